@@ -0,0 +1,62 @@
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+from src.python.multi_year_matching import get_cluster_year_connected_component_table, get_cluster_year_connected_component_table_networkx
+
+
+def generate_intersection_matching(n_years: int, n_clusters_per_year: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Generate a synthetic cluster intersection matching with the same shape as the one produced by the spatial self-join:
+    every cluster matches itself, clusters of consecutive years match with a few random neighbours and every edge appears in both directions.
+    """
+    rng = np.random.default_rng(seed)
+    years = np.arange(n_years) * 5 + 1975
+    edges = []
+    for i, y in enumerate(years):
+        ids = np.arange(n_clusters_per_year)
+        edges.append((np.full(n_clusters_per_year, y), ids, np.full(n_clusters_per_year, y), ids))
+        if i + 1 < len(years):
+            n_links = int(1.2 * n_clusters_per_year)
+            edges.append((np.full(n_links, y), rng.integers(0, n_clusters_per_year, n_links), np.full(n_links, years[i + 1]), rng.integers(0, n_clusters_per_year, n_links)))
+
+    y1, id1, y2, id2 = (np.concatenate(c) for c in zip(*edges))
+    matching = pd.DataFrame({'y1': np.concatenate([y1, y2]), 'id1': np.concatenate([id1, id2]), 'y2': np.concatenate([y2, y1]), 'id2': np.concatenate([id2, id1])})
+    return matching
+
+
+def is_same_partition(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    # Two component tables describe the same partition if there is a one-to-one mapping between their component ids
+    merged = pd.merge(a, b, on=['year', 'cluster_id'], how='outer', suffixes=('_a', '_b'))
+    if merged[['component_id_a', 'component_id_b']].isna().any().any():
+        return False
+    pairs = merged[['component_id_a', 'component_id_b']].drop_duplicates()
+    return pairs['component_id_a'].is_unique and pairs['component_id_b'].is_unique
+
+
+def run(n_years: int, scales: list, repeat: int):
+    print(f"{'clusters/year':>14} {'edges':>10} {'networkx [s]':>13} {'sparse [s]':>11} {'speedup':>8} {'same partition':>15}")
+    for n_clusters_per_year in scales:
+        matching = generate_intersection_matching(n_years=n_years, n_clusters_per_year=n_clusters_per_year)
+
+        start = time.perf_counter()
+        reference = get_cluster_year_connected_component_table_networkx(intersection_matching=matching)
+        time_networkx = time.perf_counter() - start
+
+        time_sparse = np.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = get_cluster_year_connected_component_table(intersection_matching=matching)
+            time_sparse = min(time_sparse, time.perf_counter() - start)
+
+        print(f"{n_clusters_per_year:>14} {len(matching):>10} {time_networkx:>13.3f} {time_sparse:>11.3f} {time_networkx / time_sparse:>8.1f} {str(is_same_partition(reference, result)):>15}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the sparse connected components engine against the networkx implementation")
+    parser.add_argument('--n-years', type=int, default=10)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(n_years=args.n_years, scales=args.scales, repeat=args.repeat)
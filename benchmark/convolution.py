@@ -0,0 +1,60 @@
+import argparse
+import time
+import numpy as np
+import scipy.ndimage as ndimage
+
+from src.python.convolution import get_2d_exponential_kernel, convolve2d, convolve_stack, DIRECT, FFT, TILED, CONVOLUTION_TOLERANCE
+
+
+def generate_census_place_raster(shape: tuple, n_places: int, seed: int = 0) -> np.ndarray:
+    # Sparse raster of point populations, as produced by the census place rasterization
+    rng = np.random.default_rng(seed)
+    raster = np.zeros(shape)
+    rows, cols = rng.integers(0, shape[0], n_places), rng.integers(0, shape[1], n_places)
+    np.add.at(raster, (rows, cols), rng.lognormal(mean=6, sigma=1.5, size=n_places))
+    return raster
+
+
+def _time(func, repeat: int) -> tuple:
+    best, result = np.inf, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(shape: tuple, kernel_sizes: list, n_layers: int, repeat: int):
+    image = generate_census_place_raster(shape=shape, n_places=shape[0] * shape[1] // 200)
+    print(f"Image {shape[0]}x{shape[1]}")
+    print(f"{'kernel':>7} {'direct [s]':>11} {'fft [s]':>8} {'tiled [s]':>10} {'stack fft [s]':>14} {'max rel. error':>15} {'fastest':>8}")
+
+    crossover = None
+    for size in kernel_sizes:
+        kernel = get_2d_exponential_kernel(size=size, decay_rate=0.2)
+        reference = ndimage.convolve(image, kernel, mode='constant', cval=0.0)
+
+        times, errors = {}, []
+        for method in [DIRECT, FFT, TILED]:
+            times[method], result = _time(lambda: convolve2d(image=image, kernel=kernel, method=method), repeat=repeat)
+            errors.append(np.abs(result - reference).max() / (np.abs(image).max() * np.abs(kernel).sum()))
+
+        stack = np.stack([image] * n_layers)
+        time_stack, _ = _time(lambda: convolve_stack(stack=stack, kernel=kernel, method=FFT), repeat=repeat)
+
+        fastest = min(times, key=times.get)
+        if crossover is None and times[FFT] < times[DIRECT]:
+            crossover = size
+        print(f"{size:>7} {times[DIRECT]:>11.3f} {times[FFT]:>8.3f} {times[TILED]:>10.3f} {time_stack / n_layers:>14.3f} {max(errors):>15.2e} {fastest:>8}")
+
+    print(f"FFT is faster than direct convolution from kernel size {crossover} (tolerance {CONVOLUTION_TOLERANCE:.0e} holds: see max rel. error)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the convolution backends and report the crossover points")
+    parser.add_argument('--shape', type=int, nargs=2, default=[2900, 4600], help="Image shape, defaults to the CONUS 1 km grid")
+    parser.add_argument('--kernel-sizes', type=int, nargs='+', default=[3, 5, 7, 9, 11, 15, 21, 31, 51])
+    parser.add_argument('--n-layers', type=int, default=9, help="Number of layers of the batched stack (one per census year)")
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+    run(shape=tuple(args.shape), kernel_sizes=args.kernel_sizes, n_layers=args.n_layers, repeat=args.repeat)
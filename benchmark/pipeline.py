@@ -0,0 +1,287 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+import numpy as np
+import pandas as pd
+from sqlalchemy.engine import make_url
+
+from config import config, PathManager
+from src.python.run_metrics import get_max_rss_mb
+
+
+# Each scale sets the number of census records per year, census places, raster size (1 km pixels) and years per source
+SCALES = {
+    'tiny': {'n_persons': 20_000, 'n_places': 1_000, 'raster_shape': (300, 400), 'n_cities': 20, 'n_ipums_years': 2, 'n_ghsl_years': 2},
+    'small': {'n_persons': 200_000, 'n_places': 5_000, 'raster_shape': (1_000, 1_500), 'n_cities': 150, 'n_ipums_years': 3, 'n_ghsl_years': 4},
+    'medium': {'n_persons': 2_000_000, 'n_places': 20_000, 'raster_shape': (3_000, 4_000), 'n_cities': 800, 'n_ipums_years': 5, 'n_ghsl_years': 6},
+    'large': {'n_persons': 10_000_000, 'n_places': 69_491, 'raster_shape': (8_000, 10_000), 'n_cities': 4_000, 'n_ipums_years': 9, 'n_ghsl_years': 10},
+}
+
+IPUMS_STAGES = ['extract', 'transform', 'load', 'rasterize', 'convolve', 'ipums_cluster', 'ipums_intersection_matching', 'ipums_connected_components',
+                'ipums_time_consistent_cluster', 'rca', 'ipums_export']
+GHSL_STAGES = ['load_ghsl_rasters', 'ghsl_cluster', 'ghsl_intersection_matching', 'ghsl_connected_components', 'ghsl_time_consistent_cluster',
+               'load_country_borders', 'geocoding', 'ghsl_export']
+
+# Bounding box of the contiguous US (lon, lat), where the template USA raster lies
+_CONUS_BOUNDS = (-124.0, 25.5, -67.5, 49.0)
+# Upper left corner of the synthetic GHSL grid, in Mollweide (ESRI:54009) meters
+_GHSL_ORIGIN = (-500_000.0, 6_000_000.0)
+_MAX_CENSUS_PLACE_ID = 69491
+
+
+def generate_census_place_csv(path: str, n_places: int, n_cities: int, seed: int = 0) -> pd.DataFrame:
+    # Census places are scattered around city centres in the contiguous US, with the columns expected by load.sql
+    rng = np.random.default_rng(seed)
+    centres = np.column_stack([rng.uniform(_CONUS_BOUNDS[0] + 3, _CONUS_BOUNDS[2] - 3, n_cities), rng.uniform(_CONUS_BOUNDS[1] + 3, _CONUS_BOUNDS[3] - 3, n_cities)])
+    city = rng.integers(0, n_cities, n_places)
+    spread = rng.uniform(0.05, 0.6, n_cities)[city]
+    lon = np.clip(centres[city, 0] + rng.normal(0, spread), _CONUS_BOUNDS[0], _CONUS_BOUNDS[2])
+    lat = np.clip(centres[city, 1] + rng.normal(0, spread), _CONUS_BOUNDS[1], _CONUS_BOUNDS[3])
+
+    census_place = pd.DataFrame({'lat': lat, 'lon': lon})
+    for distance in [3, 5, 10, 50, 100, 200, 300, 500]:
+        census_place[f'consistent_place_{distance}'] = city
+        census_place[f'consistent_place_name_{distance}'] = [f'place_{c}' for c in city]
+    census_place['fracpop'] = rng.uniform(0, 1, n_places)
+    census_place['potential_match'] = [f'place_{i}' for i in range(n_places)]
+    census_place['id'] = np.arange(1, n_places + 1)
+    census_place.to_csv(path, index=False)
+    return census_place
+
+
+def generate_industry_code_csv(path: str) -> np.ndarray:
+    # ind1950 codes: 0 (no industry) and a few hundred three digit codes
+    codes = np.concatenate([[0], np.arange(105, 999, 3)])
+    industry_code = pd.DataFrame({'code': codes})
+    for column in ['description', 'refined_categories', 'broad_categories', 'agri_non_agri', 'detailed', 'no_agriculture', 'all_group_by']:
+        industry_code[column] = [f'{column}_{c % 20}' for c in codes]
+    industry_code.to_csv(path, index=False)
+    return codes
+
+
+def generate_census_csvs(dem_path: str, geo_path: str, year: int, n_persons: int, n_places: int, industry_codes: np.ndarray, seed: int = 0):
+    """
+    Census records in the layout of extract.sql: a demographic file (year, occ1950, ind1950, histid, hik) and a geographic
+    crosswalk from histid to census place. Includes the quirks the ETL handles: duplicated histids, lowercase histids in the
+    crosswalk, blank hiks and census place ids above the valid range.
+    """
+    rng = np.random.default_rng(seed + year)
+    histid = np.array([f'{a:016X}-{b:019X}' for a, b in zip(rng.integers(0, 2 ** 62, n_persons), rng.integers(0, 2 ** 62, n_persons))])
+    duplicated = rng.random(n_persons) < 0.001
+    histid = np.concatenate([histid, histid[duplicated]])
+    n_records = len(histid)
+
+    hik = np.where(rng.random(n_records) < 0.3, ' ' * 21, np.array([f'{h:021d}' for h in rng.integers(0, 10 ** 18, n_records)]))
+    # Place popularity is skewed, as in the real data
+    place_weights = rng.pareto(1.2, n_places) + 1
+    census_place_id = rng.choice(np.arange(1, n_places + 1), size=n_records, p=place_weights / place_weights.sum())
+    census_place_id = np.where(rng.random(n_records) < 0.002, _MAX_CENSUS_PLACE_ID + rng.integers(1, 1000, n_records), census_place_id)
+
+    dem = pd.DataFrame({'year': year, 'occ1950': rng.integers(0, 999, n_records), 'ind1950': rng.choice(industry_codes, n_records), 'histid': histid, 'hik': hik})
+    dem.to_csv(dem_path, index=False)
+
+    has_geo = rng.random(n_records) < 0.95
+    geo = pd.DataFrame({'potential_match': 'place', 'match_type': 'exact', 'lat': 0.0, 'lon': 0.0, 'state_fips_geomatch': '01', 'county_fips_geomatch': '01001',
+                        'cluster_k5': rng.integers(0, 5, n_records), 'cpp_placeid': census_place_id, 'histid': np.char.lower(histid.astype(str))})[has_geo]
+    geo.to_csv(geo_path, index=False)
+
+
+def generate_ghsl_rasters(pop_path: str, smod_path: str, year: int, shape: tuple, n_cities: int, seed: int = 0):
+    """
+    Population and settlement model (SMOD) GeoTIFFs on a 1 km Mollweide grid. Cities are gaussian blobs that grow over time, with
+    the SMOD classes of the GHSL (30 urban centre, 21-23 urban cluster, 11-13 rural, 10 water) derived from the population density.
+    """
+    import rasterio
+    from rasterio.crs import CRS
+    from rasterio.transform import from_origin
+
+    rng = np.random.default_rng(seed)
+    height, width = shape
+    growth = 1 + 0.02 * (year - 1975)
+    rows, cols = np.arange(height)[:, np.newaxis], np.arange(width)[np.newaxis, :]
+
+    pop = rng.gamma(0.3, 5, size=shape)
+    for row, col, size, peak in zip(rng.uniform(0, height, n_cities), rng.uniform(0, width, n_cities), rng.lognormal(1, 0.6, n_cities), rng.lognormal(7, 1, n_cities)):
+        radius = int(4 * size * growth) + 1
+        r0, r1, c0, c1 = max(int(row) - radius, 0), min(int(row) + radius, height), max(int(col) - radius, 0), min(int(col) + radius, width)
+        if r0 >= r1 or c0 >= c1:
+            continue
+        distance = ((rows[r0:r1] - row) ** 2 + (cols[:, c0:c1] - col) ** 2) / (size * growth) ** 2
+        pop[r0:r1, c0:c1] += peak * growth * np.exp(-distance / 2)
+
+    smod = np.select([pop > 1500, pop > 500, pop > 300, pop > 100, pop > 50, pop > 5], [30, 23, 22, 21, 13, 12], default=11).astype(np.uint8)
+    smod[:, :width // 50] = 10
+
+    profile = {'driver': 'GTiff', 'height': height, 'width': width, 'count': 1, 'crs': CRS.from_string('ESRI:54009'),
+               'transform': from_origin(_GHSL_ORIGIN[0], _GHSL_ORIGIN[1], 1000, 1000), 'compress': 'deflate'}
+    with rasterio.open(pop_path, 'w', dtype='float32', nodata=-200, **profile) as dataset:
+        dataset.write(pop.astype(np.float32), 1)
+    with rasterio.open(smod_path, 'w', dtype='uint8', nodata=255, **profile) as dataset:
+        dataset.write(smod, 1)
+
+
+def generate_country_borders(sql_path: str, crosswalk_path: str, shape: tuple, n_countries: int = 6):
+    # Vertical stripes of countries over the GHSL grid, in the layout of the CShapes dump. The last country changes code in 1990, to exercise the validity windows.
+    from pyproj import Transformer
+    transformer = Transformer.from_crs('ESRI:54009', 'EPSG:4326', always_xy=True)
+    height, width = shape
+    x = np.linspace(_GHSL_ORIGIN[0] - 50_000, _GHSL_ORIGIN[0] + width * 1000 + 50_000, n_countries + 1)
+    y0, y1 = _GHSL_ORIGIN[1] - height * 1000 - 50_000, _GHSL_ORIGIN[1] + 50_000
+
+    rows = []
+    for i in range(n_countries):
+        # Densify the edges, since straight lines in Mollweide are curves in lon/lat
+        xs = np.concatenate([np.linspace(x[i], x[i + 1], 20), np.full(20, x[i + 1]), np.linspace(x[i + 1], x[i], 20), np.full(20, x[i])])
+        ys = np.concatenate([np.full(20, y0), np.linspace(y0, y1, 20), np.full(20, y1), np.linspace(y1, y0, 20)])
+        lon, lat = transformer.transform(xs, ys)
+        wkt = f"MULTIPOLYGON((({', '.join(f'{a} {b}' for a, b in zip(lon, lat))}, {lon[0]} {lat[0]})))"
+        if i < n_countries - 1:
+            rows.append((100 + i, 1945, 2019, wkt))
+        else:
+            rows.append((100 + i, 1945, 1990, wkt))
+            rows.append((200 + i, 1990, 2019, wkt))
+
+    with open(sql_path, 'w') as f:
+        f.write('DROP TABLE IF EXISTS "CShapes-2.0";\n')
+        f.write('CREATE TABLE "CShapes-2.0" (gid SERIAL PRIMARY KEY, gwcode INTEGER, gwsyear INTEGER, gweyear INTEGER, the_geom geometry(MultiPolygon, 4326));\n')
+        for gwcode, gwsyear, gweyear, wkt in rows:
+            f.write(f"INSERT INTO \"CShapes-2.0\" (gwcode, gwsyear, gweyear, the_geom) VALUES ({gwcode}, {gwsyear}, {gweyear}, ST_GeomFromText('{wkt}', 4326));\n")
+    pd.DataFrame({'cshape_code': [r[0] for r in rows], 'world_bank_code': [f'C{r[0]}' for r in rows]}).to_csv(crosswalk_path, index=False)
+
+
+def generate_data(scale: str, data_folder: str, seed: int):
+    parameters = SCALES[scale]
+    path = PathManager(data_folder=data_folder, docker_data_folder=data_folder)
+    for folder in ['ipums/census', 'ipums/geo', 'ghsl/pop', 'ghsl/smod', 'ghsl/country']:
+        os.makedirs(f'{data_folder}/{folder}', exist_ok=True)
+
+    generate_census_place_csv(path=path.source_data.census_place, n_places=parameters['n_places'], n_cities=parameters['n_cities'], seed=seed)
+    industry_codes = generate_industry_code_csv(path=path.source_data.industry_code)
+    for year in _get_years(scale=scale)[0]:
+        generate_census_csvs(dem_path=path.source_data.dem.format(year=year), geo_path=path.source_data.geo.format(year=year), year=year,
+                             n_persons=parameters['n_persons'], n_places=parameters['n_places'], industry_codes=industry_codes, seed=seed)
+    for year in _get_years(scale=scale)[1]:
+        generate_ghsl_rasters(pop_path=path.source_data.pop.format(year=year), smod_path=path.source_data.smod.format(year=year), year=year,
+                              shape=parameters['raster_shape'], n_cities=parameters['n_cities'], seed=seed)
+    generate_country_borders(sql_path=path.source_data.country_borders, crosswalk_path=path.source_data.crosswalk_cshape_to_world_bank_codes, shape=parameters['raster_shape'])
+
+
+def configure(scale: str, data_folder: str, server_data_folder: str, ipums_postgres_uri: str, ghsl_postgres_uri: str):
+    # Must run before anything imports src.python.utils, which creates the database engines from the config
+    assert 'src.python.utils' not in sys.modules, "The benchmark must be configured before the pipeline modules are imported"
+    config.debug = False
+    config.path = PathManager(data_folder=data_folder, docker_data_folder=server_data_folder)
+    config.db.temp_duckdb_uri = f"duckdb:///{data_folder}/tmp/temp_duckdb.db"
+    config.db.ipums_postgres_uri = ipums_postgres_uri
+    config.db.ghsl_postgres_uri = ghsl_postgres_uri
+    # The bash loaders connect with psql from the individual connection settings
+    ghsl_url = make_url(ghsl_postgres_uri)
+    config.db.postgres_user, config.db.postgres_password, config.db.postgres_host = ghsl_url.username, ghsl_url.password, ghsl_url.host
+    config.db.postgres_port, config.db.ghsl_postgres_db_name = ghsl_url.port or 5432, ghsl_url.database
+    config.param.ipums.years, config.param.ghsl.years = _get_years(scale=scale)
+    # Every stage must run, and run from scratch
+    config.param.stage_cache.enabled = False
+    os.makedirs(f"{data_folder}/tmp", exist_ok=True)
+
+
+def run_stage(stage: str):
+    sys.path.insert(0, os.path.join(config.path.project_path, 'orchestration'))
+    import ipums_etl
+    import ipums_cluster
+    import ipums_time_consistent_cluster as ipums_tcc
+    import ghsl_time_consistent_cluster as ghsl_tcc
+
+    stages = {
+        'extract': lambda: (ipums_etl.configure_duckdb(), ipums_etl.extract_data_to_duckdb()),
+        'transform': ipums_etl.transform_data,
+        'load': ipums_etl.load_data_to_postgres,
+        'rasterize': lambda: (ipums_cluster._create_function__template_usa_raster(), ipums_cluster.rasterize_census_places()),
+        'convolve': ipums_cluster.create_convolved_census_place_raster,
+        'ipums_cluster': ipums_cluster.create_cluster,
+        'ipums_intersection_matching': ipums_tcc.create_multiyear_tables_and_cluster_intersection_matching,
+        'ipums_connected_components': ipums_tcc.create_crosswalk_cluster_uid_to_cluster_id,
+        'ipums_time_consistent_cluster': ipums_tcc.create_time_consistent_cluster,
+        'rca': ipums_tcc.add_industry_rca_column,
+        'ipums_export': ipums_tcc.export_time_consistent_cluster,
+        'load_ghsl_rasters': ghsl_tcc.load_ghsl_rasters,
+        'ghsl_cluster': ghsl_tcc.create_cluster,
+        'ghsl_intersection_matching': ghsl_tcc.create_multiyear_tables_and_cluster_intersection_matching,
+        'ghsl_connected_components': ghsl_tcc.create_crosswalk_cluster_uid_to_cluster_id,
+        'ghsl_time_consistent_cluster': lambda: (ghsl_tcc.create_time_consistent_cluster_geometry_pre_geocoding(), ghsl_tcc.create_time_consistent_cluster_pre_geocoding()),
+        'load_country_borders': ghsl_tcc.load_country_borders,
+        'geocoding': ghsl_tcc.geocode_cluster_with_country,
+        'ghsl_export': ghsl_tcc.export_time_consistent_cluster,
+    }
+    stages[stage]()
+
+
+def _run_stage_in_process(stage: str, configuration: dict, queue: multiprocessing.Queue):
+    # Every stage runs in a fresh process, so that its peak RSS is its own (the database servers are not included)
+    try:
+        configure(**configuration)
+        start = time.perf_counter()
+        run_stage(stage=stage)
+        queue.put({'seconds': time.perf_counter() - start, 'max_rss_mb': get_max_rss_mb(), 'status': 'ok'})
+    except Exception:
+        traceback.print_exc()
+        queue.put({'seconds': np.nan, 'max_rss_mb': get_max_rss_mb(), 'status': 'failed'})
+
+
+def run(scales: list, stages: list, work_folder: str, server_work_folder: str, ipums_postgres_uri: str, ghsl_postgres_uri: str, seed: int, output: str, baseline: str):
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for scale in scales:
+        data_folder = os.path.join(work_folder, scale)
+        print(f"Generating {scale} data in {data_folder}")
+        start = time.perf_counter()
+        generate_data(scale=scale, data_folder=data_folder, seed=seed)
+        print(f"Generated in {time.perf_counter() - start:.1f}s")
+
+        configuration = {'scale': scale, 'data_folder': data_folder, 'server_data_folder': os.path.join(server_work_folder, scale),
+                         'ipums_postgres_uri': ipums_postgres_uri, 'ghsl_postgres_uri': ghsl_postgres_uri}
+        for stage in stages:
+            queue = context.Queue()
+            process = context.Process(target=_run_stage_in_process, args=(stage, configuration, queue))
+            process.start()
+            result = queue.get()
+            process.join()
+            results.append(dict(scale=scale, stage=stage, **result))
+            print(f"{scale:>8} {stage:>32} {result['seconds']:>10.2f}s {result['max_rss_mb']:>10.0f} MB {result['status']}")
+            if result['status'] != 'ok':
+                print(f"Stage {stage} failed, skipping the remaining stages of scale {scale}")
+                break
+
+    results = pd.DataFrame(results)
+    results.to_csv(output, index=False)
+    print(f"Results written to {output}")
+
+    if baseline is not None:
+        comparison = pd.merge(results, pd.read_csv(baseline), on=['scale', 'stage'], suffixes=('', '_baseline'))
+        comparison['speedup'] = comparison['seconds_baseline'] / comparison['seconds']
+        comparison['memory_ratio'] = comparison['max_rss_mb'] / comparison['max_rss_mb_baseline']
+        print(comparison[['scale', 'stage', 'seconds_baseline', 'seconds', 'speedup', 'max_rss_mb_baseline', 'max_rss_mb', 'memory_ratio']].to_string(index=False))
+
+
+def _get_years(scale: str):
+    ipums_years = [1850, 1860, 1870, 1880, 1900, 1910, 1920, 1930, 1940]
+    ghsl_years = [1975, 1980, 1985, 1990, 1995, 2000, 2005, 2010, 2015, 2020]
+    return ipums_years[-SCALES[scale]['n_ipums_years']:], ghsl_years[-SCALES[scale]['n_ghsl_years']:]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the pipeline stages on seeded synthetic data and report time and peak memory per stage and scale")
+    parser.add_argument('--scales', nargs='+', default=['tiny', 'small'], choices=list(SCALES))
+    parser.add_argument('--stages', nargs='+', default=IPUMS_STAGES + GHSL_STAGES, choices=IPUMS_STAGES + GHSL_STAGES)
+    parser.add_argument('--work-folder', required=True, help="Folder for the synthetic data, the DuckDB file and the caches")
+    parser.add_argument('--server-work-folder', default=None, help="The work folder as seen by the Postgres server (COPY FROM reads server-side), defaults to --work-folder")
+    parser.add_argument('--ipums-postgres-uri', required=True, help="Database with PostGIS and postgis_raster for the IPUMS stages")
+    parser.add_argument('--ghsl-postgres-uri', required=True, help="Database with PostGIS and postgis_raster for the GHSL stages")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='pipeline_benchmark.csv')
+    parser.add_argument('--baseline', default=None, help="Results of a previous run to compare against")
+    args = parser.parse_args()
+    run(scales=args.scales, stages=args.stages, work_folder=os.path.abspath(args.work_folder), server_work_folder=args.server_work_folder or os.path.abspath(args.work_folder),
+        ipums_postgres_uri=args.ipums_postgres_uri, ghsl_postgres_uri=args.ghsl_postgres_uri, seed=args.seed, output=args.output, baseline=args.baseline)
@@ -29,6 +29,8 @@ class PathManager:
                 self.sql_file_folder = sql_file_folder
                 self.extract = f"{self.sql_file_folder}/extract.sql"
                 self.transform = f"{self.sql_file_folder}/transform.sql"
+                self.stage_parquet = f"{self.sql_file_folder}/stage_parquet.sql"
+                self.transform_fused = f"{self.sql_file_folder}/transform_fused.sql"
                 self.load = f"{self.sql_file_folder}/load.sql"
 
         class IpumsTimeConsistentCluster:
@@ -38,6 +40,7 @@ class PathManager:
                 self.create_cluster = f"{self.sql_file_folder}/create_cluster.sql"
                 self.rasterize_census_places = f"{self.sql_file_folder}/create_table__rasterized_census_places.sql"
                 self.create_time_consistent_cluster = f"{self.sql_file_folder}/create_time_consistent_cluster.sql"
+                self.add_industry_rca_column = f"{self.sql_file_folder}/add_industry_rca_column.sql"
 
         class GhslTimeConsistentCluster:
             def __init__(self, sql_file_folder: str):
@@ -64,9 +67,36 @@ class PathManager:
             self.bash_file_folder = bash_file_folder
             self.ghsl_etl = self.GhslETL(bash_file_folder=f"{self.bash_file_folder}/ghsl_etl")
 
+    class Cache:
+        def __init__(self, cache_folder: str):
+            self.cache_folder = cache_folder
+            self.ipums_dem_parquet = f"{self.cache_folder}/ipums/parquet/dem_{{year}}.parquet"
+            self.ipums_geo_parquet = f"{self.cache_folder}/ipums/parquet/geo_{{year}}.parquet"
+            self.ipums_raster_store = f"{self.cache_folder}/ipums/raster"
+            # Names of the label rasters in the label raster store
+            self.label_raster_store = f"{self.cache_folder}/label_raster"
+            self.ipums_cluster_label_raster = "ipums_cluster_{year}"
+            self.ghsl_cluster_label_raster = "ghsl_cluster_{year}"
+            self.ghsl_time_consistent_cluster_label_raster = "ghsl_time_consistent_cluster"
+            self.ghsl_country_label_raster = "ghsl_country_{year}"
+            self.stage_manifest = f"{self.cache_folder}/stage_manifest.sqlite"
+
+    class Export:
+        def __init__(self, export_folder: str):
+            self.export_folder = export_folder
+            # GeoParquet datasets are folders of hive partitions (e.g., year=1990/country=USA/part-0.parquet)
+            self.ipums_time_consistent_cluster = f"{self.export_folder}/ipums/time_consistent_cluster"
+            self.ipums_time_consistent_cluster_industry = f"{self.export_folder}/ipums/time_consistent_cluster_industry"
+            self.ipums_time_consistent_cluster_geometry = f"{self.export_folder}/ipums/time_consistent_cluster_geometry.fgb"
+            self.ghsl_time_consistent_cluster = f"{self.export_folder}/ghsl/time_consistent_cluster"
+            self.ghsl_time_consistent_cluster_geometry = f"{self.export_folder}/ghsl/time_consistent_cluster_geometry.fgb"
+
     def __init__(self, project_path: str = _project_path, data_folder: str = _data_folder, docker_data_folder: str = _docker_data_folder):
         self.project_path = project_path
         self.source_data = self.Data(data_folder=data_folder, docker_data_folder=docker_data_folder)
+        self.cache = self.Cache(cache_folder=f"{data_folder}/tmp/cache")
+        self.export = self.Export(export_folder=f"{data_folder}/export")
+        self.run_metrics = f"{data_folder}/tmp/run_metrics.jsonl"
         self.sql = self.SQL(sql_file_folder=f"{self.project_path}/src/sql")
         self.bash = self.Bash(bash_file_folder=f"{self.project_path}/src/bash")
 
@@ -75,6 +105,8 @@ class DatabaseInfoManager:
     class IpumsTableName:
         def __init__(self):
             self.census_place = "census_place"
+            self.usa_geom = "usa_geom"
+            self.template_usa_raster_function = "get_template_usa_raster"
             self.industry_code = "industry1950_code"
             self.dem = "dem_{year}"
             self.geo = "geo_{year}"
@@ -82,13 +114,20 @@ class DatabaseInfoManager:
             self.census_place_industry_count = "census_place_industry_count_{year}"
             self.cluster = "cluster_{year}"
             self.cluster_industry = "cluster_industry_{year}"
+            self.cluster_geometry = "cluster_geometry_{year}"
+            self.census_place_pixel = "census_place_pixel"
+            self.census_place_cluster = "census_place_cluster_{year}"
             self.rasterized_census_places = "rasterized_census_places_{year}"
             self.convolved_census_place_raster = "convolved_census_place_raster_{year}"
+            self.cluster_sweep = "cluster_sweep"
+            self.cluster_sweep_parameter_set = "cluster_sweep_parameter_set"
 
             self.multiyear_cluster = "multiyear_cluster"
             self.multiyear_census_place_industry_count = "multiyear_census_place_industry_count"
+            self.multiyear_census_place_cluster = "multiyear_census_place_cluster"
             self.cluster_intersection_matching = "cluster_intersection_matching"
             self.crosswalk_cluster_uid_to_cluster_id = "crosswalk_cluster_uid_to_cluster_id"
+            self.cluster_uid_mapping = "cluster_uid_mapping"
             self.time_consistent_cluster = "time_consistent_cluster"
             self.time_consistent_cluster_industry = "time_consistent_cluster_industry"
             self.time_consistent_cluster_geometry = "time_consistent_cluster_geometry"
@@ -100,12 +139,16 @@ class DatabaseInfoManager:
             self.country_borders = "country_borders"
             self.crosswalk_cshape_to_world_bank_codes = "crosswalk_cshape_to_world_bank_codes"
             self.cluster = "cluster_{year}"
+            self.cluster_sweep = "cluster_sweep"
+            self.cluster_sweep_parameter_set = "cluster_sweep_parameter_set"
 
             self.multiyear_cluster = "multiyear_cluster"
             self.cluster_intersection_matching = "cluster_intersection_matching"
             self.crosswalk_cluster_uid_to_cluster_id = "crosswalk_cluster_uid_to_cluster_id"
+            self.cluster_uid_mapping = "cluster_uid_mapping"
             self.time_consistent_cluster_pre_geocoding = "time_consistent_cluster_pre_geocoding"
             self.time_consistent_cluster_geometry_pre_geocoding = "time_consistent_cluster_geometry_pre_geocoding"
+            self.cluster_country_matching = "cluster_country_matching"
             self.time_consistent_cluster = "time_consistent_cluster"
             self.time_consistent_cluster_year = "time_consistent_cluster_{year}"
             self.time_consistent_cluster_geometry = "time_consistent_cluster_geometry"
@@ -132,22 +175,100 @@ class ParameterManager:
     class Ipums:
         def __init__(self):
             self.years = [1850, 1860, 1870, 1880, 1900, 1910, 1920, 1930, 1940]
+            # 'parquet' converts the source CSVs once to deduplicated Parquet files that the transform scans, 'table' loads them into DuckDB tables
+            self.extract_engine = 'table'
+            # 'fused' counts workers per census place and industry in one pass without materializing the dem, geo and census tables,
+            # optionally for all years in one query. 'table' materializes them.
+            self.transform_engine = 'table'
+            self.transform_all_years = False
+            # Debug: keep the intermediate tables (runs the 'table' transform)
+            self.keep_etl_intermediates = False
             self.dbscan_eps = 100
             self.dbscan_min_points = 1
             self.pixel_threshold = 100
             self.convolution_kernel_size = 11
             self.convolution_kernel_decay_rate = 0.2
+            self.convolution_method = 'auto'
+            self.raster_tile_size = 256
+            # 'local' keeps the rasterized and convolved rasters memory mapped on disk and only publishes them to PostGIS for the SQL stages
+            # reading them, 'postgis' stores them as raster tables
+            self.raster_store = 'postgis'
+            # The 'python' engines label, match and crosswalk on the pixel grid. 'pixel' matching and the 'grid' crosswalk require the python cluster engine.
+            self.rasterize_engine = 'sql'
+            self.matching_engine = 'intersection'
+            self.cluster_engine = 'sql'
+            self.census_place_crosswalk_engine = 'polygon'
+            # Add the years missing from the existing time consistent clusters instead of rebuilding them (keeps the existing cluster_uids)
+            self.incremental_cluster_uid = False
 
     class Ghsl:
         def __init__(self):
             self.years = [1975, 1980, 1985, 1990, 1995, 2000, 2005, 2010, 2015, 2020]
             self.lower_bound_urban = 21
+            self.upper_bound_urban = 30
             self.dbscan_eps = 1
             self.dbscan_min_points = 1
+            self.cluster_engine = 'sql'
+            # The python cluster engine labels tiles of cluster_tile_size pixels on cluster_workers processes and merges them along the seams (None for one pass)
+            self.cluster_tile_size = 4096
+            self.cluster_workers = 4
+            # 'pixel' matching requires the python cluster engine, 'raster' country geocoding requires the python zonal stats engine
+            self.zonal_stats_engine = 'sql'
+            self.matching_engine = 'intersection'
+            self.country_geocoding_engine = 'sql'
+            # Add the epochs missing from the existing time consistent clusters instead of rebuilding them (keeps the existing cluster_uids)
+            self.incremental_cluster_uid = False
+
+    class Pipeline:
+        def __init__(self):
+            self.max_workers = 8
+            # DuckDB is single-writer, Postgres serves several connections at once. Raster tasks hold global rasters in memory:
+            # the GHSL stages size their concurrency so that they use at most raster_memory_fraction of the memory.
+            self.backend_concurrency = {'duckdb': 1, 'postgres': 8, 'bash': 4, 'python': 4, 'raster': 1}
+            self.raster_memory_fraction = 0.5
+            # 'partition' attaches the per-year tables as partitions of the multiyear tables, 'copy' copies them into a new table
+            self.multiyear_table_engine = 'copy'
+
+    class Sweep:
+        def __init__(self):
+            # Values of each swept parameter. Parameters left out keep their config.param.ipums / config.param.ghsl value.
+            # dbscan_eps only matters in whole pixels (1 km for ipums): eps below 1000 links adjacent pixels, eps from 1000 also links pixels one apart
+            self.ipums_grid = {'convolution_kernel_size': [11], 'convolution_kernel_decay_rate': [0.1, 0.2, 0.3],
+                               'pixel_threshold': [50, 100, 200, 400], 'dbscan_eps': [100, 1000]}
+            self.ghsl_grid = {'lower_bound_urban': [13, 21, 22, 23]}
+
+    class Export:
+        def __init__(self):
+            # Rows fetched from Postgres per batch, and rows per Parquet row group (row groups follow the Hilbert curve)
+            self.batch_size = 10_000
+            self.row_group_size = 1_000
+
+    class Query:
+        def __init__(self):
+            # Size bound of the in-process LRU cache of cluster geometries (WKB bytes)
+            self.geometry_cache_bytes = 512 * 1024 ** 2
+
+    class StageCache:
+        def __init__(self):
+            self.enabled = False
+            self.force = False
+
+    class RunMetrics:
+        def __init__(self):
+            self.enabled = True
+            # EXPLAIN ANALYZE runs the statement, so explain mode executes explainable statements through it and keeps the plans of the slow ones
+            self.explain = False
+            self.explain_threshold_seconds = 10
 
     def __init__(self):
         self.ipums = self.Ipums()
         self.ghsl = self.Ghsl()
+        self.pipeline = self.Pipeline()
+        self.sweep = self.Sweep()
+        self.export = self.Export()
+        self.query = self.Query()
+        self.stage_cache = self.StageCache()
+        self.run_metrics = self.RunMetrics()
 
 
 class Config:
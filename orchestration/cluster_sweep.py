@@ -0,0 +1,168 @@
+from typing import Dict, List
+import itertools
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from src.python.utils import DB, get_db_engine, copy_dataframe_to_postgres, copy_query_to_dataframe, touch_tables
+from src.python.postgis_raster_io import load_raster_tiled
+from src.python.clustering import get_structuring_element, label_clusters
+from src.python.zonal_stats import LabelRaster, zonal_sum
+from src.python.pipeline import Task, run_tasks, PYTHON
+from ipums_cluster import get_census_place_rasters as _get_census_place_rasters, convolve_census_place_rasters as _convolve_census_place_rasters, create_census_place_pixel_table as _create_census_place_pixel_table
+from ghsl_time_consistent_cluster import label_urban_pixels as _label_urban_pixels
+from config import config
+
+
+IPUMS_SWEEP_PARAMETERS = ['convolution_kernel_size', 'convolution_kernel_decay_rate', 'pixel_threshold', 'dbscan_eps']
+GHSL_SWEEP_PARAMETERS = ['lower_bound_urban', 'upper_bound_urban', 'dbscan_eps']
+
+
+def get_parameter_sets(grid: Dict[str, List], parameters: List[str], defaults) -> pd.DataFrame:
+    """
+    Cartesian product of the values of the swept parameters
+
+    Parameters:
+    - grid: values of each swept parameter, by name
+    - parameters: names of the parameters that can be swept
+    - defaults: object holding the value of the parameters that are not swept (e.g., config.param.ipums)
+
+    Returns:
+    - A dataframe with one row per parameter set: param_set_id (from 0) and one column per parameter
+    """
+    unknown = set(grid) - set(parameters)
+    if unknown:
+        raise ValueError(f"Parameters {sorted(unknown)} cannot be swept")
+    values = [grid.get(parameter, [getattr(defaults, parameter)]) for parameter in parameters]
+    parameter_sets = pd.DataFrame(list(itertools.product(*values)), columns=parameters)
+    parameter_sets.insert(0, 'param_set_id', np.arange(len(parameter_sets)))
+    return parameter_sets
+
+
+def run_ipums_sweep(grid: Dict[str, List] = None) -> pd.DataFrame:
+    """
+    Cluster the census years once per parameter set of the grid (config.param.sweep.ipums_grid by default), computing the
+    shared intermediates once: the census places are rasterized once, each kernel convolves the raster stack once, and only
+    the thresholding and labeling run per parameter set, in parallel.
+    The clusters of every parameter set are written to one long table keyed by param_set_id, year and cluster_id
+    (with the same cluster ids and populations as the cluster_{year} tables of a run with these parameters).
+
+    Returns:
+    - The parameter sets
+    """
+    assert config.param.ipums.dbscan_min_points == 1, "The sweep only supports dbscan_min_points = 1"
+    parameter_sets = get_parameter_sets(grid=grid if grid is not None else config.param.sweep.ipums_grid, parameters=IPUMS_SWEEP_PARAMETERS, defaults=config.param.ipums)
+    years = config.param.ipums.years
+
+    rasters = _get_census_place_rasters()
+    census_place_population = _get_census_place_pixel_population(years=years)
+
+    clusters = []
+    for (kernel_size, decay_rate), kernel_parameter_sets in parameter_sets.groupby(['convolution_kernel_size', 'convolution_kernel_decay_rate'], sort=False):
+        convolved_rasters = _convolve_census_place_rasters(rasters=rasters, kernel_size=int(kernel_size), decay_rate=decay_rate)
+        pixel_size = abs(convolved_rasters[0].rio.resolution()[0])
+        tasks = [Task(name=f'sweep_{parameter_set.param_set_id}_{y}', function=_get_ipums_sweep_clusters, backend=PYTHON,
+                      kwargs={'values': raster.sel(band=1).values, 'census_place_population': census_place_population[y], 'pixel_threshold': parameter_set.pixel_threshold,
+                              'structure': get_structuring_element(eps=parameter_set.dbscan_eps, pixel_size=pixel_size)})
+                 for parameter_set in kernel_parameter_sets.itertuples() for y, raster in zip(years, convolved_rasters)]
+        results = run_tasks(tasks=tasks)
+        clusters += [results[f'sweep_{parameter_set.param_set_id}_{y}'].assign(param_set_id=parameter_set.param_set_id, year=y)
+                     for parameter_set in kernel_parameter_sets.itertuples() for y in years]
+
+    # The census place pixels depend on the census places and the template raster the census places are rasterized onto
+    inputs = [config.db.ipums_table.census_place_pixel] + [config.db.ipums_table.census_place_industry_count.format(year=y) for y in years]
+    if config.param.ipums.rasterize_engine != 'python':
+        inputs += [config.db.ipums_table.rasterized_census_places.format(year=y) for y in years]
+    _write_sweep_tables(db=DB.IPUMS_POSTGRES, parameter_sets=parameter_sets, clusters=pd.concat(clusters, ignore_index=True),
+                        cluster_sweep_table=config.db.ipums_table.cluster_sweep, cluster_sweep_parameter_set_table=config.db.ipums_table.cluster_sweep_parameter_set,
+                        inputs=inputs, params={'years': years})
+    return parameter_sets
+
+
+def _get_census_place_pixel_population(years: List[int]) -> Dict[int, pd.DataFrame]:
+    # Worker count of each census place of each year with the pixel it falls in, shared by all parameter sets
+    _create_census_place_pixel_table()
+    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    census_place_population = {}
+    with e.begin() as conn:
+        for y in years:
+            query = f"""SELECT p.row, p.col, SUM(c.worker_count)
+                        FROM {config.db.ipums_table.census_place_pixel} p JOIN {config.db.ipums_table.census_place_industry_count.format(year=y)} c ON p.census_place_id = c.census_place_id
+                        GROUP BY p.census_place_id, p.row, p.col"""
+            census_place_population[y] = copy_query_to_dataframe(conn=conn, query=query, dtypes={'row': 'int64', 'col': 'int64', 'population': 'float64'})
+    return census_place_population
+
+
+def _get_ipums_sweep_clusters(values: np.ndarray, census_place_population: pd.DataFrame, pixel_threshold: float, structure: np.ndarray) -> pd.DataFrame:
+    # Clusters of one year and parameter set. As in create_cluster.sql, clusters without any census place are dropped.
+    labels, n_clusters = label_clusters(mask=values > pixel_threshold, structure=structure)
+    census_place_labels = labels[census_place_population['row'].to_numpy(), census_place_population['col'].to_numpy()]
+    population = np.bincount(census_place_labels, weights=census_place_population['population'].to_numpy(), minlength=n_clusters + 1)[1:]
+    n_census_places = np.bincount(census_place_labels, minlength=n_clusters + 1)[1:]
+    pixel_count = np.bincount(labels.ravel(), minlength=n_clusters + 1)[1:]
+    has_census_place = n_census_places > 0
+    return pd.DataFrame({'cluster_id': np.arange(n_clusters)[has_census_place], 'population': population[has_census_place], 'pixel_count': pixel_count[has_census_place]})
+
+
+def run_ghsl_sweep(grid: Dict[str, List] = None) -> pd.DataFrame:
+    """
+    Cluster the GHSL epochs once per parameter set of the grid (config.param.sweep.ghsl_grid by default). The smod and pop
+    rasters of each epoch are loaded once, and the parameter sets are labeled in parallel. The clusters of every parameter set
+    are written to one long table keyed by param_set_id, year and cluster_id.
+
+    Returns:
+    - The parameter sets
+    """
+    assert config.param.ghsl.dbscan_min_points == 1, "The sweep only supports dbscan_min_points = 1"
+    parameter_sets = get_parameter_sets(grid=grid if grid is not None else config.param.sweep.ghsl_grid, parameters=GHSL_SWEEP_PARAMETERS, defaults=config.param.ghsl)
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+
+    # One epoch at a time, so that only one pair of global rasters is in memory
+    clusters = []
+    for year in config.param.ghsl.years:
+        with e.begin() as conn:
+            smod = load_raster_tiled(con=conn, raster_table=config.db.ghsl_table.smod.format(year=year))
+            pop = load_raster_tiled(con=conn, raster_table=config.db.ghsl_table.pop.format(year=year))
+        assert smod.shape == pop.shape and smod.rio.transform() == pop.rio.transform(), "The smod and pop rasters must be on the same grid"
+
+        tasks = [Task(name=f'sweep_{parameter_set.param_set_id}_{year}', function=_get_ghsl_sweep_clusters, backend=PYTHON,
+                      kwargs={'smod': smod, 'pop': pop, 'lower_bound_urban': parameter_set.lower_bound_urban, 'upper_bound_urban': parameter_set.upper_bound_urban,
+                              'dbscan_eps': parameter_set.dbscan_eps})
+                 for parameter_set in parameter_sets.itertuples()]
+        results = run_tasks(tasks=tasks)
+        clusters += [results[f'sweep_{parameter_set.param_set_id}_{year}'].assign(param_set_id=parameter_set.param_set_id, year=year) for parameter_set in parameter_sets.itertuples()]
+
+    _write_sweep_tables(db=DB.GHSL_POSTGRES, parameter_sets=parameter_sets, clusters=pd.concat(clusters, ignore_index=True),
+                        cluster_sweep_table=config.db.ghsl_table.cluster_sweep, cluster_sweep_parameter_set_table=config.db.ghsl_table.cluster_sweep_parameter_set,
+                        inputs=[table.format(year=y) for y in config.param.ghsl.years for table in [config.db.ghsl_table.smod, config.db.ghsl_table.pop]],
+                        params={'years': config.param.ghsl.years})
+    return parameter_sets
+
+
+def _get_ghsl_sweep_clusters(smod, pop, lower_bound_urban: int, upper_bound_urban: int, dbscan_eps: float) -> pd.DataFrame:
+    labels, n_clusters = _label_urban_pixels(smod=smod, lower_bound_urban=lower_bound_urban, upper_bound_urban=upper_bound_urban, dbscan_eps=dbscan_eps)
+    label_raster = LabelRaster(labels=labels, ids=np.arange(n_clusters), transform=smod.rio.transform(), crs=str(smod.rio.crs))
+    population = zonal_sum(label_raster=label_raster, values=pop.sel(band=1).values, nodata=pop.rio.nodata)
+    pixel_count = np.bincount(labels.ravel(), minlength=n_clusters + 1)[1:]
+    return pd.DataFrame({'cluster_id': np.arange(n_clusters), 'population': population, 'pixel_count': pixel_count})
+
+
+def _write_sweep_tables(db: DB, parameter_sets: pd.DataFrame, clusters: pd.DataFrame, cluster_sweep_table: str, cluster_sweep_parameter_set_table: str,
+                        inputs: List[str], params: Dict):
+    parameter_columns = ', '.join(f"{column} DOUBLE PRECISION" for column in parameter_sets.columns if column != 'param_set_id')
+    e = get_db_engine(db=db)
+    with e.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_sweep_table}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_sweep_parameter_set_table}"))
+        conn.execute(text(f"CREATE TABLE {cluster_sweep_parameter_set_table} (param_set_id INTEGER PRIMARY KEY, {parameter_columns})"))
+        copy_dataframe_to_postgres(conn=conn, data=parameter_sets, table_name=cluster_sweep_parameter_set_table)
+        conn.execute(text(f"""CREATE TABLE {cluster_sweep_table} (
+                                  param_set_id INTEGER REFERENCES {cluster_sweep_parameter_set_table} (param_set_id), year INTEGER, cluster_id INTEGER,
+                                  population DOUBLE PRECISION, pixel_count BIGINT, PRIMARY KEY (param_set_id, year, cluster_id))"""))
+        copy_dataframe_to_postgres(conn=conn, data=clusters[['param_set_id', 'year', 'cluster_id', 'population', 'pixel_count']], table_name=cluster_sweep_table)
+    touch_tables(db=db, table_names=[cluster_sweep_parameter_set_table, cluster_sweep_table], inputs=inputs,
+                 params={**params, 'parameter_sets': parameter_sets.to_dict(orient='records')})
+
+
+if __name__ == '__main__':
+    run_ipums_sweep()
+    run_ghsl_sweep()
@@ -1,53 +1,292 @@
-from typing import List
-from sqlalchemy import text
+from typing import Dict, List, Optional
+from sqlalchemy import text, inspect
+import numpy as np
 import pandas as pd
 
-from src.python.utils import DB, get_db_engine
-from src.python.multi_year_matching import get_cluster_year_connected_component_table
+from src.python.utils import DB, get_db_engine, copy_query_to_dataframe, copy_dataframe_to_postgres, touch_tables, logger
+from src.python.multi_year_matching import get_cluster_year_connected_components, update_cluster_year_connected_components, get_label_raster_matching
+from src.python.raster_store import get_label_raster_store
+from config import config
 
 
 def create_multiyear_table(base_table_name: str, multiyear_cluster_table_name: str, column_names: List[str], years: List[int], create_spatial_index: bool, db: DB):
-    query = ""
-    for i, y in enumerate(years):
-        query_year = (f"SELECT {y} as year, {', '.join(column_names)} "
-                      f"FROM {base_table_name.format(year=y)} ")
+    # The 'partition' engine attaches the per-year tables as partitions of the multiyear table without copying rows, the 'copy' engine copies their column_names
+    e = get_db_engine(db=db)
+    engine = config.param.pipeline.multiyear_table_engine
 
-        if i < len(years) - 1:
-            query_year += "UNION ALL "
+    with e.begin() as conn:
+        if engine == 'partition':
+            _attach_multiyear_partitions(conn=conn, base_table_name=base_table_name, multiyear_table_name=multiyear_cluster_table_name, years=years, create_spatial_index=create_spatial_index)
+        elif engine == 'copy':
+            query = ""
+            for i, y in enumerate(years):
+                query_year = (f"SELECT {y} as year, {', '.join(column_names)} "
+                              f"FROM {base_table_name.format(year=y)} ")
 
-        query += query_year
+                if i < len(years) - 1:
+                    query_year += "UNION ALL "
 
-    e = get_db_engine(db=db)
+                query += query_year
+
+            _drop_multiyear_table(conn=conn, multiyear_table_name=multiyear_cluster_table_name)
+            conn.execute(text(f"CREATE TABLE {multiyear_cluster_table_name} AS ({query})"))
+
+            if create_spatial_index:
+                conn.execute(text(f"CREATE INDEX ON {multiyear_cluster_table_name} USING GIST (geom)"))
+        else:
+            raise ValueError(f"Unknown multiyear table engine {engine}")
+
+    # The multiyear table only changes when one of the per-year tables does
+    touch_tables(db=db, table_names=[multiyear_cluster_table_name], inputs=[base_table_name.format(year=y) for y in years],
+                 params={'engine': engine, 'column_names': column_names, 'years': years})
 
-    with e.begin() as conn:
-        conn.execute(text(f"DROP TABLE IF EXISTS {multiyear_cluster_table_name}"))
-        conn.execute(text(f"CREATE TABLE {multiyear_cluster_table_name} AS ({query})"))
 
+def _attach_multiyear_partitions(conn, base_table_name: str, multiyear_table_name: str, years: List[int], create_spatial_index: bool):
+    partition_names = {y: base_table_name.format(year=y) for y in years}
+
+    attached_partitions = _get_partitions(conn=conn, table_name=multiyear_table_name)
+    if attached_partitions is None:
+        # The multiyear table does not exist or was built by the copy engine
+        _drop_multiyear_table(conn=conn, multiyear_table_name=multiyear_table_name)
+        _add_year_column(conn=conn, table_name=partition_names[years[0]], year=years[0])
+        conn.execute(text(f"CREATE TABLE {multiyear_table_name} (LIKE {partition_names[years[0]]}) PARTITION BY LIST (year)"))
+        # The engines type the geometry columns differently (geometry or geometry(Geometry, srid)), so the multiyear table uses the plain geometry type
+        for column_name in _get_column_types(conn=conn, table_name=multiyear_table_name, type_name='geometry'):
+            conn.execute(text(f"ALTER TABLE {multiyear_table_name} ALTER COLUMN {column_name} TYPE geometry"))
         if create_spatial_index:
-            conn.execute(text(f"CREATE INDEX ON {multiyear_cluster_table_name} USING GIST (geom)"))
+            # Partitioned index: attached partitions get their own spatial index (or keep a matching existing one)
+            conn.execute(text(f"CREATE INDEX ON {multiyear_table_name} USING GIST (geom)"))
+        attached_partitions = []
+
+    for partition_name in set(attached_partitions) - set(partition_names.values()):
+        conn.execute(text(f"ALTER TABLE {multiyear_table_name} DETACH PARTITION {partition_name}"))
+
+    for y, partition_name in partition_names.items():
+        if partition_name in attached_partitions:
+            continue
+        _add_year_column(conn=conn, table_name=partition_name, year=y)
+        _match_column_types(conn=conn, table_name=partition_name, parent_table_name=multiyear_table_name)
+        conn.execute(text(f"ALTER TABLE {multiyear_table_name} ATTACH PARTITION {partition_name} FOR VALUES IN ({y})"))
+
+
+def _get_partitions(conn, table_name: str) -> Optional[List[str]]:
+    # Names of the partitions of a partitioned table, None if the table does not exist or is not partitioned
+    row = conn.execute(text("""
+        SELECT c.relkind, ARRAY(SELECT i.inhrelid::regclass::text FROM pg_inherits i WHERE i.inhparent = c.oid)
+        FROM pg_class c
+        WHERE c.oid = to_regclass(:table_name)
+        """), {'table_name': table_name}).fetchone()
+    if row is None or row[0] != 'p':
+        return None
+    return list(row[1])
+
+
+def _get_column_types(conn, table_name: str, type_name: str = None) -> Dict[str, str]:
+    # Columns of a table with their full type (including the type modifier, e.g., geometry(Geometry,54009)), optionally only those of a base type
+    rows = conn.execute(text("""
+        SELECT a.attname, format_type(a.atttypid, a.atttypmod)
+        FROM pg_attribute a
+        WHERE a.attrelid = to_regclass(:table_name) AND a.attnum > 0 AND NOT a.attisdropped AND (CAST(:type_name AS TEXT) IS NULL OR a.atttypid::regtype::text = :type_name)
+        """), {'table_name': table_name, 'type_name': type_name}).fetchall()
+    return dict(rows)
+
+
+def _match_column_types(conn, table_name: str, parent_table_name: str):
+    # ATTACH PARTITION requires the exact column types of the parent. Dropping the type modifier of a geometry column does not rewrite the table.
+    column_types = _get_column_types(conn=conn, table_name=table_name)
+    for column_name, column_type in _get_column_types(conn=conn, table_name=parent_table_name).items():
+        if column_name in column_types and column_types[column_name] != column_type:
+            conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE {column_type} USING {column_name}::{column_type}"))
+
+
+def _add_year_column(conn, table_name: str, year: int):
+    # A constant default is stored in the catalog, so the table is not rewritten
+    conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS year INTEGER NOT NULL DEFAULT {year}"))
+
+
+def _drop_multiyear_table(conn, multiyear_table_name: str):
+    # Dropping a partitioned table drops its partitions, which are the per-year tables, so they are detached first
+    for partition_name in _get_partitions(conn=conn, table_name=multiyear_table_name) or []:
+        conn.execute(text(f"ALTER TABLE {multiyear_table_name} DETACH PARTITION {partition_name}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {multiyear_table_name}"))
+
+
+def create_cluster_intersection_matching(db: DB, cluster_intersection_matching_table_name: str, multiyear_cluster_table_name: str, years_to_match: List[int] = None) -> None:
+    """
+    Parameters:
+    - years_to_match: if given, only the pairs involving these years are (re)computed and the other pairs of the existing matching are kept
+    """
+    e = get_db_engine(db=db)
+    if years_to_match is None:
+        with e.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {cluster_intersection_matching_table_name}"))
+            conn.execute(text(f"""
+            CREATE TABLE {cluster_intersection_matching_table_name} AS
+            SELECT c1.year as y1, c1.cluster_id AS id1, c2.year AS y2, c2.cluster_id AS id2
+            FROM {multiyear_cluster_table_name} c1 JOIN {multiyear_cluster_table_name} c2
+            ON ST_Intersects(c1.geom, c2.geom);
+            """))
+    elif years_to_match:
+        years = ', '.join(str(y) for y in years_to_match)
+        with e.begin() as conn:
+            conn.execute(text(f"DELETE FROM {cluster_intersection_matching_table_name} WHERE y1 IN ({years}) OR y2 IN ({years})"))
+            conn.execute(text(f"""
+            INSERT INTO {cluster_intersection_matching_table_name}
+            SELECT c1.year as y1, c1.cluster_id AS id1, c2.year AS y2, c2.cluster_id AS id2
+            FROM {multiyear_cluster_table_name} c1 JOIN {multiyear_cluster_table_name} c2
+            ON ST_Intersects(c1.geom, c2.geom)
+            WHERE c1.year IN ({years}) OR c2.year IN ({years});
+            """))
+    else:
+        return
+    # An incremental update keeps the other pairs, so the matching also depends on its previous version
+    touch_tables(db=db, table_names=[cluster_intersection_matching_table_name],
+                 inputs=[multiyear_cluster_table_name] + ([cluster_intersection_matching_table_name] if years_to_match is not None else []), params={'years_to_match': years_to_match})
+
+
+def create_cluster_pixel_overlap_matching(db: DB, cluster_intersection_matching_table_name: str, cluster_table_name: str, label_raster_name: str, years: List[int],
+                                          years_to_match: List[int] = None) -> None:
+    """
+    Pixel based alternative to create_cluster_intersection_matching for clusters that come from label rasters on a common grid.
+    Pairs are found by looking up the labels of every pair of years pixel by pixel (including 8-neighbours, so that the pairs
+    are the same as with ST_Intersects), and the number of overlapping pixels is recorded as the match weight.
+    Each pair of years is stored in one direction (y1 < y2), together with one self match per cluster.
 
+    Parameters:
+    - cluster_table_name: template of the per-year cluster table names. Only clusters present in these tables are matched.
+    - label_raster_name: template of the per-year names of the cached label rasters in the label raster store (label = position in the label raster ids + 1)
+    - years_to_match: if given, only the pairs involving these years are (re)computed and the other pairs of the existing matching are kept
+    """
+    if years_to_match is not None and not years_to_match:
+        return
+    e = get_db_engine(db=db)
+
+    with e.connect() as conn:
+        cluster_ids = {y: copy_query_to_dataframe(conn=conn, query=f"SELECT cluster_id FROM {cluster_table_name.format(year=y)}", dtypes={'cluster_id': 'int64'})['cluster_id'].to_numpy() for y in years}
+
+    label_raster_store = get_label_raster_store()
+    label_rasters = {y: label_raster_store.load_label_raster(name=label_raster_name.format(year=y)) for y in years}
+    matching = []
+    for i, y1 in enumerate(years):
+        if years_to_match is None or y1 in years_to_match:
+            pixel_count = np.bincount(np.asarray(label_rasters[y1].labels).ravel(), minlength=len(label_rasters[y1].ids) + 1)[1:]
+            is_cluster = np.isin(label_rasters[y1].ids, cluster_ids[y1])
+            matching.append(pd.DataFrame({'y1': y1, 'id1': label_rasters[y1].ids[is_cluster], 'y2': y1, 'id2': label_rasters[y1].ids[is_cluster], 'overlap': pixel_count[is_cluster]}))
+
+        for y2 in years[i + 1:]:
+            if years_to_match is not None and y1 not in years_to_match and y2 not in years_to_match:
+                continue
+            label_1, label_2, overlap = get_label_raster_matching(labels_1=label_rasters[y1].labels, labels_2=label_rasters[y2].labels)
+            id1, id2 = label_rasters[y1].ids[label_1 - 1], label_rasters[y2].ids[label_2 - 1]
+            is_cluster_pair = np.isin(id1, cluster_ids[y1]) & np.isin(id2, cluster_ids[y2])
+            matching.append(pd.DataFrame({'y1': y1, 'id1': id1[is_cluster_pair], 'y2': y2, 'id2': id2[is_cluster_pair], 'overlap': overlap[is_cluster_pair]}))
+
+    with e.begin() as conn:
+        if years_to_match is None:
+            conn.execute(text(f"DROP TABLE IF EXISTS {cluster_intersection_matching_table_name}"))
+            conn.execute(text(f"CREATE TABLE {cluster_intersection_matching_table_name} (y1 INTEGER, id1 BIGINT, y2 INTEGER, id2 BIGINT, overlap BIGINT)"))
+        else:
+            years = ', '.join(str(y) for y in years_to_match)
+            conn.execute(text(f"DELETE FROM {cluster_intersection_matching_table_name} WHERE y1 IN ({years}) OR y2 IN ({years})"))
+        copy_dataframe_to_postgres(conn=conn, data=pd.concat(matching, ignore_index=True), table_name=cluster_intersection_matching_table_name)
+    # The label rasters are written with the cluster tables, whose versions stand for them
+    cluster_table_names = [cluster_table_name.format(year=y) for y in years]
+    touch_tables(db=db, table_names=[cluster_intersection_matching_table_name],
+                 inputs=cluster_table_names + ([cluster_intersection_matching_table_name] if years_to_match is not None else []), params={'years': years, 'years_to_match': years_to_match})
 
-def create_cluster_intersection_matching(db: DB, cluster_intersection_matching_table_name: str, multiyear_cluster_table_name: str) -> None:
+
+def create_crosswalk_cluster_uid_to_cluster_id(db: DB, intersection_matching_table_name: str, crosswalk_cluster_uid_to_cluster_id_table_name: str, cluster_uid_mapping_table_name: str = None) -> None:
+    """
+    Parameters:
+    - cluster_uid_mapping_table_name: mapping table of the last incremental update, dropped since all the uids are renumbered
+    """
     e = get_db_engine(db=db)
+
+    # The matching is symmetric, so we only read one direction of each edge (self matches are kept so that isolated clusters get a uid)
+    with e.connect() as conn:
+        matching = copy_query_to_dataframe(conn=conn,
+                                           query=f"SELECT y1, id1, y2, id2 FROM {intersection_matching_table_name} WHERE (y1, id1) <= (y2, id2)",
+                                           dtypes={'y1': 'int64', 'id1': 'int64', 'y2': 'int64', 'id2': 'int64'})
+
+    cluster_uid, year, cluster_id = get_cluster_year_connected_components(y1=matching['y1'].to_numpy(), id1=matching['id1'].to_numpy(),
+                                                                          y2=matching['y2'].to_numpy(), id2=matching['id2'].to_numpy())
+    crosswalk = pd.DataFrame({'cluster_uid': cluster_uid, 'year': year, 'cluster_id': cluster_id})
+
     with e.begin() as conn:
-        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_intersection_matching_table_name}"))
-        conn.execute(text(f"""
-        CREATE TABLE {cluster_intersection_matching_table_name} AS
-        SELECT c1.year as y1, c1.cluster_id AS id1, c2.year AS y2, c2.cluster_id AS id2
-        FROM {multiyear_cluster_table_name} c1 JOIN {multiyear_cluster_table_name} c2
-        ON ST_Intersects(c1.geom, c2.geom);
-        """))
+        conn.execute(text(f"DROP TABLE IF EXISTS {crosswalk_cluster_uid_to_cluster_id_table_name}"))
+        conn.execute(text(f"CREATE TABLE {crosswalk_cluster_uid_to_cluster_id_table_name} (cluster_uid BIGINT, year INTEGER, cluster_id BIGINT)"))
+        copy_dataframe_to_postgres(conn=conn, data=crosswalk, table_name=crosswalk_cluster_uid_to_cluster_id_table_name)
+        if cluster_uid_mapping_table_name is not None:
+            conn.execute(text(f"DROP TABLE IF EXISTS {cluster_uid_mapping_table_name}"))
+    touch_tables(db=db, table_names=[crosswalk_cluster_uid_to_cluster_id_table_name], inputs=[intersection_matching_table_name])
+
+
+def get_years_to_add(db: DB, crosswalk_cluster_uid_to_cluster_id_table_name: str, years: List[int]) -> Optional[List[int]]:
+    """
+    Years that can be added incrementally to the existing time consistent clusters, i.e., the years that are not in the crosswalk yet
+
+    Returns:
+    - The years to add (possibly none), or None if the crosswalk does not exist or has years that are not in years anymore,
+      in which case the time consistent clusters must be rebuilt
+    """
+    e = get_db_engine(db=db)
+    with e.connect() as conn:
+        if not inspect(conn).has_table(crosswalk_cluster_uid_to_cluster_id_table_name):
+            return None
+        existing_years = {row[0] for row in conn.execute(text(f"SELECT DISTINCT year FROM {crosswalk_cluster_uid_to_cluster_id_table_name}"))}
+    if not existing_years or existing_years - set(years):
+        return None
+    return [y for y in years if y not in existing_years]
 
 
-def create_crosswalk_cluster_uid_to_cluster_id(db: DB, intersection_matching_table_name: str, crosswalk_cluster_uid_to_cluster_id_table_name: str) -> None:
+def update_crosswalk_cluster_uid_to_cluster_id(db: DB, intersection_matching_table_name: str, crosswalk_cluster_uid_to_cluster_id_table_name: str,
+                                               cluster_uid_mapping_table_name: str, years_to_add: List[int]) -> None:
+    """
+    Incremental alternative to create_crosswalk_cluster_uid_to_cluster_id: add the clusters of new years to the existing time consistent clusters.
+    The crosswalk holds the components found so far, so only the matching pairs involving the new years are read. Existing uids are kept,
+    except for merged clusters that take the smallest of their uids, and new clusters get new uids.
+
+    The mapping table (old_cluster_uid, cluster_uid) lists the time consistent clusters to recompute downstream, with the old uids they replace
+    (old_cluster_uid is NULL for new clusters). Old uids that are mapped to another uid do not exist anymore.
+    """
     e = get_db_engine(db=db)
+    if not years_to_add:
+        # Nothing to add: the mapping of a previous update is stale, without it the downstream tables are fully rebuilt
+        with e.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {cluster_uid_mapping_table_name}"))
+        return
+    years = ', '.join(str(y) for y in years_to_add)
 
     with e.connect() as conn:
-        matching = pd.read_sql(f"SELECT * FROM {intersection_matching_table_name}", con=conn)
+        crosswalk = copy_query_to_dataframe(conn=conn, query=f"SELECT cluster_uid, year, cluster_id FROM {crosswalk_cluster_uid_to_cluster_id_table_name}",
+                                            dtypes={'cluster_uid': 'int64', 'year': 'int64', 'cluster_id': 'int64'})
+        matching = copy_query_to_dataframe(conn=conn,
+                                           query=f"SELECT y1, id1, y2, id2 FROM {intersection_matching_table_name} WHERE (y1 IN ({years}) OR y2 IN ({years})) AND (y1, id1) <= (y2, id2)",
+                                           dtypes={'y1': 'int64', 'id1': 'int64', 'y2': 'int64', 'id2': 'int64'})
 
-    cluster_year_connected_component = get_cluster_year_connected_component_table(intersection_matching=matching)
-    cluster_year_connected_component = cluster_year_connected_component.rename(columns={"component_id": "cluster_uid", "year": "year", "cluster_id": "cluster_id"})
-    cluster_year_connected_component = cluster_year_connected_component[["cluster_uid", "year", "cluster_id"]].copy()
+    cluster_uid, year, cluster_id, old_cluster_uid, updated_cluster_uid = update_cluster_year_connected_components(
+        cluster_uid=crosswalk['cluster_uid'].to_numpy(), year=crosswalk['year'].to_numpy(), cluster_id=crosswalk['cluster_id'].to_numpy(),
+        y1=matching['y1'].to_numpy(), id1=matching['id1'].to_numpy(), y2=matching['y2'].to_numpy(), id2=matching['id2'].to_numpy())
+    new_crosswalk = pd.DataFrame({'cluster_uid': cluster_uid, 'year': year, 'cluster_id': cluster_id}).iloc[len(crosswalk):]
+    mapping = pd.DataFrame({'old_cluster_uid': pd.Series(old_cluster_uid, dtype='Int64').mask(old_cluster_uid < 0), 'cluster_uid': updated_cluster_uid})
+    logger.info(f"Adding years {years_to_add}: {len(new_crosswalk)} new clusters, {len(np.unique(updated_cluster_uid))} time consistent clusters to recompute")
 
     with e.begin() as conn:
-        cluster_year_connected_component.to_sql(name=crosswalk_cluster_uid_to_cluster_id_table_name, con=conn, index=False, if_exists='replace')
\ No newline at end of file
+        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_uid_mapping_table_name}"))
+        conn.execute(text(f"CREATE TABLE {cluster_uid_mapping_table_name} (old_cluster_uid BIGINT, cluster_uid BIGINT)"))
+        copy_dataframe_to_postgres(conn=conn, data=mapping, table_name=cluster_uid_mapping_table_name)
+
+        conn.execute(text(f"""
+        UPDATE {crosswalk_cluster_uid_to_cluster_id_table_name} cw SET cluster_uid = m.cluster_uid
+        FROM {cluster_uid_mapping_table_name} m
+        WHERE cw.cluster_uid = m.old_cluster_uid AND m.old_cluster_uid <> m.cluster_uid
+        """))
+        copy_dataframe_to_postgres(conn=conn, data=new_crosswalk, table_name=crosswalk_cluster_uid_to_cluster_id_table_name)
+    touch_tables(db=db, table_names=[crosswalk_cluster_uid_to_cluster_id_table_name, cluster_uid_mapping_table_name],
+                 inputs=[intersection_matching_table_name, crosswalk_cluster_uid_to_cluster_id_table_name], params={'years_to_add': years_to_add})
+
+
+def has_cluster_uid_mapping(db: DB, cluster_uid_mapping_table_name: str) -> bool:
+    # The mapping table exists after an incremental update of the crosswalk, the downstream tables then only recompute the clusters it lists
+    with get_db_engine(db=db).connect() as conn:
+        return inspect(conn).has_table(cluster_uid_mapping_table_name)
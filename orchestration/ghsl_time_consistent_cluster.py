@@ -1,12 +1,25 @@
-from sqlalchemy import text
-from src.python.utils import execute_bash_script, run_sql_script_on_db, DB, get_db_engine, execute_sql_file
-from common import create_multiyear_table as _create_multiyear_table, create_crosswalk_cluster_uid_to_cluster_id as _create_crosswalk_cluster_uid_to_cluster_id, create_cluster_intersection_matching as _create_cluster_intersection_matching
+from typing import Dict, List, Optional, Tuple
+import os
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import rasterio
+import xarray as xr
+from sqlalchemy import text, inspect
+from src.python.utils import execute_bash_script, run_sql_script_on_db, DB, get_db_engine, copy_dataframe_to_postgres, copy_query_to_dataframe, touch_tables
+from src.python.postgis_raster_io import load_raster_tiled, get_raster_grid, crs_to_srid, srid_to_crs
+from src.python.clustering import get_structuring_element, label_clusters, label_clusters_sharded, polygonize_labels
+from src.python.pipeline import Task, get_year_tasks, run_tasks, get_memory_bounded_concurrency, BASH, POSTGRES, RASTER
+from src.python.geo_export import export_geoparquet, export_flatgeobuf
+from src.python.zonal_stats import LabelRaster, rasterize_label_raster, zonal_sum, zonal_majority
+from src.python.raster_store import get_label_raster_store
+from common import create_multiyear_table as _create_multiyear_table, create_crosswalk_cluster_uid_to_cluster_id as _create_crosswalk_cluster_uid_to_cluster_id, create_cluster_intersection_matching as _create_cluster_intersection_matching, create_cluster_pixel_overlap_matching as _create_cluster_pixel_overlap_matching
+from common import get_years_to_add as _get_years_to_add, update_crosswalk_cluster_uid_to_cluster_id as _update_crosswalk_cluster_uid_to_cluster_id, has_cluster_uid_mapping as _has_cluster_uid_mapping
 from config import config
 
 
 def load_ghsl_rasters():
-    for year in config.param.ghsl.years:
-        _load_ghsl_rasters(year=year)
+    run_tasks(tasks=get_year_tasks(name='ghsl_rasters', function=_load_ghsl_rasters, years=config.param.ghsl.years, backend=BASH))
 
 
 def _load_ghsl_rasters(year: int):
@@ -14,14 +27,78 @@ def _load_ghsl_rasters(year: int):
             config.db.ghsl_table.pop.format(year=year), config.db.ghsl_table.smod.format(year=year),
             config.db.postgres_user, config.db.postgres_password, config.db.postgres_host, str(config.db.postgres_port), config.db.ghsl_postgres_db_name]
     execute_bash_script(file_path=config.path.bash.ghsl_etl.load_ghsl_rasters, args=args)
+    touch_tables(db=DB.GHSL_POSTGRES, table_names=[config.db.ghsl_table.pop.format(year=year), config.db.ghsl_table.smod.format(year=year)],
+                 inputs=[config.path.source_data.pop.format(year=year), config.path.source_data.smod.format(year=year)])
 
 
 def create_cluster():
-    for year in config.param.ghsl.years:
-        _create_cluster(year=year)
+    run_tasks(tasks=_get_cluster_tasks(), backend_concurrency=_get_backend_concurrency())
+
+
+def load_ghsl_rasters_and_create_cluster():
+    # The clusters of a year are created as soon as its pop and smod rasters are loaded, while the other years are still loading
+    tasks = get_year_tasks(name='ghsl_rasters', function=_load_ghsl_rasters, years=config.param.ghsl.years, backend=BASH)
+    run_tasks(tasks=tasks + _get_cluster_tasks(dependencies=lambda y: [f'ghsl_rasters_{y}']), backend_concurrency=_get_backend_concurrency())
+
+
+def _get_cluster_tasks(dependencies=None) -> List[Task]:
+    if config.param.ghsl.cluster_engine == 'python':
+        return get_year_tasks(name='cluster', function=_create_cluster_python, years=config.param.ghsl.years, backend=RASTER, dependencies=dependencies)
+    return get_year_tasks(name='cluster', function=_create_cluster, years=config.param.ghsl.years, backend=POSTGRES, dependencies=dependencies)
+
+
+def _get_backend_concurrency() -> Dict[str, int]:
+    # A raster task holds the pop and smod rasters of an epoch, the urban mask and two int32 label arrays
+    pop_path, smod_path = config.path.source_data.pop.format(year=config.param.ghsl.years[0]), config.path.source_data.smod.format(year=config.param.ghsl.years[0])
+    if not (os.path.exists(pop_path) and os.path.exists(smod_path)):
+        return config.param.pipeline.backend_concurrency
+    with rasterio.open(pop_path) as pop, rasterio.open(smod_path) as smod:
+        pixel_bytes = np.dtype(pop.dtypes[0]).itemsize + np.dtype(smod.dtypes[0]).itemsize + 1 + 2 * np.dtype(np.int32).itemsize
+        task_memory_bytes = pop.width * pop.height * pixel_bytes
+    return {**config.param.pipeline.backend_concurrency, RASTER: get_memory_bounded_concurrency(task_memory_bytes=task_memory_bytes)}
+
+
+def _create_cluster_python(year: int):
+    # Label the urban pixels of the smod raster (see get_structuring_element)
+    assert config.param.ghsl.dbscan_min_points == 1, "The python cluster engine only supports dbscan_min_points = 1"
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+    cluster_table = config.db.ghsl_table.cluster.format(year=year)
+
+    with e.begin() as conn:
+        smod = load_raster_tiled(con=conn, raster_table=config.db.ghsl_table.smod.format(year=year))
+        pop = load_raster_tiled(con=conn, raster_table=config.db.ghsl_table.pop.format(year=year))
+    assert smod.shape == pop.shape and smod.rio.transform() == pop.rio.transform(), "The smod and pop rasters must be on the same grid"
+
+    labels, n_clusters = label_urban_pixels(smod=smod, lower_bound_urban=config.param.ghsl.lower_bound_urban, upper_bound_urban=config.param.ghsl.upper_bound_urban,
+                                            dbscan_eps=config.param.ghsl.dbscan_eps)
+
+    label_raster = LabelRaster(labels=labels, ids=np.arange(n_clusters), transform=smod.rio.transform(), crs=str(smod.rio.crs))
+    get_label_raster_store().save_label_raster(name=config.path.cache.ghsl_cluster_label_raster.format(year=year), label_raster=label_raster)
+    population = zonal_sum(label_raster=label_raster, values=pop.sel(band=1).values, nodata=pop.rio.nodata)
+
+    clusters = polygonize_labels(labels=labels, transform=smod.rio.transform(), crs=smod.rio.crs)
+    clusters = clusters.assign(cluster_id=clusters['label'] - 1, population=population[clusters['label'].to_numpy() - 1]).rename_geometry('geom')[['cluster_id', 'population', 'geom']]
+
+    with e.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_table}"))
+        conn.execute(text(f"CREATE TABLE {cluster_table} (cluster_id INTEGER PRIMARY KEY, population DOUBLE PRECISION, geom geometry(Geometry, {crs_to_srid(smod.rio.crs)}))"))
+        copy_dataframe_to_postgres(conn=conn, data=clusters, table_name=cluster_table)
+        conn.execute(text(f"CREATE INDEX ON {cluster_table} USING GIST (geom)"))
+    touch_tables(db=DB.GHSL_POSTGRES, table_names=[cluster_table], inputs=[config.db.ghsl_table.smod.format(year=year), config.db.ghsl_table.pop.format(year=year)],
+                 params={'lower_bound_urban': config.param.ghsl.lower_bound_urban, 'upper_bound_urban': config.param.ghsl.upper_bound_urban, 'dbscan_eps': config.param.ghsl.dbscan_eps})
 
 
-@run_sql_script_on_db(db=DB.GHSL_POSTGRES)
+def label_urban_pixels(smod: xr.DataArray, lower_bound_urban: int, upper_bound_urban: int, dbscan_eps: float) -> Tuple[np.ndarray, int]:
+    # Pixels with lower_bound_urban < smod <= upper_bound_urban are urban
+    smod_values = smod.sel(band=1).values
+    urban = (smod_values > lower_bound_urban) & (smod_values <= upper_bound_urban)
+    structure = get_structuring_element(eps=dbscan_eps, pixel_size=abs(smod.rio.resolution()[0]))
+    if config.param.ghsl.cluster_tile_size is None:
+        return label_clusters(mask=urban, structure=structure)
+    return label_clusters_sharded(mask=urban, structure=structure, tile_size=config.param.ghsl.cluster_tile_size, max_workers=config.param.ghsl.cluster_workers)
+
+
+@run_sql_script_on_db(db=DB.GHSL_POSTGRES, outputs=['cluster_table'])
 def _create_cluster(year: int):
     sql_file_path = config.path.sql.ghsl_tcc.create_cluster
     params = {
@@ -29,6 +106,7 @@ def _create_cluster(year: int):
         'smod_table': config.db.ghsl_table.smod.format(year=year),
         'cluster_table': config.db.ghsl_table.cluster.format(year=year),
         'lower_bound_urban': config.param.ghsl.lower_bound_urban,
+        'upper_bound_urban': config.param.ghsl.upper_bound_urban,
         'dbscan_eps': config.param.ghsl.dbscan_eps,
         'dbscan_minpoints': config.param.ghsl.dbscan_min_points
     }
@@ -43,38 +121,116 @@ def create_multiyear_tables_and_cluster_intersection_matching():
                             create_spatial_index=True,
                             db=DB.GHSL_POSTGRES)
 
-    _create_cluster_intersection_matching(db=DB.GHSL_POSTGRES,
-                                          cluster_intersection_matching_table_name=config.db.ghsl_table.cluster_intersection_matching,
-                                          multiyear_cluster_table_name=config.db.ghsl_table.multiyear_cluster)
+    years_to_match = _get_epochs_to_add()
+    if config.param.ghsl.matching_engine == 'pixel':
+        _create_cluster_pixel_overlap_matching(db=DB.GHSL_POSTGRES,
+                                               cluster_intersection_matching_table_name=config.db.ghsl_table.cluster_intersection_matching,
+                                               cluster_table_name=config.db.ghsl_table.cluster,
+                                               label_raster_name=config.path.cache.ghsl_cluster_label_raster,
+                                               years=config.param.ghsl.years,
+                                               years_to_match=years_to_match)
+    else:
+        _create_cluster_intersection_matching(db=DB.GHSL_POSTGRES,
+                                              cluster_intersection_matching_table_name=config.db.ghsl_table.cluster_intersection_matching,
+                                              multiyear_cluster_table_name=config.db.ghsl_table.multiyear_cluster,
+                                              years_to_match=years_to_match)
 
 
 def create_crosswalk_cluster_uid_to_cluster_id() -> None:
-    _create_crosswalk_cluster_uid_to_cluster_id(db=DB.GHSL_POSTGRES,
-                                                intersection_matching_table_name=config.db.ghsl_table.cluster_intersection_matching,
-                                                crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ghsl_table.crosswalk_cluster_uid_to_cluster_id)
+    years_to_add = _get_epochs_to_add()
+    if years_to_add is None:
+        _create_crosswalk_cluster_uid_to_cluster_id(db=DB.GHSL_POSTGRES,
+                                                    intersection_matching_table_name=config.db.ghsl_table.cluster_intersection_matching,
+                                                    crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ghsl_table.crosswalk_cluster_uid_to_cluster_id,
+                                                    cluster_uid_mapping_table_name=config.db.ghsl_table.cluster_uid_mapping)
+    else:
+        _update_crosswalk_cluster_uid_to_cluster_id(db=DB.GHSL_POSTGRES,
+                                                    intersection_matching_table_name=config.db.ghsl_table.cluster_intersection_matching,
+                                                    crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ghsl_table.crosswalk_cluster_uid_to_cluster_id,
+                                                    cluster_uid_mapping_table_name=config.db.ghsl_table.cluster_uid_mapping,
+                                                    years_to_add=years_to_add)
+
+
+def _get_epochs_to_add() -> Optional[List[int]]:
+    # Epochs to add to the existing time consistent clusters in incremental mode, None if they must be rebuilt
+    if not config.param.ghsl.incremental_cluster_uid:
+        return None
+    return _get_years_to_add(db=DB.GHSL_POSTGRES, crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ghsl_table.crosswalk_cluster_uid_to_cluster_id, years=config.param.ghsl.years)
+
+
+def _get_cluster_uid_mapping_table() -> Optional[str]:
+    # Mapping of the last incremental update of the crosswalk, if any. The time consistent tables then only recompute the clusters it lists
+    # and remove the clusters they replace.
+    if config.param.ghsl.incremental_cluster_uid and _has_cluster_uid_mapping(db=DB.GHSL_POSTGRES, cluster_uid_mapping_table_name=config.db.ghsl_table.cluster_uid_mapping):
+        return config.db.ghsl_table.cluster_uid_mapping
+    return None
 
 
-@run_sql_script_on_db(db=DB.GHSL_POSTGRES)
 def create_time_consistent_cluster_geometry_pre_geocoding():
+    _create_time_consistent_cluster_geometry_pre_geocoding()
+    if config.param.ghsl.zonal_stats_engine == 'python':
+        if _get_cluster_uid_mapping_table() is not None:
+            update_time_consistent_cluster_label_raster()
+        else:
+            create_time_consistent_cluster_label_raster()
+
+
+@run_sql_script_on_db(db=DB.GHSL_POSTGRES, outputs=['time_consistent_cluster_geometry_pre_geocoding_table'])
+def _create_time_consistent_cluster_geometry_pre_geocoding():
     sql_file_path = config.path.sql.ghsl_tcc.create_time_consistent_cluster_geometry
     params = {
         'multiyear_cluster_table': config.db.ghsl_table.multiyear_cluster,
         'crosswalk_cluster_uid_to_cluster_id_table': config.db.ghsl_table.crosswalk_cluster_uid_to_cluster_id,
+        'cluster_uid_mapping_table': _get_cluster_uid_mapping_table(),
         'time_consistent_cluster_geometry_pre_geocoding_table': config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding
     }
     return sql_file_path, params
 
 
-def create_time_consistent_cluster_pre_geocoding():
+def create_time_consistent_cluster_label_raster():
+    # Rasterize the time consistent cluster geometries once onto the population grid, all epochs reuse the cached label raster
     e = get_db_engine(db=DB.GHSL_POSTGRES)
-    with e.begin() as conn:
-        for year in config.param.ghsl.years:
-            params = {
-                'time_consistent_cluster_year': config.db.ghsl_table.time_consistent_cluster_year.format(year=year),
-                'time_consistent_cluster_geometry_pre_geocoding_table': config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding,
-                'pop_table': config.db.ghsl_table.pop.format(year=year)
-            }
-            execute_sql_file(conn=conn, file_path=config.path.sql.ghsl_tcc.create_time_consistent_cluster, params=params)
+    with e.connect() as conn:
+        shape, transform, srid = get_raster_grid(con=conn, raster_table=config.db.ghsl_table.pop.format(year=config.param.ghsl.years[0]))
+        geometry = gpd.read_postgis(f"SELECT cluster_uid, geom FROM {config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding}", con=conn, geom_col='geom')
+
+    label_raster = rasterize_label_raster(geometries=geometry.geometry.values, ids=geometry['cluster_uid'].to_numpy(), shape=shape, transform=transform, crs=str(srid_to_crs(srid)))
+    get_label_raster_store().save_label_raster(name=config.path.cache.ghsl_time_consistent_cluster_label_raster, label_raster=label_raster)
+
+
+def update_time_consistent_cluster_label_raster():
+    # Incremental alternative to create_time_consistent_cluster_label_raster: only the recomputed clusters are rasterized again
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+    cluster_uid_mapping_table = config.db.ghsl_table.cluster_uid_mapping
+    geometry_table = config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding
+    with e.connect() as conn:
+        replaced_uids = copy_query_to_dataframe(conn=conn, query=f"SELECT old_cluster_uid FROM {cluster_uid_mapping_table} WHERE old_cluster_uid IS NOT NULL UNION SELECT cluster_uid FROM {cluster_uid_mapping_table}",
+                                                dtypes={'cluster_uid': 'int64'})['cluster_uid'].to_numpy()
+        geometry = gpd.read_postgis(f"SELECT cluster_uid, geom FROM {geometry_table} WHERE cluster_uid IN (SELECT cluster_uid FROM {cluster_uid_mapping_table})", con=conn, geom_col='geom')
+
+    label_raster = get_label_raster_store().load_label_raster(name=config.path.cache.ghsl_time_consistent_cluster_label_raster, mmap=False)
+    is_replaced = np.isin(label_raster.ids, replaced_uids)
+    kept_ids = label_raster.ids[~is_replaced]
+    lookup = np.zeros(len(label_raster.ids) + 1, dtype=label_raster.labels.dtype)
+    lookup[1:][~is_replaced] = np.arange(1, len(kept_ids) + 1)
+    labels = lookup[label_raster.labels]
+
+    updated = rasterize_label_raster(geometries=geometry.geometry.values, ids=geometry['cluster_uid'].to_numpy(), shape=labels.shape, transform=label_raster.transform, crs=label_raster.crs)
+    is_updated = updated.labels > 0
+    labels[is_updated] = updated.labels[is_updated] + len(kept_ids)
+    get_label_raster_store().save_label_raster(name=config.path.cache.ghsl_time_consistent_cluster_label_raster,
+                                               label_raster=LabelRaster(labels=labels, ids=np.concatenate([kept_ids, updated.ids]), transform=label_raster.transform, crs=label_raster.crs))
+
+
+def create_time_consistent_cluster_pre_geocoding():
+    if config.param.ghsl.zonal_stats_engine == 'python':
+        label_raster = get_label_raster_store().load_label_raster(name=config.path.cache.ghsl_time_consistent_cluster_label_raster)
+        tasks = [Task(name=f'time_consistent_cluster_{year}', function=_create_time_consistent_cluster_year,
+                      kwargs={'year': year, 'label_raster': label_raster, 'cluster_uid_mapping_table': _get_year_cluster_uid_mapping_table(year=year)}, backend=RASTER)
+                 for year in config.param.ghsl.years]
+    else:
+        tasks = get_year_tasks(name='time_consistent_cluster', function=_create_time_consistent_cluster_year_sql, years=config.param.ghsl.years, backend=POSTGRES)
+    run_tasks(tasks=tasks, backend_concurrency=_get_backend_concurrency())
 
     _create_multiyear_table(base_table_name=config.db.ghsl_table.time_consistent_cluster_year,
                             multiyear_cluster_table_name=config.db.ghsl_table.time_consistent_cluster_pre_geocoding,
@@ -84,6 +240,55 @@ def create_time_consistent_cluster_pre_geocoding():
                             db=DB.GHSL_POSTGRES)
 
 
+@run_sql_script_on_db(db=DB.GHSL_POSTGRES, outputs=['time_consistent_cluster_year'])
+def _create_time_consistent_cluster_year_sql(year: int):
+    sql_file_path = config.path.sql.ghsl_tcc.create_time_consistent_cluster
+    params = {
+        'time_consistent_cluster_year': config.db.ghsl_table.time_consistent_cluster_year.format(year=year),
+        'time_consistent_cluster_geometry_pre_geocoding_table': config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding,
+        'cluster_uid_mapping_table': _get_year_cluster_uid_mapping_table(year=year),
+        'pop_table': config.db.ghsl_table.pop.format(year=year)
+    }
+    return sql_file_path, params
+
+
+def _get_year_cluster_uid_mapping_table(year: int) -> Optional[str]:
+    # The populations of the epochs that already have a table are only recomputed for the clusters of the incremental update
+    cluster_uid_mapping_table = _get_cluster_uid_mapping_table()
+    if cluster_uid_mapping_table is None:
+        return None
+    with get_db_engine(db=DB.GHSL_POSTGRES).connect() as conn:
+        return cluster_uid_mapping_table if inspect(conn).has_table(config.db.ghsl_table.time_consistent_cluster_year.format(year=year)) else None
+
+
+def _create_time_consistent_cluster_year(year: int, label_raster: LabelRaster, cluster_uid_mapping_table: str = None):
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+    time_consistent_cluster_year_table = config.db.ghsl_table.time_consistent_cluster_year.format(year=year)
+
+    with e.begin() as conn:
+        pop = load_raster_tiled(con=conn, raster_table=config.db.ghsl_table.pop.format(year=year))
+        if cluster_uid_mapping_table is not None:
+            cluster_uids = copy_query_to_dataframe(conn=conn, query=f"SELECT DISTINCT cluster_uid FROM {cluster_uid_mapping_table}", dtypes={'cluster_uid': 'int64'})['cluster_uid'].to_numpy()
+    population = pd.DataFrame({'cluster_uid': label_raster.ids, 'population': zonal_sum(label_raster=label_raster, values=pop.sel(band=1).values, nodata=pop.rio.nodata)})
+
+    with e.begin() as conn:
+        if cluster_uid_mapping_table is None:
+            conn.execute(text(f"DROP TABLE IF EXISTS {time_consistent_cluster_year_table}"))
+            conn.execute(text(f"CREATE TABLE {time_consistent_cluster_year_table} (cluster_uid BIGINT, population DOUBLE PRECISION)"))
+        else:
+            conn.execute(text(f"""
+            DELETE FROM {time_consistent_cluster_year_table}
+            WHERE cluster_uid IN (SELECT old_cluster_uid FROM {cluster_uid_mapping_table} UNION SELECT cluster_uid FROM {cluster_uid_mapping_table})
+            """))
+            population = population[population['cluster_uid'].isin(cluster_uids)]
+        copy_dataframe_to_postgres(conn=conn, data=population, table_name=time_consistent_cluster_year_table)
+    # The label raster is rasterized from the geometry table, an incremental update also depends on the previous version of the table
+    inputs = [config.db.ghsl_table.pop.format(year=year), config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding]
+    if cluster_uid_mapping_table is not None:
+        inputs += [cluster_uid_mapping_table, time_consistent_cluster_year_table]
+    touch_tables(db=DB.GHSL_POSTGRES, table_names=[time_consistent_cluster_year_table], inputs=inputs)
+
+
 def load_country_borders():
     e = get_db_engine(db=DB.GHSL_POSTGRES)
 
@@ -95,21 +300,95 @@ def load_country_borders():
             config.path.source_data.crosswalk_cshape_to_world_bank_codes, config.db.ghsl_table.crosswalk_cshape_to_world_bank_codes,
             config.db.postgres_user, config.db.postgres_password, config.db.postgres_host, str(config.db.postgres_port), config.db.ghsl_postgres_db_name]
     execute_bash_script(file_path=config.path.bash.ghsl_etl.load_country_borders, args=args)
+    touch_tables(db=DB.GHSL_POSTGRES, table_names=[config.db.ghsl_table.country_borders, config.db.ghsl_table.crosswalk_cshape_to_world_bank_codes],
+                 inputs=[config.path.source_data.country_borders, config.path.source_data.crosswalk_cshape_to_world_bank_codes])
+
+
+def create_country_label_raster():
+    # Rasterize the country borders valid in each epoch onto the population grid. Epochs with the same valid borders share one rasterization.
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+    with e.connect() as conn:
+        shape, transform, srid = get_raster_grid(con=conn, raster_table=config.db.ghsl_table.pop.format(year=config.param.ghsl.years[0]))
+        country = gpd.read_postgis(f"SELECT gwcode, gwsyear, gweyear, the_geom FROM {config.db.ghsl_table.country_borders}", con=conn, geom_col='the_geom')
+
+    crs = srid_to_crs(srid)
+    country = country.to_crs(crs)
+    label_rasters = {}
+    for year in config.param.ghsl.years:
+        is_valid = ((country['gwsyear'] < year) & (year <= country['gweyear'])) | ((year == 2020) & (country['gweyear'] == 2019))
+        valid_rows = tuple(np.nonzero(is_valid.to_numpy())[0])
+        if valid_rows not in label_rasters:
+            label_rasters[valid_rows] = rasterize_label_raster(geometries=country.geometry.values[list(valid_rows)], ids=country['gwcode'].to_numpy()[list(valid_rows)],
+                                                               shape=shape, transform=transform, crs=str(crs))
+        get_label_raster_store().save_label_raster(name=config.path.cache.ghsl_country_label_raster.format(year=year), label_raster=label_rasters[valid_rows])
+
+
+def create_cluster_country_matching():
+    # Assign each time consistent cluster-year to the country covering most of its pixels. The clusters without any pixel in a country
+    # (pixel centres only) are left out, country_geocoding.sql matches them by intersection with the borders.
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+    cluster_country_matching_table = config.db.ghsl_table.cluster_country_matching
+    label_raster_store = get_label_raster_store()
+    label_raster = label_raster_store.load_label_raster(name=config.path.cache.ghsl_time_consistent_cluster_label_raster)
+
+    matching = []
+    for year in config.param.ghsl.years:
+        country_label_raster = label_raster_store.load_label_raster(name=config.path.cache.ghsl_country_label_raster.format(year=year))
+        cluster_uid, gwcode, _ = zonal_majority(label_raster=label_raster, category_raster=country_label_raster)
+        matching.append(pd.DataFrame({'cluster_uid': cluster_uid, 'year': year, 'gwcode': gwcode}))
+
+    with e.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_country_matching_table}"))
+        conn.execute(text(f"CREATE TABLE {cluster_country_matching_table} (cluster_uid BIGINT, year INTEGER, gwcode INTEGER, PRIMARY KEY (cluster_uid, year))"))
+        copy_dataframe_to_postgres(conn=conn, data=pd.concat(matching, ignore_index=True), table_name=cluster_country_matching_table)
+    # The label rasters are rasterized from the geometry and border tables onto the grid of the pop rasters
+    touch_tables(db=DB.GHSL_POSTGRES, table_names=[cluster_country_matching_table],
+                 inputs=[config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding, config.db.ghsl_table.country_borders, config.db.ghsl_table.pop.format(year=config.param.ghsl.years[0])],
+                 params={'years': config.param.ghsl.years})
 
 
-@run_sql_script_on_db(db=DB.GHSL_POSTGRES)
 def geocode_cluster_with_country():
+    if config.param.ghsl.country_geocoding_engine == 'raster':
+        assert config.param.ghsl.zonal_stats_engine == 'python', "The raster country geocoding requires the python zonal stats engine"
+        create_country_label_raster()
+        create_cluster_country_matching()
+    _geocode_cluster_with_country()
+
+
+@run_sql_script_on_db(db=DB.GHSL_POSTGRES, outputs=['time_consistent_cluster_table', 'time_consistent_cluster_geometry_table'])
+def _geocode_cluster_with_country():
     sql_file_path = config.path.sql.ghsl_tcc.country_geocoding
     params = {
+        'cluster_country_matching_table': config.db.ghsl_table.cluster_country_matching if config.param.ghsl.country_geocoding_engine == 'raster' else None,
         'time_consistent_cluster_pre_geocoding_table': config.db.ghsl_table.time_consistent_cluster_pre_geocoding,
         'time_consistent_cluster_geometry_pre_geocoding_table': config.db.ghsl_table.time_consistent_cluster_geometry_pre_geocoding,
         'time_consistent_cluster_table': config.db.ghsl_table.time_consistent_cluster,
         'country_borders_table': config.db.ghsl_table.country_borders,
+        'crosswalk_cshape_to_world_bank_codes_table': config.db.ghsl_table.crosswalk_cshape_to_world_bank_codes,
         'time_consistent_cluster_geometry_table': config.db.ghsl_table.time_consistent_cluster_geometry
     }
     return sql_file_path, params
 
 
 
+def export_time_consistent_cluster():
+    """
+    Export the geocoded time consistent clusters to files for downstream consumers: GeoParquet partitioned by year and country
+    (World Bank code) and the geometries as FlatGeobuf
+    """
+    e = get_db_engine(db=DB.GHSL_POSTGRES)
+    time_consistent_cluster_table = config.db.ghsl_table.time_consistent_cluster
+    time_consistent_cluster_geometry_table = config.db.ghsl_table.time_consistent_cluster_geometry
+    batch_size = config.param.export.batch_size
+
+    with e.begin() as conn:
+        export_geoparquet(con=conn, query=f"""SELECT c.cluster_uid, c.year, c.population, c.cshape_code, c.world_bank_code, ST_AsEWKB(g.geom) AS geom
+                                              FROM {time_consistent_cluster_table} c JOIN {time_consistent_cluster_geometry_table} g ON c.cluster_uid = g.cluster_uid""",
+                          path=config.path.export.ghsl_time_consistent_cluster, partition_columns=['year', 'world_bank_code'], extent_table=time_consistent_cluster_geometry_table,
+                          batch_size=batch_size, row_group_size=config.param.export.row_group_size)
+        export_flatgeobuf(con=conn, query=f"SELECT cluster_uid, ST_AsEWKB(geom) AS geom FROM {time_consistent_cluster_geometry_table}",
+                          path=config.path.export.ghsl_time_consistent_cluster_geometry, batch_size=batch_size)
+
+
 if __name__ == '__main__':
     load_country_borders()
\ No newline at end of file
@@ -1,9 +1,18 @@
+from typing import List, Tuple
 import numpy as np
+import pandas as pd
+import xarray as xr
+from rasterio.transform import Affine
 from sqlalchemy import text
 
-from src.python.utils import run_sql_script_on_db, DB, get_db_engine
-from src.python.postgis_raster_io import load_raster, dump_raster
-from src.python.convolution import get_2d_exponential_kernel, convolve2d
+from src.python.utils import run_sql_script_on_db, DB, get_db_engine, copy_dataframe_to_postgres, copy_query_to_dataframe, touch_tables
+from src.python.postgis_raster_io import crs_to_srid, srid_to_crs
+from src.python.raster_store import RasterStore, get_ipums_raster_store, get_label_raster_store
+from src.python.raster_utils import project_points, accumulate_points, make_raster, get_pixel_index
+from src.python.convolution import get_2d_exponential_kernel, convolve_stack
+from src.python.clustering import get_structuring_element, label_clusters, polygonize_labels
+from src.python.zonal_stats import LabelRaster
+from src.python.pipeline import Task, get_year_tasks, run_tasks, POSTGRES, PYTHON
 from config import config
 
 
@@ -18,67 +27,211 @@ def _clusterdb_config():
         conn.execute(text("ALTER DATABASE clusterdb SET postgis.gdal_enabled_drivers = 'ENABLE_ALL';"))
 
 
-@run_sql_script_on_db(db=DB.IPUMS_POSTGRES)
+@run_sql_script_on_db(db=DB.IPUMS_POSTGRES, outputs=['template_usa_raster_function'])
 def _create_function__template_usa_raster():
     sql_file_path = config.path.sql.ipums_tcc.create_function__template_usa_raster
-    return sql_file_path, {}
+    params = {
+        'template_usa_raster_function': config.db.ipums_table.template_usa_raster_function,
+        'usa_geom_table': config.db.ipums_table.usa_geom
+    }
+    return sql_file_path, params
 
 
 def rasterize_census_places():
-    for y in config.param.ipums.years:
-        _rasterize_census_places(y)
+    if config.param.ipums.rasterize_engine == 'python':
+        _save_rasters(name=config.db.ipums_table.rasterized_census_places, rasters=get_rasterized_census_places())
+    else:
+        run_tasks(tasks=get_year_tasks(name='rasterize_census_places', function=_rasterize_census_places, years=config.param.ipums.years, backend=POSTGRES, year_arg='y'))
+
 
+def get_rasterized_census_places() -> List[xr.DataArray]:
+    """
+    Rasterize the census places of all census years in one pass onto the template USA grid. Each pixel holds the sum of
+    the worker counts of the census places inside it. Coordinates are projected in bulk with pyproj.
+
+    Returns:
+    - One raster per census year, in the order of config.param.ipums.years
+    """
+    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    years = config.param.ipums.years
+    pop_count_query = " UNION ALL ".join(f"SELECT {i} AS layer, census_place_id, SUM(worker_count) AS pop_count FROM {config.db.ipums_table.census_place_industry_count.format(year=y)} GROUP BY census_place_id" for i, y in enumerate(years))
+
+    with e.begin() as conn:
+        (height, width), transform, srid = _get_template_usa_grid(conn=conn)
+        census_place = copy_query_to_dataframe(conn=conn, query=f"SELECT id, ST_X(geom::geometry), ST_Y(geom::geometry) FROM {config.db.ipums_table.census_place}",
+                                               dtypes={'census_place_id': 'int64', 'lon': 'float64', 'lat': 'float64'})
+        pop_count = copy_query_to_dataframe(conn=conn, query=pop_count_query, dtypes={'layer': 'int64', 'census_place_id': 'int64', 'pop_count': 'float64'})
 
-@run_sql_script_on_db(db=DB.IPUMS_POSTGRES)
+    crs = srid_to_crs(srid)
+    census_place['x'], census_place['y'] = project_points(lon=census_place['lon'].to_numpy(), lat=census_place['lat'].to_numpy(), crs=crs)
+    pop_count = pd.merge(pop_count, census_place, on='census_place_id', how='inner')
+
+    stack = accumulate_points(x=pop_count['x'].to_numpy(), y=pop_count['y'].to_numpy(), weights=pop_count['pop_count'].to_numpy(),
+                              transform=transform, shape=(height, width), layers=pop_count['layer'].to_numpy(), n_layers=len(years))
+    # The template raster has nodata value 0
+    return [make_raster(values=layer, transform=transform, crs=crs, nodata=0) for layer in stack]
+
+
+def _get_template_usa_grid(conn) -> Tuple[Tuple[int, int], Affine, int]:
+    res = conn.execute(text(f"SELECT upperleftx, upperlefty, width, height, scalex, scaley, srid FROM ST_MetaData({config.db.ipums_table.template_usa_raster_function}())"))
+    upper_left_x, upper_left_y, width, height, scale_x, scale_y, srid = res.fetchone()
+    return (height, width), Affine(scale_x, 0, upper_left_x, 0, scale_y, upper_left_y), srid
+
+
+@run_sql_script_on_db(db=DB.IPUMS_POSTGRES, outputs=['rasterized_census_places_table'])
 def _rasterize_census_places(y: int):
     sql_file_path = config.path.sql.ipums_tcc.rasterize_census_places
     params = {
         'rasterized_census_places_table': config.db.ipums_table.rasterized_census_places.format(year=y),
         'census_place_industry_count_table': config.db.ipums_table.census_place_industry_count.format(year=y),
+        'census_place_table': config.db.ipums_table.census_place,
+        'template_usa_raster_function': config.db.ipums_table.template_usa_raster_function,
     }
     return sql_file_path, params
 
 
 def create_convolved_census_place_raster():
-    for y in config.param.ipums.years:
-        _create_convolved_census_place_raster(y)
+    convolved_rasters = convolve_census_place_rasters(rasters=get_census_place_rasters(), kernel_size=config.param.ipums.convolution_kernel_size,
+                                                      decay_rate=config.param.ipums.convolution_kernel_decay_rate)
+    # Only the SQL cluster engine reads the convolved rasters from PostGIS
+    _save_rasters(name=config.db.ipums_table.convolved_census_place_raster, rasters=convolved_rasters, publish=config.param.ipums.cluster_engine != 'python')
+
+
+def get_census_place_rasters() -> List[xr.DataArray]:
+    # Rasterized census places of each census year, in the order of config.param.ipums.years
+    if config.param.ipums.rasterize_engine == 'python':
+        # Rasterize in memory and feed the convolution directly, without a round trip through the raster store
+        return get_rasterized_census_places()
+    # The SQL engine rasterizes into PostGIS tables
+    store = get_ipums_raster_store(backend='postgis')
+    return [store.load(name=config.db.ipums_table.rasterized_census_places.format(year=y)) for y in config.param.ipums.years]
+
+
+def convolve_census_place_rasters(rasters: List[xr.DataArray], kernel_size: int, decay_rate: float) -> List[xr.DataArray]:
+    # All census years share the same grid, so they are convolved together as one stack
+    raster_vals = np.stack([raster.sel(band=1).values for raster in rasters])
+    kernel = get_2d_exponential_kernel(size=kernel_size, decay_rate=decay_rate)
+    convolved_raster_vals = convolve_stack(stack=raster_vals, kernel=kernel, method=config.param.ipums.convolution_method)
+    return [raster.copy(data=np.expand_dims(convolved_raster_year_vals, axis=0)) for raster, convolved_raster_year_vals in zip(rasters, convolved_raster_vals)]
+
+
+def _save_rasters(name: str, rasters: List[xr.DataArray], publish: bool = False) -> None:
+    # One raster per census year, saved in parallel. Published rasters are also written to PostGIS for the SQL stages reading them.
+    stores = [get_ipums_raster_store()]
+    if publish and config.param.ipums.raster_store != 'postgis':
+        stores.append(get_ipums_raster_store(backend='postgis'))
+    backend = POSTGRES if publish or config.param.ipums.raster_store == 'postgis' else PYTHON
+    run_tasks(tasks=[Task(name=f'save_{name.format(year=y)}', function=_save_raster, kwargs={'name': name.format(year=y), 'raster': raster, 'stores': stores}, backend=backend)
+                     for y, raster in zip(config.param.ipums.years, rasters)])
+
+
+def _save_raster(name: str, raster: xr.DataArray, stores: List[RasterStore]) -> None:
+    for store in stores:
+        store.save(name=name, raster=raster)
+
+
+def create_census_place_pixel_table() -> None:
+    """
+    Persist the (row, col) of the pixel of the template USA grid containing each census place, so that census places can be
+    matched to clusters by looking up the cluster label rasters instead of reprojecting them and joining with ST_Within
+    """
+    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    census_place_pixel_table = config.db.ipums_table.census_place_pixel
 
+    with e.begin() as conn:
+        shape, transform, srid = _get_template_usa_grid(conn=conn)
+        census_place = copy_query_to_dataframe(conn=conn, query=f"SELECT id, ST_X(geom::geometry), ST_Y(geom::geometry) FROM {config.db.ipums_table.census_place}",
+                                               dtypes={'census_place_id': 'int64', 'lon': 'float64', 'lat': 'float64'})
 
-def _create_convolved_census_place_raster(y: int) -> None:
-    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    x, y = project_points(lon=census_place['lon'].to_numpy(), lat=census_place['lat'].to_numpy(), crs=srid_to_crs(srid))
+    rows, cols, inside = get_pixel_index(x=x, y=y, transform=transform, shape=shape)
+    census_place_pixel = pd.DataFrame({'census_place_id': census_place['census_place_id'].to_numpy()[inside], 'row': rows[inside], 'col': cols[inside]})
 
-    # Drop table for idempotency
     with e.begin() as conn:
-        conn.execute(text(f"DROP TABLE IF EXISTS {config.db.ipums_table.convolved_census_place_raster.format(year=y)}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {census_place_pixel_table}"))
+        conn.execute(text(f"CREATE TABLE {census_place_pixel_table} (census_place_id INTEGER PRIMARY KEY, row INTEGER, col INTEGER)"))
+        copy_dataframe_to_postgres(conn=conn, data=census_place_pixel, table_name=census_place_pixel_table)
+    touch_tables(db=DB.IPUMS_POSTGRES, table_names=[census_place_pixel_table], inputs=[config.db.ipums_table.census_place, config.db.ipums_table.template_usa_raster_function])
+
+
+def create_cluster():
+    if config.param.ipums.census_place_crosswalk_engine == 'grid':
+        assert config.param.ipums.cluster_engine == 'python', "The grid census place crosswalk requires the python cluster engine"
+        create_census_place_pixel_table()
+
+    # cluster_{y} depends on cluster_geometry_{y} with the python engine, years are independent of each other
+    years = config.param.ipums.years
+    if config.param.ipums.cluster_engine == 'python':
+        tasks = get_year_tasks(name='cluster_geometry', function=_create_cluster_geometry, years=years, backend=POSTGRES, year_arg='y') + \
+                get_year_tasks(name='cluster', function=_create_cluster, years=years, backend=POSTGRES, year_arg='y', dependencies=lambda y: [f'cluster_geometry_{y}'])
+    else:
+        tasks = get_year_tasks(name='cluster', function=_create_cluster, years=years, backend=POSTGRES, year_arg='y')
+    run_tasks(tasks=tasks)
+
+
+def _create_cluster_geometry(y: int) -> None:
+    # Label the thresholded convolved raster (see get_structuring_element)
+    assert config.param.ipums.dbscan_min_points == 1, "The python cluster engine only supports dbscan_min_points = 1"
+    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    cluster_geometry_table = config.db.ipums_table.cluster_geometry.format(year=y)
+    raster_store = get_ipums_raster_store()
+    raster_name = config.db.ipums_table.convolved_census_place_raster.format(year=y)
+    raster = raster_store.load(name=raster_name)
+
+    structure = get_structuring_element(eps=config.param.ipums.dbscan_eps, pixel_size=abs(raster.rio.resolution()[0]))
+    labels, n_clusters = label_clusters(mask=raster.sel(band=1).values > config.param.ipums.pixel_threshold, structure=structure)
+
+    label_raster = LabelRaster(labels=labels, ids=np.arange(n_clusters), transform=raster.rio.transform(), crs=str(raster.rio.crs))
+    get_label_raster_store().save_label_raster(name=config.path.cache.ipums_cluster_label_raster.format(year=y), label_raster=label_raster)
+    clusters = polygonize_labels(labels=labels, transform=raster.rio.transform(), crs=raster.rio.crs)
+    clusters = clusters.assign(cluster_id=clusters['label'] - 1).rename_geometry('geom')[['cluster_id', 'geom']]
 
     with e.begin() as conn:
-        raster = load_raster(con=conn, raster_table=config.db.ipums_table.rasterized_census_places.format(year=y))
-        raster_vals = raster.sel(band=1).values
+        conn.execute(text(f"DROP TABLE IF EXISTS {cluster_geometry_table}"))
+        conn.execute(text(f"CREATE TABLE {cluster_geometry_table} (cluster_id INTEGER PRIMARY KEY, geom geometry(Geometry, {crs_to_srid(raster.rio.crs)}))"))
+        copy_dataframe_to_postgres(conn=conn, data=clusters, table_name=cluster_geometry_table)
+    touch_tables(db=DB.IPUMS_POSTGRES, table_names=[cluster_geometry_table], inputs=[raster_store.get_input_name(name=raster_name)],
+                 params={'dbscan_eps': config.param.ipums.dbscan_eps, 'pixel_threshold': config.param.ipums.pixel_threshold})
 
-        kernel = get_2d_exponential_kernel(size=config.param.ipums.convolution_kernel_size, decay_rate=config.param.ipums.convolution_kernel_decay_rate)
-        convolved_raster_vals = convolve2d(image=raster_vals, kernel=kernel)
+    if config.param.ipums.census_place_crosswalk_engine == 'grid':
+        _create_census_place_cluster(y=y, label_raster=label_raster)
 
-        convolved_raster = raster.copy(data=np.expand_dims(convolved_raster_vals, axis=0))
-        dump_raster(con=conn, data=convolved_raster, table_name=config.db.ipums_table.convolved_census_place_raster.format(year=y))
 
+def _create_census_place_cluster(y: int, label_raster: LabelRaster) -> None:
+    # Look up the cluster of each census place from the pixel it falls in
+    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    census_place_cluster_table = config.db.ipums_table.census_place_cluster.format(year=y)
 
-def create_cluster():
-    for y in config.param.ipums.years:
-        _create_cluster(y)
+    with e.begin() as conn:
+        census_place_pixel = copy_query_to_dataframe(conn=conn, query=f"SELECT census_place_id, row, col FROM {config.db.ipums_table.census_place_pixel}",
+                                                     dtypes={'census_place_id': 'int64', 'row': 'int64', 'col': 'int64'})
 
+    labels = label_raster.labels[census_place_pixel['row'].to_numpy(), census_place_pixel['col'].to_numpy()]
+    in_cluster = labels > 0
+    census_place_cluster = pd.DataFrame({'census_place_id': census_place_pixel['census_place_id'].to_numpy()[in_cluster], 'cluster_id': label_raster.ids[labels[in_cluster] - 1]})
 
-@run_sql_script_on_db(db=DB.IPUMS_POSTGRES)
+    with e.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {census_place_cluster_table}"))
+        conn.execute(text(f"CREATE TABLE {census_place_cluster_table} (census_place_id INTEGER PRIMARY KEY, cluster_id INTEGER)"))
+        copy_dataframe_to_postgres(conn=conn, data=census_place_cluster, table_name=census_place_cluster_table)
+    touch_tables(db=DB.IPUMS_POSTGRES, table_names=[census_place_cluster_table], inputs=[config.db.ipums_table.census_place_pixel, config.db.ipums_table.cluster_geometry.format(year=y)])
+
+
+@run_sql_script_on_db(db=DB.IPUMS_POSTGRES, outputs=['cluster_table', 'cluster_industry_table'])
 def _create_cluster(y: int):
     sql_file_path = config.path.sql.ipums_tcc.create_cluster
     params = {
         'cluster_table': config.db.ipums_table.cluster.format(year=y),
         'cluster_industry_table': config.db.ipums_table.cluster_industry.format(year=y),
         'census_place_industry_count_table': config.db.ipums_table.census_place_industry_count.format(year=y),
-        'convolved_census_place_raster_table': config.db.ipums_table.convolved_census_place_raster.format(year=y),
+        # The convolved raster is only published to PostGIS for the SQL cluster engine
+        'convolved_census_place_raster_table': config.db.ipums_table.convolved_census_place_raster.format(year=y) if config.param.ipums.cluster_engine != 'python' else None,
+        'cluster_geometry_table': config.db.ipums_table.cluster_geometry.format(year=y) if config.param.ipums.cluster_engine == 'python' else None,
+        'census_place_cluster_table': config.db.ipums_table.census_place_cluster.format(year=y) if config.param.ipums.census_place_crosswalk_engine == 'grid' else None,
         'census_place_table': config.db.ipums_table.census_place,
         'industry_table': config.db.ipums_table.industry_code,
         'dbscan_eps': config.param.ipums.dbscan_eps,
         'dbscan_minpoints': config.param.ipums.dbscan_min_points,
         'pixel_threshold': config.param.ipums.pixel_threshold
     }
-    return sql_file_path, params
\ No newline at end of file
+    return sql_file_path, params
@@ -1,6 +1,12 @@
-import pandas as pd
+from typing import List
+import io
+import os
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import sqlalchemy
-from src.python.utils import run_sql_script_on_db, DB, get_db_engine, logger
+from src.python.utils import run_sql_script_on_db, DB, get_db_engine, get_postgres_type, logger, touch_tables
+from src.python import stage_cache
+from src.python.pipeline import Task, get_year_tasks, run_tasks, DUCKDB, POSTGRES
 from config import config
 
 
@@ -12,12 +18,32 @@ def configure_duckdb():
 
 
 def extract_data_to_duckdb():
-    for y in config.param.ipums.years:
-        logger.debug(f"Extracting data for year {y}")
-        _extract_data_to_duckdb(y)
+    if config.param.ipums.extract_engine == 'parquet':
+        run_tasks(tasks=get_year_tasks(name='extract', function=_stage_data_to_parquet, years=config.param.ipums.years, backend=DUCKDB, year_arg='y'))
+    elif config.param.ipums.extract_engine == 'table':
+        if _use_fused_transform():
+            logger.info("Skipping extract: the fused transform reads the source CSVs directly")
+            return
+        run_tasks(tasks=get_year_tasks(name='extract', function=_extract_data_to_duckdb, years=config.param.ipums.years, backend=DUCKDB, year_arg='y'))
+    else:
+        raise ValueError(f"Unknown extract engine {config.param.ipums.extract_engine}")
+
+
+@run_sql_script_on_db(db=DB.TEMP_DUCKDB, outputs=['dem_parquet_file_name', 'geo_parquet_file_name'])
+def _stage_data_to_parquet(y: int):
+    # The source CSVs are file inputs of the stage, so the conversion only runs again when their size, modification time or hash changed
+    sql_file_path = config.path.sql.ipums_etl.stage_parquet
+    params = {
+        'dem_file_name': config.path.source_data.dem.format(year=y),
+        'geo_file_name': config.path.source_data.geo.format(year=y),
+        'dem_parquet_file_name': config.path.cache.ipums_dem_parquet.format(year=y),
+        'geo_parquet_file_name': config.path.cache.ipums_geo_parquet.format(year=y)
+    }
+    os.makedirs(os.path.dirname(params['dem_parquet_file_name']), exist_ok=True)
+    return sql_file_path, params
 
 
-@run_sql_script_on_db(db=DB.TEMP_DUCKDB)
+@run_sql_script_on_db(db=DB.TEMP_DUCKDB, outputs=['dem_table_name', 'geo_table_name'])
 def _extract_data_to_duckdb(y: int):
     sql_file_path = config.path.sql.ipums_etl.extract
     params = {
@@ -30,12 +56,42 @@ def _extract_data_to_duckdb(y: int):
 
 
 def transform_data():
-    for y in config.param.ipums.years:
-        logger.debug(f"Transforming data for year {y}")
-        _transform_data(y)
+    if not _use_fused_transform():
+        run_tasks(tasks=get_year_tasks(name='transform', function=_transform_data, years=config.param.ipums.years, backend=DUCKDB, year_arg='y'))
+    elif config.param.ipums.transform_all_years:
+        run_tasks(tasks=[Task(name='transform', function=_transform_data_fused, kwargs={'years': config.param.ipums.years}, backend=DUCKDB)])
+    else:
+        run_tasks(tasks=[Task(name=f'transform_{y}', function=_transform_data_fused, kwargs={'years': [y]}, backend=DUCKDB) for y in config.param.ipums.years])
 
 
-@run_sql_script_on_db(db=DB.TEMP_DUCKDB)
+def _use_fused_transform() -> bool:
+    if config.param.ipums.transform_engine not in ('fused', 'table'):
+        raise ValueError(f"Unknown transform engine {config.param.ipums.transform_engine}")
+    return config.param.ipums.transform_engine == 'fused' and not config.param.ipums.keep_etl_intermediates
+
+
+@run_sql_script_on_db(db=DB.TEMP_DUCKDB, outputs=['census_place_industry_count_table_names'])
+def _transform_data_fused(years: List[int]):
+    sql_file_path = config.path.sql.ipums_etl.transform_fused
+    params = {
+        'years': years,
+        'census_place_industry_count_table_names': [config.db.ipums_table.census_place_industry_count.format(year=y) for y in years]
+    }
+    if config.param.ipums.extract_engine == 'parquet':
+        # The staged Parquet files are already deduplicated
+        params.update({
+            'dem_parquet_file_names': [config.path.cache.ipums_dem_parquet.format(year=y) for y in years],
+            'geo_parquet_file_names': [config.path.cache.ipums_geo_parquet.format(year=y) for y in years]
+        })
+    else:
+        params.update({
+            'dem_file_names': [config.path.source_data.dem.format(year=y) for y in years],
+            'geo_file_names': [config.path.source_data.geo.format(year=y) for y in years]
+        })
+    return sql_file_path, params
+
+
+@run_sql_script_on_db(db=DB.TEMP_DUCKDB, outputs=['census_table_name', 'census_place_industry_count_table_name'])
 def _transform_data(y: int):
     sql_file_path = config.path.sql.ipums_etl.transform
     params = {
@@ -44,34 +100,75 @@ def _transform_data(y: int):
         'census_table_name': config.db.ipums_table.census.format(year=y),
         'census_place_industry_count_table_name': config.db.ipums_table.census_place_industry_count.format(year=y)
     }
+    if config.param.ipums.extract_engine == 'parquet':
+        params.update({
+            'dem_parquet_file_name': config.path.cache.ipums_dem_parquet.format(year=y),
+            'geo_parquet_file_name': config.path.cache.ipums_geo_parquet.format(year=y)
+        })
     return sql_file_path, params
 
 
 def load_data_to_postgres():
     _load_census_place_and_industry_code_tables_to_postgres()
-    for y in config.param.ipums.years:
-        copy_table_from_duckdb_to_postgres(table_name=config.db.ipums_table.census_place_industry_count.format(year=y))
+    copy_tables_from_duckdb_to_postgres(table_names=[config.db.ipums_table.census_place_industry_count.format(year=y) for y in config.param.ipums.years])
 
 
-@run_sql_script_on_db(db=DB.IPUMS_POSTGRES)
+@run_sql_script_on_db(db=DB.IPUMS_POSTGRES, outputs=['census_place_table_name', 'industry_code_table_name', 'usa_geom_table_name'])
 def _load_census_place_and_industry_code_tables_to_postgres():
     sql_file_path = config.path.sql.ipums_etl.load
     params = {
         'census_place_table_name': config.db.ipums_table.census_place,
         'industry_code_table_name': config.db.ipums_table.industry_code,
+        'usa_geom_table_name': config.db.ipums_table.usa_geom,
         'census_place_file_name': config.path.source_data.census_place,
         'industry_code_file_name': config.path.source_data.industry_code
     }
     return sql_file_path, params
 
 
-def copy_table_from_duckdb_to_postgres(table_name: str, chunksize: int = 10000):
+def copy_tables_from_duckdb_to_postgres(table_names: List[str]):
+    # Each table is transferred on its own DuckDB and Postgres connection, bounded by the Postgres backend concurrency
+    run_tasks(tasks=[Task(name=f'copy_{table_name}', function=copy_table_from_duckdb_to_postgres, kwargs={'table_name': table_name}, backend=POSTGRES) for table_name in table_names])
+
+
+def copy_table_from_duckdb_to_postgres(table_name: str, batch_size: int = 1_000_000):
+    """
+    Stream a DuckDB table into Postgres as Arrow record batches, each of which is written with COPY ... FROM STDIN.
+    Only one batch is held in memory at a time.
+
+    Parameters:
+    - table_name: Name of the table in DuckDB. It is (re)created in Postgres with the same name.
+    - batch_size: Number of rows per record batch
+    """
     e_duckdb = get_db_engine(db=DB.TEMP_DUCKDB)
     e_postgres = get_db_engine(db=DB.IPUMS_POSTGRES)
 
-    # Drop table for idempotency
-    with e_postgres.begin() as conn:
-        conn.execute(sqlalchemy.text(f'DROP TABLE IF EXISTS {table_name}'))
-
-    for chunk in pd.read_sql_query(f'SELECT * FROM {table_name}', e_duckdb, chunksize=chunksize):
-        chunk.to_sql(table_name, e_postgres, if_exists='append', index=False)
\ No newline at end of file
+    # The Postgres copy carries the version of the DuckDB table, so it is only copied again when the DuckDB table changed
+    source_version = stage_cache.get_version(name=table_name, namespace=DB.TEMP_DUCKDB.value) if config.param.stage_cache.enabled else None
+    if source_version is not None and not config.param.stage_cache.force and stage_cache.get_version(name=table_name, namespace=DB.IPUMS_POSTGRES.value) == source_version:
+        with e_postgres.connect() as conn_postgres:
+            if sqlalchemy.inspect(conn_postgres).has_table(table_name):
+                logger.info(f"Skipping copy of {table_name}: up to date")
+                return
+
+    logger.debug(f"Copying table {table_name} from DuckDB to Postgres")
+    with e_duckdb.connect() as conn_duckdb, e_postgres.begin() as conn_postgres:
+        reader = conn_duckdb.connection.driver_connection.execute(f'SELECT * FROM "{table_name}"').fetch_record_batch(batch_size)
+
+        # Drop table for idempotency
+        conn_postgres.execute(sqlalchemy.text(f'DROP TABLE IF EXISTS {table_name}'))
+        conn_postgres.execute(sqlalchemy.text(f'CREATE TABLE {table_name} ({_get_postgres_column_definitions(schema=reader.schema)})'))
+
+        cursor = conn_postgres.connection.cursor()
+        copy_statement = f"COPY {table_name} ({', '.join(reader.schema.names)}) FROM STDIN WITH (FORMAT csv)"
+        write_options = pa_csv.WriteOptions(include_header=False)
+        for batch in reader:
+            buffer = io.BytesIO()
+            pa_csv.write_csv(batch, buffer, write_options=write_options)
+            buffer.seek(0)
+            cursor.copy_expert(copy_statement, buffer)
+    touch_tables(db=DB.IPUMS_POSTGRES, table_names=[table_name], version=source_version)
+
+
+def _get_postgres_column_definitions(schema: pa.Schema) -> str:
+    return ', '.join(f"{field.name} {get_postgres_type(field=field)}" for field in schema)
@@ -1,26 +1,50 @@
-import sqlalchemy
-import pandas as pd
-
-from src.python.utils import run_sql_script_on_db, DB, get_db_engine, get_postgres_table
-from common import create_multiyear_table as _create_multiyear_table, create_crosswalk_cluster_uid_to_cluster_id as _create_crosswalk_cluster_uid_to_cluster_id, create_cluster_intersection_matching as _create_cluster_intersection_matching
+from typing import List, Optional
+from src.python.utils import run_sql_script_on_db, DB, get_db_engine
+from src.python.geo_export import export_geoparquet, export_parquet, export_flatgeobuf
+from common import create_multiyear_table as _create_multiyear_table, create_crosswalk_cluster_uid_to_cluster_id as _create_crosswalk_cluster_uid_to_cluster_id, create_cluster_intersection_matching as _create_cluster_intersection_matching, create_cluster_pixel_overlap_matching as _create_cluster_pixel_overlap_matching
+from common import get_years_to_add as _get_years_to_add, update_crosswalk_cluster_uid_to_cluster_id as _update_crosswalk_cluster_uid_to_cluster_id
 from config import config
 
 
 def create_multiyear_tables_and_cluster_intersection_matching():
     _create_multiyear_table(base_table_name=config.db.ipums_table.cluster, multiyear_cluster_table_name=config.db.ipums_table.multiyear_cluster,
                             column_names=['cluster_id', 'population', 'geom'], years=config.param.ipums.years, create_spatial_index=True, db=DB.IPUMS_POSTGRES)
-    _create_cluster_intersection_matching(db=DB.IPUMS_POSTGRES, cluster_intersection_matching_table_name=config.db.ipums_table.cluster_intersection_matching, multiyear_cluster_table_name=config.db.ipums_table.multiyear_cluster)
+    years_to_match = _get_census_years_to_add()
+    if config.param.ipums.matching_engine == 'pixel' and config.param.ipums.cluster_engine == 'python':
+        _create_cluster_pixel_overlap_matching(db=DB.IPUMS_POSTGRES, cluster_intersection_matching_table_name=config.db.ipums_table.cluster_intersection_matching, cluster_table_name=config.db.ipums_table.cluster,
+                                               label_raster_name=config.path.cache.ipums_cluster_label_raster, years=config.param.ipums.years, years_to_match=years_to_match)
+    else:
+        _create_cluster_intersection_matching(db=DB.IPUMS_POSTGRES, cluster_intersection_matching_table_name=config.db.ipums_table.cluster_intersection_matching, multiyear_cluster_table_name=config.db.ipums_table.multiyear_cluster,
+                                              years_to_match=years_to_match)
 
     _create_multiyear_table(base_table_name=config.db.ipums_table.census_place_industry_count,
                             multiyear_cluster_table_name=config.db.ipums_table.multiyear_census_place_industry_count,
                             column_names=['census_place_id', 'ind1950', 'worker_count'], years=config.param.ipums.years, create_spatial_index=False, db=DB.IPUMS_POSTGRES)
+    if config.param.ipums.census_place_crosswalk_engine == 'grid':
+        _create_multiyear_table(base_table_name=config.db.ipums_table.census_place_cluster,
+                                multiyear_cluster_table_name=config.db.ipums_table.multiyear_census_place_cluster,
+                                column_names=['census_place_id', 'cluster_id'], years=config.param.ipums.years, create_spatial_index=False, db=DB.IPUMS_POSTGRES)
 
 
 def create_crosswalk_cluster_uid_to_cluster_id() -> None:
-    _create_crosswalk_cluster_uid_to_cluster_id(db=DB.IPUMS_POSTGRES, intersection_matching_table_name=config.db.ipums_table.cluster_intersection_matching, crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ipums_table.crosswalk_cluster_uid_to_cluster_id)
+    # The time consistent tables are aggregated from the crosswalk in one query, so they are always rebuilt, but with stable uids in incremental mode
+    years_to_add = _get_census_years_to_add()
+    if years_to_add is None:
+        _create_crosswalk_cluster_uid_to_cluster_id(db=DB.IPUMS_POSTGRES, intersection_matching_table_name=config.db.ipums_table.cluster_intersection_matching, crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ipums_table.crosswalk_cluster_uid_to_cluster_id,
+                                                    cluster_uid_mapping_table_name=config.db.ipums_table.cluster_uid_mapping)
+    else:
+        _update_crosswalk_cluster_uid_to_cluster_id(db=DB.IPUMS_POSTGRES, intersection_matching_table_name=config.db.ipums_table.cluster_intersection_matching, crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ipums_table.crosswalk_cluster_uid_to_cluster_id,
+                                                    cluster_uid_mapping_table_name=config.db.ipums_table.cluster_uid_mapping, years_to_add=years_to_add)
 
 
-@run_sql_script_on_db(db=DB.IPUMS_POSTGRES)
+def _get_census_years_to_add() -> Optional[List[int]]:
+    # Census years to add to the existing time consistent clusters in incremental mode, None if they must be rebuilt
+    if not config.param.ipums.incremental_cluster_uid:
+        return None
+    return _get_years_to_add(db=DB.IPUMS_POSTGRES, crosswalk_cluster_uid_to_cluster_id_table_name=config.db.ipums_table.crosswalk_cluster_uid_to_cluster_id, years=config.param.ipums.years)
+
+
+@run_sql_script_on_db(db=DB.IPUMS_POSTGRES, outputs=['time_consistent_cluster_table', 'time_consistent_cluster_industry_table', 'time_consistent_cluster_geometry_table'])
 def create_time_consistent_cluster():
     sql_file_path = config.path.sql.ipums_tcc.create_time_consistent_cluster
     params = {
@@ -28,6 +52,7 @@ def create_time_consistent_cluster():
         'multiyear_census_place_industry_count_table': config.db.ipums_table.multiyear_census_place_industry_count,
         'crosswalk_cluster_uid_to_cluster_id_table': config.db.ipums_table.crosswalk_cluster_uid_to_cluster_id,
         'census_place_table': config.db.ipums_table.census_place,
+        'multiyear_census_place_cluster_table': config.db.ipums_table.multiyear_census_place_cluster if config.param.ipums.census_place_crosswalk_engine == 'grid' else None,
         'time_consistent_cluster_table': config.db.ipums_table.time_consistent_cluster,
         'time_consistent_cluster_industry_table': config.db.ipums_table.time_consistent_cluster_industry,
         'time_consistent_cluster_geometry_table': config.db.ipums_table.time_consistent_cluster_geometry,
@@ -36,38 +61,34 @@ def create_time_consistent_cluster():
     return sql_file_path, params
 
 
+@run_sql_script_on_db(db=DB.IPUMS_POSTGRES)
 def add_industry_rca_column():
-    e = get_db_engine(db=DB.IPUMS_POSTGRES)
-
-    with e.begin() as conn:
-        conn.execute(sqlalchemy.text(f"ALTER TABLE {config.db.ipums_table.time_consistent_cluster_industry} DROP COLUMN IF EXISTS rca"))
-        conn.execute(sqlalchemy.text(f"ALTER TABLE {config.db.ipums_table.time_consistent_cluster_industry} ADD COLUMN rca FLOAT"))
-
-    for y in config.param.ipums.years:
-        _add_industry_rca_column(y)
+    sql_file_path = config.path.sql.ipums_tcc.add_industry_rca_column
+    params = {
+        'time_consistent_cluster_industry_table': config.db.ipums_table.time_consistent_cluster_industry
+    }
+    return sql_file_path, params
 
 
-def _add_industry_rca_column(y: int):
+def export_time_consistent_cluster():
+    """
+    Export the time consistent clusters to files for downstream consumers: GeoParquet partitioned by year (all clusters are in
+    the USA, so there is no country partition) with the industry counts as Parquet alongside, and the geometries as FlatGeobuf
+    """
     e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    time_consistent_cluster_table = config.db.ipums_table.time_consistent_cluster
+    time_consistent_cluster_geometry_table = config.db.ipums_table.time_consistent_cluster_geometry
+    batch_size = config.param.export.batch_size
 
-    with e.connect() as conn:
-        worker_counts = pd.read_sql(f"SELECT * FROM {config.db.ipums_table.time_consistent_cluster_industry} WHERE year = {y}", con=conn)
-
-    worker_counts = worker_counts.pivot(index='cluster_uid', columns='ind1950', values='worker_count').fillna(0)
-    worker_counts = worker_counts.drop(columns=0)
-    numerator = worker_counts.div(worker_counts.sum(axis=1), axis=0)
-    denominator = worker_counts.sum(axis=0) / worker_counts.sum().sum()
-    rca = numerator.div(denominator, axis=1)
-
-    rca = rca.melt(ignore_index=False, var_name='ind1950', value_name='rca').reset_index()
-    rca = rca.loc[rca['rca'] > 0].copy()
-    rca = rca.rename(columns={'cluster_uid': '_cluster_uid', 'ind1950': '_ind1950'})
-
-    table = get_postgres_table(name=config.db.ipums_table.time_consistent_cluster_industry, db=DB.IPUMS_POSTGRES)
     with e.begin() as conn:
-        records = rca.to_dict(orient='records')
-        stmt = sqlalchemy.update(table).where(table.c.year == y).where(table.c.cluster_uid == sqlalchemy.bindparam('_cluster_uid')).where(table.c.ind1950 == sqlalchemy.bindparam('_ind1950')).values(rca=sqlalchemy.bindparam('rca'))
-        conn.execute(stmt, records)
+        export_geoparquet(con=conn, query=f"""SELECT c.cluster_uid, c.year, c.population, ST_AsEWKB(g.geom) AS geom
+                                              FROM {time_consistent_cluster_table} c JOIN {time_consistent_cluster_geometry_table} g ON c.cluster_uid = g.cluster_uid""",
+                          path=config.path.export.ipums_time_consistent_cluster, partition_columns=['year'], extent_table=time_consistent_cluster_geometry_table,
+                          batch_size=batch_size, row_group_size=config.param.export.row_group_size)
+        export_parquet(con=conn, query=f"SELECT * FROM {config.db.ipums_table.time_consistent_cluster_industry}",
+                       path=config.path.export.ipums_time_consistent_cluster_industry, partition_columns=['year'], batch_size=batch_size)
+        export_flatgeobuf(con=conn, query=f"SELECT cluster_uid, ST_AsEWKB(geom) AS geom FROM {time_consistent_cluster_geometry_table}",
+                          path=config.path.export.ipums_time_consistent_cluster_geometry, batch_size=batch_size)
 
 
 if __name__ == '__main__':
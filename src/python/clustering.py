@@ -0,0 +1,211 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+import multiprocessing
+import threading
+import numpy as np
+import scipy.ndimage as ndimage
+import geopandas as gpd
+import pandas as pd
+from rasterio.features import shapes
+from rasterio.transform import Affine
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from shapely.geometry import shape
+
+
+# Process pools shared by the concurrent label_clusters_sharded calls, by number of workers
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def get_structuring_element(eps: float, pixel_size: float) -> np.ndarray:
+    """
+    Structuring element equivalent to ST_ClusterDBSCAN over pixel squares with minpoints=1: two pixels are in the same
+    cluster if the distance between their squares is at most eps. Touching pixels (including diagonals) are at distance 0.
+
+    Parameters:
+    - eps: DBSCAN distance threshold, in CRS units
+    - pixel_size: side length of the (square) pixels, in CRS units
+
+    Returns:
+    - A square boolean array with odd side length
+    """
+    radius = int(np.floor(eps / pixel_size)) + 1
+    offsets = np.arange(-radius, radius + 1)
+    row_offset, col_offset = np.meshgrid(offsets, offsets, indexing='ij')
+    row_gap, col_gap = np.maximum(np.abs(row_offset) - 1, 0), np.maximum(np.abs(col_offset) - 1, 0)
+    return pixel_size * np.sqrt(row_gap ** 2 + col_gap ** 2) <= eps
+
+
+def label_clusters(mask: np.ndarray, structure: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Label the connected components of a boolean mask
+
+    Parameters:
+    - mask: 2D boolean array of the pixels to cluster
+    - structure: square boolean structuring element with odd side length (see get_structuring_element)
+
+    Returns:
+    - An int32 label array (0 for background, clusters numbered from 1 in order of their first pixel in row-major order)
+      and the number of clusters
+    """
+    assert mask.ndim == 2, "The input mask must be 2D"
+    assert structure.shape[0] == structure.shape[1] and structure.shape[0] % 2 == 1, "The structuring element must be square with odd side length"
+
+    if structure.shape[0] == 3:
+        labels, n_clusters = ndimage.label(mask, structure=structure, output=np.int32)
+        return labels, n_clusters
+
+    return _label_clusters_with_large_structure(mask=mask, structure=structure)
+
+
+def label_clusters_sharded(mask: np.ndarray, structure: np.ndarray, tile_size: int, max_workers: int = 1) -> Tuple[np.ndarray, int]:
+    """
+    Sharded version of label_clusters with the same output: the mask is split into tiles that are labelled independently
+    (on a process pool if max_workers > 1), then the clusters linked across tile seams are merged with a union-find pass
+    over the pixels along the seams, and the clusters are renumbered in order of their first pixel in row-major order.
+
+    Parameters:
+    - mask, structure: see label_clusters
+    - tile_size: side length of the tiles, in pixels. It must be larger than the radius of the structuring element.
+    - max_workers: number of processes labelling tiles. The pool is shared by the calls running at the same time (e.g., one per year
+      on the pipeline threads), so that they use max_workers processes in total.
+    """
+    assert mask.ndim == 2, "The input mask must be 2D"
+    radius = structure.shape[0] // 2
+    assert tile_size > radius, "The tiles must be larger than the radius of the structuring element"
+    height, width = mask.shape
+    windows = [(row, col) for row in range(0, height, tile_size) for col in range(0, width, tile_size)]
+    tiles = (mask[row:row + tile_size, col:col + tile_size] for row, col in windows)
+
+    if max_workers > 1:
+        tile_results = list(_get_process_pool(max_workers=max_workers).map(_label_tile, tiles, [structure] * len(windows)))
+    else:
+        tile_results = [_label_tile(tile, structure) for tile in tiles]
+
+    # Provisional labels: the labels of each tile are offset by the number of clusters of the previous tiles
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    first_pixels = [np.zeros(1, dtype=np.int64)]
+    n_provisional = 0
+    for (row, col), (tile_labels, n_tile_clusters, tile_first_rows, tile_first_cols) in zip(windows, tile_results):
+        labels[row:row + tile_size, col:col + tile_size] = np.where(tile_labels > 0, tile_labels + n_provisional, 0)
+        first_pixels.append((tile_first_rows + row) * width + tile_first_cols + col)
+        n_provisional += n_tile_clusters
+        assert n_provisional < np.iinfo(np.int32).max, "Too many clusters for an int32 label raster"
+    first_pixel = np.concatenate(first_pixels)
+
+    # Union-find over the provisional labels linked by pixel pairs that straddle a seam
+    sources, targets = _get_seam_links(labels=labels, structure=structure, tile_size=tile_size)
+    adjacency = coo_matrix((np.ones(len(sources), dtype=np.int32), (sources, targets)), shape=(n_provisional + 1, n_provisional + 1))
+    n_components, component = connected_components(adjacency, directed=False)
+
+    # Renumber the merged clusters by their first pixel in row-major order, as label_clusters does (the background stays 0)
+    component_first_pixel = np.full(n_components, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(component_first_pixel, component[1:], first_pixel[1:])
+    n_clusters = n_components - 1
+    rank = np.zeros(n_components, dtype=np.int32)
+    foreground_components = np.setdiff1d(np.arange(n_components), [component[0]])
+    rank[foreground_components[np.argsort(component_first_pixel[foreground_components])]] = np.arange(1, n_clusters + 1, dtype=np.int32)
+
+    return rank[component[labels]], n_clusters
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    # Spawned workers, since the pipeline may call this from threads, where forking is unsafe
+    with _process_pools_lock:
+        if max_workers not in _process_pools:
+            _process_pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+        return _process_pools[max_workers]
+
+
+def _label_tile(mask: np.ndarray, structure: np.ndarray) -> Tuple[np.ndarray, int, np.ndarray, np.ndarray]:
+    # Labels of one tile, with the position of the first pixel of each label within the tile
+    labels, n_clusters = label_clusters(mask=mask, structure=structure)
+    values, first_index = np.unique(labels.ravel(), return_index=True)
+    first_rows, first_cols = np.unravel_index(first_index[values > 0], labels.shape)
+    return labels, n_clusters, np.asarray(first_rows, dtype=np.int64), np.asarray(first_cols, dtype=np.int64)
+
+
+def _get_seam_links(labels: np.ndarray, structure: np.ndarray, tile_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Pairs of labels of neighbouring pixels in different tiles. Such pairs lie in the bands within the structure radius of a seam.
+    height, width = labels.shape
+    radius = structure.shape[0] // 2
+    offsets = [(row_offset - radius, col_offset - radius) for row_offset, col_offset in zip(*np.nonzero(structure))]
+    offsets = [offset for offset in offsets if offset > (0, 0)]
+
+    bands = [(max(seam - radius, 0), min(seam + radius, height), 0, width) for seam in range(tile_size, height, tile_size)]
+    bands += [(0, height, max(seam - radius, 0), min(seam + radius, width)) for seam in range(tile_size, width, tile_size)]
+
+    sources, targets = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    for row_start, row_stop, col_start, col_stop in bands:
+        band = labels[row_start:row_stop, col_start:col_stop]
+        rows, cols = np.nonzero(band)
+        for row_offset, col_offset in offsets:
+            neighbour_rows, neighbour_cols = rows + row_offset, cols + col_offset
+            inside = (neighbour_rows >= 0) & (neighbour_rows < band.shape[0]) & (neighbour_cols >= 0) & (neighbour_cols < band.shape[1])
+            source_rows, source_cols = rows[inside], cols[inside]
+            neighbour_rows, neighbour_cols = neighbour_rows[inside], neighbour_cols[inside]
+            neighbours = band[neighbour_rows, neighbour_cols]
+            # Only pairs across a seam link different provisional labels
+            crosses_seam = ((source_rows + row_start) // tile_size != (neighbour_rows + row_start) // tile_size) | \
+                           ((source_cols + col_start) // tile_size != (neighbour_cols + col_start) // tile_size)
+            linked = (neighbours > 0) & crosses_seam
+            sources.append(band[source_rows[linked], source_cols[linked]])
+            targets.append(neighbours[linked])
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def polygonize_labels(labels: np.ndarray, transform: Affine, crs) -> gpd.GeoDataFrame:
+    """
+    Build one (multi)polygon per label, equivalent to the union of the label's pixel squares
+
+    Parameters:
+    - labels: 2D integer label array where 0 is background
+    - transform: affine transform of the label raster
+    - crs: coordinate reference system of the label raster
+
+    Returns:
+    - A GeoDataFrame with columns label and geometry, sorted by label
+    """
+    # Polygonize with 4-connectivity so that every part is a valid polygon, then merge the parts of each label
+    labels = labels.astype(np.int32, copy=False)
+    parts = [(int(value), shape(geometry)) for geometry, value in shapes(labels, mask=labels > 0, connectivity=4, transform=transform)]
+    parts = gpd.GeoDataFrame(pd.DataFrame(parts, columns=['label', 'geometry']), geometry='geometry', crs=crs)
+    polygons = parts.dissolve(by='label').reset_index()
+    return polygons[['label', 'geometry']].sort_values('label').reset_index(drop=True)
+
+
+def _label_clusters_with_large_structure(mask: np.ndarray, structure: np.ndarray) -> Tuple[np.ndarray, int]:
+    # ndimage.label only accepts 3x3 structuring elements, so larger neighbourhoods are linked through a sparse pixel graph
+    height, width = mask.shape
+    pixel_index = np.full(mask.shape, -1, dtype=np.int64)
+    rows, cols = np.nonzero(mask)
+    pixel_index[rows, cols] = np.arange(len(rows))
+
+    radius = structure.shape[0] // 2
+    sources, targets = [], []
+    for row_offset, col_offset in zip(*np.nonzero(structure)):
+        row_offset, col_offset = row_offset - radius, col_offset - radius
+        # Each undirected edge only needs to be added in one direction
+        if (row_offset, col_offset) <= (0, 0):
+            continue
+        neighbour_rows, neighbour_cols = rows + row_offset, cols + col_offset
+        inside = (neighbour_rows >= 0) & (neighbour_rows < height) & (neighbour_cols >= 0) & (neighbour_cols < width)
+        neighbours = pixel_index[neighbour_rows[inside], neighbour_cols[inside]]
+        linked = neighbours >= 0
+        sources.append(np.nonzero(inside)[0][linked])
+        targets.append(neighbours[linked])
+
+    n_pixels = len(rows)
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+    adjacency = coo_matrix((np.ones(len(sources), dtype=np.int32), (sources, targets)), shape=(n_pixels, n_pixels))
+    n_clusters, component = connected_components(adjacency, directed=False)
+
+    # Renumber components by their first pixel in row-major order, as ndimage.label does
+    _, first_pixel = np.unique(component, return_index=True)
+    rank = np.empty(n_clusters, dtype=np.int32)
+    rank[np.argsort(first_pixel)] = np.arange(1, n_clusters + 1, dtype=np.int32)
+
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    labels[rows, cols] = rank[component]
+    return labels, n_clusters
@@ -0,0 +1,147 @@
+from typing import Iterator, List, Tuple
+import os
+import shutil
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyogrio
+import shapely
+import sqlalchemy
+from src.python.postgis_raster_io import srid_to_crs
+from src.python.utils import read_query_batches
+
+
+# Partition value of NULLs, as read by pyarrow, DuckDB and Spark
+_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+_HILBERT_LEVEL = 16
+
+
+def export_geoparquet(con: sqlalchemy.engine.Connection, query: str, path: str, partition_columns: List[str], extent_table: str, geometry_column: str = 'geom',
+                      batch_size: int = 10_000, row_group_size: int = 1_000):
+    """
+    Export the result of a query to a hive partitioned GeoParquet dataset (one file per partition). The rows of each file are
+    sorted along a Hilbert curve over the extent of the whole dataset and written in small row groups with a bbox covering
+    column, so that readers filtering by bbox only read the row groups they need.
+    The query is streamed once, ordered by the partition columns, and a partition is written as soon as the next one starts,
+    so that only one partition is in memory.
+
+    Parameters:
+    - con: sqlalchemy connection object to the database (Postgres with PostGIS)
+    - query: query to export. The geometry column must be selected as EWKB (ST_AsEWKB), its SRID gives the CRS of the dataset.
+    - path: folder of the dataset (replaced if it exists)
+    - partition_columns: columns to partition by, e.g., ['year', 'country'], in folder order
+    - extent_table: table with the geometries of the query in its geometry_column, whose extent is used for the Hilbert curve
+    - geometry_column: name of the geometry column
+    - batch_size: number of rows fetched from the database at a time
+    - row_group_size: number of rows per row group
+    """
+    _remove(path=path)
+    total_bounds = con.execute(sqlalchemy.text(f"""SELECT ST_XMin(extent), ST_YMin(extent), ST_XMax(extent), ST_YMax(extent)
+                                                   FROM (SELECT ST_Extent({geometry_column}) AS extent FROM {extent_table}) e""")).fetchone()
+    if total_bounds[0] is None:
+        return
+
+    partition_path, partition_batches = None, []
+    for batch in _read_geodataframe_batches(con=con, query=f"SELECT * FROM ({query}) q ORDER BY {', '.join(f'q.{column}' for column in partition_columns)}",
+                                            geometry_column=geometry_column, batch_size=batch_size):
+        batch_partition_paths = _get_partition_paths(data=batch, partition_columns=partition_columns).to_numpy()
+        starts = np.flatnonzero(np.r_[True, batch_partition_paths[1:] != batch_partition_paths[:-1]])
+        for start, end in zip(starts, np.r_[starts[1:], len(batch)]):
+            if batch_partition_paths[start] != partition_path and partition_batches:
+                _write_geoparquet_partition(batches=partition_batches, path=os.path.join(path, partition_path), partition_columns=partition_columns,
+                                            total_bounds=total_bounds, row_group_size=row_group_size)
+                partition_batches = []
+            partition_path = batch_partition_paths[start]
+            partition_batches.append(batch.iloc[start:end])
+    if partition_batches:
+        _write_geoparquet_partition(batches=partition_batches, path=os.path.join(path, partition_path), partition_columns=partition_columns,
+                                    total_bounds=total_bounds, row_group_size=row_group_size)
+
+
+def export_parquet(con: sqlalchemy.engine.Connection, query: str, path: str, partition_columns: List[str], batch_size: int = 10_000):
+    # Export the result of a non spatial query to a hive partitioned Parquet dataset, streaming it batch by batch into one file per partition
+    _remove(path=path)
+    writers = {}
+    schema = None
+    try:
+        for batch in read_query_batches(conn=con, query=query, batch_size=batch_size):
+            if batch.empty:
+                continue
+            schema = schema or pa.Table.from_pandas(batch.drop(columns=partition_columns), preserve_index=False).schema
+            for partition_path, partition_batch in batch.groupby(_get_partition_paths(data=batch, partition_columns=partition_columns), sort=False):
+                if partition_path not in writers:
+                    os.makedirs(os.path.join(path, partition_path), exist_ok=True)
+                    writers[partition_path] = pq.ParquetWriter(os.path.join(path, partition_path, 'part-0.parquet'), schema, compression='zstd')
+                writers[partition_path].write_table(pa.Table.from_pandas(partition_batch.drop(columns=partition_columns), schema=schema, preserve_index=False))
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+
+def export_flatgeobuf(con: sqlalchemy.engine.Connection, query: str, path: str, geometry_column: str = 'geom', batch_size: int = 10_000):
+    """
+    Export the result of a query to a FlatGeobuf file with a packed Hilbert R-tree, so that readers filtering by bbox
+    (e.g., over HTTP range requests) only read the features they need. Batches are streamed to GDAL, which builds the index.
+
+    Parameters:
+    - query: query to export. The geometry column must be selected as EWKB (ST_AsEWKB).
+    - path: path of the file (replaced if it exists)
+    """
+    _remove(path=path)
+    batches = _read_wkb_batches(con=con, query=query, geometry_column=geometry_column, batch_size=batch_size)
+    first_batch, srid = next(batches)
+    if first_batch.num_rows == 0:
+        return
+
+    def _get_batches() -> Iterator[pa.RecordBatch]:
+        yield first_batch
+        for batch, _ in batches:
+            yield batch.cast(first_batch.schema)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    reader = pa.RecordBatchReader.from_batches(first_batch.schema, _get_batches())
+    pyogrio.write_arrow(reader, path, driver='FlatGeobuf', geometry_name=geometry_column, geometry_type='Unknown',
+                        crs=srid_to_crs(srid).to_wkt() if srid else None, layer_options={'SPATIAL_INDEX': 'YES'})
+
+
+def _get_partition_paths(data: pd.DataFrame, partition_columns: List[str]) -> pd.Series:
+    # Path of the partition of each row, relative to the dataset folder, e.g., 'year=1990/country=USA'
+    values = [data[column].astype(object).where(data[column].notna(), _NULL_PARTITION).astype(str) for column in partition_columns]
+    return pd.Series([os.path.join(*[f"{column}={value}" for column, value in zip(partition_columns, row)]) for row in zip(*values)], index=data.index, dtype=object)
+
+
+def _read_geodataframe_batches(con: sqlalchemy.engine.Connection, query: str, geometry_column: str, batch_size: int) -> Iterator[gpd.GeoDataFrame]:
+    # Geometries are parsed from EWKB one batch at a time, in bulk
+    for batch in read_query_batches(conn=con, query=query, batch_size=batch_size):
+        geometries = shapely.from_wkb(np.array([bytes(wkb) if wkb is not None else None for wkb in batch[geometry_column]], dtype=object))
+        yield gpd.GeoDataFrame(batch.assign(**{geometry_column: geometries}), geometry=geometry_column)
+
+
+def _write_geoparquet_partition(batches: List[gpd.GeoDataFrame], path: str, partition_columns: List[str], total_bounds: Tuple, row_group_size: int):
+    data = pd.concat(batches, ignore_index=True)
+    srids = shapely.get_srid(data.geometry.values.to_numpy())
+    srids = np.unique(srids[srids != 0])
+    assert len(srids) <= 1, "All geometries must have the same SRID"
+    data = data.set_crs(srid_to_crs(int(srids[0]))) if len(srids) == 1 else data
+    data = data.iloc[np.argsort(data.hilbert_distance(total_bounds=total_bounds, level=_HILBERT_LEVEL).to_numpy(), kind='stable')]
+    os.makedirs(path, exist_ok=True)
+    data.drop(columns=partition_columns).to_parquet(os.path.join(path, 'part-0.parquet'), index=False, compression='zstd', schema_version='1.1.0',
+                                                    write_covering_bbox=True, row_group_size=row_group_size)
+
+
+def _read_wkb_batches(con: sqlalchemy.engine.Connection, query: str, geometry_column: str, batch_size: int) -> Iterator[Tuple[pa.RecordBatch, int]]:
+    # Arrow batches with the geometries as ISO WKB (GDAL does not read the SRID of EWKB), and the SRID of the first geometry of the batch
+    for batch in read_query_batches(conn=con, query=query, batch_size=batch_size):
+        geometries = shapely.from_wkb(np.array([bytes(wkb) if wkb is not None else None for wkb in batch[geometry_column]], dtype=object))
+        srids = shapely.get_srid(geometries[~shapely.is_missing(geometries)])
+        wkbs = shapely.to_wkb(geometries, flavor='iso')
+        yield pa.RecordBatch.from_pandas(batch.assign(**{geometry_column: pd.Series(list(wkbs), dtype=object)}), preserve_index=False), int(srids[0]) if len(srids) else None
+
+
+def _remove(path: str):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
@@ -1,10 +1,122 @@
-from typing import List
+from typing import List, Tuple
 import networkx as nx
 import numpy as np
 import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components as sparse_connected_components
+
+
+_CLUSTER_ID_BITS = 32
 
 
 def get_cluster_year_connected_component_table(intersection_matching: pd.DataFrame) -> pd.DataFrame:
+    component_id, year, cluster_id = get_cluster_year_connected_components(y1=intersection_matching['y1'].to_numpy(),
+                                                                           id1=intersection_matching['id1'].to_numpy(),
+                                                                           y2=intersection_matching['y2'].to_numpy(),
+                                                                           id2=intersection_matching['id2'].to_numpy())
+    return pd.DataFrame({'component_id': component_id, 'year': year, 'cluster_id': cluster_id})
+
+
+def get_cluster_year_connected_components(y1: np.ndarray, id1: np.ndarray, y2: np.ndarray, id2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Label the connected components of the graph whose nodes are (year, cluster_id) pairs and whose edges are the rows of the matching
+
+    Parameters:
+    - y1, id1: year and cluster id of the first end of each edge
+    - y2, id2: year and cluster id of the second end of each edge
+
+    Returns:
+    - component_id, year, cluster_id arrays with one entry per node. Nodes are sorted by (year, cluster_id) and components
+      are numbered in order of their smallest node.
+    """
+    keys_1 = pack_cluster_year_key(year=y1, cluster_id=id1)
+    keys_2 = pack_cluster_year_key(year=y2, cluster_id=id2)
+
+    nodes, node_index = np.unique(np.concatenate([keys_1, keys_2]), return_inverse=True)
+    node_index = node_index.ravel()
+    n_edges, n_nodes = len(keys_1), len(nodes)
+
+    adjacency = coo_matrix((np.ones(n_edges, dtype=np.int32), (node_index[:n_edges], node_index[n_edges:])), shape=(n_nodes, n_nodes))
+    _, component_id = sparse_connected_components(adjacency, directed=False)
+
+    year, cluster_id = unpack_cluster_year_key(keys=nodes)
+    return component_id.astype(np.int64), year, cluster_id
+
+
+def update_cluster_year_connected_components(cluster_uid: np.ndarray, year: np.ndarray, cluster_id: np.ndarray,
+                                             y1: np.ndarray, id1: np.ndarray, y2: np.ndarray, id2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Incremental version of get_cluster_year_connected_components: add the edges of new years to existing components without
+    renumbering them. Each existing component is contracted to one node, so only the new edges are traversed.
+    Merged components keep the smallest of their uids, new components get uids above the existing ones, numbered in order of their smallest node.
+
+    Parameters:
+    - cluster_uid, year, cluster_id: existing components, with one entry per node
+    - y1, id1, y2, id2: new edges. Their ends that are not existing nodes are new nodes.
+
+    Returns:
+    - cluster_uid, year, cluster_id arrays of all the nodes: existing nodes in their input order, then new nodes sorted by (year, cluster_id)
+    - old_cluster_uid, updated_cluster_uid arrays mapping the components that contain new nodes or merge several existing components.
+      There is one entry per existing uid of these components (possibly mapped to itself) and one entry with old uid -1 per new component.
+    """
+    cluster_uid = np.asarray(cluster_uid, dtype=np.int64)
+    existing_keys = pack_cluster_year_key(year=year, cluster_id=cluster_id)
+    edge_keys = np.concatenate([pack_cluster_year_key(year=y1, cluster_id=id1), pack_cluster_year_key(year=y2, cluster_id=id2)])
+
+    # Nodes of the contracted graph: one per existing uid, then one per new node
+    uids = np.unique(cluster_uid)
+    is_existing = np.isin(edge_keys, existing_keys)
+    existing_order = np.argsort(existing_keys)
+    existing_position = existing_order[np.searchsorted(existing_keys, edge_keys[is_existing], sorter=existing_order)]
+    new_keys, new_index = np.unique(edge_keys[~is_existing], return_inverse=True)
+
+    node_index = np.empty(len(edge_keys), dtype=np.int64)
+    node_index[is_existing] = np.searchsorted(uids, cluster_uid[existing_position])
+    node_index[~is_existing] = len(uids) + new_index.ravel()
+    n_edges, n_uids, n_nodes = len(edge_keys) // 2, len(uids), len(uids) + len(new_keys)
+
+    adjacency = coo_matrix((np.ones(n_edges, dtype=np.int32), (node_index[:n_edges], node_index[n_edges:])), shape=(n_nodes, n_nodes))
+    n_components, component = sparse_connected_components(adjacency, directed=False)
+
+    # A component keeps its smallest existing uid
+    no_uid = np.iinfo(np.int64).max
+    component_uid = np.full(n_components, no_uid, dtype=np.int64)
+    np.minimum.at(component_uid, component[:n_uids], uids)
+
+    # New components are numbered in order of their first (smallest) new node
+    new_components, first_node = np.unique(component[n_uids:], return_index=True)
+    new_components = new_components[np.argsort(first_node)]
+    new_components = new_components[component_uid[new_components] == no_uid]
+    next_uid = uids.max() + 1 if n_uids > 0 else 0
+    component_uid[new_components] = next_uid + np.arange(len(new_components))
+
+    is_affected = np.bincount(component[:n_uids], minlength=n_components) > 1
+    is_affected[component[n_uids:]] = True
+
+    new_year, new_cluster_id = unpack_cluster_year_key(keys=new_keys)
+    updated_cluster_uid = np.concatenate([component_uid[component[np.searchsorted(uids, cluster_uid)]], component_uid[component[n_uids:]]])
+    all_year = np.concatenate([np.asarray(year, dtype=np.int64), new_year])
+    all_cluster_id = np.concatenate([np.asarray(cluster_id, dtype=np.int64), new_cluster_id])
+
+    is_affected_uid = is_affected[component[:n_uids]]
+    old_uid = np.concatenate([uids[is_affected_uid], np.full(len(new_components), -1, dtype=np.int64)])
+    mapped_uid = np.concatenate([component_uid[component[:n_uids]][is_affected_uid], component_uid[new_components]])
+    return updated_cluster_uid, all_year, all_cluster_id, old_uid, mapped_uid
+
+
+def pack_cluster_year_key(year: np.ndarray, cluster_id: np.ndarray) -> np.ndarray:
+    year = np.asarray(year, dtype=np.int64)
+    cluster_id = np.asarray(cluster_id, dtype=np.int64)
+    assert np.all((cluster_id >= 0) & (cluster_id < 2 ** _CLUSTER_ID_BITS)), "Cluster ids must be non-negative 32 bit integers"
+    return (year << _CLUSTER_ID_BITS) | cluster_id
+
+
+def unpack_cluster_year_key(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return keys >> _CLUSTER_ID_BITS, keys & (2 ** _CLUSTER_ID_BITS - 1)
+
+
+def get_cluster_year_connected_component_table_networkx(intersection_matching: pd.DataFrame) -> pd.DataFrame:
+    # Reference implementation, kept to benchmark and validate the sparse engine against
     matching_graph = nx.Graph()
     edges = [(f"{row['y1']}_{row['id1']}", f"{row['y2']}_{row['id2']}") for i, row in intersection_matching.iterrows()]
     matching_graph.add_edges_from(edges)
@@ -20,4 +132,42 @@ def _extract_as_dataframe(connected_components: List[List[str]]) -> pd.DataFrame
             data.append({'component_id': i, 'year': year, 'cluster_id': cluster_id})
 
     data = pd.DataFrame(data)
-    return data
\ No newline at end of file
+    return data
+
+
+def get_label_raster_matching(labels_1: np.ndarray, labels_2: np.ndarray, include_touching: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Match the labels of two label rasters on the same grid (0 is background)
+
+    Parameters:
+    - labels_1, labels_2: 2D integer label arrays
+    - include_touching: also match labels whose pixels are 8-neighbours without overlapping. Together with the
+      overlapping pairs these are exactly the pairs whose pixel unions intersect (as with ST_Intersects).
+
+    Returns:
+    - label_1, label_2, overlap arrays with one entry per matched pair, where overlap is the number of shared pixels
+    """
+    assert labels_1.shape == labels_2.shape, "The label rasters must be on the same grid"
+    height, width = labels_2.shape
+    rows, cols = np.nonzero(labels_2)
+    values_2 = np.asarray(labels_2[rows, cols], dtype=np.int64)
+
+    offsets = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)] if include_touching else [(0, 0)]
+    keys, overlap_keys = [], None
+    for row_offset, col_offset in offsets:
+        neighbour_rows, neighbour_cols = rows + row_offset, cols + col_offset
+        inside = (neighbour_rows >= 0) & (neighbour_rows < height) & (neighbour_cols >= 0) & (neighbour_cols < width)
+        values_1 = np.asarray(labels_1[neighbour_rows[inside], neighbour_cols[inside]], dtype=np.int64)
+        matched = values_1 > 0
+        offset_keys = (values_1[matched] << _CLUSTER_ID_BITS) | values_2[inside][matched]
+        keys.append(offset_keys)
+        if (row_offset, col_offset) == (0, 0):
+            overlap_keys = offset_keys
+
+    pair_keys = np.unique(np.concatenate(keys))
+    overlap_pair_keys, overlap_counts = np.unique(overlap_keys, return_counts=True)
+    overlap = np.zeros(len(pair_keys), dtype=np.int64)
+    overlap[np.searchsorted(pair_keys, overlap_pair_keys)] = overlap_counts
+
+    label_1, label_2 = unpack_cluster_year_key(keys=pair_keys)
+    return label_1, label_2, overlap
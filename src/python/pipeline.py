@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, List
+import os
+import time
+from src.python.utils import logger
+from config import config
+
+
+DUCKDB = 'duckdb'
+POSTGRES = 'postgres'
+BASH = 'bash'
+PYTHON = 'python'
+RASTER = 'raster'
+
+
+class Task:
+    """
+    A unit of work of a pipeline stage (usually one year), run once all the tasks it depends on have succeeded
+
+    Parameters:
+    - name: unique name of the task, e.g., 'cluster_1990'
+    - function: callable run with kwargs
+    - kwargs: keyword arguments of the function
+    - dependencies: names of the tasks that must complete before this one
+    - backend: backend the task runs on (duckdb, postgres, bash, python or raster for tasks holding global rasters in memory), used to bound the number of concurrent tasks on it
+    """
+    def __init__(self, name: str, function: Callable, kwargs: Dict[str, Any] = None, dependencies: Iterable[str] = (), backend: str = POSTGRES):
+        self.name = name
+        self.function = function
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.dependencies = list(dependencies)
+        self.backend = backend
+
+
+def get_year_tasks(name: str, function: Callable, years: List[int], backend: str = POSTGRES, dependencies: Callable[[int], List[str]] = None, year_arg: str = 'year') -> List[Task]:
+    """
+    Declare one task per year, named f"{name}_{year}", that calls function with the year as keyword argument year_arg
+
+    Parameters:
+    - dependencies: optional function returning the names of the tasks the task of a given year depends on
+    """
+    return [Task(name=f"{name}_{y}", function=function, kwargs={year_arg: y}, backend=backend, dependencies=dependencies(y) if dependencies is not None else ())
+            for y in years]
+
+
+def get_memory_bounded_concurrency(task_memory_bytes: int) -> int:
+    # Number of tasks of task_memory_bytes each that fit in config.param.pipeline.raster_memory_fraction of the physical memory (at least one)
+    memory_bytes = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    return max(1, int(memory_bytes * config.param.pipeline.raster_memory_fraction // task_memory_bytes))
+
+
+def run_tasks(tasks: List[Task], max_workers: int = None, backend_concurrency: Dict[str, int] = None) -> Dict[str, Any]:
+    """
+    Run a DAG of tasks on a thread pool. A task is started as soon as its dependencies have succeeded and its backend has a free slot.
+    If a task fails, no new task is started, the running ones are waited for and the first error is raised.
+
+    Parameters:
+    - tasks: the tasks of the DAG. Dependencies must be names of tasks in the list.
+    - max_workers: size of the thread pool (defaults to config.param.pipeline.max_workers)
+    - backend_concurrency: maximum number of concurrent tasks per backend (defaults to config.param.pipeline.backend_concurrency).
+      Backends that are not listed are only bounded by max_workers.
+
+    Returns:
+    - The return value of each task, by name
+    """
+    max_workers = max_workers or config.param.pipeline.max_workers
+    backend_concurrency = backend_concurrency if backend_concurrency is not None else config.param.pipeline.backend_concurrency
+    tasks = {task.name: task for task in _check_dag(tasks=tasks)}
+
+    remaining_dependencies = {name: set(task.dependencies) for name, task in tasks.items()}
+    dependents = {name: [] for name in tasks}
+    for name, task in tasks.items():
+        for dependency in task.dependencies:
+            dependents[dependency].append(name)
+
+    ready = [name for name, dependencies in remaining_dependencies.items() if not dependencies]
+    running_per_backend = {}
+    running = {}
+    results = {}
+    error = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while ready or running:
+            # Start every ready task whose backend has a free slot, in declaration order
+            for name in list(ready):
+                if error is not None or len(running) >= max_workers:
+                    break
+                backend = tasks[name].backend
+                if running_per_backend.get(backend, 0) >= backend_concurrency.get(backend, max_workers):
+                    continue
+                ready.remove(name)
+                running_per_backend[backend] = running_per_backend.get(backend, 0) + 1
+                running[executor.submit(_run_task, task=tasks[name])] = name
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                running_per_backend[tasks[name].backend] -= 1
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Task {name} failed: {e}")
+                    error = error or e
+                    continue
+
+                for dependent in dependents[name]:
+                    remaining_dependencies[dependent].discard(name)
+                    if not remaining_dependencies[dependent]:
+                        ready.append(dependent)
+
+    if error is not None:
+        raise error
+    return results
+
+
+def _run_task(task: Task) -> Any:
+    logger.debug(f"Starting task {task.name} on {task.backend}")
+    start = time.perf_counter()
+    result = task.function(**task.kwargs)
+    logger.debug(f"Finished task {task.name} in {time.perf_counter() - start:.1f}s")
+    return result
+
+
+def _check_dag(tasks: List[Task]) -> List[Task]:
+    names = [task.name for task in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError("Task names must be unique")
+
+    dependencies = {task.name: task.dependencies for task in tasks}
+    for name, task_dependencies in dependencies.items():
+        unknown = set(task_dependencies) - set(dependencies)
+        if unknown:
+            raise ValueError(f"Task {name} depends on unknown tasks {sorted(unknown)}")
+
+    # Kahn's algorithm: every task must be reachable in topological order, otherwise there is a cycle
+    in_degree = {name: len(task_dependencies) for name, task_dependencies in dependencies.items()}
+    dependents = {name: [] for name in dependencies}
+    for name, task_dependencies in dependencies.items():
+        for dependency in task_dependencies:
+            dependents[dependency].append(name)
+    queue = [name for name, degree in in_degree.items() if degree == 0]
+    n_sorted = 0
+    while queue:
+        name = queue.pop()
+        n_sorted += 1
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+    if n_sorted != len(tasks):
+        raise ValueError("The task dependencies contain a cycle")
+
+    return tasks
@@ -1,68 +1,213 @@
-from rasterio.io import MemoryFile
+from typing import Iterator, Tuple
+import io
+import struct
+import numpy as np
+from rasterio.crs import CRS
+from rasterio.errors import CRSError
+from rasterio.transform import Affine
 import rioxarray as riox
 import xarray as xr
 import sqlalchemy
 
 
-def load_raster(con: sqlalchemy.engine.Connection, raster_table: str, raster_column: str = 'rast') -> xr.DataArray:
+# PostGIS raster pixel types (see the PostGIS raster WKB specification) and the numpy dtypes used to store them
+_PIXEL_TYPE_TO_DTYPE = {
+    0: np.dtype(np.uint8),  # 1BB
+    1: np.dtype(np.uint8),  # 2BUI
+    2: np.dtype(np.uint8),  # 4BUI
+    3: np.dtype(np.int8),  # 8BSI
+    4: np.dtype(np.uint8),  # 8BUI
+    5: np.dtype(np.int16),  # 16BSI
+    6: np.dtype(np.uint16),  # 16BUI
+    7: np.dtype(np.int32),  # 32BSI
+    8: np.dtype(np.uint32),  # 32BUI
+    10: np.dtype(np.float32),  # 32BF
+    11: np.dtype(np.float64),  # 64BF
+}
+_DTYPE_TO_PIXEL_TYPE = {
+    np.dtype(np.bool_): 0,
+    np.dtype(np.int8): 3,
+    np.dtype(np.uint8): 4,
+    np.dtype(np.int16): 5,
+    np.dtype(np.uint16): 6,
+    np.dtype(np.int32): 7,
+    np.dtype(np.uint32): 8,
+    np.dtype(np.float32): 10,
+    np.dtype(np.float64): 11,
+}
+_WKB_HEADER = struct.Struct('<BHHddddddiHH')
+_BAND_IS_OFFLINE, _BAND_HAS_NODATA = 0x80, 0x40
+
+
+def load_raster_tiled(con: sqlalchemy.engine.Connection, raster_table: str, raster_column: str = 'rast', band: int = 1, tile_size: int = None) -> xr.DataArray:
     """
-    Load a specific a PostGIS raster into a rioxarray DataArray
+    Load one band of a (possibly tiled) PostGIS raster table into a rioxarray DataArray.
+    Tiles are streamed from the database as raw WKB band bytes and copied straight into a preallocated numpy array.
 
     Parameters:
-    - conn: psycopg2 connection object to the database
-    - raster_table: Name of the table containing the raster
+    - con: sqlalchemy connection object to the database
+    - raster_table: Name of the table containing the raster. All rows must be tiles of the same north-up grid.
     - raster_column: Name of the column containing the raster
+    - band: Index of the band to load (starting from 1)
+    - tile_size: If given, each row is split with ST_Tile into tiles of this size before being sent (use it for untiled single-row rasters)
 
     Returns:
-    - A rioxarray DataArray object representing the raster
+    - A rioxarray DataArray object representing the raster with dimensions (band, y, x)
     """
+    (height, width), transform, srid = get_raster_grid(con=con, raster_table=raster_table, raster_column=raster_column)
+    res = con.execute(sqlalchemy.text(f"SELECT ST_BandPixelType({raster_column}, {band}), ST_BandNoDataValue({raster_column}, {band}) FROM {raster_table} LIMIT 1"))
+    pixel_type, nodata = res.fetchone()
+    x_min, y_max, scale_x, scale_y = transform.c, transform.f, transform.a, transform.e
 
-    res = con.execute(sqlalchemy.text(f"SELECT ST_AsGDALRaster({raster_column}, 'GTIff') FROM {raster_table}"))
-    raster = res.fetchone()
+    dtype = _PIXEL_TYPE_TO_DTYPE[_get_pixel_type_code(pixel_type)]
+    data = np.full((height, width), nodata if nodata is not None else 0, dtype=dtype)
 
-    in_memory_raster = MemoryFile(bytes(raster[0]))
-    raster_dataset = riox.open_rasterio(in_memory_raster)
-    return raster_dataset
+    tile_expression = f"ST_Tile({raster_column}, {band}, {tile_size}, {tile_size})" if tile_size is not None else f"ST_Band({raster_column}, {band})"
+    tiles = con.execution_options(stream_results=True).execute(sqlalchemy.text(f"SELECT ST_AsBinary(tile) FROM (SELECT {tile_expression} AS tile FROM {raster_table}) tiles"))
+    for (tile_wkb,) in tiles:
+        upper_left_x, upper_left_y, tile_data = _parse_single_band_wkb(wkb=tile_wkb)
+        row, col = int(round((upper_left_y - y_max) / scale_y)), int(round((upper_left_x - x_min) / scale_x))
+        data[row:row + tile_data.shape[0], col:col + tile_data.shape[1]] = tile_data
 
+    raster = xr.DataArray(data[np.newaxis], dims=('band', 'y', 'x'),
+                          coords={'band': [1], 'y': y_max + (np.arange(height) + 0.5) * scale_y, 'x': x_min + (np.arange(width) + 0.5) * scale_x})
+    raster = raster.rio.write_crs(srid_to_crs(srid)).rio.write_transform(transform).rio.write_nodata(nodata)
+    return raster
 
-def dump_raster(con: sqlalchemy.engine.Connection, data: xr.DataArray, table_name:str):
+
+def srid_to_crs(srid: int) -> CRS:
+    # PostGIS SRIDs that are not EPSG codes, such as 54009 (World Mollweide), are ESRI codes
+    try:
+        return CRS.from_epsg(srid)
+    except CRSError:
+        return CRS.from_string(f"ESRI:{srid}")
+
+
+def crs_to_srid(crs) -> int:
+    authority = CRS.from_user_input(crs).to_authority()
+    assert authority is not None, "The CRS must have an EPSG or ESRI code"
+    return int(authority[1])
+
+
+def get_raster_grid(con: sqlalchemy.engine.Connection, raster_table: str, raster_column: str = 'rast') -> Tuple[Tuple[int, int], Affine, int]:
+    """
+    Get the grid covered by the tiles of a PostGIS raster table without loading any pixel
+
+    Parameters:
+    - con: sqlalchemy connection object to the database
+    - raster_table: Name of the table containing the raster. All rows must be tiles of the same north-up grid.
+    - raster_column: Name of the column containing the raster
+
+    Returns:
+    - The (height, width) of the grid, its affine transform and its SRID
+    """
+    res = con.execute(sqlalchemy.text(f"""
+        SELECT ST_SRID({raster_column}), ST_ScaleX({raster_column}), ST_ScaleY({raster_column}), ST_SkewX({raster_column}), ST_SkewY({raster_column})
+        FROM {raster_table} LIMIT 1"""))
+    srid, scale_x, scale_y, skew_x, skew_y = res.fetchone()
+    assert skew_x == 0 and skew_y == 0 and scale_x > 0 > scale_y, "The raster must be north-up without skew"
+
+    res = con.execute(sqlalchemy.text(f"""
+        SELECT MIN(ST_UpperLeftX({raster_column})), MAX(ST_UpperLeftY({raster_column})),
+               MAX(ST_UpperLeftX({raster_column}) + ST_Width({raster_column}) * ST_ScaleX({raster_column})),
+               MIN(ST_UpperLeftY({raster_column}) + ST_Height({raster_column}) * ST_ScaleY({raster_column}))
+        FROM {raster_table}"""))
+    x_min, y_max, x_max, y_min = res.fetchone()
+    width, height = int(round((x_max - x_min) / scale_x)), int(round((y_min - y_max) / scale_y))
+    return (height, width), Affine(scale_x, 0, x_min, 0, scale_y, y_max), srid
+
+
+def dump_raster_tiled(con: sqlalchemy.engine.Connection, data: xr.DataArray, table_name: str, tile_size: int = 256, create_spatial_index: bool = True):
     """
-    Dump a rioxarray DataArray into a PostGIS raster table
+    Dump a single band rioxarray DataArray into a tiled PostGIS raster table (one row per tile), with raster constraints
+    and optionally a GiST index on the tile envelopes. Tiles are encoded as raster WKB and bulk loaded with COPY.
 
-    :param con: psycopg2 connection object to the database
-    :param data: a rioxarray DataArray object representing the raster
+    :param con: sqlalchemy connection object to the database
+    :param data: a rioxarray DataArray object representing the raster, either 2D or with a single band
     :param table_name: Name of the table to store the raster (it must not exist)
+    :param tile_size: Side length of the tiles in pixels
+    :param create_spatial_index: Whether to create a GiST index on the convex hull of the tiles
     :return: None
-
     """
     assert data.rio is not None, "The input data must be a rioxarray DataArray"
     assert data.rio.crs is not None, "The input data must have a CRS"
     assert data.rio.transform() is not None, "The input data must have a transform"
 
-    raster_array = data.rio
-    width, height = raster_array.width, raster_array.height
-    bands = raster_array.count
-    srid = raster_array.crs.to_epsg()
-    nodata = raster_array.nodata
-    with MemoryFile() as memory_file:
-        with memory_file.open(driver='GTiff', width=width, height=height, count=bands, dtype=raster_array._obj.dtype, crs=f'EPSG:{srid}', transform=raster_array.transform(), nodata=nodata) as dataset:
-            dataset.write(data)
+    values = data.values
+    if values.ndim == 3:
+        assert values.shape[0] == 1, "The input data must have a single band"
+        values = values[0]
+
+    srid = crs_to_srid(data.rio.crs)
+    nodata = data.rio.nodata
+    transform = data.rio.transform()
+    assert transform.b == 0 and transform.d == 0, "The raster must be north-up without skew"
 
-        geotiff_data = memory_file.read()
+    con.execute(sqlalchemy.text(f"CREATE TABLE {table_name} (rid SERIAL PRIMARY KEY, rast raster);"))
+    cursor = con.connection.cursor()
+    for buffer in _iter_tile_wkb_buffers(values=values, transform=transform, srid=srid, nodata=nodata, tile_size=tile_size):
+        cursor.copy_expert(f"COPY {table_name} (rast) FROM STDIN", buffer)
 
-    con.execute(sqlalchemy.text(f"CREATE TABLE {table_name} (rast raster);"))
-    con.execute(sqlalchemy.text(f"INSERT INTO {table_name} (rast) VALUES (ST_FromGDALRaster(:data))"), {'data': geotiff_data})
     con.execute(sqlalchemy.text(f"SELECT AddRasterConstraints('{table_name}'::name, 'rast'::name);"))
+    if create_spatial_index:
+        con.execute(sqlalchemy.text(f"CREATE INDEX ON {table_name} USING GIST (ST_ConvexHull(rast));"))
     con.commit()
 
 
+def _iter_tile_wkb_buffers(values: np.ndarray, transform: Affine, srid: int, nodata: float, tile_size: int) -> Iterator[io.StringIO]:
+    # One COPY buffer per row of tiles, so that memory stays bounded by a strip of the raster
+    height, width = values.shape
+    for row in range(0, height, tile_size):
+        buffer = io.StringIO()
+        for col in range(0, width, tile_size):
+            tile = values[row:row + tile_size, col:col + tile_size]
+            upper_left_x, upper_left_y = transform.c + col * transform.a, transform.f + row * transform.e
+            buffer.write(_encode_single_band_wkb(data=tile, upper_left=(upper_left_x, upper_left_y), scale=(transform.a, transform.e), srid=srid, nodata=nodata).hex())
+            buffer.write('\n')
+        buffer.seek(0)
+        yield buffer
+
+
+def _encode_single_band_wkb(data: np.ndarray, upper_left: Tuple[float, float], scale: Tuple[float, float], srid: int, nodata: float) -> bytes:
+    pixel_type = _DTYPE_TO_PIXEL_TYPE[data.dtype]
+    dtype = _PIXEL_TYPE_TO_DTYPE[pixel_type].newbyteorder('<')
+    height, width = data.shape
+    header = _WKB_HEADER.pack(1, 0, 1, scale[0], scale[1], upper_left[0], upper_left[1], 0, 0, srid, width, height)
+    band_header = bytes([pixel_type | (_BAND_HAS_NODATA if nodata is not None else 0)])
+    nodata_bytes = np.array(nodata if nodata is not None else 0, dtype=dtype).tobytes()
+    return header + band_header + nodata_bytes + np.ascontiguousarray(data, dtype=dtype).tobytes()
+
+
+def _parse_single_band_wkb(wkb: bytes) -> Tuple[float, float, np.ndarray]:
+    wkb = memoryview(wkb)
+    byte_order = '<' if wkb[0] == 1 else '>'
+    header = struct.Struct(byte_order + 'BHHddddddiHH')
+    _, _, n_bands, _, _, upper_left_x, upper_left_y, _, _, _, width, height = header.unpack_from(wkb, 0)
+    assert n_bands == 1, "Only single band rasters are supported"
+
+    band_type = wkb[header.size]
+    if band_type & _BAND_IS_OFFLINE:
+        raise ValueError("Offline (out-db) raster bands are not supported")
+    dtype = _PIXEL_TYPE_TO_DTYPE[band_type & 0x0F].newbyteorder(byte_order)
+    offset = header.size + 1 + dtype.itemsize
+    tile_data = np.frombuffer(wkb, dtype=dtype, count=width * height, offset=offset).reshape(height, width)
+    return upper_left_x, upper_left_y, tile_data
+
+
+def _get_pixel_type_code(pixel_type: str) -> int:
+    codes = {'1BB': 0, '2BUI': 1, '4BUI': 2, '8BSI': 3, '8BUI': 4, '16BSI': 5, '16BUI': 6, '32BSI': 7, '32BUI': 8, '32BF': 10, '64BF': 11}
+    if pixel_type not in codes:
+        raise ValueError(f"Pixel type {pixel_type} not supported")
+    return codes[pixel_type]
+
+
 if __name__ == '__main__':
     from utils import get_db_engine, DB
 
     e = get_db_engine(db=DB.IPUMS_POSTGRES)
     with e.begin() as conn:
-        raster = load_raster(conn, 'rasterized_census_places_1850')
+        raster = load_raster_tiled(conn, 'rasterized_census_places_1850', tile_size=256)
         print(raster)
-        dump_raster(conn, raster, 'rasterized_census_places_1850_copy')
+        dump_raster_tiled(conn, raster, 'rasterized_census_places_1850_copy')
 
 
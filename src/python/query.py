@@ -0,0 +1,197 @@
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+import threading
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from sqlalchemy import text
+from src.python.utils import DB, get_db_engine
+from src.python.postgis_raster_io import srid_to_crs
+from src.python import stage_cache
+from config import config
+
+
+_SOURCES = {'ipums': DB.IPUMS_POSTGRES, 'ghsl': DB.GHSL_POSTGRES}
+_INDUSTRY_VALUES = ['worker_count', 'rca']
+_srids = {}
+
+
+class GeometryCache:
+    """
+    Least recently used cache of cluster geometries, bounded by the total size of their WKB
+
+    Parameters:
+    - max_bytes: the least recently used geometries are evicted once the cached geometries exceed this size
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.n_bytes = 0
+        self._geometries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[Tuple]) -> Dict[Tuple, shapely.Geometry]:
+        # Cached geometries among the keys, marked as recently used
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._geometries:
+                    self._geometries.move_to_end(key)
+                    found[key] = self._geometries[key][0]
+            return found
+
+    def put_many(self, keys: List[Tuple], geometries: np.ndarray, sizes: np.ndarray):
+        with self._lock:
+            for key, geometry, size in zip(keys, geometries, sizes):
+                if key in self._geometries:
+                    self.n_bytes -= self._geometries.pop(key)[1]
+                self._geometries[key] = (geometry, int(size))
+                self.n_bytes += int(size)
+            while self.n_bytes > self.max_bytes and self._geometries:
+                self.n_bytes -= self._geometries.popitem(last=False)[1][1]
+
+    def clear(self):
+        with self._lock:
+            self._geometries.clear()
+            self.n_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+
+geometry_cache = GeometryCache(max_bytes=config.param.query.geometry_cache_bytes)
+
+
+def get_clusters(source: str, years: List[int], bbox: Tuple[float, float, float, float] = None, country: str = None, min_population: float = None) -> gpd.GeoDataFrame:
+    """
+    Time consistent clusters of the given years, with their geometries. Geometries are fetched once per cluster_uid and kept
+    in an LRU cache, so that repeated queries only fetch the geometries they have not seen yet.
+    Cached geometries are keyed by the stage cache version of the geometry table or, without one (e.g., with the stage cache
+    disabled), by its file node in Postgres, which changes when the table is recreated, truncated or rewritten. Geometries
+    updated in place outside the stage cache are not detected, call geometry_cache.clear() after such updates.
+
+    Parameters:
+    - source: 'ipums' or 'ghsl'
+    - years: years (census years or GHSL epochs) to return
+    - bbox: (xmin, ymin, xmax, ymax) in the CRS of the source (EPSG:5070 for ipums, ESRI:54009 for ghsl). Only the clusters
+      whose geometry intersects it are returned.
+    - country: World Bank code of the country of the clusters (ghsl only)
+    - min_population: only return the clusters with at least this population in the year
+
+    Returns:
+    - A GeoDataFrame with one row per cluster and year: cluster_uid, year, population (and cshape_code, world_bank_code for ghsl), geom
+    """
+    db, time_consistent_cluster_table, time_consistent_cluster_geometry_table = _get_source_tables(source=source)
+    if country is not None and source != 'ghsl':
+        raise ValueError("Clusters can only be filtered by country with the ghsl source")
+    version = _get_table_version(db=db, table_name=time_consistent_cluster_geometry_table)
+    srid = _get_srid(source=source, version=version)
+
+    columns = 'c.cluster_uid, c.year, c.population' + (', c.cshape_code, c.world_bank_code' if source == 'ghsl' else '')
+    if srid is None:
+        # Without any geometry there is no cluster to return
+        return gpd.GeoDataFrame(columns=[column.removeprefix('c.') for column in columns.split(', ')] + ['geom'], geometry='geom')
+    conditions = ['c.year = ANY(:years)']
+    params = {'years': [int(year) for year in years]}
+    if bbox is not None:
+        conditions.append(f"c.cluster_uid IN (SELECT cluster_uid FROM {time_consistent_cluster_geometry_table} WHERE geom && ST_MakeEnvelope(:xmin, :ymin, :xmax, :ymax, {srid}) "
+                          f"AND ST_Intersects(geom, ST_MakeEnvelope(:xmin, :ymin, :xmax, :ymax, {srid})))")
+        params.update(zip(['xmin', 'ymin', 'xmax', 'ymax'], bbox))
+    if country is not None:
+        conditions.append('c.world_bank_code = :country')
+        params['country'] = country
+    if min_population is not None:
+        conditions.append('c.population >= :min_population')
+        params['min_population'] = min_population
+
+    e = get_db_engine(db=db)
+    with e.connect() as conn:
+        res = conn.execute(text(f"SELECT {columns} FROM {time_consistent_cluster_table} c WHERE {' AND '.join(conditions)} ORDER BY c.cluster_uid, c.year"), params)
+        clusters = pd.DataFrame(res.fetchall(), columns=list(res.keys()))
+
+    geometries = _get_geometries(source=source, version=version, cluster_uids=clusters['cluster_uid'].to_numpy())
+    return gpd.GeoDataFrame(clusters.assign(geom=geometries), geometry='geom', crs=srid_to_crs(srid))
+
+
+def get_industry_matrix(years: List[int], cluster_uids: List[int] = None, value: str = 'worker_count') -> pd.DataFrame:
+    """
+    Industry matrix of the IPUMS time consistent clusters
+
+    Parameters:
+    - years: census years to return
+    - cluster_uids: clusters to return (all by default), e.g., the cluster_uid column of get_clusters
+    - value: 'worker_count' or 'rca' (requires the rca column, see add_industry_rca_column)
+
+    Returns:
+    - A dataframe indexed by (cluster_uid, year) with one column per ind1950 code. Missing cells are 0.
+    """
+    if value not in _INDUSTRY_VALUES:
+        raise ValueError(f"Value {value} not supported, use one of {_INDUSTRY_VALUES}")
+    conditions = ['year = ANY(:years)']
+    params = {'years': [int(year) for year in years]}
+    if cluster_uids is not None:
+        conditions.append('cluster_uid = ANY(:cluster_uids)')
+        params['cluster_uids'] = [int(cluster_uid) for cluster_uid in cluster_uids]
+
+    e = get_db_engine(db=DB.IPUMS_POSTGRES)
+    with e.connect() as conn:
+        res = conn.execute(text(f"SELECT cluster_uid, year, ind1950, {value} FROM {config.db.ipums_table.time_consistent_cluster_industry} WHERE {' AND '.join(conditions)}"), params)
+        industry = pd.DataFrame(res.fetchall(), columns=list(res.keys()))
+    return industry.pivot_table(index=['cluster_uid', 'year'], columns='ind1950', values=value, aggfunc='sum', fill_value=0).rename_axis(columns=None)
+
+
+def _get_geometries(source: str, version: str, cluster_uids: np.ndarray) -> np.ndarray:
+    # Geometries of the clusters from the cache, fetching the missing ones in one query. Keys include the version of the
+    # geometry table, so that the geometries of a rebuilt table are fetched again.
+    db, _, time_consistent_cluster_geometry_table = _get_source_tables(source=source)
+    unique_uids = [int(cluster_uid) for cluster_uid in np.unique(cluster_uids)]
+    keys = [(source, version, cluster_uid) for cluster_uid in unique_uids]
+    geometries = geometry_cache.get_many(keys=keys)
+
+    missing_uids = [key[2] for key in keys if key not in geometries]
+    if missing_uids:
+        e = get_db_engine(db=db)
+        with e.connect() as conn:
+            res = conn.execute(text(f"SELECT cluster_uid, ST_AsBinary(geom) FROM {time_consistent_cluster_geometry_table} WHERE cluster_uid = ANY(:cluster_uids)"),
+                               {'cluster_uids': missing_uids})
+            rows = res.fetchall()
+        wkbs = [bytes(wkb) for _, wkb in rows]
+        fetched_keys = [(source, version, cluster_uid) for cluster_uid, _ in rows]
+        fetched_geometries = shapely.from_wkb(np.array(wkbs, dtype=object))
+        geometry_cache.put_many(keys=fetched_keys, geometries=fetched_geometries, sizes=np.array([len(wkb) for wkb in wkbs]))
+        geometries.update(zip(fetched_keys, fetched_geometries))
+
+    lookup = np.array([geometries.get(key) for key in keys], dtype=object)
+    return lookup[np.searchsorted(unique_uids, cluster_uids)] if len(unique_uids) else np.array([], dtype=object)
+
+
+def _get_table_version(db: DB, table_name: str) -> str:
+    # The file node of a table changes when it is recreated (DROP and CREATE, RENAME of a new table), truncated or rewritten
+    version = stage_cache.get_version(name=table_name, namespace=db.value) if config.param.stage_cache.enabled else None
+    if version is None:
+        e = get_db_engine(db=db)
+        with e.connect() as conn:
+            relfilenode = conn.execute(text("SELECT relfilenode FROM pg_class WHERE oid = to_regclass(:table_name)"), {'table_name': table_name}).scalar()
+        version = f"relfilenode:{relfilenode}"
+    return version
+
+
+def _get_source_tables(source: str) -> Tuple[DB, str, str]:
+    if source not in _SOURCES:
+        raise ValueError(f"Source {source} not supported, use one of {list(_SOURCES)}")
+    tables = config.db.ipums_table if source == 'ipums' else config.db.ghsl_table
+    return _SOURCES[source], tables.time_consistent_cluster, tables.time_consistent_cluster_geometry
+
+
+def _get_srid(source: str, version: str) -> Optional[int]:
+    # SRID of the geometry table, None if it is empty. Keyed by the version of the table like the geometry cache, empty tables
+    # are not cached since inserting rows does not change their version.
+    if (source, version) not in _srids:
+        db, _, time_consistent_cluster_geometry_table = _get_source_tables(source=source)
+        e = get_db_engine(db=db)
+        with e.connect() as conn:
+            srid = conn.execute(text(f"SELECT ST_SRID(geom) FROM {time_consistent_cluster_geometry_table} LIMIT 1")).scalar()
+        if srid is None:
+            return None
+        _srids[(source, version)] = srid
+    return _srids[(source, version)]
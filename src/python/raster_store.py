@@ -0,0 +1,158 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+import hashlib
+import json
+import os
+import numpy as np
+import xarray as xr
+from rasterio.transform import Affine
+from sqlalchemy import text
+
+from src.python.utils import DB, get_db_engine, touch_tables
+from src.python.postgis_raster_io import load_raster_tiled, dump_raster_tiled
+from src.python.raster_utils import make_raster
+from src.python.zonal_stats import LabelRaster
+from config import config
+
+
+class RasterStore(ABC):
+    """
+    Named single band rasters, read and written as rioxarray DataArrays with dimensions (band, y, x)
+    """
+    @abstractmethod
+    def exists(self, name: str) -> bool:
+        pass
+
+    @abstractmethod
+    def load(self, name: str) -> xr.DataArray:
+        pass
+
+    @abstractmethod
+    def save(self, name: str, raster: xr.DataArray):
+        pass
+
+    @abstractmethod
+    def get_input_name(self, name: str) -> str:
+        # Name of the raster as an input of the steps reading it in the stage cache (see utils.touch_tables)
+        pass
+
+
+class LocalRasterStore(RasterStore):
+    """
+    Rasters stored on local disk as a raw values.npy file (memory mapped when loaded, so that reading them copies nothing)
+    and a meta.json file with the transform, the CRS and the nodata value. Label rasters (see zonal_stats.LabelRaster) have
+    the same layout, with their labels as values and their ids in an ids.npy file.
+
+    Parameters:
+    - folder: folder holding one subfolder per raster
+    """
+    def __init__(self, folder: str):
+        self.folder = folder
+
+    def get_path(self, name: str) -> str:
+        return os.path.join(self.folder, name)
+
+    def exists(self, name: str) -> bool:
+        return os.path.isfile(os.path.join(self.get_path(name=name), 'meta.json'))
+
+    def load(self, name: str) -> xr.DataArray:
+        arrays, meta = _load_arrays(path=self.get_path(name=name), names=['values'], mmap=True)
+        return make_raster(values=arrays['values'], transform=Affine(*meta['transform']), crs=meta['crs'], nodata=meta['nodata'])
+
+    def save(self, name: str, raster: xr.DataArray):
+        values = raster.values
+        if values.ndim == 3:
+            assert values.shape[0] == 1, "The raster must have a single band"
+            values = values[0]
+        nodata = raster.rio.nodata
+        _save_arrays(path=self.get_path(name=name), arrays={'values': values}, transform=raster.rio.transform(), crs=str(raster.rio.crs),
+                     nodata=nodata.item() if isinstance(nodata, np.generic) else nodata)
+
+    def get_input_name(self, name: str) -> str:
+        # The stage cache fingerprints the values file
+        return os.path.join(self.get_path(name=name), 'values.npy')
+
+    def load_label_raster(self, name: str, mmap: bool = True) -> LabelRaster:
+        arrays, meta = _load_arrays(path=self.get_path(name=name), names=['values', 'ids'], mmap=mmap)
+        return LabelRaster(labels=arrays['values'], ids=np.asarray(arrays['ids']), transform=Affine(*meta['transform']), crs=meta['crs'])
+
+    def save_label_raster(self, name: str, label_raster: LabelRaster):
+        _save_arrays(path=self.get_path(name=name), arrays={'values': label_raster.labels, 'ids': label_raster.ids}, transform=label_raster.transform,
+                     crs=str(label_raster.crs), nodata=0)
+
+
+class PostgisRasterStore(RasterStore):
+    """
+    Rasters stored as tiled PostGIS raster tables, one table per raster
+
+    Parameters:
+    - db: database holding the tables
+    - tile_size: side length of the tiles in pixels. Untiled tables are split into tiles of this size when loaded.
+    """
+    def __init__(self, db: DB, tile_size: int):
+        self.db = db
+        self.tile_size = tile_size
+
+    def exists(self, name: str) -> bool:
+        e = get_db_engine(db=self.db)
+        with e.begin() as conn:
+            return conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {'name': name}).scalar()
+
+    def load(self, name: str) -> xr.DataArray:
+        e = get_db_engine(db=self.db)
+        with e.begin() as conn:
+            return load_raster_tiled(con=conn, raster_table=name, tile_size=self.tile_size)
+
+    def save(self, name: str, raster: xr.DataArray):
+        e = get_db_engine(db=self.db)
+
+        # Drop table for idempotency
+        with e.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+
+        with e.begin() as conn:
+            dump_raster_tiled(con=conn, data=raster, table_name=name, tile_size=self.tile_size)
+        touch_tables(db=self.db, table_names=[name], version=_get_raster_version(raster=raster))
+
+    def get_input_name(self, name: str) -> str:
+        return name
+
+
+def get_label_raster_store() -> LocalRasterStore:
+    # Label rasters (label = cluster_id + 1, 0 outside the clusters) cached for the pixel based stages downstream (names in config.path.cache)
+    return LocalRasterStore(folder=config.path.cache.label_raster_store)
+
+
+def get_ipums_raster_store(backend: str = None) -> RasterStore:
+    # 'local' keeps the intermediate rasters on disk, 'postgis' in the database (config.param.ipums.raster_store by default)
+    backend = backend or config.param.ipums.raster_store
+    if backend == 'local':
+        return LocalRasterStore(folder=config.path.cache.ipums_raster_store)
+    if backend == 'postgis':
+        return PostgisRasterStore(db=DB.IPUMS_POSTGRES, tile_size=config.param.ipums.raster_tile_size)
+    raise ValueError(f"Raster store {backend} not supported")
+
+
+def _get_raster_version(raster: xr.DataArray) -> str:
+    # Hash of the pixels and the grid, so that saving the same raster again does not rebuild the steps reading it
+    sha256 = hashlib.sha256(json.dumps({'transform': list(raster.rio.transform()), 'crs': str(raster.rio.crs), 'nodata': str(raster.rio.nodata)}).encode())
+    sha256.update(memoryview(np.ascontiguousarray(raster.values)).cast('B'))
+    return sha256.hexdigest()
+
+
+def _save_arrays(path: str, arrays: Dict[str, np.ndarray], transform: Affine, crs: str, nodata):
+    # Write to temporary files and rename them, so that arrays memory mapped by readers are never truncated
+    os.makedirs(path, exist_ok=True)
+    for array_name, array in arrays.items():
+        np.save(os.path.join(path, f'{array_name}.tmp.npy'), array)
+        os.replace(os.path.join(path, f'{array_name}.tmp.npy'), os.path.join(path, f'{array_name}.npy'))
+    with open(os.path.join(path, 'meta.tmp.json'), 'w') as f:
+        json.dump({'transform': [transform.a, transform.b, transform.c, transform.d, transform.e, transform.f], 'crs': crs, 'nodata': nodata}, f)
+    os.replace(os.path.join(path, 'meta.tmp.json'), os.path.join(path, 'meta.json'))
+
+
+def _load_arrays(path: str, names: List[str], mmap: bool) -> Tuple[Dict[str, np.ndarray], Dict]:
+    arrays = {array_name: np.load(os.path.join(path, f'{array_name}.npy'), mmap_mode='r' if mmap else None) for array_name in names}
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    return arrays, meta
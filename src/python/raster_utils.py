@@ -1,10 +1,11 @@
-from typing import List
+from typing import List, Tuple
 import geopandas as gpd
 import rasterio
 import numpy as np
 import xarray as xr
 from rasterio.features import shapes
-from rasterio.io import MemoryFile
+from rasterio.transform import Affine
+from pyproj import Transformer
 import rioxarray as riox
 from geocube.api.core import make_geocube
 from geocube.rasterize import rasterize_image
@@ -13,18 +14,72 @@ from shapely.geometry import shape
 import pandas as pd
 
 
-def rasterize_points(gdf: gpd.GeoDataFrame, measurements: List[str], tile_size: float, no_data: float) -> xr.DataArray:
+def rasterize_points(gdf: gpd.GeoDataFrame, measurements: List[str], tile_size: float, no_data: float, output_crs: str = "epsg:2154") -> xr.DataArray:
     raster = make_geocube(
         vector_data=gdf,
         measurements=measurements,
         resolution=(-tile_size, tile_size),
-        output_crs="epsg:2154",
+        output_crs=output_crs,
         rasterize_function=rasterize_image,
         fill=no_data
     ).to_array()
     return raster
 
 
+def project_points(lon: np.ndarray, lat: np.ndarray, crs: str) -> Tuple[np.ndarray, np.ndarray]:
+    transformer = Transformer.from_crs("EPSG:4326", crs, always_xy=True)
+    return transformer.transform(np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+
+
+def accumulate_points(x: np.ndarray, y: np.ndarray, weights: np.ndarray, transform: Affine, shape: Tuple[int, int], layers: np.ndarray = None, n_layers: int = 1) -> np.ndarray:
+    """
+    Rasterize points by summing their weights in the pixel that contains them
+
+    Parameters:
+    - x, y: point coordinates in the CRS of the grid
+    - weights: weight of each point
+    - transform: affine transform of the grid (north-up, without skew)
+    - shape: (height, width) of the grid
+    - layers: optional layer index of each point (e.g., the position of its year), to rasterize several layers in one pass
+    - n_layers: number of layers
+
+    Returns:
+    - A float64 array of shape (n_layers, height, width), or (height, width) if layers is None. Points outside the grid are dropped.
+    """
+    height, width = shape
+    rows, cols, inside = get_pixel_index(x=x, y=y, transform=transform, shape=shape)
+    stacked = layers is not None
+    layers = np.asarray(layers, dtype=np.int64) if stacked else np.zeros(len(cols), dtype=np.int64)
+
+    flat_index = (layers[inside] * height + rows[inside]) * width + cols[inside]
+    raster = np.bincount(flat_index, weights=np.asarray(weights, dtype=np.float64)[inside], minlength=n_layers * height * width)
+    raster = raster.reshape(n_layers, height, width)
+    return raster if stacked else raster[0]
+
+
+def get_pixel_index(x: np.ndarray, y: np.ndarray, transform: Affine, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the (row, col) of the pixel containing each point of a north-up grid
+
+    Returns:
+    - rows, cols and a boolean mask of the points that fall inside the grid
+    """
+    assert transform.b == 0 and transform.d == 0, "The grid must be north-up without skew"
+    height, width = shape
+    cols = np.floor((np.asarray(x) - transform.c) / transform.a).astype(np.int64)
+    rows = np.floor((np.asarray(y) - transform.f) / transform.e).astype(np.int64)
+    inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+    return rows, cols, inside
+
+
+def make_raster(values: np.ndarray, transform: Affine, crs, nodata: float = None) -> xr.DataArray:
+    # Wrap a 2D array as a single band rioxarray DataArray with dimensions (band, y, x)
+    height, width = values.shape
+    raster = xr.DataArray(values[np.newaxis], dims=('band', 'y', 'x'),
+                          coords={'band': [1], 'y': transform.f + (np.arange(height) + 0.5) * transform.e, 'x': transform.c + (np.arange(width) + 0.5) * transform.a})
+    return raster.rio.write_crs(crs).rio.write_transform(transform).rio.write_nodata(nodata)
+
+
 def extract_zonal_stats(raster: xr.DataArray, no_data: float, vector: gpd.GeoDataFrame) -> pd.DataFrame:
     _check_xarray_is_2d_raster(raster=raster)
     mean_val = rasterstats.zonal_stats(vectors=vector.geometry, raster=raster.values, affine=raster.rio.transform(), nodata=no_data, stats=['mean'], all_touched=True)
@@ -44,36 +99,6 @@ def extract_vector_within_raster_coverage(raster: xr.DataArray, vector: gpd.GeoD
     return vector
 
 
-def load_raster_from_postgis(con, raster_table: str, raster_column: str = 'rast') -> xr.DataArray:
-    with con.cursor() as cursor:
-        cursor.execute(f"SELECT ST_AsGDALRaster({raster_column}, 'GTIff') FROM {raster_table}")
-        raster = cursor.fetchone()
-
-    in_memory_raster = MemoryFile(bytes(raster[0]))
-    raster_dataset = riox.open_rasterio(in_memory_raster)
-    return raster_dataset
-
-
-def dump_raster_to_postgis(con, data: xr.DataArray, table_name: str):
-    _check_xarray_is_2d_raster(raster=data)
-
-    raster_array = data.rio
-    width, height = raster_array.width, raster_array.height
-    bands = raster_array.count
-    srid = raster_array.crs.to_epsg()
-    nodata = raster_array.nodata
-    with MemoryFile() as memory_file:
-        with memory_file.open(driver='GTiff', width=width, height=height, count=bands, dtype=raster_array._obj.dtype, crs=f'EPSG:{srid}', transform=raster_array.transform(), nodata=nodata) as dataset:
-            dataset.write(raster_array._obj.expand_dims('band'))
-        geotiff_data = memory_file.read()
-
-    with con.cursor() as cursor:
-        cursor.execute(f"CREATE TABLE {table_name} (rast raster);")
-        cursor.execute(f"INSERT INTO {table_name} (rast) VALUES (ST_FromGDALRaster(%s))", (geotiff_data,))
-        cursor.execute(f"SELECT AddRasterConstraints('{table_name}'::name, 'rast'::name);")
-        con.commit()
-
-
 def _check_xarray_is_2d_raster(raster: xr.DataArray):
     assert raster.ndim == 2, "The input raster must be 2D"
     assert raster.rio is not None, "The input raster must have a CRS"
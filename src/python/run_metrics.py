@@ -0,0 +1,116 @@
+from typing import Dict, Iterator, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+import argparse
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import uuid
+import pandas as pd
+from config import config
+
+
+_STATEMENT_PREVIEW_LENGTH = 300
+
+_run_id = f"{time.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+_stage = ContextVar('stage', default=None)
+_year = ContextVar('year', default=None)
+_lock = threading.Lock()
+
+
+def start_run(run_id: str = None) -> str:
+    # Metrics recorded from now on are keyed by this run id (a new one by default)
+    global _run_id
+    _run_id = run_id or f"{time.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    return _run_id
+
+
+def get_run_id() -> str:
+    return _run_id
+
+
+@contextmanager
+def stage_context(stage: str, year: int = None) -> Iterator[None]:
+    # Tag the statements executed inside the context with the stage and year. Context variables are local to each pipeline thread.
+    stage_token, year_token = _stage.set(stage), _year.set(year)
+    try:
+        yield
+    finally:
+        _stage.reset(stage_token)
+        _year.reset(year_token)
+
+
+def get_max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024 ** 2 if sys.platform == 'darwin' else max_rss / 1024
+
+
+def record_statement(db: str, statement_index: int, statement: str, seconds: float, rowcount: Optional[int], explain: Optional[List[Dict]] = None):
+    """
+    Append the metrics of one executed statement to the run metrics file
+
+    Parameters:
+    - db: database the statement ran on
+    - statement_index: position of the statement in its script
+    - statement: SQL of the statement (truncated in the record)
+    - seconds: wall time of the statement
+    - rowcount: rows affected (None if unknown)
+    - explain: EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output, if captured
+    """
+    record = {
+        'run_id': _run_id,
+        'stage': _stage.get(),
+        'year': _year.get(),
+        'db': db,
+        'statement_index': statement_index,
+        'statement': ' '.join(statement.split())[:_STATEMENT_PREVIEW_LENGTH],
+        'seconds': seconds,
+        'rowcount': rowcount,
+        'max_rss_mb': get_max_rss_mb(),
+        'explain': explain,
+        'timestamp': time.time(),
+    }
+
+    path = config.path.run_metrics
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _lock, open(path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+
+def read_run_metrics(run_id: str = None) -> pd.DataFrame:
+    # Metrics of one run (the latest if run_id is None)
+    if not os.path.exists(config.path.run_metrics):
+        return pd.DataFrame()
+    metrics = pd.read_json(config.path.run_metrics, lines=True)
+    if run_id is None:
+        run_id = metrics.loc[metrics['timestamp'].idxmax(), 'run_id']
+    return metrics[metrics['run_id'] == run_id].reset_index(drop=True)
+
+
+def get_slowest_statements(run_id: str = None, n: int = 20) -> pd.DataFrame:
+    """
+    Summary of a pipeline run: the n slowest statements across all stages and years
+
+    Returns:
+    - A dataframe with stage, year, statement index, seconds, rowcount, peak RSS, whether a plan was captured and the statement
+    """
+    metrics = read_run_metrics(run_id=run_id)
+    if metrics.empty:
+        return metrics
+    metrics = metrics.assign(has_explain=metrics['explain'].notna())
+    columns = ['stage', 'year', 'statement_index', 'seconds', 'rowcount', 'max_rss_mb', 'has_explain', 'statement']
+    return metrics.sort_values('seconds', ascending=False).head(n)[columns].reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Report the slowest SQL statements of a pipeline run")
+    parser.add_argument('--run-id', default=None, help="Run to report on (defaults to the latest)")
+    parser.add_argument('-n', type=int, default=20, help="Number of statements to report")
+    args = parser.parse_args()
+
+    with pd.option_context('display.max_colwidth', 120, 'display.width', 250):
+        print(get_slowest_statements(run_id=args.run_id, n=args.n))
@@ -0,0 +1,219 @@
+from typing import Callable, Dict, Iterator, List, Optional
+from contextlib import contextmanager
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+from config import config
+
+
+_HASH_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class Stage:
+    """
+    Fingerprint of one run of a pipeline step
+
+    Parameters:
+    - name: unique name of the step, e.g., the decorated function name and its outputs
+    - fingerprint: hash of the rendered SQL, the params and the versions of the inputs
+    - inputs: versions of the tables and files the step reads, by name
+    - outputs: names of the tables and files the step writes
+    """
+    def __init__(self, name: str, fingerprint: str, inputs: Dict[str, Optional[str]], outputs: List[str]):
+        self.name = name
+        self.fingerprint = fingerprint
+        self.inputs = inputs
+        self.outputs = outputs
+
+
+def get_stage(name: str, sql: str, params: Dict, outputs: List[str], namespace: str, overlay: Dict[str, str] = None) -> Stage:
+    """
+    Fingerprint a step from its rendered SQL, its params and the current versions of its inputs
+
+    Parameters:
+    - name: name of the step
+    - sql: rendered SQL of the step
+    - params: params of the step. String values (or items of lists of strings) that are outputs of other steps or existing
+      absolute file paths are inputs.
+    - outputs: names of the params holding the tables or absolute file paths (or lists of them) that the step writes
+    - namespace: namespace of the table names (the database)
+    - overlay: versions that override the manifest, used to propagate pending rebuilds in dry runs
+    """
+    output_names = [_get_output_name(value=value, namespace=namespace) for key in outputs for value in _get_string_values(params[key])]
+    versions = dict(_get_output_versions(), **(overlay or {}))
+
+    inputs = {}
+    for value in (value for param in params.values() for value in _get_string_values(param)):
+        input_name = _get_output_name(value=value, namespace=namespace)
+        if input_name in output_names:
+            continue
+        if input_name in versions:
+            inputs[input_name] = versions[input_name]
+        elif os.path.isabs(value) and os.path.isfile(value):
+            inputs[input_name] = get_file_fingerprint(path=value)
+
+    content = json.dumps({'sql': sql, 'params': params, 'inputs': inputs}, sort_keys=True, default=str)
+    return Stage(name=name, fingerprint=hashlib.sha256(content.encode()).hexdigest(), inputs=inputs, outputs=output_names)
+
+
+def is_stage_up_to_date(stage: Stage, output_exists: Callable[[str], bool], overlay: Dict[str, str] = None) -> bool:
+    # A step is up to date if it last ran with the same fingerprint and its outputs are still the ones it wrote
+    if config.param.stage_cache.force:
+        return False
+
+    with _connect() as conn:
+        row = conn.execute("SELECT fingerprint, output_versions FROM stage WHERE name = ?", (stage.name,)).fetchone()
+    if row is None or row[0] != stage.fingerprint:
+        return False
+
+    recorded_versions = json.loads(row[1])
+    versions = dict(_get_output_versions(), **(overlay or {}))
+    return all(versions.get(output) == recorded_versions.get(output) and output_exists(output) for output in stage.outputs)
+
+
+def record_stage(stage: Stage):
+    # The version of an output is derived from the fingerprint, so that rebuilding with unchanged inputs does not invalidate downstream steps
+    output_versions = {output: get_output_version(stage=stage, output=output) for output in stage.outputs}
+    now = time.time()
+    with _connect() as conn:
+        conn.execute("INSERT OR REPLACE INTO stage (name, fingerprint, output_versions, updated_at) VALUES (?, ?, ?, ?)",
+                     (stage.name, stage.fingerprint, json.dumps(output_versions), now))
+        conn.executemany("INSERT OR REPLACE INTO output (name, version, stage, updated_at) VALUES (?, ?, ?, ?)",
+                         [(output, version, stage.name, now) for output, version in output_versions.items()])
+
+
+def get_output_version(stage: Stage, output: str) -> str:
+    return hashlib.sha256(f"{stage.fingerprint}:{output}".encode()).hexdigest()
+
+
+def touch_outputs(names: List[str], namespace: str, version: str = None):
+    """
+    Give a new version to tables or files written outside cached steps (e.g., by Python code or bash scripts),
+    so that the cached steps reading them are rebuilt
+
+    Parameters:
+    - version: version to record, e.g., from get_inputs_version. A random one by default, which rebuilds every cached step reading the outputs.
+    """
+    now = time.time()
+    with _connect() as conn:
+        conn.executemany("INSERT OR REPLACE INTO output (name, version, stage, updated_at) VALUES (?, ?, NULL, ?)",
+                         [(_get_output_name(value=name, namespace=namespace), version or uuid.uuid4().hex, now) for name in names])
+
+
+def get_inputs_version(names: List[str], inputs: List[str], namespace: str, params: Dict = None) -> Optional[str]:
+    """
+    Deterministic version of tables or files written outside cached steps, from the versions of the tables and files they were computed from
+
+    Parameters:
+    - names: the tables or files written
+    - inputs: the tables or absolute file paths read
+    - params: other values the outputs depend on
+
+    Returns:
+    - A hash of the outputs, the input versions and the params, or None if an input has no version (e.g., it was written before the cache was enabled)
+    """
+    versions = _get_output_versions()
+    input_versions = {}
+    for value in inputs:
+        input_name = _get_output_name(value=value, namespace=namespace)
+        if input_name in versions:
+            input_versions[input_name] = versions[input_name]
+        elif os.path.isabs(value) and os.path.isfile(value):
+            input_versions[input_name] = get_file_fingerprint(path=value)
+        else:
+            return None
+
+    content = json.dumps({'outputs': sorted(_get_output_name(value=name, namespace=namespace) for name in names), 'inputs': input_versions, 'params': params},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_version(name: str, namespace: str) -> Optional[str]:
+    return _get_output_versions().get(_get_output_name(value=name, namespace=namespace))
+
+
+def invalidate(names: List[str] = None, namespace: str = None):
+    """
+    Forget the versions of the given tables or files (all of them if names is None), so that the steps writing them
+    and the steps reading them are rebuilt on the next run
+    """
+    with _connect() as conn:
+        if names is None:
+            conn.execute("DELETE FROM output")
+            conn.execute("DELETE FROM stage")
+        else:
+            conn.executemany("DELETE FROM output WHERE name = ?", [(_get_output_name(value=name, namespace=namespace) if namespace else name,) for name in names])
+
+
+def get_file_fingerprint(path: str) -> str:
+    # Hashing large source files is slow, so the hash is only recomputed when their size or modification time changed
+    stat = os.stat(path)
+    with _connect() as conn:
+        row = conn.execute("SELECT size, mtime_ns, sha256 FROM file WHERE path = ?", (path,)).fetchone()
+    if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+        return row[2]
+
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    with _connect() as conn:
+        conn.execute("INSERT OR REPLACE INTO file (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)", (path, stat.st_size, stat.st_mtime_ns, sha256.hexdigest()))
+    return sha256.hexdigest()
+
+
+def get_manifest() -> List[Dict]:
+    with _connect() as conn:
+        rows = conn.execute("SELECT name, version, stage, updated_at FROM output ORDER BY name").fetchall()
+    return [{'output': name, 'version': version, 'stage': stage, 'updated_at': updated_at} for name, version, stage, updated_at in rows]
+
+
+def _get_output_versions() -> Dict[str, str]:
+    with _connect() as conn:
+        return dict(conn.execute("SELECT name, version FROM output").fetchall())
+
+
+def _get_string_values(param) -> List[str]:
+    if isinstance(param, str):
+        return [param]
+    if isinstance(param, (list, tuple)):
+        return [value for value in param if isinstance(value, str)]
+    return []
+
+
+def _get_output_name(value: str, namespace: str) -> str:
+    # Files are identified by their absolute path, tables by their database and name
+    return value if os.path.isabs(value) else f"{namespace}:{value}"
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    # One short-lived connection per operation, so that the manifest can be used from the pipeline worker threads
+    manifest_path = config.path.cache.stage_manifest
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    conn = sqlite3.connect(manifest_path, timeout=60)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS stage (name TEXT PRIMARY KEY, fingerprint TEXT, output_versions TEXT, updated_at REAL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS output (name TEXT PRIMARY KEY, version TEXT, stage TEXT, updated_at REAL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS file (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT)")
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the stage cache manifest")
+    parser.add_argument('command', choices=['show', 'invalidate'])
+    parser.add_argument('names', nargs='*', help="Outputs to invalidate, as <database>:<table> or absolute file paths (all if omitted)")
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        for entry in get_manifest():
+            print(f"{entry['output']}\t{entry['stage']}\t{entry['version'][:12]}")
+    else:
+        invalidate(names=args.names or None)
@@ -1,11 +1,20 @@
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Tuple
 import subprocess
 import os
+import io
+import re
+import time
 from enum import Enum
-from sqlalchemy import create_engine, text, MetaData, Table
+from sqlalchemy import create_engine, text, inspect, MetaData, Table
 import functools
+import json
 import jinja2
 import logging
+import pandas as pd
+import geopandas as gpd
+import pyarrow as pa
+import shapely
+from src.python import stage_cache, run_metrics
 from config import config
 
 
@@ -29,21 +38,136 @@ class DB(Enum):
     GHSL_POSTGRES = 'ghsl_postgres'
 
 
-def run_sql_script_on_db(db: DB):
+# Unsigned integers map to the smallest signed type that holds them, uint64 has none
+ARROW_TO_POSTGRES_TYPE = {
+    pa.bool_(): 'BOOLEAN',
+    pa.int8(): 'SMALLINT',
+    pa.int16(): 'SMALLINT',
+    pa.int32(): 'INTEGER',
+    pa.int64(): 'BIGINT',
+    pa.uint8(): 'SMALLINT',
+    pa.uint16(): 'INTEGER',
+    pa.uint32(): 'BIGINT',
+    pa.float32(): 'REAL',
+    pa.float64(): 'DOUBLE PRECISION',
+    pa.string(): 'TEXT',
+    pa.large_string(): 'TEXT',
+    pa.date32(): 'DATE',
+}
+
+
+def run_sql_script_on_db(db: DB, outputs: List[str] = None):
+    """
+    Run the SQL template returned by the decorated function (as (sql_file_path, params)) on the database
+
+    Parameters:
+    - db: database to run the script on
+    - outputs: names of the params holding the tables or absolute file paths (or lists of them) that the script writes. If given, the script
+      is skipped when the stage cache finds that it already ran with the same SQL, params and inputs. The inputs are read from the params,
+      so every table, file or function the template reads must be passed as a param rather than hard-coded in the SQL.
+    """
     def decorator_run_sql_script_on_db(func):
         @functools.wraps(func)
         def wrapper_sql_script_on_db(*args, **kwargs):
+            year = kwargs.get('year', kwargs.get('y', next((arg for arg in args if isinstance(arg, int)), None)))
+            with run_metrics.stage_context(stage=func.__name__, year=year):
+                _run_sql_script(*args, **kwargs)
+
+        def _run_sql_script(*args, **kwargs):
             e = get_db_engine(db)
             sql_file_path, params = func(*args, **kwargs)
+            if outputs is None or not config.param.stage_cache.enabled:
+                with e.begin() as conn:
+                    execute_sql_file(conn=conn,
+                                     file_path=sql_file_path,
+                                     params=params)
+                return
+
+            stage = _get_sql_stage(func=func, db=db, outputs=outputs, sql_file_path=sql_file_path, params=params)
+            if stage_cache.is_stage_up_to_date(stage=stage, output_exists=functools.partial(_output_exists, db=db)):
+                logger.info(f"Skipping {stage.name}: up to date")
+                return
+
             with e.begin() as conn:
                 execute_sql_file(conn=conn,
                                  file_path=sql_file_path,
                                  params=params)
+            stage_cache.record_stage(stage=stage)
 
+        def get_stage(*args, stage_overlay: Dict[str, str] = None, **kwargs) -> stage_cache.Stage:
+            sql_file_path, params = func(*args, **kwargs)
+            if outputs is None:
+                return None
+            return _get_sql_stage(func=func, db=db, outputs=outputs, sql_file_path=sql_file_path, params=params, overlay=stage_overlay)
+
+        wrapper_sql_script_on_db.get_stage = get_stage
+        wrapper_sql_script_on_db.db = db
         return wrapper_sql_script_on_db
     return decorator_run_sql_script_on_db
 
 
+def touch_tables(db: DB, table_names: List[str], inputs: List[str] = None, params: Dict = None, version: str = None):
+    """
+    Give a new version to tables written outside cached SQL steps (e.g., by Python code), so that the cached steps reading them are rebuilt
+
+    Parameters:
+    - inputs: tables or absolute file paths the tables were computed from. The version is then a hash of their versions and of params,
+      so that rerunning the step on unchanged inputs does not rebuild the steps downstream.
+    - version: version to record instead, e.g., the version of the table the tables were copied from
+    """
+    if config.param.stage_cache.enabled:
+        if version is None and inputs is not None:
+            version = stage_cache.get_inputs_version(names=table_names, inputs=inputs, namespace=db.value, params=params)
+        stage_cache.touch_outputs(names=table_names, namespace=db.value, version=version)
+
+
+def get_rebuild_report(steps: List[Tuple[Callable, Dict]]) -> pd.DataFrame:
+    """
+    Dry run: report which cached steps would be rebuilt, without running anything. Steps must be given in execution order,
+    a step that would be rebuilt marks the steps reading its outputs as to be rebuilt as well. Steps outside the cache
+    (Python code, bash scripts) always run and give their outputs new versions, which is not reflected in the report.
+
+    Parameters:
+    - steps: (function decorated with run_sql_script_on_db, keyword arguments) pairs
+
+    Returns:
+    - A dataframe with the name, status (up to date, rebuild or not cached) and outputs of each step
+    """
+    overlay = {}
+    report = []
+    for func, kwargs in steps:
+        # Fingerprints are computed with the pending versions of the outputs of the steps that would be rebuilt
+        stage = func.get_stage(stage_overlay=overlay, **kwargs)
+        if stage is None:
+            report.append({'step': func.__name__, 'status': 'not cached', 'outputs': []})
+            continue
+
+        if stage_cache.is_stage_up_to_date(stage=stage, output_exists=functools.partial(_output_exists, db=func.db), overlay=overlay):
+            status = 'up to date'
+        else:
+            status = 'rebuild'
+            overlay.update({output: stage_cache.get_output_version(stage=stage, output=output) for output in stage.outputs})
+        report.append({'step': stage.name, 'status': status, 'outputs': stage.outputs})
+
+    return pd.DataFrame(report)
+
+
+def _get_sql_stage(func, db: DB, outputs: List[str], sql_file_path: str, params: Dict, overlay: Dict[str, str] = None) -> stage_cache.Stage:
+    name = f"{func.__module__}.{func.__name__}({', '.join(str(params[key]) for key in outputs)})"
+    return stage_cache.get_stage(name=name, sql=read_sql_file(sql_file_path, params), params=params, outputs=outputs, namespace=db.value, overlay=overlay)
+
+
+def _output_exists(output: str, db: DB) -> bool:
+    if os.path.isabs(output):
+        return os.path.exists(output)
+    name = output.split(':', 1)[1]
+    with get_db_engine(db).connect() as conn:
+        if inspect(conn).has_table(name):
+            return True
+        # Postgres functions (e.g., the template USA raster) are outputs too
+        return conn.dialect.name == 'postgresql' and conn.execute(text("SELECT to_regprocedure(:name || '()') IS NOT NULL"), {'name': name}).scalar()
+
+
 def get_db_engine(db: DB):
     if db == DB.TEMP_DUCKDB:
         return engine_temp_duckdb
@@ -65,8 +189,80 @@ def get_postgres_table(name: str, db: DB):
 
 
 def execute_sql_file(conn, file_path: str, params: Dict[str, str] = None):
+    # Statements are executed one by one on the same connection (and transaction), so that each can be timed
     sql = read_sql_file(file_path, params)
-    conn.execute(text(sql))
+    for i, statement in enumerate(split_sql_statements(sql)):
+        execute_sql_statement(conn=conn, statement=statement, statement_index=i)
+
+
+def execute_sql_statement(conn, statement: str, statement_index: int = 0):
+    """
+    Execute one statement and record its wall time, rows affected and the peak RSS of the process in the run metrics.
+    In explain mode (Postgres only), explainable statements run through EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON), which executes
+    them as well, and the plan is kept if the statement took longer than the explain threshold.
+    """
+    explain = config.param.run_metrics.explain and conn.dialect.name == 'postgresql' and _is_explainable(statement)
+    start = time.perf_counter()
+    if explain:
+        plan = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}")).scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        top_node = plan[0]['Plan']
+        # Data modifying statements report their rows on the node feeding the ModifyTable node
+        rowcount = top_node['Plans'][0].get('Actual Rows') if top_node['Node Type'] == 'ModifyTable' and top_node.get('Plans') else top_node.get('Actual Rows')
+    else:
+        plan = None
+        result = conn.execute(text(statement))
+        rowcount = result.rowcount if result.rowcount >= 0 else None
+    seconds = time.perf_counter() - start
+
+    if config.param.run_metrics.enabled:
+        keep_plan = plan is not None and seconds >= config.param.run_metrics.explain_threshold_seconds
+        run_metrics.record_statement(db=conn.engine.url.get_backend_name(), statement_index=statement_index, statement=statement, seconds=seconds,
+                                     rowcount=rowcount, explain=plan if keep_plan else None)
+
+
+def split_sql_statements(sql: str) -> List[str]:
+    """
+    Split a script into statements on the semicolons that are not inside quotes, quoted identifiers, dollar-quoted blocks
+    (e.g., function bodies) or comments. Statements made only of comments and whitespace are dropped.
+    """
+    statements = []
+    start, i, n = 0, 0, len(sql)
+    while i < n:
+        if sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = n if end == -1 else end + 1
+        elif sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+        elif sql[i] in ("'", '"'):
+            # Doubled quotes inside a quoted string are escapes, scanning to the next quote handles them as two strings
+            end = sql.find(sql[i], i + 1)
+            i = n if end == -1 else end + 1
+        elif sql[i] == '$' and _DOLLAR_QUOTE.match(sql, i):
+            tag = _DOLLAR_QUOTE.match(sql, i).group(0)
+            end = sql.find(tag, i + len(tag))
+            i = n if end == -1 else end + len(tag)
+        elif sql[i] == ';':
+            statements.append(sql[start:i])
+            i += 1
+            start = i
+        else:
+            i += 1
+    statements.append(sql[start:])
+    return [statement.strip() for statement in statements if _strip_sql_comments(statement).strip()]
+
+
+_DOLLAR_QUOTE = re.compile(r'\$[A-Za-z_]*\$')
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|WITH|INSERT|UPDATE|DELETE|CREATE\s+(TEMP|TEMPORARY|UNLOGGED\s+)?\s*TABLE\s.*?\bAS\s*(\(|SELECT|WITH))', re.IGNORECASE | re.DOTALL)
+
+
+def _strip_sql_comments(sql: str) -> str:
+    return re.sub(r'--[^\n]*|/\*.*?\*/', '', sql, flags=re.DOTALL)
+
+
+def _is_explainable(statement: str) -> bool:
+    return _EXPLAINABLE.match(_strip_sql_comments(statement)) is not None
 
 
 def read_sql_file(file_path: str, params: Dict[str, str] = None):
@@ -81,6 +277,53 @@ def read_sql_file(file_path: str, params: Dict[str, str] = None):
     return sql
 
 
+def read_query_batches(conn, query: str, batch_size: int, params: Dict = None) -> Iterator[pd.DataFrame]:
+    # A server side cursor sends the rows batch by batch instead of materializing the whole result on the client.
+    # An empty result gives one empty batch, so that its columns are known.
+    res = conn.execution_options(stream_results=True, max_row_buffer=batch_size).execute(text(query), params or {})
+    columns = list(res.keys())
+    empty = True
+    for rows in res.partitions(batch_size):
+        empty = False
+        yield pd.DataFrame(rows, columns=columns)
+    if empty:
+        yield pd.DataFrame(columns=columns)
+
+
+def get_postgres_type(field: pa.Field) -> str:
+    # Postgres type of an Arrow column, see ARROW_TO_POSTGRES_TYPE
+    if pa.types.is_uint64(field.type):
+        raise ValueError(f"Column {field.name} is an unsigned 64 bit integer, which does not fit in any Postgres integer type")
+    if pa.types.is_decimal(field.type):
+        return f"NUMERIC({field.type.precision}, {field.type.scale})"
+    if field.type not in ARROW_TO_POSTGRES_TYPE:
+        raise ValueError(f"Arrow type {field.type} of column {field.name} not supported")
+    return ARROW_TO_POSTGRES_TYPE[field.type]
+
+
+def copy_query_to_dataframe(conn, query: str, dtypes: Dict[str, str]) -> pd.DataFrame:
+    # Stream the result of the query out of Postgres with COPY and parse it column-wise with the given dtypes
+    buffer = io.StringIO()
+    cursor = conn.connection.cursor()
+    cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", buffer)
+    buffer.seek(0)
+    return pd.read_csv(buffer, names=list(dtypes.keys()), dtype=dtypes, header=None)
+
+
+def copy_dataframe_to_postgres(conn, data: pd.DataFrame, table_name: str):
+    # Bulk load the dataframe into an existing Postgres table with COPY. Geometries are sent as hex EWKB.
+    if isinstance(data, gpd.GeoDataFrame):
+        geometry_column = data.geometry.name
+        geometries = shapely.set_srid(data.geometry.values.to_numpy(), int(data.crs.to_authority()[1]))
+        data = pd.DataFrame(data).assign(**{geometry_column: shapely.to_wkb(geometries, hex=True, include_srid=True)})
+
+    buffer = io.StringIO()
+    data.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    cursor = conn.connection.cursor()
+    cursor.copy_expert(f"COPY {table_name} ({', '.join(data.columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
 def execute_bash_script(file_path: str, args: List[str]):
     # Change the permissions of the script to make it executable
     os.chmod(file_path, 0o755)
@@ -0,0 +1,78 @@
+from typing import Tuple
+import numpy as np
+from rasterio.features import rasterize
+from rasterio.transform import Affine
+
+
+class LabelRaster:
+    """
+    Integer raster where each pixel holds the position (starting from 1) of the zone it belongs to in ids, and 0 outside every zone
+    """
+    def __init__(self, labels: np.ndarray, ids: np.ndarray, transform: Affine, crs: str):
+        self.labels = labels
+        self.ids = ids
+        self.transform = transform
+        self.crs = crs
+
+
+def rasterize_label_raster(geometries: np.ndarray, ids: np.ndarray, shape: Tuple[int, int], transform: Affine, crs: str) -> LabelRaster:
+    """
+    Burn non-overlapping zone geometries onto a grid. A pixel belongs to a zone if its center lies in the zone's geometry,
+    as with ST_Clip(rast, geom, crop := true).
+
+    Parameters:
+    - geometries: array of shapely geometries, one per zone
+    - ids: array of zone ids with the same length as geometries
+    - shape: (height, width) of the grid
+    - transform: affine transform of the grid
+    - crs: coordinate reference system of the grid (and of the geometries)
+
+    Returns:
+    - A LabelRaster
+    """
+    assert len(geometries) == len(ids), "There must be one id per geometry"
+    assert len(ids) < np.iinfo(np.int32).max, "Too many zones for an int32 label raster"
+    labels = rasterize(shapes=zip(geometries, range(1, len(ids) + 1)), out_shape=shape, transform=transform, fill=0, dtype=np.int32)
+    return LabelRaster(labels=labels, ids=np.asarray(ids), transform=transform, crs=crs)
+
+
+def zonal_sum(label_raster: LabelRaster, values: np.ndarray, nodata: float = None) -> np.ndarray:
+    """
+    Sum the values of a raster on the same grid as the label raster over each zone, skipping nodata and non-finite pixels
+
+    Returns:
+    - An array with the sum for each zone, in the order of label_raster.ids
+    """
+    assert values.shape == label_raster.labels.shape, "The values must be on the same grid as the label raster"
+    valid = np.isfinite(values) if nodata is None else np.isfinite(values) & (values != nodata)
+    weights = np.where(valid, values, 0).ravel()
+    return np.bincount(label_raster.labels.ravel(), weights=weights, minlength=len(label_raster.ids) + 1)[1:]
+
+
+def zonal_majority(label_raster: LabelRaster, category_raster: LabelRaster) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the most frequent category of each zone, counting pixels. Ties go to the category that comes first in category_raster.ids.
+
+    Parameters:
+    - label_raster: zones
+    - category_raster: categories (e.g., countries) on the same grid as the zones
+
+    Returns:
+    - zone ids, category ids and the number of pixels of the zone in its majority category. Zones without any categorized pixel are dropped.
+    """
+    assert label_raster.labels.shape == category_raster.labels.shape, "The category raster must be on the same grid as the label raster"
+    rows, cols = np.nonzero(label_raster.labels)
+    zones = np.asarray(label_raster.labels[rows, cols], dtype=np.int64)
+    categories = np.asarray(category_raster.labels[rows, cols], dtype=np.int64)
+    categorized = categories > 0
+
+    n_categories = len(category_raster.ids) + 1
+    keys, counts = np.unique(zones[categorized] * n_categories + categories[categorized], return_counts=True)
+    zones, categories = keys // n_categories, keys % n_categories
+
+    # Sort by zone, then by decreasing count, then by category, and keep the first row of each zone
+    order = np.lexsort((categories, -counts, zones))
+    zones, categories, counts = zones[order], categories[order], counts[order]
+    first = np.ones(len(zones), dtype=bool)
+    first[1:] = zones[1:] != zones[:-1]
+    return label_raster.ids[zones[first] - 1], category_raster.ids[categories[first] - 1], counts[first]
@@ -13,7 +13,11 @@ CREATE TEMPORARY TABLE temp_cluster_country_matching ON COMMIT DROP AS
 SELECT cluster_uid, year, gwcode, gwsyear, gweyear
 FROM ({{ params.time_consistent_cluster_pre_geocoding_table }} JOIN {{ params.time_consistent_cluster_geometry_pre_geocoding_table }} USING (cluster_uid)) cluster
 JOIN temp_country_geom_transformed country ON st_intersects(cluster.geom, country.geom)
-WHERE (gwsyear < year AND year <= gweyear) OR (year = 2020 AND gweyear = 2019);
+WHERE ((gwsyear < year AND year <= gweyear) OR (year = 2020 AND gweyear = 2019))
+{% if params.cluster_country_matching_table %}
+-- Only the clusters without any pixel centre in a country on the raster (e.g., small coastal and island clusters) are matched by intersection
+AND NOT EXISTS (SELECT 1 FROM {{ params.cluster_country_matching_table }} m WHERE m.cluster_uid = cluster.cluster_uid AND m.year = cluster.year)
+{% endif %};
 
 -- Temporary table of clusters that match with multiple countries (i.e., border clusters)
 CREATE TEMPORARY TABLE temp_cluster_country_matching_multiple_countries ON COMMIT DROP AS
@@ -53,11 +57,17 @@ WHERE n_matched_countries = 1;
 -- and added world bank codes
 CREATE TEMPORARY TABLE temp_cluster_country_matching_clean ON COMMIT DROP AS
 WITH cluster_country_matching AS (
+{% if params.cluster_country_matching_table %}
+    -- Majority vote of the country label raster over the pixels of each cluster, computed in Python
+    SELECT cluster_uid, year, gwcode FROM {{ params.cluster_country_matching_table }}
+    UNION ALL
+{% endif %}
     SELECT * FROM temp_cluster_country_matching_single_countries
     UNION ALL
-    SELECT * FROM temp_cluster_country_matching_multiple_countries)
+    SELECT * FROM temp_cluster_country_matching_multiple_countries
+)
 SELECT cluster_uid, year, gwcode AS cshape_code, world_bank_code
-FROM cluster_country_matching JOIN crosswalk_cshape_to_world_bank_codes
+FROM cluster_country_matching JOIN {{ params.crosswalk_cshape_to_world_bank_codes_table }}
 ON gwcode = cshape_code;
 
 -- We add country information to the time consistent cluster table
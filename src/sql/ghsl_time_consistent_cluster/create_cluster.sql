@@ -2,7 +2,7 @@ DROP TABLE IF EXISTS "{{ params.cluster_table }}";
 
 -- Create a binary raster from the smod raster with only urban and non-urban classes
 CREATE TEMPORARY TABLE smod_binary ON COMMIT DROP AS
-SELECT ST_Reclass({{ params.smod_table }}.rast, 1,  '[0-{{ params.lower_bound_urban }}]\:0, ({{ params.lower_bound_urban }}-30]\:1', '1BB', nodataval := 0) AS rast
+SELECT ST_Reclass({{ params.smod_table }}.rast, 1,  '[0-{{ params.lower_bound_urban }}]\:0, ({{ params.lower_bound_urban }}-{{ params.upper_bound_urban }}]\:1', '1BB', nodataval := 0) AS rast
 FROM {{ params.smod_table }};
 
 -- Create a temporary cluster geometry table with DBSCAN
@@ -1,4 +1,18 @@
-DROP TABLE {{ params.time_consistent_cluster_year }};
+{% if params.cluster_uid_mapping_table %}
+DELETE FROM {{ params.time_consistent_cluster_year }}
+WHERE cluster_uid IN (SELECT old_cluster_uid FROM {{ params.cluster_uid_mapping_table }} UNION SELECT cluster_uid FROM {{ params.cluster_uid_mapping_table }});
+
+INSERT INTO {{ params.time_consistent_cluster_year }}
+WITH zonal_stats AS (
+    SELECT cluster_uid, (St_SummaryStats(St_Union(ST_Clip(rast, 1, geom, true)))).*
+    FROM {{ params.time_consistent_cluster_geometry_pre_geocoding_table }}, {{ params.pop_table }}
+    WHERE St_Intersects(rast,geom) AND cluster_uid IN (SELECT cluster_uid FROM {{ params.cluster_uid_mapping_table }})
+    GROUP BY cluster_uid
+)
+SELECT cluster_uid, sum AS population
+FROM zonal_stats;
+{% else %}
+DROP TABLE IF EXISTS {{ params.time_consistent_cluster_year }};
 
 CREATE TABLE {{ params.time_consistent_cluster_year }} AS
 WITH zonal_stats AS (
@@ -9,3 +23,4 @@ WITH zonal_stats AS (
 )
 SELECT cluster_uid, sum AS population
 FROM zonal_stats;
+{% endif %}
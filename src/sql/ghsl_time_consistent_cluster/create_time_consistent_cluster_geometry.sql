@@ -1,3 +1,18 @@
+{% if params.cluster_uid_mapping_table %}
+DELETE FROM "{{ params.time_consistent_cluster_geometry_pre_geocoding_table }}"
+WHERE cluster_uid IN (SELECT old_cluster_uid FROM "{{ params.cluster_uid_mapping_table }}" UNION SELECT cluster_uid FROM "{{ params.cluster_uid_mapping_table }}");
+
+INSERT INTO "{{ params.time_consistent_cluster_geometry_pre_geocoding_table }}"
+WITH multiyear_cluster_with_uid AS (
+    SELECT m.cluster_uid, c.year, c.cluster_id, geom
+    FROM "{{ params.crosswalk_cluster_uid_to_cluster_id_table }}" m JOIN "{{ params.multiyear_cluster_table }}" c
+    ON m.cluster_id = c.cluster_id AND m.year = c.year
+    WHERE m.cluster_uid IN (SELECT cluster_uid FROM "{{ params.cluster_uid_mapping_table }}")
+)
+SELECT cluster_uid, ST_Union(geom) AS geom
+FROM multiyear_cluster_with_uid
+GROUP BY cluster_uid;
+{% else %}
 DROP TABLE IF EXISTS "{{ params.time_consistent_cluster_geometry_pre_geocoding_table }}";
 
 -- Create the time consistent cluster geometry table
@@ -11,4 +26,5 @@ SELECT cluster_uid, ST_Union(geom) AS geom
 FROM multiyear_cluster_with_uid
 GROUP BY cluster_uid;
 
-CREATE INDEX ON "{{ params.time_consistent_cluster_geometry_pre_geocoding_table }}" USING GIST (geom);
\ No newline at end of file
+CREATE INDEX ON "{{ params.time_consistent_cluster_geometry_pre_geocoding_table }}" USING GIST (geom);
+{% endif %}
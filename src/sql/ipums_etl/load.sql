@@ -1,6 +1,6 @@
 DROP TABLE IF EXISTS "{{ params.census_place_table_name }}" CASCADE;
 DROP TABLE IF EXISTS "{{ params.industry_code_table_name }}" CASCADE;
-DROP TABLE IF EXISTS "usa_geom";
+DROP TABLE IF EXISTS "{{ params.usa_geom_table_name }}";
 
 -- Create table for census place data
 CREATE TABLE "{{ params.census_place_table_name }}" (
@@ -62,7 +62,7 @@ COPY "{{ params.industry_code_table_name }}" FROM '{{ params.industry_code_file_
 ALTER TABLE "{{ params.industry_code_table_name }}" ADD PRIMARY KEY (code);
 
 -- Create USA geom table
-CREATE TABLE "usa_geom" (
+CREATE TABLE "{{ params.usa_geom_table_name }}" (
 gid serial,
 "fid" int2,
 "program" varchar(15),
@@ -73,68 +73,68 @@ gid serial,
 geom GEOMETRY(MultiPolygon,4326)
 );
 
-ALTER TABLE "usa_geom" ADD PRIMARY KEY (gid);
+ALTER TABLE "{{ params.usa_geom_table_name }}" ADD PRIMARY KEY (gid);
 
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('1','PERMIT TRACKING','AL','ALABAMA','F','919','0106000020E6100000010000000103000000010000008F0000003910B4FA7B4455C066857E5B0FFB3F40D7B7179F5E4755C0E7605BFD4CE83F403A68ED20AD4855C0933FE3B4D9DA3F405451637F6B4855C040038712A8C83F40203BFD9E544855C0E2D243F462C73F40E5E27FDC604755C0108C1DE847BB3F40F1F48F5C984755C03139BAF264B53F40E5A656FB1D4755C00F9B507D2AAF3F409659B154CB4355C08CD5CC3B0B9F3F40A75854F2BB4255C07145D47DEC8D3F4040774A92BB4255C0BD2CE46E08853F403DEDCE743E4455C054E19801E1793F4023DDA514EE4355C015BD9551CF703F401D8862D7A04555C0FFD6AD0F035E3F40B23A39B7484555C021B5BDDF13553F40E9A737D7324555C03B8F74AC964D3F40E8A2E7789D4655C08ABA19D77C453F4002069A98FD4555C0B506E28D213A3F40424974D9964655C0A1E0EC7B69323F40D0F624B9F94555C0BBE0BB09162C3F407F7C52F7644455C0F62D9FB190293F40C8B4A2B56F4255C0FF0C774670203F407E1A0375164155C0788A289E81143F402500FE541A4055C0CA1B4E2452003F40F1A838680A5F55C0DB59D2A741003F4057AB3768245F55C03E99816741003F407ACB385E098255C0D35922B84AFE3E40C61C504E9D8B55C024D68912C7FE3E4039522024929855C090E17774D5FD3E407635AB26EBAC55C00D34E1FB82FF3E405013D50FE1B155C0E348BC7F89FF3E405256DF8470CA55C0BAAE9CE9CE003F407A9687234FE655C0072DAB68AC003F40303B7462C0E555C0E94D560151F43E4016E492A80BE855C08B99FFA57CE03E409F657B276BE755C00D9330F429D93E40CC60FB7DAEE255C05E09325423C93E407D6D98DCB3E155C087A9AD269DBF3E40157F0EF172DD55C03277FB7AAFB43E403E28DE29CFDA55C04C59CA015CB13E403924126683D955C03DC6DF0D03AB3E40C9B9D5832BD955C06AA2B1C2BE9E3E401370D12603DB55C03765175D768E3E405351B9A980DC55C0C6C6F52709883E40F02861E4CDDA55C0228A02BE507B3E40C4A234A1EFD955C08A48F76FBB703E40240EB528DADD55C004602FB4165C3E40B3565AB89AE555C028B61BA7BA513E40D8203358FAE555C09D8F903A46473E40B4717FB2E6F255C02CBDAEF1E23B3E40B004A3F3290056C01460AA7DCD3B3E4045B98590EAF155C0DD91329FCB453E4074ACBDED7AF055C0A1B5DFEFA64C3E4081741B62D2F955C00330490FDA6B3E40CBB606E774FA55C0C081D2F0059F3E40664C6C38440156C025E8EE3C83BE3E4046380A00AF0856C00EB1C20550563E406098663B801456C0AAFCAAC87F673E408BCF38C9B01956C0088D97CFBF643E40E1137D1AB41A56C03F32867488BC3E40C21426FF771B56C0DCA7B78D2D003F40BFBED1E1CF1B56C0283724F5F11E3F40733A4DF5D91C56C02D07B1A3846F3F40BCE08025C41D56C0D4358654C6B33F403E752CD8441E56C001770E6E8DE33F4010D893AC031C56C09D0B9718271D40406FB32B2D401B56C0C9F37EA99427404048B53C8D341956C0EDF002D94C4A4040EFDAB04F461656C022606B7A5E764040C60505D1B91556C0BC71CA4E667E4040B33EF553821356C0C54B4A7DFAA44040F62A18D4921156C090EC5572F7C44040878ACA6FE20F56C07384BFA811DF4040F3AF5821F80C56C07E28A1519107414089C16423C20C56C0365A7ACD930B414076A73F2DBA0A56C0D6B84AAA7D294140EA6E5C2FAE0956C01471EF128E3B41403677C7CDBA0856C0D1DB4BBC4D4A41403407193DCA0556C026CA2AFEA3724140705B1CFFF70656C074C00F1E3173414019039FA1280956C0A61B9E7A14774140A5D423646A0C56C0C3D2C7EF91804140535187437A0C56C00E9CFDCDBB8141403252EDE71BFF55C0F1BAFE630D824140CDCDCF68E6E655C0DE1E6F9759814140D3EA8BC341CE55C0D2B084B8F08041400300352149CD55C0DADCB4D80481414044F2A6C956B555C0B739DF86C67F4140E8BAF36212B255C032452A2AA07F41404B3DFA0D099455C0AE33201C657F4140EF6DEF8C6C9355C0478B305C6B7F41404ABC9CFEA67755C0B174D974067F414018444C34F96655C010E302B3BD7E4140417FB3D2506555C01A8EDC96606E414011D35467386255C0573D44B3AD4F4140DED02044A76155C044E557FAD64A4140B6F2633FC26055C07E57AD26F24241409D202E53755D55C06FA8280324254140D7B28F09A95A55C029FDFC34200B4140F64BA4C4535955C091AE7EAFDBFA4040C2568AA2935855C026C8E477E4F340409294ED56755555C05CDDF284D4D34040C2E827CB845355C054FA03C9CBBE4040B1786907CE5255C06C8F651883B64040DAA17056F74E55C0A914EDD88A904040EB0C14B6F14E55C0B38A66BA608F4040E98F8FE9904B55C0B361A291976F4040045E2825634A55C055E10D625A674040DEB98B9F324855C00481B60A77634040E3BCB6FF874855C0BB8D9AEFCE6040406854451EFE4755C05682F6F2475F4040178B479C494755C039E77B76005E4040BA50311AE54655C06014EF035158404032056257CA4555C06A3DBF288C564040EF5E46B8A44655C01D8ED730AD524040ECA53C55864555C025B24917715040401B802DB4624555C004760A3F2F4D404050657891874455C08664A886664A4040CC1F01C4B83F55C018B9683F6C424040AA981D21593F55C029587E12383A404041F073DEC83D55C08F244B39F8364040456B483D243E55C071CA28C3CA3240408911EEDD013F55C0B1914D468C314040EC1726BC2F3E55C0BF9F816A8D2F404003350F3E224055C023A381116D2C40403C3EF35D574055C05BE56916302A4040FA5E65D3F23A55C0B6CE308385254040D759092F413955C0379301EC652240400D76688E373955C0A52ED2AE2C214040E654246FF13955C08242B871F11F40401B630F911D3B55C032763871AA1F404072C8B4CF9F3A55C0DC71A455411D40403CC6EE706A3B55C0D32FA1B7E61B4040F5BA2396723E55C09C2923F72A1B4040E864B5F3763D55C0A12BA01C91184040C7FD0739804055C08137197EE51640409AFE047B8F4155C0A859A480481540402B7EBD7D694355C0217CA4A93510404092665BBBF44255C0D8A17372A20B404022CFFC3BA04355C0AEB0B217EA084040679BE4FBF74355C02E08E5BC66064040D2F31BFAA04355C082D0BE64390240403910B4FA7B4455C066857E5B0FFB3F40');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('2',NULL,'AK','ALASKA','N','920','0106000020E610000020000000010300000001000000150500007DBF255EAE2A64C05BC9E212DB5D4D40D2660F5D3D2C64C022BA344B115A4D403CCAA0D92E2B64C00447FFC71F554D40AE450B1C7D3864C09F4ED2169E464D401A75F6DFCE3664C0E8F7D3A7674E4D408E164FE3083864C0C1030FEA50524D40D709B3E0873864C09D35DD40944C4D40B7A136368E4564C03A4CBCF40F534D40A07AC672983C64C0FBDD2B1E74534D40791380A90C3564C0AE1374825E664D40BB7425B6BA3864C0C4E04F3B21644D4007422C604C3964C0AAEAC49DF37B4D4030D7B28E6E3B64C0CDC6D3B198834D40BA2B77822D3264C08A7C5F71298D4D40255AA2565C3B64C0076D551D838E4D406F75FFBEC23B64C07B2A5AABB8874D407D913FA3D23F64C0C9397C195A924D4098763FA1A84164C0028ACA23C2A24D40990BE45F0B4064C0A168EB2B39A74D405FF3951A9E3F64C0E184F8DF1D9F4D4061A5FF24BD3E64C00C1ACBFD89B04D40583D22E5A33664C0ECF3E52B79BF4D40E49EE9E1A04764C0BFF915DEA6074E402C6D97A6644664C02991BEEC63124E40604F8B2B1E4864C02BA4997037194E40DBA100ECEA4464C03BFCB1FE541F4E40C82D366F314964C0A04CF7B37A1E4E40D1A7E5A9AF4864C04839452B45154E4003BB0F2A484B64C01C5B09A3ED114E40B63757AEB84A64C09C8E10ADB51A4E40E48308372F4F64C0755AC46E04264E40F1C6C83F414764C07302EE5AB8404E4002134BC62C4764C0FCF104255B4A4E406F335509373C64C0E0789887C9594E40D67DACCABF4264C031E8D93534544E400B1DD6532F4564C0C7EA03BC0D5E4E404B3F900A0E4464C0158077321A534E401366FFC9A64864C02B830F66564E4E407CA42B3F274E64C0EE57EDC17A364E403B761B3B8A4D64C07B681A7C26304E40A58C4FFB705364C008AB37ACED294E4055577FB5E05164C021FD4F65D3204E40F1D86DF8785664C0CBE42EE052214E4054F86F6F744E64C0A2363CA3E6174E40017094E45D5064C04FDB2CC8EFFF4D404709046B205864C0389A85BF41004E40C8B501A9225A64C077920AB4A6F74D405018AEECB96B64C01250D116D3E84D40F5641EBB878364C0A1C7BBCAD9EA4D40BE820182118764C0872C3654F7F84D40559C8484A58364C00210616638004E40BB8EC40DAA8D64C05FBF49C7980B4E404942634E3F9564C0C8A5F5D22D214E40DF928C20D29464C0D7B82AD7DA294E40C0A27AC8DF9864C06D94965932254E405EA8684B82A264C0B4E5031E08324E40B1B958C8AFA464C0BD7FF19EED384E40AF621F52E4A064C05271D3638F3B4E40602642998C9F64C0DF8325238D454E40BD43A14407A864C05A10B6D78A3F4E40F8EBAEC3AEAD64C052831B05F9464E40BC1E806737A064C0A367F0C9A3594E40BA29473014A164C04D5B200173644E40FFBE01FEE99B64C0F1CB4E0ED86B4E401B2451850E9E64C044DABA079E764E4079FFDB81ED9A64C03EBBDDCFDD6E4E400A35360BA79464C0244F62DD72744E4086A4EA03659664C02A03EC9B606C4E4094CA25C20F9564C012EB8BA1DB684E40A8EBD393B28864C08F35EC983C644E402881318C0F8764C071CBDBBB13584E4092EAB0BCCE8D64C0759E65BAB9464E40ED86218B507E64C0E5AA48A9D8634E4031D8D002D17964C0EA4CC288395F4E40B5BBE9F3A77964C088E13591514A4E401247A0AF846E64C073DDDC70C3564E40B436E336166F64C0A0DAC07714604E400264F874266D64C00CEF4BFBF85F4E40890ECC8FCC7D64C02F86B225FC6C4E403534BF45EC7164C009D917B5A4714E40E1C8CF0F437864C09A735A0970774E401D10D7D1BE7564C042C68698DE7E4E40AE0CF610B97E64C0612BF75D696D4E40A7F91909EA9164C0DD57E325CE6C4E401886FB0C759464C01E71819DCB764E4054594F0ADF9B64C02B6577CD35794E403B644CE8069E64C0BFD23588E9794E40F8DA2D44AE9F64C0C4AF72A3A8774E4049449A3E60A264C039B0357CFC734E405C19B5BF89A364C0D7C79C5816764E40C6BFA2012CA664C0E5743A31D97A4E40929AAA9C929864C0EC4793D11E8E4E404EE54D58DC9F64C05E2C153B558E4E40CF91D0D08CA164C086BD6B3948874E406BF00895FEA564C0B0413E25B88F4E40D912221C13A264C08E89E564F49A4E40F0C9259D82A464C0474A6A14C0A04E406E67E81BB9A264C0F282E461469B4E402F23DF17E9A464C00C424AE3E0934E40A4977316EAAB64C048C7008A9A994E40E8799E1DB9A664C0402E73CEA3A14E40FB9B2E1C7EA664C012EE76C25AA94E40D2FE351E4CA864C01999117FECA94E40A721229906A564C0C08B93BCDEAD4E40F72E1A9BE4A464C0AC0D20F943B54E404FA4E4AA1F9B64C00FA06BB42FBF4E400A8C857DFD9664C0B64ED50CF8CF4E406FE3807C36A564C013CE72382EB74E40F470575F46A964C038CCE63BA2AA4E40D7C0A41D2DA764C084D2098B0FA34E40EF2331551DAD64C001AE7445909A4E408343D092FFAA64C0EE1C555205944E4048A5470703AC64C057B69099E4884E401B09277F41B364C0900A0D3F5E8E4E402572CA89CBB464C01B14C2E2549E4E40B03C32118FB364C02D30CFA2D7A34E40476FE493DEBB64C0BC078884C7A94E400234EE5C91BD64C018313B36D6B44E4025F59A65F4B864C0E8D6119574BA4E4075DEECEE73B964C0E3C54C4B6BC24E408A55E2EF94BC64C0DC43FF01E6C64E4040FB48DD29C464C0B50E9FFD92BF4E405AD35D7067C664C0685EEAB545CB4E40CA275F8646C564C0B8255EBF45DB4E405C56E97777C464C0C7911DB823D14E400C076AC379B864C0027B956A09D84E401520570611C064C0F5C2BF97FADC4E40F6B9AC163BC364C0DF587B535BE84E400B9DFE16F0B264C0B548749AD6EC4E40376494E947B864C06C760D90F8FE4E407C55B93A95B664C003B6965D700E4F40BDEE4AFBA9A264C0194389AEB3434F40A5B0C441D69B64C0929A5DC869444F40CF2D30F84F9B64C092A2E10A3C3C4F404696B6378B9364C0114443EC26374F40B9B76CAB239864C07826C298812F4F40A0F15DB76E9264C0D6267C7055364F406C9C723BC49564C047B46B226B3B4F40D4DAC5835A9464C0A8E8C6275B414F40FEC3473ABE9A64C0DE5B430D8D3D4F40048DA684649964C0F4E40D1229454F40BDE7B7C66F9B64C0C2A12ACA40484F40CB3C052C698F64C0B8A8DE7F5D5F4F40BB2DAF0F709964C0ABD40212314E4F4037A5956A7A9C64C095161B4BEA634F4065C05B2F889864C0DEAD695BF2644F400E8DFDB42A9C64C07ED03250D96A4F40E5EA211AC19664C05C97AABCD1814F405DC654D7218A64C04BA4EA6F5B814F405C43762EE39264C0D8E4746700914F407ADF05B9418C64C0FC175F54219C4F4067DFC3F8B58464C01079407437A14F400DBB6C9D497764C07DC5DF94629B4F4075EE90924A7464C01CEC78573F924F407FBD37CF427564C08CBFABCE3A8E4F40BD1FD70F5E7164C06AE9F8A39D8F4F40AC9AC3C9C67964C0FCF0876ECD7D4F409A465BCE527164C0E8D8A9A17B8D4F40CF8CFF03036B64C03B898BA9B5824F40480A43030B6264C01DA542BE94874F40487DD216D95564C062DBDEAB699D4F400B62837CCB5364C003956976A2A24F40D6DED531D14864C0D24260358DBE4F40538C9D990F4A64C0599E07A42AC54F40C9138CA98A4064C0243BBFB98EBD4F40FC0495A5074564C0691D870969B64F4046D33397EE2464C024EBCB7B81C14F40ACFF7D6C3E1964C0DBD891F1BBDE4F407AD97DC4CC1864C07C44611759ED4F40BEAEDCB22F1E64C0EDDFDC994A045040C8594656D81E64C003F730F22B0F50402F242894192864C05FADFB8817195040F6FC7FD4462664C0EE686DD28C1A5040415660ED4E3164C0E1616DE8AE18504071D94842E42C64C0865ECF5B2D22504041A8D01A272064C010A28AB16021504093E2B8A9B82264C007080B372C235040108204E13D1A64C0A42EF3C059275040F1E38378181964C020CC0812CE2D50402333ACB40F2564C0D3498E550C3B5040C9609F70C51F64C0A4D033A2063C50402BDFDD76502664C0A660A492CB3B5040EAF60435152C64C0FA9FCAF9633250405B26ADB39C3164C0E5691163AB2F5040235E63FBB73964C01300D80E8F345040B7EBD9B7F83664C03A560354683250409FD459E47D3C64C0E20C90B97B2D504032E47560BC4364C0A490EE68C42D5040B48ED2D2865264C06FD50566492150405FBDEB854B5464C06FC683C7C018504053CF7510FB5864C03DDA483384155040CB012BE8E95B64C0B56AEC79441D5040C62A15A98D5A64C0C7691482AF1F5040666E9F63B36164C004C188C2462350401DF81D5F066564C04F81E080FA295040A5FFB623806C64C0F7C1C577E8255040E45C8D27466164C0BE52D0C2FB205040ABA69487B56564C0B966C73E081A50401A4C715B1E7264C05675116E33245040BDC99CD7858B64C0FF73F6C90D25504045EB702F3D9764C0A23B22AFFD1E504086C5EA745F9564C0DA4D25356D215040BBEA3F68909C64C0D6DDCA1F0B1F504066F12966CA9D64C0C2E2CB9F1E2250409C7BFA61889D64C00CA6211B3B1D50401B98BFABA29864C007C5D66A5E1E50404155D0D7FFA064C01A43D4D05B1C504033992971AAC764C07A1ABAB919265040BD582099C3CF64C080642135FD2E5040CEDBFAE379CC64C0E1D5F286FF385040E0A856056AD664C029D49E29813F5040090A2CA57FDD64C096CE21C25F485040774FC6F7C2DE64C09C8628A86C4D50403339E50A79DB64C014160B3D1E525040E8C08728A4DD64C0E87D6763484950406A118ADFFCD564C0673CC1736A475040C016AE9976D164C012BE9DC56448504009DCDA1FF7CE64C0310E3355DC4B5040C54B1A6B96CF64C02D724DD8F84E50402D3330AF0CCC64C07CFA13282D5150406A2CEBE5BAC164C0D5F7A23F13505040BDE621D325D464C08A66BC9F415750406663B0A9B7EE64C0841A14CCC15A50408EF64AFF280265C053B7FB691665504083F2B758FB0365C08E57D3F81C6B504073E2B8502CFB64C067FEBEE3AD705040456B97921C0165C0183EAD430E6C5040A532F2486C0165C0AAFB55769268504066D6C9843DFA64C0E3C594DCE76D50407B4BEF69A8F064C099E73031B06E5040F17A0AC161F264C07F6F09BEEF7250402CAF438367EB64C097D0DF5FC0785040E875066D90E164C0F457F874057850400B78BB6B04DC64C0DA053049C17B5040B12623F9F7DE64C07EF1BB893E7E5040C81D3EEF7BD964C012C8FC15BE7E5040743391BBF5D664C0F85D14E6EE83504078921BC0A1C864C02F281E526B8B5040321538DBE6B964C08FC2C5678C865040148C0B991DB064C0A9308EC33B895040F97966F821BC64C007475B73318E5040DB8718499DB864C049284A874A94504025E547CA3EA564C051F690C4539C50408E0953BA27A164C0240AB5472E995040CFD9D7880C9764C0D7A1636E1EA35040678333C4C88C64C03A77F084ACA55040A2ABD382678B64C06F21FC8704A65040BF8812CDF87D64C0E7DC22FEE4A65040AC9F919C167464C011FF642142A45040F31EF8281B7E64C0A331DE1A21A550408F1D7C553D7864C0949AB69C1CA15040111C868AB37C64C019AA7341139950402CFE03F86D7B64C0E8DFC8ECAD9150405C1F2B7F168664C06152CF4D2F8C5040A231C6F1967D64C0211EA61D458D504059BCE59DAC7A64C086522AD122875040738A6C8E177564C054B8ED53788450407C6328C3535864C0407A0455D1865040EB61F96E595564C0CA6F408ACB7F50406C7DB5EEF24464C07406D375EA8450404497D21F363A64C0C28434435B7E5040E4F6B8A7E93A64C06A9ABDC5CA805040F7749D73393764C01946DAD41C8550402E77CEF31B3964C084D23DCFFC84504053FF60D9103164C0D423163218915040AA82D7E1E02264C0F33921896C8F5040B9F21AFE882364C02B9DDB7D948850408FA788B8B62564C0D794C1F8798750405A71B440262264C0CF203040748850406E3DE3BB282064C077C0818F10905040B44D9CED232464C01955340FB3955040A109E5FB2B3764C08704996DD7995040B35293F3323D64C04ABB75DE67975040834055DF7D3B64C06E4E34560092504022623B1C353D64C0C1803C5285915040128F38AADE3E64C0469E9716419550402BFFB504023C64C0F468E1EAF49B50405348DB9E153D64C0A82F67F436A25040F05625CE404764C0F3164CA36EAD5040C5A2F517205064C0B14FAA1331AF504062F7712A4B5464C051875D932CB75040BF3CB4C0774F64C0C08FDEE725BD50403BA63785764A64C09E4A4B3238BD5040E44E4CA18F4064C003B2257EAEB1504045F3F5817F4264C0BA175D6A12AA504079FDB16F683264C076298E45949C5040F51C4D530B2664C027B4E09E6DA2504048FEC065681A64C08A1A44A42B985040312FD620770764C0D8986A968A995040F0FF077ACC0664C0B6FE2EE785A15040FF62E74D5F0A64C0884BC1E58DA65040B48820D5C60764C0E97303732FA95040AC41EE8F701164C012DA94CF85A55040F4DBD76BEC1A64C01848A24060AA5040C2838AEF932464C00F2A14EB65A95040F8F7F5D2112864C0FF14B91B16A35040EFD119324D3064C00F975C5720A250401E08CC9DD13C64C0AD75D01392AE5040F154CA01B33964C040527D5D8AB95040F4AC2F08A23064C0C8938BAD23BF5040F1F2B6E0DB3B64C0AD71C11D48C35040015B7092974764C0FC3C3E7D6BC050409872355F9C4964C0B74C93BD5DC45040BBFED70F934964C03130A3B82BC0504087F6D5878F4E64C07B1BF2EC3EBF504049FDA7719D4A64C05C3FB3408AC9504059BB0774224C64C065BFADBD6DCA5040056DA689445264C02F1CBEA486C050401B818A1A317764C07F81B84F0CC7504079F86E63697A64C07117E54FA8D65040DB988AA0BB8064C098508BC8F5E2504004E8AA37B79664C0545D98E6F7F450405915F3D032A964C0A516B01FE0005140314F82B7A8AB64C09FBE10F875025140CC68400E82BD64C0749D308D5308514014A97C054EC964C09C4710BCA71251400B4844E095DA64C0611BA4DA67165140E9E79E2414CA64C0E0B9C48384195140E16B9430D4CB64C0D8D918430F1C5140D2E6EED752C764C0EF8D5B1D982451400D1DA0BD71C664C076D2722C8A2C51402B09233485C764C02AFBA138F4375140E563F5437D8A64C0A3931418833B5140E20561CB0B7264C00C8DC1F33C495140752081A2FE6564C005AA5A71C45A51401E7B6A3EC26864C04F77765BC4525140F7421B12F36364C01CE664EF94585140DDE2E7D9306264C04E8005E050645140F5557668C06464C0D5D471E28466514012A6EDCC375E64C08787E40E4C6C51405824655BF06064C0F39A5D4A976E51408402F170E95E64C0B933FA1DC67151407504FE11963E64C011BD66B764935140CDF9AA54D13664C070DD7F074C915140B84BB6C5C33C64C083ABFB385F90514092534001273964C08713D7BF2C8E5140BAF2B20A474064C0DCD8F9D0508C5140F53289D6F84364C0A1ED4C29EB895140111EA9FB833664C051471A85518C5140F46CFF93BB3364C0FD41B6CF51905140A609D0F47A1E64C013084901869251405AD86081551F64C0767FD182BA9451402C40493CEB0464C02062CEE7AAA65140CFD854DC1BFE63C042F45894F0A551402101BC3C8AFD63C0ADF762CE6FA2514001584CEE760664C04704BCA8269E5140AAFFE29E8EFD63C0674DE3C5EA9E51404CC46C1D3B0464C0E8D00ED8569451408D8414273BFE63C0F8912DB14597514088B93EF7BCF863C074375163448C5140143BF5307BFC63C0ECB2A17A0899514011112E6329FA63C0F5A3A253AE9F5140701DEFDEADF563C05D67B97DD89D5140385B68113FE963C083C4C54FECA1514073BCD5A477F763C006326F1C8A9F5140026DFEB122FE63C0681CA29976A85140116E47ADE00364C0D7225978AFA65140C9BCCB067DF563C07354FECC0AB351402A92F1234BE563C08C5FBB5057B851408C03EA5AECEB63C061E76BF5F9B55140B1B3D20AD7E463C0CE4948CA72B45140DCFDF5C059EE63C0810DB0A3DEB15140DE12CB930FE763C0637B5D2FFCAB5140CCDBD3F1FFE863C0BC88C4F264B05140EA603E7417E063C0DB6C661464B1514098239F0697E263C08B762C110AB45140B2802BE6E7D563C0C9ACFD6E3EB251406674245EF4CA63C0A18850114AB45140E835E3B360D063C0AF0DB9464CB6514006DE7ECC48BC63C0DA621E02C7B651400E4A5673EBA863C0B890699919C351401DDA687E3C9A63C0548DB9A430D35140809E00CF8A8F63C0A035A0C2FFD95140239BC787258C63C0343E4A84D4D7514074AA4F025B9363C0516708775FD65140089DFBEA698E63C0F4754C3BD8D05140B7DDB2DD5A8363C01FEDBF9270CF5140EAFAF10F7D8163C01E70125365CD51405C7E9DC69C8363C0FFD0F209FACA5140B4360F8D607E63C0A713861B09CE5140C307CCBABB7463C0A4AA09AEDDCB5140C6EBF2E69C7163C007EFFDAC82C75140B4515EC0A77763C0B2C7034DF9BF5140544DCFEFF28563C008856BE5BEBA514025D533A68E7F63C02BB3CAF07BB95140A8BB2273437F63C060CF719D58B0514037EB94F4F37C63C0A7A9442513B15140203FF949BB7C63C0482DBE6DF3B4514025860742C67263C071980107B7B551403D5321E43C7163C0B2F2F094DDBB5140EBC40034806C63C093ACDF6734C051400070751A476663C0A909EF3B4CBF5140BF3236094D6963C0DC2EC1FF72C551407E086B3A266363C0571772D260C551401435EE935A6363C0458CF6DA80C951409D2A8F86616163C0064BDFDD61C85140D00D955E0F6363C0A97750870AC1514061ECD058A46063C0B0AD944B33C151407E6486FC1B6063C07C70D1DE76C751404641C037635363C009FF4AA7EAC051409BDF83D40C5563C02BE1DF96B1BA5140D73167D0E25963C0C188C2402BB8514078886F42544663C0130872E1A9B15140B1910D20633D63C084D4E1C7E1B851407BA8D0063A2763C08484180668BB514097D30FDC081A63C0781F1F23B9B85140B1AAE5B38C1663C0DF1263DED9B3514000B322C5491563C0BCF588AAD6B65140C87FD254CB1763C0B9548BA86BB85140E796C4BB080E63C079572801A8B7514041613893000763C0DFAAFF49E3B3514008CBA036581063C06391315C62AC51402EB92161E80F63C069DBE7552FA9514021F4476B6C0263C0F90097F921A55140A1B57341081463C02381437D5AA3514097B4BB0CCFF762C075C3ED1BD1A3514005975DFECEFB62C01A9A1206D0A05140EC0803B2A0F862C046F2F24FEC9F5140FB28756104FF62C0E85B43F05D9C5140CC026F5F26E762C021B94A84BA975140B6501461A1E562C09126424A039851402DC36AFD6BE662C08A973BCFCC9B514058AAA0C30FD962C0C8B47E0D1FA051404DBC56A4E7CB62C01DBAA141179F5140A3C45D4104CD62C009571BF12E9A51402FA4A4CE84BC62C0461CC700F1A05140EA136E79EEAF62C08873C96B70A15140BF2C055D879362C0AC862B657E995140A0A557F2419062C0028F981AE993514087EE95E9398762C02A9CEE00F89651403A278973927B62C02EF8309CD293514097F45DC02A7662C0746A969C5E8D5140043BD266F43A62C04394689AE68A51408A309E1F8A3362C02B0AA352258451407FCFF7090F1F62C0961FD7B4FE7D514062FEB624BE0362C0A72FF18B1C8451402A24C94A4D0262C0C7570CC2FD7E5140EACACF98DA0062C061ECC2CFF482514068E932652B0262C08A1B54120E8551401631E811E5F861C09788AB6D62865140466188753EEB61C0EE543F0CF5865140497658E182E961C058224947AC8251403CB72C3211E961C0E7592AD18F875140438B545C0ED361C00F82C6A141805140510DCC26B3C861C0A06516CE4C7651404AB204247BB761C0CC3BBFC49F71514098EF341183AC61C03EFDE3F004695140900B34026AA861C0AF84CDAB97685140FE6038C526A761C0DB3BD12C076B5140F3D4ED4DDFA961C0C13592F4376C5140AFB5F75D2EA061C02FA78FB519695140CCE5DB5D2EA061C0884281751869514017A585B126A061C08EBA38F6621B5140AE7DFBF113A061C0D9FB5107C4755040C35BB916F79F61C0E07DF55480F24E404D8FC593EA9F61C02C5DFC2D46274E4052F8AFB3E89F61C04B9825EE44274E4070E82BFABD9061C0AD0CC213661C4E4061B36A037C8E61C066AD915899274E407571B1C9657F61C081EBD647FE174E4038997695B57561C0B9AEEBCB8C2B4E40FDA38CB13B6261C016BADB680B2D4E408F5C766B196661C0BD8A0C81560B4E40F93F6DD2245661C02C11D1510CF44D4026F451D9C25361C074FD83D10DE34D4082EEFDF9F63261C0CBB8F6127F9E4D4087F91D34F52E61C0F2398BB3EE734D40C24CA6F6F11961C0CFC3BCBA1A954D4020C7DBAABE1261C07DF32A5BDB944D408C9C40C29A0F61C08DEB6127F0A14D40F157B65DDE0E61C074DEA78D00A54D403C2ABC45E50E61C077B8598F14BC4D40EBF09E2A8B0761C086E197D843C34D40732BCB32100B61C04BB26A501DCD4D4056631F4732F760C04214CCC44CDF4D401A231DD036EF60C04BFF30429BE64D40C146B57E85E060C0FD8A1D1F99C84D40F3D673ECBBE060C0BFB4114042BC4D4071FE1CF1FDE260C0CD13903B9BB64D4071301724B6DF60C02DAB1E7DE0B14D4043586E6145DF60C0047472BFABAC4D40CA45211C85DE60C0E1D85703CCA34D40F109E05013D660C0438904D01A9F4D40F9E26EBB2ED260C0C1D12E63AB904D4027FFDF76D2CE60C0F095BCFC2B904D40D9B370FEB4CA60C090F291C59A7B4D4090EF7810EAC760C0EB5A4409A66D4D4002F5A0A584BA60C0DD1343ABE65C4D4058F1AAB3D0AD60C0E02B5A7CBB3A4D40575490689CAB60C0A80D628FDE234D4007A78A3A79A560C0F25EE2FE04144D403B1E971770A460C0A281333C58114D4080841DBFA28B60C00FDD9F45DFAB4C4024A0E0A04E8760C0E14A3C4D299A4C408C45A427D68A60C08D48CD6A438B4C402E421C1FEF8060C09B200CA99D844C40898ECB195A8360C0439B7EF1E36E4C40C10D7D549E7B60C00DAB9EB352664C40BF2993456D7A60C019E630B75D4C4C407901313AE77160C02A31FCFB0A4D4C40A733D03C636260C087D4B12ED6334C4005E8FD7CD06160C0251131ECE7324C40CD9AA13ED65860C097D7666CD12E4C40301527FE1F5460C0621F580F0F214C404362B03CD64E60C08CB8AAA8121E4C40AC7A2BFB4E4D60C0BC1F1F7574104C40079D82B8E34260C0EC180E80120F4C40E479E373894060C0FB77FC6D56F44B4089035430A54560C0565FAE8B87E04B4089035430A54560C0263AAF2B86E04B40B50E51A9A84460C01CFD4E3342C54B4042C04E64C03F60C01C06B85504A44B40AF11E95F4C4360C0884508F81D9D4B407600357B904B60C00C28B0E62F744B4037B272DFD55260C02DDD99E092654B4027F60BE37A5260C00FF2C83FC06D4B403042E352025660C005CBD4387C614B40B7B85ADDC65760C0E2BD4513A77B4B40DA6D4E0CB75760C0CF83E816C6684B40A85D6E432C5B60C0BE2C3B4832624B403A7DAB49B05D60C067B4B89290674B4093C088A5045E60C0D00B9D4B437B4B4078C1EA74546060C09E3BF4A57D804B408C78DB8FEA5A60C07FE176E9258D4B404C0B76890C5760C0F4AEE734CE894B40BF5741DED34E60C00713DDDAE9A94B40F269DDD12D5860C098BD5AD1D48B4B4063F2AEDB2D5A60C0521081793B924B40CAE0AB04C55D60C0AE5CA824288B4B405E4ACD8CD96160C0AC7C69DBAB8F4B4090E1B312296260C0F28D340874984B40FAC2E41B425E60C0B3BF0DC6CBA34B402AD716DFB25360C0C42D1AE7DBA54B408A36E5E0FC5460C0A8CE561D39AC4B409EE77B1FB55B60C0DA19AD4875A74B404FE000B7665C60C0572085F23ADA4B40CB2D9636AD5E60C0093F184D67E34B40BC686CB95E5D60C0DD15F308D9E74B4091D2FAB5046060C0AAF3CE3936E64B40FC16EE707D6660C09D7017059CFC4B40906C023E626060C0A8B98D30920D4C40AC447EE75F6A60C0A3E5840279FB4B402DF99A632A6D60C06D9549F9A9004C405F0D91145A7D60C0FCDAFEDED1ED4B40629E3753227860C00F38260259E74B40D7B661CEAB7B60C0B06C2194C9DC4B402550FE8B247A60C08197275DA4D54B4028793508327C60C02FBFE82293CC4B40FD3861CC2D8060C06DD32360B7D44B40AF648A48BE7D60C068468EA0B8CB4B404FCBF685DA7E60C05F073B67C6BF4B40B11F4449AE8560C019F9941F82CB4B40A869C2CE918860C05D9D8F14BCE04B403A9F3E8E388760C057D341FC95DE4B4011BE46CD998560C0A123806701DC4B409757898DA08560C0332BBC8B5AE64B4012846152958160C0F8B41B9519E74B40F9BC0897028260C0BC008B33EBF74B40C4A71F61447E60C07BE15387EFFB4B401EC33259C87E60C04653020225154C40FFF82925BE6F60C04DD3404A381C4C40EC931193137D60C0B8011843401D4C40C3AEE9531A7F60C03CCD3528AE2D4C40E7155A0A188560C061B19A743D304C40C0DED5871B8660C017F2B836F13A4C40B2A8F60F218B60C0D013BCA179434C40D70A1018008A60C045F1C87397514C40EA7E6F68959160C01F6CF59F4F504C40E35598239D8E60C021C578EDF6554C40B658CE2AD69060C0788029AC705B4C40A9E60526A58B60C0B30BC4C6F3684C404E592DEB249060C0D216DFF206604C402F3BC7C4A89860C01A60C421F96B4C40FB7D88179A9D60C02554CC25017D4C40394A3B0CA29860C0C24BE3EE277B4C4061AC050D619960C0BE1CCEF2398B4C403DEAAD955B9C60C0DBD4CBE828824C40CC5994631FA560C08149561F328A4C402DEE7A9DB7A360C05F8026E271924C40076C511E16A560C087F64A1C01954C40BCAAB024D5A760C062EDA6511B964C40CABE01278AA960C04CA72C14548C4C4079512881E6B060C022C513C9CA954C4085A9C9E3C0B160C0C328308CE3964C40F384112428AF60C08E14AC35B9A34C405C56F397D0A760C0A33D37C830A34C4087D2F93373A160C07AE909A9F5AE4C403EB520503AA760C09EAD81C80FA84C40B9D815E1E2AD60C070A4881A5DAC4C401D593B49C6AA60C03862A468ABB74C40E35BCA5611AF60C024979847F4B74C40DFB18E4AE7AF60C0C240D356D3C44C403BF3F0BA02AA60C011C7059A70CB4C4079C7F718BBB260C07BB8D7CBB3C84C40246613203FB560C0ABFDB3A2FCD04C409E16C9E296B460C04D89383332DA4C400181861C27A060C050200B7F33C14C40E8ADFC1D81B160C0B46E23C8FBE14C40E295222681B160C0B3D889DE8AF44C4053BCB245F0A360C0E1ADC4B3B7ED4C407D49F484D4B060C0A9325E0144F54C403B6C28E834B260C05822DA5E12F64C4085E398EA2DB660C0117739BFC1E44C40BAB8844171BB60C00419D6BA0DFA4C40533FEEFBC8B860C04BD9F9C8E3FE4C40368F0DF1D9B560C08E9313D406F84C4012FA34F377B560C07C84D222BC014D40A6FAC0BA94B860C0AF73B86723074D404CED0AB485B560C0250F0855D6124D406DFA2486CDBC60C04B403BFAEEFC4C40BA4DDA511EC260C028D7336BF10A4D4069B2C3592EC260C0203B9B2168234D401CD8D8934ABF60C04C967172AB284D40E654B56260C060C051CCC079D6324D40603DF2DC85BD60C06539DEA3AC3F4D40369FA04BABB860C078DD78354E424D40A6662EA463BF60C0FB40951B363F4D40F4E608A4A5C560C074797F3C21194D40240BBB8D60D060C0F38F5554412D4D408C83A8296CD860C002716E6CE1304D40C47B3171E2D860C0366564BBD13E4D409CADD5BDB3DF60C02F95EEB8B7554D407F251B3134DD60C036419AB4F9534D404EBD79825EDE60C00F09B3E33D684D40923BC20900E160C01DDFAA5E495E4D4038397831C5E460C029D3FE619E6B4D40FBDBCF482DE560C09FF170D0BC7C4D40F1643B653BE560C09A1FEB74117F4D4029CB5C7BC8EB60C02FBA0DCAFAA24D409647A27C88EB60C072DB5F47FEAB4D40EF67ADFE16EB60C0BF13E08DF9BB4D40361996DC42EC60C0EFCB8C46E4AD4D40F122D6FBD4EC60C0DB139D4708A74D40A8DDF27CBFF160C03DAD4442B4A84D40A2E55D376DEB60C0799695913B9A4D408003633ACFE960C0B9E52CCFA88A4D40496B8BF83FED60C017ABB39533994D4056B36242ADF160C09F172400419D4D4039CB24791CEC60C0506063B79E8B4D402F7EBA5B83EC60C00FF3D236BB7A4D4051BBA55044E560C07875133173514D401AA5BF4F24E760C0981584EACB4B4D4013E6B2C8FDE260C0C0A85555D9374D40C149C986CBE260C05B258171C91D4D40B1E42E0F12EB60C0E4E12F70E0214D40764D57B96EEF60C0E78AFC95D63C4D40D621631974EF60C094491A16F83C4D4001C2B3552BEF60C00B47FABD992F4D40C26C92295AF460C0A90C6A3200364D4065F61E355BFD60C0B84C0877FC304D4074CEAECEFCFB60C0F1B348DCE73A4D40FB2AC1CC57FE60C017EA69CD8C3A4D40100EF10E10FB60C09A5B1AE0013C4D40E03C923581FC60C05DDFFF94CD494D40F4DB1DF64EFA60C0BA9C9EE0B74C4D40CB3D7B103F0261C0FCE9EF36A0684D4009A9C8D1AEF860C0F0FB2FDF2F734D4070A95366E5FE60C093D030573F754D40103C3A59690161C039C373A1516D4D4073F61E65270161C0DFAF77373F754D4078291A75400561C01A50542240844D40637459A6630461C0A90246719E794D40F841781D400761C029E7D10850764D40CF177062940361C0016DDECCEA764D40A056D7131E0361C057846A51916D4D40B11FDD28290761C0BC7A330AE15F4D409A700565530C61C0E18D801CEB664D40E550B6788C0861C0BF937BD63A694D4067EF94F1810F61C03EA178BD656B4D40DADAD854B40F61C07BB137488A7B4D40D95AF287A51261C093F184F02C754D40832C6D64AC1661C01EB5B7DB5D824D40F5906EC6861361C0C951E7E824744D4057132B85291561C0463271D70B724D4062AE44D9CA2161C074563D402F884D400A320D23FC1C61C00D5C69C9A1764D4095D3C027052161C018E67361D1744D40B185B7E8132461C0AAE92CF927694D40B9EBF3A2AF1F61C0CE5DD4EA81724D40EDBD44346A1261C0FB09576D4A6B4D40C9F8C864740F61C0CD8719BB6C654D40F88F4DB3651461C0FA6273A431694D409AF8C288C71061C0238EF29E83594D40CDE7C7FA050E61C0312409191B554D40B10AF259E80F61C03EBA7B31FC5F4D405BEF8CC8DB0A61C08F59FDE77C574D409A1B10B0D21061C040B3636E354E4D405F778FFBAB0A61C0B628FF65134C4D403B512B0B690961C0C3E59D3FC0544D402710DE93DA0361C0C2394BF0E2464D4069708343BE0661C061EBFDF5A8414D40C4E0A550A50261C0FC3D9C9572414D40A5F121FDFD0061C0ED49769C05314D40E9AFC37DB90261C0624873CF422B4D4064F6F54AE70861C009DCC1BA8F274D40092EE20B2F0A61C0493864FA14334D408CC94A513A1061C0A0E91D3D7C384D408C0E0321D60F61C0FB48748732314D4070A363F0DA1161C0200A8345CF2F4D40B8FA88AB760F61C071F47179B02A4D40DDE89BD5240D61C0D85560A1EA2F4D405F57A416A40B61C09F3BE5DB2C264D40DB33ADBB4D1361C0583E6C3EAD2D4D406AEA57C9F91461C00484B5785D2B4D40A13C4587F81161C0A42AD2D3BB204D402FD6CD4EFE1461C03A3724BE811B4D403AEF59DAE91661C044487C943C204D403B76C451BD1561C0AB2D0DA92C264D4023CB52BB091B61C0227A1CC497284D402737FE87BD1B61C01BB23B63CE304D408B429C4AA11C61C09933DA58942B4D40767546D5751E61C0A0B318A1A7324D4010B99475052361C06CB12068E0304D40FDD8D5411B3461C08B71BA639C4C4D40BD404FD7282E61C0FF84F68865544D404ACEC0276C3561C03E3B874BA24F4D408E14BD62B63D61C0A2AC12E5F7654D40D45F4F2BF03E61C0983F9349C3734D40F3C08A6C8A4961C0584E284DC6894D4001FF06BC5C5361C0B7B7714AF78E4D400822B480005061C03111D926498F4D40C75A0937404E61C03669C3AA7E984D40EB9C73F7145461C030B0D196CF914D405F54B0BB566661C04329854B3FA84D4016BA3046AE6361C031015F9149A74D40AC6A7475436761C0BF462A7B51B04D408144A52D9C6961C04A180FFEFAAB4D40434A22A9CC7A61C055655D7A3AC44D40FD68AC01527261C0BAB691B013CE4D402DF09ADB156F61C0005DD6468EDA4D402FBE8AACD27361C0E8D8668B46F14D40A738B92F9C6F61C068D89E5D0AFE4D403797CA556C6961C05E49786F66ED4D402AE0C693EA6A61C053F6A11DA7DC4D4012E2B317726861C0BD2D18C6ACCF4D409AC8508DF36A61C0FDB344A466CD4D403AB28E1A316961C0B89A413419C94D40C43490603C6761C070B33A86D2CE4D40EA81EB53F86861C02A243F5A3CEA4D405FD377B69F5C61C04023922836E74D40EED9DF52756761C0661C849B3FEF4D403831F9BC7D7061C03080B39B77064E40038596F3DC7261C0C06331D26AF94D40F65F6899C17A61C073693EB758E94D406FCBF237F68C61C067105A994ED94D40A01893000EA061C04E0B654DB2E64D40F297A31869AE61C0E315CD9EC3F04D404A0AD9B559A861C0ADAC9056FFFC4D40175AE33302A961C01F18B0501F094E402DAF10A590AC61C0140AD38CB0114E40F0AC571D54AF61C0A59BD758E10E4E40EB12749B60AC61C0989A49890A034E40BBD5507AF6B661C0E73ECD27DDF94D40FC57E17602D761C0D5E00DCD030E4E40BBF4481F72FC61C05792AAB7B8FE4D40C84EA059C10462C0707CA23A0D044E403FCC065C190062C02E407B3A71054E402EB3ACEC140862C0562D51B68F124E406012F471120662C0DA0949F6EB194E4086BF1EA26F1262C03005EADFB6174E40FAB70A556D1662C09926D82672234E40CAE0EF31071E62C094B25D148B264E4062A6DA6A7C1962C0C4261152D0394E4098E8EC6E3A1962C0681BA7AB1C3F4E401C6CFF354B1C62C0F8169F2B313D4E40F1BA8E0E701862C0A2F10193D6544E4092894BDBA01362C052CDAF05865B4E40AADE4472541862C0F9036624EC564E40ACB366E36E1A62C0A2645A83E44B4E40440D18C7352762C0FBEB6FED252F4E40609FE0AA3E2B62C070A03A23032D4E4002F1DED2FA3462C03ACD27D2C43B4E4002022A2B273E62C0E2A64AFDD63B4E40487004B4163462C0366CC501F0554E406BA17F6CF93B62C03A827D096E4F4E40FD588C0ECE3962C0841FD8B01F544E4058361E6DF23B62C05DD372DA29534E400970BEA62C3B62C0A3EA5AFD19594E400594EF3BB53F62C0C836FF3C76504E400565D1019A3D62C00DA85DF7585A4E40ACCEF4122E4862C0774367A1A2514E40BC5AF5E2984062C030B4AC13145F4E40DBF73CE35E4162C0C5E39DAD27664E402D7725D7964862C05D9345DA685C4E40FCDF853CBE4962C0BE13FBBFFC624E40551F5E229C4F62C0CBF70071CA564E40B697E3D5F85462C0BBB8736B7E594E405688A24C095662C0FED24E924E5F4E40349C0D7FF04262C0FD1DFD73B66A4E400D1AA16C754762C052AF00C034724E40654D8C5CB04B62C09B3CB5B2F5684E40AE33AE47075462C0B2D567B3DA684E4033A6CEECC95362C09A218A5B1B704E40E426CFED325862C0F0A743DF7E794E400E5A4DF7BA5262C03B8ACD0FEE774E4060EA861E895662C036DEF309C47C4E4088FDB0DF335562C023CE30D58D844E407DDD70D5095262C0E9635FEB44844E40CBFC1CA2A45462C030FBCAA6B6884E4072B6AF04DC4762C08AB12E27E28A4E40F38CC71DB14962C087D7E4B0AD904E407A9CADE9C85262C0DBF53FD7BF904E401D64EBB4DF5E62C0D43B42F648784E40018C627C0D6162C0442E8696F4794E401C457DFD975F62C0F01E41205B804E40AF9059D3316362C0E1B006F562814E40ACC6BED0186562C0E1F604ECFE784E402EB8E5277E6662C062D7C7E6BD814E40A1AC7872C96862C0754F17832D804E4068462AA21E6862C0F69602CD25774E4007963EA7AC6B62C0BB6D14F923714E40794712B0796E62C0DBE4158173734E409C5B2E7D2E6C62C0A6515CA6E77D4E40383F13B99B6E62C0AD893C523E7A4E409036CF3FE16D62C046E6C80776814E40492A42BC7A7162C0FB4FCA9F84744E40720E4C38666F62C09F8BC2086D894E40318390208F7162C0CB945C23B3934E40A39970351B7362C0BDE3E071F4824E40FE9D75296D7562C0A8BAB69059824E40C2A2FDFA8C7362C0C6160900A5804E40AC62B983367362C02865D516A76E4E4047782047667762C01A4D8B9688714E40315A45F5EF7662C0B1818DE375794E40E809187EF37962C0FC39690FCA6F4E40F54BC5470C7862C07BBE3B2B226B4E4062C26539C17B62C044D995E27D6A4E4076BB1895BC8162C090FC99447D794E40ABDE9065727662C0CF3A6254109A4E409E75E294627862C0C0E84B2F219B4E40DB348569487762C0CF7BA31A73A34E401861A619E18162C09E5DE3C44E824E40262F18CADD8462C042D579FE098F4E407FCBE358008D62C0D7B2A64DE5864E40C3BFDC027B8B62C071D27142CB854E408D8A92BF6F8D62C0F5298DBEC17D4E402FB16B7DD28462C0ECC85CC16C884E4052BC5E04E18762C0BAA2BBCAAA794E40EF392EA0A98A62C06D818FE25F7B4E400DC9E40AD78862C0054790A681754E40A3425BCD0E8A62C0037283CF9E6B4E40D3365224A58C62C097146EE3536D4E40BC131092F48A62C04CFB3DB319684E40946C82B5759662C0B3B5F0C602654E40B736E32C638E62C06F867932DB664E40A285C35B439462C0B0E84574F55F4E406630F2F8999462C098C0C412FA5C4E404FACF50E729562C03D10F65C8A554E4071028E2D019562C0F30A46842B564E403B2B7997F58B62C0CC69AD0916634E40CB4A9CC58A8D62C0B0E2A565F44F4E409E86036C6F8762C01A7BDE7829624E4077F97CD0628662C0EFE707C80F504E40AF747856B28A62C00739E3CB53444E400FA023C3AC8F62C0181C807CB2494E40FBBBD8E3FC9462C053006724D73B4E40C09521C8F59562C0220B5B414E394E4042C51C24329562C078A02149863A4E40E4618EF1848E62C09364B65B2E454E408690F8F3F28762C0531E672BD7384E404EC16941918762C027E0CADBDF414E402F6C8C10D88562C0C10854EA47474E40D98FDA96688562C01E663567C73F4E40068DDB17148362C0737B10BEE64C4E40E7005A9A0C7E62C0A57DD354183B4E40AA2EE8C9C48262C0FFDB36B4D8314E40B1532857D38562C0C92DCD34F8344E4086F4406F6E8462C0836F989E382D4E40842B7DA9108862C0354E004B45304E4074FC4837E48662C023567B4A422B4E40EBCA09DF198A62C078AAB27429204E40666613FB848C62C04D1ACEA249244E4056EBB2718A8B62C0DCE646079A1D4E4005F4E713038E62C057821DAB99164E405CA0F11ED28662C072D38F8EA0204E409F62FB4F608862C0B4ED2540AD1C4E40A86419EDD08562C038E52C1720194E4014A689E5A68662C0595D0D8126134E40999AA60D988362C011042E4E1C1D4E40EBF244278D8662C025EE24C175104E408E2529EF7D8A62C04BDCFD363E164E4016670C37338E62C07199026A67034E40DCDFF883D38D62C081241A8FE0F94D40EECFBE9B669162C0C6C5F3F1A7034E406DC1C12D749162C0765EDE3AD7FA4D404B55D6FFB69262C09339AF6CDFF84D40A4CDAED7A99462C0D0E0EEC1D4F54D40A83A4D7253A262C0BF1B67AD05FB4D40729400F6CAA362C0277F8E1702FE4D40303554EF46A162C0EC66FB8126064E4082471F3784A362C0A59FA93E78064E40AA5F1CAAE0A862C07FAA63BDF7EE4D40CA422F8384A962C0EF09E819EB014E4077C1A95169AD62C0FB57DAD7120F4E4051C477C38EAC62C04A26293D9BFF4D400E5B9A792AB462C049BD5BF07DE94D400A2F4C34E5B062C046752B5EA9DB4D40EA5DC5BB3CB462C0C24CF4541CDF4D40C327ACF8C9B462C0D540A98729F34D404091383639B762C00768EC8A32FB4D4079B5F9785AB862C0DD8AFAC3E9EA4D40C3257237B4BB62C0586BA15D3AEC4D405A88C63A8AB862C0E5E3115EC4E34D4051B710FCDCB762C0EA63B1CD3AD44D40525EF47729C162C0802CD045DDE54D40E6088BF75FBD62C077E0424069DB4D4061BE2974AEBE62C073BF4ABB4BD54D40FC583DAFD9C062C0111F2C6A6CD04D40DA46517033C462C0764D1FC4E2D84D405F24D4A5D9C262C01FA9195732CB4D40C55BDD5DF8C562C0E6A196C0B1CB4D405BAB3DD3B1C562C00FE34841D6C34D40FBBCD9ED07CC62C0A48D5D1784BB4D40B21DBDED81C762C0B8096F33D6DB4D40B44365E57ACF62C044499CB904BB4D40DE6955ADC1D162C0F686966AA9C24D40A490E683C1CF62C06C6D03835ECC4D4087A36EAC04D562C05062CE89D3C54D40141AC3A457D262C0A9EE4D6177BE4D402499C05B65D462C0C60807C8C4BA4D40E75C681942D362C0A17B0C1076B74D40BFA275F98CDD62C08E4C0F1A90A84D40174A66B840DC62C044576EDAD8A04D40BA8115F7B3DE62C053736CECD3994D40E4DBE5387DE162C0CC45EE6E00A64D409DBFA41041E862C033671B1F22A84D402C01067FA1E362C023C0D7704C9B4D407898A8A656ED62C09B9A243F05A14D401C4E02D336F762C0F39183A17F944D40EB56331158F862C0AAA0764D499C4D40AFD0224D2BFF62C027FE89A59DA24D40B84EF6FA0EFE62C0610F837DF8AB4D4071844B2911FA62C00A12192D25AD4D40B00DB32FD7FC62C0EFEDD19526B44D4042D5A60BEDF562C0B4019423F8BC4D40DB27432EF1EB62C0BE1AD1ED61B84D404B24F80618EE62C04B49A13342C44D40FDBCEB1584E562C04ED3DCDE6FCC4D40BBE0D8EA37E662C0D991356484D24D40444DEA25D6DF62C03E3DB22768E34D40DCA2E468BFED62C0A508938E66D44D4052D094A324EF62C0C8D1EE4118D14D407216A91427ED62C0903918C71CCD4D408D797FB2E1FB62C09F461F7623DF4D40F341B00713F762C005F4D702BB024E40D6E320B5E4ED62C0B7D506A4601A4E4001A77EE19AEC62C0E0B09E360A2E4E40B51231A3CBE962C000044EA346314E404EED4E82E1E862C05116C67FF0444E4026A4CF1A28ED62C0DB32F3E30B5D4E40AE85E5CBBBE162C0357E2A4EC3644E40067D4DB21DCE62C0F1CC41BFCD834E40587F5923C9C162C047283E74D6734E40C49033A328BA62C0784B5BF2A77C4E40CA9A5B0D00A162C09735653B766C4E40262B54ADF7A062C00C0191DB706C4E40073F949140A562C0E8E013B5D9784E40E21DBC5450AB62C06E53A931B8764E40AC886DE21FC262C0790CEF68B2934E40AE1A99760BB662C0A3D856276BB24E4065614F81D4A762C05B9EAD7FFFBE4E4060495861D2A762C03905DF5F01BF4E400517C4BE58B662C0FDB61AB85FBC4E40814F9AEB3ABC62C044BD1778E3B04E402E886EFBEFBF62C0A0C37349AF9E4E40E7330EFF08D062C02B2899F348A04E407F8F754254D262C03BB0754BA6AE4E404B277540E1D262C0DE325E8056A44E4060884F417DDE62C06D506B86AA9A4E40C9049A0219DF62C00EDB6940E3984E40C12AD41773E562C09EEC9BED53864E404E8B245DD9F762C0B0D1E9CB39754E403F9400ADD2F962C08F83C01FAA6A4E409D4925AECAF662C08862CA2E835C4E405549AD02D5FB62C0552AE8705A604E4029AAA4B8F20163C00628C3F9CA554E401C19C6BE5F0A63C0BE23802CC83F4E4081FD29F7AA0A63C05B1D3B1709374E40509CFFEBD40763C03F12609E57324E4009EB0C63950D63C0B2E43FE64A254E40E7B98741F41363C036DB9FD1141C4E403AD6D301701C63C0512A9051FE1F4E40DEC62992431D63C02B0F17485A274E400A4131C55E2363C06A3B0E16F8244E40F2C41ACC141E63C0B62D60B954244E4082D21F9A901D63C094572A59DE1D4E40FA5C5BC9A01263C0F8D6F20F600A4E407F5AF245B31663C0762BC039F7F54D40DF5E61530C2763C0DA47209C07EF4D40B8061FA2C52863C0222D75A7A7EA4D4047C98A29542063C0F5CDC32729EA4D403098A9637E2163C02F6458F268DA4D402FB061EA4D2763C04C44300256D24D4089885BD3AD2D63C0303C42AC4BD34D409EF88B486A2A63C013D513F82EDC4D40ACA7EDDE6E2E63C09D5A370EEEE44D4015437E7CB22F63C0806BC1394DD24D406F2B4CF3DB3163C0E5C8649761D04D4092B9A4B1FE3263C004C5A73ABCD84D4038479108A63663C041010561E9D04D4067812EDC163263C015EC66FEBFCD4D4029BFAB3EEA3263C075A4EF5819C74D409151D4080F3C63C09A4B91AFB5C54D40E5FB54858C3863C05726589A8BC24D400A5B1CAEFA3763C06BEDFB45B3B74D40FAEF43FBA04463C0B49B5E523BB04D40B87D4B6E633E63C004A89C03DAAD4D40B708166EA64363C004C19D42CFA64D407309BE9C1C4463C09740D2E2D4994D400B4C99136A4863C0B26D2DC11D924D40276DBC4C8D4563C083D5404A978F4D40BCB6DA2E094563C00D925D06F8824D4041656D7B5D4163C00B5B0EA9148A4D40834DBE688E3663C0A3C42846C4884D407E8F858CBA2D63C033CE1B7FAC7D4D40321A783C5D2963C0048C654D69704D40C458A7F6952B63C0A675ED860F6F4D4047550C7D5E2863C014D4C1CBB56D4D400E4B2DFCC02863C073C8FACA7F6D4D4052E043B5AC2B63C0E17E8583E56B4D40DA3D3234652E63C083041CE85C5B4D4097559DB78A3363C022C5C98628514D404E7121EFBD3C63C0B13350A1864E4D40D2D14DEB213F63C0BE8F0556A5434D40A4075B73D33D63C0CA380E9A96404D40087599545F4363C046BB79C8993D4D404BD98DAE154063C0656731864D304D408D65AC9F684B63C0FBA6AC48BF244D4044D3954AA84363C0282D03EAED234D4058C3B77CDA4763C06466168FA8204D409BDD41C5FB4463C0A5658A4F7F1C4D40AF75ED8AAE4663C098BBAF3544184D409CD87FEAB84963C0DA400DA61F184D407E52921D3E4763C0E3189799CB114D40748421EDD74A63C0C8304D4FDB134D40F3E2CDC7BC4A63C022787271CB094D4077AE557DCA4F63C07FDC972703194D40EB0672B8DE4E63C03C4FF8BBAD0B4D4038984D2E495363C0F53CE3CDD60F4D40472B4E185E5163C073B8147B16084D404CBB82AD7A5263C0AC10D232C1024D406F560C846B5563C03E643CC1CC084D4068C20D071E5963C08A2098F231004D4052894512296163C096EA44226F024D40A013E90CE86363C07C36B79294F94C402A7CD1F5A26263C08F00528FDEF04C40E7ECFF3E8E6A63C0E1FEDC33E5EA4C40BF66C8D0056A63C00EF5A0DDEADD4C4008D9CCA35F7363C0970466E122E54C409BC9A7AA677463C052A0BF4F08DC4C4033C10929E07263C0B970B0C08FD54C40647F8C2EB57863C075A1746E4AD24C401EC57DEEA37763C0E577FB9433C64C402E48E114298163C0D0083E9C54C94C40401D570D8C8063C0B17801DE91C34C40DD46D74D5D8363C0ACEF791349C34C403FFD5804008163C0444E8FD327B84C40B9360348878663C0844E56C306BD4C4086BF2077889163C05F00AF3C55A84C407430A770EC9163C02C3C7DB7A4A24C40D70D832EC98A63C044EA08DE50A44C405C72F8A7598E63C07C34B0C5B49C4C40F6DFD1A23A8C63C023BAEC2DFD984C40AA9450210B8B63C043F89252E9964C407699001CDA8B63C083F1F34A13924C4088F53158368F63C0D28C0879718F4C4029ECC30C4C9063C0EFF5C9EF29864C40D0C25190BB9463C0F9D10758B2864C4070A5B2069F9163C0042ABB63067D4C405B468554049963C012833780AA854C4036C1BE041A9A63C0F9C4A628D2724C40F1463B57A29E63C001DCF19C337D4C407D871E4E479E63C0BE90699622744C405026238CDDA263C0534E2FAF53694C40980E1E5215A663C06B3DD756746C4C40E4F8F9CDC4A463C087D4F7DEB8684C409A9EBA88FFA663C06E2FCCFEA3624C40CDA9C99A79AE63C08FA50C9AA16C4C40F2BE560EC0AC63C075A8FECFDB614C401110AD4F46B363C0CA546D68EB5B4C40585E5C866AAF63C0580CFE7C97554C40F72E190176AF63C0CD15A2B9BA4E4C401144B64EFCB563C0ACCEDE04E04D4C40A02480E041B963C0062B936BBA564C40754A450B98C363C054371FB09C484C400685B20503C463C0FF4576EB34434C40D529B6D23ABB63C0FC0E559839474C40DB8C2A8520BC63C0B499B994BD3B4C407DF9310465C463C064B5DD2889414C405C1B7C7E92C463C089DCE869B53A4C40082A877F9ACD63C0FBBC4B7FB7384C40C4702D65DDD463C02579B891BF214C403C84432A46D163C05DCEF5238B1F4C4004DAF16DFED163C0CFF14BA296254C40A00896B4B6CE63C0A1397CB68F2B4C409A7A1829B2C663C02D4FF8E32A244C40B4906C65DBCC63C09A20EA7EDF1D4C40F0217559DDCA63C030B8660B0D164C40D1D05723ECC363C0DFA36977CD1D4C405D14B31281CB63C0F2B1AA48E60F4C4092458ADF33CD63C0AE23B0BC03164C404E67D45961CD63C07D99A73AEF074C409D66EA2F1CD063C0CC2A4BE3050C4C409983AD2225CE63C0A45FEFF114FF4B40D566209F30D263C0A9E48BD7F4024C40456CFCB259D063C0F2E5E45F42074C40ACC15C131DD363C06094C19485044C40EC10631358D363C045F48594F30B4C40CD87F7A83ACF63C0E8FB392E8B174C40A3B2CB1B2ED463C0657ED1D27F194C40A857A3201CD263C05EDC965C85144C407A5FEA4B0DD563C025060B8DF10D4C4031B6F64D59D663C0F3C414887E124C40C19DB38631D563C00C740E4CA6074C4083567DBD9ED763C0288FD1C0A0044C40AF0D9A43CBD463C0555FDACD47024C40AEA47D3D81D563C0F094A08623FA4B40533AAD266ADB63C091EE01FA48014C407CF17760BEDD63C0D2FEC875F2F44B404F5AC13293EB63C063E54A93EEEF4B4052225714A6ED63C08B99500E8EE44B406A12E026FDEE63C0842D90CBB4F24B40BC285DCB75F163C007CC4CC0ADF04B402133230C2FF063C0435ED9FA1AE14B400F289FF30FF263C0E28D9DEB72D54B4045F5C7C105F463C044CCB61E48C94B407E9AC93141F863C0C8BEC6CD03CD4B4006C43648BFF363C07B26C7E52CD14B406FCFFD00B5F663C058583B9F96D44B4097B66BCA47F463C074ABF0F2DAD84B40D9EBB487D1F563C005BFAEBB5DDE4B406C78C1C9F7F363C09D9E0FDB12E84B402C731D2BFBFA63C0676B6397D6EC4B409E144073B3FB63C0660109CD32E44B401536FCCD530164C0C646F22DC4E44B40768DA90E250264C05B19E35211D94B4035291490FF0464C02FD499087ADD4B40C7CC899FCD0464C0F6A98C743BD44B40BDA9C311F30D64C02ECEE39E98D24B40B5F48BD6C00B64C09B2C479F03CD4B40E0D78146501064C068AEB99015BD4B4020CCCE0C041364C0FD148CCAC2CD4B40EFE5CB85621864C0BF3DC92C95C54B40A4E0BE06141564C0723F95FF51C04B40AAB17CC68E1564C06072C4BE05BB4B408369C438FE1964C07244D6F1B4B94B400DE11FAED81C64C0395623B24FC24B40C22D7101DC2764C0C56FB9778CAC4B40887337BA293064C0E838AA4BE6AD4B409B8A2D039A2F64C01818E41F79BD4B403C1DEC49072C64C08CDB2C0735C94B40AF220DF57F2464C090E07CC41FC44B40F44AB795103264C03F744E279BCF4B40DE28D950D43664C08B824F39B4C14B40BBB76206703664C0FFADC32DCDB34B40FB7BDE730F3D64C03DBF1F20D79A4B402E4C9E906A4164C065BCC8E5AE9D4B40B73A996C083F64C0DB43F0FAEF8C4B4071588D98DF4264C0AE2F0722FC894B4014C38FC0824464C0E554B8AC648E4B402226B6B5434364C077017A1226954B4088ACADE7334764C056AB37031C8E4B40719121B43C4764C0A015873D0D834B4050E7D374034E64C01F18FFBB4E844B40D0910CECDA5064C0CDD218FFAE8D4B40135107F4A04B64C02361FC440B8D4B40CFC6E901365364C01F42AD8669A24B409464A5440E5264C083AB514E6FA54B40DEFBE586BD5464C07DAA7400AFA54B4015DAC43E285764C02500F1EBF99B4B40FF81C3746C5364C0739B70F9AF944B40CE8994ADCF5464C0AC4816E27D884B4031A4015D105264C080949F98297A4B407BCB96ACF15464C0D7B8289E5B864B40A1AF87E7995764C0E9358DB63C794B4020DEA423275C64C08D1385CA2C774B409243F52B415F64C0F91F8C0B3F7F4B40D4643EAD6C5D64C093E9311A60824B40CEC9137EF76564C000759A55C5914B408BAC1EBCB76764C092ADEDC9668C4B4022AA9DB3BF6664C069DF5681E0814B40251897AA7C6164C0E27D3AD1E2774B40F2280C8A976B64C0D6C9026FD0674B40B4FF570C696C64C0A3BE7CE5896D4B408DD00CD6DA6864C03FF30FA1B8744B40C6608C98556B64C01E798EF389754B40354AF562CF6A64C0E6F159BA9F7A4B40C1E913A4B06764C0332B3F55727A4B40432D98F4666A64C024C535C6758F4B40BCF6CE879B6064C0DB69A2BB239F4B40B82AF8FE666264C076CE00E81B964B4019EEA6FD2D5C64C0E01E3688BE974B4083DCE181B65A64C0B5585F97F89C4B405C3EFAC78D5C64C0E8368311F3A14B40B25D3F8FAE4F64C073260B20D1AF4B40219CEC571E5064C0F7AA51E8CFB84B40E729BE98955364C034E8E4929BB64B4031D13385163964C01AF396530FF24B405C9973C75B2664C0A5DDA900BF004C4050401DC3D72B64C04E3463A1ABF94B4008C22DBFE02764C074D0153688F84B406199F7FE0B1C64C019DC5A34AFFE4B40C4A305F89E1B64C0B21F28F249F74B404AEAA475E42064C055792399AAF24B40266E33B2C51D64C0173734E508F04B407DFD7D29571E64C0CCEDC5E159E94B401DD566568A1964C05318C92FE1DA4B40CE6405D92A1564C0591D80038CDD4B40B981CC5F571864C06638B0754EE34B400991F4EF431964C0D406697888F04B40D6A7BBE8191064C0F52CC3E1E5EE4B40C9279D1EEB0E64C0D401B5237AE54B406AECD84F0E0864C09D378D8186E24B40FF7016DB220A64C0D407C1BA23E94B40C86A5818B30764C0DCCAF54932EC4B4064A617B1491264C0CF3B281CE6F64B40FA3F3551D30B64C0B0E06A5674224C401FB4CC61DBFA63C0F28527AD1F454C40E408B869C2E663C0B9276816C0584C40B211222B85E863C067B02D8E36594C408886CE6D9AE763C0E214D194165D4C40509628FDA5DB63C0AA2461DB3E724C407B132472E2E063C0A61F9EBBA8654C40747EF37657DE63C092058A8A866B4C405C22CF8E8CD963C03A62953F86664C40221D796590D463C0F9F9917652614C40A211CC4377D663C02DE551C0FB7C4C40A158DFCCD4D463C05FF5FAD0B9864C40DC72762732C963C08195EE2C65A94C4012423EA3D3C163C0714629D971AE4C4057BDC1AD15BE63C0A389D903DFBE4C407649AA64C8B563C066EB6A3F8BC84C40551D381919B563C0354B14AAAABC4C40C1BEC64E9EAC63C0A6EBB49E43BF4C40553BF914C5AC63C0D09B7F6C95C74C40BE5DC19470AE63C0FC48A11DB3C54C40F6E33E0F84AD63C030A3C4D70CBF4C401CF93FD606B363C0293F993684BE4C40ECCEEAA146B363C007B0481B83CF4C40A5C4582FAEB663C0A59AF70D40D24C40CEA5A04896B363C0FB3E0673630B4D4041F8CAD0A9AC63C03FCA8A915B1A4D40DCE68BCE80A463C04DC79D6EB4144D402A1AF694C9AA63C01D432998841E4D400FB903CEF4AE63C0DD81C78A111B4D405D6D7DDE25B263C0359C3538C4264D40198ED032A4B163C0C479543137324D40AEDCD1267FA863C05E62963E354E4D40B605ACC744A763C02174D3A7F7514D40D918E04A189E63C08A65DD9B175E4D40CED975905CA263C0182DC90EB8614D40FAF8AC3C589E63C051DA204D11734D40153F8105709B63C06670ACFF9F7F4D40A0E692B6009963C04EC89FD248934D40F18F4CB2BF9B63C0002FD5452B8D4D4030538BE7559C63C06796CC7D1D814D4009AE909DA6A363C0E4126597D56F4D400D7687DDFAA463C0A7E47391866E4D4023F610EF6EC663C0D76883A3974D4D40653C1FBBBECA63C06A1B9D9F4F544D404C4F53C7C8CB63C077B97371A75F4D406193F01224D263C07887CC1CE7674D4051AA6DA1E6CF63C0049D657F65794D407CAD8FA182CD63C057170FCE4F7C4D40122FA067D4CF63C01BF0BF08D57F4D40A726161DD2C563C0A8606FF11C814D40E3F50745D3C063C0C33C58EC5E6F4D404AC6CE87D6BF63C0BE401C76BE734D400E5EF51D36C463C087FFCEF987834D4038F93CED9DCD63C061A88DDEC0894D40ABCE1DBB40D163C0CB0B76DF56964D404254B42B56CE63C0DFA86158E8864D40CC3893E354D763C072ECC993B96F4D403094EF304ED963C091CA6A20FF7A4D404B798672E4D763C0EF3464AB037F4D408016ACB36ADA63C07BDE125F347C4D400951CC6A78D863C040F06A196A754D40D5C2FC1503D963C06CDE7AB79A624D40CBCA6A565FDC63C0C006A1E3CD5D4D40F7C76D5ABBD963C068EBB33921654D4015DABDA020DB63C0B2E39EFA4A684D40ECD07FDD42DD63C03B190AE951624D40BB3102389AD663C07DA2AF12E83E4D40512F983AE5DA63C083BB8DBF6B334D4005D9FF03E2E163C0A0B4E12D4D364D400E9E802FD2ED63C097C831B318644D400FA65F78E3F463C0928BF369F56A4D40239452F523F463C0DEF72840D2794D40CDD81F82AAF863C0FB09D86D82774D40E5C726BE7AF863C0C073871F3C6D4D403DDDC1B97BFD63C0484AF8499A624D4018F710C6930064C0EDB9418E40714D408E2449CD0F0864C061A243FD87724D40DB208A944F0A64C0DF83F94192794D405315B7542B0864C0A75092CC9F7D4D40CA461E1D860A64C0D19556958B874D403B7D341BBE1A64C0FB4463E7036B4D40480F1FA0C31C64C0977D984940714D4017EA6F63972964C0524AD81F94674D40DDDDF97F802864C0A9AC1A3D27634D407DBF255EAE2A64C05BC9E212DB5D4D40010300000001000000090000002D5257680B8965C0CA06930FA0264E4082664BCC419365C045216FF877294E40EAE4C208A2A165C05A4F32A1273F4E40C3EE74CD7FA165C0FDA8D0E9BC444E4076A0E3496B9D65C04D2417552A4D4E4059149E751B9B65C0DFCBC692F23D4E402D6B327E7E8C65C05AFCCD7E49324E4005540922C78665C07C6FA46679284E402D5257680B8965C0CA06930FA0264E4001030000000100000013000000462B38EA90C364C05BC11B8569344E4086A0F4A220C264C0E9061A8CEC294E40210FB0E6E0B564C0AAD56C349F254E40C6B06A5873B764C056E567B11F154E40222973109AB564C044FF5B3A600C4E40C1E1FA8C4AB764C0A833ABF364084E40E3E216035FB164C0457A16CC43FD4D40F4E7C7BAA9B364C06D21E27A61F34D409CB51FF191C864C0D314FD03EAEB4D4092ACE230CEC364C0EF88BDCFC0E74D40FBCA6D2B5AC364C0742F6752EDE04D40EFC4453020E464C04D7891E989FF4D40179698F92DEA64C04EA2759211094E400228981280EE64C0F310D273741A4E402BC8070AEDDA64C011E78A85191A4E40341BE611EED964C04443D344C5234E40BAEBB0A0F0CF64C0CD6E0CA164304E404E5101DFC1CC64C023B580EB852B4E40462B38EA90C364C05BC11B8569344E4001030000000100000012000000EF58BEECB28564C0DA10D4FB374D4B40B6D6C7976D8C64C0BEB102278F384B403E990F61B69464C0E76F943EE9314B4075FF39AE5E9B64C082FF3F9E51364B407EDA773C849E64C0AFE320310C4B4B40BD4A73B1989664C010FDEE656E554B40E1F96C34AE8F64C0CE03C3512F754B401483CB02168764C066BA8DDC7C714B4090F94F0B698464C0A5B32697837B4B40D54A51DFA87864C087752E9211874B408315331D067164C09CA7CD6BD3854B401E824B48956B64C0124EEE7043634B409B304660B46464C087EC6597F2614B40D0A8338A9E6164C0B762A0C16E554B40D2B6DF06DE6B64C03EAC187174604B40FCDAD640076E64C0A39AD7F026544B407B9CBA3F437364C0E9AB6A5B124E4B40EF58BEECB28564C0DA10D4FB374D4B4001030000000100000032000000AAAA11A3A5D464C0AB4D0935E9C24A40829F0620C3D664C0B381D0F1EEC54A40912968DD5DD564C0E0E8BBE993BD4A40FD5B195C50D964C0A8368CED07C84A40ADBD2E9326D864C0A4C4C0D306B94A4089B3E71166DC64C0A3318CF801BD4A40F883081798E464C07B56335938B54A400C985D3706F064C08C26747FBCA04A409A6E57A257F564C0868AA651489E4A40A5053BD307FB64C0DD35DAF3D0A64A40A1AC2EB62FF664C0129F4D5521B14A40B8E022FD86EF64C0AFD52AB290AF4A400DDD9A4150EF64C093EC8329A3B74A4073580F2E6FEA64C0BF7330D8CBB34A4057FC352BC2E964C0D78FC4D814BC4A405F631E1A35E564C04F74D7B08CBB4A4096A5671EE4E564C09190F54D69C24A404CFB6113DADE64C07141BFB53AC34A407DFDB5252EE564C0CB5D5EACD5CB4A4008D61352EFDF64C0E5016BCCADCE4A40BD66C8E018E264C09A1516961DD54A4082240F6005E164C0D97F31EBBCD94A400D073ADFE0DC64C0891BE34585DA4A405C946C5EB4D964C06EE05AC7F5CF4A40D12F71607ADA64C050B0074E8FD94A4056FC8C24AAD664C0C5217392BADB4A40B6FEEC6505E164C099C005421AE04A4094AB6C4235E564C06E72CDF526ED4A403927618514D864C083D06FF50F014B40115602C4F9D264C0A2A487C38CFB4A40CEEF7EF975D464C00EEAA85C81F54A40B8F3F07140D364C0B6D3D994EAE94A401F47474AA8CE64C0B07C120134F14A40D36B7F3604CC64C086A2A5042C004B40A43C3483DDCB64C0EB8169EBD8F84A4016ACFF6E86C864C003651EAA94FC4A406F11916986C864C07C9A72D439F44A4035A6F936F1C664C08E898411B7F64A40AC6ED57440D164C0DE13E48015E44A4059ED40B9AFCF64C05E4BE7CEC4E24A404F38FCAC53D264C00C60F255CEDA4A407A1BD5B28BCF64C0C79718A82CD84A40A61C9C8159CD64C077E66967B5E04A40B16CD481F6CB64C0726CDD3572DB4A4015905ACEACCA64C0338E702496E34A4062DDC087EEC864C026DB5782C0D64A4056B7276E49D164C0C65BCA9F3ED04A40198B0266F7D264C002A8C3C267C44A407BF512674ED564C0D94C80FED5CB4A40AAAA11A3A5D464C0AB4D0935E9C24A4001030000000100000004000000D0311A5415C764C06BB48A5018DA4A40E853039572C964C085F144E066E54A4023B60F43F1C264C04D225AA856EB4A40D0311A5415C764C06BB48A5018DA4A400103000000010000000E000000B5E0C61883F964C04B956CD150BF4A404BCBFC1B3AFB64C08A1ADD34A1B04A4070875375330965C0D053489B1A9E4A409B30042E1D0F65C0ED4AA6B7E2854A405BC778A8812365C013598242B8684A40228761733C1C65C04062B93AFA774A40BC237526A71865C0C3224FF68C884A4086C3407F781965C000A0CD59C1924A4087544628F31365C0D7E8EEC4B9A24A408E5A68858C0B65C07784895B20A14A407A4A0AD8C70D65C0BA95369383AA4A406DBF7A78530B65C0426C0F49C1BC4A40ECFFEAA13D0065C01EAE5EF206C84A40B5E0C61883F964C04B956CD150BF4A4001030000000100000015000000B00EAC9C29C565C0BE8F969C6B354A403A9AE408BDBF65C0DF2C7BE4F9284A400F76653818C265C0F9ACC782751C4A4051B1ABFD49C665C01F841A26631C4A40635348283BC365C0628D01A1220D4A404173994AE6CD65C0764FF97A8F0D4A4036E8650511CC65C0DC4C63CB620C4A40ACD74F3E50CD65C0839D09A4A2044A408DBC83CEC0D065C0F56026156D0B4A403B5FD5C29ACF65C006C3C08750044A40659D779B87D665C0F4E79A0D57064A40DBF218D71BD765C0F1F61D311E004A40C030AA1AD3EA65C0136976C5A4014A400B7A1C7BC7E065C08189C12BA4024A40D3DECE3B05DD65C0A83983B6200E4A40148189558CD265C09DA801C8BD0C4A40897A3BD3FACF65C07BFD4DB3D3114A407C7C1D5CA4D165C099E02F327C164A4048AAC00182C765C0D636A8E5F21E4A409DB3C3615ACE65C0E900B644E8274A40B00EAC9C29C565C0BE8F969C6B354A400103000000010000001100000032B5805C1D1E66C0D89D59D0A0CA494025B6B7EE301F66C078DB149A03D4494017FD913C2D1A66C08FA1DD3461E24940B07D664A0C1D66C065D5CCA209E74940436221F58E1666C0B86887E616E4494005FBC846031966C05F4879D362E94940FD4516467F1666C02B7AEB7AFAEC4940B1FA6F0FC61866C0DFD75B2DD1F84940AAE44C21DE1166C00EA77F71B9FD4940E3CDD7088E1166C088B2113B4DF44940EA1A9780A11466C0E00753148CED4940660B602AB90D66C0585CB867E1EA4940472C5291D40D66C0F28737524CDD494062B5FBD94A1066C0C34CD6B83FE049408F6A3E119E1966C025722F4B27CD4940F4BA7E2F861A66C0DD2806A03BDB494032B5805C1D1E66C0D89D59D0A0CA494001030000000100000009000000500C904C213D66C0AE97B1B194CB49402B3742C44E4366C0B1218CABE5D44940CA2F5139A63E66C058632ADFB2E14940CE40D790F64666C099C8D63707F04940088F928F5B3E66C064B5AA2378F54940F3A3D86AC63A66C040DB5CDC56EA49401F89F052E73366C0D67743F3E6EC49404216729E973966C0E61E841ACBE44940500C904C213D66C0AE97B1B194CB49400103000000010000001D0000004D426542C86265C05260FE0E47B74F40A21521DC736E65C0F47B1F1C21A84F4002CD02467C7765C0A3E8D51C4FAF4F401A8AF1E8507B65C0C1D46456FBC04F4026C98035C77765C0C5197E0E52D54F404B7F6CC8A77765C0DFFBE224F7E44F40A7658582CE7565C062CA2F7464E54F40AC4FF56D647465C05307EEADC4D84F409902EC8AFA6C65C007F06F2031D24F408170AFD75F7065C0E8FC6A0571D24F40BB1FE116837165C0049F13B790CE4F40FEA4998DB96F65C006944F0241CC4F40428A46C07F6A65C06A2DC9F204D14F4025C2FB035A5D65C0A146A95205C94F405DCBC6F4F05465C0ADFE6AE8A3D64F40417CB90AB04965C0E3134F04BDD84F4087B5359B334265C00E237CEE1DCC4F409A894CCC194165C0319B992D94C44F40FE6B1B8AC04265C0348FD59812BE4F407061E4F0BC2565C00005E69125A64F4091E25F342C1665C08A658B36AEA64F40A6F23A6C481B65C0ACBC39C5C3934F40D8530D6F7E2A65C0E4931BA251974F409547FC30003565C0DF3E1036BD784F4009B283A5DA3965C0300C86A8EB8F4F4071D51CE05D3F65C0501C68A02C924F40EE3E5F3BAD4765C0364F2A930BA44F40E2FAA46A805B65C0CAC2510F03BB4F404D426542C86265C05260FE0E47B74F4001030000000100000007000000894989CE2A4362C08E987D5234324E40D4BDAD0E565362C0FB5F7653661E4E40791E34BCBE5562C0468A2380C3244E404DC69EE59E4F62C0C7CE3EDCF72E4E4070D077013D5762C014816428E42F4E40B642A1E2A65262C0214FCB54B03D4E40894989CE2A4362C08E987D5234324E40010300000001000000100000004236401C135E62C0A504FBD895244E408E53B825B56762C07093881574104E4083D3794FC36B62C05866C31755034E4076169E17546B62C0DFBCC55BC1FC4D409E4B49BF6F6F62C0AD030DD60EF94D40CE2FA484196F62C0F0BA4E701AEF4D40152491BA317D62C0A1667E9024E54D406FF6F178C77762C09779FBED55F24D4058EB81E0B07962C0B0888C6FDAF54D406BF32BB26C7562C0682FF93B1DFC4D40248EA1A75D7662C04E820C44C6FF4D4008AE006D3D6662C0A5BB79125A1F4E400A85F2E6416662C0A455C6B0252D4E406CCAA0065A6062C07F18D574C42B4E409554AA1F366362C075F4B8DE97224E404236401C135E62C0A504FBD895244E400103000000010000001F000000A42603A7FB0263C00F6A3923062E4D4088BCC37BBE0463C0E53183B0AA1D4D4059016968E8FF62C0ADECB52E632C4D4045497420DEFE62C06A7047C0E3234D406D568538A30263C03E0BB375EC134D40F84045CC330663C0C8A6B35A3C164D40826A12CDFA0763C0680449D425224D40A902AADD4C0A63C0FAAA0F02BC1E4D4056D53B5DA40963C0652B7729E8174D4022537626D40B63C0AC01B3A61D194D403585E1DED90863C067DA1B0A43104D4095805D55701163C0E5C78544D20A4D40B75CCBCDF81163C04F6B2FBD801A4D400F3F26271D1463C0C971E720F8094D40FC637476CA1863C04EFDC6FD26094D402B49ECC0401963C0AFD55E43F2FE4C40EE41D28D792763C09E2A910A90154D40B46D3CBBDD2563C01D6A0B8FA41B4D4044E1C07C051D63C03295423C10154D4033BAD5EF742363C02A92CF4DC2214D402E25A4AF7A2063C0938FDD89C5264D40928BACEA631863C044CE64B8F0204D40B5AD04E77C1863C09DAE6F0C342E4D4049D102685F1C63C086029CED11344D4053735054361663C0821BC858FD354D404910C18B201563C0ADC32674FE3C4D4038A9AEAEF80F63C0D2B0EB06253B4D4026B224F7E91063C091017CE3D9344D40958439ABD70C63C0CBB1DC9155284D404CF43A59300B63C0905D708BD8354D40A42603A7FB0263C00F6A3923062E4D400103000000010000003600000067A2C874A4BE60C0E4426B2064A64C40608DEC7CA5C560C0954F941B2AB14C40B25F59B6AFC260C06E113B5D86A04C400E160B7E95CB60C0769E9D6D3B8A4C404C308AD1A7D360C0FD4680322A814C40C44C169394D260C0882F3BBD0C934C40DB98F29959D460C0D6350E44959B4C40B982F55170D060C07971E742F99B4C404DBCD859ABD260C0ABD754889FA24C405BCDF11289CE60C04BC998C6F4A74C40297469E1D7D160C0A099821217B24C401529DD88F8CA60C0E8045AB7FBA94C405F618A88CEC960C0F2E041F2BBB14C406D39721A0DCF60C0E9CD82CF56B24C40B6FFC96A60D260C0DDDB7D12A4BE4C40699D489673CB60C043E32700E5C54C40FAB7222C67D260C0856A8312B4C04C403AF419F933D560C097B4228BB7CD4C402F98ADE1C5D960C0086188F09B054D40C81B671F5DD760C0A047F5862C174D40CBDD03644DD960C0ABB3FF345C0D4D4040F654F441DD60C08DEDB6333B1A4D4056056D7437DC60C08B37F57C86204D402C98FF7A4EDE60C04609DA7D0B244D4020D504BFABDE60C0566BF5D326344D40DE45AA2CC8D960C066E1F01661294D40FC5AE8D900D660C0FB00A388CA144D40706D452178C560C0E29DC4B166144D405C2D00DDBEC560C00512C39CA80A4D4098C30F3799BC60C0C835FF3500E64C400120AFE514BC60C02E2E013112D64C400CFDA9645AB960C0ED3FD2AA81CC4C409561B3AEC8BE60C095D5827090D74C40819CA75C7AC760C0428ECC885E034D4017765D540DC560C07A6F3ECB3EFF4C40B38BE9A9F7C960C01F6AD68DB90B4D405034941F6EC860C012602D4695034D40437E29E64BCA60C0450705419E034D4078AE581836C760C0D84C9281C1FC4C40F2BC7A233ECA60C0A448D97B76FE4C403AF73DD933C960C01FBCAA38D7E94C4017F04E54A3C760C0E15326F9E4ED4C404A12777673C160C0E62E063075D74C40B94DF5F66FC260C009DF802D8DD24C40672F506507BE60C058A64B3075CF4C40A6BAAEACF1BA60C0C9281D23E8BA4C40F8106D379BC260C0E1B6995E22C04C4093302FF565C160C0B5CF8E5DCABC4C40240187B833C360C07A0DD15B55BB4C40010E427221BF60C051FBCEDECEB84C40D3090F74E7BF60C0457ED29C2FB44C402223DDEF46BC60C028D84F6525B54C40A6E04271AEBB60C0E7B662E640AD4C4067A2C874A4BE60C0E4426B2064A64C40010300000001000000050000007B4F1E4E90D060C02EAA6A4D3A2B4D40AC49F02D5EC860C03F7444B3EA184D403463579583D360C0BE83885D641E4D40EBF0DE5EEAD560C02B5C0C66BF264D407B4F1E4E90D060C02EAA6A4D3A2B4D40010300000001000000390000004F9F91C668FC60C061FDE3606CFE4C40F5794A9493EB60C0E3F006FAFFE54C40C61D7C0F2CEA60C0DFB51C8098E04C4072D813977AEB60C0B8507C732FDC4C4097168D8958DD60C085FAE2EC61E04C40556CD2B607DA60C000ABAFB892BD4C40DD1A9CBDAEDF60C0875B8B57A0B94C406DF59797CAF960C03760C01DA9E14C40A2B8DF448EF660C06B1515753FD64C4000B9E412C6F960C04E802099D6D14C40A20CB5B350F260C013D28DC34BCB4C400526FF3812F560C0F9574A3588C64C40B379702ED8F160C09ABCC4C2EEC44C40EA6FC7648FF160C0C2B98F46C3BA4C4025E47B2713F660C081C256A763AE4C409CB7C7EBEFFA60C0A91E89ECA8B14C40FA34E247650061C0BF87D9267BC14C40BCB468F9FFF860C05EC3344BBDB74C4080FC86222A0261C044AF3EE437CC4C4002ABB3DF82FE60C0D1B3C1D6D9CE4C409667C76BDA0361C0D1180C97F4CE4C40F7DB52B5E40261C068E228D158D74C4055A059FD580761C0DDDC093753E44C409A541756520D61C01AB68DA104E94C40DF2311361B0D61C001E9833DAFEA4C4048A6FFC8800A61C038E6ECF0CFFE4C401428F7FA0F0161C05FF1D609E5EB4C404665E33A0F0161C07F2C00CAE3EB4C400528EDBA0B0161C0E43092AADCEB4C403614E6FA0E0161C0AE51FF29E5EB4C401C6370DEE30D61C0F556D0C6BE0D4D40E3E1166AB70861C0182406005B0D4D40234414126B0B61C0285B58E42F1B4D4046C9507EE00861C07EA4B951F81B4D40BA72C467450661C0FF415B4F4C0A4D40885E7EA74F0361C0D282E09D46074D409C2139EBD30561C0CF66D664B5164D401AE0E82E8D0361C0D233A7A5011C4D40C53129E0F6FE60C099AB90036F144D40852EC7A27FF960C0DB4CE19179234D40AD08F74C7FEF60C0A52D04DCDD134D40E2F647D361F360C0413C55B292054D40A183F55D09F960C05FB7044ADB054D40AC6E4214F8F360C08379432733014D40EB76931C6BF960C0743AED6EA4FD4C40B85BF57FC9F460C0186BC718EAF84C406CF4A4C9D4EC60C078D9A4E1CD114D401D21AD682EDE60C030A5C6E28A044D409C30595B0BDD60C0397138A8E3F64C40EC681BD818DF60C01CEC1A6945F14C40BC5A1D9268DD60C0A5D60EAC70EB4C408C19FFA59BE660C083D8C8538FF84C409B12268FD3DD60C02FF607AB3EE74C40F2ACA60D65E060C0057525A367E34C409C6A500E8FE760C01B46448CCBE34C40E5DEBE6675FC60C01764BDBF7EFE4C404F9F91C668FC60C061FDE3606CFE4C40010300000001000000630000001A3057F9912C63C020BF904833944C40AA9ABF7BD82E63C04D256B01288E4C40F5E5A410813163C01170AE49D6954C40C2496081123063C0BAECFC7513884C40B5C19EB2493863C0C52F7416CD854C400E7208DA353363C07A73CFC30C864C40723A7E7B8C3563C02C2C99B824814C40487E3A93C73163C065C8EBE51F7D4C403C7DE61F933363C0BA1E5BA978774C40D3272B3CDC3563C050D0A76CF37B4C40B0CCE10DDB3863C00FBC3988DA714C409EDFC030493663C06F3C2ED7D46E4C40226ABD9D6C3F63C0DAA1D864705E4C40221CDE0ADB4463C09EF68C32665F4C4006601039D23863C0052AE64DA77E4C403F08A2B4E63E63C000DB5D2E797E4C40E8BAB0AEAE3763C0A0630770A5904C40869B3B12D13963C01EDBD32E47934C40049E0F7C284363C07D122ED5337B4C403BBBA973934363C032243CAE8C854C40B0F27B25F23E63C03D6E73C6D48E4C40B3B554A6FF4E63C08B24CF4D26904C407FDD7AE8E84E63C0DFB3975C41884C402A399C55604C63C028C491FDBA854C40787942409B4863C0072E356BDE8E4C40861A12324F4363C066FC78D6CB8E4C4007EFC5E23A4563C0B95086BF627A4C4077CBD844814963C0FA19A9E417744C404B98FF816A4963C02ED2EA5E556E4C40B4186C46A34763C06668D496DB704C404FFDBB419A4963C047DA841B8E6C4C402D4724488B4A63C0377CC42E95764C40A98DB4B2085163C0C15CF1BEB07E4C409177AEF2F15063C0C24DC53DD1924C40D0480242815363C0E8AA3B8841A14C40F54307D4B55963C0A400E25587A44C400A7FCBE8305863C07396B5A169A64C40E26CDA8FE55963C0DFF8801764AB4C40BDA70023A05663C09E47CE83DBAA4C40495ED1175D5763C0952B7ADFF3B54C4088DAC3FE9E5163C001D57BEE98C54C401B2B4587795063C0712DBC11D4C14C40051255FA9D5063C0A7E18E6FF8C94C409FD4C571D44C63C0419F331428C84C403B42B2F55D4E63C03438F2E21CCA4C4030485E66384B63C0F12A57F380D24C404AFB72A8FF4663C04C3B3A4E74D54C4015F7E3DCF23F63C0E36C60D738D14C40ECDED061513F63C0ED932D7B1EC84C40203BADAF854363C05AF17F3CD9C44C400A99FFA16B3E63C06517E67346C54C404A524D306E3C63C05CF380BCBEB34C40859D44C12B3463C0ACFEED4064A24C40A4A02A6CEE3963C07741DA062DB34C40E291745A513B63C07A3226FB8BC84C4036098C14E33563C0E2809C62A1C54C40194870143E3C63C0F9FA6BCE37D24C403F2B5354AB3263C0C363BD564ECE4C40E920164E163D63C0567C31A980DA4C40C279D3B4C73D63C0A4D2D7E4BAE74C40D0DB31499B3463C0E25486DBD3F14C4031D35E96403063C038E9E8E70BD04C40E5763CBFE83063C0786A7EA69ADB4C407F3D38F6FB2D63C099B3BF6B81D94C40E84149AD023063C07BC12B752EE24C40359FEC4B292A63C07688F899CFDC4C405BF93C8B2C2F63C03E9B3610BFEB4C403D08F49FE32663C02D62400AD0E44C40A05621E0B22563C0F13724AB09DA4C407529D519BE2763C09D183130A5F24C40434B55499E2163C067FD2BCB52EA4C40C53CAF06E62863C0A862FD6895004D409D380F94361A63C0A770074C46F54C4099320DB43E1D63C0A7BED9D712EA4C40434C78731D1C63C0C3021BA8F3DC4C40116AFEE6521B63C04BC1FF0ADBEA4C40A2E29B36EB1363C0255F82C585ED4C404953DEF2E11363C091A1F981C4F64C40F2695085830A63C0E1BAA0B21DE84C40B9A5AF7AB21163C06B13AADB52D94C40DD666E69580E63C014543AAE61DC4C4056B40639B20F63C0F8C04374ECD24C4073F94B66D30C63C0DBAA0A13B0D74C409CCBDDB4FF0D63C0CFA29A0D4ECD4C405DD27BFAE90463C0203466D944CD4C4026259A741E0B63C0CEA0EF1131B64C405F8D2C3CAF1E63C0268E163D91C24C404352C538331D63C058932550D6BD4C40ADD3CE55752163C0016ABC091EB74C40900AA12ED01963C0D4D2A168E1BB4C409DA275615E1363C0E639949189B04C40980080305B1463C0C5690FBC92A84C400E9322E1E51A63C0442E9DC750A24C40481C7A133B1C63C0327A46B057AC4C40726CDA2B412563C079AD1E6A85AC4C40D3C4F22B9C2563C00C5B2A9155A64C40D89078E8AA1E63C069E3194E65A04C40B05D9A78842C63C0313DC4586C9A4C401A3057F9912C63C020BF904833944C40010300000001000000280000004F599FF4F8D460C03AC0371BD2144C40C3A929C08CE160C06FC54D9293434C40D21B9E662FDB60C0D6537630B3574C40868ACA2BF4DE60C0F2089A80E94F4C40433AEA2D0CDE60C05F9C3AFFD35A4C40E0F230356FDF60C04179777FB75B4C40AD767BB2BEE360C0E4F3FD2F924C4C4087C9C7EFF9E360C082442D6708554C408DA612BBCEDF60C0614EF147C4604C40B88FCE3215E660C0D3E5E48159564C4094882373E5E360C0671B4FB0DE694C405FF3E5B18BE860C0786EF8B737644C40BAD28D3EDCEB60C0ABFC1342956A4C40239A9B7548E960C0607861CE1E724C40924859FA4CEB60C04BAAA04C9D7B4C40748D02B151E560C08A1305E365844C405CE59B73BCEB60C087E295A63A8A4C406DE6066FCCEB60C072D76BAF9F914C40A7C979A982E860C01DC85443EE944C409230ED730DED60C0ABF53C391E934C408D522A6ADDEA60C07DD068A6BD9F4C4095FB787F16F160C0E98EDFA25B9D4C40790832E193F560C0081121A84AAC4C405BB43C4C14EF60C0DE13958DDCAC4C4051E029E07CF360C0CE8655851FB24C40272B913FDBF060C0B56712ACBEB74C406A33DEE882F060C028230604E1C04C406A75ECE010EA60C0DA2CE85B26C44C40E1E1131E09E960C024AED5DB73C04C40512C6756C9EC60C0903B77CF21B84C4027A184185DE560C08757A07237BD4C401BE7DA4E77E660C084C784A651B64C40857170B620E060C0D2FEB9D31EB34C40DAF0592A0BDD60C0ACBF9F2829AA4C40E798596F07E060C0786BA88ED4AB4C4034804CEB54DE60C0537E4EDB05A94C4067F2AFAA85DF60C04BE6CD0BAEA54C4032226622C2DA60C08E6071F5B49F4C402934D3D6C7D360C0892118A2415C4C404F599FF4F8D460C03AC0371BD2144C400103000000010000000B000000E3070B5F77F660C00A66DBCE85A84C40EB457601D8F160C068095063499D4C406F57ED060CF460C09EFD85659B9D4C4094912C4888F160C04F93888785904C40E77F3FA930F460C02446EAC485804C401E3268BCDDFA60C0BCE17B776C7E4C40947B781C6EFA60C0829641AD9E8A4C40C56AC3D6BDF660C055D7A43D9C944C40509C290E3CFA60C0EDDFDD3811964C40CDBE22DC28FB60C05876C55A7CA84C40E3070B5F77F660C00A66DBCE85A84C400103000000010000001F0000004FE1B45FB5A160C0D7563727137D4C40E0BACE94BE9D60C0E9EB3747126E4C4028BBE8E4B99F60C0545D785F47674C4094EEBE10DC9D60C048AE81EF97504C402384FED2C1A060C094F31ED3004D4C40107C313451AB60C0F50A27284C6B4C406E1B6877D5A960C03F21F59D925D4C401852C530D4A660C06E3B029EB15A4C408B621F75B5A760C0891EF70FCF504C40A2EDB0E02CA360C064C23C40C84E4C408C2CD0EB65A560C0D7DFAE4A0A4D4C4014FACC61ADA260C01C050C3003434C40A6D114E84CA560C05DD1D256043A4C40A8DA2C11CAAD60C004E497EE33404C40CAB20FCA75AD60C0274F7B61283A4C4026C5916279B260C07F3DFB7774374C40314F17F0C6B460C00B21F42CBC384C40E859E777B2B460C0EEA65F8C18484C4024B88CFC22B660C0E5125891CE484C409C65B17560B460C0D2889E95F84B4C40BCE1CE9FADB660C09425D0DFB5564C405B1991B495B560C05189FFDFED6D4C40D66B1CB342B860C0F2497F74D1664C4076E1249D8DBC60C03B03A8F4C3724C40A4F4F9749CB760C035E6EB6E44724C4014A88828A2C060C007545F34D7814C4054015A2EFEBB60C013A91E76FA8A4C402FA39EE276AA60C0DE532197907F4C407EA7596B72A860C0DB2815EBF6754C40422B606473A960C0D3ED681A74804C404FE1B45FB5A160C0D7563727137D4C40010300000001000000340000002257DDB7E1BE60C0C9E4E188670A4C40F67F2E4136C160C0678CE633760D4C40B992AF49BCC160C0DB1D7767F3274C400348798B3AC360C0D454D86D50164C40257B2D3FFEC560C0220FC32490164C40356EA90726C360C0165AC3A428114C407A2453E777C360C0189A3ED9D7FF4B40761C9A331FC760C0B1DC93CB7B084C403D4B4BFE34C660C060FCF35EE5134C404AF693EB86C860C09DB1CF80BB204C40906D81F42CC560C0090231974F274C407651932C0DC960C04BB157993F254C4015D973EC0AC960C054A2A084882D4C40BF2FE11CCCC560C03B40B12ED8374C40C91798222FC560C0D20FD778F42E4C402FE7071F83C360C045280891D3334C40691C6441A3C160C03DCF12B5F52D4C40AC1B67ACF8C060C0D4898ED62D3D4C40AC1D69E93DC260C07955985307474C4082ABE98D5BC460C0E336E915483E4C4059DC5D31DCC960C0B450E544AB474C40AF8C4AB2CFC260C044D20F961F524C4091599EAA19C860C068DA76AB634E4C40A7B319E503C760C0926BDA223D584C402374E53137CA60C0116F88421D544C4084DA5E7BA4CC60C03FC569A04A5C4C40E47DD1FED8CC60C0ED3D27931C6D4C40BFD6E765CDC860C01F058151C9654C403CAD1BF156CA60C07395B7A65F724C401D7CE9177AC360C02DDA0001DE6B4C406CF742E87DC860C008668072E2774C40FAFA789ED9BF60C01922FE6DE26F4C40DBC5B69EAEBD60C041529C9C9A664C40D36ADE7293BD60C0A4D836B6795B4C40426AFEC4D8C060C0B85C8A9ACC524C406FA03F6FA5BB60C05F3D13BD935C4C400461E2DCDBBB60C0DF6614216C674C40119AD23606B760C0FBAD33EA16624C40F2A25817E2B860C0C0D1042E90574C409DB3A43B2EB660C0A793DFDEB74C4C4036753D02B1B760C095674050B4474C40A0FD35A483BD60C0553FE632914E4C406BF54D3A0DBB60C071A7599529494C40D78AA0A86ABD60C08A77017318404C400340648079BA60C09CEFCA18BD374C40580759B228BD60C0C3678C4363364C40CCB7796661BB60C0B503E55BAF234C4055A8B5DD33BF60C0C7623184882D4C408D7A669B8CBF60C0B03096735E224C40C4D0A71877BC60C035D1C87F891C4C40A61B2B9262BE60C076773FE983194C402257DDB7E1BE60C0C9E4E188670A4C400103000000010000000A000000AE091D87B79960C0C2EA00FB9C644C406CD4ABA50A9160C0AB7BFA56E9494C404CB0F1050E9860C01F351400B6464C40BDB59BC20C9760C056E015C769414C40A617F809CB9860C0EBCDC385473F4C40FEC23D97229E60C047668E3233414C4033552DD1A89E60C092FC9BC4014C4C4072756293449C60C0D814EFA67B514C40091D4362E69E60C087275696E4654C40AE091D87B79960C0C2EA00FB9C644C40010300000001000000080000003C37E54BCF8A60C05A17371A653D4C40A79DC049338560C021D2819E252D4C402707ED952B8060C0899F6A5F0C2B4C406BA9BA158C7D60C0B8ECC0C032194C40C473F394D98160C06C51EC45360E4C403EBC4B7BB98960C0210C8E55AD1D4C405C88B3C03E8B60C022D940A194234C403C37E54BCF8A60C05A17371A653D4C40010300000001000000070000008D1B047B8D9660C0B4686635563A4C403A4C4C25B59360C0E117CB56B1324C40CCB0D8A3B99560C0AA26A0E2F1214C408E334D34189B60C084CBF6519B1D4C40CEACB116DCA160C0B46BCB43C22B4C400F9FABD3249E60C0462A402A45394C408D1B047B8D9660C0B4686635563A4C4001030000000100000055000000538DB2F9278F60C010D49BD670BF4B40B8D72AC35F8860C0310D4EB197B84B409DEB6E830C8F60C0208DC4B332B14B404583A800278860C0DBAE50F377B44B40B8C49CFAF58460C0C4A0D2C275AE4B4094DA5135C88260C0136F36DA8DA14B40A3463E36B78760C0D5FFE0C38EA04B40BACA68E9B48760C0E58BE316AA984B402C97D16DDA8260C091EF971AB2994B408CBBD737648060C022DE1665DEA24B40D3F559780C7F60C0B017FC71EE9C4B40D7AB08FAF67F60C078CE3E66DC8C4B405FE32EDA178360C06DE0DB6C378D4B406D2D05CF618260C0BB72ABE1F7844B40899B273A0C8760C0093044C8FE7E4B4075E36AEEDE7E60C016F642E842834B40AEDFD35B668060C0AE7030AFDD7B4B40730A879A277F60C0820F2AEB83724B40B2FF1906B78160C03E9AC7F3DF714B403543A2786F7E60C062BE28CEDC644B40AB9FF732428060C0A4D86A87C2634B40230E46C72D8060C0B9FB3FB058584B4008E752534C8960C08645139C705B4B40A4860087EC8660C02EA679D792654B40F06C491B5C8B60C0E8A574C848664B40BE0F7C068D8860C0F9FA3454676B4B40342BEFA1788C60C05DDC77C03F764B4018404F602D8C60C0185CB0AF0D824B401E8EEB25018F60C054E8C57379734B4017BF3AE58A8E60C0AB55D9E1117E4B4071EA3526089160C0B72321A459774B40C36A25612C9360C01D4A9399EF7B4B40F5CDC0A5159160C02C1F134904824B40B80C83E0619260C04C5D6105B8844B4055F2CFA6BA8E60C077B1488A89854B4061EA33DFDD9160C0D6C088ED8F8F4B40A837D259B99360C0EC14B5C2CF874B40DA7859DFF69160C0B5A3D7EB24954B4052CF12CD939460C0E31FE97DFD9F4B4007201AD58B9360C04691C13577954B4016E703D5629560C0307C1C01A0914B40286959CAF59860C0D17AF48B50974B40890A5539C99960C0F643A6F643A24B40FD839F7F24A060C061AFCB4DF2994B4041FED4F2DE9C60C0D75CEE44C2A34B40227D82632CA760C03A88DDB72FA44B40E52D493F64A860C010EED35F55AB4B40D5D6BE0242A660C09BBF5B8433B14B4064CD2D362C9B60C06B8607B7F7AC4B40A3AA5BCFE69F60C071A54FCE0FB04B401ABDC92F22A260C09FB4FEE5A3B64B406E617FD8529F60C0D9BE59ED3BB94B408B453B1922A460C0BFBBA3C49ABE4B401F69ECD33FA260C075E86AE472C94B4094BF5BD31E9D60C0B1D9F1CB57D04B40B7E0C2C62BA860C0E0F69DD160C94B401131B1515AAB60C06366F6C108CE4B408A0A136F09AC60C0B488FAE480DC4B40D7DD7EF199A760C0C3CE13F38FDF4B402D3B70896BA460C0A1117A4069F14B4062D69044C7A760C0BB0291CEB8F34B40CFD3849652A860C0F3E4A51C79134C40668AA288CEB360C05564F042831A4C4023AEDAD64DB460C0AAD84E915D234C40FB67971025B260C0A599E864F6254C40B6B871DB97B360C0E10134228A2C4C40F7AA7C6F6BAA60C018300A53BB294C40B043B06817AA60C02178851068224C405EFD52E114A660C0D3365FEF3A2A4C40F2832910FEA160C0A2F2D825EC1E4C40AA88EFCAD1A060C00F64561391164C40AE49160E79A460C0D7F0BE16EC0E4C40F4CC3B868DA260C0F0148E38AC064C4085BE09A1459760C070722612ACFE4B402AE9AE93D28F60C0C156703B2AE84B4095631103008E60C026FC0BDFBCCF4B407E66958C368C60C00AB8203CA4D54B4075FE54485C8960C0A1FB2C63A5C44B40C77CEAC5AA8460C0CB7912B576BD4B400F778B82778560C0564BF73720B94B40FF95236F559160C0FC6CDECBB3CF4B40B90AB8A30D9260C025734ABEA0C84B40E53690735D9060C0DECEA436ADC54B40ECFAC042C09560C061E05CDAE8B94B40538DB2F9278F60C010D49BD670BF4B4001030000000100000011000000570A9B088B8C60C0D62CBC0CFA2A4C405DB3FBC1B18C60C0DB65CD805C1C4C40CFCC46505C8F60C01E6F38BD45184C407EF2003D3C8B60C0EE10F0C7AF1B4C401FDCA20C7C8360C0DF4202FCC70E4C40DAEC7FF8738660C03EC6F4CCE70A4C407C8A328C248460C0DA2BF73AC8F64B4041C35146D08560C09D7F5DF49DFB4B40B928824EE18A60C0BBF2B931EEF44B4001A3E815AC8D60C026B714A255FA4B40CE94368E368C60C0646FB5B754034C404A7681E15F9460C0108D7C233F064C40FABF0826529660C0BF66BBAFBF0D4C402BC633E5469660C061B78ED2651C4C40BAA6C95A5C9360C04AE63214921D4C4017F22F968F9060C076AF6BBF4B2B4C40570A9B088B8C60C0D62CBC0CFA2A4C40010300000001000000090000002AEE635731A960C0B33DD55273104C4013DB0B0937AA60C0D49E3D882BFF4B4049F2826A53AF60C06946D89DDD024C40260F7E65D7B360C0818271D1A3F54B40321840D855B960C0B587AC5ADAF54B4009598F6BCEB560C0943C880A73084C40AFF45B2993AF60C092B03565F90A4C4089CD31F6D2B360C0D41473ABB2104C402AEE635731A960C0B33DD55273104C40010300000001000000200000007CDC098E677360C090FC6329EAA84B403DD748C7687A60C0A52D2F823ABA4B40E86CA10BA47460C04F076DC4BFC54B40CAA5248BB97360C071A6B1B16ECC4B407A3C134A967660C0E5B6BBE546CF4B40E37F184C327660C0B81430DF90D64B40CAB7FCD8787060C0E9216A29EEDC4B407AABC78EC17660C03146D817ADDD4B40F59D79DB706F60C0B6657A9FB7E44B40C6BEA453F07560C03F9B24819EEA4B40F5DE345DF96D60C080A1691882EB4B40831337985D7260C06382153FF8F34B40743D9BAD776760C01E3A62CB0CFA4B40091162B3FB5D60C0D609ACFC28D24B40C9C48FA4FA5E60C0E70EEEAE0DB24B4043812665E86060C0FFD524E7E6B34B40ECD4CD98976160C09B7DE43932A24B405132BA949F6460C00850C3372A994B40177F8E11DE6960C0242C4B0B099E4B4088550FDAF56660C0F78E491811A74B40B5447CE1476760C0F28FDDCEEFB34B408A8509956E6960C065C5764903A34B4022CB464EBF6E60C0F501C1EEF8A34B402E6F30E1B16860C0CB96E87DF4B74B40566C5EE1376B60C020F98CA483D24B408ECC73DDB36A60C0B2A6F9F2B6B54B40AE7DFE11D66E60C087A1CA2BF2A94B40ED8495993D6E60C0574262B69DC34B4049F434D4B17060C01E71067AEEBC4B4071FDF693FC6E60C0E218046A80AD4B403787CF8CC17060C0FFEF7D6877A54B407CDC098E677360C090FC6329EAA84B4001030000000100000007000000736562C8467A60C07CBEB6D9C9B44B408C01CF4AC97360C0DCDB15E941A44B40B28889C15F7860C0D5D5DC91AB9F4B40043FB3FD407760C0B073A92D33914B4035787CFC617A60C012D1B2570C9B4B4012A50805BE7B60C0EA77E09719AF4B40736562C8467A60C07CBEB6D9C9B44B400103000000010000000B0000000F89344A016F60C0A66B9332249E4B407A47EF0B006C60C0DABD43092A994B403F0828C2696B60C0F0E116F481844B40FED1D53A436F60C0AA138B2F10804B402784273E337160C0E8F0C20E9E8B4B40B79C8BBBB17060C08BBDCCE12F844B402B64C5F7307360C0AF6E6FE2597F4B40F200C97E037360C00D060EC39B8D4B406EC92DC0987060C063A45DC66A904B40005492C8BA7260C0B583092934A04B400F89344A016F60C0A66B9332249E4B400103000000010000000F000000DCF9EFC352A360C0A60497CF629F4B40D06A7AC8A39E60C05A4A2B35EB874B40A007907C9AA260C0D11F0DD0F08A4B408C204C9F369860C0AF0BFA2B33694B407153EAE3EE9660C0370FFD2EE0614B404F12A9E2489860C083CBA8B2A35E4B408C5935DF729560C09F2825B9F7544B404BB86D1BF19A60C03797040A34584B40334E62A0919E60C0C102EA2B5C654B402266539D059D60C03E0BD42A0C6B4B405B89DA03CFA460C07AB0415ACE784B4031ED8E7FE3A660C033952C0B1D8C4B4078F5CEF7C8A360C0E6BD6DC0008D4B404775B608E8A660C0E88A5BACB6954B40DCF9EFC352A360C0A60497CF629F4B40');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('3','AZURITE','AZ','ARIZONA','F','921','0106000020E61000000100000001030000000100000099000000BB49B4F651A15CC06211C3EA8B8340402374781DC8A35CC01818A549B5844040A29CD60509A75CC02C1870CC748340408E8B04EA92A85CC01227D6EB4B8440403FFF284C4AA95CC0834A9749AF854040C1692A2F7EAA5CC00080366BFB8440405E5D9CD786AD5CC0B545B780358C40401C689BD767AD5CC0DBDE90FBA98F4040B7F4105366AB5CC053664472689540404A6B13F485AB5CC0821AFD86BF9C40405CE5547503AC5CC049380104A09E40404EF902545FAB5CC0DB8D915D4EA2404078CD6B3C11AF5CC0893A177421A74040F3FB27D807AD5CC08347DE081CAD404019A4195B65AE5CC0D45F499A9DB440408FB60A3149A95CC012895798A5B540407D53724F5BA85CC0C724AF133FB84040472885EEBFA75CC0824E9F0CFBBB40400398040C47A65CC0B0B0946839BE40402D2D2C6B92A55CC065A2358335C14040107B9C06E2A15CC092F4BD78B0C74040FF57016993A25CC0F1FF12144ECA4040A82C6829BDA15CC04354452BA2CF40406CB442EB9DA15CC09A0040422FD5404020475DED54A25CC0F4FD12DE63D74040104BC029B99F5CC063EE44D9ABDA4040E391058DA8A05CC086F6703121DF4040722EFEAC4AA05CC0BF2B148DC7E240401B8EE0105AA15CC05A65C464BBE940402288F20FC0A05CC0ED3F9782C5EB40405083B17157A15CC03F8B435F74EE404062A03A50E29F5CC0B42BBA9667F64040AA0101F5A3A15CC068D4DCB1E8F94040F7B54A542AA15CC05A77E82F87FB40406822D669749B5CC00BDD7AEDD1034140164E564B239B5CC0FEFFD4C8060A414016737C2A409A5CC09D4A22C7230D41400F14F8BEA8945CC084C360071612414046C75F7A43925CC08BA631E5EA154140DB0A61F3168F5CC09369C725D61741400AC7082A98895CC00312215E2C224140B2CFBAC603885CC0706D783EE52241407A94A28995885CC06721041B432841401D5D1D8DD1895CC094203FB8102B4140C8292332A78B5CC01D33DA14BF2E4140C1F8DB7D80905CC0E5FD9A0EE733414067E5C22123925CC051CF54ADBE3441407819552562935CC010AC7FCAC6374140294B31EA49955CC01A32E947393A41407325AAB018985CC04988DEC5D63A4140E84B213291985CC006192B24113D41406F3782F21D985CC0EAF1BF1CAE44414074AB0838399A5CC03D340F74B74A4140E4BAA39BCB9B5CC09079FDD0AA4C414020B22E7A069B5CC037835ECF314E4140E66BFA01CD9D5CC00BA97C1EDD5A41400472D206DC9F5CC07F76FF37545F4140A8C7DDA9A2A15CC0479C7E55DC5F4140A48485CBB0A25CC024B9EA5246614140D8F4B46E7EA45CC057FB30677A6A4140FC1F861525A85CC0E84DC07D117041406DA685B659A85CC081A1C337B27541402A9CB195BEA75CC092520E35C8784140C874E43777A85CC0C3291F0DB37F4140F75E8596BFA75CC0E3259D6DDC7F414065B069D98FA85CC083DB3BC75B85414043F6A2D51EA65CC0CDEF5A44BC8941400072EABBB2A85CC0F1BAEF1C308F414083074E9B17A85CC058A035DB2391414013CF8F9549A55CC0CF16C4BDF7904140862D88D49FA45CC051FA71BDED9141407ED61614E8A35CC0E0D9B0F950964140C37A7835D0A35CC06955A2F32E9C41403B0FA4FC9FA55CC079E054A402A7414003D5B6BFBBA55CC0DA63A75ADFAD414084AED52B4EA95CC082B9CE87B2B94140EE46AB9205AB5CC06583863B04C2414069B9813196A95CC0BE3EE536F8C5414044E6E1F3CCA95CC0BAE78CCFDBCA414095AF9993F3A85CC0B3648BAB40CE41409F3C4337DCA95CC0611E5B44C3D241406178D979C8AA5CC07AC2ADE104D441405C045EDB90AA5CC04FB1157BB7D84140BC5EAFA015AC5CC00B1D55B2C5DD41404E04E001B2AB5CC0E1500DCDE1E141400F7741C926AC5CC0E8F5C3FE78EC4140583571C765AA5CC073FC3F9D7BEF414001BF16A857AA5CC02D9A955BB3F04140C577C6EFC0AC5CC0E2582EB3AFF441408EFF101B1EAF5CC09E20DC426BFE4140DF5F0C5DEEAD5CC0E731FA7CB4044240F4170661A7AE5CC0041F113885074240F102B4039AAE5CC007B215D4000B4240C4A83FE39DAD5CC055438E92760D4240D23E6078C8A75CC0D7B1D1F62B124240812466F454A65CC0352C12FAB41142401D1EDFEAF4A15CC09E85DCFED9134240C02BB3FEDC9D5CC06742F889F60F424059B1509B699C5CC01C5A8DAC7E0F424066AC11145F985CC09ED96FAE53134240CEB6BDED07965CC05988DBF3981142403DCB15E83A945CC0FAC3099A430E42409377C26472935CC0C275765E260B4240E15FE183AF935CC08B453141F707424029B80637F18E5CC0359508AC58024240BD436DB33B8D5CC0134FC06C350242406ED7EFE941885CC011EB946C57054240DF71D0C9E5865CC002A54EE67F0F4240BD0A5A02E3825CC09B576B44D4184240E1ECBAA164825CC024274CA3A61B4240D816F03FCC825CC08ACFBEB4C16B4240907D1EE7CF825CC07529028E8E7F4240EB4D405499395CC00934E35C847F424082FC53ACB8225CC08363A348BE7F424018B9973B2F0F5CC0512C78496C7F4240531C0464CBD65BC0BAB23F06388042409E2DF8305DAF5BC06792228751804240E5EA5850FB9E5BC014A6C1A58080424099557E6EF19C5BC0141A088BF17E42409024DF1AD07F5BC03BFBC211FC7E424076244D4C1A435BC052D6EBED917F4240D4FEB9EA0F435BC06B524CAF92FF41400435B529FC425BC0A447F5D8317A4140DA7A80201D435BC04D585477BF4B4140AF980CEC38435BC04419D43C43E44040145FC3D03B435BC048E026D7429A4040E6006C4149435BC07F6FE34FC863404068E15FEE2A435BC02C0ED5E994384040C1234F5BEB425BC02C51FB89EC573F40BFED600BF79C5BC0B75766E670563F40AA1402129BC45BC03DAB361CEC553F40F561E43AA6D75BC027D91FDC786E3F402F4FCF2810555CC0AA8CF85F95054040B8776CBC97B45CC0210500905B3E40401859D91BCDB35CC059792C8DDA4E404034DFE40C36AE5CC04DC0F20E455C4040FBFBD2CB9CAD5CC01D40FAEA145E4040B4197C296BAC5CC009BE6908E75E4040BD1190FDA6A65CC09006EFE9F65C4040D057941DA0A65CC043901D87315E4040615676F99AA45CC03B32B065645E40409965AB199FA45CC041BA87A2D95F404056E04E58E3A35CC0E0872A22DD5F4040A6338DF8F0A35CC02384B95F60614040F9150D96C0A25CC0D423913F60614040E8205C96C3A25CC076FA1CBDB762404024977D14EDA15CC01431B49CBD624040E38A93B53EA25CC0B62390B9DE64404085C68B94ADA15CC001C05F35AB674040E21C332C889D5CC0B61B3ECE366C404018FDFA0E7E9E5CC022E588DCCB77404030EA360EFA9D5CC0D4979434287D4040BB49B4F651A15CC06211C3EA8B834040');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('4','PDS','AR','ARKANSAS','F','922','0106000020E61000000100000001030000000100000051010000E9E8455A8C9D57C0D6901D9A2F19414001A6C5CAF79C57C0C55A9F521441414021F368A08A9C57C066573668285E4140343DA6DA1D9C57C0CFDB646AEE764140BF564F656D9B57C01493BF1945B341400C3F7DA9FB9D57C0184BEB2D0FD241405A54498E199F57C08F627ADA51E14140F05AE7F6B6A257C05897D3CBAC0D424063D29D3666A357C03C2D87290F15424059F1D881E0A657C09D1ACD00493D42404E4FF72381A757C0BF21671FA53E4240279758F52F8557C0CF6614E2D93E4240586AE69AE17657C09C5DBE51B13E4240DE0A2C3B2C6657C04C0C68F8B63E4240F5D2BB9F035557C021C720E3C03E42409471095D075357C07E7CCAA1CE3E4240E3CD73AF8B3657C046F23D89B43E424090C093C7C43157C01280B1C7B73E424088B1CDA9792157C01A390983D63E4240990A304C5D0957C0F39BD3BBEE3E42400D26764A2B0857C0AF60365BE73E42400131466011EC56C0ED1547B2D93E42409AF9BBC5FDDC56C018141FACC63E424027C484E05ADA56C052E62F6CDC3E4240DD37A5BD92C856C05A875A4C773E4240B48825D87BB356C07E6E3440A03E4240AF3399193BA556C014F790D1D93E42404CFB33C55D8E56C00AF77C6F143F42400F6CC6D99D8956C00B811AB1F53E424073AF2AB7CA8856C05A305B978E3A4240F2163634828756C0C99A3A381B3A42400130C774EE8756C078C7869D183642400BBF65B37B8756C0D5D6DD40D633424047C3282E238556C04B0EE0A3DF3242408217108A568356C0847A9587F93042405A24D209388356C069AC94EB6B2E4240999BE9AB558456C03C778C91A6294240B128A4A9308356C02B0615F7772642405F1C8F6B3C8456C09A5810FBDB224240FC74A6700A8756C0280E6C1A08214240DD7CE071678856C034E61042271B4240DEC31A75548A56C01A10A083371942400B05DE5B098E56C0ECBE49C518164240FCC9255DDE8E56C0B09457A7A21442408FCCEC3C098F56C0E346F84C8E11424022276620E29056C034E2A3D0350F4240377EF0023B9256C0DD1E9431D80E424052DD8B862E9456C012B99397BD0B4240C8C50B8E429856C0A60CDB0FADFE4140117076C0259256C04590378FE0FE41406F68E291A67D56C09C2A7BB59AFF4140788A1E91326E56C00EB55E64FEFF41402075C34FA56D56C029EE68E9B2FB4140365F396A836A56C0281BF1EC0CF84140EA7316884F6956C0FA93ABD0F9F44140F6273508906956C0EBBC86737AF24140F0DBE8E98A6A56C083AB3D555FF1414089D567AFBE6D56C04D6C1512ACF4414083D708523C6F56C06729B89121F54140F9FEE4D4D47056C09F751334CDF2414073CF22F50B7156C0004B1DB62CF14140B19DF4B37F7056C08B4363188DEF41400D826CADE56C56C09E42045DCAEB414071FC30ADDB6C56C06E17E27EEEE941406ABAC5F01A6F56C0C567AF824FE74140417F8ED3A17056C07431E9C0A3E841401A64B1F7967256C014514DE11EE74140C8F189F8327356C0273E2A461CE341403741389CEF7456C097C1FC8711E1414026D17180097756C00A1F7948C7DF4140B70154473B7A56C032DA8805A1E04140A3BAEF2CDF7C56C0AE60B907FFDD41408BB8F48CEF7C56C035CF784B35DB4140C814214A827B56C0BA1B627292D64140FC0B46E52E7956C02782CD76F9D3414052999381607756C03B6AB67431D641403D6E8280DE7656C0C553F8F4E7D541401E7C779F5A7656C01DCA833999D2414041A669814A7756C00A68EE1B9ED04140F0CF3363297856C06706DBBA13D14140D60E96AD417D56C05BFC131F35CD4140E1EB81CD517D56C0F8377A0312CA4140EDE0E3E8FD7A56C08B4E58E9E7C54140BBED3ACA997B56C0D1C4FC8BC0C341402083200CA67C56C02C43872C74C3414095D2114E977D56C0AD0096CB24C441402C8D77D1567F56C0C1E23EA6E7C74140B8EE66F71E8256C03F24E427B8C64140F45441989F8256C084BFF4A97EC541408A2D4798AE8256C05E5E9D4F9AC1414010564D53FA7F56C024DE435B07B941402240B3F9FF8256C0441BA16166B5414074848D5BDD8356C018D0CA62EDB44140A91043DDBC8456C0ABCA9A809AB6414062E9E8BCCB8456C0BCC8F07778BC41409DD2B3BD448556C051C1909638BD414096B75500888656C061C02898A0BC414051E121A5CA8856C09CEF6B5EA7B841401390B5A90E8B56C0460E14233FB6414023A36809BF8A56C0F587A40A32B14140ECB3CE05FA8856C071922F6A0AB141407E77D9E47B8856C0395D12052FB4414096732D82308756C0E5E2E2A279B541405147BBBE748556C0F8CC20028DB54140E38F9D1DD68456C0257935E40BB441408FA12A1F958556C0B0B43309D8B041406FD9BA01C48656C0932B9C4CDBAE4140EE6CFFA0528656C00BE720303FAC414005C627E2CF8656C042676B764AA84140C68451A80D8A56C038ED61D935A7414053DAFBA9DE8A56C0100FB4FE2DA441400ED713E8BD8956C03D94C181CFA1414084CC7C42C98656C0E4DB08A0C8A14140E457C4C0C58556C08CE6560193A04140539A285F6B8456C08E1003E83D9B4140BF660880B28456C0C36BF7EB9098414029C54C5F008456C07795916F6095414015A706E0228456C0929BF072E092414070590F22508556C00064279804904140B50EFA67348956C08B935FF97C9141402233134A888A56C00FD6181C9A904140140E4D8B6B8B56C023E99120EB8D414058509ACAD38A56C0FC942446F98941407DA1D70C888C56C00807712F3F85414055E03696AE9256C0C23097EF3686414037472D778C9356C062E390D81980414036DDBCB62C9356C0907B2DFD417D4140C3F23691E38F56C0AFA9C1E494794140806EA2D07C8F56C04465872631784140D988DA508C8F56C0BF53FDA9DD754140320E9453139156C0E8F3C50DC47241409394C9B6F79256C045201C2FFF704140E4786EB72B9356C0F7052E32BA6E4140031BB9374E9356C052A0A6340A6D4140DC9F0EBAAA9456C0ADE5E6B3D86C4140715F297CDB9556C09987DE902A6E414030FD22A3DB9956C0C7CE2F52AA6B4140FBEE3AC5089B56C04C6EE2F28A6A4140BBA694E6C09B56C00E4ED911F06A414097A5B865639B56C04206C6EAB56F4140EA7FC6460B9C56C07FB8C28771714140871858CA1E9E56C0F72C4547C5704140997BE36A639E56C059CB9A2BCD6D414019B7A2A8ED9C56C0BCC302F3A369414053CB6A2AE09D56C06CBDA6975E664140D95AA8E8BB9C56C0B3BAC37F636141409D19DAE8E59C56C0EB9DA6E3E25E4140F7D0B10C1B9F56C0FEA698240C5D4140CB89C30E4AA056C0E09E7C236F5D41403AD2BBB017A156C08E1B72DFCD5F4140DB0929EEEC9F56C0CEED307D086241408D4779AE16A056C0C899F5771C65414088F9559008A156C08141373421674140626FDD51C0A156C0EEB7359359674140EDE2E6F40FA356C06B1ABFF52C654140B9C3E3F222A256C09C1292244F5B41400AC0EBEFDFA056C051E48DA7E05941403A1681CA159E56C0C6D14649285A4140594E9B49D89D56C0DC0F5BAF08564140DF1A5A0E92A056C023162073AF5141404F64D71280A256C030E7C41089514140301747B40CA356C0EF839BAD7153414014EA5EB381A256C0BF538568D05741409E3AC816EAA356C026AABB44A6594140C02314F914A556C0F10420ACA6524140933D555AA3A556C08D83408E5F504140BF9B8D58F9A456C034D102936B4D4140B4C0DC50F7A156C0937B2CDF22474140CDB4CE5162A256C01D025A208F4541400B5A52D635A456C029055B9F2C4441402205861826A556C0A9B0C7FF99424140FE9DAD19C5A556C09C5038E2903F414069D9A4B3C4A456C081C9584A1E3A414061BF681212A556C0B54000ED6F3741403D587133A6A656C0501CB54ECD334140BC6706F711AA56C0775DBE8ED92E4140D04E6D531BAA56C0E372F813412A41403424AAF47BAB56C0D1DEA9D3B6284140A9F1057620AC56C085CD25F2FD284140D12EF27999AB56C030E8A64C872E41402716527C01AC56C05DAE9A89613041406FDC95C458B056C078308A83A62F4140E3921B04C4B056C02AD06424982E414090AFD8FCDCAF56C019A6926CAE2841401CDE53F988B056C0E99B5AF1B8234140EAE4FB7FBAB256C0CF0BC66B68264140494177219EB356C00BC1DF6A54264140C1B91181BBB456C07C35B44C83234140B96FBFBD36B556C0F605A4D2641D4140E1EF4FE143B756C0A36069F1101C4140CCA63A4B6DBB56C0049311C809204140054E23ABC3BB56C0A88C9E490D1E4140241BE967FBBA56C0C6D18F4E3B1A4140C1874F7AACB456C0913BE738671841407E8FC6F6AFB356C0B607C49D48154140D6F9ABD80DB556C0B4EA86BE0A13414048C4ED9A30B656C03A62CC3CE61241400C48E92775BB56C05905EECFC617414063D17C6905BD56C0D84D65D1F413414003C469864FBC56C0395124562210414051355BC002BA56C0D48DCE5C2A0D41407BCBCBBA73B756C0AA4A2D81EF0C41405765239ABBB856C0AE54098739054140CA059C42D6BC56C0290AC1C004044140CF4FA4644DBE56C003D61DE06B01414071264FA46CBE56C0E3820DC252FF4040A43BC0E184BD56C098DF11464FFD4040BA9ED7E1C0BD56C091966947D9FB4040E651CCC429BF56C024209285FFFA40409131F80606C056C0196CF422F7FB4040A2EFCA289EC056C0F06C261ECDFE4040FF629CABFEC156C03CD8C4DB2EFE4040581971B177C456C08EE25933CB004140893B8B93B1C556C0B901F2314EFF40406BEE3831DAC456C0AE011497C4FC404006397A4830C156C06DA03065DCF740408C5A064CEFC356C04F31DE0900EF4040ACA563EA83C356C0D922962EFCEB40408E1F3A86DAC156C0AB0D617689E84040F6F2120064BF56C05494CADD45E64040A6ABAA3EFCBE56C01A4073A089E4404058A91C00B6BF56C0BA704FC1C5E2404062FC10C32FC156C09D46A97FCDE140409305B7E6C8C256C0C09EBD5B84E2404083336C8A41C456C0903DF775B0E44040EA8263EFC0C656C02C9E39F265E340406884E133C6C856C03B676E6DDDE34040E2D17EF426C956C04DC5168ECEE24040AD447AD2D6C856C03DD1933696DC4040BBB4D27042C856C0A2B49BD934DB404073104F0DB3C656C07307F2FCAADA4040BB7FE0C69AC356C033A7FF8017DC4040284CFEE37DC256C0080B392551DA40406E2F43A36DC256C0551D2E4877D74040C62A05495EC556C088A01B46D3D44040FD6CCE0EC1C756C012C4DCDFBCD640408DE2BC5575CA56C079525C54F5DB4040735435FC8DCD56C0DCAE34F0C2DA40402DCB53BCC6CD56C0F1546F336DD84040106B729A25CD56C0E99E3F58C4D54040243E2E92E3C956C07A615CE38DD140407CD61011A6C956C03221FF06E2CE40406E2A8CB2C2CA56C0B34058CCE6C94040CB9232D506CC56C0918385CB92C94040B55A5F9B84CE56C04B31908598CB404085936D5A93CE56C08101FE2B3AC74040BE481698ABCD56C0A0B71DB00AC5404009849AD611CD56C05457D970F1C440405A611093B5CB56C0141B37D500C34040628A91928DCB56C004DB1A578DC14040A040B1D54BCD56C099BFBEFC9BBC4040D65750788BCE56C0B7DC3F1ED3BA4040D858CCD8E8CE56C0C8385080C6B840401EA077F1A3CB56C031202CC247B94040B6725370FFCA56C0ABB72DBFBEBB404059E9699127CB56C03B65B3D892C04040F52F3DD090CA56C056DDE9B785C14040E631910A40C856C0B576DE9C24BF40403A11BFC89EC756C02E2D6D0122BC40403260B728ABC756C0B861DF23FAB94040B5DC332A5CC856C0170C5105BCB840400C20A773BBCC56C0805DB9850BB640404BEA2BD412CD56C05013E6860BB54040CC672991D8CB56C0E96B5F4B2BB24040C6F578CAD0C856C0167B048ECAB14040AF065EE559C656C054793C2B1FB540407B6D0A847FC556C0433DC9A342BB40409A643542BAC456C06E9C1264B0BB4040DE2D81E0E8C356C082DAA165E5BA4040070F3FA0F1C356C0D02ADAE948B74040FE5568020BC556C0468EFE8C84B44040650A4DE6D9C656C0754C5EEE5EB24040E5D72DA95AC856C0058E0CB304AE4040F2144F2A14C956C0D358B8B847A94040F20EE8E6D8C756C07DB4384262A24040597221C497C656C04BD73E06EA9F4040A2641941E4C456C02FA53EE06FA54040BC3415BE73C356C0C31B95C097A540405C570C1C98C256C08A9349E319A440401921C25D7FC356C06B0BBBA8799F40409FAF8C22E5C556C005EEF58AE79C404054504B0188C556C06754A856B3944040C99E744224C656C0D21079199692404092A76EA5C5C756C0E3C405DBCA904040E723DF0C60CB56C09F5904964093404001D633EF84CC56C0B37582B7FE914040FD02378E33CC56C0A35DD61C828E4040BC8F4FC866C956C0FA48D5819E8B4040244D63A48BC756C0803C58A768884040A30C2125F1C756C0B77B610A11864040971410E908CA56C0CBCAECEA30854040C6EB6A494ACA56C03C75456ECB8240401FA68E2962CA56C0F51F0750AF8140408BE2DE744DD056C0C3379CAEBD814040D333D4875EDB56C00C8769D8BB814040B550B10A16DD56C0F15DCCB9CA8140401CD5AA6D0F0457C00C5571A54C814040B912CC33E72D57C097EB7ECC27824040322CBCC3A73E57C06796A6D35682404040E0BAFCE14E57C00D527BE07A8240409C1FB216A95E57C01B4E8F6FC1824040E0717F39C36057C0F251E18DB9824040BFD43CE9D57357C01CCB71C7E8824040C47C86DB7D8257C03A676281FF82404094C59A27598257C013A689339EA2404008EE8EBB4F8257C03B1331252CC74040559740A0F18357C040EA4120E6C94040934F53E48E8557C0CF10C9FDC2CA4040F778E145548657C020C17FFE5BC94040E1BE2E6EF18957C092A6A63B9AC840408B6A15B0388A57C09718CAB704CC404052DEAC96278D57C00104FED5E7CA40404ED63C56828D57C070E0361970C74040EBC0387A138F57C068DA4557E4C74040F4645979498E57C070941CD5FCCA404025D3EC1B328F57C09D353C73D8CB40406E79845F959157C0801829F2EAC74040C47F49006D9157C0660FE84FD8CA4040FA0A5B21DE9157C003BB762E73CB40401A175F23239357C04A85558C3CCA4040DD54B7825D9357C0A6A8468E4DC740400A74C3860D9557C08FA7CC6860C940405F7D9ACABD9757C01D173A641EC640409CA9684E4F9957C03AB945DFBBC7404017DCFB2BD79757C0BD33D8E150C940405BD3B3ACBB9757C09420C7608ACB40407DA0D3AD469857C0729940FFF5CB4040DF16B30E319957C0CC93941E9CC94040EB444F90089A57C0E01ECDDC6BC94040E52E47546F9B57C0F279D6F772CC4040048704D6629C57C0404D66155ECC4040ACC36D97E99C57C0C19BBF135FCD4040EDD45036F09B57C08CA80B95F8CE4040E9993357E99B57C0A62814D47AD140407FE9061C829E57C04F42D30EE8D0404013238A4BFD9D57C08F918E5B3BF84040E9E8455A8C9D57C0D6901D9A2F194140');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('5',NULL,'CA','CALIFORNIA','N','923','0106000020E610000005000000010300000001000000F6000000DEC3ACF6926A5EC01F0CDD23AB154340F220D33A12725EC06E68881C8C0843403E5CB2EAC6795EC014E4C01955094340AB1D66D9027F5EC0009B8C26DB114340B746DB11DD8E5EC052B6862419094340159C34DC78915EC0DF153DD267144340636EB96535945EC0A52919085C1A434025A79DA8B0955EC0132B9F4AC71843406958FC3D43925EC0C1082B5264144340F3D1571875915EC02786DB5F7A0C4340872EF56E80995EC082A49CB1A61443400361DC0E789B5EC0AD92F33B910E434064F1DFB64A9F5EC01B02C95B840E4340C3C58F61D5A15EC07276C03449134340F579E0F15E9E5EC0DBCF5042F00A4340D137C0AE69A05EC0F801E7316302434084173524469C5EC0132EFF79D1FD4240C8A4C0865C9F5EC04232A82844F74240635A671F549D5EC0CC94B5C2C7EA4240DB201EA501A15EC02EB19FC73AE94240F857F02DA6AA5EC0BDDE23F215F442403875913345AC5EC05A49AA757BF242408EB3C9D09EB45EC019F8D869FB004340DCDEC2A0F4BA5EC0AC0C0874EB034340B5AE6FE538BD5EC0CD0B1524D1FE4240BC63B6CDAFC05EC0F110F0AA4AFF4240DF59F1071DBC5EC06AFD722F9E1343404737A254A8BF5EC0F0E2A18A0B26434061EEEB7B1FC35EC04882896CA62543409EC65B63C7C75EC0DA8C0C3480374340592E677711D35EC0885593060F4643402067B55B87E15EC092C9D1FAFA6043406239E0A133EE5EC0699515E75E764340842FD59ABDEB5EC0DC8B51E559854340E424D2F413F45EC0AD4806EC84AC43402DD42E364CF05EC0B09AAEFAA3C643409526196325F25EC0DBEEF82BF3D74340C6F07A91A3F55EC047F8815FC7E9434010CE54267D005FC002060B7FD1FF4340989B65470D065FC0D969D12DD90C444044027F7F19165FC09B2338A04F2044404DC124C682155FC06798BF51ED294440B53E92FA20195FC0E37ED6D7B5374440A1937A2A01075FC095273904367D44400F22E3BC94095FC066931A937D9044409BF0942295045FC0D65E96AA2BA84440DD9CE287B5035FC03598C61FA5BA444009CC0DBE3A095FC09EE600AB14DD44408730CDEE8E0F5FC0024E60C76CE344407B0D13B2470D5FC0C90402FE95EC4440FEDAD362360D5FC0B32E6DEDB2FF4440E86423E56CF45EC0196325F218FF4440FCD32E58D8E05EC0C1F540FDB8FF444086D803EE36CE5EC0D17DE2D1470045408032A99B38925EC00711A70D19004540B9399BAE415C5EC05E26BA5A46FF4440FEF06E59CD375EC0FF7BC80A6CFE4440CA2388D694FF5DC03300A8449EFE444060439CC8C3FF5DC096C5C37DBA964440A955402CC1FF5DC0C85C95F93CDC43407A91ECA6BEFF5DC0522E0EA4C4B84340FFDB5F10B3FF5DC063AA96B8E0A74340512235B8B6FF5DC0B01E65B750944340CCCC7690A6FF5DC0DDE11DBA958D4340B7982D8AB0FF5DC0B7F6527C20884340D728A740B2FF5DC0E535B9DE3E7F4340CA0722F9EAF85DC0326DC5560C764340DD15990ED8E45DC0C087A7F5F8594340B56854A167D45DC0CD43A94B7843434089FC55BFC1C95DC01B0CEAE4B5344340F7686F01B79A5DC06822909F7EF142403C4CE609AD755DC0607797BF88BA42400B830E62444A5DC00D9605FBD37A42408EE6CC71B0F85CC04BCB492C2800424006F8149E13E85CC027715771D9E54140F75E8596BFA75CC0E3259D6DDC7F4140C874E43777A85CC0C3291F0DB37F41402A9CB195BEA75CC092520E35C87841406DA685B659A85CC081A1C337B2754140FC1F861525A85CC0E84DC07D11704140D8F4B46E7EA45CC057FB30677A6A4140A48485CBB0A25CC024B9EA5246614140A8C7DDA9A2A15CC0479C7E55DC5F41400472D206DC9F5CC07F76FF37545F4140E66BFA01CD9D5CC00BA97C1EDD5A414020B22E7A069B5CC037835ECF314E4140E4BAA39BCB9B5CC09079FDD0AA4C414074AB0838399A5CC03D340F74B74A41406F3782F21D985CC0EAF1BF1CAE444140E84B213291985CC006192B24113D41407325AAB018985CC04988DEC5D63A4140294B31EA49955CC01A32E947393A41407819552562935CC010AC7FCAC637414067E5C22123925CC051CF54ADBE344140C1F8DB7D80905CC0E5FD9A0EE7334140C8292332A78B5CC01D33DA14BF2E41401D5D1D8DD1895CC094203FB8102B41407A94A28995885CC06721041B43284140B2CFBAC603885CC0706D783EE52241400AC7082A98895CC00312215E2C224140DB0A61F3168F5CC09369C725D617414046C75F7A43925CC08BA631E5EA1541400F14F8BEA8945CC084C360071612414016737C2A409A5CC09D4A22C7230D4140164E564B239B5CC0FEFFD4C8060A41406822D669749B5CC00BDD7AEDD1034140F7B54A542AA15CC05A77E82F87FB4040AA0101F5A3A15CC068D4DCB1E8F9404062A03A50E29F5CC0B42BBA9667F640405083B17157A15CC03F8B435F74EE40402288F20FC0A05CC0ED3F9782C5EB40401B8EE0105AA15CC05A65C464BBE94040722EFEAC4AA05CC0BF2B148DC7E24040E391058DA8A05CC086F6703121DF4040104BC029B99F5CC063EE44D9ABDA404020475DED54A25CC0F4FD12DE63D740406CB442EB9DA15CC09A0040422FD54040A82C6829BDA15CC04354452BA2CF4040FF57016993A25CC0F1FF12144ECA4040107B9C06E2A15CC092F4BD78B0C740402D2D2C6B92A55CC065A2358335C140400398040C47A65CC0B0B0946839BE4040472885EEBFA75CC0824E9F0CFBBB40407D53724F5BA85CC0C724AF133FB840408FB60A3149A95CC012895798A5B5404019A4195B65AE5CC0D45F499A9DB44040F3FB27D807AD5CC08347DE081CAD404078CD6B3C11AF5CC0893A177421A740404EF902545FAB5CC0DB8D915D4EA240405CE5547503AC5CC049380104A09E40404A6B13F485AB5CC0821AFD86BF9C4040B7F4105366AB5CC053664472689540401C689BD767AD5CC0DBDE90FBA98F40405E5D9CD786AD5CC0B545B780358C4040C1692A2F7EAA5CC00080366BFB8440403FFF284C4AA95CC0834A9749AF8540408E8B04EA92A85CC01227D6EB4B844040A29CD60509A75CC02C1870CC748340402374781DC8A35CC01818A549B5844040BB49B4F651A15CC06211C3EA8B83404030EA360EFA9D5CC0D4979434287D404018FDFA0E7E9E5CC022E588DCCB774040E21C332C889D5CC0B61B3ECE366C404085C68B94ADA15CC001C05F35AB674040E38A93B53EA25CC0B62390B9DE64404024977D14EDA15CC01431B49CBD624040E8205C96C3A25CC076FA1CBDB7624040F9150D96C0A25CC0D423913F60614040A6338DF8F0A35CC02384B95F6061404056E04E58E3A35CC0E0872A22DD5F40409965AB199FA45CC041BA87A2D95F4040615676F99AA45CC03B32B065645E4040D057941DA0A65CC043901D87315E4040BD1190FDA6A65CC09006EFE9F65C4040B4197C296BAC5CC009BE6908E75E4040FBFBD2CB9CAD5CC01D40FAEA145E404034DFE40C36AE5CC04DC0F20E455C4040D72799A7D8065DC0709E0CD14A4F4040E9ED5FC232485DC039A7B27B9444404039D7A5B8C94C5DC0AAF704ECF55B4040C65ACE04B8475DC081F834EC2A4D40400649D349F8475DC09F84393AE756404017565CB9B84C5DC05A2A1C67955E4040F7C9FF9EE24F5DC033FDD5510D574040CE6162C542525DC00D2E0ECBF46C4040AA048AC14F505DC0DDBABEA5AF71404054F2AB2605555DC0B948890A458E4040EDD67ECD3F5A5DC03F16F8A4F69D404040F023AD3A665DC099E1B31680B24040994F5C75D4865DC0E7D26532B0DF4040C0595C8FC88F5DC0A6D14EF90FE34040FD594B715C925DC0C1FA6BA319DA404040F342FAEC995DC0498D978D85DE40403BB86BFD739B5DC0B7A438E341E34040873707DDD7985DC063239442FAE74040CDDC3604609A5DC091CBC71405F1404032112FBEADA25DC0FBB65CAAC404414013FE3B7A70B25DC0D5ED773F5602414067A2BF791EBC5DC0A09DAB6221054140E648C16CD8CD5DC01DB2554ABB12414038B6A0B712D15DC00571D2007A1E4140B8EEF2A1E9DE5DC029FC7479FB2F4140002B9083CDE65DC0BA5C7FBD4D35414024A344CBA4F75DC039595B5DD03341409C612D57BC005EC08DC973BA173B4140EF36986DF8085EC061AEE34B673C41405828A86C321D5EC0A0289DD2A3384140F13C8C1B9A205EC09A110061BC424140243AD1F10A295EC09C86755D424941407A61980E81265EC0D4C806691D5A414014E238556D285EC03E655AA0446141401C520413EC265EC00AD30FD2846D4140BDC644DE9E2A5EC019B7C907B0734140EEACF2DB3C295EC0773A925D7F7C4140DB25ED1479275EC04143E7969389414081C283B6DB285EC02300BE72EC914140F200033A20375EC0AFA9B6D3C89A41407742EBDC8C385EC0EA57363234A14140F9643C5666365EC0C4929827A9AE4140899CCD7A03385EC0C4DA3F02C1B64140BC4B8D137C3F5EC0C6937B3F71BA4140C8B9423A61495EC0B15FF7A58DD04140AAF413F74B515EC0FE9B5BBDEED441406B8369A80F555EC0C1AF8A4888E641404E41EAC0835C5EC06FF715F19EF041404F7079DF256C5EC011FBE3672F1742405A94B53B77785EC070AB89EC492742400B04E85B237D5EC052E9E753984A4240FFA8ADB6547A5EC069A21A8AF9514240CD25B12E83775EC0A9C3138FC94D4240602E4486BF735EC0298A02E9F8524240C6E455A2BA705EC03745BDABD468424008D75668AB725EC0231CB783D76C42405481F6DC8B785EC0CF00CB06267B4240983445DCEC835EC0208FB0E64779424038EA9CAF198B5EC08993307D1C80424075A43C9993915EC06A1A7307AB8D42406A3B306D899A5EC0E80F9FB19B9E4240593C0586E9985EC0AA088FDC1BAD4240C3F987EE409C5EC013C893AE5FBD42403B1EE5185DA05EC001F5AC8BEEC24240738407A3E29F5EC06E8121EDA1D9424096A846BFE29F5EC0A54C5D7237E4424079FB01DBA8995EC0BF29EB0681E74240A08D3F972C965EC050AD5A1AD4DC42404BDB15F971975EC0405CB9E2E9D94240DF7CACDA04975EC0F3DA527E0DCE4240D77F1838B7855EC0E48713E1ECB942407C4F55EC6B7E5EC04DFE22E1F8BA4240B8248219F4855EC00CA24CF8A7BF42404CADE96AC88C5EC0374D1E101BDE4240E0EEA895FE935EC0E5E880AAA4E342407541CBF5AE935EC0CF691E4F25F242409E59599BC6975EC0C151FB6B65F44240F1127EBD4C985EC0433041DC99FC42401E97DBD5E9925EC0FF837FD1E4014340AA8503360A805EC020DE19BD500743405B744AB2BB6C5EC09AE20CEA0103434084F8D792186A5EC0CE87345A050B43402C4507AFEB645EC005CCF2BA0C0C43401E3FA96D73645EC04D00244326084340816795CC09635EC08DC7C9E31F08434088095E4FA9645EC0A297FCF5900E43401B23012F77635EC000A84710951143405AE95293366A5EC0E46FA4F7580C4340DEC3ACF6926A5EC01F0CDD23AB1543400103000000010000000B000000DADF946A8AF75DC010B0DA17A10941404CDF653DBFEA5DC036CAE861BB02414091F6CA4DA5E45DC0444570D623074140E960CE657AE15DC0026041776D04414067CF112985E25DC09E5DE3DCD4004140B5AB34409AED5DC0C212EE6F8EFB404057CD96C239F65DC05CB9BE0DF5FB4040324C6063E6F85DC09A93570499004140E6419066EFF75DC0C186C47F14044140C84387475FFB5DC06409E83793074140DADF946A8AF75DC010B0DA17A109414001030000000100000006000000D2C81874B60A5EC0AA2355F24AF6404063B8D661440F5EC0BB6A2CB0640141404CFCFFC9FE025EC085CFD2EF42054140ABB3651DA8FD5DC0ABB7C44D50F9404004D808CBFC065EC0389A854389F24040D2C81874B60A5EC0AA2355F24AF6404001030000000100000008000000C89F2EE210A65DC01A52A8748BBD404087172C7E31975DC047AFD6049CB4404018558E93DA925DC056A91432CFAA404031FD365575935DC003D511F75BA740400C2EAE0E259D5DC0AA56499692A9404011956151CE9E5DC070721BE5B3B540409E9AE99C9CA35DC0B533B11F9DB74040C89F2EE210A65DC01A52A8748BBD40400103000000010000000700000020775F1976965DC01311BA63DB68404014EDB703E39A5DC0AC5BA2C22E674040404FBF50BFA05DC011F7B08D2F724040310A5A7D5EA65DC0D8A500D9B08240406E63E73993A45DC02BC6FBB69A844040A56A5154A9A25DC00F17719B627E404020775F1976965DC01311BA63DB684040');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('6','ECOMAP','CO','COLORADO','F','924','0106000020E61000000100000001030000000100000038000000D9E69C5DD88259C0D79FDCD31BD242402A1F794DB08259C02233E49A71B14240D826F79B618259C08835395A977E4240391BBD78DABF59C0C7CC02A1CF7F4240C35D39C1FBC459C0DD624F24F87F424069824DB797FF59C09CF344C34A7F4240DE8C00E45A495AC0ECEE776B217F4240A53C724AA34D5AC08FE503AA0D7F424008CB3054A96D5AC03D81F8C04D7F4240FEEBE3ED7C7F5AC0C68FBC58037F42402828AC25389E5AC0CFAA509CE97E4240013C87B31EB75AC0BFD1F2FCA77E424036CA74D3FBB85AC010F935FAE17F424009D14EE24ADA5AC04F85B4ECAE7F4240D9D734CA3CDE5AC098228DEAD77F4240F0D2B198D6175BC004F45AAFEE7F424076244D4C1A435BC052D6EBED917F4240B517BA26EB425BC0528FF3BABED0424008A5C9E4C3425BC016631EFB96F14240299C541DC8425BC0F32ED95493134340BDFF9F3A93435BC0540A3D8B591F4340A53F5CE473435BC0EC1C98B8503F43403E5DCB694A435BC00D32F52234AE4340580682036D435BC0E6D94A6653C2434063EBC9015D435BC03718741B25D44340291856E547435BC0222B3409F21A4440A1891437F4425BC0324DD54028554440F62F859617435BC0DC4D47AACC7F444064D8F182CBFA5AC081049F986E8044402E63779275D35AC08B2C7D5E04804440FA99495963B75AC0A7477B73CD7F4440E340336510955AC095DDBC3C2A804440D28733AD058D5AC0FE7B0AC9028044404600E3D1D7515AC01E57795E887F44403D6D6FBBCE3B5AC016980BDE447F4440A446B2244F035AC038CE873A69804440E3D377D4A0E459C0DDD3F87AF47F4440A22BAC5C82D859C0EB83CD5D0A8044405FB512CFBEA959C068095E88C27F4440E0F3F7ACC2A759C010CB0E0A07804440D50628290E8359C0018233C9C07F444062352BEC018359C0F9DF11E51E5F444081F8962DF28259C07F503CC241594440C231B6360C8359C06544738E2D374440C8C921FA0A8359C06BF35AC6DB2B444032FF015C4C8359C021A1CA8DDCFF4340CD48F3102A8359C075897BF1CAC843403B21BD901F8359C0372E30F209C8434082972161108359C078E45A7539904340C4DEC45D228359C0431A2C83BC844340D9888F5C0B8359C08DB9E47EA5584340FFA7659E0B8359C043B4FAAEC84E43400DDF1549EA8259C09484323EB5214340A1BE70A9F28259C0ED27CF3D7D20434099831A83D08259C0BF7307C600DE4240D9E69C5DD88259C0D79FDCD31BD24240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('7','SIMS','CT','CONNECTICUT','F','925','0106000020E61000000100000001030000000100000028000000B4BDA6F1F16152C0096F6853E9C24440886868F1186152C050D01F3435D544406FBF04A1FD5E52C070DB3B1F12064540B91A76A4EB4252C0284680D1A5044540AA0C7DDE634052C0647FF2F29B044540017EA4BB403452C0EE802AFB490445402329B3DC543452C0236099C2A3FF444073AFF5F21F3152C033897703470045407F3D8090603052C0BF48781D5504454039DC3F7C022752C0C869CDA1E8034540E1720F9CE62652C0E6E81623EB0245402BEF68F83D2552C039B4B203C4024540079A0EF78E2452C0E1F59522DB03454003975E0E7C2052C01EC4E023F0034540D24EA5E7B90852C00CE6A82461034540F1EB8204140652C0275AD0654D034540037FD58C59F351C04A2461114D024540D3A766AC0FF351C069BEB1138C004540813661AB72F251C0715CD57F5DDC4440CF04440BBAF251C0EA8C8C1F25D24440CDCFBF8A92F251C04DB3B99FF7CC4440DABEFB2560F351C0F011DEE239B544404A94FACA24F651C016267381B1B344405403F3458FF551C0DAC5A264C5AB444004A771E641F651C00FD9CF04A5A9444035F9C5A877F751C0BE193A8450A944409343E6B7021252C0B59F4593FCA34440EEDE97FFE21452C0F2D9DCF612A54440A6126DE8371852C0E17F275BDEAD44407AE27EA8331852C02B5F63DA98A3444020085761BE2152C0B67DBC01C1A144406A697AEF073A52C00BA6586E91A24440D9712BCBAE4652C0C1D09EF09C9444400291B83BCD6952C01E20F952CB7F4440F453409CD66952C0172668719D81444040182A4B6A6E52C007721868D88C4440A9FDE087995E52C0E0931704FA9A4440324B4C74376352C040E12E5D95A54440307A4AB3D56252C093DF8819C2AE4440B4BDA6F1F16152C0096F6853E9C24440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('8',NULL,'DE','DELAWARE','P','926','0106000020E61000000100000001030000000100000025000000E0F066B140ED52C0112D6B275F474340BBD23C517CED52C0FCF02140285343405D4F51B15FEE52C01FFB58B9466A43401B9235362AF052C00726D2EC219243403C4CEE59B9F052C0C3465401BA9F434056C53B9BEAF052C0BA920803E2A5434088D4593E6EF152C094091F070AB1434006D21D4BA1F252C0DA8544A4A7DC4340346A436898F152C0179A4725BEDC43408DEF9CC7B7EF52C0D3C416E330E343401467362077EC52C02EB7E6BF04E943404E46E43337E952C033FCD9A04DEB434085AC632257E552C07D785E0589EB4340E7D18A4014DE52C0A9DBC84ECCE94340EDE06EF2E8DA52C0457B2D1445E643402827D62F5ADA52C08523443517E54340BEDDE0925EDB52C0424CA8769DE34340B146D81877DD52C03A74E8D8B5E14340DF1F239B62DE52C01C84765AF4DE434003C9CE5C76DE52C08ADB8BB92BDC4340357FD55F50DF52C05ED3727980DB4340A314826010E752C09EB833AE73CE43404B0D955702E452C07BC5FB0E8EC8434099DCC1DEBFE552C0C8C65C6B60BB434010359352F9E052C058FB778CFBAE4340A481F65FBCD952C08D1EBEF3FDA04340671F5A7B6ED952C0FD6EE0F15C894340D5E6046CC4D452C092AD6B9099814340170F59A8AED352C0E578BE4F177943406611155032CC52C0299C632D866743403D4816FB4BC552C03DD2A1EC6366434048E7B37CEBC252C069B15D908C394340570AC6E058C452C0CDEAAB119C394340D0E72325EFC552C07AA59B13AC3943403E0609D163D652C0F2026004483A43405C53F52DB9EC52C028442192493B4340E0F066B140ED52C0112D6B275F474340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('9',NULL,'DC','DISTRICT OF COLUMBIA','P','927','0106000020E6100000010000000103000000010000000C000000D8B7ECEF814053C065C9C2BFBB7B434035E31C434C3A53C02563D8CCEE714340D2190FB2E34253C04A3B7ED9E46443406262DD903C4253C028FE181632684340ADE92072DF4253C0113D72532C6A434073C1AA11914253C0C72018D2546B4340F98ED1517B4253C03387A4CE676E434070C60E55534453C00DA3BE6A6F71434092330A96084553C077923906367543407304173AD44753C02F6F376351774340455BE992B14253C035F35E5B2C7F4340D8B7ECEF814053C065C9C2BFBB7B4340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('10',NULL,'FL','FLORIDA','P','928','0106000020E61000000700000001030000000100000031010000CB8EF24A483254C008D2A17902C93C40B8CE4369CB3054C0C685056D80BC3C400E09E730413554C07B434B7E43C93C40626839F3713654C086A8A9A023C93C40453277F5D12F54C0972F175D24663C40EEF468EF801F54C019154106C4DE3B40A9370C52992054C01DDE6DA561D33B4013F1D5AED61E54C06BB1C93681D83B405BF78029B01954C0FCFCE72E1EB43B4093508547DF1654C071F24EE13F8E3B409B166A3B560F54C095DFDAF2BF433B409A7E8A722A0C54C07BC72206892F3B404C6F34D8550E54C0BAB4BC910E373B402F6E8E60891254C0A6DD625EC83D3B40E3EA4024EA1454C0B7D7CE198E3F3B40A07FDA3F961254C005928F8F7D363B4098A77657290E54C060F5A878ED333B4072B13F4B780954C04B1704F8EB1B3B407E25B282C80554C0D1491BED5AF93A4045A2B3C5550754C0F318D96A4DF93A4016BA531F420354C03BB1A32615CC3A40862130A76B0554C0A11EB97A8D533A401BA9AA8F2D0854C0333A49D43FFA39407F303BBB5B0C54C0F64D667B91C23940707E750D4B1354C0F132D6D51E9D394023827E931E1554C06A7F77A1717D3940725AAA91531354C05178F917B5663940701EFB1FAD1A54C040D2CCA0F93F3940EBD4FC80EE1A54C028C2154B3531394075A628F0512354C0E90269845A36394077B9A7A0672C54C0124CE911FD26394020C185D4D53654C087A64F84852F3940DB69C3C4743E54C02FB55E8968213940ED85F6F59D4754C0849FDE315A223940319685997C4954C0E23B0224292A3940608F571DC34B54C0F70BBD4AD54439407CDE1716FF4854C094F590A81D523940C5EADF68BD4054C0B6B55BDDE43639406DE807A1DD3C54C0500D917FD93339402E44EFDB933A54C0F579DC64293F39404DAA59A15A3E54C00886AEBC8C523940E3AB7E332C4954C0E4D87C7A966539405E685D36895054C05139F1925CAE3940E3473FEFCB4C54C00CFA423CDEB53940AC85A3B2655054C07BE09C2598CD39408DEC0EAEF76154C01613110D27EA39401D282782F86D54C0586E6BD76FEC3940D97E261E2A6D54C0AD383A450B003A40C26837A5DC7254C099E73C24751C3A40E50E3942167454C05BA603D6D2483A402E2621C45B7654C0C8E02ADC0A553A40B2624E414F7754C025294F9C86703A406C1404094A7C54C069BB4A2EB2773A40CA255EAAF57D54C09881222F73843A40AFC24B05717B54C0C53DB880F4883A40F62268FD977854C05215DAD29AA43A40A27332D0877154C0CF1E81FBD3B53A40739D511E6A7954C0216609A5ECA93A40970DBFE6717C54C02D88B5F6FB8C3A40102D07D05F8154C02257EB6B51863A40EBBDF1AF5A8554C0C6E5160F3EB73A408EE6E18C5E8454C041E20D2B58C43A402D2BBD28508354C09B0E4CA5E0DD3A40A653AA8B438654C03E70C622FAEB3A40B2D5CEC0737F54C077B1D7DF8AF63A400C01FA1DAB7E54C0ED5F21311C083B40A76E59DF8A7F54C0839D8DF21B083B400AFA3BE2CF8054C0FEEBCB38FFF93A40DBB66530CE8954C0CD659A7BE3EF3A409A1015387A9054C06A314FF220013B40FC0BC9390F9254C0A6C56F6449063B40D5D76E387C9054C0C1001CD676FF3A404DF815B34B8B54C02E6E3ACDE7E93A405E994354D88954C0699CD6E145CA3A404DA19ABF8C9254C0EB46991F92D93A40D0C1F062BF9654C0D7FE8FD9EAF23A40087A68A57B9954C00A36C0B79EFF3A4061755444989754C091D0581AACF23A4097452C03FE9554C08E022E7954E73A406ED55185529854C058D014FB81F23A403B4E448A71A054C0338B6A7AAB3C3B408649E40BFEA154C0820EC787A1423B404461B44BEDA054C03503F74AE0353B40750EEE2E7AA454C0C4ED2B3A37463B409E6E9F6A18A254C045EE56F7F0543B4087C04C2C32A454C0D005228EFD623B4006A28F33E6AB54C0FE28ECE14D793B4039C1358FE3A854C0F00899B4E2803B40D1C565F19CAA54C0B3F4D3B75B7E3B40485D9A12A1AB54C0E88ED30041863B40BF0E4BC43F9F54C08408E799627A3B407E75DEA5E8A054C05E415BC011833B40EF4768DE569B54C0B06F701ADA853B402C8F6B2AD6A454C0549D9CB727833B4099394B8FE1A854C08246DB1D61893B407E9D106A74A454C08D5C9D9B7E8D3B4062E7990879A354C01B6DE7A70D953B40FD99768E16A854C0AFAC0033218E3B40B8564A0790A254C031CF97D6AC9B3B40739A3C285CA354C073D63A1BDEA43B40BD45BB5AE19954C0275DCA1FA8CA3B40D52CB23A869954C0C00977FEFDE73B403A58ABFF809D54C067676A03AEF03B4039535BA1EB9E54C02DB74A276BD23B4037B8C7A3ADA054C0F53DCF9FCBD43B40D31653E67EA254C0EDBFA4E08BEF3B40869DFAF050A954C0A9D76B8562073C40935A6DD1A4A954C098E63873D5013C408481F395B1AC54C0F0EB35BAD10B3C40114F74D30DAB54C0AB087A10B1023C4083F140B6D7AC54C0964101C5B0F93B40B00AAD7043A954C0727B9D0B72F73B404D12B4586EAE54C00B97D7B8C8F03B405C33F4E81CA454C0484003E2E2E03B40DB90A6EEE9A754C09C8E851139D93B4043E38A7041A954C074ADE9C139B73B4086CAC8B369AB54C0F8348E67A1B43B40DAB95540CEB254C0B0A2933364D43B40A95870389AAE54C0D9EE9BFCBFB73B4030543B996CAF54C08DF0101095AF3B408EEC4EC608B654C07B8B39A1C3D93B40A58B3D7FDDB154C0C58DD0864B2C3C40AAD6CF3A1AAB54C0424830DFB26D3C40EAAA1077B5A854C0E73777FE57B13C40125EA3BD9BAB54C0C2A04B23F2CE3C401DA358BABCA854C0BEF5F68474D03C404F255A5EBEA854C0AC82DC377CE23C406B52083357B054C0DFC7259037023D40F233288A56B354C0F00623C1B6273D40CA5F55135AC254C053EED35AEC2D3D4081158B3FBBC454C06697DCC901443D403C964AE919C954C0B1DEE2F4B54C3D40440D86C6F9C654C057AF1ACA03543D4066EB262F2DCB54C02DA1935CFB573D40B736123AFFCE54C03AED4287166F3D40666EB96E52D854C032B8258316853D409E306417EBD954C0F2BF10136BAB3D40E85A398B3AE354C025BDB835C1BC3D406FE62B21DEE954C0AAEAA1CB34E93D4017E0E6F530FE54C0BE243DEFD5133E40AC9A3FA8C60455C03024C03496193E4090ECF873760955C0114324EDEB143E40A2A1E6A3EA0E55C0DA0C5935AD1B3E401CB89AB4A61655C0BA0EB8E7D2113E40452E1111111755C0194E764736FA3D40577A611D031C55C0517DC10CE6FD3D40CF6080FAB71B55C0100988C1A4F53D4051DFFE2BB11555C08167F9DD77F23D40EC2ECFCA331655C030204AD100E93D40C71B06FDBA1D55C064BF3E0DFCED3D40FE52B7F9E93655C0AA6E304232BF3D40BDDC32C36C3B55C0F02BD42A29C73D40E772DF07403F55C074CF79C64CB83D40F5179FA0BE4D55C04B020E4899B33D400B29BB2D5A5755C05DFD1056DAAE3D40251966F3365A55C050825C29DAC63D408CACDFD37F5A55C03CCDBCFFF1DC3D409FD4D3D1265955C015AB7A181BE03D4002A4DE52C35955C0503929805BCB3D4063216E2DEA5655C0303C3A12F6B03D407F2E3C299F5355C00B263E4AA3B33D40EB75A7C93B5355C02D5B7CD24ECF3D40B1581B71A05855C081E6E5407EEC3D407F268E4D396855C053A8990FB4173E40C38615C6626455C0FFF78DC629193E40D5079FBA2A5E55C056D4D3D998053E40D9E730948F5A55C0E6BFE2D113083E405F7B1B36AC5B55C022C7BA8DB60B3E4022D789107E5855C03671049236063E40AA749E707D5855C00F1B060D4A093E40875AFFB1525955C047FA2145FE0E3E4028D48959B75D55C06E844A0E190D3E40D7A4F8E0E66155C0FBE57034B6213E408FEF99D86D6D55C0C5A2B818C42D3E403A7A4FB3A06A55C0F42B2EB86E403E40374D6A4A696655C0476F566F4B403E403D5E5849726455C0EDE7B8F69D4F3E4082D27B7AE56D55C039C04A19DB433E4005CC6D5F2C7055C0682A9690034C3E40164D5B4A6D7655C0FB0A72A1C5473E40BCD9B1C71D7555C06DE61FB3993B3E403D2F61BF817055C0D1AD272C9C3A3E404F71183A7D6E55C0DE0BFECCFB203E4019D5A4392B7F55C0F45AAA1241463E40AD0E3723CC9855C0E309DB9C3D633E40504FBB0F57A055C055CAFDFBF3683E40C0F65DC3D69855C0A1FA4575F0673E4020878CB35C8F55C077F4F90B5F663E4078664FD3758F55C08241C1FFB36D3E40E5932046568755C0D2703DE9C3623E40CC559126DE8755C056A978972C6D3E40F31709100E8E55C028BB9603E47C3E40E928FB02D39855C0DA3CA49D50763E403F32FC09F89C55C04923651351803E40C08F6E1A0EA755C02819846E746C3E405A9E260E95B255C0A65FD5A4FF6A3E40CFB0575F60CC55C05667A2D0EF5A3E40787BC241AEBB55C0A8037D31AC763E40708674EDEBC055C0DB84B9FBB1833E40B934DBC91DBF55C0462F087626973E40E8C64BCE40C155C0280FE63664963E40C48B36F36EC455C09869733258733E403C66045CF8C755C0C92D37008E903E40742402C2FACA55C02A334BC3C78E3E405B61D91E3FCA55C006374D6A0C773E40D107CF8987D155C0B7C1B58E7D5B3E40DE12DF2024DB55C01D020223DC523E409B1BCA4031DA55C03D277620F9663E409623D11732D655C004EF59B3766E3E402DA7A9B83BD655C02AF9420909753E40F02861E4CDDA55C0228A02BE507B3E405351B9A980DC55C0C6C6F52709883E401370D12603DB55C03765175D768E3E40C9B9D5832BD955C06AA2B1C2BE9E3E403924126683D955C03DC6DF0D03AB3E403E28DE29CFDA55C04C59CA015CB13E40157F0EF172DD55C03277FB7AAFB43E407D6D98DCB3E155C087A9AD269DBF3E40CC60FB7DAEE255C05E09325423C93E409F657B276BE755C00D9330F429D93E4016E492A80BE855C08B99FFA57CE03E40303B7462C0E555C0E94D560151F43E407A9687234FE655C0072DAB68AC003F405256DF8470CA55C0BAAE9CE9CE003F405013D50FE1B155C0E348BC7F89FF3E407635AB26EBAC55C00D34E1FB82FF3E4039522024929855C090E17774D5FD3E40C61C504E9D8B55C024D68912C7FE3E407ACB385E098255C0D35922B84AFE3E4057AB3768245F55C03E99816741003F40F1A838680A5F55C0DB59D2A741003F402500FE541A4055C0CA1B4E2452003F40AAC69B53024055C0CF50F5ADB4FA3E402A1BFFEE4E3E55C0D81D59B5B2F63E408AA3184C043E55C053DE910456ED3E401C784986043C55C0CCCCFAF11BE53E40305B55C2523B55C0784EF9E3CFD83E4077DAAF20AF3B55C0AD6FB0D578CD3E40E91CA93E523B55C0EA4E71BFADC63E40B2327EFC943A55C0C3B535070CC13E400D483EB9D93855C00E5284886FBE3E40E06E2E54553755C0D1B1B1AEE9B63E40368DE8733B3755C0ACE9BF2E71B63E40265063F5F61755C05497BE01B0B13E40B6C571C5061255C0D33A354FBFB03E4025BAE002D60455C0D0CD8D42B7AD3E40A26568F60B0055C0E6944709F0AC3E4050F6DCD538EF54C06D162EF315A93E40ABF243C6FAE654C0B34FE1D199A63E401A0905E2E0D354C05076AFB261A23E409D8AA1C048D354C017B63EF61EA23E40853A4FE779C854C059DE253B109F3E40D7239E1891AC54C040A82B1D81983E4044B6622D4FA554C05E155C3ACC963E40CD7B9700A49D54C06BFB83292B953E40FA04D5B95F9A54C0DA80E66CCA933E40DD721783258E54C0DE1EBBE42B913E408028DEE1418F54C06E39F9C20C883E406050E21D0A8E54C04EB745ADC2803E402FAF817BBF8C54C087BF1397717D3E40ED1C4CF9278D54C058954AA4816C3E40B87E89F4888B54C0211E38985E5E3E4032B9DD72898A54C0D8FAEA9E7D5C3E40C9491B88608354C02C6478A2215D3E40AD6C6A67748254C038C7DBE3FF603E401F89464BF38254C0928835171F6F3E40C780B96A3F8254C02930207960713E40BF119FCB708154C0F03423B74B7A3E404FC3DD0D5F8054C0325F7C6F2C923E4082A896AFDF8054C0505E13C843993E40BB7500D5DF8254C0A4AA3416A2A63E4024AB6F570A8254C0F4672AABEDC13E40A5F8F274D48054C0E3473B4FA6C33E40E6962B96FE8054C0226B8DE593CA3E40E35BE390D07E54C081B0470F42C73E401BCAB70E8A7D54C0DB31F129C7CB3E40F879536EFE7C54C0F1429BC307D23E4020DF1C4D677C54C0D1B6FF0202D33E40F319D7C7147A54C0C9E13DE73FD03E4009932F878B7954C09AA524030CD43E403D62DF42DF7754C09B8B6DCB90CC3E40ACC24D99677354C0213E2EF0BFC93E40F67B1F95B57154C05C4AFA35F7C23E40FF43DB527E7054C0C3B7C69406C53E4069AFE4AE256F54C0F103E7378EC33E405E215F8ADF6D54C0DECACC7ED0BE3E402D721B5A1E6954C01874ED0CA5BA3E40FE313FD7306854C0328EDE8E55BB3E403D989291B46654C0DCCEB9D460B73E4037D93891796654C0BB3CD63392B93E407502EC82576254C07172EA3FE2B43E405D331D82D46154C0407D491FB1B83E40C247DC14EC5F54C010DE3A333E993E409DF506D6286154C05F054AF7638E3E4073978F26485D54C023C0C06D6B743E40D79A5366C55E54C091A84C186B613E4001CA165F5E5C54C096FDF0A1705B3E401CE73F77B25B54C0310C83162D3F3E40B1BC9F62605354C0A3F530C7BDE93D402194D65E415454C08FED9B1749D43D40A46B392A9A4F54C02DB570D7E9BC3D408D43FE04F64E54C06D9D0A2645AB3D40DCBD6E47084754C004361D29246E3D4089055924364654C05657D8840F5A3D40CB8EF24A483254C008D2A17902C93C4001030000000100000012000000AA64C4535EB555C007CF860B55663E40EEE84CCEA8B255C06E6A898A6A673E40515FA19BBBA755C0FBA44E11206A3E403DAECE7239A255C0B335647B23683E400C08A51175A155C0FE1A079EB1663E40644B93D216A255C0BB937220B5643E40295E93E745AF55C01389C30D0E673E4065E05CEEBFB255C04FE74D10FC633E403E30B8D369B555C01A1CB5F014633E405CE99DA382CF55C05D9E255B49523E403541744717D155C0761D045C49523E40E18081AB94D255C031517B182D553E40A6FA194B4FD255C068E9EF55FB563E40B74FA0DFEFCC55C0883ED4B7B7553E4066A0AE18EBC855C0620A44540D5A3E4007B3768E0CC355C0E8E38911915E3E40316BF5BF76BB55C0DF83BC10A3613E40AA64C4535EB555C007CF860B55663E400103000000010000000800000043A225E5172F54C07DA0B4B4F1C93C402FA98C67DA3054C0A6FD690973D23C40CBEF98AC4C3454C05043435138E53C40C6B1C671073954C04FA7F0C66D033D40C4CB2473A43A54C07D1B51F162123D40504389D18A3954C0205AC634BF0F3D400FA42E2F323754C05F28CD2DDBFD3C4043A225E5172F54C07DA0B4B4F1C93C400103000000010000000F000000141B4224752E54C0C5487F35CCC83C40EDF2A1A0192554C05875BE5514973C40756C2322A92154C04209F27CA5763C404AFA53279C2554C063B98446C5683C40733239CAC82754C06F43B707A4693C408E25EFE2F42454C05286928D748C3C40CA676621582654C02073AEAF9A9A3C405D259D253E2A54C0F67C99EB5F9E3C4009D88AC9472C54C0FEECB81E9E963C4079A5B4D0F23154C07B81C433749E3C40D71B83AE4C3254C06229762C0EB03C40D30B92270A2F54C09FC920DDE4B43C4028AA27A8423054C0C38E616CA4BC3C404858F061092954C0DD93D2D347A83C40141B4224752E54C0C5487F35CCC83C4001030000000100000008000000C04DC569122C54C042278982EE943C408C01F1C5D72954C03EBD4CF5D3993C407735E203FD2654C078F6B441D5923C405944542D6A2A54C03D552EC16A6D3C40CA5083F0B12A54C0676FA378454D3C401489A9AFC12654C073465F171B253C408D1E9A93252E54C0353DEAA3A9623C40C04DC569122C54C042278982EE943C4001030000000100000007000000CDA5DA35868654C00B9B202709963A40792C3BF5488454C09F9BD360607F3A40FA6C80B83C8654C05475A404737E3A4098D25077AF8854C06C2B226483A43A407FB7845ABB8B54C0BEACCF6CF5AE3A4057BFD4D43B8854C0E7489EC195B13A40CDA5DA35868654C00B9B202709963A40010300000001000000070000004A46770CF70F54C0080A6E31DD5A3940AC752E38C31654C0C41E6DFF81283940353597D69E2554C0B4ECD315D5F438400C948098981654C0C94B72F826363940B052E495231554C0828769709A4439400605FE78241754C0393A2E60E74B39404A46770CF70F54C0080A6E31DD5A3940');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('11',NULL,'GA','GEORGIA','N','929','0106000020E61000000200000001030000000100000055010000203BFD9E544855C0E2D243F462C73F405451637F6B4855C040038712A8C83F403A68ED20AD4855C0933FE3B4D9DA3F40D7B7179F5E4755C0E7605BFD4CE83F403910B4FA7B4455C066857E5B0FFB3F40D2F31BFAA04355C082D0BE6439024040679BE4FBF74355C02E08E5BC6606404022CFFC3BA04355C0AEB0B217EA08404092665BBBF44255C0D8A17372A20B40402B7EBD7D694355C0217CA4A9351040409AFE047B8F4155C0A859A48048154040C7FD0739804055C08137197EE5164040E864B5F3763D55C0A12BA01C91184040F5BA2396723E55C09C2923F72A1B40403CC6EE706A3B55C0D32FA1B7E61B404072C8B4CF9F3A55C0DC71A455411D40401B630F911D3B55C032763871AA1F4040E654246FF13955C08242B871F11F40400D76688E373955C0A52ED2AE2C214040D759092F413955C0379301EC65224040FA5E65D3F23A55C0B6CE3083852540403C3EF35D574055C05BE56916302A404003350F3E224055C023A381116D2C4040EC1726BC2F3E55C0BF9F816A8D2F40408911EEDD013F55C0B1914D468C314040456B483D243E55C071CA28C3CA32404041F073DEC83D55C08F244B39F8364040AA981D21593F55C029587E12383A4040CC1F01C4B83F55C018B9683F6C42404050657891874455C08664A886664A40401B802DB4624555C004760A3F2F4D4040ECA53C55864555C025B2491771504040EF5E46B8A44655C01D8ED730AD52404032056257CA4555C06A3DBF288C564040BA50311AE54655C06014EF0351584040178B479C494755C039E77B76005E40406854451EFE4755C05682F6F2475F4040E3BCB6FF874855C0BB8D9AEFCE604040DEB98B9F324855C00481B60A77634040045E2825634A55C055E10D625A674040E98F8FE9904B55C0B361A291976F4040EB0C14B6F14E55C0B38A66BA608F4040DAA17056F74E55C0A914EDD88A904040B1786907CE5255C06C8F651883B64040C2E827CB845355C054FA03C9CBBE40409294ED56755555C05CDDF284D4D34040C2568AA2935855C026C8E477E4F34040F64BA4C4535955C091AE7EAFDBFA4040D7B28F09A95A55C029FDFC34200B41409D202E53755D55C06FA8280324254140B6F2633FC26055C07E57AD26F2424140DED02044A76155C044E557FAD64A414011D35467386255C0573D44B3AD4F4140417FB3D2506555C01A8EDC96606E414018444C34F96655C010E302B3BD7E4140EBED0E9EE95D55C00B310D60BC7E41408F922752095755C083247E9AB77E41404D05A447225155C08662D1759C7E414069FAB73F423E55C0FBCBE67B0E7F4140E108255FF13D55C098D2EF3B107F4140AF2FE1073A3355C047C0C820157F4140B83BC5435A3155C0C4BDE521D17E4140FEE8CC87982755C0ECB9FCAD8F7E414050EA75B4B81455C0D18B1C859A7E414068BF02CF8F0755C0D357E6D7807E41402B8D8DD542FF54C0C011C4869C7E41403AB91C8A06FC54C0174EDE32A77E4140E94EDFAF27E354C00A2E9F25AC7E4140E9C5C526D3E054C0DD2155A6FD7E4140449D8446CBC654C068C32C040C804140769A65C76DC654C0F065C107F97D41405F5E7A0B65C754C0AEB6F52E337A4140AAA9940BC5C754C0F959708DFE7A41402B97C9EC25C854C0C74F10EF287A4140BE85B80C3DC754C0F3F347F3D2774140272EB96D0AC854C099575BD26B784140444F3BD0CDC854C029D65CD41977414081C815F2EBC954C01C1638F45477414032F5B57322CA54C0E75CE29675754140439762D7A8CB54C00CB7081890744140377D805C06CD54C02A7EBF7C2C714140ABB60F1E0BCE54C02DAD66BBD07141400A113441E6CE54C0E699555DD96F41400B2D14828ECF54C0808B34FC6470414052A2CE8215CF54C0ADCD089F626E4140F509CD0505D054C0A0408F40D26C414002F0DCE606D054C04ACEF1A17B6B4140E741F52823D154C0B251EEE26B6B41403450F78B49D154C099FA82865468414037D33E5160D354C0DA37EEA81B67414084E265F6A6D454C07058016CC46441404D0B1CFBB2D454C083DD54304960414067EBECDF6BD654C09D6C9DD61A5D4140DE403AA071D654C0287165BAD55A4140CF3E961EBFD554C0E60D13A2BE5641406F3DB31721D354C0B2A51065DB5441400BE9ABCC2ACF54C0392D5652814E41406A3D3B608DCA54C09A0CC0FAA94C41400B2FED3E2CCA54C01C314DA0D549414068F8E79ACAC854C0309662E3AF484140D3C8C274EBC654C0F762CE6B7B444140DF4101AF0EC554C061985CB06D424140C9D5F70885C354C024B09256BA3E414014FA063F82C054C01E9AF21A443C4140D0F29B7AD8BE54C0A81886DBFD3C4140D6FFDE6BECB954C01F0DAC9F2E3D41407770C8038EB754C0AF8075C4903A4140F5E9EE9C05B654C0077CE68BD2344140D0F2713988B554C0B16AA9717E2F41408C391BD3BFB354C0E86D24D7812B41406E458B8C1AB254C03F79459E2F254140F3204229E8B054C07E35CF80F62341406105E28783B054C0A33D162ADF1D4140EE4822A786AF54C08A988E944F1A414061E12C0817AF54C04CF883E1BB154140C960F54243AA54C06BF8869CDE0D41408A999BA196A654C05C2395F96E044140BE525F2227A654C03C141EC1B7014140AABE2C01B6A454C07C343F0F05FC4040AAB89B41E7A454C080296FF1C9FA4040BBD0AF591FA154C03C6E95FB2BF7404032B8D970399D54C0032808AC69F0404044D59D6C2B9B54C0084C12D31CEE4040F340B688FF9854C02331827754ED4040DBFC46C5679754C0C401025E02EB4040A82199E37B9654C0BC73661FEEEA4040C40AC05DE99354C07DA847AAE6E640406770557C8D9354C031B5C3CF2DE440400051D8B6099154C0B559FFF77BE140401EBF5792088F54C095FFB00B5DD84040257E0B90B58D54C0AE94384F22D7404024CB76CD4C8C54C03CD698FCD9CF4040011CB04AB28A54C0AA85605FBFCE4040EB2CC207E58854C0FAEDFE2305CC4040F0569D25738754C0FC19E3A321CC404093B24320348454C012F4F56774C940401A82AB7D778254C007EB7AAB14C64040B54EC1FB498154C0D869742CF5C44040D4D89C39C77F54C0C490D06E9FC24040BCD11E58C77E54C04ADFCD75D0BE4040BF0B39B4ED7B54C007685A5F4ABC404095C4CB32AA7A54C0D4F6AF46C5B94040B9F64974587B54C0E9D6808AD3B7404023E58CD3777A54C0996709322DB54040E3DE2D762E7C54C00461D3B13EB44040357AF275407B54C02726B71C33B04040F6027EF77B7C54C0C430EE5A46B04040D33C8717F37B54C037B77E23DBAC4040BD5D9295547A54C01260D245BCAC4040452723B65F7A54C012D9116B85AA4040D1E686D42E7954C019F22E0BE9AA4040FF6042B41E7854C0FD45B67446A740409CC3F812657754C0FEAE0FD367A840409C7B6F51C47554C0959E0AD777A74040C4574DF3157754C0E4A8EC1807A64040B733EF91E67454C0E9562F837CA24040A349DEF2BF7554C0867A37C1FBA240408DCC2A138E7554C0F38F30C55BA14040A173BC54A77654C0168179092B9F404087BFB691E37354C066754511FC9C404069E530D14C7354C01476EB579D9A404062239BCFE87154C0C0AA4CB6D29B4040A25AE5AE457154C0E9F8B877609B404089BD232E9D7054C0533B913E02994040EDE957AEDB7054C017732126BD9540403F97834C626F54C043FCEC6E85924040ED9B3AE9126D54C09BEACA75BC8F40405EA85D011A6754C08A229A803F8B4040F43E0800226654C0F0B5FDA50F8940405AD6F89CD76354C01CFE8FC8C88740400118CEDB0C6354C0F70BCC6D97854040591978FAE46154C0922A766D9F854040168E8D588F6054C0B80B7536A3814040AF8DC4F7885F54C071EBF2B89D804040C64EFD96DD5F54C0839C2EA9D67A40407192DB37A16054C02A0B782A4B7A40401B6BCDB7A76054C056EF878D3E794040B523DBF4875E54C0E34C85A1E3724040F7BA5D14C35D54C0EA3FE7C1E8724040CF6197D4EC5E54C01C7D09C923704040562957B3585D54C0DF73550C8A6F40408EE266F2235D54C0576AAF161B6C40406DF2DD50AB5B54C0D4A01639BC6B40404B8CEF2F225B54C03FCF787D776A4040F895EB2F8A5B54C012FD62C1FF6840404A2BEFEEEE5A54C0AABBEB859D674040EBD2B70E895B54C01EC441AEA064404093A656ECA05A54C070761E7ADC6040403196B60C135B54C078FA49DCF95F4040501BC98B165A54C07E342781F35E40402B3A900DEA5A54C041C442F2CC59404025FF016D0F5A54C0C828ECD9E55740405400790D915954C0CAF4A4EA4D53404010CED8EE5F5A54C0EC33F2F413504040CEF73F4EA25854C070DC4BE5454C40406034BFED705754C06012CB8A4F4B40400EAF0B0E785754C090B7974D7E4A404049C04ECD7E5654C0B1769D0EB14A4040B5905F2DC95554C052CAAA55224940405669E68B225354C0620A5ADC9C484040ED2EA32B8E5154C08B76202504474040434680AC265154C0D06C63D05744404076D4818D1E4F54C02C4F607AA342404029D9ED747D4C54C0EBE6EFB9763B4040983B4A9ACB4C54C00442EBEECC3540408097277E684B54C0AC96A2A083314040974B0EC0764B54C00FE5AD87962F404046CA0723144A54C030124BD85B2B40405B44CBA1144954C0E4CB07959A2C40406C17E7E2704854C03A76D93C932A40401E4CDB67F04754C09BBD98166923404004E129AB7B4954C0AD294EBEFC204040EA8270CB734954C09FDD21ACBA1C404019283789574754C073C62D5C65184040A5F83C899F4754C0A4CCD8F90D0F40400366EA48B64654C0E05F55417F0D4040EF827EA4433954C0C348A768C40040405C4051BE4E3E54C0E9296274ABF23F40268548D3223E54C034AC649DEBE33F4037F7D350F34854C02733166B45DD3F409D495618854B54C005E7D57AE8E73F40FAA496B7434D54C022F952516EE63F405118CA9AA04C54C007AB0A497EEB3F40ABB039DC0C4D54C016FAB3BFADED3F4044FF3BF8564F54C0413C933F46E73F4043E5F7E0315254C08E5BACB60DF33F401527E636AD4F54C0968404830AE53F40D131FF1A374D54C0A4EBB4C3AFEB3F40C8629536164E54C04A364DD0A4E43F4085FA0537894B54C0050B18E0CDE53F40439D10CF0D4954C0EB8E2E1280DA3F4028D2F0277F4254C0FCAEF4B8C7D23F40B370C11FE84354C08FF3770E0DC73F40A2F2B2B9C14854C03497968221BA3F4075A84806234B54C0FAAD1468C0CC3F40CAD44944914C54C0E10D3987EBC83F40DF9A151C364B54C0F6803C8E5DBC3F4044EB02EC8A5254C0B69639DBB6CC3F408588C5CEA24854C0BEC010DA64A53F4034D5C1EAFA4B54C0D46DECEE92993F40E345DFF1674F54C09B797D6AE2A33F40D4CE53274E4F54C0B0C911E48F8E3F4060D7B31E774C54C0E065D9A651813F40D290343D594D54C098E5FE9486773F40D418CF45095454C0D363C1CA6C563F4098A8FAAE655754C01CAD74BF34583F40AF3A0015435A54C08EB4E12ABD4F3F40CCF91BF0435954C0758CBA669B433F4094E7C750E25854C09C06B2F5114C3F40F7C61EE1405354C0D6BF07119C463F40AD6E4721DB5354C09CF60B41213E3F40D74C5067625854C0B58E335021263F4045AC551CD16154C0C4FDFD9C91213F40A16DF1D89D6154C049DC5A0B28163F40A71FDCEE6B5E54C0AAFF0101380B3F409443B979446254C0131D634DA6133F40AE23372D6A5F54C0051A742F5EFC3E40F48167F1D36154C06265676E4DF63E4098F16C69075F54C0B8AA70F9E4F13E400894368BDF6154C01F5D072362DD3E405C85517EE55F54C04690727EECC13E405D331D82D46154C0407D491FB1B83E407502EC82576254C07172EA3FE2B43E4037D93891796654C0BB3CD63392B93E403D989291B46654C0DCCEB9D460B73E40FE313FD7306854C0328EDE8E55BB3E402D721B5A1E6954C01874ED0CA5BA3E405E215F8ADF6D54C0DECACC7ED0BE3E4069AFE4AE256F54C0F103E7378EC33E40FF43DB527E7054C0C3B7C69406C53E40F67B1F95B57154C05C4AFA35F7C23E40ACC24D99677354C0213E2EF0BFC93E403D62DF42DF7754C09B8B6DCB90CC3E4009932F878B7954C09AA524030CD43E40F319D7C7147A54C0C9E13DE73FD03E4020DF1C4D677C54C0D1B6FF0202D33E40F879536EFE7C54C0F1429BC307D23E401BCAB70E8A7D54C0DB31F129C7CB3E40E35BE390D07E54C081B0470F42C73E40E6962B96FE8054C0226B8DE593CA3E40A5F8F274D48054C0E3473B4FA6C33E4024AB6F570A8254C0F4672AABEDC13E40BB7500D5DF8254C0A4AA3416A2A63E4082A896AFDF8054C0505E13C843993E404FC3DD0D5F8054C0325F7C6F2C923E40BF119FCB708154C0F03423B74B7A3E40C780B96A3F8254C02930207960713E401F89464BF38254C0928835171F6F3E40AD6C6A67748254C038C7DBE3FF603E40C9491B88608354C02C6478A2215D3E4032B9DD72898A54C0D8FAEA9E7D5C3E40B87E89F4888B54C0211E38985E5E3E40ED1C4CF9278D54C058954AA4816C3E402FAF817BBF8C54C087BF1397717D3E406050E21D0A8E54C04EB745ADC2803E408028DEE1418F54C06E39F9C20C883E40DD721783258E54C0DE1EBBE42B913E40FA04D5B95F9A54C0DA80E66CCA933E40CD7B9700A49D54C06BFB83292B953E4044B6622D4FA554C05E155C3ACC963E40D7239E1891AC54C040A82B1D81983E40853A4FE779C854C059DE253B109F3E409D8AA1C048D354C017B63EF61EA23E401A0905E2E0D354C05076AFB261A23E40ABF243C6FAE654C0B34FE1D199A63E4050F6DCD538EF54C06D162EF315A93E40A26568F60B0055C0E6944709F0AC3E4025BAE002D60455C0D0CD8D42B7AD3E40B6C571C5061255C0D33A354FBFB03E40265063F5F61755C05497BE01B0B13E40368DE8733B3755C0ACE9BF2E71B63E40E06E2E54553755C0D1B1B1AEE9B63E400D483EB9D93855C00E5284886FBE3E40B2327EFC943A55C0C3B535070CC13E40E91CA93E523B55C0EA4E71BFADC63E4077DAAF20AF3B55C0AD6FB0D578CD3E40305B55C2523B55C0784EF9E3CFD83E401C784986043C55C0CCCCFAF11BE53E408AA3184C043E55C053DE910456ED3E402A1BFFEE4E3E55C0D81D59B5B2F63E40AAC69B53024055C0CF50F5ADB4FA3E402500FE541A4055C0CA1B4E2452003F407E1A0375164155C0788A289E81143F40C8B4A2B56F4255C0FF0C774670203F407F7C52F7644455C0F62D9FB190293F40D0F624B9F94555C0BBE0BB09162C3F40424974D9964655C0A1E0EC7B69323F4002069A98FD4555C0B506E28D213A3F40E8A2E7789D4655C08ABA19D77C453F40E9A737D7324555C03B8F74AC964D3F40B23A39B7484555C021B5BDDF13553F401D8862D7A04555C0FFD6AD0F035E3F4023DDA514EE4355C015BD9551CF703F403DEDCE743E4455C054E19801E1793F4040774A92BB4255C0BD2CE46E08853F40A75854F2BB4255C07145D47DEC8D3F409659B154CB4355C08CD5CC3B0B9F3F40E5A656FB1D4755C00F9B507D2AAF3F40F1F48F5C984755C03139BAF264B53F40E5E27FDC604755C0108C1DE847BB3F40203BFD9E544855C0E2D243F462C73F4001030000000100000008000000A5628D260B5F54C03D83B4E164E73E40ECA5AD61A65A54C009CDC03E79F83E40FE0D7D9DCB5954C098D4356755F03E4096570A762A5D54C0597491C967B73E40CBB35E7AAF5E54C0D8ACB463A4BC3E40EDBA8BA1125E54C05EB284EC39DC3E4053EDB327366054C0570B4163B9E13E40A5628D260B5F54C03D83B4E164E73E40');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('12','HI-EHW','HI','HAWAII','F','930','0106000020E61000000700000001030000000100000009000000196543995C0264C0DFF087C311013640645ACB38970164C05A5DA452F8FC354074C1B81EE00264C026AF737276EA354026558DC4710564C0678EACCB1ADE3540785453E9780664C05874FE5899CB354017D094CAC10764C020BDD1C9A3CD35405C62F1253E0764C015BCB05E3FE4354002F6CB1DE70364C0F270244FC7F63540196543995C0264C0DFF087C3110136400103000000010000000D000000B88554C0B9EA63C09CF8CCA0C6F2354071B916C110EE63C02B5EEBF139DE3540367E2EC46EF263C00AA23EBF56E23540E10245E77CF463C0DF052219C8F23540F40AC92A92F763C01DEE953FE4F63540ED972E45A0F963C03D34D5FB62093640874133D9CCF663C07ADA84BF282636404810EEB16EF263C028CC6AF092363640A4A0D01386EC63C073159399A73A3640F108DC75FBEA63C00864E1AE6F3236406B9F88D970E963C0E6641AB6F31F3640846205DA77EA63C0536AC77F6D0B3640B88554C0B9EA63C09CF8CCA0C6F235400103000000010000001400000029FE1CEB8BB563C0146832824B4C3540D097CBCACDB563C028F67E1D214635408FF4968A16B763C0ED9768432F483540E8A87A8A6DBA63C08CAD9310F73F35408F9FAA84BDBC63C0F133D15584543540BB355C2448BE63C0E52F5E035A4E35400EF0E4A329C363C0E2AE1EF63D4A35405F3769C030C463C0146A5BF7AE5A35401EF115BB87C763C0E9BDC9D48279354035BECE76C9C763C0C556CAF8F3893540D2422CCD8EC863C08390476B4896354094EF4736ADC363C0A6C5156F3A94354032D3C5315DC163C0FDC7C9C6E3AC3540A284AFD190BF63C025DDDA070EB3354002F0EAF540BD63C0BDA2BF059DA235403B6142DD32BB63C0763DE4F1BA81354020806F01EAB963C007F018BB3B6F3540E03AFB605FB863C09982C5FE657535404471DFC4D4B663C09020D6DCE662354029FE1CEB8BB563C0146832824B4C3540010300000001000000100000000BBD12D0F89663C063D652F12D233540A5FB7A77839863C06DD8916DAF103540E235DC135E9C63C0F62C470D940C35400DF16DB646A263C013373FF8F61A35407D14DD7436A963C0120378D6CC1435403168D3F2B9A963C0DC7CF3D12F2335401A60388CEDA763C065958A0F5A2935407C90E9096AA763C06563F7C3D83B3540D82520ED5BA563C09256176C92313540AC413C8E38A063C0C8CCD72D842F354015B197F1C29F63C021EDF70E073235404308CDF1AD9E63C0B1D75679AE353540DAD70CE52F9E63C046D1133A3B2C3540702C067A419D63C03B630EEBD82A35409DDFFE79209D63C0049E60A6752835400BBD12D0F89663C063D652F12D2335400103000000010000000A0000007D0D28E73FA163C0464A1FBDBFED34403680F384239D63C08809AD80C0ED344011C11D6FCC9963C06B4CC0AC25D734401D1604230E9A63C04BB92613D1CA34406AEF601A5E9C63C05B9A8ABB6DBC3440BFB45CBEEF9E63C0DD7C48915FBA34403A174E27B59F63C0003B8B0DD0CA3440F8A43450739F63C0D1FAA3B316D5344004E94B5DC3A163C0B86232F76AE134407D0D28E73FA163C0464A1FBDBFED34400103000000010000001400000085661401468663C0D463F0C6B3A134403F799797D78863C0A2CB8D325F9534405F39830DB28C63C0E589FDE442913440719934EAFA8D63C0943FA2A3A59F344099F62C48C08E63C0C80C88F75CBA3440B7ADA444C78F63C0FD5984E6CDCA34407C23CA62CE9063C06F7353BEB1C6344088C7021C679463C00220BC2FEACE344091CAA477339663C02B3763BAA1E9344025DF0F96EA9463C08F70462259043540E52CAB391E9363C066310437830A35407B47A95ECE9063C0C880287320FC3440C66CBFC3438F63C0C196ED4A85E53440A63EC34B698B63C01C774E96D9F13440181BDF13548863C01B184B66BDED3440F045C1535D8063C059750391DBCC34401F55F619987F63C04C3DC91C87C0344065FB5572648163C09069A617DEA73440892849C7378463C052A350C0A59F344085661401468663C0D463F0C6B3A134400103000000010000001E000000B5D68F72517563C04C0C9E30FAEB3240A299DE2CEA7863C008E0716F95023340A65418CB7B7B63C0D158C4F8950233409C5FE665067D63C0B02E175269213340F7CA0A67FF7B63C03C892C5B115F334091D9E4484F7E63C07A407A0DD77B33403A20E68C147F63C05F2A1B2BD5A033405170D28D648163C0FDBA6E69E1C733408A97F86E567F63C04C8FABFA27D233407528A032417C63C0756A7888EDEE33404F8709D5747A63C078E411926C013440BC527F92B67A63C01695ED55CF0F3440AE3D17E6827C63C0544C3B08952C3440051CB5C37B7B63C0F907B4253E45344070584351A17763C01C338A3ECD343440A6CA627AFA7163C02FA60F484E223440B62947E86A6663C0EFA08D0C5EFF334011CB99F2136363C01CE8AD958AE03340B60134B14E6263C0663FB06F7EB9334017047273395F63C00770A2CE9ABD334031154072395F63C08D382073FFA63340950092A8505963C0976DAED83A8A33400CB00A04165A63C0099FF25AAD7533404F7116C0AE5D63C02FFD8F92656B334037695C1A826063C062359147CA5433407C208C3BE06463C047AC6B95594433401BEA9FBBC16963C06C25C5FD203C334054F09B97B17063C0FF1218265B1F33409E042315357163C0449EF850CE0A3340B5D68F72517563C04C0C9E30FAEB3240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('13',NULL,'ID','IDAHO','P','931','0106000020E61000000100000001030000000100000070010000339437D2AE415DC0ACC7CD7EEAD6454020525ED985415DC06729094B79E0454053E4452160425DC060A7620D6BE64540FFF624A2C4415DC0F09DCFD070EA45405574B21EAC405DC0F4141F937DEB45402DD473C109415DC01C9A9C332EED4540461AB9DA163F5DC02F2FB635FFED4540122279FA993E5DC0FFE41DD7CDEF45409C1E93DD993E5DC09C0428B9C4F3454056490EFC6B3D5DC09BD3E59BDBF645402D434201F33D5DC027B75BFE49FB45407D32CBFEBF3B5DC05788F063D1014640469BAC2E843E5DC09BF5BE6275094640C37EB40DA93D5DC01FE7E3E38E0B4640105FA1CA993C5DC05918FA44E80B464087B12888BE395DC0C6454569BA1246408249D56D6F3A5DC083C97DE9B1164640DD667AFCD63E5DC0E7009BE552194640B8804EDE783E5DC01B1F8DC6D21C464035206083883F5DC0B3F908C69F1F46406DD88F49F1415DC0F596B142EA1F4640BF56906B54435DC0089C3CA0A31D4640ED0D407135455DC05FD35C5D361F464066CE0E966F465DC08556C09B2F22464068FC425836475DC0E249AAFA882246404362877B2B495DC0DB8291B714204640B883DE1FED4A5DC06894F1346D204640DA3B5329AB4D5DC0820C03B271244640890A62CBEA4D5DC051060C327C2646408FF22B0CE74C5DC0724D2DB4722B4640DE162FB6294F5DC0580BB6F3EA31464012F15AF6E64D5DC0B5E2FDF5C336464000CA4DBB5C4E5DC0E85FD3D68A3C46401A380EB90D4D5DC039F2FA372E3E4640E1556737FE4B5DC0FBECACD88241464087E2DB4F4A495DC0B27F3D986F444640DE769C4F36495DC0F44F26B7964746403AB8292D5A485DC086BA737648494640C8FE742214455DC0479DD72C3C5846409704EDBF41445DC0C4B9078C49594640DF630B5A88425DC0D97A2606E35F4640E8DF7647E53C5DC0972D701E556346404E08143A373A5DC05CF7DEB61A6A464051D559756E395DC0497BED739D6C4640EE25CE2D7E375DC00317918F2E6F4640ADA5742177355DC00917DF47C77546407CBADB5E3E365DC00BEAB385387A464032D5C59935355DC0E70AAB427F7C464017A2C23C48365DC0671A7004627C46404C01D4DCC6365DC0CFD637846F7D4640E321E43847365DC09833AC61018046408D501F58B0365DC066027D432B824640A4EC63ECAA335DC0F7C996615E864640A73419A661325DC0F9013542B289464021831842CC315DC0927FB7C3BB8C464035937F9EB8305DC00DCE40439B8D46405080A136242F5DC01790254793914640C8DFA884152C5DC012B73EB694A146402CFCDE65062B5DC0271A48B9EEAA4640BB19B59B35245DC03F5017D0DCBA464016DF76FB7C235DC0D1E9F2D42FBF4640861E5C95A01E5DC0B539B99A74C8464097C45C571B1E5DC0EDF7A7D699CD46400CE5615EF4205DC04E3C73090ED5464069BEA441CF215DC0514A9222F9DA464005529064E1235DC0CAD8D19BABDF46402286D3A7E1295DC014DB3FB0EBE346407A77E1E7002D5DC00AAEA089DAE84640940AEC6A84315DC08BFDCF03EEE8464072AA680BA4325DC07487B85F45EC46400CB31D6FD0365DC00BCCDB13A9F3464060AE820F7C395DC0F258B98B81FD4640AA7FC510D33A5DC0F65504E961FF4640C9B2F5564B3D5DC009351E74680847403574547A2E3F5DC0F20A7B940C0A4740D283C7788B3D5DC0E53B207B730C474074D66BB87B3B5DC02CF5638E2E154740398A495DEB3D5DC0219B65724919474056ACAA1F413E5DC08D428E5EE91F4740BBC4CEE81A405DC045FC15A4B6264740E73CB751CA415DC0B4153745EF2A4740405AF9991B445DC088E67522A22C4740E192EA9AD8425DC07D50A0CABC314740AEC045BE77425DC0CFA13511C8364740D4C41DEBAE425DC021B6F05DAF4447408E3A023A9F425DC0AF9123D9458F4740FB9FB28CB6425DC0CF88D19116A14740EF43DFC3AC425DC0F28127B943AE474044AB59F065425DC003DD89C14CFC47406C800DD27C425DC0DD14286CE9054840B41D66F7DC415DC0E3A3FE0C466B4840C27174190D425DC054DDB8BFFD7F48409EE39CE510045DC0ECBE8260FE7F4840D26846D8A0035DC0553AFB42D43F484086F151458D035DC0250BD898AF1A4840ED4EA46B6C035DC0D63C42DAF3FC4740D9BF5EC79E015DC0DEC27C2083FB4740B0C0EB81EEFF5CC02097BB036BF647408BBA999B05FC5CC02E1275ECFDEE474038C649D8D9F95CC06FCE0451A8EB4740348598F5AAF75CC02F4FA5F6E9E947405151FE525BF65CC07BC3053810E747408189A72E8DF55CC03D35C3D4CDE04740CB9BC32A98F25CC015E188DD56DF474030CCD383A5F15CC052F7DE84D8DA4740E55F515FF4EE5CC095AFFAED07D947404422DCF5FAEE5CC0588F7694E7D14740F55CEAAFB0EC5CC024A0B0BBDBCE474076C10B2B4BEC5CC0DE1361BE9CCB4740525344848AEF5CC0722F050150C44740A4F64ABFE5EC5CC07558A5A4ACC24740C65C2B5A56EC5CC0E8873744A9BE47409C815E15F8E85CC0191C9A81D4BC4740981F6BF429E95CC0B72DABFC98BA47403DBFF354FDE95CC00984D6B97EB947409E9B35FAE0EE5CC03626E8B6FFB8474019E0CFBA01F05CC0ABAB25338CB74740982EF45905F05CC0901D08B013B64740F7057C92A7EA5CC0A196E1EB17B3474064933DCFE1E85CC07C77EC46A5B04740DFD4C8CB5EE65CC0015C13455CAF47404B50A9A68DE35CC0D19F869BD4AA47403ED8B0E179E15CC01E646EAF5FA54740CC9B969F1FE05CC0A86494EC0CA44740AAE741164EDB5CC0F6D976B11EA347406E937E1320DA5CC0FEA14E70BDA14740D7380A8BFED55CC023D7FD93A4A047401B847E88D0D45CC000909012619F47406A241F82F5D25CC0E9D9D77FFB964740227744515BCC5CC09F991419E08F4740385FFD2C0ACB5CC03CEE01337D8C47404E3E320984C95CC09E1AA133BE8B47409930CF25ACC85CC04379316C228847406FBA179C34C55CC0174EAF26658347409E2853948FC35CC09DB29DFF967C4740479D8CB063C25CC03A4D52A0437B47400259DCCA19C05CC0C7E1DA43BA7A47401A33DA23BEBD5CC0C13DA4606D76474098C22DDE24BB5CC093E04FFF1D7447404DBE043E32BC5CC01E1FB99D08724740BF2705BBB2BC5CC091E21AFA1C6D474083E72DB1BFB95CC0C4964DD653664740EEA35D6D76B75CC033AEA6960566474060A7E188CFB55CC0DFC33DD5446347402F594163D1B25CC04D86B8B51D62474042EFA300C8B15CC042295155BB604740E1B05F5A1BB25CC023819237FD5947406406C6F5E0AF5CC0B44A2619FA5847406F7AFE18B3AC5CC0934080DAEB5D47407969E0F720AB5CC06236015C0B5E4740C1D3FF2E0FA85CC0DA1E9221F35747407F368C4D48A95CC098E728C1E05547408CA5F56B43A95CC09AE2B9E1955447403CF4FAC517A75CC065B984A5845047400FC6BEC395A25CC099FE1E69A6514740502ECF9E059F5CC0722B8D4CD14F47403FD7CB1F429C5CC05923F0CEA6524740C4E80FBF93985CC05771CF32AF544740C858797B6B955CC0D49B33B6BD53474014938916C8945CC051A68636B94F47405A997FF2F8955CC077F73CB53F4B4740ADE8AA4868965CC0A4707CD439424740E48B95E711975CC01C1CB9B3C84047406DB84827499A5CC0DC87E531623E4740610B0CDD93985CC0797A2791CE364740A0549BB968995CC0471CC24F2433474038ED5A193A9A5CC0E04542EF4A3247402ED0E38AA29B5CC03A1C0E6C71244740BFDE23A9529E5CC0A6DB6E0A612047404A24F4E7429E5CC0C329E649341F4740D6F854A3219C5CC0FC033449311C474013D02E5E379C5CC06EED72C6A01547404704059FE39D5CC03A6A90A5DF1347404312D6829DA05CC06796B84426144740F875E96136A15CC03FFF19836A1147407419CA9E6BA05CC0DE988DC2DD0E47406A8A1C3B8D9E5CC019B79EE2BD0D47400763EC962F9D5CC019ABE481860A4740BFE0A3F4CE9D5CC0AB54CF1F810647402CACC9F4A29F5CC046CFEB1DFF024740DFA38BB15E9E5CC0D952D2FD3F0147409FAB3051019F5CC0F16821FCB1FE46408B616889659A5CC0C2E43E9C69FC46402527EA47F0995CC0B0CD62FB1BFA4640FB4020497C9B5CC063513EF8F2F5464001A70847779A5CC00713CD3790F44640D307374324995CC00951833579EF4640F395B7E3149A5CC0509C819358EC46402E9815E85D9C5CC0F0F903B322ED4640093D09CB529E5CC0545C19B173EB464056DFD14DF29F5CC01D0C3610DDEB464053A744AF1CA15CC093011E4DB0E74640B2B11B1411A45CC0BBED374896E14640C7BA8570AFA25CC0219CAAE77CDF4640F12A2E0F3DA25CC00BB892268BDC4640F5DF9809D89F5CC0E29DE225E2D846401DAE0C6BAFA05CC006E4578447D64640A40355891CA05CC0D2856BA381D34640F29A19B123A45CC07CA88F20E8CF4640A2FF750D9FA25CC0EB87B2BF56CC46404DB41D2FE6A35CC0C353931C3DC64640F458F0CAC0A15CC038E799DD72C74640B766BB26C89F5CC0830F7E9DF8C54640F4B540029D9D5CC06AE236DF1FC646401F0A005EBF9B5CC02EB71F7F89C346401FA96ABBD19A5CC035597A7EDFBF464077E875F4C5975CC014A9F4C02CBE46407288FF706A965CC040B29D2250BB464014A7A34DE4945CC06BCD64E48CBA46406641B485C8905CC01BD2B6A630BE46408B086144DD8F5CC02279F98660C046401FBBE3E47C8F5CC04083DD6884C446405D521FBF778C5CC0D40DAACB92C3464017F746FD0C8B5CC02DCDC94D9FC546404824CF7873885CC077CB97F072C64640412619988F875CC0F5962EB21AC9464077C4C6544F855CC0B0373C750ECB4640049D8EF39D835CC05C3DEBB704D04640F9ED027027815CC0EB2CF1DA04D246405039CC0FB4805CC014FCB47B85D34640A21EADB145815CC03D1CC97B10D64640E19938319B805CC0691E7EBCD9D74640BB74BA4D277E5CC0CAD5F89E43D94640DC63218CB47D5CC083DDD2DEF5D64640AC35DF074F7B5CC05686F940EAD5464089D2BB261B7B5CC03DDBC020DBD34640632ACAA3BD795CC0BAD1768191D146400810C2C2CF795CC02B2FB5E086CE46402669319D87765CC0B644D32306CE4640D6849699A3745CC0E8AF71A5E1CC4640CFFDC1B670735CC042FE13A6B7CA464097C037965B755CC03049B482E8C14640CC3CA7D0FA715CC0D2D8D3A528C2464010C7236F6D715CC03A577D26E7C0464093073E0C3A715CC0C17EE38625BD4640CB67034B48725CC00E7533860AB9464095787A069A715CC02D858F8780B446407394629F716F5CC0E90B530AF2B0464087904F194D6F5CC03B6EA6EB27A946403B079DCE136C5CC0975783908EA34640F03F5FED2A6C5CC0F473CC7092A146400E00C46351695CC0A9A7121A789A464084B5199C75665CC071415AC02A97464083B1B2B805665CC016D99DC42A9346404F818ED494645CC08DF81DC838914640860F6693C2645CC0002F9329118F4640B678846F58635CC0E37F3D2CC48D4640F1CE9589A7605CC0D9FFCF8FCD8D4640C8B3B2A851615CC078018C11818A4640C1180EC35E5F5CC007DECAB31D894640B28B31A11F5F5CC0043D0E157787464024187BDA255D5CC0A25B42758C854640FAAC6FD95D5D5CC0AFE51D778383464082E16DD3395C5CC06897B1D8C47F4640ADA42D90B85C5CC0952556F589794640112F4892A85D5CC025C9CE546B784640FDB6A4B6305F5CC0661389F543784640675A9397C15F5CC07C030F3520774640ACC81746845C5CC0FB0E326DF56C46405EF3F9DEF75A5CC000918CABB66A4640E8DCFCCB66565CC0742AE3685E67464032DC37E6CC555CC0A4742147B6634640C34F254165545CC00B8D1287DE63464004D20C3775505CC005B54C08BE67464048820BB4614F5CC0547EED66EA674640B6C1D47AD9485CC05A6239D7766146404146BBD527485CC0CC1E6C72625E4640DD516B4E82465CC08A0450CA8A5B464073AA864B55465CC05434EBC51359464052F1FF63AE445CC00BFA019F775646406E6A6E7979435CC0599270B3E84F4640CA40E37950455CC05B8F8B4D954A46408DCBEFCC89425CC067EE87A5344746403BBD41A96B425CC05C44250138444640335CFA5E7E405CC01CF674BB5B414640E989A2BE4C415CC06F627BD6AA3D46401761DB186D405CC01088D54FEF394640958D8BD8C4405CC0B752F30C073846405C958D540E3F5CC088C765CABF374640805CD7CC0C3C5CC04AF567E01E3446404C4AC3A5C9385CC030A9C3F948324640332EB6E0BA375CC0E858E8745B2F4640A3A7589B08365CC06A92CB10442D46409F268D3950345CC0069159309E2E46401E934CBE65345CC0CE223C7489324640A51D2383E8345CC065788118E635464072B9DE65F5325CC03BDBE919A03A464044412C47E9315CC043F16579A93C46408CF56224F52E5CC0D1BEA535FE3D4640D8A3DA83B72D5CC0587CE1949B3F4640E6FE53D9CD295CC01E92FCED8A3D46402578574A84225CC0CCC26CA31E3D4640F2698E231E205CC052E0487F433B46401A0C0263581D5CC0BE6DEEC5023C464075A94B9FED1A5CC010D0AF2A82394640D049A37D86175CC0AB0650B281394640B7F8CE03CC155CC061D5319AA33F4640B08F2AA4EB155CC00ABBA57B36434640961F49E111125CC00F3DFE84564546408C095D5F6D105CC08F738428AD4746409ED183D9BE0E5CC0F7F680699D474640E484E5D6EF0D5CC0824AAC69ED444640BBC60132C70C5CC05000F58906444640665302BDF2075CC0F7B2C3CA9D4346403B1773B664065CC0BB37026B554246402B31F7AACC035CC0F6DE3F8BA94346409827DCA1BB015CC00693C98BEC424640B631DFE082015CC0657CA54B7C44464075273F9394FE5BC05840F86DCC434640A6C059482FFC5BC0FFF345715D464640A2221E14D7F75BC02F5842B83347464038912C9BB3F35BC0F8003F7A824046405C04BB17BAF25BC0A482BAFC5C4246401593AF2F15F15BC0B5CDACDE684246403700624AE3ED5BC03164B7445244464046574CCAD4EB5BC05ADA280A7F464640B2738964BCE65BC0D770DCB080454640CE9F92824DE45BC0D914EC55C4464640F5FFA81B60DF5BC06ADA735AAC434640CE253F7AE2DE5BC01B74635CA044464034E8F49565DD5BC0928D7C9FDA4446408740DDF69EDD5BC06CBF9F806446464028E499BC8BDF5BC03F7D715D8D46464091DD5200EEE05BC07614C7E0ED4B46406065EC9F1CE05BC016990225D84E4640F9F41B017EE05BC028FCB4C79F514640E3C3D63A17DE5BC0DCEECFCB025246408FC3CD3854DD5BC00D09D2EE865346404359DAF97BDD5BC0965DF250C35546402DF4117EC5DE5BC0863A8951805846405167795D6DDE5BC0218DE173E0594640FF78E27764DC5BC0425F4C78495B4640999F980E49D95BC05E84973CBC5A4640D04C752DA3D85BC02DF717C16C5E464030BE64EBD3D75BC04F8AFE025F5F4640181AB10666D65BC0D640F562F35C46403C8C0A216ED45BC0CF8E2EA62A5D46403A45A6BF30D45BC0E8F408C4435A464019FD383BECD25BC0156D6F836A57464068D72B164BD15BC0A3DEA2243F564640AB74349552D15BC088B3610134524640172E008C55CE5BC023C48C863E5046404C6CAF2A11CE5BC079F1FE051A4F46403A2927ADFDCE5BC0CB3C16C2204D4640FC3B41690CCE5BC0399FE5A15D4946407F05BEE070CB5BC0A8709A084D484640AA772D3EE5CA5BC07789A0A8C845464030CE2E5699C85BC0C183814E9243464027FFE33340C85BC0751DC8CD18404640D8765A6D0EC65BC0E8C05453393E46404410F9C44CC35BC0460525DB953C4640BDB6B7D639C35BC07B071C4FC4FD45408B3F9C4CFEC25BC098B96CD4FCC145402FC3F1350AC35BC0D28B292F72A4454053AA7D5926C35BC0EA9F97878B824540281ADA72FEC25BC015C7CC8E6A404540BC87CDDB1DC35BC0BD512E9783FF4440A4DB434DA7DF5BC00D7BFC9905004540BC7F3BD46E065CC0533AE7624B00454003A3535B6A095CC0B689CA00E1FF4440FC213E34553F5CC0413ADD9325004540766C922A80825CC033CCEAF768FF4440CD21F3053F915CC015942F727AFF4440AC0D965A97C15CC0B048D0858DFF44405F5D5392A4FC5CC0F11816094FFF444046DBD00F823F5DC0F70C386D55FF4440D746DE1235415DC08E8F9C6A55FF4440339437D2AE415DC0ACC7CD7EEAD64540');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('14','ACES','IL','ILLINOIS','F','932','0106000020E610000001000000010300000001000000460100001D3D72F4940456C0550A7FB669C14240EDD1B753A00556C076521A1CF8BC4240AD88B496F31356C077EF0C0EB1B84240FD21875DFD1656C0950B64F165B442408EC93C89DF1A56C07540BDCECDB54240C8F50891EE1D56C07F27A6B04DB34240AAC61535BA2056C02DFE280201A64240EFE41211182056C0458905C900A1424078834EE8D81C56C0AFA4C22D559A4240C03318240B1B56C042813471179442406131442CD51C56C033A29A18A38C4240700B3893841E56C0768301DD3D89424067266156681F56C02D36B4FEBB88424074116DBB1B2156C0C80F113E4C884240DBD7EEE1CB2356C0BC19E9D9538942400C5F922A502756C08B2F2B12F78D4240C2A8C7170F2C56C0E1DBC3EB56914240630A4C814E2F56C02ACB5708149242404E33E6A2C72F56C05F973C077A9342409741CB1F413756C096E3933FE39942406915C630AF3B56C01443027BF69B42400EDAEE3E913F56C019B0F4D72B9C4240ACB73CAA2A4456C082C55DF3CB9742407520552D7B4756C0828E00325C8E42402CE4D6F05E4956C0F0E1CB2FEF8B4240E6A10212DB4A56C015FCC78E3A884240556D366F294B56C06F30F32F4C834240B01D00C99E4956C0A5962593CE7F4240ED1068C5504856C097F26A367C7E42401993F6AE634C56C013514F31507E4240CDEE32B5724D56C05BE89B0CB78342407A3AEF5A374F56C0133A942959854240FD954483E75056C0FE1ACC86288B4240F5D6DC25325256C075DA5986AF8B424061736F676A5356C0DF432586EF8A42403AE3FC64D35356C0E1A75086CD8742403B08C89CEA5056C0CD7248688E834240561F85DAC55056C0805716491E8142407C665A1B1A5256C07CE042A8E77F4240C278E45EE85356C043B5CBE63E8142404A3CE28A835856C0253F3E444E864240CC3DEA11535856C02608FA64B08C4240F84FC6DC205B56C01E605785919142407E5689E3325C56C0FA3EB6C52A9542406E5E6DB1F85D56C077EC1768B69C4240FAC5A615C95D56C030721BE97BA04240E663E1F9565F56C04FEB8449C6A04240E6017CFEE46056C0C70D84C962A34240EABE8601E56056C0F545EAA70AA74240C4637F030B6056C0D9C44BC52CAA4240C5D1EA5E015E56C0EBF9946473AB4240F536C29AE45B56C02C4216C389AD4240F73885DE5E5B56C000B0B3E09DB44240503FADA7095D56C085207E9E03BA42400BCCDD13AC5F56C0992FC87BF2BE42404CB9F8B69A6156C0F4C9218137C942400E4A8696DC6056C0B2358F63D8CE4240EDB133D73B6156C02324E02541D342405DAAAEB6DC6056C00429C2A706D742409EE2D137626156C0F9C618C9F0D84240267E24E0376556C0B4FDE54C63DA4240DEC79AEFA86A56C0356728B46CDF4240BE4EAAEF426B56C065F18AD35AE4424006FCF4F03B6C56C0B2A83A3305E742400B07FB94A06E56C075135352A7EB4240C3575C41847656C0A6DC74D4DAF34240875964221D7756C094F003B5E8F34240AC7DDCA37B7756C0A316C5B62AF2424075659A68A47956C058F6F9591FF0424085AB29ED077C56C068DD697C65F0424058B9BE50A87E56C006E33F5CBAF44240285BFF6B557D56C0A5FB6E165AFB4240A911ADF2B28056C03BBAF15814FC424062179DB6B08256C04C4DD21823FF4240C9EE7D20A58756C099573B3C2304434023A7B701A18856C061787B9CE9064340DC21020B4A8D56C009038601630B43407CA23F70449056C09DDDEB04A50F43406F9FB7518B9256C0C1FEB6055C15434034A3EDB58E9556C0CBD9B2862918434089ED3D575A9756C0F22DEB48FF1D43403E0C8854A59756C0180F59276C294340FE39B2B1F69656C049CE3FE5C42E4340E3BD580EBE9556C0BDCCCF0309324340F8DD0648539356C07D60A160B536434004EAA97F049156C045E74F1A66424340C87080DEB99056C0231BD67833444340450AC97A6D8F56C061EC42B50B4843407556ADB0C38B56C0A393740D1F4E43400B10158FC18B56C091D74749545443401E944650F38C56C032609727A75943401D16AF6E968C56C002323385AC5C43409132CBE8768A56C06447177EF66243405920E184A88856C087AA3F5B8C644340F21FFC22CC8756C0AA54E8B87866434038CBF1213F8756C0CA3B7F554E6A4340BFEDDFC4818856C01B4BF7B4316D4340FE8902549E8F56C0895403351075434052418ED7DB9156C037468BB55E76434029009F7B789456C0855CE9F66476434064B4CCA3719A56C0617FCA352F7B4340ADCF48C9139E56C057760EF8C77A43402F338973F4A156C0CB8E9BE2217243406AB7E83982A456C089D61047896F434045981B4126A856C0E22A2889BF7043402A6D5EE4D0AA56C01CD1CF05B8774340688DAE4632AD56C04AC631FFD78443403C2BFF264BAD56C05FE8B0FD73874340FB022C8531AC56C0916182FAFF8B43400FA19608E1AD56C0177D30187792434030FBF1E8F8AD56C07268D4F413994340082733AAE0AE56C078072013C69C4340E5EAC2CA3EAF56C0D2F586D1B99F4340FDA17BD2E2B156C0E4D35030FFA5434049B2329F70B656C0BAD5FE2CDDAC43404C1CDF6DACBC56C0F42419E847B34340D8FCEC9A55C256C010051904E4B843405B04E81E21C456C040D9E003ADBC4340D274FF0200C656C0A7177C64B5C343409D13594D01CA56C0289078E3BCC64340C692C75404CD56C0B96BC702CFCC4340BB783D0757D456C0B6ADFC9ECDD74340A7A98BCF80D756C02FD1A17EC2DC434063B18490E8D756C0F4EFA0DF72E143404D920B7270D856C0E2E64680E3E6434009DF22FEC1DC56C0624046DF79EE43404C8E6B7EDFDC56C00901861F51F14340DBB67FFBC9DB56C06D896AA070F343402A14F9FA8DDB56C0EF5AAE4000F6434087C6E51DA2DC56C00378B0201AF94340EED24F4532DF56C039831301BE004440035C172944E056C0388E3A7F8B084440B34839CC0AE156C0DC2D633D3A114440D0B6DACB6DE056C0787E9B1CAA1944400ADF530BF1DF56C07F6A639C2E204440BB089C8A28DF56C07B080B37A32744404D920A46B8DC56C0F57967F29B2F4440BCDFAC61D0DA56C0585B339286314440D4A269BCB2D856C0590398523A3244401C3EEABADDD756C000EA3892963344403D0AC7DEACD856C0DD7F62EE40394440F9B76F1FFFD756C0A058C7297940444038DC63E076D856C0DBA6C224A7434440958C66046FDA56C0C5BE19FF254644402000FA4352DA56C0FC5D1C7A58494440D8AA257F0CD856C0C60369D73E4D444071F63111C8D056C079DD47FCDD51444054B0E98AC3CD56C0356F7EFC69524440B1A402C468CA56C0BB5E975A035444409CB44C8046C856C0F0C50FF851574440171CF93FB0C756C0BB8CA8F54B5A4440616496FEF1C556C07246E3AF7B61444081F4ECFFB2C556C095CACFE4B86A4440303A4A9C28C356C0B6278B7F9770444023A73356F0BE56C04CE7F97B44764440C310DE947EBD56C0FE6AC158AB7944401A96D5571BBD56C0CA4E98C7028944404DF735B94EBD56C0F30C2AC25C8D44404196301D64BF56C03658D8D97B9244404876A9802DC156C0A4C365D33A9544406BEA17259DC356C00F3706AE90964440CDB75ACB81C656C0CB6CC37EA39D4440DD48654D8FC656C064A844D948A2444014DC700FB3C456C001ACBFD5DEAA44400F1C9B7294C356C05127A85061B3444084223ED1C4C156C0963F447136B6444033E7CACE0DC056C0BFE8C8B32EB74440B34FAF88C9BC56C08C5D63F9EBB544405EC9EFBE08B656C0024CFB5FEAB84440F35F3A38ECB156C058EC9FC494B944407D8B98AE55AD56C0D4A315AB9CB94440461998E72BAA56C0A1F09C4E2EBB4440908D762074A656C0D3356C303BC144400B9681579FA256C0DD81B01454C34440D3B77AC9209D56C038A0DBB987C344404DA0C7A6D89B56C00086BD1895C54440577BDFA5149B56C0E862A8769DC8444039B1F4BA4D9656C05D9F7BF61ECB444009E2BDFAB99556C02BFBEF9429CD44407FCD2F3ED79556C0994D447016D3444010C19CC1DF9456C0E8C3D3A883DC444035C24E61859356C0F89E64E5D4E0444032E5B61B599056C0F5401E0211E44440C584A1B38A8C56C0751AE27A30E7444059628EB3E58956C09F72248624F7444016E20395238956C06D5F835EF3FD44404B489E76A48956C05343013248044540D8C72138C48A56C0664D0309D1074540DA0D5E78AC8A56C0FA8ADB3B480D454083D6FF18478B56C0FF4E60566D0F4540E75533DA448C56C0FCBE7DF5B40F45403DFCFABCC98E56C02EFDA0687214454064AEF4FDB79456C0BCC2565A42194540A2BF67FD8A9756C082A648B5E81A4540BFCF663B119A56C08048728A0F1F45402ECFA75AC29A56C03560F5C1C821454090C97A39619B56C0810B12419A2B4540D5084339459C56C0163F9C38172E4540B4C321596F9F56C038F557EBC3314540943523DA13A456C0C2EA76F9FE35454076D216F9C7A656C0571FBAC7F33A45403FC0119880A956C085355D00E23C45400616F7B6B8A956C0DA575B59523F45403E74F776DCA856C0C43733D432414540DF0D47F7E29A56C0DFB53E1A12414540CB3F9CC21D7B56C09B6274DE86404540CBB8F65C6C7556C0358894A8714045403FA47BA5A35956C0E2E7D324AE3F45404ED45203035756C0C07A81C5BB3F4540BB9CF7A31B3C56C02BF11A26D53E45402CBC43B5F63056C03A11518BD63E454038792950392D56C08CB3E78DAD3E4540D4689F41121356C0E064F17BF93E4540A9388071770C56C0317D4A3FAC3E4540FE146D4E08F355C0A0B17C8F9C3E454064B605A791F555C051A474DC382845405ADC6FCBA8F055C021774F9A07144540F877F834EBEA55C041057E3AA9074540B84E7F1536E755C04F93287876EC4440B81A3AFCE9E155C0C84F60C79FDC44408A5BCA8717E255C0550DB4C720BC4440F17CE93914E255C07AB73B4492A6444046F9F37008E255C0896F5EBF3E9644402D15DE260DE255C0FE563A7746814440793282B117E255C0514E26D66A5F4440F624C15561E255C0A38E0E91503F4440EE280BD548E255C0282DF930DC3D4440737F8A4943E255C0846B8214471544402274EC6F4AE255C026CAC55494F143403C3CAF3B47E255C08F678B0900CE4340E530954078E255C001616C281EBD43407C56304193E255C02D10623ADFAC43400C7BAC8740E655C0F1BF549A4DAB4340C765004B04E855C0C668243D5AA74340D9BC4FC914E755C020EE56FF1AA643408A5DEFA969E755C0DC8DE8C006A443403A760BC9D7E655C0C5859DC40CA14340BE0F84E669E555C083D4A066D89F4340C2095BE6ABE555C0452AD94BB09A434086E5D7E607E655C0FB66E88C5D994340F1962CA8E8E655C0D7A77A0C1A994340D58091EB3BE955C0CCEAFCEE929543406C6FCF0DE7EA55C077D5D7B0C7924340BC4E35EC34EA55C0742F2593BA904340D41C3CEC62EA55C048B9BC75878E43409BF606A96DE855C0CA79CC574F8D434065A58B8860E855C006F7E5D9648B43408055BA862BE755C032F8F4BAD58A43406B41A94376E555C0E9F6423EFF87434033A56BC23BE555C013BED8E6757F434057373E63E1E555C03A50E6863F7F4340A575F23E11E355C0E28FF349127D4340013859BD24E255C0EC92EC0B5C7B4340E1EC82DCEEE155C0422845904A774340F5BBB99C82E255C0D0A89BF3D3734340036A58FEC7E355C002691878576F4340D0F81ADD3BE355C0AC40C1D9D06D4340138CA49681E055C034C5D561D6654340E35DAE1738E155C0729F48646C634340DE73F77583E055C08B9DCCC4876243405127EA9588E055C05B92C9874B5E43402800837BCFE255C0ED049B89CF57434057879901AAE555C07A33B42A0B5643404827948603E855C0C9F8EE2B49524340D5BC68273CE855C01FF50D4CBD4F4340B5FA83A6ABE755C0D317A36CB44C4340F0DF4DE9FFE855C03D0B28CDEE4B4340B116EECAC8E955C00C50AA2D76494340B711CEED11EB55C0DB1E6D8E134643404C7B80CBB0E955C0C1F6862EF9414340DB1FEEEBD3E955C0EB9AE20E104043407D800C0F84EB55C0D3D4E0CE84404340C55F649057EC55C0BE928B6DA43D43400B0DA75764F055C000BC268DAB3B4340D5CBD8578EF055C0ECFC3FAC833A4340FC6778754BEF55C0E9BD720A07394340B1D274B6E6EF55C07B8BE56781354340680F1CD92DF255C0D6BECCE66730434070060CFD68F555C06836CF07212D434063EC503D68F655C0422CAA62A0244340F5AC52FE3BF755C01470834388244340B4B7C2BFF0F755C03FA65F078E2843407DDE69E08AF855C0544CFC8765284340B6B58C20DDF855C04D96B8867D26434027EA6E4281FA55C0BAB5C7E6FA234340746DBFC279FA55C09225A4C8B42643403125E1C342FB55C053D1DE4904274340939DBE26B9FE55C0A3170668DD1E4340CDD0EB461BFF55C0A6CD2AE80F1E434097BD07E596FE55C03AEADC85B2194340BDF4561FABFB55C0CA39D420E915434001E39E3EA6FB55C07363DB5F2B14434032A2999FD6FC55C0BCA596E08711434067EEC4614EFE55C0EE042F02DF1043401B73AC66300156C0AB79B2833A0D4340E9F23D85CA0056C0476B1B83D30B434042993ADFC0FD55C05ED0FDBF630C4340CE5F81BF6BFE55C0ED94E19F6309434083FDE287390256C0DEE2AFC1ED06434023A3E088C20256C0534B4B01C805434033BF7708A80256C0FFDD0BA1E80443404C98E304640156C077AE98404C044340F0295225DF0156C0AC0DE25F0F014340209A8623640156C0B87B371ED0FC42401FC1E206B90256C04CE1DA5D68FA4240B9B35CE6AC0256C02DD6041D9FF7424040390E4A230456C0C78CA19D04F74240B4CEC3EC0D0556C08B4F5B7ED6F84240EA4741CD600556C02675D7FD3BF6424003376C44F30156C03726EA1B75F54240D4C8A523B40156C0342B1E5BF1F34240B2F383A6DF0256C0FBD089BBB1F24240F94AAD4F680656C0AD9BCFDDFEF3424033409ACF7E0656C0FDD7F6DD9AF24240AA290E6BD90456C08D47C4DB15EF4240BCA24F84310256C08DE1FA5801EC42408DCB3DE5B20256C078E5BAB8EDE94240154F920CB70556C0EE1098DB67EA42400B27F80B820556C0F8D5F0FAA8E84240C6951964470256C0CD31811722E742408042A6E7A30456C0EA21C71923DE4240C50DCF0D8E0856C0F32D3683B3D942400F098BAE330A56C00ADE81EA92D442400F209C2B170A56C0FF9EBA8E73D042405B1835C4960856C0D7D8DA12B4CA42401D3D72F4940456C0550A7FB669C14240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('15','IN-FRS','IN','INDIANA','F','933','0106000020E610000001000000010300000001000000080100002297F9DEDC9555C00B709460B11643403F766A82519755C0801507BCBD18434024814B05DA9855C070D54F78EF18434041386843C69855C000D93EBA811543404176FCBDF59555C052A73062E9134340E3996F7C779555C0752EBA846F1243404D90B4BC049655C0A9F41EC42F1143401B326301329955C0C28AA81CC80F434000F7FE410F9A55C041FE351BDA0D43400BCD0D28F69C55C0A43626D29B104340E3A76B09C09D55C0094E6B3088104340B47433895B9E55C0B41A846F4C0E43404E247144529C55C0D72D5D765A0B4340D7218E63519C55C02F056A37BA0943405ABB25E4559D55C0113F659592074340928E1D0833A055C05B434D6D9C064340048B80CA38A155C0938B63AA05064340ED89D109C8A155C0DDAE138A6402434055C55269F9A155C01931F0A765FE4240A0850AE814A155C0DDCA47639BF84240790E318974A155C0F8F7B87FC4F642407DDD2C2CA1A255C03BA8173BF4F54240F5B2A7F23BA555C0ECF115347CF642403AF150B54AA655C01B3C2FB0E5F542408B8B9C9858A755C0E5F50424D2ED4240133C5FFD50A955C0380F63BD49EC424094C755809EAA55C0B8BD13FA76EC42401D2D1841ECAA55C0CCA9C27A29EE42406E0C327F42AA55C0D3B3E48187F34240C4D08540CBAA55C0AA79CCA1E3F442402AC3ADA31AAC55C0DA96FE9DB7F442402B7EF0E9A5AE55C0BAE6B2F482F24240AE45C4AD3EB055C060FAA570FDF24240779D405461B355C06614555049FD4240216B8137E2B455C09CA5BC6DEBFE4240293B0ADC3FB755C0D5EC126753FE424086E14DE09AB955C0F5FC05BE12FA4240029F16E49EBB55C0462DB9B711F84240A7C3F24A4CBF55C00ADE0A6E1EF74240F918D28DD7C055C002CC3DAA5EF64240161D36B055C255C0C951BA8539F44240860CC85090C455C03FBBAF3C50E74240DF0B6FB3CFC655C09889CA5762E4424079335FB670C855C00835B51416E54240AFE713FB1DCA55C097413812DAE94240DA2EB1FD3FCB55C0CD6BDE8F58EB424042220F4483CE55C06766E9E8AFEC4240CE3E6AAB74D155C05990B80277EF4240D2C07632E0D355C00B0E625D65F2424003D932A1CDD855C09DD56F12ADF74240311EFD4AF2DC55C0E63E9FE9DFF74240F8F01DB14EE055C0D3040E4433F542408358D445ADE655C0BCCE01E24EFC4240673FB10523E855C0B29013C333F64240E96C99DD0FE655C0E2985FA404F24240E00B691BFEE555C06091CF64B5EE4240B52CFBBBE2E655C0ABF8614502EC42409FF58F62B5E955C0C844C5A401EA424022EFFD68D2EB55C0879EE1430EEB4240E8F55E8C80EB55C032456683D2F24240F8A173F166ED55C0EAF41A232BF342409E6C3DD49AEE55C01E14C4C281F24240B0DAC5F83DF055C0A3EBD6E2F5F24240A6FDBBA2B6F455C063C4F6A86AF04240E5179728DCF655C06587388C0AF24240D73312D089F955C04A30353159F6424019DA7C5300FB55C0A7C85B93BFF542402BE52895CEFB55C0D94B22F4BCF342400D78F254F5FB55C02F22295307F042406C2A9B2F41FA55C0B148A2AF57EB4240F111A710E4FA55C0FBC98F2FA5E742407164CF9322FC55C0D2DA4AB057E64240B763CDF65BFD55C0B8AC00515BE3424061F135E0B70056C07F3413B692E64240C6951964470256C0CD31811722E742400B27F80B820556C0F8D5F0FAA8E84240154F920CB70556C0EE1098DB67EA42408DCB3DE5B20256C078E5BAB8EDE94240BCA24F84310256C08DE1FA5801EC4240AA290E6BD90456C08D47C4DB15EF424033409ACF7E0656C0FDD7F6DD9AF24240F94AAD4F680656C0AD9BCFDDFEF34240B2F383A6DF0256C0FBD089BBB1F24240D4C8A523B40156C0342B1E5BF1F3424003376C44F30156C03726EA1B75F54240EA4741CD600556C02675D7FD3BF64240B4CEC3EC0D0556C08B4F5B7ED6F8424040390E4A230456C0C78CA19D04F74240B9B35CE6AC0256C02DD6041D9FF742401FC1E206B90256C04CE1DA5D68FA4240209A8623640156C0B87B371ED0FC4240F0295225DF0156C0AC0DE25F0F0143404C98E304640156C077AE98404C04434033BF7708A80256C0FFDD0BA1E804434023A3E088C20256C0534B4B01C805434083FDE287390256C0DEE2AFC1ED064340CE5F81BF6BFE55C0ED94E19F6309434042993ADFC0FD55C05ED0FDBF630C4340E9F23D85CA0056C0476B1B83D30B43401B73AC66300156C0AB79B2833A0D434067EEC4614EFE55C0EE042F02DF10434032A2999FD6FC55C0BCA596E08711434001E39E3EA6FB55C07363DB5F2B144340BDF4561FABFB55C0CA39D420E915434097BD07E596FE55C03AEADC85B2194340CDD0EB461BFF55C0A6CD2AE80F1E4340939DBE26B9FE55C0A3170668DD1E43403125E1C342FB55C053D1DE4904274340746DBFC279FA55C09225A4C8B426434027EA6E4281FA55C0BAB5C7E6FA234340B6B58C20DDF855C04D96B8867D2643407DDE69E08AF855C0544CFC8765284340B4B7C2BFF0F755C03FA65F078E284340F5AC52FE3BF755C0147083438824434063EC503D68F655C0422CAA62A024434070060CFD68F555C06836CF07212D4340680F1CD92DF255C0D6BECCE667304340B1D274B6E6EF55C07B8BE56781354340FC6778754BEF55C0E9BD720A07394340D5CBD8578EF055C0ECFC3FAC833A43400B0DA75764F055C000BC268DAB3B4340C55F649057EC55C0BE928B6DA43D43407D800C0F84EB55C0D3D4E0CE84404340DB1FEEEBD3E955C0EB9AE20E104043404C7B80CBB0E955C0C1F6862EF9414340B711CEED11EB55C0DB1E6D8E13464340B116EECAC8E955C00C50AA2D76494340F0DF4DE9FFE855C03D0B28CDEE4B4340B5FA83A6ABE755C0D317A36CB44C4340D5BC68273CE855C01FF50D4CBD4F43404827948603E855C0C9F8EE2B4952434057879901AAE555C07A33B42A0B5643402800837BCFE255C0ED049B89CF5743405127EA9588E055C05B92C9874B5E4340DE73F77583E055C08B9DCCC487624340E35DAE1738E155C0729F48646C634340138CA49681E055C034C5D561D6654340D0F81ADD3BE355C0AC40C1D9D06D4340036A58FEC7E355C002691878576F4340F5BBB99C82E255C0D0A89BF3D3734340E1EC82DCEEE155C0422845904A774340013859BD24E255C0EC92EC0B5C7B4340A575F23E11E355C0E28FF349127D434057373E63E1E555C03A50E6863F7F434033A56BC23BE555C013BED8E6757F43406B41A94376E555C0E9F6423EFF8743408055BA862BE755C032F8F4BAD58A434065A58B8860E855C006F7E5D9648B43409BF606A96DE855C0CA79CC574F8D4340D41C3CEC62EA55C048B9BC75878E4340BC4E35EC34EA55C0742F2593BA9043406C6FCF0DE7EA55C077D5D7B0C7924340D58091EB3BE955C0CCEAFCEE92954340F1962CA8E8E655C0D7A77A0C1A99434086E5D7E607E655C0FB66E88C5D994340C2095BE6ABE555C0452AD94BB09A4340BE0F84E669E555C083D4A066D89F43403A760BC9D7E655C0C5859DC40CA143408A5DEFA969E755C0DC8DE8C006A44340D9BC4FC914E755C020EE56FF1AA64340C765004B04E855C0C668243D5AA743400C7BAC8740E655C0F1BF549A4DAB43407C56304193E255C02D10623ADFAC4340E530954078E255C001616C281EBD43403C3CAF3B47E255C08F678B0900CE43402274EC6F4AE255C026CAC55494F14340737F8A4943E255C0846B821447154440EE280BD548E255C0282DF930DC3D4440F624C15561E255C0A38E0E91503F4440793282B117E255C0514E26D66A5F44402D15DE260DE255C0FE563A774681444046F9F37008E255C0896F5EBF3E964440F17CE93914E255C07AB73B4492A644408A5BCA8717E255C0550DB4C720BC4440B81A3AFCE9E155C0C84F60C79FDC4440457D5770ADDD55C0F7190ACBF7D54440C3DEF3ECD5DA55C0C984662C93D64440FB3B834D49DC55C0600DAE0B3DD44440EDD09B8743D955C07FD46C2D2DD1444035E5FD78F7CE55C0882DC0F326D04440E602664351BC55C0E680C462B6DB4440007A33D96DB555C04CD2570FFCE144408DDEA3909CA155C0396CE339FDE144407EE9181E038F55C0D57F6512E7E1444003F020105F8455C0B81C4358DFE144408EA7EA88267355C0D9697D83BBE1444056C1E692346A55C086753CC79DE144407B36867B055355C0412DD105BDE1444066D15E6A5C4C55C0913501A5A5E14440C879EA50DD3455C0D4BFA11F85E144409007936B763255C02B8FB71E67E14440A31D4D8B953255C0D36B1B8247D9444082D8FCCDA53255C04C9A0829E7C344407F35B371AE3255C050A5A968C5B64440FEB509589F3255C08198FB2554A444408F5A5B59A93255C09AFAC6A566A04440365307FF973255C0309D2BF7817E4440D4902720A03255C025B7E0D40678444025CB3D84C13255C0E18E214C4B5D44408536B5A4C43255C057B04AC65B4B44408AE98F02DA3255C05A4039C4302D4440875D27A2E73255C0701EA464E52844408E6230986D3355C0578A1F72CA014440F5A529F5973355C03BDC6DB665F54340E0C92CAFC13355C00CBC28C0DCDD43405263E206E83355C0326BE0CF32C8434041EA2C24E93355C0407ED554AFC1434026B05137F83355C019BC9088FAA743409293BEF6F83355C04E5958A9C9A643406299564CEF3355C07E5E9E85218D434079EF2CAEFB3455C00709D5A3458D4340934CABD2BF3855C0D54EE46453884340F0D833B2F53855C0DCD22EA77B8643406F29E22F153855C0E9740BEB358443406C6922CB073655C0F770FA11BF8043406B2C7D89673555C0B2C07F96CB7D4340232C060A2A3655C023DA145A317A43400354B66B0E3855C03FA0A3BBBB764340F56DF22A043855C0204FAA3E68744340390DB509063755C00698442176734340F1BFBB05683355C0DCB8A126D7724340343AA784793255C0A6E1818933714340BBCE6784653255C0F8E5892CEE6E43409602FF65C33455C0834C63AECF6A4340564518E5663455C06E215E758E654340FDDEE569703E55C07CDB7A0BEC6343406CF809CC9A4155C094F05E4AD46143405857968F614455C03299D0E90D60434042B82E76A84755C040C300EB685B43409833BEBA4C4A55C0C5B25D8BFB5843403F46115F214D55C04A05508810594340622C92845E5155C02898AABC475F4340C6AF83CA705555C0AB48F939565E4340100FCB91C35A55C0A0BD0374845E434075D42794965C55C07F892594C75C43404745C914095D55C07E677118EB5843408DD0EB71295B55C0B1BDA90ADC4A434088225EB1B75A55C039C7026FDE47434029BE50F2AB5B55C0D4AA8CF1BC44434069797A34D95D55C034E92D9253424340283A2EF7756055C02B5AC579573C43400C9D917F356755C07BD7A97E2C394340A2FBA0A0306955C019A2D7AF1C314340A98F2AE0DE6955C00A543A7C3B2B4340B463A0E09B6B55C045158BA6852643402C42A4A2CD6F55C04EF42EAF992243401D821A47517255C02FD5416825244340650D51899E7355C0D84D6385A1244340319F410CC17555C0AE8311855D234340F5A244AB8C7655C08E153B2B891E43401AF9016E5F7A55C07B17BA490A174340CFA44F488B7A55C06EC7C7D14D08434018EDD367937B55C001739AB65B044340AEA2C768597D55C090286AFE830143407D85EC2B6D8055C0289E50E7390043401F2E0A0F068255C0263EC60119FF4240DE47A8B15F8355C04C3A0B98BFFB42409309B119B88655C0C7F1A17673014340FCFC4125338C55C0AB9C5FE84502434007BC6C4E239055C0A748975C36054340BBA8F3D1C59155C0ABA3433672074340B4BA30F4A69255C0FDFFEBF10B0A4340FA788B180D9355C0A1D3F4293D1343402297F9DEDC9555C00B709460B1164340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('16','IDNR_EFD','IA','IOWA','F','934','0106000020E610000001000000010300000001000000F8000000171CF93FB0C756C0BB8CA8F54B5A44409CB44C8046C856C0F0C50FF851574440B1A402C468CA56C0BB5E975A0354444054B0E98AC3CD56C0356F7EFC6952444071F63111C8D056C079DD47FCDD514440D8AA257F0CD856C0C60369D73E4D44402000FA4352DA56C0FC5D1C7A58494440958C66046FDA56C0C5BE19FF2546444038DC63E076D856C0DBA6C224A7434440F9B76F1FFFD756C0A058C729794044403D0AC7DEACD856C0DD7F62EE403944401C3EEABADDD756C000EA389296334440D4A269BCB2D856C0590398523A324440BCDFAC61D0DA56C0585B3392863144404D920A46B8DC56C0F57967F29B2F4440AE6728CB87DE56C071F9C7AF0C324440EDFC554D61DF56C08F2016EF05324440EA8A622F06E056C073F6AA4DDC334440A9C4A6B3C5E156C06687FD69803444408F1A9014E5E156C0BEDC41E7B0374440057617767CE256C0C91F94257C384440E8B8901520E256C0DC3BEDE44B3A44406561BC9C14E556C008AAA77E5C3B444027FC4E7E81E556C0EEFBA8BB043E4440586F25A37AE756C0C69F8CB49F40444026EF5FA3D7E756C0ECBB1A2D36444440E63DAA0D4BEC56C066225D5F9D464440E2DA0E4D28EC56C0E87709D8644A44407F420AF1E2ED56C0C24B7EB1F54B4440085D943478EF56C0383FE9690D4E4440E7B1475491FC56C0D5BE0FAEDB4D444065F844F85C0C57C08F41F4B4CF4C4440E8B0DA07231757C0B1CC3FEABE4C4440299914265F2957C08DC2EA05B54B444017BA23B0F02D57C000B3E3367A4B444024D414C7754657C0C0313BE4CB4A444041749E86B25757C00C6F9B884D4A4440436CA9B9066457C0C383F01B584A4440DEB7B4CC527257C096E0C1990A4A444068694EE0278157C0D486748E79494440E9DAA3CF418F57C01B6F1A6B1549444074B0BA060E9F57C058A0988B7F49444024F2C1BBF3A857C01AA9DF01B249444052D2CF5EEBBA57C08DD72B4AE24944401FE0D458EACD57C09F70DC747B4A4440A79149C87BD857C0599FFB74CB4A4440C2B7C5621EF157C083708CEC654B4440238F67A37BF057C0CC40A2CB794F44407EB453E626F157C0BCE4EEAA5152444087D0707A1AF857C0ECAE8FEF7E5D4440442BF6BB83F657C02A92F8EA73654440B8DA66002CF657C094176B26966C4440FA0FBEC066F557C0999E5004666F4440D631C7E389F557C0000E2E825773444014CD7D4A9BF557C0AE84D57CB47C444038ECF1EF18F757C0DBA860DA568044402516DBB102F757C005771BF97A844440737C2A563EF857C0C02C31786E884440F24287F6EDF657C0C44AF5D6F98D4440DF12839C1BF857C0F6F3C795049544407ADDB1FA06F757C07E7E7DD55B95444032377D1BFDF657C0D19EF4D41B974440B8D80063A1FA57C03F6C6115D798444051F4C02406FB57C0C7BA63F59A9A4440CFB982844DFA57C07BC8CBD4D49C444042E2E5E588FB57C00EC9B8CBA9A64440A4686F2351FA57C022C606EA7BA74440E23C022372F957C0934AA4EDB7A444402C307321E7F857C05E17A1EA93A644407CD4046558FC57C0F01AD0A587AB44408EA7F8E129FC57C03E49D9FB88B24440DED51E1ED8FB57C0C1324F502FBB4440E038C3FE00FD57C027EDFF2E77BC444044999F01710058C04CCF8AAFB0BD4440DC4F8561DC0058C032EAF36D1ABF444075622FBFC9FF57C0FEE7CA6979C14440D419F01E9DFF57C0B7F456E698C34440736C673F4B0058C09C5B3965B1C44440FFB1B304360358C0A65DFF691DC3444070D247687E0558C05DE2FC88CDC44440630C7E48E20558C05EF1242415C8444059FD27672C0558C0552FB660BAC94440345C03AA1F0758C074B82E3DACCC44400B16E2075B0658C0439E0C91CCD344401E089E69B20758C027C4AA6B90D744404AC0B229D20758C07CC42FE9F2D84440BCA37CC5790558C05189EF053DDA44400AD4A3A6620658C0C20EFAE0A3DD444067D875465B0658C0CE92B47C61E04440996DB404E40458C0325A03DC4EE54440F83B700EAE0858C0E5D3CD5B6AEE44409A3CB6F33C0A58C08D93803BBBF34440893351F2550958C08E02F55A63F64440F3EB31D46D0958C022AC093AAEFB4440DED24C9BDA0B58C0160A091A87FD4440F973295FFB0C58C036C2DF1991FF4440DD5B53251C0F58C02AE2BD3929004540651D2847470F58C07E2AC1DCA30345401053F2ACFD1058C09B2F4A4142064540BA0D6C743F1258C05644444CCD0F4540C27D2BE2891658C076E3A7198715454068D83FC7431758C0BDF661BE651B454082BBCA039D1558C0ACF88EFC601D454019821C444A1558C0FE20B1BE5121454099BA8FC5F11558C0D46BB6401B2445402B9855C9981758C0E50111A42526454063516B2BF21858C07C8695C7152A454058029AAF251B58C0DB8FA42BB52C454038E3C64C5A1A58C032A4BBEBC1304540B80F2B6CBA1A58C01C4AA96D1735454008EBB908771958C0C821EFAC8C3845404D3BB147591958C01569FACDD33B4540A2B6100B1F1C58C02A9ACF719F3E454016592E4EBC1E58C0113C4E533142454003ED3B4E511F58C0E0B68C1132484540B99B1D6F0F2058C02C3DE911754945406439D58D431F58C05550D5304D4A45406E3DA16FD22058C096D06DD09B50454076B6FC72A22258C02500C5B2C954454054A0D4D5082458C09AD2D6D591554540F5D9673E192858C07098E35DAB5A4540BD453861012958C0E376C83FD25F4540B446EFC0822858C0374B4F596F634540CE63B3BC742658C03737C2EF5766454059B0AFFB9B2558C02A3B38C7ED6A454073CE3819AE2458C0CF9C53E5CB6A4540BE17C6F6982358C017595B605F6C4540CC510295662258C04F3D75D4CD72454041536636D52258C0DD368E92F9744540999C36B2F42058C0DA0AF2A7E7794540D32431F3182158C02FB35942447E454015E285F1EF1F58C01180CFDB8A814540F48F89D9472158C063A4D3D5978645407A091354B11E58C00B3021D1EB87454000AF8EF2921D58C0E8765AADAC894540FB5D7FD37D1D58C0DAEDE96A3F8B4540455BB475E51C58C0A315A4E22A904540B3CA3C82471E58C03C1F0934C39A4540F1926F062F1F58C095E68773E49B4540CE706932C02358C07431E7D4DC9C45404156F694492458C00D4FC351AC9E4540762956F5CF2358C0BACC9FEE6AA045400B3B8FB7862458C0BCB24C0CBEA1454046E1CC7A102558C0146C372521A54540722D9B96982258C06B76106061A7454063C4E117772158C0AE27BD12B1AD45403588257A9A2158C06064284B2EB14540716BF57FB12358C0AC26B6074BB345402C00D906B42558C0454D18BFBFB74540D61378E95C2558C0F5F27992AFBD45401C75CDCC4A2658C02A270C0EFBBF4540AF441B17781D58C0821E83C6F6BF454046665012E80358C0749E9AF3CFBF45407D948B7C7BF757C0975F5965DDBF45401BE410E1BEDD57C04F59B2F5F0BF454022A7463761D957C064BFFFF10AC045400C83C8E4E8BA57C05594A165EBBF4540A69C439B07B757C0B94C05FF00C045403273AF9F229D57C04ACD40CFC1BF4540A4F56D5DCB8F57C061FA278BDDBF4540A0E87731557E57C01622EECA09C0454031CE6236D66957C08AA803FE18C045408B21379A0D6057C0B042DE0110C045400D1C97F77A4357C0C0FAF2C12FC0454026CC68D2BD4157C08FFE01E829C04540482AED68B62357C07467A98008C04540591402B9001D57C016271E5EEEBF4540E441FE4AF60457C0C4DB2843E4BF45404540AC51BEEE56C0FBDAD3F7F1BF454077EECA3E1CE756C0A250F08414C04540FC3FFDEA4ECE56C0CBEC787F1AC0454015DDEE0A19CF56C08225FBC57ABB45403AD245A87FCD56C0342D3B4E47B645405FC2F305B0CC56C06D524CF86CAF4540E4E11BC454CB56C025A8AB1B4EAD45402FE9B01C06C556C042ED97241AA84540973EE15A40C456C0C519A06AEDA34540AD61615A6BC456C037AB0BCF02A1454092F8F39F53CA56C09E418BC4E3924540DA5751E0C9CA56C0531C25129C8A4540B135A45F39CA56C07B687A32648A4540A822F4DEBDC956C06E8510232B8045400A97D25EE7C856C00F6E3AAF83764540B3A75FBCFAC556C009E0FC5A8B6F454003850EFC3FC556C08801DC4C45644540B1ED991B3CC456C0C5563D56595F454051B59A99F2BF56C0BC6ED7E6805A4540DE029298D7BA56C05FDDEE6F2057454061C1F5771FB956C0D04C2492D056454058CD4113B8AF56C04FB53F9F18544540C61B337577AC56C08A3056A6A75145408ADC6D3685AA56C0E5FBEB5D234945407F83E0F6E8A856C0795DB6A3214745404F7D32970BA856C05CABF8EDA74345403E74F776DCA856C0C43733D4324145400616F7B6B8A956C0DA575B59523F45403FC0119880A956C085355D00E23C454076D216F9C7A656C0571FBAC7F33A4540943523DA13A456C0C2EA76F9FE354540B4C321596F9F56C038F557EBC3314540D5084339459C56C0163F9C38172E454090C97A39619B56C0810B12419A2B45402ECFA75AC29A56C03560F5C1C8214540BFCF663B119A56C08048728A0F1F4540A2BF67FD8A9756C082A648B5E81A454064AEF4FDB79456C0BCC2565A421945403DFCFABCC98E56C02EFDA06872144540E75533DA448C56C0FCBE7DF5B40F454083D6FF18478B56C0FF4E60566D0F4540DA0D5E78AC8A56C0FA8ADB3B480D4540D8C72138C48A56C0664D0309D10745404B489E76A48956C0534301324804454016E20395238956C06D5F835EF3FD444059628EB3E58956C09F72248624F74440C584A1B38A8C56C0751AE27A30E7444032E5B61B599056C0F5401E0211E4444035C24E61859356C0F89E64E5D4E0444010C19CC1DF9456C0E8C3D3A883DC44407FCD2F3ED79556C0994D447016D3444009E2BDFAB99556C02BFBEF9429CD444039B1F4BA4D9656C05D9F7BF61ECB4440577BDFA5149B56C0E862A8769DC844404DA0C7A6D89B56C00086BD1895C54440D3B77AC9209D56C038A0DBB987C344400B9681579FA256C0DD81B01454C34440908D762074A656C0D3356C303BC14440461998E72BAA56C0A1F09C4E2EBB44407D8B98AE55AD56C0D4A315AB9CB94440F35F3A38ECB156C058EC9FC494B944405EC9EFBE08B656C0024CFB5FEAB84440B34FAF88C9BC56C08C5D63F9EBB5444033E7CACE0DC056C0BFE8C8B32EB7444084223ED1C4C156C0963F447136B644400F1C9B7294C356C05127A85061B3444014DC700FB3C456C001ACBFD5DEAA4440DD48654D8FC656C064A844D948A24440CDB75ACB81C656C0CB6CC37EA39D44406BEA17259DC356C00F3706AE909644404876A9802DC156C0A4C365D33A9544404196301D64BF56C03658D8D97B9244404DF735B94EBD56C0F30C2AC25C8D44401A96D5571BBD56C0CA4E98C702894440C310DE947EBD56C0FE6AC158AB79444023A73356F0BE56C04CE7F97B44764440303A4A9C28C356C0B6278B7F9770444081F4ECFFB2C556C095CACFE4B86A4440616496FEF1C556C07246E3AF7B614440171CF93FB0C756C0BB8CA8F54B5A4440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('17','KS-FP','KS','KANSAS','F','935','0106000020E6100000010000000103000000010000007C00000068D4F5849AC457C0552DE16E3080424086B4311A06DA57C06DC5D32B148042409110C24AAAE157C0C5C0786221804240FBD288B449F257C03508BE32C27F424090645F3B4FFD57C0F93735B70280424012683D1E630058C036EF0767C97F42403CD7195F3A2158C091BD07EF12804240DB2C67A3EA2F58C05E081E7105804240B0578CF5CF4858C08ED595B7F97F4240F35FB231C95D58C047F2643C8C7F42407153CFD4787358C00BA33710D17F42408B8CAE9AB08658C06F09A676D47F424030F4C799379658C02331593FE17F4240B61E61F592A258C028D354C8CA7F4240A5C66F12F8BF58C09B9C43D9C07F424040C16391FFDB58C0821175B04D7F42406A288660DBE258C034DEF0536B7F424077A495E7F3FF58C0385543D7697F4240CBFC4032AB0559C00DEEA513B37F4240F565F77A972859C09A1F74F8B87F4240CCB92C6AD63C59C0A26A2E9C927F4240ABCBB429954459C05C6D4DFDAC7F4240D390E06D6F6359C0A1A717A3937F42400E36FBB9918159C016C6FB7A937E4240D826F79B618259C08835395A977E42402A1F794DB08259C02233E49A71B14240D9E69C5DD88259C0D79FDCD31BD2424099831A83D08259C0BF7307C600DE4240A1BE70A9F28259C0ED27CF3D7D2043400DDF1549EA8259C09484323EB5214340FFA7659E0B8359C043B4FAAEC84E4340D9888F5C0B8359C08DB9E47EA5584340C4DEC45D228359C0431A2C83BC84434082972161108359C078E45A75399043403B21BD901F8359C0372E30F209C84340CD48F3102A8359C075897BF1CAC8434032FF015C4C8359C021A1CA8DDCFF4340EFF293BB125A59C0F74D97E32000444080123B159E5459C0CE6A23AC3B004440F4C9188F4F3059C0468E6D7F06004440DABFD70C0B2F59C08C6DE4E0E4FF43400E7A562C3B0C59C0E7CDCA2F130044408543460A940B59C0BBC0B8AF0F00444000D91AD92EE858C0DD7FD1E76100444097DD57A567CB58C0739C2324F2FF4340317688D024C458C028DDCE89C9FF4340285212D71EAE58C0B5218194CDFF4340BAE8E86249A058C0FADE0AF2A1FF43401DDC7817E89058C0F7FC01B6CCFF43402DE48F617E7B58C083A7AB4DCDFF4340BAC5D5FF427458C00EF37320F7FF4340D06E4890295758C08DC89727AAFF4340EE571262213A58C01D98FCFF81FF4340CEBD6F784A3358C0D00A14FD4AFF4340735792F60E1D58C0B694930D41FF434067016BF7650F58C00A6A39E14BFF434041F27F8A140058C03DFE5D5E61FF43406DD0FAFDF6F157C0D123AEA92AFF434061589DD319D557C01784805A0DFF4340404305B2C1D357C055153F96ECFF4340A802E9E96BCF57C0A3BB62EC96F84340E1EF764749CD57C0A717FC2816F843402F847AE569CC57C02EA8DAC780F44340FEC262A2A2C957C0D64592223BF443400916053D72C657C0266B53BC57EF4340B404163A0CC457C0751356B7EAEE4340E0D176F824C257C07311C0335DF04340385A98B864C157C0EF97A932D0F243404F80EEF2C2BD57C0E9378D2F4EF34340E7467E2F0CBC57C04D4C0FCFB2F24340681E80CCEFBB57C08DCCBEAEB8EC434085D1E1C920BB57C09A8C890EA4EA43401F246A267EB957C03AB9B8CE06EA43401FE5A144DDB857C0BEEC138FA0E84340FE23B2848EB957C0B7DAC86E9AE54340779943A8BABB57C0D6460AEE31E44340342CF9E7D8BB57C09037082E41E3434022F570C5FEBA57C05832F8ED00E1434031E40CE021B857C0A810B8EF5DE14340C398D27EC1B757C076220BF086E04340BA76DADE2EB857C0DD545A90A1DE434061915CA1F6B957C02A00535006DD4340DC67452493BB57C0B9C25A2F0FDD43406B2ACF4700BD57C0929BD9AD45DE4340DD418DE88DBD57C03DB2926DB3DD4340EB9494E6A0BE57C06B6368B0ADD743407D5D8589CFC157C029119394B9D443407ED50CC995C357C09D3E069A16D04340C643A6656EC357C0B4422F7B1BCB434092EA36A9F9C657C017595EC1C4C7434071FE1CC687C657C00B3BC46134C443409556D4DD0BC357C056D547411FBE4340753F52BD97C257C0665949A441BB43408ADC5EF81DBF57C0FD15614740B843408B47C4F657BD57C0443D484DAAB44340CC7A7E743FBB57C0FE56FD53CDB043409CB549727DB957C0D84780D5B8B043403F5EBE7353BA57C085DFF61B89AB434061FBA67317BA57C0FEB34CFF58A94340F46CDD1164B857C03A21D3269DA44340B50608AE57B557C005386E8C81A1434047168C4D88B457C00DB91D33029B4340A624D72A90B257C0A61EE67533994340873FDA04C1AE57C0D5EE04BBEB954340F151459E3BAB57C0A8D5ECDA639643402D48BFBA5EA957C0B8D5F25C47944340EDBEC6B635A757C0942B473E69934340207B9C757AA657C0DE1D58BF13924340E6C69EB6EBA657C04714FD42708E4340680D3F77FEA657C0A3A87DABB78543406436DCB332A757C083209A62266B43407C82D1D13DA757C05ECF1A4E5D5E4340969B3A1299A757C04F1A5340593C4340FC6FA6929EA757C0E7C1071B2E324340D240FC5682A757C065FC4EF5230743404BBB809778A757C0D464ADBEE3034340880FF881A2A757C0F85B1CF205D742406D3DAFA19DA757C0690C39773FD342405E9A37D699A757C0DF5893982DAE4240EEC9E5539DA757C046CEAE21F3A942408991DBF4B8A757C05CDF17EAB2874240EE67D94CB4A757C06DBB293B9F7F424075DCDA7E18C257C0363B5A8A1980424068D4F5849AC457C0552DE16E30804240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('18','KY-TEMPO','KY','KENTUCKY','F','936','0106000020E6100000020000000103000000010000005C01000094A18DC9AEA055C0A24C9578D9534240D3CCE87250B155C06E0AED097853424006BB82205DC455C0176C54C84D534240227F658536C755C066A49F0D5E5342408BAFAADF2ED655C0D7B054851B534240012C727F00E955C048C638789652424066352AC562EC55C07B89B09A7E524240C3C2575BA0F655C0478C00681D524240D3EA6ABCB9F755C05890AAA8AF554240EE071BDA900456C06B1532DCFF5642407D71793CA10256C0FF5AB19B964A4240793AA6BE3E0256C03A6831BCE3444240E8B2C4A2BC0256C0C61A0B9E8F3F42403AE22DE2BE1F56C0757F6E44C53F4240E1C87AC4CF2056C08D847825F13F42401F3121D0E23356C03670ACBBE03F4240F1F84F12E33456C0429A8DFCFC3F424078B1B4D2243556C032D3F33CFB3F4240B98A60CD2F5656C001990C8D55404240BA43E6D48B5A56C0FDE28ACB57404240919788F5C35A56C04DDECD295C414240E30151D2EE5756C06D81CF33E14E424044024491455756C0261F25F218504240234002CFE95556C0CC05E51180504240F586B44CA15456C098949F33A04F42408B42ACC7245256C0C020A7BEA349424047A6EFC2774F56C02D795AC0DF484240142410C0724D56C037DA737D7D4A4240BEBBE2DFCF4C56C0CBB3A253D0504240FEE98F9D564B56C0693C578F97534240422CDDDCBE4A56C07FDE0BECF75542400BD8D1E0A44C56C0AAC73A83515B4240868D0B41914C56C0C61937001E5D4240702EC55F584B56C0DDFADCDA676142407D0F8D1CB14956C0F34F0A1C2A6142400E8C06DA084856C0728BCCBB5062424085814BDB0E4856C078BFAF976F6542403CB29840864A56C012159213F9664240516319231B4B56C028B2D10E2B6A42407A13F102A94A56C0AE417A0CF76B4240E8454B3F4C4856C017EA284BE96E424070CEDBDFB84656C052F3321E1A7A424056F44AA1DC4656C0716426DA1E7D4240ED1068C5504856C097F26A367C7E4240B01D00C99E4956C0A5962593CE7F4240556D366F294B56C06F30F32F4C834240E6A10212DB4A56C015FCC78E3A8842402CE4D6F05E4956C0F0E1CB2FEF8B42407520552D7B4756C0828E00325C8E4240ACB73CAA2A4456C082C55DF3CB9742400EDAEE3E913F56C019B0F4D72B9C42406915C630AF3B56C01443027BF69B42409741CB1F413756C096E3933FE39942404E33E6A2C72F56C05F973C077A934240630A4C814E2F56C02ACB570814924240C2A8C7170F2C56C0E1DBC3EB569142400C5F922A502756C08B2F2B12F78D4240DBD7EEE1CB2356C0BC19E9D95389424074116DBB1B2156C0C80F113E4C88424067266156681F56C02D36B4FEBB884240700B3893841E56C0768301DD3D8942406131442CD51C56C033A29A18A38C4240C03318240B1B56C0428134711794424078834EE8D81C56C0AFA4C22D559A4240EFE41211182056C0458905C900A14240AAC61535BA2056C02DFE280201A64240C8F50891EE1D56C07F27A6B04DB342408EC93C89DF1A56C07540BDCECDB54240FD21875DFD1656C0950B64F165B44240AD88B496F31356C077EF0C0EB1B84240EDD1B753A00556C076521A1CF8BC42401D3D72F4940456C0550A7FB669C142405B1835C4960856C0D7D8DA12B4CA42400F209C2B170A56C0FF9EBA8E73D042400F098BAE330A56C00ADE81EA92D44240C50DCF0D8E0856C0F32D3683B3D942408042A6E7A30456C0EA21C71923DE4240C6951964470256C0CD31811722E7424061F135E0B70056C07F3413B692E64240B763CDF65BFD55C0B8AC00515BE342407164CF9322FC55C0D2DA4AB057E64240F111A710E4FA55C0FBC98F2FA5E742406C2A9B2F41FA55C0B148A2AF57EB42400D78F254F5FB55C02F22295307F042402BE52895CEFB55C0D94B22F4BCF3424019DA7C5300FB55C0A7C85B93BFF54240D73312D089F955C04A30353159F64240E5179728DCF655C06587388C0AF24240A6FDBBA2B6F455C063C4F6A86AF04240B0DAC5F83DF055C0A3EBD6E2F5F242409E6C3DD49AEE55C01E14C4C281F24240F8A173F166ED55C0EAF41A232BF34240E8F55E8C80EB55C032456683D2F2424022EFFD68D2EB55C0879EE1430EEB42409FF58F62B5E955C0C844C5A401EA4240B52CFBBBE2E655C0ABF8614502EC4240E00B691BFEE555C06091CF64B5EE4240E96C99DD0FE655C0E2985FA404F24240673FB10523E855C0B29013C333F642408358D445ADE655C0BCCE01E24EFC4240F8F01DB14EE055C0D3040E4433F54240311EFD4AF2DC55C0E63E9FE9DFF7424003D932A1CDD855C09DD56F12ADF74240D2C07632E0D355C00B0E625D65F24240CE3E6AAB74D155C05990B80277EF424042220F4483CE55C06766E9E8AFEC4240DA2EB1FD3FCB55C0CD6BDE8F58EB4240AFE713FB1DCA55C097413812DAE9424079335FB670C855C00835B51416E54240DF0B6FB3CFC655C09889CA5762E44240860CC85090C455C03FBBAF3C50E74240161D36B055C255C0C951BA8539F44240F918D28DD7C055C002CC3DAA5EF64240A7C3F24A4CBF55C00ADE0A6E1EF74240029F16E49EBB55C0462DB9B711F8424086E14DE09AB955C0F5FC05BE12FA4240293B0ADC3FB755C0D5EC126753FE4240216B8137E2B455C09CA5BC6DEBFE4240779D405461B355C06614555049FD4240AE45C4AD3EB055C060FAA570FDF242402B7EF0E9A5AE55C0BAE6B2F482F242402AC3ADA31AAC55C0DA96FE9DB7F44240C4D08540CBAA55C0AA79CCA1E3F442406E0C327F42AA55C0D3B3E48187F342401D2D1841ECAA55C0CCA9C27A29EE424094C755809EAA55C0B8BD13FA76EC4240133C5FFD50A955C0380F63BD49EC42408B8B9C9858A755C0E5F50424D2ED42403AF150B54AA655C01B3C2FB0E5F54240F5B2A7F23BA555C0ECF115347CF642407DDD2C2CA1A255C03BA8173BF4F54240790E318974A155C0F8F7B87FC4F64240A0850AE814A155C0DDCA47639BF8424055C55269F9A155C01931F0A765FE4240ED89D109C8A155C0DDAE138A64024340048B80CA38A155C0938B63AA05064340928E1D0833A055C05B434D6D9C0643405ABB25E4559D55C0113F659592074340D7218E63519C55C02F056A37BA0943404E247144529C55C0D72D5D765A0B4340B47433895B9E55C0B41A846F4C0E4340E3A76B09C09D55C0094E6B30881043400BCD0D28F69C55C0A43626D29B10434000F7FE410F9A55C041FE351BDA0D43401B326301329955C0C28AA81CC80F43404D90B4BC049655C0A9F41EC42F114340E3996F7C779555C0752EBA846F1243404176FCBDF59555C052A73062E913434041386843C69855C000D93EBA8115434024814B05DA9855C070D54F78EF1843403F766A82519755C0801507BCBD1843402297F9DEDC9555C00B709460B1164340FA788B180D9355C0A1D3F4293D134340B4BA30F4A69255C0FDFFEBF10B0A4340BBA8F3D1C59155C0ABA343367207434007BC6C4E239055C0A748975C36054340FCFC4125338C55C0AB9C5FE8450243409309B119B88655C0C7F1A17673014340DE47A8B15F8355C04C3A0B98BFFB42401F2E0A0F068255C0263EC60119FF42407D85EC2B6D8055C0289E50E739004340AEA2C768597D55C090286AFE8301434018EDD367937B55C001739AB65B044340CFA44F488B7A55C06EC7C7D14D0843401AF9016E5F7A55C07B17BA490A174340F5A244AB8C7655C08E153B2B891E4340319F410CC17555C0AE8311855D234340650D51899E7355C0D84D6385A12443401D821A47517255C02FD54168252443402C42A4A2CD6F55C04EF42EAF99224340B463A0E09B6B55C045158BA685264340A98F2AE0DE6955C00A543A7C3B2B4340A2FBA0A0306955C019A2D7AF1C3143400C9D917F356755C07BD7A97E2C394340283A2EF7756055C02B5AC579573C434069797A34D95D55C034E92D925342434029BE50F2AB5B55C0D4AA8CF1BC44434088225EB1B75A55C039C7026FDE4743408DD0EB71295B55C0B1BDA90ADC4A43404745C914095D55C07E677118EB58434075D42794965C55C07F892594C75C4340100FCB91C35A55C0A0BD0374845E4340C6AF83CA705555C0AB48F939565E4340622C92845E5155C02898AABC475F43403F46115F214D55C04A055088105943409833BEBA4C4A55C0C5B25D8BFB58434042B82E76A84755C040C300EB685B43405857968F614455C03299D0E90D6043406CF809CC9A4155C094F05E4AD4614340FDDEE569703E55C07CDB7A0BEC634340564518E5663455C06E215E758E6543409602FF65C33455C0834C63AECF6A4340BBCE6784653255C0F8E5892CEE6E4340343AA784793255C0A6E1818933714340F1BFBB05683355C0DCB8A126D7724340390DB509063755C00698442176734340F56DF22A043855C0204FAA3E687443400354B66B0E3855C03FA0A3BBBB764340232C060A2A3655C023DA145A317A43406B2C7D89673555C0B2C07F96CB7D43406C6922CB073655C0F770FA11BF8043406F29E22F153855C0E9740BEB35844340F0D833B2F53855C0DCD22EA77B864340934CABD2BF3855C0D54EE4645388434079EF2CAEFB3455C00709D5A3458D43406299564CEF3355C07E5E9E85218D4340F602092A8E3255C0D9C40047B38D4340ED4005468B2F55C0BC1F34252F924340FBC5761DB82A55C0A58BCDD0788B4340B82DE878D92755C08509DB7497894340DA6540D6F42555C0C5C47D76FE884340D81433B0FA2055C0A1BCCC960E8C4340C45484CE7D1F55C0751E4E16BE8D43405DEEA289791C55C019065258508E434014280B673E1B55C05CFF3D3DD88A4340DEF8A305DD1A55C066FCD2220F864340C6B8AE420B1955C0763BE1459384434030B5543E211655C005F9CB08D784434038DBF05A0D1455C0CBD2A22ECD814340A7E1FB96911255C079F2D89DE67843407D96B7D3BC1055C0708E5FE56F75434014FF55100F0F55C089775570F16F43407008210EA30E55C082F0BF3D06684340E7D7CEE84F0B55C0E4EFAD85ED64434096569AFFAF0555C02EC2540FFC6143402AFB507C710355C0A8245411C2614340D9D04C1394FD54C05AC057F38963434079D21B0C67FA54C03C1181D804614340B707A324E2F654C0961B777C595F4340EF91CA209AF554C082F480E11E5B4340257181FA96F254C013B3DCE5CF584340E28D6E564BF154C03FB3FF0C4E5343401E8E71EE9EED54C06B8A44D05951434024A47C096DEB54C0F8F1A7927A4F43407A02B8E6F7E954C035609E52DB4F43408D784D052AE954C02A10E0F063514340E2AFF70487E854C07A4E37CD1D554340A6F7718393E754C0CD5C6ECBC75643406D84F217B3E154C09C47762A1A594340D43D243401E054C08CE19B6B565843403144910C08DD54C08DF59391F654434081A6A560C5D754C055CF2CF7D6534340E8C5C7191FD554C08EA4D9FBE4504340906EB23780D454C082AF55DFA34D4340833939359ED354C0DE362321544C4340429DEA1290D254C0EE9DC8A15E4C4340338FC7D074D154C051FB9B21FC4D43400B5A754DAECF54C0C87536E1E44F4340F87BB8E3A4CB54C00DE050450F4E43409DDB6D5E29C954C081B90F86464F4340C1A3789B1EC754C030C8524219554340E9B6D774E5C354C05507ADE2C55743400F62FF70B9C154C0493B4121755B4340C1F7C2293DBE54C0DB150F431D5C434025974AA4F6BA54C0ECCEAA828A5F43401A1945E0FAB854C0EAC94C44135F43404AD6415DE2B754C068E29267085C4340C1DDCE1C52B854C02DD2016B76574340296A19B90AB754C0871420AF8153434001EE7096A5B654C0900409D5DB4C43407470EB71EDB454C04FAC75392C494340BBBC32EE59B354C0AF32433C55474340BAE11C067CAF54C0C44367DFCA464340F04C585F84AC54C07A42B2A1024543408C507C5ADDAA54C04290422646404340CC66259247A754C03105B669803C43401419BAEC8AA554C0401AE16FCD344340738AEF8C49A654C00FDE8AD3292F43409B66F187A0A454C02B742F5A66274340D2E67B881FA554C0E9A899FB702543402655DDE6C5A454C09A31FBBEC32043407DF9E707B4A554C0F42EA7E0681F434065E8AD4A70A754C0AF3E3761911E434077994447D3A654C08B87754CCF184340DD1252E747A754C0B3A40AD0CB164340E6A6650A6BA954C03FF16611B0154340454818295AA954C0E219EAF6BA124340D87D8F21F7A554C0F4F0CC40130E43409D4FA65594A154C089077D39010243401B607E2C739E54C00838DB85EAFC4240D9904C2CBB9E54C045E880A929FA4240EE023ECE939F54C0B605224AA4F842403029816E03A054C02A12AEAD0CF642403E6BF1C1019C54C08BDDD79A8AF24240A3881EFEF99A54C0A3F01861A9EF42403020B8B8F89954C00382746EE6E742405952DB0BC09554C0F778E63A67E44240E62850A7729454C0713CBF2114E142408EEDDFE8149554C00DB3EB0241DF424069A33684EB9254C0AF1F6EB1A3D54240B64F2379418F54C08B62233B11D44240485E41F0258D54C039780AC6DFCF42406032870AE08B54C00CA9926601D242400F3E8323328A54C079AB3812FACB424094FAB21B6F8854C0640E34B796CB4240F459545DCC8854C0E12B7059F2C8424093A8E99F608954C0C27F7D1870C84240BF10DEDE1E8954C08263599A5AC74240518DEBAD668554C00C8BCB042FC6424030807605908354C08742826C3EC34240F70CA603258354C0C24B090A96C64240D9CECFBCAF8154C0F5A03410E8C342402A2B6131807E54C04E08545489C54240017048AE697D54C0654BC076FDC34240BD3D012C7E9254C0D62940B105A74240F8C7405AA59654C0416AD1B458A14240AE182905FA9954C06F4A261317A04240872F9BDA33A354C00D44433B8599424088C9E27B5AA454C06143C256D2984240517475AA05AE54C00367210C158E4240B8A08D0B2BAE54C0B5BA4C48EB8B4240260C080B63AD54C07B500E67A9894240AD4DBB6C15AE54C073B33B63708842405727A56E4FAE54C0C3807DDC5984424076B9E574FBB354C0DFD4C486B7804240D7E06FB775B754C0B85ADE39BF7C424022B0859814B754C099EDE51851774240A5E5CADA31B854C09510709264724240F2A02700DABC54C0032A8A1F9A6E4240640AD80DFCC254C06A87A5F2EC6D4240416F145359C454C0E4C1F970ED6C4240BF5765C434C854C0285D7446BB63424071292E05F6C754C0A551C1422660424097D2EA67DDC854C04C6F3E43BA5E42400EED80B508CD54C07A22C840FC5D4240D71A078D91D454C0876E95F9D15A4240052E40D8B1D854C0973FEB94175842409AFA589ADDD954C0890EBFD20E5642406526024474DD54C0BD1DC6EDB6544240A59AD32EFAE154C07AB76368AB5442402A47C23665E954C0BAB5081AF94E424006E59C1836EB54C000E12D54A24C4240B3761CDA84EC54C0F90453AFC84A424082D645DEE0FB54C0BEB2F86AAF4B4240148817896E0055C0B475E88AC94B4240480B898A491055C0CA5716CA374C42401079B30A6F1055C0C99DCE49394C4240B1CDA82B0A3255C004E99022734D42402006F4ACA03255C0763709017F4D42401FC8E5C9E63F55C0C224CF5B7C4F4240D818969C705155C04689253614504240C7842BC0345355C05028251324504240B6D422F2FD5B55C05082F524214F4240FCBCB23E457255C0E84A0639375042404F2E5753C27E55C05A8BC9D5095142403FBE2F4BBC8C55C02FF66659575242407CB8EFA0969A55C0DA049ABE5153424094A18DC9AEA055C0A24C9578D95342400103000000010000000B000000F42A1F22216256C002F53D0AC43F4240C71603C64A6456C086F97D0468424240B89E75E65D6456C04B9AAFDF4E454240A6565105996356C0CBC7401C66474240D75AB5C2F26156C09A55795B454842409AD95C9E905F56C08EB0D71D93474240C314F1FCD45E56C03B8F71801F4642404617A73B2C5E56C002E69B6547434240BE95721CD55E56C0A7C6B7E99B404240196BB11B755E56C0478A6E6BD23F4240F42A1F22216256C002F53D0AC43F4240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('19',NULL,'LA','LOUISIANA','P','937','0106000020E61000000400000001030000000100000002020000023CB412486D57C0931E4709553D3E40273E3797C26C57C00149CD162F4C3E40C1C02E5CB76E57C0C631A2791C4E3E402CB88D24997057C0D52D2DD550573E408CA020C69B7057C044AD6EB2B65A3E406377C645DF6F57C028AD510D1C5E3E40CDAD7EC8537057C0C05D814BCA613E4023ACFEE9886F57C0A0591102B6683E40B8F3886A306E57C04A2CE717E56E3E40FAE8FF68976C57C009F0B3AE5D713E40B12E39AC076D57C0D8569E8B74763E40901C996CAE6C57C07667F84762783E404FCFA5F0C26D57C022A9DB07247D3E406239B1D0466D57C09F2DB9E3167F3E4057C05072BF6D57C0B9C5C2645C813E4071E6EA12296D57C0DA9A7641E7853E405F1C0D18126F57C087082849B48B3E4098434A98F46D57C089FC86C47F913E40A69DE979F36D57C0CC9ED6C36B963E405B1679D8636C57C0987EAB7D5A993E405E6E3316FE6A57C0674AEEB818993E401528C9F9576C57C08AED35FEB19D3E402B71A719D36B57C0DAD47EFBA59F3E403CD10CFC5A6C57C093EC10FEE6A33E40485673BA666B57C08D79681AD0A33E40CE998F1B406A57C036818DB64DAC3E40827877B8896757C0284C546EDFAF3E409694229A346757C02539D34DE5B53E40C0BFAFBC8C6757C0681F816F95BB3E40204C739BE66657C0C15B9D2D72BB3E40CB47CE9D976757C07AB32930F9BE3E40F57AB45A766557C0B976D200BBC53E40BEAEFC39406557C043D382925FCD3E4002E43536416357C01E82D0601BD43E4062179B76926357C0F3376DBBB0D73E405154A877436457C02C8F3E9C68D83E40E5C7F2F5636357C03863A57248DC3E40E7B99DB6E76357C03C23756F40DF3E40F9934717656457C09A51032AEDE23E400F7BBA36236457C00CCF9DE2F1E63E4069439EF4FC6257C093202DDDD0E73E401DA47ED42F6357C009DB8814D2EC3E405AE43B12EE6157C02FA6E8CE5AED3E4047D68991A66157C09B5D6BAA9EEF3E40834DC031126257C0B46B2240FFF53E400CEC9C92666257C0FA4D972303F53E40F749D753206357C04C360D206BF83E403DAA91F6A56457C05A203583F3F93E4058C2E974E96357C02B928C19ECFD3E40C78619968B6457C0AEBA87D959FF3E409B4F1E365B6457C0FB0F60AF5B033F40E078EBD52A6457C03CCECA6BAC043F40A5499BD3066357C01C83F769AB033F408763300F796057C0D7FAF471020A3F40793D1B92A86157C0B8A33CCCA20E3F40DC7F7C51196157C02E742D202A133F401BCD6775D56257C051A9B7E122153F409F8FB355C56257C0436F881A4E183F40F0C22198D96357C0146AE03AC9193F4052D61078A36357C0EC5786550A1C3F40EBFD30B5416257C08FE5064DC31D3F40ADCC9E14CF6157C04EB99C0549203F4011331556696257C0630BC903F4213F40A66F02D8D66257C0787E8676CB283F4043DAD0F5D26157C00BADB5F0C2293F406B338157616257C0ED2D2EEB302D3F4069A31116BC6157C0F09FD2A7A22D3F40461E9AB6DC6157C08719D5239B2F3F40C49AF7B93F6357C01E372505ED303F401E7AD47CEF6457C050D217B51D2C3F40B4F57DFF056657C09302F8D32D2E3F40E7C04E21996657C062D47C4A02333F40EFE1CA60CE6557C0EE54E4F5D83A3F404B5311841D6757C01A36D9310C3E3F4091E841E52B6757C0F9606F022D453F406CA33DE6766757C044BBEF3FA7463F40313D1968626857C0EA7F7AA32A463F40146ED44A546957C0C6C0ECBC5A4A3F40F9593AEC006A57C01A22A8606F493F407340D810A26B57C020E0ABD617503F404346ED90576B57C0A5C1742D1D543F402B92EF6CA46857C08E6AB40CBF5F3F406FA86FF0516A57C07AE18A32615F3F40C8DDC731826A57C0857003C504663F4019CA5ED5026C57C090BF310504683F40F2B7BBB6746C57C077806CC1856A3F40B8DF7957906C57C029395BFB8B6D3F40AD2A93D6FA6B57C0DD92683435703F40DAA5EC58EF6C57C05FD21D5349723F40510CF2D8B56C57C06A786DE92D763F40C887D09C866E57C04E059EF0AB753F408530FA60177057C00B260D88557C3F40695EFD200A7057C0E82E82E5A07D3F40668401FD066E57C092CA0B7CDE7E3F40E772F8BB2E6D57C08C7DCBAB4F853F4073D3627FD66E57C0697D9070A5853F4050EAD5C1DA6F57C001BC6F8BB3893F40F499B703DD7057C031504330E9873F4001CB02A6F07157C0FB5ABB90AE883F4011039C8AE27357C09B9010662A8F3F40F5E9C7AB417457C002578E1CC9933F405C5A0EAE4C7557C0744728D721973F403FD1D82E7D7557C0954E0A8B889D3F407CF3CB2C777457C0EFE1BBC7469E3F401AA6B68C277457C026058697ECA53F4041E4E58B9F7357C064880BB368A73F402813D94CF87357C0B39A8BC8BBAC3F40A576328BB77257C082C0CD5229B63F4030F42AEDC57357C06586CF562EB53F409832072E2B7457C00B8B56F567B63F4076FFA1EDD97357C023C7A6AA03BB3F40B81D86D0347557C034E87841E2C03F40422BF3CE9F7457C0690518D659C63F408582ECAF687557C0F937A72B5CCD3F409A0241535C7757C081C383E843D13F40442EE6732A7857C09B63121BACD93F40B8DDBEB3697857C09F32AD7120DF3F4018D7EA34227957C001A06BB4C7DE3F407B981F95907957C021ED810906E53F40EDB2D5171D7B57C0359A9F0E8CE43F40675CC056C27A57C052F7BC45EDE83F40F22A8818E67B57C045D7DB28DDE83F4048B4D45B177E57C04F414F875FEC3F404C34EBBB8D7E57C09A926F7E42F23F403AA8B81D4B8057C05F09D95365FA3F40C3BCDB1DA58057C015E782CE42FD3F407793C4A0418257C0579F8C4CA3FE3F40B08DE1B33C8257C0B87539CB8C19404085F2E64B448257C0DD75F13DD7314040051128A1958257C086E22D60F4584040752CB79CAC8257C0B1176C47F5704040C47C86DB7D8257C03A676281FF824040BFD43CE9D57357C01CCB71C7E8824040E0717F39C36057C0F251E18DB98240409C1FB216A95E57C01B4E8F6FC182404040E0BAFCE14E57C00D527BE07A824040322CBCC3A73E57C06796A6D356824040B912CC33E72D57C097EB7ECC278240401CD5AA6D0F0457C00C5571A54C814040B550B10A16DD56C0F15DCCB9CA814040D333D4875EDB56C00C8769D8BB8140408BE2DE744DD056C0C3379CAEBD8140401FA68E2962CA56C0F51F0750AF814040BB7540C95DCA56C0D29062B20D804040A9A59EAE64CD56C026A91C21CE77404052660EEDB2CC56C06BE17866077540404B1BCA29DECA56C0FAF040E9DB7340409A5D3946C9C856C001A361267E7540405EDD62A552C856C09A10C601037840402333A0457AC856C0D2E4CD38D87C4040DB1B39C329C756C047278996657E4040FCDAC820F0C556C08BA8DE766E7E404073B9FE3ED8C456C087120F5F177A4040D24CC4BF18C556C0FDC9D7104B704040D31180C61AC956C0E016F518B16B4040C000D54703CA56C0C5574BCBA3614040E391E5A5BDC856C0B55B302E296040400FF21AA242C656C0AA24E18EF05F4040855696DEC8C356C07D533196A05C404042303247F0C856C0F2E50047E75440404F2F13285EC956C0AB60B3EB8E52404085664F451CC756C02EA55739804C4040CE1C014117C456C0E6D2C796A24D4040CB525B1F0EC356C0A730F694A74E40409AD213BDC3C156C0DEFF262D21524040C2D544DB82C056C059B1E68C47524040D4BD6E5AC2BF56C06735DD7124504040E0B9ECBAEBBF56C0367B8414CC4E4040467EAE5E13C256C084EE907D994A4040184A2441C6C356C069C1689FCB4940407D859A22B2C456C080944F63E7474040ECEEE1610BC456C096C2B0086A454040DCB9A0FCB0BF56C078F09811824140407B7EBF7C7FBF56C02C9E88F6693F4040118EF23E44C156C03C136797D73E4040094B624063C256C099CECED5A03F40409D460064B0C556C098A711473E464040B005F0469BC756C06399B92D19434040A2632DE789C756C0CC37BBB4D53F40402ED2DA62C0C356C0A6CA6FE53B394040092D1FA0BAC156C0943039C7A53840406061981C34BF56C0B3AF6864FF3940405D501E3BCCBD56C071C730C95738404019679CFB15BE56C0C411CD0FA735404094A4CF9E98C056C00A6BEE55D83240409DC3181EEFBF56C0BE4EE47FE52E4040C30D2ADD04BF56C0FF665C23A32D4040C01336D88FBA56C08C8CCA274B2C4040D4BFBD15A8B856C09F2495FDD430404062C0247507B856C061B0591E9D3040401FADA098A7BA56C086166C74192740405BEA9D797ABB56C0EFFEB536162640409DADB05C31BE56C04F8E0974E4264040FCA1469DC6BE56C04C3E19561E26404027BF919DF8BE56C048E22599C5244040B4C5E9DC26BE56C0595B499F752240402E06297D8CBE56C0DDEE296C9D1C404013BC3F23ACC256C08573CC84F21F4040EDE43E2501C456C06B78E468CF1D4040C86CF727A2C556C047ECFFC8C31D404056DC518971C656C035AD464D861B40408D94EB8A6DC756C0E2E12B8AE51C4040A9D22E6F12CA56C09BECDCAE5E1A4040E6433470AFCA56C0CF7909B808164040DA85F98E06CA56C02E04383F8D124040C374DDE9F6C656C0D422F9614C114040307D27C751C556C0517BD69E09134040727CCD4377C356C0B0B7D9C238114040637F1F23E8C256C0BE21605C541440407B3629447EC356C016D093B5A31740406991E9C091C156C0C6B4D239C41540401457A67E40C056C09A05FE59AF154040C344579FBAC056C05AEE08E32D114040F97939E2A2C256C0835EA329CD0D404095E4B325BBC456C0C99A0E0D0D0C404078A3B0E42AC456C03DC597B68307404085A356E7B8C556C016B1C4B64B07404089EB80EB0BC856C0E4F0F2AD500B4040CFDF970D53C956C058718C6EFC0A4040B6C03DED28C956C0D4B0D1337B084040F4ADE14691C556C03B6AF3999B054040CDBA5A05B0C456C08CA0357D1D0440400ECC2AA5A3C456C038F10320B7024040B1C9E248EBC656C099A0CBAEF2FD3F4085F8E9EE70CA56C0E67247EF0AFD3F401724F110E6CC56C086DA5C5219EA3F40EDC61E95A5CF56C0B7DDBFA3F0E03F40246A42B7F0D056C05F49C80997DD3F40722872D372CF56C04C9762F8DBD53F40800B24F40BD056C02741DE409ED13F40C4B8AF17B7D156C0DDB67A3CD9D33F40A9ACA6BABAD256C0A91025CB8ADC3F40D46AF51B6CD356C01F6B680AF7DC3F40C7009C1F6ED556C009B3DB33EED73F409D00392039D656C0D71037AABBCB3F40A85032227FD756C0D4F32A9657C53F4004FAEE3D85D556C05D4A2ABA7CC33F40859074D4CFD056C0C1EA3B1620C63F4084E14334E5D056C0C8698BDD7FC23F400F43597616D256C0081454A1F8BF3F40193C4D1EC1D556C0E6BB8DDC2FC23F40F9207042B6D756C049F004BFE3C03F408A318C615DD756C03961ED1F72C03F4082793124D4D856C0D0803E8778B73F4024473C63E8D856C02BAC0B3494A73F408FECBA4523DA56C07A79DBB922A03F40EA02C5AC45DD56C0E33EAED880A03F40B8A5CE72DBDF56C093B43613A1A63F402D732AF47FE056C0EE4141B7D4A43F408A75157491E056C0BA5D7BDC379F3F40DBBF6A52D1DF56C03EF1EF3DB79A3F40BD9C6BA695DA56C04E7AC57E439A3F40620C7444DFD956C0637A39421B963F404EB8FBE61BDB56C0E234672710903F408D3A00EDB9DD56C02D4D5B4BF98A3F409727B87230E056C03B6E42EDED883F400B8203336AE056C0EB81037193863F40EC1AEE7181E056C091510C46FD733F40073E976C4ADE56C089B8FDAC9D6B3F4048963EABD1DD56C09886E01171673F408B71000DC6DE56C08FE4673AB6603F40D82BE14EA9DF56C095CF705B10603F4082E4EB1179E156C0425CFA2060643F40E87646D32FE256C05BBB97DFC3683F40691DFB333AE256C04A547098306F3F40E90350B55BE356C0B3999DA0DF6E3F402D5558B655E456C0F71A894AE16B3F409E30DCD4CCE356C052ADF21163633F405CD0B97236E256C0D886F1E8FB613F40FED11593D7E256C03CEC78916E5E3F402C4E7512BDE256C0BC2FF517D4583F40D6981C4F5EE056C0D66BBE0ECE523F40380E378E28E056C0EB2E58F5814C3F402817F0CE17E156C01D17784077483F4050BBA891A4E356C0762B3A763D453F405F8F46F796E856C0342DD7F416473F40385AAB1732E956C060472EFB67453F40FEFC6496C4E856C04B2CBF00B93D3F405FE5483376E656C0173F9618C4363F400F3BDDF1DAE556C0C08047FDB02D3F402EEA2FF2AFE756C03D329C94B0203F40B052148E28E456C0A5D329CD06153F404094D54C55E356C057D5B68FE30E3F40A5F77D8DA8E456C0B40F779C5B083F4086C7BF6F2DE856C01E4FFBD00F033F404FE0A08F77E856C08966467559003F404B69762278CB56C03BBA6D411E003F40281B6016A6C356C0510A7E661B003F402EB867081AB556C01ABA874E65003F40F1015A37DBA356C0655D16D36F003F406DBF22D6BAA256C0BB1762B398003F40B0788387FE9556C01A06243C61013F40E43344A1999056C0A8ACCD00E3013F409305D906597556C0D221ACDDD6013F408A66E0D7E46E56C08F556EEAE7013F4014744DD64F6E56C0A996CBEC63003F408218C395836E56C09D4E40D20FFC3E40B12A0694116E56C0BCD504F4B9F93E40352E3E56546F56C0E188F17824F73E40169DAC16E86F56C01F328D3D29F33E40CA8BCBF3636F56C0BBEA038415ED3E40B20B0FF6837056C02B81E684C9EB3E405AF3A473BA6F56C03424C6C8FCE83E4083744E93CB6F56C04ECB988B1DE73E4056526F15DA7056C0D6CBB34A85E63E40E4F16AB3037156C00ECEC995B1DC3E4090D4D5D53D7256C04A731A7390DC3E40E4FD6D52967156C0D31293BD9DD43E40B8A33C35F37256C06232103C40D43E4021C226F4FA7256C0FBFBF8000AD03E406DFBD955E67356C003905580CBCF3E4027903BB6C77456C04E5FCE652BCA3E4071D5BEF10D7456C0268CD8F387BF3E40E609DC12D67456C0FF72B2331EBE3E406B44F591B27456C035E47C76A9BB3E40E77812B37A7556C0A94F1377B7BA3E40466408F3047656C0D5622A7A61B63E40FAAB9E902A7556C0677F47FD2AB43E40561DCC91D87556C05E1DCB3D57B33E40605A4CD0DF7556C0EE761D03F5AD3E40F16E260F777556C0DC4FEEA306AD3E4023DEBCCF1B7656C0791855868FAA3E403E4405EE167556C03F331266BEAB3E4034D0484B707456C03089DA0AB8A63E4028996CE98D7356C0DC0B67CC42A63E401C0D7DE97F7456C0C9BE5B31D09F3E4024B372409D7256C04B868043CF8D3E401756F77D757156C0E128DA831E8D3E407956F5D8547056C0DD5B42CBFF833E4028129653DE6E56C0EE9A7550727F3E40485E1211056E56C0C1DB0F51FC7E3E401054EACEA46D56C00D6D6A143E7B3E40E1199F0B866C56C07A99A1556E7A3E40C5D7844A746C56C090172E18DB773E40B8863CA8BD6B56C079A9AEB974763E401ADA69C53A6B56C038F1C99D02723E40FD57C841396B56C0366771476B663E404B39B81CE66956C01FE6C26C0A613E4068AD9E59636956C03DF6D552F45A3E40AE7A5C778A6856C0DAD96273F55A3E40FDA72254B16756C0DF5291F7EA573E40E8C55CF2966756C0993FA5FBE1523E40981EA6F4C56856C03E32ACFCD44F3E402481C133E86856C0C3297C80BB4B3E40256F38710F6856C01E9940C3544A3E40C2A8214EC96756C0A215186BC8413E40D533FDCACD6656C00EF73BAF713F3E4093D8464B0A6756C050BF33B1CD3D3E40EF1FD383BA6456C0E99C0148E7313E40836017BCA06E56C0E88A3CDC562E3E40B8062B03977056C0858619E8283B3E40EA892CE7627C56C0E15F601E15453E40B5AE53FED58456C03C286964755E3E40319FAC14588F56C0752744FF85613E407202E119C79356C0EE9305DBC84D3E40A0B524822B9B56C062F771A6952F3E4055993AFA509956C0FDA90C8F92173E403E11A2A9A99156C0EF6455BBE20F3E40EC50E393238756C034D79BF9A60A3E409E6F2F25657F56C0929278ECBC0D3E409D6C44D8097956C05AA54D9BF5273E403A1A59C5167356C03F7B1B9FF91A3E406D4A229D5D6F56C08BFCDB83AF283E40F9215F39656E56C02E42B414001F3E4033290732D46A56C0A567B569D3293E406F4162AD8F6956C044C41A5D571F3E4026B095B5E06D56C0EDB29E4F230E3E404D3D716A557656C04790F548BC023E403171FFC6887456C0730345C787F33D40927F0BD5C26D56C04480FBD72AF83D408AED8DB8946D56C063D02061C4E53D403D8D6A8E276856C06CFC2F892CE03D40AEA300C77E6556C017308D9DEDE53D401185589DC26456C01AF90E344B023E40A70AB408E55B56C0415CFE295E0B3E402A56372B085D56C0A82B6BFF58FC3D4008A06BC22D5856C07ECA217F87F33D40659DE54B965B56C077964F08B6F03D40D95C79AFBD5956C028D816DD8FD83D40734F4534F45A56C0ECA50944FED33D403080566D4C5756C0812AAD64F9CB3D40AAE4C117B75A56C0F4967D8F6EC83D40B43158FEDC5E56C0CD21170BB9D43D400C804A8D976256C0A3C6A70A36C13D4015E0BB38A36956C00BFD509F53C43D4097A824B5F16556C044A2BC2CFBB53D40B1BDEC57286756C01F8111989FB23D4067D5DDACC36056C00ECCB93124AA3D403BAAB208AB5E56C05AD3331ADCA23D40FA4078D7446656C01A3F50C547AA3D40230D661F4F6B56C085E11045F5B33D409DEDF941806C56C0775DAB2DAFB13D4032A41A1EA86856C04DB5076164A03D40C584DCC89C6E56C04CD348CC6BA53D40E4672F2CE86F56C04E63BE352BA33D40EB65BE0A496E56C01D999A9E249B3D40512498D0647156C0142B4E23399C3D401BF75936DB6256C09D2A185EC0783D4073C390755F6256C0FAD400A5C5663D40FA21D1019C5856C0A5C56F4CDF653D406266C25D925556C0E381A2C844573D40BE8B8315F25056C09AAAD417C5593D4032606BB7CD5056C0BFCFB53A3D4C3D40A50A0CAC604C56C07FFF00325B593D40965037E6504856C0CFBD9F97774A3D40431635C6B14756C0E6B9CE0C3E363D40EC2F3AFB204256C058D17DA131393D40AC4870224A4656C02F6C8869D7293D404BAC2038654156C00E77D78CA9253D408F3E753BB24356C0EB4227D4D4153D40E7FE5745194856C085F5C89CA3223D4026974542214756C0404AC89B40153D409405FF86DB4956C0E714E0D0A50E3D409CB2CFC43D4956C0FB931A0945043D405C556E336F4F56C037EE6AF0041F3D40D8AA04D37A5056C090946CFE380F3D40209CD3EA455956C040336D468DF03C40FA0E0CB6D95056C0DDD08D42F1253D40304F9FFA6B5456C03C388AD7202E3D406253C236BE5556C0827DC238C01A3D40B5CCDAD7DF5856C0EDCC0F6CB2193D40D3DD0F1C295956C06D0BEBA471253D40359B5488E45D56C0973FD8D360373D40800A922B625D56C06B57CFED77413D40F74AC38C905F56C00507DDA4283C3D40D150B865A76756C0D0263D3892473D40210D1203166756C095D6CF19EE543D401FD2885FE07256C085831FFE91523D40AC7975BA3C7056C02ACBE45BD15F3D400311E27E977456C085ECC7E8C06B3D40234D0E5D527456C07623DEA6457A3D400AE4090CDF7D56C0890D887101793D407DA5620C347E56C0644A221DE8803D40360E0AB06D8056C0957431A4727E3D40B96A4CB93C8756C0E99D8309C98D3D400185625CC98856C057673CD5A7883D406B0894FCB68956C04C3F2B1566983D4084286243528D56C0E4DE8C72738B3D40B72DC900258B56C04EFFE70AF67E3D40CF49E1324F8256C0DB5D2FE678723D4046F1C2748A8356C06D8661F3A36D3D40B40D2892EA8156C04FFABE18CC5F3D409437EF94948356C05C996E67F7593D4027EB63B21C8256C09EFC7546124F3D40FE2FC71A258756C0449E5A995C523D40BD8515F7FB8456C0A986785BEE363D407C7D3653C28256C0835993DA42393D406C81CFB6FA8456C09B21C24C2B2D3D40D9E2BBA9938E56C0E4DB49B642193D405584E5ACE49056C0EC2E9733452F3D40142FFEE88B8F56C0EF157AB836413D40BA7D1D2DD89156C0DAC9B8CD70463D4069040DAE2E9256C0D304BC5DDB3E3D405CA22ED53F9656C0441EB2981D503D40504DC11B5F9956C093CB8392B8453D409D11457C099A56C084A75A3274533D4044222141D59C56C05AD83DA3395A3D400C4822857E9E56C0BE5A2921CF4D3D4046DBED2E1CA756C0573501D6164E3D40C7D6550D52A556C07199DB33CC423D403DD0CBD0C2A756C0C3BC034714393D4067C9BC709AA956C0308EF65019413D401CE13DF5D6A856C0CDB397499E293D406074AE56C4AB56C02D606D5D922E3D40E45B099950AB56C0B8AA3338E9233D4002883D011BB256C0689E81587F203D40DE115EBE73B156C02FD88DC21E293D406A93A464B8B556C0024A9FDBAD2E3D409B2994297DB856C0F3AC046F2D233D40002CE20DE8BA56C0A19B169F912E3D40D6E35D601DB456C0453690E793383D40476C282063B456C0330296CBBD413D408E97DB2B6EB956C0032B62A985443D40A58F9611F0BB56C0EF1A78BAF0573D40A519684504C556C0782C8A262A5C3D406959E9498AC656C030C323196B503D40C83089D8ADCD56C03A33C29BEA673D408AEA107DD0D056C07844759D557D3D405D5BDBADB6DB56C0E9EB4201768D3D40CD41C83910E356C0E59B9F911C883D40880AB9771AE356C0539B629862A43D40A388FFE02FE956C0921E5CDCDAA43D4084B152BD68E756C0948BB83BE6C43D4084EC2B973FF756C04633BD9ED0B93D40F5A2463865F856C0C88315AE15C43D40E588C3332FF656C099B6DF1BF3CE3D40CF6A2352BBF456C0BE39E7C171C93D4016C934D1F5F456C021168B6ECBD63D401C2C17BFE4FD56C01D4DA0F985D73D408A8D8F004BFE56C078C798C659CE3D4016C81216C70857C05F30ACE111BB3D40F2B4F693530857C04F3B90CC05C63D408C28C0DCC70C57C0B814DDDD5BC33D40816EED0FD30357C042594E53659B3D40C6E1302D081357C00854C26DA48A3D400E5D1E0FE02657C02DA1C939B0963D4067C4CF3DF44E57C0BE8B3179FBC93D408FD3891C356E57C023F5FB4B40C23D40EEFE0408517357C0810BF54CD2B93D40A48BFEFD977957C014EB66F05ACF3D401034F52FA77257C0AB747BAFBBD93D405D7F92DCA97057C04E333AC794013E4017971BF59B6D57C007471D118C0F3E40BEE83A55D36D57C023E44D838B183E4014DA10D4586D57C076070E5B6D1D3E40FDB47C129D6C57C0E99FAD593E1E3E4099FF5632B96C57C042FC841035243E40086F8370E96B57C044C31ED036243E40BFA01C50BB6B57C0EAA9A32C00263E40EFDE65F2C96C57C01649C80CA9263E40E4E6A5B1906C57C08FAC58C2062D3E4008E2DCF2166D57C00074CF805A2E3E40FC0ACFB3C26D57C0059D219173383E40023CB412486D57C0931E4709553D3E4001030000000100000008000000FC2F5A2B0C0157C03A2895CEB2983D40DD0BA95CC3F956C0E8D24968A3A63D403C756A2D45F156C0D802A02420943D4069D49146E7EC56C02C17C2C1C7933D400B67A42CF5F056C0024F68DBC4883D40CC9E06EC84F056C08938526F987E3D403CFCB37857F656C0787C0278B17C3D40FC2F5A2B0C0157C03A2895CEB2983D400103000000010000000F00000090463E2BD8D556C0274EE87887573D40DB6614473BD356C0E33ADB6103513D40F0E83EDB7FCE56C04925E765A3613D409DE4A1171DCC56C013956144304C3D40C6F2C41257CA56C0274E5358DF523D4082872655F5CA56C0C0CFE3089F483D40F5769F9708CC56C018FCCBE8E5483D40FA18F758D4CC56C00DC6E920D84E3D40DA89FBD87BCC56C09E38466E0F463D40A9E6A112C4C956C0C72D118E3B443D4051936C7479CA56C017C82AD8C93E3D401CB30BD09EC856C040651E6F8A423D404869C02D36C856C0C2CAA1A11C3A3D403D2399A5ACD156C014A475F907413D4090463E2BD8D556C0274EE87887573D400103000000010000001200000093B66811D0BB56C0C50687FF53423D402ABB5D5622BE56C0C590B3FCF93D3D4065B1203408BD56C03C7BF412E7453D40EAE632F8CEBE56C0DFF6D7C7BE463D40388AA896BEBE56C072CDBBCA4E383D4076DB14927ABC56C0AC821CD3F4393D40BEDBA5D291BD56C0EF71E08D902F3D4003B3771735C056C00DAFD6602F2F3D40BD37EBF8A6BF56C0B82996A18C393D4092269B3FD8C256C01A207C0B15363D40A066F55F1EC256C01B6923A38F463D40F2A1B10555C456C059CED46DCC403D40437703408EC356C05F1AA7DADF303D40E405F90CD8C756C0DDBFC641223A3D40D757142E29C856C0209FF3C1234B3D40D46EBFBB78C056C0186FA5D92B4C3D40936616DAEEBF56C00BAA2C90E4523D4093B66811D0BB56C0C50687FF53423D40');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('20','ME-EFIS','ME','MAINE','F','938','0106000020E6100000020000000103000000010000008F0000001C0FE6E4BE7151C0C10611B17D09464099A85F11097751C0AF410F0900004640C0221A65A87251C0A0377264C7E04540EF2C3C25257551C0685750A72EDD454055BA9DA6837651C0F905C32346DF4540A599286A277651C0EEF976EDD1EB454070ED812EC17851C042293D2538F045406946FEEACC7951C0F5ADA7B736E54540032C8B0C447E51C027F2E19869E24540CD1A3DCFF77F51C089BFDA74A2E44540FC45C513317F51C0A121DD2A41EC45404C593395B08151C0A113CBA73CEC454042A7AC33068A51C0B2B0978218E545401479DA4F178F51C050605B2DC8D7454021B5E12A398E51C0E3F0BD03E3C945409438B7F2DC9551C06ACE83E377C4454008DC3A536B9751C0C4D1353114B745408A229E1B3F9D51C040E46674BBAC4540AA76CE027EA251C08A1E52D0F8AA4540EE0D3A5F9AAA51C078977D8BA78B4540B20E160F65B451C036999A78998F4540110B79B327B551C07E534AD15F94454021B4F7960BB451C0947617C71B9E45400EB12464ABB951C07B37C476F8A345404AB45BA5F8B951C03EECE434AAA6454091E5F68E0FBE51C01D40EE89E5AE4540C06AC390A9BE51C047539927B6B2454047A7AAEF88BD51C0C986838614B84540B746877121BE51C04A75C3E32FBC4540FF5C3CD164BD51C030F8710019C2454069114392B6BD51C06C09743E18C445402D060791C6BC51C05763B51C44C64540569118B237BD51C08481A1DA35C84540098368F453BE51C08B1C08B931C94540754B6F1B01BF51C02AC2F6D844E5454074686BD88CC051C044600E5F1D24464032FB13A6D6C151C0280E2DA89255464089BE66C099C551C08F56EA8A96A6464043715D8366BD51C0104CFDF35FAB46402934CCA817B851C0DAE6D564DB9C4640C74E4EACF1B551C08D51E8019AA34640FEB180B702B451C09BD2C21666AD4640DAE6DA7F10B551C01510935003B24640589A878101B351C0A146A20A6CB64640A58AE5AFA2A851C0E840AEF92BB246401E2DD80313AE51C0669C217DA8C1464054EFC86458A351C06D86A8A490D44640E4D84A575E9951C0F027C3006CDC4640663EAB3FA39A51C0716368D828E54640D4DCBEF2409051C0E94E589712F346405D062076D68F51C042B3EB4CE9F8464075B4AEE0DB9351C0A9E6970E01FC4640C6BBE1E3EB9151C0161674C0CD064740689B02A8829351C0F81E8A428808474012D36F44AD8E51C01FF94E73971147401DC805CF249251C028ED4B165A184740E0C4584D3A8C51C0A44A6F07DC2A47407295229EFB8251C0A5570BF48A364740F3D64EBFE78051C09D2F4A5D094947400D864DDF097F51C0002595AB7E5847405C45A52BBD4E51C0CA236BDD06BA47405ABE65A9014351C0963CD31905B647408783CF87594251C06E93D939F1A0474045392D95453951C01BFB522E54974740D84B2567F02051C037D041ED02A64740B8B2285A0A1951C0416D41107EA44740AC09AD966D1551C057D3346FBEAD47402764D389C50E51C01609483113AD4740DDD689EB9FF250C037B24CF7CE874740C265BF43F0F150C02755145A39F94640E80F4CFF5BF050C0326A0F8052F546409C9F953FDAF250C0A2CF3CE471F046404CFF967899F050C00D58F54DF5E9464014B3303A65F350C07F534771B2E54640757358716BF350C01A32626DCCD64640455FF56A30F050C00C6A779663D4464019CD6847F4ED50C072D82FD234D7464096918E755EE750C0D0A2842877CD4640F3ACDB801DDC50C0429E8D0DD9CB4640216ECE1FA1DA50C01692887974C046406358974843E050C0723BF1372FBE4640E78B489BC9DA50C0D8FDECED1BB04640DB4EECBB96DE50C0C6E2813AE0A34640B9A266B31FDC50C0E8E19F4944984640B19345671ED650C0C2D521F6A58F46404B01B3C68AD150C09A2E65716597464077FFB9329ECA50C0F14DB87800944640B613036DA4C950C0D94D805D9D8F464077A0EAD52EC450C00CE41833CA7A464030E751A463C950C06A031751C9734640CF25628908BE50C0CE2B085F116A4640DF88C9767EC050C01D403985EB6346403BA513C6D2CC50C09B75561AAF5346409AEA24F1BDD350C0BD5BF593A6534640EB24F55ADDD850C0B9BC6DCD7F5846407B4CC1288BE450C06843E82E964C4640AF40CA0B9BE750C048FA4D9226454640DB44D002EBF350C021ED70CBE9464640EDF7D2A7F2F650C0B31A8A2D9E4446408F23D2489AF950C06844A938E83946408906BD51F9FD50C059264136513C46405D15AAF2A8FD50C087109B91AE404640934B4B3423FF50C0C91CB3540E3E464036E71E950C0151C0C30DE64146314640C087C7A0C20451C01C733FE0D0304640E936AE8FB80851C0B67B1A92D43C464086DFCF24B80F51C07DF7DF8DCD3E4640D19317F0471751C0ABDF12AF37374640FF4016B66D1B51C0EB9418298F3B4640B5C4C804572351C0E997C20B14334640C3CB7BC2EC2151C0E2DF4459192546407E840EA6CD2351C0383A20FC432146400920AB3C612F51C0B18CD88B542C4640892C1BC3053451C04CE3264DE929464026434DC5143451C0BB3F2BA1FD344640517BD241722F51C0DE5E08B6EE404640192AC8A6B22F51C0D7752F71B24646408453C413B53451C0F6E8D9A8F04D4640DC5D9059B93451C0222C72E2005546401B8A5E37143751C08DCA4347344E464091CE2AAEB43351C0459FCA6DEA4846408FFF4787F23351C008D8AFD64E3F464077303932633D51C0B1AE2E1D15374640F0D3D8B10A3F51C0691551D1B322464083E31CF75F4151C0239C30733E1F4640EB0239EDC34451C0A399C027D708464056B6D066064E51C0A52CAB5530F94540CD7E5B2BCB5251C0081316B599F845408EC8654C2C5651C0FFBC794A0B024640912B6C4C3F5951C004D2706537034640798D554AED5E51C0362811768EF14540F6A4A586B76551C00329D37624EC454090394765866A51C0FEFFF1B015ED4540ED5BDB87EF6951C09D243BD478FD45400A7B92483A6751C0FF66E76C4D04464085D6B3E41E6E51C0490787B60FF8454084B992E3E76F51C0070129205AF24540A9B1D403616E51C056DE61BF69E445400B6B9EE3057051C0EA0F25857FE14540BFE7D764C57151C05A8C135C48E545400B0D0D69337351C0D930455E7003464005C37784127151C0331400171C0646401C0FE6E4BE7151C0C10611B17D094640010300000001000000090000007E4B82B2D31851C0078017D449304640438FAC8E6A1651C07D44F5D210334640F7B02DAFBF1651C05D85ABCFE4364640FC741703470F51C0A2793E1302384640E93B7A928B0A51C0221B7DC1D02A4640422BCA49801351C05E5102C01F2546405ACB6A8A861451C065F18167CF1C4640DD4980F4C81951C0D5A0539FA92246407E4B82B2D31851C0078017D449304640');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('21',NULL,'MD','MARYLAND','P','939','0106000020E610000004000000010300000001000000F2000000BBD23C517CED52C0FCF0214028534340E0F066B140ED52C0112D6B275F4743405C53F52DB9EC52C028442192493B43403E0609D163D652C0F2026004483A4340D0E72325EFC552C07AA59B13AC394340F2C89B72E9C952C092AF3DA0532F43405B1E35B5A3C952C0B2931E8A0E2343408CE5D0C8CCD052C095756CDACB194340247C965BE0D752C00309F754D608434059922CBDD5D752C096B5B69C270243409A80CEC211E852C07413D3A98EFF4240D6E47EA576E952C0DFF0E74F31FC42401945787762F752C024AC307269FD424047C263AD3AF152C0836E77A9760C4340D64970D76FF952C0FDB4F54668164340C99873509DF552C02E4E9FE1A81D4340E1EDDEF21FF752C0DA4504C2BD1E4340655A2C0CCEF252C04EB6B7BBC12143403B9AFF5641F952C09A65C8C126214340FC81855AD0F752C0D69E65B0BD2D4340017CE91CBCF852C0FBD56E0E1330434058A427FEC5FC52C0A7C129611E2443404C7C3923ADFF52C071599DC32D24434022E63B484F0153C049D137DF372943402813B3EC2A0453C0DDA637C828214340EDBD25F1CF1253C0E8ABE081F1374340ECEF3271AA1253C0CDAEFCFE4A3D43401E2F46C6470C53C0484AB53190454340576642D00B1053C09EFBEF912F4C43409B8E3DB2050253C02C75839F38494340C1FDBA32C60153C0C81F00B9A14F43409E4D8C34FB0253C0EC1E85DEC54B43407F34F698D70453C0A0E92FFF314E4340A4CE7CC2EA0753C0B227CCD8A25A4340A424BE091E0B53C01A0D297EC75A43401ECA1B54450E53C031534CFCA661434033A00E1B131153C05802327D8F624340BD510F3E961553C033FCBDA8F9564340F24F7DC0691653C0D96359867D594340EBA0D3E2691153C00B81CF4EC46A4340243DF94F780C53C01A4805B9F761434079A53FED970A53C0ADDF06F2F464434050EE766B4C0753C0819F965E5A71434031616784D50453C0367D9A7CE0714340E7E7386A900653C0B7977BFCF57243403E5BF02B170653C009070F1560794340B3ECDF2D440753C0E759A6B9DD7543409EFF8304C20C53C0908309919A7C4340FA4355D6190753C0E4B2BDC0318F43409DF1642D2C0E53C02861A361E88B43405C537EB1440F53C081E3147DC29043400EE2378EF50D53C058C955353C9A43402C00E5BD2B0753C09D8D95DC23A94340B8E2CFB25F0253C037755FABE2AD4340B52E688E5CF652C00EA5E44B8BB043406777332A9FFE52C091902D5884B243403222E488F2FC52C08723636653BC4340FC176B0F5DFE52C053F9E9EA16C34340E0E7E538FD0153C074C7A81AF7C843400D09AFE0000553C0B43130D56FC54340D46BA468DE0953C05BBC1F4076B343406E9AF9537C0E53C0F36E8DF2FFAF4340CDAD4408471753C031814E895AB24340646AF9A6841953C0FA4DACAD999D434029E3CD98FB2153C0E8A2E6A7119F43400AD5CA45A32653C0E262A50336A143403DF04AFE252453C01499E187A39D4340F1ED701FE82453C0E62F858B5F994340CA23E763D92653C0B961400C2E9743403A724EA1112653C0C5F0906F53944340F365551D122453C03F8938CC2299434050B00B891C1B53C076FB47DA298F43407F3D1AA3301E53C0F72CE1DA4474434080CDE59F1F2353C0AC5F15D629614340B78C0478982153C0BC2C4721D95A4340BD9F656E8C2053C0184F2222D84243401D7E32BEAB1853C03705DB8919324340471D7CA1ED1953C086F2856E4E2C434035FB48E4F31A53C013928A310A29434043ADE0AB2E1E53C09BA86AF3FA2A434050F18DB2432153C0E542126F833443406F46FB6C672953C078A8A18EAB394340A2B5ED17FB1553C0E4BF8BB5491B4340360E28131C1553C0049BF7C3DD05434018DDCCC1EC2453C001CF648A831C4340886B61A7A23053C0E05DFC1F011E43404FAE2FB3493753C03E5B2EBC1B3243408A8A5F18213A53C0F150E1B16526434083E0CD1F413E53C095D45049632A434000F8A545224053C0EBDA8B30A7364340F552DEBB1E4E53C0C9EDCE5405324340A4C6D45F5B5053C04AAF6DAFF4344340EE709DE2C15153C0823B6A405D3E4340F52C31DA4C4853C03C294797F9524340249EA9FAFC4753C08C7195EFC5564340E3E24F37F14553C052E796E91F5A43405189FB95384553C097C24407925B43406F8D67F2A24353C0392D9848275B4340007A3F71F44253C05235E9C6045C4340D2190FB2E34253C04A3B7ED9E464434035E31C434C3A53C02563D8CCEE714340D8B7ECEF814053C065C9C2BFBB7B4340455BE992B14253C035F35E5B2C7F43407304173AD44753C02F6F37635177434013630A3CB64953C03DAE667E817B434007B22D63944F53C0A9D1DB3BED7C4340958805455D5053C029851C148B834340B3FC4670C15453C0E263776C0688434000496A93285653C08AA4928AC8884340CFB2751FB25B53C0ECEFE7A78F8843403E8554E2665D53C0630478635C8A4340CD008243A75E53C0E2DDB7FD518D4340348E4006D16053C0E9884FF9F18E4340DB2D04840B6153C0EE75B48F2A944340053F5D3F9D5E53C0CBC9342DA9964340475A139C8C5D53C003A61185FF9B43402FB2C71BBD5D53C0C7156C22559D43400B5F0BFC995F53C0B3171D7B00A043404DC39180AE6253C04ED2A6F86FA243400CBD3223656453C0167A261635A64340D33D3868706753C008C0627460A6434093FEC1AE796B53C07F13FBD0CDA843409FA4DAD38E6E53C0641BF78EADA84340603D1376017053C0F0DB602DD5A9434035E27076467053C0B8713E0C57AB43402D7E9175B56F53C0BFE082AA20AE43403B19A4F6657053C055A88EE871B0434061E1BFD42E6F53C0AD5E0E88B6B2434067A019D5696F53C06F02D9E6A3B343406DC8C476727053C04D2BA5C46BB64340E11C127B587353C0E8C3202356B74340A5724F1B807353C039E0288252B84340ACEB935AEE7253C0EDC840A1B7B943406D9354DB777353C049B6E21F48BB4340D47580393F7253C0CB80C2E0C3BA4340B8F005FB2A7353C01C6A1FBE8BBD43400DEE7018617153C0678B2E3DC2BF434043C7A2DDCF7453C0F222BD5B38BF43403104F99F437653C0EDB039BA41C04340BFCBE81DD17453C06F8E26798AC14340210EA71E0D7553C06B488496BEC343402E831A3F787553C06524B03647C34340350A22A0017653C088958D5516C4434052F1EE21567753C003B4AD17E0C14340EC6100E3A67753C0967E9572E0C543400C0E5065F47853C00D88EA8F6FC7434010E8FCA4A67853C0ACFD0DEF3FC843407B1DCEE1967653C08399AFCF60C84340C4729660C07553C002A2E88E4FC943408A2F6501EA7553C01757AAE97CCD43406D5BDEE2C07653C0E0E8FFC913CD43402B317026DC7853C0C266B8C6EBCE4340358044E6017953C01E74F8C8E3CC43400DE772E7CE7953C0B47B9CC94DCC43407A33BB2B127C53C0873453C521CF4340E51C628CA47C53C004E761C5B8CE434019F1B08ADE7B53C027551DA9C4CB4340C77E898B7A7C53C0FA34FB6902CB43406F262B0EB67D53C0FF7CD5E53FCE43405E04D970B17F53C0CE1F7606ABCC43400B6FF7D5B08153C0D259BA20BACF43403E5714A2098653C0C1F5A0117AD643408901BFD0B58B53C0BCBC7F04EAD8434040CA0953138D53C04DCB062685D643409CAB51F6908E53C0637B164445D64340A0F185B5AB8E53C0965FF9E64BD443404A9629987E9053C05D101FC811D24340CFCADE17799153C0B545E80B28CF43408168D55F449653C014B0D1E0FED14340B0ADFE7FD59653C031D31082F1D043406A9BD4C12B9853C057D24000CFD04340E80B56E19D9853C087E87CC3A7CE4340285AEA25A49B53C0FB2E095E7BCF434029FDF520DB9953C0A63DFFE736CB4340BD446D25D79C53C0445A02C3DDCB43402B5AAC658E9D53C03CD88BC458CA4340A531C7BFEE9A53C0FED3060F53C64340E540F621899C53C0520E604D2FC64340B569B4012C9D53C00E9BC26F51C44340D7B30043CD9E53C0AC4ABD508DC243409F5AFFE58FA053C0EAF5336D38C34340C70110AB1BA453C04C1FFC88B2C24340DFD8B9EFADA653C057FA0D4291C44340E6E2ABF2C5A853C00ED51960D5C34340928D1B948BA953C022FE671DDDC443408C9BDEB5A6AA53C026FBD41BBAC443408AECF91AD8AD53C0BF3CE112A0C743403A84A2DCE4AE53C0C4E6296ECFC943400457D19FBBB053C0B7E7F92B78CA43407ACFA30185B153C085A625C801CD4340A0DE4DBD1EAF53C0B1C002E8ECCD434025FA047DC0AE53C00C5067C68ECF4340F42E155DDFAE53C05D516B6540D043405A14CCA020B153C0BAE782E334D04340136FB30174B153C09D15188076D24340B11522E514B353C024B46222BFD043407A293D251AB353C068192705C6CE4340B092E368A2B453C03B4DF42AF8CA4340555D7A869EB353C01BE4F1AE8DC84340E6DD76ABA3B553C09E5094CF1AC843408644EB70BBB753C0535904184DC3434026B38C1F25BD53C0E3B9E64FF0BA4340C75508A21BBE53C09290A39821B843406A48C16E20C353C0D3B110A9EDBD4340A02A60511FC453C0814BBF882FBE43400C0B973285C453C0CA83E0CE44BC4340E49F5EB8B1C653C0B1C5D28F45BC43405D581A9730C653C0049DF0F178BB43405ADFB938A9C653C0BDD0B75941B9434055983CDE68C853C0CCB7584761B54340320DF6C21ECA53C0D29872A9FCB44340F05A8BE46ECA53C05CC580125EB24340C870CA97A6D053C042D20F4AA0AC43408A6EF99CE8D153C041F1CF94A1A943400788BBC1E5D253C0A4AD602078A6434079325B0D28D653C0CBB0324563A54340F5C41058A1D853C075398F7178A243408D709508C1DC53C0FA5136E1259B434066B06D2B84DD53C01F4365414C9B4340239CE9F159DF53C07A50A54344994340892BF53AC8DE53C0B13BEBF031DC43404CE7380F62D953C0C6FDAB7712DC43403AC276F487BB53C03FA33F8975DC4340B793322756B453C0323EEA0E8FDC4340714DE548A09853C070901CCBA3DC43403926BB44699553C03C17782FAFDC4340AD188104248653C07D877CE8DBDC4340EC391066735E53C0CB3E0F9D1CDC4340353A3B45B95D53C070B5495E2BDC43408196AAB2254E53C05FE682383FDC43409CF094C5CB3F53C0DC8B5A2D46DC434046B02C6A973253C073C7F11E52DC4340B79ADF2A782453C09483E9A731DC43402EBBF377EB0E53C0BCBDC4B265DC4340670B3B08E90853C0E39C390272DC434006D21D4BA1F252C0DA8544A4A7DC434088D4593E6EF152C094091F070AB1434056C53B9BEAF052C0BA920803E2A543403C4CEE59B9F052C0C3465401BA9F43401B9235362AF052C00726D2EC219243405D4F51B15FEE52C01FFB58B9466A4340BBD23C517CED52C0FCF02140285343400103000000010000000E000000E11AA34DBD1253C09B895BFE33744340D3C974F4D31253C0959538F1DC7B434005119CF8AD1553C0F7AA1D93777A43403B5FE6B31A1453C0B06394B694784340CC3C8AB1A01453C0202824FDC2744340FEAB59F5E61553C0F3370E3A4B7643402A5732AE141553C0F27690E420704340011022F1031853C0B6C49608576D4340505AFC7AD01653C0FBA85292A97A434016CE1FD92A1353C0604386E535854340EC72DC4FDC0F53C0A254732F507D4340A6617F29C50F53C0455BA29B3B7643404CB8C2EF7B1153C09FCEB81584794340E11AA34DBD1253C09B895BFE3374434001030000000100000004000000570AC6E058C452C0CDEAAB119C39434048E7B37CEBC252C069B15D908C39434097B56AA896C552C0DD6FDC015A294340570AC6E058C452C0CDEAAB119C3943400103000000010000000800000079EB428A4DD152C0BD9D8EF98B0343406CF398459FCF52C093DF1DF7DD044340C990BA9F66CD52C0C82ED8EB110C43408630321885CA52C08B03C4353C1A434031F4BA8904C652C036FB502200294340A1DA75590FCB52C0F31FFE44E90F43405EDF418580CF52C0D592CFB8AA03434079EB428A4DD152C0BD9D8EF98B034340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('22','MA-EPICS','MA','MASSACHUSETTS','F','940','0106000020E610000003000000010300000001000000590000004ACABCDD6FD451C02B4F7850D7E24440F8BAA142BFD551C00A7E8C0E68E44440B77868651CD651C0ED4CF2AB15E84440C5F1DC2569D551C0C05DDCC8CFED44405FFC5468EBD551C01E6929A719F044409ED5AD4751D551C0C4791026B1F24440C43F3EB092D851C0934DA764B8F14440ECDB135479D851C080B5377E58FD4440C451FAB43BD851C051097A5BC101454086A72DE6D5DF51C0C883E1372F014540D3A766AC0FF351C069BEB1138C004540037FD58C59F351C04A2461114D024540F1EB8204140652C0275AD0654D034540D24EA5E7B90852C00CE6A8246103454003975E0E7C2052C01EC4E023F0034540079A0EF78E2452C0E1F59522DB0345402BEF68F83D2552C039B4B203C4024540E1720F9CE62652C0E6E81623EB02454039DC3F7C022752C0C869CDA1E80345407F3D8090603052C0BF48781D5504454073AFF5F21F3152C033897703470045402329B3DC543452C0236099C2A3FF4440017EA4BB403452C0EE802AFB49044540AA0C7DDE634052C0647FF2F29B044540B91A76A4EB4252C0284680D1A50445406FBF04A1FD5E52C070DB3B1F12064540E3CBA3FEEC5F52C05F4C803BEA094540636764E7735652C03FBA2FD69B4045405E68460D845052C05F21AAD97E5F454008278CAF424152C029EB9451C55E4540A445DE63123B52C0ECCEB1F5615E4540A3420A562B1D52C037347FBCE85C4540DE75A128EA1152C00E51AE43385C45405B1B2FAB88FB51C0B9918DD6855A4540A8A65108A9F951C0866CA2D8495A454057BAD26461D251C02E26A5D66B594540242FCF8227D051C0E077ABD3EF5C4540F6CAF70264CF51C02EB35ED12C5F4540CF72F31DEDCB51C0A03C30B58F5E4540C6E81D8096CB51C0477E122B56674540DFA796FBB7C751C0FC0B486DBD68454080377D3632C451C0C802C7F2F36645409C1F0195A0C151C0C9F9202FF36C45403FF1D92BF7BA51C0660D09924C7145406A9356A97AB951C04D82843385714540BE81062362B651C0537F0BDA846E4540AB95329F16B451C025602AFCFB6E454078F07D2B57AF51C0BC26D456EE5445407BC4FDF9F6A551C0A1054220BA52454088845D7A8AA851C0B9889204944A454098DA9C4B0AB451C01D2140A1F1454540A0F68DCE30B951C05F0DA54B5A394540E9ACA8D47ABD51C0E294F1AB58374540B81CAFB52FC251C055E8297C8F2445401DAAD1C615BB51C04FB975A7041E45409705BE8521B951C0AFDE3CA604224540F2F2783EC7B451C00FAE5E4A582145407257FFF892B151C069491B6FD31F45404CB3DD08E8AB51C092BFA9F69A134540B91779D498A751C04EF1E7A4EDFB44402348FCE794A251C0DB9F6C6B29F7444065CB5FC169A251C0A4AD763523E74440D711D2D01A9B51C0E6828F042FDF444045C09A7F869151C0A92F04745FDC44400B264207D59551C0F6ACEDB01CDB4440B20944F9228D51C009E2269A35DB4440738040D03A8151C0925085D308E44440F96DD856078051C02502C5E39CED4440BDD5028C6E8651C041ACB3E34700454010C0F058549051C00564D7FCB10745409C508E52A58851C04E63917C47094540927895EA3A8351C02B7CB4C15D0345400AA2E6F8B47D51C02F6CBE5BB9F34440609672E7BC7A51C07971C97A42E2444010995B45157D51C076C77F8DF3D54440B4CFFD8C729951C08509C0BE68CE4440A03879F1B49B51C0A806D4C2EDC844409B20F8E2C6A851C0B2F4B15118C54440EB3694858DAA51C083427C2C2FC7444039249629AAA751C00F15C65329DE4440F1A97E3BB9B551C09E6E1A7137D04440C387EEA118B951C0F452570C24D14440FA6B3F6913C051C028502D6D93C24440E7B1391A7FC751C0E878AAA71CBF4440D2E0B6A009C951C0F4BBE4FCDFD3444090ED0548B9CC51C07BE06219D9D644400539868BA7CE51C0876775B795DA44403D126F7110D151C0E5A9B494F7DF44404ACABCDD6FD451C02B4F7850D7E244400103000000010000000F00000089754E5BADA651C0C8B5F332FFB64440AC74081C55A451C02DA6F2EB76BB44409B7E569861A351C090B7B6FE6CB544400552ECD8DAA451C04A87EF3D84B44440C620A655F8A051C0EE174E4B07B34440FABEE3EF1C9F51C052337545B8AB4440CEE2FD7946AF51C09189A798C5AA444007279DFA42B151C0F0F5FD3B2AA644408A3346C802B651C032FE8DE39EAC4440F23B35E014B251C03CFB904C1FAD444040D0A8DC56B151C0EA7A3CF598A94440C3AA08FE1CB051C0AE7B02EAEAB044405E3E641FB8AA51C0E944CC623BBA44404CD0491EC6A651C07C72FEC3C1BC444089754E5BADA651C0C8B5F332FFB644400103000000010000000D000000D2133DA4078251C046C15B5CEDA7444040BA6FA26A8051C0A79E043892A94440EBD70B24B48151C04127ECB529AB444092DB5AC89B8551C07D6B4923FFA54440391F9004358251C04DD95893C3AC44407812DF25278351C0E49A6DC92BB244400B6D1F9ED27D51C099DD6CFEBEA54440FB4501FEFA7D51C0E0B44A883BA04440F0BA9648998651C0603BB1F27F9E4440FDA1B231A68D51C0A912501396A2444078036E11418D51C023CD35ABA4A54440E5B50889438651C0E855296989A34440D2133DA4078251C046C15B5CEDA74440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('23',NULL,'MI','MICHIGAN','P','941','0106000020E61000000500000001030000000100000009000000EAA39D7DD71F56C0B56897EC3E1648409BDBE85B052856C07D9BB6D63E044840860DD0F4B23956C012B1796CE9FA47402AB733F4D44156C0B3BE2745E2EC4740182099DFF34856C065D0A5527BE94740203B8CBD584C56C0038C6A4A1CEC47407B495515EA4C56C0AF606D3922F14740A326A886FD4956C0CD4D66A038F84740EAA39D7DD71F56C0B56897EC3E1648400103000000010000000D0000003F3CDE280B2056C0E69316A024A5474039BD6092061C56C0B44989018EAD47405EBE6471870D56C0F5AE20A852B9474080748D9070F255C08B4431F242BC4740281DA19E14ED55C0D90856DB3DB547400D433A5F33EF55C01E257BA34EB24740FE4E9BD1B0FA55C058E4B42CD3AD47406E5E9DD4390E56C0325F5E40B2994740D676B1066C1A56C05134CDE1797E4740B5C2C95C1F1E56C0A2A1EFBB448E474051AD9063082656C08F2B1CFB3F914740026FE3D61E2656C0B113C00D2E9F47403F3CDE280B2056C0E69316A024A54740010300000001000000AC0000000BEED7B1077755C069F7149317FC4640F618D6A08E7A55C0DC7146079FFA46401328FED6B17A55C0179E1E5487F5464063F14C55588455C0213F093F6BFB4640EFB6DBAF989055C00B61AFFD34F94640663F416C339455C0917AEB67EDF34640A25E43BF009655C00B5A437ECDEA464085374162549D55C0F96B44B5A1E146404DAEEC85E1A155C05BBDD9F5DDDF46405FAB349F68A155C0B1481C1EAFDC46404FCC583ADFA455C062ECC7FBE6DA46404B2346634EA855C05D3BDF9484CF4640362010EAD7AB55C0E83F5FC634D346406496C8539AAC55C011E53734A4D8464089ED284F6CA555C0E4B19F352DE84640346446E9BBB055C08A78BF96BCE94640F4EBBB35B4B955C09809A3D97DDB4640B5A585ACEBC755C0930B0C9D1ED94640F1F29F6CAFD055C0005C45C403C74640CFDE4E3443D555C0A1B721C143B646408621D4075EE555C0E9372271D4944640A8C01FC1EBE555C045BFFF62E38D4640DBB20B630FEB55C03AA9738F019246402057D5E4B2EE55C0E824B6FC9A964640922A6EE61DEF55C08850E4337B9946403BA113282FEE55C0778EC110189B46402785900A0FEE55C06A401F884E9E4640C91E120C21ED55C0DBC11D86A09F4640E7515B0F16ED55C0E694B49ED7A24640C292979C4DE955C03033DDCE90AC4640AC489D1E32E955C0A0980C4B51AE46400A47C55F22EC55C0AD06691D15B24640C8C0A576A4F055C000CC8AC02BAD46402A9AA714FEF455C018743279DDAD46406153B492D7F555C0B2EBBE9B4EAC4640FB1BEB942CF755C0BE17A59261AF46403AAB0E1596F755C0CC451C11A0AF46402D3E7033EFF755C08BACA4D358AE46409EB39B138DF855C0EC41B951D4AE464078EB3CBA5EF655C0DA2CF3A8FBB3464067C0159F0EF755C0FE7CDAFBF8B84640E58E454312F455C0B598E0F9B4BB46404DAB2F4885F255C06D2CA972E1BF4640CF36D26D87F355C0E25FAE05B3C54640FD22A9D007F555C057B1539DC7C8464046C3A1F152F255C002C4B741C5C84640DDE525D69AF155C0B1FBC17AD9CC46406EA0B5B7AAF155C00554C3577DCE4640D65D7BDC79F455C06CDFE708C5D346409289EB9D4AF455C01DEF41862BD546400908F8FFFAF155C01A27B66784D64640888F3621C2F155C05120EAA590D746404ACA312346F355C0321F40FFC4D94640AF6171A44CF355C091A28DDC0EDB46409E637745E9F555C0AAA1463578DC46404A53DD88E9F755C004E0C4EA16E046403038EC0907FE55C0992FADFC1AE24640F9C3B64D5DFF55C08633F613C4E54640F10C320F4E0356C0B260A8529FE44640DF26D9D1AD0556C0C163EFEF50E546401A1DC117510856C0D22AB029E2E8464038E15759CB0756C0D78C4547DDEA46401577C8DB2F0456C0119B4381D3EF4640D2ACDEFF200656C0D10A339E26F246404012BDA3010656C0A7251AB9D6F546409EB03605210756C03E06199890F646400EE37AC8A00956C031003977D8F74640C9D4274C880B56C066BA56D50CFA464018C2F66CC20D56C0D4BF67D754F94640BCB50371751056C0E8271B77C8FB4640D363BB4E251356C0E8A82CFC20FB4640FAC2998E901456C0EFB5A33EBDFB46405BE74411AD1756C0C1D43DA14EFF4640EFCC824ED31956C0D04651C6E0FD464000FAC98F131D56C0AEC908EA180047405100C1CEF61E56C0333EE02DE4FF4640857C690F9F1F56C0DBF010ACA8014740C6D46ACEFF2056C068CD49CC610247400EE6E84B182356C07381E46D780247406AD30EA9D22456C06B5A4592250147402AD4C7073E2656C040E8C971FC0147403AF2F663642756C00A2520573FFF464080678FE1312956C04548005927FF464014F2EA415A2B56C0A3025F1594024740888EB5DF072D56C09C690C176C024740C335C37E7D2E56C0EB14C455C90347402882E31C793156C057DC2CF8B4024740C1151D3EC23156C0AB2D21B52C044740F12901DFCD3256C0D93F9173A7044740E49A4E3E7B3356C08BBCAB556E034740FF15F466363B56C079F840C66B0947405D20442C0F3F56C0D91AD49ED90C4740CC904A39634656C035BA5F6CA4124740FF4DF36D357B56C0C2133550EA264740925E586D258756C0F0D9632D932B47401B36DF0F5F8756C00DD6546CBD2E47404FC3A535138956C0C3E4E94A6B324740DCBC4E3B548A56C01D04FEE89F384740EC7981A3898D56C08E5E6546CE40474032915EA7899056C03C541E06204147405E723D28449156C0591833A4E04247401A2D9B2A369356C064D708E43443474066967F6A5A9356C07E8D0081AB4547401D7378CB139456C000F4DE9F994647404FF34371AC9856C0D9CD4A8113454740E25033F21F9A56C06D5AF23BC8484740159DE613358156C07DACD778DD56474047F6295AB87856C0F52D2D786C624740A60C86BFA37256C00FFB9A3190694740B6EE43FDBF5856C0FEE509A1D36C4740C69833E0BB4D56C00177DE4331764740027D3413034856C09FA747CE907F474043932C0BAC3F56C0A39EE014A17F474001309803803B56C03CB39163F5834740341F7716A13856C0E0B5970D628D4740AF1F9EBA492856C03915C56EE79C4740FE7199058F2756C08686665BC890474050F123C1B72056C0D2B6BDFEA18D4740D397FDE8D42056C04EBFD8E52B844740A4F14F083C1C56C010B97964D07E4740DE33D3AF8A1C56C0BEAF1AAED27647400951D9597F1E56C033D0FB9B756D47402B2DF85E951C56C04B8632A2526647406F4AAD83610B56C090F499EE1279474040A581A91B0C56C0E2C4029952734740EED0C70B590256C0DBE4FA01B87447401AF72151A4F955C0360EA61373744740821F3E257BEA55C09D9AB8F31D6B4740236E0F4BC7D755C06C1CE2DA054147401769EE5D15C755C07B475F47304047402820BDE368C055C0ABA82745A54447403752F4BBC4B755C0389B69C7E03847402EDFEB939BB055C0106DD9F0493E4740A5D71B9AD8A855C0FA70ECBC0C3647405704C7D4979D55C03C0AC7A6D147474015F79C9E7A8955C09916979A26564740AC6A1CF9308655C0273C1BD7DF53474024B0A1E0E17655C09E88E1B3EF584740064B9A163F6055C0D421765A4B56474052F051DFB94E55C0CB6B5357DE6047405F7454C71A3D55C020581888AE6247406CB3C4E6B94155C02FE15220E058474066C5DFE4364155C0C76C296C464647408FE375514E4355C0D2CD09BEB6404740607911A0104155C074CEE11FFC3C474021ECEBC19A3B55C0574CE7A7713E474039730B0D6F3355C0FA37CAC4D63847403D80D0E24E2855C0E7407913D13D4740D377FE92A62455C066CD2EEE363447405DA021349F1A55C087C08338863D47409B300E7CF11355C0AC24FBB58C3E47408457BB18A00B55C02F42E915D61F474041D2EF077B1155C03FAD3B1A891A474017EA3D5DCF0F55C00BAA48FDF11547402B3368BDA90755C06A6F07BA8A16474022FC0A9DE40155C08D54BD3A811047408ED32B7FF70355C07B7DD69D170C474073C435FF53FF54C08A2C168053034740F5D7FD95B9F954C069CA1867C1004740C331D17303FA54C0E2EFB821E9FA464044C47DDB3F0755C0152E4BC140FD4640286D4AE2AF1655C06C7B8975E5FF464040AC3CC91A2055C09E4278543AFD4640C93AE7637A2755C037A225B9E40447409E286AF2182C55C026456FF79804474074E061B3D42E55C0CEFE7CE986ED464085D35A6B783655C036B6156200F24640DDE1C8BDF14355C0A583E80F2B03474015728121355855C00534105BCE0C4740C03A18689C6055C022471A6F0B0D4740219335C4F16955C09329CD0687FC46400BEED7B1077755C069F7149317FC464001030000000100000011000000DB255B14B3F654C0FA17E3C9CB01474074901E4F45F354C06B2BB74C84FE4640CC7C742F69F054C06D84F0CF7F03474032592D221CEB54C0BEACD7F1A1044740C1568B458AEB54C06B0E3C9030094740D3ADBC6FE0EE54C0A9874E0EC40A47405A3BE5C197E954C0C545F7EF4E0D4740DC651856BAE554C08DA67592540B4740D0C0ADE82CE254C086F54F568201474077122FBC48DE54C0795569F767FE464063D635C108E154C006C541D27DF646405DF8FBAA1BE554C07BED09AF70F5464002E485154DE854C03EE964700FFA4640D15DED2B83F354C098CB46E6E7F74640D4736F7294F654C09AAE746AACFF4640F3D6F472B2F854C06B91A1E444FC4640DB255B14B3F654C0FA17E3C9CB01474001030000000100000076000000007A33D96DB555C04CD2570FFCE14440DBF08BA186A755C0B0A5454227F44440112A12E3EC9F55C0A49B50682F1045406815F82AF49755C0F74E800AED1F4540509EF61F3D9255C013E3D2BC0E3645402D260B55F18D55C0EE7131792D6345403B60EF8A869155C0DD037C677E8F45402F951116A59D55C097BC1743D2BC4540F2E8FBADA4A255C0EA485750E3D44540A2A02EF0A89C55C01DB27EB2E6E245406A7EAECAE09955C0C362CE5621E24540864F024FC89B55C01A942DD306E44540AF25F5B0719B55C0F29153D1F9E84540DFEBDE3C699D55C0CC3FEDA79FF945403CDF3E9A0A9C55C05AC4AC2909F9454065AFCBC730A155C0A106D4FEDC0646401FA97D28BB9855C00493C93B73174640108358B3679155C0162A060EF52C4640E3191C053C8F55C0843B8BDCD9424640C1631A588D9055C02C82518DB159464002733769F18655C0B1B23832025E4640F461B1884E8555C0174AC92C93634640FE81C80D458655C00E1153DDE06C46407DDF172C518455C0FDEE1B15FA724640444CFCACED7255C0A557BF6C347E4640B26284C30D6755C0AF761ED227994640860D6864316455C0DEF264991C9746405729B4DACA6955C04186209DAB7A46400C00CBA3D56855C09FAD1FC8A3634640A194B14FAB6155C09741AF4DAF614640F519B4EFE25C55C0160EBC2F266E4640C83AC5B3A15855C0C8C073725B814640C71628C5F95855C01A9A597B159B4640833E9C5FE35755C0DB757F6303A34640C08BD9E68C5355C0A535F95502A94640209A8E76F14555C038E9908863AF4640B665E0E0183F55C02DD3DF4CC4AF4640C3E2FDB4FC3A55C075185E9277B44640B98BD8773C4555C06C47A7AA79BB464055581467B54755C0429AB387EEC84640D8514C46FE4455C05E7E30E8A9D04640B591073BF03E55C080E798EE83D74640124D3ADE353E55C0B4D4506F6EDE464050B07E0F592E55C0F41D0405E1E346408FF5F110C71D55C01E5F6D64AAD34640100922C6921455C0562FE8A032D54640F8D465E6270D55C07B3D5D82C1D04640BFFAB996A70855C0345DBFC621C946404206BE30C70655C09A310106D7BF464040965FAA10FB54C0B166A56FF2BE4640E0C3058D19F254C0856071D268B4464028FCFDA096ED54C005094E57C9B44640CBC6DE46E9E554C0DCAC737ABCAC46404E149FB6BBDF54C0255FD9C12EAE46406135EB9255DF54C02C11689F1AAA46405C42449E37D954C05E2A59A0EEA24640CED959C1EDDA54C067CFDB5CEBA04640A2C7FF3A84D954C01BB96F9A589B464090E7386603D454C09D42F5959F8C4640097FAFB871DC54C0ED580349C18646401A7A5C34C6DB54C0770EE3A56C8146401B54A4F8C0DD54C0A8E6CAA2BA7F4640BC9F6A907ADB54C0AC3472E590764640B183455D76D454C0FC5F06AB296E4640F7DFB7D3F8D154C047927AED015A4640395B17797BD454C096716999FA414640594B197BD8D654C0984224A9E52A46403683139ADDE154C02474446E71214640CBD690FE5DE454C0240A806DC61546400DC248424CE654C021C549ED050946405B719B791BED54C0D34E2B1CA3FF454056C2304EE9F754C0EC9FC3693EFB454085BB0AADC6FA54C07665C42D60F5454063C1C52F0AFC54C0FF7D855C61D945402390351DBFEC54C0653BE513C1CC4540E80C8535E5E954C0812490EFBFCD4540A77DC06CFAE154C0158B4AB6EBDC454050C65BC2A1DF54C08BD94FB6F6D94540AB476BA2D9DD54C0362AC06E74DF4540ECC41E9A7FD754C0DCAA090217EC45404ECC709BDDD454C0DBB787F960F845408ED0F47B2BBC54C022C11B6FF4084640D7A6372495B354C0FEF5E3D74B044640D68D13F395AE54C0536212167BFC45407BD1B04D95A754C072F6ACCBD8E44540E25E9369C4A654C0AFAF0A9EE7D84540E45ECA983EA054C00B9415670C964540DE672C97DE9A54C0C3B127BC797C454009863A79349E54C0DEAA210308734540EC251489499E54C00E0F7494A6614540A7D78CDA29A154C0D7D7309E28514540F593E20D56A954C0179BB37ADC5045406CEFB8B293A854C0C57D9956AE55454072B38823B5AE54C0F8607B7032574540675E868B81B454C0FB962DB761514540950634E459B354C0D85EBC5A744E45402D316241D7B854C06685B9EE743F4540A803497AFEB754C0717FD7F1A13A45408354581C7BBB54C0400A351C782E4540ADC1E2BAE2C654C06EF0EB61772545401579BB6A68CC54C076F4A1E0D00E4540272C8E0B2ACC54C091C40A72590445403373B968E4DE54C0F242C30ED1DC4440A8BFD89FE4F054C04E1C3B0AC8DB44401951DFCA97F754C054780DACA5DB4440C86E9E45FD1655C0DF02F506A1DA44403E2814E6991855C06C7425E783DA4440A31D4D8B953255C0D36B1B8247D944409007936B763255C02B8FB71E67E14440C879EA50DD3455C0D4BFA11F85E1444066D15E6A5C4C55C0913501A5A5E144407B36867B055355C0412DD105BDE1444056C1E692346A55C086753CC79DE144408EA7EA88267355C0D9697D83BBE1444003F020105F8455C0B81C4358DFE144407EE9181E038F55C0D57F6512E7E144408DDEA3909CA155C0396CE339FDE14440007A33D96DB555C04CD2570FFCE14440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('24','MN-DELTA','MN','MINNESOTA','F','942','0106000020E610000001000000010300000001000000320100004540AC51BEEE56C0FBDAD3F7F1BF4540E441FE4AF60457C0C4DB2843E4BF4540591402B9001D57C016271E5EEEBF4540482AED68B62357C07467A98008C0454026CC68D2BD4157C08FFE01E829C045400D1C97F77A4357C0C0FAF2C12FC045408B21379A0D6057C0B042DE0110C0454031CE6236D66957C08AA803FE18C04540A0E87731557E57C01622EECA09C04540A4F56D5DCB8F57C061FA278BDDBF45403273AF9F229D57C04ACD40CFC1BF4540A69C439B07B757C0B94C05FF00C045400C83C8E4E8BA57C05594A165EBBF454022A7463761D957C064BFFFF10AC045401BE410E1BEDD57C04F59B2F5F0BF45407D948B7C7BF757C0975F5965DDBF454046665012E80358C0749E9AF3CFBF4540AF441B17781D58C0821E83C6F6BF45401A54F0F8381D58C075AE8692A3EC45401C3E3700461D58C078E531D87A194640A9DA9E75201D58C08333CB6DE8444640E39642DD3A1D58C0132964CD7C5046404BAFB047221D58C025C18E8E9266464013036F69301D58C0B5AAA0536A7C46408251DD78161D58C0F38B989A39A3464019F0E95A491D58C015238BB940A64640428458DE901E58C04CE32B980CAA4640F8EA0248152258C0C6BD9E5404B04640461160B4B92658C056608F4FC1B246402A3A55E25C2C58C035FC49CA8FB44640030FEDEB3B2F58C0DFAC8724A6BA46403A7685543B3158C0374B7FBF3CC24640594AF423F53558C0A4586178C3CA464045094B27B83658C07CBB77B6F7CD46402489F3864C3558C029A069B549D34640D1FCF0B4122A58C089C57C9696DE46402B771DF1B12658C0437BC73375E7464018D03F0FA12558C08CE0F673AFE84640A1152771482458C05C3A45EE90F7464036982391F42358C02F0EFBAD4DF946404551F5B5E02458C04D1A934AB9024740CBCE4AD6522358C0E413AC4A3A0C4740E5F124FC8D2458C0C0C4EAA8AD164740C67C8FFE9F2558C0810AF1C790184740C8C28B7F882558C0100DA7A7921B47400BB8A5A1482658C03ED4BF268D1E474095885762882658C0591EDCAB0C2B47401880FCE3592758C0C6227C6CE72C474047015508BC2958C00ED096EC012E4740AC3C8DED0B2C58C0897E5B91C33447402A0CA1706B2D58C0FADA3F73AD364740BACD19D2C02D58C066B8A5F7FE3B47401A125D56612F58C0C9FE94BAA53E4740B150AA1C143058C0CF266DE1574B47408AFA82BF583158C0B4051E44CC4C4740236F5742323258C03E9369E7E24F4740D23D3663933258C0DE0FFA689C504740BA5046E6CB3258C0B1ADD10CE3564740FD9F4D06053258C02AFC2D6D805A4740D455A7C7F13158C0B2C0E46F93614740C0C98746053358C040149AB3F06747408B4B52012B3158C02302B66D246C47405E8CFDC0CB3158C00E051C50056F47408B32503B713058C073C543AB1D7647406410441BD63058C07C8C676CD7774740EB72495E6D3258C03D6CEED2517747409AE2629D8A3258C0A60E5BB35E794740CA145D1E523358C066DF6116597A4740B449A07CC73258C0A1B088341D7C4740292F0EFF453458C0A57BA5BA217C47406C11041EC53458C0E6E6359E70804740DDEB257F753558C0260DBA424F814740F7FA299DA53458C0CAE6DEE4578447408D29D5FCEC3458C00F5CF130178A474043E676FB6C3458C0CD065672DA8B47406F7E8BDCB43558C01FAC59067193474067AEA83AE53458C01E5AF5A6C4954740499E747A923558C0A481135BC79E4740B367EE3B603658C0EFCB1441E0A047401B26D31A9D3558C080C0F6FE9DA547405195011C313658C031670EE244A8474018F4495BA93558C01DCDAFA0CEAB4740E0E431BD703658C06F3A41C433AE47402B08EDBBBF3558C0577569C22AB14740DC1D847D663658C09CB8920558B447409DA80200813758C02977DD09E0B447409E25C9DEC53658C0F5308C87E7B747404BC581C0773758C02AD097AA13BB47403AC0DADE803658C02AA21D4814C047400073DE7E153758C0322C42CABBC2474022EDA11B593658C0C0CDDB67B4C547408378F75BF43658C04AB7D4A90FC84740D5CBA0B88A3658C02957ED88F2CC47408BE7A1BAE43758C0A748BEACC0CE4740E80E4D59EC3858C042B4792E43D64740AA97793B1D3B58C0F4A6457267DB4740F2A06518A63B58C0E6363393BAE147408BA20A184D3D58C0418EE038B0E547402AF1B019F83E58C0D2A946FDA2E747407A3748F68A3E58C078AFF2DDFCE94740C0120A94054058C0FB56DDA462EF474027B830F5504158C05F6DC8A812F047402A99552FFB4058C07D6B036C7DF547405048A84D134358C06493BFF53AFA4740086C88E54A4458C0EC7473412A0648404F02D625EF4558C07AAD05080109484012CC8283564658C07AA113ABEC0C48406B94C9C3CC4758C01E523630E50E4840E6DB3C21BD4758C0FB9BA071461248406282D2A1BC4858C07012A8B4FE124840EFB0239F6D4758C049549F7161144840FA3DC5DFCB4858C052748675791548406197FCFEB84858C0AE3032D66D16484095D6F31CC94858C02F8C2FD7F7184840C367C97B5F4858C02C219D36141A484096150DFA184758C04063DBD3921A4840C85253BAF14858C0FE982179621C48407A100BB8FD4658C09C6927B5301D48400AC070D8294858C0B5AD1D18E41D484056B85B16EC4758C0189B49982C214840CB5521F7BE4858C0F2EB1D9ADA214840E0EC3255264758C0FA4C5376912348404CA90535364758C06DCEB176A024484015DAF8555A4858C0EB423A5982254840BA09F634474758C0F109C0B6BE254840D209BE14584758C06745CEF6DC264840C65DED157D4858C0E7F224D9CD274840494437B4344758C0D00C2E56F32848402195C4D5C64858C0B1F9AF19BA2948405901AF54644858C00EEE9958452E4840B9AA5316A04958C04DC13ADB7D2E48404866C1F48F4858C0D93DA398AC2F48408F7E8A34A74858C08F08D55834314840D6B49F162A4A58C0ECBB5CBCB031484053E68E93434858C07729C19735344840244894B5964958C090EBF19A7A34484041997795B44958C0B89416DBB5354840C3B28DB2D84758C0B766AA1643354840577BD211A84758C04273E7F5F237484033284EF4304958C06C2CBCF91338484092DB7B319D4858C029EE4A5837424840A7ED58337E4958C03FDB4B3A4C424840F28473B1EB4858C04F933E596F44484093EC8D53F44958C0F841C03BEA444840CFDBFD93444A58C06ADDD61CC5454840DFA42132624958C08628C93A57464840A34CB394BF4A58C0B48F283EF8474840413A2672BC4958C0DFD3EE5B534948400B7299D21F4A58C0336C3FBDB44A4840CE9EDF0F034958C08803EFBA1F4B48408871940F434958C05286DB5B984E4840596F0F8CDE4758C095CD1B59754F484072C53C0C284858C0682CDA199D504840CB7B2C69E34658C01C020917A2504840C6167105384658C08F7C73F656564840E27105A8784758C07F02D2B9FD584840E2F72BE60B4758C0895978D9B25A48403B10F3A9A04858C09DA33D5DF55C48409802D1E87A4858C0F04D4FDDA45F4840737BBB2A774958C065811D40B9604840A1051868E94858C070D47CBFBB614840AD87F9E6704958C0C13CB861FD634840A94C06E9214B58C03CF3BC06986648403953EAA58A4A58C0249E0826BA67484015BF36088C4B58C0CDBC8B886368484075483F03F54A58C083048A68016B4840B045901E3F4B58C02D2FA84BD76F4840CDFEDAFDD84D58C0046AEA334677484025312016AF4E58C0AB8A6599FF7F48404A5D0EE60A1A58C0C8399869FF7F48403512FFBFB4D157C069EE13B6FF7F4840EA10029318CA57C074879FDDFF7F484043C5C731B8C957C09BE765DA94AF48401C9A8B2140B557C09BD444D957AA484089BA759999AB57C07C4E7FD2467048406672029371AC57C0E4FDB0E788634840B4B2120180A457C03F2C7ABE595B48402819D3838F9B57C0E8003603FB5A48404456CAA5B59257C08ABF5347965A48402A7523E0C58E57C00773045474534840DD73F684027657C060319061F74F4840235FAE09037457C0022168914043484022DEF1A3FD7157C0233757C97B414840B0CDABA7E76057C025C09EFD62444840C8630B1FC85D57C0D13561AB5646484000354B184C5D57C0526306EBDD4B4840F8DD649D785357C09389A38E8E514840E45C2331DA4557C04849E3EE33504840CBFA95709A3C57C0F0DFD7F36D5048409B6D57F2A72E57C0D777C9A625454840584DBC93132957C0FF04BA2A2A454840AA67F49B162857C04278E4885C404840C5536E7CB92C57C0F00F2A04533F4840E1319BA3392D57C02C481867ED3A48409647CB84D71F57C0B3CBF64D54384840FBD041C1341D57C041F5F1467A334840A6A587E94A1E57C0EA508286C22D484048B334FBAF1757C0FC9B147D421C48407D340106B91157C09D73FC8F461F4840A2593EA9371357C04B58A8112F264840A848D720AC1157C04905B1CF182D4840F2A45BC30F0857C09DB703DCF12E48407997F572400257C0B950DF4F812D4840000026AFB0FE56C02467CA0B0D204840A36939F17BF256C093CA54F7621A48405AD7C46390ED56C07F4A2CED2F1948400ED0F8ED09ED56C0241BDEE8B20E4840A83B93D066E456C0AC5D39DF5E0D4840CDA0627894E456C0117C97C093054840A12B251853CF56C0F08945FA670A4840A448CCCCBCC156C0BCE7C2DD00194840BDEBF1E153B756C0E9F958908920484045484D4D93AF56C0AB9AD31F520B4840F6C7CB2F51A456C029FB63DC930F48404015EC2FA3A356C0E011DA3EDF0B4840B455B41A4C8956C070FD8A466F0E48407BE06476B58156C05FF2DBA2040B484018C1F0582B7F56C0D7A144E8030348408863BDF99F7956C0F9D590680AFF4740B6B1BEB1F46F56C0E8DB60D96303484073FF6F8CF66156C0FB69A64336004840577C96910A6856C09F81FA430CFF4740DA2E7358BA6856C000631950CDFA47405E328EB8FA7F56C07C0831578BE9474017A092D59DA056C02C567B3FDFDA47401F3A58DB5FC156C07085EBF903BB47409B50A47AFEDD56C043803DE3FD8F4740BF99D01243F356C06D0061C6AA764740E4797FDAA90557C09CE2B3E35C654740A55B5B67BC0D57C048E360B487554740EE8D36C7661357C0D472E85A525547403F342EA8621257C0FA6D8D19535447406CA2CDD1791257C0E42B1AF73E35474037B5E80E7E1257C045387A7D0B1447404D335B0B851257C0B16D1FA35F094740FF0692ACF31457C09D1BCFC8470747406358468C281657C00FDA246EE4024740E561DF8C5B1757C01144C87014024740232A1D30331B57C0F378F2B74303474084B3C112971D57C084D7B6E197FD4640597E5ED6882157C0AF1B6D49C5FD4640AE0DB8FA5E2357C0C0483930C3F946404C636626A32A57C0FBFA75C235F546401990690C332D57C09E958DEA0AF2464049E7B474FB2E57C04E65E65328EC46406D3220B7EB2F57C01A0AAFB62CEB4640CFBFAFE3DC3157C01207B823B5E146408D4DE84B5A3557C01BE2A9CF8DDD46405E2D45900A3757C0C42193B6F3DA4640D9A9AB59AA3857C0EBE8B5E58DD24640C2CF96001E3857C05634185117CA46404411FE3E713557C0F0FA07901DC8464023705179C73057C0B1AC16C939C846406DD520169A2E57C0342D56090CC646402CE11FF0DD2B57C0275B0CB52ABC4640A37EA188E82957C083EB00B544BA46403B9F8145472957C0168571F73FB84640EB4BF722852957C0038C8DA09EB24640FA2607E8D42B57C0CFB03D4A79AE4640379A20C9452D57C01AE8D7D4BAA846409E137D2FC82F57C01AE6DADB17A64640451C3DCA583057C0630F42272F9B4640A8991029CE3057C0EB1201E8E297464009793503AD2F57C08C31BFA805944640FD9A65FFB42F57C046A680EA768E464004C55A25FE3257C0462FE0EA658846407CC18CDAD43057C01BBA8BCDD4824640EE428E99183157C00C1F9BED2080464092354E32FC2F57C061D3908FC3774640CC770052403057C094D196CF1E754640F30DE254663157C0C96E01AF22734640B13941B1E93057C01B20CCAF5D6E464032B321AFB43057C08D9B5070ED6A4640AC5A11B38E3357C0F3A17530825F4640F77323652D2F57C0BBFA4810575B4640A8693AF1572857C06B7C2C6F42524640947F966CF92657C0E02ED30E1E4E46405367F0F9962057C02027B6D09E494640DF5DEDDAD01557C07417724FC3464640E6D116B6821457C0175CADCF2E454640CFD68DEDFC1257C0B0B2DFD0FF3E4640A79AA042F10F57C0E686AA4F653A464092B9265B310D57C0FD64F34E1D384640A29CF967D80557C0425B100C32354640594160923BFE56C069204784A72E4640B049416B16FC56C06DD8AF00682B46403E4655670EFB56C005E5FA7DA4284640EDAEB5C507FB56C0EF23C25BE824464039CF235EE0F856C03AB56798F5204640774D0AD251F656C0135AEFD2781846406C3CEDBE34F056C0991A64AD9011464065D2F431BEE956C0172A230A900846400C4176AA83E656C04568D7A9390546406A3DCD266DE456C03990306A79044640CE22DAA2D1E156C03034722A61044640D5D598F941DB56C04A88ADCA28FE4540A4DE1816E5D756C074A5EB8E3DF945402735A646AFD256C04A8140BF70EC45406F1C591A12D056C05331CAAADFE4454027871C1492D056C069D2ED7677DC4540C507CA7289D056C020F3697FB2D64540CCA4904EE9CE56C0F483076EA8CC45403C5B7E4D65CF56C076EBAE363CC64540FC3FFDEA4ECE56C0CBEC787F1AC0454077EECA3E1CE756C0A250F08414C045404540AC51BEEE56C0FBDAD3F7F1BF4540');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('25','MS-ENSITE','MS','MISSISSIPPI','F','943','0106000020E610000001000000010300000001000000A6010000733A4DF5D91C56C02D07B1A3846F3F40BFBED1E1CF1B56C0283724F5F11E3F40C21426FF771B56C0DCA7B78D2D003F40E1137D1AB41A56C03F32867488BC3E408BCF38C9B01956C0088D97CFBF643E4035CAC2E68C1956C0B738ACBB565A3E4091C05C10B61D56C059BA62BF79533E402F895408FA2456C09BA22ED278613E4009E6AB9ABA2B56C0C6BF3778A2573E4074AB2F1DEC3756C06C57C39B266E3E400CEFB9C5883B56C05169D37AB36A3E4019EF0DBEAF3856C079B15A42F6653E400EE8DAF8AB5156C034AF2D6799503E4081C3977C815156C0FCA403B5545F3E4036C02E67715556C090B8336B63613E4000F0D2C9E15656C08FABA94C835D3E409FE73600635456C0C2990F60A0513E40E1FF3B6C995A56C05C858804A9413E40E9910B2E0A5C56C04029019472333E40EF1FD383BA6456C0E99C0148E7313E4093D8464B0A6756C050BF33B1CD3D3E40D533FDCACD6656C00EF73BAF713F3E40C2A8214EC96756C0A215186BC8413E40256F38710F6856C01E9940C3544A3E402481C133E86856C0C3297C80BB4B3E40981EA6F4C56856C03E32ACFCD44F3E40E8C55CF2966756C0993FA5FBE1523E40FDA72254B16756C0DF5291F7EA573E40AE7A5C778A6856C0DAD96273F55A3E4068AD9E59636956C03DF6D552F45A3E404B39B81CE66956C01FE6C26C0A613E40FD57C841396B56C0366771476B663E401ADA69C53A6B56C038F1C99D02723E40B8863CA8BD6B56C079A9AEB974763E40C5D7844A746C56C090172E18DB773E40E1199F0B866C56C07A99A1556E7A3E401054EACEA46D56C00D6D6A143E7B3E40485E1211056E56C0C1DB0F51FC7E3E4028129653DE6E56C0EE9A7550727F3E407956F5D8547056C0DD5B42CBFF833E401756F77D757156C0E128DA831E8D3E4024B372409D7256C04B868043CF8D3E401C0D7DE97F7456C0C9BE5B31D09F3E4028996CE98D7356C0DC0B67CC42A63E4034D0484B707456C03089DA0AB8A63E403E4405EE167556C03F331266BEAB3E4023DEBCCF1B7656C0791855868FAA3E40F16E260F777556C0DC4FEEA306AD3E40605A4CD0DF7556C0EE761D03F5AD3E40561DCC91D87556C05E1DCB3D57B33E40FAAB9E902A7556C0677F47FD2AB43E40466408F3047656C0D5622A7A61B63E40E77812B37A7556C0A94F1377B7BA3E406B44F591B27456C035E47C76A9BB3E40E609DC12D67456C0FF72B2331EBE3E4071D5BEF10D7456C0268CD8F387BF3E4027903BB6C77456C04E5FCE652BCA3E406DFBD955E67356C003905580CBCF3E4021C226F4FA7256C0FBFBF8000AD03E40B8A33C35F37256C06232103C40D43E40E4FD6D52967156C0D31293BD9DD43E4090D4D5D53D7256C04A731A7390DC3E40E4F16AB3037156C00ECEC995B1DC3E4056526F15DA7056C0D6CBB34A85E63E4083744E93CB6F56C04ECB988B1DE73E405AF3A473BA6F56C03424C6C8FCE83E40B20B0FF6837056C02B81E684C9EB3E40CA8BCBF3636F56C0BBEA038415ED3E40169DAC16E86F56C01F328D3D29F33E40352E3E56546F56C0E188F17824F73E40B12A0694116E56C0BCD504F4B9F93E408218C395836E56C09D4E40D20FFC3E4014744DD64F6E56C0A996CBEC63003F408A66E0D7E46E56C08F556EEAE7013F409305D906597556C0D221ACDDD6013F40E43344A1999056C0A8ACCD00E3013F40B0788387FE9556C01A06243C61013F406DBF22D6BAA256C0BB1762B398003F40F1015A37DBA356C0655D16D36F003F402EB867081AB556C01ABA874E65003F40281B6016A6C356C0510A7E661B003F404B69762278CB56C03BBA6D411E003F404FE0A08F77E856C08966467559003F4086C7BF6F2DE856C01E4FFBD00F033F40A5F77D8DA8E456C0B40F779C5B083F404094D54C55E356C057D5B68FE30E3F40B052148E28E456C0A5D329CD06153F402EEA2FF2AFE756C03D329C94B0203F400F3BDDF1DAE556C0C08047FDB02D3F405FE5483376E656C0173F9618C4363F40FEFC6496C4E856C04B2CBF00B93D3F40385AAB1732E956C060472EFB67453F405F8F46F796E856C0342DD7F416473F4050BBA891A4E356C0762B3A763D453F402817F0CE17E156C01D17784077483F40380E378E28E056C0EB2E58F5814C3F40D6981C4F5EE056C0D66BBE0ECE523F402C4E7512BDE256C0BC2FF517D4583F40FED11593D7E256C03CEC78916E5E3F405CD0B97236E256C0D886F1E8FB613F409E30DCD4CCE356C052ADF21163633F402D5558B655E456C0F71A894AE16B3F40E90350B55BE356C0B3999DA0DF6E3F40691DFB333AE256C04A547098306F3F40E87646D32FE256C05BBB97DFC3683F4082E4EB1179E156C0425CFA2060643F40D82BE14EA9DF56C095CF705B10603F408B71000DC6DE56C08FE4673AB6603F4048963EABD1DD56C09886E01171673F40073E976C4ADE56C089B8FDAC9D6B3F40EC1AEE7181E056C091510C46FD733F400B8203336AE056C0EB81037193863F409727B87230E056C03B6E42EDED883F408D3A00EDB9DD56C02D4D5B4BF98A3F404EB8FBE61BDB56C0E234672710903F40620C7444DFD956C0637A39421B963F40BD9C6BA695DA56C04E7AC57E439A3F40DBBF6A52D1DF56C03EF1EF3DB79A3F408A75157491E056C0BA5D7BDC379F3F402D732AF47FE056C0EE4141B7D4A43F40B8A5CE72DBDF56C093B43613A1A63F40EA02C5AC45DD56C0E33EAED880A03F408FECBA4523DA56C07A79DBB922A03F4024473C63E8D856C02BAC0B3494A73F4082793124D4D856C0D0803E8778B73F408A318C615DD756C03961ED1F72C03F40F9207042B6D756C049F004BFE3C03F40193C4D1EC1D556C0E6BB8DDC2FC23F400F43597616D256C0081454A1F8BF3F4084E14334E5D056C0C8698BDD7FC23F40859074D4CFD056C0C1EA3B1620C63F4004FAEE3D85D556C05D4A2ABA7CC33F40A85032227FD756C0D4F32A9657C53F409D00392039D656C0D71037AABBCB3F40C7009C1F6ED556C009B3DB33EED73F40D46AF51B6CD356C01F6B680AF7DC3F40A9ACA6BABAD256C0A91025CB8ADC3F40C4B8AF17B7D156C0DDB67A3CD9D33F40800B24F40BD056C02741DE409ED13F40722872D372CF56C04C9762F8DBD53F40246A42B7F0D056C05F49C80997DD3F40EDC61E95A5CF56C0B7DDBFA3F0E03F401724F110E6CC56C086DA5C5219EA3F4085F8E9EE70CA56C0E67247EF0AFD3F40B1C9E248EBC656C099A0CBAEF2FD3F400ECC2AA5A3C456C038F10320B7024040CDBA5A05B0C456C08CA0357D1D044040F4ADE14691C556C03B6AF3999B054040B6C03DED28C956C0D4B0D1337B084040CFDF970D53C956C058718C6EFC0A404089EB80EB0BC856C0E4F0F2AD500B404085A356E7B8C556C016B1C4B64B07404078A3B0E42AC456C03DC597B68307404095E4B325BBC456C0C99A0E0D0D0C4040F97939E2A2C256C0835EA329CD0D4040C344579FBAC056C05AEE08E32D1140401457A67E40C056C09A05FE59AF1540406991E9C091C156C0C6B4D239C41540407B3629447EC356C016D093B5A3174040637F1F23E8C256C0BE21605C54144040727CCD4377C356C0B0B7D9C238114040307D27C751C556C0517BD69E09134040C374DDE9F6C656C0D422F9614C114040DA85F98E06CA56C02E04383F8D124040E6433470AFCA56C0CF7909B808164040A9D22E6F12CA56C09BECDCAE5E1A40408D94EB8A6DC756C0E2E12B8AE51C404056DC518971C656C035AD464D861B4040C86CF727A2C556C047ECFFC8C31D4040EDE43E2501C456C06B78E468CF1D404013BC3F23ACC256C08573CC84F21F40402E06297D8CBE56C0DDEE296C9D1C4040B4C5E9DC26BE56C0595B499F7522404027BF919DF8BE56C048E22599C5244040FCA1469DC6BE56C04C3E19561E2640409DADB05C31BE56C04F8E0974E42640405BEA9D797ABB56C0EFFEB536162640401FADA098A7BA56C086166C741927404062C0247507B856C061B0591E9D304040D4BFBD15A8B856C09F2495FDD4304040C01336D88FBA56C08C8CCA274B2C4040C30D2ADD04BF56C0FF665C23A32D40409DC3181EEFBF56C0BE4EE47FE52E404094A4CF9E98C056C00A6BEE55D832404019679CFB15BE56C0C411CD0FA73540405D501E3BCCBD56C071C730C9573840406061981C34BF56C0B3AF6864FF394040092D1FA0BAC156C0943039C7A53840402ED2DA62C0C356C0A6CA6FE53B394040A2632DE789C756C0CC37BBB4D53F4040B005F0469BC756C06399B92D194340409D460064B0C556C098A711473E464040094B624063C256C099CECED5A03F4040118EF23E44C156C03C136797D73E40407B7EBF7C7FBF56C02C9E88F6693F4040DCB9A0FCB0BF56C078F0981182414040ECEEE1610BC456C096C2B0086A4540407D859A22B2C456C080944F63E7474040184A2441C6C356C069C1689FCB494040467EAE5E13C256C084EE907D994A4040E0B9ECBAEBBF56C0367B8414CC4E4040D4BD6E5AC2BF56C06735DD7124504040C2D544DB82C056C059B1E68C475240409AD213BDC3C156C0DEFF262D21524040CB525B1F0EC356C0A730F694A74E4040CE1C014117C456C0E6D2C796A24D404085664F451CC756C02EA55739804C40404F2F13285EC956C0AB60B3EB8E52404042303247F0C856C0F2E50047E7544040855696DEC8C356C07D533196A05C40400FF21AA242C656C0AA24E18EF05F4040E391E5A5BDC856C0B55B302E29604040C000D54703CA56C0C5574BCBA3614040D31180C61AC956C0E016F518B16B4040D24CC4BF18C556C0FDC9D7104B70404073B9FE3ED8C456C087120F5F177A4040FCDAC820F0C556C08BA8DE766E7E4040DB1B39C329C756C047278996657E40402333A0457AC856C0D2E4CD38D87C40405EDD62A552C856C09A10C601037840409A5D3946C9C856C001A361267E7540404B1BCA29DECA56C0FAF040E9DB73404052660EEDB2CC56C06BE1786607754040A9A59EAE64CD56C026A91C21CE774040BB7540C95DCA56C0D29062B20D8040401FA68E2962CA56C0F51F0750AF814040C6EB6A494ACA56C03C75456ECB824040971410E908CA56C0CBCAECEA30854040A30C2125F1C756C0B77B610A11864040244D63A48BC756C0803C58A768884040BC8F4FC866C956C0FA48D5819E8B4040FD02378E33CC56C0A35DD61C828E404001D633EF84CC56C0B37582B7FE914040E723DF0C60CB56C09F5904964093404092A76EA5C5C756C0E3C405DBCA904040C99E744224C656C0D21079199692404054504B0188C556C06754A856B39440409FAF8C22E5C556C005EEF58AE79C40401921C25D7FC356C06B0BBBA8799F40405C570C1C98C256C08A9349E319A44040BC3415BE73C356C0C31B95C097A54040A2641941E4C456C02FA53EE06FA54040597221C497C656C04BD73E06EA9F4040F20EE8E6D8C756C07DB4384262A24040F2144F2A14C956C0D358B8B847A94040E5D72DA95AC856C0058E0CB304AE4040650A4DE6D9C656C0754C5EEE5EB24040FE5568020BC556C0468EFE8C84B44040070F3FA0F1C356C0D02ADAE948B74040DE2D81E0E8C356C082DAA165E5BA40409A643542BAC456C06E9C1264B0BB40407B6D0A847FC556C0433DC9A342BB4040AF065EE559C656C054793C2B1FB54040C6F578CAD0C856C0167B048ECAB14040CC672991D8CB56C0E96B5F4B2BB240404BEA2BD412CD56C05013E6860BB540400C20A773BBCC56C0805DB9850BB64040B5DC332A5CC856C0170C5105BCB840403260B728ABC756C0B861DF23FAB940403A11BFC89EC756C02E2D6D0122BC4040E631910A40C856C0B576DE9C24BF4040F52F3DD090CA56C056DDE9B785C1404059E9699127CB56C03B65B3D892C04040B6725370FFCA56C0ABB72DBFBEBB40401EA077F1A3CB56C031202CC247B94040D858CCD8E8CE56C0C8385080C6B84040D65750788BCE56C0B7DC3F1ED3BA4040A040B1D54BCD56C099BFBEFC9BBC4040628A91928DCB56C004DB1A578DC140405A611093B5CB56C0141B37D500C3404009849AD611CD56C05457D970F1C44040BE481698ABCD56C0A0B71DB00AC5404085936D5A93CE56C08101FE2B3AC74040B55A5F9B84CE56C04B31908598CB4040CB9232D506CC56C0918385CB92C940406E2A8CB2C2CA56C0B34058CCE6C940407CD61011A6C956C03221FF06E2CE4040243E2E92E3C956C07A615CE38DD14040106B729A25CD56C0E99E3F58C4D540402DCB53BCC6CD56C0F1546F336DD84040735435FC8DCD56C0DCAE34F0C2DA40408DE2BC5575CA56C079525C54F5DB4040FD6CCE0EC1C756C012C4DCDFBCD64040C62A05495EC556C088A01B46D3D440406E2F43A36DC256C0551D2E4877D74040284CFEE37DC256C0080B392551DA4040BB7FE0C69AC356C033A7FF8017DC404073104F0DB3C656C07307F2FCAADA4040BBB4D27042C856C0A2B49BD934DB4040AD447AD2D6C856C03DD1933696DC4040E2D17EF426C956C04DC5168ECEE240406884E133C6C856C03B676E6DDDE34040EA8263EFC0C656C02C9E39F265E3404083336C8A41C456C0903DF775B0E440409305B7E6C8C256C0C09EBD5B84E2404062FC10C32FC156C09D46A97FCDE1404058A91C00B6BF56C0BA704FC1C5E24040A6ABAA3EFCBE56C01A4073A089E44040F6F2120064BF56C05494CADD45E640408E1F3A86DAC156C0AB0D617689E84040ACA563EA83C356C0D922962EFCEB40408C5A064CEFC356C04F31DE0900EF404006397A4830C156C06DA03065DCF740406BEE3831DAC456C0AE011497C4FC4040893B8B93B1C556C0B901F2314EFF4040581971B177C456C08EE25933CB004140FF629CABFEC156C03CD8C4DB2EFE4040A2EFCA289EC056C0F06C261ECDFE40409131F80606C056C0196CF422F7FB4040E651CCC429BF56C024209285FFFA4040BA9ED7E1C0BD56C091966947D9FB4040A43BC0E184BD56C098DF11464FFD404071264FA46CBE56C0E3820DC252FF4040CF4FA4644DBE56C003D61DE06B014140CA059C42D6BC56C0290AC1C0040441405765239ABBB856C0AE540987390541407BCBCBBA73B756C0AA4A2D81EF0C414051355BC002BA56C0D48DCE5C2A0D414003C469864FBC56C0395124562210414063D17C6905BD56C0D84D65D1F41341400C48E92775BB56C05905EECFC617414048C4ED9A30B656C03A62CC3CE6124140D6F9ABD80DB556C0B4EA86BE0A1341407E8FC6F6AFB356C0B607C49D48154140C1874F7AACB456C0913BE73867184140241BE967FBBA56C0C6D18F4E3B1A4140054E23ABC3BB56C0A88C9E490D1E4140CCA63A4B6DBB56C0049311C809204140E1EF4FE143B756C0A36069F1101C4140B96FBFBD36B556C0F605A4D2641D4140C1B91181BBB456C07C35B44C83234140494177219EB356C00BC1DF6A54264140EAE4FB7FBAB256C0CF0BC66B682641401CDE53F988B056C0E99B5AF1B823414090AFD8FCDCAF56C019A6926CAE284140E3921B04C4B056C02AD06424982E41406FDC95C458B056C078308A83A62F41402716527C01AC56C05DAE9A8961304140D12EF27999AB56C030E8A64C872E4140A9F1057620AC56C085CD25F2FD2841403424AAF47BAB56C0D1DEA9D3B6284140D04E6D531BAA56C0E372F813412A4140BC6706F711AA56C0775DBE8ED92E41403D587133A6A656C0501CB54ECD33414061BF681212A556C0B54000ED6F37414069D9A4B3C4A456C081C9584A1E3A4140FE9DAD19C5A556C09C5038E2903F41402205861826A556C0A9B0C7FF994241400B5A52D635A456C029055B9F2C444140CDB4CE5162A256C01D025A208F454140B4C0DC50F7A156C0937B2CDF22474140BF9B8D58F9A456C034D102936B4D4140933D555AA3A556C08D83408E5F504140C02314F914A556C0F10420ACA65241409E3AC816EAA356C026AABB44A659414014EA5EB381A256C0BF538568D0574140301747B40CA356C0EF839BAD715341404F64D71280A256C030E7C41089514140DF1A5A0E92A056C023162073AF514140594E9B49D89D56C0DC0F5BAF085641403A1681CA159E56C0C6D14649285A41400AC0EBEFDFA056C051E48DA7E0594140B9C3E3F222A256C09C1292244F5B4140EDE2E6F40FA356C06B1ABFF52C654140626FDD51C0A156C0EEB735935967414088F9559008A156C081413734216741408D4779AE16A056C0C899F5771C654140DB0929EEEC9F56C0CEED307D086241403AD2BBB017A156C08E1B72DFCD5F4140CB89C30E4AA056C0E09E7C236F5D4140F7D0B10C1B9F56C0FEA698240C5D41409D19DAE8E59C56C0EB9DA6E3E25E4140D95AA8E8BB9C56C0B3BAC37F6361414053CB6A2AE09D56C06CBDA6975E66414019B7A2A8ED9C56C0BCC302F3A3694140997BE36A639E56C059CB9A2BCD6D4140871858CA1E9E56C0F72C4547C5704140EA7FC6460B9C56C07FB8C2877171414097A5B865639B56C04206C6EAB56F4140BBA694E6C09B56C00E4ED911F06A4140FBEE3AC5089B56C04C6EE2F28A6A414030FD22A3DB9956C0C7CE2F52AA6B4140715F297CDB9556C09987DE902A6E4140DC9F0EBAAA9456C0ADE5E6B3D86C4140031BB9374E9356C052A0A6340A6D4140E4786EB72B9356C0F7052E32BA6E41409394C9B6F79256C045201C2FFF704140320E9453139156C0E8F3C50DC4724140D988DA508C8F56C0BF53FDA9DD754140806EA2D07C8F56C04465872631784140C3F23691E38F56C0AFA9C1E49479414036DDBCB62C9356C0907B2DFD417D414037472D778C9356C062E390D819804140999FCEC0E76D56C0F27395CAE77F41402AC7CE37616956C0F0ED250718804140781D4670E95556C09AA6549BF97F414012BF383DAE4C56C02A528EF51C804140FC769185654056C05906E8B00780414032A886CA003456C018A08DE84F8041404282A9263E3256C0AD9D264768804140E5F3E477851856C0DB17A533A5804140381A09B5821656C0D7619F937D804140A5D423646A0C56C0C3D2C7EF9180414019039FA1280956C0A61B9E7A14774140705B1CFFF70656C074C00F1E317341403407193DCA0556C026CA2AFEA37241403677C7CDBA0856C0D1DB4BBC4D4A4140EA6E5C2FAE0956C01471EF128E3B414076A73F2DBA0A56C0D6B84AAA7D29414089C16423C20C56C0365A7ACD930B4140F3AF5821F80C56C07E28A15191074140878ACA6FE20F56C07384BFA811DF4040F62A18D4921156C090EC5572F7C44040B33EF553821356C0C54B4A7DFAA44040C60505D1B91556C0BC71CA4E667E4040EFDAB04F461656C022606B7A5E76404048B53C8D341956C0EDF002D94C4A40406FB32B2D401B56C0C9F37EA99427404010D893AC031C56C09D0B9718271D40403E752CD8441E56C001770E6E8DE33F40BCE08025C41D56C0D4358654C6B33F40733A4DF5D91C56C02D07B1A3846F3F40');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('26','MO-DNR','MO','MISSOURI','F','944','0106000020E6100000010000000103000000010000005001000070CEDBDFB84656C052F3321E1A7A4240E8454B3F4C4856C017EA284BE96E42407A13F102A94A56C0AE417A0CF76B4240516319231B4B56C028B2D10E2B6A42403CB29840864A56C012159213F966424085814BDB0E4856C078BFAF976F6542400E8C06DA084856C0728BCCBB506242407D0F8D1CB14956C0F34F0A1C2A614240702EC55F584B56C0DDFADCDA67614240868D0B41914C56C0C61937001E5D42400BD8D1E0A44C56C0AAC73A83515B4240422CDDDCBE4A56C07FDE0BECF7554240FEE98F9D564B56C0693C578F97534240BEBBE2DFCF4C56C0CBB3A253D0504240142410C0724D56C037DA737D7D4A424047A6EFC2774F56C02D795AC0DF4842408B42ACC7245256C0C020A7BEA3494240F586B44CA15456C098949F33A04F4240234002CFE95556C0CC05E5118050424044024491455756C0261F25F218504240E30151D2EE5756C06D81CF33E14E4240919788F5C35A56C04DDECD295C414240BA43E6D48B5A56C0FDE28ACB574042400B713CB8B55C56C0AF93B9B36C3A4240A8B6AA5A235E56C0C3A480151739424030143EFD7D5F56C0CF5C2F51963B4240196BB11B755E56C0478A6E6BD23F4240BE95721CD55E56C0A7C6B7E99B4042404617A73B2C5E56C002E69B6547434240C314F1FCD45E56C03B8F71801F4642409AD95C9E905F56C08EB0D71D93474240D75AB5C2F26156C09A55795B45484240A6565105996356C0CBC7401C66474240B89E75E65D6456C04B9AAFDF4E454240C71603C64A6456C086F97D0468424240F42A1F22216256C002F53D0AC43F4240FDE3F5BF076156C0F4716A4F663C42409891D982E56256C0E1D90775733842403A1BB9FF486156C08CBC24FD57334240331219FF3D6156C041160746912D42408AAB1542DB6256C0E2223CC7422C4240A39391E9C46656C0D8A539A46A2D424074369D2BDD6756C0F0142548DC2A424081566D89D66656C04F3A8DED6F27424080BC4941B56256C096E9FA93F523424017F44BE0446256C0343D4B97DE2142407678E0A0AB6256C0C4574EB8F020424006D39DEA8F6756C011E647FAD71E42409FC47431EC6A56C040D11297A22042404B6F8DB4746C56C0DD1A55374820424060348CF4866C56C0717A1099D41E42400C05B4D1516B56C0D40EFB9C471C4240F8B178C9976756C01C8BE22387174240F6C84BE5BA6556C0472704A9771342407AE7E164BA6556C09FFE8F4C9F1042403AA283CDB76A56C02E55FDB1B80C42400A5E4F6E686B56C0B406F314A10A42404FF4FB4D176C56C0F888119F4F034240788A1E91326E56C00EB55E64FEFF41406F68E291A67D56C09C2A7BB59AFF4140117076C0259256C04590378FE0FE4140C8C50B8E429856C0A60CDB0FADFE414052DD8B862E9456C012B99397BD0B4240377EF0023B9256C0DD1E9431D80E424022276620E29056C034E2A3D0350F42408FCCEC3C098F56C0E346F84C8E114240FCC9255DDE8E56C0B09457A7A21442400B05DE5B098E56C0ECBE49C518164240DEC31A75548A56C01A10A08337194240DD7CE071678856C034E61042271B4240FC74A6700A8756C0280E6C1A082142405F1C8F6B3C8456C09A5810FBDB224240B128A4A9308356C02B0615F777264240999BE9AB558456C03C778C91A62942405A24D209388356C069AC94EB6B2E42408217108A568356C0847A9587F930424047C3282E238556C04B0EE0A3DF3242400BBF65B37B8756C0D5D6DD40D63342400130C774EE8756C078C7869D18364240F2163634828756C0C99A3A381B3A424073AF2AB7CA8856C05A305B978E3A42400F6CC6D99D8956C00B811AB1F53E42404CFB33C55D8E56C00AF77C6F143F4240AF3399193BA556C014F790D1D93E4240B48825D87BB356C07E6E3440A03E4240DD37A5BD92C856C05A875A4C773E424027C484E05ADA56C052E62F6CDC3E42409AF9BBC5FDDC56C018141FACC63E42400131466011EC56C0ED1547B2D93E42400D26764A2B0857C0AF60365BE73E4240990A304C5D0957C0F39BD3BBEE3E424088B1CDA9792157C01A390983D63E424090C093C7C43157C01280B1C7B73E4240E3CD73AF8B3657C046F23D89B43E42409471095D075357C07E7CCAA1CE3E4240F5D2BB9F035557C021C720E3C03E4240DE0A2C3B2C6657C04C0C68F8B63E4240586AE69AE17657C09C5DBE51B13E4240279758F52F8557C0CF6614E2D93E42404E4FF72381A757C0BF21671FA53E42401D35B0AABFA757C09BEA5359D4554240543887ADC9A757C0D3F598E5BD614240EE67D94CB4A757C06DBB293B9F7F42408991DBF4B8A757C05CDF17EAB2874240EEC9E5539DA757C046CEAE21F3A942405E9A37D699A757C0DF5893982DAE42406D3DAFA19DA757C0690C39773FD34240880FF881A2A757C0F85B1CF205D742404BBB809778A757C0D464ADBEE3034340D240FC5682A757C065FC4EF523074340FC6FA6929EA757C0E7C1071B2E324340969B3A1299A757C04F1A5340593C43407C82D1D13DA757C05ECF1A4E5D5E43406436DCB332A757C083209A62266B4340680D3F77FEA657C0A3A87DABB7854340E6C69EB6EBA657C04714FD42708E4340207B9C757AA657C0DE1D58BF13924340EDBEC6B635A757C0942B473E699343402D48BFBA5EA957C0B8D5F25C47944340F151459E3BAB57C0A8D5ECDA63964340873FDA04C1AE57C0D5EE04BBEB954340A624D72A90B257C0A61EE6753399434047168C4D88B457C00DB91D33029B4340B50608AE57B557C005386E8C81A14340F46CDD1164B857C03A21D3269DA4434061FBA67317BA57C0FEB34CFF58A943403F5EBE7353BA57C085DFF61B89AB43409CB549727DB957C0D84780D5B8B04340CC7A7E743FBB57C0FE56FD53CDB043408B47C4F657BD57C0443D484DAAB443408ADC5EF81DBF57C0FD15614740B84340753F52BD97C257C0665949A441BB43409556D4DD0BC357C056D547411FBE434071FE1CC687C657C00B3BC46134C4434092EA36A9F9C657C017595EC1C4C74340C643A6656EC357C0B4422F7B1BCB43407ED50CC995C357C09D3E069A16D043407D5D8589CFC157C029119394B9D44340EB9494E6A0BE57C06B6368B0ADD74340DD418DE88DBD57C03DB2926DB3DD43406B2ACF4700BD57C0929BD9AD45DE4340DC67452493BB57C0B9C25A2F0FDD434061915CA1F6B957C02A00535006DD4340BA76DADE2EB857C0DD545A90A1DE4340C398D27EC1B757C076220BF086E0434031E40CE021B857C0A810B8EF5DE1434022F570C5FEBA57C05832F8ED00E14340342CF9E7D8BB57C09037082E41E34340779943A8BABB57C0D6460AEE31E44340FE23B2848EB957C0B7DAC86E9AE543401FE5A144DDB857C0BEEC138FA0E843401F246A267EB957C03AB9B8CE06EA434085D1E1C920BB57C09A8C890EA4EA4340681E80CCEFBB57C08DCCBEAEB8EC4340E7467E2F0CBC57C04D4C0FCFB2F243404F80EEF2C2BD57C0E9378D2F4EF34340385A98B864C157C0EF97A932D0F24340E0D176F824C257C07311C0335DF04340B404163A0CC457C0751356B7EAEE43400916053D72C657C0266B53BC57EF4340FEC262A2A2C957C0D64592223BF443402F847AE569CC57C02EA8DAC780F44340E1EF764749CD57C0A717FC2816F84340A802E9E96BCF57C0A3BB62EC96F84340404305B2C1D357C055153F96ECFF4340F9EF1D9515D657C0EAB4E65932034440C9849C77C2D757C0F184611EAE0344404D4F5A79FED857C0A28726A099054440EBCD961B7BDA57C01E818E83280644406344309AD7D957C0974983DD490A44401FFD16589CD857C0781122D8340C4440737DB5D823D957C0366AD0F6C50E444006AACBDB09DB57C0A09095F9DC1044409E98663F80DD57C009C9F97945164440C878C95FDDDD57C066D359F54B1B44406E0FE24084DE57C0B98ADC94091D4440318ECE4A04E357C00D96B95B13224440733E33341DE657C0D18826C4A627444082E3409C65E957C0F3D145E890274440CD73DBBC50E957C03AFBE0A842294440FFE6CC388CE757C022622BE76B2A444019BB48D96FE757C0D8CFE7075A2C4440E192BC7C96E857C0E2A3D929ED2D4440FD93009FC1E857C01B5831ECBC32444048D391CE80EC57C0C80C60901F3E4440D70E6E8ED6EB57C0323173F08F41444087EDEAAA1DEA57C04A7AE0EFE143444028794CAE6DEA57C0E07D726E84474440DC2C1C913EEB57C03310A54D6D4844400222D692FEEB57C00D6D226ED44744409D84D5D04AEC57C0FE38D1AF164344409580CF992BEF57C02D1815CF24444440D25E89BFDBF057C0777FDCCD5C464440C2B7C5621EF157C083708CEC654B4440A79149C87BD857C0599FFB74CB4A44401FE0D458EACD57C09F70DC747B4A444052D2CF5EEBBA57C08DD72B4AE249444024F2C1BBF3A857C01AA9DF01B249444074B0BA060E9F57C058A0988B7F494440E9DAA3CF418F57C01B6F1A6B1549444068694EE0278157C0D486748E79494440DEB7B4CC527257C096E0C1990A4A4440436CA9B9066457C0C383F01B584A444041749E86B25757C00C6F9B884D4A444024D414C7754657C0C0313BE4CB4A444017BA23B0F02D57C000B3E3367A4B4440299914265F2957C08DC2EA05B54B4440E8B0DA07231757C0B1CC3FEABE4C444065F844F85C0C57C08F41F4B4CF4C4440E7B1475491FC56C0D5BE0FAEDB4D4440085D943478EF56C0383FE9690D4E44407F420AF1E2ED56C0C24B7EB1F54B4440E2DA0E4D28EC56C0E87709D8644A4440E63DAA0D4BEC56C066225D5F9D46444026EF5FA3D7E756C0ECBB1A2D36444440586F25A37AE756C0C69F8CB49F40444027FC4E7E81E556C0EEFBA8BB043E44406561BC9C14E556C008AAA77E5C3B4440E8B8901520E256C0DC3BEDE44B3A4440057617767CE256C0C91F94257C3844408F1A9014E5E156C0BEDC41E7B0374440A9C4A6B3C5E156C06687FD6980344440EA8A622F06E056C073F6AA4DDC334440EDFC554D61DF56C08F2016EF05324440AE6728CB87DE56C071F9C7AF0C3244404D920A46B8DC56C0F57967F29B2F4440BB089C8A28DF56C07B080B37A32744400ADF530BF1DF56C07F6A639C2E204440D0B6DACB6DE056C0787E9B1CAA194440B34839CC0AE156C0DC2D633D3A114440035C172944E056C0388E3A7F8B084440EED24F4532DF56C039831301BE00444087C6E51DA2DC56C00378B0201AF943402A14F9FA8DDB56C0EF5AAE4000F64340DBB67FFBC9DB56C06D896AA070F343404C8E6B7EDFDC56C00901861F51F1434009DF22FEC1DC56C0624046DF79EE43404D920B7270D856C0E2E64680E3E6434063B18490E8D756C0F4EFA0DF72E14340A7A98BCF80D756C02FD1A17EC2DC4340BB783D0757D456C0B6ADFC9ECDD74340C692C75404CD56C0B96BC702CFCC43409D13594D01CA56C0289078E3BCC64340D274FF0200C656C0A7177C64B5C343405B04E81E21C456C040D9E003ADBC4340D8FCEC9A55C256C010051904E4B843404C1CDF6DACBC56C0F42419E847B3434049B2329F70B656C0BAD5FE2CDDAC4340FDA17BD2E2B156C0E4D35030FFA54340E5EAC2CA3EAF56C0D2F586D1B99F4340082733AAE0AE56C078072013C69C434030FBF1E8F8AD56C07268D4F4139943400FA19608E1AD56C0177D301877924340FB022C8531AC56C0916182FAFF8B43403C2BFF264BAD56C05FE8B0FD73874340688DAE4632AD56C04AC631FFD78443402A6D5EE4D0AA56C01CD1CF05B877434045981B4126A856C0E22A2889BF7043406AB7E83982A456C089D61047896F43402F338973F4A156C0CB8E9BE221724340ADCF48C9139E56C057760EF8C77A434064B4CCA3719A56C0617FCA352F7B434029009F7B789456C0855CE9F66476434052418ED7DB9156C037468BB55E764340FE8902549E8F56C08954033510754340BFEDDFC4818856C01B4BF7B4316D434038CBF1213F8756C0CA3B7F554E6A4340F21FFC22CC8756C0AA54E8B8786643405920E184A88856C087AA3F5B8C6443409132CBE8768A56C06447177EF66243401D16AF6E968C56C002323385AC5C43401E944650F38C56C032609727A75943400B10158FC18B56C091D74749545443407556ADB0C38B56C0A393740D1F4E4340450AC97A6D8F56C061EC42B50B484340C87080DEB99056C0231BD6783344434004EAA97F049156C045E74F1A66424340F8DD0648539356C07D60A160B5364340E3BD580EBE9556C0BDCCCF0309324340FE39B2B1F69656C049CE3FE5C42E43403E0C8854A59756C0180F59276C29434089ED3D575A9756C0F22DEB48FF1D434034A3EDB58E9556C0CBD9B286291843406F9FB7518B9256C0C1FEB6055C1543407CA23F70449056C09DDDEB04A50F4340DC21020B4A8D56C009038601630B434023A7B701A18856C061787B9CE9064340C9EE7D20A58756C099573B3C2304434062179DB6B08256C04C4DD21823FF4240A911ADF2B28056C03BBAF15814FC4240285BFF6B557D56C0A5FB6E165AFB424058B9BE50A87E56C006E33F5CBAF4424085AB29ED077C56C068DD697C65F0424075659A68A47956C058F6F9591FF04240AC7DDCA37B7756C0A316C5B62AF24240875964221D7756C094F003B5E8F34240C3575C41847656C0A6DC74D4DAF342400B07FB94A06E56C075135352A7EB424006FCF4F03B6C56C0B2A83A3305E74240BE4EAAEF426B56C065F18AD35AE44240DEC79AEFA86A56C0356728B46CDF4240267E24E0376556C0B4FDE54C63DA42409EE2D137626156C0F9C618C9F0D842405DAAAEB6DC6056C00429C2A706D74240EDB133D73B6156C02324E02541D342400E4A8696DC6056C0B2358F63D8CE42404CB9F8B69A6156C0F4C9218137C942400BCCDD13AC5F56C0992FC87BF2BE4240503FADA7095D56C085207E9E03BA4240F73885DE5E5B56C000B0B3E09DB44240F536C29AE45B56C02C4216C389AD4240C5D1EA5E015E56C0EBF9946473AB4240C4637F030B6056C0D9C44BC52CAA4240EABE8601E56056C0F545EAA70AA74240E6017CFEE46056C0C70D84C962A34240E663E1F9565F56C04FEB8449C6A04240FAC5A615C95D56C030721BE97BA042406E5E6DB1F85D56C077EC1768B69C42407E5689E3325C56C0FA3EB6C52A954240F84FC6DC205B56C01E60578591914240CC3DEA11535856C02608FA64B08C42404A3CE28A835856C0253F3E444E864240C278E45EE85356C043B5CBE63E8142407C665A1B1A5256C07CE042A8E77F4240561F85DAC55056C0805716491E8142403B08C89CEA5056C0CD7248688E8342403AE3FC64D35356C0E1A75086CD87424061736F676A5356C0DF432586EF8A4240F5D6DC25325256C075DA5986AF8B4240FD954483E75056C0FE1ACC86288B42407A3AEF5A374F56C0133A942959854240CDEE32B5724D56C05BE89B0CB78342401993F6AE634C56C013514F31507E4240ED1068C5504856C097F26A367C7E424056F44AA1DC4656C0716426DA1E7D424070CEDBDFB84656C052F3321E1A7A4240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('27','MT-CEDARS','MT','MONTANA','F','945','0106000020E610000001000000010300000001000000290100005167795D6DDE5BC0218DE173E05946402DF4117EC5DE5BC0863A8951805846404359DAF97BDD5BC0965DF250C35546408FC3CD3854DD5BC00D09D2EE86534640E3C3D63A17DE5BC0DCEECFCB02524640F9F41B017EE05BC028FCB4C79F5146406065EC9F1CE05BC016990225D84E464091DD5200EEE05BC07614C7E0ED4B464028E499BC8BDF5BC03F7D715D8D4646408740DDF69EDD5BC06CBF9F806446464034E8F49565DD5BC0928D7C9FDA444640CE253F7AE2DE5BC01B74635CA0444640F5FFA81B60DF5BC06ADA735AAC434640CE9F92824DE45BC0D914EC55C4464640B2738964BCE65BC0D770DCB08045464046574CCAD4EB5BC05ADA280A7F4646403700624AE3ED5BC03164B744524446401593AF2F15F15BC0B5CDACDE684246405C04BB17BAF25BC0A482BAFC5C42464038912C9BB3F35BC0F8003F7A82404640A2221E14D7F75BC02F5842B833474640A6C059482FFC5BC0FFF345715D46464075273F9394FE5BC05840F86DCC434640B631DFE082015CC0657CA54B7C4446409827DCA1BB015CC00693C98BEC4246402B31F7AACC035CC0F6DE3F8BA94346403B1773B664065CC0BB37026B55424640665302BDF2075CC0F7B2C3CA9D434640BBC60132C70C5CC05000F58906444640E484E5D6EF0D5CC0824AAC69ED4446409ED183D9BE0E5CC0F7F680699D4746408C095D5F6D105CC08F738428AD474640961F49E111125CC00F3DFE8456454640B08F2AA4EB155CC00ABBA57B36434640B7F8CE03CC155CC061D5319AA33F4640D049A37D86175CC0AB0650B28139464075A94B9FED1A5CC010D0AF2A823946401A0C0263581D5CC0BE6DEEC5023C4640F2698E231E205CC052E0487F433B46402578574A84225CC0CCC26CA31E3D4640E6FE53D9CD295CC01E92FCED8A3D4640D8A3DA83B72D5CC0587CE1949B3F46408CF56224F52E5CC0D1BEA535FE3D464044412C47E9315CC043F16579A93C464072B9DE65F5325CC03BDBE919A03A4640A51D2383E8345CC065788118E63546401E934CBE65345CC0CE223C74893246409F268D3950345CC0069159309E2E4640A3A7589B08365CC06A92CB10442D4640332EB6E0BA375CC0E858E8745B2F46404C4AC3A5C9385CC030A9C3F948324640805CD7CC0C3C5CC04AF567E01E3446405C958D540E3F5CC088C765CABF374640958D8BD8C4405CC0B752F30C073846401761DB186D405CC01088D54FEF394640E989A2BE4C415CC06F627BD6AA3D4640335CFA5E7E405CC01CF674BB5B4146403BBD41A96B425CC05C442501384446408DCBEFCC89425CC067EE87A534474640CA40E37950455CC05B8F8B4D954A46406E6A6E7979435CC0599270B3E84F464052F1FF63AE445CC00BFA019F7756464073AA864B55465CC05434EBC513594640DD516B4E82465CC08A0450CA8A5B46404146BBD527485CC0CC1E6C72625E4640B6C1D47AD9485CC05A6239D77661464048820BB4614F5CC0547EED66EA67464004D20C3775505CC005B54C08BE674640C34F254165545CC00B8D1287DE63464032DC37E6CC555CC0A4742147B6634640E8DCFCCB66565CC0742AE3685E6746405EF3F9DEF75A5CC000918CABB66A4640ACC81746845C5CC0FB0E326DF56C4640675A9397C15F5CC07C030F3520774640FDB6A4B6305F5CC0661389F543784640112F4892A85D5CC025C9CE546B784640ADA42D90B85C5CC0952556F58979464082E16DD3395C5CC06897B1D8C47F4640FAAC6FD95D5D5CC0AFE51D778383464024187BDA255D5CC0A25B42758C854640B28B31A11F5F5CC0043D0E1577874640C1180EC35E5F5CC007DECAB31D894640C8B3B2A851615CC078018C11818A4640F1CE9589A7605CC0D9FFCF8FCD8D4640B678846F58635CC0E37F3D2CC48D4640860F6693C2645CC0002F9329118F46404F818ED494645CC08DF81DC83891464083B1B2B805665CC016D99DC42A93464084B5199C75665CC071415AC02A9746400E00C46351695CC0A9A7121A789A4640F03F5FED2A6C5CC0F473CC7092A146403B079DCE136C5CC0975783908EA3464087904F194D6F5CC03B6EA6EB27A946407394629F716F5CC0E90B530AF2B0464095787A069A715CC02D858F8780B44640CB67034B48725CC00E7533860AB9464093073E0C3A715CC0C17EE38625BD464010C7236F6D715CC03A577D26E7C04640CC3CA7D0FA715CC0D2D8D3A528C2464097C037965B755CC03049B482E8C14640CFFDC1B670735CC042FE13A6B7CA4640D6849699A3745CC0E8AF71A5E1CC46402669319D87765CC0B644D32306CE46400810C2C2CF795CC02B2FB5E086CE4640632ACAA3BD795CC0BAD1768191D1464089D2BB261B7B5CC03DDBC020DBD34640AC35DF074F7B5CC05686F940EAD54640DC63218CB47D5CC083DDD2DEF5D64640BB74BA4D277E5CC0CAD5F89E43D94640E19938319B805CC0691E7EBCD9D74640A21EADB145815CC03D1CC97B10D646405039CC0FB4805CC014FCB47B85D34640F9ED027027815CC0EB2CF1DA04D24640049D8EF39D835CC05C3DEBB704D0464077C4C6544F855CC0B0373C750ECB4640412619988F875CC0F5962EB21AC946404824CF7873885CC077CB97F072C6464017F746FD0C8B5CC02DCDC94D9FC546405D521FBF778C5CC0D40DAACB92C346401FBBE3E47C8F5CC04083DD6884C446408B086144DD8F5CC02279F98660C046406641B485C8905CC01BD2B6A630BE464014A7A34DE4945CC06BCD64E48CBA46407288FF706A965CC040B29D2250BB464077E875F4C5975CC014A9F4C02CBE46401FA96ABBD19A5CC035597A7EDFBF46401F0A005EBF9B5CC02EB71F7F89C34640F4B540029D9D5CC06AE236DF1FC64640B766BB26C89F5CC0830F7E9DF8C54640F458F0CAC0A15CC038E799DD72C746404DB41D2FE6A35CC0C353931C3DC64640A2FF750D9FA25CC0EB87B2BF56CC4640F29A19B123A45CC07CA88F20E8CF4640A40355891CA05CC0D2856BA381D346401DAE0C6BAFA05CC006E4578447D64640F5DF9809D89F5CC0E29DE225E2D84640F12A2E0F3DA25CC00BB892268BDC4640C7BA8570AFA25CC0219CAAE77CDF4640B2B11B1411A45CC0BBED374896E1464053A744AF1CA15CC093011E4DB0E7464056DFD14DF29F5CC01D0C3610DDEB4640093D09CB529E5CC0545C19B173EB46402E9815E85D9C5CC0F0F903B322ED4640F395B7E3149A5CC0509C819358EC4640D307374324995CC00951833579EF464001A70847779A5CC00713CD3790F44640FB4020497C9B5CC063513EF8F2F546402527EA47F0995CC0B0CD62FB1BFA46408B616889659A5CC0C2E43E9C69FC46409FAB3051019F5CC0F16821FCB1FE4640DFA38BB15E9E5CC0D952D2FD3F0147402CACC9F4A29F5CC046CFEB1DFF024740BFE0A3F4CE9D5CC0AB54CF1F810647400763EC962F9D5CC019ABE481860A47406A8A1C3B8D9E5CC019B79EE2BD0D47407419CA9E6BA05CC0DE988DC2DD0E4740F875E96136A15CC03FFF19836A1147404312D6829DA05CC06796B844261447404704059FE39D5CC03A6A90A5DF13474013D02E5E379C5CC06EED72C6A0154740D6F854A3219C5CC0FC033449311C47404A24F4E7429E5CC0C329E649341F4740BFDE23A9529E5CC0A6DB6E0A612047402ED0E38AA29B5CC03A1C0E6C7124474038ED5A193A9A5CC0E04542EF4A324740A0549BB968995CC0471CC24F24334740610B0CDD93985CC0797A2791CE3647406DB84827499A5CC0DC87E531623E4740E48B95E711975CC01C1CB9B3C8404740ADE8AA4868965CC0A4707CD4394247405A997FF2F8955CC077F73CB53F4B474014938916C8945CC051A68636B94F4740C858797B6B955CC0D49B33B6BD534740C4E80FBF93985CC05771CF32AF5447403FD7CB1F429C5CC05923F0CEA6524740502ECF9E059F5CC0722B8D4CD14F47400FC6BEC395A25CC099FE1E69A65147403CF4FAC517A75CC065B984A5845047408CA5F56B43A95CC09AE2B9E1955447407F368C4D48A95CC098E728C1E0554740C1D3FF2E0FA85CC0DA1E9221F35747407969E0F720AB5CC06236015C0B5E47406F7AFE18B3AC5CC0934080DAEB5D47406406C6F5E0AF5CC0B44A2619FA584740E1B05F5A1BB25CC023819237FD59474042EFA300C8B15CC042295155BB6047402F594163D1B25CC04D86B8B51D62474060A7E188CFB55CC0DFC33DD544634740EEA35D6D76B75CC033AEA6960566474083E72DB1BFB95CC0C4964DD653664740BF2705BBB2BC5CC091E21AFA1C6D47404DBE043E32BC5CC01E1FB99D0872474098C22DDE24BB5CC093E04FFF1D7447401A33DA23BEBD5CC0C13DA4606D7647400259DCCA19C05CC0C7E1DA43BA7A4740479D8CB063C25CC03A4D52A0437B47409E2853948FC35CC09DB29DFF967C47406FBA179C34C55CC0174EAF26658347409930CF25ACC85CC04379316C228847404E3E320984C95CC09E1AA133BE8B4740385FFD2C0ACB5CC03CEE01337D8C4740227744515BCC5CC09F991419E08F47406A241F82F5D25CC0E9D9D77FFB9647401B847E88D0D45CC000909012619F4740D7380A8BFED55CC023D7FD93A4A047406E937E1320DA5CC0FEA14E70BDA14740AAE741164EDB5CC0F6D976B11EA34740CC9B969F1FE05CC0A86494EC0CA447403ED8B0E179E15CC01E646EAF5FA547404B50A9A68DE35CC0D19F869BD4AA4740DFD4C8CB5EE65CC0015C13455CAF474064933DCFE1E85CC07C77EC46A5B04740F7057C92A7EA5CC0A196E1EB17B34740982EF45905F05CC0901D08B013B6474019E0CFBA01F05CC0ABAB25338CB747409E9B35FAE0EE5CC03626E8B6FFB847403DBFF354FDE95CC00984D6B97EB94740981F6BF429E95CC0B72DABFC98BA47409C815E15F8E85CC0191C9A81D4BC4740C65C2B5A56EC5CC0E8873744A9BE4740A4F64ABFE5EC5CC07558A5A4ACC24740525344848AEF5CC0722F050150C4474076C10B2B4BEC5CC0DE1361BE9CCB4740F55CEAAFB0EC5CC024A0B0BBDBCE47404422DCF5FAEE5CC0588F7694E7D14740E55F515FF4EE5CC095AFFAED07D9474030CCD383A5F15CC052F7DE84D8DA4740CB9BC32A98F25CC015E188DD56DF47408189A72E8DF55CC03D35C3D4CDE047405151FE525BF65CC07BC3053810E74740348598F5AAF75CC02F4FA5F6E9E9474038C649D8D9F95CC06FCE0451A8EB47408BBA999B05FC5CC02E1275ECFDEE4740B0C0EB81EEFF5CC02097BB036BF64740D9BF5EC79E015DC0DEC27C2083FB4740ED4EA46B6C035DC0D63C42DAF3FC474086F151458D035DC0250BD898AF1A4840D26846D8A0035DC0553AFB42D43F48409EE39CE510045DC0ECBE8260FE7F484087ABDF43ADAE5CC03D1CA505FF7F484052D62FC90F845CC0715F5A43FF7F4840AFB3288A0E0C5CC0716829BCFF7F484068877B6B17D25BC0C2C54B610080484018C82A100DB05BC019F9252D00804840DA6D5B130C605BC0223C1B2A00804840299BB90E0B105BC00656C850008048409A33042C0ACC5AC0EF57CB8F008048404B97317F09885AC080B6B0B100804840B38ADBC108445AC04275FEB20080484089FBC50B08045AC0BB4830E0008048403665192C59035AC007689262AA524840313951CB55035AC0FEA837EC0C324840F0F9F86519035AC089C0C7A902004840BF83C41607035AC0DBE707C433B3474023AFD075F0025AC0A198DE01BBAA474056AB463709035AC07F00751A4C524740F7DB4C39FD025AC069C534EF71454740E15A90C00F035AC07740C1ECF32347409735164821035AC016F26504B4F84640DCFAC0482B035AC0534C40DF07F14640FF8D2776CE025AC08BF3F9803F9B46409F213CB2C1025AC071A86117B87F4640D4AE2975D4035AC0844E1AB7A87F46405B1E10C9AC425AC08A54F540238046403D4ECEB070455AC0D2377E01FA7F464066815D885A815AC07EC3ECB2A47F46409116B14097905AC045B3C140827F4640846A0B6E3DF95AC02D5EC395F87F4640E3DF285D97105BC05018F9C5038046405536B53204285BC067C31A22B17F46408BF9312129735BC01778BC5CF07F46403A1F3AC0B67F5BC0E02593845B804640CDA075FA22995BC0A331EBF3D27F4640AE0AAD607F9B5BC01720F632037F464029C9F05F6BC35BC0EF062AF3727F464048CC60AC4DC35BC0553AF8050E5546404410F9C44CC35BC0460525DB953C4640D8765A6D0EC65BC0E8C05453393E464027FFE33340C85BC0751DC8CD1840464030CE2E5699C85BC0C183814E92434640AA772D3EE5CA5BC07789A0A8C84546407F05BEE070CB5BC0A8709A084D484640FC3B41690CCE5BC0399FE5A15D4946403A2927ADFDCE5BC0CB3C16C2204D46404C6CAF2A11CE5BC079F1FE051A4F4640172E008C55CE5BC023C48C863E504640AB74349552D15BC088B361013452464068D72B164BD15BC0A3DEA2243F56464019FD383BECD25BC0156D6F836A5746403A45A6BF30D45BC0E8F408C4435A46403C8C0A216ED45BC0CF8E2EA62A5D4640181AB10666D65BC0D640F562F35C464030BE64EBD3D75BC04F8AFE025F5F4640D04C752DA3D85BC02DF717C16C5E4640999F980E49D95BC05E84973CBC5A4640FF78E27764DC5BC0425F4C78495B46405167795D6DDE5BC0218DE173E0594640');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('28','NDEQ','NE','NEBRASKA','F','946','0106000020E610000001000000010300000001000000C4000000EFF293BB125A59C0F74D97E32000444032FF015C4C8359C021A1CA8DDCFF4340C8C921FA0A8359C06BF35AC6DB2B4440C231B6360C8359C06544738E2D37444081F8962DF28259C07F503CC24159444062352BEC018359C0F9DF11E51E5F4440D50628290E8359C0018233C9C07F4440E0F3F7ACC2A759C010CB0E0A078044405FB512CFBEA959C068095E88C27F4440A22BAC5C82D859C0EB83CD5D0A804440E3D377D4A0E459C0DDD3F87AF47F4440A446B2244F035AC038CE873A69804440244A42F074035AC0E437B6CBACB14440A0A41D528D035AC0AAAA767038C8444081D35B6E6E035AC06D9039375FD944400FF89DC36C035AC0D5F523F3F9FF4440278A1E1999035AC0D692057FAD4E4540D15E13C398035AC05EA8BB58648045407162CFFB17E059C0E75B06BED27F4540F6CB724260C059C0A3207CD4EA7F45402EB980E474B259C00C63AE1B667F4540861EFF818C8559C0BF80209EB47E4540843846C8D44E59C09286B9DE507E4540E59D505CAE0C59C0F540B833DC7E45407A0D8D3C19E258C07EF900D5047F4540AFCB861241D058C01A372A9E067F4540201F2885D99F58C0F7ED869BF27E454056C356C3469D58C094303EE2F4774540117B6A7F099958C0E1CF3303C7754540E7A8839ADC9358C09F18BAA6DE704540FA70D1ABBD8A58C0EB792110776B45405AC4BD88458958C07A632B52FB6A45405562D025E18758C0F8D34A16FD6845400B9282E5CB8758C08E12255878674540C162F0F81E8258C0938BE6E474624540B213C173B07F58C07CA1BCE726624540A5EFE6F0AA7D58C02F98294608634540CAB0F88D7C7B58C00343AAE26A6545407EFF41CBF47858C0ABA8F81B676A4540742FB4CBDF7858C02B90CE178B6D45406A7F8AA5647458C0548ACA56EC6E454069051083027358C0838C2B99BF6C4540E2A2CA806B7158C01362C2194F6C4540AB06467E6A6E58C0FFC0FC37D36D45400537595CE36B58C054BD97791D6B454075CA625BA36858C0A539B6953E6E45400078F798856458C09A28C8F58A6C454072B81177646058C01A0DDEF3186E4540ADEAE413EC5E58C09AFCCC52B76D45403DC969CF435D58C088FC0752DB6C45403CBED063EA5858C0633D9C0C086F4540F3AC7536EE5358C0E682DF884E6E4540C2C56A8F5F5158C0B211C147CD6C454022B1FD6A904F58C075D4C0A5086D454001497F485D4E58C02B4E4886AC6B4540A6BC91A68E4D58C0668CF46802684540F8AC14C0544A58C062091E29396645408AF1C29B594858C0644FDFEB0F63454060507A0CF84058C0D8169FAC38614540EC7761A8B13E58C071FEAD6C1061454021A63387143E58C0DA3534AE436045406D8DEF67953E58C0EEF54D6F185D454031760D27213E58C07A19AD8F4E5C4540D615C080203A58C04376A04FA85D4540F3DCF955D93358C04CB45C701F5A45401F902C35DE3358C034EF6E3036574540D7A18F73283358C0E9B25830C3554540E3B67B0A402E58C09206AE6B945545400043FA66BD2C58C0E4645108305445402D4FF845742C58C09F808AA71152454058CFF307C72D58C08BA919AA9A4F4540A1846D27B32D58C07702B8E95F4E4540294F873DBF2858C07FF6AB607E464540AF86755C462858C0FEE069A0E74245409B03DFF9BF2658C0B165671EED404540B320F8976C2558C069226B3C5742454057EC6C94052358C07FF8B9B89F42454049577830A91F58C0F5D51CD5853E4540A2B6100B1F1C58C02A9ACF719F3E45404D3BB147591958C01569FACDD33B454008EBB908771958C0C821EFAC8C384540B80F2B6CBA1A58C01C4AA96D1735454038E3C64C5A1A58C032A4BBEBC130454058029AAF251B58C0DB8FA42BB52C454063516B2BF21858C07C8695C7152A45402B9855C9981758C0E50111A42526454099BA8FC5F11558C0D46BB6401B24454019821C444A1558C0FE20B1BE5121454082BBCA039D1558C0ACF88EFC601D454068D83FC7431758C0BDF661BE651B4540C27D2BE2891658C076E3A71987154540BA0D6C743F1258C05644444CCD0F45401053F2ACFD1058C09B2F4A4142064540651D2847470F58C07E2AC1DCA3034540DD5B53251C0F58C02AE2BD3929004540F973295FFB0C58C036C2DF1991FF4440DED24C9BDA0B58C0160A091A87FD4440F3EB31D46D0958C022AC093AAEFB4440893351F2550958C08E02F55A63F644409A3CB6F33C0A58C08D93803BBBF34440F83B700EAE0858C0E5D3CD5B6AEE4440996DB404E40458C0325A03DC4EE5444067D875465B0658C0CE92B47C61E044400AD4A3A6620658C0C20EFAE0A3DD4440BCA37CC5790558C05189EF053DDA44404AC0B229D20758C07CC42FE9F2D844401E089E69B20758C027C4AA6B90D744400B16E2075B0658C0439E0C91CCD34440345C03AA1F0758C074B82E3DACCC444059FD27672C0558C0552FB660BAC94440630C7E48E20558C05EF1242415C8444070D247687E0558C05DE2FC88CDC44440FFB1B304360358C0A65DFF691DC34440736C673F4B0058C09C5B3965B1C44440D419F01E9DFF57C0B7F456E698C3444075622FBFC9FF57C0FEE7CA6979C14440DC4F8561DC0058C032EAF36D1ABF444044999F01710058C04CCF8AAFB0BD4440E038C3FE00FD57C027EDFF2E77BC4440DED51E1ED8FB57C0C1324F502FBB44408EA7F8E129FC57C03E49D9FB88B244407CD4046558FC57C0F01AD0A587AB44402C307321E7F857C05E17A1EA93A64440E23C022372F957C0934AA4EDB7A44440A4686F2351FA57C022C606EA7BA7444042E2E5E588FB57C00EC9B8CBA9A64440CFB982844DFA57C07BC8CBD4D49C444051F4C02406FB57C0C7BA63F59A9A4440B8D80063A1FA57C03F6C6115D798444032377D1BFDF657C0D19EF4D41B9744407ADDB1FA06F757C07E7E7DD55B954440DF12839C1BF857C0F6F3C79504954440F24287F6EDF657C0C44AF5D6F98D4440737C2A563EF857C0C02C31786E8844402516DBB102F757C005771BF97A84444038ECF1EF18F757C0DBA860DA5680444014CD7D4A9BF557C0AE84D57CB47C4440D631C7E389F557C0000E2E8257734440FA0FBEC066F557C0999E5004666F4440B8DA66002CF657C094176B26966C4440442BF6BB83F657C02A92F8EA7365444087D0707A1AF857C0ECAE8FEF7E5D44407EB453E626F157C0BCE4EEAA51524440238F67A37BF057C0CC40A2CB794F4440C2B7C5621EF157C083708CEC654B4440D25E89BFDBF057C0777FDCCD5C4644409580CF992BEF57C02D1815CF244444409D84D5D04AEC57C0FE38D1AF164344400222D692FEEB57C00D6D226ED4474440DC2C1C913EEB57C03310A54D6D48444028794CAE6DEA57C0E07D726E8447444087EDEAAA1DEA57C04A7AE0EFE1434440D70E6E8ED6EB57C0323173F08F41444048D391CE80EC57C0C80C60901F3E4440FD93009FC1E857C01B5831ECBC324440E192BC7C96E857C0E2A3D929ED2D444019BB48D96FE757C0D8CFE7075A2C4440FFE6CC388CE757C022622BE76B2A4440CD73DBBC50E957C03AFBE0A84229444082E3409C65E957C0F3D145E890274440733E33341DE657C0D18826C4A6274440318ECE4A04E357C00D96B95B132244406E0FE24084DE57C0B98ADC94091D4440C878C95FDDDD57C066D359F54B1B44409E98663F80DD57C009C9F9794516444006AACBDB09DB57C0A09095F9DC104440737DB5D823D957C0366AD0F6C50E44401FFD16589CD857C0781122D8340C44406344309AD7D957C0974983DD490A4440EBCD961B7BDA57C01E818E83280644404D4F5A79FED857C0A28726A099054440C9849C77C2D757C0F184611EAE034440F9EF1D9515D657C0EAB4E65932034440404305B2C1D357C055153F96ECFF434061589DD319D557C01784805A0DFF43406DD0FAFDF6F157C0D123AEA92AFF434041F27F8A140058C03DFE5D5E61FF434067016BF7650F58C00A6A39E14BFF4340735792F60E1D58C0B694930D41FF4340CEBD6F784A3358C0D00A14FD4AFF4340EE571262213A58C01D98FCFF81FF4340D06E4890295758C08DC89727AAFF4340BAC5D5FF427458C00EF37320F7FF43402DE48F617E7B58C083A7AB4DCDFF43401DDC7817E89058C0F7FC01B6CCFF4340BAE8E86249A058C0FADE0AF2A1FF4340285212D71EAE58C0B5218194CDFF4340317688D024C458C028DDCE89C9FF434097DD57A567CB58C0739C2324F2FF434000D91AD92EE858C0DD7FD1E7610044408543460A940B59C0BBC0B8AF0F0044400E7A562C3B0C59C0E7CDCA2F13004440DABFD70C0B2F59C08C6DE4E0E4FF4340F4C9188F4F3059C0468E6D7F0600444080123B159E5459C0CE6A23AC3B004440EFF293BB125A59C0F74D97E320004440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('29','NV-FP','NV','NEVADA','F','947','0106000020E6100000010000000103000000010000005400000089FC55BFC1C95DC01B0CEAE4B5344340B56854A167D45DC0CD43A94B78434340DD15990ED8E45DC0C087A7F5F8594340CA0722F9EAF85DC0326DC5560C764340D728A740B2FF5DC0E535B9DE3E7F4340B7982D8AB0FF5DC0B7F6527C20884340CCCC7690A6FF5DC0DDE11DBA958D4340512235B8B6FF5DC0B01E65B750944340FFDB5F10B3FF5DC063AA96B8E0A743407A91ECA6BEFF5DC0522E0EA4C4B84340A955402CC1FF5DC0C85C95F93CDC434060439CC8C3FF5DC096C5C37DBA964440CA2388D694FF5DC03300A8449EFE444058C00A2082D65DC0609DCBBB92FE44404B07C379E6D35DC0397F09FD9BFE444042B4383BDC8B5DC0F390C8CD91FF4440D746DE1235415DC08E8F9C6A55FF444046DBD00F823F5DC0F70C386D55FF44405F5D5392A4FC5CC0F11816094FFF4440AC0D965A97C15CC0B048D0858DFF4440CD21F3053F915CC015942F727AFF4440766C922A80825CC033CCEAF768FF4440B90BFF1171825CC0C0A7C733B47F44408D5D6F5D70825CC01ABCECC6360E44400056B9D08C825CC078E4C5DD52F44340B020161691825CC02E5097A0F3C44340B6F16147D5825CC0C8506956E9564340034A09C2E2825CC0BC7AB9A4194943401B0E6D8506835CC0FE035B989E1143405641475106835CC02B6D65F19ACC4240907D1EE7CF825CC07529028E8E7F4240D816F03FCC825CC08ACFBEB4C16B4240E1ECBAA164825CC024274CA3A61B4240BD0A5A02E3825CC09B576B44D4184240DF71D0C9E5865CC002A54EE67F0F42406ED7EFE941885CC011EB946C57054240BD436DB33B8D5CC0134FC06C3502424029B80637F18E5CC0359508AC58024240E15FE183AF935CC08B453141F70742409377C26472935CC0C275765E260B42403DCB15E83A945CC0FAC3099A430E4240CEB6BDED07965CC05988DBF39811424066AC11145F985CC09ED96FAE5313424059B1509B699C5CC01C5A8DAC7E0F4240C02BB3FEDC9D5CC06742F889F60F42401D1EDFEAF4A15CC09E85DCFED9134240812466F454A65CC0352C12FAB4114240D23E6078C8A75CC0D7B1D1F62B124240C4A83FE39DAD5CC055438E92760D4240F102B4039AAE5CC007B215D4000B4240F4170661A7AE5CC0041F113885074240DF5F0C5DEEAD5CC0E731FA7CB40442408EFF101B1EAF5CC09E20DC426BFE4140C577C6EFC0AC5CC0E2582EB3AFF4414001BF16A857AA5CC02D9A955BB3F04140583571C765AA5CC073FC3F9D7BEF41400F7741C926AC5CC0E8F5C3FE78EC41404E04E001B2AB5CC0E1500DCDE1E14140BC5EAFA015AC5CC00B1D55B2C5DD41405C045EDB90AA5CC04FB1157BB7D841406178D979C8AA5CC07AC2ADE104D441409F3C4337DCA95CC0611E5B44C3D2414095AF9993F3A85CC0B3648BAB40CE414044E6E1F3CCA95CC0BAE78CCFDBCA414069B9813196A95CC0BE3EE536F8C54140EE46AB9205AB5CC06583863B04C2414084AED52B4EA95CC082B9CE87B2B9414003D5B6BFBBA55CC0DA63A75ADFAD41403B0FA4FC9FA55CC079E054A402A74140C37A7835D0A35CC06955A2F32E9C41407ED61614E8A35CC0E0D9B0F950964140862D88D49FA45CC051FA71BDED91414013CF8F9549A55CC0CF16C4BDF790414083074E9B17A85CC058A035DB239141400072EABBB2A85CC0F1BAEF1C308F414043F6A2D51EA65CC0CDEF5A44BC89414065B069D98FA85CC083DB3BC75B854140F75E8596BFA75CC0E3259D6DDC7F414006F8149E13E85CC027715771D9E541408EE6CC71B0F85CC04BCB492C280042400B830E62444A5DC00D9605FBD37A42403C4CE609AD755DC0607797BF88BA4240F7686F01B79A5DC06822909F7EF1424089FC55BFC1C95DC01B0CEAE4B5344340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('30','NH-DES','NH','NEW HAMPSHIRE','F','948','0106000020E6100000010000000103000000010000007B000000DE75A128EA1152C00E51AE43385C4540A3420A562B1D52C037347FBCE85C4540C54EE936941D52C07E238978985F454003D56138AD1E52C0D90A6AB67B6145401398871A772052C0722204D56562454022DF1B1BD62052C0D2F5B27306654540CB9F8E9D7D2252C0C7CA44D2636745401D42365F6B2352C07BF1558E296E454093B5DF7C962152C06DE3B68AD074454025B9713C4B2152C014B3B967D07945403A1DF7DA452052C04DD12147987B4540A541CC384B1E52C081F0A845F27C4540CAF60418421D52C093508403F37F45400593AA588D1D52C0B7B1D5DBF3854540AD45D0B7611C52C0169BF7F51D8A4540309AEDB7011C52C0786B91EFE18E4540790E1E19F41C52C02715B188F8934540A1FC08D9E01B52C04D91117CBA9D4540E5D0063BC11952C0F9623B5158A7454078D4F53B411A52C0ADA8C54E65A94540C5C503BD721952C04FCCF4CAEDAC45401E68AB7E601A52C04B58A0A645B04540738DC11F5C1952C0687D930280B4454070761B237B1852C0047D6C5808BE4540EC7ABEA4471952C090D4BC343FC245409AC4B765E71752C09646789243C94540479BA344511552C0A9012B7376CC4540ADF2E563751352C0CC894E6F69D94540746E46C0A41052C09CF954501EDE45400D88131C060E52C0C50D66B116E0454047A0AF9B300D52C0B5F0E48FDFE14540E119D75BD40B52C0E269EECA9DE6454017E412BFE20A52C0F77FED5F80F045407C4B781BC90752C040D2EF3B61F44540F57E38BC3E0752C00E3AE89636F845404F4BF69ADE0552C0087CE8739FFA45402FE4723E380752C089380D71FEFC45401ED0B3BE080752C077C32B0F9FFE454093F518FD730552C0E6F1A06B24014640F1B2E63DEC0452C001A9E4E719044640FF9A3AFD380252C00E701800AC0A4640AE0C179E130252C0C19CD1FD4C0C4640104D37402B0352C000D96E9DDB0C4640962385203C0252C05631519A740F4640CC7F60C4DC0252C0F8C18314061446402DE3D847CB0352C020FF369051174640C104B14AD70252C0BD31BE28001E4640C06EE6EDCF0352C03FDA6CA37821464080F94D8E450252C076023FDD53264640C7086CCCA4FF51C099654519ED294640BF79A80717FC51C02549265BB32946401CEC67476AFB51C0E7AB2EB9052B4640EBA906A06DF551C06C96CDB90E2C4640147E397F8EF451C06133FF98D82C464007AFD5FE0DF351C076DBF2922C3146409F84C67C0FF151C013AF50D1F93246405B14DA1252EB51C0A2A13D8FEE354640DABFE67002EA51C04D60D96B56384640A4042B1174E951C0B3F70FE60D3C4640FD110850BDE851C04D02C084053D4640F56B116D4FE751C0E28D5CA5BC3C4640ACBE692A8BE551C005E6CA014D3F4640371D5ACAD0E451C040B4F8994D4346402B87F72CDAE551C0F5CC3ED6F9444640F53ABE0DE8E551C0AE89C6D28D464640E72EDFC75AE251C03F20796B1A4A4640849DEA6A76E351C03ED3B5065D4C46407CD98C8E5AE451C04D0A99DB975146407E3BB211AEE551C06E6DDDD746534640CA2D5E35E4E651C00A4AE030C4564640AE76177B64E851C0C609BC60F05E46403512851558E551C024DA09BABC634640CA2AF573CEE451C04B955156736846403F8F914868E051C0D746B36C28734640DC60272916E151C02A3F1409CB784640938ABE8C9EE251C0F2AE1106007D46404055030558E051C0DEC53B82B58146403E05CF2131E051C05297627DAA874640519BDCD58BDB51C0BDE4B29AF98E4640A3E105EEC2D951C0E45E4E74F5994640026ACB7094DC51C03644C6EE379E4640A31BC66ABAD851C04931DB32129E4640DFA401E905D351C0E10E633591A54640B38A6937CCC951C04D56CDC6759E464089BE66C099C551C08F56EA8A96A6464032FB13A6D6C151C0280E2DA89255464074686BD88CC051C044600E5F1D244640754B6F1B01BF51C02AC2F6D844E54540098368F453BE51C08B1C08B931C94540569118B237BD51C08481A1DA35C845402D060791C6BC51C05763B51C44C6454069114392B6BD51C06C09743E18C44540FF5C3CD164BD51C030F8710019C24540B746877121BE51C04A75C3E32FBC454047A7AAEF88BD51C0C986838614B84540C06AC390A9BE51C047539927B6B2454091E5F68E0FBE51C01D40EE89E5AE45404AB45BA5F8B951C03EECE434AAA645400EB12464ABB951C07B37C476F8A3454021B4F7960BB451C0947617C71B9E4540110B79B327B551C07E534AD15F944540B20E160F65B451C036999A78998F45406FE884B79FB851C028B579B0589045405A1826F4F9B751C0336031D6FE8C4540714B4D56F2B951C00B45F735C18A45401ADA2252BCB851C05B90967C89874540DDB2D60BDEB351C055611C9F7C8B4540B9819E21FCAE51C0ECB2188B85874540AB95329F16B451C025602AFCFB6E4540BE81062362B651C0537F0BDA846E45406A9356A97AB951C04D828433857145403FF1D92BF7BA51C0660D09924C7145409C1F0195A0C151C0C9F9202FF36C454080377D3632C451C0C802C7F2F3664540DFA796FBB7C751C0FC0B486DBD684540C6E81D8096CB51C0477E122B56674540CF72F31DEDCB51C0A03C30B58F5E4540F6CAF70264CF51C02EB35ED12C5F4540242FCF8227D051C0E077ABD3EF5C454057BAD26461D251C02E26A5D66B594540A8A65108A9F951C0866CA2D8495A45405B1B2FAB88FB51C0B9918DD6855A4540DE75A128EA1152C00E51AE43385C4540');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('31','NJ-NJEMS','NJ','NEW JERSEY','F','949','0106000020E6100000010000000103000000010000007E000000357FD55F50DF52C05ED3727980DB434003C9CE5C76DE52C08ADB8BB92BDC4340DF1F239B62DE52C01C84765AF4DE4340B146D81877DD52C03A74E8D8B5E14340BEDDE0925EDB52C0424CA8769DE343402827D62F5ADA52C08523443517E54340EDE06EF2E8DA52C0457B2D1445E64340870340C123D652C075DE06319CEC43409D4688483DD052C0D5C82C953AEC434071266EC6CECF52C080E43815DAEC4340B097D4F5E0CB52C032399AD54EF04340D0293E4B25C952C0A001B455D8F0434081937D09B1C852C04E0AF634CDF24340F8D01E0C6BC952C07403FA92A5F743401AEE9C8AF3C852C0BCC7AF915BFA43407453D4041AC752C052F9773004FD4340F5B489DF69C552C007E3FDCFE4FC43400BB68FDC5AC452C0F5D11A4F21FE4340A48E9758ECC252C073BB9F2CFA004440C709826CF1BE52C0662F12885C0444406432C96732BD52C084CC81046D07444076F4F59ACDB752C02E85D8C1FD09444066D64FB40EB552C097A0CC5CDE0E444095B76E48C3AF52C0D43958FCEA0F4440940F91456EAE52C05AD14E7B1C13444056096DE748AF52C0C6DAE9B6BF164440494A98D4EFB552C07F09054DCD1F444043F3E6B95CB852C018D99004592644402F5D2A1FF4BA52C0039BFE41322844407E1BED20AEBB52C0F04E9B1EB92A44400BA239E3CFBC52C0429C7D7C382C4440363BF20643BE52C058B85FF3C43344408F0973CA07C052C044FF17B24D344440C2F09F6C5CC152C0D9D565925E334440FA50B750ADC352C050DCBC2DC83544404700E1D27CC452C05C7E3B87663A44400490D35313C452C01BA7E43DB0424440391481361BC552C013B88B39CE45444063850D3CF8C752C05FC9D9534B4844404A5D1C82AACB52C0548BA43145474440390F6D04A5CC52C03088132F0C4944408DD3638462CC52C0F1E048EDB84A4440EF3B5926D3CC52C01F2818E8AF4E4440A423C806ABCC52C0EE585CA52D514440E34A6BE85ECD52C0A49E4E624B5344403C077CA6C7CB52C067FBF2C0BB554440D64C828924CD52C0EB4071DDD0574440CFE9F12804CC52C0BC55A858A75C444084358CAA64CC52C0944CEB94BE5F444062CFBC69E6CA52C082ABE7F22C6344408E632A2557C852C0C0C3F415E8624440EFEEF8426FC652C003726C165565444015B034A3B5C552C0121C235423694440A2CE57E55EC652C004EAC3B16D6B44402111CAE07EC352C01C9873B4866D44400144D7819DC352C059C807339F6F4440EBAB7944B7C452C0D7A3F96F3B714440858121661AC552C09D787FEDA0734440E51AB170ACC852C01BC41781417B4440C8031052EAC852C00AF8059F1F7D4440C36651B076C752C07C79BE1F0880444037E14D897AC452C0B986EA245F814440439DC5A341C252C0B23DF6269C834440ED5FFADD12C052C02F7AD786FF8744404F13A6B8D7BD52C0E9238D25958A44404989C2DB49BF52C0CD321225778A44406CA0AF9A03BF52C0C85EA482B88C444080C3B8B5CCBC52C011EA8E42518E44401A406D908BBA52C07B9863C00F92444014D6D48839B752C0012EE07B779A44406530204973B752C0EC465F59089D4440D05A9102D0B452C0853E12B62FA444402FF95E3ED3B252C022EDF896C9A5444073E04D9DAAB252C0A72C1675EEA7444010BAAFD2CDAC52C048825894DFAC4440EB88AA88CE9752C07F82B49C1199444032F96FD1828F52C0CB2985BF9D9144403763F96CA28D52C0681D8181D28F444027AFFB7D637952C01A7100D3CF7F44407BEC937E5A7952C06D2CAFD8FD7A444065C5A2802C7A52C09EC5213DB2764440E423ED82087B52C05E40C9C269714440045A292B887E52C0E40C6A0E146644408BC87D8F668052C060F0EBF66D5E444016C4374F658052C01E5387BC1C5A4440135BBD7C428852C05EF7D542D3524440C8B417DC648752C0D45F51F9515A444084483B1F668952C044A0881D765644401F834104548D52C0A55CC509AC4B44409DFAD8AAD99152C03B72C2B3D441444077B021E9359152C0F309501D5C3B444064B3D8435E8E52C000FF2E63C73844404022C2F8CC8752C0E28DF764C9394440923529C59E7E52C0E001B13F6C294440B75128C3828252C0F8245428090D4440EC2D01ECD98552C0844F82E4DB0E4440B4559A895C8552C0B9A4348A490B4440CD80EEE1318252C0CC8F3AEAB10B44401781A3C22F8352C0DEB0871047074440E95E65CED18752C002A0A2909906444077096C06F38452C09B3DEA32690544401EDAD7CC308A52C0357F5C2476F04340D4F2A4A8F88A52C01DC87E6CF0DB43407694AD13368F52C0FD88D5C3E0CF434026C6EAA2B19452C0F980CD1E3AC94340AE7A05E40B9552C07E29963B06C3434041685D93649A52C07D3C7C9C74C5434021CF99F1AB9952C0065E4B1A56C043408FE1CA7C779D52C0BD3FBEF59FB6434098C2A3DAA39C52C0CABF7D13C7B0434086481E8220AA52C00AF68EA7C4A443409208947BD7A752C075DC29880CA4434016E8CA3BF9A752C0B2511C261BA0434030D1B9BF58B352C06741A335608343401B25DFB045B852C0F951F231B37E4340294EAC5015B852C02AE18091747A434078D935C4F5BD52C0A90E8EEF617C4340E56A1812F9B852C0AEE1F2F8928E4340852E0277AABA52C04121FA7BD79543405F28A20BECC052C0E9CF56FC639943405BA1C964ADC752C039B122FBA39743402E8AC75F9ADA52C08B0A9F13FFAF4340ED673B7860E352C092ED3E2CC9BE43409FF43F6E11E152C0C7A28B5085C8434009C4A2B77EE452C0534D95F011CF4340357FD55F50DF52C05ED3727980DB4340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('32',NULL,'NM','NEW MEXICO','P','950','0106000020E6100000010000000103000000010000003A00000068E15FEE2A435BC02C0ED5E994384040E6006C4149435BC07F6FE34FC8634040145FC3D03B435BC048E026D7429A4040AF980CEC38435BC04419D43C43E44040DA7A80201D435BC04D585477BF4B41400435B529FC425BC0A447F5D8317A4140D4FEB9EA0F435BC06B524CAF92FF414076244D4C1A435BC052D6EBED917F4240F0D2B198D6175BC004F45AAFEE7F4240D9D734CA3CDE5AC098228DEAD77F424009D14EE24ADA5AC04F85B4ECAE7F424036CA74D3FBB85AC010F935FAE17F4240013C87B31EB75AC0BFD1F2FCA77E42402828AC25389E5AC0CFAA509CE97E4240FEEBE3ED7C7F5AC0C68FBC58037F424008CB3054A96D5AC03D81F8C04D7F4240A53C724AA34D5AC08FE503AA0D7F4240DE8C00E45A495AC0ECEE776B217F424069824DB797FF59C09CF344C34A7F4240C35D39C1FBC459C0DD624F24F87F4240391BBD78DABF59C0C7CC02A1CF7F4240BCD50A6BD5BF59C063337BFC053F42402B8D2E11BFC159C01B14297BEC3E4240D63480008AC159C067C0E9082D074240C921C07A72C159C09771E09404DF41409BE4FC436DC159C041D38BB2D3CF4140D9A1ED75ACC159C0981A19A3B0964140B84886B79DC159C054E126E87D7B4140D0687B3673C159C05D658610675F4140E8188CB7E5C159C0BC9042A96627414024085AE820C259C053CB6F51C0E9404024FC63A87AC259C06AECA08C6DC8404081689B2AC2C259C099D8F3C75CB04040AFB8B53C28C359C0F881DBD6107A40407B959D56D7C359C0C92F1765FD4140407E9F359D8FC359C0FA6BA41BE50A4040809B2D0DBDC359C08D3C4C4842004040C1B45A7D48D559C05191B64B8C00404017622A37AFEE59C0BEB2D51BCC004040A43FD8E1CEFE59C0CB58421BC50040400B085D293C015AC01E472299F2004040786C33E677365AC0C82123FD6A004040DC89DF0A073B5AC0E2D1A2978F0040401D1C101735805AC01BC3885436004040EE55547F37985AC0E3EBBA7A1800404006038A7BE9A75AC07D238CAD23004040CC48189D9AA95AC07A20B1E3F6FA3F405FF0F69A7CA85AC0F93F6168E3F83F40B5FAAD578FA85AC050D02B8602EA3F407B3B6D9738A95AC00758062F2CE53F401F5B14926EA75AC089B569EA40D83F40535686F05BA75AC0DA7455985DD13F4003D50E6987A25AC064B24F4D4BC93F4026C808F725D25AC0969BDA34FBC83F40458CF720020D5BC04B96A67D72C93F40BDB6D4407B0D5BC08C7413CA06583F40C1234F5BEB425BC02C51FB89EC573F4068E15FEE2A435BC02C0ED5E994384040');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('33','FIS','NY','NEW YORK','F','951','0106000020E6100000040000000103000000010000009C000000951088D7D8F053C06CC0FEC537224540833E59D46ADC53C0710DE8A2AD3545400510B36AB6D653C0EA15A2C1293F4540C63C9E591AC953C0031FD20A8D494540CA65ECD4CCC253C090E10EEB80594540B9635221FDB653C0AE2D31AC78654540364D1475F0BB53C07DEB799DB37C4540F80C51AF7FB853C0107D669DDC82454063627AF83CBB53C0FE93713987884540C201C64DE9C353C0DEB9CEF1988B4540C839674E84C253C0131644D086924540079C39B9FBC353C0A3D16AE854A24540F4ACDAE2BC9D53C03986217C9DAF45404A5ABA147D7F53C0CC58FF0CCBAE4540AE449733AE6F53C0A49033DAE6AA4540B33F1275D86453C07DC5B808EB9E4540179372F1255853C0830C728F4AA34540B388499E873A53C0ED78A808A9A345409763D136282F53C09D2657AEDEAB454073D76A70FB2D53C0502CEA8F66A94540AA990DFCA72753C0DA7AD3F402B54540098A5014191D53C029C130A017C04540C84900C7410E53C061C2A782EEC64540B7AF5200D00B53C00FB5539C0CD145402F6928A3290D53C084960BB762D745409D9692065C0F53C000F54073E5EA45403CC521E2650C53C07428AD7BCCF44540F23FC59D420853C024DAC69752F74540B28C6B039C0853C02E37507CB1014640F979A612E60C53C084CEBF846508464029A45321001353C04A150ED16005464074912671391753C09F0EAFE3960C464037A9FE1E46F652C0D780F620F4314640304947D88DF052C02C42F5893E4246406CCDB1140CD552C0761C7BB2C2674640FF6A0C68FBBD52C013DF848C6C7946400B4535631CAF52C09340D1E0177F4640CE46D4E4608152C0AB0A1416D47E464039C130F30F5652C0B2E1BE27C980464072173AD3725652C0C3C9424AB17D4640C01F59D1875552C0AF97B7905F77464077B8CFB6775852C0348BE616896C464041441B959E5752C0E790F8DAD8684640DE6A1E11EA5452C069D089404F6646405F6391D4E15752C09F2B6BC7B35C46402E2301F2EB5652C0B3601251165746403F21DFD2E05752C0513D54B4A4544640A40ADD51B05752C0198C8D5932514640DE3E86D26F5852C0053EEFDB554F4640FD336A50C35752C04204BD24224A4640DB261A8D425652C08B694C8AE84646400FAC5CAB675552C0733B408CAC45464031E03CC0C55252C0CBC5E0BE6737464073FFF61E335352C04DC5A182E8334640A196843F1B5552C0422689A6062F464065949E748A5352C087BE7B574C214640F3C2D637265852C088125A7AC21946406EEAACB5735852C00F4F5B9F071646405B2B01751A5A52C085685BE36F1146404BA56112295A52C0A909A368A50D464072AF2691DA5B52C0D1327FCD2D084640BB41946FE75B52C0C09BCDD0D80546402E0E25CA205A52C06586701855024640E34733C8B65A52C0AE15EC3C7DFE454020234E00F15952C07119266A18F5454010D78DFA015852C007DA7FB167F1454015721B949F5852C05574FC1DFAE6454059DA4DCFF95652C07BABE483A3E345403DCC0BADD35652C0466F7DE7D6E0454011C7524ABE5752C0688A6C906DDB454067621FC6115B52C04A28D022E9D0454020489EC0C55A52C0494F2DAF8ECA45407CFAFADCD65852C02D5529B3D9C84540ACECBF9F465752C0E0773E48B8CE4540D11D191C6D5352C0ACCD8CA7F6CF45404E36C19AD25252C05BF804C950CF4540759A92F7075252C01A9F828FEDCB4540E192A256A65252C0932F53B39AC94540D9D91F93A35052C066762DD799C745400024DCCD414F52C00EFEA281A4C145407C7AC12B015052C049527B10CAA74540809C1C12AA5152C0A748D58E5B784540961BE7B0E45152C04164AF33266B4540313F0072F45252C03E61D0B4DA6645409C3E96CE3B5152C0F9328678AD5F45405E68460D845052C05F21AAD97E5F4540636764E7735652C03FBA2FD69B404540E3CBA3FEEC5F52C05F4C803BEA0945406FBF04A1FD5E52C070DB3B1F12064540886868F1186152C050D01F3435D54440B4BDA6F1F16152C0096F6853E9C24440307A4AB3D56252C093DF8819C2AE4440324B4C74376352C040E12E5D95A54440A9FDE087995E52C0E0931704FA9A444040182A4B6A6E52C007721868D88C4440F453409CD66952C0172668719D8144400291B83BCD6952C01E20F952CB7F444022381C32EC7152C0C60ED4047F7144407A48FA54F77252C031916EEC896A444083653B04DF7A52C00C20D24EC266444016C4374F658052C01E5387BC1C5A44408BC87D8F668052C060F0EBF66D5E4440045A292B887E52C0E40C6A0E14664440E423ED82087B52C05E40C9C26971444065C5A2802C7A52C09EC5213DB27644407BEC937E5A7952C06D2CAFD8FD7A444027AFFB7D637952C01A7100D3CF7F44403763F96CA28D52C0681D8181D28F444032F96FD1828F52C0CB2985BF9D914440EB88AA88CE9752C07F82B49C1199444010BAAFD2CDAC52C048825894DFAC4440817D6B3223AD52C03C829BF101B0444086C0475463AF52C061C6F3CD68B34440B56877D35CAF52C02F2E6B0B06B64440E9DC47144FB052C04B9B6E090FB744400E8C1F38BDB252C0CEC17C8607B74440CEA94BDE4CB752C01B04485E3CB94440657675414CB952C0E2B16CFCEAB84440AD029E0082B952C0EEECAB591FBB44409E5D9F22AFBB52C033F4DA33FFBD444090DA41C631BE52C0881AC1B0E6BD4440E189E1E7F3C052C0A67CEB2A10C544406922FD079BC152C0DE740E2A6CC84440E37696AC78C452C0A293AD885FCD444047779A0CA3C452C0DF9E6D6879CE44401D5D7CE848C352C076FDE18793D1444058073C872FC452C0650F8CC57FDB4440723E4265A5C352C0215050C504DD4440DD6C8DA4ECC352C03C4B4CE497E244407E966DC937C652C0C0CC12A4B7E34440A082F26832C652C0371AC6E30AE6444054E8F2251CC552C00A70410336E8444096744EAA89C752C0C6E1586222EB44408AC4D6EAFBC752C0C86A0C02B2EC4440E554CB6D7DC952C0DD9E71818AED444006E54B50F6CA52C0ABD65D6015EF4440F56349FB49D052C04EF9E93D37EF4440765625FA27D252C0AC0715154BF94440157A907EBDD452C092EDE50E0BFB4440E2D4D43E1FD652C00CBD478B15FF44402291F60280D852C0BD4D4226CAFF444000E0DEEEB3DE52C03E430DFA88FF4440F102F39BB50653C0A02E1693EFFF4440CFB76003480953C0D25E3472150045406668122E172453C0CC878DAD62004540DFEE36D46A3B53C069ECD30D530045404F62921CFD3D53C0988307AE61004540C96E1DE5386753C0DF88D3A5D9FF44409282C335AE6F53C01158049DA8FF4440929915A1128D53C092980C08C5FF4440F396D390869353C02FB4C303EDFF44406E90B054C9BA53C0EFB1EBFAFAFF44401A4099AACEC353C04D601FEF250045402EB4590731E753C0D8DD952A1300454039DE3408BFF053C035BCE4C465004540951088D7D8F053C06CC0FEC537224540010300000001000000240000001E5B0631247052C0FF5C266F1B4C4440B4E362A55D7B52C09FD0F51561474440C0F319B2BA7052C0E755C46B224F4440E86E7EB2F47052C091070E0987514440982C1BDC257652C02FC1B3668853444079254C649B7A52C00E57E9E9C85044402E16DCDF4E7852C06B0416F08D4B44402D40232E428052C0BD6425B2664A4440DD993431C68152C08E332AC7D55144403A4963A9287D52C0C41C6C17A45E4440355BD281897952C0543D10F0076644409EA58030407052C05C58C313F96444409F53196FF76F52C06BB51BEB286C4440EC6A3D164A6652C04E90723C9A73444051DE4A05995E52C096FCB9799B7044408069D7BB8F5B52C0B1DEEC5516764440644A2FBFBA4D52C00132F05555734440E8089ACF054952C0B7150458C7794440D35C657B5C4152C05E119D9DF57B4440FB00BBAE6B2852C029E8F9C09A7D444002FE483E4A1452C043BA1C5B1D9344409A115559FE1152C01EB10B993E924440281F3983AC1652C0DF7FE21F1B8E444068833868A51A52C00ED05B48558344400C4CE11C432352C0D74EB2C8AB7B444086E8C34BB52652C05274DCE3E0734440B8F36292781E52C0625E7D6BC77544402712DEDCC11252C0B7DCD00013834440F55FFFB1030D52C0493CE3218784444052763AC0ED0452C032F07ED112804440E32A83E71DFB51C08B053114DD8A44405852D4DCADF751C08E9C9F7789894440DA179704CCFA51C0F7B0D0D9E9834440544F02C15A2152C043546F4853684440D342D2AA0A5B52C0DAD43C4DA65444401E5B0631247052C0FF5C266F1B4C44400103000000010000000C000000D2D5707AC15252C009A9D74A2D50444087BFF619A25252C04D48F4A908514440F99DC152634F52C0E3CA58A7085144402E384BF5434352C0D4B63EE06B5644407B84853A1F3852C0679A275D615E44406640FC8C0F3252C07693B21ECF6144402D1DA609783052C09FCD247F4C624440E5BB5ECAE53052C0A16A78FF1261444032D5AB46343D52C06345A9DE9A5944402E3D6BD2FA4152C0C5FBAA80EE55444089926374F04F52C07C94A0E80D504440D2D5707AC15252C009A9D74A2D5044400103000000010000000800000086B5F8042A8F52C008E957B7C4404440AE34D7052A8F52C09783CD11DA444440F6FC6EA0A48A52C08A448085EF4F444073046CD6A98452C00E8B23E424534440A0964CD4C98352C0B132CECC044D4440D045463ADF8752C0C5D09314BA454440709CC4A0648C52C0C43D16185A41444086B5F8042A8F52C008E957B7C4404440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('34',NULL,'NC','NORTH CAROLINA','N','952','0106000020E610000006000000010300000001000000020100002B8D8DD542FF54C0C011C4869C7E414068BF02CF8F0755C0D357E6D7807E414050EA75B4B81455C0D18B1C859A7E414006F7AD149F1255C098BB95ABF59A4140D89BA58A740E55C0A691F0D27EA14140E90F0D447F0B55C0894A3B5DDB9E414007D166F87F0655C08DB057ED709F4140BE78916DBB0255C0D93C1979E6A2414049F9E929F80155C0FD842F1B74A541401F565306DD0155C012E697DAA5A94140FF1257DD650055C0A7EE6E9EBCAF4140B9DEC6BACD0055C0872875BC2FB4414008A48F4B18FD54C019CC8E464FBA41407FB92D023CFA54C032F3B80E00BD41409C06B85B64F854C06F9514B35DC14140ECF1C05320F554C0A9A7667C73C241409AD1024BA6F154C066005CA4BEC64140E0ED449A0EEB54C01A2CE4F653C841404DEBC8B047E754C046A941C131C94140A9E71928E6E354C009982C0C13C74140D04E1E1F5DE054C03C4DDC75A2C741400C9655B552DD54C05B9067BA76CC4140C7C4CD26C4D854C032112A430AD04140D1FF9E1EF2D554C092830E27A1D34140137AAB3517D354C03B79ECAD05D44140101BBF6F93D054C09CC5962F76D84140A9F2200F34D054C092F868EFB3D94140B548D52E99CF54C0B9750EAEF1DB4140FF8339A7DACB54C089FBC3534FDD4140CBEC02A52FC954C0615936D6A2E141403EA499418EC754C0EF8148B9C7E1414093CEF93BD4C354C05992F4C02EE4414013ADEEF028BF54C0D7FF866A15E34140DA0DF18F9BBD54C040E38EAE5EE541403D9FCF3107BA54C04C2BD216A8EF4140C2F9E3F87DBA54C0B60258B6C7F6414098B7B87855B954C0236ED23867F941407D3E68F3CAB654C07815A39D48F94140547F560ABFB354C0EED18A83E2F541405811AA09AFB154C089BA566774FA4140395E536C80B154C0197735E769FE41407EDB018CD6B054C0182CFD87F4FF4140A894954933A954C0A8669355A20642401A9F5BA82FA854C08EA94D17F806424026E9E743ACA654C09F652B1B8405424019DB2CDFE4A554C021AF2F1EE3024240B9C64A3DC3A654C02CA798BD770042400A59C3B758A654C019035AE150FB41409DCD72D274A354C0FCDFAD4865FA41406440AF4F6FA054C0FB9020CE7FFC4140A911064E679E54C0DA2CA9F123FF4140D763B44E219A54C0DE965494A7094240E9C6ACEBEA9754C09988B2B6A50C4240234EA643F49354C057A00F3CA60F4240B3B1803AC79054C0559D1D236C0F424097A2E610498D54C075D55D13D5124240BD4E5F83D98954C0CFA768ECE21142403423BF178C8754C0FFCE9F02560C42402307006FF78454C0C1DFC653D50C4240C75041834C8154C08D1E49699E1042401530097BB57B54C0EFF98B8AB8214240661FEFB94D7A54C0E76705673B254240E701BE71257554C0F4CAA609DA2A42400E9164A3BD6E54C08B4638FB2B2A4240869A6201656D54C035063A9BBB2A4240B47207A75F6F54C05C918571552E4240695B6E096B6F54C066795F092A324240A67C34EAAD6C54C0D84CE837673C4240EC2F24EFF76C54C06423A8AC7D42424031D9CD93DE6A54C0FDDDCB827D4B42403B0C6976165654C033D148AE57494240A46422B1CE3954C0FEE91A215D4842408A5E3306A13554C029ECF10223484240693A2405182754C009D4A7E159474240CBBF088CD81B54C01D147D1A8D464240E7AA8031100354C08A8337060D464240719BF94D860154C05C9DC7E6C745424072FFC1A1E6ED53C069A006C72546424069125F9FA4E053C0CD5FE02A1E46424050ECDB1AE0CD53C0010055D263464240B934255338C953C092B0F8D3E94542401F81E6AEF8B253C027703E1B97454240F4A89BE82CAF53C0C0E9DB5CEA454240C147398C589D53C0DEA135EB534542406D9C48C48A9453C053915AB2D8454240CD5A6AD6498353C0FD143B4CBC4642408D256E26827953C088A21CB9CB4642402F879674DF7053C068D7E101DC464240BF1863B9765453C03F5E77B6EB464240C0370DA8544B53C03C225F58394742406F18ABCE1F3B53C0B3F4733CF3464240759D6ECEF63A53C012D67D9CF3464240FB2B98610C2453C04EBE207C174742400377A897D21F53C069E58ADA29474240CC0B625A1D1553C069C4C5D9314742404D286B98210853C0FE07881F56474240CB1A2A4BEB0253C0138A75434F4742406408D5661A0253C045A2ED09DC41424023833E50CE0553C0244789E879404240377F413872FE52C060D356FADA37424058FACCD50AFE52C0EED63ABE273542405BABD79B140053C02991CE1AA43542404B65DA8EDBFC52C04D1ED1E8CC2E4240D7CAAA8E60FB52C031C4DC0032364240C3D590A826FB52C0ADEF280EF12C424091A07D112EF352C0F8442318760E4240283C0A4B1AF352C00401017B570942405F2D87FEB4F652C00ED935CD8B0D4240A1E0213E75FA52C027AEAAE15A1F424004AF080942FD52C070AEBBFA3A214240B7E91CC842FC52C0C1B96A16B22542405DB861378D0053C0B8A11FABED284240578140A23CFD52C0835BB4BAD218424025B88965C8FE52C0A45919D6BE154240CDACB656B30B53C0680FECE05E284240880F5DDCFC0D53C0DF078961FC254240F74F89E1300753C0E162CD92581642407460D8C50F0953C05DCDEDB4EC124240C996103A040F53C08BE57834EE144240A7496D051C1353C0E133AF0B711B42408B23D03E9C1153C08150EADC250E4240A0767777BB1E53C07E3B20E13B0A424045AF1CAFE21A53C08E7324A5850742408C7F2279732153C0A3FF062DF0004240F329ABA1FE2553C087D3AE485101424078D44A0B842953C0D66CCB5C6E0842407E03D007812853C0032D5982C5044240B567670F262C53C0775F67DD5E06424043ABA8BA792E53C02883BFEB17144240781FEADF0E2C53C0D70B32DAB7254240CCD9A131AF3153C03F7DC6D3E22D4240AF9DF5E51E3B53C0DAAA95AD4032424043F52DE96C2F53C06B6FD7775C284240328BAE3F422D53C0AD6888BC1522424071E255C2A92F53C05B290120F61D424093EE3C7EA93053C02FD5CC2C87124240A5EA372C612C53C02DA644E51EFF4140BFE2922D692F53C0795850A6E8F741407904B4C8992C53C0EA97D8C889F8414012AEBB282F1A53C0C016E1F122FD414047C47DBEC01753C0A69402575CF741404AA1F4ABA80D53C0B2B28D8C0FFD41407A4DE2CCB60553C0E23E52FC45FB414073B7CFDAA40153C086EB89B9D5F54140346F9FD7D50453C071659C38E4E04140EA47BDA9BB0253C02EBD54C88DD741406BEA9640AF0A53C0F8032F8D37D94140DAF0FD31AE0653C08B6A3890F7D44140C9612B84550153C0DCD3704BAAD54140AAA1C90F33FF52C04279D67D49F2414001CB01E354F452C0989BEC493BF64140D2C1E6CEE8EF52C0CA9CDC084CEF414009506BC1A7EE52C028E8CB112AD541402AF49CC6D5F152C078BFDE1218CA4140CAF4EF2308F952C08ADB6CF0D2D04140AF4836EF5D0353C0CEB9E75717B5414040BFFBA2990B53C0E94603E3BCAB41409EDBDB9EE61F53C01D0927104CB541407FAF9A42232253C055BEE991A5B94140A33A3538511D53C01060547696C041403A54191C8E1C53C05162553488C641402BF1A8AA302153C01FE10AAFF5C94140B9F35802801F53C03A3E40B25EC541404DEBB094D22853C0F1BFD1CB9FC24140C989430D382853C07626E17312B8414030B306331F2D53C0B48B54BABFB4414056D804D39E4653C0982D59D471C6414004607F14E73E53C02CD49298E4B7414010105F8C732C53C02934C144E0AC4140C55F48834E2753C06E29A381F4A241404BD93FA4D02553C0462A37BAF7A7414028500AA2992253C03D2131B2E4A64140BB3D04016F2053C0D96C460ADD9F41406BCFB385F12853C0DC2FD5951A964140C5DDFE44B62653C088C8D9C8C19141402F74C888ED2753C0CBE261F941884140FF33EAD05E2B53C0DF89E78F1A83414031BDA311583653C0717027A0BE7D4140FD1570E43B3C53C0D57A30FD87834140EF4357A3583C53C0263AB022FC884140F32811180B4353C0761929FBD08B41401EC248A1AD4653C07DB5FD59488B4140D10F46820E4753C02F15AB1779884140E5BF40110E4053C0E694F338CA8641403A1BF3DE6A3A53C0C0E71A7EE377414016B8A78C632953C0BE02500908744140D5A60D91DC2A53C0C5BBE8282E7C41402A9E591DE22153C095B7872CC67C41408686D48C751C53C0E8CAB53527824140619921E51D1B53C08EAB66F723794140415C3716461753C013DF133FBD784140CF01450E0F1553C05704D083F17C41409016224A1E1453C0AAFCFB2478794140F88FDD090D1E53C093D63C3382644140C01BD464FF2753C073F6AC2E265C414017CF1576364353C09FDE146E7B594140EF95CC27834953C07517FBE6DA614140E57D8DA2424853C037F38990B0574140B3D12166004A53C0D9ECB11395544140DC1556F0736253C0565B45BC843A41405954BA7A886553C0321D35C0E6354140E5BF7BBF006753C0C7B366FFB437414012E8483E8C6653C0A2954D81D634414050DDC7BE037053C0C62B0C4B11274140561F8C524D7753C04D163C36B118414003E15E16397953C0262AC484E0084140B4B2763B4B7B53C065934B65F60741408F66B4E2777D53C0B02479B63E184140C700B6BF537D53C03685AD8C12FF4040B650A48A358253C08F2EAF340DF54040509B36C415A553C0ACB70AC5EAF040402B57C8F1F2A953C0DC8AC3C073F94040CB3BD7A2C0C453C0F0CFC1AB01274140D3AB743A9ADC53C0046F74AC424F4140096EB9DB2ADD53C090F8232B2F514140458804C1B4EA53C0B191A84681664140739D7824E3EB53C06E4E9BC31767414011DB12F7DCFA53C0B7A373F86E674140104507DFCD1454C0347CAD304F684140027839E9EC2354C0EBC95F5C5E684140BB3346D6303354C0B81DC9357B684140C3927EB9443254C0DA2ACDBE6B784140969D92E3C13554C078E95AFD46804140F90F5BA83F3954C00D31842CAA874140A1D165AA5D3B54C091FA4880FA8C41400350DD338A4254C0C4769FBBC7844140B629E0B12E4454C07BB4AD2D878841409ACC83B1CE4154C0A48CC5B1828D41400ACB9D30204354C01ABBF666EA904140A2BB1C70244354C0AED38D036A93414024695BE6A55454C0B4DA1C68FA9441405F89D8AE2A5754C0BC52D9BFDC9441400D0C2ABAF87054C00884D74E5F974140261DA3E7B47754C040CC375674974140CCDEF754297E54C0B964107E1D984140685A8FCF708D54C0A55B9D1FBC984140D3750077CD9154C0CDE5B6BEF9984140F8F923DB849454C009E2AB4497974140BFE095DE719654C0D83A3948AD984140413E809F099754C088A378A96E974140F676BB00C29754C012A6074B67974140F55FA7C2EC9854C0A4E0806DAB9A4140694E5B48049C54C03CDD11F3B7954140F1067A8BDC9D54C032A2F11639964140D8E5111391A154C03913B078CC9341409EFFB5D878A454C084017F5526934140BA4838C6E0A954C0C29503344E8F41400D4AF6C9E5AB54C0FA4FABF28F8F4140EE81294D06AC54C0A4750396888C4140F5E1560F9FAC54C0FC45E456B18B414032620F5C5BB154C0F9E50CE6F28A4140CEF5A7B8CDB854C0ECFBF5BE198741405BD0F01675C054C07195F9091C834140449D8446CBC654C068C32C040C804140E9C5C526D3E054C0DD2155A6FD7E4140E94EDFAF27E354C00A2E9F25AC7E41403AB91C8A06FC54C0174EDE32A77E41402B8D8DD542FF54C0C011C4869C7E4140010300000001000000070000008A10F167B70153C0B06B8B8447474240480D6863E4FF52C06842C66545474240D778B71357FA52C00A22A4AE76454240F419C3312AFB52C08AC10B58B03C42400FE73AFB85FE52C08FDBFBB2343D42407DE752BD75FE52C0D2B7EC6C504242408A10F167B70153C0B06B8B844747424001030000000100000008000000E2519C52B4F952C081A2838D36474240BF30710E2EF852C07D5851EF2B474240B4F0205D75F152C00534EE935D1D42400EA48460DAE252C08219CED0EEE44140872B5C72F3EC52C0580B885167064240FAE1DC3864EF52C0EB6B1B6A76064240737CAA7E19F252C0C51C4473D81C4240E2519C52B4F952C081A2838D3647424001030000000100000009000000AF9518A969DF52C009493BC6D8D541409DC84E7C20E252C064BEC1B86FE24140D335349D38DD52C0C70D0FC70CCF414030408C3DA8E152C0B42BA632329D4140148F26F5EDEF52C0156F57FA51984140C0FF55283CEC52C0ADE9A6E1199E414033B2046159E152C0FDADFE5409A44140838F20BB66DE52C0DEAC174647C84140AF9518A969DF52C009493BC6D8D5414001030000000100000008000000BA31BA6E100153C08CC138D2E8884140171613886BFE52C0FE4086B9E48E414005D1828DA0F652C0D650042C6F9541406E89AA18DAF052C0A1A17C78A29841401056EEE2E9F352C0D4D687510495414084A4BFF7D3F952C0A63DC323FB9041404528D5EB280053C0DCBFF5D3E8884140BA31BA6E100153C08CC138D2E88841400103000000010000000900000027CD3791CF2253C01A94EE65434B4140BE0CE8B3812353C0C1C719822F4E4140EA78DDB0642253C0BDBBAB629A4E4140939876E9FB1E53C0C213AE5951594140B31CC6E0A41B53C041C3127763614140FE31F3D5F41753C09806B87C116841408CB20CC3631253C0EACF564747704140D56B2D86021E53C01336F6DBC258414027CD3791CF2253C01A94EE65434B4140');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('35',NULL,'ND','NORTH DAKOTA','N','953','0106000020E610000001000000010300000001000000A0000000D96E7E7ABFAE58C0DD68D34319F846401F6CE5F26FC058C0CCF0445B43F846400E020FFEE8ED58C0DBB4C564ACF84640E02C35D50CF858C08ED29428C6F846407B6E610AEC2059C0025146A25EF84640D8D36D772D8059C0B8353304A4F846400201A3C491BC59C04AD5717C88F846403BB3CA2DABBF59C06253287A76F846409735164821035AC016F26504B4F84640E15A90C00F035AC07740C1ECF3234740F7DB4C39FD025AC069C534EF7145474056AB463709035AC07F00751A4C52474023AFD075F0025AC0A198DE01BBAA4740BF83C41607035AC0DBE707C433B34740F0F9F86519035AC089C0C7A902004840313951CB55035AC0FEA837EC0C3248403665192C59035AC007689262AA52484089FBC50B08045AC0BB4830E000804840AB75758407BC59C0F5CCD7DB008048405D5CB3C76C8159C04E6726800080484031CECC2A076059C0817F90A80080484014AF7EB0060C59C037D3A3120080484043A8E9F125E258C0229E86480080484033740A9C06C058C0B26FB536008048405840AF06067C58C0716829BCFF7F484025312016AF4E58C0AB8A6599FF7F4840CDFEDAFDD84D58C0046AEA3346774840B045901E3F4B58C02D2FA84BD76F484075483F03F54A58C083048A68016B484015BF36088C4B58C0CDBC8B88636848403953EAA58A4A58C0249E0826BA674840A94C06E9214B58C03CF3BC0698664840AD87F9E6704958C0C13CB861FD634840A1051868E94858C070D47CBFBB614840737BBB2A774958C065811D40B96048409802D1E87A4858C0F04D4FDDA45F48403B10F3A9A04858C09DA33D5DF55C4840E2F72BE60B4758C0895978D9B25A4840E27105A8784758C07F02D2B9FD584840C6167105384658C08F7C73F656564840CB7B2C69E34658C01C020917A250484072C53C0C284858C0682CDA199D504840596F0F8CDE4758C095CD1B59754F48408871940F434958C05286DB5B984E4840CE9EDF0F034958C08803EFBA1F4B48400B7299D21F4A58C0336C3FBDB44A4840413A2672BC4958C0DFD3EE5B53494840A34CB394BF4A58C0B48F283EF8474840DFA42132624958C08628C93A57464840CFDBFD93444A58C06ADDD61CC545484093EC8D53F44958C0F841C03BEA444840F28473B1EB4858C04F933E596F444840A7ED58337E4958C03FDB4B3A4C42484092DB7B319D4858C029EE4A583742484033284EF4304958C06C2CBCF913384840577BD211A84758C04273E7F5F2374840C3B28DB2D84758C0B766AA164335484041997795B44958C0B89416DBB5354840244894B5964958C090EBF19A7A34484053E68E93434858C07729C19735344840D6B49F162A4A58C0ECBB5CBCB03148408F7E8A34A74858C08F08D558343148404866C1F48F4858C0D93DA398AC2F4840B9AA5316A04958C04DC13ADB7D2E48405901AF54644858C00EEE9958452E48402195C4D5C64858C0B1F9AF19BA294840494437B4344758C0D00C2E56F3284840C65DED157D4858C0E7F224D9CD274840D209BE14584758C06745CEF6DC264840BA09F634474758C0F109C0B6BE25484015DAF8555A4858C0EB423A59822548404CA90535364758C06DCEB176A0244840E0EC3255264758C0FA4C537691234840CB5521F7BE4858C0F2EB1D9ADA21484056B85B16EC4758C0189B49982C2148400AC070D8294858C0B5AD1D18E41D48407A100BB8FD4658C09C6927B5301D4840C85253BAF14858C0FE982179621C484096150DFA184758C04063DBD3921A4840C367C97B5F4858C02C219D36141A484095D6F31CC94858C02F8C2FD7F71848406197FCFEB84858C0AE3032D66D164840FA3DC5DFCB4858C05274867579154840EFB0239F6D4758C049549F71611448406282D2A1BC4858C07012A8B4FE124840E6DB3C21BD4758C0FB9BA071461248406B94C9C3CC4758C01E523630E50E484012CC8283564658C07AA113ABEC0C48404F02D625EF4558C07AAD050801094840086C88E54A4458C0EC7473412A0648405048A84D134358C06493BFF53AFA47402A99552FFB4058C07D6B036C7DF5474027B830F5504158C05F6DC8A812F04740C0120A94054058C0FB56DDA462EF47407A3748F68A3E58C078AFF2DDFCE947402AF1B019F83E58C0D2A946FDA2E747408BA20A184D3D58C0418EE038B0E54740F2A06518A63B58C0E6363393BAE14740AA97793B1D3B58C0F4A6457267DB4740E80E4D59EC3858C042B4792E43D647408BE7A1BAE43758C0A748BEACC0CE4740D5CBA0B88A3658C02957ED88F2CC47408378F75BF43658C04AB7D4A90FC8474022EDA11B593658C0C0CDDB67B4C547400073DE7E153758C0322C42CABBC247403AC0DADE803658C02AA21D4814C047404BC581C0773758C02AD097AA13BB47409E25C9DEC53658C0F5308C87E7B747409DA80200813758C02977DD09E0B44740DC1D847D663658C09CB8920558B447402B08EDBBBF3558C0577569C22AB14740E0E431BD703658C06F3A41C433AE474018F4495BA93558C01DCDAFA0CEAB47405195011C313658C031670EE244A847401B26D31A9D3558C080C0F6FE9DA54740B367EE3B603658C0EFCB1441E0A04740499E747A923558C0A481135BC79E474067AEA83AE53458C01E5AF5A6C49547406F7E8BDCB43558C01FAC59067193474043E676FB6C3458C0CD065672DA8B47408D29D5FCEC3458C00F5CF130178A4740F7FA299DA53458C0CAE6DEE457844740DDEB257F753558C0260DBA424F8147406C11041EC53458C0E6E6359E70804740292F0EFF453458C0A57BA5BA217C4740B449A07CC73258C0A1B088341D7C4740CA145D1E523358C066DF6116597A47409AE2629D8A3258C0A60E5BB35E794740EB72495E6D3258C03D6CEED2517747406410441BD63058C07C8C676CD77747408B32503B713058C073C543AB1D7647405E8CFDC0CB3158C00E051C50056F47408B4B52012B3158C02302B66D246C4740C0C98746053358C040149AB3F0674740D455A7C7F13158C0B2C0E46F93614740FD9F4D06053258C02AFC2D6D805A4740BA5046E6CB3258C0B1ADD10CE3564740D23D3663933258C0DE0FFA689C504740236F5742323258C03E9369E7E24F47408AFA82BF583158C0B4051E44CC4C4740B150AA1C143058C0CF266DE1574B47401A125D56612F58C0C9FE94BAA53E4740BACD19D2C02D58C066B8A5F7FE3B47402A0CA1706B2D58C0FADA3F73AD364740AC3C8DED0B2C58C0897E5B91C334474047015508BC2958C00ED096EC012E47401880FCE3592758C0C6227C6CE72C474095885762882658C0591EDCAB0C2B47400BB8A5A1482658C03ED4BF268D1E4740C8C28B7F882558C0100DA7A7921B4740C67C8FFE9F2558C0810AF1C790184740E5F124FC8D2458C0C0C4EAA8AD164740CBCE4AD6522358C0E413AC4A3A0C47404551F5B5E02458C04D1A934AB902474036982391F42358C02F0EFBAD4DF94640A1152771482458C05C3A45EE90F74640962ABA8CEE4E58C068BFFD51DFF746400E0CD560A37E58C06CA2552E25F746409B430A01F18058C0681138533BF74640D96E7E7ABFAE58C0DD68D34319F84640');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('36',NULL,'OH','OHIO','P','954','0106000020E610000001000000010300000001000000D5000000338FC7D074D154C051FB9B21FC4D4340429DEA1290D254C0EE9DC8A15E4C4340833939359ED354C0DE362321544C4340906EB23780D454C082AF55DFA34D4340E8C5C7191FD554C08EA4D9FBE450434081A6A560C5D754C055CF2CF7D65343403144910C08DD54C08DF59391F6544340D43D243401E054C08CE19B6B565843406D84F217B3E154C09C47762A1A594340A6F7718393E754C0CD5C6ECBC7564340E2AFF70487E854C07A4E37CD1D5543408D784D052AE954C02A10E0F0635143407A02B8E6F7E954C035609E52DB4F434024A47C096DEB54C0F8F1A7927A4F43401E8E71EE9EED54C06B8A44D059514340E28D6E564BF154C03FB3FF0C4E534340257181FA96F254C013B3DCE5CF584340EF91CA209AF554C082F480E11E5B4340B707A324E2F654C0961B777C595F434079D21B0C67FA54C03C1181D804614340D9D04C1394FD54C05AC057F3896343402AFB507C710355C0A8245411C261434096569AFFAF0555C02EC2540FFC614340E7D7CEE84F0B55C0E4EFAD85ED6443407008210EA30E55C082F0BF3D0668434014FF55100F0F55C089775570F16F43407D96B7D3BC1055C0708E5FE56F754340A7E1FB96911255C079F2D89DE678434038DBF05A0D1455C0CBD2A22ECD81434030B5543E211655C005F9CB08D7844340C6B8AE420B1955C0763BE14593844340DEF8A305DD1A55C066FCD2220F86434014280B673E1B55C05CFF3D3DD88A43405DEEA289791C55C019065258508E4340C45484CE7D1F55C0751E4E16BE8D4340D81433B0FA2055C0A1BCCC960E8C4340DA6540D6F42555C0C5C47D76FE884340B82DE878D92755C08509DB7497894340FBC5761DB82A55C0A58BCDD0788B4340ED4005468B2F55C0BC1F34252F924340F602092A8E3255C0D9C40047B38D43406299564CEF3355C07E5E9E85218D43409293BEF6F83355C04E5958A9C9A6434026B05137F83355C019BC9088FAA7434041EA2C24E93355C0407ED554AFC143405263E206E83355C0326BE0CF32C84340E0C92CAFC13355C00CBC28C0DCDD4340F5A529F5973355C03BDC6DB665F543408E6230986D3355C0578A1F72CA014440875D27A2E73255C0701EA464E52844408AE98F02DA3255C05A4039C4302D44408536B5A4C43255C057B04AC65B4B444025CB3D84C13255C0E18E214C4B5D4440D4902720A03255C025B7E0D406784440365307FF973255C0309D2BF7817E44408F5A5B59A93255C09AFAC6A566A04440FEB509589F3255C08198FB2554A444407F35B371AE3255C050A5A968C5B6444082D8FCCDA53255C04C9A0829E7C34440A31D4D8B953255C0D36B1B8247D944403E2814E6991855C06C7425E783DA4440C86E9E45FD1655C0DF02F506A1DA44401951DFCA97F754C054780DACA5DB4440A8BFD89FE4F054C04E1C3B0AC8DB44403373B968E4DE54C0F242C30ED1DC444005F038FBD6C954C049DFBBB523D04440F83F0B4138C054C01BF67F88E3C444401052B1E3EEB254C0F951FAA8D1C444401FA1C0A238B254C06F08C40CF3C04440DF91376881C454C08E6995CF61BA4440454AE6F12BBA54C0087D99D3F8B644409A25DE73E2AD54C06D78F5CBAAB944406A37252820A354C046FDB65917B24440FF667B36D99554C0079FB56D3BB744404F02E6AEFF8054C04039E7AEF5C144404F099EE58F7D54C0BB8C6DDE3EC044400B2F99A0436F54C03F0BC428DEBE4440BDE633DD9B5E54C0EBBCF711DCD04440F0D1F0572F5754C0B296FD51B5DC4440FB119946FC3F54C03B78F139D5EC4440E55E8963512154C01E5061D351FE4440FCA1AEFF722154C043C21A30E6EC444024D204FF872154C0061CA8815FBF444047FF2F9E472154C07C4A0A02A1BE4440FD1898BA772154C0096422A59790444097C371D3562154C0917190C2D9724440BEBEF7B14C2154C0856A6A67556D4440FF08B270682154C04912D4DF8F514440DDD1A33AC32454C022ABC33DD84E4440272A57A1232754C0C569513A5E4F4440A3843826CA2854C01279C9F8964E4440D05AC60CBC2A54C0DD480B7B834A44408C3169ADCA2A54C0E6EFF95CBD484440C4F152478A2854C02DD35BA304454440AD96B326042854C09D58E34892404440CE8DE962842654C0E3BBF34D823D4440BE9391AA2E2854C0094F0B19F9324440C0492F8B452854C082CB65BABF31444050B560E7FD2654C0C653667DC72F4440E06E7468B02654C0D7CE0608332744407D22A00B572754C0AA41036C64234440C98E5E749B2954C0D78EB06F721F444005AB347C6D2B54C07892A8F4D91844407ECEC661DB2C54C0FBFAE1F686154440915699A2EE2C54C0B0E55138B9134440616E324E3F2F54C0E418E0A390044440E4D3F4F0492F54C041693D8AE2FD4340FE65FDF9D53054C04EBBBBCD37F94340AFC17F9B913054C008FD2612ECF54340E8DB54FE283154C065824572E7F443407B78B803F23254C0660FCA4EBDF5434088D2A0A6B33354C0C2671D4E3CF54340DC9ABA08FA3354C031D21BCFD3F343407FD4F2469D3254C07B05ED15A9EF4340706D0A0A1B3354C066B2F816A9ED4340132930D1DB3454C0940F3C367AEB43404D6172326C3454C0EFCE295B8DE7434083F4D800BA3754C0E0B0707A47E14340A07E7921D03654C001B6CF3E40DE434075259460443554C07CB685C302DC4340A840B8634C3554C000BBA10409DA43405EC26C2D423754C0A99214C215D7434032005E12DB3754C0DB408FE2C9D4434087DEBE1A643854C0B76C62E4E1CF434052B757E2673A54C084B5B2C0BDCD4340320E1AE5AF3B54C00B45013EB0CD434069A00C10F43E54C019BD2E9878CA4340F82F8C9A154254C060DF5176A6C54340A358827C644254C0D06E27572EC44340A70E0DA5494654C00FC41FB68BBF4340A73DC5667E4754C0B47EA757E0BB43409FF99C6B8E4B54C033B90CD609B84340408019CDD14C54C0DB1B7D163CB54340C2B6F68E654E54C047F61C1545B44340A907FB2F354F54C0AE731D75B9B1434033BFDB552D5254C05CA7B9938BB14340157FC57DAF5554C05BD4683444AD43405B9526030F5854C01D1A18943FAC43408BFCE84CC65B54C04B9A698FF8B34340495D0A4FAB5C54C073C70D8F9CB4434060BC80B1C25D54C0212230EF13B44340C5E438FC996254C0D9C3F79025AD4340A2F0843EAC6354C07F2BDA7194AA434064A478DFA66454C080F1EF9509A24340430E41AFB86A54C02BE808979FA243405CBFD232216C54C01F6D53184FA1434046467A73AA6C54C099ECD09D299C43403C7B88D7466E54C0F625F25E4C9B4340AA44A0FC917054C0065361047F9643408FD6AC39A96F54C04D8196AB1C90434019FB7C5A3A7054C0BD44E2CF1F8C434012E9BBBE537254C0154D6491E3894340894F84C3737454C0799025B0DB8943401513ECE3C07454C0244C9F518088434075960FC20F7454C0D2F9E554A585434006754BBCA47154C038DDF37927824340E48BA5DC077254C0ADED6AC2F87B43407939DD79C97054C0AE70D72A1077434092A8B45C207254C02B5B684B37764340B03594C2B87454C079534A6467794340F6B90985D17554C0E3D1D7C50C78434005FC7DA8797754C01FE142EE5E714340629E1AEC217954C07DD0A44ECD6F4340ECB14B6F937A54C022A7988B357143400BB5CB71A37B54C0ED46CDE88672434015EC17CD827954C0E5F41E2453774340033C7691617B54C012B7A899FC7D4340E460CED2037C54C0D2D051D8DE7E43406E6E1778697E54C09235ACD61A7F4340A279CCBBFA7F54C0BB41ED12F4814340FE691BA3BE8254C095F8E150CF814340FD8FAF85BE8354C0B5EFAAB3997E4340E0571FEA708554C0560F0FD4147D43408561942C7A8654C0A6C2E236DE79434078B72C92EA8854C0A8B4B27C1F734340D23B75B2598954C0D0AD82655D6B4340EDD5E779A78C54C0EDFD51C7FD664340924F5E3CDF8D54C0890A5D49B46343401D05FD35C68B54C005DD6135EB5A43407EBB0636188C54C066251139C5564340ECA86D321D8B54C0DA98BBA0EB504340B6D868B3CA8B54C01CB47A042A4C43407054CF97AC8D54C0A5241EE3DB4A4340D1284461569154C0510B9A5B254C4340FC0406E48E9254C0DF1E331B404A43404525E5841C9454C08D2F9DA48C3B43402F427946119554C02668C4E4913843404B9BD2D0439954C014278B1DD83643401CD844948D9A54C02AD8E61A17374340F2B2ECE0AD9F54C05CFA6252F2334340068890070BA354C03C4763F143334340F8442DABD3A454C06E4CCD10B33343401419BAEC8AA554C0401AE16FCD344340CC66259247A754C03105B669803C43408C507C5ADDAA54C04290422646404340F04C585F84AC54C07A42B2A102454340BAE11C067CAF54C0C44367DFCA464340BBBC32EE59B354C0AF32433C554743407470EB71EDB454C04FAC75392C49434001EE7096A5B654C0900409D5DB4C4340296A19B90AB754C0871420AF81534340C1DDCE1C52B854C02DD2016B765743404AD6415DE2B754C068E29267085C43401A1945E0FAB854C0EAC94C44135F434025974AA4F6BA54C0ECCEAA828A5F4340C1F7C2293DBE54C0DB150F431D5C43400F62FF70B9C154C0493B4121755B4340E9B6D774E5C354C05507ADE2C5574340C1A3789B1EC754C030C85242195543409DDB6D5E29C954C081B90F86464F4340F87BB8E3A4CB54C00DE050450F4E43400B5A754DAECF54C0C87536E1E44F4340338FC7D074D154C051FB9B21FC4D4340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('37','OK-FMS','OK','OKLAHOMA','F','955','0106000020E6100000010000000103000000010000003C010000343DA6DA1D9C57C0CFDB646AEE76414021F368A08A9C57C066573668285E414001A6C5CAF79C57C0C55A9F5214414140E9E8455A8C9D57C0D6901D9A2F19414013238A4BFD9D57C08F918E5B3BF840407FE9061C829E57C04F42D30EE8D04040E79EAE5E0DA057C0D9B2FACBC3CF404081861A60B0A057C015989F29C2D040407DC839E19DA157C0C45BC16781CF4040247268212AA157C01683BEE751D240407FDC6EC439A357C08308CCE2FFD04040ACE09DA5FDA357C077CB5B005DD140404E43E965FEA357C09394E5FF4BD24040475C3064B2A257C05CB11983FDD240408B93FF84EBA257C04F2DFFC1B3D4404059D6BB27E8A457C04E7C059D7DD340405ED82789ABA557C024F7817AE9D340407DB0EDA876A557C03034737AC4D44040E37C27C72FA457C0B07D4A5EE1D44040CA26FA46E6A357C04C2D9CFE04D640402714B8A809A557C0EEFD0CBBD5D540407B0C90C975A557C0F87E9F99ECD64040C1A1A14A79A657C05806405736D540402B5407CE71A857C0F3096CB08DD7404099875CEEE4A857C01C5B41B0C9D5404045B033F028AA57C0B5E8E30CF9D440404DB27751DBAA57C007EBBA2A45D5404015D73A31C3AA57C0C1A8890AF6D54040BE1F440F40A957C0D94478EEC0D640405E1267D0F6A957C04560F9AAA0D84040E1F5A471CBAA57C07C5158C82BD940402509B6933CAC57C0138EA7045FD84040D24A64B87AAF57C0C0AA96B9C6D9404094A4F4D94CB057C01BF4E5D69BDA404036674B3882AF57C0022AB3570DDC40401A0277DBD3B057C09F54E795C3DB4040D101E6B8FFAF57C0B69B3DF44FDE4040F2314BBF22B257C096034253ECDD404054ACFB3E10B257C0AB8F233206DF4040415CD2BBEBB057C041AF2AB260E040407087987F28B257C0C7E3B2716EE04040F2CAFF826BB357C0C802EB31AEDE404040441EA670B457C0A6E66C10F0DF4040021EAF0DEBB657C085DD204FEDDF4040521AFB5270B857C0AFCA8C8E35E3404051839E9980BA57C0F5A2580D15E5404012B9193929BA57C079FCA9EDDBE64040FD4F3EFBC7BA57C06AA63EAD7CE8404095CA4C1F33BC57C00EF75DEC6FE84040606AD0BF2ABC57C0F9556EACA3EB404013E0A8C372BD57C059BA894B91EC4040C2DF99E502BE57C036A591AAE3EE40407E78020954BF57C072C9E7E99AED4040AD85B2ECD4C057C0B675CFE85DEF4040421832CF67C257C0E4042E68EBEE4040490C5CF0C1C257C0415DBC0739F1404055930C330EC457C045AD0967CAF240408207B0B313C457C0FEF46F0679F5404045A62D755DC557C04030F1A6BCF140403EE02396C1C557C02109A0A6D1F24040ABF2D29547C557C069F9D16593F540400BDD79171EC657C00A319905FFF540409EC2FB19A5C757C060BC4825C9F44040E1EF1B3B1FC857C02F38BD8468F54040BDDE1F5C34C857C001D87BE371F840403E6AB6BE81C957C0AB64F4A2C9F840406743374AFECE57C06C7D371E84FB404099F0B1EA18D057C0FCB691DFE0F74040FDBFE30814D057C0365BF341DBF340407AAE9CE9E2D057C0F17B7FA1EEF24040EBFFE8EBC3D157C0E79F4D7F82F54040D2F3FEAA58D257C060553B8089F14040B4D51D0C57D357C0E4D3255F80F140407E1FBB8F88D557C009EC231CD8F24040CC61A02D23D557C0D4582FBE7DEF4040800BA5F7EADC57C0CB617174D4EE40407149EE99F9DD57C0BC487B127AF140400099481CF1DF57C0DE817C90DFF0404057FC4CFFD6E057C0D0A64D6EECF240401C046063D5E257C00EDB5B6A63F1404076396C040EE357C086B3BA6956F2404004755BE1B9E157C09F92660CEFF24040E8B9BBA044E157C0BA18334D10F440402C70E7C4FAE257C0A3589DC9BAF3404054A8676908E457C098C1B5A6D4F74040341EDED0CDE657C01983FA80EAF840407E9CCD515DE757C03115ABDFE8F74040780B5B103FE757C0BD7B62C0CDF54040F2FFA5138FE857C0980DE85DC9F54040578218FCCBEC57C0BE7500F68CF24040D32646A4D0EF57C0878346CFA5F340404D3FCC45B3F057C093314A8E5FF2404050BC3385EDF057C0CEB2918E86F040404846A16333F157C045D2570FFEEC4040A5C88C29EDF257C0B4E205EDB0EE404081E818CDE0F457C02FC64B8CEBEB404092E1A91032F657C0FEF0F36AAAEB40400CA32EA5BBFB57C034F66A2000F2404040EDE5665FFC57C0FEB18DDFEDF14040EE395C8760FD57C0275CC9E0BCEE40400CDBE0C991FE57C09D6D34A0D4ED404001C9D64EA5FF57C007A21E9D0FF040406031E80F2F0058C0FF4BA57CCEEF40401D40158E210058C0FBD518BFB4ED4040DDD880AEEA0058C03DE4C84012EC404063886A71BA0158C0E53E7D5F95ED404078CBCD32160358C0D9B7C441B2EB40405E52BCB8DF0558C0B5702D621EEC4040D008D759050758C0B801FA6428EA404008F6B6DF8C0958C070D3BFE4F7EA4040353BD581D80A58C0741E39661FEA4040F759A4A2BC0B58C0B037D0286FE84040E9A5A141950B58C0B105120A7EE74040E90E60DFE70958C0BB8CE6467AE940406D24593D110958C017CBFD8603E9404083553C3E570A58C0143300AB2FE640402AC8D41CD20A58C09E902E907DE24040B62F7F7EFC0B58C0C815D1921CE140402D3BFCA19E0D58C0CDE91C94DEE040408B31AA4BD01158C00521EEB301E34040ECA01C6C8E1258C010B103578AE14040AC13216A441358C0BFB4506069DB404049F31C2B421458C024E29E03D8D940405DE5052F431658C0590FBF2452DA404033E1DDD3BF1758C01239A49FC8DE404061C1D0DCDC1A58C042D8B139EBE440403FEEC583351F58C0FC41491F9DE3404070C90BA6102058C071B6417EE3E44040F38712A9B12058C03F9A41B96BE840407F3E5870FE2358C0A3D159B9AAE94040130F51767E2658C0BEF25C57E9EB4040C9F0EBF8522758C0B2DF13D476EE4040E10142B76C2558C009E3412CB8F2404098A5A221A82A58C0F7F0694CF2F44040A54BB802642B58C0E9D6EC2EC4F340408CF836E2642C58C099B5497A8BEC4040B085E0A3902D58C07B05A89DBFEA4040D060B848F12F58C0C15AE1BF79EA40408FC89551103358C08745BBD85DEF40409C063F141F3458C09C87597899EF4040368096D8083658C0B6FC6A5BD7ED4040225C687B1F3758C07E41F8DA4EEE40403DF0E61E453858C0CA1696562AF1404023C1B840853858C027C99D4E5CF64040DF05A3E3843958C043A16EC99DF9404053CAE0A8823B58C0873409A71EFB404058856C69EF3B58C0C972C36956F940403A202D6EFB3D58C09C16106CFDF74040306171D13D3F58C08F6DA5EADEF8404026D906503B3F58C08AC8B0F831F04040507C3A92644058C0B175DFFDE0EC4040CCA24E14A84158C07401A7DF9AEB4040FF36CB598E4458C01B9A3B9CACED4040FE50101B474558C0023F643DF4EC4040EF1D73BA064558C022CCCABF40EB4040514BF856384358C07D7311236AE940408865331BA14558C0633FDFE561E740403702E8395C4558C02BC031D30ADF4040C1359D7ACF4558C089495AD5AADD4040F9E4C31D6A4758C0038148D6EEDC404079D17FE2C64958C00C35837548DD404067F03807204C58C009A8E12F5EE04040ED51C2E9594D58C0C71C6CA2EDE8404059FA40E87F4C58C0CD9F4A9F0AEB40407E764605CF4A58C015051ADD87EC40408CC4D684864A58C0A4D8FBF97EEE40405459B127094C58C01518CF721CF34040E64B914A8B4D58C0287E11F1F0F34040E8F1844EC44F58C05AEF70B379F240403690ED0E105058C05B3D9FD7C0EF4040B7C26FB0E85058C068B44B3AEEED40400A295ED1715158C0078CBBD7B3EF40406425E3D51E5458C0C9B6C232AEF24040F97A44162D5458C03FFDE7576CEF40400F1963F9E45558C0E05FE29956EE4040732C6C7C455758C039E2EF5F62EA4040057D2F42445A58C0D660F16110E9404081EBE886FE5C58C0CF66E45E0CEB4040C798F265455D58C065D637F4FCF1404002FA36C6A25D58C054C3A59184F340407FCCCCC7945E58C0E798A11033F440407322492C2F6158C0FBBFBC0D5CF540404C4E0051836358C0A1E3166EB6F34040E6E6BCB3DC6458C0783AEF6C89F3404021905D15EE6558C0E08EF28880F5404001F617556E6658C0C69246BF19FC404049D906BEF76A58C0040489188EFE40408EDFA6A2176D58C0AFBDEED95EFC40407EDB3A46AD6E58C08AB990FD3DF84040C4379B496D7058C053FD583D52F74040D4C599CE977258C09E0A12C3FDF14040AF771A37957658C05D593AC7B7ED404063007619AF7758C03EC694A777ED4040FB811E3E337A58C099D3B443E3EF4040FCECC9831F7D58C0CCCA692119F14040B5083F26827E58C0F1A5EC7D88F3404067F909067E7E58C0C9E75F5CC1F440402D132C22DD7C58C0473567F95FF740409B8D61E3A67D58C04E694D9670F94040799E2421AD7C58C0D30BA154DCFA4040D4D72EA1D57C58C0FEB4B13252FC404043F1A164E97E58C08EB3A94C2D00414069AE6F0A868158C02CE41DAE58FE4040A46E2F6F938358C053822EEDB4FE4040F0367F93898558C084EA4C49B100414065A29CB61A8758C0553984FBF2084140392261530B8658C05363F02E3C114140936590365F8758C0B7C4750B151341405CB6F999C78858C07B45862DBB11414056C8AC1F158B58C098D4BA71C70E4140AB331DB0BF9158C054DAA44EBD0F4140F4140B38889458C01E225A8BDB1141401CEF4A5D729658C09671E60A34124140487DA9029D9858C0BD89A4EFD40E414073DCF2C20A9958C0F3EF52742D0B41405F2577E5139A58C0DF1E05F5900A4140BD7454A7FC9A58C010CEC33770084140EEF1198BB49C58C0759F8BD9F8064140A478F193FD9F58C0203720578308414035BF5ADEB4A358C0C23B06AE7E0D4140FB85BE22E8A458C0D1DDECC62D124140B27E5CA7E2A658C0E5763C04641341406E264ACA15A858C02A02E6A14A144140B2A9E92E5FAA58C0B87B9122D5124140BA3DACF1AEAB58C051AC1B21361341409D323B1429AD58C02EB26E43BE104140FA46881ED9B158C04DB1F21EE71041403CC3C623EEB358C0091B5CFAB0124140A5694E7011B958C065D92EB2981441401990769BFBBC58C09D3C6D68EA184140B7BD2563C7BF58C08A3D72A3D31A414029EE06C746C258C0A41FAE2179194140A8A089CC0AC558C0D6B7FD5BAE1A41406BFABC1136C858C07E24BF98CC1941401D82FFF74BCB58C0871F66923D1B41406F386EBA36CC58C09AD7632FA61C41403BA018FE1DCD58C077346DC8BB2041405D7C9C1F96CC58C022BA85FB1027414097D3FDA12CCD58C069471073812A41406D324F2A49D058C0D0013345242F4140E899714D1FD158C0BF3C179CFD324140E88B14D4B6D458C0CC61F333D63441400D2F321A55D758C007394D86A2394140F779567C29D958C0692F1FCAEB364140F3EF04DB3FD958C065862013CB324140614384BB42DA58C01C3C6F79412F41404023515E14DC58C0DA9AA338B12E41405210AD23B5DE58C063211CD019314140F08CD20629E058C039DDA008BB3341401131D48A78E358C0E2E82B1F273541404C1F628C01E558C0E500BCBD593441408968354C7AE558C06713858345314140F975102D84E658C05FCBC3652F2F41409E07A993DBEB58C071260299523041400E784DBDCBF158C042240C19D73841400C98BBC523F558C0237D507F3C404140361FF9CA19F758C0DF905C95644241407955C2EE61F858C0106D33CA2C464140A07BB196AAFB58C0C159265A224A4140BDD5A1D87CFC58C099758177314A41407D928A1C3DFE58C0EDE1BD36ED4741402B7F3540C6FF58C0B4DEA232FC474140E5CBFADFF3FF58C029F7ABABA55F4140751278EBC5FF58C0C5EAD17AF983414095D2AD30D8FF58C0492BCD7A53974140B11342E0A9FF58C05892D4045AB64140CE43326E060059C02B0544AE36CF4140BF85BA3FE1FF58C099006B9621F14140021726EBD7FF58C0A09F68275F07424003522F68190059C0DFFDD4080C3F424032D4EC28770059C026670D88383F4240079D5391302359C0E4885840A73E42400D92E814453D59C05BAA8B72AC3E4240D633B93CC44559C0C829356E783E4240A6E97575BA6759C0F662DEE2FA3E42401DADBDD7378259C09FFBFCFF193F4240C89C5F659A8A59C0BFE81CFEBF3E4240BCD50A6BD5BF59C063337BFC053F4240391BBD78DABF59C0C7CC02A1CF7F4240D826F79B618259C08835395A977E42400E36FBB9918159C016C6FB7A937E4240D390E06D6F6359C0A1A717A3937F4240ABCBB429954459C05C6D4DFDAC7F4240CCB92C6AD63C59C0A26A2E9C927F4240F565F77A972859C09A1F74F8B87F4240CBFC4032AB0559C00DEEA513B37F424077A495E7F3FF58C0385543D7697F42406A288660DBE258C034DEF0536B7F424040C16391FFDB58C0821175B04D7F4240A5C66F12F8BF58C09B9C43D9C07F4240B61E61F592A258C028D354C8CA7F424030F4C799379658C02331593FE17F42408B8CAE9AB08658C06F09A676D47F42407153CFD4787358C00BA33710D17F4240F35FB231C95D58C047F2643C8C7F4240B0578CF5CF4858C08ED595B7F97F4240DB2C67A3EA2F58C05E081E71058042403CD7195F3A2158C091BD07EF1280424012683D1E630058C036EF0767C97F424090645F3B4FFD57C0F93735B702804240FBD288B449F257C03508BE32C27F42409110C24AAAE157C0C5C078622180424086B4311A06DA57C06DC5D32B1480424068D4F5849AC457C0552DE16E3080424075DCDA7E18C257C0363B5A8A19804240EE67D94CB4A757C06DBB293B9F7F4240543887ADC9A757C0D3F598E5BD6142401D35B0AABFA757C09BEA5359D45542404E4FF72381A757C0BF21671FA53E424059F1D881E0A657C09D1ACD00493D424063D29D3666A357C03C2D87290F154240F05AE7F6B6A257C05897D3CBAC0D42405A54498E199F57C08F627ADA51E141400C3F7DA9FB9D57C0184BEB2D0FD24140BF564F656D9B57C01493BF1945B34140343DA6DA1D9C57C0CFDB646AEE764140');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('38',NULL,'OR','OREGON','N','956','0106000020E610000001000000010300000001000000C7000000B9399BAE415C5EC05E26BA5A46FF44408032A99B38925EC00711A70D1900454086D803EE36CE5EC0D17DE2D147004540FCD32E58D8E05EC0C1F540FDB8FF4440E86423E56CF45EC0196325F218FF4440FEDAD362360D5FC0B32E6DEDB2FF44405BFA0D368B165FC0B6DAD574A10C45400EE84B60901A5FC0FFEAF678791F454042523039051C5FC0E47B886BFD3645407F3DC4A512195FC0D9971A9CC9464540219FD445AB195FC0DF19F99BB44F4540162A60C3D0235FC003A1B3F68D6A4540EE431CEB0F1F5FC0225FB5504C7A4540B6EC0BE1C0185FC05D45ACBE7BA1454099533B27FD195FC0B61647E26CA6454020DD061E89115FC016805FF7C3BA4540827EC6DC760E5FC0DE5BA2CC70CD45400F948001220A5FC01AC3E10CB6ED454066392C8B92075FC0C5E8CD777F22464003CAA45E7B035FC0602440F8C0544640B4AD821BD6045FC072B2405A4968464067DEF2117C005FC00AC915059F844640AAABE50B39FD5EC0281C93E67FA54640B146437EC1FE5EC0C3D8E63F17BE464007C94C7AF2FB5EC0F8E7CF0605C14640D42B8F4B18F95EC00793F2ACADBC46400F878B2A02F75EC0DA6F1EF1E1BF4640C24EAEC204FD5EC0617A768CC5C846402DB3F4AAE8FB5EC08C984D81F6D94640E0F9581781FE5EC0288BA50143E346401CCBA49733FD5EC0E5D0DB487EEF46400522CDBFC6FF5EC06B8B24E690F846405D8745BBF4FA5EC0403EB6CF930147403D7DEEBF8CFE5EC07A871145F2194740D9BE0B7AD2F25EC0E1624BF2430E474056DD10BCBBF15EC0355FF9B07C1247402413A9E88AF45EC095E6A082C91847402BCB6002BBF05EC08C82354BDF1A474011DE0FF7E5ED5EC052124814BF1547404BC65251E5EA5EC0692A5AF75516474026D71A0217E15EC0F8799B3F381E474007071F8444D75EC0780A72A373124740E36D177C80D35EC07A73CEC286124740A8094854ECCF5EC0165B45426F1247406E5D8F9198CD5EC08332FBC1C21547402FDA3BCD46CB5EC01B46E0C27F174740860C1C6496C75EC015118CA5F3164740CF21DCF73CC35EC02FA0582AEF134740C0ABEEC958BE5EC0200B5F52240E47405C4F9E9F95B95EC0958BB579270A474090D11CD806B85EC0D10255BE7A034740C539870AB2B35EC09A011764D1F846401B5E0A2899B35EC08F353EA5B8F34640658536432EB25EC0612B0EE716EF4640B501268235B25EC012987E87DBEC46400B9DA3BF6EB25EC0D62FB7A871E64640C1A27A1AEAB05EC0BE472B4B5AE14640EDA3DA7971B15EC093D7ADCC24DD464092BF64B5ACB05EC0524140741FD346408D37B98E90AC5EC062F7DB19C6D04640FCCE4469ADA95EC00277AB9EACCD46400290920030A45EC01D7EAB0523CC46401EE7AC55FA9B5EC0BC88FFAC4AC846402D3D2833D0965EC0AED5C44C78C8464088B59DD066935EC00F23C71084C546408ADC77CEAC8F5EC0BE12BF8F28C64640861A521A40855EC0C849DAA295CB46405705913000805EC0918BCBDD14CF46401788770D407E5EC0893F7C1C61D14640FDD2CD07517B5EC023276CFC2DD24640A1E1EFA2D9785EC08C88F43AA3D64640A9D58E18E8735EC02613C9FBAFD94640186EC5718E705EC0DAA0C39D48D846408AE602EF356D5EC017AC02602AD84640B295F607DC615EC0162A3BCB1ADC4640C3A23AC6525C5EC080DB73AEF4D846403DEA1886025B5EC06EFD3BAF65D846400D09C7448A575EC0CA3E84548FD946403D13DB837A545EC014C2B8972BD9464080C46F63B0515EC08423FED7D3D64640A9BACFA0B64D5EC03C7AA9DA33D546404D332400034D5EC09B8D93FA21D44640C9D98F9F4A4C5EC0F37A05B67ECE4640E3EE54FE274B5EC0E34F8FB6DDCC4640FF8C895A03485EC03A95D51CB4CD4640ED0BC4B6B4445EC0C0373224C4D24640D2BA219424425EC07BB9B06790D346404AA24B8DFB3D5EC0B7BA9B6C94D2464039B2BA6AB53C5EC08C99EF8D3DD346401600DCA41B3A5EC0C1E62E5057D146401440EF7F21375EC0658999D224D54640437E4D8C9B2C5EC0A25530FCF1DA46405749DA47232A5EC035C82B3FC6DD46400FE93EA3EB275EC009FA7EA12EDF464072F0163B7C245EC05BA72C66D6DE4640C0CE1B2EF21F5EC006EF366D0AD94640BCD34066601C5EC017F76E513AD84640BB93D41227125EC01D46F8FCB8DB46402B48ECC8460D5EC0BF6D67E221DC4640F4CFF264FA095EC069238B0571E1464007571EBA64045EC0D3A97DACDDE3464087DE1AF1A2FF5DC06F615372D3E746404CE18ABFA9F75DC0F6F0C91875EA46407A62BDFA58F55DC0217CECDAB9EB464012A263A76BEB5DC021E39FFF1FED46405A0194C2D0E75DC0E6F7ACE01FF34640F65061FFB6E55DC029141281E7F44640204E4C36C8E05DC06A7D200119F34640F7F1E34C16DC5DC0700B16C006F54640F6749BC448D85DC0D62A303F74F54640DC8B2A7A60D35DC02077F37D61F746405FB5108570CB5DC03018F19D0FF646408309ABDDF9C85DC08577FA9E7DF6464015907CEB0FC25DC08A1BAAE2AEFB46406F359543DBBE5DC0C53BE024E1FF4640C0C72593857F5DC0746C3CB4350047403388DD2FE47E5DC0C270D615FCFF4640BAFD3AB494665DC002ADADC90800474003E70C91D35E5DC044EBAE95FAFF4640AA7FC510D33A5DC0F65504E961FF464060AE820F7C395DC0F258B98B81FD46400CB31D6FD0365DC00BCCDB13A9F3464072AA680BA4325DC07487B85F45EC4640940AEC6A84315DC08BFDCF03EEE846407A77E1E7002D5DC00AAEA089DAE846402286D3A7E1295DC014DB3FB0EBE3464005529064E1235DC0CAD8D19BABDF464069BEA441CF215DC0514A9222F9DA46400CE5615EF4205DC04E3C73090ED5464097C45C571B1E5DC0EDF7A7D699CD4640861E5C95A01E5DC0B539B99A74C8464016DF76FB7C235DC0D1E9F2D42FBF4640BB19B59B35245DC03F5017D0DCBA46402CFCDE65062B5DC0271A48B9EEAA4640C8DFA884152C5DC012B73EB694A146405080A136242F5DC0179025479391464035937F9EB8305DC00DCE40439B8D464021831842CC315DC0927FB7C3BB8C4640A73419A661325DC0F9013542B2894640A4EC63ECAA335DC0F7C996615E8646408D501F58B0365DC066027D432B824640E321E43847365DC09833AC61018046404C01D4DCC6365DC0CFD637846F7D464017A2C23C48365DC0671A7004627C464032D5C59935355DC0E70AAB427F7C46407CBADB5E3E365DC00BEAB385387A4640ADA5742177355DC00917DF47C7754640EE25CE2D7E375DC00317918F2E6F464051D559756E395DC0497BED739D6C46404E08143A373A5DC05CF7DEB61A6A4640E8DF7647E53C5DC0972D701E55634640DF630B5A88425DC0D97A2606E35F46409704EDBF41445DC0C4B9078C49594640C8FE742214455DC0479DD72C3C5846403AB8292D5A485DC086BA737648494640DE769C4F36495DC0F44F26B79647464087E2DB4F4A495DC0B27F3D986F444640E1556737FE4B5DC0FBECACD8824146401A380EB90D4D5DC039F2FA372E3E464000CA4DBB5C4E5DC0E85FD3D68A3C464012F15AF6E64D5DC0B5E2FDF5C3364640DE162FB6294F5DC0580BB6F3EA3146408FF22B0CE74C5DC0724D2DB4722B4640890A62CBEA4D5DC051060C327C264640DA3B5329AB4D5DC0820C03B271244640B883DE1FED4A5DC06894F1346D2046404362877B2B495DC0DB8291B71420464068FC425836475DC0E249AAFA8822464066CE0E966F465DC08556C09B2F224640ED0D407135455DC05FD35C5D361F4640BF56906B54435DC0089C3CA0A31D46406DD88F49F1415DC0F596B142EA1F464035206083883F5DC0B3F908C69F1F4640B8804EDE783E5DC01B1F8DC6D21C4640DD667AFCD63E5DC0E7009BE5521946408249D56D6F3A5DC083C97DE9B116464087B12888BE395DC0C6454569BA124640105FA1CA993C5DC05918FA44E80B4640C37EB40DA93D5DC01FE7E3E38E0B4640469BAC2E843E5DC09BF5BE62750946407D32CBFEBF3B5DC05788F063D10146402D434201F33D5DC027B75BFE49FB454056490EFC6B3D5DC09BD3E59BDBF645409C1E93DD993E5DC09C0428B9C4F34540122279FA993E5DC0FFE41DD7CDEF4540461AB9DA163F5DC02F2FB635FFED45402DD473C109415DC01C9A9C332EED45405574B21EAC405DC0F4141F937DEB4540FFF624A2C4415DC0F09DCFD070EA454053E4452160425DC060A7620D6BE6454020525ED985415DC06729094B79E04540339437D2AE415DC0ACC7CD7EEAD64540D746DE1235415DC08E8F9C6A55FF444042B4383BDC8B5DC0F390C8CD91FF44404B07C379E6D35DC0397F09FD9BFE444058C00A2082D65DC0609DCBBB92FE4440CA2388D694FF5DC03300A8449EFE4440FEF06E59CD375EC0FF7BC80A6CFE4440B9399BAE415C5EC05E26BA5A46FF4440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('39','PA-EFACTS','PA','PENNSYLVANIA','F','957','0106000020E6100000010000000103000000010000009A000000EC391066735E53C0CB3E0F9D1CDC4340AD188104248653C07D877CE8DBDC43403926BB44699553C03C17782FAFDC4340714DE548A09853C070901CCBA3DC4340B793322756B453C0323EEA0E8FDC43403AC276F487BB53C03FA33F8975DC43404CE7380F62D953C0C6FDAB7712DC4340892BF53AC8DE53C0B13BEBF031DC43404F107BEDF7F053C035BE872C64DC4340CD0D4EE9C4FA53C0E94378955FDC43404B61D015761B54C0A0E96FCD23DC4340EFA48DA18D2154C01ACD7D9350DC43409ADD87E0932154C057512B7EADFA434066F60BFB982154C0A753A1F0EB02444012BB8AB9AA2154C0BE75027ECD144440FE05C814822154C0401F169D963344405C9895138F2154C0F69D51D2483D4440FF08B270682154C04912D4DF8F514440BEBEF7B14C2154C0856A6A67556D444097C371D3562154C0917190C2D9724440FD1898BA772154C0096422A59790444047FF2F9E472154C07C4A0A02A1BE444024D204FF872154C0061CA8815FBF4440FCA1AEFF722154C043C21A30E6EC4440E55E8963512154C01E5061D351FE4440951088D7D8F053C06CC0FEC53722454039DE3408BFF053C035BCE4C4650045402EB4590731E753C0D8DD952A130045401A4099AACEC353C04D601FEF250045406E90B054C9BA53C0EFB1EBFAFAFF4440F396D390869353C02FB4C303EDFF4440929915A1128D53C092980C08C5FF44409282C335AE6F53C01158049DA8FF4440C96E1DE5386753C0DF88D3A5D9FF44404F62921CFD3D53C0988307AE61004540DFEE36D46A3B53C069ECD30D530045406668122E172453C0CC878DAD62004540CFB76003480953C0D25E347215004540F102F39BB50653C0A02E1693EFFF444000E0DEEEB3DE52C03E430DFA88FF44402291F60280D852C0BD4D4226CAFF4440E2D4D43E1FD652C00CBD478B15FF4440157A907EBDD452C092EDE50E0BFB4440765625FA27D252C0AC0715154BF94440F56349FB49D052C04EF9E93D37EF444006E54B50F6CA52C0ABD65D6015EF4440E554CB6D7DC952C0DD9E71818AED44408AC4D6EAFBC752C0C86A0C02B2EC444096744EAA89C752C0C6E1586222EB444054E8F2251CC552C00A70410336E84440A082F26832C652C0371AC6E30AE644407E966DC937C652C0C0CC12A4B7E34440DD6C8DA4ECC352C03C4B4CE497E24440723E4265A5C352C0215050C504DD444058073C872FC452C0650F8CC57FDB44401D5D7CE848C352C076FDE18793D1444047779A0CA3C452C0DF9E6D6879CE4440E37696AC78C452C0A293AD885FCD44406922FD079BC152C0DE740E2A6CC84440E189E1E7F3C052C0A67CEB2A10C5444090DA41C631BE52C0881AC1B0E6BD44409E5D9F22AFBB52C033F4DA33FFBD4440AD029E0082B952C0EEECAB591FBB4440657675414CB952C0E2B16CFCEAB84440CEA94BDE4CB752C01B04485E3CB944400E8C1F38BDB252C0CEC17C8607B74440E9DC47144FB052C04B9B6E090FB74440B56877D35CAF52C02F2E6B0B06B6444086C0475463AF52C061C6F3CD68B34440817D6B3223AD52C03C829BF101B0444010BAAFD2CDAC52C048825894DFAC444073E04D9DAAB252C0A72C1675EEA744402FF95E3ED3B252C022EDF896C9A54440D05A9102D0B452C0853E12B62FA444406530204973B752C0EC465F59089D444014D6D48839B752C0012EE07B779A44401A406D908BBA52C07B9863C00F92444080C3B8B5CCBC52C011EA8E42518E44406CA0AF9A03BF52C0C85EA482B88C44404989C2DB49BF52C0CD321225778A44404F13A6B8D7BD52C0E9238D25958A4440ED5FFADD12C052C02F7AD786FF874440439DC5A341C252C0B23DF6269C83444037E14D897AC452C0B986EA245F814440C36651B076C752C07C79BE1F08804440C8031052EAC852C00AF8059F1F7D4440E51AB170ACC852C01BC41781417B4440858121661AC552C09D787FEDA0734440EBAB7944B7C452C0D7A3F96F3B7144400144D7819DC352C059C807339F6F44402111CAE07EC352C01C9873B4866D4440A2CE57E55EC652C004EAC3B16D6B444015B034A3B5C552C0121C235423694440EFEEF8426FC652C003726C16556544408E632A2557C852C0C0C3F415E862444062CFBC69E6CA52C082ABE7F22C63444084358CAA64CC52C0944CEB94BE5F4440CFE9F12804CC52C0BC55A858A75C4440D64C828924CD52C0EB4071DDD05744403C077CA6C7CB52C067FBF2C0BB554440E34A6BE85ECD52C0A49E4E624B534440A423C806ABCC52C0EE585CA52D514440EF3B5926D3CC52C01F2818E8AF4E44408DD3638462CC52C0F1E048EDB84A4440390F6D04A5CC52C03088132F0C4944404A5D1C82AACB52C0548BA4314547444063850D3CF8C752C05FC9D9534B484440391481361BC552C013B88B39CE4544400490D35313C452C01BA7E43DB04244404700E1D27CC452C05C7E3B87663A4440FA50B750ADC352C050DCBC2DC8354440C2F09F6C5CC152C0D9D565925E3344408F0973CA07C052C044FF17B24D344440363BF20643BE52C058B85FF3C43344400BA239E3CFBC52C0429C7D7C382C44407E1BED20AEBB52C0F04E9B1EB92A44402F5D2A1FF4BA52C0039BFE413228444043F3E6B95CB852C018D9900459264440494A98D4EFB552C07F09054DCD1F444056096DE748AF52C0C6DAE9B6BF164440940F91456EAE52C05AD14E7B1C13444095B76E48C3AF52C0D43958FCEA0F444066D64FB40EB552C097A0CC5CDE0E444076F4F59ACDB752C02E85D8C1FD0944406432C96732BD52C084CC81046D074440C709826CF1BE52C0662F12885C044440A48E9758ECC252C073BB9F2CFA0044400BB68FDC5AC452C0F5D11A4F21FE4340F5B489DF69C552C007E3FDCFE4FC43407453D4041AC752C052F9773004FD43401AEE9C8AF3C852C0BCC7AF915BFA4340F8D01E0C6BC952C07403FA92A5F7434081937D09B1C852C04E0AF634CDF24340D0293E4B25C952C0A001B455D8F04340B097D4F5E0CB52C032399AD54EF0434071266EC6CECF52C080E43815DAEC43409D4688483DD052C0D5C82C953AEC4340870340C123D652C075DE06319CEC4340EDE06EF2E8DA52C0457B2D1445E64340E7D18A4014DE52C0A9DBC84ECCE9434085AC632257E552C07D785E0589EB43404E46E43337E952C033FCD9A04DEB43401467362077EC52C02EB7E6BF04E943408DEF9CC7B7EF52C0D3C416E330E34340346A436898F152C0179A4725BEDC434006D21D4BA1F252C0DA8544A4A7DC4340670B3B08E90853C0E39C390272DC43402EBBF377EB0E53C0BCBDC4B265DC4340B79ADF2A782453C09483E9A731DC434046B02C6A973253C073C7F11E52DC43409CF094C5CB3F53C0DC8B5A2D46DC43408196AAB2254E53C05FE682383FDC4340353A3B45B95D53C070B5495E2BDC4340EC391066735E53C0CB3E0F9D1CDC4340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('40',NULL,'RI','RHODE ISLAND','N','958','0106000020E6100000030000000103000000010000001E000000CDCFBF8A92F251C04DB3B99FF7CC4440CF04440BBAF251C0EA8C8C1F25D24440813661AB72F251C0715CD57F5DDC4440D3A766AC0FF351C069BEB1138C00454086A72DE6D5DF51C0C883E1372F014540C451FAB43BD851C051097A5BC1014540ECDB135479D851C080B5377E58FD4440C43F3EB092D851C0934DA764B8F144409ED5AD4751D551C0C4791026B1F244405FFC5468EBD551C01E6929A719F04440C5F1DC2569D551C0C05DDCC8CFED4440B77868651CD651C0ED4CF2AB15E84440F8BAA142BFD551C00A7E8C0E68E444404ACABCDD6FD451C02B4F7850D7E244403D126F7110D151C0E5A9B494F7DF44400539868BA7CE51C0876775B795DA4440D2434E152DD251C01886D375FBD64440ECA5B54683D751C06D9D2890E4DE44404F58C76C30D951C07FB8B68D6DE1444090AAD7E69DD751C065CB727105DA4440360CA8F0D4DA51C07B4CB1B07BD34440AC41C82F59DB51C0DFB33CD64BBE44407EC674535ADF51C0885935DA2FB2444091910C9439EE51C0A07FD9CBE3A9444035F9C5A877F751C0BE193A8450A9444004A771E641F651C00FD9CF04A5A944405403F3458FF551C0DAC5A264C5AB44404A94FACA24F651C016267381B1B34440DABEFB2560F351C0F011DEE239B54440CDCFBF8A92F251C04DB3B99FF7CC44400103000000010000000500000090ED0548B9CC51C07BE06219D9D64440D2E0B6A009C951C0F4BBE4FCDFD34440E7B1391A7FC751C0E878AAA71CBF444045B64AC5CBCC51C0263222054EBB444090ED0548B9CC51C07BE06219D9D6444001030000000100000006000000C96E75123AD151C086C672B885CF4440084B856A0BCE51C0DEBBFDB95CD14440DA31166C46CF51C0C2ACDBE0C7BC4440039C8AB56ED251C039501E3DE7BD4440A3FA2C9E5ED651C0CE63ACDD11B94440C96E75123AD151C086C672B885CF4440');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('41',NULL,'SC','SOUTH CAROLINA','N','959','0106000020E610000002000000010300000001000000F300000089BD232E9D7054C0533B913E02994040A25AE5AE457154C0E9F8B877609B404062239BCFE87154C0C0AA4CB6D29B404069E530D14C7354C01476EB579D9A404087BFB691E37354C066754511FC9C4040A173BC54A77654C0168179092B9F40408DCC2A138E7554C0F38F30C55BA14040A349DEF2BF7554C0867A37C1FBA24040B733EF91E67454C0E9562F837CA24040C4574DF3157754C0E4A8EC1807A640409C7B6F51C47554C0959E0AD777A740409CC3F812657754C0FEAE0FD367A84040FF6042B41E7854C0FD45B67446A74040D1E686D42E7954C019F22E0BE9AA4040452723B65F7A54C012D9116B85AA4040BD5D9295547A54C01260D245BCAC4040D33C8717F37B54C037B77E23DBAC4040F6027EF77B7C54C0C430EE5A46B04040357AF275407B54C02726B71C33B04040E3DE2D762E7C54C00461D3B13EB4404023E58CD3777A54C0996709322DB54040B9F64974587B54C0E9D6808AD3B7404095C4CB32AA7A54C0D4F6AF46C5B94040BF0B39B4ED7B54C007685A5F4ABC4040BCD11E58C77E54C04ADFCD75D0BE4040D4D89C39C77F54C0C490D06E9FC24040B54EC1FB498154C0D869742CF5C440401A82AB7D778254C007EB7AAB14C6404093B24320348454C012F4F56774C94040F0569D25738754C0FC19E3A321CC4040EB2CC207E58854C0FAEDFE2305CC4040011CB04AB28A54C0AA85605FBFCE404024CB76CD4C8C54C03CD698FCD9CF4040257E0B90B58D54C0AE94384F22D740401EBF5792088F54C095FFB00B5DD840400051D8B6099154C0B559FFF77BE140406770557C8D9354C031B5C3CF2DE44040C40AC05DE99354C07DA847AAE6E64040A82199E37B9654C0BC73661FEEEA4040DBFC46C5679754C0C401025E02EB4040F340B688FF9854C02331827754ED404044D59D6C2B9B54C0084C12D31CEE404032B8D970399D54C0032808AC69F04040BBD0AF591FA154C03C6E95FB2BF74040AAB89B41E7A454C080296FF1C9FA4040AABE2C01B6A454C07C343F0F05FC4040BE525F2227A654C03C141EC1B70141408A999BA196A654C05C2395F96E044140C960F54243AA54C06BF8869CDE0D414061E12C0817AF54C04CF883E1BB154140EE4822A786AF54C08A988E944F1A41406105E28783B054C0A33D162ADF1D4140F3204229E8B054C07E35CF80F62341406E458B8C1AB254C03F79459E2F2541408C391BD3BFB354C0E86D24D7812B4140D0F2713988B554C0B16AA9717E2F4140F5E9EE9C05B654C0077CE68BD23441407770C8038EB754C0AF8075C4903A4140D6FFDE6BECB954C01F0DAC9F2E3D4140D0F29B7AD8BE54C0A81886DBFD3C414014FA063F82C054C01E9AF21A443C4140C9D5F70885C354C024B09256BA3E4140DF4101AF0EC554C061985CB06D424140D3C8C274EBC654C0F762CE6B7B44414068F8E79ACAC854C0309662E3AF4841400B2FED3E2CCA54C01C314DA0D54941406A3D3B608DCA54C09A0CC0FAA94C41400BE9ABCC2ACF54C0392D5652814E41406F3DB31721D354C0B2A51065DB544140CF3E961EBFD554C0E60D13A2BE564140DE403AA071D654C0287165BAD55A414067EBECDF6BD654C09D6C9DD61A5D41404D0B1CFBB2D454C083DD54304960414084E265F6A6D454C07058016CC464414037D33E5160D354C0DA37EEA81B6741403450F78B49D154C099FA828654684140E741F52823D154C0B251EEE26B6B414002F0DCE606D054C04ACEF1A17B6B4140F509CD0505D054C0A0408F40D26C414052A2CE8215CF54C0ADCD089F626E41400B2D14828ECF54C0808B34FC647041400A113441E6CE54C0E699555DD96F4140ABB60F1E0BCE54C02DAD66BBD0714140377D805C06CD54C02A7EBF7C2C714140439762D7A8CB54C00CB708189074414032F5B57322CA54C0E75CE2967575414081C815F2EBC954C01C1638F454774140444F3BD0CDC854C029D65CD419774140272EB96D0AC854C099575BD26B784140BE85B80C3DC754C0F3F347F3D27741402B97C9EC25C854C0C74F10EF287A4140AAA9940BC5C754C0F959708DFE7A41405F5E7A0B65C754C0AEB6F52E337A4140769A65C76DC654C0F065C107F97D4140449D8446CBC654C068C32C040C8041405BD0F01675C054C07195F9091C834140CEF5A7B8CDB854C0ECFBF5BE1987414032620F5C5BB154C0F9E50CE6F28A4140F5E1560F9FAC54C0FC45E456B18B4140EE81294D06AC54C0A4750396888C41400D4AF6C9E5AB54C0FA4FABF28F8F4140BA4838C6E0A954C0C29503344E8F41409EFFB5D878A454C084017F5526934140D8E5111391A154C03913B078CC934140F1067A8BDC9D54C032A2F11639964140694E5B48049C54C03CDD11F3B7954140F55FA7C2EC9854C0A4E0806DAB9A4140F676BB00C29754C012A6074B67974140413E809F099754C088A378A96E974140BFE095DE719654C0D83A3948AD984140F8F923DB849454C009E2AB4497974140D3750077CD9154C0CDE5B6BEF9984140685A8FCF708D54C0A55B9D1FBC984140CCDEF754297E54C0B964107E1D984140261DA3E7B47754C040CC3756749741400D0C2ABAF87054C00884D74E5F9741405F89D8AE2A5754C0BC52D9BFDC94414024695BE6A55454C0B4DA1C68FA944140A2BB1C70244354C0AED38D036A9341400ACB9D30204354C01ABBF666EA9041409ACC83B1CE4154C0A48CC5B1828D4140B629E0B12E4454C07BB4AD2D878841400350DD338A4254C0C4769FBBC7844140A1D165AA5D3B54C091FA4880FA8C4140F90F5BA83F3954C00D31842CAA874140969D92E3C13554C078E95AFD46804140C3927EB9443254C0DA2ACDBE6B784140BB3346D6303354C0B81DC9357B684140027839E9EC2354C0EBC95F5C5E684140104507DFCD1454C0347CAD304F68414011DB12F7DCFA53C0B7A373F86E674140739D7824E3EB53C06E4E9BC317674140458804C1B4EA53C0B191A84681664140096EB9DB2ADD53C090F8232B2F514140D3AB743A9ADC53C0046F74AC424F4140CB3BD7A2C0C453C0F0CFC1AB012741402B57C8F1F2A953C0DC8AC3C073F94040509B36C415A553C0ACB70AC5EAF040404D879F8BD8A753C0E8BD9985CFEE4040210C24E57FA553C07E16B08640ED4040189B185EB6B653C05825AEC1B1DB404026E740650BC053C011D8BEEA4BC940409724A944BCC753C02907D1C023B74040C1F2A20E9CC953C0AE6B4FDB9BA84040B7BFAE8F1ECA53C0FD1DEADBD4AB40406B545E8A55D153C0DE24485605A6404092CC011FECCC53C018F57A1A839740407B37F426B1CE53C0D6427EDC1C924040A6BDF20052D653C0180A62DED6934040293269B60FD353C00F26C37DC991404094C97B956CD253C0DF89F9BF668D404095C7B89347DA53C02B195A6EC6814040891DD25845E553C0D01BBAB50C8240405C27F1C180E753C0207A8B5C907D404020612CFD9BE553C010E0BAE569764040B4004202D6E653C0C312116B1A7340402DDE0F0526F053C0DF99FC82A9654040925AD13F14FA53C0CF7F74E73565404088C000E730F353C0E05260CC087740402F8BCE990EFA53C0D032977B006E404034A6FF3789FB53C0BECCD73205754040AF19FE5C93FD53C067493EB5C373404033E5CDC4ABFC53C0461E1B45C867404024846DE010F953C0733FA7B1F45D40408608E6815EF953C04E8541BEB55640402ADD0A95C8FF53C0FBDD3D708A4D404027CA88CB7D0D54C0AB1BC389E247404062DA93139A1254C05CE32B62854040408D65B919381654C0C115D2C187414040B21770FD031954C043A50233E4534040A18BAD9F9F1A54C04EB3950FA7554040D8BF645F961954C088ED5386A2404040AD3020E8C31E54C0DE72FCE755414040F70FC4AA392354C021BA085967474040A005200B7D2254C0B2CAB04943414040F56F9FCD5E2954C0AFCAC9A76A424040DD7EBC0D302954C002BEB18FCD3F4040EEF79ECD1B1F54C0E7DB01062C374040A83D10CC561C54C0C8291519CF2F4040393BAF11771D54C0B1C32EAFCA2840404AF526D8102854C062A9A8D0EB224040AECEDF96642B54C0EFC23AB090244040AD4FE5537C2F54C0B59E11731B2E4040055A9412293354C034C49859953C4040433225F1393254C073F3D98BA5404040B7A4DC32273554C05CACCE8315424040D7C458D47F3754C0570AB1592F444040A3297075993454C0E67721794A3340401B4549B8F43154C012FD8185C21F4040D0728D82253954C0DF6636EBB90840400366EA48B64654C0E05F55417F0D4040A5F83C899F4754C0A4CCD8F90D0F404019283789574754C073C62D5C65184040EA8270CB734954C09FDD21ACBA1C404004E129AB7B4954C0AD294EBEFC2040401E4CDB67F04754C09BBD9816692340406C17E7E2704854C03A76D93C932A40405B44CBA1144954C0E4CB07959A2C404046CA0723144A54C030124BD85B2B4040974B0EC0764B54C00FE5AD87962F40408097277E684B54C0AC96A2A083314040983B4A9ACB4C54C00442EBEECC35404029D9ED747D4C54C0EBE6EFB9763B404076D4818D1E4F54C02C4F607AA3424040434680AC265154C0D06C63D057444040ED2EA32B8E5154C08B762025044740405669E68B225354C0620A5ADC9C484040B5905F2DC95554C052CAAA552249404049C04ECD7E5654C0B1769D0EB14A40400EAF0B0E785754C090B7974D7E4A40406034BFED705754C06012CB8A4F4B4040CEF73F4EA25854C070DC4BE5454C404010CED8EE5F5A54C0EC33F2F4135040405400790D915954C0CAF4A4EA4D53404025FF016D0F5A54C0C828ECD9E55740402B3A900DEA5A54C041C442F2CC594040501BC98B165A54C07E342781F35E40403196B60C135B54C078FA49DCF95F404093A656ECA05A54C070761E7ADC604040EBD2B70E895B54C01EC441AEA06440404A2BEFEEEE5A54C0AABBEB859D674040F895EB2F8A5B54C012FD62C1FF6840404B8CEF2F225B54C03FCF787D776A40406DF2DD50AB5B54C0D4A01639BC6B40408EE266F2235D54C0576AAF161B6C4040562957B3585D54C0DF73550C8A6F4040CF6197D4EC5E54C01C7D09C923704040F7BA5D14C35D54C0EA3FE7C1E8724040B523DBF4875E54C0E34C85A1E37240401B6BCDB7A76054C056EF878D3E7940407192DB37A16054C02A0B782A4B7A4040C64EFD96DD5F54C0839C2EA9D67A4040AF8DC4F7885F54C071EBF2B89D804040168E8D588F6054C0B80B7536A3814040591978FAE46154C0922A766D9F8540400118CEDB0C6354C0F70BCC6D978540405AD6F89CD76354C01CFE8FC8C8874040F43E0800226654C0F0B5FDA50F8940405EA85D011A6754C08A229A803F8B4040ED9B3AE9126D54C09BEACA75BC8F40403F97834C626F54C043FCEC6E85924040EDE957AEDB7054C017732126BD95404089BD232E9D7054C0533B913E0299404001030000000100000005000000BC6E7DB7233154C0CA792E621B214040DAE1BD76052E54C0CC12BE9AD72240402A4A83D8A92A54C0A88491AB2C1C4040D2FF03DE6E3454C07684F8BF660D4040BC6E7DB7233154C0CA792E621B214040');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('42',NULL,'SD','SOUTH DAKOTA','P','960','0106000020E610000001000000010300000001000000910000002EB980E474B259C00C63AE1B667F4540F6CB724260C059C0A3207CD4EA7F45407162CFFB17E059C0E75B06BED27F4540D15E13C398035AC05EA8BB5864804540229D7A3CC9035AC0F028DB4254BD4540C28FA0DCB4035AC0A8AFC5A479C04540E62AAB82CE035AC0BCBAD80A2CED4540B81987A3D2035AC0CE49A368AA124640E5E93404E8035AC0C8D6000D46174640B985EA46CE035AC0D6F0FC6284494640D4AE2975D4035AC0844E1AB7A87F46409F213CB2C1025AC071A86117B87F4640FF8D2776CE025AC08BF3F9803F9B4640DCFAC0482B035AC0534C40DF07F146409735164821035AC016F26504B4F846403BB3CA2DABBF59C06253287A76F846400201A3C491BC59C04AD5717C88F84640D8D36D772D8059C0B8353304A4F846407B6E610AEC2059C0025146A25EF84640E02C35D50CF858C08ED29428C6F846400E020FFEE8ED58C0DBB4C564ACF846401F6CE5F26FC058C0CCF0445B43F84640D96E7E7ABFAE58C0DD68D34319F846409B430A01F18058C0681138533BF746400E0CD560A37E58C06CA2552E25F74640962ABA8CEE4E58C068BFFD51DFF74640A1152771482458C05C3A45EE90F7464018D03F0FA12558C08CE0F673AFE846402B771DF1B12658C0437BC73375E74640D1FCF0B4122A58C089C57C9696DE46402489F3864C3558C029A069B549D3464045094B27B83658C07CBB77B6F7CD4640594AF423F53558C0A4586178C3CA46403A7685543B3158C0374B7FBF3CC24640030FEDEB3B2F58C0DFAC8724A6BA46402A3A55E25C2C58C035FC49CA8FB44640461160B4B92658C056608F4FC1B24640F8EA0248152258C0C6BD9E5404B04640428458DE901E58C04CE32B980CAA464019F0E95A491D58C015238BB940A646408251DD78161D58C0F38B989A39A3464013036F69301D58C0B5AAA0536A7C46404BAFB047221D58C025C18E8E92664640E39642DD3A1D58C0132964CD7C504640A9DA9E75201D58C08333CB6DE84446401C3E3700461D58C078E531D87A1946401A54F0F8381D58C075AE8692A3EC4540AF441B17781D58C0821E83C6F6BF45401C75CDCC4A2658C02A270C0EFBBF4540D61378E95C2558C0F5F27992AFBD45402C00D906B42558C0454D18BFBFB74540716BF57FB12358C0AC26B6074BB345403588257A9A2158C06064284B2EB1454063C4E117772158C0AE27BD12B1AD4540722D9B96982258C06B76106061A7454046E1CC7A102558C0146C372521A545400B3B8FB7862458C0BCB24C0CBEA14540762956F5CF2358C0BACC9FEE6AA045404156F694492458C00D4FC351AC9E4540CE706932C02358C07431E7D4DC9C4540F1926F062F1F58C095E68773E49B4540B3CA3C82471E58C03C1F0934C39A4540455BB475E51C58C0A315A4E22A904540FB5D7FD37D1D58C0DAEDE96A3F8B454000AF8EF2921D58C0E8765AADAC8945407A091354B11E58C00B3021D1EB874540F48F89D9472158C063A4D3D59786454015E285F1EF1F58C01180CFDB8A814540D32431F3182158C02FB35942447E4540999C36B2F42058C0DA0AF2A7E779454041536636D52258C0DD368E92F9744540CC510295662258C04F3D75D4CD724540BE17C6F6982358C017595B605F6C454073CE3819AE2458C0CF9C53E5CB6A454059B0AFFB9B2558C02A3B38C7ED6A4540CE63B3BC742658C03737C2EF57664540B446EFC0822858C0374B4F596F634540BD453861012958C0E376C83FD25F4540F5D9673E192858C07098E35DAB5A454054A0D4D5082458C09AD2D6D59155454076B6FC72A22258C02500C5B2C95445406E3DA16FD22058C096D06DD09B5045406439D58D431F58C05550D5304D4A4540B99B1D6F0F2058C02C3DE9117549454003ED3B4E511F58C0E0B68C113248454016592E4EBC1E58C0113C4E5331424540A2B6100B1F1C58C02A9ACF719F3E454049577830A91F58C0F5D51CD5853E454057EC6C94052358C07FF8B9B89F424540B320F8976C2558C069226B3C574245409B03DFF9BF2658C0B165671EED404540AF86755C462858C0FEE069A0E7424540294F873DBF2858C07FF6AB607E464540A1846D27B32D58C07702B8E95F4E454058CFF307C72D58C08BA919AA9A4F45402D4FF845742C58C09F808AA7115245400043FA66BD2C58C0E464510830544540E3B67B0A402E58C09206AE6B94554540D7A18F73283358C0E9B25830C35545401F902C35DE3358C034EF6E3036574540F3DCF955D93358C04CB45C701F5A4540D615C080203A58C04376A04FA85D454031760D27213E58C07A19AD8F4E5C45406D8DEF67953E58C0EEF54D6F185D454021A63387143E58C0DA3534AE43604540EC7761A8B13E58C071FEAD6C1061454060507A0CF84058C0D8169FAC386145408AF1C29B594858C0644FDFEB0F634540F8AC14C0544A58C062091E2939664540A6BC91A68E4D58C0668CF4680268454001497F485D4E58C02B4E4886AC6B454022B1FD6A904F58C075D4C0A5086D4540C2C56A8F5F5158C0B211C147CD6C4540F3AC7536EE5358C0E682DF884E6E45403CBED063EA5858C0633D9C0C086F45403DC969CF435D58C088FC0752DB6C4540ADEAE413EC5E58C09AFCCC52B76D454072B81177646058C01A0DDEF3186E45400078F798856458C09A28C8F58A6C454075CA625BA36858C0A539B6953E6E45400537595CE36B58C054BD97791D6B4540AB06467E6A6E58C0FFC0FC37D36D4540E2A2CA806B7158C01362C2194F6C454069051083027358C0838C2B99BF6C45406A7F8AA5647458C0548ACA56EC6E4540742FB4CBDF7858C02B90CE178B6D45407EFF41CBF47858C0ABA8F81B676A4540CAB0F88D7C7B58C00343AAE26A654540A5EFE6F0AA7D58C02F98294608634540B213C173B07F58C07CA1BCE726624540C162F0F81E8258C0938BE6E4746245400B9282E5CB8758C08E122558786745405562D025E18758C0F8D34A16FD6845405AC4BD88458958C07A632B52FB6A4540FA70D1ABBD8A58C0EB792110776B4540E7A8839ADC9358C09F18BAA6DE704540117B6A7F099958C0E1CF3303C775454056C356C3469D58C094303EE2F4774540201F2885D99F58C0F7ED869BF27E4540AFCB861241D058C01A372A9E067F45407A0D8D3C19E258C07EF900D5047F4540E59D505CAE0C59C0F540B833DC7E4540843846C8D44E59C09286B9DE507E4540861EFF818C8559C0BF80209EB47E45402EB980E474B259C00C63AE1B667F4540');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('43',NULL,'TN','TENNESSEE','P','961','0106000020E610000001000000010300000001000000FA00000008A48F4B18FD54C019CC8E464FBA4140B9DEC6BACD0055C0872875BC2FB44140FF1257DD650055C0A7EE6E9EBCAF41401F565306DD0155C012E697DAA5A9414049F9E929F80155C0FD842F1B74A54140BE78916DBB0255C0D93C1979E6A2414007D166F87F0655C08DB057ED709F4140E90F0D447F0B55C0894A3B5DDB9E4140D89BA58A740E55C0A691F0D27EA1414006F7AD149F1255C098BB95ABF59A414050EA75B4B81455C0D18B1C859A7E4140FEE8CC87982755C0ECB9FCAD8F7E4140B83BC5435A3155C0C4BDE521D17E4140AF2FE1073A3355C047C0C820157F4140E108255FF13D55C098D2EF3B107F414069FAB73F423E55C0FBCBE67B0E7F41404D05A447225155C08662D1759C7E41408F922752095755C083247E9AB77E4140EBED0E9EE95D55C00B310D60BC7E414018444C34F96655C010E302B3BD7E41404ABC9CFEA67755C0B174D974067F4140EF6DEF8C6C9355C0478B305C6B7F41404B3DFA0D099455C0AE33201C657F4140E8BAF36212B255C032452A2AA07F414044F2A6C956B555C0B739DF86C67F41400300352149CD55C0DADCB4D804814140D3EA8BC341CE55C0D2B084B8F0804140CDCDCF68E6E655C0DE1E6F97598141403252EDE71BFF55C0F1BAFE630D824140535187437A0C56C00E9CFDCDBB814140A5D423646A0C56C0C3D2C7EF91804140381A09B5821656C0D7619F937D804140E5F3E477851856C0DB17A533A58041404282A9263E3256C0AD9D26476880414032A886CA003456C018A08DE84F804140FC769185654056C05906E8B00780414012BF383DAE4C56C02A528EF51C804140781D4670E95556C09AA6549BF97F41402AC7CE37616956C0F0ED250718804140999FCEC0E76D56C0F27395CAE77F414037472D778C9356C062E390D81980414055E03696AE9256C0C23097EF368641407DA1D70C888C56C00807712F3F85414058509ACAD38A56C0FC942446F9894140140E4D8B6B8B56C023E99120EB8D41402233134A888A56C00FD6181C9A904140B50EFA67348956C08B935FF97C91414070590F22508556C0006427980490414015A706E0228456C0929BF072E092414029C54C5F008456C07795916F60954140BF660880B28456C0C36BF7EB90984140539A285F6B8456C08E1003E83D9B4140E457C4C0C58556C08CE6560193A0414084CC7C42C98656C0E4DB08A0C8A141400ED713E8BD8956C03D94C181CFA1414053DAFBA9DE8A56C0100FB4FE2DA44140C68451A80D8A56C038ED61D935A7414005C627E2CF8656C042676B764AA84140EE6CFFA0528656C00BE720303FAC41406FD9BA01C48656C0932B9C4CDBAE41408FA12A1F958556C0B0B43309D8B04140E38F9D1DD68456C0257935E40BB441405147BBBE748556C0F8CC20028DB5414096732D82308756C0E5E2E2A279B541407E77D9E47B8856C0395D12052FB44140ECB3CE05FA8856C071922F6A0AB1414023A36809BF8A56C0F587A40A32B141401390B5A90E8B56C0460E14233FB6414051E121A5CA8856C09CEF6B5EA7B8414096B75500888656C061C02898A0BC41409DD2B3BD448556C051C1909638BD414062E9E8BCCB8456C0BCC8F07778BC4140A91043DDBC8456C0ABCA9A809AB6414074848D5BDD8356C018D0CA62EDB441402240B3F9FF8256C0441BA16166B5414010564D53FA7F56C024DE435B07B941408A2D4798AE8256C05E5E9D4F9AC14140F45441989F8256C084BFF4A97EC54140B8EE66F71E8256C03F24E427B8C641402C8D77D1567F56C0C1E23EA6E7C7414095D2114E977D56C0AD0096CB24C441402083200CA67C56C02C43872C74C34140BBED3ACA997B56C0D1C4FC8BC0C34140EDE0E3E8FD7A56C08B4E58E9E7C54140E1EB81CD517D56C0F8377A0312CA4140D60E96AD417D56C05BFC131F35CD4140F0CF3363297856C06706DBBA13D1414041A669814A7756C00A68EE1B9ED041401E7C779F5A7656C01DCA833999D241403D6E8280DE7656C0C553F8F4E7D5414052999381607756C03B6AB67431D64140FC0B46E52E7956C02782CD76F9D34140C814214A827B56C0BA1B627292D641408BB8F48CEF7C56C035CF784B35DB4140A3BAEF2CDF7C56C0AE60B907FFDD4140B70154473B7A56C032DA8805A1E0414026D17180097756C00A1F7948C7DF41403741389CEF7456C097C1FC8711E14140C8F189F8327356C0273E2A461CE341401A64B1F7967256C014514DE11EE74140417F8ED3A17056C07431E9C0A3E841406ABAC5F01A6F56C0C567AF824FE7414071FC30ADDB6C56C06E17E27EEEE941400D826CADE56C56C09E42045DCAEB4140B19DF4B37F7056C08B4363188DEF414073CF22F50B7156C0004B1DB62CF14140F9FEE4D4D47056C09F751334CDF2414083D708523C6F56C06729B89121F5414089D567AFBE6D56C04D6C1512ACF44140F0DBE8E98A6A56C083AB3D555FF14140F6273508906956C0EBBC86737AF24140EA7316884F6956C0FA93ABD0F9F44140365F396A836A56C0281BF1EC0CF841402075C34FA56D56C029EE68E9B2FB4140788A1E91326E56C00EB55E64FEFF41404FF4FB4D176C56C0F888119F4F0342400A5E4F6E686B56C0B406F314A10A42403AA283CDB76A56C02E55FDB1B80C42407AE7E164BA6556C09FFE8F4C9F104240F6C84BE5BA6556C0472704A977134240F8B178C9976756C01C8BE223871742400C05B4D1516B56C0D40EFB9C471C424060348CF4866C56C0717A1099D41E42404B6F8DB4746C56C0DD1A5537482042409FC47431EC6A56C040D11297A220424006D39DEA8F6756C011E647FAD71E42407678E0A0AB6256C0C4574EB8F020424017F44BE0446256C0343D4B97DE21424080BC4941B56256C096E9FA93F523424081566D89D66656C04F3A8DED6F27424074369D2BDD6756C0F0142548DC2A4240A39391E9C46656C0D8A539A46A2D42408AAB1542DB6256C0E2223CC7422C4240331219FF3D6156C041160746912D42403A1BB9FF486156C08CBC24FD573342409891D982E56256C0E1D9077573384240FDE3F5BF076156C0F4716A4F663C4240F42A1F22216256C002F53D0AC43F4240196BB11B755E56C0478A6E6BD23F424030143EFD7D5F56C0CF5C2F51963B4240A8B6AA5A235E56C0C3A48015173942400B713CB8B55C56C0AF93B9B36C3A4240BA43E6D48B5A56C0FDE28ACB57404240B98A60CD2F5656C001990C8D5540424078B1B4D2243556C032D3F33CFB3F4240F1F84F12E33456C0429A8DFCFC3F42401F3121D0E23356C03670ACBBE03F4240E1C87AC4CF2056C08D847825F13F42403AE22DE2BE1F56C0757F6E44C53F4240E8B2C4A2BC0256C0C61A0B9E8F3F4240793AA6BE3E0256C03A6831BCE34442407D71793CA10256C0FF5AB19B964A4240EE071BDA900456C06B1532DCFF564240D3EA6ABCB9F755C05890AAA8AF554240C3C2575BA0F655C0478C00681D52424066352AC562EC55C07B89B09A7E524240012C727F00E955C048C63878965242408BAFAADF2ED655C0D7B054851B534240227F658536C755C066A49F0D5E53424006BB82205DC455C0176C54C84D534240D3CCE87250B155C06E0AED097853424094A18DC9AEA055C0A24C9578D95342407CB8EFA0969A55C0DA049ABE515342403FBE2F4BBC8C55C02FF66659575242404F2E5753C27E55C05A8BC9D509514240FCBCB23E457255C0E84A063937504240B6D422F2FD5B55C05082F524214F4240C7842BC0345355C05028251324504240D818969C705155C046892536145042401FC8E5C9E63F55C0C224CF5B7C4F42402006F4ACA03255C0763709017F4D4240B1CDA82B0A3255C004E99022734D42401079B30A6F1055C0C99DCE49394C4240480B898A491055C0CA5716CA374C4240148817896E0055C0B475E88AC94B424082D645DEE0FB54C0BEB2F86AAF4B4240B3761CDA84EC54C0F90453AFC84A424006E59C1836EB54C000E12D54A24C42408F64319DB5DD54C0FDFA14CBA64C4240B30F731D9AD154C0EAB1081EDC4C424046208198E5CF54C087740B01834B42408093F9D17FCD54C00F8B8985464B42400B47000C26BF54C0253C6961AF4B4240CDAB7B7E63B654C09CC01C3EA74B4240C50805FC17A754C097B9B8C3B74B42404B7BD3B8FF9254C0CFFA1E22C04B4240229F4BC7DD8D54C0B32601900A4C424031484D1BDE8954C09499D7E22D4C42404E3486B4797B54C043036B1C484C42403709DD54C57A54C060F290BB8A4E4240114CC3A90C7554C0422A11CA484E4240EEB7CFD3BE6954C0760C5541C84D424031D9CD93DE6A54C0FDDDCB827D4B4240EC2F24EFF76C54C06423A8AC7D424240A67C34EAAD6C54C0D84CE837673C4240695B6E096B6F54C066795F092A324240B47207A75F6F54C05C918571552E4240869A6201656D54C035063A9BBB2A42400E9164A3BD6E54C08B4638FB2B2A4240E701BE71257554C0F4CAA609DA2A4240661FEFB94D7A54C0E76705673B2542401530097BB57B54C0EFF98B8AB8214240C75041834C8154C08D1E49699E1042402307006FF78454C0C1DFC653D50C42403423BF178C8754C0FFCE9F02560C4240BD4E5F83D98954C0CFA768ECE211424097A2E610498D54C075D55D13D5124240B3B1803AC79054C0559D1D236C0F4240234EA643F49354C057A00F3CA60F4240E9C6ACEBEA9754C09988B2B6A50C4240D763B44E219A54C0DE965494A7094240A911064E679E54C0DA2CA9F123FF41406440AF4F6FA054C0FB9020CE7FFC41409DCD72D274A354C0FCDFAD4865FA41400A59C3B758A654C019035AE150FB4140B9C64A3DC3A654C02CA798BD7700424019DB2CDFE4A554C021AF2F1EE302424026E9E743ACA654C09F652B1B840542401A9F5BA82FA854C08EA94D17F8064240A894954933A954C0A8669355A20642407EDB018CD6B054C0182CFD87F4FF4140395E536C80B154C0197735E769FE41405811AA09AFB154C089BA566774FA4140547F560ABFB354C0EED18A83E2F541407D3E68F3CAB654C07815A39D48F9414098B7B87855B954C0236ED23867F94140C2F9E3F87DBA54C0B60258B6C7F641403D9FCF3107BA54C04C2BD216A8EF4140DA0DF18F9BBD54C040E38EAE5EE5414013ADEEF028BF54C0D7FF866A15E3414093CEF93BD4C354C05992F4C02EE441403EA499418EC754C0EF8148B9C7E14140CBEC02A52FC954C0615936D6A2E14140FF8339A7DACB54C089FBC3534FDD4140B548D52E99CF54C0B9750EAEF1DB4140A9F2200F34D054C092F868EFB3D94140101BBF6F93D054C09CC5962F76D84140137AAB3517D354C03B79ECAD05D44140D1FF9E1EF2D554C092830E27A1D34140C7C4CD26C4D854C032112A430AD041400C9655B552DD54C05B9067BA76CC4140D04E1E1F5DE054C03C4DDC75A2C74140A9E71928E6E354C009982C0C13C741404DEBC8B047E754C046A941C131C94140E0ED449A0EEB54C01A2CE4F653C841409AD1024BA6F154C066005CA4BEC64140ECF1C05320F554C0A9A7667C73C241409C06B85B64F854C06F9514B35DC141407FB92D023CFA54C032F3B80E00BD414008A48F4B18FD54C019CC8E464FBA4140');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('44','TX-TCEQ ACR','TX','TEXAS','F','962','0106000020E610000006000000010300000001000000170300004402E9C2ED7F5AC0FE05B641D9643F4063DD6278A68D5AC0531EB95B6E7A3F40F49E3A988C985AC0F91A7F15DFBB3F4003D50E6987A25AC064B24F4D4BC93F40535686F05BA75AC0DA7455985DD13F401F5B14926EA75AC089B569EA40D83F407B3B6D9738A95AC00758062F2CE53F40B5FAAD578FA85AC050D02B8602EA3F405FF0F69A7CA85AC0F93F6168E3F83F40CC48189D9AA95AC07A20B1E3F6FA3F4006038A7BE9A75AC07D238CAD23004040EE55547F37985AC0E3EBBA7A180040401D1C101735805AC01BC3885436004040DC89DF0A073B5AC0E2D1A2978F004040786C33E677365AC0C82123FD6A0040400B085D293C015AC01E472299F2004040A43FD8E1CEFE59C0CB58421BC500404017622A37AFEE59C0BEB2D51BCC004040C1B45A7D48D559C05191B64B8C004040809B2D0DBDC359C08D3C4C48420040407E9F359D8FC359C0FA6BA41BE50A40407B959D56D7C359C0C92F1765FD414040AFB8B53C28C359C0F881DBD6107A404081689B2AC2C259C099D8F3C75CB0404024FC63A87AC259C06AECA08C6DC8404024085AE820C259C053CB6F51C0E94040E8188CB7E5C159C0BC9042A966274140D0687B3673C159C05D658610675F4140B84886B79DC159C054E126E87D7B4140D9A1ED75ACC159C0981A19A3B09641409BE4FC436DC159C041D38BB2D3CF4140C921C07A72C159C09771E09404DF4140D63480008AC159C067C0E9082D0742402B8D2E11BFC159C01B14297BEC3E4240BCD50A6BD5BF59C063337BFC053F4240C89C5F659A8A59C0BFE81CFEBF3E42401DADBDD7378259C09FFBFCFF193F4240A6E97575BA6759C0F662DEE2FA3E4240D633B93CC44559C0C829356E783E42400D92E814453D59C05BAA8B72AC3E4240079D5391302359C0E4885840A73E424032D4EC28770059C026670D88383F424003522F68190059C0DFFDD4080C3F4240021726EBD7FF58C0A09F68275F074240BF85BA3FE1FF58C099006B9621F14140CE43326E060059C02B0544AE36CF4140B11342E0A9FF58C05892D4045AB6414095D2AD30D8FF58C0492BCD7A53974140751278EBC5FF58C0C5EAD17AF9834140E5CBFADFF3FF58C029F7ABABA55F41402B7F3540C6FF58C0B4DEA232FC4741407D928A1C3DFE58C0EDE1BD36ED474140BDD5A1D87CFC58C099758177314A4140A07BB196AAFB58C0C159265A224A41407955C2EE61F858C0106D33CA2C464140361FF9CA19F758C0DF905C95644241400C98BBC523F558C0237D507F3C4041400E784DBDCBF158C042240C19D73841409E07A993DBEB58C07126029952304140F975102D84E658C05FCBC3652F2F41408968354C7AE558C067138583453141404C1F628C01E558C0E500BCBD593441401131D48A78E358C0E2E82B1F27354140F08CD20629E058C039DDA008BB3341405210AD23B5DE58C063211CD0193141404023515E14DC58C0DA9AA338B12E4140614384BB42DA58C01C3C6F79412F4140F3EF04DB3FD958C065862013CB324140F779567C29D958C0692F1FCAEB3641400D2F321A55D758C007394D86A2394140E88B14D4B6D458C0CC61F333D6344140E899714D1FD158C0BF3C179CFD3241406D324F2A49D058C0D0013345242F414097D3FDA12CCD58C069471073812A41405D7C9C1F96CC58C022BA85FB102741403BA018FE1DCD58C077346DC8BB2041406F386EBA36CC58C09AD7632FA61C41401D82FFF74BCB58C0871F66923D1B41406BFABC1136C858C07E24BF98CC194140A8A089CC0AC558C0D6B7FD5BAE1A414029EE06C746C258C0A41FAE2179194140B7BD2563C7BF58C08A3D72A3D31A41401990769BFBBC58C09D3C6D68EA184140A5694E7011B958C065D92EB2981441403CC3C623EEB358C0091B5CFAB0124140FA46881ED9B158C04DB1F21EE71041409D323B1429AD58C02EB26E43BE104140BA3DACF1AEAB58C051AC1B2136134140B2A9E92E5FAA58C0B87B9122D51241406E264ACA15A858C02A02E6A14A144140B27E5CA7E2A658C0E5763C0464134140FB85BE22E8A458C0D1DDECC62D12414035BF5ADEB4A358C0C23B06AE7E0D4140A478F193FD9F58C02037205783084140EEF1198BB49C58C0759F8BD9F8064140BD7454A7FC9A58C010CEC337700841405F2577E5139A58C0DF1E05F5900A414073DCF2C20A9958C0F3EF52742D0B4140487DA9029D9858C0BD89A4EFD40E41401CEF4A5D729658C09671E60A34124140F4140B38889458C01E225A8BDB114140AB331DB0BF9158C054DAA44EBD0F414056C8AC1F158B58C098D4BA71C70E41405CB6F999C78858C07B45862DBB114140936590365F8758C0B7C4750B15134140392261530B8658C05363F02E3C11414065A29CB61A8758C0553984FBF2084140F0367F93898558C084EA4C49B1004140A46E2F6F938358C053822EEDB4FE404069AE6F0A868158C02CE41DAE58FE404043F1A164E97E58C08EB3A94C2D004140D4D72EA1D57C58C0FEB4B13252FC4040799E2421AD7C58C0D30BA154DCFA40409B8D61E3A67D58C04E694D9670F940402D132C22DD7C58C0473567F95FF7404067F909067E7E58C0C9E75F5CC1F44040B5083F26827E58C0F1A5EC7D88F34040FCECC9831F7D58C0CCCA692119F14040FB811E3E337A58C099D3B443E3EF404063007619AF7758C03EC694A777ED4040AF771A37957658C05D593AC7B7ED4040D4C599CE977258C09E0A12C3FDF14040C4379B496D7058C053FD583D52F740407EDB3A46AD6E58C08AB990FD3DF840408EDFA6A2176D58C0AFBDEED95EFC404049D906BEF76A58C0040489188EFE404001F617556E6658C0C69246BF19FC404021905D15EE6558C0E08EF28880F54040E6E6BCB3DC6458C0783AEF6C89F340404C4E0051836358C0A1E3166EB6F340407322492C2F6158C0FBBFBC0D5CF540407FCCCCC7945E58C0E798A11033F4404002FA36C6A25D58C054C3A59184F34040C798F265455D58C065D637F4FCF1404081EBE886FE5C58C0CF66E45E0CEB4040057D2F42445A58C0D660F16110E94040732C6C7C455758C039E2EF5F62EA40400F1963F9E45558C0E05FE29956EE4040F97A44162D5458C03FFDE7576CEF40406425E3D51E5458C0C9B6C232AEF240400A295ED1715158C0078CBBD7B3EF4040B7C26FB0E85058C068B44B3AEEED40403690ED0E105058C05B3D9FD7C0EF4040E8F1844EC44F58C05AEF70B379F24040E64B914A8B4D58C0287E11F1F0F340405459B127094C58C01518CF721CF340408CC4D684864A58C0A4D8FBF97EEE40407E764605CF4A58C015051ADD87EC404059FA40E87F4C58C0CD9F4A9F0AEB4040ED51C2E9594D58C0C71C6CA2EDE8404067F03807204C58C009A8E12F5EE0404079D17FE2C64958C00C35837548DD4040F9E4C31D6A4758C0038148D6EEDC4040C1359D7ACF4558C089495AD5AADD40403702E8395C4558C02BC031D30ADF40408865331BA14558C0633FDFE561E74040514BF856384358C07D7311236AE94040EF1D73BA064558C022CCCABF40EB4040FE50101B474558C0023F643DF4EC4040FF36CB598E4458C01B9A3B9CACED4040CCA24E14A84158C07401A7DF9AEB4040507C3A92644058C0B175DFFDE0EC404026D906503B3F58C08AC8B0F831F04040306171D13D3F58C08F6DA5EADEF840403A202D6EFB3D58C09C16106CFDF7404058856C69EF3B58C0C972C36956F9404053CAE0A8823B58C0873409A71EFB4040DF05A3E3843958C043A16EC99DF9404023C1B840853858C027C99D4E5CF640403DF0E61E453858C0CA1696562AF14040225C687B1F3758C07E41F8DA4EEE4040368096D8083658C0B6FC6A5BD7ED40409C063F141F3458C09C87597899EF40408FC89551103358C08745BBD85DEF4040D060B848F12F58C0C15AE1BF79EA4040B085E0A3902D58C07B05A89DBFEA40408CF836E2642C58C099B5497A8BEC4040A54BB802642B58C0E9D6EC2EC4F3404098A5A221A82A58C0F7F0694CF2F44040E10142B76C2558C009E3412CB8F24040C9F0EBF8522758C0B2DF13D476EE4040130F51767E2658C0BEF25C57E9EB40407F3E5870FE2358C0A3D159B9AAE94040F38712A9B12058C03F9A41B96BE8404070C90BA6102058C071B6417EE3E440403FEEC583351F58C0FC41491F9DE3404061C1D0DCDC1A58C042D8B139EBE4404033E1DDD3BF1758C01239A49FC8DE40405DE5052F431658C0590FBF2452DA404049F31C2B421458C024E29E03D8D94040AC13216A441358C0BFB4506069DB4040ECA01C6C8E1258C010B103578AE140408B31AA4BD01158C00521EEB301E340402D3BFCA19E0D58C0CDE91C94DEE04040B62F7F7EFC0B58C0C815D1921CE140402AC8D41CD20A58C09E902E907DE2404083553C3E570A58C0143300AB2FE640406D24593D110958C017CBFD8603E94040E90E60DFE70958C0BB8CE6467AE94040E9A5A141950B58C0B105120A7EE74040F759A4A2BC0B58C0B037D0286FE84040353BD581D80A58C0741E39661FEA404008F6B6DF8C0958C070D3BFE4F7EA4040D008D759050758C0B801FA6428EA40405E52BCB8DF0558C0B5702D621EEC404078CBCD32160358C0D9B7C441B2EB404063886A71BA0158C0E53E7D5F95ED4040DDD880AEEA0058C03DE4C84012EC40401D40158E210058C0FBD518BFB4ED40406031E80F2F0058C0FF4BA57CCEEF404001C9D64EA5FF57C007A21E9D0FF040400CDBE0C991FE57C09D6D34A0D4ED4040EE395C8760FD57C0275CC9E0BCEE404040EDE5665FFC57C0FEB18DDFEDF140400CA32EA5BBFB57C034F66A2000F2404092E1A91032F657C0FEF0F36AAAEB404081E818CDE0F457C02FC64B8CEBEB4040A5C88C29EDF257C0B4E205EDB0EE40404846A16333F157C045D2570FFEEC404050BC3385EDF057C0CEB2918E86F040404D3FCC45B3F057C093314A8E5FF24040D32646A4D0EF57C0878346CFA5F34040578218FCCBEC57C0BE7500F68CF24040F2FFA5138FE857C0980DE85DC9F54040780B5B103FE757C0BD7B62C0CDF540407E9CCD515DE757C03115ABDFE8F74040341EDED0CDE657C01983FA80EAF8404054A8676908E457C098C1B5A6D4F740402C70E7C4FAE257C0A3589DC9BAF34040E8B9BBA044E157C0BA18334D10F4404004755BE1B9E157C09F92660CEFF2404076396C040EE357C086B3BA6956F240401C046063D5E257C00EDB5B6A63F1404057FC4CFFD6E057C0D0A64D6EECF240400099481CF1DF57C0DE817C90DFF040407149EE99F9DD57C0BC487B127AF14040800BA5F7EADC57C0CB617174D4EE4040CC61A02D23D557C0D4582FBE7DEF40407E1FBB8F88D557C009EC231CD8F24040B4D51D0C57D357C0E4D3255F80F14040D2F3FEAA58D257C060553B8089F14040EBFFE8EBC3D157C0E79F4D7F82F540407AAE9CE9E2D057C0F17B7FA1EEF24040FDBFE30814D057C0365BF341DBF3404099F0B1EA18D057C0FCB691DFE0F740406743374AFECE57C06C7D371E84FB40403E6AB6BE81C957C0AB64F4A2C9F84040BDDE1F5C34C857C001D87BE371F84040E1EF1B3B1FC857C02F38BD8468F540409EC2FB19A5C757C060BC4825C9F440400BDD79171EC657C00A319905FFF54040ABF2D29547C557C069F9D16593F540403EE02396C1C557C02109A0A6D1F2404045A62D755DC557C04030F1A6BCF140408207B0B313C457C0FEF46F0679F5404055930C330EC457C045AD0967CAF24040490C5CF0C1C257C0415DBC0739F14040421832CF67C257C0E4042E68EBEE4040AD85B2ECD4C057C0B675CFE85DEF40407E78020954BF57C072C9E7E99AED4040C2DF99E502BE57C036A591AAE3EE404013E0A8C372BD57C059BA894B91EC4040606AD0BF2ABC57C0F9556EACA3EB404095CA4C1F33BC57C00EF75DEC6FE84040FD4F3EFBC7BA57C06AA63EAD7CE8404012B9193929BA57C079FCA9EDDBE6404051839E9980BA57C0F5A2580D15E54040521AFB5270B857C0AFCA8C8E35E34040021EAF0DEBB657C085DD204FEDDF404040441EA670B457C0A6E66C10F0DF4040F2CAFF826BB357C0C802EB31AEDE40407087987F28B257C0C7E3B2716EE04040415CD2BBEBB057C041AF2AB260E0404054ACFB3E10B257C0AB8F233206DF4040F2314BBF22B257C096034253ECDD4040D101E6B8FFAF57C0B69B3DF44FDE40401A0277DBD3B057C09F54E795C3DB404036674B3882AF57C0022AB3570DDC404094A4F4D94CB057C01BF4E5D69BDA4040D24A64B87AAF57C0C0AA96B9C6D940402509B6933CAC57C0138EA7045FD84040E1F5A471CBAA57C07C5158C82BD940405E1267D0F6A957C04560F9AAA0D84040BE1F440F40A957C0D94478EEC0D6404015D73A31C3AA57C0C1A8890AF6D540404DB27751DBAA57C007EBBA2A45D5404045B033F028AA57C0B5E8E30CF9D4404099875CEEE4A857C01C5B41B0C9D540402B5407CE71A857C0F3096CB08DD74040C1A1A14A79A657C05806405736D540407B0C90C975A557C0F87E9F99ECD640402714B8A809A557C0EEFD0CBBD5D54040CA26FA46E6A357C04C2D9CFE04D64040E37C27C72FA457C0B07D4A5EE1D440407DB0EDA876A557C03034737AC4D440405ED82789ABA557C024F7817AE9D3404059D6BB27E8A457C04E7C059D7DD340408B93FF84EBA257C04F2DFFC1B3D44040475C3064B2A257C05CB11983FDD240404E43E965FEA357C09394E5FF4BD24040ACE09DA5FDA357C077CB5B005DD140407FDC6EC439A357C08308CCE2FFD04040247268212AA157C01683BEE751D240407DC839E19DA157C0C45BC16781CF404081861A60B0A057C015989F29C2D04040E79EAE5E0DA057C0D9B2FACBC3CF40407FE9061C829E57C04F42D30EE8D04040E9993357E99B57C0A62814D47AD14040EDD45036F09B57C08CA80B95F8CE4040ACC36D97E99C57C0C19BBF135FCD4040048704D6629C57C0404D66155ECC4040E52E47546F9B57C0F279D6F772CC4040EB444F90089A57C0E01ECDDC6BC94040DF16B30E319957C0CC93941E9CC940407DA0D3AD469857C0729940FFF5CB40405BD3B3ACBB9757C09420C7608ACB404017DCFB2BD79757C0BD33D8E150C940409CA9684E4F9957C03AB945DFBBC740405F7D9ACABD9757C01D173A641EC640400A74C3860D9557C08FA7CC6860C94040DD54B7825D9357C0A6A8468E4DC740401A175F23239357C04A85558C3CCA4040FA0A5B21DE9157C003BB762E73CB4040C47F49006D9157C0660FE84FD8CA40406E79845F959157C0801829F2EAC7404025D3EC1B328F57C09D353C73D8CB4040F4645979498E57C070941CD5FCCA4040EBC0387A138F57C068DA4557E4C740404ED63C56828D57C070E0361970C7404052DEAC96278D57C00104FED5E7CA40408B6A15B0388A57C09718CAB704CC4040E1BE2E6EF18957C092A6A63B9AC84040F778E145548657C020C17FFE5BC94040934F53E48E8557C0CF10C9FDC2CA4040559740A0F18357C040EA4120E6C9404008EE8EBB4F8257C03B1331252CC7404094C59A27598257C013A689339EA24040C47C86DB7D8257C03A676281FF824040752CB79CAC8257C0B1176C47F5704040051128A1958257C086E22D60F458404085F2E64B448257C0DD75F13DD7314040B08DE1B33C8257C0B87539CB8C1940407793C4A0418257C0579F8C4CA3FE3F40C3BCDB1DA58057C015E782CE42FD3F403AA8B81D4B8057C05F09D95365FA3F404C34EBBB8D7E57C09A926F7E42F23F4048B4D45B177E57C04F414F875FEC3F40F22A8818E67B57C045D7DB28DDE83F40675CC056C27A57C052F7BC45EDE83F40EDB2D5171D7B57C0359A9F0E8CE43F407B981F95907957C021ED810906E53F4018D7EA34227957C001A06BB4C7DE3F40B8DDBEB3697857C09F32AD7120DF3F40442EE6732A7857C09B63121BACD93F409A0241535C7757C081C383E843D13F408582ECAF687557C0F937A72B5CCD3F40422BF3CE9F7457C0690518D659C63F40B81D86D0347557C034E87841E2C03F4076FFA1EDD97357C023C7A6AA03BB3F409832072E2B7457C00B8B56F567B63F4030F42AEDC57357C06586CF562EB53F40A576328BB77257C082C0CD5229B63F402813D94CF87357C0B39A8BC8BBAC3F4041E4E58B9F7357C064880BB368A73F401AA6B68C277457C026058697ECA53F407CF3CB2C777457C0EFE1BBC7469E3F403FD1D82E7D7557C0954E0A8B889D3F405C5A0EAE4C7557C0744728D721973F40F5E9C7AB417457C002578E1CC9933F4011039C8AE27357C09B9010662A8F3F4001CB02A6F07157C0FB5ABB90AE883F40F499B703DD7057C031504330E9873F4050EAD5C1DA6F57C001BC6F8BB3893F4073D3627FD66E57C0697D9070A5853F40E772F8BB2E6D57C08C7DCBAB4F853F40668401FD066E57C092CA0B7CDE7E3F40695EFD200A7057C0E82E82E5A07D3F408530FA60177057C00B260D88557C3F40C887D09C866E57C04E059EF0AB753F40510CF2D8B56C57C06A786DE92D763F40DAA5EC58EF6C57C05FD21D5349723F40AD2A93D6FA6B57C0DD92683435703F40B8DF7957906C57C029395BFB8B6D3F40F2B7BBB6746C57C077806CC1856A3F4019CA5ED5026C57C090BF310504683F40C8DDC731826A57C0857003C504663F406FA86FF0516A57C07AE18A32615F3F402B92EF6CA46857C08E6AB40CBF5F3F404346ED90576B57C0A5C1742D1D543F407340D810A26B57C020E0ABD617503F40F9593AEC006A57C01A22A8606F493F40146ED44A546957C0C6C0ECBC5A4A3F40313D1968626857C0EA7F7AA32A463F406CA33DE6766757C044BBEF3FA7463F4091E841E52B6757C0F9606F022D453F404B5311841D6757C01A36D9310C3E3F40EFE1CA60CE6557C0EE54E4F5D83A3F40E7C04E21996657C062D47C4A02333F40B4F57DFF056657C09302F8D32D2E3F401E7AD47CEF6457C050D217B51D2C3F40C49AF7B93F6357C01E372505ED303F40461E9AB6DC6157C08719D5239B2F3F4069A31116BC6157C0F09FD2A7A22D3F406B338157616257C0ED2D2EEB302D3F4043DAD0F5D26157C00BADB5F0C2293F40A66F02D8D66257C0787E8676CB283F4011331556696257C0630BC903F4213F40ADCC9E14CF6157C04EB99C0549203F40EBFD30B5416257C08FE5064DC31D3F4052D61078A36357C0EC5786550A1C3F40F0C22198D96357C0146AE03AC9193F409F8FB355C56257C0436F881A4E183F401BCD6775D56257C051A9B7E122153F40DC7F7C51196157C02E742D202A133F40793D1B92A86157C0B8A33CCCA20E3F408763300F796057C0D7FAF471020A3F40A5499BD3066357C01C83F769AB033F40E078EBD52A6457C03CCECA6BAC043F409B4F1E365B6457C0FB0F60AF5B033F40C78619968B6457C0AEBA87D959FF3E4058C2E974E96357C02B928C19ECFD3E403DAA91F6A56457C05A203583F3F93E40F749D753206357C04C360D206BF83E400CEC9C92666257C0FA4D972303F53E40834DC031126257C0B46B2240FFF53E4047D68991A66157C09B5D6BAA9EEF3E405AE43B12EE6157C02FA6E8CE5AED3E401DA47ED42F6357C009DB8814D2EC3E4069439EF4FC6257C093202DDDD0E73E400F7BBA36236457C00CCF9DE2F1E63E40F9934717656457C09A51032AEDE23E40E7B99DB6E76357C03C23756F40DF3E40E5C7F2F5636357C03863A57248DC3E405154A877436457C02C8F3E9C68D83E4062179B76926357C0F3376DBBB0D73E4002E43536416357C01E82D0601BD43E40BEAEFC39406557C043D382925FCD3E40F57AB45A766557C0B976D200BBC53E40CB47CE9D976757C07AB32930F9BE3E40204C739BE66657C0C15B9D2D72BB3E40C0BFAFBC8C6757C0681F816F95BB3E409694229A346757C02539D34DE5B53E40827877B8896757C0284C546EDFAF3E40CE998F1B406A57C036818DB64DAC3E40485673BA666B57C08D79681AD0A33E403CD10CFC5A6C57C093EC10FEE6A33E402B71A719D36B57C0DAD47EFBA59F3E401528C9F9576C57C08AED35FEB19D3E405E6E3316FE6A57C0674AEEB818993E405B1679D8636C57C0987EAB7D5A993E40A69DE979F36D57C0CC9ED6C36B963E4098434A98F46D57C089FC86C47F913E405F1C0D18126F57C087082849B48B3E4071E6EA12296D57C0DA9A7641E7853E4057C05072BF6D57C0B9C5C2645C813E406239B1D0466D57C09F2DB9E3167F3E404FCFA5F0C26D57C022A9DB07247D3E40901C996CAE6C57C07667F84762783E40B12E39AC076D57C0D8569E8B74763E40FAE8FF68976C57C009F0B3AE5D713E40B8F3886A306E57C04A2CE717E56E3E4023ACFEE9886F57C0A0591102B6683E40CDAD7EC8537057C0C05D814BCA613E406377C645DF6F57C028AD510D1C5E3E408CA020C69B7057C044AD6EB2B65A3E402CB88D24997057C0D52D2DD550573E40C1C02E5CB76E57C0C631A2791C4E3E40273E3797C26C57C00149CD162F4C3E40023CB412486D57C0931E4709553D3E40FC0ACFB3C26D57C0059D219173383E4008E2DCF2166D57C00074CF805A2E3E40E4E6A5B1906C57C08FAC58C2062D3E40EFDE65F2C96C57C01649C80CA9263E40BFA01C50BB6B57C0EAA9A32C00263E40086F8370E96B57C044C31ED036243E4099FF5632B96C57C042FC841035243E40FDB47C129D6C57C0E99FAD593E1E3E4014DA10D4586D57C076070E5B6D1D3E40BEE83A55D36D57C023E44D838B183E4017971BF59B6D57C007471D118C0F3E405D7F92DCA97057C04E333AC794013E4089372F69E07657C0F3B0B273A9FD3D40BF9F5BE6D07657C04E48881DFEF63D401C5DA887EC7C57C064CA06668ED13D40D84797B0727557C03D302E2ABFAC3D402830EF7C328457C0DA26CCB89EAC3D4023BF7012DC9657C053211C9C648F3D40A9362CF4239857C0AEAA74E35C8D3D407BC03D8EB1AB57C00F073B27E26E3D403356105412B157C01E611B063E5D3D40AF7A59B744B257C01B58FBBA2C623D4094F9AFAFA7AB57C02D02FA11B0793D40490C1327AAA457C0867E163B85883D40F7A54B2018A057C0E92369898B843D401BC8893D149E57C02389762E988E3D4017944C41B4A057C0DD9815D99D8B3D405ABD9B432BA257C02110E9F1E08D3D40A04CC5E622A457C0ECFD5D4148943D40A264703D73B257C0BD2333EBED893D4096E2883639AD57C0447F9A4DA3A83D401D843398D4AC57C03566F9F939C13D40C095125D19AF57C07BF2D9A70FCB3D4094BCC06818B557C0095469AC94C23D40F9D3DE8ECAB857C0AA45C93D34AB3D40AC0E5CD5B2BB57C0FE20C621B4AE3D40C1B29688A9C557C06BDA2768E0CD3D40871E364499C257C0624B4CED38B63D403FC6699D54BF57C0438764CD0FAE3D400EC603BFEAC057C02F17C6083B8F3D400324D8AE53BA57C0D50F13F524803D408E3769B7E9BE57C0F9AB3B46F4753D401667D0D169BC57C03EF2708604773D40BA86DA30F9BC57C0EF6B19DBA96C3D40AD55192B79BA57C079082EC09B6B3D40988F2B4DB3BA57C0BDF1DDB0B3723D4057D2DEA60BB957C055B77E6C49663D40E9211CFB31B457C059E02EC0045F3D405CC7A32611B957C0B3616C6FE1643D4070D0670389B957C032093F5C1B4F3D40055747ABE2BC57C0A7726E107F533D407D74ABB842C457C006C930B634323D40BB95046749CA57C089085AFD44333D40B87A112A8FCA57C0B998927F271E3D40BE3882AFA4CC57C001E0D3C6FF1A3D407ACBF45BE9CF57C0BBC05AFF87FA3C4036760136B7E157C06D129DF5B1CD3C404E39409ABAEB57C0146829B42ABA3C40C9E560B7FAEA57C0894A07C0C0C03C400B53B58857F257C05BDE99CA37BD3C40F47E0CCF00FC57C0712EA510D3B03C409B0AA77335FD57C0DE6D2C23799F3C4049F72BDEF3EC57C08EC4769F20B83C400BBE2DAC3C0D58C0BA64150D197D3C40AC8074177BFF57C009A3A8FEC0983C40445B0CB3F9FE57C0133F305645A73C405BC2DDAA380F58C0C8B57C1954923C40E93CD249500F58C0AAC66587EE983C405DC1F302180A58C0730AB0708B9C3C40C5563EA8670F58C065733EED97A23C40857C51FAAE0958C062D30CE74FC33C407F818043980D58C0C41DA683DEAF3C404EBAA06B511258C0E867118178A93C40C75600E8511158C02AD67F5D91B53C408831E2D0E31458C0DDA6E07A65A23C40FFC12375521758C0369BF3EA459E3C40089227F6161958C030BF896DA7AB3C409B6E9394261958C06B8E82AAEEB93C40441D9F78591B58C09DEAC63958B63C404BF5C699CB1C58C06CB15DA35BC13C40013DBD39AE1B58C036B28DA390B23C40E0A2D455D51958C01574F96F42B83C401099FA79D11A58C0652B9B6591A33C408619B5960A1858C01C2F1BB1409C3C4017DB8A03741F58C07D60AC00A68E3C4041E9377DFE1B58C0E04C5C62E6983C40B87539BD181D58C096AC6820FDA73C40A8D0D201F21E58C0870FCD272C993C40325D8904C72058C094C3D1C3C39B3C405FB46563C42058C004509E4B5AA63C40C923688A852458C025EA4954F4A23C40244FF028882458C044C366552EB13C4097380246A32458C09CC4440EF6CE3C40CC1DCF49E92458C01225BED5E2B03C405220934ADF2558C0AC2A41A8B6B73C40226EF0B0642958C029699CCBE3B63C40781090D3412A58C05DFB76BEE9AD3C40D1EA106FD82658C081055B7BB89F3C4065AA4A11142758C06D7210DE288F3C40377DDB0B492458C047CA5B360A933C4084FB6F44281F58C059BC64FEA9813C40AD00B48E0F2458C06F7654CE4B783C40D431E249332158C092A927140B763C40ECAACF23831E58C0D02A2181EE7F3C4068C85FBE051958C0C67399D9306F3C408FF31E21572A58C0F29872DE794E3C40A84226C4F72C58C086ACA4AC29573C4096FE2C820F2D58C06FA0652F6B653C40C22E1E066D2F58C0B23A6D6B5B673C4079456708643258C0CEC27624507A3C406429B7ADBE3458C0B172E1F32D733C404EB1C669783258C0110AA81450723C40251EB367993058C015F83CE743693C40DACB45CAA33158C0E35E425154643C406C9176F2A33658C0D8DA3449C0673C405F0700AD763258C07EB879054E5A3C40C02C2F8E563258C0DA41AF192A503C408B606450CA3258C092D96D4E8B453C400E469FEFCD3158C074864369C93A3C40F82022F2733358C040E3753334363C40AF1FC2FDDF3C58C0490E5873591D3C408680AB5C6E3A58C0FC5D6D2AD0413C4086242EC26F3E58C088E3378606363C40023D7CDE3E3C58C0EC11931BE32F3C40805AD17F6C3E58C0A5FA34B2861D3C4057E3E3232B4258C02CD581803F233C40FD32FB84864158C0C69DC1AE38333C4057CB5967744858C0ADE9B3AA76213C407CE81808AF4858C0612A24537F293C40E04B4AC9C44A58C09FDFFD56E5283C40FC86F2A7114A58C084C19336DE1D3C404346CBEAAC5058C0266CEDFDA4103C40C749D0C9744F58C05E0CEACA870C3C403F13A7EA505158C00DFA1DD9B6063C40BAD27589224F58C0AEA42FD1720A3C40262E54E5E44758C0D5A2E2A4F70D3C404465D002B54158C0E2023098A81B3C40170687608A4158C0E3AF729E41053C40274624615A4758C02FC0BD746AEA3B40B8FA17E2864C58C0B5125FAA01D03B40843505A5D34F58C02103508397D23B40E92D8EC3AB4D58C033F0F59AD7D43B400A28D607295258C07FA1BF3417DF3B400DAF26CB1F5758C0997A2A221BD73B404C92FE0A235658C07FE5F7689CDF3B4046F24431B25E58C0F1B248846FDA3B40A4E37412CE5F58C0A616B76F32E03B40323293F3676158C0953606562ADD3B40123520D2FC5F58C05B43D588F2D73B40502F85B0B95E58C05E2E1BDE11D23B4045F73F4CE25858C0CB947844ECD43B4058A95BAB655958C0EA4FF5D369C53B4032795F265B5458C049AA8FAD68B63B40776636C8625658C08054160534B73B404003FD857F5458C0C52F23BCE1B03B40017677E7A15658C0022BDFF61FA43B40D6CE9E2A915958C09DCF49F12CA23B40944BB6E6415658C0B890FF7EBAA13B407845CE85CE5358C0EBCBE3D14AB53B4093A4A601015058C099815BAB6BB03B40AD4A6D043B5558C0BAA336F208903B40D2846BDD665A58C0211977AA43523B4090193B850B6058C02AB8CCBAEA513B4030282EEF7F6058C039A4972685703B40DBDA1D69D56158C0EC302BEF2B583B4028D9A7AB6C6658C0CEE483A0EA4C3B40D03FBDB9057058C089D89D00846B3B404D6E9AB1896B58C0B2EE3101714B3B40752420BB3D7258C06F7B1802BD493B40F62A5A63196358C094BE2204043B3B40470751DA5B5B58C0D93CF2DDF4433B4075C33CB93D6058C0535C3557F5143B409B594233AC5E58C0D506CBC630FF3A40AAA26CBD676458C06DA9BD916AFA3A40539B9678BB6358C02F333FCFACD83A402503E6CDBB5F58C0F715B5454BCB3A40924E2FE1EC5C58C0737AD08EF0993A40B651337B455B58C0685AEEFCC0843A408AC13CE1655E58C0D725818E267A3A40164F3CFCF85A58C007BA2513AA623A40E33E0FF59C5758C01F5B8740025C3A402F689FB4A15658C03E50B127CC2E3A403E6F7B44375058C034E2C67C94113A40D089E968B35158C0474D3793AC003A4065C3F97DA74D58C0C443A9B169023A40CDA6A6D3094B58C03C87991E76F43940233E126CAC5358C0CF8578DA29F739407DD8BF09805358C075F9B5C263F039404F98CB55665858C04B62DC60D9EA3940727D2F91B25858C0E49BC53681D83940F861A899D05B58C04B36A37376D83940705E5C58C86558C0E2467BB1FFEE39400EF30318D06458C02F39F6095CF4394062C1B17D3E6758C02F324B275DF63940B0D702C57C6958C082902AD317063A405EA1A686887758C03AC796AB7C0F3A402178EC22958258C0B0EA1ACF4B0F3A4007DD0988E78458C00F1D879CF4083A40F965F808588558C08B96B2CDEC103A407EEB7DD9DC8C58C05E5E9E76440E3A400F1BB405B49258C0F11D849E34193A40599F5EA4629158C09E9E8A330A1F3A40480ED666B99258C053711DEC16223A40CF8ED2A9019558C068465415AC1C3A403AF5C12D3D9658C07392DB5CB6283A4085BCD2D1A09858C012A2EFBB08283A408E003A3D099D58C0B7A2E899A4383A40E0FF40C0489F58C038160C62AF333A405A34E6CB6AA658C01F93CEFAC3423A40DCD1F4F067AB58C09D7D273C0E3E3A40D206901D7DB458C03580AA1D1B603A407A75886230BA58C0B8DCF3F7545C3A408C0D2A0622BC58C0B1D99B6049653A40EFD58FAFD9C658C000A7228B7C6B3A40FAEB719383C658C0E7F4B1EA197D3A405A0F47B8D0CA58C0C54A7FB0CA8B3A40FDDC51D9A1CA58C01FBD415889943A403D6F39274BD258C0139E96D590DB3A4073F5E47003D958C07D0C9FE76AF23A40639C357227D958C0C8929BC8F0FE3A404F910BF824DD58C00920B1CD69073B40829B4197FFDB58C08999019812333B40AD67B33ACCDD58C0833EF9F12A453B40C298FB62CFE258C059FC24F6A6513B401F63BB7B69DF58C00B2B618CB57D3B402707C85FBBE158C09CAFD3232C813B406717761F2BE358C0DE820E4DE89C3B408DEFC993BFED58C086C898F16EA93B40472988403AF458C08925C7F4C7C73B402D6D560801F858C0433D7FE547CC3B40DD24B1D34CFC58C072538CA4B6FC3B40A9D4EDDA97FF58C036F45114F5003C40601D8E8C390659C08C3B86F290273C40322D8DFEB80D59C0D50F42CBC3333C400F7147E1520E59C08B51B8D5E13D3C40CDCF1ACC161359C069FEA4D9D6473C403BB7E56CC41259C0A575CBA614523C40F3C49CD6851659C056A9D67BFA643C407DD9D1BC221859C0356FFA0F9A7A3C40EBBBB459271659C0D22F6C4846803C4041AF3C63DF1A59C0F8D76B29618B3C40893A7061D31959C035EFA2B309973C40CC20F48EE31F59C09C6A1C4447A93C405872D7FFC42559C0D93C4EF3FBE43C40FC132F08722959C03E37353A2FEC3C4085243210D32A59C053E7D85F8F143D40AEC3E2E0363159C0D9336AE4B32A3D40B43D3EE7073359C0CDB476F7233E3D4057BF31869A4059C08A529D8C9C5F3D40361570D0554459C0F6278F6749793D4097E45185C15059C0C70CBA49D5863D403658FD68515059C0E9A5C8CB03A13D40DE7FE7CBCB5359C09D7D4B98C4943D40525F568E995359C0713799AC13A73D40A9A08D339A5759C036E3099649A83D408C281CBAA75A59C09130B651E2BE3D40D7D03EDAB45959C064317F0726C53D4015BA445DB95C59C0AF711A3FC3C23D40178E5280225E59C034E35309F5C93D4093BAC7A57A6259C0A184178762C33D403153EF88D66259C0BDE3794C71CF3D40E728F58A3D6559C00D608F3CEEC33D405E1B28D1F66859C05BB76875D5C13D402F3A0C819B7059C088021AEF90C93D4018802C078F7359C080D5EB29BBC73D403F7A9CAA727459C08979889777D03D40C3840C182D7B59C0D76A9351E8C93D40B4A1DF7F517E59C0E2F5ED1BA8D13D40DC6CB32C1F8459C03ED0B59CE6C83D400A34F4B7C89459C0DE8F3FF25BE13D406F0790FD8C9759C0B6AAF29771D83D4057D3605EA79859C07BDFA8F0A4C43D40424AB9B039A059C013F05A5720C93D40B1F931175AA359C0D96F2800ECBF3D4052E8135BECA459C05656F2F447C73D40416E64A3D5A859C0600C054287BB3D40F14BFB8850AB59C01318FE3A92BE3D4005EF54BF87B359C05CC3229DC4873D407CC8B721A6B459C09973F4C97B693D405699326C8AB859C08D5B79B8835A3D407097FD2F29BA59C05CAE24D6F7443D40A309A28776B759C0CB08BC8FAF3A3D40707FE33B44BF59C089CC10CEE9303D40E1BB85AFD9C959C077DAAFA498FA3C40F92F332317D159C09F3ACC25F6013D402206A7A2F8D159C0FE451AAD90FC3C409E1BDE8A80D559C080EA0784F00C3D40A1A586CD0ED859C0977F7BC445083D40707E58B95EDE59C004CBD3C184123D4081157965B5E159C06A638EDD97253D40CB60133F21EE59C010FC3964DA303D407416276561EF59C018AA9B32053B3D4081B2D78816F259C016E474EFE03A3D4076F4FCA92AF159C06657E3550C483D40BB9B7ECB65F259C04A85D31B78443D4009CD0063F3025AC0DD3F0B5A0C543D40AE08670C8D0A5AC01EB4FABDA1663D40BE091632220D5AC0A2C7D168F67B3D404CBFFC5C32185AC052D27DDF008D3D40A1485A6549225AC031FC8B11FDAD3D407E4D82A0FE245AC0FB6F7F1AE0CE3D40C4BB83C6302B5AC0FB9AE4A3D1E83D40E3F785469B2C5AC018D03FDDB50E3E402375FF24372B5AC059BD05C22C263E408FAD348CFF2C5AC07A21E49D173D3E404F5729DC1F345AC0979C6F25C2593E40DC27463BA5335AC0AB53AA9A68603E40B54618829F365AC034AE7C1375643E40639F5FEA08395AC0611A5F6C19923E40AF1FAEFB313F5AC049EBDB2E37A43E40C20E17DFDF3F5AC004094CBE39AF3E4074EAF067E8435AC0353A567A21B03E4072524F01C04D5AC08E30FDE1EDCF3E4019CCDF668E505AC001902E063CCC3E400448464B70525AC0D1B8239903D53E40383DED4D1D545AC0703BF19F0FD13E400DDEC23703595AC069D99D726CDA3E406525487B365A5AC0A1F129C013E73E400807226E83635AC010A4C65C98FF3E401737FC92A3665AC053B5D5B428163F40389B28C64B715AC04878FFAEC02B3F404402E9C2ED7F5AC0FE05B641D9643F4001030000000100000005000000E37CBEE278BA57C00B71B9D6FF413D405C2A70F31FB157C0B2B5D451BA573D40BAB41F10E9AF57C060A9699ED9513D40E3A12681C2C657C0C7FFD224E2183D40E37CBEE278BA57C00B71B9D6FF413D40010300000001000000080000003020B1027B1958C02E6E65E49B583C40183EBFD36E3558C0C3BCA4B90D113C40B9AACF71763358C0C1D584AF252C3C4063B5F58B4E2F58C06300640A0F2F3C40EA5663B2122258C0EFFDBE158B513C4005A29BCAA61D58C0771D6E507C533C4088D972430F1B58C062B164CF47643C403020B1027B1958C02E6E65E49B583C40010300000001000000090000005A1B9BBB2C3C58C00CAC8088D50B3C404FE2A717DA3758C018BE0BC9B6213C404A8B44B49C3558C07201D85F251A3C400F623C15A93658C036ABF9E5B80C3C40126BBA1B314358C0EEE304B15CD73B405070F29C944158C059A7309428EA3B406A04D61AC73C58C0DCDAD4581DFC3B40B6DA22FD493E58C0CC38FD4C4B003C405A1B9BBB2C3C58C00CAC8088D50B3C400103000000010000000D0000007E8CB715005758C08CBCC1E0B6483B40F757E0124C5858C0CD9FAA7EF5353B40B8074137165858C08604297EF3483B40830A5E3F7D5558C03CE9F96FEE703B40B482059EEE4F58C00EF7E2D9D9943B40750CECA0925058C09B397584EDA63B404D58DDDB0B4D58C0356994E0C49C3B40341F699DE84A58C00B3E117C30B53B401D64F3FBD54458C0DEA87EA9C3CF3B40A8861A5E404758C092E0F623CCD13B40E9C073FB714358C08B938FD9ADD43B401D59C6BB554E58C0D60B64DD06933B407E8CB715005758C08CBCC1E0B6483B400103000000010000001500000026073FEE495358C007FFB413F3993A402FA5DC18EE5658C08B73C9F8FCB43A4040835E006C5858C0FB81F21E1AD23A4006206906515958C0B7E9E82D1DEC3A403112EDCFAC5958C0F1A8D9CE8E1C3B40DEDE4F33E65858C029F5B9A1B4333B40C9E388323E5858C00D4C0B016C343B40CEF0DAADC75858C0E1F33C77FA183B40C2BD04066C5858C015E9FEE008F33A405BE1C51CEE5658C0DF0E676891CD3A409EFF6D2DF35258C0384714F4DB993A40A77ADC01DF4E58C0872E912D226B3A40264342DB7E4C58C08AB033B174423A40B72834D7024B58C05627CDD4FC133A400E7B53587E4B58C0ACA58AB780123A40D68027FD624D58C0F15DD3953A403A4085B46900804E58C0C560EB8B51593A4086BB4CA4185058C051AE034E6E6B3A406699B9C61E5158C0BD098B33B07A3A4055F38DE9D75158C069536A94518A3A4026073FEE495358C007FFB413F3993A40');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('45',NULL,'UT','UTAH','N','963','0106000020E610000001000000010300000001000000290000001B0E6D8506835CC0FE035B989E114340034A09C2E2825CC0BC7AB9A419494340B6F16147D5825CC0C8506956E9564340B020161691825CC02E5097A0F3C443400056B9D08C825CC078E4C5DD52F443408D5D6F5D70825CC01ABCECC6360E4440B90BFF1171825CC0C0A7C733B47F4440766C922A80825CC033CCEAF768FF4440FC213E34553F5CC0413ADD932500454003A3535B6A095CC0B689CA00E1FF4440BC7F3BD46E065CC0533AE7624B004540A4DB434DA7DF5BC00D7BFC9905004540BC87CDDB1DC35BC0BD512E9783FF4440B2A0E1B544C35BC09AC0FA500FCA4440517A90404EC35BC047DB971514A144403140D9F343C35BC06E454F0D907F444076071D3C0B845BC0CCC837ECBA7F44406F60B07A23805BC0A4F91A57B17F4440F62F859617435BC0DC4D47AACC7F4440A1891437F4425BC0324DD54028554440291856E547435BC0222B3409F21A444063EBC9015D435BC03718741B25D44340580682036D435BC0E6D94A6653C243403E5DCB694A435BC00D32F52234AE4340A53F5CE473435BC0EC1C98B8503F4340BDFF9F3A93435BC0540A3D8B591F4340299C541DC8425BC0F32ED9549313434008A5C9E4C3425BC016631EFB96F14240B517BA26EB425BC0528FF3BABED0424076244D4C1A435BC052D6EBED917F42409024DF1AD07F5BC03BFBC211FC7E424099557E6EF19C5BC0141A088BF17E4240E5EA5850FB9E5BC014A6C1A5808042409E2DF8305DAF5BC06792228751804240531C0464CBD65BC0BAB23F063880424018B9973B2F0F5CC0512C78496C7F424082FC53ACB8225CC08363A348BE7F4240EB4D405499395CC00934E35C847F4240907D1EE7CF825CC07529028E8E7F42405641475106835CC02B6D65F19ACC42401B0E6D8506835CC0FE035B989E114340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('46',NULL,'VT','VERMONT','P','964','0106000020E610000001000000010300000001000000820000005E68460D845052C05F21AAD97E5F45409C3E96CE3B5152C0F9328678AD5F4540313F0072F45252C03E61D0B4DA664540961BE7B0E45152C04164AF33266B4540809C1C12AA5152C0A748D58E5B7845407C7AC12B015052C049527B10CAA745400024DCCD414F52C00EFEA281A4C14540D9D91F93A35052C066762DD799C74540E192A256A65252C0932F53B39AC94540759A92F7075252C01A9F828FEDCB45404E36C19AD25252C05BF804C950CF4540D11D191C6D5352C0ACCD8CA7F6CF4540ACECBF9F465752C0E0773E48B8CE45407CFAFADCD65852C02D5529B3D9C8454020489EC0C55A52C0494F2DAF8ECA454067621FC6115B52C04A28D022E9D0454011C7524ABE5752C0688A6C906DDB45403DCC0BADD35652C0466F7DE7D6E0454059DA4DCFF95652C07BABE483A3E3454015721B949F5852C05574FC1DFAE6454010D78DFA015852C007DA7FB167F1454020234E00F15952C07119266A18F54540E34733C8B65A52C0AE15EC3C7DFE45402E0E25CA205A52C06586701855024640BB41946FE75B52C0C09BCDD0D805464072AF2691DA5B52C0D1327FCD2D0846404BA56112295A52C0A909A368A50D46405B2B01751A5A52C085685BE36F1146406EEAACB5735852C00F4F5B9F07164640F3C2D637265852C088125A7AC219464065949E748A5352C087BE7B574C214640A196843F1B5552C0422689A6062F464073FFF61E335352C04DC5A182E833464031E03CC0C55252C0CBC5E0BE673746400FAC5CAB675552C0733B408CAC454640DB261A8D425652C08B694C8AE8464640FD336A50C35752C04204BD24224A4640DE3E86D26F5852C0053EEFDB554F4640A40ADD51B05752C0198C8D59325146403F21DFD2E05752C0513D54B4A45446402E2301F2EB5652C0B3601251165746405F6391D4E15752C09F2B6BC7B35C4640DE6A1E11EA5452C069D089404F66464041441B959E5752C0E790F8DAD868464077B8CFB6775852C0348BE616896C4640C01F59D1875552C0AF97B7905F77464072173AD3725652C0C3C9424AB17D464039C130F30F5652C0B2E1BE27C98046402CDC4F22114C52C07B59221316814640012BFFD5052352C06C32B0F7AF804640BE90B537B8F951C0525B1B83F08046404055030558E051C0DEC53B82B5814640938ABE8C9EE251C0F2AE1106007D4640DC60272916E151C02A3F1409CB7846403F8F914868E051C0D746B36C28734640CA2AF573CEE451C04B955156736846403512851558E551C024DA09BABC634640AE76177B64E851C0C609BC60F05E4640CA2D5E35E4E651C00A4AE030C45646407E3BB211AEE551C06E6DDDD7465346407CD98C8E5AE451C04D0A99DB97514640849DEA6A76E351C03ED3B5065D4C4640E72EDFC75AE251C03F20796B1A4A4640F53ABE0DE8E551C0AE89C6D28D4646402B87F72CDAE551C0F5CC3ED6F9444640371D5ACAD0E451C040B4F8994D434640ACBE692A8BE551C005E6CA014D3F4640F56B116D4FE751C0E28D5CA5BC3C4640FD110850BDE851C04D02C084053D4640A4042B1174E951C0B3F70FE60D3C4640DABFE67002EA51C04D60D96B563846405B14DA1252EB51C0A2A13D8FEE3546409F84C67C0FF151C013AF50D1F932464007AFD5FE0DF351C076DBF2922C314640147E397F8EF451C06133FF98D82C4640EBA906A06DF551C06C96CDB90E2C46401CEC67476AFB51C0E7AB2EB9052B4640BF79A80717FC51C02549265BB3294640C7086CCCA4FF51C099654519ED29464080F94D8E450252C076023FDD53264640C06EE6EDCF0352C03FDA6CA378214640C104B14AD70252C0BD31BE28001E46402DE3D847CB0352C020FF369051174640CC7F60C4DC0252C0F8C1831406144640962385203C0252C05631519A740F4640104D37402B0352C000D96E9DDB0C4640AE0C179E130252C0C19CD1FD4C0C4640FF9A3AFD380252C00E701800AC0A4640F1B2E63DEC0452C001A9E4E71904464093F518FD730552C0E6F1A06B240146401ED0B3BE080752C077C32B0F9FFE45402FE4723E380752C089380D71FEFC45404F4BF69ADE0552C0087CE8739FFA4540F57E38BC3E0752C00E3AE89636F845407C4B781BC90752C040D2EF3B61F4454017E412BFE20A52C0F77FED5F80F04540E119D75BD40B52C0E269EECA9DE6454047A0AF9B300D52C0B5F0E48FDFE145400D88131C060E52C0C50D66B116E04540746E46C0A41052C09CF954501EDE4540ADF2E563751352C0CC894E6F69D94540479BA344511552C0A9012B7376CC45409AC4B765E71752C09646789243C94540EC7ABEA4471952C090D4BC343FC2454070761B237B1852C0047D6C5808BE4540738DC11F5C1952C0687D930280B445401E68AB7E601A52C04B58A0A645B04540C5C503BD721952C04FCCF4CAEDAC454078D4F53B411A52C0ADA8C54E65A94540E5D0063BC11952C0F9623B5158A74540A1FC08D9E01B52C04D91117CBA9D4540790E1E19F41C52C02715B188F8934540309AEDB7011C52C0786B91EFE18E4540AD45D0B7611C52C0169BF7F51D8A45400593AA588D1D52C0B7B1D5DBF3854540CAF60418421D52C093508403F37F4540A541CC384B1E52C081F0A845F27C45403A1DF7DA452052C04DD12147987B454025B9713C4B2152C014B3B967D079454093B5DF7C962152C06DE3B68AD07445401D42365F6B2352C07BF1558E296E4540CB9F8E9D7D2252C0C7CA44D26367454022DF1B1BD62052C0D2F5B273066545401398871A772052C0722204D56562454003D56138AD1E52C0D90A6AB67B614540C54EE936941D52C07E238978985F4540A3420A562B1D52C037347FBCE85C4540A445DE63123B52C0ECCEB1F5615E454008278CAF424152C029EB9451C55E45405E68460D845052C05F21AAD97E5F4540');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('47',NULL,'VA','VIRGINIA','P','965','0106000020E6100000030000000103000000010000006B010000B934255338C953C092B0F8D3E945424050ECDB1AE0CD53C0010055D26346424069125F9FA4E053C0CD5FE02A1E46424072FFC1A1E6ED53C069A006C725464240719BF94D860154C05C9DC7E6C7454240E7AA8031100354C08A8337060D464240CBBF088CD81B54C01D147D1A8D464240693A2405182754C009D4A7E1594742408A5E3306A13554C029ECF10223484240A46422B1CE3954C0FEE91A215D4842403B0C6976165654C033D148AE5749424031D9CD93DE6A54C0FDDDCB827D4B4240EEB7CFD3BE6954C0760C5541C84D4240114CC3A90C7554C0422A11CA484E42403709DD54C57A54C060F290BB8A4E42404E3486B4797B54C043036B1C484C424031484D1BDE8954C09499D7E22D4C4240229F4BC7DD8D54C0B32601900A4C42404B7BD3B8FF9254C0CFFA1E22C04B4240C50805FC17A754C097B9B8C3B74B4240CDAB7B7E63B654C09CC01C3EA74B42400B47000C26BF54C0253C6961AF4B42408093F9D17FCD54C00F8B8985464B424046208198E5CF54C087740B01834B4240B30F731D9AD154C0EAB1081EDC4C42408F64319DB5DD54C0FDFA14CBA64C424006E59C1836EB54C000E12D54A24C42402A47C23665E954C0BAB5081AF94E4240A59AD32EFAE154C07AB76368AB5442406526024474DD54C0BD1DC6EDB65442409AFA589ADDD954C0890EBFD20E564240052E40D8B1D854C0973FEB9417584240D71A078D91D454C0876E95F9D15A42400EED80B508CD54C07A22C840FC5D424097D2EA67DDC854C04C6F3E43BA5E424071292E05F6C754C0A551C14226604240BF5765C434C854C0285D7446BB634240416F145359C454C0E4C1F970ED6C4240640AD80DFCC254C06A87A5F2EC6D4240F2A02700DABC54C0032A8A1F9A6E4240A5E5CADA31B854C0951070926472424022B0859814B754C099EDE51851774240D7E06FB775B754C0B85ADE39BF7C424076B9E574FBB354C0DFD4C486B78042405727A56E4FAE54C0C3807DDC59844240AD4DBB6C15AE54C073B33B6370884240260C080B63AD54C07B500E67A9894240B8A08D0B2BAE54C0B5BA4C48EB8B4240517475AA05AE54C00367210C158E424088C9E27B5AA454C06143C256D2984240872F9BDA33A354C00D44433B85994240AE182905FA9954C06F4A261317A04240F8C7405AA59654C0416AD1B458A14240BD3D012C7E9254C0D62940B105A74240017048AE697D54C0654BC076FDC34240661CAC69DE7B54C01E64AABBD9C04240A7835AECAB7C54C0CD0ACD7B1BBF4240F6E022B27D7E54C04E84FCDACFBD4240EDB7C6B53E7F54C0EB9B231BB9BB42405C09044CED7A54C0F75585A22FB54240081FFB0F517B54C05D3C9FC494AF42406335DA096B7954C063C23E6898AB4240CF2994C1487754C03C8A628BA8A94240906C61A0F47654C0955BB1CC4CA742408326F75AB07554C0EE4A466F8BA442406A3B23342F7454C008E52BF1C7A34240E9E079EDBA7254C0ED54CA71C1A4424006EBA8601E7054C0DDF92555D9A2424036CE90DE426F54C0D0AB5A1710A04240E6280D1EE96C54C0053D9BBA229E4240BEB851DF9D6A54C06AAFFB7D3A9A42404C885F39A06354C0BE9B95C4699A4240258C35B35A6054C045CC87E7FF9D4240816277D0B65F54C0663F6E685DA0424019E2CF4D6C5E54C046C187E990A042406E392264D05954C0BA88390C2DA4424061BA4642055954C033FC88EBD3A742404954667EF65654C0DA13DACB62AB4240405B5FB9F55354C07382263198A5424003BEB28A444E54C040EF3259BF9E4240C56642D8014954C0C01B24BE30A3424013B3E47D984154C0C09772A79DA4424032884C96193F54C0D4DB76EA32A74240961FE353A03E54C0BADF47EBF2A542406ECEEEF0F13D54C0B119496C59A542400EABC7A9C93B54C09E5A794F93A64240E745AE5ABF3654C08E4216D671AB42408A933A7A4C3654C0707897B6EBAC42408C6C0FA4263854C0E0A5FBD3C0B14240FD2E79016F3654C0865B5AF633B64240B26523D52C3354C085CD893ADFB442401BF1FFD2263354C029BACFFA24B24240BD23060C483154C01E6681DD6EB1424011D3DDE8D43054C0F01B357E8AAF42407E603C26DA2F54C07D11BBBF85B042405A6BAFC6C32F54C0E362F35FA1B14240246A3203B42E54C01A0BB0A144B242400F7FF61C222D54C03F6D2765B6B142401419834A3D2654C09F34B24F18B94240E71F1381BC2254C071680E140FBC4240BB8A2B9A8F2054C04CF93957CEBC42400A42B673391F54C0CFF559DAF4BA4240F14291AF271F54C0C71E08BD88B74240C3BC808B621E54C06E430EFF1EB64240280D3464391B54C03B1A4F03ABB7424035140602DA1854C06BE8D1E39CBB42404C97FBBC891654C0A72DA4E5F0BC4240DF15469E3D1654C0BF3C7BE4DEBE424095EC93376D1254C0F0A7CD666DC14240B069D77CF71154C0D5D54323A4C44240D814BC3FBB1354C06D8427A2A1C342403D14FEA3DB1454C0C696DB7F46C44240E5F3BC2A451454C0483FE73B8AC8424083AD73E7C40F54C0E37E8E1B67CC4240EC82ADEA020E54C0F0236BF9E7CF424085126874481054C063C0B99302D242404F10217B421354C07F8F2B71FDD142406300C9DE821354C0C3DC0DCF7CD342406D0487C2EC1254C0D8B37ECCF3D54240138C6626661354C01C5F9ECA61D74240BD2BFB8A001054C0F0288C45EFDC4240EA048AD24C1054C00E490D01EDE0424044E4B16D1D0E54C07B6101A3B1E34240450886AF510E54C0A78673E1B3E6424045CEC767FB0A54C08CEFF964E6EB42401A54C3A8050B54C0D8A714841AEE424018E036873D0A54C0AF29580449F04240D779D19F950754C09E14206815F24240F19175BED00654C06EC8518813F54240DE342FF6810354C0E34021AC52FA42400956E32C080054C05C717010B4FE4240AF7D4608DBFD53C02291B88FF10443407FD18BE747FD53C03D60DE6D9F08434025C19C2369FB53C0BAEBFB4C390D43409E136865DCFB53C09866860A870F4340DA68870243FA53C0B5EADB48D014434069100464A2FA53C0301FAA26F21643401FE4209831F553C0E7476D2609204340AE1101B3CAF253C03BF1B6A563224340C958E43256F253C0D34CD3C27E2443403D4646B660F353C0B35AA65E41264340B8CDEC9638F353C020DB71DB3B284340D0640973E5F053C046D827964F2D43405AFC0DAEE6EE53C0B70AE518092D43404782A40E15EE53C0ABD56D10853243405150782BC8EB53C0DE54080B123743406B1E587054EC53C098FC539C0B404340C5D30F6E99EA53C06664CBD9A8424340601D17F1D7EA53C074C958336C46434014526D301DE953C08620F64BD24B4340523DDD3D56E253C0FBA4EE19E34643405B028F5120DF53C0FD848390273B434086B4ABB849D453C09CAD9D2AD1344340C368DE536ED153C0432264AAF93743400FF0A590D3CE53C0A61320E6803D43406F3BB7C427C853C05383CF5541544340C491C383BFC753C0F4F14D54F65443408F1545BFAAC553C0FBF971D6605443409124DE3E95C553C06792ADC7875A4340D9DAEC999EC353C0E7AB8FF98A61434039EEB7D981C353C00EC945753365434097575ED628C253C019AF221465664340CD685A6E32BF53C03B0322AD626C4340DF32B0BA75B753C0C352343AB7614340D614611037B453C09E73492EB86A4340A0F33D6BC1B253C011A05206AB704340FE3F47C2F3AF53C0780CD5C0AB744340AEF7160037AF53C073AEADBDF2764340440FBF5D58AE53C0039047DD14774340948F98DD03AE53C01B25F1C1D673434066D2FAD688AB53C08D7EFEBEF975434079694FF167A953C0278138B9AB7943409F2451CE5FA853C05BE8D432677D43405F3F920951A653C0A0A3E2B4D07B4340924141C267A353C07BC6D3A9C8814340D4A9952126A353C0152900A801834340BB6884831BA453C0B79052A67F844340D0212E7F58A253C036BD18215087434099099A391AA053C0537BB2D8FD8B4340AAB586570E9F53C0A1376335548E4340B8F2FBB2AB9C53C0468863943C8F4340FB5CEE708E9B53C006C4DF2E06934340D14AC44DC09953C0C94C080BD695434099AA2EF0239B53C092CB71E54B994340D40CF28F139B53C0FDB66482279B43405A62994D8B9953C0D502269C5A9F4340BBBE888F779A53C0645FF918F7A04340B5C4BC6CD09553C0D9FA67E6B4AB4340F062A9ED029653C04A171C24ECAC4340A1D83DF0639753C0BBED9BC04BAE4340BAE7BD2F6A9653C0DF77CBFCBEB043406EDD8A333E9653C0F8319BEA7EBA4340EC467D6BB89153C03306F41634B643407093FA44B08E53C052B00B0010B243405CA4320D228253C0FA2CE57700A24340409C56DD297553C07EE9A451EB9043404AE9B69C7B7453C0E04B110F24924340C221107B8C7353C0E14F49622A9943400C01A0B72A7153C0ECEF39F58E9F4340B201CFF69A7053C01DA902316FA443409FA4DAD38E6E53C0641BF78EADA8434093FEC1AE796B53C07F13FBD0CDA84340D33D3868706753C008C0627460A643400CBD3223656453C0167A261635A643404DC39180AE6253C04ED2A6F86FA243400B5F0BFC995F53C0B3171D7B00A043402FB2C71BBD5D53C0C7156C22559D4340475A139C8C5D53C003A61185FF9B4340053F5D3F9D5E53C0CBC9342DA9964340DB2D04840B6153C0EE75B48F2A944340348E4006D16053C0E9884FF9F18E4340CD008243A75E53C0E2DDB7FD518D43403E8554E2665D53C0630478635C8A4340CFB2751FB25B53C0ECEFE7A78F88434000496A93285653C08AA4928AC8884340B3FC4670C15453C0E263776C06884340958805455D5053C029851C148B83434007B22D63944F53C0A9D1DB3BED7C434013630A3CB64953C03DAE667E817B43407304173AD44753C02F6F37635177434092330A96084553C0779239063675434070C60E55534453C00DA3BE6A6F714340F98ED1517B4253C03387A4CE676E434073C1AA11914253C0C72018D2546B4340ADE92072DF4253C0113D72532C6A43406262DD903C4253C028FE181632684340D2190FB2E34253C04A3B7ED9E4644340007A3F71F44253C05235E9C6045C43406F8D67F2A24353C0392D9848275B43405189FB95384553C097C24407925B4340E3E24F37F14553C052E796E91F5A4340249EA9FAFC4753C08C7195EFC5564340F52C31DA4C4853C03C294797F95243408E1197019B4C53C07132807CB84F43405AD426E3714C53C0B3CDD5D297544340B8A5D2068C4E53C0F98DBDB44E53434046D34AA4695353C0F4893C9F42404340E2E315E6A45553C04C70FDEFED374340E448E401825253C09D15F61C702E43400D1C7FE4935453C0A3E107C30B2C4340399C0EBD624F53C0298637826E2A43406735EA89784353C021BB449C0F304340B9BF8A81F03F53C0A850F735E423434000AD4DF7E93B53C0A92EFEE5EE1943407290781F192653C0B9C1D2B8670F4340B1CFEB171E2353C058A99BB98009434047BF1BB7B12353C0BDBF734042034340CC090F17B22453C0FC1EAA246C00434043646ED48C2153C0370801DFA5014340344393B8831753C04486579881FA4240FB6ACB44911053C065FD6BB4F0F14240BB489A031A1053C082483DDAD6EC4240A83571CEBF1453C00A29F0D643E642407D9066AAD01353C00123413F10DC4240571118B0D31653C0B4E34C4CA2D94240E65D5A8AA71453C05C1C8703C7D64240C26548EB0C1653C0B4DDE869C0CF42401B3ABEC36E2053C0B90C99F108D442406E7207F2202553C0A7A891B097E242409F1978B9692853C085459549F3E54240EE59B2C8603153C0470E670D5AF54240689EC3315D3453C0492A93D0B6F54240428AC5A6D92E53C0EA6BB42B39E642400B0D6E409C2B53C073E725B12FE34240C94EAA4D6D2453C0A66318972ED24240519AE9A31D1453C0C922472492C64240C8D2EEA74A1653C0735C728B3CC34240CB61BC41CD2053C00B65FA4CBFC642409A5F6E34C41B53C000BA289CF6C142400AA67BC8BD1653C053AD38AD08C24240201AAAB7451053C01A92CC31F6B142407BF4E43A971153C0F2BF55824CAA4240DB4E669F3D1353C0808BF2C5D7AA42405140B005AD1553C035A44E4064B2424081506A16941C53C096B45C26A3BA42409E4FD8B9AB1D53C00A5B69D1A2B54240517D5312AC1A53C0427C206AC5B4424074A490B0D11953C0B683D8EFC3AF424032084059221D53C055E5F13756B042404B5A712F1D1953C0D1836F9E93A5424077BF5DDC7D1D53C035C89DB1B6A04240B81C0079CD2953C06839A8B5C7B44240295B9C41142D53C0E11C8FDE95B542407A793FBBDB2A53C0ABEB4EDD96AF4240FBDCABCF0F2653C0329D7FFD4DA542401870EA55281B53C0E1B38C738D9A4240009E0C14691A53C0DB31795B8693424026590EF1601953C070B79A952A96424011FBF1CA421753C06012DAD6C29242405AB62626911553C0444D26EDAC964240D09CB5FC421253C0DE4B7493A58F4240EBEFF1904D1953C05D055C21CE8D42408C9BB17BD41153C01FDE34DE8889424085B68E9EC01253C04F78212CA4824240FA9E090F971853C0769DA5B4CA7E4240738A7615401B53C086AA9877927B4240BD47A288F82153C0626BE651AD884240B87261C6F42053C09DD95A6E548B42404E19C24C1B2453C08E5895EE178F42408BCDA00D5C2453C0CCDCE0F2478A4240DEB4C854F92753C0211C0332F39042401A9C5A72052753C04891136CE096424026B00017752953C000D8650BED9C4240826C2BDD982C53C051D01E10C89D424076A12BE4BA2F53C0571380D7C5984240596D9F4AEB3253C06899CDD6C99E4240505AE1B3D63653C0EC6A17F93C9F42405BA6F8D7023853C0359D32135BA942400E7D6BF7323853C00EB1B9B839A142401E3CB23F3C3C53C0B0FE2F1D4E9E42407C0C9897A23953C067A314FEC09942401FE8B34A033353C05F6F14B98D9A42405D4BA122A62E53C0DDBE00F94D934240C077459CE12B53C0507390715C994240323A0C3BF52A53C08B748914ED9242403D2C3E9B942A53C098B663BBF2864240DB3154CFF52453C0CD9BA3792783424070894B343C2753C0AB19EFDD5B7F4240DB2F678C802353C0359D80DACF804240FC3A9CC04E1F53C07AD1029A1E7B4240FCAC5A02142153C0A54D705DC7744240D9B7029DD61E53C00807F17BA9754240C36B755C1F1F53C0F0C005DDA6724240E3698C25DA2353C0C1CEF801C56B4240975E9903F02353C07BCCABA3DB654240D045907E702053C0C8B941BF4F6F42405A9AD92F451A53C0D458FD59667342403B76B885421653C004835737ED744240F8D6D382DC1553C0663FDF791F6E42401213554A331953C0383BCA7C046B4240412A378BA71953C0507C87BDC36942402B0D315E4B1453C0934C9779496C42407A73C819B61253C063D1F4F90B6A4240E98A737FAA1353C0FE48315498784240C7C3DB3B2B1253C08C3644B23F7B42406BBA0C6EED0C53C02C4F4132B57742400407EDAB3E0C53C0FF556A94C97342404CB390C18E0753C089039F1144774240EFD4124FAEFF52C073266A122E764240BF30710E2EF852C07D5851EF2B474240E2519C52B4F952C081A2838D36474240D13A4AB31EF952C0AC6703C8B14C42403E34CF23D4FC52C02F9C2933615C4240480D6863E4FF52C06842C665454742408A10F167B70153C0B06B8B84474742403290E2CFEF0353C02B6A317C474D4240CB1A2A4BEB0253C0138A75434F4742404D286B98210853C0FE07881F56474240CC0B625A1D1553C069C4C5D9314742400377A897D21F53C069E58ADA29474240FB2B98610C2453C04EBE207C17474240759D6ECEF63A53C012D67D9CF34642406F18ABCE1F3B53C0B3F4733CF3464240C0370DA8544B53C03C225F5839474240BF1863B9765453C03F5E77B6EB4642402F879674DF7053C068D7E101DC4642408D256E26827953C088A21CB9CB464240CD5A6AD6498353C0FD143B4CBC4642406D9C48C48A9453C053915AB2D8454240C147398C589D53C0DEA135EB53454240F4A89BE82CAF53C0C0E9DB5CEA4542401F81E6AEF8B253C027703E1B97454240B934255338C953C092B0F8D3E94542400103000000010000000900000079EB428A4DD152C0BD9D8EF98B0343405EDF418580CF52C0D592CFB8AA034340703570911AD352C0E2F6C68543FB4240568F5B3CAFD552C0A4E2F7B3C7F142407EC2E8A5AFD852C01AC3E87619F04240FF8BF17C0BD652C0BB4176F175F342408DB33EA334D852C0954C353257F34240EB206A3C2AD652C0D3F2932E9FF5424079EB428A4DD152C0BD9D8EF98B03434001030000000100000022000000F18C4F557DF752C08A83023DB2C642403880D75E35FC52C0F0F51255E5C7424098F4913E78FB52C0B683159102CB42409B3B2E79C3F852C0E9CFDE154DCA42409AA1E91BF6F952C04AAFBAB1D0CB4240C0CAEEF328F352C0F253EE4120DB4240CCC5177310F252C033F173741DE54240A8D764EB86EC52C022466DED8DE9424008B3804AEDEB52C06215AF26DBED42407263E0CDF3EE52C0E018EEFC20F7424002DEE2461EEA52C02704D8B57CF84240D6E47EA576E952C0DFF0E74F31FC42409A80CEC211E852C07413D3A98EFF424059922CBDD5D752C096B5B69C27024340706EF64486E752C0DF56A3E43FD94240D9270C42BBE552C089C8D189B2D642407F11FAC4BEEC52C00617ED7F79CB4240A529E73F98E952C070037F68AAC742404B9B99058AEE52C0DCC217E676C74240C69F39C664F052C0D784E6CE5DC142401B1C85601DED52C0623983952EBF424035CE7CE902F452C051265C120EBC424000E06C267DF452C0545DD65992B642401373474096F252C022D2736041B4424095FF9286E2F452C0EEB4E95A8AB5424025495F8D64F952C003FA6F3E0BAF4240B69BAB2896FB52C07F189D29429242408A0CB0EF1EFE52C09255830A2D904240DBBF8FFD280153C058B2F09F8AA7424055C8115AC8FB52C06462E9240DBE424053C7983DC4FD52C0EC7300C35FBD4240436C753E14FD52C02090E8BBCFC24240282042DD8BFB52C07F11DE764CC74240F18C4F557DF752C08A83023DB2C64240');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('48','WA-FSIS','WA','WASHINGTON','F','966','0106000020E610000003000000010300000001000000F4000000493A969FBA995EC0191A61E5D31C484096CB216B9F9D5EC0978142043B1D48401338A533159D5EC06CB3A76E72104840BF09DC1420975EC00FB97A45B10748403A5A3FC0EDA05EC034BDB70C2611484095907757B1A25EC0AF7A7E5EF01A4840D713229995A05EC03C4FC1487C20484039A9A0C4E1995EC079F1AE69901F4840CAB61C6536985EC0E6AB8D9415254840757AC6931EA45EC0DF0E680706354840A246C3A6B0AA5EC0ABEFF0BED9344840D6133232C3AC5EC0A17DBC25463F4840CD06B864ECA65EC0FCADD3D3684248408206C0907CA15EC0590703F4AC3A4840FF16A448539E5EC00E19B038293B48403E8AEBD456A05EC06ACDD8E29B474840823A71AA7D9B5EC0893E4C0DB94C4840EACBF815389F5EC0ED5CD3A9BC5148402BE49521B3A15EC01A2D97CB195B484016EBA52014A15EC0E209E29003614840D5048744A2AC5EC0C2015032C9664840330E228045B05EC01107BE817A744840C905D48CA2B45EC0CDA8E15CB1794840925896B69CAF5EC0BD1069EB577A484030FB81B5F7B05EC0ACD675AFF77F4840A541F80FDA365EC0365D5D73FA7F48402AD39A96FDB55DC0C56C35ACFC7F48406577AD9CD28C5DC026171F03FD7F48404A34A7B3115C5DC01A876254FD7F4840C27174190D425DC054DDB8BFFD7F4840B41D66F7DC415DC0E3A3FE0C466B48406C800DD27C425DC0DD14286CE905484044AB59F065425DC003DD89C14CFC4740EF43DFC3AC425DC0F28127B943AE4740FB9FB28CB6425DC0CF88D19116A147408E3A023A9F425DC0AF9123D9458F4740D4C41DEBAE425DC021B6F05DAF444740AEC045BE77425DC0CFA13511C8364740E192EA9AD8425DC07D50A0CABC314740405AF9991B445DC088E67522A22C4740E73CB751CA415DC0B4153745EF2A4740BBC4CEE81A405DC045FC15A4B626474056ACAA1F413E5DC08D428E5EE91F4740398A495DEB3D5DC0219B65724919474074D66BB87B3B5DC02CF5638E2E154740D283C7788B3D5DC0E53B207B730C47403574547A2E3F5DC0F20A7B940C0A4740C9B2F5564B3D5DC009351E7468084740AA7FC510D33A5DC0F65504E961FF464003E70C91D35E5DC044EBAE95FAFF4640BAFD3AB494665DC002ADADC9080047403388DD2FE47E5DC0C270D615FCFF4640C0C72593857F5DC0746C3CB4350047406F359543DBBE5DC0C53BE024E1FF464015907CEB0FC25DC08A1BAAE2AEFB46408309ABDDF9C85DC08577FA9E7DF646405FB5108570CB5DC03018F19D0FF64640DC8B2A7A60D35DC02077F37D61F74640F6749BC448D85DC0D62A303F74F54640F7F1E34C16DC5DC0700B16C006F54640204E4C36C8E05DC06A7D200119F34640F65061FFB6E55DC029141281E7F446405A0194C2D0E75DC0E6F7ACE01FF3464012A263A76BEB5DC021E39FFF1FED46407A62BDFA58F55DC0217CECDAB9EB46404CE18ABFA9F75DC0F6F0C91875EA464087DE1AF1A2FF5DC06F615372D3E7464007571EBA64045EC0D3A97DACDDE34640F4CFF264FA095EC069238B0571E146402B48ECC8460D5EC0BF6D67E221DC4640BB93D41227125EC01D46F8FCB8DB4640BCD34066601C5EC017F76E513AD84640C0CE1B2EF21F5EC006EF366D0AD9464072F0163B7C245EC05BA72C66D6DE46400FE93EA3EB275EC009FA7EA12EDF46405749DA47232A5EC035C82B3FC6DD4640437E4D8C9B2C5EC0A25530FCF1DA46401440EF7F21375EC0658999D224D546401600DCA41B3A5EC0C1E62E5057D1464039B2BA6AB53C5EC08C99EF8D3DD346404AA24B8DFB3D5EC0B7BA9B6C94D24640D2BA219424425EC07BB9B06790D34640ED0BC4B6B4445EC0C0373224C4D24640FF8C895A03485EC03A95D51CB4CD4640E3EE54FE274B5EC0E34F8FB6DDCC4640C9D98F9F4A4C5EC0F37A05B67ECE46404D332400034D5EC09B8D93FA21D44640A9BACFA0B64D5EC03C7AA9DA33D5464080C46F63B0515EC08423FED7D3D646403D13DB837A545EC014C2B8972BD946400D09C7448A575EC0CA3E84548FD946403DEA1886025B5EC06EFD3BAF65D84640C3A23AC6525C5EC080DB73AEF4D84640B295F607DC615EC0162A3BCB1ADC46408AE602EF356D5EC017AC02602AD84640186EC5718E705EC0DAA0C39D48D84640A9D58E18E8735EC02613C9FBAFD94640A1E1EFA2D9785EC08C88F43AA3D64640FDD2CD07517B5EC023276CFC2DD246401788770D407E5EC0893F7C1C61D146405705913000805EC0918BCBDD14CF4640861A521A40855EC0C849DAA295CB46408ADC77CEAC8F5EC0BE12BF8F28C6464088B59DD066935EC00F23C71084C546402D3D2833D0965EC0AED5C44C78C846401EE7AC55FA9B5EC0BC88FFAC4AC846400290920030A45EC01D7EAB0523CC4640FCCE4469ADA95EC00277AB9EACCD46408D37B98E90AC5EC062F7DB19C6D0464092BF64B5ACB05EC0524140741FD34640EDA3DA7971B15EC093D7ADCC24DD4640C1A27A1AEAB05EC0BE472B4B5AE146400B9DA3BF6EB25EC0D62FB7A871E64640B501268235B25EC012987E87DBEC4640658536432EB25EC0612B0EE716EF46401B5E0A2899B35EC08F353EA5B8F34640C539870AB2B35EC09A011764D1F8464090D11CD806B85EC0D10255BE7A0347405C4F9E9F95B95EC0958BB579270A4740C0ABEEC958BE5EC0200B5F52240E4740CF21DCF73CC35EC02FA0582AEF134740860C1C6496C75EC015118CA5F31647402FDA3BCD46CB5EC01B46E0C27F1747406E5D8F9198CD5EC08332FBC1C2154740A8094854ECCF5EC0165B45426F124740E36D177C80D35EC07A73CEC286124740675F262521DE5EC0C0DBE3FA3323474016FB2755AFE75EC033B661F31B214740996C46EB6DEE5EC0065C9CC4882447407E558D78B0F85EC055656BAFC61E47403E67D0B592FF5EC0E0953315B7274740900B141910055FC065C62A8D35224740E805895331045FC00621C42CE3514740A9860E8979015FC05F18027AB14A4740789A9C06D5005FC0BACE626D1C314740FB3AAE56DAF55EC0B2FB6783C1334740248A605234FC5EC0EF82C22E953D47409D1E163330F95EC08D25E1106B41474009B5BC264BFD5EC0A0A6CE3D014F474010A0544A4BFB5EC00F5809DA2656474005EE9265D2F55EC0EB3E13DDF05B4740F09C648F50F95EC018D778B45B5F4740C8B3651BC3025FC002874327A15B4740FB0877C0D3055FC064F1139E505D4740A2AFD84488065FC0938786510D6547406C91C58AE2085FC05770DCB43273474080112DC8C4065FC07A2255373E7447401EB33F07B4065FC082E19EFEE36F474037B51800D8015FC0B5C2A4347169474040B6B1E200035FC088B66C83917147407E0A3D8D02F45EC006B11334637B4740B9FA963FBCFF5EC0E7B4D334FA7C4740A589098633025FC048BBDAE8F8834740ACA473EE30075FC00BE8066076854740EEADD6CD5E0A5FC002B4248CFD7647400BECB2BF550C5FC0A5543CAE5F9547401C7F48ACCF0E5FC0FFDEDE8235A34740457FB87D71145FC0E9BA87D6B3AC47401E180C5457165FC0E4DC72CA71C3474013950728E9175FC06ED8EA00C3D147401110C06DFA1E5FC0BD91DEE674E7474037C601EED3265FC05565508DD6EF4740E60C2FB3E52E5FC001F569D7321348402DEB7A27222D5FC0C47D910AB21D4840D543FD34E62D5FC09180E8CE53304840A6D8552811245FC00D2C0C50BB2D48406945471470FF5EC09C9594685F144840B0A0BE1B66D95EC057ACCE3F360E48405193BADEE2C75EC0D43DE4B2091348408DD1C167FBBA5EC0AC72400F0E0C4840217C80A630BB5EC0CDF4A8C88C08484032D6C9C3D4B55EC0CB444C9D0A114840E01A415F35B15EC0C2FF15656E12484049DF993A63B35EC09DE6AAD0EB0A48408CD7C00257AA5EC0E593AC6865F547403B736C58D4A95EC0594044B0A5EE4740AB916C55BCAF5EC0A467F2EB8CE747400F91C41A8CB25EC07F8A5DEAB9E6474036B04C22CFB35EC0FFBB35A4B4ED4740BEBE81A4F6B65EC00C516EE5E5E94740404A7E2C8FB95EC0DF66340D15D647402CA0B049E5BE5EC0DE0A5D2D80CD4740604D9A634AC75EC022C0B22D67BA47400BEB601FDCC95EC0A4CA03319DAC474013F2158FABC05EC01DAA38FD2FAD47401024EBED53B55EC04F327E9A1FB84740D46A6D3251C25EC09943F71A93AD47400C28763C36C75EC0EDCF54938FAF474025DAF77EAFC15EC0CEA453310AC24740E1587BA1AFBA5EC0F7F50B6FABCE47400E07B43630B05EC0F604F47391D447408E99F1A646AE5EC086C11B15E2E047401BDE6A461DA75EC0975C1A17CDEC4740916E77F53EA75EC0B0A9950BD5F747402C3B11750AA25EC0D109243869F44740964C07444F9E5EC0EC75B132A3E047409635B1D0C6A75EC0BB48444436D94740A8F7FA9088A55EC0BB0F2ECC1CC94740814F706A89A35EC066C3E64FB0CA474008CEB4A0BBA25EC001AE64F3E8C247407833C71749A05EC05E234A79ECC04740ACA8C196BDA35EC0C1080F96FDB24740157517F2D2A25EC01BAFACD8DCAF474067A35DF4A5A55EC01FF17435BEAA4740F74C5DEA66A35EC07C271A3B44A44740A1EE756A27A55EC036AE207A2DA047406069159323A75EC0D7ED5C158EA54740774DB1AFD7A65EC0169DBE16A2A24740E4DB689EC8AC5EC08493BC0C63A54740DC85D3813DA85EC075A8DDCD03B3474036DF23C3CBA85EC0DD0CCCAC04B34740E1CF3E8B75AF5EC094A6D1A4B4AB4740F4A682E642B15EC0D7E64E6911A24740491B013B11AE5EC018A9458E8F9C4740FCFD0122B8B05EC041AA24ACCC94474072A5AC93CEB45EC03158D3C90E9E4740B67CC3517EB15EC0AB2C7CA32EAB4740304F4FFC56B35EC0136312C12CAE47405D534C0958B85EC058128B444DA64740DE5F374F63C75EC01E42181E9F9A4740C4E2DF6032C55EC0AAB4BD08878B47403DF4AF9B01C25EC04E44422AE68C47408676FEE214BB5EC09C2A83AD238647401FD2F02890B25EC0D3E94A2C1C904740E3E1779C9AAE5EC01A9E7B6E8D8A474019571818CEAC5EC08B0E57F0958C4740B6CA8E29E0A55EC0BCE04B380C974740A4A2E007F8A15EC01E85FC5CCBA447403253C24CFBA25EC06E9E60BA7BA847400E98F45A249B5EC0D4EC526636A1474058C7645924995EC095C230688CA3474066517E3F439C5EC0DF7DAE438BA6474031AAE0FEEE9A5EC0ECF27BE4CFA847405FF13CF7D2945EC0A12529CA12AC4740BC111A9976945EC0E3D6BA48EFB14740BE4A2FE920995EC03DB4B99F4FC147405A41B34C76985EC0B7FA185D36CC4740295E29558C9A5EC03291C5D803D547405F6A9B5C3F995EC0E4C1B13318E34740C023241463935EC06A1D8EA3A0F94740E667E74CBA8E5EC0A1C176E70BFC474045144932E38D5EC05273A7C7F3004840F6EBA3C492975EC0B5C3D4F266104840493A969FBA995EC0191A61E5D31C48400103000000010000000C000000765A715BF3BD5EC0FC645442CE384840AD1E7F4B18C65EC087F000BA5D3D48407F0FDCD938CA5EC02F7EF2B9CB424840329F88A1DFCA5EC06394E21E0248484059BDA10607C95EC08EE035ABD34F48405AF9165FA3C65EC0B798044DDF4D4840565CC929C6C05EC0D5CD756E5B474840576E38858EC05EC0F58E62EA50444840D1536562F3BD5EC07522238D724348406299C5E36CC15EC0CC962BC5B541484066CAAA6035C15EC0D6F7AF61AB3E4840765A715BF3BD5EC0FC645442CE38484001030000000100000014000000F748578BECAE5EC0FABDD22C6923484050D0746599AA5EC07202069DC9324840B7058F3AAEA65EC06E1EBF22D03348405F1056E3A5A15EC0717632F7172948401C074260D5A15EC0A8EE650F4A244840F4EC8295E7A75EC037A68CD0EE25484043E7C6A5D9AE5EC032F6D861DA1C4840568F866619A75EC0EB1AD9BC681A4840C02B66FCF4A25EC05E201D7DD609484098B811F3C19F5EC0BF6FC0840A0C4840C95124D251985EC01A556B5E1D04484069EF58DFBE965EC077823D9E60FB47402B3CBBF7C3985EC00F1DAC43C8F3474006574CA3569C5EC0050E18DE82F547401E1F26F72E9E5EC008E0CCB266FE4740ED153DA5E0A25EC04616950ED8FB474013C376C4F3A65EC0876E39EC050448409E000BF683AC5EC0F6D5FB1331174840200AA6A933B15EC029E8B53D021C4840F748578BECAE5EC0FABDD22C69234840');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('49',NULL,'WV','WEST VIRGINIA','N','967','0106000020E6100000010000000103000000010000008D0100000FF0A590D3CE53C0A61320E6803D4340C368DE536ED153C0432264AAF937434086B4ABB849D453C09CAD9D2AD13443405B028F5120DF53C0FD848390273B4340523DDD3D56E253C0FBA4EE19E346434014526D301DE953C08620F64BD24B4340601D17F1D7EA53C074C958336C464340C5D30F6E99EA53C06664CBD9A84243406B1E587054EC53C098FC539C0B4043405150782BC8EB53C0DE54080B123743404782A40E15EE53C0ABD56D10853243405AFC0DAEE6EE53C0B70AE518092D4340D0640973E5F053C046D827964F2D4340B8CDEC9638F353C020DB71DB3B2843403D4646B660F353C0B35AA65E41264340C958E43256F253C0D34CD3C27E244340AE1101B3CAF253C03BF1B6A5632243401FE4209831F553C0E7476D260920434069100464A2FA53C0301FAA26F2164340DA68870243FA53C0B5EADB48D01443409E136865DCFB53C09866860A870F434025C19C2369FB53C0BAEBFB4C390D43407FD18BE747FD53C03D60DE6D9F084340AF7D4608DBFD53C02291B88FF10443400956E32C080054C05C717010B4FE4240DE342FF6810354C0E34021AC52FA4240F19175BED00654C06EC8518813F54240D779D19F950754C09E14206815F2424018E036873D0A54C0AF29580449F042401A54C3A8050B54C0D8A714841AEE424045CEC767FB0A54C08CEFF964E6EB4240450886AF510E54C0A78673E1B3E6424044E4B16D1D0E54C07B6101A3B1E34240EA048AD24C1054C00E490D01EDE04240BD2BFB8A001054C0F0288C45EFDC4240138C6626661354C01C5F9ECA61D742406D0487C2EC1254C0D8B37ECCF3D542406300C9DE821354C0C3DC0DCF7CD342404F10217B421354C07F8F2B71FDD1424085126874481054C063C0B99302D24240EC82ADEA020E54C0F0236BF9E7CF424083AD73E7C40F54C0E37E8E1B67CC4240E5F3BC2A451454C0483FE73B8AC842403D14FEA3DB1454C0C696DB7F46C44240D814BC3FBB1354C06D8427A2A1C34240B069D77CF71154C0D5D54323A4C4424095EC93376D1254C0F0A7CD666DC14240DF15469E3D1654C0BF3C7BE4DEBE42404C97FBBC891654C0A72DA4E5F0BC424035140602DA1854C06BE8D1E39CBB4240280D3464391B54C03B1A4F03ABB74240C3BC808B621E54C06E430EFF1EB64240F14291AF271F54C0C71E08BD88B742400A42B673391F54C0CFF559DAF4BA4240BB8A2B9A8F2054C04CF93957CEBC4240E71F1381BC2254C071680E140FBC42401419834A3D2654C09F34B24F18B942400F7FF61C222D54C03F6D2765B6B14240246A3203B42E54C01A0BB0A144B242405A6BAFC6C32F54C0E362F35FA1B142407E603C26DA2F54C07D11BBBF85B0424011D3DDE8D43054C0F01B357E8AAF4240BD23060C483154C01E6681DD6EB142401BF1FFD2263354C029BACFFA24B24240B26523D52C3354C085CD893ADFB44240FD2E79016F3654C0865B5AF633B642408C6C0FA4263854C0E0A5FBD3C0B142408A933A7A4C3654C0707897B6EBAC4240E745AE5ABF3654C08E4216D671AB42400EABC7A9C93B54C09E5A794F93A642406ECEEEF0F13D54C0B119496C59A54240961FE353A03E54C0BADF47EBF2A5424032884C96193F54C0D4DB76EA32A7424013B3E47D984154C0C09772A79DA44240C56642D8014954C0C01B24BE30A3424003BEB28A444E54C040EF3259BF9E4240405B5FB9F55354C07382263198A542404954667EF65654C0DA13DACB62AB424061BA4642055954C033FC88EBD3A742406E392264D05954C0BA88390C2DA4424019E2CF4D6C5E54C046C187E990A04240816277D0B65F54C0663F6E685DA04240258C35B35A6054C045CC87E7FF9D42404C885F39A06354C0BE9B95C4699A4240BEB851DF9D6A54C06AAFFB7D3A9A4240E6280D1EE96C54C0053D9BBA229E424036CE90DE426F54C0D0AB5A1710A0424006EBA8601E7054C0DDF92555D9A24240E9E079EDBA7254C0ED54CA71C1A442406A3B23342F7454C008E52BF1C7A342408326F75AB07554C0EE4A466F8BA44240906C61A0F47654C0955BB1CC4CA74240CF2994C1487754C03C8A628BA8A942406335DA096B7954C063C23E6898AB4240081FFB0F517B54C05D3C9FC494AF42405C09044CED7A54C0F75585A22FB54240EDB7C6B53E7F54C0EB9B231BB9BB4240F6E022B27D7E54C04E84FCDACFBD4240A7835AECAB7C54C0CD0ACD7B1BBF4240661CAC69DE7B54C01E64AABBD9C04240017048AE697D54C0654BC076FDC342402A2B6131807E54C04E08545489C54240D9CECFBCAF8154C0F5A03410E8C34240F70CA603258354C0C24B090A96C6424030807605908354C08742826C3EC34240518DEBAD668554C00C8BCB042FC64240BF10DEDE1E8954C08263599A5AC7424093A8E99F608954C0C27F7D1870C84240F459545DCC8854C0E12B7059F2C8424094FAB21B6F8854C0640E34B796CB42400F3E8323328A54C079AB3812FACB42406032870AE08B54C00CA9926601D24240485E41F0258D54C039780AC6DFCF4240B64F2379418F54C08B62233B11D4424069A33684EB9254C0AF1F6EB1A3D542408EEDDFE8149554C00DB3EB0241DF4240E62850A7729454C0713CBF2114E142405952DB0BC09554C0F778E63A67E442403020B8B8F89954C00382746EE6E74240A3881EFEF99A54C0A3F01861A9EF42403E6BF1C1019C54C08BDDD79A8AF242403029816E03A054C02A12AEAD0CF64240EE023ECE939F54C0B605224AA4F84240D9904C2CBB9E54C045E880A929FA42401B607E2C739E54C00838DB85EAFC42409D4FA65594A154C089077D3901024340D87D8F21F7A554C0F4F0CC40130E4340454818295AA954C0E219EAF6BA124340E6A6650A6BA954C03FF16611B0154340DD1252E747A754C0B3A40AD0CB16434077994447D3A654C08B87754CCF18434065E8AD4A70A754C0AF3E3761911E43407DF9E707B4A554C0F42EA7E0681F43402655DDE6C5A454C09A31FBBEC3204340D2E67B881FA554C0E9A899FB702543409B66F187A0A454C02B742F5A66274340738AEF8C49A654C00FDE8AD3292F43401419BAEC8AA554C0401AE16FCD344340F8442DABD3A454C06E4CCD10B3334340068890070BA354C03C4763F143334340F2B2ECE0AD9F54C05CFA6252F23343401CD844948D9A54C02AD8E61A173743404B9BD2D0439954C014278B1DD83643402F427946119554C02668C4E4913843404525E5841C9454C08D2F9DA48C3B4340FC0406E48E9254C0DF1E331B404A4340D1284461569154C0510B9A5B254C43407054CF97AC8D54C0A5241EE3DB4A4340B6D868B3CA8B54C01CB47A042A4C4340ECA86D321D8B54C0DA98BBA0EB5043407EBB0636188C54C066251139C55643401D05FD35C68B54C005DD6135EB5A4340924F5E3CDF8D54C0890A5D49B4634340EDD5E779A78C54C0EDFD51C7FD664340D23B75B2598954C0D0AD82655D6B434078B72C92EA8854C0A8B4B27C1F7343408561942C7A8654C0A6C2E236DE794340E0571FEA708554C0560F0FD4147D4340FD8FAF85BE8354C0B5EFAAB3997E4340FE691BA3BE8254C095F8E150CF814340A279CCBBFA7F54C0BB41ED12F48143406E6E1778697E54C09235ACD61A7F4340E460CED2037C54C0D2D051D8DE7E4340033C7691617B54C012B7A899FC7D434015EC17CD827954C0E5F41E24537743400BB5CB71A37B54C0ED46CDE886724340ECB14B6F937A54C022A7988B35714340629E1AEC217954C07DD0A44ECD6F434005FC7DA8797754C01FE142EE5E714340F6B90985D17554C0E3D1D7C50C784340B03594C2B87454C079534A646779434092A8B45C207254C02B5B684B377643407939DD79C97054C0AE70D72A10774340E48BA5DC077254C0ADED6AC2F87B434006754BBCA47154C038DDF3792782434075960FC20F7454C0D2F9E554A58543401513ECE3C07454C0244C9F5180884340894F84C3737454C0799025B0DB89434012E9BBBE537254C0154D6491E389434019FB7C5A3A7054C0BD44E2CF1F8C43408FD6AC39A96F54C04D8196AB1C904340AA44A0FC917054C0065361047F9643403C7B88D7466E54C0F625F25E4C9B434046467A73AA6C54C099ECD09D299C43405CBFD232216C54C01F6D53184FA14340430E41AFB86A54C02BE808979FA2434064A478DFA66454C080F1EF9509A24340A2F0843EAC6354C07F2BDA7194AA4340C5E438FC996254C0D9C3F79025AD434060BC80B1C25D54C0212230EF13B44340495D0A4FAB5C54C073C70D8F9CB443408BFCE84CC65B54C04B9A698FF8B343405B9526030F5854C01D1A18943FAC4340157FC57DAF5554C05BD4683444AD434033BFDB552D5254C05CA7B9938BB14340A907FB2F354F54C0AE731D75B9B14340C2B6F68E654E54C047F61C1545B44340408019CDD14C54C0DB1B7D163CB543409FF99C6B8E4B54C033B90CD609B84340A73DC5667E4754C0B47EA757E0BB4340A70E0DA5494654C00FC41FB68BBF4340A358827C644254C0D06E27572EC44340F82F8C9A154254C060DF5176A6C5434069A00C10F43E54C019BD2E9878CA4340320E1AE5AF3B54C00B45013EB0CD434052B757E2673A54C084B5B2C0BDCD434087DEBE1A643854C0B76C62E4E1CF434032005E12DB3754C0DB408FE2C9D443405EC26C2D423754C0A99214C215D74340A840B8634C3554C000BBA10409DA434075259460443554C07CB685C302DC4340A07E7921D03654C001B6CF3E40DE434083F4D800BA3754C0E0B0707A47E143404D6172326C3454C0EFCE295B8DE74340132930D1DB3454C0940F3C367AEB4340706D0A0A1B3354C066B2F816A9ED43407FD4F2469D3254C07B05ED15A9EF4340DC9ABA08FA3354C031D21BCFD3F3434088D2A0A6B33354C0C2671D4E3CF543407B78B803F23254C0660FCA4EBDF54340E8DB54FE283154C065824572E7F44340AFC17F9B913054C008FD2612ECF54340FE65FDF9D53054C04EBBBBCD37F94340E4D3F4F0492F54C041693D8AE2FD4340616E324E3F2F54C0E418E0A390044440915699A2EE2C54C0B0E55138B91344407ECEC661DB2C54C0FBFAE1F68615444005AB347C6D2B54C07892A8F4D9184440C98E5E749B2954C0D78EB06F721F44407D22A00B572754C0AA41036C64234440E06E7468B02654C0D7CE06083327444050B560E7FD2654C0C653667DC72F4440C0492F8B452854C082CB65BABF314440BE9391AA2E2854C0094F0B19F9324440CE8DE962842654C0E3BBF34D823D4440AD96B326042854C09D58E34892404440C4F152478A2854C02DD35BA3044544408C3169ADCA2A54C0E6EFF95CBD484440D05AC60CBC2A54C0DD480B7B834A4440A3843826CA2854C01279C9F8964E4440272A57A1232754C0C569513A5E4F4440DDD1A33AC32454C022ABC33DD84E4440FF08B270682154C04912D4DF8F5144405C9895138F2154C0F69D51D2483D4440FE05C814822154C0401F169D9633444012BB8AB9AA2154C0BE75027ECD14444066F60BFB982154C0A753A1F0EB0244409ADD87E0932154C057512B7EADFA4340EFA48DA18D2154C01ACD7D9350DC43404B61D015761B54C0A0E96FCD23DC4340CD0D4EE9C4FA53C0E94378955FDC43404F107BEDF7F053C035BE872C64DC4340892BF53AC8DE53C0B13BEBF031DC4340239CE9F159DF53C07A50A5434499434066B06D2B84DD53C01F4365414C9B43408D709508C1DC53C0FA5136E1259B4340F5C41058A1D853C075398F7178A2434079325B0D28D653C0CBB0324563A543400788BBC1E5D253C0A4AD602078A643408A6EF99CE8D153C041F1CF94A1A94340C870CA97A6D053C042D20F4AA0AC4340F05A8BE46ECA53C05CC580125EB24340320DF6C21ECA53C0D29872A9FCB4434055983CDE68C853C0CCB7584761B543405ADFB938A9C653C0BDD0B75941B943405D581A9730C653C0049DF0F178BB4340E49F5EB8B1C653C0B1C5D28F45BC43400C0B973285C453C0CA83E0CE44BC4340A02A60511FC453C0814BBF882FBE43406A48C16E20C353C0D3B110A9EDBD4340C75508A21BBE53C09290A39821B8434026B38C1F25BD53C0E3B9E64FF0BA43408644EB70BBB753C0535904184DC34340E6DD76ABA3B553C09E5094CF1AC84340555D7A869EB353C01BE4F1AE8DC84340B092E368A2B453C03B4DF42AF8CA43407A293D251AB353C068192705C6CE4340B11522E514B353C024B46222BFD04340136FB30174B153C09D15188076D243405A14CCA020B153C0BAE782E334D04340F42E155DDFAE53C05D516B6540D0434025FA047DC0AE53C00C5067C68ECF4340A0DE4DBD1EAF53C0B1C002E8ECCD43407ACFA30185B153C085A625C801CD43400457D19FBBB053C0B7E7F92B78CA43403A84A2DCE4AE53C0C4E6296ECFC943408AECF91AD8AD53C0BF3CE112A0C743408C9BDEB5A6AA53C026FBD41BBAC44340928D1B948BA953C022FE671DDDC44340E6E2ABF2C5A853C00ED51960D5C34340DFD8B9EFADA653C057FA0D4291C44340C70110AB1BA453C04C1FFC88B2C243409F5AFFE58FA053C0EAF5336D38C34340D7B30043CD9E53C0AC4ABD508DC24340B569B4012C9D53C00E9BC26F51C44340E540F621899C53C0520E604D2FC64340A531C7BFEE9A53C0FED3060F53C643402B5AAC658E9D53C03CD88BC458CA4340BD446D25D79C53C0445A02C3DDCB434029FDF520DB9953C0A63DFFE736CB4340285AEA25A49B53C0FB2E095E7BCF4340E80B56E19D9853C087E87CC3A7CE43406A9BD4C12B9853C057D24000CFD04340B0ADFE7FD59653C031D31082F1D043408168D55F449653C014B0D1E0FED14340CFCADE17799153C0B545E80B28CF43404A9629987E9053C05D101FC811D24340A0F185B5AB8E53C0965FF9E64BD443409CAB51F6908E53C0637B164445D6434040CA0953138D53C04DCB062685D643408901BFD0B58B53C0BCBC7F04EAD843403E5714A2098653C0C1F5A0117AD643400B6FF7D5B08153C0D259BA20BACF43405E04D970B17F53C0CE1F7606ABCC43406F262B0EB67D53C0FF7CD5E53FCE4340C77E898B7A7C53C0FA34FB6902CB434019F1B08ADE7B53C027551DA9C4CB4340E51C628CA47C53C004E761C5B8CE43407A33BB2B127C53C0873453C521CF43400DE772E7CE7953C0B47B9CC94DCC4340358044E6017953C01E74F8C8E3CC43402B317026DC7853C0C266B8C6EBCE43406D5BDEE2C07653C0E0E8FFC913CD43408A2F6501EA7553C01757AAE97CCD4340C4729660C07553C002A2E88E4FC943407B1DCEE1967653C08399AFCF60C8434010E8FCA4A67853C0ACFD0DEF3FC843400C0E5065F47853C00D88EA8F6FC74340EC6100E3A67753C0967E9572E0C5434052F1EE21567753C003B4AD17E0C14340350A22A0017653C088958D5516C443402E831A3F787553C06524B03647C34340210EA71E0D7553C06B488496BEC34340BFCBE81DD17453C06F8E26798AC143403104F99F437653C0EDB039BA41C0434043C7A2DDCF7453C0F222BD5B38BF43400DEE7018617153C0678B2E3DC2BF4340B8F005FB2A7353C01C6A1FBE8BBD4340D47580393F7253C0CB80C2E0C3BA43406D9354DB777353C049B6E21F48BB4340ACEB935AEE7253C0EDC840A1B7B94340A5724F1B807353C039E0288252B84340E11C127B587353C0E8C3202356B743406DC8C476727053C04D2BA5C46BB6434067A019D5696F53C06F02D9E6A3B3434061E1BFD42E6F53C0AD5E0E88B6B243403B19A4F6657053C055A88EE871B043402D7E9175B56F53C0BFE082AA20AE434035E27076467053C0B8713E0C57AB4340603D1376017053C0F0DB602DD5A943409FA4DAD38E6E53C0641BF78EADA84340B201CFF69A7053C01DA902316FA443400C01A0B72A7153C0ECEF39F58E9F4340C221107B8C7353C0E14F49622A9943404AE9B69C7B7453C0E04B110F24924340409C56DD297553C07EE9A451EB9043405CA4320D228253C0FA2CE57700A243407093FA44B08E53C052B00B0010B24340EC467D6BB89153C03306F41634B643406EDD8A333E9653C0F8319BEA7EBA4340BAE7BD2F6A9653C0DF77CBFCBEB04340A1D83DF0639753C0BBED9BC04BAE4340F062A9ED029653C04A171C24ECAC4340B5C4BC6CD09553C0D9FA67E6B4AB4340BBBE888F779A53C0645FF918F7A043405A62994D8B9953C0D502269C5A9F4340D40CF28F139B53C0FDB66482279B434099AA2EF0239B53C092CB71E54B994340D14AC44DC09953C0C94C080BD6954340FB5CEE708E9B53C006C4DF2E06934340B8F2FBB2AB9C53C0468863943C8F4340AAB586570E9F53C0A1376335548E434099099A391AA053C0537BB2D8FD8B4340D0212E7F58A253C036BD182150874340BB6884831BA453C0B79052A67F844340D4A9952126A353C0152900A801834340924141C267A353C07BC6D3A9C88143405F3F920951A653C0A0A3E2B4D07B43409F2451CE5FA853C05BE8D432677D434079694FF167A953C0278138B9AB79434066D2FAD688AB53C08D7EFEBEF9754340948F98DD03AE53C01B25F1C1D6734340440FBF5D58AE53C0039047DD14774340AEF7160037AF53C073AEADBDF2764340FE3F47C2F3AF53C0780CD5C0AB744340A0F33D6BC1B253C011A05206AB704340D614611037B453C09E73492EB86A4340DF32B0BA75B753C0C352343AB7614340CD685A6E32BF53C03B0322AD626C434097575ED628C253C019AF22146566434039EEB7D981C353C00EC9457533654340D9DAEC999EC353C0E7AB8FF98A6143409124DE3E95C553C06792ADC7875A43408F1545BFAAC553C0FBF971D660544340C491C383BFC753C0F4F14D54F65443406F3BB7C427C853C05383CF55415443400FF0A590D3CE53C0A61320E6803D4340');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('50','WI-ESR','WI','WISCONSIN','F','968','0106000020E610000002000000010300000001000000F500000099DCA352E8EF55C0E5742942167B464082459A70C2F555C0CFD29686B276464051FB4A6E2FF555C07721C5D0C96F4640A3D2B43517FF55C092DED481385C46402B325974ECFE55C0A14E44A2B056464059BC48B5D90056C001943BA1CE5146409CA876D172FE55C0EA96F0A2434C4640DF2B3255D50056C0E4251361A54F46405F50CF33960256C0BCECFD3E25494640C47C49AED6FD55C04C1CE8238B44464009DE79474AFB55C056FDC68602454640994C03239AF755C033E9E2C8F64E4640CAC36817E9F055C0E96ACC2D7052464016F9391853EE55C02433E0903A584640FAD21C6053E755C04E1F644CA16A464000C307DF60E355C0CCF74490F86C4640F821E89A4EE355C06739E8D658694640ECE85282C2DB55C0CB5723740F724640CC466A7584D755C09854B16EE16746402F33633220D455C042013658B9654640FBB72C60E0D755C08A86363FA55646405FA4154A4EDE55C06E247F5B58444640A1558F3766E255C0AF1EBB05F729464037BD3DCD1BE155C072D3571F7F164640F632E75E3DE955C0D1BB76B5850C46403378C2C778EE55C0297194716BF245407A2EC686F9EC55C02C0D1AA32AD6454017743D904EF255C010647312EDC54540790DDDAF63F355C0AF623E24B7BA45404714877105F855C00268215CE6AD4540739EC40AF3F855C0CCACAD663E994540D4926A600BF755C0323F6B49B689454090ADEC4016F955C0BBEB87964C834540E9E3C23588F555C007D95DC4777B4540862C476878F455C0BE6A6956B86B454060766F786FF055C06F9A38A2866345408000B316A8F255C066B8008854554540FE146D4E08F355C0A0B17C8F9C3E4540A9388071770C56C0317D4A3FAC3E4540D4689F41121356C0E064F17BF93E454038792950392D56C08CB3E78DAD3E45402CBC43B5F63056C03A11518BD63E4540BB9CF7A31B3C56C02BF11A26D53E45404ED45203035756C0C07A81C5BB3F45403FA47BA5A35956C0E2E7D324AE3F4540CBB8F65C6C7556C0358894A871404540CB3F9CC21D7B56C09B6274DE86404540DF0D47F7E29A56C0DFB53E1A124145403E74F776DCA856C0C43733D4324145404F7D32970BA856C05CABF8EDA74345407F83E0F6E8A856C0795DB6A3214745408ADC6D3685AA56C0E5FBEB5D23494540C61B337577AC56C08A3056A6A751454058CD4113B8AF56C04FB53F9F1854454061C1F5771FB956C0D04C2492D0564540DE029298D7BA56C05FDDEE6F2057454051B59A99F2BF56C0BC6ED7E6805A4540B1ED991B3CC456C0C5563D56595F454003850EFC3FC556C08801DC4C45644540B3A75FBCFAC556C009E0FC5A8B6F45400A97D25EE7C856C00F6E3AAF83764540A822F4DEBDC956C06E8510232B804540B135A45F39CA56C07B687A32648A4540DA5751E0C9CA56C0531C25129C8A454092F8F39F53CA56C09E418BC4E3924540AD61615A6BC456C037AB0BCF02A14540973EE15A40C456C0C519A06AEDA345402FE9B01C06C556C042ED97241AA84540E4E11BC454CB56C025A8AB1B4EAD45405FC2F305B0CC56C06D524CF86CAF45403AD245A87FCD56C0342D3B4E47B6454015DDEE0A19CF56C08225FBC57ABB4540FC3FFDEA4ECE56C0CBEC787F1AC045403C5B7E4D65CF56C076EBAE363CC64540CCA4904EE9CE56C0F483076EA8CC4540C507CA7289D056C020F3697FB2D6454027871C1492D056C069D2ED7677DC45406F1C591A12D056C05331CAAADFE445402735A646AFD256C04A8140BF70EC4540A4DE1816E5D756C074A5EB8E3DF94540D5D598F941DB56C04A88ADCA28FE4540CE22DAA2D1E156C03034722A610446406A3DCD266DE456C03990306A790446400C4176AA83E656C04568D7A93905464065D2F431BEE956C0172A230A900846406C3CEDBE34F056C0991A64AD90114640774D0AD251F656C0135AEFD27818464039CF235EE0F856C03AB56798F5204640EDAEB5C507FB56C0EF23C25BE82446403E4655670EFB56C005E5FA7DA4284640B049416B16FC56C06DD8AF00682B4640594160923BFE56C069204784A72E4640A29CF967D80557C0425B100C3235464092B9265B310D57C0FD64F34E1D384640A79AA042F10F57C0E686AA4F653A4640CFD68DEDFC1257C0B0B2DFD0FF3E4640E6D116B6821457C0175CADCF2E454640DF5DEDDAD01557C07417724FC34646405367F0F9962057C02027B6D09E494640947F966CF92657C0E02ED30E1E4E4640A8693AF1572857C06B7C2C6F42524640F77323652D2F57C0BBFA4810575B4640AC5A11B38E3357C0F3A17530825F464032B321AFB43057C08D9B5070ED6A4640B13941B1E93057C01B20CCAF5D6E4640F30DE254663157C0C96E01AF22734640CC770052403057C094D196CF1E75464092354E32FC2F57C061D3908FC3774640EE428E99183157C00C1F9BED208046407CC18CDAD43057C01BBA8BCDD482464004C55A25FE3257C0462FE0EA65884640FD9A65FFB42F57C046A680EA768E464009793503AD2F57C08C31BFA805944640A8991029CE3057C0EB1201E8E2974640451C3DCA583057C0630F42272F9B46409E137D2FC82F57C01AE6DADB17A64640379A20C9452D57C01AE8D7D4BAA84640FA2607E8D42B57C0CFB03D4A79AE4640EB4BF722852957C0038C8DA09EB246403B9F8145472957C0168571F73FB84640A37EA188E82957C083EB00B544BA46402CE11FF0DD2B57C0275B0CB52ABC46406DD520169A2E57C0342D56090CC6464023705179C73057C0B1AC16C939C846404411FE3E713557C0F0FA07901DC84640C2CF96001E3857C05634185117CA4640D9A9AB59AA3857C0EBE8B5E58DD246405E2D45900A3757C0C42193B6F3DA46408D4DE84B5A3557C01BE2A9CF8DDD4640CFBFAFE3DC3157C01207B823B5E146406D3220B7EB2F57C01A0AAFB62CEB464049E7B474FB2E57C04E65E65328EC46401990690C332D57C09E958DEA0AF246404C636626A32A57C0FBFA75C235F54640AE0DB8FA5E2357C0C0483930C3F94640597E5ED6882157C0AF1B6D49C5FD464084B3C112971D57C084D7B6E197FD4640232A1D30331B57C0F378F2B743034740E561DF8C5B1757C01144C870140247406358468C281657C00FDA246EE4024740FF0692ACF31457C09D1BCFC8470747404D335B0B851257C0B16D1FA35F09474037B5E80E7E1257C045387A7D0B1447406CA2CDD1791257C0E42B1AF73E3547403F342EA8621257C0FA6D8D1953544740B1A720C8620D57C0068EB4B3CC524740A045B45E240657C0317CC86A0E5F4740AE697D1C440057C09860A0C5865747400C465337F9FA56C0F73B8CA30E574740BADD1FC891E356C06282F7C9E06047400E4B599726B756C01E3B60D9EA7947401691922E91B156C0F631F942CA754740C12B3CABC1B156C092100C290A714740254F179447BB56C0300381C2F14A4740AEC04804C4AE56C07F43692CA6524740068C52BB9DA256C0852D2C13344B4740E25033F21F9A56C06D5AF23BC84847404FF34371AC9856C0D9CD4A81134547401D7378CB139456C000F4DE9F9946474066967F6A5A9356C07E8D0081AB4547401A2D9B2A369356C064D708E4344347405E723D28449156C0591833A4E042474032915EA7899056C03C541E0620414740EC7981A3898D56C08E5E6546CE404740DCBC4E3B548A56C01D04FEE89F3847404FC3A535138956C0C3E4E94A6B3247401B36DF0F5F8756C00DD6546CBD2E4740925E586D258756C0F0D9632D932B4740FF4DF36D357B56C0C2133550EA264740CC904A39634656C035BA5F6CA41247405D20442C0F3F56C0D91AD49ED90C4740FF15F466363B56C079F840C66B094740E49A4E3E7B3356C08BBCAB556E034740F12901DFCD3256C0D93F9173A7044740C1151D3EC23156C0AB2D21B52C0447402882E31C793156C057DC2CF8B4024740C335C37E7D2E56C0EB14C455C9034740888EB5DF072D56C09C690C176C02474014F2EA415A2B56C0A3025F159402474080678FE1312956C04548005927FF46403AF2F663642756C00A2520573FFF46402AD4C7073E2656C040E8C971FC0147406AD30EA9D22456C06B5A4592250147400EE6E84B182356C07381E46D78024740C6D46ACEFF2056C068CD49CC61024740857C690F9F1F56C0DBF010ACA80147405100C1CEF61E56C0333EE02DE4FF464000FAC98F131D56C0AEC908EA18004740EFCC824ED31956C0D04651C6E0FD46405BE74411AD1756C0C1D43DA14EFF4640FAC2998E901456C0EFB5A33EBDFB4640D363BB4E251356C0E8A82CFC20FB4640BCB50371751056C0E8271B77C8FB464018C2F66CC20D56C0D4BF67D754F94640C9D4274C880B56C066BA56D50CFA46400EE37AC8A00956C031003977D8F746409EB03605210756C03E06199890F646404012BDA3010656C0A7251AB9D6F54640D2ACDEFF200656C0D10A339E26F246401577C8DB2F0456C0119B4381D3EF464038E15759CB0756C0D78C4547DDEA46401A1DC117510856C0D22AB029E2E84640DF26D9D1AD0556C0C163EFEF50E54640F10C320F4E0356C0B260A8529FE44640F9C3B64D5DFF55C08633F613C4E546403038EC0907FE55C0992FADFC1AE246404A53DD88E9F755C004E0C4EA16E046409E637745E9F555C0AAA1463578DC4640AF6171A44CF355C091A28DDC0EDB46404ACA312346F355C0321F40FFC4D94640888F3621C2F155C05120EAA590D746400908F8FFFAF155C01A27B66784D646409289EB9D4AF455C01DEF41862BD54640D65D7BDC79F455C06CDFE708C5D346406EA0B5B7AAF155C00554C3577DCE4640DDE525D69AF155C0B1FBC17AD9CC464046C3A1F152F255C002C4B741C5C84640FD22A9D007F555C057B1539DC7C84640CF36D26D87F355C0E25FAE05B3C546404DAB2F4885F255C06D2CA972E1BF4640E58E454312F455C0B598E0F9B4BB464067C0159F0EF755C0FE7CDAFBF8B8464078EB3CBA5EF655C0DA2CF3A8FBB346409EB39B138DF855C0EC41B951D4AE46402D3E7033EFF755C08BACA4D358AE46403AAB0E1596F755C0CC451C11A0AF4640FB1BEB942CF755C0BE17A59261AF46406153B492D7F555C0B2EBBE9B4EAC46402A9AA714FEF455C018743279DDAD4640C8C0A576A4F055C000CC8AC02BAD46400A47C55F22EC55C0AD06691D15B24640AC489D1E32E955C0A0980C4B51AE4640C292979C4DE955C03033DDCE90AC4640E7515B0F16ED55C0E694B49ED7A24640C91E120C21ED55C0DBC11D86A09F46402785900A0FEE55C06A401F884E9E46403BA113282FEE55C0778EC110189B4640922A6EE61DEF55C08850E4337B9946402057D5E4B2EE55C0E824B6FC9A964640DBB20B630FEB55C03AA9738F0192464046AAF67F8DEA55C0F12AE27BF58D46400B09C69F33E555C0C7811E291D8C4640CB13EFDA95E755C05B63D87245874640850BB693B3E755C0FFA66FC8F97E464099DCA352E8EF55C0E5742942167B4640010300000001000000170000002DEED1A535C255C07981BC032CA54640AD3AA4C71EBF55C008E09E643AA64640FC4469FFEEBD55C0C411A969C19E46401AD22E1CBABF55C0D9785FEAF49B4640D524D91FE3C255C06C9C41DBDF9F46402B50F2F0A0C155C09E20D0593293464059814BAF1CC555C0D83ABBF4DA924640466F40A8DFC255C0D70F6EC7398C4640D14DBA869CC555C0CAF5DC83CC8B46407749CBA05EC555C012525F0FD28646408319F72134C755C0C1C752294A884640624DC2B36FCB55C06A21F599CC7D4640F96EE56BCDCA55C0D3DCCE247777464018A8E86029CD55C09755654FC66F464043C30D73E9D355C0CAD8B0373E664640DD1DBA393DD855C0FE4A14273B6B4640B008C365F2D955C0C956B232A274464079C4B7F6E5D555C054EFAC7FF281464085A7A59C24D255C0E3D3E13ABC86464022F8C34FC7CE55C0BE67B37A68964640B2E219EE62CB55C06D7F0B27D693464018D2FC653AC455C0B076CD7DF2A546402DEED1A535C255C07981BC032CA54640');
-INSERT INTO "usa_geom" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('51',NULL,'WY','WYOMING','N','969','0106000020E6100000010000000103000000010000003000000081D35B6E6E035AC06D9039375FD94440A0A41D528D035AC0AAAA767038C84440244A42F074035AC0E437B6CBACB14440A446B2244F035AC038CE873A698044403D6D6FBBCE3B5AC016980BDE447F44404600E3D1D7515AC01E57795E887F4440D28733AD058D5AC0FE7B0AC902804440E340336510955AC095DDBC3C2A804440FA99495963B75AC0A7477B73CD7F44402E63779275D35AC08B2C7D5E0480444064D8F182CBFA5AC081049F986E804440F62F859617435BC0DC4D47AACC7F44406F60B07A23805BC0A4F91A57B17F444076071D3C0B845BC0CCC837ECBA7F44403140D9F343C35BC06E454F0D907F4440517A90404EC35BC047DB971514A14440B2A0E1B544C35BC09AC0FA500FCA4440BC87CDDB1DC35BC0BD512E9783FF4440281ADA72FEC25BC015C7CC8E6A40454053AA7D5926C35BC0EA9F97878B8245402FC3F1350AC35BC0D28B292F72A445408B3F9C4CFEC25BC098B96CD4FCC14540BDB6B7D639C35BC07B071C4FC4FD45404410F9C44CC35BC0460525DB953C464048CC60AC4DC35BC0553AF8050E55464029C9F05F6BC35BC0EF062AF3727F4640AE0AAD607F9B5BC01720F632037F4640CDA075FA22995BC0A331EBF3D27F46403A1F3AC0B67F5BC0E02593845B8046408BF9312129735BC01778BC5CF07F46405536B53204285BC067C31A22B17F4640E3DF285D97105BC05018F9C503804640846A0B6E3DF95AC02D5EC395F87F46409116B14097905AC045B3C140827F464066815D885A815AC07EC3ECB2A47F46403D4ECEB070455AC0D2377E01FA7F46405B1E10C9AC425AC08A54F54023804640D4AE2975D4035AC0844E1AB7A87F4640B985EA46CE035AC0D6F0FC6284494640E5E93404E8035AC0C8D6000D46174640B81987A3D2035AC0CE49A368AA124640E62AAB82CE035AC0BCBAD80A2CED4540C28FA0DCB4035AC0A8AFC5A479C04540229D7A3CC9035AC0F028DB4254BD4540D15E13C398035AC05EA8BB5864804540278A1E1999035AC0D692057FAD4E45400FF89DC36C035AC0D5F523F3F9FF444081D35B6E6E035AC06D9039375FD94440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('1','PERMIT TRACKING','AL','ALABAMA','F','919','0106000020E6100000010000000103000000010000008F0000003910B4FA7B4455C066857E5B0FFB3F40D7B7179F5E4755C0E7605BFD4CE83F403A68ED20AD4855C0933FE3B4D9DA3F405451637F6B4855C040038712A8C83F40203BFD9E544855C0E2D243F462C73F40E5E27FDC604755C0108C1DE847BB3F40F1F48F5C984755C03139BAF264B53F40E5A656FB1D4755C00F9B507D2AAF3F409659B154CB4355C08CD5CC3B0B9F3F40A75854F2BB4255C07145D47DEC8D3F4040774A92BB4255C0BD2CE46E08853F403DEDCE743E4455C054E19801E1793F4023DDA514EE4355C015BD9551CF703F401D8862D7A04555C0FFD6AD0F035E3F40B23A39B7484555C021B5BDDF13553F40E9A737D7324555C03B8F74AC964D3F40E8A2E7789D4655C08ABA19D77C453F4002069A98FD4555C0B506E28D213A3F40424974D9964655C0A1E0EC7B69323F40D0F624B9F94555C0BBE0BB09162C3F407F7C52F7644455C0F62D9FB190293F40C8B4A2B56F4255C0FF0C774670203F407E1A0375164155C0788A289E81143F402500FE541A4055C0CA1B4E2452003F40F1A838680A5F55C0DB59D2A741003F4057AB3768245F55C03E99816741003F407ACB385E098255C0D35922B84AFE3E40C61C504E9D8B55C024D68912C7FE3E4039522024929855C090E17774D5FD3E407635AB26EBAC55C00D34E1FB82FF3E405013D50FE1B155C0E348BC7F89FF3E405256DF8470CA55C0BAAE9CE9CE003F407A9687234FE655C0072DAB68AC003F40303B7462C0E555C0E94D560151F43E4016E492A80BE855C08B99FFA57CE03E409F657B276BE755C00D9330F429D93E40CC60FB7DAEE255C05E09325423C93E407D6D98DCB3E155C087A9AD269DBF3E40157F0EF172DD55C03277FB7AAFB43E403E28DE29CFDA55C04C59CA015CB13E403924126683D955C03DC6DF0D03AB3E40C9B9D5832BD955C06AA2B1C2BE9E3E401370D12603DB55C03765175D768E3E405351B9A980DC55C0C6C6F52709883E40F02861E4CDDA55C0228A02BE507B3E40C4A234A1EFD955C08A48F76FBB703E40240EB528DADD55C004602FB4165C3E40B3565AB89AE555C028B61BA7BA513E40D8203358FAE555C09D8F903A46473E40B4717FB2E6F255C02CBDAEF1E23B3E40B004A3F3290056C01460AA7DCD3B3E4045B98590EAF155C0DD91329FCB453E4074ACBDED7AF055C0A1B5DFEFA64C3E4081741B62D2F955C00330490FDA6B3E40CBB606E774FA55C0C081D2F0059F3E40664C6C38440156C025E8EE3C83BE3E4046380A00AF0856C00EB1C20550563E406098663B801456C0AAFCAAC87F673E408BCF38C9B01956C0088D97CFBF643E40E1137D1AB41A56C03F32867488BC3E40C21426FF771B56C0DCA7B78D2D003F40BFBED1E1CF1B56C0283724F5F11E3F40733A4DF5D91C56C02D07B1A3846F3F40BCE08025C41D56C0D4358654C6B33F403E752CD8441E56C001770E6E8DE33F4010D893AC031C56C09D0B9718271D40406FB32B2D401B56C0C9F37EA99427404048B53C8D341956C0EDF002D94C4A4040EFDAB04F461656C022606B7A5E764040C60505D1B91556C0BC71CA4E667E4040B33EF553821356C0C54B4A7DFAA44040F62A18D4921156C090EC5572F7C44040878ACA6FE20F56C07384BFA811DF4040F3AF5821F80C56C07E28A1519107414089C16423C20C56C0365A7ACD930B414076A73F2DBA0A56C0D6B84AAA7D294140EA6E5C2FAE0956C01471EF128E3B41403677C7CDBA0856C0D1DB4BBC4D4A41403407193DCA0556C026CA2AFEA3724140705B1CFFF70656C074C00F1E3173414019039FA1280956C0A61B9E7A14774140A5D423646A0C56C0C3D2C7EF91804140535187437A0C56C00E9CFDCDBB8141403252EDE71BFF55C0F1BAFE630D824140CDCDCF68E6E655C0DE1E6F9759814140D3EA8BC341CE55C0D2B084B8F08041400300352149CD55C0DADCB4D80481414044F2A6C956B555C0B739DF86C67F4140E8BAF36212B255C032452A2AA07F41404B3DFA0D099455C0AE33201C657F4140EF6DEF8C6C9355C0478B305C6B7F41404ABC9CFEA67755C0B174D974067F414018444C34F96655C010E302B3BD7E4140417FB3D2506555C01A8EDC96606E414011D35467386255C0573D44B3AD4F4140DED02044A76155C044E557FAD64A4140B6F2633FC26055C07E57AD26F24241409D202E53755D55C06FA8280324254140D7B28F09A95A55C029FDFC34200B4140F64BA4C4535955C091AE7EAFDBFA4040C2568AA2935855C026C8E477E4F340409294ED56755555C05CDDF284D4D34040C2E827CB845355C054FA03C9CBBE4040B1786907CE5255C06C8F651883B64040DAA17056F74E55C0A914EDD88A904040EB0C14B6F14E55C0B38A66BA608F4040E98F8FE9904B55C0B361A291976F4040045E2825634A55C055E10D625A674040DEB98B9F324855C00481B60A77634040E3BCB6FF874855C0BB8D9AEFCE6040406854451EFE4755C05682F6F2475F4040178B479C494755C039E77B76005E4040BA50311AE54655C06014EF035158404032056257CA4555C06A3DBF288C564040EF5E46B8A44655C01D8ED730AD524040ECA53C55864555C025B24917715040401B802DB4624555C004760A3F2F4D404050657891874455C08664A886664A4040CC1F01C4B83F55C018B9683F6C424040AA981D21593F55C029587E12383A404041F073DEC83D55C08F244B39F8364040456B483D243E55C071CA28C3CA3240408911EEDD013F55C0B1914D468C314040EC1726BC2F3E55C0BF9F816A8D2F404003350F3E224055C023A381116D2C40403C3EF35D574055C05BE56916302A4040FA5E65D3F23A55C0B6CE308385254040D759092F413955C0379301EC652240400D76688E373955C0A52ED2AE2C214040E654246FF13955C08242B871F11F40401B630F911D3B55C032763871AA1F404072C8B4CF9F3A55C0DC71A455411D40403CC6EE706A3B55C0D32FA1B7E61B4040F5BA2396723E55C09C2923F72A1B4040E864B5F3763D55C0A12BA01C91184040C7FD0739804055C08137197EE51640409AFE047B8F4155C0A859A480481540402B7EBD7D694355C0217CA4A93510404092665BBBF44255C0D8A17372A20B404022CFFC3BA04355C0AEB0B217EA084040679BE4FBF74355C02E08E5BC66064040D2F31BFAA04355C082D0BE64390240403910B4FA7B4455C066857E5B0FFB3F40');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('2',NULL,'AK','ALASKA','N','920','0106000020E610000020000000010300000001000000150500007DBF255EAE2A64C05BC9E212DB5D4D40D2660F5D3D2C64C022BA344B115A4D403CCAA0D92E2B64C00447FFC71F554D40AE450B1C7D3864C09F4ED2169E464D401A75F6DFCE3664C0E8F7D3A7674E4D408E164FE3083864C0C1030FEA50524D40D709B3E0873864C09D35DD40944C4D40B7A136368E4564C03A4CBCF40F534D40A07AC672983C64C0FBDD2B1E74534D40791380A90C3564C0AE1374825E664D40BB7425B6BA3864C0C4E04F3B21644D4007422C604C3964C0AAEAC49DF37B4D4030D7B28E6E3B64C0CDC6D3B198834D40BA2B77822D3264C08A7C5F71298D4D40255AA2565C3B64C0076D551D838E4D406F75FFBEC23B64C07B2A5AABB8874D407D913FA3D23F64C0C9397C195A924D4098763FA1A84164C0028ACA23C2A24D40990BE45F0B4064C0A168EB2B39A74D405FF3951A9E3F64C0E184F8DF1D9F4D4061A5FF24BD3E64C00C1ACBFD89B04D40583D22E5A33664C0ECF3E52B79BF4D40E49EE9E1A04764C0BFF915DEA6074E402C6D97A6644664C02991BEEC63124E40604F8B2B1E4864C02BA4997037194E40DBA100ECEA4464C03BFCB1FE541F4E40C82D366F314964C0A04CF7B37A1E4E40D1A7E5A9AF4864C04839452B45154E4003BB0F2A484B64C01C5B09A3ED114E40B63757AEB84A64C09C8E10ADB51A4E40E48308372F4F64C0755AC46E04264E40F1C6C83F414764C07302EE5AB8404E4002134BC62C4764C0FCF104255B4A4E406F335509373C64C0E0789887C9594E40D67DACCABF4264C031E8D93534544E400B1DD6532F4564C0C7EA03BC0D5E4E404B3F900A0E4464C0158077321A534E401366FFC9A64864C02B830F66564E4E407CA42B3F274E64C0EE57EDC17A364E403B761B3B8A4D64C07B681A7C26304E40A58C4FFB705364C008AB37ACED294E4055577FB5E05164C021FD4F65D3204E40F1D86DF8785664C0CBE42EE052214E4054F86F6F744E64C0A2363CA3E6174E40017094E45D5064C04FDB2CC8EFFF4D404709046B205864C0389A85BF41004E40C8B501A9225A64C077920AB4A6F74D405018AEECB96B64C01250D116D3E84D40F5641EBB878364C0A1C7BBCAD9EA4D40BE820182118764C0872C3654F7F84D40559C8484A58364C00210616638004E40BB8EC40DAA8D64C05FBF49C7980B4E404942634E3F9564C0C8A5F5D22D214E40DF928C20D29464C0D7B82AD7DA294E40C0A27AC8DF9864C06D94965932254E405EA8684B82A264C0B4E5031E08324E40B1B958C8AFA464C0BD7FF19EED384E40AF621F52E4A064C05271D3638F3B4E40602642998C9F64C0DF8325238D454E40BD43A14407A864C05A10B6D78A3F4E40F8EBAEC3AEAD64C052831B05F9464E40BC1E806737A064C0A367F0C9A3594E40BA29473014A164C04D5B200173644E40FFBE01FEE99B64C0F1CB4E0ED86B4E401B2451850E9E64C044DABA079E764E4079FFDB81ED9A64C03EBBDDCFDD6E4E400A35360BA79464C0244F62DD72744E4086A4EA03659664C02A03EC9B606C4E4094CA25C20F9564C012EB8BA1DB684E40A8EBD393B28864C08F35EC983C644E402881318C0F8764C071CBDBBB13584E4092EAB0BCCE8D64C0759E65BAB9464E40ED86218B507E64C0E5AA48A9D8634E4031D8D002D17964C0EA4CC288395F4E40B5BBE9F3A77964C088E13591514A4E401247A0AF846E64C073DDDC70C3564E40B436E336166F64C0A0DAC07714604E400264F874266D64C00CEF4BFBF85F4E40890ECC8FCC7D64C02F86B225FC6C4E403534BF45EC7164C009D917B5A4714E40E1C8CF0F437864C09A735A0970774E401D10D7D1BE7564C042C68698DE7E4E40AE0CF610B97E64C0612BF75D696D4E40A7F91909EA9164C0DD57E325CE6C4E401886FB0C759464C01E71819DCB764E4054594F0ADF9B64C02B6577CD35794E403B644CE8069E64C0BFD23588E9794E40F8DA2D44AE9F64C0C4AF72A3A8774E4049449A3E60A264C039B0357CFC734E405C19B5BF89A364C0D7C79C5816764E40C6BFA2012CA664C0E5743A31D97A4E40929AAA9C929864C0EC4793D11E8E4E404EE54D58DC9F64C05E2C153B558E4E40CF91D0D08CA164C086BD6B3948874E406BF00895FEA564C0B0413E25B88F4E40D912221C13A264C08E89E564F49A4E40F0C9259D82A464C0474A6A14C0A04E406E67E81BB9A264C0F282E461469B4E402F23DF17E9A464C00C424AE3E0934E40A4977316EAAB64C048C7008A9A994E40E8799E1DB9A664C0402E73CEA3A14E40FB9B2E1C7EA664C012EE76C25AA94E40D2FE351E4CA864C01999117FECA94E40A721229906A564C0C08B93BCDEAD4E40F72E1A9BE4A464C0AC0D20F943B54E404FA4E4AA1F9B64C00FA06BB42FBF4E400A8C857DFD9664C0B64ED50CF8CF4E406FE3807C36A564C013CE72382EB74E40F470575F46A964C038CCE63BA2AA4E40D7C0A41D2DA764C084D2098B0FA34E40EF2331551DAD64C001AE7445909A4E408343D092FFAA64C0EE1C555205944E4048A5470703AC64C057B69099E4884E401B09277F41B364C0900A0D3F5E8E4E402572CA89CBB464C01B14C2E2549E4E40B03C32118FB364C02D30CFA2D7A34E40476FE493DEBB64C0BC078884C7A94E400234EE5C91BD64C018313B36D6B44E4025F59A65F4B864C0E8D6119574BA4E4075DEECEE73B964C0E3C54C4B6BC24E408A55E2EF94BC64C0DC43FF01E6C64E4040FB48DD29C464C0B50E9FFD92BF4E405AD35D7067C664C0685EEAB545CB4E40CA275F8646C564C0B8255EBF45DB4E405C56E97777C464C0C7911DB823D14E400C076AC379B864C0027B956A09D84E401520570611C064C0F5C2BF97FADC4E40F6B9AC163BC364C0DF587B535BE84E400B9DFE16F0B264C0B548749AD6EC4E40376494E947B864C06C760D90F8FE4E407C55B93A95B664C003B6965D700E4F40BDEE4AFBA9A264C0194389AEB3434F40A5B0C441D69B64C0929A5DC869444F40CF2D30F84F9B64C092A2E10A3C3C4F404696B6378B9364C0114443EC26374F40B9B76CAB239864C07826C298812F4F40A0F15DB76E9264C0D6267C7055364F406C9C723BC49564C047B46B226B3B4F40D4DAC5835A9464C0A8E8C6275B414F40FEC3473ABE9A64C0DE5B430D8D3D4F40048DA684649964C0F4E40D1229454F40BDE7B7C66F9B64C0C2A12ACA40484F40CB3C052C698F64C0B8A8DE7F5D5F4F40BB2DAF0F709964C0ABD40212314E4F4037A5956A7A9C64C095161B4BEA634F4065C05B2F889864C0DEAD695BF2644F400E8DFDB42A9C64C07ED03250D96A4F40E5EA211AC19664C05C97AABCD1814F405DC654D7218A64C04BA4EA6F5B814F405C43762EE39264C0D8E4746700914F407ADF05B9418C64C0FC175F54219C4F4067DFC3F8B58464C01079407437A14F400DBB6C9D497764C07DC5DF94629B4F4075EE90924A7464C01CEC78573F924F407FBD37CF427564C08CBFABCE3A8E4F40BD1FD70F5E7164C06AE9F8A39D8F4F40AC9AC3C9C67964C0FCF0876ECD7D4F409A465BCE527164C0E8D8A9A17B8D4F40CF8CFF03036B64C03B898BA9B5824F40480A43030B6264C01DA542BE94874F40487DD216D95564C062DBDEAB699D4F400B62837CCB5364C003956976A2A24F40D6DED531D14864C0D24260358DBE4F40538C9D990F4A64C0599E07A42AC54F40C9138CA98A4064C0243BBFB98EBD4F40FC0495A5074564C0691D870969B64F4046D33397EE2464C024EBCB7B81C14F40ACFF7D6C3E1964C0DBD891F1BBDE4F407AD97DC4CC1864C07C44611759ED4F40BEAEDCB22F1E64C0EDDFDC994A045040C8594656D81E64C003F730F22B0F50402F242894192864C05FADFB8817195040F6FC7FD4462664C0EE686DD28C1A5040415660ED4E3164C0E1616DE8AE18504071D94842E42C64C0865ECF5B2D22504041A8D01A272064C010A28AB16021504093E2B8A9B82264C007080B372C235040108204E13D1A64C0A42EF3C059275040F1E38378181964C020CC0812CE2D50402333ACB40F2564C0D3498E550C3B5040C9609F70C51F64C0A4D033A2063C50402BDFDD76502664C0A660A492CB3B5040EAF60435152C64C0FA9FCAF9633250405B26ADB39C3164C0E5691163AB2F5040235E63FBB73964C01300D80E8F345040B7EBD9B7F83664C03A560354683250409FD459E47D3C64C0E20C90B97B2D504032E47560BC4364C0A490EE68C42D5040B48ED2D2865264C06FD50566492150405FBDEB854B5464C06FC683C7C018504053CF7510FB5864C03DDA483384155040CB012BE8E95B64C0B56AEC79441D5040C62A15A98D5A64C0C7691482AF1F5040666E9F63B36164C004C188C2462350401DF81D5F066564C04F81E080FA295040A5FFB623806C64C0F7C1C577E8255040E45C8D27466164C0BE52D0C2FB205040ABA69487B56564C0B966C73E081A50401A4C715B1E7264C05675116E33245040BDC99CD7858B64C0FF73F6C90D25504045EB702F3D9764C0A23B22AFFD1E504086C5EA745F9564C0DA4D25356D215040BBEA3F68909C64C0D6DDCA1F0B1F504066F12966CA9D64C0C2E2CB9F1E2250409C7BFA61889D64C00CA6211B3B1D50401B98BFABA29864C007C5D66A5E1E50404155D0D7FFA064C01A43D4D05B1C504033992971AAC764C07A1ABAB919265040BD582099C3CF64C080642135FD2E5040CEDBFAE379CC64C0E1D5F286FF385040E0A856056AD664C029D49E29813F5040090A2CA57FDD64C096CE21C25F485040774FC6F7C2DE64C09C8628A86C4D50403339E50A79DB64C014160B3D1E525040E8C08728A4DD64C0E87D6763484950406A118ADFFCD564C0673CC1736A475040C016AE9976D164C012BE9DC56448504009DCDA1FF7CE64C0310E3355DC4B5040C54B1A6B96CF64C02D724DD8F84E50402D3330AF0CCC64C07CFA13282D5150406A2CEBE5BAC164C0D5F7A23F13505040BDE621D325D464C08A66BC9F415750406663B0A9B7EE64C0841A14CCC15A50408EF64AFF280265C053B7FB691665504083F2B758FB0365C08E57D3F81C6B504073E2B8502CFB64C067FEBEE3AD705040456B97921C0165C0183EAD430E6C5040A532F2486C0165C0AAFB55769268504066D6C9843DFA64C0E3C594DCE76D50407B4BEF69A8F064C099E73031B06E5040F17A0AC161F264C07F6F09BEEF7250402CAF438367EB64C097D0DF5FC0785040E875066D90E164C0F457F874057850400B78BB6B04DC64C0DA053049C17B5040B12623F9F7DE64C07EF1BB893E7E5040C81D3EEF7BD964C012C8FC15BE7E5040743391BBF5D664C0F85D14E6EE83504078921BC0A1C864C02F281E526B8B5040321538DBE6B964C08FC2C5678C865040148C0B991DB064C0A9308EC33B895040F97966F821BC64C007475B73318E5040DB8718499DB864C049284A874A94504025E547CA3EA564C051F690C4539C50408E0953BA27A164C0240AB5472E995040CFD9D7880C9764C0D7A1636E1EA35040678333C4C88C64C03A77F084ACA55040A2ABD382678B64C06F21FC8704A65040BF8812CDF87D64C0E7DC22FEE4A65040AC9F919C167464C011FF642142A45040F31EF8281B7E64C0A331DE1A21A550408F1D7C553D7864C0949AB69C1CA15040111C868AB37C64C019AA7341139950402CFE03F86D7B64C0E8DFC8ECAD9150405C1F2B7F168664C06152CF4D2F8C5040A231C6F1967D64C0211EA61D458D504059BCE59DAC7A64C086522AD122875040738A6C8E177564C054B8ED53788450407C6328C3535864C0407A0455D1865040EB61F96E595564C0CA6F408ACB7F50406C7DB5EEF24464C07406D375EA8450404497D21F363A64C0C28434435B7E5040E4F6B8A7E93A64C06A9ABDC5CA805040F7749D73393764C01946DAD41C8550402E77CEF31B3964C084D23DCFFC84504053FF60D9103164C0D423163218915040AA82D7E1E02264C0F33921896C8F5040B9F21AFE882364C02B9DDB7D948850408FA788B8B62564C0D794C1F8798750405A71B440262264C0CF203040748850406E3DE3BB282064C077C0818F10905040B44D9CED232464C01955340FB3955040A109E5FB2B3764C08704996DD7995040B35293F3323D64C04ABB75DE67975040834055DF7D3B64C06E4E34560092504022623B1C353D64C0C1803C5285915040128F38AADE3E64C0469E9716419550402BFFB504023C64C0F468E1EAF49B50405348DB9E153D64C0A82F67F436A25040F05625CE404764C0F3164CA36EAD5040C5A2F517205064C0B14FAA1331AF504062F7712A4B5464C051875D932CB75040BF3CB4C0774F64C0C08FDEE725BD50403BA63785764A64C09E4A4B3238BD5040E44E4CA18F4064C003B2257EAEB1504045F3F5817F4264C0BA175D6A12AA504079FDB16F683264C076298E45949C5040F51C4D530B2664C027B4E09E6DA2504048FEC065681A64C08A1A44A42B985040312FD620770764C0D8986A968A995040F0FF077ACC0664C0B6FE2EE785A15040FF62E74D5F0A64C0884BC1E58DA65040B48820D5C60764C0E97303732FA95040AC41EE8F701164C012DA94CF85A55040F4DBD76BEC1A64C01848A24060AA5040C2838AEF932464C00F2A14EB65A95040F8F7F5D2112864C0FF14B91B16A35040EFD119324D3064C00F975C5720A250401E08CC9DD13C64C0AD75D01392AE5040F154CA01B33964C040527D5D8AB95040F4AC2F08A23064C0C8938BAD23BF5040F1F2B6E0DB3B64C0AD71C11D48C35040015B7092974764C0FC3C3E7D6BC050409872355F9C4964C0B74C93BD5DC45040BBFED70F934964C03130A3B82BC0504087F6D5878F4E64C07B1BF2EC3EBF504049FDA7719D4A64C05C3FB3408AC9504059BB0774224C64C065BFADBD6DCA5040056DA689445264C02F1CBEA486C050401B818A1A317764C07F81B84F0CC7504079F86E63697A64C07117E54FA8D65040DB988AA0BB8064C098508BC8F5E2504004E8AA37B79664C0545D98E6F7F450405915F3D032A964C0A516B01FE0005140314F82B7A8AB64C09FBE10F875025140CC68400E82BD64C0749D308D5308514014A97C054EC964C09C4710BCA71251400B4844E095DA64C0611BA4DA67165140E9E79E2414CA64C0E0B9C48384195140E16B9430D4CB64C0D8D918430F1C5140D2E6EED752C764C0EF8D5B1D982451400D1DA0BD71C664C076D2722C8A2C51402B09233485C764C02AFBA138F4375140E563F5437D8A64C0A3931418833B5140E20561CB0B7264C00C8DC1F33C495140752081A2FE6564C005AA5A71C45A51401E7B6A3EC26864C04F77765BC4525140F7421B12F36364C01CE664EF94585140DDE2E7D9306264C04E8005E050645140F5557668C06464C0D5D471E28466514012A6EDCC375E64C08787E40E4C6C51405824655BF06064C0F39A5D4A976E51408402F170E95E64C0B933FA1DC67151407504FE11963E64C011BD66B764935140CDF9AA54D13664C070DD7F074C915140B84BB6C5C33C64C083ABFB385F90514092534001273964C08713D7BF2C8E5140BAF2B20A474064C0DCD8F9D0508C5140F53289D6F84364C0A1ED4C29EB895140111EA9FB833664C051471A85518C5140F46CFF93BB3364C0FD41B6CF51905140A609D0F47A1E64C013084901869251405AD86081551F64C0767FD182BA9451402C40493CEB0464C02062CEE7AAA65140CFD854DC1BFE63C042F45894F0A551402101BC3C8AFD63C0ADF762CE6FA2514001584CEE760664C04704BCA8269E5140AAFFE29E8EFD63C0674DE3C5EA9E51404CC46C1D3B0464C0E8D00ED8569451408D8414273BFE63C0F8912DB14597514088B93EF7BCF863C074375163448C5140143BF5307BFC63C0ECB2A17A0899514011112E6329FA63C0F5A3A253AE9F5140701DEFDEADF563C05D67B97DD89D5140385B68113FE963C083C4C54FECA1514073BCD5A477F763C006326F1C8A9F5140026DFEB122FE63C0681CA29976A85140116E47ADE00364C0D7225978AFA65140C9BCCB067DF563C07354FECC0AB351402A92F1234BE563C08C5FBB5057B851408C03EA5AECEB63C061E76BF5F9B55140B1B3D20AD7E463C0CE4948CA72B45140DCFDF5C059EE63C0810DB0A3DEB15140DE12CB930FE763C0637B5D2FFCAB5140CCDBD3F1FFE863C0BC88C4F264B05140EA603E7417E063C0DB6C661464B1514098239F0697E263C08B762C110AB45140B2802BE6E7D563C0C9ACFD6E3EB251406674245EF4CA63C0A18850114AB45140E835E3B360D063C0AF0DB9464CB6514006DE7ECC48BC63C0DA621E02C7B651400E4A5673EBA863C0B890699919C351401DDA687E3C9A63C0548DB9A430D35140809E00CF8A8F63C0A035A0C2FFD95140239BC787258C63C0343E4A84D4D7514074AA4F025B9363C0516708775FD65140089DFBEA698E63C0F4754C3BD8D05140B7DDB2DD5A8363C01FEDBF9270CF5140EAFAF10F7D8163C01E70125365CD51405C7E9DC69C8363C0FFD0F209FACA5140B4360F8D607E63C0A713861B09CE5140C307CCBABB7463C0A4AA09AEDDCB5140C6EBF2E69C7163C007EFFDAC82C75140B4515EC0A77763C0B2C7034DF9BF5140544DCFEFF28563C008856BE5BEBA514025D533A68E7F63C02BB3CAF07BB95140A8BB2273437F63C060CF719D58B0514037EB94F4F37C63C0A7A9442513B15140203FF949BB7C63C0482DBE6DF3B4514025860742C67263C071980107B7B551403D5321E43C7163C0B2F2F094DDBB5140EBC40034806C63C093ACDF6734C051400070751A476663C0A909EF3B4CBF5140BF3236094D6963C0DC2EC1FF72C551407E086B3A266363C0571772D260C551401435EE935A6363C0458CF6DA80C951409D2A8F86616163C0064BDFDD61C85140D00D955E0F6363C0A97750870AC1514061ECD058A46063C0B0AD944B33C151407E6486FC1B6063C07C70D1DE76C751404641C037635363C009FF4AA7EAC051409BDF83D40C5563C02BE1DF96B1BA5140D73167D0E25963C0C188C2402BB8514078886F42544663C0130872E1A9B15140B1910D20633D63C084D4E1C7E1B851407BA8D0063A2763C08484180668BB514097D30FDC081A63C0781F1F23B9B85140B1AAE5B38C1663C0DF1263DED9B3514000B322C5491563C0BCF588AAD6B65140C87FD254CB1763C0B9548BA86BB85140E796C4BB080E63C079572801A8B7514041613893000763C0DFAAFF49E3B3514008CBA036581063C06391315C62AC51402EB92161E80F63C069DBE7552FA9514021F4476B6C0263C0F90097F921A55140A1B57341081463C02381437D5AA3514097B4BB0CCFF762C075C3ED1BD1A3514005975DFECEFB62C01A9A1206D0A05140EC0803B2A0F862C046F2F24FEC9F5140FB28756104FF62C0E85B43F05D9C5140CC026F5F26E762C021B94A84BA975140B6501461A1E562C09126424A039851402DC36AFD6BE662C08A973BCFCC9B514058AAA0C30FD962C0C8B47E0D1FA051404DBC56A4E7CB62C01DBAA141179F5140A3C45D4104CD62C009571BF12E9A51402FA4A4CE84BC62C0461CC700F1A05140EA136E79EEAF62C08873C96B70A15140BF2C055D879362C0AC862B657E995140A0A557F2419062C0028F981AE993514087EE95E9398762C02A9CEE00F89651403A278973927B62C02EF8309CD293514097F45DC02A7662C0746A969C5E8D5140043BD266F43A62C04394689AE68A51408A309E1F8A3362C02B0AA352258451407FCFF7090F1F62C0961FD7B4FE7D514062FEB624BE0362C0A72FF18B1C8451402A24C94A4D0262C0C7570CC2FD7E5140EACACF98DA0062C061ECC2CFF482514068E932652B0262C08A1B54120E8551401631E811E5F861C09788AB6D62865140466188753EEB61C0EE543F0CF5865140497658E182E961C058224947AC8251403CB72C3211E961C0E7592AD18F875140438B545C0ED361C00F82C6A141805140510DCC26B3C861C0A06516CE4C7651404AB204247BB761C0CC3BBFC49F71514098EF341183AC61C03EFDE3F004695140900B34026AA861C0AF84CDAB97685140FE6038C526A761C0DB3BD12C076B5140F3D4ED4DDFA961C0C13592F4376C5140AFB5F75D2EA061C02FA78FB519695140CCE5DB5D2EA061C0884281751869514017A585B126A061C08EBA38F6621B5140AE7DFBF113A061C0D9FB5107C4755040C35BB916F79F61C0E07DF55480F24E404D8FC593EA9F61C02C5DFC2D46274E4052F8AFB3E89F61C04B9825EE44274E4070E82BFABD9061C0AD0CC213661C4E4061B36A037C8E61C066AD915899274E407571B1C9657F61C081EBD647FE174E4038997695B57561C0B9AEEBCB8C2B4E40FDA38CB13B6261C016BADB680B2D4E408F5C766B196661C0BD8A0C81560B4E40F93F6DD2245661C02C11D1510CF44D4026F451D9C25361C074FD83D10DE34D4082EEFDF9F63261C0CBB8F6127F9E4D4087F91D34F52E61C0F2398BB3EE734D40C24CA6F6F11961C0CFC3BCBA1A954D4020C7DBAABE1261C07DF32A5BDB944D408C9C40C29A0F61C08DEB6127F0A14D40F157B65DDE0E61C074DEA78D00A54D403C2ABC45E50E61C077B8598F14BC4D40EBF09E2A8B0761C086E197D843C34D40732BCB32100B61C04BB26A501DCD4D4056631F4732F760C04214CCC44CDF4D401A231DD036EF60C04BFF30429BE64D40C146B57E85E060C0FD8A1D1F99C84D40F3D673ECBBE060C0BFB4114042BC4D4071FE1CF1FDE260C0CD13903B9BB64D4071301724B6DF60C02DAB1E7DE0B14D4043586E6145DF60C0047472BFABAC4D40CA45211C85DE60C0E1D85703CCA34D40F109E05013D660C0438904D01A9F4D40F9E26EBB2ED260C0C1D12E63AB904D4027FFDF76D2CE60C0F095BCFC2B904D40D9B370FEB4CA60C090F291C59A7B4D4090EF7810EAC760C0EB5A4409A66D4D4002F5A0A584BA60C0DD1343ABE65C4D4058F1AAB3D0AD60C0E02B5A7CBB3A4D40575490689CAB60C0A80D628FDE234D4007A78A3A79A560C0F25EE2FE04144D403B1E971770A460C0A281333C58114D4080841DBFA28B60C00FDD9F45DFAB4C4024A0E0A04E8760C0E14A3C4D299A4C408C45A427D68A60C08D48CD6A438B4C402E421C1FEF8060C09B200CA99D844C40898ECB195A8360C0439B7EF1E36E4C40C10D7D549E7B60C00DAB9EB352664C40BF2993456D7A60C019E630B75D4C4C407901313AE77160C02A31FCFB0A4D4C40A733D03C636260C087D4B12ED6334C4005E8FD7CD06160C0251131ECE7324C40CD9AA13ED65860C097D7666CD12E4C40301527FE1F5460C0621F580F0F214C404362B03CD64E60C08CB8AAA8121E4C40AC7A2BFB4E4D60C0BC1F1F7574104C40079D82B8E34260C0EC180E80120F4C40E479E373894060C0FB77FC6D56F44B4089035430A54560C0565FAE8B87E04B4089035430A54560C0263AAF2B86E04B40B50E51A9A84460C01CFD4E3342C54B4042C04E64C03F60C01C06B85504A44B40AF11E95F4C4360C0884508F81D9D4B407600357B904B60C00C28B0E62F744B4037B272DFD55260C02DDD99E092654B4027F60BE37A5260C00FF2C83FC06D4B403042E352025660C005CBD4387C614B40B7B85ADDC65760C0E2BD4513A77B4B40DA6D4E0CB75760C0CF83E816C6684B40A85D6E432C5B60C0BE2C3B4832624B403A7DAB49B05D60C067B4B89290674B4093C088A5045E60C0D00B9D4B437B4B4078C1EA74546060C09E3BF4A57D804B408C78DB8FEA5A60C07FE176E9258D4B404C0B76890C5760C0F4AEE734CE894B40BF5741DED34E60C00713DDDAE9A94B40F269DDD12D5860C098BD5AD1D48B4B4063F2AEDB2D5A60C0521081793B924B40CAE0AB04C55D60C0AE5CA824288B4B405E4ACD8CD96160C0AC7C69DBAB8F4B4090E1B312296260C0F28D340874984B40FAC2E41B425E60C0B3BF0DC6CBA34B402AD716DFB25360C0C42D1AE7DBA54B408A36E5E0FC5460C0A8CE561D39AC4B409EE77B1FB55B60C0DA19AD4875A74B404FE000B7665C60C0572085F23ADA4B40CB2D9636AD5E60C0093F184D67E34B40BC686CB95E5D60C0DD15F308D9E74B4091D2FAB5046060C0AAF3CE3936E64B40FC16EE707D6660C09D7017059CFC4B40906C023E626060C0A8B98D30920D4C40AC447EE75F6A60C0A3E5840279FB4B402DF99A632A6D60C06D9549F9A9004C405F0D91145A7D60C0FCDAFEDED1ED4B40629E3753227860C00F38260259E74B40D7B661CEAB7B60C0B06C2194C9DC4B402550FE8B247A60C08197275DA4D54B4028793508327C60C02FBFE82293CC4B40FD3861CC2D8060C06DD32360B7D44B40AF648A48BE7D60C068468EA0B8CB4B404FCBF685DA7E60C05F073B67C6BF4B40B11F4449AE8560C019F9941F82CB4B40A869C2CE918860C05D9D8F14BCE04B403A9F3E8E388760C057D341FC95DE4B4011BE46CD998560C0A123806701DC4B409757898DA08560C0332BBC8B5AE64B4012846152958160C0F8B41B9519E74B40F9BC0897028260C0BC008B33EBF74B40C4A71F61447E60C07BE15387EFFB4B401EC33259C87E60C04653020225154C40FFF82925BE6F60C04DD3404A381C4C40EC931193137D60C0B8011843401D4C40C3AEE9531A7F60C03CCD3528AE2D4C40E7155A0A188560C061B19A743D304C40C0DED5871B8660C017F2B836F13A4C40B2A8F60F218B60C0D013BCA179434C40D70A1018008A60C045F1C87397514C40EA7E6F68959160C01F6CF59F4F504C40E35598239D8E60C021C578EDF6554C40B658CE2AD69060C0788029AC705B4C40A9E60526A58B60C0B30BC4C6F3684C404E592DEB249060C0D216DFF206604C402F3BC7C4A89860C01A60C421F96B4C40FB7D88179A9D60C02554CC25017D4C40394A3B0CA29860C0C24BE3EE277B4C4061AC050D619960C0BE1CCEF2398B4C403DEAAD955B9C60C0DBD4CBE828824C40CC5994631FA560C08149561F328A4C402DEE7A9DB7A360C05F8026E271924C40076C511E16A560C087F64A1C01954C40BCAAB024D5A760C062EDA6511B964C40CABE01278AA960C04CA72C14548C4C4079512881E6B060C022C513C9CA954C4085A9C9E3C0B160C0C328308CE3964C40F384112428AF60C08E14AC35B9A34C405C56F397D0A760C0A33D37C830A34C4087D2F93373A160C07AE909A9F5AE4C403EB520503AA760C09EAD81C80FA84C40B9D815E1E2AD60C070A4881A5DAC4C401D593B49C6AA60C03862A468ABB74C40E35BCA5611AF60C024979847F4B74C40DFB18E4AE7AF60C0C240D356D3C44C403BF3F0BA02AA60C011C7059A70CB4C4079C7F718BBB260C07BB8D7CBB3C84C40246613203FB560C0ABFDB3A2FCD04C409E16C9E296B460C04D89383332DA4C400181861C27A060C050200B7F33C14C40E8ADFC1D81B160C0B46E23C8FBE14C40E295222681B160C0B3D889DE8AF44C4053BCB245F0A360C0E1ADC4B3B7ED4C407D49F484D4B060C0A9325E0144F54C403B6C28E834B260C05822DA5E12F64C4085E398EA2DB660C0117739BFC1E44C40BAB8844171BB60C00419D6BA0DFA4C40533FEEFBC8B860C04BD9F9C8E3FE4C40368F0DF1D9B560C08E9313D406F84C4012FA34F377B560C07C84D222BC014D40A6FAC0BA94B860C0AF73B86723074D404CED0AB485B560C0250F0855D6124D406DFA2486CDBC60C04B403BFAEEFC4C40BA4DDA511EC260C028D7336BF10A4D4069B2C3592EC260C0203B9B2168234D401CD8D8934ABF60C04C967172AB284D40E654B56260C060C051CCC079D6324D40603DF2DC85BD60C06539DEA3AC3F4D40369FA04BABB860C078DD78354E424D40A6662EA463BF60C0FB40951B363F4D40F4E608A4A5C560C074797F3C21194D40240BBB8D60D060C0F38F5554412D4D408C83A8296CD860C002716E6CE1304D40C47B3171E2D860C0366564BBD13E4D409CADD5BDB3DF60C02F95EEB8B7554D407F251B3134DD60C036419AB4F9534D404EBD79825EDE60C00F09B3E33D684D40923BC20900E160C01DDFAA5E495E4D4038397831C5E460C029D3FE619E6B4D40FBDBCF482DE560C09FF170D0BC7C4D40F1643B653BE560C09A1FEB74117F4D4029CB5C7BC8EB60C02FBA0DCAFAA24D409647A27C88EB60C072DB5F47FEAB4D40EF67ADFE16EB60C0BF13E08DF9BB4D40361996DC42EC60C0EFCB8C46E4AD4D40F122D6FBD4EC60C0DB139D4708A74D40A8DDF27CBFF160C03DAD4442B4A84D40A2E55D376DEB60C0799695913B9A4D408003633ACFE960C0B9E52CCFA88A4D40496B8BF83FED60C017ABB39533994D4056B36242ADF160C09F172400419D4D4039CB24791CEC60C0506063B79E8B4D402F7EBA5B83EC60C00FF3D236BB7A4D4051BBA55044E560C07875133173514D401AA5BF4F24E760C0981584EACB4B4D4013E6B2C8FDE260C0C0A85555D9374D40C149C986CBE260C05B258171C91D4D40B1E42E0F12EB60C0E4E12F70E0214D40764D57B96EEF60C0E78AFC95D63C4D40D621631974EF60C094491A16F83C4D4001C2B3552BEF60C00B47FABD992F4D40C26C92295AF460C0A90C6A3200364D4065F61E355BFD60C0B84C0877FC304D4074CEAECEFCFB60C0F1B348DCE73A4D40FB2AC1CC57FE60C017EA69CD8C3A4D40100EF10E10FB60C09A5B1AE0013C4D40E03C923581FC60C05DDFFF94CD494D40F4DB1DF64EFA60C0BA9C9EE0B74C4D40CB3D7B103F0261C0FCE9EF36A0684D4009A9C8D1AEF860C0F0FB2FDF2F734D4070A95366E5FE60C093D030573F754D40103C3A59690161C039C373A1516D4D4073F61E65270161C0DFAF77373F754D4078291A75400561C01A50542240844D40637459A6630461C0A90246719E794D40F841781D400761C029E7D10850764D40CF177062940361C0016DDECCEA764D40A056D7131E0361C057846A51916D4D40B11FDD28290761C0BC7A330AE15F4D409A700565530C61C0E18D801CEB664D40E550B6788C0861C0BF937BD63A694D4067EF94F1810F61C03EA178BD656B4D40DADAD854B40F61C07BB137488A7B4D40D95AF287A51261C093F184F02C754D40832C6D64AC1661C01EB5B7DB5D824D40F5906EC6861361C0C951E7E824744D4057132B85291561C0463271D70B724D4062AE44D9CA2161C074563D402F884D400A320D23FC1C61C00D5C69C9A1764D4095D3C027052161C018E67361D1744D40B185B7E8132461C0AAE92CF927694D40B9EBF3A2AF1F61C0CE5DD4EA81724D40EDBD44346A1261C0FB09576D4A6B4D40C9F8C864740F61C0CD8719BB6C654D40F88F4DB3651461C0FA6273A431694D409AF8C288C71061C0238EF29E83594D40CDE7C7FA050E61C0312409191B554D40B10AF259E80F61C03EBA7B31FC5F4D405BEF8CC8DB0A61C08F59FDE77C574D409A1B10B0D21061C040B3636E354E4D405F778FFBAB0A61C0B628FF65134C4D403B512B0B690961C0C3E59D3FC0544D402710DE93DA0361C0C2394BF0E2464D4069708343BE0661C061EBFDF5A8414D40C4E0A550A50261C0FC3D9C9572414D40A5F121FDFD0061C0ED49769C05314D40E9AFC37DB90261C0624873CF422B4D4064F6F54AE70861C009DCC1BA8F274D40092EE20B2F0A61C0493864FA14334D408CC94A513A1061C0A0E91D3D7C384D408C0E0321D60F61C0FB48748732314D4070A363F0DA1161C0200A8345CF2F4D40B8FA88AB760F61C071F47179B02A4D40DDE89BD5240D61C0D85560A1EA2F4D405F57A416A40B61C09F3BE5DB2C264D40DB33ADBB4D1361C0583E6C3EAD2D4D406AEA57C9F91461C00484B5785D2B4D40A13C4587F81161C0A42AD2D3BB204D402FD6CD4EFE1461C03A3724BE811B4D403AEF59DAE91661C044487C943C204D403B76C451BD1561C0AB2D0DA92C264D4023CB52BB091B61C0227A1CC497284D402737FE87BD1B61C01BB23B63CE304D408B429C4AA11C61C09933DA58942B4D40767546D5751E61C0A0B318A1A7324D4010B99475052361C06CB12068E0304D40FDD8D5411B3461C08B71BA639C4C4D40BD404FD7282E61C0FF84F68865544D404ACEC0276C3561C03E3B874BA24F4D408E14BD62B63D61C0A2AC12E5F7654D40D45F4F2BF03E61C0983F9349C3734D40F3C08A6C8A4961C0584E284DC6894D4001FF06BC5C5361C0B7B7714AF78E4D400822B480005061C03111D926498F4D40C75A0937404E61C03669C3AA7E984D40EB9C73F7145461C030B0D196CF914D405F54B0BB566661C04329854B3FA84D4016BA3046AE6361C031015F9149A74D40AC6A7475436761C0BF462A7B51B04D408144A52D9C6961C04A180FFEFAAB4D40434A22A9CC7A61C055655D7A3AC44D40FD68AC01527261C0BAB691B013CE4D402DF09ADB156F61C0005DD6468EDA4D402FBE8AACD27361C0E8D8668B46F14D40A738B92F9C6F61C068D89E5D0AFE4D403797CA556C6961C05E49786F66ED4D402AE0C693EA6A61C053F6A11DA7DC4D4012E2B317726861C0BD2D18C6ACCF4D409AC8508DF36A61C0FDB344A466CD4D403AB28E1A316961C0B89A413419C94D40C43490603C6761C070B33A86D2CE4D40EA81EB53F86861C02A243F5A3CEA4D405FD377B69F5C61C04023922836E74D40EED9DF52756761C0661C849B3FEF4D403831F9BC7D7061C03080B39B77064E40038596F3DC7261C0C06331D26AF94D40F65F6899C17A61C073693EB758E94D406FCBF237F68C61C067105A994ED94D40A01893000EA061C04E0B654DB2E64D40F297A31869AE61C0E315CD9EC3F04D404A0AD9B559A861C0ADAC9056FFFC4D40175AE33302A961C01F18B0501F094E402DAF10A590AC61C0140AD38CB0114E40F0AC571D54AF61C0A59BD758E10E4E40EB12749B60AC61C0989A49890A034E40BBD5507AF6B661C0E73ECD27DDF94D40FC57E17602D761C0D5E00DCD030E4E40BBF4481F72FC61C05792AAB7B8FE4D40C84EA059C10462C0707CA23A0D044E403FCC065C190062C02E407B3A71054E402EB3ACEC140862C0562D51B68F124E406012F471120662C0DA0949F6EB194E4086BF1EA26F1262C03005EADFB6174E40FAB70A556D1662C09926D82672234E40CAE0EF31071E62C094B25D148B264E4062A6DA6A7C1962C0C4261152D0394E4098E8EC6E3A1962C0681BA7AB1C3F4E401C6CFF354B1C62C0F8169F2B313D4E40F1BA8E0E701862C0A2F10193D6544E4092894BDBA01362C052CDAF05865B4E40AADE4472541862C0F9036624EC564E40ACB366E36E1A62C0A2645A83E44B4E40440D18C7352762C0FBEB6FED252F4E40609FE0AA3E2B62C070A03A23032D4E4002F1DED2FA3462C03ACD27D2C43B4E4002022A2B273E62C0E2A64AFDD63B4E40487004B4163462C0366CC501F0554E406BA17F6CF93B62C03A827D096E4F4E40FD588C0ECE3962C0841FD8B01F544E4058361E6DF23B62C05DD372DA29534E400970BEA62C3B62C0A3EA5AFD19594E400594EF3BB53F62C0C836FF3C76504E400565D1019A3D62C00DA85DF7585A4E40ACCEF4122E4862C0774367A1A2514E40BC5AF5E2984062C030B4AC13145F4E40DBF73CE35E4162C0C5E39DAD27664E402D7725D7964862C05D9345DA685C4E40FCDF853CBE4962C0BE13FBBFFC624E40551F5E229C4F62C0CBF70071CA564E40B697E3D5F85462C0BBB8736B7E594E405688A24C095662C0FED24E924E5F4E40349C0D7FF04262C0FD1DFD73B66A4E400D1AA16C754762C052AF00C034724E40654D8C5CB04B62C09B3CB5B2F5684E40AE33AE47075462C0B2D567B3DA684E4033A6CEECC95362C09A218A5B1B704E40E426CFED325862C0F0A743DF7E794E400E5A4DF7BA5262C03B8ACD0FEE774E4060EA861E895662C036DEF309C47C4E4088FDB0DF335562C023CE30D58D844E407DDD70D5095262C0E9635FEB44844E40CBFC1CA2A45462C030FBCAA6B6884E4072B6AF04DC4762C08AB12E27E28A4E40F38CC71DB14962C087D7E4B0AD904E407A9CADE9C85262C0DBF53FD7BF904E401D64EBB4DF5E62C0D43B42F648784E40018C627C0D6162C0442E8696F4794E401C457DFD975F62C0F01E41205B804E40AF9059D3316362C0E1B006F562814E40ACC6BED0186562C0E1F604ECFE784E402EB8E5277E6662C062D7C7E6BD814E40A1AC7872C96862C0754F17832D804E4068462AA21E6862C0F69602CD25774E4007963EA7AC6B62C0BB6D14F923714E40794712B0796E62C0DBE4158173734E409C5B2E7D2E6C62C0A6515CA6E77D4E40383F13B99B6E62C0AD893C523E7A4E409036CF3FE16D62C046E6C80776814E40492A42BC7A7162C0FB4FCA9F84744E40720E4C38666F62C09F8BC2086D894E40318390208F7162C0CB945C23B3934E40A39970351B7362C0BDE3E071F4824E40FE9D75296D7562C0A8BAB69059824E40C2A2FDFA8C7362C0C6160900A5804E40AC62B983367362C02865D516A76E4E4047782047667762C01A4D8B9688714E40315A45F5EF7662C0B1818DE375794E40E809187EF37962C0FC39690FCA6F4E40F54BC5470C7862C07BBE3B2B226B4E4062C26539C17B62C044D995E27D6A4E4076BB1895BC8162C090FC99447D794E40ABDE9065727662C0CF3A6254109A4E409E75E294627862C0C0E84B2F219B4E40DB348569487762C0CF7BA31A73A34E401861A619E18162C09E5DE3C44E824E40262F18CADD8462C042D579FE098F4E407FCBE358008D62C0D7B2A64DE5864E40C3BFDC027B8B62C071D27142CB854E408D8A92BF6F8D62C0F5298DBEC17D4E402FB16B7DD28462C0ECC85CC16C884E4052BC5E04E18762C0BAA2BBCAAA794E40EF392EA0A98A62C06D818FE25F7B4E400DC9E40AD78862C0054790A681754E40A3425BCD0E8A62C0037283CF9E6B4E40D3365224A58C62C097146EE3536D4E40BC131092F48A62C04CFB3DB319684E40946C82B5759662C0B3B5F0C602654E40B736E32C638E62C06F867932DB664E40A285C35B439462C0B0E84574F55F4E406630F2F8999462C098C0C412FA5C4E404FACF50E729562C03D10F65C8A554E4071028E2D019562C0F30A46842B564E403B2B7997F58B62C0CC69AD0916634E40CB4A9CC58A8D62C0B0E2A565F44F4E409E86036C6F8762C01A7BDE7829624E4077F97CD0628662C0EFE707C80F504E40AF747856B28A62C00739E3CB53444E400FA023C3AC8F62C0181C807CB2494E40FBBBD8E3FC9462C053006724D73B4E40C09521C8F59562C0220B5B414E394E4042C51C24329562C078A02149863A4E40E4618EF1848E62C09364B65B2E454E408690F8F3F28762C0531E672BD7384E404EC16941918762C027E0CADBDF414E402F6C8C10D88562C0C10854EA47474E40D98FDA96688562C01E663567C73F4E40068DDB17148362C0737B10BEE64C4E40E7005A9A0C7E62C0A57DD354183B4E40AA2EE8C9C48262C0FFDB36B4D8314E40B1532857D38562C0C92DCD34F8344E4086F4406F6E8462C0836F989E382D4E40842B7DA9108862C0354E004B45304E4074FC4837E48662C023567B4A422B4E40EBCA09DF198A62C078AAB27429204E40666613FB848C62C04D1ACEA249244E4056EBB2718A8B62C0DCE646079A1D4E4005F4E713038E62C057821DAB99164E405CA0F11ED28662C072D38F8EA0204E409F62FB4F608862C0B4ED2540AD1C4E40A86419EDD08562C038E52C1720194E4014A689E5A68662C0595D0D8126134E40999AA60D988362C011042E4E1C1D4E40EBF244278D8662C025EE24C175104E408E2529EF7D8A62C04BDCFD363E164E4016670C37338E62C07199026A67034E40DCDFF883D38D62C081241A8FE0F94D40EECFBE9B669162C0C6C5F3F1A7034E406DC1C12D749162C0765EDE3AD7FA4D404B55D6FFB69262C09339AF6CDFF84D40A4CDAED7A99462C0D0E0EEC1D4F54D40A83A4D7253A262C0BF1B67AD05FB4D40729400F6CAA362C0277F8E1702FE4D40303554EF46A162C0EC66FB8126064E4082471F3784A362C0A59FA93E78064E40AA5F1CAAE0A862C07FAA63BDF7EE4D40CA422F8384A962C0EF09E819EB014E4077C1A95169AD62C0FB57DAD7120F4E4051C477C38EAC62C04A26293D9BFF4D400E5B9A792AB462C049BD5BF07DE94D400A2F4C34E5B062C046752B5EA9DB4D40EA5DC5BB3CB462C0C24CF4541CDF4D40C327ACF8C9B462C0D540A98729F34D404091383639B762C00768EC8A32FB4D4079B5F9785AB862C0DD8AFAC3E9EA4D40C3257237B4BB62C0586BA15D3AEC4D405A88C63A8AB862C0E5E3115EC4E34D4051B710FCDCB762C0EA63B1CD3AD44D40525EF47729C162C0802CD045DDE54D40E6088BF75FBD62C077E0424069DB4D4061BE2974AEBE62C073BF4ABB4BD54D40FC583DAFD9C062C0111F2C6A6CD04D40DA46517033C462C0764D1FC4E2D84D405F24D4A5D9C262C01FA9195732CB4D40C55BDD5DF8C562C0E6A196C0B1CB4D405BAB3DD3B1C562C00FE34841D6C34D40FBBCD9ED07CC62C0A48D5D1784BB4D40B21DBDED81C762C0B8096F33D6DB4D40B44365E57ACF62C044499CB904BB4D40DE6955ADC1D162C0F686966AA9C24D40A490E683C1CF62C06C6D03835ECC4D4087A36EAC04D562C05062CE89D3C54D40141AC3A457D262C0A9EE4D6177BE4D402499C05B65D462C0C60807C8C4BA4D40E75C681942D362C0A17B0C1076B74D40BFA275F98CDD62C08E4C0F1A90A84D40174A66B840DC62C044576EDAD8A04D40BA8115F7B3DE62C053736CECD3994D40E4DBE5387DE162C0CC45EE6E00A64D409DBFA41041E862C033671B1F22A84D402C01067FA1E362C023C0D7704C9B4D407898A8A656ED62C09B9A243F05A14D401C4E02D336F762C0F39183A17F944D40EB56331158F862C0AAA0764D499C4D40AFD0224D2BFF62C027FE89A59DA24D40B84EF6FA0EFE62C0610F837DF8AB4D4071844B2911FA62C00A12192D25AD4D40B00DB32FD7FC62C0EFEDD19526B44D4042D5A60BEDF562C0B4019423F8BC4D40DB27432EF1EB62C0BE1AD1ED61B84D404B24F80618EE62C04B49A13342C44D40FDBCEB1584E562C04ED3DCDE6FCC4D40BBE0D8EA37E662C0D991356484D24D40444DEA25D6DF62C03E3DB22768E34D40DCA2E468BFED62C0A508938E66D44D4052D094A324EF62C0C8D1EE4118D14D407216A91427ED62C0903918C71CCD4D408D797FB2E1FB62C09F461F7623DF4D40F341B00713F762C005F4D702BB024E40D6E320B5E4ED62C0B7D506A4601A4E4001A77EE19AEC62C0E0B09E360A2E4E40B51231A3CBE962C000044EA346314E404EED4E82E1E862C05116C67FF0444E4026A4CF1A28ED62C0DB32F3E30B5D4E40AE85E5CBBBE162C0357E2A4EC3644E40067D4DB21DCE62C0F1CC41BFCD834E40587F5923C9C162C047283E74D6734E40C49033A328BA62C0784B5BF2A77C4E40CA9A5B0D00A162C09735653B766C4E40262B54ADF7A062C00C0191DB706C4E40073F949140A562C0E8E013B5D9784E40E21DBC5450AB62C06E53A931B8764E40AC886DE21FC262C0790CEF68B2934E40AE1A99760BB662C0A3D856276BB24E4065614F81D4A762C05B9EAD7FFFBE4E4060495861D2A762C03905DF5F01BF4E400517C4BE58B662C0FDB61AB85FBC4E40814F9AEB3ABC62C044BD1778E3B04E402E886EFBEFBF62C0A0C37349AF9E4E40E7330EFF08D062C02B2899F348A04E407F8F754254D262C03BB0754BA6AE4E404B277540E1D262C0DE325E8056A44E4060884F417DDE62C06D506B86AA9A4E40C9049A0219DF62C00EDB6940E3984E40C12AD41773E562C09EEC9BED53864E404E8B245DD9F762C0B0D1E9CB39754E403F9400ADD2F962C08F83C01FAA6A4E409D4925AECAF662C08862CA2E835C4E405549AD02D5FB62C0552AE8705A604E4029AAA4B8F20163C00628C3F9CA554E401C19C6BE5F0A63C0BE23802CC83F4E4081FD29F7AA0A63C05B1D3B1709374E40509CFFEBD40763C03F12609E57324E4009EB0C63950D63C0B2E43FE64A254E40E7B98741F41363C036DB9FD1141C4E403AD6D301701C63C0512A9051FE1F4E40DEC62992431D63C02B0F17485A274E400A4131C55E2363C06A3B0E16F8244E40F2C41ACC141E63C0B62D60B954244E4082D21F9A901D63C094572A59DE1D4E40FA5C5BC9A01263C0F8D6F20F600A4E407F5AF245B31663C0762BC039F7F54D40DF5E61530C2763C0DA47209C07EF4D40B8061FA2C52863C0222D75A7A7EA4D4047C98A29542063C0F5CDC32729EA4D403098A9637E2163C02F6458F268DA4D402FB061EA4D2763C04C44300256D24D4089885BD3AD2D63C0303C42AC4BD34D409EF88B486A2A63C013D513F82EDC4D40ACA7EDDE6E2E63C09D5A370EEEE44D4015437E7CB22F63C0806BC1394DD24D406F2B4CF3DB3163C0E5C8649761D04D4092B9A4B1FE3263C004C5A73ABCD84D4038479108A63663C041010561E9D04D4067812EDC163263C015EC66FEBFCD4D4029BFAB3EEA3263C075A4EF5819C74D409151D4080F3C63C09A4B91AFB5C54D40E5FB54858C3863C05726589A8BC24D400A5B1CAEFA3763C06BEDFB45B3B74D40FAEF43FBA04463C0B49B5E523BB04D40B87D4B6E633E63C004A89C03DAAD4D40B708166EA64363C004C19D42CFA64D407309BE9C1C4463C09740D2E2D4994D400B4C99136A4863C0B26D2DC11D924D40276DBC4C8D4563C083D5404A978F4D40BCB6DA2E094563C00D925D06F8824D4041656D7B5D4163C00B5B0EA9148A4D40834DBE688E3663C0A3C42846C4884D407E8F858CBA2D63C033CE1B7FAC7D4D40321A783C5D2963C0048C654D69704D40C458A7F6952B63C0A675ED860F6F4D4047550C7D5E2863C014D4C1CBB56D4D400E4B2DFCC02863C073C8FACA7F6D4D4052E043B5AC2B63C0E17E8583E56B4D40DA3D3234652E63C083041CE85C5B4D4097559DB78A3363C022C5C98628514D404E7121EFBD3C63C0B13350A1864E4D40D2D14DEB213F63C0BE8F0556A5434D40A4075B73D33D63C0CA380E9A96404D40087599545F4363C046BB79C8993D4D404BD98DAE154063C0656731864D304D408D65AC9F684B63C0FBA6AC48BF244D4044D3954AA84363C0282D03EAED234D4058C3B77CDA4763C06466168FA8204D409BDD41C5FB4463C0A5658A4F7F1C4D40AF75ED8AAE4663C098BBAF3544184D409CD87FEAB84963C0DA400DA61F184D407E52921D3E4763C0E3189799CB114D40748421EDD74A63C0C8304D4FDB134D40F3E2CDC7BC4A63C022787271CB094D4077AE557DCA4F63C07FDC972703194D40EB0672B8DE4E63C03C4FF8BBAD0B4D4038984D2E495363C0F53CE3CDD60F4D40472B4E185E5163C073B8147B16084D404CBB82AD7A5263C0AC10D232C1024D406F560C846B5563C03E643CC1CC084D4068C20D071E5963C08A2098F231004D4052894512296163C096EA44226F024D40A013E90CE86363C07C36B79294F94C402A7CD1F5A26263C08F00528FDEF04C40E7ECFF3E8E6A63C0E1FEDC33E5EA4C40BF66C8D0056A63C00EF5A0DDEADD4C4008D9CCA35F7363C0970466E122E54C409BC9A7AA677463C052A0BF4F08DC4C4033C10929E07263C0B970B0C08FD54C40647F8C2EB57863C075A1746E4AD24C401EC57DEEA37763C0E577FB9433C64C402E48E114298163C0D0083E9C54C94C40401D570D8C8063C0B17801DE91C34C40DD46D74D5D8363C0ACEF791349C34C403FFD5804008163C0444E8FD327B84C40B9360348878663C0844E56C306BD4C4086BF2077889163C05F00AF3C55A84C407430A770EC9163C02C3C7DB7A4A24C40D70D832EC98A63C044EA08DE50A44C405C72F8A7598E63C07C34B0C5B49C4C40F6DFD1A23A8C63C023BAEC2DFD984C40AA9450210B8B63C043F89252E9964C407699001CDA8B63C083F1F34A13924C4088F53158368F63C0D28C0879718F4C4029ECC30C4C9063C0EFF5C9EF29864C40D0C25190BB9463C0F9D10758B2864C4070A5B2069F9163C0042ABB63067D4C405B468554049963C012833780AA854C4036C1BE041A9A63C0F9C4A628D2724C40F1463B57A29E63C001DCF19C337D4C407D871E4E479E63C0BE90699622744C405026238CDDA263C0534E2FAF53694C40980E1E5215A663C06B3DD756746C4C40E4F8F9CDC4A463C087D4F7DEB8684C409A9EBA88FFA663C06E2FCCFEA3624C40CDA9C99A79AE63C08FA50C9AA16C4C40F2BE560EC0AC63C075A8FECFDB614C401110AD4F46B363C0CA546D68EB5B4C40585E5C866AAF63C0580CFE7C97554C40F72E190176AF63C0CD15A2B9BA4E4C401144B64EFCB563C0ACCEDE04E04D4C40A02480E041B963C0062B936BBA564C40754A450B98C363C054371FB09C484C400685B20503C463C0FF4576EB34434C40D529B6D23ABB63C0FC0E559839474C40DB8C2A8520BC63C0B499B994BD3B4C407DF9310465C463C064B5DD2889414C405C1B7C7E92C463C089DCE869B53A4C40082A877F9ACD63C0FBBC4B7FB7384C40C4702D65DDD463C02579B891BF214C403C84432A46D163C05DCEF5238B1F4C4004DAF16DFED163C0CFF14BA296254C40A00896B4B6CE63C0A1397CB68F2B4C409A7A1829B2C663C02D4FF8E32A244C40B4906C65DBCC63C09A20EA7EDF1D4C40F0217559DDCA63C030B8660B0D164C40D1D05723ECC363C0DFA36977CD1D4C405D14B31281CB63C0F2B1AA48E60F4C4092458ADF33CD63C0AE23B0BC03164C404E67D45961CD63C07D99A73AEF074C409D66EA2F1CD063C0CC2A4BE3050C4C409983AD2225CE63C0A45FEFF114FF4B40D566209F30D263C0A9E48BD7F4024C40456CFCB259D063C0F2E5E45F42074C40ACC15C131DD363C06094C19485044C40EC10631358D363C045F48594F30B4C40CD87F7A83ACF63C0E8FB392E8B174C40A3B2CB1B2ED463C0657ED1D27F194C40A857A3201CD263C05EDC965C85144C407A5FEA4B0DD563C025060B8DF10D4C4031B6F64D59D663C0F3C414887E124C40C19DB38631D563C00C740E4CA6074C4083567DBD9ED763C0288FD1C0A0044C40AF0D9A43CBD463C0555FDACD47024C40AEA47D3D81D563C0F094A08623FA4B40533AAD266ADB63C091EE01FA48014C407CF17760BEDD63C0D2FEC875F2F44B404F5AC13293EB63C063E54A93EEEF4B4052225714A6ED63C08B99500E8EE44B406A12E026FDEE63C0842D90CBB4F24B40BC285DCB75F163C007CC4CC0ADF04B402133230C2FF063C0435ED9FA1AE14B400F289FF30FF263C0E28D9DEB72D54B4045F5C7C105F463C044CCB61E48C94B407E9AC93141F863C0C8BEC6CD03CD4B4006C43648BFF363C07B26C7E52CD14B406FCFFD00B5F663C058583B9F96D44B4097B66BCA47F463C074ABF0F2DAD84B40D9EBB487D1F563C005BFAEBB5DDE4B406C78C1C9F7F363C09D9E0FDB12E84B402C731D2BFBFA63C0676B6397D6EC4B409E144073B3FB63C0660109CD32E44B401536FCCD530164C0C646F22DC4E44B40768DA90E250264C05B19E35211D94B4035291490FF0464C02FD499087ADD4B40C7CC899FCD0464C0F6A98C743BD44B40BDA9C311F30D64C02ECEE39E98D24B40B5F48BD6C00B64C09B2C479F03CD4B40E0D78146501064C068AEB99015BD4B4020CCCE0C041364C0FD148CCAC2CD4B40EFE5CB85621864C0BF3DC92C95C54B40A4E0BE06141564C0723F95FF51C04B40AAB17CC68E1564C06072C4BE05BB4B408369C438FE1964C07244D6F1B4B94B400DE11FAED81C64C0395623B24FC24B40C22D7101DC2764C0C56FB9778CAC4B40887337BA293064C0E838AA4BE6AD4B409B8A2D039A2F64C01818E41F79BD4B403C1DEC49072C64C08CDB2C0735C94B40AF220DF57F2464C090E07CC41FC44B40F44AB795103264C03F744E279BCF4B40DE28D950D43664C08B824F39B4C14B40BBB76206703664C0FFADC32DCDB34B40FB7BDE730F3D64C03DBF1F20D79A4B402E4C9E906A4164C065BCC8E5AE9D4B40B73A996C083F64C0DB43F0FAEF8C4B4071588D98DF4264C0AE2F0722FC894B4014C38FC0824464C0E554B8AC648E4B402226B6B5434364C077017A1226954B4088ACADE7334764C056AB37031C8E4B40719121B43C4764C0A015873D0D834B4050E7D374034E64C01F18FFBB4E844B40D0910CECDA5064C0CDD218FFAE8D4B40135107F4A04B64C02361FC440B8D4B40CFC6E901365364C01F42AD8669A24B409464A5440E5264C083AB514E6FA54B40DEFBE586BD5464C07DAA7400AFA54B4015DAC43E285764C02500F1EBF99B4B40FF81C3746C5364C0739B70F9AF944B40CE8994ADCF5464C0AC4816E27D884B4031A4015D105264C080949F98297A4B407BCB96ACF15464C0D7B8289E5B864B40A1AF87E7995764C0E9358DB63C794B4020DEA423275C64C08D1385CA2C774B409243F52B415F64C0F91F8C0B3F7F4B40D4643EAD6C5D64C093E9311A60824B40CEC9137EF76564C000759A55C5914B408BAC1EBCB76764C092ADEDC9668C4B4022AA9DB3BF6664C069DF5681E0814B40251897AA7C6164C0E27D3AD1E2774B40F2280C8A976B64C0D6C9026FD0674B40B4FF570C696C64C0A3BE7CE5896D4B408DD00CD6DA6864C03FF30FA1B8744B40C6608C98556B64C01E798EF389754B40354AF562CF6A64C0E6F159BA9F7A4B40C1E913A4B06764C0332B3F55727A4B40432D98F4666A64C024C535C6758F4B40BCF6CE879B6064C0DB69A2BB239F4B40B82AF8FE666264C076CE00E81B964B4019EEA6FD2D5C64C0E01E3688BE974B4083DCE181B65A64C0B5585F97F89C4B405C3EFAC78D5C64C0E8368311F3A14B40B25D3F8FAE4F64C073260B20D1AF4B40219CEC571E5064C0F7AA51E8CFB84B40E729BE98955364C034E8E4929BB64B4031D13385163964C01AF396530FF24B405C9973C75B2664C0A5DDA900BF004C4050401DC3D72B64C04E3463A1ABF94B4008C22DBFE02764C074D0153688F84B406199F7FE0B1C64C019DC5A34AFFE4B40C4A305F89E1B64C0B21F28F249F74B404AEAA475E42064C055792399AAF24B40266E33B2C51D64C0173734E508F04B407DFD7D29571E64C0CCEDC5E159E94B401DD566568A1964C05318C92FE1DA4B40CE6405D92A1564C0591D80038CDD4B40B981CC5F571864C06638B0754EE34B400991F4EF431964C0D406697888F04B40D6A7BBE8191064C0F52CC3E1E5EE4B40C9279D1EEB0E64C0D401B5237AE54B406AECD84F0E0864C09D378D8186E24B40FF7016DB220A64C0D407C1BA23E94B40C86A5818B30764C0DCCAF54932EC4B4064A617B1491264C0CF3B281CE6F64B40FA3F3551D30B64C0B0E06A5674224C401FB4CC61DBFA63C0F28527AD1F454C40E408B869C2E663C0B9276816C0584C40B211222B85E863C067B02D8E36594C408886CE6D9AE763C0E214D194165D4C40509628FDA5DB63C0AA2461DB3E724C407B132472E2E063C0A61F9EBBA8654C40747EF37657DE63C092058A8A866B4C405C22CF8E8CD963C03A62953F86664C40221D796590D463C0F9F9917652614C40A211CC4377D663C02DE551C0FB7C4C40A158DFCCD4D463C05FF5FAD0B9864C40DC72762732C963C08195EE2C65A94C4012423EA3D3C163C0714629D971AE4C4057BDC1AD15BE63C0A389D903DFBE4C407649AA64C8B563C066EB6A3F8BC84C40551D381919B563C0354B14AAAABC4C40C1BEC64E9EAC63C0A6EBB49E43BF4C40553BF914C5AC63C0D09B7F6C95C74C40BE5DC19470AE63C0FC48A11DB3C54C40F6E33E0F84AD63C030A3C4D70CBF4C401CF93FD606B363C0293F993684BE4C40ECCEEAA146B363C007B0481B83CF4C40A5C4582FAEB663C0A59AF70D40D24C40CEA5A04896B363C0FB3E0673630B4D4041F8CAD0A9AC63C03FCA8A915B1A4D40DCE68BCE80A463C04DC79D6EB4144D402A1AF694C9AA63C01D432998841E4D400FB903CEF4AE63C0DD81C78A111B4D405D6D7DDE25B263C0359C3538C4264D40198ED032A4B163C0C479543137324D40AEDCD1267FA863C05E62963E354E4D40B605ACC744A763C02174D3A7F7514D40D918E04A189E63C08A65DD9B175E4D40CED975905CA263C0182DC90EB8614D40FAF8AC3C589E63C051DA204D11734D40153F8105709B63C06670ACFF9F7F4D40A0E692B6009963C04EC89FD248934D40F18F4CB2BF9B63C0002FD5452B8D4D4030538BE7559C63C06796CC7D1D814D4009AE909DA6A363C0E4126597D56F4D400D7687DDFAA463C0A7E47391866E4D4023F610EF6EC663C0D76883A3974D4D40653C1FBBBECA63C06A1B9D9F4F544D404C4F53C7C8CB63C077B97371A75F4D406193F01224D263C07887CC1CE7674D4051AA6DA1E6CF63C0049D657F65794D407CAD8FA182CD63C057170FCE4F7C4D40122FA067D4CF63C01BF0BF08D57F4D40A726161DD2C563C0A8606FF11C814D40E3F50745D3C063C0C33C58EC5E6F4D404AC6CE87D6BF63C0BE401C76BE734D400E5EF51D36C463C087FFCEF987834D4038F93CED9DCD63C061A88DDEC0894D40ABCE1DBB40D163C0CB0B76DF56964D404254B42B56CE63C0DFA86158E8864D40CC3893E354D763C072ECC993B96F4D403094EF304ED963C091CA6A20FF7A4D404B798672E4D763C0EF3464AB037F4D408016ACB36ADA63C07BDE125F347C4D400951CC6A78D863C040F06A196A754D40D5C2FC1503D963C06CDE7AB79A624D40CBCA6A565FDC63C0C006A1E3CD5D4D40F7C76D5ABBD963C068EBB33921654D4015DABDA020DB63C0B2E39EFA4A684D40ECD07FDD42DD63C03B190AE951624D40BB3102389AD663C07DA2AF12E83E4D40512F983AE5DA63C083BB8DBF6B334D4005D9FF03E2E163C0A0B4E12D4D364D400E9E802FD2ED63C097C831B318644D400FA65F78E3F463C0928BF369F56A4D40239452F523F463C0DEF72840D2794D40CDD81F82AAF863C0FB09D86D82774D40E5C726BE7AF863C0C073871F3C6D4D403DDDC1B97BFD63C0484AF8499A624D4018F710C6930064C0EDB9418E40714D408E2449CD0F0864C061A243FD87724D40DB208A944F0A64C0DF83F94192794D405315B7542B0864C0A75092CC9F7D4D40CA461E1D860A64C0D19556958B874D403B7D341BBE1A64C0FB4463E7036B4D40480F1FA0C31C64C0977D984940714D4017EA6F63972964C0524AD81F94674D40DDDDF97F802864C0A9AC1A3D27634D407DBF255EAE2A64C05BC9E212DB5D4D40010300000001000000090000002D5257680B8965C0CA06930FA0264E4082664BCC419365C045216FF877294E40EAE4C208A2A165C05A4F32A1273F4E40C3EE74CD7FA165C0FDA8D0E9BC444E4076A0E3496B9D65C04D2417552A4D4E4059149E751B9B65C0DFCBC692F23D4E402D6B327E7E8C65C05AFCCD7E49324E4005540922C78665C07C6FA46679284E402D5257680B8965C0CA06930FA0264E4001030000000100000013000000462B38EA90C364C05BC11B8569344E4086A0F4A220C264C0E9061A8CEC294E40210FB0E6E0B564C0AAD56C349F254E40C6B06A5873B764C056E567B11F154E40222973109AB564C044FF5B3A600C4E40C1E1FA8C4AB764C0A833ABF364084E40E3E216035FB164C0457A16CC43FD4D40F4E7C7BAA9B364C06D21E27A61F34D409CB51FF191C864C0D314FD03EAEB4D4092ACE230CEC364C0EF88BDCFC0E74D40FBCA6D2B5AC364C0742F6752EDE04D40EFC4453020E464C04D7891E989FF4D40179698F92DEA64C04EA2759211094E400228981280EE64C0F310D273741A4E402BC8070AEDDA64C011E78A85191A4E40341BE611EED964C04443D344C5234E40BAEBB0A0F0CF64C0CD6E0CA164304E404E5101DFC1CC64C023B580EB852B4E40462B38EA90C364C05BC11B8569344E4001030000000100000012000000EF58BEECB28564C0DA10D4FB374D4B40B6D6C7976D8C64C0BEB102278F384B403E990F61B69464C0E76F943EE9314B4075FF39AE5E9B64C082FF3F9E51364B407EDA773C849E64C0AFE320310C4B4B40BD4A73B1989664C010FDEE656E554B40E1F96C34AE8F64C0CE03C3512F754B401483CB02168764C066BA8DDC7C714B4090F94F0B698464C0A5B32697837B4B40D54A51DFA87864C087752E9211874B408315331D067164C09CA7CD6BD3854B401E824B48956B64C0124EEE7043634B409B304660B46464C087EC6597F2614B40D0A8338A9E6164C0B762A0C16E554B40D2B6DF06DE6B64C03EAC187174604B40FCDAD640076E64C0A39AD7F026544B407B9CBA3F437364C0E9AB6A5B124E4B40EF58BEECB28564C0DA10D4FB374D4B4001030000000100000032000000AAAA11A3A5D464C0AB4D0935E9C24A40829F0620C3D664C0B381D0F1EEC54A40912968DD5DD564C0E0E8BBE993BD4A40FD5B195C50D964C0A8368CED07C84A40ADBD2E9326D864C0A4C4C0D306B94A4089B3E71166DC64C0A3318CF801BD4A40F883081798E464C07B56335938B54A400C985D3706F064C08C26747FBCA04A409A6E57A257F564C0868AA651489E4A40A5053BD307FB64C0DD35DAF3D0A64A40A1AC2EB62FF664C0129F4D5521B14A40B8E022FD86EF64C0AFD52AB290AF4A400DDD9A4150EF64C093EC8329A3B74A4073580F2E6FEA64C0BF7330D8CBB34A4057FC352BC2E964C0D78FC4D814BC4A405F631E1A35E564C04F74D7B08CBB4A4096A5671EE4E564C09190F54D69C24A404CFB6113DADE64C07141BFB53AC34A407DFDB5252EE564C0CB5D5EACD5CB4A4008D61352EFDF64C0E5016BCCADCE4A40BD66C8E018E264C09A1516961DD54A4082240F6005E164C0D97F31EBBCD94A400D073ADFE0DC64C0891BE34585DA4A405C946C5EB4D964C06EE05AC7F5CF4A40D12F71607ADA64C050B0074E8FD94A4056FC8C24AAD664C0C5217392BADB4A40B6FEEC6505E164C099C005421AE04A4094AB6C4235E564C06E72CDF526ED4A403927618514D864C083D06FF50F014B40115602C4F9D264C0A2A487C38CFB4A40CEEF7EF975D464C00EEAA85C81F54A40B8F3F07140D364C0B6D3D994EAE94A401F47474AA8CE64C0B07C120134F14A40D36B7F3604CC64C086A2A5042C004B40A43C3483DDCB64C0EB8169EBD8F84A4016ACFF6E86C864C003651EAA94FC4A406F11916986C864C07C9A72D439F44A4035A6F936F1C664C08E898411B7F64A40AC6ED57440D164C0DE13E48015E44A4059ED40B9AFCF64C05E4BE7CEC4E24A404F38FCAC53D264C00C60F255CEDA4A407A1BD5B28BCF64C0C79718A82CD84A40A61C9C8159CD64C077E66967B5E04A40B16CD481F6CB64C0726CDD3572DB4A4015905ACEACCA64C0338E702496E34A4062DDC087EEC864C026DB5782C0D64A4056B7276E49D164C0C65BCA9F3ED04A40198B0266F7D264C002A8C3C267C44A407BF512674ED564C0D94C80FED5CB4A40AAAA11A3A5D464C0AB4D0935E9C24A4001030000000100000004000000D0311A5415C764C06BB48A5018DA4A40E853039572C964C085F144E066E54A4023B60F43F1C264C04D225AA856EB4A40D0311A5415C764C06BB48A5018DA4A400103000000010000000E000000B5E0C61883F964C04B956CD150BF4A404BCBFC1B3AFB64C08A1ADD34A1B04A4070875375330965C0D053489B1A9E4A409B30042E1D0F65C0ED4AA6B7E2854A405BC778A8812365C013598242B8684A40228761733C1C65C04062B93AFA774A40BC237526A71865C0C3224FF68C884A4086C3407F781965C000A0CD59C1924A4087544628F31365C0D7E8EEC4B9A24A408E5A68858C0B65C07784895B20A14A407A4A0AD8C70D65C0BA95369383AA4A406DBF7A78530B65C0426C0F49C1BC4A40ECFFEAA13D0065C01EAE5EF206C84A40B5E0C61883F964C04B956CD150BF4A4001030000000100000015000000B00EAC9C29C565C0BE8F969C6B354A403A9AE408BDBF65C0DF2C7BE4F9284A400F76653818C265C0F9ACC782751C4A4051B1ABFD49C665C01F841A26631C4A40635348283BC365C0628D01A1220D4A404173994AE6CD65C0764FF97A8F0D4A4036E8650511CC65C0DC4C63CB620C4A40ACD74F3E50CD65C0839D09A4A2044A408DBC83CEC0D065C0F56026156D0B4A403B5FD5C29ACF65C006C3C08750044A40659D779B87D665C0F4E79A0D57064A40DBF218D71BD765C0F1F61D311E004A40C030AA1AD3EA65C0136976C5A4014A400B7A1C7BC7E065C08189C12BA4024A40D3DECE3B05DD65C0A83983B6200E4A40148189558CD265C09DA801C8BD0C4A40897A3BD3FACF65C07BFD4DB3D3114A407C7C1D5CA4D165C099E02F327C164A4048AAC00182C765C0D636A8E5F21E4A409DB3C3615ACE65C0E900B644E8274A40B00EAC9C29C565C0BE8F969C6B354A400103000000010000001100000032B5805C1D1E66C0D89D59D0A0CA494025B6B7EE301F66C078DB149A03D4494017FD913C2D1A66C08FA1DD3461E24940B07D664A0C1D66C065D5CCA209E74940436221F58E1666C0B86887E616E4494005FBC846031966C05F4879D362E94940FD4516467F1666C02B7AEB7AFAEC4940B1FA6F0FC61866C0DFD75B2DD1F84940AAE44C21DE1166C00EA77F71B9FD4940E3CDD7088E1166C088B2113B4DF44940EA1A9780A11466C0E00753148CED4940660B602AB90D66C0585CB867E1EA4940472C5291D40D66C0F28737524CDD494062B5FBD94A1066C0C34CD6B83FE049408F6A3E119E1966C025722F4B27CD4940F4BA7E2F861A66C0DD2806A03BDB494032B5805C1D1E66C0D89D59D0A0CA494001030000000100000009000000500C904C213D66C0AE97B1B194CB49402B3742C44E4366C0B1218CABE5D44940CA2F5139A63E66C058632ADFB2E14940CE40D790F64666C099C8D63707F04940088F928F5B3E66C064B5AA2378F54940F3A3D86AC63A66C040DB5CDC56EA49401F89F052E73366C0D67743F3E6EC49404216729E973966C0E61E841ACBE44940500C904C213D66C0AE97B1B194CB49400103000000010000001D0000004D426542C86265C05260FE0E47B74F40A21521DC736E65C0F47B1F1C21A84F4002CD02467C7765C0A3E8D51C4FAF4F401A8AF1E8507B65C0C1D46456FBC04F4026C98035C77765C0C5197E0E52D54F404B7F6CC8A77765C0DFFBE224F7E44F40A7658582CE7565C062CA2F7464E54F40AC4FF56D647465C05307EEADC4D84F409902EC8AFA6C65C007F06F2031D24F408170AFD75F7065C0E8FC6A0571D24F40BB1FE116837165C0049F13B790CE4F40FEA4998DB96F65C006944F0241CC4F40428A46C07F6A65C06A2DC9F204D14F4025C2FB035A5D65C0A146A95205C94F405DCBC6F4F05465C0ADFE6AE8A3D64F40417CB90AB04965C0E3134F04BDD84F4087B5359B334265C00E237CEE1DCC4F409A894CCC194165C0319B992D94C44F40FE6B1B8AC04265C0348FD59812BE4F407061E4F0BC2565C00005E69125A64F4091E25F342C1665C08A658B36AEA64F40A6F23A6C481B65C0ACBC39C5C3934F40D8530D6F7E2A65C0E4931BA251974F409547FC30003565C0DF3E1036BD784F4009B283A5DA3965C0300C86A8EB8F4F4071D51CE05D3F65C0501C68A02C924F40EE3E5F3BAD4765C0364F2A930BA44F40E2FAA46A805B65C0CAC2510F03BB4F404D426542C86265C05260FE0E47B74F4001030000000100000007000000894989CE2A4362C08E987D5234324E40D4BDAD0E565362C0FB5F7653661E4E40791E34BCBE5562C0468A2380C3244E404DC69EE59E4F62C0C7CE3EDCF72E4E4070D077013D5762C014816428E42F4E40B642A1E2A65262C0214FCB54B03D4E40894989CE2A4362C08E987D5234324E40010300000001000000100000004236401C135E62C0A504FBD895244E408E53B825B56762C07093881574104E4083D3794FC36B62C05866C31755034E4076169E17546B62C0DFBCC55BC1FC4D409E4B49BF6F6F62C0AD030DD60EF94D40CE2FA484196F62C0F0BA4E701AEF4D40152491BA317D62C0A1667E9024E54D406FF6F178C77762C09779FBED55F24D4058EB81E0B07962C0B0888C6FDAF54D406BF32BB26C7562C0682FF93B1DFC4D40248EA1A75D7662C04E820C44C6FF4D4008AE006D3D6662C0A5BB79125A1F4E400A85F2E6416662C0A455C6B0252D4E406CCAA0065A6062C07F18D574C42B4E409554AA1F366362C075F4B8DE97224E404236401C135E62C0A504FBD895244E400103000000010000001F000000A42603A7FB0263C00F6A3923062E4D4088BCC37BBE0463C0E53183B0AA1D4D4059016968E8FF62C0ADECB52E632C4D4045497420DEFE62C06A7047C0E3234D406D568538A30263C03E0BB375EC134D40F84045CC330663C0C8A6B35A3C164D40826A12CDFA0763C0680449D425224D40A902AADD4C0A63C0FAAA0F02BC1E4D4056D53B5DA40963C0652B7729E8174D4022537626D40B63C0AC01B3A61D194D403585E1DED90863C067DA1B0A43104D4095805D55701163C0E5C78544D20A4D40B75CCBCDF81163C04F6B2FBD801A4D400F3F26271D1463C0C971E720F8094D40FC637476CA1863C04EFDC6FD26094D402B49ECC0401963C0AFD55E43F2FE4C40EE41D28D792763C09E2A910A90154D40B46D3CBBDD2563C01D6A0B8FA41B4D4044E1C07C051D63C03295423C10154D4033BAD5EF742363C02A92CF4DC2214D402E25A4AF7A2063C0938FDD89C5264D40928BACEA631863C044CE64B8F0204D40B5AD04E77C1863C09DAE6F0C342E4D4049D102685F1C63C086029CED11344D4053735054361663C0821BC858FD354D404910C18B201563C0ADC32674FE3C4D4038A9AEAEF80F63C0D2B0EB06253B4D4026B224F7E91063C091017CE3D9344D40958439ABD70C63C0CBB1DC9155284D404CF43A59300B63C0905D708BD8354D40A42603A7FB0263C00F6A3923062E4D400103000000010000003600000067A2C874A4BE60C0E4426B2064A64C40608DEC7CA5C560C0954F941B2AB14C40B25F59B6AFC260C06E113B5D86A04C400E160B7E95CB60C0769E9D6D3B8A4C404C308AD1A7D360C0FD4680322A814C40C44C169394D260C0882F3BBD0C934C40DB98F29959D460C0D6350E44959B4C40B982F55170D060C07971E742F99B4C404DBCD859ABD260C0ABD754889FA24C405BCDF11289CE60C04BC998C6F4A74C40297469E1D7D160C0A099821217B24C401529DD88F8CA60C0E8045AB7FBA94C405F618A88CEC960C0F2E041F2BBB14C406D39721A0DCF60C0E9CD82CF56B24C40B6FFC96A60D260C0DDDB7D12A4BE4C40699D489673CB60C043E32700E5C54C40FAB7222C67D260C0856A8312B4C04C403AF419F933D560C097B4228BB7CD4C402F98ADE1C5D960C0086188F09B054D40C81B671F5DD760C0A047F5862C174D40CBDD03644DD960C0ABB3FF345C0D4D4040F654F441DD60C08DEDB6333B1A4D4056056D7437DC60C08B37F57C86204D402C98FF7A4EDE60C04609DA7D0B244D4020D504BFABDE60C0566BF5D326344D40DE45AA2CC8D960C066E1F01661294D40FC5AE8D900D660C0FB00A388CA144D40706D452178C560C0E29DC4B166144D405C2D00DDBEC560C00512C39CA80A4D4098C30F3799BC60C0C835FF3500E64C400120AFE514BC60C02E2E013112D64C400CFDA9645AB960C0ED3FD2AA81CC4C409561B3AEC8BE60C095D5827090D74C40819CA75C7AC760C0428ECC885E034D4017765D540DC560C07A6F3ECB3EFF4C40B38BE9A9F7C960C01F6AD68DB90B4D405034941F6EC860C012602D4695034D40437E29E64BCA60C0450705419E034D4078AE581836C760C0D84C9281C1FC4C40F2BC7A233ECA60C0A448D97B76FE4C403AF73DD933C960C01FBCAA38D7E94C4017F04E54A3C760C0E15326F9E4ED4C404A12777673C160C0E62E063075D74C40B94DF5F66FC260C009DF802D8DD24C40672F506507BE60C058A64B3075CF4C40A6BAAEACF1BA60C0C9281D23E8BA4C40F8106D379BC260C0E1B6995E22C04C4093302FF565C160C0B5CF8E5DCABC4C40240187B833C360C07A0DD15B55BB4C40010E427221BF60C051FBCEDECEB84C40D3090F74E7BF60C0457ED29C2FB44C402223DDEF46BC60C028D84F6525B54C40A6E04271AEBB60C0E7B662E640AD4C4067A2C874A4BE60C0E4426B2064A64C40010300000001000000050000007B4F1E4E90D060C02EAA6A4D3A2B4D40AC49F02D5EC860C03F7444B3EA184D403463579583D360C0BE83885D641E4D40EBF0DE5EEAD560C02B5C0C66BF264D407B4F1E4E90D060C02EAA6A4D3A2B4D40010300000001000000390000004F9F91C668FC60C061FDE3606CFE4C40F5794A9493EB60C0E3F006FAFFE54C40C61D7C0F2CEA60C0DFB51C8098E04C4072D813977AEB60C0B8507C732FDC4C4097168D8958DD60C085FAE2EC61E04C40556CD2B607DA60C000ABAFB892BD4C40DD1A9CBDAEDF60C0875B8B57A0B94C406DF59797CAF960C03760C01DA9E14C40A2B8DF448EF660C06B1515753FD64C4000B9E412C6F960C04E802099D6D14C40A20CB5B350F260C013D28DC34BCB4C400526FF3812F560C0F9574A3588C64C40B379702ED8F160C09ABCC4C2EEC44C40EA6FC7648FF160C0C2B98F46C3BA4C4025E47B2713F660C081C256A763AE4C409CB7C7EBEFFA60C0A91E89ECA8B14C40FA34E247650061C0BF87D9267BC14C40BCB468F9FFF860C05EC3344BBDB74C4080FC86222A0261C044AF3EE437CC4C4002ABB3DF82FE60C0D1B3C1D6D9CE4C409667C76BDA0361C0D1180C97F4CE4C40F7DB52B5E40261C068E228D158D74C4055A059FD580761C0DDDC093753E44C409A541756520D61C01AB68DA104E94C40DF2311361B0D61C001E9833DAFEA4C4048A6FFC8800A61C038E6ECF0CFFE4C401428F7FA0F0161C05FF1D609E5EB4C404665E33A0F0161C07F2C00CAE3EB4C400528EDBA0B0161C0E43092AADCEB4C403614E6FA0E0161C0AE51FF29E5EB4C401C6370DEE30D61C0F556D0C6BE0D4D40E3E1166AB70861C0182406005B0D4D40234414126B0B61C0285B58E42F1B4D4046C9507EE00861C07EA4B951F81B4D40BA72C467450661C0FF415B4F4C0A4D40885E7EA74F0361C0D282E09D46074D409C2139EBD30561C0CF66D664B5164D401AE0E82E8D0361C0D233A7A5011C4D40C53129E0F6FE60C099AB90036F144D40852EC7A27FF960C0DB4CE19179234D40AD08F74C7FEF60C0A52D04DCDD134D40E2F647D361F360C0413C55B292054D40A183F55D09F960C05FB7044ADB054D40AC6E4214F8F360C08379432733014D40EB76931C6BF960C0743AED6EA4FD4C40B85BF57FC9F460C0186BC718EAF84C406CF4A4C9D4EC60C078D9A4E1CD114D401D21AD682EDE60C030A5C6E28A044D409C30595B0BDD60C0397138A8E3F64C40EC681BD818DF60C01CEC1A6945F14C40BC5A1D9268DD60C0A5D60EAC70EB4C408C19FFA59BE660C083D8C8538FF84C409B12268FD3DD60C02FF607AB3EE74C40F2ACA60D65E060C0057525A367E34C409C6A500E8FE760C01B46448CCBE34C40E5DEBE6675FC60C01764BDBF7EFE4C404F9F91C668FC60C061FDE3606CFE4C40010300000001000000630000001A3057F9912C63C020BF904833944C40AA9ABF7BD82E63C04D256B01288E4C40F5E5A410813163C01170AE49D6954C40C2496081123063C0BAECFC7513884C40B5C19EB2493863C0C52F7416CD854C400E7208DA353363C07A73CFC30C864C40723A7E7B8C3563C02C2C99B824814C40487E3A93C73163C065C8EBE51F7D4C403C7DE61F933363C0BA1E5BA978774C40D3272B3CDC3563C050D0A76CF37B4C40B0CCE10DDB3863C00FBC3988DA714C409EDFC030493663C06F3C2ED7D46E4C40226ABD9D6C3F63C0DAA1D864705E4C40221CDE0ADB4463C09EF68C32665F4C4006601039D23863C0052AE64DA77E4C403F08A2B4E63E63C000DB5D2E797E4C40E8BAB0AEAE3763C0A0630770A5904C40869B3B12D13963C01EDBD32E47934C40049E0F7C284363C07D122ED5337B4C403BBBA973934363C032243CAE8C854C40B0F27B25F23E63C03D6E73C6D48E4C40B3B554A6FF4E63C08B24CF4D26904C407FDD7AE8E84E63C0DFB3975C41884C402A399C55604C63C028C491FDBA854C40787942409B4863C0072E356BDE8E4C40861A12324F4363C066FC78D6CB8E4C4007EFC5E23A4563C0B95086BF627A4C4077CBD844814963C0FA19A9E417744C404B98FF816A4963C02ED2EA5E556E4C40B4186C46A34763C06668D496DB704C404FFDBB419A4963C047DA841B8E6C4C402D4724488B4A63C0377CC42E95764C40A98DB4B2085163C0C15CF1BEB07E4C409177AEF2F15063C0C24DC53DD1924C40D0480242815363C0E8AA3B8841A14C40F54307D4B55963C0A400E25587A44C400A7FCBE8305863C07396B5A169A64C40E26CDA8FE55963C0DFF8801764AB4C40BDA70023A05663C09E47CE83DBAA4C40495ED1175D5763C0952B7ADFF3B54C4088DAC3FE9E5163C001D57BEE98C54C401B2B4587795063C0712DBC11D4C14C40051255FA9D5063C0A7E18E6FF8C94C409FD4C571D44C63C0419F331428C84C403B42B2F55D4E63C03438F2E21CCA4C4030485E66384B63C0F12A57F380D24C404AFB72A8FF4663C04C3B3A4E74D54C4015F7E3DCF23F63C0E36C60D738D14C40ECDED061513F63C0ED932D7B1EC84C40203BADAF854363C05AF17F3CD9C44C400A99FFA16B3E63C06517E67346C54C404A524D306E3C63C05CF380BCBEB34C40859D44C12B3463C0ACFEED4064A24C40A4A02A6CEE3963C07741DA062DB34C40E291745A513B63C07A3226FB8BC84C4036098C14E33563C0E2809C62A1C54C40194870143E3C63C0F9FA6BCE37D24C403F2B5354AB3263C0C363BD564ECE4C40E920164E163D63C0567C31A980DA4C40C279D3B4C73D63C0A4D2D7E4BAE74C40D0DB31499B3463C0E25486DBD3F14C4031D35E96403063C038E9E8E70BD04C40E5763CBFE83063C0786A7EA69ADB4C407F3D38F6FB2D63C099B3BF6B81D94C40E84149AD023063C07BC12B752EE24C40359FEC4B292A63C07688F899CFDC4C405BF93C8B2C2F63C03E9B3610BFEB4C403D08F49FE32663C02D62400AD0E44C40A05621E0B22563C0F13724AB09DA4C407529D519BE2763C09D183130A5F24C40434B55499E2163C067FD2BCB52EA4C40C53CAF06E62863C0A862FD6895004D409D380F94361A63C0A770074C46F54C4099320DB43E1D63C0A7BED9D712EA4C40434C78731D1C63C0C3021BA8F3DC4C40116AFEE6521B63C04BC1FF0ADBEA4C40A2E29B36EB1363C0255F82C585ED4C404953DEF2E11363C091A1F981C4F64C40F2695085830A63C0E1BAA0B21DE84C40B9A5AF7AB21163C06B13AADB52D94C40DD666E69580E63C014543AAE61DC4C4056B40639B20F63C0F8C04374ECD24C4073F94B66D30C63C0DBAA0A13B0D74C409CCBDDB4FF0D63C0CFA29A0D4ECD4C405DD27BFAE90463C0203466D944CD4C4026259A741E0B63C0CEA0EF1131B64C405F8D2C3CAF1E63C0268E163D91C24C404352C538331D63C058932550D6BD4C40ADD3CE55752163C0016ABC091EB74C40900AA12ED01963C0D4D2A168E1BB4C409DA275615E1363C0E639949189B04C40980080305B1463C0C5690FBC92A84C400E9322E1E51A63C0442E9DC750A24C40481C7A133B1C63C0327A46B057AC4C40726CDA2B412563C079AD1E6A85AC4C40D3C4F22B9C2563C00C5B2A9155A64C40D89078E8AA1E63C069E3194E65A04C40B05D9A78842C63C0313DC4586C9A4C401A3057F9912C63C020BF904833944C40010300000001000000280000004F599FF4F8D460C03AC0371BD2144C40C3A929C08CE160C06FC54D9293434C40D21B9E662FDB60C0D6537630B3574C40868ACA2BF4DE60C0F2089A80E94F4C40433AEA2D0CDE60C05F9C3AFFD35A4C40E0F230356FDF60C04179777FB75B4C40AD767BB2BEE360C0E4F3FD2F924C4C4087C9C7EFF9E360C082442D6708554C408DA612BBCEDF60C0614EF147C4604C40B88FCE3215E660C0D3E5E48159564C4094882373E5E360C0671B4FB0DE694C405FF3E5B18BE860C0786EF8B737644C40BAD28D3EDCEB60C0ABFC1342956A4C40239A9B7548E960C0607861CE1E724C40924859FA4CEB60C04BAAA04C9D7B4C40748D02B151E560C08A1305E365844C405CE59B73BCEB60C087E295A63A8A4C406DE6066FCCEB60C072D76BAF9F914C40A7C979A982E860C01DC85443EE944C409230ED730DED60C0ABF53C391E934C408D522A6ADDEA60C07DD068A6BD9F4C4095FB787F16F160C0E98EDFA25B9D4C40790832E193F560C0081121A84AAC4C405BB43C4C14EF60C0DE13958DDCAC4C4051E029E07CF360C0CE8655851FB24C40272B913FDBF060C0B56712ACBEB74C406A33DEE882F060C028230604E1C04C406A75ECE010EA60C0DA2CE85B26C44C40E1E1131E09E960C024AED5DB73C04C40512C6756C9EC60C0903B77CF21B84C4027A184185DE560C08757A07237BD4C401BE7DA4E77E660C084C784A651B64C40857170B620E060C0D2FEB9D31EB34C40DAF0592A0BDD60C0ACBF9F2829AA4C40E798596F07E060C0786BA88ED4AB4C4034804CEB54DE60C0537E4EDB05A94C4067F2AFAA85DF60C04BE6CD0BAEA54C4032226622C2DA60C08E6071F5B49F4C402934D3D6C7D360C0892118A2415C4C404F599FF4F8D460C03AC0371BD2144C400103000000010000000B000000E3070B5F77F660C00A66DBCE85A84C40EB457601D8F160C068095063499D4C406F57ED060CF460C09EFD85659B9D4C4094912C4888F160C04F93888785904C40E77F3FA930F460C02446EAC485804C401E3268BCDDFA60C0BCE17B776C7E4C40947B781C6EFA60C0829641AD9E8A4C40C56AC3D6BDF660C055D7A43D9C944C40509C290E3CFA60C0EDDFDD3811964C40CDBE22DC28FB60C05876C55A7CA84C40E3070B5F77F660C00A66DBCE85A84C400103000000010000001F0000004FE1B45FB5A160C0D7563727137D4C40E0BACE94BE9D60C0E9EB3747126E4C4028BBE8E4B99F60C0545D785F47674C4094EEBE10DC9D60C048AE81EF97504C402384FED2C1A060C094F31ED3004D4C40107C313451AB60C0F50A27284C6B4C406E1B6877D5A960C03F21F59D925D4C401852C530D4A660C06E3B029EB15A4C408B621F75B5A760C0891EF70FCF504C40A2EDB0E02CA360C064C23C40C84E4C408C2CD0EB65A560C0D7DFAE4A0A4D4C4014FACC61ADA260C01C050C3003434C40A6D114E84CA560C05DD1D256043A4C40A8DA2C11CAAD60C004E497EE33404C40CAB20FCA75AD60C0274F7B61283A4C4026C5916279B260C07F3DFB7774374C40314F17F0C6B460C00B21F42CBC384C40E859E777B2B460C0EEA65F8C18484C4024B88CFC22B660C0E5125891CE484C409C65B17560B460C0D2889E95F84B4C40BCE1CE9FADB660C09425D0DFB5564C405B1991B495B560C05189FFDFED6D4C40D66B1CB342B860C0F2497F74D1664C4076E1249D8DBC60C03B03A8F4C3724C40A4F4F9749CB760C035E6EB6E44724C4014A88828A2C060C007545F34D7814C4054015A2EFEBB60C013A91E76FA8A4C402FA39EE276AA60C0DE532197907F4C407EA7596B72A860C0DB2815EBF6754C40422B606473A960C0D3ED681A74804C404FE1B45FB5A160C0D7563727137D4C40010300000001000000340000002257DDB7E1BE60C0C9E4E188670A4C40F67F2E4136C160C0678CE633760D4C40B992AF49BCC160C0DB1D7767F3274C400348798B3AC360C0D454D86D50164C40257B2D3FFEC560C0220FC32490164C40356EA90726C360C0165AC3A428114C407A2453E777C360C0189A3ED9D7FF4B40761C9A331FC760C0B1DC93CB7B084C403D4B4BFE34C660C060FCF35EE5134C404AF693EB86C860C09DB1CF80BB204C40906D81F42CC560C0090231974F274C407651932C0DC960C04BB157993F254C4015D973EC0AC960C054A2A084882D4C40BF2FE11CCCC560C03B40B12ED8374C40C91798222FC560C0D20FD778F42E4C402FE7071F83C360C045280891D3334C40691C6441A3C160C03DCF12B5F52D4C40AC1B67ACF8C060C0D4898ED62D3D4C40AC1D69E93DC260C07955985307474C4082ABE98D5BC460C0E336E915483E4C4059DC5D31DCC960C0B450E544AB474C40AF8C4AB2CFC260C044D20F961F524C4091599EAA19C860C068DA76AB634E4C40A7B319E503C760C0926BDA223D584C402374E53137CA60C0116F88421D544C4084DA5E7BA4CC60C03FC569A04A5C4C40E47DD1FED8CC60C0ED3D27931C6D4C40BFD6E765CDC860C01F058151C9654C403CAD1BF156CA60C07395B7A65F724C401D7CE9177AC360C02DDA0001DE6B4C406CF742E87DC860C008668072E2774C40FAFA789ED9BF60C01922FE6DE26F4C40DBC5B69EAEBD60C041529C9C9A664C40D36ADE7293BD60C0A4D836B6795B4C40426AFEC4D8C060C0B85C8A9ACC524C406FA03F6FA5BB60C05F3D13BD935C4C400461E2DCDBBB60C0DF6614216C674C40119AD23606B760C0FBAD33EA16624C40F2A25817E2B860C0C0D1042E90574C409DB3A43B2EB660C0A793DFDEB74C4C4036753D02B1B760C095674050B4474C40A0FD35A483BD60C0553FE632914E4C406BF54D3A0DBB60C071A7599529494C40D78AA0A86ABD60C08A77017318404C400340648079BA60C09CEFCA18BD374C40580759B228BD60C0C3678C4363364C40CCB7796661BB60C0B503E55BAF234C4055A8B5DD33BF60C0C7623184882D4C408D7A669B8CBF60C0B03096735E224C40C4D0A71877BC60C035D1C87F891C4C40A61B2B9262BE60C076773FE983194C402257DDB7E1BE60C0C9E4E188670A4C400103000000010000000A000000AE091D87B79960C0C2EA00FB9C644C406CD4ABA50A9160C0AB7BFA56E9494C404CB0F1050E9860C01F351400B6464C40BDB59BC20C9760C056E015C769414C40A617F809CB9860C0EBCDC385473F4C40FEC23D97229E60C047668E3233414C4033552DD1A89E60C092FC9BC4014C4C4072756293449C60C0D814EFA67B514C40091D4362E69E60C087275696E4654C40AE091D87B79960C0C2EA00FB9C644C40010300000001000000080000003C37E54BCF8A60C05A17371A653D4C40A79DC049338560C021D2819E252D4C402707ED952B8060C0899F6A5F0C2B4C406BA9BA158C7D60C0B8ECC0C032194C40C473F394D98160C06C51EC45360E4C403EBC4B7BB98960C0210C8E55AD1D4C405C88B3C03E8B60C022D940A194234C403C37E54BCF8A60C05A17371A653D4C40010300000001000000070000008D1B047B8D9660C0B4686635563A4C403A4C4C25B59360C0E117CB56B1324C40CCB0D8A3B99560C0AA26A0E2F1214C408E334D34189B60C084CBF6519B1D4C40CEACB116DCA160C0B46BCB43C22B4C400F9FABD3249E60C0462A402A45394C408D1B047B8D9660C0B4686635563A4C4001030000000100000055000000538DB2F9278F60C010D49BD670BF4B40B8D72AC35F8860C0310D4EB197B84B409DEB6E830C8F60C0208DC4B332B14B404583A800278860C0DBAE50F377B44B40B8C49CFAF58460C0C4A0D2C275AE4B4094DA5135C88260C0136F36DA8DA14B40A3463E36B78760C0D5FFE0C38EA04B40BACA68E9B48760C0E58BE316AA984B402C97D16DDA8260C091EF971AB2994B408CBBD737648060C022DE1665DEA24B40D3F559780C7F60C0B017FC71EE9C4B40D7AB08FAF67F60C078CE3E66DC8C4B405FE32EDA178360C06DE0DB6C378D4B406D2D05CF618260C0BB72ABE1F7844B40899B273A0C8760C0093044C8FE7E4B4075E36AEEDE7E60C016F642E842834B40AEDFD35B668060C0AE7030AFDD7B4B40730A879A277F60C0820F2AEB83724B40B2FF1906B78160C03E9AC7F3DF714B403543A2786F7E60C062BE28CEDC644B40AB9FF732428060C0A4D86A87C2634B40230E46C72D8060C0B9FB3FB058584B4008E752534C8960C08645139C705B4B40A4860087EC8660C02EA679D792654B40F06C491B5C8B60C0E8A574C848664B40BE0F7C068D8860C0F9FA3454676B4B40342BEFA1788C60C05DDC77C03F764B4018404F602D8C60C0185CB0AF0D824B401E8EEB25018F60C054E8C57379734B4017BF3AE58A8E60C0AB55D9E1117E4B4071EA3526089160C0B72321A459774B40C36A25612C9360C01D4A9399EF7B4B40F5CDC0A5159160C02C1F134904824B40B80C83E0619260C04C5D6105B8844B4055F2CFA6BA8E60C077B1488A89854B4061EA33DFDD9160C0D6C088ED8F8F4B40A837D259B99360C0EC14B5C2CF874B40DA7859DFF69160C0B5A3D7EB24954B4052CF12CD939460C0E31FE97DFD9F4B4007201AD58B9360C04691C13577954B4016E703D5629560C0307C1C01A0914B40286959CAF59860C0D17AF48B50974B40890A5539C99960C0F643A6F643A24B40FD839F7F24A060C061AFCB4DF2994B4041FED4F2DE9C60C0D75CEE44C2A34B40227D82632CA760C03A88DDB72FA44B40E52D493F64A860C010EED35F55AB4B40D5D6BE0242A660C09BBF5B8433B14B4064CD2D362C9B60C06B8607B7F7AC4B40A3AA5BCFE69F60C071A54FCE0FB04B401ABDC92F22A260C09FB4FEE5A3B64B406E617FD8529F60C0D9BE59ED3BB94B408B453B1922A460C0BFBBA3C49ABE4B401F69ECD33FA260C075E86AE472C94B4094BF5BD31E9D60C0B1D9F1CB57D04B40B7E0C2C62BA860C0E0F69DD160C94B401131B1515AAB60C06366F6C108CE4B408A0A136F09AC60C0B488FAE480DC4B40D7DD7EF199A760C0C3CE13F38FDF4B402D3B70896BA460C0A1117A4069F14B4062D69044C7A760C0BB0291CEB8F34B40CFD3849652A860C0F3E4A51C79134C40668AA288CEB360C05564F042831A4C4023AEDAD64DB460C0AAD84E915D234C40FB67971025B260C0A599E864F6254C40B6B871DB97B360C0E10134228A2C4C40F7AA7C6F6BAA60C018300A53BB294C40B043B06817AA60C02178851068224C405EFD52E114A660C0D3365FEF3A2A4C40F2832910FEA160C0A2F2D825EC1E4C40AA88EFCAD1A060C00F64561391164C40AE49160E79A460C0D7F0BE16EC0E4C40F4CC3B868DA260C0F0148E38AC064C4085BE09A1459760C070722612ACFE4B402AE9AE93D28F60C0C156703B2AE84B4095631103008E60C026FC0BDFBCCF4B407E66958C368C60C00AB8203CA4D54B4075FE54485C8960C0A1FB2C63A5C44B40C77CEAC5AA8460C0CB7912B576BD4B400F778B82778560C0564BF73720B94B40FF95236F559160C0FC6CDECBB3CF4B40B90AB8A30D9260C025734ABEA0C84B40E53690735D9060C0DECEA436ADC54B40ECFAC042C09560C061E05CDAE8B94B40538DB2F9278F60C010D49BD670BF4B4001030000000100000011000000570A9B088B8C60C0D62CBC0CFA2A4C405DB3FBC1B18C60C0DB65CD805C1C4C40CFCC46505C8F60C01E6F38BD45184C407EF2003D3C8B60C0EE10F0C7AF1B4C401FDCA20C7C8360C0DF4202FCC70E4C40DAEC7FF8738660C03EC6F4CCE70A4C407C8A328C248460C0DA2BF73AC8F64B4041C35146D08560C09D7F5DF49DFB4B40B928824EE18A60C0BBF2B931EEF44B4001A3E815AC8D60C026B714A255FA4B40CE94368E368C60C0646FB5B754034C404A7681E15F9460C0108D7C233F064C40FABF0826529660C0BF66BBAFBF0D4C402BC633E5469660C061B78ED2651C4C40BAA6C95A5C9360C04AE63214921D4C4017F22F968F9060C076AF6BBF4B2B4C40570A9B088B8C60C0D62CBC0CFA2A4C40010300000001000000090000002AEE635731A960C0B33DD55273104C4013DB0B0937AA60C0D49E3D882BFF4B4049F2826A53AF60C06946D89DDD024C40260F7E65D7B360C0818271D1A3F54B40321840D855B960C0B587AC5ADAF54B4009598F6BCEB560C0943C880A73084C40AFF45B2993AF60C092B03565F90A4C4089CD31F6D2B360C0D41473ABB2104C402AEE635731A960C0B33DD55273104C40010300000001000000200000007CDC098E677360C090FC6329EAA84B403DD748C7687A60C0A52D2F823ABA4B40E86CA10BA47460C04F076DC4BFC54B40CAA5248BB97360C071A6B1B16ECC4B407A3C134A967660C0E5B6BBE546CF4B40E37F184C327660C0B81430DF90D64B40CAB7FCD8787060C0E9216A29EEDC4B407AABC78EC17660C03146D817ADDD4B40F59D79DB706F60C0B6657A9FB7E44B40C6BEA453F07560C03F9B24819EEA4B40F5DE345DF96D60C080A1691882EB4B40831337985D7260C06382153FF8F34B40743D9BAD776760C01E3A62CB0CFA4B40091162B3FB5D60C0D609ACFC28D24B40C9C48FA4FA5E60C0E70EEEAE0DB24B4043812665E86060C0FFD524E7E6B34B40ECD4CD98976160C09B7DE43932A24B405132BA949F6460C00850C3372A994B40177F8E11DE6960C0242C4B0B099E4B4088550FDAF56660C0F78E491811A74B40B5447CE1476760C0F28FDDCEEFB34B408A8509956E6960C065C5764903A34B4022CB464EBF6E60C0F501C1EEF8A34B402E6F30E1B16860C0CB96E87DF4B74B40566C5EE1376B60C020F98CA483D24B408ECC73DDB36A60C0B2A6F9F2B6B54B40AE7DFE11D66E60C087A1CA2BF2A94B40ED8495993D6E60C0574262B69DC34B4049F434D4B17060C01E71067AEEBC4B4071FDF693FC6E60C0E218046A80AD4B403787CF8CC17060C0FFEF7D6877A54B407CDC098E677360C090FC6329EAA84B4001030000000100000007000000736562C8467A60C07CBEB6D9C9B44B408C01CF4AC97360C0DCDB15E941A44B40B28889C15F7860C0D5D5DC91AB9F4B40043FB3FD407760C0B073A92D33914B4035787CFC617A60C012D1B2570C9B4B4012A50805BE7B60C0EA77E09719AF4B40736562C8467A60C07CBEB6D9C9B44B400103000000010000000B0000000F89344A016F60C0A66B9332249E4B407A47EF0B006C60C0DABD43092A994B403F0828C2696B60C0F0E116F481844B40FED1D53A436F60C0AA138B2F10804B402784273E337160C0E8F0C20E9E8B4B40B79C8BBBB17060C08BBDCCE12F844B402B64C5F7307360C0AF6E6FE2597F4B40F200C97E037360C00D060EC39B8D4B406EC92DC0987060C063A45DC66A904B40005492C8BA7260C0B583092934A04B400F89344A016F60C0A66B9332249E4B400103000000010000000F000000DCF9EFC352A360C0A60497CF629F4B40D06A7AC8A39E60C05A4A2B35EB874B40A007907C9AA260C0D11F0DD0F08A4B408C204C9F369860C0AF0BFA2B33694B407153EAE3EE9660C0370FFD2EE0614B404F12A9E2489860C083CBA8B2A35E4B408C5935DF729560C09F2825B9F7544B404BB86D1BF19A60C03797040A34584B40334E62A0919E60C0C102EA2B5C654B402266539D059D60C03E0BD42A0C6B4B405B89DA03CFA460C07AB0415ACE784B4031ED8E7FE3A660C033952C0B1D8C4B4078F5CEF7C8A360C0E6BD6DC0008D4B404775B608E8A660C0E88A5BACB6954B40DCF9EFC352A360C0A60497CF629F4B40');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('3','AZURITE','AZ','ARIZONA','F','921','0106000020E61000000100000001030000000100000099000000BB49B4F651A15CC06211C3EA8B8340402374781DC8A35CC01818A549B5844040A29CD60509A75CC02C1870CC748340408E8B04EA92A85CC01227D6EB4B8440403FFF284C4AA95CC0834A9749AF854040C1692A2F7EAA5CC00080366BFB8440405E5D9CD786AD5CC0B545B780358C40401C689BD767AD5CC0DBDE90FBA98F4040B7F4105366AB5CC053664472689540404A6B13F485AB5CC0821AFD86BF9C40405CE5547503AC5CC049380104A09E40404EF902545FAB5CC0DB8D915D4EA2404078CD6B3C11AF5CC0893A177421A74040F3FB27D807AD5CC08347DE081CAD404019A4195B65AE5CC0D45F499A9DB440408FB60A3149A95CC012895798A5B540407D53724F5BA85CC0C724AF133FB84040472885EEBFA75CC0824E9F0CFBBB40400398040C47A65CC0B0B0946839BE40402D2D2C6B92A55CC065A2358335C14040107B9C06E2A15CC092F4BD78B0C74040FF57016993A25CC0F1FF12144ECA4040A82C6829BDA15CC04354452BA2CF40406CB442EB9DA15CC09A0040422FD5404020475DED54A25CC0F4FD12DE63D74040104BC029B99F5CC063EE44D9ABDA4040E391058DA8A05CC086F6703121DF4040722EFEAC4AA05CC0BF2B148DC7E240401B8EE0105AA15CC05A65C464BBE940402288F20FC0A05CC0ED3F9782C5EB40405083B17157A15CC03F8B435F74EE404062A03A50E29F5CC0B42BBA9667F64040AA0101F5A3A15CC068D4DCB1E8F94040F7B54A542AA15CC05A77E82F87FB40406822D669749B5CC00BDD7AEDD1034140164E564B239B5CC0FEFFD4C8060A414016737C2A409A5CC09D4A22C7230D41400F14F8BEA8945CC084C360071612414046C75F7A43925CC08BA631E5EA154140DB0A61F3168F5CC09369C725D61741400AC7082A98895CC00312215E2C224140B2CFBAC603885CC0706D783EE52241407A94A28995885CC06721041B432841401D5D1D8DD1895CC094203FB8102B4140C8292332A78B5CC01D33DA14BF2E4140C1F8DB7D80905CC0E5FD9A0EE733414067E5C22123925CC051CF54ADBE3441407819552562935CC010AC7FCAC6374140294B31EA49955CC01A32E947393A41407325AAB018985CC04988DEC5D63A4140E84B213291985CC006192B24113D41406F3782F21D985CC0EAF1BF1CAE44414074AB0838399A5CC03D340F74B74A4140E4BAA39BCB9B5CC09079FDD0AA4C414020B22E7A069B5CC037835ECF314E4140E66BFA01CD9D5CC00BA97C1EDD5A41400472D206DC9F5CC07F76FF37545F4140A8C7DDA9A2A15CC0479C7E55DC5F4140A48485CBB0A25CC024B9EA5246614140D8F4B46E7EA45CC057FB30677A6A4140FC1F861525A85CC0E84DC07D117041406DA685B659A85CC081A1C337B27541402A9CB195BEA75CC092520E35C8784140C874E43777A85CC0C3291F0DB37F4140F75E8596BFA75CC0E3259D6DDC7F414065B069D98FA85CC083DB3BC75B85414043F6A2D51EA65CC0CDEF5A44BC8941400072EABBB2A85CC0F1BAEF1C308F414083074E9B17A85CC058A035DB2391414013CF8F9549A55CC0CF16C4BDF7904140862D88D49FA45CC051FA71BDED9141407ED61614E8A35CC0E0D9B0F950964140C37A7835D0A35CC06955A2F32E9C41403B0FA4FC9FA55CC079E054A402A7414003D5B6BFBBA55CC0DA63A75ADFAD414084AED52B4EA95CC082B9CE87B2B94140EE46AB9205AB5CC06583863B04C2414069B9813196A95CC0BE3EE536F8C5414044E6E1F3CCA95CC0BAE78CCFDBCA414095AF9993F3A85CC0B3648BAB40CE41409F3C4337DCA95CC0611E5B44C3D241406178D979C8AA5CC07AC2ADE104D441405C045EDB90AA5CC04FB1157BB7D84140BC5EAFA015AC5CC00B1D55B2C5DD41404E04E001B2AB5CC0E1500DCDE1E141400F7741C926AC5CC0E8F5C3FE78EC4140583571C765AA5CC073FC3F9D7BEF414001BF16A857AA5CC02D9A955BB3F04140C577C6EFC0AC5CC0E2582EB3AFF441408EFF101B1EAF5CC09E20DC426BFE4140DF5F0C5DEEAD5CC0E731FA7CB4044240F4170661A7AE5CC0041F113885074240F102B4039AAE5CC007B215D4000B4240C4A83FE39DAD5CC055438E92760D4240D23E6078C8A75CC0D7B1D1F62B124240812466F454A65CC0352C12FAB41142401D1EDFEAF4A15CC09E85DCFED9134240C02BB3FEDC9D5CC06742F889F60F424059B1509B699C5CC01C5A8DAC7E0F424066AC11145F985CC09ED96FAE53134240CEB6BDED07965CC05988DBF3981142403DCB15E83A945CC0FAC3099A430E42409377C26472935CC0C275765E260B4240E15FE183AF935CC08B453141F707424029B80637F18E5CC0359508AC58024240BD436DB33B8D5CC0134FC06C350242406ED7EFE941885CC011EB946C57054240DF71D0C9E5865CC002A54EE67F0F4240BD0A5A02E3825CC09B576B44D4184240E1ECBAA164825CC024274CA3A61B4240D816F03FCC825CC08ACFBEB4C16B4240907D1EE7CF825CC07529028E8E7F4240EB4D405499395CC00934E35C847F424082FC53ACB8225CC08363A348BE7F424018B9973B2F0F5CC0512C78496C7F4240531C0464CBD65BC0BAB23F06388042409E2DF8305DAF5BC06792228751804240E5EA5850FB9E5BC014A6C1A58080424099557E6EF19C5BC0141A088BF17E42409024DF1AD07F5BC03BFBC211FC7E424076244D4C1A435BC052D6EBED917F4240D4FEB9EA0F435BC06B524CAF92FF41400435B529FC425BC0A447F5D8317A4140DA7A80201D435BC04D585477BF4B4140AF980CEC38435BC04419D43C43E44040145FC3D03B435BC048E026D7429A4040E6006C4149435BC07F6FE34FC863404068E15FEE2A435BC02C0ED5E994384040C1234F5BEB425BC02C51FB89EC573F40BFED600BF79C5BC0B75766E670563F40AA1402129BC45BC03DAB361CEC553F40F561E43AA6D75BC027D91FDC786E3F402F4FCF2810555CC0AA8CF85F95054040B8776CBC97B45CC0210500905B3E40401859D91BCDB35CC059792C8DDA4E404034DFE40C36AE5CC04DC0F20E455C4040FBFBD2CB9CAD5CC01D40FAEA145E4040B4197C296BAC5CC009BE6908E75E4040BD1190FDA6A65CC09006EFE9F65C4040D057941DA0A65CC043901D87315E4040615676F99AA45CC03B32B065645E40409965AB199FA45CC041BA87A2D95F404056E04E58E3A35CC0E0872A22DD5F4040A6338DF8F0A35CC02384B95F60614040F9150D96C0A25CC0D423913F60614040E8205C96C3A25CC076FA1CBDB762404024977D14EDA15CC01431B49CBD624040E38A93B53EA25CC0B62390B9DE64404085C68B94ADA15CC001C05F35AB674040E21C332C889D5CC0B61B3ECE366C404018FDFA0E7E9E5CC022E588DCCB77404030EA360EFA9D5CC0D4979434287D4040BB49B4F651A15CC06211C3EA8B834040');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('4','PDS','AR','ARKANSAS','F','922','0106000020E61000000100000001030000000100000051010000E9E8455A8C9D57C0D6901D9A2F19414001A6C5CAF79C57C0C55A9F521441414021F368A08A9C57C066573668285E4140343DA6DA1D9C57C0CFDB646AEE764140BF564F656D9B57C01493BF1945B341400C3F7DA9FB9D57C0184BEB2D0FD241405A54498E199F57C08F627ADA51E14140F05AE7F6B6A257C05897D3CBAC0D424063D29D3666A357C03C2D87290F15424059F1D881E0A657C09D1ACD00493D42404E4FF72381A757C0BF21671FA53E4240279758F52F8557C0CF6614E2D93E4240586AE69AE17657C09C5DBE51B13E4240DE0A2C3B2C6657C04C0C68F8B63E4240F5D2BB9F035557C021C720E3C03E42409471095D075357C07E7CCAA1CE3E4240E3CD73AF8B3657C046F23D89B43E424090C093C7C43157C01280B1C7B73E424088B1CDA9792157C01A390983D63E4240990A304C5D0957C0F39BD3BBEE3E42400D26764A2B0857C0AF60365BE73E42400131466011EC56C0ED1547B2D93E42409AF9BBC5FDDC56C018141FACC63E424027C484E05ADA56C052E62F6CDC3E4240DD37A5BD92C856C05A875A4C773E4240B48825D87BB356C07E6E3440A03E4240AF3399193BA556C014F790D1D93E42404CFB33C55D8E56C00AF77C6F143F42400F6CC6D99D8956C00B811AB1F53E424073AF2AB7CA8856C05A305B978E3A4240F2163634828756C0C99A3A381B3A42400130C774EE8756C078C7869D183642400BBF65B37B8756C0D5D6DD40D633424047C3282E238556C04B0EE0A3DF3242408217108A568356C0847A9587F93042405A24D209388356C069AC94EB6B2E4240999BE9AB558456C03C778C91A6294240B128A4A9308356C02B0615F7772642405F1C8F6B3C8456C09A5810FBDB224240FC74A6700A8756C0280E6C1A08214240DD7CE071678856C034E61042271B4240DEC31A75548A56C01A10A083371942400B05DE5B098E56C0ECBE49C518164240FCC9255DDE8E56C0B09457A7A21442408FCCEC3C098F56C0E346F84C8E11424022276620E29056C034E2A3D0350F4240377EF0023B9256C0DD1E9431D80E424052DD8B862E9456C012B99397BD0B4240C8C50B8E429856C0A60CDB0FADFE4140117076C0259256C04590378FE0FE41406F68E291A67D56C09C2A7BB59AFF4140788A1E91326E56C00EB55E64FEFF41402075C34FA56D56C029EE68E9B2FB4140365F396A836A56C0281BF1EC0CF84140EA7316884F6956C0FA93ABD0F9F44140F6273508906956C0EBBC86737AF24140F0DBE8E98A6A56C083AB3D555FF1414089D567AFBE6D56C04D6C1512ACF4414083D708523C6F56C06729B89121F54140F9FEE4D4D47056C09F751334CDF2414073CF22F50B7156C0004B1DB62CF14140B19DF4B37F7056C08B4363188DEF41400D826CADE56C56C09E42045DCAEB414071FC30ADDB6C56C06E17E27EEEE941406ABAC5F01A6F56C0C567AF824FE74140417F8ED3A17056C07431E9C0A3E841401A64B1F7967256C014514DE11EE74140C8F189F8327356C0273E2A461CE341403741389CEF7456C097C1FC8711E1414026D17180097756C00A1F7948C7DF4140B70154473B7A56C032DA8805A1E04140A3BAEF2CDF7C56C0AE60B907FFDD41408BB8F48CEF7C56C035CF784B35DB4140C814214A827B56C0BA1B627292D64140FC0B46E52E7956C02782CD76F9D3414052999381607756C03B6AB67431D641403D6E8280DE7656C0C553F8F4E7D541401E7C779F5A7656C01DCA833999D2414041A669814A7756C00A68EE1B9ED04140F0CF3363297856C06706DBBA13D14140D60E96AD417D56C05BFC131F35CD4140E1EB81CD517D56C0F8377A0312CA4140EDE0E3E8FD7A56C08B4E58E9E7C54140BBED3ACA997B56C0D1C4FC8BC0C341402083200CA67C56C02C43872C74C3414095D2114E977D56C0AD0096CB24C441402C8D77D1567F56C0C1E23EA6E7C74140B8EE66F71E8256C03F24E427B8C64140F45441989F8256C084BFF4A97EC541408A2D4798AE8256C05E5E9D4F9AC1414010564D53FA7F56C024DE435B07B941402240B3F9FF8256C0441BA16166B5414074848D5BDD8356C018D0CA62EDB44140A91043DDBC8456C0ABCA9A809AB6414062E9E8BCCB8456C0BCC8F07778BC41409DD2B3BD448556C051C1909638BD414096B75500888656C061C02898A0BC414051E121A5CA8856C09CEF6B5EA7B841401390B5A90E8B56C0460E14233FB6414023A36809BF8A56C0F587A40A32B14140ECB3CE05FA8856C071922F6A0AB141407E77D9E47B8856C0395D12052FB4414096732D82308756C0E5E2E2A279B541405147BBBE748556C0F8CC20028DB54140E38F9D1DD68456C0257935E40BB441408FA12A1F958556C0B0B43309D8B041406FD9BA01C48656C0932B9C4CDBAE4140EE6CFFA0528656C00BE720303FAC414005C627E2CF8656C042676B764AA84140C68451A80D8A56C038ED61D935A7414053DAFBA9DE8A56C0100FB4FE2DA441400ED713E8BD8956C03D94C181CFA1414084CC7C42C98656C0E4DB08A0C8A14140E457C4C0C58556C08CE6560193A04140539A285F6B8456C08E1003E83D9B4140BF660880B28456C0C36BF7EB9098414029C54C5F008456C07795916F6095414015A706E0228456C0929BF072E092414070590F22508556C00064279804904140B50EFA67348956C08B935FF97C9141402233134A888A56C00FD6181C9A904140140E4D8B6B8B56C023E99120EB8D414058509ACAD38A56C0FC942446F98941407DA1D70C888C56C00807712F3F85414055E03696AE9256C0C23097EF3686414037472D778C9356C062E390D81980414036DDBCB62C9356C0907B2DFD417D4140C3F23691E38F56C0AFA9C1E494794140806EA2D07C8F56C04465872631784140D988DA508C8F56C0BF53FDA9DD754140320E9453139156C0E8F3C50DC47241409394C9B6F79256C045201C2FFF704140E4786EB72B9356C0F7052E32BA6E4140031BB9374E9356C052A0A6340A6D4140DC9F0EBAAA9456C0ADE5E6B3D86C4140715F297CDB9556C09987DE902A6E414030FD22A3DB9956C0C7CE2F52AA6B4140FBEE3AC5089B56C04C6EE2F28A6A4140BBA694E6C09B56C00E4ED911F06A414097A5B865639B56C04206C6EAB56F4140EA7FC6460B9C56C07FB8C28771714140871858CA1E9E56C0F72C4547C5704140997BE36A639E56C059CB9A2BCD6D414019B7A2A8ED9C56C0BCC302F3A369414053CB6A2AE09D56C06CBDA6975E664140D95AA8E8BB9C56C0B3BAC37F636141409D19DAE8E59C56C0EB9DA6E3E25E4140F7D0B10C1B9F56C0FEA698240C5D4140CB89C30E4AA056C0E09E7C236F5D41403AD2BBB017A156C08E1B72DFCD5F4140DB0929EEEC9F56C0CEED307D086241408D4779AE16A056C0C899F5771C65414088F9559008A156C08141373421674140626FDD51C0A156C0EEB7359359674140EDE2E6F40FA356C06B1ABFF52C654140B9C3E3F222A256C09C1292244F5B41400AC0EBEFDFA056C051E48DA7E05941403A1681CA159E56C0C6D14649285A4140594E9B49D89D56C0DC0F5BAF08564140DF1A5A0E92A056C023162073AF5141404F64D71280A256C030E7C41089514140301747B40CA356C0EF839BAD7153414014EA5EB381A256C0BF538568D05741409E3AC816EAA356C026AABB44A6594140C02314F914A556C0F10420ACA6524140933D555AA3A556C08D83408E5F504140BF9B8D58F9A456C034D102936B4D4140B4C0DC50F7A156C0937B2CDF22474140CDB4CE5162A256C01D025A208F4541400B5A52D635A456C029055B9F2C4441402205861826A556C0A9B0C7FF99424140FE9DAD19C5A556C09C5038E2903F414069D9A4B3C4A456C081C9584A1E3A414061BF681212A556C0B54000ED6F3741403D587133A6A656C0501CB54ECD334140BC6706F711AA56C0775DBE8ED92E4140D04E6D531BAA56C0E372F813412A41403424AAF47BAB56C0D1DEA9D3B6284140A9F1057620AC56C085CD25F2FD284140D12EF27999AB56C030E8A64C872E41402716527C01AC56C05DAE9A89613041406FDC95C458B056C078308A83A62F4140E3921B04C4B056C02AD06424982E414090AFD8FCDCAF56C019A6926CAE2841401CDE53F988B056C0E99B5AF1B8234140EAE4FB7FBAB256C0CF0BC66B68264140494177219EB356C00BC1DF6A54264140C1B91181BBB456C07C35B44C83234140B96FBFBD36B556C0F605A4D2641D4140E1EF4FE143B756C0A36069F1101C4140CCA63A4B6DBB56C0049311C809204140054E23ABC3BB56C0A88C9E490D1E4140241BE967FBBA56C0C6D18F4E3B1A4140C1874F7AACB456C0913BE738671841407E8FC6F6AFB356C0B607C49D48154140D6F9ABD80DB556C0B4EA86BE0A13414048C4ED9A30B656C03A62CC3CE61241400C48E92775BB56C05905EECFC617414063D17C6905BD56C0D84D65D1F413414003C469864FBC56C0395124562210414051355BC002BA56C0D48DCE5C2A0D41407BCBCBBA73B756C0AA4A2D81EF0C41405765239ABBB856C0AE54098739054140CA059C42D6BC56C0290AC1C004044140CF4FA4644DBE56C003D61DE06B01414071264FA46CBE56C0E3820DC252FF4040A43BC0E184BD56C098DF11464FFD4040BA9ED7E1C0BD56C091966947D9FB4040E651CCC429BF56C024209285FFFA40409131F80606C056C0196CF422F7FB4040A2EFCA289EC056C0F06C261ECDFE4040FF629CABFEC156C03CD8C4DB2EFE4040581971B177C456C08EE25933CB004140893B8B93B1C556C0B901F2314EFF40406BEE3831DAC456C0AE011497C4FC404006397A4830C156C06DA03065DCF740408C5A064CEFC356C04F31DE0900EF4040ACA563EA83C356C0D922962EFCEB40408E1F3A86DAC156C0AB0D617689E84040F6F2120064BF56C05494CADD45E64040A6ABAA3EFCBE56C01A4073A089E4404058A91C00B6BF56C0BA704FC1C5E2404062FC10C32FC156C09D46A97FCDE140409305B7E6C8C256C0C09EBD5B84E2404083336C8A41C456C0903DF775B0E44040EA8263EFC0C656C02C9E39F265E340406884E133C6C856C03B676E6DDDE34040E2D17EF426C956C04DC5168ECEE24040AD447AD2D6C856C03DD1933696DC4040BBB4D27042C856C0A2B49BD934DB404073104F0DB3C656C07307F2FCAADA4040BB7FE0C69AC356C033A7FF8017DC4040284CFEE37DC256C0080B392551DA40406E2F43A36DC256C0551D2E4877D74040C62A05495EC556C088A01B46D3D44040FD6CCE0EC1C756C012C4DCDFBCD640408DE2BC5575CA56C079525C54F5DB4040735435FC8DCD56C0DCAE34F0C2DA40402DCB53BCC6CD56C0F1546F336DD84040106B729A25CD56C0E99E3F58C4D54040243E2E92E3C956C07A615CE38DD140407CD61011A6C956C03221FF06E2CE40406E2A8CB2C2CA56C0B34058CCE6C94040CB9232D506CC56C0918385CB92C94040B55A5F9B84CE56C04B31908598CB404085936D5A93CE56C08101FE2B3AC74040BE481698ABCD56C0A0B71DB00AC5404009849AD611CD56C05457D970F1C440405A611093B5CB56C0141B37D500C34040628A91928DCB56C004DB1A578DC14040A040B1D54BCD56C099BFBEFC9BBC4040D65750788BCE56C0B7DC3F1ED3BA4040D858CCD8E8CE56C0C8385080C6B840401EA077F1A3CB56C031202CC247B94040B6725370FFCA56C0ABB72DBFBEBB404059E9699127CB56C03B65B3D892C04040F52F3DD090CA56C056DDE9B785C14040E631910A40C856C0B576DE9C24BF40403A11BFC89EC756C02E2D6D0122BC40403260B728ABC756C0B861DF23FAB94040B5DC332A5CC856C0170C5105BCB840400C20A773BBCC56C0805DB9850BB640404BEA2BD412CD56C05013E6860BB54040CC672991D8CB56C0E96B5F4B2BB24040C6F578CAD0C856C0167B048ECAB14040AF065EE559C656C054793C2B1FB540407B6D0A847FC556C0433DC9A342BB40409A643542BAC456C06E9C1264B0BB4040DE2D81E0E8C356C082DAA165E5BA4040070F3FA0F1C356C0D02ADAE948B74040FE5568020BC556C0468EFE8C84B44040650A4DE6D9C656C0754C5EEE5EB24040E5D72DA95AC856C0058E0CB304AE4040F2144F2A14C956C0D358B8B847A94040F20EE8E6D8C756C07DB4384262A24040597221C497C656C04BD73E06EA9F4040A2641941E4C456C02FA53EE06FA54040BC3415BE73C356C0C31B95C097A540405C570C1C98C256C08A9349E319A440401921C25D7FC356C06B0BBBA8799F40409FAF8C22E5C556C005EEF58AE79C404054504B0188C556C06754A856B3944040C99E744224C656C0D21079199692404092A76EA5C5C756C0E3C405DBCA904040E723DF0C60CB56C09F5904964093404001D633EF84CC56C0B37582B7FE914040FD02378E33CC56C0A35DD61C828E4040BC8F4FC866C956C0FA48D5819E8B4040244D63A48BC756C0803C58A768884040A30C2125F1C756C0B77B610A11864040971410E908CA56C0CBCAECEA30854040C6EB6A494ACA56C03C75456ECB8240401FA68E2962CA56C0F51F0750AF8140408BE2DE744DD056C0C3379CAEBD814040D333D4875EDB56C00C8769D8BB814040B550B10A16DD56C0F15DCCB9CA8140401CD5AA6D0F0457C00C5571A54C814040B912CC33E72D57C097EB7ECC27824040322CBCC3A73E57C06796A6D35682404040E0BAFCE14E57C00D527BE07A8240409C1FB216A95E57C01B4E8F6FC1824040E0717F39C36057C0F251E18DB9824040BFD43CE9D57357C01CCB71C7E8824040C47C86DB7D8257C03A676281FF82404094C59A27598257C013A689339EA2404008EE8EBB4F8257C03B1331252CC74040559740A0F18357C040EA4120E6C94040934F53E48E8557C0CF10C9FDC2CA4040F778E145548657C020C17FFE5BC94040E1BE2E6EF18957C092A6A63B9AC840408B6A15B0388A57C09718CAB704CC404052DEAC96278D57C00104FED5E7CA40404ED63C56828D57C070E0361970C74040EBC0387A138F57C068DA4557E4C74040F4645979498E57C070941CD5FCCA404025D3EC1B328F57C09D353C73D8CB40406E79845F959157C0801829F2EAC74040C47F49006D9157C0660FE84FD8CA4040FA0A5B21DE9157C003BB762E73CB40401A175F23239357C04A85558C3CCA4040DD54B7825D9357C0A6A8468E4DC740400A74C3860D9557C08FA7CC6860C940405F7D9ACABD9757C01D173A641EC640409CA9684E4F9957C03AB945DFBBC7404017DCFB2BD79757C0BD33D8E150C940405BD3B3ACBB9757C09420C7608ACB40407DA0D3AD469857C0729940FFF5CB4040DF16B30E319957C0CC93941E9CC94040EB444F90089A57C0E01ECDDC6BC94040E52E47546F9B57C0F279D6F772CC4040048704D6629C57C0404D66155ECC4040ACC36D97E99C57C0C19BBF135FCD4040EDD45036F09B57C08CA80B95F8CE4040E9993357E99B57C0A62814D47AD140407FE9061C829E57C04F42D30EE8D0404013238A4BFD9D57C08F918E5B3BF84040E9E8455A8C9D57C0D6901D9A2F194140');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('5',NULL,'CA','CALIFORNIA','N','923','0106000020E610000005000000010300000001000000F6000000DEC3ACF6926A5EC01F0CDD23AB154340F220D33A12725EC06E68881C8C0843403E5CB2EAC6795EC014E4C01955094340AB1D66D9027F5EC0009B8C26DB114340B746DB11DD8E5EC052B6862419094340159C34DC78915EC0DF153DD267144340636EB96535945EC0A52919085C1A434025A79DA8B0955EC0132B9F4AC71843406958FC3D43925EC0C1082B5264144340F3D1571875915EC02786DB5F7A0C4340872EF56E80995EC082A49CB1A61443400361DC0E789B5EC0AD92F33B910E434064F1DFB64A9F5EC01B02C95B840E4340C3C58F61D5A15EC07276C03449134340F579E0F15E9E5EC0DBCF5042F00A4340D137C0AE69A05EC0F801E7316302434084173524469C5EC0132EFF79D1FD4240C8A4C0865C9F5EC04232A82844F74240635A671F549D5EC0CC94B5C2C7EA4240DB201EA501A15EC02EB19FC73AE94240F857F02DA6AA5EC0BDDE23F215F442403875913345AC5EC05A49AA757BF242408EB3C9D09EB45EC019F8D869FB004340DCDEC2A0F4BA5EC0AC0C0874EB034340B5AE6FE538BD5EC0CD0B1524D1FE4240BC63B6CDAFC05EC0F110F0AA4AFF4240DF59F1071DBC5EC06AFD722F9E1343404737A254A8BF5EC0F0E2A18A0B26434061EEEB7B1FC35EC04882896CA62543409EC65B63C7C75EC0DA8C0C3480374340592E677711D35EC0885593060F4643402067B55B87E15EC092C9D1FAFA6043406239E0A133EE5EC0699515E75E764340842FD59ABDEB5EC0DC8B51E559854340E424D2F413F45EC0AD4806EC84AC43402DD42E364CF05EC0B09AAEFAA3C643409526196325F25EC0DBEEF82BF3D74340C6F07A91A3F55EC047F8815FC7E9434010CE54267D005FC002060B7FD1FF4340989B65470D065FC0D969D12DD90C444044027F7F19165FC09B2338A04F2044404DC124C682155FC06798BF51ED294440B53E92FA20195FC0E37ED6D7B5374440A1937A2A01075FC095273904367D44400F22E3BC94095FC066931A937D9044409BF0942295045FC0D65E96AA2BA84440DD9CE287B5035FC03598C61FA5BA444009CC0DBE3A095FC09EE600AB14DD44408730CDEE8E0F5FC0024E60C76CE344407B0D13B2470D5FC0C90402FE95EC4440FEDAD362360D5FC0B32E6DEDB2FF4440E86423E56CF45EC0196325F218FF4440FCD32E58D8E05EC0C1F540FDB8FF444086D803EE36CE5EC0D17DE2D1470045408032A99B38925EC00711A70D19004540B9399BAE415C5EC05E26BA5A46FF4440FEF06E59CD375EC0FF7BC80A6CFE4440CA2388D694FF5DC03300A8449EFE444060439CC8C3FF5DC096C5C37DBA964440A955402CC1FF5DC0C85C95F93CDC43407A91ECA6BEFF5DC0522E0EA4C4B84340FFDB5F10B3FF5DC063AA96B8E0A74340512235B8B6FF5DC0B01E65B750944340CCCC7690A6FF5DC0DDE11DBA958D4340B7982D8AB0FF5DC0B7F6527C20884340D728A740B2FF5DC0E535B9DE3E7F4340CA0722F9EAF85DC0326DC5560C764340DD15990ED8E45DC0C087A7F5F8594340B56854A167D45DC0CD43A94B7843434089FC55BFC1C95DC01B0CEAE4B5344340F7686F01B79A5DC06822909F7EF142403C4CE609AD755DC0607797BF88BA42400B830E62444A5DC00D9605FBD37A42408EE6CC71B0F85CC04BCB492C2800424006F8149E13E85CC027715771D9E54140F75E8596BFA75CC0E3259D6DDC7F4140C874E43777A85CC0C3291F0DB37F41402A9CB195BEA75CC092520E35C87841406DA685B659A85CC081A1C337B2754140FC1F861525A85CC0E84DC07D11704140D8F4B46E7EA45CC057FB30677A6A4140A48485CBB0A25CC024B9EA5246614140A8C7DDA9A2A15CC0479C7E55DC5F41400472D206DC9F5CC07F76FF37545F4140E66BFA01CD9D5CC00BA97C1EDD5A414020B22E7A069B5CC037835ECF314E4140E4BAA39BCB9B5CC09079FDD0AA4C414074AB0838399A5CC03D340F74B74A41406F3782F21D985CC0EAF1BF1CAE444140E84B213291985CC006192B24113D41407325AAB018985CC04988DEC5D63A4140294B31EA49955CC01A32E947393A41407819552562935CC010AC7FCAC637414067E5C22123925CC051CF54ADBE344140C1F8DB7D80905CC0E5FD9A0EE7334140C8292332A78B5CC01D33DA14BF2E41401D5D1D8DD1895CC094203FB8102B41407A94A28995885CC06721041B43284140B2CFBAC603885CC0706D783EE52241400AC7082A98895CC00312215E2C224140DB0A61F3168F5CC09369C725D617414046C75F7A43925CC08BA631E5EA1541400F14F8BEA8945CC084C360071612414016737C2A409A5CC09D4A22C7230D4140164E564B239B5CC0FEFFD4C8060A41406822D669749B5CC00BDD7AEDD1034140F7B54A542AA15CC05A77E82F87FB4040AA0101F5A3A15CC068D4DCB1E8F9404062A03A50E29F5CC0B42BBA9667F640405083B17157A15CC03F8B435F74EE40402288F20FC0A05CC0ED3F9782C5EB40401B8EE0105AA15CC05A65C464BBE94040722EFEAC4AA05CC0BF2B148DC7E24040E391058DA8A05CC086F6703121DF4040104BC029B99F5CC063EE44D9ABDA404020475DED54A25CC0F4FD12DE63D740406CB442EB9DA15CC09A0040422FD54040A82C6829BDA15CC04354452BA2CF4040FF57016993A25CC0F1FF12144ECA4040107B9C06E2A15CC092F4BD78B0C740402D2D2C6B92A55CC065A2358335C140400398040C47A65CC0B0B0946839BE4040472885EEBFA75CC0824E9F0CFBBB40407D53724F5BA85CC0C724AF133FB840408FB60A3149A95CC012895798A5B5404019A4195B65AE5CC0D45F499A9DB44040F3FB27D807AD5CC08347DE081CAD404078CD6B3C11AF5CC0893A177421A740404EF902545FAB5CC0DB8D915D4EA240405CE5547503AC5CC049380104A09E40404A6B13F485AB5CC0821AFD86BF9C4040B7F4105366AB5CC053664472689540401C689BD767AD5CC0DBDE90FBA98F40405E5D9CD786AD5CC0B545B780358C4040C1692A2F7EAA5CC00080366BFB8440403FFF284C4AA95CC0834A9749AF8540408E8B04EA92A85CC01227D6EB4B844040A29CD60509A75CC02C1870CC748340402374781DC8A35CC01818A549B5844040BB49B4F651A15CC06211C3EA8B83404030EA360EFA9D5CC0D4979434287D404018FDFA0E7E9E5CC022E588DCCB774040E21C332C889D5CC0B61B3ECE366C404085C68B94ADA15CC001C05F35AB674040E38A93B53EA25CC0B62390B9DE64404024977D14EDA15CC01431B49CBD624040E8205C96C3A25CC076FA1CBDB7624040F9150D96C0A25CC0D423913F60614040A6338DF8F0A35CC02384B95F6061404056E04E58E3A35CC0E0872A22DD5F40409965AB199FA45CC041BA87A2D95F4040615676F99AA45CC03B32B065645E4040D057941DA0A65CC043901D87315E4040BD1190FDA6A65CC09006EFE9F65C4040B4197C296BAC5CC009BE6908E75E4040FBFBD2CB9CAD5CC01D40FAEA145E404034DFE40C36AE5CC04DC0F20E455C4040D72799A7D8065DC0709E0CD14A4F4040E9ED5FC232485DC039A7B27B9444404039D7A5B8C94C5DC0AAF704ECF55B4040C65ACE04B8475DC081F834EC2A4D40400649D349F8475DC09F84393AE756404017565CB9B84C5DC05A2A1C67955E4040F7C9FF9EE24F5DC033FDD5510D574040CE6162C542525DC00D2E0ECBF46C4040AA048AC14F505DC0DDBABEA5AF71404054F2AB2605555DC0B948890A458E4040EDD67ECD3F5A5DC03F16F8A4F69D404040F023AD3A665DC099E1B31680B24040994F5C75D4865DC0E7D26532B0DF4040C0595C8FC88F5DC0A6D14EF90FE34040FD594B715C925DC0C1FA6BA319DA404040F342FAEC995DC0498D978D85DE40403BB86BFD739B5DC0B7A438E341E34040873707DDD7985DC063239442FAE74040CDDC3604609A5DC091CBC71405F1404032112FBEADA25DC0FBB65CAAC404414013FE3B7A70B25DC0D5ED773F5602414067A2BF791EBC5DC0A09DAB6221054140E648C16CD8CD5DC01DB2554ABB12414038B6A0B712D15DC00571D2007A1E4140B8EEF2A1E9DE5DC029FC7479FB2F4140002B9083CDE65DC0BA5C7FBD4D35414024A344CBA4F75DC039595B5DD03341409C612D57BC005EC08DC973BA173B4140EF36986DF8085EC061AEE34B673C41405828A86C321D5EC0A0289DD2A3384140F13C8C1B9A205EC09A110061BC424140243AD1F10A295EC09C86755D424941407A61980E81265EC0D4C806691D5A414014E238556D285EC03E655AA0446141401C520413EC265EC00AD30FD2846D4140BDC644DE9E2A5EC019B7C907B0734140EEACF2DB3C295EC0773A925D7F7C4140DB25ED1479275EC04143E7969389414081C283B6DB285EC02300BE72EC914140F200033A20375EC0AFA9B6D3C89A41407742EBDC8C385EC0EA57363234A14140F9643C5666365EC0C4929827A9AE4140899CCD7A03385EC0C4DA3F02C1B64140BC4B8D137C3F5EC0C6937B3F71BA4140C8B9423A61495EC0B15FF7A58DD04140AAF413F74B515EC0FE9B5BBDEED441406B8369A80F555EC0C1AF8A4888E641404E41EAC0835C5EC06FF715F19EF041404F7079DF256C5EC011FBE3672F1742405A94B53B77785EC070AB89EC492742400B04E85B237D5EC052E9E753984A4240FFA8ADB6547A5EC069A21A8AF9514240CD25B12E83775EC0A9C3138FC94D4240602E4486BF735EC0298A02E9F8524240C6E455A2BA705EC03745BDABD468424008D75668AB725EC0231CB783D76C42405481F6DC8B785EC0CF00CB06267B4240983445DCEC835EC0208FB0E64779424038EA9CAF198B5EC08993307D1C80424075A43C9993915EC06A1A7307AB8D42406A3B306D899A5EC0E80F9FB19B9E4240593C0586E9985EC0AA088FDC1BAD4240C3F987EE409C5EC013C893AE5FBD42403B1EE5185DA05EC001F5AC8BEEC24240738407A3E29F5EC06E8121EDA1D9424096A846BFE29F5EC0A54C5D7237E4424079FB01DBA8995EC0BF29EB0681E74240A08D3F972C965EC050AD5A1AD4DC42404BDB15F971975EC0405CB9E2E9D94240DF7CACDA04975EC0F3DA527E0DCE4240D77F1838B7855EC0E48713E1ECB942407C4F55EC6B7E5EC04DFE22E1F8BA4240B8248219F4855EC00CA24CF8A7BF42404CADE96AC88C5EC0374D1E101BDE4240E0EEA895FE935EC0E5E880AAA4E342407541CBF5AE935EC0CF691E4F25F242409E59599BC6975EC0C151FB6B65F44240F1127EBD4C985EC0433041DC99FC42401E97DBD5E9925EC0FF837FD1E4014340AA8503360A805EC020DE19BD500743405B744AB2BB6C5EC09AE20CEA0103434084F8D792186A5EC0CE87345A050B43402C4507AFEB645EC005CCF2BA0C0C43401E3FA96D73645EC04D00244326084340816795CC09635EC08DC7C9E31F08434088095E4FA9645EC0A297FCF5900E43401B23012F77635EC000A84710951143405AE95293366A5EC0E46FA4F7580C4340DEC3ACF6926A5EC01F0CDD23AB1543400103000000010000000B000000DADF946A8AF75DC010B0DA17A10941404CDF653DBFEA5DC036CAE861BB02414091F6CA4DA5E45DC0444570D623074140E960CE657AE15DC0026041776D04414067CF112985E25DC09E5DE3DCD4004140B5AB34409AED5DC0C212EE6F8EFB404057CD96C239F65DC05CB9BE0DF5FB4040324C6063E6F85DC09A93570499004140E6419066EFF75DC0C186C47F14044140C84387475FFB5DC06409E83793074140DADF946A8AF75DC010B0DA17A109414001030000000100000006000000D2C81874B60A5EC0AA2355F24AF6404063B8D661440F5EC0BB6A2CB0640141404CFCFFC9FE025EC085CFD2EF42054140ABB3651DA8FD5DC0ABB7C44D50F9404004D808CBFC065EC0389A854389F24040D2C81874B60A5EC0AA2355F24AF6404001030000000100000008000000C89F2EE210A65DC01A52A8748BBD404087172C7E31975DC047AFD6049CB4404018558E93DA925DC056A91432CFAA404031FD365575935DC003D511F75BA740400C2EAE0E259D5DC0AA56499692A9404011956151CE9E5DC070721BE5B3B540409E9AE99C9CA35DC0B533B11F9DB74040C89F2EE210A65DC01A52A8748BBD40400103000000010000000700000020775F1976965DC01311BA63DB68404014EDB703E39A5DC0AC5BA2C22E674040404FBF50BFA05DC011F7B08D2F724040310A5A7D5EA65DC0D8A500D9B08240406E63E73993A45DC02BC6FBB69A844040A56A5154A9A25DC00F17719B627E404020775F1976965DC01311BA63DB684040');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('6','ECOMAP','CO','COLORADO','F','924','0106000020E61000000100000001030000000100000038000000D9E69C5DD88259C0D79FDCD31BD242402A1F794DB08259C02233E49A71B14240D826F79B618259C08835395A977E4240391BBD78DABF59C0C7CC02A1CF7F4240C35D39C1FBC459C0DD624F24F87F424069824DB797FF59C09CF344C34A7F4240DE8C00E45A495AC0ECEE776B217F4240A53C724AA34D5AC08FE503AA0D7F424008CB3054A96D5AC03D81F8C04D7F4240FEEBE3ED7C7F5AC0C68FBC58037F42402828AC25389E5AC0CFAA509CE97E4240013C87B31EB75AC0BFD1F2FCA77E424036CA74D3FBB85AC010F935FAE17F424009D14EE24ADA5AC04F85B4ECAE7F4240D9D734CA3CDE5AC098228DEAD77F4240F0D2B198D6175BC004F45AAFEE7F424076244D4C1A435BC052D6EBED917F4240B517BA26EB425BC0528FF3BABED0424008A5C9E4C3425BC016631EFB96F14240299C541DC8425BC0F32ED95493134340BDFF9F3A93435BC0540A3D8B591F4340A53F5CE473435BC0EC1C98B8503F43403E5DCB694A435BC00D32F52234AE4340580682036D435BC0E6D94A6653C2434063EBC9015D435BC03718741B25D44340291856E547435BC0222B3409F21A4440A1891437F4425BC0324DD54028554440F62F859617435BC0DC4D47AACC7F444064D8F182CBFA5AC081049F986E8044402E63779275D35AC08B2C7D5E04804440FA99495963B75AC0A7477B73CD7F4440E340336510955AC095DDBC3C2A804440D28733AD058D5AC0FE7B0AC9028044404600E3D1D7515AC01E57795E887F44403D6D6FBBCE3B5AC016980BDE447F4440A446B2244F035AC038CE873A69804440E3D377D4A0E459C0DDD3F87AF47F4440A22BAC5C82D859C0EB83CD5D0A8044405FB512CFBEA959C068095E88C27F4440E0F3F7ACC2A759C010CB0E0A07804440D50628290E8359C0018233C9C07F444062352BEC018359C0F9DF11E51E5F444081F8962DF28259C07F503CC241594440C231B6360C8359C06544738E2D374440C8C921FA0A8359C06BF35AC6DB2B444032FF015C4C8359C021A1CA8DDCFF4340CD48F3102A8359C075897BF1CAC843403B21BD901F8359C0372E30F209C8434082972161108359C078E45A7539904340C4DEC45D228359C0431A2C83BC844340D9888F5C0B8359C08DB9E47EA5584340FFA7659E0B8359C043B4FAAEC84E43400DDF1549EA8259C09484323EB5214340A1BE70A9F28259C0ED27CF3D7D20434099831A83D08259C0BF7307C600DE4240D9E69C5DD88259C0D79FDCD31BD24240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('7','SIMS','CT','CONNECTICUT','F','925','0106000020E61000000100000001030000000100000028000000B4BDA6F1F16152C0096F6853E9C24440886868F1186152C050D01F3435D544406FBF04A1FD5E52C070DB3B1F12064540B91A76A4EB4252C0284680D1A5044540AA0C7DDE634052C0647FF2F29B044540017EA4BB403452C0EE802AFB490445402329B3DC543452C0236099C2A3FF444073AFF5F21F3152C033897703470045407F3D8090603052C0BF48781D5504454039DC3F7C022752C0C869CDA1E8034540E1720F9CE62652C0E6E81623EB0245402BEF68F83D2552C039B4B203C4024540079A0EF78E2452C0E1F59522DB03454003975E0E7C2052C01EC4E023F0034540D24EA5E7B90852C00CE6A82461034540F1EB8204140652C0275AD0654D034540037FD58C59F351C04A2461114D024540D3A766AC0FF351C069BEB1138C004540813661AB72F251C0715CD57F5DDC4440CF04440BBAF251C0EA8C8C1F25D24440CDCFBF8A92F251C04DB3B99FF7CC4440DABEFB2560F351C0F011DEE239B544404A94FACA24F651C016267381B1B344405403F3458FF551C0DAC5A264C5AB444004A771E641F651C00FD9CF04A5A9444035F9C5A877F751C0BE193A8450A944409343E6B7021252C0B59F4593FCA34440EEDE97FFE21452C0F2D9DCF612A54440A6126DE8371852C0E17F275BDEAD44407AE27EA8331852C02B5F63DA98A3444020085761BE2152C0B67DBC01C1A144406A697AEF073A52C00BA6586E91A24440D9712BCBAE4652C0C1D09EF09C9444400291B83BCD6952C01E20F952CB7F4440F453409CD66952C0172668719D81444040182A4B6A6E52C007721868D88C4440A9FDE087995E52C0E0931704FA9A4440324B4C74376352C040E12E5D95A54440307A4AB3D56252C093DF8819C2AE4440B4BDA6F1F16152C0096F6853E9C24440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('8',NULL,'DE','DELAWARE','P','926','0106000020E61000000100000001030000000100000025000000E0F066B140ED52C0112D6B275F474340BBD23C517CED52C0FCF02140285343405D4F51B15FEE52C01FFB58B9466A43401B9235362AF052C00726D2EC219243403C4CEE59B9F052C0C3465401BA9F434056C53B9BEAF052C0BA920803E2A5434088D4593E6EF152C094091F070AB1434006D21D4BA1F252C0DA8544A4A7DC4340346A436898F152C0179A4725BEDC43408DEF9CC7B7EF52C0D3C416E330E343401467362077EC52C02EB7E6BF04E943404E46E43337E952C033FCD9A04DEB434085AC632257E552C07D785E0589EB4340E7D18A4014DE52C0A9DBC84ECCE94340EDE06EF2E8DA52C0457B2D1445E643402827D62F5ADA52C08523443517E54340BEDDE0925EDB52C0424CA8769DE34340B146D81877DD52C03A74E8D8B5E14340DF1F239B62DE52C01C84765AF4DE434003C9CE5C76DE52C08ADB8BB92BDC4340357FD55F50DF52C05ED3727980DB4340A314826010E752C09EB833AE73CE43404B0D955702E452C07BC5FB0E8EC8434099DCC1DEBFE552C0C8C65C6B60BB434010359352F9E052C058FB778CFBAE4340A481F65FBCD952C08D1EBEF3FDA04340671F5A7B6ED952C0FD6EE0F15C894340D5E6046CC4D452C092AD6B9099814340170F59A8AED352C0E578BE4F177943406611155032CC52C0299C632D866743403D4816FB4BC552C03DD2A1EC6366434048E7B37CEBC252C069B15D908C394340570AC6E058C452C0CDEAAB119C394340D0E72325EFC552C07AA59B13AC3943403E0609D163D652C0F2026004483A43405C53F52DB9EC52C028442192493B4340E0F066B140ED52C0112D6B275F474340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('9',NULL,'DC','DISTRICT OF COLUMBIA','P','927','0106000020E6100000010000000103000000010000000C000000D8B7ECEF814053C065C9C2BFBB7B434035E31C434C3A53C02563D8CCEE714340D2190FB2E34253C04A3B7ED9E46443406262DD903C4253C028FE181632684340ADE92072DF4253C0113D72532C6A434073C1AA11914253C0C72018D2546B4340F98ED1517B4253C03387A4CE676E434070C60E55534453C00DA3BE6A6F71434092330A96084553C077923906367543407304173AD44753C02F6F376351774340455BE992B14253C035F35E5B2C7F4340D8B7ECEF814053C065C9C2BFBB7B4340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('10',NULL,'FL','FLORIDA','P','928','0106000020E61000000700000001030000000100000031010000CB8EF24A483254C008D2A17902C93C40B8CE4369CB3054C0C685056D80BC3C400E09E730413554C07B434B7E43C93C40626839F3713654C086A8A9A023C93C40453277F5D12F54C0972F175D24663C40EEF468EF801F54C019154106C4DE3B40A9370C52992054C01DDE6DA561D33B4013F1D5AED61E54C06BB1C93681D83B405BF78029B01954C0FCFCE72E1EB43B4093508547DF1654C071F24EE13F8E3B409B166A3B560F54C095DFDAF2BF433B409A7E8A722A0C54C07BC72206892F3B404C6F34D8550E54C0BAB4BC910E373B402F6E8E60891254C0A6DD625EC83D3B40E3EA4024EA1454C0B7D7CE198E3F3B40A07FDA3F961254C005928F8F7D363B4098A77657290E54C060F5A878ED333B4072B13F4B780954C04B1704F8EB1B3B407E25B282C80554C0D1491BED5AF93A4045A2B3C5550754C0F318D96A4DF93A4016BA531F420354C03BB1A32615CC3A40862130A76B0554C0A11EB97A8D533A401BA9AA8F2D0854C0333A49D43FFA39407F303BBB5B0C54C0F64D667B91C23940707E750D4B1354C0F132D6D51E9D394023827E931E1554C06A7F77A1717D3940725AAA91531354C05178F917B5663940701EFB1FAD1A54C040D2CCA0F93F3940EBD4FC80EE1A54C028C2154B3531394075A628F0512354C0E90269845A36394077B9A7A0672C54C0124CE911FD26394020C185D4D53654C087A64F84852F3940DB69C3C4743E54C02FB55E8968213940ED85F6F59D4754C0849FDE315A223940319685997C4954C0E23B0224292A3940608F571DC34B54C0F70BBD4AD54439407CDE1716FF4854C094F590A81D523940C5EADF68BD4054C0B6B55BDDE43639406DE807A1DD3C54C0500D917FD93339402E44EFDB933A54C0F579DC64293F39404DAA59A15A3E54C00886AEBC8C523940E3AB7E332C4954C0E4D87C7A966539405E685D36895054C05139F1925CAE3940E3473FEFCB4C54C00CFA423CDEB53940AC85A3B2655054C07BE09C2598CD39408DEC0EAEF76154C01613110D27EA39401D282782F86D54C0586E6BD76FEC3940D97E261E2A6D54C0AD383A450B003A40C26837A5DC7254C099E73C24751C3A40E50E3942167454C05BA603D6D2483A402E2621C45B7654C0C8E02ADC0A553A40B2624E414F7754C025294F9C86703A406C1404094A7C54C069BB4A2EB2773A40CA255EAAF57D54C09881222F73843A40AFC24B05717B54C0C53DB880F4883A40F62268FD977854C05215DAD29AA43A40A27332D0877154C0CF1E81FBD3B53A40739D511E6A7954C0216609A5ECA93A40970DBFE6717C54C02D88B5F6FB8C3A40102D07D05F8154C02257EB6B51863A40EBBDF1AF5A8554C0C6E5160F3EB73A408EE6E18C5E8454C041E20D2B58C43A402D2BBD28508354C09B0E4CA5E0DD3A40A653AA8B438654C03E70C622FAEB3A40B2D5CEC0737F54C077B1D7DF8AF63A400C01FA1DAB7E54C0ED5F21311C083B40A76E59DF8A7F54C0839D8DF21B083B400AFA3BE2CF8054C0FEEBCB38FFF93A40DBB66530CE8954C0CD659A7BE3EF3A409A1015387A9054C06A314FF220013B40FC0BC9390F9254C0A6C56F6449063B40D5D76E387C9054C0C1001CD676FF3A404DF815B34B8B54C02E6E3ACDE7E93A405E994354D88954C0699CD6E145CA3A404DA19ABF8C9254C0EB46991F92D93A40D0C1F062BF9654C0D7FE8FD9EAF23A40087A68A57B9954C00A36C0B79EFF3A4061755444989754C091D0581AACF23A4097452C03FE9554C08E022E7954E73A406ED55185529854C058D014FB81F23A403B4E448A71A054C0338B6A7AAB3C3B408649E40BFEA154C0820EC787A1423B404461B44BEDA054C03503F74AE0353B40750EEE2E7AA454C0C4ED2B3A37463B409E6E9F6A18A254C045EE56F7F0543B4087C04C2C32A454C0D005228EFD623B4006A28F33E6AB54C0FE28ECE14D793B4039C1358FE3A854C0F00899B4E2803B40D1C565F19CAA54C0B3F4D3B75B7E3B40485D9A12A1AB54C0E88ED30041863B40BF0E4BC43F9F54C08408E799627A3B407E75DEA5E8A054C05E415BC011833B40EF4768DE569B54C0B06F701ADA853B402C8F6B2AD6A454C0549D9CB727833B4099394B8FE1A854C08246DB1D61893B407E9D106A74A454C08D5C9D9B7E8D3B4062E7990879A354C01B6DE7A70D953B40FD99768E16A854C0AFAC0033218E3B40B8564A0790A254C031CF97D6AC9B3B40739A3C285CA354C073D63A1BDEA43B40BD45BB5AE19954C0275DCA1FA8CA3B40D52CB23A869954C0C00977FEFDE73B403A58ABFF809D54C067676A03AEF03B4039535BA1EB9E54C02DB74A276BD23B4037B8C7A3ADA054C0F53DCF9FCBD43B40D31653E67EA254C0EDBFA4E08BEF3B40869DFAF050A954C0A9D76B8562073C40935A6DD1A4A954C098E63873D5013C408481F395B1AC54C0F0EB35BAD10B3C40114F74D30DAB54C0AB087A10B1023C4083F140B6D7AC54C0964101C5B0F93B40B00AAD7043A954C0727B9D0B72F73B404D12B4586EAE54C00B97D7B8C8F03B405C33F4E81CA454C0484003E2E2E03B40DB90A6EEE9A754C09C8E851139D93B4043E38A7041A954C074ADE9C139B73B4086CAC8B369AB54C0F8348E67A1B43B40DAB95540CEB254C0B0A2933364D43B40A95870389AAE54C0D9EE9BFCBFB73B4030543B996CAF54C08DF0101095AF3B408EEC4EC608B654C07B8B39A1C3D93B40A58B3D7FDDB154C0C58DD0864B2C3C40AAD6CF3A1AAB54C0424830DFB26D3C40EAAA1077B5A854C0E73777FE57B13C40125EA3BD9BAB54C0C2A04B23F2CE3C401DA358BABCA854C0BEF5F68474D03C404F255A5EBEA854C0AC82DC377CE23C406B52083357B054C0DFC7259037023D40F233288A56B354C0F00623C1B6273D40CA5F55135AC254C053EED35AEC2D3D4081158B3FBBC454C06697DCC901443D403C964AE919C954C0B1DEE2F4B54C3D40440D86C6F9C654C057AF1ACA03543D4066EB262F2DCB54C02DA1935CFB573D40B736123AFFCE54C03AED4287166F3D40666EB96E52D854C032B8258316853D409E306417EBD954C0F2BF10136BAB3D40E85A398B3AE354C025BDB835C1BC3D406FE62B21DEE954C0AAEAA1CB34E93D4017E0E6F530FE54C0BE243DEFD5133E40AC9A3FA8C60455C03024C03496193E4090ECF873760955C0114324EDEB143E40A2A1E6A3EA0E55C0DA0C5935AD1B3E401CB89AB4A61655C0BA0EB8E7D2113E40452E1111111755C0194E764736FA3D40577A611D031C55C0517DC10CE6FD3D40CF6080FAB71B55C0100988C1A4F53D4051DFFE2BB11555C08167F9DD77F23D40EC2ECFCA331655C030204AD100E93D40C71B06FDBA1D55C064BF3E0DFCED3D40FE52B7F9E93655C0AA6E304232BF3D40BDDC32C36C3B55C0F02BD42A29C73D40E772DF07403F55C074CF79C64CB83D40F5179FA0BE4D55C04B020E4899B33D400B29BB2D5A5755C05DFD1056DAAE3D40251966F3365A55C050825C29DAC63D408CACDFD37F5A55C03CCDBCFFF1DC3D409FD4D3D1265955C015AB7A181BE03D4002A4DE52C35955C0503929805BCB3D4063216E2DEA5655C0303C3A12F6B03D407F2E3C299F5355C00B263E4AA3B33D40EB75A7C93B5355C02D5B7CD24ECF3D40B1581B71A05855C081E6E5407EEC3D407F268E4D396855C053A8990FB4173E40C38615C6626455C0FFF78DC629193E40D5079FBA2A5E55C056D4D3D998053E40D9E730948F5A55C0E6BFE2D113083E405F7B1B36AC5B55C022C7BA8DB60B3E4022D789107E5855C03671049236063E40AA749E707D5855C00F1B060D4A093E40875AFFB1525955C047FA2145FE0E3E4028D48959B75D55C06E844A0E190D3E40D7A4F8E0E66155C0FBE57034B6213E408FEF99D86D6D55C0C5A2B818C42D3E403A7A4FB3A06A55C0F42B2EB86E403E40374D6A4A696655C0476F566F4B403E403D5E5849726455C0EDE7B8F69D4F3E4082D27B7AE56D55C039C04A19DB433E4005CC6D5F2C7055C0682A9690034C3E40164D5B4A6D7655C0FB0A72A1C5473E40BCD9B1C71D7555C06DE61FB3993B3E403D2F61BF817055C0D1AD272C9C3A3E404F71183A7D6E55C0DE0BFECCFB203E4019D5A4392B7F55C0F45AAA1241463E40AD0E3723CC9855C0E309DB9C3D633E40504FBB0F57A055C055CAFDFBF3683E40C0F65DC3D69855C0A1FA4575F0673E4020878CB35C8F55C077F4F90B5F663E4078664FD3758F55C08241C1FFB36D3E40E5932046568755C0D2703DE9C3623E40CC559126DE8755C056A978972C6D3E40F31709100E8E55C028BB9603E47C3E40E928FB02D39855C0DA3CA49D50763E403F32FC09F89C55C04923651351803E40C08F6E1A0EA755C02819846E746C3E405A9E260E95B255C0A65FD5A4FF6A3E40CFB0575F60CC55C05667A2D0EF5A3E40787BC241AEBB55C0A8037D31AC763E40708674EDEBC055C0DB84B9FBB1833E40B934DBC91DBF55C0462F087626973E40E8C64BCE40C155C0280FE63664963E40C48B36F36EC455C09869733258733E403C66045CF8C755C0C92D37008E903E40742402C2FACA55C02A334BC3C78E3E405B61D91E3FCA55C006374D6A0C773E40D107CF8987D155C0B7C1B58E7D5B3E40DE12DF2024DB55C01D020223DC523E409B1BCA4031DA55C03D277620F9663E409623D11732D655C004EF59B3766E3E402DA7A9B83BD655C02AF9420909753E40F02861E4CDDA55C0228A02BE507B3E405351B9A980DC55C0C6C6F52709883E401370D12603DB55C03765175D768E3E40C9B9D5832BD955C06AA2B1C2BE9E3E403924126683D955C03DC6DF0D03AB3E403E28DE29CFDA55C04C59CA015CB13E40157F0EF172DD55C03277FB7AAFB43E407D6D98DCB3E155C087A9AD269DBF3E40CC60FB7DAEE255C05E09325423C93E409F657B276BE755C00D9330F429D93E4016E492A80BE855C08B99FFA57CE03E40303B7462C0E555C0E94D560151F43E407A9687234FE655C0072DAB68AC003F405256DF8470CA55C0BAAE9CE9CE003F405013D50FE1B155C0E348BC7F89FF3E407635AB26EBAC55C00D34E1FB82FF3E4039522024929855C090E17774D5FD3E40C61C504E9D8B55C024D68912C7FE3E407ACB385E098255C0D35922B84AFE3E4057AB3768245F55C03E99816741003F40F1A838680A5F55C0DB59D2A741003F402500FE541A4055C0CA1B4E2452003F40AAC69B53024055C0CF50F5ADB4FA3E402A1BFFEE4E3E55C0D81D59B5B2F63E408AA3184C043E55C053DE910456ED3E401C784986043C55C0CCCCFAF11BE53E40305B55C2523B55C0784EF9E3CFD83E4077DAAF20AF3B55C0AD6FB0D578CD3E40E91CA93E523B55C0EA4E71BFADC63E40B2327EFC943A55C0C3B535070CC13E400D483EB9D93855C00E5284886FBE3E40E06E2E54553755C0D1B1B1AEE9B63E40368DE8733B3755C0ACE9BF2E71B63E40265063F5F61755C05497BE01B0B13E40B6C571C5061255C0D33A354FBFB03E4025BAE002D60455C0D0CD8D42B7AD3E40A26568F60B0055C0E6944709F0AC3E4050F6DCD538EF54C06D162EF315A93E40ABF243C6FAE654C0B34FE1D199A63E401A0905E2E0D354C05076AFB261A23E409D8AA1C048D354C017B63EF61EA23E40853A4FE779C854C059DE253B109F3E40D7239E1891AC54C040A82B1D81983E4044B6622D4FA554C05E155C3ACC963E40CD7B9700A49D54C06BFB83292B953E40FA04D5B95F9A54C0DA80E66CCA933E40DD721783258E54C0DE1EBBE42B913E408028DEE1418F54C06E39F9C20C883E406050E21D0A8E54C04EB745ADC2803E402FAF817BBF8C54C087BF1397717D3E40ED1C4CF9278D54C058954AA4816C3E40B87E89F4888B54C0211E38985E5E3E4032B9DD72898A54C0D8FAEA9E7D5C3E40C9491B88608354C02C6478A2215D3E40AD6C6A67748254C038C7DBE3FF603E401F89464BF38254C0928835171F6F3E40C780B96A3F8254C02930207960713E40BF119FCB708154C0F03423B74B7A3E404FC3DD0D5F8054C0325F7C6F2C923E4082A896AFDF8054C0505E13C843993E40BB7500D5DF8254C0A4AA3416A2A63E4024AB6F570A8254C0F4672AABEDC13E40A5F8F274D48054C0E3473B4FA6C33E40E6962B96FE8054C0226B8DE593CA3E40E35BE390D07E54C081B0470F42C73E401BCAB70E8A7D54C0DB31F129C7CB3E40F879536EFE7C54C0F1429BC307D23E4020DF1C4D677C54C0D1B6FF0202D33E40F319D7C7147A54C0C9E13DE73FD03E4009932F878B7954C09AA524030CD43E403D62DF42DF7754C09B8B6DCB90CC3E40ACC24D99677354C0213E2EF0BFC93E40F67B1F95B57154C05C4AFA35F7C23E40FF43DB527E7054C0C3B7C69406C53E4069AFE4AE256F54C0F103E7378EC33E405E215F8ADF6D54C0DECACC7ED0BE3E402D721B5A1E6954C01874ED0CA5BA3E40FE313FD7306854C0328EDE8E55BB3E403D989291B46654C0DCCEB9D460B73E4037D93891796654C0BB3CD63392B93E407502EC82576254C07172EA3FE2B43E405D331D82D46154C0407D491FB1B83E40C247DC14EC5F54C010DE3A333E993E409DF506D6286154C05F054AF7638E3E4073978F26485D54C023C0C06D6B743E40D79A5366C55E54C091A84C186B613E4001CA165F5E5C54C096FDF0A1705B3E401CE73F77B25B54C0310C83162D3F3E40B1BC9F62605354C0A3F530C7BDE93D402194D65E415454C08FED9B1749D43D40A46B392A9A4F54C02DB570D7E9BC3D408D43FE04F64E54C06D9D0A2645AB3D40DCBD6E47084754C004361D29246E3D4089055924364654C05657D8840F5A3D40CB8EF24A483254C008D2A17902C93C4001030000000100000012000000AA64C4535EB555C007CF860B55663E40EEE84CCEA8B255C06E6A898A6A673E40515FA19BBBA755C0FBA44E11206A3E403DAECE7239A255C0B335647B23683E400C08A51175A155C0FE1A079EB1663E40644B93D216A255C0BB937220B5643E40295E93E745AF55C01389C30D0E673E4065E05CEEBFB255C04FE74D10FC633E403E30B8D369B555C01A1CB5F014633E405CE99DA382CF55C05D9E255B49523E403541744717D155C0761D045C49523E40E18081AB94D255C031517B182D553E40A6FA194B4FD255C068E9EF55FB563E40B74FA0DFEFCC55C0883ED4B7B7553E4066A0AE18EBC855C0620A44540D5A3E4007B3768E0CC355C0E8E38911915E3E40316BF5BF76BB55C0DF83BC10A3613E40AA64C4535EB555C007CF860B55663E400103000000010000000800000043A225E5172F54C07DA0B4B4F1C93C402FA98C67DA3054C0A6FD690973D23C40CBEF98AC4C3454C05043435138E53C40C6B1C671073954C04FA7F0C66D033D40C4CB2473A43A54C07D1B51F162123D40504389D18A3954C0205AC634BF0F3D400FA42E2F323754C05F28CD2DDBFD3C4043A225E5172F54C07DA0B4B4F1C93C400103000000010000000F000000141B4224752E54C0C5487F35CCC83C40EDF2A1A0192554C05875BE5514973C40756C2322A92154C04209F27CA5763C404AFA53279C2554C063B98446C5683C40733239CAC82754C06F43B707A4693C408E25EFE2F42454C05286928D748C3C40CA676621582654C02073AEAF9A9A3C405D259D253E2A54C0F67C99EB5F9E3C4009D88AC9472C54C0FEECB81E9E963C4079A5B4D0F23154C07B81C433749E3C40D71B83AE4C3254C06229762C0EB03C40D30B92270A2F54C09FC920DDE4B43C4028AA27A8423054C0C38E616CA4BC3C404858F061092954C0DD93D2D347A83C40141B4224752E54C0C5487F35CCC83C4001030000000100000008000000C04DC569122C54C042278982EE943C408C01F1C5D72954C03EBD4CF5D3993C407735E203FD2654C078F6B441D5923C405944542D6A2A54C03D552EC16A6D3C40CA5083F0B12A54C0676FA378454D3C401489A9AFC12654C073465F171B253C408D1E9A93252E54C0353DEAA3A9623C40C04DC569122C54C042278982EE943C4001030000000100000007000000CDA5DA35868654C00B9B202709963A40792C3BF5488454C09F9BD360607F3A40FA6C80B83C8654C05475A404737E3A4098D25077AF8854C06C2B226483A43A407FB7845ABB8B54C0BEACCF6CF5AE3A4057BFD4D43B8854C0E7489EC195B13A40CDA5DA35868654C00B9B202709963A40010300000001000000070000004A46770CF70F54C0080A6E31DD5A3940AC752E38C31654C0C41E6DFF81283940353597D69E2554C0B4ECD315D5F438400C948098981654C0C94B72F826363940B052E495231554C0828769709A4439400605FE78241754C0393A2E60E74B39404A46770CF70F54C0080A6E31DD5A3940');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('11',NULL,'GA','GEORGIA','N','929','0106000020E61000000200000001030000000100000055010000203BFD9E544855C0E2D243F462C73F405451637F6B4855C040038712A8C83F403A68ED20AD4855C0933FE3B4D9DA3F40D7B7179F5E4755C0E7605BFD4CE83F403910B4FA7B4455C066857E5B0FFB3F40D2F31BFAA04355C082D0BE6439024040679BE4FBF74355C02E08E5BC6606404022CFFC3BA04355C0AEB0B217EA08404092665BBBF44255C0D8A17372A20B40402B7EBD7D694355C0217CA4A9351040409AFE047B8F4155C0A859A48048154040C7FD0739804055C08137197EE5164040E864B5F3763D55C0A12BA01C91184040F5BA2396723E55C09C2923F72A1B40403CC6EE706A3B55C0D32FA1B7E61B404072C8B4CF9F3A55C0DC71A455411D40401B630F911D3B55C032763871AA1F4040E654246FF13955C08242B871F11F40400D76688E373955C0A52ED2AE2C214040D759092F413955C0379301EC65224040FA5E65D3F23A55C0B6CE3083852540403C3EF35D574055C05BE56916302A404003350F3E224055C023A381116D2C4040EC1726BC2F3E55C0BF9F816A8D2F40408911EEDD013F55C0B1914D468C314040456B483D243E55C071CA28C3CA32404041F073DEC83D55C08F244B39F8364040AA981D21593F55C029587E12383A4040CC1F01C4B83F55C018B9683F6C42404050657891874455C08664A886664A40401B802DB4624555C004760A3F2F4D4040ECA53C55864555C025B2491771504040EF5E46B8A44655C01D8ED730AD52404032056257CA4555C06A3DBF288C564040BA50311AE54655C06014EF0351584040178B479C494755C039E77B76005E40406854451EFE4755C05682F6F2475F4040E3BCB6FF874855C0BB8D9AEFCE604040DEB98B9F324855C00481B60A77634040045E2825634A55C055E10D625A674040E98F8FE9904B55C0B361A291976F4040EB0C14B6F14E55C0B38A66BA608F4040DAA17056F74E55C0A914EDD88A904040B1786907CE5255C06C8F651883B64040C2E827CB845355C054FA03C9CBBE40409294ED56755555C05CDDF284D4D34040C2568AA2935855C026C8E477E4F34040F64BA4C4535955C091AE7EAFDBFA4040D7B28F09A95A55C029FDFC34200B41409D202E53755D55C06FA8280324254140B6F2633FC26055C07E57AD26F2424140DED02044A76155C044E557FAD64A414011D35467386255C0573D44B3AD4F4140417FB3D2506555C01A8EDC96606E414018444C34F96655C010E302B3BD7E4140EBED0E9EE95D55C00B310D60BC7E41408F922752095755C083247E9AB77E41404D05A447225155C08662D1759C7E414069FAB73F423E55C0FBCBE67B0E7F4140E108255FF13D55C098D2EF3B107F4140AF2FE1073A3355C047C0C820157F4140B83BC5435A3155C0C4BDE521D17E4140FEE8CC87982755C0ECB9FCAD8F7E414050EA75B4B81455C0D18B1C859A7E414068BF02CF8F0755C0D357E6D7807E41402B8D8DD542FF54C0C011C4869C7E41403AB91C8A06FC54C0174EDE32A77E4140E94EDFAF27E354C00A2E9F25AC7E4140E9C5C526D3E054C0DD2155A6FD7E4140449D8446CBC654C068C32C040C804140769A65C76DC654C0F065C107F97D41405F5E7A0B65C754C0AEB6F52E337A4140AAA9940BC5C754C0F959708DFE7A41402B97C9EC25C854C0C74F10EF287A4140BE85B80C3DC754C0F3F347F3D2774140272EB96D0AC854C099575BD26B784140444F3BD0CDC854C029D65CD41977414081C815F2EBC954C01C1638F45477414032F5B57322CA54C0E75CE29675754140439762D7A8CB54C00CB7081890744140377D805C06CD54C02A7EBF7C2C714140ABB60F1E0BCE54C02DAD66BBD07141400A113441E6CE54C0E699555DD96F41400B2D14828ECF54C0808B34FC6470414052A2CE8215CF54C0ADCD089F626E4140F509CD0505D054C0A0408F40D26C414002F0DCE606D054C04ACEF1A17B6B4140E741F52823D154C0B251EEE26B6B41403450F78B49D154C099FA82865468414037D33E5160D354C0DA37EEA81B67414084E265F6A6D454C07058016CC46441404D0B1CFBB2D454C083DD54304960414067EBECDF6BD654C09D6C9DD61A5D4140DE403AA071D654C0287165BAD55A4140CF3E961EBFD554C0E60D13A2BE5641406F3DB31721D354C0B2A51065DB5441400BE9ABCC2ACF54C0392D5652814E41406A3D3B608DCA54C09A0CC0FAA94C41400B2FED3E2CCA54C01C314DA0D549414068F8E79ACAC854C0309662E3AF484140D3C8C274EBC654C0F762CE6B7B444140DF4101AF0EC554C061985CB06D424140C9D5F70885C354C024B09256BA3E414014FA063F82C054C01E9AF21A443C4140D0F29B7AD8BE54C0A81886DBFD3C4140D6FFDE6BECB954C01F0DAC9F2E3D41407770C8038EB754C0AF8075C4903A4140F5E9EE9C05B654C0077CE68BD2344140D0F2713988B554C0B16AA9717E2F41408C391BD3BFB354C0E86D24D7812B41406E458B8C1AB254C03F79459E2F254140F3204229E8B054C07E35CF80F62341406105E28783B054C0A33D162ADF1D4140EE4822A786AF54C08A988E944F1A414061E12C0817AF54C04CF883E1BB154140C960F54243AA54C06BF8869CDE0D41408A999BA196A654C05C2395F96E044140BE525F2227A654C03C141EC1B7014140AABE2C01B6A454C07C343F0F05FC4040AAB89B41E7A454C080296FF1C9FA4040BBD0AF591FA154C03C6E95FB2BF7404032B8D970399D54C0032808AC69F0404044D59D6C2B9B54C0084C12D31CEE4040F340B688FF9854C02331827754ED4040DBFC46C5679754C0C401025E02EB4040A82199E37B9654C0BC73661FEEEA4040C40AC05DE99354C07DA847AAE6E640406770557C8D9354C031B5C3CF2DE440400051D8B6099154C0B559FFF77BE140401EBF5792088F54C095FFB00B5DD84040257E0B90B58D54C0AE94384F22D7404024CB76CD4C8C54C03CD698FCD9CF4040011CB04AB28A54C0AA85605FBFCE4040EB2CC207E58854C0FAEDFE2305CC4040F0569D25738754C0FC19E3A321CC404093B24320348454C012F4F56774C940401A82AB7D778254C007EB7AAB14C64040B54EC1FB498154C0D869742CF5C44040D4D89C39C77F54C0C490D06E9FC24040BCD11E58C77E54C04ADFCD75D0BE4040BF0B39B4ED7B54C007685A5F4ABC404095C4CB32AA7A54C0D4F6AF46C5B94040B9F64974587B54C0E9D6808AD3B7404023E58CD3777A54C0996709322DB54040E3DE2D762E7C54C00461D3B13EB44040357AF275407B54C02726B71C33B04040F6027EF77B7C54C0C430EE5A46B04040D33C8717F37B54C037B77E23DBAC4040BD5D9295547A54C01260D245BCAC4040452723B65F7A54C012D9116B85AA4040D1E686D42E7954C019F22E0BE9AA4040FF6042B41E7854C0FD45B67446A740409CC3F812657754C0FEAE0FD367A840409C7B6F51C47554C0959E0AD777A74040C4574DF3157754C0E4A8EC1807A64040B733EF91E67454C0E9562F837CA24040A349DEF2BF7554C0867A37C1FBA240408DCC2A138E7554C0F38F30C55BA14040A173BC54A77654C0168179092B9F404087BFB691E37354C066754511FC9C404069E530D14C7354C01476EB579D9A404062239BCFE87154C0C0AA4CB6D29B4040A25AE5AE457154C0E9F8B877609B404089BD232E9D7054C0533B913E02994040EDE957AEDB7054C017732126BD9540403F97834C626F54C043FCEC6E85924040ED9B3AE9126D54C09BEACA75BC8F40405EA85D011A6754C08A229A803F8B4040F43E0800226654C0F0B5FDA50F8940405AD6F89CD76354C01CFE8FC8C88740400118CEDB0C6354C0F70BCC6D97854040591978FAE46154C0922A766D9F854040168E8D588F6054C0B80B7536A3814040AF8DC4F7885F54C071EBF2B89D804040C64EFD96DD5F54C0839C2EA9D67A40407192DB37A16054C02A0B782A4B7A40401B6BCDB7A76054C056EF878D3E794040B523DBF4875E54C0E34C85A1E3724040F7BA5D14C35D54C0EA3FE7C1E8724040CF6197D4EC5E54C01C7D09C923704040562957B3585D54C0DF73550C8A6F40408EE266F2235D54C0576AAF161B6C40406DF2DD50AB5B54C0D4A01639BC6B40404B8CEF2F225B54C03FCF787D776A4040F895EB2F8A5B54C012FD62C1FF6840404A2BEFEEEE5A54C0AABBEB859D674040EBD2B70E895B54C01EC441AEA064404093A656ECA05A54C070761E7ADC6040403196B60C135B54C078FA49DCF95F4040501BC98B165A54C07E342781F35E40402B3A900DEA5A54C041C442F2CC59404025FF016D0F5A54C0C828ECD9E55740405400790D915954C0CAF4A4EA4D53404010CED8EE5F5A54C0EC33F2F413504040CEF73F4EA25854C070DC4BE5454C40406034BFED705754C06012CB8A4F4B40400EAF0B0E785754C090B7974D7E4A404049C04ECD7E5654C0B1769D0EB14A4040B5905F2DC95554C052CAAA55224940405669E68B225354C0620A5ADC9C484040ED2EA32B8E5154C08B76202504474040434680AC265154C0D06C63D05744404076D4818D1E4F54C02C4F607AA342404029D9ED747D4C54C0EBE6EFB9763B4040983B4A9ACB4C54C00442EBEECC3540408097277E684B54C0AC96A2A083314040974B0EC0764B54C00FE5AD87962F404046CA0723144A54C030124BD85B2B40405B44CBA1144954C0E4CB07959A2C40406C17E7E2704854C03A76D93C932A40401E4CDB67F04754C09BBD98166923404004E129AB7B4954C0AD294EBEFC204040EA8270CB734954C09FDD21ACBA1C404019283789574754C073C62D5C65184040A5F83C899F4754C0A4CCD8F90D0F40400366EA48B64654C0E05F55417F0D4040EF827EA4433954C0C348A768C40040405C4051BE4E3E54C0E9296274ABF23F40268548D3223E54C034AC649DEBE33F4037F7D350F34854C02733166B45DD3F409D495618854B54C005E7D57AE8E73F40FAA496B7434D54C022F952516EE63F405118CA9AA04C54C007AB0A497EEB3F40ABB039DC0C4D54C016FAB3BFADED3F4044FF3BF8564F54C0413C933F46E73F4043E5F7E0315254C08E5BACB60DF33F401527E636AD4F54C0968404830AE53F40D131FF1A374D54C0A4EBB4C3AFEB3F40C8629536164E54C04A364DD0A4E43F4085FA0537894B54C0050B18E0CDE53F40439D10CF0D4954C0EB8E2E1280DA3F4028D2F0277F4254C0FCAEF4B8C7D23F40B370C11FE84354C08FF3770E0DC73F40A2F2B2B9C14854C03497968221BA3F4075A84806234B54C0FAAD1468C0CC3F40CAD44944914C54C0E10D3987EBC83F40DF9A151C364B54C0F6803C8E5DBC3F4044EB02EC8A5254C0B69639DBB6CC3F408588C5CEA24854C0BEC010DA64A53F4034D5C1EAFA4B54C0D46DECEE92993F40E345DFF1674F54C09B797D6AE2A33F40D4CE53274E4F54C0B0C911E48F8E3F4060D7B31E774C54C0E065D9A651813F40D290343D594D54C098E5FE9486773F40D418CF45095454C0D363C1CA6C563F4098A8FAAE655754C01CAD74BF34583F40AF3A0015435A54C08EB4E12ABD4F3F40CCF91BF0435954C0758CBA669B433F4094E7C750E25854C09C06B2F5114C3F40F7C61EE1405354C0D6BF07119C463F40AD6E4721DB5354C09CF60B41213E3F40D74C5067625854C0B58E335021263F4045AC551CD16154C0C4FDFD9C91213F40A16DF1D89D6154C049DC5A0B28163F40A71FDCEE6B5E54C0AAFF0101380B3F409443B979446254C0131D634DA6133F40AE23372D6A5F54C0051A742F5EFC3E40F48167F1D36154C06265676E4DF63E4098F16C69075F54C0B8AA70F9E4F13E400894368BDF6154C01F5D072362DD3E405C85517EE55F54C04690727EECC13E405D331D82D46154C0407D491FB1B83E407502EC82576254C07172EA3FE2B43E4037D93891796654C0BB3CD63392B93E403D989291B46654C0DCCEB9D460B73E40FE313FD7306854C0328EDE8E55BB3E402D721B5A1E6954C01874ED0CA5BA3E405E215F8ADF6D54C0DECACC7ED0BE3E4069AFE4AE256F54C0F103E7378EC33E40FF43DB527E7054C0C3B7C69406C53E40F67B1F95B57154C05C4AFA35F7C23E40ACC24D99677354C0213E2EF0BFC93E403D62DF42DF7754C09B8B6DCB90CC3E4009932F878B7954C09AA524030CD43E40F319D7C7147A54C0C9E13DE73FD03E4020DF1C4D677C54C0D1B6FF0202D33E40F879536EFE7C54C0F1429BC307D23E401BCAB70E8A7D54C0DB31F129C7CB3E40E35BE390D07E54C081B0470F42C73E40E6962B96FE8054C0226B8DE593CA3E40A5F8F274D48054C0E3473B4FA6C33E4024AB6F570A8254C0F4672AABEDC13E40BB7500D5DF8254C0A4AA3416A2A63E4082A896AFDF8054C0505E13C843993E404FC3DD0D5F8054C0325F7C6F2C923E40BF119FCB708154C0F03423B74B7A3E40C780B96A3F8254C02930207960713E401F89464BF38254C0928835171F6F3E40AD6C6A67748254C038C7DBE3FF603E40C9491B88608354C02C6478A2215D3E4032B9DD72898A54C0D8FAEA9E7D5C3E40B87E89F4888B54C0211E38985E5E3E40ED1C4CF9278D54C058954AA4816C3E402FAF817BBF8C54C087BF1397717D3E406050E21D0A8E54C04EB745ADC2803E408028DEE1418F54C06E39F9C20C883E40DD721783258E54C0DE1EBBE42B913E40FA04D5B95F9A54C0DA80E66CCA933E40CD7B9700A49D54C06BFB83292B953E4044B6622D4FA554C05E155C3ACC963E40D7239E1891AC54C040A82B1D81983E40853A4FE779C854C059DE253B109F3E409D8AA1C048D354C017B63EF61EA23E401A0905E2E0D354C05076AFB261A23E40ABF243C6FAE654C0B34FE1D199A63E4050F6DCD538EF54C06D162EF315A93E40A26568F60B0055C0E6944709F0AC3E4025BAE002D60455C0D0CD8D42B7AD3E40B6C571C5061255C0D33A354FBFB03E40265063F5F61755C05497BE01B0B13E40368DE8733B3755C0ACE9BF2E71B63E40E06E2E54553755C0D1B1B1AEE9B63E400D483EB9D93855C00E5284886FBE3E40B2327EFC943A55C0C3B535070CC13E40E91CA93E523B55C0EA4E71BFADC63E4077DAAF20AF3B55C0AD6FB0D578CD3E40305B55C2523B55C0784EF9E3CFD83E401C784986043C55C0CCCCFAF11BE53E408AA3184C043E55C053DE910456ED3E402A1BFFEE4E3E55C0D81D59B5B2F63E40AAC69B53024055C0CF50F5ADB4FA3E402500FE541A4055C0CA1B4E2452003F407E1A0375164155C0788A289E81143F40C8B4A2B56F4255C0FF0C774670203F407F7C52F7644455C0F62D9FB190293F40D0F624B9F94555C0BBE0BB09162C3F40424974D9964655C0A1E0EC7B69323F4002069A98FD4555C0B506E28D213A3F40E8A2E7789D4655C08ABA19D77C453F40E9A737D7324555C03B8F74AC964D3F40B23A39B7484555C021B5BDDF13553F401D8862D7A04555C0FFD6AD0F035E3F4023DDA514EE4355C015BD9551CF703F403DEDCE743E4455C054E19801E1793F4040774A92BB4255C0BD2CE46E08853F40A75854F2BB4255C07145D47DEC8D3F409659B154CB4355C08CD5CC3B0B9F3F40E5A656FB1D4755C00F9B507D2AAF3F40F1F48F5C984755C03139BAF264B53F40E5E27FDC604755C0108C1DE847BB3F40203BFD9E544855C0E2D243F462C73F4001030000000100000008000000A5628D260B5F54C03D83B4E164E73E40ECA5AD61A65A54C009CDC03E79F83E40FE0D7D9DCB5954C098D4356755F03E4096570A762A5D54C0597491C967B73E40CBB35E7AAF5E54C0D8ACB463A4BC3E40EDBA8BA1125E54C05EB284EC39DC3E4053EDB327366054C0570B4163B9E13E40A5628D260B5F54C03D83B4E164E73E40');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('12','HI-EHW','HI','HAWAII','F','930','0106000020E61000000700000001030000000100000009000000196543995C0264C0DFF087C311013640645ACB38970164C05A5DA452F8FC354074C1B81EE00264C026AF737276EA354026558DC4710564C0678EACCB1ADE3540785453E9780664C05874FE5899CB354017D094CAC10764C020BDD1C9A3CD35405C62F1253E0764C015BCB05E3FE4354002F6CB1DE70364C0F270244FC7F63540196543995C0264C0DFF087C3110136400103000000010000000D000000B88554C0B9EA63C09CF8CCA0C6F2354071B916C110EE63C02B5EEBF139DE3540367E2EC46EF263C00AA23EBF56E23540E10245E77CF463C0DF052219C8F23540F40AC92A92F763C01DEE953FE4F63540ED972E45A0F963C03D34D5FB62093640874133D9CCF663C07ADA84BF282636404810EEB16EF263C028CC6AF092363640A4A0D01386EC63C073159399A73A3640F108DC75FBEA63C00864E1AE6F3236406B9F88D970E963C0E6641AB6F31F3640846205DA77EA63C0536AC77F6D0B3640B88554C0B9EA63C09CF8CCA0C6F235400103000000010000001400000029FE1CEB8BB563C0146832824B4C3540D097CBCACDB563C028F67E1D214635408FF4968A16B763C0ED9768432F483540E8A87A8A6DBA63C08CAD9310F73F35408F9FAA84BDBC63C0F133D15584543540BB355C2448BE63C0E52F5E035A4E35400EF0E4A329C363C0E2AE1EF63D4A35405F3769C030C463C0146A5BF7AE5A35401EF115BB87C763C0E9BDC9D48279354035BECE76C9C763C0C556CAF8F3893540D2422CCD8EC863C08390476B4896354094EF4736ADC363C0A6C5156F3A94354032D3C5315DC163C0FDC7C9C6E3AC3540A284AFD190BF63C025DDDA070EB3354002F0EAF540BD63C0BDA2BF059DA235403B6142DD32BB63C0763DE4F1BA81354020806F01EAB963C007F018BB3B6F3540E03AFB605FB863C09982C5FE657535404471DFC4D4B663C09020D6DCE662354029FE1CEB8BB563C0146832824B4C3540010300000001000000100000000BBD12D0F89663C063D652F12D233540A5FB7A77839863C06DD8916DAF103540E235DC135E9C63C0F62C470D940C35400DF16DB646A263C013373FF8F61A35407D14DD7436A963C0120378D6CC1435403168D3F2B9A963C0DC7CF3D12F2335401A60388CEDA763C065958A0F5A2935407C90E9096AA763C06563F7C3D83B3540D82520ED5BA563C09256176C92313540AC413C8E38A063C0C8CCD72D842F354015B197F1C29F63C021EDF70E073235404308CDF1AD9E63C0B1D75679AE353540DAD70CE52F9E63C046D1133A3B2C3540702C067A419D63C03B630EEBD82A35409DDFFE79209D63C0049E60A6752835400BBD12D0F89663C063D652F12D2335400103000000010000000A0000007D0D28E73FA163C0464A1FBDBFED34403680F384239D63C08809AD80C0ED344011C11D6FCC9963C06B4CC0AC25D734401D1604230E9A63C04BB92613D1CA34406AEF601A5E9C63C05B9A8ABB6DBC3440BFB45CBEEF9E63C0DD7C48915FBA34403A174E27B59F63C0003B8B0DD0CA3440F8A43450739F63C0D1FAA3B316D5344004E94B5DC3A163C0B86232F76AE134407D0D28E73FA163C0464A1FBDBFED34400103000000010000001400000085661401468663C0D463F0C6B3A134403F799797D78863C0A2CB8D325F9534405F39830DB28C63C0E589FDE442913440719934EAFA8D63C0943FA2A3A59F344099F62C48C08E63C0C80C88F75CBA3440B7ADA444C78F63C0FD5984E6CDCA34407C23CA62CE9063C06F7353BEB1C6344088C7021C679463C00220BC2FEACE344091CAA477339663C02B3763BAA1E9344025DF0F96EA9463C08F70462259043540E52CAB391E9363C066310437830A35407B47A95ECE9063C0C880287320FC3440C66CBFC3438F63C0C196ED4A85E53440A63EC34B698B63C01C774E96D9F13440181BDF13548863C01B184B66BDED3440F045C1535D8063C059750391DBCC34401F55F619987F63C04C3DC91C87C0344065FB5572648163C09069A617DEA73440892849C7378463C052A350C0A59F344085661401468663C0D463F0C6B3A134400103000000010000001E000000B5D68F72517563C04C0C9E30FAEB3240A299DE2CEA7863C008E0716F95023340A65418CB7B7B63C0D158C4F8950233409C5FE665067D63C0B02E175269213340F7CA0A67FF7B63C03C892C5B115F334091D9E4484F7E63C07A407A0DD77B33403A20E68C147F63C05F2A1B2BD5A033405170D28D648163C0FDBA6E69E1C733408A97F86E567F63C04C8FABFA27D233407528A032417C63C0756A7888EDEE33404F8709D5747A63C078E411926C013440BC527F92B67A63C01695ED55CF0F3440AE3D17E6827C63C0544C3B08952C3440051CB5C37B7B63C0F907B4253E45344070584351A17763C01C338A3ECD343440A6CA627AFA7163C02FA60F484E223440B62947E86A6663C0EFA08D0C5EFF334011CB99F2136363C01CE8AD958AE03340B60134B14E6263C0663FB06F7EB9334017047273395F63C00770A2CE9ABD334031154072395F63C08D382073FFA63340950092A8505963C0976DAED83A8A33400CB00A04165A63C0099FF25AAD7533404F7116C0AE5D63C02FFD8F92656B334037695C1A826063C062359147CA5433407C208C3BE06463C047AC6B95594433401BEA9FBBC16963C06C25C5FD203C334054F09B97B17063C0FF1218265B1F33409E042315357163C0449EF850CE0A3340B5D68F72517563C04C0C9E30FAEB3240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('13',NULL,'ID','IDAHO','P','931','0106000020E61000000100000001030000000100000070010000339437D2AE415DC0ACC7CD7EEAD6454020525ED985415DC06729094B79E0454053E4452160425DC060A7620D6BE64540FFF624A2C4415DC0F09DCFD070EA45405574B21EAC405DC0F4141F937DEB45402DD473C109415DC01C9A9C332EED4540461AB9DA163F5DC02F2FB635FFED4540122279FA993E5DC0FFE41DD7CDEF45409C1E93DD993E5DC09C0428B9C4F3454056490EFC6B3D5DC09BD3E59BDBF645402D434201F33D5DC027B75BFE49FB45407D32CBFEBF3B5DC05788F063D1014640469BAC2E843E5DC09BF5BE6275094640C37EB40DA93D5DC01FE7E3E38E0B4640105FA1CA993C5DC05918FA44E80B464087B12888BE395DC0C6454569BA1246408249D56D6F3A5DC083C97DE9B1164640DD667AFCD63E5DC0E7009BE552194640B8804EDE783E5DC01B1F8DC6D21C464035206083883F5DC0B3F908C69F1F46406DD88F49F1415DC0F596B142EA1F4640BF56906B54435DC0089C3CA0A31D4640ED0D407135455DC05FD35C5D361F464066CE0E966F465DC08556C09B2F22464068FC425836475DC0E249AAFA882246404362877B2B495DC0DB8291B714204640B883DE1FED4A5DC06894F1346D204640DA3B5329AB4D5DC0820C03B271244640890A62CBEA4D5DC051060C327C2646408FF22B0CE74C5DC0724D2DB4722B4640DE162FB6294F5DC0580BB6F3EA31464012F15AF6E64D5DC0B5E2FDF5C336464000CA4DBB5C4E5DC0E85FD3D68A3C46401A380EB90D4D5DC039F2FA372E3E4640E1556737FE4B5DC0FBECACD88241464087E2DB4F4A495DC0B27F3D986F444640DE769C4F36495DC0F44F26B7964746403AB8292D5A485DC086BA737648494640C8FE742214455DC0479DD72C3C5846409704EDBF41445DC0C4B9078C49594640DF630B5A88425DC0D97A2606E35F4640E8DF7647E53C5DC0972D701E556346404E08143A373A5DC05CF7DEB61A6A464051D559756E395DC0497BED739D6C4640EE25CE2D7E375DC00317918F2E6F4640ADA5742177355DC00917DF47C77546407CBADB5E3E365DC00BEAB385387A464032D5C59935355DC0E70AAB427F7C464017A2C23C48365DC0671A7004627C46404C01D4DCC6365DC0CFD637846F7D4640E321E43847365DC09833AC61018046408D501F58B0365DC066027D432B824640A4EC63ECAA335DC0F7C996615E864640A73419A661325DC0F9013542B289464021831842CC315DC0927FB7C3BB8C464035937F9EB8305DC00DCE40439B8D46405080A136242F5DC01790254793914640C8DFA884152C5DC012B73EB694A146402CFCDE65062B5DC0271A48B9EEAA4640BB19B59B35245DC03F5017D0DCBA464016DF76FB7C235DC0D1E9F2D42FBF4640861E5C95A01E5DC0B539B99A74C8464097C45C571B1E5DC0EDF7A7D699CD46400CE5615EF4205DC04E3C73090ED5464069BEA441CF215DC0514A9222F9DA464005529064E1235DC0CAD8D19BABDF46402286D3A7E1295DC014DB3FB0EBE346407A77E1E7002D5DC00AAEA089DAE84640940AEC6A84315DC08BFDCF03EEE8464072AA680BA4325DC07487B85F45EC46400CB31D6FD0365DC00BCCDB13A9F3464060AE820F7C395DC0F258B98B81FD4640AA7FC510D33A5DC0F65504E961FF4640C9B2F5564B3D5DC009351E74680847403574547A2E3F5DC0F20A7B940C0A4740D283C7788B3D5DC0E53B207B730C474074D66BB87B3B5DC02CF5638E2E154740398A495DEB3D5DC0219B65724919474056ACAA1F413E5DC08D428E5EE91F4740BBC4CEE81A405DC045FC15A4B6264740E73CB751CA415DC0B4153745EF2A4740405AF9991B445DC088E67522A22C4740E192EA9AD8425DC07D50A0CABC314740AEC045BE77425DC0CFA13511C8364740D4C41DEBAE425DC021B6F05DAF4447408E3A023A9F425DC0AF9123D9458F4740FB9FB28CB6425DC0CF88D19116A14740EF43DFC3AC425DC0F28127B943AE474044AB59F065425DC003DD89C14CFC47406C800DD27C425DC0DD14286CE9054840B41D66F7DC415DC0E3A3FE0C466B4840C27174190D425DC054DDB8BFFD7F48409EE39CE510045DC0ECBE8260FE7F4840D26846D8A0035DC0553AFB42D43F484086F151458D035DC0250BD898AF1A4840ED4EA46B6C035DC0D63C42DAF3FC4740D9BF5EC79E015DC0DEC27C2083FB4740B0C0EB81EEFF5CC02097BB036BF647408BBA999B05FC5CC02E1275ECFDEE474038C649D8D9F95CC06FCE0451A8EB4740348598F5AAF75CC02F4FA5F6E9E947405151FE525BF65CC07BC3053810E747408189A72E8DF55CC03D35C3D4CDE04740CB9BC32A98F25CC015E188DD56DF474030CCD383A5F15CC052F7DE84D8DA4740E55F515FF4EE5CC095AFFAED07D947404422DCF5FAEE5CC0588F7694E7D14740F55CEAAFB0EC5CC024A0B0BBDBCE474076C10B2B4BEC5CC0DE1361BE9CCB4740525344848AEF5CC0722F050150C44740A4F64ABFE5EC5CC07558A5A4ACC24740C65C2B5A56EC5CC0E8873744A9BE47409C815E15F8E85CC0191C9A81D4BC4740981F6BF429E95CC0B72DABFC98BA47403DBFF354FDE95CC00984D6B97EB947409E9B35FAE0EE5CC03626E8B6FFB8474019E0CFBA01F05CC0ABAB25338CB74740982EF45905F05CC0901D08B013B64740F7057C92A7EA5CC0A196E1EB17B3474064933DCFE1E85CC07C77EC46A5B04740DFD4C8CB5EE65CC0015C13455CAF47404B50A9A68DE35CC0D19F869BD4AA47403ED8B0E179E15CC01E646EAF5FA54740CC9B969F1FE05CC0A86494EC0CA44740AAE741164EDB5CC0F6D976B11EA347406E937E1320DA5CC0FEA14E70BDA14740D7380A8BFED55CC023D7FD93A4A047401B847E88D0D45CC000909012619F47406A241F82F5D25CC0E9D9D77FFB964740227744515BCC5CC09F991419E08F4740385FFD2C0ACB5CC03CEE01337D8C47404E3E320984C95CC09E1AA133BE8B47409930CF25ACC85CC04379316C228847406FBA179C34C55CC0174EAF26658347409E2853948FC35CC09DB29DFF967C4740479D8CB063C25CC03A4D52A0437B47400259DCCA19C05CC0C7E1DA43BA7A47401A33DA23BEBD5CC0C13DA4606D76474098C22DDE24BB5CC093E04FFF1D7447404DBE043E32BC5CC01E1FB99D08724740BF2705BBB2BC5CC091E21AFA1C6D474083E72DB1BFB95CC0C4964DD653664740EEA35D6D76B75CC033AEA6960566474060A7E188CFB55CC0DFC33DD5446347402F594163D1B25CC04D86B8B51D62474042EFA300C8B15CC042295155BB604740E1B05F5A1BB25CC023819237FD5947406406C6F5E0AF5CC0B44A2619FA5847406F7AFE18B3AC5CC0934080DAEB5D47407969E0F720AB5CC06236015C0B5E4740C1D3FF2E0FA85CC0DA1E9221F35747407F368C4D48A95CC098E728C1E05547408CA5F56B43A95CC09AE2B9E1955447403CF4FAC517A75CC065B984A5845047400FC6BEC395A25CC099FE1E69A6514740502ECF9E059F5CC0722B8D4CD14F47403FD7CB1F429C5CC05923F0CEA6524740C4E80FBF93985CC05771CF32AF544740C858797B6B955CC0D49B33B6BD53474014938916C8945CC051A68636B94F47405A997FF2F8955CC077F73CB53F4B4740ADE8AA4868965CC0A4707CD439424740E48B95E711975CC01C1CB9B3C84047406DB84827499A5CC0DC87E531623E4740610B0CDD93985CC0797A2791CE364740A0549BB968995CC0471CC24F2433474038ED5A193A9A5CC0E04542EF4A3247402ED0E38AA29B5CC03A1C0E6C71244740BFDE23A9529E5CC0A6DB6E0A612047404A24F4E7429E5CC0C329E649341F4740D6F854A3219C5CC0FC033449311C474013D02E5E379C5CC06EED72C6A01547404704059FE39D5CC03A6A90A5DF1347404312D6829DA05CC06796B84426144740F875E96136A15CC03FFF19836A1147407419CA9E6BA05CC0DE988DC2DD0E47406A8A1C3B8D9E5CC019B79EE2BD0D47400763EC962F9D5CC019ABE481860A4740BFE0A3F4CE9D5CC0AB54CF1F810647402CACC9F4A29F5CC046CFEB1DFF024740DFA38BB15E9E5CC0D952D2FD3F0147409FAB3051019F5CC0F16821FCB1FE46408B616889659A5CC0C2E43E9C69FC46402527EA47F0995CC0B0CD62FB1BFA4640FB4020497C9B5CC063513EF8F2F5464001A70847779A5CC00713CD3790F44640D307374324995CC00951833579EF4640F395B7E3149A5CC0509C819358EC46402E9815E85D9C5CC0F0F903B322ED4640093D09CB529E5CC0545C19B173EB464056DFD14DF29F5CC01D0C3610DDEB464053A744AF1CA15CC093011E4DB0E74640B2B11B1411A45CC0BBED374896E14640C7BA8570AFA25CC0219CAAE77CDF4640F12A2E0F3DA25CC00BB892268BDC4640F5DF9809D89F5CC0E29DE225E2D846401DAE0C6BAFA05CC006E4578447D64640A40355891CA05CC0D2856BA381D34640F29A19B123A45CC07CA88F20E8CF4640A2FF750D9FA25CC0EB87B2BF56CC46404DB41D2FE6A35CC0C353931C3DC64640F458F0CAC0A15CC038E799DD72C74640B766BB26C89F5CC0830F7E9DF8C54640F4B540029D9D5CC06AE236DF1FC646401F0A005EBF9B5CC02EB71F7F89C346401FA96ABBD19A5CC035597A7EDFBF464077E875F4C5975CC014A9F4C02CBE46407288FF706A965CC040B29D2250BB464014A7A34DE4945CC06BCD64E48CBA46406641B485C8905CC01BD2B6A630BE46408B086144DD8F5CC02279F98660C046401FBBE3E47C8F5CC04083DD6884C446405D521FBF778C5CC0D40DAACB92C3464017F746FD0C8B5CC02DCDC94D9FC546404824CF7873885CC077CB97F072C64640412619988F875CC0F5962EB21AC9464077C4C6544F855CC0B0373C750ECB4640049D8EF39D835CC05C3DEBB704D04640F9ED027027815CC0EB2CF1DA04D246405039CC0FB4805CC014FCB47B85D34640A21EADB145815CC03D1CC97B10D64640E19938319B805CC0691E7EBCD9D74640BB74BA4D277E5CC0CAD5F89E43D94640DC63218CB47D5CC083DDD2DEF5D64640AC35DF074F7B5CC05686F940EAD5464089D2BB261B7B5CC03DDBC020DBD34640632ACAA3BD795CC0BAD1768191D146400810C2C2CF795CC02B2FB5E086CE46402669319D87765CC0B644D32306CE4640D6849699A3745CC0E8AF71A5E1CC4640CFFDC1B670735CC042FE13A6B7CA464097C037965B755CC03049B482E8C14640CC3CA7D0FA715CC0D2D8D3A528C2464010C7236F6D715CC03A577D26E7C0464093073E0C3A715CC0C17EE38625BD4640CB67034B48725CC00E7533860AB9464095787A069A715CC02D858F8780B446407394629F716F5CC0E90B530AF2B0464087904F194D6F5CC03B6EA6EB27A946403B079DCE136C5CC0975783908EA34640F03F5FED2A6C5CC0F473CC7092A146400E00C46351695CC0A9A7121A789A464084B5199C75665CC071415AC02A97464083B1B2B805665CC016D99DC42A9346404F818ED494645CC08DF81DC838914640860F6693C2645CC0002F9329118F4640B678846F58635CC0E37F3D2CC48D4640F1CE9589A7605CC0D9FFCF8FCD8D4640C8B3B2A851615CC078018C11818A4640C1180EC35E5F5CC007DECAB31D894640B28B31A11F5F5CC0043D0E157787464024187BDA255D5CC0A25B42758C854640FAAC6FD95D5D5CC0AFE51D778383464082E16DD3395C5CC06897B1D8C47F4640ADA42D90B85C5CC0952556F589794640112F4892A85D5CC025C9CE546B784640FDB6A4B6305F5CC0661389F543784640675A9397C15F5CC07C030F3520774640ACC81746845C5CC0FB0E326DF56C46405EF3F9DEF75A5CC000918CABB66A4640E8DCFCCB66565CC0742AE3685E67464032DC37E6CC555CC0A4742147B6634640C34F254165545CC00B8D1287DE63464004D20C3775505CC005B54C08BE67464048820BB4614F5CC0547EED66EA674640B6C1D47AD9485CC05A6239D7766146404146BBD527485CC0CC1E6C72625E4640DD516B4E82465CC08A0450CA8A5B464073AA864B55465CC05434EBC51359464052F1FF63AE445CC00BFA019F775646406E6A6E7979435CC0599270B3E84F4640CA40E37950455CC05B8F8B4D954A46408DCBEFCC89425CC067EE87A5344746403BBD41A96B425CC05C44250138444640335CFA5E7E405CC01CF674BB5B414640E989A2BE4C415CC06F627BD6AA3D46401761DB186D405CC01088D54FEF394640958D8BD8C4405CC0B752F30C073846405C958D540E3F5CC088C765CABF374640805CD7CC0C3C5CC04AF567E01E3446404C4AC3A5C9385CC030A9C3F948324640332EB6E0BA375CC0E858E8745B2F4640A3A7589B08365CC06A92CB10442D46409F268D3950345CC0069159309E2E46401E934CBE65345CC0CE223C7489324640A51D2383E8345CC065788118E635464072B9DE65F5325CC03BDBE919A03A464044412C47E9315CC043F16579A93C46408CF56224F52E5CC0D1BEA535FE3D4640D8A3DA83B72D5CC0587CE1949B3F4640E6FE53D9CD295CC01E92FCED8A3D46402578574A84225CC0CCC26CA31E3D4640F2698E231E205CC052E0487F433B46401A0C0263581D5CC0BE6DEEC5023C464075A94B9FED1A5CC010D0AF2A82394640D049A37D86175CC0AB0650B281394640B7F8CE03CC155CC061D5319AA33F4640B08F2AA4EB155CC00ABBA57B36434640961F49E111125CC00F3DFE84564546408C095D5F6D105CC08F738428AD4746409ED183D9BE0E5CC0F7F680699D474640E484E5D6EF0D5CC0824AAC69ED444640BBC60132C70C5CC05000F58906444640665302BDF2075CC0F7B2C3CA9D4346403B1773B664065CC0BB37026B554246402B31F7AACC035CC0F6DE3F8BA94346409827DCA1BB015CC00693C98BEC424640B631DFE082015CC0657CA54B7C44464075273F9394FE5BC05840F86DCC434640A6C059482FFC5BC0FFF345715D464640A2221E14D7F75BC02F5842B83347464038912C9BB3F35BC0F8003F7A824046405C04BB17BAF25BC0A482BAFC5C4246401593AF2F15F15BC0B5CDACDE684246403700624AE3ED5BC03164B7445244464046574CCAD4EB5BC05ADA280A7F464640B2738964BCE65BC0D770DCB080454640CE9F92824DE45BC0D914EC55C4464640F5FFA81B60DF5BC06ADA735AAC434640CE253F7AE2DE5BC01B74635CA044464034E8F49565DD5BC0928D7C9FDA4446408740DDF69EDD5BC06CBF9F806446464028E499BC8BDF5BC03F7D715D8D46464091DD5200EEE05BC07614C7E0ED4B46406065EC9F1CE05BC016990225D84E4640F9F41B017EE05BC028FCB4C79F514640E3C3D63A17DE5BC0DCEECFCB025246408FC3CD3854DD5BC00D09D2EE865346404359DAF97BDD5BC0965DF250C35546402DF4117EC5DE5BC0863A8951805846405167795D6DDE5BC0218DE173E0594640FF78E27764DC5BC0425F4C78495B4640999F980E49D95BC05E84973CBC5A4640D04C752DA3D85BC02DF717C16C5E464030BE64EBD3D75BC04F8AFE025F5F4640181AB10666D65BC0D640F562F35C46403C8C0A216ED45BC0CF8E2EA62A5D46403A45A6BF30D45BC0E8F408C4435A464019FD383BECD25BC0156D6F836A57464068D72B164BD15BC0A3DEA2243F564640AB74349552D15BC088B3610134524640172E008C55CE5BC023C48C863E5046404C6CAF2A11CE5BC079F1FE051A4F46403A2927ADFDCE5BC0CB3C16C2204D4640FC3B41690CCE5BC0399FE5A15D4946407F05BEE070CB5BC0A8709A084D484640AA772D3EE5CA5BC07789A0A8C845464030CE2E5699C85BC0C183814E9243464027FFE33340C85BC0751DC8CD18404640D8765A6D0EC65BC0E8C05453393E46404410F9C44CC35BC0460525DB953C4640BDB6B7D639C35BC07B071C4FC4FD45408B3F9C4CFEC25BC098B96CD4FCC145402FC3F1350AC35BC0D28B292F72A4454053AA7D5926C35BC0EA9F97878B824540281ADA72FEC25BC015C7CC8E6A404540BC87CDDB1DC35BC0BD512E9783FF4440A4DB434DA7DF5BC00D7BFC9905004540BC7F3BD46E065CC0533AE7624B00454003A3535B6A095CC0B689CA00E1FF4440FC213E34553F5CC0413ADD9325004540766C922A80825CC033CCEAF768FF4440CD21F3053F915CC015942F727AFF4440AC0D965A97C15CC0B048D0858DFF44405F5D5392A4FC5CC0F11816094FFF444046DBD00F823F5DC0F70C386D55FF4440D746DE1235415DC08E8F9C6A55FF4440339437D2AE415DC0ACC7CD7EEAD64540');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('14','ACES','IL','ILLINOIS','F','932','0106000020E610000001000000010300000001000000460100001D3D72F4940456C0550A7FB669C14240EDD1B753A00556C076521A1CF8BC4240AD88B496F31356C077EF0C0EB1B84240FD21875DFD1656C0950B64F165B442408EC93C89DF1A56C07540BDCECDB54240C8F50891EE1D56C07F27A6B04DB34240AAC61535BA2056C02DFE280201A64240EFE41211182056C0458905C900A1424078834EE8D81C56C0AFA4C22D559A4240C03318240B1B56C042813471179442406131442CD51C56C033A29A18A38C4240700B3893841E56C0768301DD3D89424067266156681F56C02D36B4FEBB88424074116DBB1B2156C0C80F113E4C884240DBD7EEE1CB2356C0BC19E9D9538942400C5F922A502756C08B2F2B12F78D4240C2A8C7170F2C56C0E1DBC3EB56914240630A4C814E2F56C02ACB5708149242404E33E6A2C72F56C05F973C077A9342409741CB1F413756C096E3933FE39942406915C630AF3B56C01443027BF69B42400EDAEE3E913F56C019B0F4D72B9C4240ACB73CAA2A4456C082C55DF3CB9742407520552D7B4756C0828E00325C8E42402CE4D6F05E4956C0F0E1CB2FEF8B4240E6A10212DB4A56C015FCC78E3A884240556D366F294B56C06F30F32F4C834240B01D00C99E4956C0A5962593CE7F4240ED1068C5504856C097F26A367C7E42401993F6AE634C56C013514F31507E4240CDEE32B5724D56C05BE89B0CB78342407A3AEF5A374F56C0133A942959854240FD954483E75056C0FE1ACC86288B4240F5D6DC25325256C075DA5986AF8B424061736F676A5356C0DF432586EF8A42403AE3FC64D35356C0E1A75086CD8742403B08C89CEA5056C0CD7248688E834240561F85DAC55056C0805716491E8142407C665A1B1A5256C07CE042A8E77F4240C278E45EE85356C043B5CBE63E8142404A3CE28A835856C0253F3E444E864240CC3DEA11535856C02608FA64B08C4240F84FC6DC205B56C01E605785919142407E5689E3325C56C0FA3EB6C52A9542406E5E6DB1F85D56C077EC1768B69C4240FAC5A615C95D56C030721BE97BA04240E663E1F9565F56C04FEB8449C6A04240E6017CFEE46056C0C70D84C962A34240EABE8601E56056C0F545EAA70AA74240C4637F030B6056C0D9C44BC52CAA4240C5D1EA5E015E56C0EBF9946473AB4240F536C29AE45B56C02C4216C389AD4240F73885DE5E5B56C000B0B3E09DB44240503FADA7095D56C085207E9E03BA42400BCCDD13AC5F56C0992FC87BF2BE42404CB9F8B69A6156C0F4C9218137C942400E4A8696DC6056C0B2358F63D8CE4240EDB133D73B6156C02324E02541D342405DAAAEB6DC6056C00429C2A706D742409EE2D137626156C0F9C618C9F0D84240267E24E0376556C0B4FDE54C63DA4240DEC79AEFA86A56C0356728B46CDF4240BE4EAAEF426B56C065F18AD35AE4424006FCF4F03B6C56C0B2A83A3305E742400B07FB94A06E56C075135352A7EB4240C3575C41847656C0A6DC74D4DAF34240875964221D7756C094F003B5E8F34240AC7DDCA37B7756C0A316C5B62AF2424075659A68A47956C058F6F9591FF0424085AB29ED077C56C068DD697C65F0424058B9BE50A87E56C006E33F5CBAF44240285BFF6B557D56C0A5FB6E165AFB4240A911ADF2B28056C03BBAF15814FC424062179DB6B08256C04C4DD21823FF4240C9EE7D20A58756C099573B3C2304434023A7B701A18856C061787B9CE9064340DC21020B4A8D56C009038601630B43407CA23F70449056C09DDDEB04A50F43406F9FB7518B9256C0C1FEB6055C15434034A3EDB58E9556C0CBD9B2862918434089ED3D575A9756C0F22DEB48FF1D43403E0C8854A59756C0180F59276C294340FE39B2B1F69656C049CE3FE5C42E4340E3BD580EBE9556C0BDCCCF0309324340F8DD0648539356C07D60A160B536434004EAA97F049156C045E74F1A66424340C87080DEB99056C0231BD67833444340450AC97A6D8F56C061EC42B50B4843407556ADB0C38B56C0A393740D1F4E43400B10158FC18B56C091D74749545443401E944650F38C56C032609727A75943401D16AF6E968C56C002323385AC5C43409132CBE8768A56C06447177EF66243405920E184A88856C087AA3F5B8C644340F21FFC22CC8756C0AA54E8B87866434038CBF1213F8756C0CA3B7F554E6A4340BFEDDFC4818856C01B4BF7B4316D4340FE8902549E8F56C0895403351075434052418ED7DB9156C037468BB55E76434029009F7B789456C0855CE9F66476434064B4CCA3719A56C0617FCA352F7B4340ADCF48C9139E56C057760EF8C77A43402F338973F4A156C0CB8E9BE2217243406AB7E83982A456C089D61047896F434045981B4126A856C0E22A2889BF7043402A6D5EE4D0AA56C01CD1CF05B8774340688DAE4632AD56C04AC631FFD78443403C2BFF264BAD56C05FE8B0FD73874340FB022C8531AC56C0916182FAFF8B43400FA19608E1AD56C0177D30187792434030FBF1E8F8AD56C07268D4F413994340082733AAE0AE56C078072013C69C4340E5EAC2CA3EAF56C0D2F586D1B99F4340FDA17BD2E2B156C0E4D35030FFA5434049B2329F70B656C0BAD5FE2CDDAC43404C1CDF6DACBC56C0F42419E847B34340D8FCEC9A55C256C010051904E4B843405B04E81E21C456C040D9E003ADBC4340D274FF0200C656C0A7177C64B5C343409D13594D01CA56C0289078E3BCC64340C692C75404CD56C0B96BC702CFCC4340BB783D0757D456C0B6ADFC9ECDD74340A7A98BCF80D756C02FD1A17EC2DC434063B18490E8D756C0F4EFA0DF72E143404D920B7270D856C0E2E64680E3E6434009DF22FEC1DC56C0624046DF79EE43404C8E6B7EDFDC56C00901861F51F14340DBB67FFBC9DB56C06D896AA070F343402A14F9FA8DDB56C0EF5AAE4000F6434087C6E51DA2DC56C00378B0201AF94340EED24F4532DF56C039831301BE004440035C172944E056C0388E3A7F8B084440B34839CC0AE156C0DC2D633D3A114440D0B6DACB6DE056C0787E9B1CAA1944400ADF530BF1DF56C07F6A639C2E204440BB089C8A28DF56C07B080B37A32744404D920A46B8DC56C0F57967F29B2F4440BCDFAC61D0DA56C0585B339286314440D4A269BCB2D856C0590398523A3244401C3EEABADDD756C000EA3892963344403D0AC7DEACD856C0DD7F62EE40394440F9B76F1FFFD756C0A058C7297940444038DC63E076D856C0DBA6C224A7434440958C66046FDA56C0C5BE19FF254644402000FA4352DA56C0FC5D1C7A58494440D8AA257F0CD856C0C60369D73E4D444071F63111C8D056C079DD47FCDD51444054B0E98AC3CD56C0356F7EFC69524440B1A402C468CA56C0BB5E975A035444409CB44C8046C856C0F0C50FF851574440171CF93FB0C756C0BB8CA8F54B5A4440616496FEF1C556C07246E3AF7B61444081F4ECFFB2C556C095CACFE4B86A4440303A4A9C28C356C0B6278B7F9770444023A73356F0BE56C04CE7F97B44764440C310DE947EBD56C0FE6AC158AB7944401A96D5571BBD56C0CA4E98C7028944404DF735B94EBD56C0F30C2AC25C8D44404196301D64BF56C03658D8D97B9244404876A9802DC156C0A4C365D33A9544406BEA17259DC356C00F3706AE90964440CDB75ACB81C656C0CB6CC37EA39D4440DD48654D8FC656C064A844D948A2444014DC700FB3C456C001ACBFD5DEAA44400F1C9B7294C356C05127A85061B3444084223ED1C4C156C0963F447136B6444033E7CACE0DC056C0BFE8C8B32EB74440B34FAF88C9BC56C08C5D63F9EBB544405EC9EFBE08B656C0024CFB5FEAB84440F35F3A38ECB156C058EC9FC494B944407D8B98AE55AD56C0D4A315AB9CB94440461998E72BAA56C0A1F09C4E2EBB4440908D762074A656C0D3356C303BC144400B9681579FA256C0DD81B01454C34440D3B77AC9209D56C038A0DBB987C344404DA0C7A6D89B56C00086BD1895C54440577BDFA5149B56C0E862A8769DC8444039B1F4BA4D9656C05D9F7BF61ECB444009E2BDFAB99556C02BFBEF9429CD44407FCD2F3ED79556C0994D447016D3444010C19CC1DF9456C0E8C3D3A883DC444035C24E61859356C0F89E64E5D4E0444032E5B61B599056C0F5401E0211E44440C584A1B38A8C56C0751AE27A30E7444059628EB3E58956C09F72248624F7444016E20395238956C06D5F835EF3FD44404B489E76A48956C05343013248044540D8C72138C48A56C0664D0309D1074540DA0D5E78AC8A56C0FA8ADB3B480D454083D6FF18478B56C0FF4E60566D0F4540E75533DA448C56C0FCBE7DF5B40F45403DFCFABCC98E56C02EFDA0687214454064AEF4FDB79456C0BCC2565A42194540A2BF67FD8A9756C082A648B5E81A4540BFCF663B119A56C08048728A0F1F45402ECFA75AC29A56C03560F5C1C821454090C97A39619B56C0810B12419A2B4540D5084339459C56C0163F9C38172E4540B4C321596F9F56C038F557EBC3314540943523DA13A456C0C2EA76F9FE35454076D216F9C7A656C0571FBAC7F33A45403FC0119880A956C085355D00E23C45400616F7B6B8A956C0DA575B59523F45403E74F776DCA856C0C43733D432414540DF0D47F7E29A56C0DFB53E1A12414540CB3F9CC21D7B56C09B6274DE86404540CBB8F65C6C7556C0358894A8714045403FA47BA5A35956C0E2E7D324AE3F45404ED45203035756C0C07A81C5BB3F4540BB9CF7A31B3C56C02BF11A26D53E45402CBC43B5F63056C03A11518BD63E454038792950392D56C08CB3E78DAD3E4540D4689F41121356C0E064F17BF93E4540A9388071770C56C0317D4A3FAC3E4540FE146D4E08F355C0A0B17C8F9C3E454064B605A791F555C051A474DC382845405ADC6FCBA8F055C021774F9A07144540F877F834EBEA55C041057E3AA9074540B84E7F1536E755C04F93287876EC4440B81A3AFCE9E155C0C84F60C79FDC44408A5BCA8717E255C0550DB4C720BC4440F17CE93914E255C07AB73B4492A6444046F9F37008E255C0896F5EBF3E9644402D15DE260DE255C0FE563A7746814440793282B117E255C0514E26D66A5F4440F624C15561E255C0A38E0E91503F4440EE280BD548E255C0282DF930DC3D4440737F8A4943E255C0846B8214471544402274EC6F4AE255C026CAC55494F143403C3CAF3B47E255C08F678B0900CE4340E530954078E255C001616C281EBD43407C56304193E255C02D10623ADFAC43400C7BAC8740E655C0F1BF549A4DAB4340C765004B04E855C0C668243D5AA74340D9BC4FC914E755C020EE56FF1AA643408A5DEFA969E755C0DC8DE8C006A443403A760BC9D7E655C0C5859DC40CA14340BE0F84E669E555C083D4A066D89F4340C2095BE6ABE555C0452AD94BB09A434086E5D7E607E655C0FB66E88C5D994340F1962CA8E8E655C0D7A77A0C1A994340D58091EB3BE955C0CCEAFCEE929543406C6FCF0DE7EA55C077D5D7B0C7924340BC4E35EC34EA55C0742F2593BA904340D41C3CEC62EA55C048B9BC75878E43409BF606A96DE855C0CA79CC574F8D434065A58B8860E855C006F7E5D9648B43408055BA862BE755C032F8F4BAD58A43406B41A94376E555C0E9F6423EFF87434033A56BC23BE555C013BED8E6757F434057373E63E1E555C03A50E6863F7F4340A575F23E11E355C0E28FF349127D4340013859BD24E255C0EC92EC0B5C7B4340E1EC82DCEEE155C0422845904A774340F5BBB99C82E255C0D0A89BF3D3734340036A58FEC7E355C002691878576F4340D0F81ADD3BE355C0AC40C1D9D06D4340138CA49681E055C034C5D561D6654340E35DAE1738E155C0729F48646C634340DE73F77583E055C08B9DCCC4876243405127EA9588E055C05B92C9874B5E43402800837BCFE255C0ED049B89CF57434057879901AAE555C07A33B42A0B5643404827948603E855C0C9F8EE2B49524340D5BC68273CE855C01FF50D4CBD4F4340B5FA83A6ABE755C0D317A36CB44C4340F0DF4DE9FFE855C03D0B28CDEE4B4340B116EECAC8E955C00C50AA2D76494340B711CEED11EB55C0DB1E6D8E134643404C7B80CBB0E955C0C1F6862EF9414340DB1FEEEBD3E955C0EB9AE20E104043407D800C0F84EB55C0D3D4E0CE84404340C55F649057EC55C0BE928B6DA43D43400B0DA75764F055C000BC268DAB3B4340D5CBD8578EF055C0ECFC3FAC833A4340FC6778754BEF55C0E9BD720A07394340B1D274B6E6EF55C07B8BE56781354340680F1CD92DF255C0D6BECCE66730434070060CFD68F555C06836CF07212D434063EC503D68F655C0422CAA62A0244340F5AC52FE3BF755C01470834388244340B4B7C2BFF0F755C03FA65F078E2843407DDE69E08AF855C0544CFC8765284340B6B58C20DDF855C04D96B8867D26434027EA6E4281FA55C0BAB5C7E6FA234340746DBFC279FA55C09225A4C8B42643403125E1C342FB55C053D1DE4904274340939DBE26B9FE55C0A3170668DD1E4340CDD0EB461BFF55C0A6CD2AE80F1E434097BD07E596FE55C03AEADC85B2194340BDF4561FABFB55C0CA39D420E915434001E39E3EA6FB55C07363DB5F2B14434032A2999FD6FC55C0BCA596E08711434067EEC4614EFE55C0EE042F02DF1043401B73AC66300156C0AB79B2833A0D4340E9F23D85CA0056C0476B1B83D30B434042993ADFC0FD55C05ED0FDBF630C4340CE5F81BF6BFE55C0ED94E19F6309434083FDE287390256C0DEE2AFC1ED06434023A3E088C20256C0534B4B01C805434033BF7708A80256C0FFDD0BA1E80443404C98E304640156C077AE98404C044340F0295225DF0156C0AC0DE25F0F014340209A8623640156C0B87B371ED0FC42401FC1E206B90256C04CE1DA5D68FA4240B9B35CE6AC0256C02DD6041D9FF7424040390E4A230456C0C78CA19D04F74240B4CEC3EC0D0556C08B4F5B7ED6F84240EA4741CD600556C02675D7FD3BF6424003376C44F30156C03726EA1B75F54240D4C8A523B40156C0342B1E5BF1F34240B2F383A6DF0256C0FBD089BBB1F24240F94AAD4F680656C0AD9BCFDDFEF3424033409ACF7E0656C0FDD7F6DD9AF24240AA290E6BD90456C08D47C4DB15EF4240BCA24F84310256C08DE1FA5801EC42408DCB3DE5B20256C078E5BAB8EDE94240154F920CB70556C0EE1098DB67EA42400B27F80B820556C0F8D5F0FAA8E84240C6951964470256C0CD31811722E742408042A6E7A30456C0EA21C71923DE4240C50DCF0D8E0856C0F32D3683B3D942400F098BAE330A56C00ADE81EA92D442400F209C2B170A56C0FF9EBA8E73D042405B1835C4960856C0D7D8DA12B4CA42401D3D72F4940456C0550A7FB669C14240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('15','IN-FRS','IN','INDIANA','F','933','0106000020E610000001000000010300000001000000080100002297F9DEDC9555C00B709460B11643403F766A82519755C0801507BCBD18434024814B05DA9855C070D54F78EF18434041386843C69855C000D93EBA811543404176FCBDF59555C052A73062E9134340E3996F7C779555C0752EBA846F1243404D90B4BC049655C0A9F41EC42F1143401B326301329955C0C28AA81CC80F434000F7FE410F9A55C041FE351BDA0D43400BCD0D28F69C55C0A43626D29B104340E3A76B09C09D55C0094E6B3088104340B47433895B9E55C0B41A846F4C0E43404E247144529C55C0D72D5D765A0B4340D7218E63519C55C02F056A37BA0943405ABB25E4559D55C0113F659592074340928E1D0833A055C05B434D6D9C064340048B80CA38A155C0938B63AA05064340ED89D109C8A155C0DDAE138A6402434055C55269F9A155C01931F0A765FE4240A0850AE814A155C0DDCA47639BF84240790E318974A155C0F8F7B87FC4F642407DDD2C2CA1A255C03BA8173BF4F54240F5B2A7F23BA555C0ECF115347CF642403AF150B54AA655C01B3C2FB0E5F542408B8B9C9858A755C0E5F50424D2ED4240133C5FFD50A955C0380F63BD49EC424094C755809EAA55C0B8BD13FA76EC42401D2D1841ECAA55C0CCA9C27A29EE42406E0C327F42AA55C0D3B3E48187F34240C4D08540CBAA55C0AA79CCA1E3F442402AC3ADA31AAC55C0DA96FE9DB7F442402B7EF0E9A5AE55C0BAE6B2F482F24240AE45C4AD3EB055C060FAA570FDF24240779D405461B355C06614555049FD4240216B8137E2B455C09CA5BC6DEBFE4240293B0ADC3FB755C0D5EC126753FE424086E14DE09AB955C0F5FC05BE12FA4240029F16E49EBB55C0462DB9B711F84240A7C3F24A4CBF55C00ADE0A6E1EF74240F918D28DD7C055C002CC3DAA5EF64240161D36B055C255C0C951BA8539F44240860CC85090C455C03FBBAF3C50E74240DF0B6FB3CFC655C09889CA5762E4424079335FB670C855C00835B51416E54240AFE713FB1DCA55C097413812DAE94240DA2EB1FD3FCB55C0CD6BDE8F58EB424042220F4483CE55C06766E9E8AFEC4240CE3E6AAB74D155C05990B80277EF4240D2C07632E0D355C00B0E625D65F2424003D932A1CDD855C09DD56F12ADF74240311EFD4AF2DC55C0E63E9FE9DFF74240F8F01DB14EE055C0D3040E4433F542408358D445ADE655C0BCCE01E24EFC4240673FB10523E855C0B29013C333F64240E96C99DD0FE655C0E2985FA404F24240E00B691BFEE555C06091CF64B5EE4240B52CFBBBE2E655C0ABF8614502EC42409FF58F62B5E955C0C844C5A401EA424022EFFD68D2EB55C0879EE1430EEB4240E8F55E8C80EB55C032456683D2F24240F8A173F166ED55C0EAF41A232BF342409E6C3DD49AEE55C01E14C4C281F24240B0DAC5F83DF055C0A3EBD6E2F5F24240A6FDBBA2B6F455C063C4F6A86AF04240E5179728DCF655C06587388C0AF24240D73312D089F955C04A30353159F6424019DA7C5300FB55C0A7C85B93BFF542402BE52895CEFB55C0D94B22F4BCF342400D78F254F5FB55C02F22295307F042406C2A9B2F41FA55C0B148A2AF57EB4240F111A710E4FA55C0FBC98F2FA5E742407164CF9322FC55C0D2DA4AB057E64240B763CDF65BFD55C0B8AC00515BE3424061F135E0B70056C07F3413B692E64240C6951964470256C0CD31811722E742400B27F80B820556C0F8D5F0FAA8E84240154F920CB70556C0EE1098DB67EA42408DCB3DE5B20256C078E5BAB8EDE94240BCA24F84310256C08DE1FA5801EC4240AA290E6BD90456C08D47C4DB15EF424033409ACF7E0656C0FDD7F6DD9AF24240F94AAD4F680656C0AD9BCFDDFEF34240B2F383A6DF0256C0FBD089BBB1F24240D4C8A523B40156C0342B1E5BF1F3424003376C44F30156C03726EA1B75F54240EA4741CD600556C02675D7FD3BF64240B4CEC3EC0D0556C08B4F5B7ED6F8424040390E4A230456C0C78CA19D04F74240B9B35CE6AC0256C02DD6041D9FF742401FC1E206B90256C04CE1DA5D68FA4240209A8623640156C0B87B371ED0FC4240F0295225DF0156C0AC0DE25F0F0143404C98E304640156C077AE98404C04434033BF7708A80256C0FFDD0BA1E804434023A3E088C20256C0534B4B01C805434083FDE287390256C0DEE2AFC1ED064340CE5F81BF6BFE55C0ED94E19F6309434042993ADFC0FD55C05ED0FDBF630C4340E9F23D85CA0056C0476B1B83D30B43401B73AC66300156C0AB79B2833A0D434067EEC4614EFE55C0EE042F02DF10434032A2999FD6FC55C0BCA596E08711434001E39E3EA6FB55C07363DB5F2B144340BDF4561FABFB55C0CA39D420E915434097BD07E596FE55C03AEADC85B2194340CDD0EB461BFF55C0A6CD2AE80F1E4340939DBE26B9FE55C0A3170668DD1E43403125E1C342FB55C053D1DE4904274340746DBFC279FA55C09225A4C8B426434027EA6E4281FA55C0BAB5C7E6FA234340B6B58C20DDF855C04D96B8867D2643407DDE69E08AF855C0544CFC8765284340B4B7C2BFF0F755C03FA65F078E284340F5AC52FE3BF755C0147083438824434063EC503D68F655C0422CAA62A024434070060CFD68F555C06836CF07212D4340680F1CD92DF255C0D6BECCE667304340B1D274B6E6EF55C07B8BE56781354340FC6778754BEF55C0E9BD720A07394340D5CBD8578EF055C0ECFC3FAC833A43400B0DA75764F055C000BC268DAB3B4340C55F649057EC55C0BE928B6DA43D43407D800C0F84EB55C0D3D4E0CE84404340DB1FEEEBD3E955C0EB9AE20E104043404C7B80CBB0E955C0C1F6862EF9414340B711CEED11EB55C0DB1E6D8E13464340B116EECAC8E955C00C50AA2D76494340F0DF4DE9FFE855C03D0B28CDEE4B4340B5FA83A6ABE755C0D317A36CB44C4340D5BC68273CE855C01FF50D4CBD4F43404827948603E855C0C9F8EE2B4952434057879901AAE555C07A33B42A0B5643402800837BCFE255C0ED049B89CF5743405127EA9588E055C05B92C9874B5E4340DE73F77583E055C08B9DCCC487624340E35DAE1738E155C0729F48646C634340138CA49681E055C034C5D561D6654340D0F81ADD3BE355C0AC40C1D9D06D4340036A58FEC7E355C002691878576F4340F5BBB99C82E255C0D0A89BF3D3734340E1EC82DCEEE155C0422845904A774340013859BD24E255C0EC92EC0B5C7B4340A575F23E11E355C0E28FF349127D434057373E63E1E555C03A50E6863F7F434033A56BC23BE555C013BED8E6757F43406B41A94376E555C0E9F6423EFF8743408055BA862BE755C032F8F4BAD58A434065A58B8860E855C006F7E5D9648B43409BF606A96DE855C0CA79CC574F8D4340D41C3CEC62EA55C048B9BC75878E4340BC4E35EC34EA55C0742F2593BA9043406C6FCF0DE7EA55C077D5D7B0C7924340D58091EB3BE955C0CCEAFCEE92954340F1962CA8E8E655C0D7A77A0C1A99434086E5D7E607E655C0FB66E88C5D994340C2095BE6ABE555C0452AD94BB09A4340BE0F84E669E555C083D4A066D89F43403A760BC9D7E655C0C5859DC40CA143408A5DEFA969E755C0DC8DE8C006A44340D9BC4FC914E755C020EE56FF1AA64340C765004B04E855C0C668243D5AA743400C7BAC8740E655C0F1BF549A4DAB43407C56304193E255C02D10623ADFAC4340E530954078E255C001616C281EBD43403C3CAF3B47E255C08F678B0900CE43402274EC6F4AE255C026CAC55494F14340737F8A4943E255C0846B821447154440EE280BD548E255C0282DF930DC3D4440F624C15561E255C0A38E0E91503F4440793282B117E255C0514E26D66A5F44402D15DE260DE255C0FE563A774681444046F9F37008E255C0896F5EBF3E964440F17CE93914E255C07AB73B4492A644408A5BCA8717E255C0550DB4C720BC4440B81A3AFCE9E155C0C84F60C79FDC4440457D5770ADDD55C0F7190ACBF7D54440C3DEF3ECD5DA55C0C984662C93D64440FB3B834D49DC55C0600DAE0B3DD44440EDD09B8743D955C07FD46C2D2DD1444035E5FD78F7CE55C0882DC0F326D04440E602664351BC55C0E680C462B6DB4440007A33D96DB555C04CD2570FFCE144408DDEA3909CA155C0396CE339FDE144407EE9181E038F55C0D57F6512E7E1444003F020105F8455C0B81C4358DFE144408EA7EA88267355C0D9697D83BBE1444056C1E692346A55C086753CC79DE144407B36867B055355C0412DD105BDE1444066D15E6A5C4C55C0913501A5A5E14440C879EA50DD3455C0D4BFA11F85E144409007936B763255C02B8FB71E67E14440A31D4D8B953255C0D36B1B8247D9444082D8FCCDA53255C04C9A0829E7C344407F35B371AE3255C050A5A968C5B64440FEB509589F3255C08198FB2554A444408F5A5B59A93255C09AFAC6A566A04440365307FF973255C0309D2BF7817E4440D4902720A03255C025B7E0D40678444025CB3D84C13255C0E18E214C4B5D44408536B5A4C43255C057B04AC65B4B44408AE98F02DA3255C05A4039C4302D4440875D27A2E73255C0701EA464E52844408E6230986D3355C0578A1F72CA014440F5A529F5973355C03BDC6DB665F54340E0C92CAFC13355C00CBC28C0DCDD43405263E206E83355C0326BE0CF32C8434041EA2C24E93355C0407ED554AFC1434026B05137F83355C019BC9088FAA743409293BEF6F83355C04E5958A9C9A643406299564CEF3355C07E5E9E85218D434079EF2CAEFB3455C00709D5A3458D4340934CABD2BF3855C0D54EE46453884340F0D833B2F53855C0DCD22EA77B8643406F29E22F153855C0E9740BEB358443406C6922CB073655C0F770FA11BF8043406B2C7D89673555C0B2C07F96CB7D4340232C060A2A3655C023DA145A317A43400354B66B0E3855C03FA0A3BBBB764340F56DF22A043855C0204FAA3E68744340390DB509063755C00698442176734340F1BFBB05683355C0DCB8A126D7724340343AA784793255C0A6E1818933714340BBCE6784653255C0F8E5892CEE6E43409602FF65C33455C0834C63AECF6A4340564518E5663455C06E215E758E654340FDDEE569703E55C07CDB7A0BEC6343406CF809CC9A4155C094F05E4AD46143405857968F614455C03299D0E90D60434042B82E76A84755C040C300EB685B43409833BEBA4C4A55C0C5B25D8BFB5843403F46115F214D55C04A05508810594340622C92845E5155C02898AABC475F4340C6AF83CA705555C0AB48F939565E4340100FCB91C35A55C0A0BD0374845E434075D42794965C55C07F892594C75C43404745C914095D55C07E677118EB5843408DD0EB71295B55C0B1BDA90ADC4A434088225EB1B75A55C039C7026FDE47434029BE50F2AB5B55C0D4AA8CF1BC44434069797A34D95D55C034E92D9253424340283A2EF7756055C02B5AC579573C43400C9D917F356755C07BD7A97E2C394340A2FBA0A0306955C019A2D7AF1C314340A98F2AE0DE6955C00A543A7C3B2B4340B463A0E09B6B55C045158BA6852643402C42A4A2CD6F55C04EF42EAF992243401D821A47517255C02FD5416825244340650D51899E7355C0D84D6385A1244340319F410CC17555C0AE8311855D234340F5A244AB8C7655C08E153B2B891E43401AF9016E5F7A55C07B17BA490A174340CFA44F488B7A55C06EC7C7D14D08434018EDD367937B55C001739AB65B044340AEA2C768597D55C090286AFE830143407D85EC2B6D8055C0289E50E7390043401F2E0A0F068255C0263EC60119FF4240DE47A8B15F8355C04C3A0B98BFFB42409309B119B88655C0C7F1A17673014340FCFC4125338C55C0AB9C5FE84502434007BC6C4E239055C0A748975C36054340BBA8F3D1C59155C0ABA3433672074340B4BA30F4A69255C0FDFFEBF10B0A4340FA788B180D9355C0A1D3F4293D1343402297F9DEDC9555C00B709460B1164340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('16','IDNR_EFD','IA','IOWA','F','934','0106000020E610000001000000010300000001000000F8000000171CF93FB0C756C0BB8CA8F54B5A44409CB44C8046C856C0F0C50FF851574440B1A402C468CA56C0BB5E975A0354444054B0E98AC3CD56C0356F7EFC6952444071F63111C8D056C079DD47FCDD514440D8AA257F0CD856C0C60369D73E4D44402000FA4352DA56C0FC5D1C7A58494440958C66046FDA56C0C5BE19FF2546444038DC63E076D856C0DBA6C224A7434440F9B76F1FFFD756C0A058C729794044403D0AC7DEACD856C0DD7F62EE403944401C3EEABADDD756C000EA389296334440D4A269BCB2D856C0590398523A324440BCDFAC61D0DA56C0585B3392863144404D920A46B8DC56C0F57967F29B2F4440AE6728CB87DE56C071F9C7AF0C324440EDFC554D61DF56C08F2016EF05324440EA8A622F06E056C073F6AA4DDC334440A9C4A6B3C5E156C06687FD69803444408F1A9014E5E156C0BEDC41E7B0374440057617767CE256C0C91F94257C384440E8B8901520E256C0DC3BEDE44B3A44406561BC9C14E556C008AAA77E5C3B444027FC4E7E81E556C0EEFBA8BB043E4440586F25A37AE756C0C69F8CB49F40444026EF5FA3D7E756C0ECBB1A2D36444440E63DAA0D4BEC56C066225D5F9D464440E2DA0E4D28EC56C0E87709D8644A44407F420AF1E2ED56C0C24B7EB1F54B4440085D943478EF56C0383FE9690D4E4440E7B1475491FC56C0D5BE0FAEDB4D444065F844F85C0C57C08F41F4B4CF4C4440E8B0DA07231757C0B1CC3FEABE4C4440299914265F2957C08DC2EA05B54B444017BA23B0F02D57C000B3E3367A4B444024D414C7754657C0C0313BE4CB4A444041749E86B25757C00C6F9B884D4A4440436CA9B9066457C0C383F01B584A4440DEB7B4CC527257C096E0C1990A4A444068694EE0278157C0D486748E79494440E9DAA3CF418F57C01B6F1A6B1549444074B0BA060E9F57C058A0988B7F49444024F2C1BBF3A857C01AA9DF01B249444052D2CF5EEBBA57C08DD72B4AE24944401FE0D458EACD57C09F70DC747B4A4440A79149C87BD857C0599FFB74CB4A4440C2B7C5621EF157C083708CEC654B4440238F67A37BF057C0CC40A2CB794F44407EB453E626F157C0BCE4EEAA5152444087D0707A1AF857C0ECAE8FEF7E5D4440442BF6BB83F657C02A92F8EA73654440B8DA66002CF657C094176B26966C4440FA0FBEC066F557C0999E5004666F4440D631C7E389F557C0000E2E825773444014CD7D4A9BF557C0AE84D57CB47C444038ECF1EF18F757C0DBA860DA568044402516DBB102F757C005771BF97A844440737C2A563EF857C0C02C31786E884440F24287F6EDF657C0C44AF5D6F98D4440DF12839C1BF857C0F6F3C795049544407ADDB1FA06F757C07E7E7DD55B95444032377D1BFDF657C0D19EF4D41B974440B8D80063A1FA57C03F6C6115D798444051F4C02406FB57C0C7BA63F59A9A4440CFB982844DFA57C07BC8CBD4D49C444042E2E5E588FB57C00EC9B8CBA9A64440A4686F2351FA57C022C606EA7BA74440E23C022372F957C0934AA4EDB7A444402C307321E7F857C05E17A1EA93A644407CD4046558FC57C0F01AD0A587AB44408EA7F8E129FC57C03E49D9FB88B24440DED51E1ED8FB57C0C1324F502FBB4440E038C3FE00FD57C027EDFF2E77BC444044999F01710058C04CCF8AAFB0BD4440DC4F8561DC0058C032EAF36D1ABF444075622FBFC9FF57C0FEE7CA6979C14440D419F01E9DFF57C0B7F456E698C34440736C673F4B0058C09C5B3965B1C44440FFB1B304360358C0A65DFF691DC3444070D247687E0558C05DE2FC88CDC44440630C7E48E20558C05EF1242415C8444059FD27672C0558C0552FB660BAC94440345C03AA1F0758C074B82E3DACCC44400B16E2075B0658C0439E0C91CCD344401E089E69B20758C027C4AA6B90D744404AC0B229D20758C07CC42FE9F2D84440BCA37CC5790558C05189EF053DDA44400AD4A3A6620658C0C20EFAE0A3DD444067D875465B0658C0CE92B47C61E04440996DB404E40458C0325A03DC4EE54440F83B700EAE0858C0E5D3CD5B6AEE44409A3CB6F33C0A58C08D93803BBBF34440893351F2550958C08E02F55A63F64440F3EB31D46D0958C022AC093AAEFB4440DED24C9BDA0B58C0160A091A87FD4440F973295FFB0C58C036C2DF1991FF4440DD5B53251C0F58C02AE2BD3929004540651D2847470F58C07E2AC1DCA30345401053F2ACFD1058C09B2F4A4142064540BA0D6C743F1258C05644444CCD0F4540C27D2BE2891658C076E3A7198715454068D83FC7431758C0BDF661BE651B454082BBCA039D1558C0ACF88EFC601D454019821C444A1558C0FE20B1BE5121454099BA8FC5F11558C0D46BB6401B2445402B9855C9981758C0E50111A42526454063516B2BF21858C07C8695C7152A454058029AAF251B58C0DB8FA42BB52C454038E3C64C5A1A58C032A4BBEBC1304540B80F2B6CBA1A58C01C4AA96D1735454008EBB908771958C0C821EFAC8C3845404D3BB147591958C01569FACDD33B4540A2B6100B1F1C58C02A9ACF719F3E454016592E4EBC1E58C0113C4E533142454003ED3B4E511F58C0E0B68C1132484540B99B1D6F0F2058C02C3DE911754945406439D58D431F58C05550D5304D4A45406E3DA16FD22058C096D06DD09B50454076B6FC72A22258C02500C5B2C954454054A0D4D5082458C09AD2D6D591554540F5D9673E192858C07098E35DAB5A4540BD453861012958C0E376C83FD25F4540B446EFC0822858C0374B4F596F634540CE63B3BC742658C03737C2EF5766454059B0AFFB9B2558C02A3B38C7ED6A454073CE3819AE2458C0CF9C53E5CB6A4540BE17C6F6982358C017595B605F6C4540CC510295662258C04F3D75D4CD72454041536636D52258C0DD368E92F9744540999C36B2F42058C0DA0AF2A7E7794540D32431F3182158C02FB35942447E454015E285F1EF1F58C01180CFDB8A814540F48F89D9472158C063A4D3D5978645407A091354B11E58C00B3021D1EB87454000AF8EF2921D58C0E8765AADAC894540FB5D7FD37D1D58C0DAEDE96A3F8B4540455BB475E51C58C0A315A4E22A904540B3CA3C82471E58C03C1F0934C39A4540F1926F062F1F58C095E68773E49B4540CE706932C02358C07431E7D4DC9C45404156F694492458C00D4FC351AC9E4540762956F5CF2358C0BACC9FEE6AA045400B3B8FB7862458C0BCB24C0CBEA1454046E1CC7A102558C0146C372521A54540722D9B96982258C06B76106061A7454063C4E117772158C0AE27BD12B1AD45403588257A9A2158C06064284B2EB14540716BF57FB12358C0AC26B6074BB345402C00D906B42558C0454D18BFBFB74540D61378E95C2558C0F5F27992AFBD45401C75CDCC4A2658C02A270C0EFBBF4540AF441B17781D58C0821E83C6F6BF454046665012E80358C0749E9AF3CFBF45407D948B7C7BF757C0975F5965DDBF45401BE410E1BEDD57C04F59B2F5F0BF454022A7463761D957C064BFFFF10AC045400C83C8E4E8BA57C05594A165EBBF4540A69C439B07B757C0B94C05FF00C045403273AF9F229D57C04ACD40CFC1BF4540A4F56D5DCB8F57C061FA278BDDBF4540A0E87731557E57C01622EECA09C0454031CE6236D66957C08AA803FE18C045408B21379A0D6057C0B042DE0110C045400D1C97F77A4357C0C0FAF2C12FC0454026CC68D2BD4157C08FFE01E829C04540482AED68B62357C07467A98008C04540591402B9001D57C016271E5EEEBF4540E441FE4AF60457C0C4DB2843E4BF45404540AC51BEEE56C0FBDAD3F7F1BF454077EECA3E1CE756C0A250F08414C04540FC3FFDEA4ECE56C0CBEC787F1AC0454015DDEE0A19CF56C08225FBC57ABB45403AD245A87FCD56C0342D3B4E47B645405FC2F305B0CC56C06D524CF86CAF4540E4E11BC454CB56C025A8AB1B4EAD45402FE9B01C06C556C042ED97241AA84540973EE15A40C456C0C519A06AEDA34540AD61615A6BC456C037AB0BCF02A1454092F8F39F53CA56C09E418BC4E3924540DA5751E0C9CA56C0531C25129C8A4540B135A45F39CA56C07B687A32648A4540A822F4DEBDC956C06E8510232B8045400A97D25EE7C856C00F6E3AAF83764540B3A75FBCFAC556C009E0FC5A8B6F454003850EFC3FC556C08801DC4C45644540B1ED991B3CC456C0C5563D56595F454051B59A99F2BF56C0BC6ED7E6805A4540DE029298D7BA56C05FDDEE6F2057454061C1F5771FB956C0D04C2492D056454058CD4113B8AF56C04FB53F9F18544540C61B337577AC56C08A3056A6A75145408ADC6D3685AA56C0E5FBEB5D234945407F83E0F6E8A856C0795DB6A3214745404F7D32970BA856C05CABF8EDA74345403E74F776DCA856C0C43733D4324145400616F7B6B8A956C0DA575B59523F45403FC0119880A956C085355D00E23C454076D216F9C7A656C0571FBAC7F33A4540943523DA13A456C0C2EA76F9FE354540B4C321596F9F56C038F557EBC3314540D5084339459C56C0163F9C38172E454090C97A39619B56C0810B12419A2B45402ECFA75AC29A56C03560F5C1C8214540BFCF663B119A56C08048728A0F1F4540A2BF67FD8A9756C082A648B5E81A454064AEF4FDB79456C0BCC2565A421945403DFCFABCC98E56C02EFDA06872144540E75533DA448C56C0FCBE7DF5B40F454083D6FF18478B56C0FF4E60566D0F4540DA0D5E78AC8A56C0FA8ADB3B480D4540D8C72138C48A56C0664D0309D10745404B489E76A48956C0534301324804454016E20395238956C06D5F835EF3FD444059628EB3E58956C09F72248624F74440C584A1B38A8C56C0751AE27A30E7444032E5B61B599056C0F5401E0211E4444035C24E61859356C0F89E64E5D4E0444010C19CC1DF9456C0E8C3D3A883DC44407FCD2F3ED79556C0994D447016D3444009E2BDFAB99556C02BFBEF9429CD444039B1F4BA4D9656C05D9F7BF61ECB4440577BDFA5149B56C0E862A8769DC844404DA0C7A6D89B56C00086BD1895C54440D3B77AC9209D56C038A0DBB987C344400B9681579FA256C0DD81B01454C34440908D762074A656C0D3356C303BC14440461998E72BAA56C0A1F09C4E2EBB44407D8B98AE55AD56C0D4A315AB9CB94440F35F3A38ECB156C058EC9FC494B944405EC9EFBE08B656C0024CFB5FEAB84440B34FAF88C9BC56C08C5D63F9EBB5444033E7CACE0DC056C0BFE8C8B32EB7444084223ED1C4C156C0963F447136B644400F1C9B7294C356C05127A85061B3444014DC700FB3C456C001ACBFD5DEAA4440DD48654D8FC656C064A844D948A24440CDB75ACB81C656C0CB6CC37EA39D44406BEA17259DC356C00F3706AE909644404876A9802DC156C0A4C365D33A9544404196301D64BF56C03658D8D97B9244404DF735B94EBD56C0F30C2AC25C8D44401A96D5571BBD56C0CA4E98C702894440C310DE947EBD56C0FE6AC158AB79444023A73356F0BE56C04CE7F97B44764440303A4A9C28C356C0B6278B7F9770444081F4ECFFB2C556C095CACFE4B86A4440616496FEF1C556C07246E3AF7B614440171CF93FB0C756C0BB8CA8F54B5A4440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('17','KS-FP','KS','KANSAS','F','935','0106000020E6100000010000000103000000010000007C00000068D4F5849AC457C0552DE16E3080424086B4311A06DA57C06DC5D32B148042409110C24AAAE157C0C5C0786221804240FBD288B449F257C03508BE32C27F424090645F3B4FFD57C0F93735B70280424012683D1E630058C036EF0767C97F42403CD7195F3A2158C091BD07EF12804240DB2C67A3EA2F58C05E081E7105804240B0578CF5CF4858C08ED595B7F97F4240F35FB231C95D58C047F2643C8C7F42407153CFD4787358C00BA33710D17F42408B8CAE9AB08658C06F09A676D47F424030F4C799379658C02331593FE17F4240B61E61F592A258C028D354C8CA7F4240A5C66F12F8BF58C09B9C43D9C07F424040C16391FFDB58C0821175B04D7F42406A288660DBE258C034DEF0536B7F424077A495E7F3FF58C0385543D7697F4240CBFC4032AB0559C00DEEA513B37F4240F565F77A972859C09A1F74F8B87F4240CCB92C6AD63C59C0A26A2E9C927F4240ABCBB429954459C05C6D4DFDAC7F4240D390E06D6F6359C0A1A717A3937F42400E36FBB9918159C016C6FB7A937E4240D826F79B618259C08835395A977E42402A1F794DB08259C02233E49A71B14240D9E69C5DD88259C0D79FDCD31BD2424099831A83D08259C0BF7307C600DE4240A1BE70A9F28259C0ED27CF3D7D2043400DDF1549EA8259C09484323EB5214340FFA7659E0B8359C043B4FAAEC84E4340D9888F5C0B8359C08DB9E47EA5584340C4DEC45D228359C0431A2C83BC84434082972161108359C078E45A75399043403B21BD901F8359C0372E30F209C84340CD48F3102A8359C075897BF1CAC8434032FF015C4C8359C021A1CA8DDCFF4340EFF293BB125A59C0F74D97E32000444080123B159E5459C0CE6A23AC3B004440F4C9188F4F3059C0468E6D7F06004440DABFD70C0B2F59C08C6DE4E0E4FF43400E7A562C3B0C59C0E7CDCA2F130044408543460A940B59C0BBC0B8AF0F00444000D91AD92EE858C0DD7FD1E76100444097DD57A567CB58C0739C2324F2FF4340317688D024C458C028DDCE89C9FF4340285212D71EAE58C0B5218194CDFF4340BAE8E86249A058C0FADE0AF2A1FF43401DDC7817E89058C0F7FC01B6CCFF43402DE48F617E7B58C083A7AB4DCDFF4340BAC5D5FF427458C00EF37320F7FF4340D06E4890295758C08DC89727AAFF4340EE571262213A58C01D98FCFF81FF4340CEBD6F784A3358C0D00A14FD4AFF4340735792F60E1D58C0B694930D41FF434067016BF7650F58C00A6A39E14BFF434041F27F8A140058C03DFE5D5E61FF43406DD0FAFDF6F157C0D123AEA92AFF434061589DD319D557C01784805A0DFF4340404305B2C1D357C055153F96ECFF4340A802E9E96BCF57C0A3BB62EC96F84340E1EF764749CD57C0A717FC2816F843402F847AE569CC57C02EA8DAC780F44340FEC262A2A2C957C0D64592223BF443400916053D72C657C0266B53BC57EF4340B404163A0CC457C0751356B7EAEE4340E0D176F824C257C07311C0335DF04340385A98B864C157C0EF97A932D0F243404F80EEF2C2BD57C0E9378D2F4EF34340E7467E2F0CBC57C04D4C0FCFB2F24340681E80CCEFBB57C08DCCBEAEB8EC434085D1E1C920BB57C09A8C890EA4EA43401F246A267EB957C03AB9B8CE06EA43401FE5A144DDB857C0BEEC138FA0E84340FE23B2848EB957C0B7DAC86E9AE54340779943A8BABB57C0D6460AEE31E44340342CF9E7D8BB57C09037082E41E3434022F570C5FEBA57C05832F8ED00E1434031E40CE021B857C0A810B8EF5DE14340C398D27EC1B757C076220BF086E04340BA76DADE2EB857C0DD545A90A1DE434061915CA1F6B957C02A00535006DD4340DC67452493BB57C0B9C25A2F0FDD43406B2ACF4700BD57C0929BD9AD45DE4340DD418DE88DBD57C03DB2926DB3DD4340EB9494E6A0BE57C06B6368B0ADD743407D5D8589CFC157C029119394B9D443407ED50CC995C357C09D3E069A16D04340C643A6656EC357C0B4422F7B1BCB434092EA36A9F9C657C017595EC1C4C7434071FE1CC687C657C00B3BC46134C443409556D4DD0BC357C056D547411FBE4340753F52BD97C257C0665949A441BB43408ADC5EF81DBF57C0FD15614740B843408B47C4F657BD57C0443D484DAAB44340CC7A7E743FBB57C0FE56FD53CDB043409CB549727DB957C0D84780D5B8B043403F5EBE7353BA57C085DFF61B89AB434061FBA67317BA57C0FEB34CFF58A94340F46CDD1164B857C03A21D3269DA44340B50608AE57B557C005386E8C81A1434047168C4D88B457C00DB91D33029B4340A624D72A90B257C0A61EE67533994340873FDA04C1AE57C0D5EE04BBEB954340F151459E3BAB57C0A8D5ECDA639643402D48BFBA5EA957C0B8D5F25C47944340EDBEC6B635A757C0942B473E69934340207B9C757AA657C0DE1D58BF13924340E6C69EB6EBA657C04714FD42708E4340680D3F77FEA657C0A3A87DABB78543406436DCB332A757C083209A62266B43407C82D1D13DA757C05ECF1A4E5D5E4340969B3A1299A757C04F1A5340593C4340FC6FA6929EA757C0E7C1071B2E324340D240FC5682A757C065FC4EF5230743404BBB809778A757C0D464ADBEE3034340880FF881A2A757C0F85B1CF205D742406D3DAFA19DA757C0690C39773FD342405E9A37D699A757C0DF5893982DAE4240EEC9E5539DA757C046CEAE21F3A942408991DBF4B8A757C05CDF17EAB2874240EE67D94CB4A757C06DBB293B9F7F424075DCDA7E18C257C0363B5A8A1980424068D4F5849AC457C0552DE16E30804240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('18','KY-TEMPO','KY','KENTUCKY','F','936','0106000020E6100000020000000103000000010000005C01000094A18DC9AEA055C0A24C9578D9534240D3CCE87250B155C06E0AED097853424006BB82205DC455C0176C54C84D534240227F658536C755C066A49F0D5E5342408BAFAADF2ED655C0D7B054851B534240012C727F00E955C048C638789652424066352AC562EC55C07B89B09A7E524240C3C2575BA0F655C0478C00681D524240D3EA6ABCB9F755C05890AAA8AF554240EE071BDA900456C06B1532DCFF5642407D71793CA10256C0FF5AB19B964A4240793AA6BE3E0256C03A6831BCE3444240E8B2C4A2BC0256C0C61A0B9E8F3F42403AE22DE2BE1F56C0757F6E44C53F4240E1C87AC4CF2056C08D847825F13F42401F3121D0E23356C03670ACBBE03F4240F1F84F12E33456C0429A8DFCFC3F424078B1B4D2243556C032D3F33CFB3F4240B98A60CD2F5656C001990C8D55404240BA43E6D48B5A56C0FDE28ACB57404240919788F5C35A56C04DDECD295C414240E30151D2EE5756C06D81CF33E14E424044024491455756C0261F25F218504240234002CFE95556C0CC05E51180504240F586B44CA15456C098949F33A04F42408B42ACC7245256C0C020A7BEA349424047A6EFC2774F56C02D795AC0DF484240142410C0724D56C037DA737D7D4A4240BEBBE2DFCF4C56C0CBB3A253D0504240FEE98F9D564B56C0693C578F97534240422CDDDCBE4A56C07FDE0BECF75542400BD8D1E0A44C56C0AAC73A83515B4240868D0B41914C56C0C61937001E5D4240702EC55F584B56C0DDFADCDA676142407D0F8D1CB14956C0F34F0A1C2A6142400E8C06DA084856C0728BCCBB5062424085814BDB0E4856C078BFAF976F6542403CB29840864A56C012159213F9664240516319231B4B56C028B2D10E2B6A42407A13F102A94A56C0AE417A0CF76B4240E8454B3F4C4856C017EA284BE96E424070CEDBDFB84656C052F3321E1A7A424056F44AA1DC4656C0716426DA1E7D4240ED1068C5504856C097F26A367C7E4240B01D00C99E4956C0A5962593CE7F4240556D366F294B56C06F30F32F4C834240E6A10212DB4A56C015FCC78E3A8842402CE4D6F05E4956C0F0E1CB2FEF8B42407520552D7B4756C0828E00325C8E4240ACB73CAA2A4456C082C55DF3CB9742400EDAEE3E913F56C019B0F4D72B9C42406915C630AF3B56C01443027BF69B42409741CB1F413756C096E3933FE39942404E33E6A2C72F56C05F973C077A934240630A4C814E2F56C02ACB570814924240C2A8C7170F2C56C0E1DBC3EB569142400C5F922A502756C08B2F2B12F78D4240DBD7EEE1CB2356C0BC19E9D95389424074116DBB1B2156C0C80F113E4C88424067266156681F56C02D36B4FEBB884240700B3893841E56C0768301DD3D8942406131442CD51C56C033A29A18A38C4240C03318240B1B56C0428134711794424078834EE8D81C56C0AFA4C22D559A4240EFE41211182056C0458905C900A14240AAC61535BA2056C02DFE280201A64240C8F50891EE1D56C07F27A6B04DB342408EC93C89DF1A56C07540BDCECDB54240FD21875DFD1656C0950B64F165B44240AD88B496F31356C077EF0C0EB1B84240EDD1B753A00556C076521A1CF8BC42401D3D72F4940456C0550A7FB669C142405B1835C4960856C0D7D8DA12B4CA42400F209C2B170A56C0FF9EBA8E73D042400F098BAE330A56C00ADE81EA92D44240C50DCF0D8E0856C0F32D3683B3D942408042A6E7A30456C0EA21C71923DE4240C6951964470256C0CD31811722E7424061F135E0B70056C07F3413B692E64240B763CDF65BFD55C0B8AC00515BE342407164CF9322FC55C0D2DA4AB057E64240F111A710E4FA55C0FBC98F2FA5E742406C2A9B2F41FA55C0B148A2AF57EB42400D78F254F5FB55C02F22295307F042402BE52895CEFB55C0D94B22F4BCF3424019DA7C5300FB55C0A7C85B93BFF54240D73312D089F955C04A30353159F64240E5179728DCF655C06587388C0AF24240A6FDBBA2B6F455C063C4F6A86AF04240B0DAC5F83DF055C0A3EBD6E2F5F242409E6C3DD49AEE55C01E14C4C281F24240F8A173F166ED55C0EAF41A232BF34240E8F55E8C80EB55C032456683D2F2424022EFFD68D2EB55C0879EE1430EEB42409FF58F62B5E955C0C844C5A401EA4240B52CFBBBE2E655C0ABF8614502EC4240E00B691BFEE555C06091CF64B5EE4240E96C99DD0FE655C0E2985FA404F24240673FB10523E855C0B29013C333F642408358D445ADE655C0BCCE01E24EFC4240F8F01DB14EE055C0D3040E4433F54240311EFD4AF2DC55C0E63E9FE9DFF7424003D932A1CDD855C09DD56F12ADF74240D2C07632E0D355C00B0E625D65F24240CE3E6AAB74D155C05990B80277EF424042220F4483CE55C06766E9E8AFEC4240DA2EB1FD3FCB55C0CD6BDE8F58EB4240AFE713FB1DCA55C097413812DAE9424079335FB670C855C00835B51416E54240DF0B6FB3CFC655C09889CA5762E44240860CC85090C455C03FBBAF3C50E74240161D36B055C255C0C951BA8539F44240F918D28DD7C055C002CC3DAA5EF64240A7C3F24A4CBF55C00ADE0A6E1EF74240029F16E49EBB55C0462DB9B711F8424086E14DE09AB955C0F5FC05BE12FA4240293B0ADC3FB755C0D5EC126753FE4240216B8137E2B455C09CA5BC6DEBFE4240779D405461B355C06614555049FD4240AE45C4AD3EB055C060FAA570FDF242402B7EF0E9A5AE55C0BAE6B2F482F242402AC3ADA31AAC55C0DA96FE9DB7F44240C4D08540CBAA55C0AA79CCA1E3F442406E0C327F42AA55C0D3B3E48187F342401D2D1841ECAA55C0CCA9C27A29EE424094C755809EAA55C0B8BD13FA76EC4240133C5FFD50A955C0380F63BD49EC42408B8B9C9858A755C0E5F50424D2ED42403AF150B54AA655C01B3C2FB0E5F54240F5B2A7F23BA555C0ECF115347CF642407DDD2C2CA1A255C03BA8173BF4F54240790E318974A155C0F8F7B87FC4F64240A0850AE814A155C0DDCA47639BF8424055C55269F9A155C01931F0A765FE4240ED89D109C8A155C0DDAE138A64024340048B80CA38A155C0938B63AA05064340928E1D0833A055C05B434D6D9C0643405ABB25E4559D55C0113F659592074340D7218E63519C55C02F056A37BA0943404E247144529C55C0D72D5D765A0B4340B47433895B9E55C0B41A846F4C0E4340E3A76B09C09D55C0094E6B30881043400BCD0D28F69C55C0A43626D29B10434000F7FE410F9A55C041FE351BDA0D43401B326301329955C0C28AA81CC80F43404D90B4BC049655C0A9F41EC42F114340E3996F7C779555C0752EBA846F1243404176FCBDF59555C052A73062E913434041386843C69855C000D93EBA8115434024814B05DA9855C070D54F78EF1843403F766A82519755C0801507BCBD1843402297F9DEDC9555C00B709460B1164340FA788B180D9355C0A1D3F4293D134340B4BA30F4A69255C0FDFFEBF10B0A4340BBA8F3D1C59155C0ABA343367207434007BC6C4E239055C0A748975C36054340FCFC4125338C55C0AB9C5FE8450243409309B119B88655C0C7F1A17673014340DE47A8B15F8355C04C3A0B98BFFB42401F2E0A0F068255C0263EC60119FF42407D85EC2B6D8055C0289E50E739004340AEA2C768597D55C090286AFE8301434018EDD367937B55C001739AB65B044340CFA44F488B7A55C06EC7C7D14D0843401AF9016E5F7A55C07B17BA490A174340F5A244AB8C7655C08E153B2B891E4340319F410CC17555C0AE8311855D234340650D51899E7355C0D84D6385A12443401D821A47517255C02FD54168252443402C42A4A2CD6F55C04EF42EAF99224340B463A0E09B6B55C045158BA685264340A98F2AE0DE6955C00A543A7C3B2B4340A2FBA0A0306955C019A2D7AF1C3143400C9D917F356755C07BD7A97E2C394340283A2EF7756055C02B5AC579573C434069797A34D95D55C034E92D925342434029BE50F2AB5B55C0D4AA8CF1BC44434088225EB1B75A55C039C7026FDE4743408DD0EB71295B55C0B1BDA90ADC4A43404745C914095D55C07E677118EB58434075D42794965C55C07F892594C75C4340100FCB91C35A55C0A0BD0374845E4340C6AF83CA705555C0AB48F939565E4340622C92845E5155C02898AABC475F43403F46115F214D55C04A055088105943409833BEBA4C4A55C0C5B25D8BFB58434042B82E76A84755C040C300EB685B43405857968F614455C03299D0E90D6043406CF809CC9A4155C094F05E4AD4614340FDDEE569703E55C07CDB7A0BEC634340564518E5663455C06E215E758E6543409602FF65C33455C0834C63AECF6A4340BBCE6784653255C0F8E5892CEE6E4340343AA784793255C0A6E1818933714340F1BFBB05683355C0DCB8A126D7724340390DB509063755C00698442176734340F56DF22A043855C0204FAA3E687443400354B66B0E3855C03FA0A3BBBB764340232C060A2A3655C023DA145A317A43406B2C7D89673555C0B2C07F96CB7D43406C6922CB073655C0F770FA11BF8043406F29E22F153855C0E9740BEB35844340F0D833B2F53855C0DCD22EA77B864340934CABD2BF3855C0D54EE4645388434079EF2CAEFB3455C00709D5A3458D43406299564CEF3355C07E5E9E85218D4340F602092A8E3255C0D9C40047B38D4340ED4005468B2F55C0BC1F34252F924340FBC5761DB82A55C0A58BCDD0788B4340B82DE878D92755C08509DB7497894340DA6540D6F42555C0C5C47D76FE884340D81433B0FA2055C0A1BCCC960E8C4340C45484CE7D1F55C0751E4E16BE8D43405DEEA289791C55C019065258508E434014280B673E1B55C05CFF3D3DD88A4340DEF8A305DD1A55C066FCD2220F864340C6B8AE420B1955C0763BE1459384434030B5543E211655C005F9CB08D784434038DBF05A0D1455C0CBD2A22ECD814340A7E1FB96911255C079F2D89DE67843407D96B7D3BC1055C0708E5FE56F75434014FF55100F0F55C089775570F16F43407008210EA30E55C082F0BF3D06684340E7D7CEE84F0B55C0E4EFAD85ED64434096569AFFAF0555C02EC2540FFC6143402AFB507C710355C0A8245411C2614340D9D04C1394FD54C05AC057F38963434079D21B0C67FA54C03C1181D804614340B707A324E2F654C0961B777C595F4340EF91CA209AF554C082F480E11E5B4340257181FA96F254C013B3DCE5CF584340E28D6E564BF154C03FB3FF0C4E5343401E8E71EE9EED54C06B8A44D05951434024A47C096DEB54C0F8F1A7927A4F43407A02B8E6F7E954C035609E52DB4F43408D784D052AE954C02A10E0F063514340E2AFF70487E854C07A4E37CD1D554340A6F7718393E754C0CD5C6ECBC75643406D84F217B3E154C09C47762A1A594340D43D243401E054C08CE19B6B565843403144910C08DD54C08DF59391F654434081A6A560C5D754C055CF2CF7D6534340E8C5C7191FD554C08EA4D9FBE4504340906EB23780D454C082AF55DFA34D4340833939359ED354C0DE362321544C4340429DEA1290D254C0EE9DC8A15E4C4340338FC7D074D154C051FB9B21FC4D43400B5A754DAECF54C0C87536E1E44F4340F87BB8E3A4CB54C00DE050450F4E43409DDB6D5E29C954C081B90F86464F4340C1A3789B1EC754C030C8524219554340E9B6D774E5C354C05507ADE2C55743400F62FF70B9C154C0493B4121755B4340C1F7C2293DBE54C0DB150F431D5C434025974AA4F6BA54C0ECCEAA828A5F43401A1945E0FAB854C0EAC94C44135F43404AD6415DE2B754C068E29267085C4340C1DDCE1C52B854C02DD2016B76574340296A19B90AB754C0871420AF8153434001EE7096A5B654C0900409D5DB4C43407470EB71EDB454C04FAC75392C494340BBBC32EE59B354C0AF32433C55474340BAE11C067CAF54C0C44367DFCA464340F04C585F84AC54C07A42B2A1024543408C507C5ADDAA54C04290422646404340CC66259247A754C03105B669803C43401419BAEC8AA554C0401AE16FCD344340738AEF8C49A654C00FDE8AD3292F43409B66F187A0A454C02B742F5A66274340D2E67B881FA554C0E9A899FB702543402655DDE6C5A454C09A31FBBEC32043407DF9E707B4A554C0F42EA7E0681F434065E8AD4A70A754C0AF3E3761911E434077994447D3A654C08B87754CCF184340DD1252E747A754C0B3A40AD0CB164340E6A6650A6BA954C03FF16611B0154340454818295AA954C0E219EAF6BA124340D87D8F21F7A554C0F4F0CC40130E43409D4FA65594A154C089077D39010243401B607E2C739E54C00838DB85EAFC4240D9904C2CBB9E54C045E880A929FA4240EE023ECE939F54C0B605224AA4F842403029816E03A054C02A12AEAD0CF642403E6BF1C1019C54C08BDDD79A8AF24240A3881EFEF99A54C0A3F01861A9EF42403020B8B8F89954C00382746EE6E742405952DB0BC09554C0F778E63A67E44240E62850A7729454C0713CBF2114E142408EEDDFE8149554C00DB3EB0241DF424069A33684EB9254C0AF1F6EB1A3D54240B64F2379418F54C08B62233B11D44240485E41F0258D54C039780AC6DFCF42406032870AE08B54C00CA9926601D242400F3E8323328A54C079AB3812FACB424094FAB21B6F8854C0640E34B796CB4240F459545DCC8854C0E12B7059F2C8424093A8E99F608954C0C27F7D1870C84240BF10DEDE1E8954C08263599A5AC74240518DEBAD668554C00C8BCB042FC6424030807605908354C08742826C3EC34240F70CA603258354C0C24B090A96C64240D9CECFBCAF8154C0F5A03410E8C342402A2B6131807E54C04E08545489C54240017048AE697D54C0654BC076FDC34240BD3D012C7E9254C0D62940B105A74240F8C7405AA59654C0416AD1B458A14240AE182905FA9954C06F4A261317A04240872F9BDA33A354C00D44433B8599424088C9E27B5AA454C06143C256D2984240517475AA05AE54C00367210C158E4240B8A08D0B2BAE54C0B5BA4C48EB8B4240260C080B63AD54C07B500E67A9894240AD4DBB6C15AE54C073B33B63708842405727A56E4FAE54C0C3807DDC5984424076B9E574FBB354C0DFD4C486B7804240D7E06FB775B754C0B85ADE39BF7C424022B0859814B754C099EDE51851774240A5E5CADA31B854C09510709264724240F2A02700DABC54C0032A8A1F9A6E4240640AD80DFCC254C06A87A5F2EC6D4240416F145359C454C0E4C1F970ED6C4240BF5765C434C854C0285D7446BB63424071292E05F6C754C0A551C1422660424097D2EA67DDC854C04C6F3E43BA5E42400EED80B508CD54C07A22C840FC5D4240D71A078D91D454C0876E95F9D15A4240052E40D8B1D854C0973FEB94175842409AFA589ADDD954C0890EBFD20E5642406526024474DD54C0BD1DC6EDB6544240A59AD32EFAE154C07AB76368AB5442402A47C23665E954C0BAB5081AF94E424006E59C1836EB54C000E12D54A24C4240B3761CDA84EC54C0F90453AFC84A424082D645DEE0FB54C0BEB2F86AAF4B4240148817896E0055C0B475E88AC94B4240480B898A491055C0CA5716CA374C42401079B30A6F1055C0C99DCE49394C4240B1CDA82B0A3255C004E99022734D42402006F4ACA03255C0763709017F4D42401FC8E5C9E63F55C0C224CF5B7C4F4240D818969C705155C04689253614504240C7842BC0345355C05028251324504240B6D422F2FD5B55C05082F524214F4240FCBCB23E457255C0E84A0639375042404F2E5753C27E55C05A8BC9D5095142403FBE2F4BBC8C55C02FF66659575242407CB8EFA0969A55C0DA049ABE5153424094A18DC9AEA055C0A24C9578D95342400103000000010000000B000000F42A1F22216256C002F53D0AC43F4240C71603C64A6456C086F97D0468424240B89E75E65D6456C04B9AAFDF4E454240A6565105996356C0CBC7401C66474240D75AB5C2F26156C09A55795B454842409AD95C9E905F56C08EB0D71D93474240C314F1FCD45E56C03B8F71801F4642404617A73B2C5E56C002E69B6547434240BE95721CD55E56C0A7C6B7E99B404240196BB11B755E56C0478A6E6BD23F4240F42A1F22216256C002F53D0AC43F4240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('19',NULL,'LA','LOUISIANA','P','937','0106000020E61000000400000001030000000100000002020000023CB412486D57C0931E4709553D3E40273E3797C26C57C00149CD162F4C3E40C1C02E5CB76E57C0C631A2791C4E3E402CB88D24997057C0D52D2DD550573E408CA020C69B7057C044AD6EB2B65A3E406377C645DF6F57C028AD510D1C5E3E40CDAD7EC8537057C0C05D814BCA613E4023ACFEE9886F57C0A0591102B6683E40B8F3886A306E57C04A2CE717E56E3E40FAE8FF68976C57C009F0B3AE5D713E40B12E39AC076D57C0D8569E8B74763E40901C996CAE6C57C07667F84762783E404FCFA5F0C26D57C022A9DB07247D3E406239B1D0466D57C09F2DB9E3167F3E4057C05072BF6D57C0B9C5C2645C813E4071E6EA12296D57C0DA9A7641E7853E405F1C0D18126F57C087082849B48B3E4098434A98F46D57C089FC86C47F913E40A69DE979F36D57C0CC9ED6C36B963E405B1679D8636C57C0987EAB7D5A993E405E6E3316FE6A57C0674AEEB818993E401528C9F9576C57C08AED35FEB19D3E402B71A719D36B57C0DAD47EFBA59F3E403CD10CFC5A6C57C093EC10FEE6A33E40485673BA666B57C08D79681AD0A33E40CE998F1B406A57C036818DB64DAC3E40827877B8896757C0284C546EDFAF3E409694229A346757C02539D34DE5B53E40C0BFAFBC8C6757C0681F816F95BB3E40204C739BE66657C0C15B9D2D72BB3E40CB47CE9D976757C07AB32930F9BE3E40F57AB45A766557C0B976D200BBC53E40BEAEFC39406557C043D382925FCD3E4002E43536416357C01E82D0601BD43E4062179B76926357C0F3376DBBB0D73E405154A877436457C02C8F3E9C68D83E40E5C7F2F5636357C03863A57248DC3E40E7B99DB6E76357C03C23756F40DF3E40F9934717656457C09A51032AEDE23E400F7BBA36236457C00CCF9DE2F1E63E4069439EF4FC6257C093202DDDD0E73E401DA47ED42F6357C009DB8814D2EC3E405AE43B12EE6157C02FA6E8CE5AED3E4047D68991A66157C09B5D6BAA9EEF3E40834DC031126257C0B46B2240FFF53E400CEC9C92666257C0FA4D972303F53E40F749D753206357C04C360D206BF83E403DAA91F6A56457C05A203583F3F93E4058C2E974E96357C02B928C19ECFD3E40C78619968B6457C0AEBA87D959FF3E409B4F1E365B6457C0FB0F60AF5B033F40E078EBD52A6457C03CCECA6BAC043F40A5499BD3066357C01C83F769AB033F408763300F796057C0D7FAF471020A3F40793D1B92A86157C0B8A33CCCA20E3F40DC7F7C51196157C02E742D202A133F401BCD6775D56257C051A9B7E122153F409F8FB355C56257C0436F881A4E183F40F0C22198D96357C0146AE03AC9193F4052D61078A36357C0EC5786550A1C3F40EBFD30B5416257C08FE5064DC31D3F40ADCC9E14CF6157C04EB99C0549203F4011331556696257C0630BC903F4213F40A66F02D8D66257C0787E8676CB283F4043DAD0F5D26157C00BADB5F0C2293F406B338157616257C0ED2D2EEB302D3F4069A31116BC6157C0F09FD2A7A22D3F40461E9AB6DC6157C08719D5239B2F3F40C49AF7B93F6357C01E372505ED303F401E7AD47CEF6457C050D217B51D2C3F40B4F57DFF056657C09302F8D32D2E3F40E7C04E21996657C062D47C4A02333F40EFE1CA60CE6557C0EE54E4F5D83A3F404B5311841D6757C01A36D9310C3E3F4091E841E52B6757C0F9606F022D453F406CA33DE6766757C044BBEF3FA7463F40313D1968626857C0EA7F7AA32A463F40146ED44A546957C0C6C0ECBC5A4A3F40F9593AEC006A57C01A22A8606F493F407340D810A26B57C020E0ABD617503F404346ED90576B57C0A5C1742D1D543F402B92EF6CA46857C08E6AB40CBF5F3F406FA86FF0516A57C07AE18A32615F3F40C8DDC731826A57C0857003C504663F4019CA5ED5026C57C090BF310504683F40F2B7BBB6746C57C077806CC1856A3F40B8DF7957906C57C029395BFB8B6D3F40AD2A93D6FA6B57C0DD92683435703F40DAA5EC58EF6C57C05FD21D5349723F40510CF2D8B56C57C06A786DE92D763F40C887D09C866E57C04E059EF0AB753F408530FA60177057C00B260D88557C3F40695EFD200A7057C0E82E82E5A07D3F40668401FD066E57C092CA0B7CDE7E3F40E772F8BB2E6D57C08C7DCBAB4F853F4073D3627FD66E57C0697D9070A5853F4050EAD5C1DA6F57C001BC6F8BB3893F40F499B703DD7057C031504330E9873F4001CB02A6F07157C0FB5ABB90AE883F4011039C8AE27357C09B9010662A8F3F40F5E9C7AB417457C002578E1CC9933F405C5A0EAE4C7557C0744728D721973F403FD1D82E7D7557C0954E0A8B889D3F407CF3CB2C777457C0EFE1BBC7469E3F401AA6B68C277457C026058697ECA53F4041E4E58B9F7357C064880BB368A73F402813D94CF87357C0B39A8BC8BBAC3F40A576328BB77257C082C0CD5229B63F4030F42AEDC57357C06586CF562EB53F409832072E2B7457C00B8B56F567B63F4076FFA1EDD97357C023C7A6AA03BB3F40B81D86D0347557C034E87841E2C03F40422BF3CE9F7457C0690518D659C63F408582ECAF687557C0F937A72B5CCD3F409A0241535C7757C081C383E843D13F40442EE6732A7857C09B63121BACD93F40B8DDBEB3697857C09F32AD7120DF3F4018D7EA34227957C001A06BB4C7DE3F407B981F95907957C021ED810906E53F40EDB2D5171D7B57C0359A9F0E8CE43F40675CC056C27A57C052F7BC45EDE83F40F22A8818E67B57C045D7DB28DDE83F4048B4D45B177E57C04F414F875FEC3F404C34EBBB8D7E57C09A926F7E42F23F403AA8B81D4B8057C05F09D95365FA3F40C3BCDB1DA58057C015E782CE42FD3F407793C4A0418257C0579F8C4CA3FE3F40B08DE1B33C8257C0B87539CB8C19404085F2E64B448257C0DD75F13DD7314040051128A1958257C086E22D60F4584040752CB79CAC8257C0B1176C47F5704040C47C86DB7D8257C03A676281FF824040BFD43CE9D57357C01CCB71C7E8824040E0717F39C36057C0F251E18DB98240409C1FB216A95E57C01B4E8F6FC182404040E0BAFCE14E57C00D527BE07A824040322CBCC3A73E57C06796A6D356824040B912CC33E72D57C097EB7ECC278240401CD5AA6D0F0457C00C5571A54C814040B550B10A16DD56C0F15DCCB9CA814040D333D4875EDB56C00C8769D8BB8140408BE2DE744DD056C0C3379CAEBD8140401FA68E2962CA56C0F51F0750AF814040BB7540C95DCA56C0D29062B20D804040A9A59EAE64CD56C026A91C21CE77404052660EEDB2CC56C06BE17866077540404B1BCA29DECA56C0FAF040E9DB7340409A5D3946C9C856C001A361267E7540405EDD62A552C856C09A10C601037840402333A0457AC856C0D2E4CD38D87C4040DB1B39C329C756C047278996657E4040FCDAC820F0C556C08BA8DE766E7E404073B9FE3ED8C456C087120F5F177A4040D24CC4BF18C556C0FDC9D7104B704040D31180C61AC956C0E016F518B16B4040C000D54703CA56C0C5574BCBA3614040E391E5A5BDC856C0B55B302E296040400FF21AA242C656C0AA24E18EF05F4040855696DEC8C356C07D533196A05C404042303247F0C856C0F2E50047E75440404F2F13285EC956C0AB60B3EB8E52404085664F451CC756C02EA55739804C4040CE1C014117C456C0E6D2C796A24D4040CB525B1F0EC356C0A730F694A74E40409AD213BDC3C156C0DEFF262D21524040C2D544DB82C056C059B1E68C47524040D4BD6E5AC2BF56C06735DD7124504040E0B9ECBAEBBF56C0367B8414CC4E4040467EAE5E13C256C084EE907D994A4040184A2441C6C356C069C1689FCB4940407D859A22B2C456C080944F63E7474040ECEEE1610BC456C096C2B0086A454040DCB9A0FCB0BF56C078F09811824140407B7EBF7C7FBF56C02C9E88F6693F4040118EF23E44C156C03C136797D73E4040094B624063C256C099CECED5A03F40409D460064B0C556C098A711473E464040B005F0469BC756C06399B92D19434040A2632DE789C756C0CC37BBB4D53F40402ED2DA62C0C356C0A6CA6FE53B394040092D1FA0BAC156C0943039C7A53840406061981C34BF56C0B3AF6864FF3940405D501E3BCCBD56C071C730C95738404019679CFB15BE56C0C411CD0FA735404094A4CF9E98C056C00A6BEE55D83240409DC3181EEFBF56C0BE4EE47FE52E4040C30D2ADD04BF56C0FF665C23A32D4040C01336D88FBA56C08C8CCA274B2C4040D4BFBD15A8B856C09F2495FDD430404062C0247507B856C061B0591E9D3040401FADA098A7BA56C086166C74192740405BEA9D797ABB56C0EFFEB536162640409DADB05C31BE56C04F8E0974E4264040FCA1469DC6BE56C04C3E19561E26404027BF919DF8BE56C048E22599C5244040B4C5E9DC26BE56C0595B499F752240402E06297D8CBE56C0DDEE296C9D1C404013BC3F23ACC256C08573CC84F21F4040EDE43E2501C456C06B78E468CF1D4040C86CF727A2C556C047ECFFC8C31D404056DC518971C656C035AD464D861B40408D94EB8A6DC756C0E2E12B8AE51C4040A9D22E6F12CA56C09BECDCAE5E1A4040E6433470AFCA56C0CF7909B808164040DA85F98E06CA56C02E04383F8D124040C374DDE9F6C656C0D422F9614C114040307D27C751C556C0517BD69E09134040727CCD4377C356C0B0B7D9C238114040637F1F23E8C256C0BE21605C541440407B3629447EC356C016D093B5A31740406991E9C091C156C0C6B4D239C41540401457A67E40C056C09A05FE59AF154040C344579FBAC056C05AEE08E32D114040F97939E2A2C256C0835EA329CD0D404095E4B325BBC456C0C99A0E0D0D0C404078A3B0E42AC456C03DC597B68307404085A356E7B8C556C016B1C4B64B07404089EB80EB0BC856C0E4F0F2AD500B4040CFDF970D53C956C058718C6EFC0A4040B6C03DED28C956C0D4B0D1337B084040F4ADE14691C556C03B6AF3999B054040CDBA5A05B0C456C08CA0357D1D0440400ECC2AA5A3C456C038F10320B7024040B1C9E248EBC656C099A0CBAEF2FD3F4085F8E9EE70CA56C0E67247EF0AFD3F401724F110E6CC56C086DA5C5219EA3F40EDC61E95A5CF56C0B7DDBFA3F0E03F40246A42B7F0D056C05F49C80997DD3F40722872D372CF56C04C9762F8DBD53F40800B24F40BD056C02741DE409ED13F40C4B8AF17B7D156C0DDB67A3CD9D33F40A9ACA6BABAD256C0A91025CB8ADC3F40D46AF51B6CD356C01F6B680AF7DC3F40C7009C1F6ED556C009B3DB33EED73F409D00392039D656C0D71037AABBCB3F40A85032227FD756C0D4F32A9657C53F4004FAEE3D85D556C05D4A2ABA7CC33F40859074D4CFD056C0C1EA3B1620C63F4084E14334E5D056C0C8698BDD7FC23F400F43597616D256C0081454A1F8BF3F40193C4D1EC1D556C0E6BB8DDC2FC23F40F9207042B6D756C049F004BFE3C03F408A318C615DD756C03961ED1F72C03F4082793124D4D856C0D0803E8778B73F4024473C63E8D856C02BAC0B3494A73F408FECBA4523DA56C07A79DBB922A03F40EA02C5AC45DD56C0E33EAED880A03F40B8A5CE72DBDF56C093B43613A1A63F402D732AF47FE056C0EE4141B7D4A43F408A75157491E056C0BA5D7BDC379F3F40DBBF6A52D1DF56C03EF1EF3DB79A3F40BD9C6BA695DA56C04E7AC57E439A3F40620C7444DFD956C0637A39421B963F404EB8FBE61BDB56C0E234672710903F408D3A00EDB9DD56C02D4D5B4BF98A3F409727B87230E056C03B6E42EDED883F400B8203336AE056C0EB81037193863F40EC1AEE7181E056C091510C46FD733F40073E976C4ADE56C089B8FDAC9D6B3F4048963EABD1DD56C09886E01171673F408B71000DC6DE56C08FE4673AB6603F40D82BE14EA9DF56C095CF705B10603F4082E4EB1179E156C0425CFA2060643F40E87646D32FE256C05BBB97DFC3683F40691DFB333AE256C04A547098306F3F40E90350B55BE356C0B3999DA0DF6E3F402D5558B655E456C0F71A894AE16B3F409E30DCD4CCE356C052ADF21163633F405CD0B97236E256C0D886F1E8FB613F40FED11593D7E256C03CEC78916E5E3F402C4E7512BDE256C0BC2FF517D4583F40D6981C4F5EE056C0D66BBE0ECE523F40380E378E28E056C0EB2E58F5814C3F402817F0CE17E156C01D17784077483F4050BBA891A4E356C0762B3A763D453F405F8F46F796E856C0342DD7F416473F40385AAB1732E956C060472EFB67453F40FEFC6496C4E856C04B2CBF00B93D3F405FE5483376E656C0173F9618C4363F400F3BDDF1DAE556C0C08047FDB02D3F402EEA2FF2AFE756C03D329C94B0203F40B052148E28E456C0A5D329CD06153F404094D54C55E356C057D5B68FE30E3F40A5F77D8DA8E456C0B40F779C5B083F4086C7BF6F2DE856C01E4FFBD00F033F404FE0A08F77E856C08966467559003F404B69762278CB56C03BBA6D411E003F40281B6016A6C356C0510A7E661B003F402EB867081AB556C01ABA874E65003F40F1015A37DBA356C0655D16D36F003F406DBF22D6BAA256C0BB1762B398003F40B0788387FE9556C01A06243C61013F40E43344A1999056C0A8ACCD00E3013F409305D906597556C0D221ACDDD6013F408A66E0D7E46E56C08F556EEAE7013F4014744DD64F6E56C0A996CBEC63003F408218C395836E56C09D4E40D20FFC3E40B12A0694116E56C0BCD504F4B9F93E40352E3E56546F56C0E188F17824F73E40169DAC16E86F56C01F328D3D29F33E40CA8BCBF3636F56C0BBEA038415ED3E40B20B0FF6837056C02B81E684C9EB3E405AF3A473BA6F56C03424C6C8FCE83E4083744E93CB6F56C04ECB988B1DE73E4056526F15DA7056C0D6CBB34A85E63E40E4F16AB3037156C00ECEC995B1DC3E4090D4D5D53D7256C04A731A7390DC3E40E4FD6D52967156C0D31293BD9DD43E40B8A33C35F37256C06232103C40D43E4021C226F4FA7256C0FBFBF8000AD03E406DFBD955E67356C003905580CBCF3E4027903BB6C77456C04E5FCE652BCA3E4071D5BEF10D7456C0268CD8F387BF3E40E609DC12D67456C0FF72B2331EBE3E406B44F591B27456C035E47C76A9BB3E40E77812B37A7556C0A94F1377B7BA3E40466408F3047656C0D5622A7A61B63E40FAAB9E902A7556C0677F47FD2AB43E40561DCC91D87556C05E1DCB3D57B33E40605A4CD0DF7556C0EE761D03F5AD3E40F16E260F777556C0DC4FEEA306AD3E4023DEBCCF1B7656C0791855868FAA3E403E4405EE167556C03F331266BEAB3E4034D0484B707456C03089DA0AB8A63E4028996CE98D7356C0DC0B67CC42A63E401C0D7DE97F7456C0C9BE5B31D09F3E4024B372409D7256C04B868043CF8D3E401756F77D757156C0E128DA831E8D3E407956F5D8547056C0DD5B42CBFF833E4028129653DE6E56C0EE9A7550727F3E40485E1211056E56C0C1DB0F51FC7E3E401054EACEA46D56C00D6D6A143E7B3E40E1199F0B866C56C07A99A1556E7A3E40C5D7844A746C56C090172E18DB773E40B8863CA8BD6B56C079A9AEB974763E401ADA69C53A6B56C038F1C99D02723E40FD57C841396B56C0366771476B663E404B39B81CE66956C01FE6C26C0A613E4068AD9E59636956C03DF6D552F45A3E40AE7A5C778A6856C0DAD96273F55A3E40FDA72254B16756C0DF5291F7EA573E40E8C55CF2966756C0993FA5FBE1523E40981EA6F4C56856C03E32ACFCD44F3E402481C133E86856C0C3297C80BB4B3E40256F38710F6856C01E9940C3544A3E40C2A8214EC96756C0A215186BC8413E40D533FDCACD6656C00EF73BAF713F3E4093D8464B0A6756C050BF33B1CD3D3E40EF1FD383BA6456C0E99C0148E7313E40836017BCA06E56C0E88A3CDC562E3E40B8062B03977056C0858619E8283B3E40EA892CE7627C56C0E15F601E15453E40B5AE53FED58456C03C286964755E3E40319FAC14588F56C0752744FF85613E407202E119C79356C0EE9305DBC84D3E40A0B524822B9B56C062F771A6952F3E4055993AFA509956C0FDA90C8F92173E403E11A2A9A99156C0EF6455BBE20F3E40EC50E393238756C034D79BF9A60A3E409E6F2F25657F56C0929278ECBC0D3E409D6C44D8097956C05AA54D9BF5273E403A1A59C5167356C03F7B1B9FF91A3E406D4A229D5D6F56C08BFCDB83AF283E40F9215F39656E56C02E42B414001F3E4033290732D46A56C0A567B569D3293E406F4162AD8F6956C044C41A5D571F3E4026B095B5E06D56C0EDB29E4F230E3E404D3D716A557656C04790F548BC023E403171FFC6887456C0730345C787F33D40927F0BD5C26D56C04480FBD72AF83D408AED8DB8946D56C063D02061C4E53D403D8D6A8E276856C06CFC2F892CE03D40AEA300C77E6556C017308D9DEDE53D401185589DC26456C01AF90E344B023E40A70AB408E55B56C0415CFE295E0B3E402A56372B085D56C0A82B6BFF58FC3D4008A06BC22D5856C07ECA217F87F33D40659DE54B965B56C077964F08B6F03D40D95C79AFBD5956C028D816DD8FD83D40734F4534F45A56C0ECA50944FED33D403080566D4C5756C0812AAD64F9CB3D40AAE4C117B75A56C0F4967D8F6EC83D40B43158FEDC5E56C0CD21170BB9D43D400C804A8D976256C0A3C6A70A36C13D4015E0BB38A36956C00BFD509F53C43D4097A824B5F16556C044A2BC2CFBB53D40B1BDEC57286756C01F8111989FB23D4067D5DDACC36056C00ECCB93124AA3D403BAAB208AB5E56C05AD3331ADCA23D40FA4078D7446656C01A3F50C547AA3D40230D661F4F6B56C085E11045F5B33D409DEDF941806C56C0775DAB2DAFB13D4032A41A1EA86856C04DB5076164A03D40C584DCC89C6E56C04CD348CC6BA53D40E4672F2CE86F56C04E63BE352BA33D40EB65BE0A496E56C01D999A9E249B3D40512498D0647156C0142B4E23399C3D401BF75936DB6256C09D2A185EC0783D4073C390755F6256C0FAD400A5C5663D40FA21D1019C5856C0A5C56F4CDF653D406266C25D925556C0E381A2C844573D40BE8B8315F25056C09AAAD417C5593D4032606BB7CD5056C0BFCFB53A3D4C3D40A50A0CAC604C56C07FFF00325B593D40965037E6504856C0CFBD9F97774A3D40431635C6B14756C0E6B9CE0C3E363D40EC2F3AFB204256C058D17DA131393D40AC4870224A4656C02F6C8869D7293D404BAC2038654156C00E77D78CA9253D408F3E753BB24356C0EB4227D4D4153D40E7FE5745194856C085F5C89CA3223D4026974542214756C0404AC89B40153D409405FF86DB4956C0E714E0D0A50E3D409CB2CFC43D4956C0FB931A0945043D405C556E336F4F56C037EE6AF0041F3D40D8AA04D37A5056C090946CFE380F3D40209CD3EA455956C040336D468DF03C40FA0E0CB6D95056C0DDD08D42F1253D40304F9FFA6B5456C03C388AD7202E3D406253C236BE5556C0827DC238C01A3D40B5CCDAD7DF5856C0EDCC0F6CB2193D40D3DD0F1C295956C06D0BEBA471253D40359B5488E45D56C0973FD8D360373D40800A922B625D56C06B57CFED77413D40F74AC38C905F56C00507DDA4283C3D40D150B865A76756C0D0263D3892473D40210D1203166756C095D6CF19EE543D401FD2885FE07256C085831FFE91523D40AC7975BA3C7056C02ACBE45BD15F3D400311E27E977456C085ECC7E8C06B3D40234D0E5D527456C07623DEA6457A3D400AE4090CDF7D56C0890D887101793D407DA5620C347E56C0644A221DE8803D40360E0AB06D8056C0957431A4727E3D40B96A4CB93C8756C0E99D8309C98D3D400185625CC98856C057673CD5A7883D406B0894FCB68956C04C3F2B1566983D4084286243528D56C0E4DE8C72738B3D40B72DC900258B56C04EFFE70AF67E3D40CF49E1324F8256C0DB5D2FE678723D4046F1C2748A8356C06D8661F3A36D3D40B40D2892EA8156C04FFABE18CC5F3D409437EF94948356C05C996E67F7593D4027EB63B21C8256C09EFC7546124F3D40FE2FC71A258756C0449E5A995C523D40BD8515F7FB8456C0A986785BEE363D407C7D3653C28256C0835993DA42393D406C81CFB6FA8456C09B21C24C2B2D3D40D9E2BBA9938E56C0E4DB49B642193D405584E5ACE49056C0EC2E9733452F3D40142FFEE88B8F56C0EF157AB836413D40BA7D1D2DD89156C0DAC9B8CD70463D4069040DAE2E9256C0D304BC5DDB3E3D405CA22ED53F9656C0441EB2981D503D40504DC11B5F9956C093CB8392B8453D409D11457C099A56C084A75A3274533D4044222141D59C56C05AD83DA3395A3D400C4822857E9E56C0BE5A2921CF4D3D4046DBED2E1CA756C0573501D6164E3D40C7D6550D52A556C07199DB33CC423D403DD0CBD0C2A756C0C3BC034714393D4067C9BC709AA956C0308EF65019413D401CE13DF5D6A856C0CDB397499E293D406074AE56C4AB56C02D606D5D922E3D40E45B099950AB56C0B8AA3338E9233D4002883D011BB256C0689E81587F203D40DE115EBE73B156C02FD88DC21E293D406A93A464B8B556C0024A9FDBAD2E3D409B2994297DB856C0F3AC046F2D233D40002CE20DE8BA56C0A19B169F912E3D40D6E35D601DB456C0453690E793383D40476C282063B456C0330296CBBD413D408E97DB2B6EB956C0032B62A985443D40A58F9611F0BB56C0EF1A78BAF0573D40A519684504C556C0782C8A262A5C3D406959E9498AC656C030C323196B503D40C83089D8ADCD56C03A33C29BEA673D408AEA107DD0D056C07844759D557D3D405D5BDBADB6DB56C0E9EB4201768D3D40CD41C83910E356C0E59B9F911C883D40880AB9771AE356C0539B629862A43D40A388FFE02FE956C0921E5CDCDAA43D4084B152BD68E756C0948BB83BE6C43D4084EC2B973FF756C04633BD9ED0B93D40F5A2463865F856C0C88315AE15C43D40E588C3332FF656C099B6DF1BF3CE3D40CF6A2352BBF456C0BE39E7C171C93D4016C934D1F5F456C021168B6ECBD63D401C2C17BFE4FD56C01D4DA0F985D73D408A8D8F004BFE56C078C798C659CE3D4016C81216C70857C05F30ACE111BB3D40F2B4F693530857C04F3B90CC05C63D408C28C0DCC70C57C0B814DDDD5BC33D40816EED0FD30357C042594E53659B3D40C6E1302D081357C00854C26DA48A3D400E5D1E0FE02657C02DA1C939B0963D4067C4CF3DF44E57C0BE8B3179FBC93D408FD3891C356E57C023F5FB4B40C23D40EEFE0408517357C0810BF54CD2B93D40A48BFEFD977957C014EB66F05ACF3D401034F52FA77257C0AB747BAFBBD93D405D7F92DCA97057C04E333AC794013E4017971BF59B6D57C007471D118C0F3E40BEE83A55D36D57C023E44D838B183E4014DA10D4586D57C076070E5B6D1D3E40FDB47C129D6C57C0E99FAD593E1E3E4099FF5632B96C57C042FC841035243E40086F8370E96B57C044C31ED036243E40BFA01C50BB6B57C0EAA9A32C00263E40EFDE65F2C96C57C01649C80CA9263E40E4E6A5B1906C57C08FAC58C2062D3E4008E2DCF2166D57C00074CF805A2E3E40FC0ACFB3C26D57C0059D219173383E40023CB412486D57C0931E4709553D3E4001030000000100000008000000FC2F5A2B0C0157C03A2895CEB2983D40DD0BA95CC3F956C0E8D24968A3A63D403C756A2D45F156C0D802A02420943D4069D49146E7EC56C02C17C2C1C7933D400B67A42CF5F056C0024F68DBC4883D40CC9E06EC84F056C08938526F987E3D403CFCB37857F656C0787C0278B17C3D40FC2F5A2B0C0157C03A2895CEB2983D400103000000010000000F00000090463E2BD8D556C0274EE87887573D40DB6614473BD356C0E33ADB6103513D40F0E83EDB7FCE56C04925E765A3613D409DE4A1171DCC56C013956144304C3D40C6F2C41257CA56C0274E5358DF523D4082872655F5CA56C0C0CFE3089F483D40F5769F9708CC56C018FCCBE8E5483D40FA18F758D4CC56C00DC6E920D84E3D40DA89FBD87BCC56C09E38466E0F463D40A9E6A112C4C956C0C72D118E3B443D4051936C7479CA56C017C82AD8C93E3D401CB30BD09EC856C040651E6F8A423D404869C02D36C856C0C2CAA1A11C3A3D403D2399A5ACD156C014A475F907413D4090463E2BD8D556C0274EE87887573D400103000000010000001200000093B66811D0BB56C0C50687FF53423D402ABB5D5622BE56C0C590B3FCF93D3D4065B1203408BD56C03C7BF412E7453D40EAE632F8CEBE56C0DFF6D7C7BE463D40388AA896BEBE56C072CDBBCA4E383D4076DB14927ABC56C0AC821CD3F4393D40BEDBA5D291BD56C0EF71E08D902F3D4003B3771735C056C00DAFD6602F2F3D40BD37EBF8A6BF56C0B82996A18C393D4092269B3FD8C256C01A207C0B15363D40A066F55F1EC256C01B6923A38F463D40F2A1B10555C456C059CED46DCC403D40437703408EC356C05F1AA7DADF303D40E405F90CD8C756C0DDBFC641223A3D40D757142E29C856C0209FF3C1234B3D40D46EBFBB78C056C0186FA5D92B4C3D40936616DAEEBF56C00BAA2C90E4523D4093B66811D0BB56C0C50687FF53423D40');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('20','ME-EFIS','ME','MAINE','F','938','0106000020E6100000020000000103000000010000008F0000001C0FE6E4BE7151C0C10611B17D09464099A85F11097751C0AF410F0900004640C0221A65A87251C0A0377264C7E04540EF2C3C25257551C0685750A72EDD454055BA9DA6837651C0F905C32346DF4540A599286A277651C0EEF976EDD1EB454070ED812EC17851C042293D2538F045406946FEEACC7951C0F5ADA7B736E54540032C8B0C447E51C027F2E19869E24540CD1A3DCFF77F51C089BFDA74A2E44540FC45C513317F51C0A121DD2A41EC45404C593395B08151C0A113CBA73CEC454042A7AC33068A51C0B2B0978218E545401479DA4F178F51C050605B2DC8D7454021B5E12A398E51C0E3F0BD03E3C945409438B7F2DC9551C06ACE83E377C4454008DC3A536B9751C0C4D1353114B745408A229E1B3F9D51C040E46674BBAC4540AA76CE027EA251C08A1E52D0F8AA4540EE0D3A5F9AAA51C078977D8BA78B4540B20E160F65B451C036999A78998F4540110B79B327B551C07E534AD15F94454021B4F7960BB451C0947617C71B9E45400EB12464ABB951C07B37C476F8A345404AB45BA5F8B951C03EECE434AAA6454091E5F68E0FBE51C01D40EE89E5AE4540C06AC390A9BE51C047539927B6B2454047A7AAEF88BD51C0C986838614B84540B746877121BE51C04A75C3E32FBC4540FF5C3CD164BD51C030F8710019C2454069114392B6BD51C06C09743E18C445402D060791C6BC51C05763B51C44C64540569118B237BD51C08481A1DA35C84540098368F453BE51C08B1C08B931C94540754B6F1B01BF51C02AC2F6D844E5454074686BD88CC051C044600E5F1D24464032FB13A6D6C151C0280E2DA89255464089BE66C099C551C08F56EA8A96A6464043715D8366BD51C0104CFDF35FAB46402934CCA817B851C0DAE6D564DB9C4640C74E4EACF1B551C08D51E8019AA34640FEB180B702B451C09BD2C21666AD4640DAE6DA7F10B551C01510935003B24640589A878101B351C0A146A20A6CB64640A58AE5AFA2A851C0E840AEF92BB246401E2DD80313AE51C0669C217DA8C1464054EFC86458A351C06D86A8A490D44640E4D84A575E9951C0F027C3006CDC4640663EAB3FA39A51C0716368D828E54640D4DCBEF2409051C0E94E589712F346405D062076D68F51C042B3EB4CE9F8464075B4AEE0DB9351C0A9E6970E01FC4640C6BBE1E3EB9151C0161674C0CD064740689B02A8829351C0F81E8A428808474012D36F44AD8E51C01FF94E73971147401DC805CF249251C028ED4B165A184740E0C4584D3A8C51C0A44A6F07DC2A47407295229EFB8251C0A5570BF48A364740F3D64EBFE78051C09D2F4A5D094947400D864DDF097F51C0002595AB7E5847405C45A52BBD4E51C0CA236BDD06BA47405ABE65A9014351C0963CD31905B647408783CF87594251C06E93D939F1A0474045392D95453951C01BFB522E54974740D84B2567F02051C037D041ED02A64740B8B2285A0A1951C0416D41107EA44740AC09AD966D1551C057D3346FBEAD47402764D389C50E51C01609483113AD4740DDD689EB9FF250C037B24CF7CE874740C265BF43F0F150C02755145A39F94640E80F4CFF5BF050C0326A0F8052F546409C9F953FDAF250C0A2CF3CE471F046404CFF967899F050C00D58F54DF5E9464014B3303A65F350C07F534771B2E54640757358716BF350C01A32626DCCD64640455FF56A30F050C00C6A779663D4464019CD6847F4ED50C072D82FD234D7464096918E755EE750C0D0A2842877CD4640F3ACDB801DDC50C0429E8D0DD9CB4640216ECE1FA1DA50C01692887974C046406358974843E050C0723BF1372FBE4640E78B489BC9DA50C0D8FDECED1BB04640DB4EECBB96DE50C0C6E2813AE0A34640B9A266B31FDC50C0E8E19F4944984640B19345671ED650C0C2D521F6A58F46404B01B3C68AD150C09A2E65716597464077FFB9329ECA50C0F14DB87800944640B613036DA4C950C0D94D805D9D8F464077A0EAD52EC450C00CE41833CA7A464030E751A463C950C06A031751C9734640CF25628908BE50C0CE2B085F116A4640DF88C9767EC050C01D403985EB6346403BA513C6D2CC50C09B75561AAF5346409AEA24F1BDD350C0BD5BF593A6534640EB24F55ADDD850C0B9BC6DCD7F5846407B4CC1288BE450C06843E82E964C4640AF40CA0B9BE750C048FA4D9226454640DB44D002EBF350C021ED70CBE9464640EDF7D2A7F2F650C0B31A8A2D9E4446408F23D2489AF950C06844A938E83946408906BD51F9FD50C059264136513C46405D15AAF2A8FD50C087109B91AE404640934B4B3423FF50C0C91CB3540E3E464036E71E950C0151C0C30DE64146314640C087C7A0C20451C01C733FE0D0304640E936AE8FB80851C0B67B1A92D43C464086DFCF24B80F51C07DF7DF8DCD3E4640D19317F0471751C0ABDF12AF37374640FF4016B66D1B51C0EB9418298F3B4640B5C4C804572351C0E997C20B14334640C3CB7BC2EC2151C0E2DF4459192546407E840EA6CD2351C0383A20FC432146400920AB3C612F51C0B18CD88B542C4640892C1BC3053451C04CE3264DE929464026434DC5143451C0BB3F2BA1FD344640517BD241722F51C0DE5E08B6EE404640192AC8A6B22F51C0D7752F71B24646408453C413B53451C0F6E8D9A8F04D4640DC5D9059B93451C0222C72E2005546401B8A5E37143751C08DCA4347344E464091CE2AAEB43351C0459FCA6DEA4846408FFF4787F23351C008D8AFD64E3F464077303932633D51C0B1AE2E1D15374640F0D3D8B10A3F51C0691551D1B322464083E31CF75F4151C0239C30733E1F4640EB0239EDC34451C0A399C027D708464056B6D066064E51C0A52CAB5530F94540CD7E5B2BCB5251C0081316B599F845408EC8654C2C5651C0FFBC794A0B024640912B6C4C3F5951C004D2706537034640798D554AED5E51C0362811768EF14540F6A4A586B76551C00329D37624EC454090394765866A51C0FEFFF1B015ED4540ED5BDB87EF6951C09D243BD478FD45400A7B92483A6751C0FF66E76C4D04464085D6B3E41E6E51C0490787B60FF8454084B992E3E76F51C0070129205AF24540A9B1D403616E51C056DE61BF69E445400B6B9EE3057051C0EA0F25857FE14540BFE7D764C57151C05A8C135C48E545400B0D0D69337351C0D930455E7003464005C37784127151C0331400171C0646401C0FE6E4BE7151C0C10611B17D094640010300000001000000090000007E4B82B2D31851C0078017D449304640438FAC8E6A1651C07D44F5D210334640F7B02DAFBF1651C05D85ABCFE4364640FC741703470F51C0A2793E1302384640E93B7A928B0A51C0221B7DC1D02A4640422BCA49801351C05E5102C01F2546405ACB6A8A861451C065F18167CF1C4640DD4980F4C81951C0D5A0539FA92246407E4B82B2D31851C0078017D449304640');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('21',NULL,'MD','MARYLAND','P','939','0106000020E610000004000000010300000001000000F2000000BBD23C517CED52C0FCF0214028534340E0F066B140ED52C0112D6B275F4743405C53F52DB9EC52C028442192493B43403E0609D163D652C0F2026004483A4340D0E72325EFC552C07AA59B13AC394340F2C89B72E9C952C092AF3DA0532F43405B1E35B5A3C952C0B2931E8A0E2343408CE5D0C8CCD052C095756CDACB194340247C965BE0D752C00309F754D608434059922CBDD5D752C096B5B69C270243409A80CEC211E852C07413D3A98EFF4240D6E47EA576E952C0DFF0E74F31FC42401945787762F752C024AC307269FD424047C263AD3AF152C0836E77A9760C4340D64970D76FF952C0FDB4F54668164340C99873509DF552C02E4E9FE1A81D4340E1EDDEF21FF752C0DA4504C2BD1E4340655A2C0CCEF252C04EB6B7BBC12143403B9AFF5641F952C09A65C8C126214340FC81855AD0F752C0D69E65B0BD2D4340017CE91CBCF852C0FBD56E0E1330434058A427FEC5FC52C0A7C129611E2443404C7C3923ADFF52C071599DC32D24434022E63B484F0153C049D137DF372943402813B3EC2A0453C0DDA637C828214340EDBD25F1CF1253C0E8ABE081F1374340ECEF3271AA1253C0CDAEFCFE4A3D43401E2F46C6470C53C0484AB53190454340576642D00B1053C09EFBEF912F4C43409B8E3DB2050253C02C75839F38494340C1FDBA32C60153C0C81F00B9A14F43409E4D8C34FB0253C0EC1E85DEC54B43407F34F698D70453C0A0E92FFF314E4340A4CE7CC2EA0753C0B227CCD8A25A4340A424BE091E0B53C01A0D297EC75A43401ECA1B54450E53C031534CFCA661434033A00E1B131153C05802327D8F624340BD510F3E961553C033FCBDA8F9564340F24F7DC0691653C0D96359867D594340EBA0D3E2691153C00B81CF4EC46A4340243DF94F780C53C01A4805B9F761434079A53FED970A53C0ADDF06F2F464434050EE766B4C0753C0819F965E5A71434031616784D50453C0367D9A7CE0714340E7E7386A900653C0B7977BFCF57243403E5BF02B170653C009070F1560794340B3ECDF2D440753C0E759A6B9DD7543409EFF8304C20C53C0908309919A7C4340FA4355D6190753C0E4B2BDC0318F43409DF1642D2C0E53C02861A361E88B43405C537EB1440F53C081E3147DC29043400EE2378EF50D53C058C955353C9A43402C00E5BD2B0753C09D8D95DC23A94340B8E2CFB25F0253C037755FABE2AD4340B52E688E5CF652C00EA5E44B8BB043406777332A9FFE52C091902D5884B243403222E488F2FC52C08723636653BC4340FC176B0F5DFE52C053F9E9EA16C34340E0E7E538FD0153C074C7A81AF7C843400D09AFE0000553C0B43130D56FC54340D46BA468DE0953C05BBC1F4076B343406E9AF9537C0E53C0F36E8DF2FFAF4340CDAD4408471753C031814E895AB24340646AF9A6841953C0FA4DACAD999D434029E3CD98FB2153C0E8A2E6A7119F43400AD5CA45A32653C0E262A50336A143403DF04AFE252453C01499E187A39D4340F1ED701FE82453C0E62F858B5F994340CA23E763D92653C0B961400C2E9743403A724EA1112653C0C5F0906F53944340F365551D122453C03F8938CC2299434050B00B891C1B53C076FB47DA298F43407F3D1AA3301E53C0F72CE1DA4474434080CDE59F1F2353C0AC5F15D629614340B78C0478982153C0BC2C4721D95A4340BD9F656E8C2053C0184F2222D84243401D7E32BEAB1853C03705DB8919324340471D7CA1ED1953C086F2856E4E2C434035FB48E4F31A53C013928A310A29434043ADE0AB2E1E53C09BA86AF3FA2A434050F18DB2432153C0E542126F833443406F46FB6C672953C078A8A18EAB394340A2B5ED17FB1553C0E4BF8BB5491B4340360E28131C1553C0049BF7C3DD05434018DDCCC1EC2453C001CF648A831C4340886B61A7A23053C0E05DFC1F011E43404FAE2FB3493753C03E5B2EBC1B3243408A8A5F18213A53C0F150E1B16526434083E0CD1F413E53C095D45049632A434000F8A545224053C0EBDA8B30A7364340F552DEBB1E4E53C0C9EDCE5405324340A4C6D45F5B5053C04AAF6DAFF4344340EE709DE2C15153C0823B6A405D3E4340F52C31DA4C4853C03C294797F9524340249EA9FAFC4753C08C7195EFC5564340E3E24F37F14553C052E796E91F5A43405189FB95384553C097C24407925B43406F8D67F2A24353C0392D9848275B4340007A3F71F44253C05235E9C6045C4340D2190FB2E34253C04A3B7ED9E464434035E31C434C3A53C02563D8CCEE714340D8B7ECEF814053C065C9C2BFBB7B4340455BE992B14253C035F35E5B2C7F43407304173AD44753C02F6F37635177434013630A3CB64953C03DAE667E817B434007B22D63944F53C0A9D1DB3BED7C4340958805455D5053C029851C148B834340B3FC4670C15453C0E263776C0688434000496A93285653C08AA4928AC8884340CFB2751FB25B53C0ECEFE7A78F8843403E8554E2665D53C0630478635C8A4340CD008243A75E53C0E2DDB7FD518D4340348E4006D16053C0E9884FF9F18E4340DB2D04840B6153C0EE75B48F2A944340053F5D3F9D5E53C0CBC9342DA9964340475A139C8C5D53C003A61185FF9B43402FB2C71BBD5D53C0C7156C22559D43400B5F0BFC995F53C0B3171D7B00A043404DC39180AE6253C04ED2A6F86FA243400CBD3223656453C0167A261635A64340D33D3868706753C008C0627460A6434093FEC1AE796B53C07F13FBD0CDA843409FA4DAD38E6E53C0641BF78EADA84340603D1376017053C0F0DB602DD5A9434035E27076467053C0B8713E0C57AB43402D7E9175B56F53C0BFE082AA20AE43403B19A4F6657053C055A88EE871B0434061E1BFD42E6F53C0AD5E0E88B6B2434067A019D5696F53C06F02D9E6A3B343406DC8C476727053C04D2BA5C46BB64340E11C127B587353C0E8C3202356B74340A5724F1B807353C039E0288252B84340ACEB935AEE7253C0EDC840A1B7B943406D9354DB777353C049B6E21F48BB4340D47580393F7253C0CB80C2E0C3BA4340B8F005FB2A7353C01C6A1FBE8BBD43400DEE7018617153C0678B2E3DC2BF434043C7A2DDCF7453C0F222BD5B38BF43403104F99F437653C0EDB039BA41C04340BFCBE81DD17453C06F8E26798AC14340210EA71E0D7553C06B488496BEC343402E831A3F787553C06524B03647C34340350A22A0017653C088958D5516C4434052F1EE21567753C003B4AD17E0C14340EC6100E3A67753C0967E9572E0C543400C0E5065F47853C00D88EA8F6FC7434010E8FCA4A67853C0ACFD0DEF3FC843407B1DCEE1967653C08399AFCF60C84340C4729660C07553C002A2E88E4FC943408A2F6501EA7553C01757AAE97CCD43406D5BDEE2C07653C0E0E8FFC913CD43402B317026DC7853C0C266B8C6EBCE4340358044E6017953C01E74F8C8E3CC43400DE772E7CE7953C0B47B9CC94DCC43407A33BB2B127C53C0873453C521CF4340E51C628CA47C53C004E761C5B8CE434019F1B08ADE7B53C027551DA9C4CB4340C77E898B7A7C53C0FA34FB6902CB43406F262B0EB67D53C0FF7CD5E53FCE43405E04D970B17F53C0CE1F7606ABCC43400B6FF7D5B08153C0D259BA20BACF43403E5714A2098653C0C1F5A0117AD643408901BFD0B58B53C0BCBC7F04EAD8434040CA0953138D53C04DCB062685D643409CAB51F6908E53C0637B164445D64340A0F185B5AB8E53C0965FF9E64BD443404A9629987E9053C05D101FC811D24340CFCADE17799153C0B545E80B28CF43408168D55F449653C014B0D1E0FED14340B0ADFE7FD59653C031D31082F1D043406A9BD4C12B9853C057D24000CFD04340E80B56E19D9853C087E87CC3A7CE4340285AEA25A49B53C0FB2E095E7BCF434029FDF520DB9953C0A63DFFE736CB4340BD446D25D79C53C0445A02C3DDCB43402B5AAC658E9D53C03CD88BC458CA4340A531C7BFEE9A53C0FED3060F53C64340E540F621899C53C0520E604D2FC64340B569B4012C9D53C00E9BC26F51C44340D7B30043CD9E53C0AC4ABD508DC243409F5AFFE58FA053C0EAF5336D38C34340C70110AB1BA453C04C1FFC88B2C24340DFD8B9EFADA653C057FA0D4291C44340E6E2ABF2C5A853C00ED51960D5C34340928D1B948BA953C022FE671DDDC443408C9BDEB5A6AA53C026FBD41BBAC443408AECF91AD8AD53C0BF3CE112A0C743403A84A2DCE4AE53C0C4E6296ECFC943400457D19FBBB053C0B7E7F92B78CA43407ACFA30185B153C085A625C801CD4340A0DE4DBD1EAF53C0B1C002E8ECCD434025FA047DC0AE53C00C5067C68ECF4340F42E155DDFAE53C05D516B6540D043405A14CCA020B153C0BAE782E334D04340136FB30174B153C09D15188076D24340B11522E514B353C024B46222BFD043407A293D251AB353C068192705C6CE4340B092E368A2B453C03B4DF42AF8CA4340555D7A869EB353C01BE4F1AE8DC84340E6DD76ABA3B553C09E5094CF1AC843408644EB70BBB753C0535904184DC3434026B38C1F25BD53C0E3B9E64FF0BA4340C75508A21BBE53C09290A39821B843406A48C16E20C353C0D3B110A9EDBD4340A02A60511FC453C0814BBF882FBE43400C0B973285C453C0CA83E0CE44BC4340E49F5EB8B1C653C0B1C5D28F45BC43405D581A9730C653C0049DF0F178BB43405ADFB938A9C653C0BDD0B75941B9434055983CDE68C853C0CCB7584761B54340320DF6C21ECA53C0D29872A9FCB44340F05A8BE46ECA53C05CC580125EB24340C870CA97A6D053C042D20F4AA0AC43408A6EF99CE8D153C041F1CF94A1A943400788BBC1E5D253C0A4AD602078A6434079325B0D28D653C0CBB0324563A54340F5C41058A1D853C075398F7178A243408D709508C1DC53C0FA5136E1259B434066B06D2B84DD53C01F4365414C9B4340239CE9F159DF53C07A50A54344994340892BF53AC8DE53C0B13BEBF031DC43404CE7380F62D953C0C6FDAB7712DC43403AC276F487BB53C03FA33F8975DC4340B793322756B453C0323EEA0E8FDC4340714DE548A09853C070901CCBA3DC43403926BB44699553C03C17782FAFDC4340AD188104248653C07D877CE8DBDC4340EC391066735E53C0CB3E0F9D1CDC4340353A3B45B95D53C070B5495E2BDC43408196AAB2254E53C05FE682383FDC43409CF094C5CB3F53C0DC8B5A2D46DC434046B02C6A973253C073C7F11E52DC4340B79ADF2A782453C09483E9A731DC43402EBBF377EB0E53C0BCBDC4B265DC4340670B3B08E90853C0E39C390272DC434006D21D4BA1F252C0DA8544A4A7DC434088D4593E6EF152C094091F070AB1434056C53B9BEAF052C0BA920803E2A543403C4CEE59B9F052C0C3465401BA9F43401B9235362AF052C00726D2EC219243405D4F51B15FEE52C01FFB58B9466A4340BBD23C517CED52C0FCF02140285343400103000000010000000E000000E11AA34DBD1253C09B895BFE33744340D3C974F4D31253C0959538F1DC7B434005119CF8AD1553C0F7AA1D93777A43403B5FE6B31A1453C0B06394B694784340CC3C8AB1A01453C0202824FDC2744340FEAB59F5E61553C0F3370E3A4B7643402A5732AE141553C0F27690E420704340011022F1031853C0B6C49608576D4340505AFC7AD01653C0FBA85292A97A434016CE1FD92A1353C0604386E535854340EC72DC4FDC0F53C0A254732F507D4340A6617F29C50F53C0455BA29B3B7643404CB8C2EF7B1153C09FCEB81584794340E11AA34DBD1253C09B895BFE3374434001030000000100000004000000570AC6E058C452C0CDEAAB119C39434048E7B37CEBC252C069B15D908C39434097B56AA896C552C0DD6FDC015A294340570AC6E058C452C0CDEAAB119C3943400103000000010000000800000079EB428A4DD152C0BD9D8EF98B0343406CF398459FCF52C093DF1DF7DD044340C990BA9F66CD52C0C82ED8EB110C43408630321885CA52C08B03C4353C1A434031F4BA8904C652C036FB502200294340A1DA75590FCB52C0F31FFE44E90F43405EDF418580CF52C0D592CFB8AA03434079EB428A4DD152C0BD9D8EF98B034340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('22','MA-EPICS','MA','MASSACHUSETTS','F','940','0106000020E610000003000000010300000001000000590000004ACABCDD6FD451C02B4F7850D7E24440F8BAA142BFD551C00A7E8C0E68E44440B77868651CD651C0ED4CF2AB15E84440C5F1DC2569D551C0C05DDCC8CFED44405FFC5468EBD551C01E6929A719F044409ED5AD4751D551C0C4791026B1F24440C43F3EB092D851C0934DA764B8F14440ECDB135479D851C080B5377E58FD4440C451FAB43BD851C051097A5BC101454086A72DE6D5DF51C0C883E1372F014540D3A766AC0FF351C069BEB1138C004540037FD58C59F351C04A2461114D024540F1EB8204140652C0275AD0654D034540D24EA5E7B90852C00CE6A8246103454003975E0E7C2052C01EC4E023F0034540079A0EF78E2452C0E1F59522DB0345402BEF68F83D2552C039B4B203C4024540E1720F9CE62652C0E6E81623EB02454039DC3F7C022752C0C869CDA1E80345407F3D8090603052C0BF48781D5504454073AFF5F21F3152C033897703470045402329B3DC543452C0236099C2A3FF4440017EA4BB403452C0EE802AFB49044540AA0C7DDE634052C0647FF2F29B044540B91A76A4EB4252C0284680D1A50445406FBF04A1FD5E52C070DB3B1F12064540E3CBA3FEEC5F52C05F4C803BEA094540636764E7735652C03FBA2FD69B4045405E68460D845052C05F21AAD97E5F454008278CAF424152C029EB9451C55E4540A445DE63123B52C0ECCEB1F5615E4540A3420A562B1D52C037347FBCE85C4540DE75A128EA1152C00E51AE43385C45405B1B2FAB88FB51C0B9918DD6855A4540A8A65108A9F951C0866CA2D8495A454057BAD26461D251C02E26A5D66B594540242FCF8227D051C0E077ABD3EF5C4540F6CAF70264CF51C02EB35ED12C5F4540CF72F31DEDCB51C0A03C30B58F5E4540C6E81D8096CB51C0477E122B56674540DFA796FBB7C751C0FC0B486DBD68454080377D3632C451C0C802C7F2F36645409C1F0195A0C151C0C9F9202FF36C45403FF1D92BF7BA51C0660D09924C7145406A9356A97AB951C04D82843385714540BE81062362B651C0537F0BDA846E4540AB95329F16B451C025602AFCFB6E454078F07D2B57AF51C0BC26D456EE5445407BC4FDF9F6A551C0A1054220BA52454088845D7A8AA851C0B9889204944A454098DA9C4B0AB451C01D2140A1F1454540A0F68DCE30B951C05F0DA54B5A394540E9ACA8D47ABD51C0E294F1AB58374540B81CAFB52FC251C055E8297C8F2445401DAAD1C615BB51C04FB975A7041E45409705BE8521B951C0AFDE3CA604224540F2F2783EC7B451C00FAE5E4A582145407257FFF892B151C069491B6FD31F45404CB3DD08E8AB51C092BFA9F69A134540B91779D498A751C04EF1E7A4EDFB44402348FCE794A251C0DB9F6C6B29F7444065CB5FC169A251C0A4AD763523E74440D711D2D01A9B51C0E6828F042FDF444045C09A7F869151C0A92F04745FDC44400B264207D59551C0F6ACEDB01CDB4440B20944F9228D51C009E2269A35DB4440738040D03A8151C0925085D308E44440F96DD856078051C02502C5E39CED4440BDD5028C6E8651C041ACB3E34700454010C0F058549051C00564D7FCB10745409C508E52A58851C04E63917C47094540927895EA3A8351C02B7CB4C15D0345400AA2E6F8B47D51C02F6CBE5BB9F34440609672E7BC7A51C07971C97A42E2444010995B45157D51C076C77F8DF3D54440B4CFFD8C729951C08509C0BE68CE4440A03879F1B49B51C0A806D4C2EDC844409B20F8E2C6A851C0B2F4B15118C54440EB3694858DAA51C083427C2C2FC7444039249629AAA751C00F15C65329DE4440F1A97E3BB9B551C09E6E1A7137D04440C387EEA118B951C0F452570C24D14440FA6B3F6913C051C028502D6D93C24440E7B1391A7FC751C0E878AAA71CBF4440D2E0B6A009C951C0F4BBE4FCDFD3444090ED0548B9CC51C07BE06219D9D644400539868BA7CE51C0876775B795DA44403D126F7110D151C0E5A9B494F7DF44404ACABCDD6FD451C02B4F7850D7E244400103000000010000000F00000089754E5BADA651C0C8B5F332FFB64440AC74081C55A451C02DA6F2EB76BB44409B7E569861A351C090B7B6FE6CB544400552ECD8DAA451C04A87EF3D84B44440C620A655F8A051C0EE174E4B07B34440FABEE3EF1C9F51C052337545B8AB4440CEE2FD7946AF51C09189A798C5AA444007279DFA42B151C0F0F5FD3B2AA644408A3346C802B651C032FE8DE39EAC4440F23B35E014B251C03CFB904C1FAD444040D0A8DC56B151C0EA7A3CF598A94440C3AA08FE1CB051C0AE7B02EAEAB044405E3E641FB8AA51C0E944CC623BBA44404CD0491EC6A651C07C72FEC3C1BC444089754E5BADA651C0C8B5F332FFB644400103000000010000000D000000D2133DA4078251C046C15B5CEDA7444040BA6FA26A8051C0A79E043892A94440EBD70B24B48151C04127ECB529AB444092DB5AC89B8551C07D6B4923FFA54440391F9004358251C04DD95893C3AC44407812DF25278351C0E49A6DC92BB244400B6D1F9ED27D51C099DD6CFEBEA54440FB4501FEFA7D51C0E0B44A883BA04440F0BA9648998651C0603BB1F27F9E4440FDA1B231A68D51C0A912501396A2444078036E11418D51C023CD35ABA4A54440E5B50889438651C0E855296989A34440D2133DA4078251C046C15B5CEDA74440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('23',NULL,'MI','MICHIGAN','P','941','0106000020E61000000500000001030000000100000009000000EAA39D7DD71F56C0B56897EC3E1648409BDBE85B052856C07D9BB6D63E044840860DD0F4B23956C012B1796CE9FA47402AB733F4D44156C0B3BE2745E2EC4740182099DFF34856C065D0A5527BE94740203B8CBD584C56C0038C6A4A1CEC47407B495515EA4C56C0AF606D3922F14740A326A886FD4956C0CD4D66A038F84740EAA39D7DD71F56C0B56897EC3E1648400103000000010000000D0000003F3CDE280B2056C0E69316A024A5474039BD6092061C56C0B44989018EAD47405EBE6471870D56C0F5AE20A852B9474080748D9070F255C08B4431F242BC4740281DA19E14ED55C0D90856DB3DB547400D433A5F33EF55C01E257BA34EB24740FE4E9BD1B0FA55C058E4B42CD3AD47406E5E9DD4390E56C0325F5E40B2994740D676B1066C1A56C05134CDE1797E4740B5C2C95C1F1E56C0A2A1EFBB448E474051AD9063082656C08F2B1CFB3F914740026FE3D61E2656C0B113C00D2E9F47403F3CDE280B2056C0E69316A024A54740010300000001000000AC0000000BEED7B1077755C069F7149317FC4640F618D6A08E7A55C0DC7146079FFA46401328FED6B17A55C0179E1E5487F5464063F14C55588455C0213F093F6BFB4640EFB6DBAF989055C00B61AFFD34F94640663F416C339455C0917AEB67EDF34640A25E43BF009655C00B5A437ECDEA464085374162549D55C0F96B44B5A1E146404DAEEC85E1A155C05BBDD9F5DDDF46405FAB349F68A155C0B1481C1EAFDC46404FCC583ADFA455C062ECC7FBE6DA46404B2346634EA855C05D3BDF9484CF4640362010EAD7AB55C0E83F5FC634D346406496C8539AAC55C011E53734A4D8464089ED284F6CA555C0E4B19F352DE84640346446E9BBB055C08A78BF96BCE94640F4EBBB35B4B955C09809A3D97DDB4640B5A585ACEBC755C0930B0C9D1ED94640F1F29F6CAFD055C0005C45C403C74640CFDE4E3443D555C0A1B721C143B646408621D4075EE555C0E9372271D4944640A8C01FC1EBE555C045BFFF62E38D4640DBB20B630FEB55C03AA9738F019246402057D5E4B2EE55C0E824B6FC9A964640922A6EE61DEF55C08850E4337B9946403BA113282FEE55C0778EC110189B46402785900A0FEE55C06A401F884E9E4640C91E120C21ED55C0DBC11D86A09F4640E7515B0F16ED55C0E694B49ED7A24640C292979C4DE955C03033DDCE90AC4640AC489D1E32E955C0A0980C4B51AE46400A47C55F22EC55C0AD06691D15B24640C8C0A576A4F055C000CC8AC02BAD46402A9AA714FEF455C018743279DDAD46406153B492D7F555C0B2EBBE9B4EAC4640FB1BEB942CF755C0BE17A59261AF46403AAB0E1596F755C0CC451C11A0AF46402D3E7033EFF755C08BACA4D358AE46409EB39B138DF855C0EC41B951D4AE464078EB3CBA5EF655C0DA2CF3A8FBB3464067C0159F0EF755C0FE7CDAFBF8B84640E58E454312F455C0B598E0F9B4BB46404DAB2F4885F255C06D2CA972E1BF4640CF36D26D87F355C0E25FAE05B3C54640FD22A9D007F555C057B1539DC7C8464046C3A1F152F255C002C4B741C5C84640DDE525D69AF155C0B1FBC17AD9CC46406EA0B5B7AAF155C00554C3577DCE4640D65D7BDC79F455C06CDFE708C5D346409289EB9D4AF455C01DEF41862BD546400908F8FFFAF155C01A27B66784D64640888F3621C2F155C05120EAA590D746404ACA312346F355C0321F40FFC4D94640AF6171A44CF355C091A28DDC0EDB46409E637745E9F555C0AAA1463578DC46404A53DD88E9F755C004E0C4EA16E046403038EC0907FE55C0992FADFC1AE24640F9C3B64D5DFF55C08633F613C4E54640F10C320F4E0356C0B260A8529FE44640DF26D9D1AD0556C0C163EFEF50E546401A1DC117510856C0D22AB029E2E8464038E15759CB0756C0D78C4547DDEA46401577C8DB2F0456C0119B4381D3EF4640D2ACDEFF200656C0D10A339E26F246404012BDA3010656C0A7251AB9D6F546409EB03605210756C03E06199890F646400EE37AC8A00956C031003977D8F74640C9D4274C880B56C066BA56D50CFA464018C2F66CC20D56C0D4BF67D754F94640BCB50371751056C0E8271B77C8FB4640D363BB4E251356C0E8A82CFC20FB4640FAC2998E901456C0EFB5A33EBDFB46405BE74411AD1756C0C1D43DA14EFF4640EFCC824ED31956C0D04651C6E0FD464000FAC98F131D56C0AEC908EA180047405100C1CEF61E56C0333EE02DE4FF4640857C690F9F1F56C0DBF010ACA8014740C6D46ACEFF2056C068CD49CC610247400EE6E84B182356C07381E46D780247406AD30EA9D22456C06B5A4592250147402AD4C7073E2656C040E8C971FC0147403AF2F663642756C00A2520573FFF464080678FE1312956C04548005927FF464014F2EA415A2B56C0A3025F1594024740888EB5DF072D56C09C690C176C024740C335C37E7D2E56C0EB14C455C90347402882E31C793156C057DC2CF8B4024740C1151D3EC23156C0AB2D21B52C044740F12901DFCD3256C0D93F9173A7044740E49A4E3E7B3356C08BBCAB556E034740FF15F466363B56C079F840C66B0947405D20442C0F3F56C0D91AD49ED90C4740CC904A39634656C035BA5F6CA4124740FF4DF36D357B56C0C2133550EA264740925E586D258756C0F0D9632D932B47401B36DF0F5F8756C00DD6546CBD2E47404FC3A535138956C0C3E4E94A6B324740DCBC4E3B548A56C01D04FEE89F384740EC7981A3898D56C08E5E6546CE40474032915EA7899056C03C541E06204147405E723D28449156C0591833A4E04247401A2D9B2A369356C064D708E43443474066967F6A5A9356C07E8D0081AB4547401D7378CB139456C000F4DE9F994647404FF34371AC9856C0D9CD4A8113454740E25033F21F9A56C06D5AF23BC8484740159DE613358156C07DACD778DD56474047F6295AB87856C0F52D2D786C624740A60C86BFA37256C00FFB9A3190694740B6EE43FDBF5856C0FEE509A1D36C4740C69833E0BB4D56C00177DE4331764740027D3413034856C09FA747CE907F474043932C0BAC3F56C0A39EE014A17F474001309803803B56C03CB39163F5834740341F7716A13856C0E0B5970D628D4740AF1F9EBA492856C03915C56EE79C4740FE7199058F2756C08686665BC890474050F123C1B72056C0D2B6BDFEA18D4740D397FDE8D42056C04EBFD8E52B844740A4F14F083C1C56C010B97964D07E4740DE33D3AF8A1C56C0BEAF1AAED27647400951D9597F1E56C033D0FB9B756D47402B2DF85E951C56C04B8632A2526647406F4AAD83610B56C090F499EE1279474040A581A91B0C56C0E2C4029952734740EED0C70B590256C0DBE4FA01B87447401AF72151A4F955C0360EA61373744740821F3E257BEA55C09D9AB8F31D6B4740236E0F4BC7D755C06C1CE2DA054147401769EE5D15C755C07B475F47304047402820BDE368C055C0ABA82745A54447403752F4BBC4B755C0389B69C7E03847402EDFEB939BB055C0106DD9F0493E4740A5D71B9AD8A855C0FA70ECBC0C3647405704C7D4979D55C03C0AC7A6D147474015F79C9E7A8955C09916979A26564740AC6A1CF9308655C0273C1BD7DF53474024B0A1E0E17655C09E88E1B3EF584740064B9A163F6055C0D421765A4B56474052F051DFB94E55C0CB6B5357DE6047405F7454C71A3D55C020581888AE6247406CB3C4E6B94155C02FE15220E058474066C5DFE4364155C0C76C296C464647408FE375514E4355C0D2CD09BEB6404740607911A0104155C074CEE11FFC3C474021ECEBC19A3B55C0574CE7A7713E474039730B0D6F3355C0FA37CAC4D63847403D80D0E24E2855C0E7407913D13D4740D377FE92A62455C066CD2EEE363447405DA021349F1A55C087C08338863D47409B300E7CF11355C0AC24FBB58C3E47408457BB18A00B55C02F42E915D61F474041D2EF077B1155C03FAD3B1A891A474017EA3D5DCF0F55C00BAA48FDF11547402B3368BDA90755C06A6F07BA8A16474022FC0A9DE40155C08D54BD3A811047408ED32B7FF70355C07B7DD69D170C474073C435FF53FF54C08A2C168053034740F5D7FD95B9F954C069CA1867C1004740C331D17303FA54C0E2EFB821E9FA464044C47DDB3F0755C0152E4BC140FD4640286D4AE2AF1655C06C7B8975E5FF464040AC3CC91A2055C09E4278543AFD4640C93AE7637A2755C037A225B9E40447409E286AF2182C55C026456FF79804474074E061B3D42E55C0CEFE7CE986ED464085D35A6B783655C036B6156200F24640DDE1C8BDF14355C0A583E80F2B03474015728121355855C00534105BCE0C4740C03A18689C6055C022471A6F0B0D4740219335C4F16955C09329CD0687FC46400BEED7B1077755C069F7149317FC464001030000000100000011000000DB255B14B3F654C0FA17E3C9CB01474074901E4F45F354C06B2BB74C84FE4640CC7C742F69F054C06D84F0CF7F03474032592D221CEB54C0BEACD7F1A1044740C1568B458AEB54C06B0E3C9030094740D3ADBC6FE0EE54C0A9874E0EC40A47405A3BE5C197E954C0C545F7EF4E0D4740DC651856BAE554C08DA67592540B4740D0C0ADE82CE254C086F54F568201474077122FBC48DE54C0795569F767FE464063D635C108E154C006C541D27DF646405DF8FBAA1BE554C07BED09AF70F5464002E485154DE854C03EE964700FFA4640D15DED2B83F354C098CB46E6E7F74640D4736F7294F654C09AAE746AACFF4640F3D6F472B2F854C06B91A1E444FC4640DB255B14B3F654C0FA17E3C9CB01474001030000000100000076000000007A33D96DB555C04CD2570FFCE14440DBF08BA186A755C0B0A5454227F44440112A12E3EC9F55C0A49B50682F1045406815F82AF49755C0F74E800AED1F4540509EF61F3D9255C013E3D2BC0E3645402D260B55F18D55C0EE7131792D6345403B60EF8A869155C0DD037C677E8F45402F951116A59D55C097BC1743D2BC4540F2E8FBADA4A255C0EA485750E3D44540A2A02EF0A89C55C01DB27EB2E6E245406A7EAECAE09955C0C362CE5621E24540864F024FC89B55C01A942DD306E44540AF25F5B0719B55C0F29153D1F9E84540DFEBDE3C699D55C0CC3FEDA79FF945403CDF3E9A0A9C55C05AC4AC2909F9454065AFCBC730A155C0A106D4FEDC0646401FA97D28BB9855C00493C93B73174640108358B3679155C0162A060EF52C4640E3191C053C8F55C0843B8BDCD9424640C1631A588D9055C02C82518DB159464002733769F18655C0B1B23832025E4640F461B1884E8555C0174AC92C93634640FE81C80D458655C00E1153DDE06C46407DDF172C518455C0FDEE1B15FA724640444CFCACED7255C0A557BF6C347E4640B26284C30D6755C0AF761ED227994640860D6864316455C0DEF264991C9746405729B4DACA6955C04186209DAB7A46400C00CBA3D56855C09FAD1FC8A3634640A194B14FAB6155C09741AF4DAF614640F519B4EFE25C55C0160EBC2F266E4640C83AC5B3A15855C0C8C073725B814640C71628C5F95855C01A9A597B159B4640833E9C5FE35755C0DB757F6303A34640C08BD9E68C5355C0A535F95502A94640209A8E76F14555C038E9908863AF4640B665E0E0183F55C02DD3DF4CC4AF4640C3E2FDB4FC3A55C075185E9277B44640B98BD8773C4555C06C47A7AA79BB464055581467B54755C0429AB387EEC84640D8514C46FE4455C05E7E30E8A9D04640B591073BF03E55C080E798EE83D74640124D3ADE353E55C0B4D4506F6EDE464050B07E0F592E55C0F41D0405E1E346408FF5F110C71D55C01E5F6D64AAD34640100922C6921455C0562FE8A032D54640F8D465E6270D55C07B3D5D82C1D04640BFFAB996A70855C0345DBFC621C946404206BE30C70655C09A310106D7BF464040965FAA10FB54C0B166A56FF2BE4640E0C3058D19F254C0856071D268B4464028FCFDA096ED54C005094E57C9B44640CBC6DE46E9E554C0DCAC737ABCAC46404E149FB6BBDF54C0255FD9C12EAE46406135EB9255DF54C02C11689F1AAA46405C42449E37D954C05E2A59A0EEA24640CED959C1EDDA54C067CFDB5CEBA04640A2C7FF3A84D954C01BB96F9A589B464090E7386603D454C09D42F5959F8C4640097FAFB871DC54C0ED580349C18646401A7A5C34C6DB54C0770EE3A56C8146401B54A4F8C0DD54C0A8E6CAA2BA7F4640BC9F6A907ADB54C0AC3472E590764640B183455D76D454C0FC5F06AB296E4640F7DFB7D3F8D154C047927AED015A4640395B17797BD454C096716999FA414640594B197BD8D654C0984224A9E52A46403683139ADDE154C02474446E71214640CBD690FE5DE454C0240A806DC61546400DC248424CE654C021C549ED050946405B719B791BED54C0D34E2B1CA3FF454056C2304EE9F754C0EC9FC3693EFB454085BB0AADC6FA54C07665C42D60F5454063C1C52F0AFC54C0FF7D855C61D945402390351DBFEC54C0653BE513C1CC4540E80C8535E5E954C0812490EFBFCD4540A77DC06CFAE154C0158B4AB6EBDC454050C65BC2A1DF54C08BD94FB6F6D94540AB476BA2D9DD54C0362AC06E74DF4540ECC41E9A7FD754C0DCAA090217EC45404ECC709BDDD454C0DBB787F960F845408ED0F47B2BBC54C022C11B6FF4084640D7A6372495B354C0FEF5E3D74B044640D68D13F395AE54C0536212167BFC45407BD1B04D95A754C072F6ACCBD8E44540E25E9369C4A654C0AFAF0A9EE7D84540E45ECA983EA054C00B9415670C964540DE672C97DE9A54C0C3B127BC797C454009863A79349E54C0DEAA210308734540EC251489499E54C00E0F7494A6614540A7D78CDA29A154C0D7D7309E28514540F593E20D56A954C0179BB37ADC5045406CEFB8B293A854C0C57D9956AE55454072B38823B5AE54C0F8607B7032574540675E868B81B454C0FB962DB761514540950634E459B354C0D85EBC5A744E45402D316241D7B854C06685B9EE743F4540A803497AFEB754C0717FD7F1A13A45408354581C7BBB54C0400A351C782E4540ADC1E2BAE2C654C06EF0EB61772545401579BB6A68CC54C076F4A1E0D00E4540272C8E0B2ACC54C091C40A72590445403373B968E4DE54C0F242C30ED1DC4440A8BFD89FE4F054C04E1C3B0AC8DB44401951DFCA97F754C054780DACA5DB4440C86E9E45FD1655C0DF02F506A1DA44403E2814E6991855C06C7425E783DA4440A31D4D8B953255C0D36B1B8247D944409007936B763255C02B8FB71E67E14440C879EA50DD3455C0D4BFA11F85E1444066D15E6A5C4C55C0913501A5A5E144407B36867B055355C0412DD105BDE1444056C1E692346A55C086753CC79DE144408EA7EA88267355C0D9697D83BBE1444003F020105F8455C0B81C4358DFE144407EE9181E038F55C0D57F6512E7E144408DDEA3909CA155C0396CE339FDE14440007A33D96DB555C04CD2570FFCE14440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('24','MN-DELTA','MN','MINNESOTA','F','942','0106000020E610000001000000010300000001000000320100004540AC51BEEE56C0FBDAD3F7F1BF4540E441FE4AF60457C0C4DB2843E4BF4540591402B9001D57C016271E5EEEBF4540482AED68B62357C07467A98008C0454026CC68D2BD4157C08FFE01E829C045400D1C97F77A4357C0C0FAF2C12FC045408B21379A0D6057C0B042DE0110C0454031CE6236D66957C08AA803FE18C04540A0E87731557E57C01622EECA09C04540A4F56D5DCB8F57C061FA278BDDBF45403273AF9F229D57C04ACD40CFC1BF4540A69C439B07B757C0B94C05FF00C045400C83C8E4E8BA57C05594A165EBBF454022A7463761D957C064BFFFF10AC045401BE410E1BEDD57C04F59B2F5F0BF45407D948B7C7BF757C0975F5965DDBF454046665012E80358C0749E9AF3CFBF4540AF441B17781D58C0821E83C6F6BF45401A54F0F8381D58C075AE8692A3EC45401C3E3700461D58C078E531D87A194640A9DA9E75201D58C08333CB6DE8444640E39642DD3A1D58C0132964CD7C5046404BAFB047221D58C025C18E8E9266464013036F69301D58C0B5AAA0536A7C46408251DD78161D58C0F38B989A39A3464019F0E95A491D58C015238BB940A64640428458DE901E58C04CE32B980CAA4640F8EA0248152258C0C6BD9E5404B04640461160B4B92658C056608F4FC1B246402A3A55E25C2C58C035FC49CA8FB44640030FEDEB3B2F58C0DFAC8724A6BA46403A7685543B3158C0374B7FBF3CC24640594AF423F53558C0A4586178C3CA464045094B27B83658C07CBB77B6F7CD46402489F3864C3558C029A069B549D34640D1FCF0B4122A58C089C57C9696DE46402B771DF1B12658C0437BC73375E7464018D03F0FA12558C08CE0F673AFE84640A1152771482458C05C3A45EE90F7464036982391F42358C02F0EFBAD4DF946404551F5B5E02458C04D1A934AB9024740CBCE4AD6522358C0E413AC4A3A0C4740E5F124FC8D2458C0C0C4EAA8AD164740C67C8FFE9F2558C0810AF1C790184740C8C28B7F882558C0100DA7A7921B47400BB8A5A1482658C03ED4BF268D1E474095885762882658C0591EDCAB0C2B47401880FCE3592758C0C6227C6CE72C474047015508BC2958C00ED096EC012E4740AC3C8DED0B2C58C0897E5B91C33447402A0CA1706B2D58C0FADA3F73AD364740BACD19D2C02D58C066B8A5F7FE3B47401A125D56612F58C0C9FE94BAA53E4740B150AA1C143058C0CF266DE1574B47408AFA82BF583158C0B4051E44CC4C4740236F5742323258C03E9369E7E24F4740D23D3663933258C0DE0FFA689C504740BA5046E6CB3258C0B1ADD10CE3564740FD9F4D06053258C02AFC2D6D805A4740D455A7C7F13158C0B2C0E46F93614740C0C98746053358C040149AB3F06747408B4B52012B3158C02302B66D246C47405E8CFDC0CB3158C00E051C50056F47408B32503B713058C073C543AB1D7647406410441BD63058C07C8C676CD7774740EB72495E6D3258C03D6CEED2517747409AE2629D8A3258C0A60E5BB35E794740CA145D1E523358C066DF6116597A4740B449A07CC73258C0A1B088341D7C4740292F0EFF453458C0A57BA5BA217C47406C11041EC53458C0E6E6359E70804740DDEB257F753558C0260DBA424F814740F7FA299DA53458C0CAE6DEE4578447408D29D5FCEC3458C00F5CF130178A474043E676FB6C3458C0CD065672DA8B47406F7E8BDCB43558C01FAC59067193474067AEA83AE53458C01E5AF5A6C4954740499E747A923558C0A481135BC79E4740B367EE3B603658C0EFCB1441E0A047401B26D31A9D3558C080C0F6FE9DA547405195011C313658C031670EE244A8474018F4495BA93558C01DCDAFA0CEAB4740E0E431BD703658C06F3A41C433AE47402B08EDBBBF3558C0577569C22AB14740DC1D847D663658C09CB8920558B447409DA80200813758C02977DD09E0B447409E25C9DEC53658C0F5308C87E7B747404BC581C0773758C02AD097AA13BB47403AC0DADE803658C02AA21D4814C047400073DE7E153758C0322C42CABBC2474022EDA11B593658C0C0CDDB67B4C547408378F75BF43658C04AB7D4A90FC84740D5CBA0B88A3658C02957ED88F2CC47408BE7A1BAE43758C0A748BEACC0CE4740E80E4D59EC3858C042B4792E43D64740AA97793B1D3B58C0F4A6457267DB4740F2A06518A63B58C0E6363393BAE147408BA20A184D3D58C0418EE038B0E547402AF1B019F83E58C0D2A946FDA2E747407A3748F68A3E58C078AFF2DDFCE94740C0120A94054058C0FB56DDA462EF474027B830F5504158C05F6DC8A812F047402A99552FFB4058C07D6B036C7DF547405048A84D134358C06493BFF53AFA4740086C88E54A4458C0EC7473412A0648404F02D625EF4558C07AAD05080109484012CC8283564658C07AA113ABEC0C48406B94C9C3CC4758C01E523630E50E4840E6DB3C21BD4758C0FB9BA071461248406282D2A1BC4858C07012A8B4FE124840EFB0239F6D4758C049549F7161144840FA3DC5DFCB4858C052748675791548406197FCFEB84858C0AE3032D66D16484095D6F31CC94858C02F8C2FD7F7184840C367C97B5F4858C02C219D36141A484096150DFA184758C04063DBD3921A4840C85253BAF14858C0FE982179621C48407A100BB8FD4658C09C6927B5301D48400AC070D8294858C0B5AD1D18E41D484056B85B16EC4758C0189B49982C214840CB5521F7BE4858C0F2EB1D9ADA214840E0EC3255264758C0FA4C5376912348404CA90535364758C06DCEB176A024484015DAF8555A4858C0EB423A5982254840BA09F634474758C0F109C0B6BE254840D209BE14584758C06745CEF6DC264840C65DED157D4858C0E7F224D9CD274840494437B4344758C0D00C2E56F32848402195C4D5C64858C0B1F9AF19BA2948405901AF54644858C00EEE9958452E4840B9AA5316A04958C04DC13ADB7D2E48404866C1F48F4858C0D93DA398AC2F48408F7E8A34A74858C08F08D55834314840D6B49F162A4A58C0ECBB5CBCB031484053E68E93434858C07729C19735344840244894B5964958C090EBF19A7A34484041997795B44958C0B89416DBB5354840C3B28DB2D84758C0B766AA1643354840577BD211A84758C04273E7F5F237484033284EF4304958C06C2CBCF91338484092DB7B319D4858C029EE4A5837424840A7ED58337E4958C03FDB4B3A4C424840F28473B1EB4858C04F933E596F44484093EC8D53F44958C0F841C03BEA444840CFDBFD93444A58C06ADDD61CC5454840DFA42132624958C08628C93A57464840A34CB394BF4A58C0B48F283EF8474840413A2672BC4958C0DFD3EE5B534948400B7299D21F4A58C0336C3FBDB44A4840CE9EDF0F034958C08803EFBA1F4B48408871940F434958C05286DB5B984E4840596F0F8CDE4758C095CD1B59754F484072C53C0C284858C0682CDA199D504840CB7B2C69E34658C01C020917A2504840C6167105384658C08F7C73F656564840E27105A8784758C07F02D2B9FD584840E2F72BE60B4758C0895978D9B25A48403B10F3A9A04858C09DA33D5DF55C48409802D1E87A4858C0F04D4FDDA45F4840737BBB2A774958C065811D40B9604840A1051868E94858C070D47CBFBB614840AD87F9E6704958C0C13CB861FD634840A94C06E9214B58C03CF3BC06986648403953EAA58A4A58C0249E0826BA67484015BF36088C4B58C0CDBC8B886368484075483F03F54A58C083048A68016B4840B045901E3F4B58C02D2FA84BD76F4840CDFEDAFDD84D58C0046AEA334677484025312016AF4E58C0AB8A6599FF7F48404A5D0EE60A1A58C0C8399869FF7F48403512FFBFB4D157C069EE13B6FF7F4840EA10029318CA57C074879FDDFF7F484043C5C731B8C957C09BE765DA94AF48401C9A8B2140B557C09BD444D957AA484089BA759999AB57C07C4E7FD2467048406672029371AC57C0E4FDB0E788634840B4B2120180A457C03F2C7ABE595B48402819D3838F9B57C0E8003603FB5A48404456CAA5B59257C08ABF5347965A48402A7523E0C58E57C00773045474534840DD73F684027657C060319061F74F4840235FAE09037457C0022168914043484022DEF1A3FD7157C0233757C97B414840B0CDABA7E76057C025C09EFD62444840C8630B1FC85D57C0D13561AB5646484000354B184C5D57C0526306EBDD4B4840F8DD649D785357C09389A38E8E514840E45C2331DA4557C04849E3EE33504840CBFA95709A3C57C0F0DFD7F36D5048409B6D57F2A72E57C0D777C9A625454840584DBC93132957C0FF04BA2A2A454840AA67F49B162857C04278E4885C404840C5536E7CB92C57C0F00F2A04533F4840E1319BA3392D57C02C481867ED3A48409647CB84D71F57C0B3CBF64D54384840FBD041C1341D57C041F5F1467A334840A6A587E94A1E57C0EA508286C22D484048B334FBAF1757C0FC9B147D421C48407D340106B91157C09D73FC8F461F4840A2593EA9371357C04B58A8112F264840A848D720AC1157C04905B1CF182D4840F2A45BC30F0857C09DB703DCF12E48407997F572400257C0B950DF4F812D4840000026AFB0FE56C02467CA0B0D204840A36939F17BF256C093CA54F7621A48405AD7C46390ED56C07F4A2CED2F1948400ED0F8ED09ED56C0241BDEE8B20E4840A83B93D066E456C0AC5D39DF5E0D4840CDA0627894E456C0117C97C093054840A12B251853CF56C0F08945FA670A4840A448CCCCBCC156C0BCE7C2DD00194840BDEBF1E153B756C0E9F958908920484045484D4D93AF56C0AB9AD31F520B4840F6C7CB2F51A456C029FB63DC930F48404015EC2FA3A356C0E011DA3EDF0B4840B455B41A4C8956C070FD8A466F0E48407BE06476B58156C05FF2DBA2040B484018C1F0582B7F56C0D7A144E8030348408863BDF99F7956C0F9D590680AFF4740B6B1BEB1F46F56C0E8DB60D96303484073FF6F8CF66156C0FB69A64336004840577C96910A6856C09F81FA430CFF4740DA2E7358BA6856C000631950CDFA47405E328EB8FA7F56C07C0831578BE9474017A092D59DA056C02C567B3FDFDA47401F3A58DB5FC156C07085EBF903BB47409B50A47AFEDD56C043803DE3FD8F4740BF99D01243F356C06D0061C6AA764740E4797FDAA90557C09CE2B3E35C654740A55B5B67BC0D57C048E360B487554740EE8D36C7661357C0D472E85A525547403F342EA8621257C0FA6D8D19535447406CA2CDD1791257C0E42B1AF73E35474037B5E80E7E1257C045387A7D0B1447404D335B0B851257C0B16D1FA35F094740FF0692ACF31457C09D1BCFC8470747406358468C281657C00FDA246EE4024740E561DF8C5B1757C01144C87014024740232A1D30331B57C0F378F2B74303474084B3C112971D57C084D7B6E197FD4640597E5ED6882157C0AF1B6D49C5FD4640AE0DB8FA5E2357C0C0483930C3F946404C636626A32A57C0FBFA75C235F546401990690C332D57C09E958DEA0AF2464049E7B474FB2E57C04E65E65328EC46406D3220B7EB2F57C01A0AAFB62CEB4640CFBFAFE3DC3157C01207B823B5E146408D4DE84B5A3557C01BE2A9CF8DDD46405E2D45900A3757C0C42193B6F3DA4640D9A9AB59AA3857C0EBE8B5E58DD24640C2CF96001E3857C05634185117CA46404411FE3E713557C0F0FA07901DC8464023705179C73057C0B1AC16C939C846406DD520169A2E57C0342D56090CC646402CE11FF0DD2B57C0275B0CB52ABC4640A37EA188E82957C083EB00B544BA46403B9F8145472957C0168571F73FB84640EB4BF722852957C0038C8DA09EB24640FA2607E8D42B57C0CFB03D4A79AE4640379A20C9452D57C01AE8D7D4BAA846409E137D2FC82F57C01AE6DADB17A64640451C3DCA583057C0630F42272F9B4640A8991029CE3057C0EB1201E8E297464009793503AD2F57C08C31BFA805944640FD9A65FFB42F57C046A680EA768E464004C55A25FE3257C0462FE0EA658846407CC18CDAD43057C01BBA8BCDD4824640EE428E99183157C00C1F9BED2080464092354E32FC2F57C061D3908FC3774640CC770052403057C094D196CF1E754640F30DE254663157C0C96E01AF22734640B13941B1E93057C01B20CCAF5D6E464032B321AFB43057C08D9B5070ED6A4640AC5A11B38E3357C0F3A17530825F4640F77323652D2F57C0BBFA4810575B4640A8693AF1572857C06B7C2C6F42524640947F966CF92657C0E02ED30E1E4E46405367F0F9962057C02027B6D09E494640DF5DEDDAD01557C07417724FC3464640E6D116B6821457C0175CADCF2E454640CFD68DEDFC1257C0B0B2DFD0FF3E4640A79AA042F10F57C0E686AA4F653A464092B9265B310D57C0FD64F34E1D384640A29CF967D80557C0425B100C32354640594160923BFE56C069204784A72E4640B049416B16FC56C06DD8AF00682B46403E4655670EFB56C005E5FA7DA4284640EDAEB5C507FB56C0EF23C25BE824464039CF235EE0F856C03AB56798F5204640774D0AD251F656C0135AEFD2781846406C3CEDBE34F056C0991A64AD9011464065D2F431BEE956C0172A230A900846400C4176AA83E656C04568D7A9390546406A3DCD266DE456C03990306A79044640CE22DAA2D1E156C03034722A61044640D5D598F941DB56C04A88ADCA28FE4540A4DE1816E5D756C074A5EB8E3DF945402735A646AFD256C04A8140BF70EC45406F1C591A12D056C05331CAAADFE4454027871C1492D056C069D2ED7677DC4540C507CA7289D056C020F3697FB2D64540CCA4904EE9CE56C0F483076EA8CC45403C5B7E4D65CF56C076EBAE363CC64540FC3FFDEA4ECE56C0CBEC787F1AC0454077EECA3E1CE756C0A250F08414C045404540AC51BEEE56C0FBDAD3F7F1BF4540');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('25','MS-ENSITE','MS','MISSISSIPPI','F','943','0106000020E610000001000000010300000001000000A6010000733A4DF5D91C56C02D07B1A3846F3F40BFBED1E1CF1B56C0283724F5F11E3F40C21426FF771B56C0DCA7B78D2D003F40E1137D1AB41A56C03F32867488BC3E408BCF38C9B01956C0088D97CFBF643E4035CAC2E68C1956C0B738ACBB565A3E4091C05C10B61D56C059BA62BF79533E402F895408FA2456C09BA22ED278613E4009E6AB9ABA2B56C0C6BF3778A2573E4074AB2F1DEC3756C06C57C39B266E3E400CEFB9C5883B56C05169D37AB36A3E4019EF0DBEAF3856C079B15A42F6653E400EE8DAF8AB5156C034AF2D6799503E4081C3977C815156C0FCA403B5545F3E4036C02E67715556C090B8336B63613E4000F0D2C9E15656C08FABA94C835D3E409FE73600635456C0C2990F60A0513E40E1FF3B6C995A56C05C858804A9413E40E9910B2E0A5C56C04029019472333E40EF1FD383BA6456C0E99C0148E7313E4093D8464B0A6756C050BF33B1CD3D3E40D533FDCACD6656C00EF73BAF713F3E40C2A8214EC96756C0A215186BC8413E40256F38710F6856C01E9940C3544A3E402481C133E86856C0C3297C80BB4B3E40981EA6F4C56856C03E32ACFCD44F3E40E8C55CF2966756C0993FA5FBE1523E40FDA72254B16756C0DF5291F7EA573E40AE7A5C778A6856C0DAD96273F55A3E4068AD9E59636956C03DF6D552F45A3E404B39B81CE66956C01FE6C26C0A613E40FD57C841396B56C0366771476B663E401ADA69C53A6B56C038F1C99D02723E40B8863CA8BD6B56C079A9AEB974763E40C5D7844A746C56C090172E18DB773E40E1199F0B866C56C07A99A1556E7A3E401054EACEA46D56C00D6D6A143E7B3E40485E1211056E56C0C1DB0F51FC7E3E4028129653DE6E56C0EE9A7550727F3E407956F5D8547056C0DD5B42CBFF833E401756F77D757156C0E128DA831E8D3E4024B372409D7256C04B868043CF8D3E401C0D7DE97F7456C0C9BE5B31D09F3E4028996CE98D7356C0DC0B67CC42A63E4034D0484B707456C03089DA0AB8A63E403E4405EE167556C03F331266BEAB3E4023DEBCCF1B7656C0791855868FAA3E40F16E260F777556C0DC4FEEA306AD3E40605A4CD0DF7556C0EE761D03F5AD3E40561DCC91D87556C05E1DCB3D57B33E40FAAB9E902A7556C0677F47FD2AB43E40466408F3047656C0D5622A7A61B63E40E77812B37A7556C0A94F1377B7BA3E406B44F591B27456C035E47C76A9BB3E40E609DC12D67456C0FF72B2331EBE3E4071D5BEF10D7456C0268CD8F387BF3E4027903BB6C77456C04E5FCE652BCA3E406DFBD955E67356C003905580CBCF3E4021C226F4FA7256C0FBFBF8000AD03E40B8A33C35F37256C06232103C40D43E40E4FD6D52967156C0D31293BD9DD43E4090D4D5D53D7256C04A731A7390DC3E40E4F16AB3037156C00ECEC995B1DC3E4056526F15DA7056C0D6CBB34A85E63E4083744E93CB6F56C04ECB988B1DE73E405AF3A473BA6F56C03424C6C8FCE83E40B20B0FF6837056C02B81E684C9EB3E40CA8BCBF3636F56C0BBEA038415ED3E40169DAC16E86F56C01F328D3D29F33E40352E3E56546F56C0E188F17824F73E40B12A0694116E56C0BCD504F4B9F93E408218C395836E56C09D4E40D20FFC3E4014744DD64F6E56C0A996CBEC63003F408A66E0D7E46E56C08F556EEAE7013F409305D906597556C0D221ACDDD6013F40E43344A1999056C0A8ACCD00E3013F40B0788387FE9556C01A06243C61013F406DBF22D6BAA256C0BB1762B398003F40F1015A37DBA356C0655D16D36F003F402EB867081AB556C01ABA874E65003F40281B6016A6C356C0510A7E661B003F404B69762278CB56C03BBA6D411E003F404FE0A08F77E856C08966467559003F4086C7BF6F2DE856C01E4FFBD00F033F40A5F77D8DA8E456C0B40F779C5B083F404094D54C55E356C057D5B68FE30E3F40B052148E28E456C0A5D329CD06153F402EEA2FF2AFE756C03D329C94B0203F400F3BDDF1DAE556C0C08047FDB02D3F405FE5483376E656C0173F9618C4363F40FEFC6496C4E856C04B2CBF00B93D3F40385AAB1732E956C060472EFB67453F405F8F46F796E856C0342DD7F416473F4050BBA891A4E356C0762B3A763D453F402817F0CE17E156C01D17784077483F40380E378E28E056C0EB2E58F5814C3F40D6981C4F5EE056C0D66BBE0ECE523F402C4E7512BDE256C0BC2FF517D4583F40FED11593D7E256C03CEC78916E5E3F405CD0B97236E256C0D886F1E8FB613F409E30DCD4CCE356C052ADF21163633F402D5558B655E456C0F71A894AE16B3F40E90350B55BE356C0B3999DA0DF6E3F40691DFB333AE256C04A547098306F3F40E87646D32FE256C05BBB97DFC3683F4082E4EB1179E156C0425CFA2060643F40D82BE14EA9DF56C095CF705B10603F408B71000DC6DE56C08FE4673AB6603F4048963EABD1DD56C09886E01171673F40073E976C4ADE56C089B8FDAC9D6B3F40EC1AEE7181E056C091510C46FD733F400B8203336AE056C0EB81037193863F409727B87230E056C03B6E42EDED883F408D3A00EDB9DD56C02D4D5B4BF98A3F404EB8FBE61BDB56C0E234672710903F40620C7444DFD956C0637A39421B963F40BD9C6BA695DA56C04E7AC57E439A3F40DBBF6A52D1DF56C03EF1EF3DB79A3F408A75157491E056C0BA5D7BDC379F3F402D732AF47FE056C0EE4141B7D4A43F40B8A5CE72DBDF56C093B43613A1A63F40EA02C5AC45DD56C0E33EAED880A03F408FECBA4523DA56C07A79DBB922A03F4024473C63E8D856C02BAC0B3494A73F4082793124D4D856C0D0803E8778B73F408A318C615DD756C03961ED1F72C03F40F9207042B6D756C049F004BFE3C03F40193C4D1EC1D556C0E6BB8DDC2FC23F400F43597616D256C0081454A1F8BF3F4084E14334E5D056C0C8698BDD7FC23F40859074D4CFD056C0C1EA3B1620C63F4004FAEE3D85D556C05D4A2ABA7CC33F40A85032227FD756C0D4F32A9657C53F409D00392039D656C0D71037AABBCB3F40C7009C1F6ED556C009B3DB33EED73F40D46AF51B6CD356C01F6B680AF7DC3F40A9ACA6BABAD256C0A91025CB8ADC3F40C4B8AF17B7D156C0DDB67A3CD9D33F40800B24F40BD056C02741DE409ED13F40722872D372CF56C04C9762F8DBD53F40246A42B7F0D056C05F49C80997DD3F40EDC61E95A5CF56C0B7DDBFA3F0E03F401724F110E6CC56C086DA5C5219EA3F4085F8E9EE70CA56C0E67247EF0AFD3F40B1C9E248EBC656C099A0CBAEF2FD3F400ECC2AA5A3C456C038F10320B7024040CDBA5A05B0C456C08CA0357D1D044040F4ADE14691C556C03B6AF3999B054040B6C03DED28C956C0D4B0D1337B084040CFDF970D53C956C058718C6EFC0A404089EB80EB0BC856C0E4F0F2AD500B404085A356E7B8C556C016B1C4B64B07404078A3B0E42AC456C03DC597B68307404095E4B325BBC456C0C99A0E0D0D0C4040F97939E2A2C256C0835EA329CD0D4040C344579FBAC056C05AEE08E32D1140401457A67E40C056C09A05FE59AF1540406991E9C091C156C0C6B4D239C41540407B3629447EC356C016D093B5A3174040637F1F23E8C256C0BE21605C54144040727CCD4377C356C0B0B7D9C238114040307D27C751C556C0517BD69E09134040C374DDE9F6C656C0D422F9614C114040DA85F98E06CA56C02E04383F8D124040E6433470AFCA56C0CF7909B808164040A9D22E6F12CA56C09BECDCAE5E1A40408D94EB8A6DC756C0E2E12B8AE51C404056DC518971C656C035AD464D861B4040C86CF727A2C556C047ECFFC8C31D4040EDE43E2501C456C06B78E468CF1D404013BC3F23ACC256C08573CC84F21F40402E06297D8CBE56C0DDEE296C9D1C4040B4C5E9DC26BE56C0595B499F7522404027BF919DF8BE56C048E22599C5244040FCA1469DC6BE56C04C3E19561E2640409DADB05C31BE56C04F8E0974E42640405BEA9D797ABB56C0EFFEB536162640401FADA098A7BA56C086166C741927404062C0247507B856C061B0591E9D304040D4BFBD15A8B856C09F2495FDD4304040C01336D88FBA56C08C8CCA274B2C4040C30D2ADD04BF56C0FF665C23A32D40409DC3181EEFBF56C0BE4EE47FE52E404094A4CF9E98C056C00A6BEE55D832404019679CFB15BE56C0C411CD0FA73540405D501E3BCCBD56C071C730C9573840406061981C34BF56C0B3AF6864FF394040092D1FA0BAC156C0943039C7A53840402ED2DA62C0C356C0A6CA6FE53B394040A2632DE789C756C0CC37BBB4D53F4040B005F0469BC756C06399B92D194340409D460064B0C556C098A711473E464040094B624063C256C099CECED5A03F4040118EF23E44C156C03C136797D73E40407B7EBF7C7FBF56C02C9E88F6693F4040DCB9A0FCB0BF56C078F0981182414040ECEEE1610BC456C096C2B0086A4540407D859A22B2C456C080944F63E7474040184A2441C6C356C069C1689FCB494040467EAE5E13C256C084EE907D994A4040E0B9ECBAEBBF56C0367B8414CC4E4040D4BD6E5AC2BF56C06735DD7124504040C2D544DB82C056C059B1E68C475240409AD213BDC3C156C0DEFF262D21524040CB525B1F0EC356C0A730F694A74E4040CE1C014117C456C0E6D2C796A24D404085664F451CC756C02EA55739804C40404F2F13285EC956C0AB60B3EB8E52404042303247F0C856C0F2E50047E7544040855696DEC8C356C07D533196A05C40400FF21AA242C656C0AA24E18EF05F4040E391E5A5BDC856C0B55B302E29604040C000D54703CA56C0C5574BCBA3614040D31180C61AC956C0E016F518B16B4040D24CC4BF18C556C0FDC9D7104B70404073B9FE3ED8C456C087120F5F177A4040FCDAC820F0C556C08BA8DE766E7E4040DB1B39C329C756C047278996657E40402333A0457AC856C0D2E4CD38D87C40405EDD62A552C856C09A10C601037840409A5D3946C9C856C001A361267E7540404B1BCA29DECA56C0FAF040E9DB73404052660EEDB2CC56C06BE1786607754040A9A59EAE64CD56C026A91C21CE774040BB7540C95DCA56C0D29062B20D8040401FA68E2962CA56C0F51F0750AF814040C6EB6A494ACA56C03C75456ECB824040971410E908CA56C0CBCAECEA30854040A30C2125F1C756C0B77B610A11864040244D63A48BC756C0803C58A768884040BC8F4FC866C956C0FA48D5819E8B4040FD02378E33CC56C0A35DD61C828E404001D633EF84CC56C0B37582B7FE914040E723DF0C60CB56C09F5904964093404092A76EA5C5C756C0E3C405DBCA904040C99E744224C656C0D21079199692404054504B0188C556C06754A856B39440409FAF8C22E5C556C005EEF58AE79C40401921C25D7FC356C06B0BBBA8799F40405C570C1C98C256C08A9349E319A44040BC3415BE73C356C0C31B95C097A54040A2641941E4C456C02FA53EE06FA54040597221C497C656C04BD73E06EA9F4040F20EE8E6D8C756C07DB4384262A24040F2144F2A14C956C0D358B8B847A94040E5D72DA95AC856C0058E0CB304AE4040650A4DE6D9C656C0754C5EEE5EB24040FE5568020BC556C0468EFE8C84B44040070F3FA0F1C356C0D02ADAE948B74040DE2D81E0E8C356C082DAA165E5BA40409A643542BAC456C06E9C1264B0BB40407B6D0A847FC556C0433DC9A342BB4040AF065EE559C656C054793C2B1FB54040C6F578CAD0C856C0167B048ECAB14040CC672991D8CB56C0E96B5F4B2BB240404BEA2BD412CD56C05013E6860BB540400C20A773BBCC56C0805DB9850BB64040B5DC332A5CC856C0170C5105BCB840403260B728ABC756C0B861DF23FAB940403A11BFC89EC756C02E2D6D0122BC4040E631910A40C856C0B576DE9C24BF4040F52F3DD090CA56C056DDE9B785C1404059E9699127CB56C03B65B3D892C04040B6725370FFCA56C0ABB72DBFBEBB40401EA077F1A3CB56C031202CC247B94040D858CCD8E8CE56C0C8385080C6B84040D65750788BCE56C0B7DC3F1ED3BA4040A040B1D54BCD56C099BFBEFC9BBC4040628A91928DCB56C004DB1A578DC140405A611093B5CB56C0141B37D500C3404009849AD611CD56C05457D970F1C44040BE481698ABCD56C0A0B71DB00AC5404085936D5A93CE56C08101FE2B3AC74040B55A5F9B84CE56C04B31908598CB4040CB9232D506CC56C0918385CB92C940406E2A8CB2C2CA56C0B34058CCE6C940407CD61011A6C956C03221FF06E2CE4040243E2E92E3C956C07A615CE38DD14040106B729A25CD56C0E99E3F58C4D540402DCB53BCC6CD56C0F1546F336DD84040735435FC8DCD56C0DCAE34F0C2DA40408DE2BC5575CA56C079525C54F5DB4040FD6CCE0EC1C756C012C4DCDFBCD64040C62A05495EC556C088A01B46D3D440406E2F43A36DC256C0551D2E4877D74040284CFEE37DC256C0080B392551DA4040BB7FE0C69AC356C033A7FF8017DC404073104F0DB3C656C07307F2FCAADA4040BBB4D27042C856C0A2B49BD934DB4040AD447AD2D6C856C03DD1933696DC4040E2D17EF426C956C04DC5168ECEE240406884E133C6C856C03B676E6DDDE34040EA8263EFC0C656C02C9E39F265E3404083336C8A41C456C0903DF775B0E440409305B7E6C8C256C0C09EBD5B84E2404062FC10C32FC156C09D46A97FCDE1404058A91C00B6BF56C0BA704FC1C5E24040A6ABAA3EFCBE56C01A4073A089E44040F6F2120064BF56C05494CADD45E640408E1F3A86DAC156C0AB0D617689E84040ACA563EA83C356C0D922962EFCEB40408C5A064CEFC356C04F31DE0900EF404006397A4830C156C06DA03065DCF740406BEE3831DAC456C0AE011497C4FC4040893B8B93B1C556C0B901F2314EFF4040581971B177C456C08EE25933CB004140FF629CABFEC156C03CD8C4DB2EFE4040A2EFCA289EC056C0F06C261ECDFE40409131F80606C056C0196CF422F7FB4040E651CCC429BF56C024209285FFFA4040BA9ED7E1C0BD56C091966947D9FB4040A43BC0E184BD56C098DF11464FFD404071264FA46CBE56C0E3820DC252FF4040CF4FA4644DBE56C003D61DE06B014140CA059C42D6BC56C0290AC1C0040441405765239ABBB856C0AE540987390541407BCBCBBA73B756C0AA4A2D81EF0C414051355BC002BA56C0D48DCE5C2A0D414003C469864FBC56C0395124562210414063D17C6905BD56C0D84D65D1F41341400C48E92775BB56C05905EECFC617414048C4ED9A30B656C03A62CC3CE6124140D6F9ABD80DB556C0B4EA86BE0A1341407E8FC6F6AFB356C0B607C49D48154140C1874F7AACB456C0913BE73867184140241BE967FBBA56C0C6D18F4E3B1A4140054E23ABC3BB56C0A88C9E490D1E4140CCA63A4B6DBB56C0049311C809204140E1EF4FE143B756C0A36069F1101C4140B96FBFBD36B556C0F605A4D2641D4140C1B91181BBB456C07C35B44C83234140494177219EB356C00BC1DF6A54264140EAE4FB7FBAB256C0CF0BC66B682641401CDE53F988B056C0E99B5AF1B823414090AFD8FCDCAF56C019A6926CAE284140E3921B04C4B056C02AD06424982E41406FDC95C458B056C078308A83A62F41402716527C01AC56C05DAE9A8961304140D12EF27999AB56C030E8A64C872E4140A9F1057620AC56C085CD25F2FD2841403424AAF47BAB56C0D1DEA9D3B6284140D04E6D531BAA56C0E372F813412A4140BC6706F711AA56C0775DBE8ED92E41403D587133A6A656C0501CB54ECD33414061BF681212A556C0B54000ED6F37414069D9A4B3C4A456C081C9584A1E3A4140FE9DAD19C5A556C09C5038E2903F41402205861826A556C0A9B0C7FF994241400B5A52D635A456C029055B9F2C444140CDB4CE5162A256C01D025A208F454140B4C0DC50F7A156C0937B2CDF22474140BF9B8D58F9A456C034D102936B4D4140933D555AA3A556C08D83408E5F504140C02314F914A556C0F10420ACA65241409E3AC816EAA356C026AABB44A659414014EA5EB381A256C0BF538568D0574140301747B40CA356C0EF839BAD715341404F64D71280A256C030E7C41089514140DF1A5A0E92A056C023162073AF514140594E9B49D89D56C0DC0F5BAF085641403A1681CA159E56C0C6D14649285A41400AC0EBEFDFA056C051E48DA7E0594140B9C3E3F222A256C09C1292244F5B4140EDE2E6F40FA356C06B1ABFF52C654140626FDD51C0A156C0EEB735935967414088F9559008A156C081413734216741408D4779AE16A056C0C899F5771C654140DB0929EEEC9F56C0CEED307D086241403AD2BBB017A156C08E1B72DFCD5F4140CB89C30E4AA056C0E09E7C236F5D4140F7D0B10C1B9F56C0FEA698240C5D41409D19DAE8E59C56C0EB9DA6E3E25E4140D95AA8E8BB9C56C0B3BAC37F6361414053CB6A2AE09D56C06CBDA6975E66414019B7A2A8ED9C56C0BCC302F3A3694140997BE36A639E56C059CB9A2BCD6D4140871858CA1E9E56C0F72C4547C5704140EA7FC6460B9C56C07FB8C2877171414097A5B865639B56C04206C6EAB56F4140BBA694E6C09B56C00E4ED911F06A4140FBEE3AC5089B56C04C6EE2F28A6A414030FD22A3DB9956C0C7CE2F52AA6B4140715F297CDB9556C09987DE902A6E4140DC9F0EBAAA9456C0ADE5E6B3D86C4140031BB9374E9356C052A0A6340A6D4140E4786EB72B9356C0F7052E32BA6E41409394C9B6F79256C045201C2FFF704140320E9453139156C0E8F3C50DC4724140D988DA508C8F56C0BF53FDA9DD754140806EA2D07C8F56C04465872631784140C3F23691E38F56C0AFA9C1E49479414036DDBCB62C9356C0907B2DFD417D414037472D778C9356C062E390D819804140999FCEC0E76D56C0F27395CAE77F41402AC7CE37616956C0F0ED250718804140781D4670E95556C09AA6549BF97F414012BF383DAE4C56C02A528EF51C804140FC769185654056C05906E8B00780414032A886CA003456C018A08DE84F8041404282A9263E3256C0AD9D264768804140E5F3E477851856C0DB17A533A5804140381A09B5821656C0D7619F937D804140A5D423646A0C56C0C3D2C7EF9180414019039FA1280956C0A61B9E7A14774140705B1CFFF70656C074C00F1E317341403407193DCA0556C026CA2AFEA37241403677C7CDBA0856C0D1DB4BBC4D4A4140EA6E5C2FAE0956C01471EF128E3B414076A73F2DBA0A56C0D6B84AAA7D29414089C16423C20C56C0365A7ACD930B4140F3AF5821F80C56C07E28A15191074140878ACA6FE20F56C07384BFA811DF4040F62A18D4921156C090EC5572F7C44040B33EF553821356C0C54B4A7DFAA44040C60505D1B91556C0BC71CA4E667E4040EFDAB04F461656C022606B7A5E76404048B53C8D341956C0EDF002D94C4A40406FB32B2D401B56C0C9F37EA99427404010D893AC031C56C09D0B9718271D40403E752CD8441E56C001770E6E8DE33F40BCE08025C41D56C0D4358654C6B33F40733A4DF5D91C56C02D07B1A3846F3F40');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('26','MO-DNR','MO','MISSOURI','F','944','0106000020E6100000010000000103000000010000005001000070CEDBDFB84656C052F3321E1A7A4240E8454B3F4C4856C017EA284BE96E42407A13F102A94A56C0AE417A0CF76B4240516319231B4B56C028B2D10E2B6A42403CB29840864A56C012159213F966424085814BDB0E4856C078BFAF976F6542400E8C06DA084856C0728BCCBB506242407D0F8D1CB14956C0F34F0A1C2A614240702EC55F584B56C0DDFADCDA67614240868D0B41914C56C0C61937001E5D42400BD8D1E0A44C56C0AAC73A83515B4240422CDDDCBE4A56C07FDE0BECF7554240FEE98F9D564B56C0693C578F97534240BEBBE2DFCF4C56C0CBB3A253D0504240142410C0724D56C037DA737D7D4A424047A6EFC2774F56C02D795AC0DF4842408B42ACC7245256C0C020A7BEA3494240F586B44CA15456C098949F33A04F4240234002CFE95556C0CC05E5118050424044024491455756C0261F25F218504240E30151D2EE5756C06D81CF33E14E4240919788F5C35A56C04DDECD295C414240BA43E6D48B5A56C0FDE28ACB574042400B713CB8B55C56C0AF93B9B36C3A4240A8B6AA5A235E56C0C3A480151739424030143EFD7D5F56C0CF5C2F51963B4240196BB11B755E56C0478A6E6BD23F4240BE95721CD55E56C0A7C6B7E99B4042404617A73B2C5E56C002E69B6547434240C314F1FCD45E56C03B8F71801F4642409AD95C9E905F56C08EB0D71D93474240D75AB5C2F26156C09A55795B45484240A6565105996356C0CBC7401C66474240B89E75E65D6456C04B9AAFDF4E454240C71603C64A6456C086F97D0468424240F42A1F22216256C002F53D0AC43F4240FDE3F5BF076156C0F4716A4F663C42409891D982E56256C0E1D90775733842403A1BB9FF486156C08CBC24FD57334240331219FF3D6156C041160746912D42408AAB1542DB6256C0E2223CC7422C4240A39391E9C46656C0D8A539A46A2D424074369D2BDD6756C0F0142548DC2A424081566D89D66656C04F3A8DED6F27424080BC4941B56256C096E9FA93F523424017F44BE0446256C0343D4B97DE2142407678E0A0AB6256C0C4574EB8F020424006D39DEA8F6756C011E647FAD71E42409FC47431EC6A56C040D11297A22042404B6F8DB4746C56C0DD1A55374820424060348CF4866C56C0717A1099D41E42400C05B4D1516B56C0D40EFB9C471C4240F8B178C9976756C01C8BE22387174240F6C84BE5BA6556C0472704A9771342407AE7E164BA6556C09FFE8F4C9F1042403AA283CDB76A56C02E55FDB1B80C42400A5E4F6E686B56C0B406F314A10A42404FF4FB4D176C56C0F888119F4F034240788A1E91326E56C00EB55E64FEFF41406F68E291A67D56C09C2A7BB59AFF4140117076C0259256C04590378FE0FE4140C8C50B8E429856C0A60CDB0FADFE414052DD8B862E9456C012B99397BD0B4240377EF0023B9256C0DD1E9431D80E424022276620E29056C034E2A3D0350F42408FCCEC3C098F56C0E346F84C8E114240FCC9255DDE8E56C0B09457A7A21442400B05DE5B098E56C0ECBE49C518164240DEC31A75548A56C01A10A08337194240DD7CE071678856C034E61042271B4240FC74A6700A8756C0280E6C1A082142405F1C8F6B3C8456C09A5810FBDB224240B128A4A9308356C02B0615F777264240999BE9AB558456C03C778C91A62942405A24D209388356C069AC94EB6B2E42408217108A568356C0847A9587F930424047C3282E238556C04B0EE0A3DF3242400BBF65B37B8756C0D5D6DD40D63342400130C774EE8756C078C7869D18364240F2163634828756C0C99A3A381B3A424073AF2AB7CA8856C05A305B978E3A42400F6CC6D99D8956C00B811AB1F53E42404CFB33C55D8E56C00AF77C6F143F4240AF3399193BA556C014F790D1D93E4240B48825D87BB356C07E6E3440A03E4240DD37A5BD92C856C05A875A4C773E424027C484E05ADA56C052E62F6CDC3E42409AF9BBC5FDDC56C018141FACC63E42400131466011EC56C0ED1547B2D93E42400D26764A2B0857C0AF60365BE73E4240990A304C5D0957C0F39BD3BBEE3E424088B1CDA9792157C01A390983D63E424090C093C7C43157C01280B1C7B73E4240E3CD73AF8B3657C046F23D89B43E42409471095D075357C07E7CCAA1CE3E4240F5D2BB9F035557C021C720E3C03E4240DE0A2C3B2C6657C04C0C68F8B63E4240586AE69AE17657C09C5DBE51B13E4240279758F52F8557C0CF6614E2D93E42404E4FF72381A757C0BF21671FA53E42401D35B0AABFA757C09BEA5359D4554240543887ADC9A757C0D3F598E5BD614240EE67D94CB4A757C06DBB293B9F7F42408991DBF4B8A757C05CDF17EAB2874240EEC9E5539DA757C046CEAE21F3A942405E9A37D699A757C0DF5893982DAE42406D3DAFA19DA757C0690C39773FD34240880FF881A2A757C0F85B1CF205D742404BBB809778A757C0D464ADBEE3034340D240FC5682A757C065FC4EF523074340FC6FA6929EA757C0E7C1071B2E324340969B3A1299A757C04F1A5340593C43407C82D1D13DA757C05ECF1A4E5D5E43406436DCB332A757C083209A62266B4340680D3F77FEA657C0A3A87DABB7854340E6C69EB6EBA657C04714FD42708E4340207B9C757AA657C0DE1D58BF13924340EDBEC6B635A757C0942B473E699343402D48BFBA5EA957C0B8D5F25C47944340F151459E3BAB57C0A8D5ECDA63964340873FDA04C1AE57C0D5EE04BBEB954340A624D72A90B257C0A61EE6753399434047168C4D88B457C00DB91D33029B4340B50608AE57B557C005386E8C81A14340F46CDD1164B857C03A21D3269DA4434061FBA67317BA57C0FEB34CFF58A943403F5EBE7353BA57C085DFF61B89AB43409CB549727DB957C0D84780D5B8B04340CC7A7E743FBB57C0FE56FD53CDB043408B47C4F657BD57C0443D484DAAB443408ADC5EF81DBF57C0FD15614740B84340753F52BD97C257C0665949A441BB43409556D4DD0BC357C056D547411FBE434071FE1CC687C657C00B3BC46134C4434092EA36A9F9C657C017595EC1C4C74340C643A6656EC357C0B4422F7B1BCB43407ED50CC995C357C09D3E069A16D043407D5D8589CFC157C029119394B9D44340EB9494E6A0BE57C06B6368B0ADD74340DD418DE88DBD57C03DB2926DB3DD43406B2ACF4700BD57C0929BD9AD45DE4340DC67452493BB57C0B9C25A2F0FDD434061915CA1F6B957C02A00535006DD4340BA76DADE2EB857C0DD545A90A1DE4340C398D27EC1B757C076220BF086E0434031E40CE021B857C0A810B8EF5DE1434022F570C5FEBA57C05832F8ED00E14340342CF9E7D8BB57C09037082E41E34340779943A8BABB57C0D6460AEE31E44340FE23B2848EB957C0B7DAC86E9AE543401FE5A144DDB857C0BEEC138FA0E843401F246A267EB957C03AB9B8CE06EA434085D1E1C920BB57C09A8C890EA4EA4340681E80CCEFBB57C08DCCBEAEB8EC4340E7467E2F0CBC57C04D4C0FCFB2F243404F80EEF2C2BD57C0E9378D2F4EF34340385A98B864C157C0EF97A932D0F24340E0D176F824C257C07311C0335DF04340B404163A0CC457C0751356B7EAEE43400916053D72C657C0266B53BC57EF4340FEC262A2A2C957C0D64592223BF443402F847AE569CC57C02EA8DAC780F44340E1EF764749CD57C0A717FC2816F84340A802E9E96BCF57C0A3BB62EC96F84340404305B2C1D357C055153F96ECFF4340F9EF1D9515D657C0EAB4E65932034440C9849C77C2D757C0F184611EAE0344404D4F5A79FED857C0A28726A099054440EBCD961B7BDA57C01E818E83280644406344309AD7D957C0974983DD490A44401FFD16589CD857C0781122D8340C4440737DB5D823D957C0366AD0F6C50E444006AACBDB09DB57C0A09095F9DC1044409E98663F80DD57C009C9F97945164440C878C95FDDDD57C066D359F54B1B44406E0FE24084DE57C0B98ADC94091D4440318ECE4A04E357C00D96B95B13224440733E33341DE657C0D18826C4A627444082E3409C65E957C0F3D145E890274440CD73DBBC50E957C03AFBE0A842294440FFE6CC388CE757C022622BE76B2A444019BB48D96FE757C0D8CFE7075A2C4440E192BC7C96E857C0E2A3D929ED2D4440FD93009FC1E857C01B5831ECBC32444048D391CE80EC57C0C80C60901F3E4440D70E6E8ED6EB57C0323173F08F41444087EDEAAA1DEA57C04A7AE0EFE143444028794CAE6DEA57C0E07D726E84474440DC2C1C913EEB57C03310A54D6D4844400222D692FEEB57C00D6D226ED44744409D84D5D04AEC57C0FE38D1AF164344409580CF992BEF57C02D1815CF24444440D25E89BFDBF057C0777FDCCD5C464440C2B7C5621EF157C083708CEC654B4440A79149C87BD857C0599FFB74CB4A44401FE0D458EACD57C09F70DC747B4A444052D2CF5EEBBA57C08DD72B4AE249444024F2C1BBF3A857C01AA9DF01B249444074B0BA060E9F57C058A0988B7F494440E9DAA3CF418F57C01B6F1A6B1549444068694EE0278157C0D486748E79494440DEB7B4CC527257C096E0C1990A4A4440436CA9B9066457C0C383F01B584A444041749E86B25757C00C6F9B884D4A444024D414C7754657C0C0313BE4CB4A444017BA23B0F02D57C000B3E3367A4B4440299914265F2957C08DC2EA05B54B4440E8B0DA07231757C0B1CC3FEABE4C444065F844F85C0C57C08F41F4B4CF4C4440E7B1475491FC56C0D5BE0FAEDB4D4440085D943478EF56C0383FE9690D4E44407F420AF1E2ED56C0C24B7EB1F54B4440E2DA0E4D28EC56C0E87709D8644A4440E63DAA0D4BEC56C066225D5F9D46444026EF5FA3D7E756C0ECBB1A2D36444440586F25A37AE756C0C69F8CB49F40444027FC4E7E81E556C0EEFBA8BB043E44406561BC9C14E556C008AAA77E5C3B4440E8B8901520E256C0DC3BEDE44B3A4440057617767CE256C0C91F94257C3844408F1A9014E5E156C0BEDC41E7B0374440A9C4A6B3C5E156C06687FD6980344440EA8A622F06E056C073F6AA4DDC334440EDFC554D61DF56C08F2016EF05324440AE6728CB87DE56C071F9C7AF0C3244404D920A46B8DC56C0F57967F29B2F4440BB089C8A28DF56C07B080B37A32744400ADF530BF1DF56C07F6A639C2E204440D0B6DACB6DE056C0787E9B1CAA194440B34839CC0AE156C0DC2D633D3A114440035C172944E056C0388E3A7F8B084440EED24F4532DF56C039831301BE00444087C6E51DA2DC56C00378B0201AF943402A14F9FA8DDB56C0EF5AAE4000F64340DBB67FFBC9DB56C06D896AA070F343404C8E6B7EDFDC56C00901861F51F1434009DF22FEC1DC56C0624046DF79EE43404D920B7270D856C0E2E64680E3E6434063B18490E8D756C0F4EFA0DF72E14340A7A98BCF80D756C02FD1A17EC2DC4340BB783D0757D456C0B6ADFC9ECDD74340C692C75404CD56C0B96BC702CFCC43409D13594D01CA56C0289078E3BCC64340D274FF0200C656C0A7177C64B5C343405B04E81E21C456C040D9E003ADBC4340D8FCEC9A55C256C010051904E4B843404C1CDF6DACBC56C0F42419E847B3434049B2329F70B656C0BAD5FE2CDDAC4340FDA17BD2E2B156C0E4D35030FFA54340E5EAC2CA3EAF56C0D2F586D1B99F4340082733AAE0AE56C078072013C69C434030FBF1E8F8AD56C07268D4F4139943400FA19608E1AD56C0177D301877924340FB022C8531AC56C0916182FAFF8B43403C2BFF264BAD56C05FE8B0FD73874340688DAE4632AD56C04AC631FFD78443402A6D5EE4D0AA56C01CD1CF05B877434045981B4126A856C0E22A2889BF7043406AB7E83982A456C089D61047896F43402F338973F4A156C0CB8E9BE221724340ADCF48C9139E56C057760EF8C77A434064B4CCA3719A56C0617FCA352F7B434029009F7B789456C0855CE9F66476434052418ED7DB9156C037468BB55E764340FE8902549E8F56C08954033510754340BFEDDFC4818856C01B4BF7B4316D434038CBF1213F8756C0CA3B7F554E6A4340F21FFC22CC8756C0AA54E8B8786643405920E184A88856C087AA3F5B8C6443409132CBE8768A56C06447177EF66243401D16AF6E968C56C002323385AC5C43401E944650F38C56C032609727A75943400B10158FC18B56C091D74749545443407556ADB0C38B56C0A393740D1F4E4340450AC97A6D8F56C061EC42B50B484340C87080DEB99056C0231BD6783344434004EAA97F049156C045E74F1A66424340F8DD0648539356C07D60A160B5364340E3BD580EBE9556C0BDCCCF0309324340FE39B2B1F69656C049CE3FE5C42E43403E0C8854A59756C0180F59276C29434089ED3D575A9756C0F22DEB48FF1D434034A3EDB58E9556C0CBD9B286291843406F9FB7518B9256C0C1FEB6055C1543407CA23F70449056C09DDDEB04A50F4340DC21020B4A8D56C009038601630B434023A7B701A18856C061787B9CE9064340C9EE7D20A58756C099573B3C2304434062179DB6B08256C04C4DD21823FF4240A911ADF2B28056C03BBAF15814FC4240285BFF6B557D56C0A5FB6E165AFB424058B9BE50A87E56C006E33F5CBAF4424085AB29ED077C56C068DD697C65F0424075659A68A47956C058F6F9591FF04240AC7DDCA37B7756C0A316C5B62AF24240875964221D7756C094F003B5E8F34240C3575C41847656C0A6DC74D4DAF342400B07FB94A06E56C075135352A7EB424006FCF4F03B6C56C0B2A83A3305E74240BE4EAAEF426B56C065F18AD35AE44240DEC79AEFA86A56C0356728B46CDF4240267E24E0376556C0B4FDE54C63DA42409EE2D137626156C0F9C618C9F0D842405DAAAEB6DC6056C00429C2A706D74240EDB133D73B6156C02324E02541D342400E4A8696DC6056C0B2358F63D8CE42404CB9F8B69A6156C0F4C9218137C942400BCCDD13AC5F56C0992FC87BF2BE4240503FADA7095D56C085207E9E03BA4240F73885DE5E5B56C000B0B3E09DB44240F536C29AE45B56C02C4216C389AD4240C5D1EA5E015E56C0EBF9946473AB4240C4637F030B6056C0D9C44BC52CAA4240EABE8601E56056C0F545EAA70AA74240E6017CFEE46056C0C70D84C962A34240E663E1F9565F56C04FEB8449C6A04240FAC5A615C95D56C030721BE97BA042406E5E6DB1F85D56C077EC1768B69C42407E5689E3325C56C0FA3EB6C52A954240F84FC6DC205B56C01E60578591914240CC3DEA11535856C02608FA64B08C42404A3CE28A835856C0253F3E444E864240C278E45EE85356C043B5CBE63E8142407C665A1B1A5256C07CE042A8E77F4240561F85DAC55056C0805716491E8142403B08C89CEA5056C0CD7248688E8342403AE3FC64D35356C0E1A75086CD87424061736F676A5356C0DF432586EF8A4240F5D6DC25325256C075DA5986AF8B4240FD954483E75056C0FE1ACC86288B42407A3AEF5A374F56C0133A942959854240CDEE32B5724D56C05BE89B0CB78342401993F6AE634C56C013514F31507E4240ED1068C5504856C097F26A367C7E424056F44AA1DC4656C0716426DA1E7D424070CEDBDFB84656C052F3321E1A7A4240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('27','MT-CEDARS','MT','MONTANA','F','945','0106000020E610000001000000010300000001000000290100005167795D6DDE5BC0218DE173E05946402DF4117EC5DE5BC0863A8951805846404359DAF97BDD5BC0965DF250C35546408FC3CD3854DD5BC00D09D2EE86534640E3C3D63A17DE5BC0DCEECFCB02524640F9F41B017EE05BC028FCB4C79F5146406065EC9F1CE05BC016990225D84E464091DD5200EEE05BC07614C7E0ED4B464028E499BC8BDF5BC03F7D715D8D4646408740DDF69EDD5BC06CBF9F806446464034E8F49565DD5BC0928D7C9FDA444640CE253F7AE2DE5BC01B74635CA0444640F5FFA81B60DF5BC06ADA735AAC434640CE9F92824DE45BC0D914EC55C4464640B2738964BCE65BC0D770DCB08045464046574CCAD4EB5BC05ADA280A7F4646403700624AE3ED5BC03164B744524446401593AF2F15F15BC0B5CDACDE684246405C04BB17BAF25BC0A482BAFC5C42464038912C9BB3F35BC0F8003F7A82404640A2221E14D7F75BC02F5842B833474640A6C059482FFC5BC0FFF345715D46464075273F9394FE5BC05840F86DCC434640B631DFE082015CC0657CA54B7C4446409827DCA1BB015CC00693C98BEC4246402B31F7AACC035CC0F6DE3F8BA94346403B1773B664065CC0BB37026B55424640665302BDF2075CC0F7B2C3CA9D434640BBC60132C70C5CC05000F58906444640E484E5D6EF0D5CC0824AAC69ED4446409ED183D9BE0E5CC0F7F680699D4746408C095D5F6D105CC08F738428AD474640961F49E111125CC00F3DFE8456454640B08F2AA4EB155CC00ABBA57B36434640B7F8CE03CC155CC061D5319AA33F4640D049A37D86175CC0AB0650B28139464075A94B9FED1A5CC010D0AF2A823946401A0C0263581D5CC0BE6DEEC5023C4640F2698E231E205CC052E0487F433B46402578574A84225CC0CCC26CA31E3D4640E6FE53D9CD295CC01E92FCED8A3D4640D8A3DA83B72D5CC0587CE1949B3F46408CF56224F52E5CC0D1BEA535FE3D464044412C47E9315CC043F16579A93C464072B9DE65F5325CC03BDBE919A03A4640A51D2383E8345CC065788118E63546401E934CBE65345CC0CE223C74893246409F268D3950345CC0069159309E2E4640A3A7589B08365CC06A92CB10442D4640332EB6E0BA375CC0E858E8745B2F46404C4AC3A5C9385CC030A9C3F948324640805CD7CC0C3C5CC04AF567E01E3446405C958D540E3F5CC088C765CABF374640958D8BD8C4405CC0B752F30C073846401761DB186D405CC01088D54FEF394640E989A2BE4C415CC06F627BD6AA3D4640335CFA5E7E405CC01CF674BB5B4146403BBD41A96B425CC05C442501384446408DCBEFCC89425CC067EE87A534474640CA40E37950455CC05B8F8B4D954A46406E6A6E7979435CC0599270B3E84F464052F1FF63AE445CC00BFA019F7756464073AA864B55465CC05434EBC513594640DD516B4E82465CC08A0450CA8A5B46404146BBD527485CC0CC1E6C72625E4640B6C1D47AD9485CC05A6239D77661464048820BB4614F5CC0547EED66EA67464004D20C3775505CC005B54C08BE674640C34F254165545CC00B8D1287DE63464032DC37E6CC555CC0A4742147B6634640E8DCFCCB66565CC0742AE3685E6746405EF3F9DEF75A5CC000918CABB66A4640ACC81746845C5CC0FB0E326DF56C4640675A9397C15F5CC07C030F3520774640FDB6A4B6305F5CC0661389F543784640112F4892A85D5CC025C9CE546B784640ADA42D90B85C5CC0952556F58979464082E16DD3395C5CC06897B1D8C47F4640FAAC6FD95D5D5CC0AFE51D778383464024187BDA255D5CC0A25B42758C854640B28B31A11F5F5CC0043D0E1577874640C1180EC35E5F5CC007DECAB31D894640C8B3B2A851615CC078018C11818A4640F1CE9589A7605CC0D9FFCF8FCD8D4640B678846F58635CC0E37F3D2CC48D4640860F6693C2645CC0002F9329118F46404F818ED494645CC08DF81DC83891464083B1B2B805665CC016D99DC42A93464084B5199C75665CC071415AC02A9746400E00C46351695CC0A9A7121A789A4640F03F5FED2A6C5CC0F473CC7092A146403B079DCE136C5CC0975783908EA3464087904F194D6F5CC03B6EA6EB27A946407394629F716F5CC0E90B530AF2B0464095787A069A715CC02D858F8780B44640CB67034B48725CC00E7533860AB9464093073E0C3A715CC0C17EE38625BD464010C7236F6D715CC03A577D26E7C04640CC3CA7D0FA715CC0D2D8D3A528C2464097C037965B755CC03049B482E8C14640CFFDC1B670735CC042FE13A6B7CA4640D6849699A3745CC0E8AF71A5E1CC46402669319D87765CC0B644D32306CE46400810C2C2CF795CC02B2FB5E086CE4640632ACAA3BD795CC0BAD1768191D1464089D2BB261B7B5CC03DDBC020DBD34640AC35DF074F7B5CC05686F940EAD54640DC63218CB47D5CC083DDD2DEF5D64640BB74BA4D277E5CC0CAD5F89E43D94640E19938319B805CC0691E7EBCD9D74640A21EADB145815CC03D1CC97B10D646405039CC0FB4805CC014FCB47B85D34640F9ED027027815CC0EB2CF1DA04D24640049D8EF39D835CC05C3DEBB704D0464077C4C6544F855CC0B0373C750ECB4640412619988F875CC0F5962EB21AC946404824CF7873885CC077CB97F072C6464017F746FD0C8B5CC02DCDC94D9FC546405D521FBF778C5CC0D40DAACB92C346401FBBE3E47C8F5CC04083DD6884C446408B086144DD8F5CC02279F98660C046406641B485C8905CC01BD2B6A630BE464014A7A34DE4945CC06BCD64E48CBA46407288FF706A965CC040B29D2250BB464077E875F4C5975CC014A9F4C02CBE46401FA96ABBD19A5CC035597A7EDFBF46401F0A005EBF9B5CC02EB71F7F89C34640F4B540029D9D5CC06AE236DF1FC64640B766BB26C89F5CC0830F7E9DF8C54640F458F0CAC0A15CC038E799DD72C746404DB41D2FE6A35CC0C353931C3DC64640A2FF750D9FA25CC0EB87B2BF56CC4640F29A19B123A45CC07CA88F20E8CF4640A40355891CA05CC0D2856BA381D346401DAE0C6BAFA05CC006E4578447D64640F5DF9809D89F5CC0E29DE225E2D84640F12A2E0F3DA25CC00BB892268BDC4640C7BA8570AFA25CC0219CAAE77CDF4640B2B11B1411A45CC0BBED374896E1464053A744AF1CA15CC093011E4DB0E7464056DFD14DF29F5CC01D0C3610DDEB4640093D09CB529E5CC0545C19B173EB46402E9815E85D9C5CC0F0F903B322ED4640F395B7E3149A5CC0509C819358EC4640D307374324995CC00951833579EF464001A70847779A5CC00713CD3790F44640FB4020497C9B5CC063513EF8F2F546402527EA47F0995CC0B0CD62FB1BFA46408B616889659A5CC0C2E43E9C69FC46409FAB3051019F5CC0F16821FCB1FE4640DFA38BB15E9E5CC0D952D2FD3F0147402CACC9F4A29F5CC046CFEB1DFF024740BFE0A3F4CE9D5CC0AB54CF1F810647400763EC962F9D5CC019ABE481860A47406A8A1C3B8D9E5CC019B79EE2BD0D47407419CA9E6BA05CC0DE988DC2DD0E4740F875E96136A15CC03FFF19836A1147404312D6829DA05CC06796B844261447404704059FE39D5CC03A6A90A5DF13474013D02E5E379C5CC06EED72C6A0154740D6F854A3219C5CC0FC033449311C47404A24F4E7429E5CC0C329E649341F4740BFDE23A9529E5CC0A6DB6E0A612047402ED0E38AA29B5CC03A1C0E6C7124474038ED5A193A9A5CC0E04542EF4A324740A0549BB968995CC0471CC24F24334740610B0CDD93985CC0797A2791CE3647406DB84827499A5CC0DC87E531623E4740E48B95E711975CC01C1CB9B3C8404740ADE8AA4868965CC0A4707CD4394247405A997FF2F8955CC077F73CB53F4B474014938916C8945CC051A68636B94F4740C858797B6B955CC0D49B33B6BD534740C4E80FBF93985CC05771CF32AF5447403FD7CB1F429C5CC05923F0CEA6524740502ECF9E059F5CC0722B8D4CD14F47400FC6BEC395A25CC099FE1E69A65147403CF4FAC517A75CC065B984A5845047408CA5F56B43A95CC09AE2B9E1955447407F368C4D48A95CC098E728C1E0554740C1D3FF2E0FA85CC0DA1E9221F35747407969E0F720AB5CC06236015C0B5E47406F7AFE18B3AC5CC0934080DAEB5D47406406C6F5E0AF5CC0B44A2619FA584740E1B05F5A1BB25CC023819237FD59474042EFA300C8B15CC042295155BB6047402F594163D1B25CC04D86B8B51D62474060A7E188CFB55CC0DFC33DD544634740EEA35D6D76B75CC033AEA6960566474083E72DB1BFB95CC0C4964DD653664740BF2705BBB2BC5CC091E21AFA1C6D47404DBE043E32BC5CC01E1FB99D0872474098C22DDE24BB5CC093E04FFF1D7447401A33DA23BEBD5CC0C13DA4606D7647400259DCCA19C05CC0C7E1DA43BA7A4740479D8CB063C25CC03A4D52A0437B47409E2853948FC35CC09DB29DFF967C47406FBA179C34C55CC0174EAF26658347409930CF25ACC85CC04379316C228847404E3E320984C95CC09E1AA133BE8B4740385FFD2C0ACB5CC03CEE01337D8C4740227744515BCC5CC09F991419E08F47406A241F82F5D25CC0E9D9D77FFB9647401B847E88D0D45CC000909012619F4740D7380A8BFED55CC023D7FD93A4A047406E937E1320DA5CC0FEA14E70BDA14740AAE741164EDB5CC0F6D976B11EA34740CC9B969F1FE05CC0A86494EC0CA447403ED8B0E179E15CC01E646EAF5FA547404B50A9A68DE35CC0D19F869BD4AA4740DFD4C8CB5EE65CC0015C13455CAF474064933DCFE1E85CC07C77EC46A5B04740F7057C92A7EA5CC0A196E1EB17B34740982EF45905F05CC0901D08B013B6474019E0CFBA01F05CC0ABAB25338CB747409E9B35FAE0EE5CC03626E8B6FFB847403DBFF354FDE95CC00984D6B97EB94740981F6BF429E95CC0B72DABFC98BA47409C815E15F8E85CC0191C9A81D4BC4740C65C2B5A56EC5CC0E8873744A9BE4740A4F64ABFE5EC5CC07558A5A4ACC24740525344848AEF5CC0722F050150C4474076C10B2B4BEC5CC0DE1361BE9CCB4740F55CEAAFB0EC5CC024A0B0BBDBCE47404422DCF5FAEE5CC0588F7694E7D14740E55F515FF4EE5CC095AFFAED07D9474030CCD383A5F15CC052F7DE84D8DA4740CB9BC32A98F25CC015E188DD56DF47408189A72E8DF55CC03D35C3D4CDE047405151FE525BF65CC07BC3053810E74740348598F5AAF75CC02F4FA5F6E9E9474038C649D8D9F95CC06FCE0451A8EB47408BBA999B05FC5CC02E1275ECFDEE4740B0C0EB81EEFF5CC02097BB036BF64740D9BF5EC79E015DC0DEC27C2083FB4740ED4EA46B6C035DC0D63C42DAF3FC474086F151458D035DC0250BD898AF1A4840D26846D8A0035DC0553AFB42D43F48409EE39CE510045DC0ECBE8260FE7F484087ABDF43ADAE5CC03D1CA505FF7F484052D62FC90F845CC0715F5A43FF7F4840AFB3288A0E0C5CC0716829BCFF7F484068877B6B17D25BC0C2C54B610080484018C82A100DB05BC019F9252D00804840DA6D5B130C605BC0223C1B2A00804840299BB90E0B105BC00656C850008048409A33042C0ACC5AC0EF57CB8F008048404B97317F09885AC080B6B0B100804840B38ADBC108445AC04275FEB20080484089FBC50B08045AC0BB4830E0008048403665192C59035AC007689262AA524840313951CB55035AC0FEA837EC0C324840F0F9F86519035AC089C0C7A902004840BF83C41607035AC0DBE707C433B3474023AFD075F0025AC0A198DE01BBAA474056AB463709035AC07F00751A4C524740F7DB4C39FD025AC069C534EF71454740E15A90C00F035AC07740C1ECF32347409735164821035AC016F26504B4F84640DCFAC0482B035AC0534C40DF07F14640FF8D2776CE025AC08BF3F9803F9B46409F213CB2C1025AC071A86117B87F4640D4AE2975D4035AC0844E1AB7A87F46405B1E10C9AC425AC08A54F540238046403D4ECEB070455AC0D2377E01FA7F464066815D885A815AC07EC3ECB2A47F46409116B14097905AC045B3C140827F4640846A0B6E3DF95AC02D5EC395F87F4640E3DF285D97105BC05018F9C5038046405536B53204285BC067C31A22B17F46408BF9312129735BC01778BC5CF07F46403A1F3AC0B67F5BC0E02593845B804640CDA075FA22995BC0A331EBF3D27F4640AE0AAD607F9B5BC01720F632037F464029C9F05F6BC35BC0EF062AF3727F464048CC60AC4DC35BC0553AF8050E5546404410F9C44CC35BC0460525DB953C4640D8765A6D0EC65BC0E8C05453393E464027FFE33340C85BC0751DC8CD1840464030CE2E5699C85BC0C183814E92434640AA772D3EE5CA5BC07789A0A8C84546407F05BEE070CB5BC0A8709A084D484640FC3B41690CCE5BC0399FE5A15D4946403A2927ADFDCE5BC0CB3C16C2204D46404C6CAF2A11CE5BC079F1FE051A4F4640172E008C55CE5BC023C48C863E504640AB74349552D15BC088B361013452464068D72B164BD15BC0A3DEA2243F56464019FD383BECD25BC0156D6F836A5746403A45A6BF30D45BC0E8F408C4435A46403C8C0A216ED45BC0CF8E2EA62A5D4640181AB10666D65BC0D640F562F35C464030BE64EBD3D75BC04F8AFE025F5F4640D04C752DA3D85BC02DF717C16C5E4640999F980E49D95BC05E84973CBC5A4640FF78E27764DC5BC0425F4C78495B46405167795D6DDE5BC0218DE173E0594640');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('28','NDEQ','NE','NEBRASKA','F','946','0106000020E610000001000000010300000001000000C4000000EFF293BB125A59C0F74D97E32000444032FF015C4C8359C021A1CA8DDCFF4340C8C921FA0A8359C06BF35AC6DB2B4440C231B6360C8359C06544738E2D37444081F8962DF28259C07F503CC24159444062352BEC018359C0F9DF11E51E5F4440D50628290E8359C0018233C9C07F4440E0F3F7ACC2A759C010CB0E0A078044405FB512CFBEA959C068095E88C27F4440A22BAC5C82D859C0EB83CD5D0A804440E3D377D4A0E459C0DDD3F87AF47F4440A446B2244F035AC038CE873A69804440244A42F074035AC0E437B6CBACB14440A0A41D528D035AC0AAAA767038C8444081D35B6E6E035AC06D9039375FD944400FF89DC36C035AC0D5F523F3F9FF4440278A1E1999035AC0D692057FAD4E4540D15E13C398035AC05EA8BB58648045407162CFFB17E059C0E75B06BED27F4540F6CB724260C059C0A3207CD4EA7F45402EB980E474B259C00C63AE1B667F4540861EFF818C8559C0BF80209EB47E4540843846C8D44E59C09286B9DE507E4540E59D505CAE0C59C0F540B833DC7E45407A0D8D3C19E258C07EF900D5047F4540AFCB861241D058C01A372A9E067F4540201F2885D99F58C0F7ED869BF27E454056C356C3469D58C094303EE2F4774540117B6A7F099958C0E1CF3303C7754540E7A8839ADC9358C09F18BAA6DE704540FA70D1ABBD8A58C0EB792110776B45405AC4BD88458958C07A632B52FB6A45405562D025E18758C0F8D34A16FD6845400B9282E5CB8758C08E12255878674540C162F0F81E8258C0938BE6E474624540B213C173B07F58C07CA1BCE726624540A5EFE6F0AA7D58C02F98294608634540CAB0F88D7C7B58C00343AAE26A6545407EFF41CBF47858C0ABA8F81B676A4540742FB4CBDF7858C02B90CE178B6D45406A7F8AA5647458C0548ACA56EC6E454069051083027358C0838C2B99BF6C4540E2A2CA806B7158C01362C2194F6C4540AB06467E6A6E58C0FFC0FC37D36D45400537595CE36B58C054BD97791D6B454075CA625BA36858C0A539B6953E6E45400078F798856458C09A28C8F58A6C454072B81177646058C01A0DDEF3186E4540ADEAE413EC5E58C09AFCCC52B76D45403DC969CF435D58C088FC0752DB6C45403CBED063EA5858C0633D9C0C086F4540F3AC7536EE5358C0E682DF884E6E4540C2C56A8F5F5158C0B211C147CD6C454022B1FD6A904F58C075D4C0A5086D454001497F485D4E58C02B4E4886AC6B4540A6BC91A68E4D58C0668CF46802684540F8AC14C0544A58C062091E29396645408AF1C29B594858C0644FDFEB0F63454060507A0CF84058C0D8169FAC38614540EC7761A8B13E58C071FEAD6C1061454021A63387143E58C0DA3534AE436045406D8DEF67953E58C0EEF54D6F185D454031760D27213E58C07A19AD8F4E5C4540D615C080203A58C04376A04FA85D4540F3DCF955D93358C04CB45C701F5A45401F902C35DE3358C034EF6E3036574540D7A18F73283358C0E9B25830C3554540E3B67B0A402E58C09206AE6B945545400043FA66BD2C58C0E4645108305445402D4FF845742C58C09F808AA71152454058CFF307C72D58C08BA919AA9A4F4540A1846D27B32D58C07702B8E95F4E4540294F873DBF2858C07FF6AB607E464540AF86755C462858C0FEE069A0E74245409B03DFF9BF2658C0B165671EED404540B320F8976C2558C069226B3C5742454057EC6C94052358C07FF8B9B89F42454049577830A91F58C0F5D51CD5853E4540A2B6100B1F1C58C02A9ACF719F3E45404D3BB147591958C01569FACDD33B454008EBB908771958C0C821EFAC8C384540B80F2B6CBA1A58C01C4AA96D1735454038E3C64C5A1A58C032A4BBEBC130454058029AAF251B58C0DB8FA42BB52C454063516B2BF21858C07C8695C7152A45402B9855C9981758C0E50111A42526454099BA8FC5F11558C0D46BB6401B24454019821C444A1558C0FE20B1BE5121454082BBCA039D1558C0ACF88EFC601D454068D83FC7431758C0BDF661BE651B4540C27D2BE2891658C076E3A71987154540BA0D6C743F1258C05644444CCD0F45401053F2ACFD1058C09B2F4A4142064540651D2847470F58C07E2AC1DCA3034540DD5B53251C0F58C02AE2BD3929004540F973295FFB0C58C036C2DF1991FF4440DED24C9BDA0B58C0160A091A87FD4440F3EB31D46D0958C022AC093AAEFB4440893351F2550958C08E02F55A63F644409A3CB6F33C0A58C08D93803BBBF34440F83B700EAE0858C0E5D3CD5B6AEE4440996DB404E40458C0325A03DC4EE5444067D875465B0658C0CE92B47C61E044400AD4A3A6620658C0C20EFAE0A3DD4440BCA37CC5790558C05189EF053DDA44404AC0B229D20758C07CC42FE9F2D844401E089E69B20758C027C4AA6B90D744400B16E2075B0658C0439E0C91CCD34440345C03AA1F0758C074B82E3DACCC444059FD27672C0558C0552FB660BAC94440630C7E48E20558C05EF1242415C8444070D247687E0558C05DE2FC88CDC44440FFB1B304360358C0A65DFF691DC34440736C673F4B0058C09C5B3965B1C44440D419F01E9DFF57C0B7F456E698C3444075622FBFC9FF57C0FEE7CA6979C14440DC4F8561DC0058C032EAF36D1ABF444044999F01710058C04CCF8AAFB0BD4440E038C3FE00FD57C027EDFF2E77BC4440DED51E1ED8FB57C0C1324F502FBB44408EA7F8E129FC57C03E49D9FB88B244407CD4046558FC57C0F01AD0A587AB44402C307321E7F857C05E17A1EA93A64440E23C022372F957C0934AA4EDB7A44440A4686F2351FA57C022C606EA7BA7444042E2E5E588FB57C00EC9B8CBA9A64440CFB982844DFA57C07BC8CBD4D49C444051F4C02406FB57C0C7BA63F59A9A4440B8D80063A1FA57C03F6C6115D798444032377D1BFDF657C0D19EF4D41B9744407ADDB1FA06F757C07E7E7DD55B954440DF12839C1BF857C0F6F3C79504954440F24287F6EDF657C0C44AF5D6F98D4440737C2A563EF857C0C02C31786E8844402516DBB102F757C005771BF97A84444038ECF1EF18F757C0DBA860DA5680444014CD7D4A9BF557C0AE84D57CB47C4440D631C7E389F557C0000E2E8257734440FA0FBEC066F557C0999E5004666F4440B8DA66002CF657C094176B26966C4440442BF6BB83F657C02A92F8EA7365444087D0707A1AF857C0ECAE8FEF7E5D44407EB453E626F157C0BCE4EEAA51524440238F67A37BF057C0CC40A2CB794F4440C2B7C5621EF157C083708CEC654B4440D25E89BFDBF057C0777FDCCD5C4644409580CF992BEF57C02D1815CF244444409D84D5D04AEC57C0FE38D1AF164344400222D692FEEB57C00D6D226ED4474440DC2C1C913EEB57C03310A54D6D48444028794CAE6DEA57C0E07D726E8447444087EDEAAA1DEA57C04A7AE0EFE1434440D70E6E8ED6EB57C0323173F08F41444048D391CE80EC57C0C80C60901F3E4440FD93009FC1E857C01B5831ECBC324440E192BC7C96E857C0E2A3D929ED2D444019BB48D96FE757C0D8CFE7075A2C4440FFE6CC388CE757C022622BE76B2A4440CD73DBBC50E957C03AFBE0A84229444082E3409C65E957C0F3D145E890274440733E33341DE657C0D18826C4A6274440318ECE4A04E357C00D96B95B132244406E0FE24084DE57C0B98ADC94091D4440C878C95FDDDD57C066D359F54B1B44409E98663F80DD57C009C9F9794516444006AACBDB09DB57C0A09095F9DC104440737DB5D823D957C0366AD0F6C50E44401FFD16589CD857C0781122D8340C44406344309AD7D957C0974983DD490A4440EBCD961B7BDA57C01E818E83280644404D4F5A79FED857C0A28726A099054440C9849C77C2D757C0F184611EAE034440F9EF1D9515D657C0EAB4E65932034440404305B2C1D357C055153F96ECFF434061589DD319D557C01784805A0DFF43406DD0FAFDF6F157C0D123AEA92AFF434041F27F8A140058C03DFE5D5E61FF434067016BF7650F58C00A6A39E14BFF4340735792F60E1D58C0B694930D41FF4340CEBD6F784A3358C0D00A14FD4AFF4340EE571262213A58C01D98FCFF81FF4340D06E4890295758C08DC89727AAFF4340BAC5D5FF427458C00EF37320F7FF43402DE48F617E7B58C083A7AB4DCDFF43401DDC7817E89058C0F7FC01B6CCFF4340BAE8E86249A058C0FADE0AF2A1FF4340285212D71EAE58C0B5218194CDFF4340317688D024C458C028DDCE89C9FF434097DD57A567CB58C0739C2324F2FF434000D91AD92EE858C0DD7FD1E7610044408543460A940B59C0BBC0B8AF0F0044400E7A562C3B0C59C0E7CDCA2F13004440DABFD70C0B2F59C08C6DE4E0E4FF4340F4C9188F4F3059C0468E6D7F0600444080123B159E5459C0CE6A23AC3B004440EFF293BB125A59C0F74D97E320004440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('29','NV-FP','NV','NEVADA','F','947','0106000020E6100000010000000103000000010000005400000089FC55BFC1C95DC01B0CEAE4B5344340B56854A167D45DC0CD43A94B78434340DD15990ED8E45DC0C087A7F5F8594340CA0722F9EAF85DC0326DC5560C764340D728A740B2FF5DC0E535B9DE3E7F4340B7982D8AB0FF5DC0B7F6527C20884340CCCC7690A6FF5DC0DDE11DBA958D4340512235B8B6FF5DC0B01E65B750944340FFDB5F10B3FF5DC063AA96B8E0A743407A91ECA6BEFF5DC0522E0EA4C4B84340A955402CC1FF5DC0C85C95F93CDC434060439CC8C3FF5DC096C5C37DBA964440CA2388D694FF5DC03300A8449EFE444058C00A2082D65DC0609DCBBB92FE44404B07C379E6D35DC0397F09FD9BFE444042B4383BDC8B5DC0F390C8CD91FF4440D746DE1235415DC08E8F9C6A55FF444046DBD00F823F5DC0F70C386D55FF44405F5D5392A4FC5CC0F11816094FFF4440AC0D965A97C15CC0B048D0858DFF4440CD21F3053F915CC015942F727AFF4440766C922A80825CC033CCEAF768FF4440B90BFF1171825CC0C0A7C733B47F44408D5D6F5D70825CC01ABCECC6360E44400056B9D08C825CC078E4C5DD52F44340B020161691825CC02E5097A0F3C44340B6F16147D5825CC0C8506956E9564340034A09C2E2825CC0BC7AB9A4194943401B0E6D8506835CC0FE035B989E1143405641475106835CC02B6D65F19ACC4240907D1EE7CF825CC07529028E8E7F4240D816F03FCC825CC08ACFBEB4C16B4240E1ECBAA164825CC024274CA3A61B4240BD0A5A02E3825CC09B576B44D4184240DF71D0C9E5865CC002A54EE67F0F42406ED7EFE941885CC011EB946C57054240BD436DB33B8D5CC0134FC06C3502424029B80637F18E5CC0359508AC58024240E15FE183AF935CC08B453141F70742409377C26472935CC0C275765E260B42403DCB15E83A945CC0FAC3099A430E4240CEB6BDED07965CC05988DBF39811424066AC11145F985CC09ED96FAE5313424059B1509B699C5CC01C5A8DAC7E0F4240C02BB3FEDC9D5CC06742F889F60F42401D1EDFEAF4A15CC09E85DCFED9134240812466F454A65CC0352C12FAB4114240D23E6078C8A75CC0D7B1D1F62B124240C4A83FE39DAD5CC055438E92760D4240F102B4039AAE5CC007B215D4000B4240F4170661A7AE5CC0041F113885074240DF5F0C5DEEAD5CC0E731FA7CB40442408EFF101B1EAF5CC09E20DC426BFE4140C577C6EFC0AC5CC0E2582EB3AFF4414001BF16A857AA5CC02D9A955BB3F04140583571C765AA5CC073FC3F9D7BEF41400F7741C926AC5CC0E8F5C3FE78EC41404E04E001B2AB5CC0E1500DCDE1E14140BC5EAFA015AC5CC00B1D55B2C5DD41405C045EDB90AA5CC04FB1157BB7D841406178D979C8AA5CC07AC2ADE104D441409F3C4337DCA95CC0611E5B44C3D2414095AF9993F3A85CC0B3648BAB40CE414044E6E1F3CCA95CC0BAE78CCFDBCA414069B9813196A95CC0BE3EE536F8C54140EE46AB9205AB5CC06583863B04C2414084AED52B4EA95CC082B9CE87B2B9414003D5B6BFBBA55CC0DA63A75ADFAD41403B0FA4FC9FA55CC079E054A402A74140C37A7835D0A35CC06955A2F32E9C41407ED61614E8A35CC0E0D9B0F950964140862D88D49FA45CC051FA71BDED91414013CF8F9549A55CC0CF16C4BDF790414083074E9B17A85CC058A035DB239141400072EABBB2A85CC0F1BAEF1C308F414043F6A2D51EA65CC0CDEF5A44BC89414065B069D98FA85CC083DB3BC75B854140F75E8596BFA75CC0E3259D6DDC7F414006F8149E13E85CC027715771D9E541408EE6CC71B0F85CC04BCB492C280042400B830E62444A5DC00D9605FBD37A42403C4CE609AD755DC0607797BF88BA4240F7686F01B79A5DC06822909F7EF1424089FC55BFC1C95DC01B0CEAE4B5344340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('30','NH-DES','NH','NEW HAMPSHIRE','F','948','0106000020E6100000010000000103000000010000007B000000DE75A128EA1152C00E51AE43385C4540A3420A562B1D52C037347FBCE85C4540C54EE936941D52C07E238978985F454003D56138AD1E52C0D90A6AB67B6145401398871A772052C0722204D56562454022DF1B1BD62052C0D2F5B27306654540CB9F8E9D7D2252C0C7CA44D2636745401D42365F6B2352C07BF1558E296E454093B5DF7C962152C06DE3B68AD074454025B9713C4B2152C014B3B967D07945403A1DF7DA452052C04DD12147987B4540A541CC384B1E52C081F0A845F27C4540CAF60418421D52C093508403F37F45400593AA588D1D52C0B7B1D5DBF3854540AD45D0B7611C52C0169BF7F51D8A4540309AEDB7011C52C0786B91EFE18E4540790E1E19F41C52C02715B188F8934540A1FC08D9E01B52C04D91117CBA9D4540E5D0063BC11952C0F9623B5158A7454078D4F53B411A52C0ADA8C54E65A94540C5C503BD721952C04FCCF4CAEDAC45401E68AB7E601A52C04B58A0A645B04540738DC11F5C1952C0687D930280B4454070761B237B1852C0047D6C5808BE4540EC7ABEA4471952C090D4BC343FC245409AC4B765E71752C09646789243C94540479BA344511552C0A9012B7376CC4540ADF2E563751352C0CC894E6F69D94540746E46C0A41052C09CF954501EDE45400D88131C060E52C0C50D66B116E0454047A0AF9B300D52C0B5F0E48FDFE14540E119D75BD40B52C0E269EECA9DE6454017E412BFE20A52C0F77FED5F80F045407C4B781BC90752C040D2EF3B61F44540F57E38BC3E0752C00E3AE89636F845404F4BF69ADE0552C0087CE8739FFA45402FE4723E380752C089380D71FEFC45401ED0B3BE080752C077C32B0F9FFE454093F518FD730552C0E6F1A06B24014640F1B2E63DEC0452C001A9E4E719044640FF9A3AFD380252C00E701800AC0A4640AE0C179E130252C0C19CD1FD4C0C4640104D37402B0352C000D96E9DDB0C4640962385203C0252C05631519A740F4640CC7F60C4DC0252C0F8C18314061446402DE3D847CB0352C020FF369051174640C104B14AD70252C0BD31BE28001E4640C06EE6EDCF0352C03FDA6CA37821464080F94D8E450252C076023FDD53264640C7086CCCA4FF51C099654519ED294640BF79A80717FC51C02549265BB32946401CEC67476AFB51C0E7AB2EB9052B4640EBA906A06DF551C06C96CDB90E2C4640147E397F8EF451C06133FF98D82C464007AFD5FE0DF351C076DBF2922C3146409F84C67C0FF151C013AF50D1F93246405B14DA1252EB51C0A2A13D8FEE354640DABFE67002EA51C04D60D96B56384640A4042B1174E951C0B3F70FE60D3C4640FD110850BDE851C04D02C084053D4640F56B116D4FE751C0E28D5CA5BC3C4640ACBE692A8BE551C005E6CA014D3F4640371D5ACAD0E451C040B4F8994D4346402B87F72CDAE551C0F5CC3ED6F9444640F53ABE0DE8E551C0AE89C6D28D464640E72EDFC75AE251C03F20796B1A4A4640849DEA6A76E351C03ED3B5065D4C46407CD98C8E5AE451C04D0A99DB975146407E3BB211AEE551C06E6DDDD746534640CA2D5E35E4E651C00A4AE030C4564640AE76177B64E851C0C609BC60F05E46403512851558E551C024DA09BABC634640CA2AF573CEE451C04B955156736846403F8F914868E051C0D746B36C28734640DC60272916E151C02A3F1409CB784640938ABE8C9EE251C0F2AE1106007D46404055030558E051C0DEC53B82B58146403E05CF2131E051C05297627DAA874640519BDCD58BDB51C0BDE4B29AF98E4640A3E105EEC2D951C0E45E4E74F5994640026ACB7094DC51C03644C6EE379E4640A31BC66ABAD851C04931DB32129E4640DFA401E905D351C0E10E633591A54640B38A6937CCC951C04D56CDC6759E464089BE66C099C551C08F56EA8A96A6464032FB13A6D6C151C0280E2DA89255464074686BD88CC051C044600E5F1D244640754B6F1B01BF51C02AC2F6D844E54540098368F453BE51C08B1C08B931C94540569118B237BD51C08481A1DA35C845402D060791C6BC51C05763B51C44C6454069114392B6BD51C06C09743E18C44540FF5C3CD164BD51C030F8710019C24540B746877121BE51C04A75C3E32FBC454047A7AAEF88BD51C0C986838614B84540C06AC390A9BE51C047539927B6B2454091E5F68E0FBE51C01D40EE89E5AE45404AB45BA5F8B951C03EECE434AAA645400EB12464ABB951C07B37C476F8A3454021B4F7960BB451C0947617C71B9E4540110B79B327B551C07E534AD15F944540B20E160F65B451C036999A78998F45406FE884B79FB851C028B579B0589045405A1826F4F9B751C0336031D6FE8C4540714B4D56F2B951C00B45F735C18A45401ADA2252BCB851C05B90967C89874540DDB2D60BDEB351C055611C9F7C8B4540B9819E21FCAE51C0ECB2188B85874540AB95329F16B451C025602AFCFB6E4540BE81062362B651C0537F0BDA846E45406A9356A97AB951C04D828433857145403FF1D92BF7BA51C0660D09924C7145409C1F0195A0C151C0C9F9202FF36C454080377D3632C451C0C802C7F2F3664540DFA796FBB7C751C0FC0B486DBD684540C6E81D8096CB51C0477E122B56674540CF72F31DEDCB51C0A03C30B58F5E4540F6CAF70264CF51C02EB35ED12C5F4540242FCF8227D051C0E077ABD3EF5C454057BAD26461D251C02E26A5D66B594540A8A65108A9F951C0866CA2D8495A45405B1B2FAB88FB51C0B9918DD6855A4540DE75A128EA1152C00E51AE43385C4540');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('31','NJ-NJEMS','NJ','NEW JERSEY','F','949','0106000020E6100000010000000103000000010000007E000000357FD55F50DF52C05ED3727980DB434003C9CE5C76DE52C08ADB8BB92BDC4340DF1F239B62DE52C01C84765AF4DE4340B146D81877DD52C03A74E8D8B5E14340BEDDE0925EDB52C0424CA8769DE343402827D62F5ADA52C08523443517E54340EDE06EF2E8DA52C0457B2D1445E64340870340C123D652C075DE06319CEC43409D4688483DD052C0D5C82C953AEC434071266EC6CECF52C080E43815DAEC4340B097D4F5E0CB52C032399AD54EF04340D0293E4B25C952C0A001B455D8F0434081937D09B1C852C04E0AF634CDF24340F8D01E0C6BC952C07403FA92A5F743401AEE9C8AF3C852C0BCC7AF915BFA43407453D4041AC752C052F9773004FD4340F5B489DF69C552C007E3FDCFE4FC43400BB68FDC5AC452C0F5D11A4F21FE4340A48E9758ECC252C073BB9F2CFA004440C709826CF1BE52C0662F12885C0444406432C96732BD52C084CC81046D07444076F4F59ACDB752C02E85D8C1FD09444066D64FB40EB552C097A0CC5CDE0E444095B76E48C3AF52C0D43958FCEA0F4440940F91456EAE52C05AD14E7B1C13444056096DE748AF52C0C6DAE9B6BF164440494A98D4EFB552C07F09054DCD1F444043F3E6B95CB852C018D99004592644402F5D2A1FF4BA52C0039BFE41322844407E1BED20AEBB52C0F04E9B1EB92A44400BA239E3CFBC52C0429C7D7C382C4440363BF20643BE52C058B85FF3C43344408F0973CA07C052C044FF17B24D344440C2F09F6C5CC152C0D9D565925E334440FA50B750ADC352C050DCBC2DC83544404700E1D27CC452C05C7E3B87663A44400490D35313C452C01BA7E43DB0424440391481361BC552C013B88B39CE45444063850D3CF8C752C05FC9D9534B4844404A5D1C82AACB52C0548BA43145474440390F6D04A5CC52C03088132F0C4944408DD3638462CC52C0F1E048EDB84A4440EF3B5926D3CC52C01F2818E8AF4E4440A423C806ABCC52C0EE585CA52D514440E34A6BE85ECD52C0A49E4E624B5344403C077CA6C7CB52C067FBF2C0BB554440D64C828924CD52C0EB4071DDD0574440CFE9F12804CC52C0BC55A858A75C444084358CAA64CC52C0944CEB94BE5F444062CFBC69E6CA52C082ABE7F22C6344408E632A2557C852C0C0C3F415E8624440EFEEF8426FC652C003726C165565444015B034A3B5C552C0121C235423694440A2CE57E55EC652C004EAC3B16D6B44402111CAE07EC352C01C9873B4866D44400144D7819DC352C059C807339F6F4440EBAB7944B7C452C0D7A3F96F3B714440858121661AC552C09D787FEDA0734440E51AB170ACC852C01BC41781417B4440C8031052EAC852C00AF8059F1F7D4440C36651B076C752C07C79BE1F0880444037E14D897AC452C0B986EA245F814440439DC5A341C252C0B23DF6269C834440ED5FFADD12C052C02F7AD786FF8744404F13A6B8D7BD52C0E9238D25958A44404989C2DB49BF52C0CD321225778A44406CA0AF9A03BF52C0C85EA482B88C444080C3B8B5CCBC52C011EA8E42518E44401A406D908BBA52C07B9863C00F92444014D6D48839B752C0012EE07B779A44406530204973B752C0EC465F59089D4440D05A9102D0B452C0853E12B62FA444402FF95E3ED3B252C022EDF896C9A5444073E04D9DAAB252C0A72C1675EEA7444010BAAFD2CDAC52C048825894DFAC4440EB88AA88CE9752C07F82B49C1199444032F96FD1828F52C0CB2985BF9D9144403763F96CA28D52C0681D8181D28F444027AFFB7D637952C01A7100D3CF7F44407BEC937E5A7952C06D2CAFD8FD7A444065C5A2802C7A52C09EC5213DB2764440E423ED82087B52C05E40C9C269714440045A292B887E52C0E40C6A0E146644408BC87D8F668052C060F0EBF66D5E444016C4374F658052C01E5387BC1C5A4440135BBD7C428852C05EF7D542D3524440C8B417DC648752C0D45F51F9515A444084483B1F668952C044A0881D765644401F834104548D52C0A55CC509AC4B44409DFAD8AAD99152C03B72C2B3D441444077B021E9359152C0F309501D5C3B444064B3D8435E8E52C000FF2E63C73844404022C2F8CC8752C0E28DF764C9394440923529C59E7E52C0E001B13F6C294440B75128C3828252C0F8245428090D4440EC2D01ECD98552C0844F82E4DB0E4440B4559A895C8552C0B9A4348A490B4440CD80EEE1318252C0CC8F3AEAB10B44401781A3C22F8352C0DEB0871047074440E95E65CED18752C002A0A2909906444077096C06F38452C09B3DEA32690544401EDAD7CC308A52C0357F5C2476F04340D4F2A4A8F88A52C01DC87E6CF0DB43407694AD13368F52C0FD88D5C3E0CF434026C6EAA2B19452C0F980CD1E3AC94340AE7A05E40B9552C07E29963B06C3434041685D93649A52C07D3C7C9C74C5434021CF99F1AB9952C0065E4B1A56C043408FE1CA7C779D52C0BD3FBEF59FB6434098C2A3DAA39C52C0CABF7D13C7B0434086481E8220AA52C00AF68EA7C4A443409208947BD7A752C075DC29880CA4434016E8CA3BF9A752C0B2511C261BA0434030D1B9BF58B352C06741A335608343401B25DFB045B852C0F951F231B37E4340294EAC5015B852C02AE18091747A434078D935C4F5BD52C0A90E8EEF617C4340E56A1812F9B852C0AEE1F2F8928E4340852E0277AABA52C04121FA7BD79543405F28A20BECC052C0E9CF56FC639943405BA1C964ADC752C039B122FBA39743402E8AC75F9ADA52C08B0A9F13FFAF4340ED673B7860E352C092ED3E2CC9BE43409FF43F6E11E152C0C7A28B5085C8434009C4A2B77EE452C0534D95F011CF4340357FD55F50DF52C05ED3727980DB4340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('32',NULL,'NM','NEW MEXICO','P','950','0106000020E6100000010000000103000000010000003A00000068E15FEE2A435BC02C0ED5E994384040E6006C4149435BC07F6FE34FC8634040145FC3D03B435BC048E026D7429A4040AF980CEC38435BC04419D43C43E44040DA7A80201D435BC04D585477BF4B41400435B529FC425BC0A447F5D8317A4140D4FEB9EA0F435BC06B524CAF92FF414076244D4C1A435BC052D6EBED917F4240F0D2B198D6175BC004F45AAFEE7F4240D9D734CA3CDE5AC098228DEAD77F424009D14EE24ADA5AC04F85B4ECAE7F424036CA74D3FBB85AC010F935FAE17F4240013C87B31EB75AC0BFD1F2FCA77E42402828AC25389E5AC0CFAA509CE97E4240FEEBE3ED7C7F5AC0C68FBC58037F424008CB3054A96D5AC03D81F8C04D7F4240A53C724AA34D5AC08FE503AA0D7F4240DE8C00E45A495AC0ECEE776B217F424069824DB797FF59C09CF344C34A7F4240C35D39C1FBC459C0DD624F24F87F4240391BBD78DABF59C0C7CC02A1CF7F4240BCD50A6BD5BF59C063337BFC053F42402B8D2E11BFC159C01B14297BEC3E4240D63480008AC159C067C0E9082D074240C921C07A72C159C09771E09404DF41409BE4FC436DC159C041D38BB2D3CF4140D9A1ED75ACC159C0981A19A3B0964140B84886B79DC159C054E126E87D7B4140D0687B3673C159C05D658610675F4140E8188CB7E5C159C0BC9042A96627414024085AE820C259C053CB6F51C0E9404024FC63A87AC259C06AECA08C6DC8404081689B2AC2C259C099D8F3C75CB04040AFB8B53C28C359C0F881DBD6107A40407B959D56D7C359C0C92F1765FD4140407E9F359D8FC359C0FA6BA41BE50A4040809B2D0DBDC359C08D3C4C4842004040C1B45A7D48D559C05191B64B8C00404017622A37AFEE59C0BEB2D51BCC004040A43FD8E1CEFE59C0CB58421BC50040400B085D293C015AC01E472299F2004040786C33E677365AC0C82123FD6A004040DC89DF0A073B5AC0E2D1A2978F0040401D1C101735805AC01BC3885436004040EE55547F37985AC0E3EBBA7A1800404006038A7BE9A75AC07D238CAD23004040CC48189D9AA95AC07A20B1E3F6FA3F405FF0F69A7CA85AC0F93F6168E3F83F40B5FAAD578FA85AC050D02B8602EA3F407B3B6D9738A95AC00758062F2CE53F401F5B14926EA75AC089B569EA40D83F40535686F05BA75AC0DA7455985DD13F4003D50E6987A25AC064B24F4D4BC93F4026C808F725D25AC0969BDA34FBC83F40458CF720020D5BC04B96A67D72C93F40BDB6D4407B0D5BC08C7413CA06583F40C1234F5BEB425BC02C51FB89EC573F4068E15FEE2A435BC02C0ED5E994384040');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('33','FIS','NY','NEW YORK','F','951','0106000020E6100000040000000103000000010000009C000000951088D7D8F053C06CC0FEC537224540833E59D46ADC53C0710DE8A2AD3545400510B36AB6D653C0EA15A2C1293F4540C63C9E591AC953C0031FD20A8D494540CA65ECD4CCC253C090E10EEB80594540B9635221FDB653C0AE2D31AC78654540364D1475F0BB53C07DEB799DB37C4540F80C51AF7FB853C0107D669DDC82454063627AF83CBB53C0FE93713987884540C201C64DE9C353C0DEB9CEF1988B4540C839674E84C253C0131644D086924540079C39B9FBC353C0A3D16AE854A24540F4ACDAE2BC9D53C03986217C9DAF45404A5ABA147D7F53C0CC58FF0CCBAE4540AE449733AE6F53C0A49033DAE6AA4540B33F1275D86453C07DC5B808EB9E4540179372F1255853C0830C728F4AA34540B388499E873A53C0ED78A808A9A345409763D136282F53C09D2657AEDEAB454073D76A70FB2D53C0502CEA8F66A94540AA990DFCA72753C0DA7AD3F402B54540098A5014191D53C029C130A017C04540C84900C7410E53C061C2A782EEC64540B7AF5200D00B53C00FB5539C0CD145402F6928A3290D53C084960BB762D745409D9692065C0F53C000F54073E5EA45403CC521E2650C53C07428AD7BCCF44540F23FC59D420853C024DAC69752F74540B28C6B039C0853C02E37507CB1014640F979A612E60C53C084CEBF846508464029A45321001353C04A150ED16005464074912671391753C09F0EAFE3960C464037A9FE1E46F652C0D780F620F4314640304947D88DF052C02C42F5893E4246406CCDB1140CD552C0761C7BB2C2674640FF6A0C68FBBD52C013DF848C6C7946400B4535631CAF52C09340D1E0177F4640CE46D4E4608152C0AB0A1416D47E464039C130F30F5652C0B2E1BE27C980464072173AD3725652C0C3C9424AB17D4640C01F59D1875552C0AF97B7905F77464077B8CFB6775852C0348BE616896C464041441B959E5752C0E790F8DAD8684640DE6A1E11EA5452C069D089404F6646405F6391D4E15752C09F2B6BC7B35C46402E2301F2EB5652C0B3601251165746403F21DFD2E05752C0513D54B4A4544640A40ADD51B05752C0198C8D5932514640DE3E86D26F5852C0053EEFDB554F4640FD336A50C35752C04204BD24224A4640DB261A8D425652C08B694C8AE84646400FAC5CAB675552C0733B408CAC45464031E03CC0C55252C0CBC5E0BE6737464073FFF61E335352C04DC5A182E8334640A196843F1B5552C0422689A6062F464065949E748A5352C087BE7B574C214640F3C2D637265852C088125A7AC21946406EEAACB5735852C00F4F5B9F071646405B2B01751A5A52C085685BE36F1146404BA56112295A52C0A909A368A50D464072AF2691DA5B52C0D1327FCD2D084640BB41946FE75B52C0C09BCDD0D80546402E0E25CA205A52C06586701855024640E34733C8B65A52C0AE15EC3C7DFE454020234E00F15952C07119266A18F5454010D78DFA015852C007DA7FB167F1454015721B949F5852C05574FC1DFAE6454059DA4DCFF95652C07BABE483A3E345403DCC0BADD35652C0466F7DE7D6E0454011C7524ABE5752C0688A6C906DDB454067621FC6115B52C04A28D022E9D0454020489EC0C55A52C0494F2DAF8ECA45407CFAFADCD65852C02D5529B3D9C84540ACECBF9F465752C0E0773E48B8CE4540D11D191C6D5352C0ACCD8CA7F6CF45404E36C19AD25252C05BF804C950CF4540759A92F7075252C01A9F828FEDCB4540E192A256A65252C0932F53B39AC94540D9D91F93A35052C066762DD799C745400024DCCD414F52C00EFEA281A4C145407C7AC12B015052C049527B10CAA74540809C1C12AA5152C0A748D58E5B784540961BE7B0E45152C04164AF33266B4540313F0072F45252C03E61D0B4DA6645409C3E96CE3B5152C0F9328678AD5F45405E68460D845052C05F21AAD97E5F4540636764E7735652C03FBA2FD69B404540E3CBA3FEEC5F52C05F4C803BEA0945406FBF04A1FD5E52C070DB3B1F12064540886868F1186152C050D01F3435D54440B4BDA6F1F16152C0096F6853E9C24440307A4AB3D56252C093DF8819C2AE4440324B4C74376352C040E12E5D95A54440A9FDE087995E52C0E0931704FA9A444040182A4B6A6E52C007721868D88C4440F453409CD66952C0172668719D8144400291B83BCD6952C01E20F952CB7F444022381C32EC7152C0C60ED4047F7144407A48FA54F77252C031916EEC896A444083653B04DF7A52C00C20D24EC266444016C4374F658052C01E5387BC1C5A44408BC87D8F668052C060F0EBF66D5E4440045A292B887E52C0E40C6A0E14664440E423ED82087B52C05E40C9C26971444065C5A2802C7A52C09EC5213DB27644407BEC937E5A7952C06D2CAFD8FD7A444027AFFB7D637952C01A7100D3CF7F44403763F96CA28D52C0681D8181D28F444032F96FD1828F52C0CB2985BF9D914440EB88AA88CE9752C07F82B49C1199444010BAAFD2CDAC52C048825894DFAC4440817D6B3223AD52C03C829BF101B0444086C0475463AF52C061C6F3CD68B34440B56877D35CAF52C02F2E6B0B06B64440E9DC47144FB052C04B9B6E090FB744400E8C1F38BDB252C0CEC17C8607B74440CEA94BDE4CB752C01B04485E3CB94440657675414CB952C0E2B16CFCEAB84440AD029E0082B952C0EEECAB591FBB44409E5D9F22AFBB52C033F4DA33FFBD444090DA41C631BE52C0881AC1B0E6BD4440E189E1E7F3C052C0A67CEB2A10C544406922FD079BC152C0DE740E2A6CC84440E37696AC78C452C0A293AD885FCD444047779A0CA3C452C0DF9E6D6879CE44401D5D7CE848C352C076FDE18793D1444058073C872FC452C0650F8CC57FDB4440723E4265A5C352C0215050C504DD4440DD6C8DA4ECC352C03C4B4CE497E244407E966DC937C652C0C0CC12A4B7E34440A082F26832C652C0371AC6E30AE6444054E8F2251CC552C00A70410336E8444096744EAA89C752C0C6E1586222EB44408AC4D6EAFBC752C0C86A0C02B2EC4440E554CB6D7DC952C0DD9E71818AED444006E54B50F6CA52C0ABD65D6015EF4440F56349FB49D052C04EF9E93D37EF4440765625FA27D252C0AC0715154BF94440157A907EBDD452C092EDE50E0BFB4440E2D4D43E1FD652C00CBD478B15FF44402291F60280D852C0BD4D4226CAFF444000E0DEEEB3DE52C03E430DFA88FF4440F102F39BB50653C0A02E1693EFFF4440CFB76003480953C0D25E3472150045406668122E172453C0CC878DAD62004540DFEE36D46A3B53C069ECD30D530045404F62921CFD3D53C0988307AE61004540C96E1DE5386753C0DF88D3A5D9FF44409282C335AE6F53C01158049DA8FF4440929915A1128D53C092980C08C5FF4440F396D390869353C02FB4C303EDFF44406E90B054C9BA53C0EFB1EBFAFAFF44401A4099AACEC353C04D601FEF250045402EB4590731E753C0D8DD952A1300454039DE3408BFF053C035BCE4C465004540951088D7D8F053C06CC0FEC537224540010300000001000000240000001E5B0631247052C0FF5C266F1B4C4440B4E362A55D7B52C09FD0F51561474440C0F319B2BA7052C0E755C46B224F4440E86E7EB2F47052C091070E0987514440982C1BDC257652C02FC1B3668853444079254C649B7A52C00E57E9E9C85044402E16DCDF4E7852C06B0416F08D4B44402D40232E428052C0BD6425B2664A4440DD993431C68152C08E332AC7D55144403A4963A9287D52C0C41C6C17A45E4440355BD281897952C0543D10F0076644409EA58030407052C05C58C313F96444409F53196FF76F52C06BB51BEB286C4440EC6A3D164A6652C04E90723C9A73444051DE4A05995E52C096FCB9799B7044408069D7BB8F5B52C0B1DEEC5516764440644A2FBFBA4D52C00132F05555734440E8089ACF054952C0B7150458C7794440D35C657B5C4152C05E119D9DF57B4440FB00BBAE6B2852C029E8F9C09A7D444002FE483E4A1452C043BA1C5B1D9344409A115559FE1152C01EB10B993E924440281F3983AC1652C0DF7FE21F1B8E444068833868A51A52C00ED05B48558344400C4CE11C432352C0D74EB2C8AB7B444086E8C34BB52652C05274DCE3E0734440B8F36292781E52C0625E7D6BC77544402712DEDCC11252C0B7DCD00013834440F55FFFB1030D52C0493CE3218784444052763AC0ED0452C032F07ED112804440E32A83E71DFB51C08B053114DD8A44405852D4DCADF751C08E9C9F7789894440DA179704CCFA51C0F7B0D0D9E9834440544F02C15A2152C043546F4853684440D342D2AA0A5B52C0DAD43C4DA65444401E5B0631247052C0FF5C266F1B4C44400103000000010000000C000000D2D5707AC15252C009A9D74A2D50444087BFF619A25252C04D48F4A908514440F99DC152634F52C0E3CA58A7085144402E384BF5434352C0D4B63EE06B5644407B84853A1F3852C0679A275D615E44406640FC8C0F3252C07693B21ECF6144402D1DA609783052C09FCD247F4C624440E5BB5ECAE53052C0A16A78FF1261444032D5AB46343D52C06345A9DE9A5944402E3D6BD2FA4152C0C5FBAA80EE55444089926374F04F52C07C94A0E80D504440D2D5707AC15252C009A9D74A2D5044400103000000010000000800000086B5F8042A8F52C008E957B7C4404440AE34D7052A8F52C09783CD11DA444440F6FC6EA0A48A52C08A448085EF4F444073046CD6A98452C00E8B23E424534440A0964CD4C98352C0B132CECC044D4440D045463ADF8752C0C5D09314BA454440709CC4A0648C52C0C43D16185A41444086B5F8042A8F52C008E957B7C4404440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('34',NULL,'NC','NORTH CAROLINA','N','952','0106000020E610000006000000010300000001000000020100002B8D8DD542FF54C0C011C4869C7E414068BF02CF8F0755C0D357E6D7807E414050EA75B4B81455C0D18B1C859A7E414006F7AD149F1255C098BB95ABF59A4140D89BA58A740E55C0A691F0D27EA14140E90F0D447F0B55C0894A3B5DDB9E414007D166F87F0655C08DB057ED709F4140BE78916DBB0255C0D93C1979E6A2414049F9E929F80155C0FD842F1B74A541401F565306DD0155C012E697DAA5A94140FF1257DD650055C0A7EE6E9EBCAF4140B9DEC6BACD0055C0872875BC2FB4414008A48F4B18FD54C019CC8E464FBA41407FB92D023CFA54C032F3B80E00BD41409C06B85B64F854C06F9514B35DC14140ECF1C05320F554C0A9A7667C73C241409AD1024BA6F154C066005CA4BEC64140E0ED449A0EEB54C01A2CE4F653C841404DEBC8B047E754C046A941C131C94140A9E71928E6E354C009982C0C13C74140D04E1E1F5DE054C03C4DDC75A2C741400C9655B552DD54C05B9067BA76CC4140C7C4CD26C4D854C032112A430AD04140D1FF9E1EF2D554C092830E27A1D34140137AAB3517D354C03B79ECAD05D44140101BBF6F93D054C09CC5962F76D84140A9F2200F34D054C092F868EFB3D94140B548D52E99CF54C0B9750EAEF1DB4140FF8339A7DACB54C089FBC3534FDD4140CBEC02A52FC954C0615936D6A2E141403EA499418EC754C0EF8148B9C7E1414093CEF93BD4C354C05992F4C02EE4414013ADEEF028BF54C0D7FF866A15E34140DA0DF18F9BBD54C040E38EAE5EE541403D9FCF3107BA54C04C2BD216A8EF4140C2F9E3F87DBA54C0B60258B6C7F6414098B7B87855B954C0236ED23867F941407D3E68F3CAB654C07815A39D48F94140547F560ABFB354C0EED18A83E2F541405811AA09AFB154C089BA566774FA4140395E536C80B154C0197735E769FE41407EDB018CD6B054C0182CFD87F4FF4140A894954933A954C0A8669355A20642401A9F5BA82FA854C08EA94D17F806424026E9E743ACA654C09F652B1B8405424019DB2CDFE4A554C021AF2F1EE3024240B9C64A3DC3A654C02CA798BD770042400A59C3B758A654C019035AE150FB41409DCD72D274A354C0FCDFAD4865FA41406440AF4F6FA054C0FB9020CE7FFC4140A911064E679E54C0DA2CA9F123FF4140D763B44E219A54C0DE965494A7094240E9C6ACEBEA9754C09988B2B6A50C4240234EA643F49354C057A00F3CA60F4240B3B1803AC79054C0559D1D236C0F424097A2E610498D54C075D55D13D5124240BD4E5F83D98954C0CFA768ECE21142403423BF178C8754C0FFCE9F02560C42402307006FF78454C0C1DFC653D50C4240C75041834C8154C08D1E49699E1042401530097BB57B54C0EFF98B8AB8214240661FEFB94D7A54C0E76705673B254240E701BE71257554C0F4CAA609DA2A42400E9164A3BD6E54C08B4638FB2B2A4240869A6201656D54C035063A9BBB2A4240B47207A75F6F54C05C918571552E4240695B6E096B6F54C066795F092A324240A67C34EAAD6C54C0D84CE837673C4240EC2F24EFF76C54C06423A8AC7D42424031D9CD93DE6A54C0FDDDCB827D4B42403B0C6976165654C033D148AE57494240A46422B1CE3954C0FEE91A215D4842408A5E3306A13554C029ECF10223484240693A2405182754C009D4A7E159474240CBBF088CD81B54C01D147D1A8D464240E7AA8031100354C08A8337060D464240719BF94D860154C05C9DC7E6C745424072FFC1A1E6ED53C069A006C72546424069125F9FA4E053C0CD5FE02A1E46424050ECDB1AE0CD53C0010055D263464240B934255338C953C092B0F8D3E94542401F81E6AEF8B253C027703E1B97454240F4A89BE82CAF53C0C0E9DB5CEA454240C147398C589D53C0DEA135EB534542406D9C48C48A9453C053915AB2D8454240CD5A6AD6498353C0FD143B4CBC4642408D256E26827953C088A21CB9CB4642402F879674DF7053C068D7E101DC464240BF1863B9765453C03F5E77B6EB464240C0370DA8544B53C03C225F58394742406F18ABCE1F3B53C0B3F4733CF3464240759D6ECEF63A53C012D67D9CF3464240FB2B98610C2453C04EBE207C174742400377A897D21F53C069E58ADA29474240CC0B625A1D1553C069C4C5D9314742404D286B98210853C0FE07881F56474240CB1A2A4BEB0253C0138A75434F4742406408D5661A0253C045A2ED09DC41424023833E50CE0553C0244789E879404240377F413872FE52C060D356FADA37424058FACCD50AFE52C0EED63ABE273542405BABD79B140053C02991CE1AA43542404B65DA8EDBFC52C04D1ED1E8CC2E4240D7CAAA8E60FB52C031C4DC0032364240C3D590A826FB52C0ADEF280EF12C424091A07D112EF352C0F8442318760E4240283C0A4B1AF352C00401017B570942405F2D87FEB4F652C00ED935CD8B0D4240A1E0213E75FA52C027AEAAE15A1F424004AF080942FD52C070AEBBFA3A214240B7E91CC842FC52C0C1B96A16B22542405DB861378D0053C0B8A11FABED284240578140A23CFD52C0835BB4BAD218424025B88965C8FE52C0A45919D6BE154240CDACB656B30B53C0680FECE05E284240880F5DDCFC0D53C0DF078961FC254240F74F89E1300753C0E162CD92581642407460D8C50F0953C05DCDEDB4EC124240C996103A040F53C08BE57834EE144240A7496D051C1353C0E133AF0B711B42408B23D03E9C1153C08150EADC250E4240A0767777BB1E53C07E3B20E13B0A424045AF1CAFE21A53C08E7324A5850742408C7F2279732153C0A3FF062DF0004240F329ABA1FE2553C087D3AE485101424078D44A0B842953C0D66CCB5C6E0842407E03D007812853C0032D5982C5044240B567670F262C53C0775F67DD5E06424043ABA8BA792E53C02883BFEB17144240781FEADF0E2C53C0D70B32DAB7254240CCD9A131AF3153C03F7DC6D3E22D4240AF9DF5E51E3B53C0DAAA95AD4032424043F52DE96C2F53C06B6FD7775C284240328BAE3F422D53C0AD6888BC1522424071E255C2A92F53C05B290120F61D424093EE3C7EA93053C02FD5CC2C87124240A5EA372C612C53C02DA644E51EFF4140BFE2922D692F53C0795850A6E8F741407904B4C8992C53C0EA97D8C889F8414012AEBB282F1A53C0C016E1F122FD414047C47DBEC01753C0A69402575CF741404AA1F4ABA80D53C0B2B28D8C0FFD41407A4DE2CCB60553C0E23E52FC45FB414073B7CFDAA40153C086EB89B9D5F54140346F9FD7D50453C071659C38E4E04140EA47BDA9BB0253C02EBD54C88DD741406BEA9640AF0A53C0F8032F8D37D94140DAF0FD31AE0653C08B6A3890F7D44140C9612B84550153C0DCD3704BAAD54140AAA1C90F33FF52C04279D67D49F2414001CB01E354F452C0989BEC493BF64140D2C1E6CEE8EF52C0CA9CDC084CEF414009506BC1A7EE52C028E8CB112AD541402AF49CC6D5F152C078BFDE1218CA4140CAF4EF2308F952C08ADB6CF0D2D04140AF4836EF5D0353C0CEB9E75717B5414040BFFBA2990B53C0E94603E3BCAB41409EDBDB9EE61F53C01D0927104CB541407FAF9A42232253C055BEE991A5B94140A33A3538511D53C01060547696C041403A54191C8E1C53C05162553488C641402BF1A8AA302153C01FE10AAFF5C94140B9F35802801F53C03A3E40B25EC541404DEBB094D22853C0F1BFD1CB9FC24140C989430D382853C07626E17312B8414030B306331F2D53C0B48B54BABFB4414056D804D39E4653C0982D59D471C6414004607F14E73E53C02CD49298E4B7414010105F8C732C53C02934C144E0AC4140C55F48834E2753C06E29A381F4A241404BD93FA4D02553C0462A37BAF7A7414028500AA2992253C03D2131B2E4A64140BB3D04016F2053C0D96C460ADD9F41406BCFB385F12853C0DC2FD5951A964140C5DDFE44B62653C088C8D9C8C19141402F74C888ED2753C0CBE261F941884140FF33EAD05E2B53C0DF89E78F1A83414031BDA311583653C0717027A0BE7D4140FD1570E43B3C53C0D57A30FD87834140EF4357A3583C53C0263AB022FC884140F32811180B4353C0761929FBD08B41401EC248A1AD4653C07DB5FD59488B4140D10F46820E4753C02F15AB1779884140E5BF40110E4053C0E694F338CA8641403A1BF3DE6A3A53C0C0E71A7EE377414016B8A78C632953C0BE02500908744140D5A60D91DC2A53C0C5BBE8282E7C41402A9E591DE22153C095B7872CC67C41408686D48C751C53C0E8CAB53527824140619921E51D1B53C08EAB66F723794140415C3716461753C013DF133FBD784140CF01450E0F1553C05704D083F17C41409016224A1E1453C0AAFCFB2478794140F88FDD090D1E53C093D63C3382644140C01BD464FF2753C073F6AC2E265C414017CF1576364353C09FDE146E7B594140EF95CC27834953C07517FBE6DA614140E57D8DA2424853C037F38990B0574140B3D12166004A53C0D9ECB11395544140DC1556F0736253C0565B45BC843A41405954BA7A886553C0321D35C0E6354140E5BF7BBF006753C0C7B366FFB437414012E8483E8C6653C0A2954D81D634414050DDC7BE037053C0C62B0C4B11274140561F8C524D7753C04D163C36B118414003E15E16397953C0262AC484E0084140B4B2763B4B7B53C065934B65F60741408F66B4E2777D53C0B02479B63E184140C700B6BF537D53C03685AD8C12FF4040B650A48A358253C08F2EAF340DF54040509B36C415A553C0ACB70AC5EAF040402B57C8F1F2A953C0DC8AC3C073F94040CB3BD7A2C0C453C0F0CFC1AB01274140D3AB743A9ADC53C0046F74AC424F4140096EB9DB2ADD53C090F8232B2F514140458804C1B4EA53C0B191A84681664140739D7824E3EB53C06E4E9BC31767414011DB12F7DCFA53C0B7A373F86E674140104507DFCD1454C0347CAD304F684140027839E9EC2354C0EBC95F5C5E684140BB3346D6303354C0B81DC9357B684140C3927EB9443254C0DA2ACDBE6B784140969D92E3C13554C078E95AFD46804140F90F5BA83F3954C00D31842CAA874140A1D165AA5D3B54C091FA4880FA8C41400350DD338A4254C0C4769FBBC7844140B629E0B12E4454C07BB4AD2D878841409ACC83B1CE4154C0A48CC5B1828D41400ACB9D30204354C01ABBF666EA904140A2BB1C70244354C0AED38D036A93414024695BE6A55454C0B4DA1C68FA9441405F89D8AE2A5754C0BC52D9BFDC9441400D0C2ABAF87054C00884D74E5F974140261DA3E7B47754C040CC375674974140CCDEF754297E54C0B964107E1D984140685A8FCF708D54C0A55B9D1FBC984140D3750077CD9154C0CDE5B6BEF9984140F8F923DB849454C009E2AB4497974140BFE095DE719654C0D83A3948AD984140413E809F099754C088A378A96E974140F676BB00C29754C012A6074B67974140F55FA7C2EC9854C0A4E0806DAB9A4140694E5B48049C54C03CDD11F3B7954140F1067A8BDC9D54C032A2F11639964140D8E5111391A154C03913B078CC9341409EFFB5D878A454C084017F5526934140BA4838C6E0A954C0C29503344E8F41400D4AF6C9E5AB54C0FA4FABF28F8F4140EE81294D06AC54C0A4750396888C4140F5E1560F9FAC54C0FC45E456B18B414032620F5C5BB154C0F9E50CE6F28A4140CEF5A7B8CDB854C0ECFBF5BE198741405BD0F01675C054C07195F9091C834140449D8446CBC654C068C32C040C804140E9C5C526D3E054C0DD2155A6FD7E4140E94EDFAF27E354C00A2E9F25AC7E41403AB91C8A06FC54C0174EDE32A77E41402B8D8DD542FF54C0C011C4869C7E4140010300000001000000070000008A10F167B70153C0B06B8B8447474240480D6863E4FF52C06842C66545474240D778B71357FA52C00A22A4AE76454240F419C3312AFB52C08AC10B58B03C42400FE73AFB85FE52C08FDBFBB2343D42407DE752BD75FE52C0D2B7EC6C504242408A10F167B70153C0B06B8B844747424001030000000100000008000000E2519C52B4F952C081A2838D36474240BF30710E2EF852C07D5851EF2B474240B4F0205D75F152C00534EE935D1D42400EA48460DAE252C08219CED0EEE44140872B5C72F3EC52C0580B885167064240FAE1DC3864EF52C0EB6B1B6A76064240737CAA7E19F252C0C51C4473D81C4240E2519C52B4F952C081A2838D3647424001030000000100000009000000AF9518A969DF52C009493BC6D8D541409DC84E7C20E252C064BEC1B86FE24140D335349D38DD52C0C70D0FC70CCF414030408C3DA8E152C0B42BA632329D4140148F26F5EDEF52C0156F57FA51984140C0FF55283CEC52C0ADE9A6E1199E414033B2046159E152C0FDADFE5409A44140838F20BB66DE52C0DEAC174647C84140AF9518A969DF52C009493BC6D8D5414001030000000100000008000000BA31BA6E100153C08CC138D2E8884140171613886BFE52C0FE4086B9E48E414005D1828DA0F652C0D650042C6F9541406E89AA18DAF052C0A1A17C78A29841401056EEE2E9F352C0D4D687510495414084A4BFF7D3F952C0A63DC323FB9041404528D5EB280053C0DCBFF5D3E8884140BA31BA6E100153C08CC138D2E88841400103000000010000000900000027CD3791CF2253C01A94EE65434B4140BE0CE8B3812353C0C1C719822F4E4140EA78DDB0642253C0BDBBAB629A4E4140939876E9FB1E53C0C213AE5951594140B31CC6E0A41B53C041C3127763614140FE31F3D5F41753C09806B87C116841408CB20CC3631253C0EACF564747704140D56B2D86021E53C01336F6DBC258414027CD3791CF2253C01A94EE65434B4140');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('35',NULL,'ND','NORTH DAKOTA','N','953','0106000020E610000001000000010300000001000000A0000000D96E7E7ABFAE58C0DD68D34319F846401F6CE5F26FC058C0CCF0445B43F846400E020FFEE8ED58C0DBB4C564ACF84640E02C35D50CF858C08ED29428C6F846407B6E610AEC2059C0025146A25EF84640D8D36D772D8059C0B8353304A4F846400201A3C491BC59C04AD5717C88F846403BB3CA2DABBF59C06253287A76F846409735164821035AC016F26504B4F84640E15A90C00F035AC07740C1ECF3234740F7DB4C39FD025AC069C534EF7145474056AB463709035AC07F00751A4C52474023AFD075F0025AC0A198DE01BBAA4740BF83C41607035AC0DBE707C433B34740F0F9F86519035AC089C0C7A902004840313951CB55035AC0FEA837EC0C3248403665192C59035AC007689262AA52484089FBC50B08045AC0BB4830E000804840AB75758407BC59C0F5CCD7DB008048405D5CB3C76C8159C04E6726800080484031CECC2A076059C0817F90A80080484014AF7EB0060C59C037D3A3120080484043A8E9F125E258C0229E86480080484033740A9C06C058C0B26FB536008048405840AF06067C58C0716829BCFF7F484025312016AF4E58C0AB8A6599FF7F4840CDFEDAFDD84D58C0046AEA3346774840B045901E3F4B58C02D2FA84BD76F484075483F03F54A58C083048A68016B484015BF36088C4B58C0CDBC8B88636848403953EAA58A4A58C0249E0826BA674840A94C06E9214B58C03CF3BC0698664840AD87F9E6704958C0C13CB861FD634840A1051868E94858C070D47CBFBB614840737BBB2A774958C065811D40B96048409802D1E87A4858C0F04D4FDDA45F48403B10F3A9A04858C09DA33D5DF55C4840E2F72BE60B4758C0895978D9B25A4840E27105A8784758C07F02D2B9FD584840C6167105384658C08F7C73F656564840CB7B2C69E34658C01C020917A250484072C53C0C284858C0682CDA199D504840596F0F8CDE4758C095CD1B59754F48408871940F434958C05286DB5B984E4840CE9EDF0F034958C08803EFBA1F4B48400B7299D21F4A58C0336C3FBDB44A4840413A2672BC4958C0DFD3EE5B53494840A34CB394BF4A58C0B48F283EF8474840DFA42132624958C08628C93A57464840CFDBFD93444A58C06ADDD61CC545484093EC8D53F44958C0F841C03BEA444840F28473B1EB4858C04F933E596F444840A7ED58337E4958C03FDB4B3A4C42484092DB7B319D4858C029EE4A583742484033284EF4304958C06C2CBCF913384840577BD211A84758C04273E7F5F2374840C3B28DB2D84758C0B766AA164335484041997795B44958C0B89416DBB5354840244894B5964958C090EBF19A7A34484053E68E93434858C07729C19735344840D6B49F162A4A58C0ECBB5CBCB03148408F7E8A34A74858C08F08D558343148404866C1F48F4858C0D93DA398AC2F4840B9AA5316A04958C04DC13ADB7D2E48405901AF54644858C00EEE9958452E48402195C4D5C64858C0B1F9AF19BA294840494437B4344758C0D00C2E56F3284840C65DED157D4858C0E7F224D9CD274840D209BE14584758C06745CEF6DC264840BA09F634474758C0F109C0B6BE25484015DAF8555A4858C0EB423A59822548404CA90535364758C06DCEB176A0244840E0EC3255264758C0FA4C537691234840CB5521F7BE4858C0F2EB1D9ADA21484056B85B16EC4758C0189B49982C2148400AC070D8294858C0B5AD1D18E41D48407A100BB8FD4658C09C6927B5301D4840C85253BAF14858C0FE982179621C484096150DFA184758C04063DBD3921A4840C367C97B5F4858C02C219D36141A484095D6F31CC94858C02F8C2FD7F71848406197FCFEB84858C0AE3032D66D164840FA3DC5DFCB4858C05274867579154840EFB0239F6D4758C049549F71611448406282D2A1BC4858C07012A8B4FE124840E6DB3C21BD4758C0FB9BA071461248406B94C9C3CC4758C01E523630E50E484012CC8283564658C07AA113ABEC0C48404F02D625EF4558C07AAD050801094840086C88E54A4458C0EC7473412A0648405048A84D134358C06493BFF53AFA47402A99552FFB4058C07D6B036C7DF5474027B830F5504158C05F6DC8A812F04740C0120A94054058C0FB56DDA462EF47407A3748F68A3E58C078AFF2DDFCE947402AF1B019F83E58C0D2A946FDA2E747408BA20A184D3D58C0418EE038B0E54740F2A06518A63B58C0E6363393BAE14740AA97793B1D3B58C0F4A6457267DB4740E80E4D59EC3858C042B4792E43D647408BE7A1BAE43758C0A748BEACC0CE4740D5CBA0B88A3658C02957ED88F2CC47408378F75BF43658C04AB7D4A90FC8474022EDA11B593658C0C0CDDB67B4C547400073DE7E153758C0322C42CABBC247403AC0DADE803658C02AA21D4814C047404BC581C0773758C02AD097AA13BB47409E25C9DEC53658C0F5308C87E7B747409DA80200813758C02977DD09E0B44740DC1D847D663658C09CB8920558B447402B08EDBBBF3558C0577569C22AB14740E0E431BD703658C06F3A41C433AE474018F4495BA93558C01DCDAFA0CEAB47405195011C313658C031670EE244A847401B26D31A9D3558C080C0F6FE9DA54740B367EE3B603658C0EFCB1441E0A04740499E747A923558C0A481135BC79E474067AEA83AE53458C01E5AF5A6C49547406F7E8BDCB43558C01FAC59067193474043E676FB6C3458C0CD065672DA8B47408D29D5FCEC3458C00F5CF130178A4740F7FA299DA53458C0CAE6DEE457844740DDEB257F753558C0260DBA424F8147406C11041EC53458C0E6E6359E70804740292F0EFF453458C0A57BA5BA217C4740B449A07CC73258C0A1B088341D7C4740CA145D1E523358C066DF6116597A47409AE2629D8A3258C0A60E5BB35E794740EB72495E6D3258C03D6CEED2517747406410441BD63058C07C8C676CD77747408B32503B713058C073C543AB1D7647405E8CFDC0CB3158C00E051C50056F47408B4B52012B3158C02302B66D246C4740C0C98746053358C040149AB3F0674740D455A7C7F13158C0B2C0E46F93614740FD9F4D06053258C02AFC2D6D805A4740BA5046E6CB3258C0B1ADD10CE3564740D23D3663933258C0DE0FFA689C504740236F5742323258C03E9369E7E24F47408AFA82BF583158C0B4051E44CC4C4740B150AA1C143058C0CF266DE1574B47401A125D56612F58C0C9FE94BAA53E4740BACD19D2C02D58C066B8A5F7FE3B47402A0CA1706B2D58C0FADA3F73AD364740AC3C8DED0B2C58C0897E5B91C334474047015508BC2958C00ED096EC012E47401880FCE3592758C0C6227C6CE72C474095885762882658C0591EDCAB0C2B47400BB8A5A1482658C03ED4BF268D1E4740C8C28B7F882558C0100DA7A7921B4740C67C8FFE9F2558C0810AF1C790184740E5F124FC8D2458C0C0C4EAA8AD164740CBCE4AD6522358C0E413AC4A3A0C47404551F5B5E02458C04D1A934AB902474036982391F42358C02F0EFBAD4DF94640A1152771482458C05C3A45EE90F74640962ABA8CEE4E58C068BFFD51DFF746400E0CD560A37E58C06CA2552E25F746409B430A01F18058C0681138533BF74640D96E7E7ABFAE58C0DD68D34319F84640');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('36',NULL,'OH','OHIO','P','954','0106000020E610000001000000010300000001000000D5000000338FC7D074D154C051FB9B21FC4D4340429DEA1290D254C0EE9DC8A15E4C4340833939359ED354C0DE362321544C4340906EB23780D454C082AF55DFA34D4340E8C5C7191FD554C08EA4D9FBE450434081A6A560C5D754C055CF2CF7D65343403144910C08DD54C08DF59391F6544340D43D243401E054C08CE19B6B565843406D84F217B3E154C09C47762A1A594340A6F7718393E754C0CD5C6ECBC7564340E2AFF70487E854C07A4E37CD1D5543408D784D052AE954C02A10E0F0635143407A02B8E6F7E954C035609E52DB4F434024A47C096DEB54C0F8F1A7927A4F43401E8E71EE9EED54C06B8A44D059514340E28D6E564BF154C03FB3FF0C4E534340257181FA96F254C013B3DCE5CF584340EF91CA209AF554C082F480E11E5B4340B707A324E2F654C0961B777C595F434079D21B0C67FA54C03C1181D804614340D9D04C1394FD54C05AC057F3896343402AFB507C710355C0A8245411C261434096569AFFAF0555C02EC2540FFC614340E7D7CEE84F0B55C0E4EFAD85ED6443407008210EA30E55C082F0BF3D0668434014FF55100F0F55C089775570F16F43407D96B7D3BC1055C0708E5FE56F754340A7E1FB96911255C079F2D89DE678434038DBF05A0D1455C0CBD2A22ECD81434030B5543E211655C005F9CB08D7844340C6B8AE420B1955C0763BE14593844340DEF8A305DD1A55C066FCD2220F86434014280B673E1B55C05CFF3D3DD88A43405DEEA289791C55C019065258508E4340C45484CE7D1F55C0751E4E16BE8D4340D81433B0FA2055C0A1BCCC960E8C4340DA6540D6F42555C0C5C47D76FE884340B82DE878D92755C08509DB7497894340FBC5761DB82A55C0A58BCDD0788B4340ED4005468B2F55C0BC1F34252F924340F602092A8E3255C0D9C40047B38D43406299564CEF3355C07E5E9E85218D43409293BEF6F83355C04E5958A9C9A6434026B05137F83355C019BC9088FAA7434041EA2C24E93355C0407ED554AFC143405263E206E83355C0326BE0CF32C84340E0C92CAFC13355C00CBC28C0DCDD4340F5A529F5973355C03BDC6DB665F543408E6230986D3355C0578A1F72CA014440875D27A2E73255C0701EA464E52844408AE98F02DA3255C05A4039C4302D44408536B5A4C43255C057B04AC65B4B444025CB3D84C13255C0E18E214C4B5D4440D4902720A03255C025B7E0D406784440365307FF973255C0309D2BF7817E44408F5A5B59A93255C09AFAC6A566A04440FEB509589F3255C08198FB2554A444407F35B371AE3255C050A5A968C5B6444082D8FCCDA53255C04C9A0829E7C34440A31D4D8B953255C0D36B1B8247D944403E2814E6991855C06C7425E783DA4440C86E9E45FD1655C0DF02F506A1DA44401951DFCA97F754C054780DACA5DB4440A8BFD89FE4F054C04E1C3B0AC8DB44403373B968E4DE54C0F242C30ED1DC444005F038FBD6C954C049DFBBB523D04440F83F0B4138C054C01BF67F88E3C444401052B1E3EEB254C0F951FAA8D1C444401FA1C0A238B254C06F08C40CF3C04440DF91376881C454C08E6995CF61BA4440454AE6F12BBA54C0087D99D3F8B644409A25DE73E2AD54C06D78F5CBAAB944406A37252820A354C046FDB65917B24440FF667B36D99554C0079FB56D3BB744404F02E6AEFF8054C04039E7AEF5C144404F099EE58F7D54C0BB8C6DDE3EC044400B2F99A0436F54C03F0BC428DEBE4440BDE633DD9B5E54C0EBBCF711DCD04440F0D1F0572F5754C0B296FD51B5DC4440FB119946FC3F54C03B78F139D5EC4440E55E8963512154C01E5061D351FE4440FCA1AEFF722154C043C21A30E6EC444024D204FF872154C0061CA8815FBF444047FF2F9E472154C07C4A0A02A1BE4440FD1898BA772154C0096422A59790444097C371D3562154C0917190C2D9724440BEBEF7B14C2154C0856A6A67556D4440FF08B270682154C04912D4DF8F514440DDD1A33AC32454C022ABC33DD84E4440272A57A1232754C0C569513A5E4F4440A3843826CA2854C01279C9F8964E4440D05AC60CBC2A54C0DD480B7B834A44408C3169ADCA2A54C0E6EFF95CBD484440C4F152478A2854C02DD35BA304454440AD96B326042854C09D58E34892404440CE8DE962842654C0E3BBF34D823D4440BE9391AA2E2854C0094F0B19F9324440C0492F8B452854C082CB65BABF31444050B560E7FD2654C0C653667DC72F4440E06E7468B02654C0D7CE0608332744407D22A00B572754C0AA41036C64234440C98E5E749B2954C0D78EB06F721F444005AB347C6D2B54C07892A8F4D91844407ECEC661DB2C54C0FBFAE1F686154440915699A2EE2C54C0B0E55138B9134440616E324E3F2F54C0E418E0A390044440E4D3F4F0492F54C041693D8AE2FD4340FE65FDF9D53054C04EBBBBCD37F94340AFC17F9B913054C008FD2612ECF54340E8DB54FE283154C065824572E7F443407B78B803F23254C0660FCA4EBDF5434088D2A0A6B33354C0C2671D4E3CF54340DC9ABA08FA3354C031D21BCFD3F343407FD4F2469D3254C07B05ED15A9EF4340706D0A0A1B3354C066B2F816A9ED4340132930D1DB3454C0940F3C367AEB43404D6172326C3454C0EFCE295B8DE7434083F4D800BA3754C0E0B0707A47E14340A07E7921D03654C001B6CF3E40DE434075259460443554C07CB685C302DC4340A840B8634C3554C000BBA10409DA43405EC26C2D423754C0A99214C215D7434032005E12DB3754C0DB408FE2C9D4434087DEBE1A643854C0B76C62E4E1CF434052B757E2673A54C084B5B2C0BDCD4340320E1AE5AF3B54C00B45013EB0CD434069A00C10F43E54C019BD2E9878CA4340F82F8C9A154254C060DF5176A6C54340A358827C644254C0D06E27572EC44340A70E0DA5494654C00FC41FB68BBF4340A73DC5667E4754C0B47EA757E0BB43409FF99C6B8E4B54C033B90CD609B84340408019CDD14C54C0DB1B7D163CB54340C2B6F68E654E54C047F61C1545B44340A907FB2F354F54C0AE731D75B9B1434033BFDB552D5254C05CA7B9938BB14340157FC57DAF5554C05BD4683444AD43405B9526030F5854C01D1A18943FAC43408BFCE84CC65B54C04B9A698FF8B34340495D0A4FAB5C54C073C70D8F9CB4434060BC80B1C25D54C0212230EF13B44340C5E438FC996254C0D9C3F79025AD4340A2F0843EAC6354C07F2BDA7194AA434064A478DFA66454C080F1EF9509A24340430E41AFB86A54C02BE808979FA243405CBFD232216C54C01F6D53184FA1434046467A73AA6C54C099ECD09D299C43403C7B88D7466E54C0F625F25E4C9B4340AA44A0FC917054C0065361047F9643408FD6AC39A96F54C04D8196AB1C90434019FB7C5A3A7054C0BD44E2CF1F8C434012E9BBBE537254C0154D6491E3894340894F84C3737454C0799025B0DB8943401513ECE3C07454C0244C9F518088434075960FC20F7454C0D2F9E554A585434006754BBCA47154C038DDF37927824340E48BA5DC077254C0ADED6AC2F87B43407939DD79C97054C0AE70D72A1077434092A8B45C207254C02B5B684B37764340B03594C2B87454C079534A6467794340F6B90985D17554C0E3D1D7C50C78434005FC7DA8797754C01FE142EE5E714340629E1AEC217954C07DD0A44ECD6F4340ECB14B6F937A54C022A7988B357143400BB5CB71A37B54C0ED46CDE88672434015EC17CD827954C0E5F41E2453774340033C7691617B54C012B7A899FC7D4340E460CED2037C54C0D2D051D8DE7E43406E6E1778697E54C09235ACD61A7F4340A279CCBBFA7F54C0BB41ED12F4814340FE691BA3BE8254C095F8E150CF814340FD8FAF85BE8354C0B5EFAAB3997E4340E0571FEA708554C0560F0FD4147D43408561942C7A8654C0A6C2E236DE79434078B72C92EA8854C0A8B4B27C1F734340D23B75B2598954C0D0AD82655D6B4340EDD5E779A78C54C0EDFD51C7FD664340924F5E3CDF8D54C0890A5D49B46343401D05FD35C68B54C005DD6135EB5A43407EBB0636188C54C066251139C5564340ECA86D321D8B54C0DA98BBA0EB504340B6D868B3CA8B54C01CB47A042A4C43407054CF97AC8D54C0A5241EE3DB4A4340D1284461569154C0510B9A5B254C4340FC0406E48E9254C0DF1E331B404A43404525E5841C9454C08D2F9DA48C3B43402F427946119554C02668C4E4913843404B9BD2D0439954C014278B1DD83643401CD844948D9A54C02AD8E61A17374340F2B2ECE0AD9F54C05CFA6252F2334340068890070BA354C03C4763F143334340F8442DABD3A454C06E4CCD10B33343401419BAEC8AA554C0401AE16FCD344340CC66259247A754C03105B669803C43408C507C5ADDAA54C04290422646404340F04C585F84AC54C07A42B2A102454340BAE11C067CAF54C0C44367DFCA464340BBBC32EE59B354C0AF32433C554743407470EB71EDB454C04FAC75392C49434001EE7096A5B654C0900409D5DB4C4340296A19B90AB754C0871420AF81534340C1DDCE1C52B854C02DD2016B765743404AD6415DE2B754C068E29267085C43401A1945E0FAB854C0EAC94C44135F434025974AA4F6BA54C0ECCEAA828A5F4340C1F7C2293DBE54C0DB150F431D5C43400F62FF70B9C154C0493B4121755B4340E9B6D774E5C354C05507ADE2C5574340C1A3789B1EC754C030C85242195543409DDB6D5E29C954C081B90F86464F4340F87BB8E3A4CB54C00DE050450F4E43400B5A754DAECF54C0C87536E1E44F4340338FC7D074D154C051FB9B21FC4D4340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('37','OK-FMS','OK','OKLAHOMA','F','955','0106000020E6100000010000000103000000010000003C010000343DA6DA1D9C57C0CFDB646AEE76414021F368A08A9C57C066573668285E414001A6C5CAF79C57C0C55A9F5214414140E9E8455A8C9D57C0D6901D9A2F19414013238A4BFD9D57C08F918E5B3BF840407FE9061C829E57C04F42D30EE8D04040E79EAE5E0DA057C0D9B2FACBC3CF404081861A60B0A057C015989F29C2D040407DC839E19DA157C0C45BC16781CF4040247268212AA157C01683BEE751D240407FDC6EC439A357C08308CCE2FFD04040ACE09DA5FDA357C077CB5B005DD140404E43E965FEA357C09394E5FF4BD24040475C3064B2A257C05CB11983FDD240408B93FF84EBA257C04F2DFFC1B3D4404059D6BB27E8A457C04E7C059D7DD340405ED82789ABA557C024F7817AE9D340407DB0EDA876A557C03034737AC4D44040E37C27C72FA457C0B07D4A5EE1D44040CA26FA46E6A357C04C2D9CFE04D640402714B8A809A557C0EEFD0CBBD5D540407B0C90C975A557C0F87E9F99ECD64040C1A1A14A79A657C05806405736D540402B5407CE71A857C0F3096CB08DD7404099875CEEE4A857C01C5B41B0C9D5404045B033F028AA57C0B5E8E30CF9D440404DB27751DBAA57C007EBBA2A45D5404015D73A31C3AA57C0C1A8890AF6D54040BE1F440F40A957C0D94478EEC0D640405E1267D0F6A957C04560F9AAA0D84040E1F5A471CBAA57C07C5158C82BD940402509B6933CAC57C0138EA7045FD84040D24A64B87AAF57C0C0AA96B9C6D9404094A4F4D94CB057C01BF4E5D69BDA404036674B3882AF57C0022AB3570DDC40401A0277DBD3B057C09F54E795C3DB4040D101E6B8FFAF57C0B69B3DF44FDE4040F2314BBF22B257C096034253ECDD404054ACFB3E10B257C0AB8F233206DF4040415CD2BBEBB057C041AF2AB260E040407087987F28B257C0C7E3B2716EE04040F2CAFF826BB357C0C802EB31AEDE404040441EA670B457C0A6E66C10F0DF4040021EAF0DEBB657C085DD204FEDDF4040521AFB5270B857C0AFCA8C8E35E3404051839E9980BA57C0F5A2580D15E5404012B9193929BA57C079FCA9EDDBE64040FD4F3EFBC7BA57C06AA63EAD7CE8404095CA4C1F33BC57C00EF75DEC6FE84040606AD0BF2ABC57C0F9556EACA3EB404013E0A8C372BD57C059BA894B91EC4040C2DF99E502BE57C036A591AAE3EE40407E78020954BF57C072C9E7E99AED4040AD85B2ECD4C057C0B675CFE85DEF4040421832CF67C257C0E4042E68EBEE4040490C5CF0C1C257C0415DBC0739F1404055930C330EC457C045AD0967CAF240408207B0B313C457C0FEF46F0679F5404045A62D755DC557C04030F1A6BCF140403EE02396C1C557C02109A0A6D1F24040ABF2D29547C557C069F9D16593F540400BDD79171EC657C00A319905FFF540409EC2FB19A5C757C060BC4825C9F44040E1EF1B3B1FC857C02F38BD8468F54040BDDE1F5C34C857C001D87BE371F840403E6AB6BE81C957C0AB64F4A2C9F840406743374AFECE57C06C7D371E84FB404099F0B1EA18D057C0FCB691DFE0F74040FDBFE30814D057C0365BF341DBF340407AAE9CE9E2D057C0F17B7FA1EEF24040EBFFE8EBC3D157C0E79F4D7F82F54040D2F3FEAA58D257C060553B8089F14040B4D51D0C57D357C0E4D3255F80F140407E1FBB8F88D557C009EC231CD8F24040CC61A02D23D557C0D4582FBE7DEF4040800BA5F7EADC57C0CB617174D4EE40407149EE99F9DD57C0BC487B127AF140400099481CF1DF57C0DE817C90DFF0404057FC4CFFD6E057C0D0A64D6EECF240401C046063D5E257C00EDB5B6A63F1404076396C040EE357C086B3BA6956F2404004755BE1B9E157C09F92660CEFF24040E8B9BBA044E157C0BA18334D10F440402C70E7C4FAE257C0A3589DC9BAF3404054A8676908E457C098C1B5A6D4F74040341EDED0CDE657C01983FA80EAF840407E9CCD515DE757C03115ABDFE8F74040780B5B103FE757C0BD7B62C0CDF54040F2FFA5138FE857C0980DE85DC9F54040578218FCCBEC57C0BE7500F68CF24040D32646A4D0EF57C0878346CFA5F340404D3FCC45B3F057C093314A8E5FF2404050BC3385EDF057C0CEB2918E86F040404846A16333F157C045D2570FFEEC4040A5C88C29EDF257C0B4E205EDB0EE404081E818CDE0F457C02FC64B8CEBEB404092E1A91032F657C0FEF0F36AAAEB40400CA32EA5BBFB57C034F66A2000F2404040EDE5665FFC57C0FEB18DDFEDF14040EE395C8760FD57C0275CC9E0BCEE40400CDBE0C991FE57C09D6D34A0D4ED404001C9D64EA5FF57C007A21E9D0FF040406031E80F2F0058C0FF4BA57CCEEF40401D40158E210058C0FBD518BFB4ED4040DDD880AEEA0058C03DE4C84012EC404063886A71BA0158C0E53E7D5F95ED404078CBCD32160358C0D9B7C441B2EB40405E52BCB8DF0558C0B5702D621EEC4040D008D759050758C0B801FA6428EA404008F6B6DF8C0958C070D3BFE4F7EA4040353BD581D80A58C0741E39661FEA4040F759A4A2BC0B58C0B037D0286FE84040E9A5A141950B58C0B105120A7EE74040E90E60DFE70958C0BB8CE6467AE940406D24593D110958C017CBFD8603E9404083553C3E570A58C0143300AB2FE640402AC8D41CD20A58C09E902E907DE24040B62F7F7EFC0B58C0C815D1921CE140402D3BFCA19E0D58C0CDE91C94DEE040408B31AA4BD01158C00521EEB301E34040ECA01C6C8E1258C010B103578AE14040AC13216A441358C0BFB4506069DB404049F31C2B421458C024E29E03D8D940405DE5052F431658C0590FBF2452DA404033E1DDD3BF1758C01239A49FC8DE404061C1D0DCDC1A58C042D8B139EBE440403FEEC583351F58C0FC41491F9DE3404070C90BA6102058C071B6417EE3E44040F38712A9B12058C03F9A41B96BE840407F3E5870FE2358C0A3D159B9AAE94040130F51767E2658C0BEF25C57E9EB4040C9F0EBF8522758C0B2DF13D476EE4040E10142B76C2558C009E3412CB8F2404098A5A221A82A58C0F7F0694CF2F44040A54BB802642B58C0E9D6EC2EC4F340408CF836E2642C58C099B5497A8BEC4040B085E0A3902D58C07B05A89DBFEA4040D060B848F12F58C0C15AE1BF79EA40408FC89551103358C08745BBD85DEF40409C063F141F3458C09C87597899EF4040368096D8083658C0B6FC6A5BD7ED4040225C687B1F3758C07E41F8DA4EEE40403DF0E61E453858C0CA1696562AF1404023C1B840853858C027C99D4E5CF64040DF05A3E3843958C043A16EC99DF9404053CAE0A8823B58C0873409A71EFB404058856C69EF3B58C0C972C36956F940403A202D6EFB3D58C09C16106CFDF74040306171D13D3F58C08F6DA5EADEF8404026D906503B3F58C08AC8B0F831F04040507C3A92644058C0B175DFFDE0EC4040CCA24E14A84158C07401A7DF9AEB4040FF36CB598E4458C01B9A3B9CACED4040FE50101B474558C0023F643DF4EC4040EF1D73BA064558C022CCCABF40EB4040514BF856384358C07D7311236AE940408865331BA14558C0633FDFE561E740403702E8395C4558C02BC031D30ADF4040C1359D7ACF4558C089495AD5AADD4040F9E4C31D6A4758C0038148D6EEDC404079D17FE2C64958C00C35837548DD404067F03807204C58C009A8E12F5EE04040ED51C2E9594D58C0C71C6CA2EDE8404059FA40E87F4C58C0CD9F4A9F0AEB40407E764605CF4A58C015051ADD87EC40408CC4D684864A58C0A4D8FBF97EEE40405459B127094C58C01518CF721CF34040E64B914A8B4D58C0287E11F1F0F34040E8F1844EC44F58C05AEF70B379F240403690ED0E105058C05B3D9FD7C0EF4040B7C26FB0E85058C068B44B3AEEED40400A295ED1715158C0078CBBD7B3EF40406425E3D51E5458C0C9B6C232AEF24040F97A44162D5458C03FFDE7576CEF40400F1963F9E45558C0E05FE29956EE4040732C6C7C455758C039E2EF5F62EA4040057D2F42445A58C0D660F16110E9404081EBE886FE5C58C0CF66E45E0CEB4040C798F265455D58C065D637F4FCF1404002FA36C6A25D58C054C3A59184F340407FCCCCC7945E58C0E798A11033F440407322492C2F6158C0FBBFBC0D5CF540404C4E0051836358C0A1E3166EB6F34040E6E6BCB3DC6458C0783AEF6C89F3404021905D15EE6558C0E08EF28880F5404001F617556E6658C0C69246BF19FC404049D906BEF76A58C0040489188EFE40408EDFA6A2176D58C0AFBDEED95EFC40407EDB3A46AD6E58C08AB990FD3DF84040C4379B496D7058C053FD583D52F74040D4C599CE977258C09E0A12C3FDF14040AF771A37957658C05D593AC7B7ED404063007619AF7758C03EC694A777ED4040FB811E3E337A58C099D3B443E3EF4040FCECC9831F7D58C0CCCA692119F14040B5083F26827E58C0F1A5EC7D88F3404067F909067E7E58C0C9E75F5CC1F440402D132C22DD7C58C0473567F95FF740409B8D61E3A67D58C04E694D9670F94040799E2421AD7C58C0D30BA154DCFA4040D4D72EA1D57C58C0FEB4B13252FC404043F1A164E97E58C08EB3A94C2D00414069AE6F0A868158C02CE41DAE58FE4040A46E2F6F938358C053822EEDB4FE4040F0367F93898558C084EA4C49B100414065A29CB61A8758C0553984FBF2084140392261530B8658C05363F02E3C114140936590365F8758C0B7C4750B151341405CB6F999C78858C07B45862DBB11414056C8AC1F158B58C098D4BA71C70E4140AB331DB0BF9158C054DAA44EBD0F4140F4140B38889458C01E225A8BDB1141401CEF4A5D729658C09671E60A34124140487DA9029D9858C0BD89A4EFD40E414073DCF2C20A9958C0F3EF52742D0B41405F2577E5139A58C0DF1E05F5900A4140BD7454A7FC9A58C010CEC33770084140EEF1198BB49C58C0759F8BD9F8064140A478F193FD9F58C0203720578308414035BF5ADEB4A358C0C23B06AE7E0D4140FB85BE22E8A458C0D1DDECC62D124140B27E5CA7E2A658C0E5763C04641341406E264ACA15A858C02A02E6A14A144140B2A9E92E5FAA58C0B87B9122D5124140BA3DACF1AEAB58C051AC1B21361341409D323B1429AD58C02EB26E43BE104140FA46881ED9B158C04DB1F21EE71041403CC3C623EEB358C0091B5CFAB0124140A5694E7011B958C065D92EB2981441401990769BFBBC58C09D3C6D68EA184140B7BD2563C7BF58C08A3D72A3D31A414029EE06C746C258C0A41FAE2179194140A8A089CC0AC558C0D6B7FD5BAE1A41406BFABC1136C858C07E24BF98CC1941401D82FFF74BCB58C0871F66923D1B41406F386EBA36CC58C09AD7632FA61C41403BA018FE1DCD58C077346DC8BB2041405D7C9C1F96CC58C022BA85FB1027414097D3FDA12CCD58C069471073812A41406D324F2A49D058C0D0013345242F4140E899714D1FD158C0BF3C179CFD324140E88B14D4B6D458C0CC61F333D63441400D2F321A55D758C007394D86A2394140F779567C29D958C0692F1FCAEB364140F3EF04DB3FD958C065862013CB324140614384BB42DA58C01C3C6F79412F41404023515E14DC58C0DA9AA338B12E41405210AD23B5DE58C063211CD019314140F08CD20629E058C039DDA008BB3341401131D48A78E358C0E2E82B1F273541404C1F628C01E558C0E500BCBD593441408968354C7AE558C06713858345314140F975102D84E658C05FCBC3652F2F41409E07A993DBEB58C071260299523041400E784DBDCBF158C042240C19D73841400C98BBC523F558C0237D507F3C404140361FF9CA19F758C0DF905C95644241407955C2EE61F858C0106D33CA2C464140A07BB196AAFB58C0C159265A224A4140BDD5A1D87CFC58C099758177314A41407D928A1C3DFE58C0EDE1BD36ED4741402B7F3540C6FF58C0B4DEA232FC474140E5CBFADFF3FF58C029F7ABABA55F4140751278EBC5FF58C0C5EAD17AF983414095D2AD30D8FF58C0492BCD7A53974140B11342E0A9FF58C05892D4045AB64140CE43326E060059C02B0544AE36CF4140BF85BA3FE1FF58C099006B9621F14140021726EBD7FF58C0A09F68275F07424003522F68190059C0DFFDD4080C3F424032D4EC28770059C026670D88383F4240079D5391302359C0E4885840A73E42400D92E814453D59C05BAA8B72AC3E4240D633B93CC44559C0C829356E783E4240A6E97575BA6759C0F662DEE2FA3E42401DADBDD7378259C09FFBFCFF193F4240C89C5F659A8A59C0BFE81CFEBF3E4240BCD50A6BD5BF59C063337BFC053F4240391BBD78DABF59C0C7CC02A1CF7F4240D826F79B618259C08835395A977E42400E36FBB9918159C016C6FB7A937E4240D390E06D6F6359C0A1A717A3937F4240ABCBB429954459C05C6D4DFDAC7F4240CCB92C6AD63C59C0A26A2E9C927F4240F565F77A972859C09A1F74F8B87F4240CBFC4032AB0559C00DEEA513B37F424077A495E7F3FF58C0385543D7697F42406A288660DBE258C034DEF0536B7F424040C16391FFDB58C0821175B04D7F4240A5C66F12F8BF58C09B9C43D9C07F4240B61E61F592A258C028D354C8CA7F424030F4C799379658C02331593FE17F42408B8CAE9AB08658C06F09A676D47F42407153CFD4787358C00BA33710D17F4240F35FB231C95D58C047F2643C8C7F4240B0578CF5CF4858C08ED595B7F97F4240DB2C67A3EA2F58C05E081E71058042403CD7195F3A2158C091BD07EF1280424012683D1E630058C036EF0767C97F424090645F3B4FFD57C0F93735B702804240FBD288B449F257C03508BE32C27F42409110C24AAAE157C0C5C078622180424086B4311A06DA57C06DC5D32B1480424068D4F5849AC457C0552DE16E3080424075DCDA7E18C257C0363B5A8A19804240EE67D94CB4A757C06DBB293B9F7F4240543887ADC9A757C0D3F598E5BD6142401D35B0AABFA757C09BEA5359D45542404E4FF72381A757C0BF21671FA53E424059F1D881E0A657C09D1ACD00493D424063D29D3666A357C03C2D87290F154240F05AE7F6B6A257C05897D3CBAC0D42405A54498E199F57C08F627ADA51E141400C3F7DA9FB9D57C0184BEB2D0FD24140BF564F656D9B57C01493BF1945B34140343DA6DA1D9C57C0CFDB646AEE764140');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('38',NULL,'OR','OREGON','N','956','0106000020E610000001000000010300000001000000C7000000B9399BAE415C5EC05E26BA5A46FF44408032A99B38925EC00711A70D1900454086D803EE36CE5EC0D17DE2D147004540FCD32E58D8E05EC0C1F540FDB8FF4440E86423E56CF45EC0196325F218FF4440FEDAD362360D5FC0B32E6DEDB2FF44405BFA0D368B165FC0B6DAD574A10C45400EE84B60901A5FC0FFEAF678791F454042523039051C5FC0E47B886BFD3645407F3DC4A512195FC0D9971A9CC9464540219FD445AB195FC0DF19F99BB44F4540162A60C3D0235FC003A1B3F68D6A4540EE431CEB0F1F5FC0225FB5504C7A4540B6EC0BE1C0185FC05D45ACBE7BA1454099533B27FD195FC0B61647E26CA6454020DD061E89115FC016805FF7C3BA4540827EC6DC760E5FC0DE5BA2CC70CD45400F948001220A5FC01AC3E10CB6ED454066392C8B92075FC0C5E8CD777F22464003CAA45E7B035FC0602440F8C0544640B4AD821BD6045FC072B2405A4968464067DEF2117C005FC00AC915059F844640AAABE50B39FD5EC0281C93E67FA54640B146437EC1FE5EC0C3D8E63F17BE464007C94C7AF2FB5EC0F8E7CF0605C14640D42B8F4B18F95EC00793F2ACADBC46400F878B2A02F75EC0DA6F1EF1E1BF4640C24EAEC204FD5EC0617A768CC5C846402DB3F4AAE8FB5EC08C984D81F6D94640E0F9581781FE5EC0288BA50143E346401CCBA49733FD5EC0E5D0DB487EEF46400522CDBFC6FF5EC06B8B24E690F846405D8745BBF4FA5EC0403EB6CF930147403D7DEEBF8CFE5EC07A871145F2194740D9BE0B7AD2F25EC0E1624BF2430E474056DD10BCBBF15EC0355FF9B07C1247402413A9E88AF45EC095E6A082C91847402BCB6002BBF05EC08C82354BDF1A474011DE0FF7E5ED5EC052124814BF1547404BC65251E5EA5EC0692A5AF75516474026D71A0217E15EC0F8799B3F381E474007071F8444D75EC0780A72A373124740E36D177C80D35EC07A73CEC286124740A8094854ECCF5EC0165B45426F1247406E5D8F9198CD5EC08332FBC1C21547402FDA3BCD46CB5EC01B46E0C27F174740860C1C6496C75EC015118CA5F3164740CF21DCF73CC35EC02FA0582AEF134740C0ABEEC958BE5EC0200B5F52240E47405C4F9E9F95B95EC0958BB579270A474090D11CD806B85EC0D10255BE7A034740C539870AB2B35EC09A011764D1F846401B5E0A2899B35EC08F353EA5B8F34640658536432EB25EC0612B0EE716EF4640B501268235B25EC012987E87DBEC46400B9DA3BF6EB25EC0D62FB7A871E64640C1A27A1AEAB05EC0BE472B4B5AE14640EDA3DA7971B15EC093D7ADCC24DD464092BF64B5ACB05EC0524140741FD346408D37B98E90AC5EC062F7DB19C6D04640FCCE4469ADA95EC00277AB9EACCD46400290920030A45EC01D7EAB0523CC46401EE7AC55FA9B5EC0BC88FFAC4AC846402D3D2833D0965EC0AED5C44C78C8464088B59DD066935EC00F23C71084C546408ADC77CEAC8F5EC0BE12BF8F28C64640861A521A40855EC0C849DAA295CB46405705913000805EC0918BCBDD14CF46401788770D407E5EC0893F7C1C61D14640FDD2CD07517B5EC023276CFC2DD24640A1E1EFA2D9785EC08C88F43AA3D64640A9D58E18E8735EC02613C9FBAFD94640186EC5718E705EC0DAA0C39D48D846408AE602EF356D5EC017AC02602AD84640B295F607DC615EC0162A3BCB1ADC4640C3A23AC6525C5EC080DB73AEF4D846403DEA1886025B5EC06EFD3BAF65D846400D09C7448A575EC0CA3E84548FD946403D13DB837A545EC014C2B8972BD9464080C46F63B0515EC08423FED7D3D64640A9BACFA0B64D5EC03C7AA9DA33D546404D332400034D5EC09B8D93FA21D44640C9D98F9F4A4C5EC0F37A05B67ECE4640E3EE54FE274B5EC0E34F8FB6DDCC4640FF8C895A03485EC03A95D51CB4CD4640ED0BC4B6B4445EC0C0373224C4D24640D2BA219424425EC07BB9B06790D346404AA24B8DFB3D5EC0B7BA9B6C94D2464039B2BA6AB53C5EC08C99EF8D3DD346401600DCA41B3A5EC0C1E62E5057D146401440EF7F21375EC0658999D224D54640437E4D8C9B2C5EC0A25530FCF1DA46405749DA47232A5EC035C82B3FC6DD46400FE93EA3EB275EC009FA7EA12EDF464072F0163B7C245EC05BA72C66D6DE4640C0CE1B2EF21F5EC006EF366D0AD94640BCD34066601C5EC017F76E513AD84640BB93D41227125EC01D46F8FCB8DB46402B48ECC8460D5EC0BF6D67E221DC4640F4CFF264FA095EC069238B0571E1464007571EBA64045EC0D3A97DACDDE3464087DE1AF1A2FF5DC06F615372D3E746404CE18ABFA9F75DC0F6F0C91875EA46407A62BDFA58F55DC0217CECDAB9EB464012A263A76BEB5DC021E39FFF1FED46405A0194C2D0E75DC0E6F7ACE01FF34640F65061FFB6E55DC029141281E7F44640204E4C36C8E05DC06A7D200119F34640F7F1E34C16DC5DC0700B16C006F54640F6749BC448D85DC0D62A303F74F54640DC8B2A7A60D35DC02077F37D61F746405FB5108570CB5DC03018F19D0FF646408309ABDDF9C85DC08577FA9E7DF6464015907CEB0FC25DC08A1BAAE2AEFB46406F359543DBBE5DC0C53BE024E1FF4640C0C72593857F5DC0746C3CB4350047403388DD2FE47E5DC0C270D615FCFF4640BAFD3AB494665DC002ADADC90800474003E70C91D35E5DC044EBAE95FAFF4640AA7FC510D33A5DC0F65504E961FF464060AE820F7C395DC0F258B98B81FD46400CB31D6FD0365DC00BCCDB13A9F3464072AA680BA4325DC07487B85F45EC4640940AEC6A84315DC08BFDCF03EEE846407A77E1E7002D5DC00AAEA089DAE846402286D3A7E1295DC014DB3FB0EBE3464005529064E1235DC0CAD8D19BABDF464069BEA441CF215DC0514A9222F9DA46400CE5615EF4205DC04E3C73090ED5464097C45C571B1E5DC0EDF7A7D699CD4640861E5C95A01E5DC0B539B99A74C8464016DF76FB7C235DC0D1E9F2D42FBF4640BB19B59B35245DC03F5017D0DCBA46402CFCDE65062B5DC0271A48B9EEAA4640C8DFA884152C5DC012B73EB694A146405080A136242F5DC0179025479391464035937F9EB8305DC00DCE40439B8D464021831842CC315DC0927FB7C3BB8C4640A73419A661325DC0F9013542B2894640A4EC63ECAA335DC0F7C996615E8646408D501F58B0365DC066027D432B824640E321E43847365DC09833AC61018046404C01D4DCC6365DC0CFD637846F7D464017A2C23C48365DC0671A7004627C464032D5C59935355DC0E70AAB427F7C46407CBADB5E3E365DC00BEAB385387A4640ADA5742177355DC00917DF47C7754640EE25CE2D7E375DC00317918F2E6F464051D559756E395DC0497BED739D6C46404E08143A373A5DC05CF7DEB61A6A4640E8DF7647E53C5DC0972D701E55634640DF630B5A88425DC0D97A2606E35F46409704EDBF41445DC0C4B9078C49594640C8FE742214455DC0479DD72C3C5846403AB8292D5A485DC086BA737648494640DE769C4F36495DC0F44F26B79647464087E2DB4F4A495DC0B27F3D986F444640E1556737FE4B5DC0FBECACD8824146401A380EB90D4D5DC039F2FA372E3E464000CA4DBB5C4E5DC0E85FD3D68A3C464012F15AF6E64D5DC0B5E2FDF5C3364640DE162FB6294F5DC0580BB6F3EA3146408FF22B0CE74C5DC0724D2DB4722B4640890A62CBEA4D5DC051060C327C264640DA3B5329AB4D5DC0820C03B271244640B883DE1FED4A5DC06894F1346D2046404362877B2B495DC0DB8291B71420464068FC425836475DC0E249AAFA8822464066CE0E966F465DC08556C09B2F224640ED0D407135455DC05FD35C5D361F4640BF56906B54435DC0089C3CA0A31D46406DD88F49F1415DC0F596B142EA1F464035206083883F5DC0B3F908C69F1F4640B8804EDE783E5DC01B1F8DC6D21C4640DD667AFCD63E5DC0E7009BE5521946408249D56D6F3A5DC083C97DE9B116464087B12888BE395DC0C6454569BA124640105FA1CA993C5DC05918FA44E80B4640C37EB40DA93D5DC01FE7E3E38E0B4640469BAC2E843E5DC09BF5BE62750946407D32CBFEBF3B5DC05788F063D10146402D434201F33D5DC027B75BFE49FB454056490EFC6B3D5DC09BD3E59BDBF645409C1E93DD993E5DC09C0428B9C4F34540122279FA993E5DC0FFE41DD7CDEF4540461AB9DA163F5DC02F2FB635FFED45402DD473C109415DC01C9A9C332EED45405574B21EAC405DC0F4141F937DEB4540FFF624A2C4415DC0F09DCFD070EA454053E4452160425DC060A7620D6BE6454020525ED985415DC06729094B79E04540339437D2AE415DC0ACC7CD7EEAD64540D746DE1235415DC08E8F9C6A55FF444042B4383BDC8B5DC0F390C8CD91FF44404B07C379E6D35DC0397F09FD9BFE444058C00A2082D65DC0609DCBBB92FE4440CA2388D694FF5DC03300A8449EFE4440FEF06E59CD375EC0FF7BC80A6CFE4440B9399BAE415C5EC05E26BA5A46FF4440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('39','PA-EFACTS','PA','PENNSYLVANIA','F','957','0106000020E6100000010000000103000000010000009A000000EC391066735E53C0CB3E0F9D1CDC4340AD188104248653C07D877CE8DBDC43403926BB44699553C03C17782FAFDC4340714DE548A09853C070901CCBA3DC4340B793322756B453C0323EEA0E8FDC43403AC276F487BB53C03FA33F8975DC43404CE7380F62D953C0C6FDAB7712DC4340892BF53AC8DE53C0B13BEBF031DC43404F107BEDF7F053C035BE872C64DC4340CD0D4EE9C4FA53C0E94378955FDC43404B61D015761B54C0A0E96FCD23DC4340EFA48DA18D2154C01ACD7D9350DC43409ADD87E0932154C057512B7EADFA434066F60BFB982154C0A753A1F0EB02444012BB8AB9AA2154C0BE75027ECD144440FE05C814822154C0401F169D963344405C9895138F2154C0F69D51D2483D4440FF08B270682154C04912D4DF8F514440BEBEF7B14C2154C0856A6A67556D444097C371D3562154C0917190C2D9724440FD1898BA772154C0096422A59790444047FF2F9E472154C07C4A0A02A1BE444024D204FF872154C0061CA8815FBF4440FCA1AEFF722154C043C21A30E6EC4440E55E8963512154C01E5061D351FE4440951088D7D8F053C06CC0FEC53722454039DE3408BFF053C035BCE4C4650045402EB4590731E753C0D8DD952A130045401A4099AACEC353C04D601FEF250045406E90B054C9BA53C0EFB1EBFAFAFF4440F396D390869353C02FB4C303EDFF4440929915A1128D53C092980C08C5FF44409282C335AE6F53C01158049DA8FF4440C96E1DE5386753C0DF88D3A5D9FF44404F62921CFD3D53C0988307AE61004540DFEE36D46A3B53C069ECD30D530045406668122E172453C0CC878DAD62004540CFB76003480953C0D25E347215004540F102F39BB50653C0A02E1693EFFF444000E0DEEEB3DE52C03E430DFA88FF44402291F60280D852C0BD4D4226CAFF4440E2D4D43E1FD652C00CBD478B15FF4440157A907EBDD452C092EDE50E0BFB4440765625FA27D252C0AC0715154BF94440F56349FB49D052C04EF9E93D37EF444006E54B50F6CA52C0ABD65D6015EF4440E554CB6D7DC952C0DD9E71818AED44408AC4D6EAFBC752C0C86A0C02B2EC444096744EAA89C752C0C6E1586222EB444054E8F2251CC552C00A70410336E84440A082F26832C652C0371AC6E30AE644407E966DC937C652C0C0CC12A4B7E34440DD6C8DA4ECC352C03C4B4CE497E24440723E4265A5C352C0215050C504DD444058073C872FC452C0650F8CC57FDB44401D5D7CE848C352C076FDE18793D1444047779A0CA3C452C0DF9E6D6879CE4440E37696AC78C452C0A293AD885FCD44406922FD079BC152C0DE740E2A6CC84440E189E1E7F3C052C0A67CEB2A10C5444090DA41C631BE52C0881AC1B0E6BD44409E5D9F22AFBB52C033F4DA33FFBD4440AD029E0082B952C0EEECAB591FBB4440657675414CB952C0E2B16CFCEAB84440CEA94BDE4CB752C01B04485E3CB944400E8C1F38BDB252C0CEC17C8607B74440E9DC47144FB052C04B9B6E090FB74440B56877D35CAF52C02F2E6B0B06B6444086C0475463AF52C061C6F3CD68B34440817D6B3223AD52C03C829BF101B0444010BAAFD2CDAC52C048825894DFAC444073E04D9DAAB252C0A72C1675EEA744402FF95E3ED3B252C022EDF896C9A54440D05A9102D0B452C0853E12B62FA444406530204973B752C0EC465F59089D444014D6D48839B752C0012EE07B779A44401A406D908BBA52C07B9863C00F92444080C3B8B5CCBC52C011EA8E42518E44406CA0AF9A03BF52C0C85EA482B88C44404989C2DB49BF52C0CD321225778A44404F13A6B8D7BD52C0E9238D25958A4440ED5FFADD12C052C02F7AD786FF874440439DC5A341C252C0B23DF6269C83444037E14D897AC452C0B986EA245F814440C36651B076C752C07C79BE1F08804440C8031052EAC852C00AF8059F1F7D4440E51AB170ACC852C01BC41781417B4440858121661AC552C09D787FEDA0734440EBAB7944B7C452C0D7A3F96F3B7144400144D7819DC352C059C807339F6F44402111CAE07EC352C01C9873B4866D4440A2CE57E55EC652C004EAC3B16D6B444015B034A3B5C552C0121C235423694440EFEEF8426FC652C003726C16556544408E632A2557C852C0C0C3F415E862444062CFBC69E6CA52C082ABE7F22C63444084358CAA64CC52C0944CEB94BE5F4440CFE9F12804CC52C0BC55A858A75C4440D64C828924CD52C0EB4071DDD05744403C077CA6C7CB52C067FBF2C0BB554440E34A6BE85ECD52C0A49E4E624B534440A423C806ABCC52C0EE585CA52D514440EF3B5926D3CC52C01F2818E8AF4E44408DD3638462CC52C0F1E048EDB84A4440390F6D04A5CC52C03088132F0C4944404A5D1C82AACB52C0548BA4314547444063850D3CF8C752C05FC9D9534B484440391481361BC552C013B88B39CE4544400490D35313C452C01BA7E43DB04244404700E1D27CC452C05C7E3B87663A4440FA50B750ADC352C050DCBC2DC8354440C2F09F6C5CC152C0D9D565925E3344408F0973CA07C052C044FF17B24D344440363BF20643BE52C058B85FF3C43344400BA239E3CFBC52C0429C7D7C382C44407E1BED20AEBB52C0F04E9B1EB92A44402F5D2A1FF4BA52C0039BFE413228444043F3E6B95CB852C018D9900459264440494A98D4EFB552C07F09054DCD1F444056096DE748AF52C0C6DAE9B6BF164440940F91456EAE52C05AD14E7B1C13444095B76E48C3AF52C0D43958FCEA0F444066D64FB40EB552C097A0CC5CDE0E444076F4F59ACDB752C02E85D8C1FD0944406432C96732BD52C084CC81046D074440C709826CF1BE52C0662F12885C044440A48E9758ECC252C073BB9F2CFA0044400BB68FDC5AC452C0F5D11A4F21FE4340F5B489DF69C552C007E3FDCFE4FC43407453D4041AC752C052F9773004FD43401AEE9C8AF3C852C0BCC7AF915BFA4340F8D01E0C6BC952C07403FA92A5F7434081937D09B1C852C04E0AF634CDF24340D0293E4B25C952C0A001B455D8F04340B097D4F5E0CB52C032399AD54EF0434071266EC6CECF52C080E43815DAEC43409D4688483DD052C0D5C82C953AEC4340870340C123D652C075DE06319CEC4340EDE06EF2E8DA52C0457B2D1445E64340E7D18A4014DE52C0A9DBC84ECCE9434085AC632257E552C07D785E0589EB43404E46E43337E952C033FCD9A04DEB43401467362077EC52C02EB7E6BF04E943408DEF9CC7B7EF52C0D3C416E330E34340346A436898F152C0179A4725BEDC434006D21D4BA1F252C0DA8544A4A7DC4340670B3B08E90853C0E39C390272DC43402EBBF377EB0E53C0BCBDC4B265DC4340B79ADF2A782453C09483E9A731DC434046B02C6A973253C073C7F11E52DC43409CF094C5CB3F53C0DC8B5A2D46DC43408196AAB2254E53C05FE682383FDC4340353A3B45B95D53C070B5495E2BDC4340EC391066735E53C0CB3E0F9D1CDC4340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('40',NULL,'RI','RHODE ISLAND','N','958','0106000020E6100000030000000103000000010000001E000000CDCFBF8A92F251C04DB3B99FF7CC4440CF04440BBAF251C0EA8C8C1F25D24440813661AB72F251C0715CD57F5DDC4440D3A766AC0FF351C069BEB1138C00454086A72DE6D5DF51C0C883E1372F014540C451FAB43BD851C051097A5BC1014540ECDB135479D851C080B5377E58FD4440C43F3EB092D851C0934DA764B8F144409ED5AD4751D551C0C4791026B1F244405FFC5468EBD551C01E6929A719F04440C5F1DC2569D551C0C05DDCC8CFED4440B77868651CD651C0ED4CF2AB15E84440F8BAA142BFD551C00A7E8C0E68E444404ACABCDD6FD451C02B4F7850D7E244403D126F7110D151C0E5A9B494F7DF44400539868BA7CE51C0876775B795DA4440D2434E152DD251C01886D375FBD64440ECA5B54683D751C06D9D2890E4DE44404F58C76C30D951C07FB8B68D6DE1444090AAD7E69DD751C065CB727105DA4440360CA8F0D4DA51C07B4CB1B07BD34440AC41C82F59DB51C0DFB33CD64BBE44407EC674535ADF51C0885935DA2FB2444091910C9439EE51C0A07FD9CBE3A9444035F9C5A877F751C0BE193A8450A9444004A771E641F651C00FD9CF04A5A944405403F3458FF551C0DAC5A264C5AB44404A94FACA24F651C016267381B1B34440DABEFB2560F351C0F011DEE239B54440CDCFBF8A92F251C04DB3B99FF7CC44400103000000010000000500000090ED0548B9CC51C07BE06219D9D64440D2E0B6A009C951C0F4BBE4FCDFD34440E7B1391A7FC751C0E878AAA71CBF444045B64AC5CBCC51C0263222054EBB444090ED0548B9CC51C07BE06219D9D6444001030000000100000006000000C96E75123AD151C086C672B885CF4440084B856A0BCE51C0DEBBFDB95CD14440DA31166C46CF51C0C2ACDBE0C7BC4440039C8AB56ED251C039501E3DE7BD4440A3FA2C9E5ED651C0CE63ACDD11B94440C96E75123AD151C086C672B885CF4440');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('41',NULL,'SC','SOUTH CAROLINA','N','959','0106000020E610000002000000010300000001000000F300000089BD232E9D7054C0533B913E02994040A25AE5AE457154C0E9F8B877609B404062239BCFE87154C0C0AA4CB6D29B404069E530D14C7354C01476EB579D9A404087BFB691E37354C066754511FC9C4040A173BC54A77654C0168179092B9F40408DCC2A138E7554C0F38F30C55BA14040A349DEF2BF7554C0867A37C1FBA24040B733EF91E67454C0E9562F837CA24040C4574DF3157754C0E4A8EC1807A640409C7B6F51C47554C0959E0AD777A740409CC3F812657754C0FEAE0FD367A84040FF6042B41E7854C0FD45B67446A74040D1E686D42E7954C019F22E0BE9AA4040452723B65F7A54C012D9116B85AA4040BD5D9295547A54C01260D245BCAC4040D33C8717F37B54C037B77E23DBAC4040F6027EF77B7C54C0C430EE5A46B04040357AF275407B54C02726B71C33B04040E3DE2D762E7C54C00461D3B13EB4404023E58CD3777A54C0996709322DB54040B9F64974587B54C0E9D6808AD3B7404095C4CB32AA7A54C0D4F6AF46C5B94040BF0B39B4ED7B54C007685A5F4ABC4040BCD11E58C77E54C04ADFCD75D0BE4040D4D89C39C77F54C0C490D06E9FC24040B54EC1FB498154C0D869742CF5C440401A82AB7D778254C007EB7AAB14C6404093B24320348454C012F4F56774C94040F0569D25738754C0FC19E3A321CC4040EB2CC207E58854C0FAEDFE2305CC4040011CB04AB28A54C0AA85605FBFCE404024CB76CD4C8C54C03CD698FCD9CF4040257E0B90B58D54C0AE94384F22D740401EBF5792088F54C095FFB00B5DD840400051D8B6099154C0B559FFF77BE140406770557C8D9354C031B5C3CF2DE44040C40AC05DE99354C07DA847AAE6E64040A82199E37B9654C0BC73661FEEEA4040DBFC46C5679754C0C401025E02EB4040F340B688FF9854C02331827754ED404044D59D6C2B9B54C0084C12D31CEE404032B8D970399D54C0032808AC69F04040BBD0AF591FA154C03C6E95FB2BF74040AAB89B41E7A454C080296FF1C9FA4040AABE2C01B6A454C07C343F0F05FC4040BE525F2227A654C03C141EC1B70141408A999BA196A654C05C2395F96E044140C960F54243AA54C06BF8869CDE0D414061E12C0817AF54C04CF883E1BB154140EE4822A786AF54C08A988E944F1A41406105E28783B054C0A33D162ADF1D4140F3204229E8B054C07E35CF80F62341406E458B8C1AB254C03F79459E2F2541408C391BD3BFB354C0E86D24D7812B4140D0F2713988B554C0B16AA9717E2F4140F5E9EE9C05B654C0077CE68BD23441407770C8038EB754C0AF8075C4903A4140D6FFDE6BECB954C01F0DAC9F2E3D4140D0F29B7AD8BE54C0A81886DBFD3C414014FA063F82C054C01E9AF21A443C4140C9D5F70885C354C024B09256BA3E4140DF4101AF0EC554C061985CB06D424140D3C8C274EBC654C0F762CE6B7B44414068F8E79ACAC854C0309662E3AF4841400B2FED3E2CCA54C01C314DA0D54941406A3D3B608DCA54C09A0CC0FAA94C41400BE9ABCC2ACF54C0392D5652814E41406F3DB31721D354C0B2A51065DB544140CF3E961EBFD554C0E60D13A2BE564140DE403AA071D654C0287165BAD55A414067EBECDF6BD654C09D6C9DD61A5D41404D0B1CFBB2D454C083DD54304960414084E265F6A6D454C07058016CC464414037D33E5160D354C0DA37EEA81B6741403450F78B49D154C099FA828654684140E741F52823D154C0B251EEE26B6B414002F0DCE606D054C04ACEF1A17B6B4140F509CD0505D054C0A0408F40D26C414052A2CE8215CF54C0ADCD089F626E41400B2D14828ECF54C0808B34FC647041400A113441E6CE54C0E699555DD96F4140ABB60F1E0BCE54C02DAD66BBD0714140377D805C06CD54C02A7EBF7C2C714140439762D7A8CB54C00CB708189074414032F5B57322CA54C0E75CE2967575414081C815F2EBC954C01C1638F454774140444F3BD0CDC854C029D65CD419774140272EB96D0AC854C099575BD26B784140BE85B80C3DC754C0F3F347F3D27741402B97C9EC25C854C0C74F10EF287A4140AAA9940BC5C754C0F959708DFE7A41405F5E7A0B65C754C0AEB6F52E337A4140769A65C76DC654C0F065C107F97D4140449D8446CBC654C068C32C040C8041405BD0F01675C054C07195F9091C834140CEF5A7B8CDB854C0ECFBF5BE1987414032620F5C5BB154C0F9E50CE6F28A4140F5E1560F9FAC54C0FC45E456B18B4140EE81294D06AC54C0A4750396888C41400D4AF6C9E5AB54C0FA4FABF28F8F4140BA4838C6E0A954C0C29503344E8F41409EFFB5D878A454C084017F5526934140D8E5111391A154C03913B078CC934140F1067A8BDC9D54C032A2F11639964140694E5B48049C54C03CDD11F3B7954140F55FA7C2EC9854C0A4E0806DAB9A4140F676BB00C29754C012A6074B67974140413E809F099754C088A378A96E974140BFE095DE719654C0D83A3948AD984140F8F923DB849454C009E2AB4497974140D3750077CD9154C0CDE5B6BEF9984140685A8FCF708D54C0A55B9D1FBC984140CCDEF754297E54C0B964107E1D984140261DA3E7B47754C040CC3756749741400D0C2ABAF87054C00884D74E5F9741405F89D8AE2A5754C0BC52D9BFDC94414024695BE6A55454C0B4DA1C68FA944140A2BB1C70244354C0AED38D036A9341400ACB9D30204354C01ABBF666EA9041409ACC83B1CE4154C0A48CC5B1828D4140B629E0B12E4454C07BB4AD2D878841400350DD338A4254C0C4769FBBC7844140A1D165AA5D3B54C091FA4880FA8C4140F90F5BA83F3954C00D31842CAA874140969D92E3C13554C078E95AFD46804140C3927EB9443254C0DA2ACDBE6B784140BB3346D6303354C0B81DC9357B684140027839E9EC2354C0EBC95F5C5E684140104507DFCD1454C0347CAD304F68414011DB12F7DCFA53C0B7A373F86E674140739D7824E3EB53C06E4E9BC317674140458804C1B4EA53C0B191A84681664140096EB9DB2ADD53C090F8232B2F514140D3AB743A9ADC53C0046F74AC424F4140CB3BD7A2C0C453C0F0CFC1AB012741402B57C8F1F2A953C0DC8AC3C073F94040509B36C415A553C0ACB70AC5EAF040404D879F8BD8A753C0E8BD9985CFEE4040210C24E57FA553C07E16B08640ED4040189B185EB6B653C05825AEC1B1DB404026E740650BC053C011D8BEEA4BC940409724A944BCC753C02907D1C023B74040C1F2A20E9CC953C0AE6B4FDB9BA84040B7BFAE8F1ECA53C0FD1DEADBD4AB40406B545E8A55D153C0DE24485605A6404092CC011FECCC53C018F57A1A839740407B37F426B1CE53C0D6427EDC1C924040A6BDF20052D653C0180A62DED6934040293269B60FD353C00F26C37DC991404094C97B956CD253C0DF89F9BF668D404095C7B89347DA53C02B195A6EC6814040891DD25845E553C0D01BBAB50C8240405C27F1C180E753C0207A8B5C907D404020612CFD9BE553C010E0BAE569764040B4004202D6E653C0C312116B1A7340402DDE0F0526F053C0DF99FC82A9654040925AD13F14FA53C0CF7F74E73565404088C000E730F353C0E05260CC087740402F8BCE990EFA53C0D032977B006E404034A6FF3789FB53C0BECCD73205754040AF19FE5C93FD53C067493EB5C373404033E5CDC4ABFC53C0461E1B45C867404024846DE010F953C0733FA7B1F45D40408608E6815EF953C04E8541BEB55640402ADD0A95C8FF53C0FBDD3D708A4D404027CA88CB7D0D54C0AB1BC389E247404062DA93139A1254C05CE32B62854040408D65B919381654C0C115D2C187414040B21770FD031954C043A50233E4534040A18BAD9F9F1A54C04EB3950FA7554040D8BF645F961954C088ED5386A2404040AD3020E8C31E54C0DE72FCE755414040F70FC4AA392354C021BA085967474040A005200B7D2254C0B2CAB04943414040F56F9FCD5E2954C0AFCAC9A76A424040DD7EBC0D302954C002BEB18FCD3F4040EEF79ECD1B1F54C0E7DB01062C374040A83D10CC561C54C0C8291519CF2F4040393BAF11771D54C0B1C32EAFCA2840404AF526D8102854C062A9A8D0EB224040AECEDF96642B54C0EFC23AB090244040AD4FE5537C2F54C0B59E11731B2E4040055A9412293354C034C49859953C4040433225F1393254C073F3D98BA5404040B7A4DC32273554C05CACCE8315424040D7C458D47F3754C0570AB1592F444040A3297075993454C0E67721794A3340401B4549B8F43154C012FD8185C21F4040D0728D82253954C0DF6636EBB90840400366EA48B64654C0E05F55417F0D4040A5F83C899F4754C0A4CCD8F90D0F404019283789574754C073C62D5C65184040EA8270CB734954C09FDD21ACBA1C404004E129AB7B4954C0AD294EBEFC2040401E4CDB67F04754C09BBD9816692340406C17E7E2704854C03A76D93C932A40405B44CBA1144954C0E4CB07959A2C404046CA0723144A54C030124BD85B2B4040974B0EC0764B54C00FE5AD87962F40408097277E684B54C0AC96A2A083314040983B4A9ACB4C54C00442EBEECC35404029D9ED747D4C54C0EBE6EFB9763B404076D4818D1E4F54C02C4F607AA3424040434680AC265154C0D06C63D057444040ED2EA32B8E5154C08B762025044740405669E68B225354C0620A5ADC9C484040B5905F2DC95554C052CAAA552249404049C04ECD7E5654C0B1769D0EB14A40400EAF0B0E785754C090B7974D7E4A40406034BFED705754C06012CB8A4F4B4040CEF73F4EA25854C070DC4BE5454C404010CED8EE5F5A54C0EC33F2F4135040405400790D915954C0CAF4A4EA4D53404025FF016D0F5A54C0C828ECD9E55740402B3A900DEA5A54C041C442F2CC594040501BC98B165A54C07E342781F35E40403196B60C135B54C078FA49DCF95F404093A656ECA05A54C070761E7ADC604040EBD2B70E895B54C01EC441AEA06440404A2BEFEEEE5A54C0AABBEB859D674040F895EB2F8A5B54C012FD62C1FF6840404B8CEF2F225B54C03FCF787D776A40406DF2DD50AB5B54C0D4A01639BC6B40408EE266F2235D54C0576AAF161B6C4040562957B3585D54C0DF73550C8A6F4040CF6197D4EC5E54C01C7D09C923704040F7BA5D14C35D54C0EA3FE7C1E8724040B523DBF4875E54C0E34C85A1E37240401B6BCDB7A76054C056EF878D3E7940407192DB37A16054C02A0B782A4B7A4040C64EFD96DD5F54C0839C2EA9D67A4040AF8DC4F7885F54C071EBF2B89D804040168E8D588F6054C0B80B7536A3814040591978FAE46154C0922A766D9F8540400118CEDB0C6354C0F70BCC6D978540405AD6F89CD76354C01CFE8FC8C8874040F43E0800226654C0F0B5FDA50F8940405EA85D011A6754C08A229A803F8B4040ED9B3AE9126D54C09BEACA75BC8F40403F97834C626F54C043FCEC6E85924040EDE957AEDB7054C017732126BD95404089BD232E9D7054C0533B913E0299404001030000000100000005000000BC6E7DB7233154C0CA792E621B214040DAE1BD76052E54C0CC12BE9AD72240402A4A83D8A92A54C0A88491AB2C1C4040D2FF03DE6E3454C07684F8BF660D4040BC6E7DB7233154C0CA792E621B214040');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('42',NULL,'SD','SOUTH DAKOTA','P','960','0106000020E610000001000000010300000001000000910000002EB980E474B259C00C63AE1B667F4540F6CB724260C059C0A3207CD4EA7F45407162CFFB17E059C0E75B06BED27F4540D15E13C398035AC05EA8BB5864804540229D7A3CC9035AC0F028DB4254BD4540C28FA0DCB4035AC0A8AFC5A479C04540E62AAB82CE035AC0BCBAD80A2CED4540B81987A3D2035AC0CE49A368AA124640E5E93404E8035AC0C8D6000D46174640B985EA46CE035AC0D6F0FC6284494640D4AE2975D4035AC0844E1AB7A87F46409F213CB2C1025AC071A86117B87F4640FF8D2776CE025AC08BF3F9803F9B4640DCFAC0482B035AC0534C40DF07F146409735164821035AC016F26504B4F846403BB3CA2DABBF59C06253287A76F846400201A3C491BC59C04AD5717C88F84640D8D36D772D8059C0B8353304A4F846407B6E610AEC2059C0025146A25EF84640E02C35D50CF858C08ED29428C6F846400E020FFEE8ED58C0DBB4C564ACF846401F6CE5F26FC058C0CCF0445B43F84640D96E7E7ABFAE58C0DD68D34319F846409B430A01F18058C0681138533BF746400E0CD560A37E58C06CA2552E25F74640962ABA8CEE4E58C068BFFD51DFF74640A1152771482458C05C3A45EE90F7464018D03F0FA12558C08CE0F673AFE846402B771DF1B12658C0437BC73375E74640D1FCF0B4122A58C089C57C9696DE46402489F3864C3558C029A069B549D3464045094B27B83658C07CBB77B6F7CD4640594AF423F53558C0A4586178C3CA46403A7685543B3158C0374B7FBF3CC24640030FEDEB3B2F58C0DFAC8724A6BA46402A3A55E25C2C58C035FC49CA8FB44640461160B4B92658C056608F4FC1B24640F8EA0248152258C0C6BD9E5404B04640428458DE901E58C04CE32B980CAA464019F0E95A491D58C015238BB940A646408251DD78161D58C0F38B989A39A3464013036F69301D58C0B5AAA0536A7C46404BAFB047221D58C025C18E8E92664640E39642DD3A1D58C0132964CD7C504640A9DA9E75201D58C08333CB6DE84446401C3E3700461D58C078E531D87A1946401A54F0F8381D58C075AE8692A3EC4540AF441B17781D58C0821E83C6F6BF45401C75CDCC4A2658C02A270C0EFBBF4540D61378E95C2558C0F5F27992AFBD45402C00D906B42558C0454D18BFBFB74540716BF57FB12358C0AC26B6074BB345403588257A9A2158C06064284B2EB1454063C4E117772158C0AE27BD12B1AD4540722D9B96982258C06B76106061A7454046E1CC7A102558C0146C372521A545400B3B8FB7862458C0BCB24C0CBEA14540762956F5CF2358C0BACC9FEE6AA045404156F694492458C00D4FC351AC9E4540CE706932C02358C07431E7D4DC9C4540F1926F062F1F58C095E68773E49B4540B3CA3C82471E58C03C1F0934C39A4540455BB475E51C58C0A315A4E22A904540FB5D7FD37D1D58C0DAEDE96A3F8B454000AF8EF2921D58C0E8765AADAC8945407A091354B11E58C00B3021D1EB874540F48F89D9472158C063A4D3D59786454015E285F1EF1F58C01180CFDB8A814540D32431F3182158C02FB35942447E4540999C36B2F42058C0DA0AF2A7E779454041536636D52258C0DD368E92F9744540CC510295662258C04F3D75D4CD724540BE17C6F6982358C017595B605F6C454073CE3819AE2458C0CF9C53E5CB6A454059B0AFFB9B2558C02A3B38C7ED6A4540CE63B3BC742658C03737C2EF57664540B446EFC0822858C0374B4F596F634540BD453861012958C0E376C83FD25F4540F5D9673E192858C07098E35DAB5A454054A0D4D5082458C09AD2D6D59155454076B6FC72A22258C02500C5B2C95445406E3DA16FD22058C096D06DD09B5045406439D58D431F58C05550D5304D4A4540B99B1D6F0F2058C02C3DE9117549454003ED3B4E511F58C0E0B68C113248454016592E4EBC1E58C0113C4E5331424540A2B6100B1F1C58C02A9ACF719F3E454049577830A91F58C0F5D51CD5853E454057EC6C94052358C07FF8B9B89F424540B320F8976C2558C069226B3C574245409B03DFF9BF2658C0B165671EED404540AF86755C462858C0FEE069A0E7424540294F873DBF2858C07FF6AB607E464540A1846D27B32D58C07702B8E95F4E454058CFF307C72D58C08BA919AA9A4F45402D4FF845742C58C09F808AA7115245400043FA66BD2C58C0E464510830544540E3B67B0A402E58C09206AE6B94554540D7A18F73283358C0E9B25830C35545401F902C35DE3358C034EF6E3036574540F3DCF955D93358C04CB45C701F5A4540D615C080203A58C04376A04FA85D454031760D27213E58C07A19AD8F4E5C45406D8DEF67953E58C0EEF54D6F185D454021A63387143E58C0DA3534AE43604540EC7761A8B13E58C071FEAD6C1061454060507A0CF84058C0D8169FAC386145408AF1C29B594858C0644FDFEB0F634540F8AC14C0544A58C062091E2939664540A6BC91A68E4D58C0668CF4680268454001497F485D4E58C02B4E4886AC6B454022B1FD6A904F58C075D4C0A5086D4540C2C56A8F5F5158C0B211C147CD6C4540F3AC7536EE5358C0E682DF884E6E45403CBED063EA5858C0633D9C0C086F45403DC969CF435D58C088FC0752DB6C4540ADEAE413EC5E58C09AFCCC52B76D454072B81177646058C01A0DDEF3186E45400078F798856458C09A28C8F58A6C454075CA625BA36858C0A539B6953E6E45400537595CE36B58C054BD97791D6B4540AB06467E6A6E58C0FFC0FC37D36D4540E2A2CA806B7158C01362C2194F6C454069051083027358C0838C2B99BF6C45406A7F8AA5647458C0548ACA56EC6E4540742FB4CBDF7858C02B90CE178B6D45407EFF41CBF47858C0ABA8F81B676A4540CAB0F88D7C7B58C00343AAE26A654540A5EFE6F0AA7D58C02F98294608634540B213C173B07F58C07CA1BCE726624540C162F0F81E8258C0938BE6E4746245400B9282E5CB8758C08E122558786745405562D025E18758C0F8D34A16FD6845405AC4BD88458958C07A632B52FB6A4540FA70D1ABBD8A58C0EB792110776B4540E7A8839ADC9358C09F18BAA6DE704540117B6A7F099958C0E1CF3303C775454056C356C3469D58C094303EE2F4774540201F2885D99F58C0F7ED869BF27E4540AFCB861241D058C01A372A9E067F45407A0D8D3C19E258C07EF900D5047F4540E59D505CAE0C59C0F540B833DC7E4540843846C8D44E59C09286B9DE507E4540861EFF818C8559C0BF80209EB47E45402EB980E474B259C00C63AE1B667F4540');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('43',NULL,'TN','TENNESSEE','P','961','0106000020E610000001000000010300000001000000FA00000008A48F4B18FD54C019CC8E464FBA4140B9DEC6BACD0055C0872875BC2FB44140FF1257DD650055C0A7EE6E9EBCAF41401F565306DD0155C012E697DAA5A9414049F9E929F80155C0FD842F1B74A54140BE78916DBB0255C0D93C1979E6A2414007D166F87F0655C08DB057ED709F4140E90F0D447F0B55C0894A3B5DDB9E4140D89BA58A740E55C0A691F0D27EA1414006F7AD149F1255C098BB95ABF59A414050EA75B4B81455C0D18B1C859A7E4140FEE8CC87982755C0ECB9FCAD8F7E4140B83BC5435A3155C0C4BDE521D17E4140AF2FE1073A3355C047C0C820157F4140E108255FF13D55C098D2EF3B107F414069FAB73F423E55C0FBCBE67B0E7F41404D05A447225155C08662D1759C7E41408F922752095755C083247E9AB77E4140EBED0E9EE95D55C00B310D60BC7E414018444C34F96655C010E302B3BD7E41404ABC9CFEA67755C0B174D974067F4140EF6DEF8C6C9355C0478B305C6B7F41404B3DFA0D099455C0AE33201C657F4140E8BAF36212B255C032452A2AA07F414044F2A6C956B555C0B739DF86C67F41400300352149CD55C0DADCB4D804814140D3EA8BC341CE55C0D2B084B8F0804140CDCDCF68E6E655C0DE1E6F97598141403252EDE71BFF55C0F1BAFE630D824140535187437A0C56C00E9CFDCDBB814140A5D423646A0C56C0C3D2C7EF91804140381A09B5821656C0D7619F937D804140E5F3E477851856C0DB17A533A58041404282A9263E3256C0AD9D26476880414032A886CA003456C018A08DE84F804140FC769185654056C05906E8B00780414012BF383DAE4C56C02A528EF51C804140781D4670E95556C09AA6549BF97F41402AC7CE37616956C0F0ED250718804140999FCEC0E76D56C0F27395CAE77F414037472D778C9356C062E390D81980414055E03696AE9256C0C23097EF368641407DA1D70C888C56C00807712F3F85414058509ACAD38A56C0FC942446F9894140140E4D8B6B8B56C023E99120EB8D41402233134A888A56C00FD6181C9A904140B50EFA67348956C08B935FF97C91414070590F22508556C0006427980490414015A706E0228456C0929BF072E092414029C54C5F008456C07795916F60954140BF660880B28456C0C36BF7EB90984140539A285F6B8456C08E1003E83D9B4140E457C4C0C58556C08CE6560193A0414084CC7C42C98656C0E4DB08A0C8A141400ED713E8BD8956C03D94C181CFA1414053DAFBA9DE8A56C0100FB4FE2DA44140C68451A80D8A56C038ED61D935A7414005C627E2CF8656C042676B764AA84140EE6CFFA0528656C00BE720303FAC41406FD9BA01C48656C0932B9C4CDBAE41408FA12A1F958556C0B0B43309D8B04140E38F9D1DD68456C0257935E40BB441405147BBBE748556C0F8CC20028DB5414096732D82308756C0E5E2E2A279B541407E77D9E47B8856C0395D12052FB44140ECB3CE05FA8856C071922F6A0AB1414023A36809BF8A56C0F587A40A32B141401390B5A90E8B56C0460E14233FB6414051E121A5CA8856C09CEF6B5EA7B8414096B75500888656C061C02898A0BC41409DD2B3BD448556C051C1909638BD414062E9E8BCCB8456C0BCC8F07778BC4140A91043DDBC8456C0ABCA9A809AB6414074848D5BDD8356C018D0CA62EDB441402240B3F9FF8256C0441BA16166B5414010564D53FA7F56C024DE435B07B941408A2D4798AE8256C05E5E9D4F9AC14140F45441989F8256C084BFF4A97EC54140B8EE66F71E8256C03F24E427B8C641402C8D77D1567F56C0C1E23EA6E7C7414095D2114E977D56C0AD0096CB24C441402083200CA67C56C02C43872C74C34140BBED3ACA997B56C0D1C4FC8BC0C34140EDE0E3E8FD7A56C08B4E58E9E7C54140E1EB81CD517D56C0F8377A0312CA4140D60E96AD417D56C05BFC131F35CD4140F0CF3363297856C06706DBBA13D1414041A669814A7756C00A68EE1B9ED041401E7C779F5A7656C01DCA833999D241403D6E8280DE7656C0C553F8F4E7D5414052999381607756C03B6AB67431D64140FC0B46E52E7956C02782CD76F9D34140C814214A827B56C0BA1B627292D641408BB8F48CEF7C56C035CF784B35DB4140A3BAEF2CDF7C56C0AE60B907FFDD4140B70154473B7A56C032DA8805A1E0414026D17180097756C00A1F7948C7DF41403741389CEF7456C097C1FC8711E14140C8F189F8327356C0273E2A461CE341401A64B1F7967256C014514DE11EE74140417F8ED3A17056C07431E9C0A3E841406ABAC5F01A6F56C0C567AF824FE7414071FC30ADDB6C56C06E17E27EEEE941400D826CADE56C56C09E42045DCAEB4140B19DF4B37F7056C08B4363188DEF414073CF22F50B7156C0004B1DB62CF14140F9FEE4D4D47056C09F751334CDF2414083D708523C6F56C06729B89121F5414089D567AFBE6D56C04D6C1512ACF44140F0DBE8E98A6A56C083AB3D555FF14140F6273508906956C0EBBC86737AF24140EA7316884F6956C0FA93ABD0F9F44140365F396A836A56C0281BF1EC0CF841402075C34FA56D56C029EE68E9B2FB4140788A1E91326E56C00EB55E64FEFF41404FF4FB4D176C56C0F888119F4F0342400A5E4F6E686B56C0B406F314A10A42403AA283CDB76A56C02E55FDB1B80C42407AE7E164BA6556C09FFE8F4C9F104240F6C84BE5BA6556C0472704A977134240F8B178C9976756C01C8BE223871742400C05B4D1516B56C0D40EFB9C471C424060348CF4866C56C0717A1099D41E42404B6F8DB4746C56C0DD1A5537482042409FC47431EC6A56C040D11297A220424006D39DEA8F6756C011E647FAD71E42407678E0A0AB6256C0C4574EB8F020424017F44BE0446256C0343D4B97DE21424080BC4941B56256C096E9FA93F523424081566D89D66656C04F3A8DED6F27424074369D2BDD6756C0F0142548DC2A4240A39391E9C46656C0D8A539A46A2D42408AAB1542DB6256C0E2223CC7422C4240331219FF3D6156C041160746912D42403A1BB9FF486156C08CBC24FD573342409891D982E56256C0E1D9077573384240FDE3F5BF076156C0F4716A4F663C4240F42A1F22216256C002F53D0AC43F4240196BB11B755E56C0478A6E6BD23F424030143EFD7D5F56C0CF5C2F51963B4240A8B6AA5A235E56C0C3A48015173942400B713CB8B55C56C0AF93B9B36C3A4240BA43E6D48B5A56C0FDE28ACB57404240B98A60CD2F5656C001990C8D5540424078B1B4D2243556C032D3F33CFB3F4240F1F84F12E33456C0429A8DFCFC3F42401F3121D0E23356C03670ACBBE03F4240E1C87AC4CF2056C08D847825F13F42403AE22DE2BE1F56C0757F6E44C53F4240E8B2C4A2BC0256C0C61A0B9E8F3F4240793AA6BE3E0256C03A6831BCE34442407D71793CA10256C0FF5AB19B964A4240EE071BDA900456C06B1532DCFF564240D3EA6ABCB9F755C05890AAA8AF554240C3C2575BA0F655C0478C00681D52424066352AC562EC55C07B89B09A7E524240012C727F00E955C048C63878965242408BAFAADF2ED655C0D7B054851B534240227F658536C755C066A49F0D5E53424006BB82205DC455C0176C54C84D534240D3CCE87250B155C06E0AED097853424094A18DC9AEA055C0A24C9578D95342407CB8EFA0969A55C0DA049ABE515342403FBE2F4BBC8C55C02FF66659575242404F2E5753C27E55C05A8BC9D509514240FCBCB23E457255C0E84A063937504240B6D422F2FD5B55C05082F524214F4240C7842BC0345355C05028251324504240D818969C705155C046892536145042401FC8E5C9E63F55C0C224CF5B7C4F42402006F4ACA03255C0763709017F4D4240B1CDA82B0A3255C004E99022734D42401079B30A6F1055C0C99DCE49394C4240480B898A491055C0CA5716CA374C4240148817896E0055C0B475E88AC94B424082D645DEE0FB54C0BEB2F86AAF4B4240B3761CDA84EC54C0F90453AFC84A424006E59C1836EB54C000E12D54A24C42408F64319DB5DD54C0FDFA14CBA64C4240B30F731D9AD154C0EAB1081EDC4C424046208198E5CF54C087740B01834B42408093F9D17FCD54C00F8B8985464B42400B47000C26BF54C0253C6961AF4B4240CDAB7B7E63B654C09CC01C3EA74B4240C50805FC17A754C097B9B8C3B74B42404B7BD3B8FF9254C0CFFA1E22C04B4240229F4BC7DD8D54C0B32601900A4C424031484D1BDE8954C09499D7E22D4C42404E3486B4797B54C043036B1C484C42403709DD54C57A54C060F290BB8A4E4240114CC3A90C7554C0422A11CA484E4240EEB7CFD3BE6954C0760C5541C84D424031D9CD93DE6A54C0FDDDCB827D4B4240EC2F24EFF76C54C06423A8AC7D424240A67C34EAAD6C54C0D84CE837673C4240695B6E096B6F54C066795F092A324240B47207A75F6F54C05C918571552E4240869A6201656D54C035063A9BBB2A42400E9164A3BD6E54C08B4638FB2B2A4240E701BE71257554C0F4CAA609DA2A4240661FEFB94D7A54C0E76705673B2542401530097BB57B54C0EFF98B8AB8214240C75041834C8154C08D1E49699E1042402307006FF78454C0C1DFC653D50C42403423BF178C8754C0FFCE9F02560C4240BD4E5F83D98954C0CFA768ECE211424097A2E610498D54C075D55D13D5124240B3B1803AC79054C0559D1D236C0F4240234EA643F49354C057A00F3CA60F4240E9C6ACEBEA9754C09988B2B6A50C4240D763B44E219A54C0DE965494A7094240A911064E679E54C0DA2CA9F123FF41406440AF4F6FA054C0FB9020CE7FFC41409DCD72D274A354C0FCDFAD4865FA41400A59C3B758A654C019035AE150FB4140B9C64A3DC3A654C02CA798BD7700424019DB2CDFE4A554C021AF2F1EE302424026E9E743ACA654C09F652B1B840542401A9F5BA82FA854C08EA94D17F8064240A894954933A954C0A8669355A20642407EDB018CD6B054C0182CFD87F4FF4140395E536C80B154C0197735E769FE41405811AA09AFB154C089BA566774FA4140547F560ABFB354C0EED18A83E2F541407D3E68F3CAB654C07815A39D48F9414098B7B87855B954C0236ED23867F94140C2F9E3F87DBA54C0B60258B6C7F641403D9FCF3107BA54C04C2BD216A8EF4140DA0DF18F9BBD54C040E38EAE5EE5414013ADEEF028BF54C0D7FF866A15E3414093CEF93BD4C354C05992F4C02EE441403EA499418EC754C0EF8148B9C7E14140CBEC02A52FC954C0615936D6A2E14140FF8339A7DACB54C089FBC3534FDD4140B548D52E99CF54C0B9750EAEF1DB4140A9F2200F34D054C092F868EFB3D94140101BBF6F93D054C09CC5962F76D84140137AAB3517D354C03B79ECAD05D44140D1FF9E1EF2D554C092830E27A1D34140C7C4CD26C4D854C032112A430AD041400C9655B552DD54C05B9067BA76CC4140D04E1E1F5DE054C03C4DDC75A2C74140A9E71928E6E354C009982C0C13C741404DEBC8B047E754C046A941C131C94140E0ED449A0EEB54C01A2CE4F653C841409AD1024BA6F154C066005CA4BEC64140ECF1C05320F554C0A9A7667C73C241409C06B85B64F854C06F9514B35DC141407FB92D023CFA54C032F3B80E00BD414008A48F4B18FD54C019CC8E464FBA4140');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('44','TX-TCEQ ACR','TX','TEXAS','F','962','0106000020E610000006000000010300000001000000170300004402E9C2ED7F5AC0FE05B641D9643F4063DD6278A68D5AC0531EB95B6E7A3F40F49E3A988C985AC0F91A7F15DFBB3F4003D50E6987A25AC064B24F4D4BC93F40535686F05BA75AC0DA7455985DD13F401F5B14926EA75AC089B569EA40D83F407B3B6D9738A95AC00758062F2CE53F40B5FAAD578FA85AC050D02B8602EA3F405FF0F69A7CA85AC0F93F6168E3F83F40CC48189D9AA95AC07A20B1E3F6FA3F4006038A7BE9A75AC07D238CAD23004040EE55547F37985AC0E3EBBA7A180040401D1C101735805AC01BC3885436004040DC89DF0A073B5AC0E2D1A2978F004040786C33E677365AC0C82123FD6A0040400B085D293C015AC01E472299F2004040A43FD8E1CEFE59C0CB58421BC500404017622A37AFEE59C0BEB2D51BCC004040C1B45A7D48D559C05191B64B8C004040809B2D0DBDC359C08D3C4C48420040407E9F359D8FC359C0FA6BA41BE50A40407B959D56D7C359C0C92F1765FD414040AFB8B53C28C359C0F881DBD6107A404081689B2AC2C259C099D8F3C75CB0404024FC63A87AC259C06AECA08C6DC8404024085AE820C259C053CB6F51C0E94040E8188CB7E5C159C0BC9042A966274140D0687B3673C159C05D658610675F4140B84886B79DC159C054E126E87D7B4140D9A1ED75ACC159C0981A19A3B09641409BE4FC436DC159C041D38BB2D3CF4140C921C07A72C159C09771E09404DF4140D63480008AC159C067C0E9082D0742402B8D2E11BFC159C01B14297BEC3E4240BCD50A6BD5BF59C063337BFC053F4240C89C5F659A8A59C0BFE81CFEBF3E42401DADBDD7378259C09FFBFCFF193F4240A6E97575BA6759C0F662DEE2FA3E4240D633B93CC44559C0C829356E783E42400D92E814453D59C05BAA8B72AC3E4240079D5391302359C0E4885840A73E424032D4EC28770059C026670D88383F424003522F68190059C0DFFDD4080C3F4240021726EBD7FF58C0A09F68275F074240BF85BA3FE1FF58C099006B9621F14140CE43326E060059C02B0544AE36CF4140B11342E0A9FF58C05892D4045AB6414095D2AD30D8FF58C0492BCD7A53974140751278EBC5FF58C0C5EAD17AF9834140E5CBFADFF3FF58C029F7ABABA55F41402B7F3540C6FF58C0B4DEA232FC4741407D928A1C3DFE58C0EDE1BD36ED474140BDD5A1D87CFC58C099758177314A4140A07BB196AAFB58C0C159265A224A41407955C2EE61F858C0106D33CA2C464140361FF9CA19F758C0DF905C95644241400C98BBC523F558C0237D507F3C4041400E784DBDCBF158C042240C19D73841409E07A993DBEB58C07126029952304140F975102D84E658C05FCBC3652F2F41408968354C7AE558C067138583453141404C1F628C01E558C0E500BCBD593441401131D48A78E358C0E2E82B1F27354140F08CD20629E058C039DDA008BB3341405210AD23B5DE58C063211CD0193141404023515E14DC58C0DA9AA338B12E4140614384BB42DA58C01C3C6F79412F4140F3EF04DB3FD958C065862013CB324140F779567C29D958C0692F1FCAEB3641400D2F321A55D758C007394D86A2394140E88B14D4B6D458C0CC61F333D6344140E899714D1FD158C0BF3C179CFD3241406D324F2A49D058C0D0013345242F414097D3FDA12CCD58C069471073812A41405D7C9C1F96CC58C022BA85FB102741403BA018FE1DCD58C077346DC8BB2041406F386EBA36CC58C09AD7632FA61C41401D82FFF74BCB58C0871F66923D1B41406BFABC1136C858C07E24BF98CC194140A8A089CC0AC558C0D6B7FD5BAE1A414029EE06C746C258C0A41FAE2179194140B7BD2563C7BF58C08A3D72A3D31A41401990769BFBBC58C09D3C6D68EA184140A5694E7011B958C065D92EB2981441403CC3C623EEB358C0091B5CFAB0124140FA46881ED9B158C04DB1F21EE71041409D323B1429AD58C02EB26E43BE104140BA3DACF1AEAB58C051AC1B2136134140B2A9E92E5FAA58C0B87B9122D51241406E264ACA15A858C02A02E6A14A144140B27E5CA7E2A658C0E5763C0464134140FB85BE22E8A458C0D1DDECC62D12414035BF5ADEB4A358C0C23B06AE7E0D4140A478F193FD9F58C02037205783084140EEF1198BB49C58C0759F8BD9F8064140BD7454A7FC9A58C010CEC337700841405F2577E5139A58C0DF1E05F5900A414073DCF2C20A9958C0F3EF52742D0B4140487DA9029D9858C0BD89A4EFD40E41401CEF4A5D729658C09671E60A34124140F4140B38889458C01E225A8BDB114140AB331DB0BF9158C054DAA44EBD0F414056C8AC1F158B58C098D4BA71C70E41405CB6F999C78858C07B45862DBB114140936590365F8758C0B7C4750B15134140392261530B8658C05363F02E3C11414065A29CB61A8758C0553984FBF2084140F0367F93898558C084EA4C49B1004140A46E2F6F938358C053822EEDB4FE404069AE6F0A868158C02CE41DAE58FE404043F1A164E97E58C08EB3A94C2D004140D4D72EA1D57C58C0FEB4B13252FC4040799E2421AD7C58C0D30BA154DCFA40409B8D61E3A67D58C04E694D9670F940402D132C22DD7C58C0473567F95FF7404067F909067E7E58C0C9E75F5CC1F44040B5083F26827E58C0F1A5EC7D88F34040FCECC9831F7D58C0CCCA692119F14040FB811E3E337A58C099D3B443E3EF404063007619AF7758C03EC694A777ED4040AF771A37957658C05D593AC7B7ED4040D4C599CE977258C09E0A12C3FDF14040C4379B496D7058C053FD583D52F740407EDB3A46AD6E58C08AB990FD3DF840408EDFA6A2176D58C0AFBDEED95EFC404049D906BEF76A58C0040489188EFE404001F617556E6658C0C69246BF19FC404021905D15EE6558C0E08EF28880F54040E6E6BCB3DC6458C0783AEF6C89F340404C4E0051836358C0A1E3166EB6F340407322492C2F6158C0FBBFBC0D5CF540407FCCCCC7945E58C0E798A11033F4404002FA36C6A25D58C054C3A59184F34040C798F265455D58C065D637F4FCF1404081EBE886FE5C58C0CF66E45E0CEB4040057D2F42445A58C0D660F16110E94040732C6C7C455758C039E2EF5F62EA40400F1963F9E45558C0E05FE29956EE4040F97A44162D5458C03FFDE7576CEF40406425E3D51E5458C0C9B6C232AEF240400A295ED1715158C0078CBBD7B3EF4040B7C26FB0E85058C068B44B3AEEED40403690ED0E105058C05B3D9FD7C0EF4040E8F1844EC44F58C05AEF70B379F24040E64B914A8B4D58C0287E11F1F0F340405459B127094C58C01518CF721CF340408CC4D684864A58C0A4D8FBF97EEE40407E764605CF4A58C015051ADD87EC404059FA40E87F4C58C0CD9F4A9F0AEB4040ED51C2E9594D58C0C71C6CA2EDE8404067F03807204C58C009A8E12F5EE0404079D17FE2C64958C00C35837548DD4040F9E4C31D6A4758C0038148D6EEDC4040C1359D7ACF4558C089495AD5AADD40403702E8395C4558C02BC031D30ADF40408865331BA14558C0633FDFE561E74040514BF856384358C07D7311236AE94040EF1D73BA064558C022CCCABF40EB4040FE50101B474558C0023F643DF4EC4040FF36CB598E4458C01B9A3B9CACED4040CCA24E14A84158C07401A7DF9AEB4040507C3A92644058C0B175DFFDE0EC404026D906503B3F58C08AC8B0F831F04040306171D13D3F58C08F6DA5EADEF840403A202D6EFB3D58C09C16106CFDF7404058856C69EF3B58C0C972C36956F9404053CAE0A8823B58C0873409A71EFB4040DF05A3E3843958C043A16EC99DF9404023C1B840853858C027C99D4E5CF640403DF0E61E453858C0CA1696562AF14040225C687B1F3758C07E41F8DA4EEE4040368096D8083658C0B6FC6A5BD7ED40409C063F141F3458C09C87597899EF40408FC89551103358C08745BBD85DEF4040D060B848F12F58C0C15AE1BF79EA4040B085E0A3902D58C07B05A89DBFEA40408CF836E2642C58C099B5497A8BEC4040A54BB802642B58C0E9D6EC2EC4F3404098A5A221A82A58C0F7F0694CF2F44040E10142B76C2558C009E3412CB8F24040C9F0EBF8522758C0B2DF13D476EE4040130F51767E2658C0BEF25C57E9EB40407F3E5870FE2358C0A3D159B9AAE94040F38712A9B12058C03F9A41B96BE8404070C90BA6102058C071B6417EE3E440403FEEC583351F58C0FC41491F9DE3404061C1D0DCDC1A58C042D8B139EBE4404033E1DDD3BF1758C01239A49FC8DE40405DE5052F431658C0590FBF2452DA404049F31C2B421458C024E29E03D8D94040AC13216A441358C0BFB4506069DB4040ECA01C6C8E1258C010B103578AE140408B31AA4BD01158C00521EEB301E340402D3BFCA19E0D58C0CDE91C94DEE04040B62F7F7EFC0B58C0C815D1921CE140402AC8D41CD20A58C09E902E907DE2404083553C3E570A58C0143300AB2FE640406D24593D110958C017CBFD8603E94040E90E60DFE70958C0BB8CE6467AE94040E9A5A141950B58C0B105120A7EE74040F759A4A2BC0B58C0B037D0286FE84040353BD581D80A58C0741E39661FEA404008F6B6DF8C0958C070D3BFE4F7EA4040D008D759050758C0B801FA6428EA40405E52BCB8DF0558C0B5702D621EEC404078CBCD32160358C0D9B7C441B2EB404063886A71BA0158C0E53E7D5F95ED4040DDD880AEEA0058C03DE4C84012EC40401D40158E210058C0FBD518BFB4ED40406031E80F2F0058C0FF4BA57CCEEF404001C9D64EA5FF57C007A21E9D0FF040400CDBE0C991FE57C09D6D34A0D4ED4040EE395C8760FD57C0275CC9E0BCEE404040EDE5665FFC57C0FEB18DDFEDF140400CA32EA5BBFB57C034F66A2000F2404092E1A91032F657C0FEF0F36AAAEB404081E818CDE0F457C02FC64B8CEBEB4040A5C88C29EDF257C0B4E205EDB0EE40404846A16333F157C045D2570FFEEC404050BC3385EDF057C0CEB2918E86F040404D3FCC45B3F057C093314A8E5FF24040D32646A4D0EF57C0878346CFA5F34040578218FCCBEC57C0BE7500F68CF24040F2FFA5138FE857C0980DE85DC9F54040780B5B103FE757C0BD7B62C0CDF540407E9CCD515DE757C03115ABDFE8F74040341EDED0CDE657C01983FA80EAF8404054A8676908E457C098C1B5A6D4F740402C70E7C4FAE257C0A3589DC9BAF34040E8B9BBA044E157C0BA18334D10F4404004755BE1B9E157C09F92660CEFF2404076396C040EE357C086B3BA6956F240401C046063D5E257C00EDB5B6A63F1404057FC4CFFD6E057C0D0A64D6EECF240400099481CF1DF57C0DE817C90DFF040407149EE99F9DD57C0BC487B127AF14040800BA5F7EADC57C0CB617174D4EE4040CC61A02D23D557C0D4582FBE7DEF40407E1FBB8F88D557C009EC231CD8F24040B4D51D0C57D357C0E4D3255F80F14040D2F3FEAA58D257C060553B8089F14040EBFFE8EBC3D157C0E79F4D7F82F540407AAE9CE9E2D057C0F17B7FA1EEF24040FDBFE30814D057C0365BF341DBF3404099F0B1EA18D057C0FCB691DFE0F740406743374AFECE57C06C7D371E84FB40403E6AB6BE81C957C0AB64F4A2C9F84040BDDE1F5C34C857C001D87BE371F84040E1EF1B3B1FC857C02F38BD8468F540409EC2FB19A5C757C060BC4825C9F440400BDD79171EC657C00A319905FFF54040ABF2D29547C557C069F9D16593F540403EE02396C1C557C02109A0A6D1F2404045A62D755DC557C04030F1A6BCF140408207B0B313C457C0FEF46F0679F5404055930C330EC457C045AD0967CAF24040490C5CF0C1C257C0415DBC0739F14040421832CF67C257C0E4042E68EBEE4040AD85B2ECD4C057C0B675CFE85DEF40407E78020954BF57C072C9E7E99AED4040C2DF99E502BE57C036A591AAE3EE404013E0A8C372BD57C059BA894B91EC4040606AD0BF2ABC57C0F9556EACA3EB404095CA4C1F33BC57C00EF75DEC6FE84040FD4F3EFBC7BA57C06AA63EAD7CE8404012B9193929BA57C079FCA9EDDBE6404051839E9980BA57C0F5A2580D15E54040521AFB5270B857C0AFCA8C8E35E34040021EAF0DEBB657C085DD204FEDDF404040441EA670B457C0A6E66C10F0DF4040F2CAFF826BB357C0C802EB31AEDE40407087987F28B257C0C7E3B2716EE04040415CD2BBEBB057C041AF2AB260E0404054ACFB3E10B257C0AB8F233206DF4040F2314BBF22B257C096034253ECDD4040D101E6B8FFAF57C0B69B3DF44FDE40401A0277DBD3B057C09F54E795C3DB404036674B3882AF57C0022AB3570DDC404094A4F4D94CB057C01BF4E5D69BDA4040D24A64B87AAF57C0C0AA96B9C6D940402509B6933CAC57C0138EA7045FD84040E1F5A471CBAA57C07C5158C82BD940405E1267D0F6A957C04560F9AAA0D84040BE1F440F40A957C0D94478EEC0D6404015D73A31C3AA57C0C1A8890AF6D540404DB27751DBAA57C007EBBA2A45D5404045B033F028AA57C0B5E8E30CF9D4404099875CEEE4A857C01C5B41B0C9D540402B5407CE71A857C0F3096CB08DD74040C1A1A14A79A657C05806405736D540407B0C90C975A557C0F87E9F99ECD640402714B8A809A557C0EEFD0CBBD5D54040CA26FA46E6A357C04C2D9CFE04D64040E37C27C72FA457C0B07D4A5EE1D440407DB0EDA876A557C03034737AC4D440405ED82789ABA557C024F7817AE9D3404059D6BB27E8A457C04E7C059D7DD340408B93FF84EBA257C04F2DFFC1B3D44040475C3064B2A257C05CB11983FDD240404E43E965FEA357C09394E5FF4BD24040ACE09DA5FDA357C077CB5B005DD140407FDC6EC439A357C08308CCE2FFD04040247268212AA157C01683BEE751D240407DC839E19DA157C0C45BC16781CF404081861A60B0A057C015989F29C2D04040E79EAE5E0DA057C0D9B2FACBC3CF40407FE9061C829E57C04F42D30EE8D04040E9993357E99B57C0A62814D47AD14040EDD45036F09B57C08CA80B95F8CE4040ACC36D97E99C57C0C19BBF135FCD4040048704D6629C57C0404D66155ECC4040E52E47546F9B57C0F279D6F772CC4040EB444F90089A57C0E01ECDDC6BC94040DF16B30E319957C0CC93941E9CC940407DA0D3AD469857C0729940FFF5CB40405BD3B3ACBB9757C09420C7608ACB404017DCFB2BD79757C0BD33D8E150C940409CA9684E4F9957C03AB945DFBBC740405F7D9ACABD9757C01D173A641EC640400A74C3860D9557C08FA7CC6860C94040DD54B7825D9357C0A6A8468E4DC740401A175F23239357C04A85558C3CCA4040FA0A5B21DE9157C003BB762E73CB4040C47F49006D9157C0660FE84FD8CA40406E79845F959157C0801829F2EAC7404025D3EC1B328F57C09D353C73D8CB4040F4645979498E57C070941CD5FCCA4040EBC0387A138F57C068DA4557E4C740404ED63C56828D57C070E0361970C7404052DEAC96278D57C00104FED5E7CA40408B6A15B0388A57C09718CAB704CC4040E1BE2E6EF18957C092A6A63B9AC84040F778E145548657C020C17FFE5BC94040934F53E48E8557C0CF10C9FDC2CA4040559740A0F18357C040EA4120E6C9404008EE8EBB4F8257C03B1331252CC7404094C59A27598257C013A689339EA24040C47C86DB7D8257C03A676281FF824040752CB79CAC8257C0B1176C47F5704040051128A1958257C086E22D60F458404085F2E64B448257C0DD75F13DD7314040B08DE1B33C8257C0B87539CB8C1940407793C4A0418257C0579F8C4CA3FE3F40C3BCDB1DA58057C015E782CE42FD3F403AA8B81D4B8057C05F09D95365FA3F404C34EBBB8D7E57C09A926F7E42F23F4048B4D45B177E57C04F414F875FEC3F40F22A8818E67B57C045D7DB28DDE83F40675CC056C27A57C052F7BC45EDE83F40EDB2D5171D7B57C0359A9F0E8CE43F407B981F95907957C021ED810906E53F4018D7EA34227957C001A06BB4C7DE3F40B8DDBEB3697857C09F32AD7120DF3F40442EE6732A7857C09B63121BACD93F409A0241535C7757C081C383E843D13F408582ECAF687557C0F937A72B5CCD3F40422BF3CE9F7457C0690518D659C63F40B81D86D0347557C034E87841E2C03F4076FFA1EDD97357C023C7A6AA03BB3F409832072E2B7457C00B8B56F567B63F4030F42AEDC57357C06586CF562EB53F40A576328BB77257C082C0CD5229B63F402813D94CF87357C0B39A8BC8BBAC3F4041E4E58B9F7357C064880BB368A73F401AA6B68C277457C026058697ECA53F407CF3CB2C777457C0EFE1BBC7469E3F403FD1D82E7D7557C0954E0A8B889D3F405C5A0EAE4C7557C0744728D721973F40F5E9C7AB417457C002578E1CC9933F4011039C8AE27357C09B9010662A8F3F4001CB02A6F07157C0FB5ABB90AE883F40F499B703DD7057C031504330E9873F4050EAD5C1DA6F57C001BC6F8BB3893F4073D3627FD66E57C0697D9070A5853F40E772F8BB2E6D57C08C7DCBAB4F853F40668401FD066E57C092CA0B7CDE7E3F40695EFD200A7057C0E82E82E5A07D3F408530FA60177057C00B260D88557C3F40C887D09C866E57C04E059EF0AB753F40510CF2D8B56C57C06A786DE92D763F40DAA5EC58EF6C57C05FD21D5349723F40AD2A93D6FA6B57C0DD92683435703F40B8DF7957906C57C029395BFB8B6D3F40F2B7BBB6746C57C077806CC1856A3F4019CA5ED5026C57C090BF310504683F40C8DDC731826A57C0857003C504663F406FA86FF0516A57C07AE18A32615F3F402B92EF6CA46857C08E6AB40CBF5F3F404346ED90576B57C0A5C1742D1D543F407340D810A26B57C020E0ABD617503F40F9593AEC006A57C01A22A8606F493F40146ED44A546957C0C6C0ECBC5A4A3F40313D1968626857C0EA7F7AA32A463F406CA33DE6766757C044BBEF3FA7463F4091E841E52B6757C0F9606F022D453F404B5311841D6757C01A36D9310C3E3F40EFE1CA60CE6557C0EE54E4F5D83A3F40E7C04E21996657C062D47C4A02333F40B4F57DFF056657C09302F8D32D2E3F401E7AD47CEF6457C050D217B51D2C3F40C49AF7B93F6357C01E372505ED303F40461E9AB6DC6157C08719D5239B2F3F4069A31116BC6157C0F09FD2A7A22D3F406B338157616257C0ED2D2EEB302D3F4043DAD0F5D26157C00BADB5F0C2293F40A66F02D8D66257C0787E8676CB283F4011331556696257C0630BC903F4213F40ADCC9E14CF6157C04EB99C0549203F40EBFD30B5416257C08FE5064DC31D3F4052D61078A36357C0EC5786550A1C3F40F0C22198D96357C0146AE03AC9193F409F8FB355C56257C0436F881A4E183F401BCD6775D56257C051A9B7E122153F40DC7F7C51196157C02E742D202A133F40793D1B92A86157C0B8A33CCCA20E3F408763300F796057C0D7FAF471020A3F40A5499BD3066357C01C83F769AB033F40E078EBD52A6457C03CCECA6BAC043F409B4F1E365B6457C0FB0F60AF5B033F40C78619968B6457C0AEBA87D959FF3E4058C2E974E96357C02B928C19ECFD3E403DAA91F6A56457C05A203583F3F93E40F749D753206357C04C360D206BF83E400CEC9C92666257C0FA4D972303F53E40834DC031126257C0B46B2240FFF53E4047D68991A66157C09B5D6BAA9EEF3E405AE43B12EE6157C02FA6E8CE5AED3E401DA47ED42F6357C009DB8814D2EC3E4069439EF4FC6257C093202DDDD0E73E400F7BBA36236457C00CCF9DE2F1E63E40F9934717656457C09A51032AEDE23E40E7B99DB6E76357C03C23756F40DF3E40E5C7F2F5636357C03863A57248DC3E405154A877436457C02C8F3E9C68D83E4062179B76926357C0F3376DBBB0D73E4002E43536416357C01E82D0601BD43E40BEAEFC39406557C043D382925FCD3E40F57AB45A766557C0B976D200BBC53E40CB47CE9D976757C07AB32930F9BE3E40204C739BE66657C0C15B9D2D72BB3E40C0BFAFBC8C6757C0681F816F95BB3E409694229A346757C02539D34DE5B53E40827877B8896757C0284C546EDFAF3E40CE998F1B406A57C036818DB64DAC3E40485673BA666B57C08D79681AD0A33E403CD10CFC5A6C57C093EC10FEE6A33E402B71A719D36B57C0DAD47EFBA59F3E401528C9F9576C57C08AED35FEB19D3E405E6E3316FE6A57C0674AEEB818993E405B1679D8636C57C0987EAB7D5A993E40A69DE979F36D57C0CC9ED6C36B963E4098434A98F46D57C089FC86C47F913E405F1C0D18126F57C087082849B48B3E4071E6EA12296D57C0DA9A7641E7853E4057C05072BF6D57C0B9C5C2645C813E406239B1D0466D57C09F2DB9E3167F3E404FCFA5F0C26D57C022A9DB07247D3E40901C996CAE6C57C07667F84762783E40B12E39AC076D57C0D8569E8B74763E40FAE8FF68976C57C009F0B3AE5D713E40B8F3886A306E57C04A2CE717E56E3E4023ACFEE9886F57C0A0591102B6683E40CDAD7EC8537057C0C05D814BCA613E406377C645DF6F57C028AD510D1C5E3E408CA020C69B7057C044AD6EB2B65A3E402CB88D24997057C0D52D2DD550573E40C1C02E5CB76E57C0C631A2791C4E3E40273E3797C26C57C00149CD162F4C3E40023CB412486D57C0931E4709553D3E40FC0ACFB3C26D57C0059D219173383E4008E2DCF2166D57C00074CF805A2E3E40E4E6A5B1906C57C08FAC58C2062D3E40EFDE65F2C96C57C01649C80CA9263E40BFA01C50BB6B57C0EAA9A32C00263E40086F8370E96B57C044C31ED036243E4099FF5632B96C57C042FC841035243E40FDB47C129D6C57C0E99FAD593E1E3E4014DA10D4586D57C076070E5B6D1D3E40BEE83A55D36D57C023E44D838B183E4017971BF59B6D57C007471D118C0F3E405D7F92DCA97057C04E333AC794013E4089372F69E07657C0F3B0B273A9FD3D40BF9F5BE6D07657C04E48881DFEF63D401C5DA887EC7C57C064CA06668ED13D40D84797B0727557C03D302E2ABFAC3D402830EF7C328457C0DA26CCB89EAC3D4023BF7012DC9657C053211C9C648F3D40A9362CF4239857C0AEAA74E35C8D3D407BC03D8EB1AB57C00F073B27E26E3D403356105412B157C01E611B063E5D3D40AF7A59B744B257C01B58FBBA2C623D4094F9AFAFA7AB57C02D02FA11B0793D40490C1327AAA457C0867E163B85883D40F7A54B2018A057C0E92369898B843D401BC8893D149E57C02389762E988E3D4017944C41B4A057C0DD9815D99D8B3D405ABD9B432BA257C02110E9F1E08D3D40A04CC5E622A457C0ECFD5D4148943D40A264703D73B257C0BD2333EBED893D4096E2883639AD57C0447F9A4DA3A83D401D843398D4AC57C03566F9F939C13D40C095125D19AF57C07BF2D9A70FCB3D4094BCC06818B557C0095469AC94C23D40F9D3DE8ECAB857C0AA45C93D34AB3D40AC0E5CD5B2BB57C0FE20C621B4AE3D40C1B29688A9C557C06BDA2768E0CD3D40871E364499C257C0624B4CED38B63D403FC6699D54BF57C0438764CD0FAE3D400EC603BFEAC057C02F17C6083B8F3D400324D8AE53BA57C0D50F13F524803D408E3769B7E9BE57C0F9AB3B46F4753D401667D0D169BC57C03EF2708604773D40BA86DA30F9BC57C0EF6B19DBA96C3D40AD55192B79BA57C079082EC09B6B3D40988F2B4DB3BA57C0BDF1DDB0B3723D4057D2DEA60BB957C055B77E6C49663D40E9211CFB31B457C059E02EC0045F3D405CC7A32611B957C0B3616C6FE1643D4070D0670389B957C032093F5C1B4F3D40055747ABE2BC57C0A7726E107F533D407D74ABB842C457C006C930B634323D40BB95046749CA57C089085AFD44333D40B87A112A8FCA57C0B998927F271E3D40BE3882AFA4CC57C001E0D3C6FF1A3D407ACBF45BE9CF57C0BBC05AFF87FA3C4036760136B7E157C06D129DF5B1CD3C404E39409ABAEB57C0146829B42ABA3C40C9E560B7FAEA57C0894A07C0C0C03C400B53B58857F257C05BDE99CA37BD3C40F47E0CCF00FC57C0712EA510D3B03C409B0AA77335FD57C0DE6D2C23799F3C4049F72BDEF3EC57C08EC4769F20B83C400BBE2DAC3C0D58C0BA64150D197D3C40AC8074177BFF57C009A3A8FEC0983C40445B0CB3F9FE57C0133F305645A73C405BC2DDAA380F58C0C8B57C1954923C40E93CD249500F58C0AAC66587EE983C405DC1F302180A58C0730AB0708B9C3C40C5563EA8670F58C065733EED97A23C40857C51FAAE0958C062D30CE74FC33C407F818043980D58C0C41DA683DEAF3C404EBAA06B511258C0E867118178A93C40C75600E8511158C02AD67F5D91B53C408831E2D0E31458C0DDA6E07A65A23C40FFC12375521758C0369BF3EA459E3C40089227F6161958C030BF896DA7AB3C409B6E9394261958C06B8E82AAEEB93C40441D9F78591B58C09DEAC63958B63C404BF5C699CB1C58C06CB15DA35BC13C40013DBD39AE1B58C036B28DA390B23C40E0A2D455D51958C01574F96F42B83C401099FA79D11A58C0652B9B6591A33C408619B5960A1858C01C2F1BB1409C3C4017DB8A03741F58C07D60AC00A68E3C4041E9377DFE1B58C0E04C5C62E6983C40B87539BD181D58C096AC6820FDA73C40A8D0D201F21E58C0870FCD272C993C40325D8904C72058C094C3D1C3C39B3C405FB46563C42058C004509E4B5AA63C40C923688A852458C025EA4954F4A23C40244FF028882458C044C366552EB13C4097380246A32458C09CC4440EF6CE3C40CC1DCF49E92458C01225BED5E2B03C405220934ADF2558C0AC2A41A8B6B73C40226EF0B0642958C029699CCBE3B63C40781090D3412A58C05DFB76BEE9AD3C40D1EA106FD82658C081055B7BB89F3C4065AA4A11142758C06D7210DE288F3C40377DDB0B492458C047CA5B360A933C4084FB6F44281F58C059BC64FEA9813C40AD00B48E0F2458C06F7654CE4B783C40D431E249332158C092A927140B763C40ECAACF23831E58C0D02A2181EE7F3C4068C85FBE051958C0C67399D9306F3C408FF31E21572A58C0F29872DE794E3C40A84226C4F72C58C086ACA4AC29573C4096FE2C820F2D58C06FA0652F6B653C40C22E1E066D2F58C0B23A6D6B5B673C4079456708643258C0CEC27624507A3C406429B7ADBE3458C0B172E1F32D733C404EB1C669783258C0110AA81450723C40251EB367993058C015F83CE743693C40DACB45CAA33158C0E35E425154643C406C9176F2A33658C0D8DA3449C0673C405F0700AD763258C07EB879054E5A3C40C02C2F8E563258C0DA41AF192A503C408B606450CA3258C092D96D4E8B453C400E469FEFCD3158C074864369C93A3C40F82022F2733358C040E3753334363C40AF1FC2FDDF3C58C0490E5873591D3C408680AB5C6E3A58C0FC5D6D2AD0413C4086242EC26F3E58C088E3378606363C40023D7CDE3E3C58C0EC11931BE32F3C40805AD17F6C3E58C0A5FA34B2861D3C4057E3E3232B4258C02CD581803F233C40FD32FB84864158C0C69DC1AE38333C4057CB5967744858C0ADE9B3AA76213C407CE81808AF4858C0612A24537F293C40E04B4AC9C44A58C09FDFFD56E5283C40FC86F2A7114A58C084C19336DE1D3C404346CBEAAC5058C0266CEDFDA4103C40C749D0C9744F58C05E0CEACA870C3C403F13A7EA505158C00DFA1DD9B6063C40BAD27589224F58C0AEA42FD1720A3C40262E54E5E44758C0D5A2E2A4F70D3C404465D002B54158C0E2023098A81B3C40170687608A4158C0E3AF729E41053C40274624615A4758C02FC0BD746AEA3B40B8FA17E2864C58C0B5125FAA01D03B40843505A5D34F58C02103508397D23B40E92D8EC3AB4D58C033F0F59AD7D43B400A28D607295258C07FA1BF3417DF3B400DAF26CB1F5758C0997A2A221BD73B404C92FE0A235658C07FE5F7689CDF3B4046F24431B25E58C0F1B248846FDA3B40A4E37412CE5F58C0A616B76F32E03B40323293F3676158C0953606562ADD3B40123520D2FC5F58C05B43D588F2D73B40502F85B0B95E58C05E2E1BDE11D23B4045F73F4CE25858C0CB947844ECD43B4058A95BAB655958C0EA4FF5D369C53B4032795F265B5458C049AA8FAD68B63B40776636C8625658C08054160534B73B404003FD857F5458C0C52F23BCE1B03B40017677E7A15658C0022BDFF61FA43B40D6CE9E2A915958C09DCF49F12CA23B40944BB6E6415658C0B890FF7EBAA13B407845CE85CE5358C0EBCBE3D14AB53B4093A4A601015058C099815BAB6BB03B40AD4A6D043B5558C0BAA336F208903B40D2846BDD665A58C0211977AA43523B4090193B850B6058C02AB8CCBAEA513B4030282EEF7F6058C039A4972685703B40DBDA1D69D56158C0EC302BEF2B583B4028D9A7AB6C6658C0CEE483A0EA4C3B40D03FBDB9057058C089D89D00846B3B404D6E9AB1896B58C0B2EE3101714B3B40752420BB3D7258C06F7B1802BD493B40F62A5A63196358C094BE2204043B3B40470751DA5B5B58C0D93CF2DDF4433B4075C33CB93D6058C0535C3557F5143B409B594233AC5E58C0D506CBC630FF3A40AAA26CBD676458C06DA9BD916AFA3A40539B9678BB6358C02F333FCFACD83A402503E6CDBB5F58C0F715B5454BCB3A40924E2FE1EC5C58C0737AD08EF0993A40B651337B455B58C0685AEEFCC0843A408AC13CE1655E58C0D725818E267A3A40164F3CFCF85A58C007BA2513AA623A40E33E0FF59C5758C01F5B8740025C3A402F689FB4A15658C03E50B127CC2E3A403E6F7B44375058C034E2C67C94113A40D089E968B35158C0474D3793AC003A4065C3F97DA74D58C0C443A9B169023A40CDA6A6D3094B58C03C87991E76F43940233E126CAC5358C0CF8578DA29F739407DD8BF09805358C075F9B5C263F039404F98CB55665858C04B62DC60D9EA3940727D2F91B25858C0E49BC53681D83940F861A899D05B58C04B36A37376D83940705E5C58C86558C0E2467BB1FFEE39400EF30318D06458C02F39F6095CF4394062C1B17D3E6758C02F324B275DF63940B0D702C57C6958C082902AD317063A405EA1A686887758C03AC796AB7C0F3A402178EC22958258C0B0EA1ACF4B0F3A4007DD0988E78458C00F1D879CF4083A40F965F808588558C08B96B2CDEC103A407EEB7DD9DC8C58C05E5E9E76440E3A400F1BB405B49258C0F11D849E34193A40599F5EA4629158C09E9E8A330A1F3A40480ED666B99258C053711DEC16223A40CF8ED2A9019558C068465415AC1C3A403AF5C12D3D9658C07392DB5CB6283A4085BCD2D1A09858C012A2EFBB08283A408E003A3D099D58C0B7A2E899A4383A40E0FF40C0489F58C038160C62AF333A405A34E6CB6AA658C01F93CEFAC3423A40DCD1F4F067AB58C09D7D273C0E3E3A40D206901D7DB458C03580AA1D1B603A407A75886230BA58C0B8DCF3F7545C3A408C0D2A0622BC58C0B1D99B6049653A40EFD58FAFD9C658C000A7228B7C6B3A40FAEB719383C658C0E7F4B1EA197D3A405A0F47B8D0CA58C0C54A7FB0CA8B3A40FDDC51D9A1CA58C01FBD415889943A403D6F39274BD258C0139E96D590DB3A4073F5E47003D958C07D0C9FE76AF23A40639C357227D958C0C8929BC8F0FE3A404F910BF824DD58C00920B1CD69073B40829B4197FFDB58C08999019812333B40AD67B33ACCDD58C0833EF9F12A453B40C298FB62CFE258C059FC24F6A6513B401F63BB7B69DF58C00B2B618CB57D3B402707C85FBBE158C09CAFD3232C813B406717761F2BE358C0DE820E4DE89C3B408DEFC993BFED58C086C898F16EA93B40472988403AF458C08925C7F4C7C73B402D6D560801F858C0433D7FE547CC3B40DD24B1D34CFC58C072538CA4B6FC3B40A9D4EDDA97FF58C036F45114F5003C40601D8E8C390659C08C3B86F290273C40322D8DFEB80D59C0D50F42CBC3333C400F7147E1520E59C08B51B8D5E13D3C40CDCF1ACC161359C069FEA4D9D6473C403BB7E56CC41259C0A575CBA614523C40F3C49CD6851659C056A9D67BFA643C407DD9D1BC221859C0356FFA0F9A7A3C40EBBBB459271659C0D22F6C4846803C4041AF3C63DF1A59C0F8D76B29618B3C40893A7061D31959C035EFA2B309973C40CC20F48EE31F59C09C6A1C4447A93C405872D7FFC42559C0D93C4EF3FBE43C40FC132F08722959C03E37353A2FEC3C4085243210D32A59C053E7D85F8F143D40AEC3E2E0363159C0D9336AE4B32A3D40B43D3EE7073359C0CDB476F7233E3D4057BF31869A4059C08A529D8C9C5F3D40361570D0554459C0F6278F6749793D4097E45185C15059C0C70CBA49D5863D403658FD68515059C0E9A5C8CB03A13D40DE7FE7CBCB5359C09D7D4B98C4943D40525F568E995359C0713799AC13A73D40A9A08D339A5759C036E3099649A83D408C281CBAA75A59C09130B651E2BE3D40D7D03EDAB45959C064317F0726C53D4015BA445DB95C59C0AF711A3FC3C23D40178E5280225E59C034E35309F5C93D4093BAC7A57A6259C0A184178762C33D403153EF88D66259C0BDE3794C71CF3D40E728F58A3D6559C00D608F3CEEC33D405E1B28D1F66859C05BB76875D5C13D402F3A0C819B7059C088021AEF90C93D4018802C078F7359C080D5EB29BBC73D403F7A9CAA727459C08979889777D03D40C3840C182D7B59C0D76A9351E8C93D40B4A1DF7F517E59C0E2F5ED1BA8D13D40DC6CB32C1F8459C03ED0B59CE6C83D400A34F4B7C89459C0DE8F3FF25BE13D406F0790FD8C9759C0B6AAF29771D83D4057D3605EA79859C07BDFA8F0A4C43D40424AB9B039A059C013F05A5720C93D40B1F931175AA359C0D96F2800ECBF3D4052E8135BECA459C05656F2F447C73D40416E64A3D5A859C0600C054287BB3D40F14BFB8850AB59C01318FE3A92BE3D4005EF54BF87B359C05CC3229DC4873D407CC8B721A6B459C09973F4C97B693D405699326C8AB859C08D5B79B8835A3D407097FD2F29BA59C05CAE24D6F7443D40A309A28776B759C0CB08BC8FAF3A3D40707FE33B44BF59C089CC10CEE9303D40E1BB85AFD9C959C077DAAFA498FA3C40F92F332317D159C09F3ACC25F6013D402206A7A2F8D159C0FE451AAD90FC3C409E1BDE8A80D559C080EA0784F00C3D40A1A586CD0ED859C0977F7BC445083D40707E58B95EDE59C004CBD3C184123D4081157965B5E159C06A638EDD97253D40CB60133F21EE59C010FC3964DA303D407416276561EF59C018AA9B32053B3D4081B2D78816F259C016E474EFE03A3D4076F4FCA92AF159C06657E3550C483D40BB9B7ECB65F259C04A85D31B78443D4009CD0063F3025AC0DD3F0B5A0C543D40AE08670C8D0A5AC01EB4FABDA1663D40BE091632220D5AC0A2C7D168F67B3D404CBFFC5C32185AC052D27DDF008D3D40A1485A6549225AC031FC8B11FDAD3D407E4D82A0FE245AC0FB6F7F1AE0CE3D40C4BB83C6302B5AC0FB9AE4A3D1E83D40E3F785469B2C5AC018D03FDDB50E3E402375FF24372B5AC059BD05C22C263E408FAD348CFF2C5AC07A21E49D173D3E404F5729DC1F345AC0979C6F25C2593E40DC27463BA5335AC0AB53AA9A68603E40B54618829F365AC034AE7C1375643E40639F5FEA08395AC0611A5F6C19923E40AF1FAEFB313F5AC049EBDB2E37A43E40C20E17DFDF3F5AC004094CBE39AF3E4074EAF067E8435AC0353A567A21B03E4072524F01C04D5AC08E30FDE1EDCF3E4019CCDF668E505AC001902E063CCC3E400448464B70525AC0D1B8239903D53E40383DED4D1D545AC0703BF19F0FD13E400DDEC23703595AC069D99D726CDA3E406525487B365A5AC0A1F129C013E73E400807226E83635AC010A4C65C98FF3E401737FC92A3665AC053B5D5B428163F40389B28C64B715AC04878FFAEC02B3F404402E9C2ED7F5AC0FE05B641D9643F4001030000000100000005000000E37CBEE278BA57C00B71B9D6FF413D405C2A70F31FB157C0B2B5D451BA573D40BAB41F10E9AF57C060A9699ED9513D40E3A12681C2C657C0C7FFD224E2183D40E37CBEE278BA57C00B71B9D6FF413D40010300000001000000080000003020B1027B1958C02E6E65E49B583C40183EBFD36E3558C0C3BCA4B90D113C40B9AACF71763358C0C1D584AF252C3C4063B5F58B4E2F58C06300640A0F2F3C40EA5663B2122258C0EFFDBE158B513C4005A29BCAA61D58C0771D6E507C533C4088D972430F1B58C062B164CF47643C403020B1027B1958C02E6E65E49B583C40010300000001000000090000005A1B9BBB2C3C58C00CAC8088D50B3C404FE2A717DA3758C018BE0BC9B6213C404A8B44B49C3558C07201D85F251A3C400F623C15A93658C036ABF9E5B80C3C40126BBA1B314358C0EEE304B15CD73B405070F29C944158C059A7309428EA3B406A04D61AC73C58C0DCDAD4581DFC3B40B6DA22FD493E58C0CC38FD4C4B003C405A1B9BBB2C3C58C00CAC8088D50B3C400103000000010000000D0000007E8CB715005758C08CBCC1E0B6483B40F757E0124C5858C0CD9FAA7EF5353B40B8074137165858C08604297EF3483B40830A5E3F7D5558C03CE9F96FEE703B40B482059EEE4F58C00EF7E2D9D9943B40750CECA0925058C09B397584EDA63B404D58DDDB0B4D58C0356994E0C49C3B40341F699DE84A58C00B3E117C30B53B401D64F3FBD54458C0DEA87EA9C3CF3B40A8861A5E404758C092E0F623CCD13B40E9C073FB714358C08B938FD9ADD43B401D59C6BB554E58C0D60B64DD06933B407E8CB715005758C08CBCC1E0B6483B400103000000010000001500000026073FEE495358C007FFB413F3993A402FA5DC18EE5658C08B73C9F8FCB43A4040835E006C5858C0FB81F21E1AD23A4006206906515958C0B7E9E82D1DEC3A403112EDCFAC5958C0F1A8D9CE8E1C3B40DEDE4F33E65858C029F5B9A1B4333B40C9E388323E5858C00D4C0B016C343B40CEF0DAADC75858C0E1F33C77FA183B40C2BD04066C5858C015E9FEE008F33A405BE1C51CEE5658C0DF0E676891CD3A409EFF6D2DF35258C0384714F4DB993A40A77ADC01DF4E58C0872E912D226B3A40264342DB7E4C58C08AB033B174423A40B72834D7024B58C05627CDD4FC133A400E7B53587E4B58C0ACA58AB780123A40D68027FD624D58C0F15DD3953A403A4085B46900804E58C0C560EB8B51593A4086BB4CA4185058C051AE034E6E6B3A406699B9C61E5158C0BD098B33B07A3A4055F38DE9D75158C069536A94518A3A4026073FEE495358C007FFB413F3993A40');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('45',NULL,'UT','UTAH','N','963','0106000020E610000001000000010300000001000000290000001B0E6D8506835CC0FE035B989E114340034A09C2E2825CC0BC7AB9A419494340B6F16147D5825CC0C8506956E9564340B020161691825CC02E5097A0F3C443400056B9D08C825CC078E4C5DD52F443408D5D6F5D70825CC01ABCECC6360E4440B90BFF1171825CC0C0A7C733B47F4440766C922A80825CC033CCEAF768FF4440FC213E34553F5CC0413ADD932500454003A3535B6A095CC0B689CA00E1FF4440BC7F3BD46E065CC0533AE7624B004540A4DB434DA7DF5BC00D7BFC9905004540BC87CDDB1DC35BC0BD512E9783FF4440B2A0E1B544C35BC09AC0FA500FCA4440517A90404EC35BC047DB971514A144403140D9F343C35BC06E454F0D907F444076071D3C0B845BC0CCC837ECBA7F44406F60B07A23805BC0A4F91A57B17F4440F62F859617435BC0DC4D47AACC7F4440A1891437F4425BC0324DD54028554440291856E547435BC0222B3409F21A444063EBC9015D435BC03718741B25D44340580682036D435BC0E6D94A6653C243403E5DCB694A435BC00D32F52234AE4340A53F5CE473435BC0EC1C98B8503F4340BDFF9F3A93435BC0540A3D8B591F4340299C541DC8425BC0F32ED9549313434008A5C9E4C3425BC016631EFB96F14240B517BA26EB425BC0528FF3BABED0424076244D4C1A435BC052D6EBED917F42409024DF1AD07F5BC03BFBC211FC7E424099557E6EF19C5BC0141A088BF17E4240E5EA5850FB9E5BC014A6C1A5808042409E2DF8305DAF5BC06792228751804240531C0464CBD65BC0BAB23F063880424018B9973B2F0F5CC0512C78496C7F424082FC53ACB8225CC08363A348BE7F4240EB4D405499395CC00934E35C847F4240907D1EE7CF825CC07529028E8E7F42405641475106835CC02B6D65F19ACC42401B0E6D8506835CC0FE035B989E114340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('46',NULL,'VT','VERMONT','P','964','0106000020E610000001000000010300000001000000820000005E68460D845052C05F21AAD97E5F45409C3E96CE3B5152C0F9328678AD5F4540313F0072F45252C03E61D0B4DA664540961BE7B0E45152C04164AF33266B4540809C1C12AA5152C0A748D58E5B7845407C7AC12B015052C049527B10CAA745400024DCCD414F52C00EFEA281A4C14540D9D91F93A35052C066762DD799C74540E192A256A65252C0932F53B39AC94540759A92F7075252C01A9F828FEDCB45404E36C19AD25252C05BF804C950CF4540D11D191C6D5352C0ACCD8CA7F6CF4540ACECBF9F465752C0E0773E48B8CE45407CFAFADCD65852C02D5529B3D9C8454020489EC0C55A52C0494F2DAF8ECA454067621FC6115B52C04A28D022E9D0454011C7524ABE5752C0688A6C906DDB45403DCC0BADD35652C0466F7DE7D6E0454059DA4DCFF95652C07BABE483A3E3454015721B949F5852C05574FC1DFAE6454010D78DFA015852C007DA7FB167F1454020234E00F15952C07119266A18F54540E34733C8B65A52C0AE15EC3C7DFE45402E0E25CA205A52C06586701855024640BB41946FE75B52C0C09BCDD0D805464072AF2691DA5B52C0D1327FCD2D0846404BA56112295A52C0A909A368A50D46405B2B01751A5A52C085685BE36F1146406EEAACB5735852C00F4F5B9F07164640F3C2D637265852C088125A7AC219464065949E748A5352C087BE7B574C214640A196843F1B5552C0422689A6062F464073FFF61E335352C04DC5A182E833464031E03CC0C55252C0CBC5E0BE673746400FAC5CAB675552C0733B408CAC454640DB261A8D425652C08B694C8AE8464640FD336A50C35752C04204BD24224A4640DE3E86D26F5852C0053EEFDB554F4640A40ADD51B05752C0198C8D59325146403F21DFD2E05752C0513D54B4A45446402E2301F2EB5652C0B3601251165746405F6391D4E15752C09F2B6BC7B35C4640DE6A1E11EA5452C069D089404F66464041441B959E5752C0E790F8DAD868464077B8CFB6775852C0348BE616896C4640C01F59D1875552C0AF97B7905F77464072173AD3725652C0C3C9424AB17D464039C130F30F5652C0B2E1BE27C98046402CDC4F22114C52C07B59221316814640012BFFD5052352C06C32B0F7AF804640BE90B537B8F951C0525B1B83F08046404055030558E051C0DEC53B82B5814640938ABE8C9EE251C0F2AE1106007D4640DC60272916E151C02A3F1409CB7846403F8F914868E051C0D746B36C28734640CA2AF573CEE451C04B955156736846403512851558E551C024DA09BABC634640AE76177B64E851C0C609BC60F05E4640CA2D5E35E4E651C00A4AE030C45646407E3BB211AEE551C06E6DDDD7465346407CD98C8E5AE451C04D0A99DB97514640849DEA6A76E351C03ED3B5065D4C4640E72EDFC75AE251C03F20796B1A4A4640F53ABE0DE8E551C0AE89C6D28D4646402B87F72CDAE551C0F5CC3ED6F9444640371D5ACAD0E451C040B4F8994D434640ACBE692A8BE551C005E6CA014D3F4640F56B116D4FE751C0E28D5CA5BC3C4640FD110850BDE851C04D02C084053D4640A4042B1174E951C0B3F70FE60D3C4640DABFE67002EA51C04D60D96B563846405B14DA1252EB51C0A2A13D8FEE3546409F84C67C0FF151C013AF50D1F932464007AFD5FE0DF351C076DBF2922C314640147E397F8EF451C06133FF98D82C4640EBA906A06DF551C06C96CDB90E2C46401CEC67476AFB51C0E7AB2EB9052B4640BF79A80717FC51C02549265BB3294640C7086CCCA4FF51C099654519ED29464080F94D8E450252C076023FDD53264640C06EE6EDCF0352C03FDA6CA378214640C104B14AD70252C0BD31BE28001E46402DE3D847CB0352C020FF369051174640CC7F60C4DC0252C0F8C1831406144640962385203C0252C05631519A740F4640104D37402B0352C000D96E9DDB0C4640AE0C179E130252C0C19CD1FD4C0C4640FF9A3AFD380252C00E701800AC0A4640F1B2E63DEC0452C001A9E4E71904464093F518FD730552C0E6F1A06B240146401ED0B3BE080752C077C32B0F9FFE45402FE4723E380752C089380D71FEFC45404F4BF69ADE0552C0087CE8739FFA4540F57E38BC3E0752C00E3AE89636F845407C4B781BC90752C040D2EF3B61F4454017E412BFE20A52C0F77FED5F80F04540E119D75BD40B52C0E269EECA9DE6454047A0AF9B300D52C0B5F0E48FDFE145400D88131C060E52C0C50D66B116E04540746E46C0A41052C09CF954501EDE4540ADF2E563751352C0CC894E6F69D94540479BA344511552C0A9012B7376CC45409AC4B765E71752C09646789243C94540EC7ABEA4471952C090D4BC343FC2454070761B237B1852C0047D6C5808BE4540738DC11F5C1952C0687D930280B445401E68AB7E601A52C04B58A0A645B04540C5C503BD721952C04FCCF4CAEDAC454078D4F53B411A52C0ADA8C54E65A94540E5D0063BC11952C0F9623B5158A74540A1FC08D9E01B52C04D91117CBA9D4540790E1E19F41C52C02715B188F8934540309AEDB7011C52C0786B91EFE18E4540AD45D0B7611C52C0169BF7F51D8A45400593AA588D1D52C0B7B1D5DBF3854540CAF60418421D52C093508403F37F4540A541CC384B1E52C081F0A845F27C45403A1DF7DA452052C04DD12147987B454025B9713C4B2152C014B3B967D079454093B5DF7C962152C06DE3B68AD07445401D42365F6B2352C07BF1558E296E4540CB9F8E9D7D2252C0C7CA44D26367454022DF1B1BD62052C0D2F5B273066545401398871A772052C0722204D56562454003D56138AD1E52C0D90A6AB67B614540C54EE936941D52C07E238978985F4540A3420A562B1D52C037347FBCE85C4540A445DE63123B52C0ECCEB1F5615E454008278CAF424152C029EB9451C55E45405E68460D845052C05F21AAD97E5F4540');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('47',NULL,'VA','VIRGINIA','P','965','0106000020E6100000030000000103000000010000006B010000B934255338C953C092B0F8D3E945424050ECDB1AE0CD53C0010055D26346424069125F9FA4E053C0CD5FE02A1E46424072FFC1A1E6ED53C069A006C725464240719BF94D860154C05C9DC7E6C7454240E7AA8031100354C08A8337060D464240CBBF088CD81B54C01D147D1A8D464240693A2405182754C009D4A7E1594742408A5E3306A13554C029ECF10223484240A46422B1CE3954C0FEE91A215D4842403B0C6976165654C033D148AE5749424031D9CD93DE6A54C0FDDDCB827D4B4240EEB7CFD3BE6954C0760C5541C84D4240114CC3A90C7554C0422A11CA484E42403709DD54C57A54C060F290BB8A4E42404E3486B4797B54C043036B1C484C424031484D1BDE8954C09499D7E22D4C4240229F4BC7DD8D54C0B32601900A4C42404B7BD3B8FF9254C0CFFA1E22C04B4240C50805FC17A754C097B9B8C3B74B4240CDAB7B7E63B654C09CC01C3EA74B42400B47000C26BF54C0253C6961AF4B42408093F9D17FCD54C00F8B8985464B424046208198E5CF54C087740B01834B4240B30F731D9AD154C0EAB1081EDC4C42408F64319DB5DD54C0FDFA14CBA64C424006E59C1836EB54C000E12D54A24C42402A47C23665E954C0BAB5081AF94E4240A59AD32EFAE154C07AB76368AB5442406526024474DD54C0BD1DC6EDB65442409AFA589ADDD954C0890EBFD20E564240052E40D8B1D854C0973FEB9417584240D71A078D91D454C0876E95F9D15A42400EED80B508CD54C07A22C840FC5D424097D2EA67DDC854C04C6F3E43BA5E424071292E05F6C754C0A551C14226604240BF5765C434C854C0285D7446BB634240416F145359C454C0E4C1F970ED6C4240640AD80DFCC254C06A87A5F2EC6D4240F2A02700DABC54C0032A8A1F9A6E4240A5E5CADA31B854C0951070926472424022B0859814B754C099EDE51851774240D7E06FB775B754C0B85ADE39BF7C424076B9E574FBB354C0DFD4C486B78042405727A56E4FAE54C0C3807DDC59844240AD4DBB6C15AE54C073B33B6370884240260C080B63AD54C07B500E67A9894240B8A08D0B2BAE54C0B5BA4C48EB8B4240517475AA05AE54C00367210C158E424088C9E27B5AA454C06143C256D2984240872F9BDA33A354C00D44433B85994240AE182905FA9954C06F4A261317A04240F8C7405AA59654C0416AD1B458A14240BD3D012C7E9254C0D62940B105A74240017048AE697D54C0654BC076FDC34240661CAC69DE7B54C01E64AABBD9C04240A7835AECAB7C54C0CD0ACD7B1BBF4240F6E022B27D7E54C04E84FCDACFBD4240EDB7C6B53E7F54C0EB9B231BB9BB42405C09044CED7A54C0F75585A22FB54240081FFB0F517B54C05D3C9FC494AF42406335DA096B7954C063C23E6898AB4240CF2994C1487754C03C8A628BA8A94240906C61A0F47654C0955BB1CC4CA742408326F75AB07554C0EE4A466F8BA442406A3B23342F7454C008E52BF1C7A34240E9E079EDBA7254C0ED54CA71C1A4424006EBA8601E7054C0DDF92555D9A2424036CE90DE426F54C0D0AB5A1710A04240E6280D1EE96C54C0053D9BBA229E4240BEB851DF9D6A54C06AAFFB7D3A9A42404C885F39A06354C0BE9B95C4699A4240258C35B35A6054C045CC87E7FF9D4240816277D0B65F54C0663F6E685DA0424019E2CF4D6C5E54C046C187E990A042406E392264D05954C0BA88390C2DA4424061BA4642055954C033FC88EBD3A742404954667EF65654C0DA13DACB62AB4240405B5FB9F55354C07382263198A5424003BEB28A444E54C040EF3259BF9E4240C56642D8014954C0C01B24BE30A3424013B3E47D984154C0C09772A79DA4424032884C96193F54C0D4DB76EA32A74240961FE353A03E54C0BADF47EBF2A542406ECEEEF0F13D54C0B119496C59A542400EABC7A9C93B54C09E5A794F93A64240E745AE5ABF3654C08E4216D671AB42408A933A7A4C3654C0707897B6EBAC42408C6C0FA4263854C0E0A5FBD3C0B14240FD2E79016F3654C0865B5AF633B64240B26523D52C3354C085CD893ADFB442401BF1FFD2263354C029BACFFA24B24240BD23060C483154C01E6681DD6EB1424011D3DDE8D43054C0F01B357E8AAF42407E603C26DA2F54C07D11BBBF85B042405A6BAFC6C32F54C0E362F35FA1B14240246A3203B42E54C01A0BB0A144B242400F7FF61C222D54C03F6D2765B6B142401419834A3D2654C09F34B24F18B94240E71F1381BC2254C071680E140FBC4240BB8A2B9A8F2054C04CF93957CEBC42400A42B673391F54C0CFF559DAF4BA4240F14291AF271F54C0C71E08BD88B74240C3BC808B621E54C06E430EFF1EB64240280D3464391B54C03B1A4F03ABB7424035140602DA1854C06BE8D1E39CBB42404C97FBBC891654C0A72DA4E5F0BC4240DF15469E3D1654C0BF3C7BE4DEBE424095EC93376D1254C0F0A7CD666DC14240B069D77CF71154C0D5D54323A4C44240D814BC3FBB1354C06D8427A2A1C342403D14FEA3DB1454C0C696DB7F46C44240E5F3BC2A451454C0483FE73B8AC8424083AD73E7C40F54C0E37E8E1B67CC4240EC82ADEA020E54C0F0236BF9E7CF424085126874481054C063C0B99302D242404F10217B421354C07F8F2B71FDD142406300C9DE821354C0C3DC0DCF7CD342406D0487C2EC1254C0D8B37ECCF3D54240138C6626661354C01C5F9ECA61D74240BD2BFB8A001054C0F0288C45EFDC4240EA048AD24C1054C00E490D01EDE0424044E4B16D1D0E54C07B6101A3B1E34240450886AF510E54C0A78673E1B3E6424045CEC767FB0A54C08CEFF964E6EB42401A54C3A8050B54C0D8A714841AEE424018E036873D0A54C0AF29580449F04240D779D19F950754C09E14206815F24240F19175BED00654C06EC8518813F54240DE342FF6810354C0E34021AC52FA42400956E32C080054C05C717010B4FE4240AF7D4608DBFD53C02291B88FF10443407FD18BE747FD53C03D60DE6D9F08434025C19C2369FB53C0BAEBFB4C390D43409E136865DCFB53C09866860A870F4340DA68870243FA53C0B5EADB48D014434069100464A2FA53C0301FAA26F21643401FE4209831F553C0E7476D2609204340AE1101B3CAF253C03BF1B6A563224340C958E43256F253C0D34CD3C27E2443403D4646B660F353C0B35AA65E41264340B8CDEC9638F353C020DB71DB3B284340D0640973E5F053C046D827964F2D43405AFC0DAEE6EE53C0B70AE518092D43404782A40E15EE53C0ABD56D10853243405150782BC8EB53C0DE54080B123743406B1E587054EC53C098FC539C0B404340C5D30F6E99EA53C06664CBD9A8424340601D17F1D7EA53C074C958336C46434014526D301DE953C08620F64BD24B4340523DDD3D56E253C0FBA4EE19E34643405B028F5120DF53C0FD848390273B434086B4ABB849D453C09CAD9D2AD1344340C368DE536ED153C0432264AAF93743400FF0A590D3CE53C0A61320E6803D43406F3BB7C427C853C05383CF5541544340C491C383BFC753C0F4F14D54F65443408F1545BFAAC553C0FBF971D6605443409124DE3E95C553C06792ADC7875A4340D9DAEC999EC353C0E7AB8FF98A61434039EEB7D981C353C00EC945753365434097575ED628C253C019AF221465664340CD685A6E32BF53C03B0322AD626C4340DF32B0BA75B753C0C352343AB7614340D614611037B453C09E73492EB86A4340A0F33D6BC1B253C011A05206AB704340FE3F47C2F3AF53C0780CD5C0AB744340AEF7160037AF53C073AEADBDF2764340440FBF5D58AE53C0039047DD14774340948F98DD03AE53C01B25F1C1D673434066D2FAD688AB53C08D7EFEBEF975434079694FF167A953C0278138B9AB7943409F2451CE5FA853C05BE8D432677D43405F3F920951A653C0A0A3E2B4D07B4340924141C267A353C07BC6D3A9C8814340D4A9952126A353C0152900A801834340BB6884831BA453C0B79052A67F844340D0212E7F58A253C036BD18215087434099099A391AA053C0537BB2D8FD8B4340AAB586570E9F53C0A1376335548E4340B8F2FBB2AB9C53C0468863943C8F4340FB5CEE708E9B53C006C4DF2E06934340D14AC44DC09953C0C94C080BD695434099AA2EF0239B53C092CB71E54B994340D40CF28F139B53C0FDB66482279B43405A62994D8B9953C0D502269C5A9F4340BBBE888F779A53C0645FF918F7A04340B5C4BC6CD09553C0D9FA67E6B4AB4340F062A9ED029653C04A171C24ECAC4340A1D83DF0639753C0BBED9BC04BAE4340BAE7BD2F6A9653C0DF77CBFCBEB043406EDD8A333E9653C0F8319BEA7EBA4340EC467D6BB89153C03306F41634B643407093FA44B08E53C052B00B0010B243405CA4320D228253C0FA2CE57700A24340409C56DD297553C07EE9A451EB9043404AE9B69C7B7453C0E04B110F24924340C221107B8C7353C0E14F49622A9943400C01A0B72A7153C0ECEF39F58E9F4340B201CFF69A7053C01DA902316FA443409FA4DAD38E6E53C0641BF78EADA8434093FEC1AE796B53C07F13FBD0CDA84340D33D3868706753C008C0627460A643400CBD3223656453C0167A261635A643404DC39180AE6253C04ED2A6F86FA243400B5F0BFC995F53C0B3171D7B00A043402FB2C71BBD5D53C0C7156C22559D4340475A139C8C5D53C003A61185FF9B4340053F5D3F9D5E53C0CBC9342DA9964340DB2D04840B6153C0EE75B48F2A944340348E4006D16053C0E9884FF9F18E4340CD008243A75E53C0E2DDB7FD518D43403E8554E2665D53C0630478635C8A4340CFB2751FB25B53C0ECEFE7A78F88434000496A93285653C08AA4928AC8884340B3FC4670C15453C0E263776C06884340958805455D5053C029851C148B83434007B22D63944F53C0A9D1DB3BED7C434013630A3CB64953C03DAE667E817B43407304173AD44753C02F6F37635177434092330A96084553C0779239063675434070C60E55534453C00DA3BE6A6F714340F98ED1517B4253C03387A4CE676E434073C1AA11914253C0C72018D2546B4340ADE92072DF4253C0113D72532C6A43406262DD903C4253C028FE181632684340D2190FB2E34253C04A3B7ED9E4644340007A3F71F44253C05235E9C6045C43406F8D67F2A24353C0392D9848275B43405189FB95384553C097C24407925B4340E3E24F37F14553C052E796E91F5A4340249EA9FAFC4753C08C7195EFC5564340F52C31DA4C4853C03C294797F95243408E1197019B4C53C07132807CB84F43405AD426E3714C53C0B3CDD5D297544340B8A5D2068C4E53C0F98DBDB44E53434046D34AA4695353C0F4893C9F42404340E2E315E6A45553C04C70FDEFED374340E448E401825253C09D15F61C702E43400D1C7FE4935453C0A3E107C30B2C4340399C0EBD624F53C0298637826E2A43406735EA89784353C021BB449C0F304340B9BF8A81F03F53C0A850F735E423434000AD4DF7E93B53C0A92EFEE5EE1943407290781F192653C0B9C1D2B8670F4340B1CFEB171E2353C058A99BB98009434047BF1BB7B12353C0BDBF734042034340CC090F17B22453C0FC1EAA246C00434043646ED48C2153C0370801DFA5014340344393B8831753C04486579881FA4240FB6ACB44911053C065FD6BB4F0F14240BB489A031A1053C082483DDAD6EC4240A83571CEBF1453C00A29F0D643E642407D9066AAD01353C00123413F10DC4240571118B0D31653C0B4E34C4CA2D94240E65D5A8AA71453C05C1C8703C7D64240C26548EB0C1653C0B4DDE869C0CF42401B3ABEC36E2053C0B90C99F108D442406E7207F2202553C0A7A891B097E242409F1978B9692853C085459549F3E54240EE59B2C8603153C0470E670D5AF54240689EC3315D3453C0492A93D0B6F54240428AC5A6D92E53C0EA6BB42B39E642400B0D6E409C2B53C073E725B12FE34240C94EAA4D6D2453C0A66318972ED24240519AE9A31D1453C0C922472492C64240C8D2EEA74A1653C0735C728B3CC34240CB61BC41CD2053C00B65FA4CBFC642409A5F6E34C41B53C000BA289CF6C142400AA67BC8BD1653C053AD38AD08C24240201AAAB7451053C01A92CC31F6B142407BF4E43A971153C0F2BF55824CAA4240DB4E669F3D1353C0808BF2C5D7AA42405140B005AD1553C035A44E4064B2424081506A16941C53C096B45C26A3BA42409E4FD8B9AB1D53C00A5B69D1A2B54240517D5312AC1A53C0427C206AC5B4424074A490B0D11953C0B683D8EFC3AF424032084059221D53C055E5F13756B042404B5A712F1D1953C0D1836F9E93A5424077BF5DDC7D1D53C035C89DB1B6A04240B81C0079CD2953C06839A8B5C7B44240295B9C41142D53C0E11C8FDE95B542407A793FBBDB2A53C0ABEB4EDD96AF4240FBDCABCF0F2653C0329D7FFD4DA542401870EA55281B53C0E1B38C738D9A4240009E0C14691A53C0DB31795B8693424026590EF1601953C070B79A952A96424011FBF1CA421753C06012DAD6C29242405AB62626911553C0444D26EDAC964240D09CB5FC421253C0DE4B7493A58F4240EBEFF1904D1953C05D055C21CE8D42408C9BB17BD41153C01FDE34DE8889424085B68E9EC01253C04F78212CA4824240FA9E090F971853C0769DA5B4CA7E4240738A7615401B53C086AA9877927B4240BD47A288F82153C0626BE651AD884240B87261C6F42053C09DD95A6E548B42404E19C24C1B2453C08E5895EE178F42408BCDA00D5C2453C0CCDCE0F2478A4240DEB4C854F92753C0211C0332F39042401A9C5A72052753C04891136CE096424026B00017752953C000D8650BED9C4240826C2BDD982C53C051D01E10C89D424076A12BE4BA2F53C0571380D7C5984240596D9F4AEB3253C06899CDD6C99E4240505AE1B3D63653C0EC6A17F93C9F42405BA6F8D7023853C0359D32135BA942400E7D6BF7323853C00EB1B9B839A142401E3CB23F3C3C53C0B0FE2F1D4E9E42407C0C9897A23953C067A314FEC09942401FE8B34A033353C05F6F14B98D9A42405D4BA122A62E53C0DDBE00F94D934240C077459CE12B53C0507390715C994240323A0C3BF52A53C08B748914ED9242403D2C3E9B942A53C098B663BBF2864240DB3154CFF52453C0CD9BA3792783424070894B343C2753C0AB19EFDD5B7F4240DB2F678C802353C0359D80DACF804240FC3A9CC04E1F53C07AD1029A1E7B4240FCAC5A02142153C0A54D705DC7744240D9B7029DD61E53C00807F17BA9754240C36B755C1F1F53C0F0C005DDA6724240E3698C25DA2353C0C1CEF801C56B4240975E9903F02353C07BCCABA3DB654240D045907E702053C0C8B941BF4F6F42405A9AD92F451A53C0D458FD59667342403B76B885421653C004835737ED744240F8D6D382DC1553C0663FDF791F6E42401213554A331953C0383BCA7C046B4240412A378BA71953C0507C87BDC36942402B0D315E4B1453C0934C9779496C42407A73C819B61253C063D1F4F90B6A4240E98A737FAA1353C0FE48315498784240C7C3DB3B2B1253C08C3644B23F7B42406BBA0C6EED0C53C02C4F4132B57742400407EDAB3E0C53C0FF556A94C97342404CB390C18E0753C089039F1144774240EFD4124FAEFF52C073266A122E764240BF30710E2EF852C07D5851EF2B474240E2519C52B4F952C081A2838D36474240D13A4AB31EF952C0AC6703C8B14C42403E34CF23D4FC52C02F9C2933615C4240480D6863E4FF52C06842C665454742408A10F167B70153C0B06B8B84474742403290E2CFEF0353C02B6A317C474D4240CB1A2A4BEB0253C0138A75434F4742404D286B98210853C0FE07881F56474240CC0B625A1D1553C069C4C5D9314742400377A897D21F53C069E58ADA29474240FB2B98610C2453C04EBE207C17474240759D6ECEF63A53C012D67D9CF34642406F18ABCE1F3B53C0B3F4733CF3464240C0370DA8544B53C03C225F5839474240BF1863B9765453C03F5E77B6EB4642402F879674DF7053C068D7E101DC4642408D256E26827953C088A21CB9CB464240CD5A6AD6498353C0FD143B4CBC4642406D9C48C48A9453C053915AB2D8454240C147398C589D53C0DEA135EB53454240F4A89BE82CAF53C0C0E9DB5CEA4542401F81E6AEF8B253C027703E1B97454240B934255338C953C092B0F8D3E94542400103000000010000000900000079EB428A4DD152C0BD9D8EF98B0343405EDF418580CF52C0D592CFB8AA034340703570911AD352C0E2F6C68543FB4240568F5B3CAFD552C0A4E2F7B3C7F142407EC2E8A5AFD852C01AC3E87619F04240FF8BF17C0BD652C0BB4176F175F342408DB33EA334D852C0954C353257F34240EB206A3C2AD652C0D3F2932E9FF5424079EB428A4DD152C0BD9D8EF98B03434001030000000100000022000000F18C4F557DF752C08A83023DB2C642403880D75E35FC52C0F0F51255E5C7424098F4913E78FB52C0B683159102CB42409B3B2E79C3F852C0E9CFDE154DCA42409AA1E91BF6F952C04AAFBAB1D0CB4240C0CAEEF328F352C0F253EE4120DB4240CCC5177310F252C033F173741DE54240A8D764EB86EC52C022466DED8DE9424008B3804AEDEB52C06215AF26DBED42407263E0CDF3EE52C0E018EEFC20F7424002DEE2461EEA52C02704D8B57CF84240D6E47EA576E952C0DFF0E74F31FC42409A80CEC211E852C07413D3A98EFF424059922CBDD5D752C096B5B69C27024340706EF64486E752C0DF56A3E43FD94240D9270C42BBE552C089C8D189B2D642407F11FAC4BEEC52C00617ED7F79CB4240A529E73F98E952C070037F68AAC742404B9B99058AEE52C0DCC217E676C74240C69F39C664F052C0D784E6CE5DC142401B1C85601DED52C0623983952EBF424035CE7CE902F452C051265C120EBC424000E06C267DF452C0545DD65992B642401373474096F252C022D2736041B4424095FF9286E2F452C0EEB4E95A8AB5424025495F8D64F952C003FA6F3E0BAF4240B69BAB2896FB52C07F189D29429242408A0CB0EF1EFE52C09255830A2D904240DBBF8FFD280153C058B2F09F8AA7424055C8115AC8FB52C06462E9240DBE424053C7983DC4FD52C0EC7300C35FBD4240436C753E14FD52C02090E8BBCFC24240282042DD8BFB52C07F11DE764CC74240F18C4F557DF752C08A83023DB2C64240');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('48','WA-FSIS','WA','WASHINGTON','F','966','0106000020E610000003000000010300000001000000F4000000493A969FBA995EC0191A61E5D31C484096CB216B9F9D5EC0978142043B1D48401338A533159D5EC06CB3A76E72104840BF09DC1420975EC00FB97A45B10748403A5A3FC0EDA05EC034BDB70C2611484095907757B1A25EC0AF7A7E5EF01A4840D713229995A05EC03C4FC1487C20484039A9A0C4E1995EC079F1AE69901F4840CAB61C6536985EC0E6AB8D9415254840757AC6931EA45EC0DF0E680706354840A246C3A6B0AA5EC0ABEFF0BED9344840D6133232C3AC5EC0A17DBC25463F4840CD06B864ECA65EC0FCADD3D3684248408206C0907CA15EC0590703F4AC3A4840FF16A448539E5EC00E19B038293B48403E8AEBD456A05EC06ACDD8E29B474840823A71AA7D9B5EC0893E4C0DB94C4840EACBF815389F5EC0ED5CD3A9BC5148402BE49521B3A15EC01A2D97CB195B484016EBA52014A15EC0E209E29003614840D5048744A2AC5EC0C2015032C9664840330E228045B05EC01107BE817A744840C905D48CA2B45EC0CDA8E15CB1794840925896B69CAF5EC0BD1069EB577A484030FB81B5F7B05EC0ACD675AFF77F4840A541F80FDA365EC0365D5D73FA7F48402AD39A96FDB55DC0C56C35ACFC7F48406577AD9CD28C5DC026171F03FD7F48404A34A7B3115C5DC01A876254FD7F4840C27174190D425DC054DDB8BFFD7F4840B41D66F7DC415DC0E3A3FE0C466B48406C800DD27C425DC0DD14286CE905484044AB59F065425DC003DD89C14CFC4740EF43DFC3AC425DC0F28127B943AE4740FB9FB28CB6425DC0CF88D19116A147408E3A023A9F425DC0AF9123D9458F4740D4C41DEBAE425DC021B6F05DAF444740AEC045BE77425DC0CFA13511C8364740E192EA9AD8425DC07D50A0CABC314740405AF9991B445DC088E67522A22C4740E73CB751CA415DC0B4153745EF2A4740BBC4CEE81A405DC045FC15A4B626474056ACAA1F413E5DC08D428E5EE91F4740398A495DEB3D5DC0219B65724919474074D66BB87B3B5DC02CF5638E2E154740D283C7788B3D5DC0E53B207B730C47403574547A2E3F5DC0F20A7B940C0A4740C9B2F5564B3D5DC009351E7468084740AA7FC510D33A5DC0F65504E961FF464003E70C91D35E5DC044EBAE95FAFF4640BAFD3AB494665DC002ADADC9080047403388DD2FE47E5DC0C270D615FCFF4640C0C72593857F5DC0746C3CB4350047406F359543DBBE5DC0C53BE024E1FF464015907CEB0FC25DC08A1BAAE2AEFB46408309ABDDF9C85DC08577FA9E7DF646405FB5108570CB5DC03018F19D0FF64640DC8B2A7A60D35DC02077F37D61F74640F6749BC448D85DC0D62A303F74F54640F7F1E34C16DC5DC0700B16C006F54640204E4C36C8E05DC06A7D200119F34640F65061FFB6E55DC029141281E7F446405A0194C2D0E75DC0E6F7ACE01FF3464012A263A76BEB5DC021E39FFF1FED46407A62BDFA58F55DC0217CECDAB9EB46404CE18ABFA9F75DC0F6F0C91875EA464087DE1AF1A2FF5DC06F615372D3E7464007571EBA64045EC0D3A97DACDDE34640F4CFF264FA095EC069238B0571E146402B48ECC8460D5EC0BF6D67E221DC4640BB93D41227125EC01D46F8FCB8DB4640BCD34066601C5EC017F76E513AD84640C0CE1B2EF21F5EC006EF366D0AD9464072F0163B7C245EC05BA72C66D6DE46400FE93EA3EB275EC009FA7EA12EDF46405749DA47232A5EC035C82B3FC6DD4640437E4D8C9B2C5EC0A25530FCF1DA46401440EF7F21375EC0658999D224D546401600DCA41B3A5EC0C1E62E5057D1464039B2BA6AB53C5EC08C99EF8D3DD346404AA24B8DFB3D5EC0B7BA9B6C94D24640D2BA219424425EC07BB9B06790D34640ED0BC4B6B4445EC0C0373224C4D24640FF8C895A03485EC03A95D51CB4CD4640E3EE54FE274B5EC0E34F8FB6DDCC4640C9D98F9F4A4C5EC0F37A05B67ECE46404D332400034D5EC09B8D93FA21D44640A9BACFA0B64D5EC03C7AA9DA33D5464080C46F63B0515EC08423FED7D3D646403D13DB837A545EC014C2B8972BD946400D09C7448A575EC0CA3E84548FD946403DEA1886025B5EC06EFD3BAF65D84640C3A23AC6525C5EC080DB73AEF4D84640B295F607DC615EC0162A3BCB1ADC46408AE602EF356D5EC017AC02602AD84640186EC5718E705EC0DAA0C39D48D84640A9D58E18E8735EC02613C9FBAFD94640A1E1EFA2D9785EC08C88F43AA3D64640FDD2CD07517B5EC023276CFC2DD246401788770D407E5EC0893F7C1C61D146405705913000805EC0918BCBDD14CF4640861A521A40855EC0C849DAA295CB46408ADC77CEAC8F5EC0BE12BF8F28C6464088B59DD066935EC00F23C71084C546402D3D2833D0965EC0AED5C44C78C846401EE7AC55FA9B5EC0BC88FFAC4AC846400290920030A45EC01D7EAB0523CC4640FCCE4469ADA95EC00277AB9EACCD46408D37B98E90AC5EC062F7DB19C6D0464092BF64B5ACB05EC0524140741FD34640EDA3DA7971B15EC093D7ADCC24DD4640C1A27A1AEAB05EC0BE472B4B5AE146400B9DA3BF6EB25EC0D62FB7A871E64640B501268235B25EC012987E87DBEC4640658536432EB25EC0612B0EE716EF46401B5E0A2899B35EC08F353EA5B8F34640C539870AB2B35EC09A011764D1F8464090D11CD806B85EC0D10255BE7A0347405C4F9E9F95B95EC0958BB579270A4740C0ABEEC958BE5EC0200B5F52240E4740CF21DCF73CC35EC02FA0582AEF134740860C1C6496C75EC015118CA5F31647402FDA3BCD46CB5EC01B46E0C27F1747406E5D8F9198CD5EC08332FBC1C2154740A8094854ECCF5EC0165B45426F124740E36D177C80D35EC07A73CEC286124740675F262521DE5EC0C0DBE3FA3323474016FB2755AFE75EC033B661F31B214740996C46EB6DEE5EC0065C9CC4882447407E558D78B0F85EC055656BAFC61E47403E67D0B592FF5EC0E0953315B7274740900B141910055FC065C62A8D35224740E805895331045FC00621C42CE3514740A9860E8979015FC05F18027AB14A4740789A9C06D5005FC0BACE626D1C314740FB3AAE56DAF55EC0B2FB6783C1334740248A605234FC5EC0EF82C22E953D47409D1E163330F95EC08D25E1106B41474009B5BC264BFD5EC0A0A6CE3D014F474010A0544A4BFB5EC00F5809DA2656474005EE9265D2F55EC0EB3E13DDF05B4740F09C648F50F95EC018D778B45B5F4740C8B3651BC3025FC002874327A15B4740FB0877C0D3055FC064F1139E505D4740A2AFD84488065FC0938786510D6547406C91C58AE2085FC05770DCB43273474080112DC8C4065FC07A2255373E7447401EB33F07B4065FC082E19EFEE36F474037B51800D8015FC0B5C2A4347169474040B6B1E200035FC088B66C83917147407E0A3D8D02F45EC006B11334637B4740B9FA963FBCFF5EC0E7B4D334FA7C4740A589098633025FC048BBDAE8F8834740ACA473EE30075FC00BE8066076854740EEADD6CD5E0A5FC002B4248CFD7647400BECB2BF550C5FC0A5543CAE5F9547401C7F48ACCF0E5FC0FFDEDE8235A34740457FB87D71145FC0E9BA87D6B3AC47401E180C5457165FC0E4DC72CA71C3474013950728E9175FC06ED8EA00C3D147401110C06DFA1E5FC0BD91DEE674E7474037C601EED3265FC05565508DD6EF4740E60C2FB3E52E5FC001F569D7321348402DEB7A27222D5FC0C47D910AB21D4840D543FD34E62D5FC09180E8CE53304840A6D8552811245FC00D2C0C50BB2D48406945471470FF5EC09C9594685F144840B0A0BE1B66D95EC057ACCE3F360E48405193BADEE2C75EC0D43DE4B2091348408DD1C167FBBA5EC0AC72400F0E0C4840217C80A630BB5EC0CDF4A8C88C08484032D6C9C3D4B55EC0CB444C9D0A114840E01A415F35B15EC0C2FF15656E12484049DF993A63B35EC09DE6AAD0EB0A48408CD7C00257AA5EC0E593AC6865F547403B736C58D4A95EC0594044B0A5EE4740AB916C55BCAF5EC0A467F2EB8CE747400F91C41A8CB25EC07F8A5DEAB9E6474036B04C22CFB35EC0FFBB35A4B4ED4740BEBE81A4F6B65EC00C516EE5E5E94740404A7E2C8FB95EC0DF66340D15D647402CA0B049E5BE5EC0DE0A5D2D80CD4740604D9A634AC75EC022C0B22D67BA47400BEB601FDCC95EC0A4CA03319DAC474013F2158FABC05EC01DAA38FD2FAD47401024EBED53B55EC04F327E9A1FB84740D46A6D3251C25EC09943F71A93AD47400C28763C36C75EC0EDCF54938FAF474025DAF77EAFC15EC0CEA453310AC24740E1587BA1AFBA5EC0F7F50B6FABCE47400E07B43630B05EC0F604F47391D447408E99F1A646AE5EC086C11B15E2E047401BDE6A461DA75EC0975C1A17CDEC4740916E77F53EA75EC0B0A9950BD5F747402C3B11750AA25EC0D109243869F44740964C07444F9E5EC0EC75B132A3E047409635B1D0C6A75EC0BB48444436D94740A8F7FA9088A55EC0BB0F2ECC1CC94740814F706A89A35EC066C3E64FB0CA474008CEB4A0BBA25EC001AE64F3E8C247407833C71749A05EC05E234A79ECC04740ACA8C196BDA35EC0C1080F96FDB24740157517F2D2A25EC01BAFACD8DCAF474067A35DF4A5A55EC01FF17435BEAA4740F74C5DEA66A35EC07C271A3B44A44740A1EE756A27A55EC036AE207A2DA047406069159323A75EC0D7ED5C158EA54740774DB1AFD7A65EC0169DBE16A2A24740E4DB689EC8AC5EC08493BC0C63A54740DC85D3813DA85EC075A8DDCD03B3474036DF23C3CBA85EC0DD0CCCAC04B34740E1CF3E8B75AF5EC094A6D1A4B4AB4740F4A682E642B15EC0D7E64E6911A24740491B013B11AE5EC018A9458E8F9C4740FCFD0122B8B05EC041AA24ACCC94474072A5AC93CEB45EC03158D3C90E9E4740B67CC3517EB15EC0AB2C7CA32EAB4740304F4FFC56B35EC0136312C12CAE47405D534C0958B85EC058128B444DA64740DE5F374F63C75EC01E42181E9F9A4740C4E2DF6032C55EC0AAB4BD08878B47403DF4AF9B01C25EC04E44422AE68C47408676FEE214BB5EC09C2A83AD238647401FD2F02890B25EC0D3E94A2C1C904740E3E1779C9AAE5EC01A9E7B6E8D8A474019571818CEAC5EC08B0E57F0958C4740B6CA8E29E0A55EC0BCE04B380C974740A4A2E007F8A15EC01E85FC5CCBA447403253C24CFBA25EC06E9E60BA7BA847400E98F45A249B5EC0D4EC526636A1474058C7645924995EC095C230688CA3474066517E3F439C5EC0DF7DAE438BA6474031AAE0FEEE9A5EC0ECF27BE4CFA847405FF13CF7D2945EC0A12529CA12AC4740BC111A9976945EC0E3D6BA48EFB14740BE4A2FE920995EC03DB4B99F4FC147405A41B34C76985EC0B7FA185D36CC4740295E29558C9A5EC03291C5D803D547405F6A9B5C3F995EC0E4C1B13318E34740C023241463935EC06A1D8EA3A0F94740E667E74CBA8E5EC0A1C176E70BFC474045144932E38D5EC05273A7C7F3004840F6EBA3C492975EC0B5C3D4F266104840493A969FBA995EC0191A61E5D31C48400103000000010000000C000000765A715BF3BD5EC0FC645442CE384840AD1E7F4B18C65EC087F000BA5D3D48407F0FDCD938CA5EC02F7EF2B9CB424840329F88A1DFCA5EC06394E21E0248484059BDA10607C95EC08EE035ABD34F48405AF9165FA3C65EC0B798044DDF4D4840565CC929C6C05EC0D5CD756E5B474840576E38858EC05EC0F58E62EA50444840D1536562F3BD5EC07522238D724348406299C5E36CC15EC0CC962BC5B541484066CAAA6035C15EC0D6F7AF61AB3E4840765A715BF3BD5EC0FC645442CE38484001030000000100000014000000F748578BECAE5EC0FABDD22C6923484050D0746599AA5EC07202069DC9324840B7058F3AAEA65EC06E1EBF22D03348405F1056E3A5A15EC0717632F7172948401C074260D5A15EC0A8EE650F4A244840F4EC8295E7A75EC037A68CD0EE25484043E7C6A5D9AE5EC032F6D861DA1C4840568F866619A75EC0EB1AD9BC681A4840C02B66FCF4A25EC05E201D7DD609484098B811F3C19F5EC0BF6FC0840A0C4840C95124D251985EC01A556B5E1D04484069EF58DFBE965EC077823D9E60FB47402B3CBBF7C3985EC00F1DAC43C8F3474006574CA3569C5EC0050E18DE82F547401E1F26F72E9E5EC008E0CCB266FE4740ED153DA5E0A25EC04616950ED8FB474013C376C4F3A65EC0876E39EC050448409E000BF683AC5EC0F6D5FB1331174840200AA6A933B15EC029E8B53D021C4840F748578BECAE5EC0FABDD22C69234840');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('49',NULL,'WV','WEST VIRGINIA','N','967','0106000020E6100000010000000103000000010000008D0100000FF0A590D3CE53C0A61320E6803D4340C368DE536ED153C0432264AAF937434086B4ABB849D453C09CAD9D2AD13443405B028F5120DF53C0FD848390273B4340523DDD3D56E253C0FBA4EE19E346434014526D301DE953C08620F64BD24B4340601D17F1D7EA53C074C958336C464340C5D30F6E99EA53C06664CBD9A84243406B1E587054EC53C098FC539C0B4043405150782BC8EB53C0DE54080B123743404782A40E15EE53C0ABD56D10853243405AFC0DAEE6EE53C0B70AE518092D4340D0640973E5F053C046D827964F2D4340B8CDEC9638F353C020DB71DB3B2843403D4646B660F353C0B35AA65E41264340C958E43256F253C0D34CD3C27E244340AE1101B3CAF253C03BF1B6A5632243401FE4209831F553C0E7476D260920434069100464A2FA53C0301FAA26F2164340DA68870243FA53C0B5EADB48D01443409E136865DCFB53C09866860A870F434025C19C2369FB53C0BAEBFB4C390D43407FD18BE747FD53C03D60DE6D9F084340AF7D4608DBFD53C02291B88FF10443400956E32C080054C05C717010B4FE4240DE342FF6810354C0E34021AC52FA4240F19175BED00654C06EC8518813F54240D779D19F950754C09E14206815F2424018E036873D0A54C0AF29580449F042401A54C3A8050B54C0D8A714841AEE424045CEC767FB0A54C08CEFF964E6EB4240450886AF510E54C0A78673E1B3E6424044E4B16D1D0E54C07B6101A3B1E34240EA048AD24C1054C00E490D01EDE04240BD2BFB8A001054C0F0288C45EFDC4240138C6626661354C01C5F9ECA61D742406D0487C2EC1254C0D8B37ECCF3D542406300C9DE821354C0C3DC0DCF7CD342404F10217B421354C07F8F2B71FDD1424085126874481054C063C0B99302D24240EC82ADEA020E54C0F0236BF9E7CF424083AD73E7C40F54C0E37E8E1B67CC4240E5F3BC2A451454C0483FE73B8AC842403D14FEA3DB1454C0C696DB7F46C44240D814BC3FBB1354C06D8427A2A1C34240B069D77CF71154C0D5D54323A4C4424095EC93376D1254C0F0A7CD666DC14240DF15469E3D1654C0BF3C7BE4DEBE42404C97FBBC891654C0A72DA4E5F0BC424035140602DA1854C06BE8D1E39CBB4240280D3464391B54C03B1A4F03ABB74240C3BC808B621E54C06E430EFF1EB64240F14291AF271F54C0C71E08BD88B742400A42B673391F54C0CFF559DAF4BA4240BB8A2B9A8F2054C04CF93957CEBC4240E71F1381BC2254C071680E140FBC42401419834A3D2654C09F34B24F18B942400F7FF61C222D54C03F6D2765B6B14240246A3203B42E54C01A0BB0A144B242405A6BAFC6C32F54C0E362F35FA1B142407E603C26DA2F54C07D11BBBF85B0424011D3DDE8D43054C0F01B357E8AAF4240BD23060C483154C01E6681DD6EB142401BF1FFD2263354C029BACFFA24B24240B26523D52C3354C085CD893ADFB44240FD2E79016F3654C0865B5AF633B642408C6C0FA4263854C0E0A5FBD3C0B142408A933A7A4C3654C0707897B6EBAC4240E745AE5ABF3654C08E4216D671AB42400EABC7A9C93B54C09E5A794F93A642406ECEEEF0F13D54C0B119496C59A54240961FE353A03E54C0BADF47EBF2A5424032884C96193F54C0D4DB76EA32A7424013B3E47D984154C0C09772A79DA44240C56642D8014954C0C01B24BE30A3424003BEB28A444E54C040EF3259BF9E4240405B5FB9F55354C07382263198A542404954667EF65654C0DA13DACB62AB424061BA4642055954C033FC88EBD3A742406E392264D05954C0BA88390C2DA4424019E2CF4D6C5E54C046C187E990A04240816277D0B65F54C0663F6E685DA04240258C35B35A6054C045CC87E7FF9D42404C885F39A06354C0BE9B95C4699A4240BEB851DF9D6A54C06AAFFB7D3A9A4240E6280D1EE96C54C0053D9BBA229E424036CE90DE426F54C0D0AB5A1710A0424006EBA8601E7054C0DDF92555D9A24240E9E079EDBA7254C0ED54CA71C1A442406A3B23342F7454C008E52BF1C7A342408326F75AB07554C0EE4A466F8BA44240906C61A0F47654C0955BB1CC4CA74240CF2994C1487754C03C8A628BA8A942406335DA096B7954C063C23E6898AB4240081FFB0F517B54C05D3C9FC494AF42405C09044CED7A54C0F75585A22FB54240EDB7C6B53E7F54C0EB9B231BB9BB4240F6E022B27D7E54C04E84FCDACFBD4240A7835AECAB7C54C0CD0ACD7B1BBF4240661CAC69DE7B54C01E64AABBD9C04240017048AE697D54C0654BC076FDC342402A2B6131807E54C04E08545489C54240D9CECFBCAF8154C0F5A03410E8C34240F70CA603258354C0C24B090A96C6424030807605908354C08742826C3EC34240518DEBAD668554C00C8BCB042FC64240BF10DEDE1E8954C08263599A5AC7424093A8E99F608954C0C27F7D1870C84240F459545DCC8854C0E12B7059F2C8424094FAB21B6F8854C0640E34B796CB42400F3E8323328A54C079AB3812FACB42406032870AE08B54C00CA9926601D24240485E41F0258D54C039780AC6DFCF4240B64F2379418F54C08B62233B11D4424069A33684EB9254C0AF1F6EB1A3D542408EEDDFE8149554C00DB3EB0241DF4240E62850A7729454C0713CBF2114E142405952DB0BC09554C0F778E63A67E442403020B8B8F89954C00382746EE6E74240A3881EFEF99A54C0A3F01861A9EF42403E6BF1C1019C54C08BDDD79A8AF242403029816E03A054C02A12AEAD0CF64240EE023ECE939F54C0B605224AA4F84240D9904C2CBB9E54C045E880A929FA42401B607E2C739E54C00838DB85EAFC42409D4FA65594A154C089077D3901024340D87D8F21F7A554C0F4F0CC40130E4340454818295AA954C0E219EAF6BA124340E6A6650A6BA954C03FF16611B0154340DD1252E747A754C0B3A40AD0CB16434077994447D3A654C08B87754CCF18434065E8AD4A70A754C0AF3E3761911E43407DF9E707B4A554C0F42EA7E0681F43402655DDE6C5A454C09A31FBBEC3204340D2E67B881FA554C0E9A899FB702543409B66F187A0A454C02B742F5A66274340738AEF8C49A654C00FDE8AD3292F43401419BAEC8AA554C0401AE16FCD344340F8442DABD3A454C06E4CCD10B3334340068890070BA354C03C4763F143334340F2B2ECE0AD9F54C05CFA6252F23343401CD844948D9A54C02AD8E61A173743404B9BD2D0439954C014278B1DD83643402F427946119554C02668C4E4913843404525E5841C9454C08D2F9DA48C3B4340FC0406E48E9254C0DF1E331B404A4340D1284461569154C0510B9A5B254C43407054CF97AC8D54C0A5241EE3DB4A4340B6D868B3CA8B54C01CB47A042A4C4340ECA86D321D8B54C0DA98BBA0EB5043407EBB0636188C54C066251139C55643401D05FD35C68B54C005DD6135EB5A4340924F5E3CDF8D54C0890A5D49B4634340EDD5E779A78C54C0EDFD51C7FD664340D23B75B2598954C0D0AD82655D6B434078B72C92EA8854C0A8B4B27C1F7343408561942C7A8654C0A6C2E236DE794340E0571FEA708554C0560F0FD4147D4340FD8FAF85BE8354C0B5EFAAB3997E4340FE691BA3BE8254C095F8E150CF814340A279CCBBFA7F54C0BB41ED12F48143406E6E1778697E54C09235ACD61A7F4340E460CED2037C54C0D2D051D8DE7E4340033C7691617B54C012B7A899FC7D434015EC17CD827954C0E5F41E24537743400BB5CB71A37B54C0ED46CDE886724340ECB14B6F937A54C022A7988B35714340629E1AEC217954C07DD0A44ECD6F434005FC7DA8797754C01FE142EE5E714340F6B90985D17554C0E3D1D7C50C784340B03594C2B87454C079534A646779434092A8B45C207254C02B5B684B377643407939DD79C97054C0AE70D72A10774340E48BA5DC077254C0ADED6AC2F87B434006754BBCA47154C038DDF3792782434075960FC20F7454C0D2F9E554A58543401513ECE3C07454C0244C9F5180884340894F84C3737454C0799025B0DB89434012E9BBBE537254C0154D6491E389434019FB7C5A3A7054C0BD44E2CF1F8C43408FD6AC39A96F54C04D8196AB1C904340AA44A0FC917054C0065361047F9643403C7B88D7466E54C0F625F25E4C9B434046467A73AA6C54C099ECD09D299C43405CBFD232216C54C01F6D53184FA14340430E41AFB86A54C02BE808979FA2434064A478DFA66454C080F1EF9509A24340A2F0843EAC6354C07F2BDA7194AA4340C5E438FC996254C0D9C3F79025AD434060BC80B1C25D54C0212230EF13B44340495D0A4FAB5C54C073C70D8F9CB443408BFCE84CC65B54C04B9A698FF8B343405B9526030F5854C01D1A18943FAC4340157FC57DAF5554C05BD4683444AD434033BFDB552D5254C05CA7B9938BB14340A907FB2F354F54C0AE731D75B9B14340C2B6F68E654E54C047F61C1545B44340408019CDD14C54C0DB1B7D163CB543409FF99C6B8E4B54C033B90CD609B84340A73DC5667E4754C0B47EA757E0BB4340A70E0DA5494654C00FC41FB68BBF4340A358827C644254C0D06E27572EC44340F82F8C9A154254C060DF5176A6C5434069A00C10F43E54C019BD2E9878CA4340320E1AE5AF3B54C00B45013EB0CD434052B757E2673A54C084B5B2C0BDCD434087DEBE1A643854C0B76C62E4E1CF434032005E12DB3754C0DB408FE2C9D443405EC26C2D423754C0A99214C215D74340A840B8634C3554C000BBA10409DA434075259460443554C07CB685C302DC4340A07E7921D03654C001B6CF3E40DE434083F4D800BA3754C0E0B0707A47E143404D6172326C3454C0EFCE295B8DE74340132930D1DB3454C0940F3C367AEB4340706D0A0A1B3354C066B2F816A9ED43407FD4F2469D3254C07B05ED15A9EF4340DC9ABA08FA3354C031D21BCFD3F3434088D2A0A6B33354C0C2671D4E3CF543407B78B803F23254C0660FCA4EBDF54340E8DB54FE283154C065824572E7F44340AFC17F9B913054C008FD2612ECF54340FE65FDF9D53054C04EBBBBCD37F94340E4D3F4F0492F54C041693D8AE2FD4340616E324E3F2F54C0E418E0A390044440915699A2EE2C54C0B0E55138B91344407ECEC661DB2C54C0FBFAE1F68615444005AB347C6D2B54C07892A8F4D9184440C98E5E749B2954C0D78EB06F721F44407D22A00B572754C0AA41036C64234440E06E7468B02654C0D7CE06083327444050B560E7FD2654C0C653667DC72F4440C0492F8B452854C082CB65BABF314440BE9391AA2E2854C0094F0B19F9324440CE8DE962842654C0E3BBF34D823D4440AD96B326042854C09D58E34892404440C4F152478A2854C02DD35BA3044544408C3169ADCA2A54C0E6EFF95CBD484440D05AC60CBC2A54C0DD480B7B834A4440A3843826CA2854C01279C9F8964E4440272A57A1232754C0C569513A5E4F4440DDD1A33AC32454C022ABC33DD84E4440FF08B270682154C04912D4DF8F5144405C9895138F2154C0F69D51D2483D4440FE05C814822154C0401F169D9633444012BB8AB9AA2154C0BE75027ECD14444066F60BFB982154C0A753A1F0EB0244409ADD87E0932154C057512B7EADFA4340EFA48DA18D2154C01ACD7D9350DC43404B61D015761B54C0A0E96FCD23DC4340CD0D4EE9C4FA53C0E94378955FDC43404F107BEDF7F053C035BE872C64DC4340892BF53AC8DE53C0B13BEBF031DC4340239CE9F159DF53C07A50A5434499434066B06D2B84DD53C01F4365414C9B43408D709508C1DC53C0FA5136E1259B4340F5C41058A1D853C075398F7178A2434079325B0D28D653C0CBB0324563A543400788BBC1E5D253C0A4AD602078A643408A6EF99CE8D153C041F1CF94A1A94340C870CA97A6D053C042D20F4AA0AC4340F05A8BE46ECA53C05CC580125EB24340320DF6C21ECA53C0D29872A9FCB4434055983CDE68C853C0CCB7584761B543405ADFB938A9C653C0BDD0B75941B943405D581A9730C653C0049DF0F178BB4340E49F5EB8B1C653C0B1C5D28F45BC43400C0B973285C453C0CA83E0CE44BC4340A02A60511FC453C0814BBF882FBE43406A48C16E20C353C0D3B110A9EDBD4340C75508A21BBE53C09290A39821B8434026B38C1F25BD53C0E3B9E64FF0BA43408644EB70BBB753C0535904184DC34340E6DD76ABA3B553C09E5094CF1AC84340555D7A869EB353C01BE4F1AE8DC84340B092E368A2B453C03B4DF42AF8CA43407A293D251AB353C068192705C6CE4340B11522E514B353C024B46222BFD04340136FB30174B153C09D15188076D243405A14CCA020B153C0BAE782E334D04340F42E155DDFAE53C05D516B6540D0434025FA047DC0AE53C00C5067C68ECF4340A0DE4DBD1EAF53C0B1C002E8ECCD43407ACFA30185B153C085A625C801CD43400457D19FBBB053C0B7E7F92B78CA43403A84A2DCE4AE53C0C4E6296ECFC943408AECF91AD8AD53C0BF3CE112A0C743408C9BDEB5A6AA53C026FBD41BBAC44340928D1B948BA953C022FE671DDDC44340E6E2ABF2C5A853C00ED51960D5C34340DFD8B9EFADA653C057FA0D4291C44340C70110AB1BA453C04C1FFC88B2C243409F5AFFE58FA053C0EAF5336D38C34340D7B30043CD9E53C0AC4ABD508DC24340B569B4012C9D53C00E9BC26F51C44340E540F621899C53C0520E604D2FC64340A531C7BFEE9A53C0FED3060F53C643402B5AAC658E9D53C03CD88BC458CA4340BD446D25D79C53C0445A02C3DDCB434029FDF520DB9953C0A63DFFE736CB4340285AEA25A49B53C0FB2E095E7BCF4340E80B56E19D9853C087E87CC3A7CE43406A9BD4C12B9853C057D24000CFD04340B0ADFE7FD59653C031D31082F1D043408168D55F449653C014B0D1E0FED14340CFCADE17799153C0B545E80B28CF43404A9629987E9053C05D101FC811D24340A0F185B5AB8E53C0965FF9E64BD443409CAB51F6908E53C0637B164445D6434040CA0953138D53C04DCB062685D643408901BFD0B58B53C0BCBC7F04EAD843403E5714A2098653C0C1F5A0117AD643400B6FF7D5B08153C0D259BA20BACF43405E04D970B17F53C0CE1F7606ABCC43406F262B0EB67D53C0FF7CD5E53FCE4340C77E898B7A7C53C0FA34FB6902CB434019F1B08ADE7B53C027551DA9C4CB4340E51C628CA47C53C004E761C5B8CE43407A33BB2B127C53C0873453C521CF43400DE772E7CE7953C0B47B9CC94DCC4340358044E6017953C01E74F8C8E3CC43402B317026DC7853C0C266B8C6EBCE43406D5BDEE2C07653C0E0E8FFC913CD43408A2F6501EA7553C01757AAE97CCD4340C4729660C07553C002A2E88E4FC943407B1DCEE1967653C08399AFCF60C8434010E8FCA4A67853C0ACFD0DEF3FC843400C0E5065F47853C00D88EA8F6FC74340EC6100E3A67753C0967E9572E0C5434052F1EE21567753C003B4AD17E0C14340350A22A0017653C088958D5516C443402E831A3F787553C06524B03647C34340210EA71E0D7553C06B488496BEC34340BFCBE81DD17453C06F8E26798AC143403104F99F437653C0EDB039BA41C0434043C7A2DDCF7453C0F222BD5B38BF43400DEE7018617153C0678B2E3DC2BF4340B8F005FB2A7353C01C6A1FBE8BBD4340D47580393F7253C0CB80C2E0C3BA43406D9354DB777353C049B6E21F48BB4340ACEB935AEE7253C0EDC840A1B7B94340A5724F1B807353C039E0288252B84340E11C127B587353C0E8C3202356B743406DC8C476727053C04D2BA5C46BB6434067A019D5696F53C06F02D9E6A3B3434061E1BFD42E6F53C0AD5E0E88B6B243403B19A4F6657053C055A88EE871B043402D7E9175B56F53C0BFE082AA20AE434035E27076467053C0B8713E0C57AB4340603D1376017053C0F0DB602DD5A943409FA4DAD38E6E53C0641BF78EADA84340B201CFF69A7053C01DA902316FA443400C01A0B72A7153C0ECEF39F58E9F4340C221107B8C7353C0E14F49622A9943404AE9B69C7B7453C0E04B110F24924340409C56DD297553C07EE9A451EB9043405CA4320D228253C0FA2CE57700A243407093FA44B08E53C052B00B0010B24340EC467D6BB89153C03306F41634B643406EDD8A333E9653C0F8319BEA7EBA4340BAE7BD2F6A9653C0DF77CBFCBEB04340A1D83DF0639753C0BBED9BC04BAE4340F062A9ED029653C04A171C24ECAC4340B5C4BC6CD09553C0D9FA67E6B4AB4340BBBE888F779A53C0645FF918F7A043405A62994D8B9953C0D502269C5A9F4340D40CF28F139B53C0FDB66482279B434099AA2EF0239B53C092CB71E54B994340D14AC44DC09953C0C94C080BD6954340FB5CEE708E9B53C006C4DF2E06934340B8F2FBB2AB9C53C0468863943C8F4340AAB586570E9F53C0A1376335548E434099099A391AA053C0537BB2D8FD8B4340D0212E7F58A253C036BD182150874340BB6884831BA453C0B79052A67F844340D4A9952126A353C0152900A801834340924141C267A353C07BC6D3A9C88143405F3F920951A653C0A0A3E2B4D07B43409F2451CE5FA853C05BE8D432677D434079694FF167A953C0278138B9AB79434066D2FAD688AB53C08D7EFEBEF9754340948F98DD03AE53C01B25F1C1D6734340440FBF5D58AE53C0039047DD14774340AEF7160037AF53C073AEADBDF2764340FE3F47C2F3AF53C0780CD5C0AB744340A0F33D6BC1B253C011A05206AB704340D614611037B453C09E73492EB86A4340DF32B0BA75B753C0C352343AB7614340CD685A6E32BF53C03B0322AD626C434097575ED628C253C019AF22146566434039EEB7D981C353C00EC9457533654340D9DAEC999EC353C0E7AB8FF98A6143409124DE3E95C553C06792ADC7875A43408F1545BFAAC553C0FBF971D660544340C491C383BFC753C0F4F14D54F65443406F3BB7C427C853C05383CF55415443400FF0A590D3CE53C0A61320E6803D4340');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('50','WI-ESR','WI','WISCONSIN','F','968','0106000020E610000002000000010300000001000000F500000099DCA352E8EF55C0E5742942167B464082459A70C2F555C0CFD29686B276464051FB4A6E2FF555C07721C5D0C96F4640A3D2B43517FF55C092DED481385C46402B325974ECFE55C0A14E44A2B056464059BC48B5D90056C001943BA1CE5146409CA876D172FE55C0EA96F0A2434C4640DF2B3255D50056C0E4251361A54F46405F50CF33960256C0BCECFD3E25494640C47C49AED6FD55C04C1CE8238B44464009DE79474AFB55C056FDC68602454640994C03239AF755C033E9E2C8F64E4640CAC36817E9F055C0E96ACC2D7052464016F9391853EE55C02433E0903A584640FAD21C6053E755C04E1F644CA16A464000C307DF60E355C0CCF74490F86C4640F821E89A4EE355C06739E8D658694640ECE85282C2DB55C0CB5723740F724640CC466A7584D755C09854B16EE16746402F33633220D455C042013658B9654640FBB72C60E0D755C08A86363FA55646405FA4154A4EDE55C06E247F5B58444640A1558F3766E255C0AF1EBB05F729464037BD3DCD1BE155C072D3571F7F164640F632E75E3DE955C0D1BB76B5850C46403378C2C778EE55C0297194716BF245407A2EC686F9EC55C02C0D1AA32AD6454017743D904EF255C010647312EDC54540790DDDAF63F355C0AF623E24B7BA45404714877105F855C00268215CE6AD4540739EC40AF3F855C0CCACAD663E994540D4926A600BF755C0323F6B49B689454090ADEC4016F955C0BBEB87964C834540E9E3C23588F555C007D95DC4777B4540862C476878F455C0BE6A6956B86B454060766F786FF055C06F9A38A2866345408000B316A8F255C066B8008854554540FE146D4E08F355C0A0B17C8F9C3E4540A9388071770C56C0317D4A3FAC3E4540D4689F41121356C0E064F17BF93E454038792950392D56C08CB3E78DAD3E45402CBC43B5F63056C03A11518BD63E4540BB9CF7A31B3C56C02BF11A26D53E45404ED45203035756C0C07A81C5BB3F45403FA47BA5A35956C0E2E7D324AE3F4540CBB8F65C6C7556C0358894A871404540CB3F9CC21D7B56C09B6274DE86404540DF0D47F7E29A56C0DFB53E1A124145403E74F776DCA856C0C43733D4324145404F7D32970BA856C05CABF8EDA74345407F83E0F6E8A856C0795DB6A3214745408ADC6D3685AA56C0E5FBEB5D23494540C61B337577AC56C08A3056A6A751454058CD4113B8AF56C04FB53F9F1854454061C1F5771FB956C0D04C2492D0564540DE029298D7BA56C05FDDEE6F2057454051B59A99F2BF56C0BC6ED7E6805A4540B1ED991B3CC456C0C5563D56595F454003850EFC3FC556C08801DC4C45644540B3A75FBCFAC556C009E0FC5A8B6F45400A97D25EE7C856C00F6E3AAF83764540A822F4DEBDC956C06E8510232B804540B135A45F39CA56C07B687A32648A4540DA5751E0C9CA56C0531C25129C8A454092F8F39F53CA56C09E418BC4E3924540AD61615A6BC456C037AB0BCF02A14540973EE15A40C456C0C519A06AEDA345402FE9B01C06C556C042ED97241AA84540E4E11BC454CB56C025A8AB1B4EAD45405FC2F305B0CC56C06D524CF86CAF45403AD245A87FCD56C0342D3B4E47B6454015DDEE0A19CF56C08225FBC57ABB4540FC3FFDEA4ECE56C0CBEC787F1AC045403C5B7E4D65CF56C076EBAE363CC64540CCA4904EE9CE56C0F483076EA8CC4540C507CA7289D056C020F3697FB2D6454027871C1492D056C069D2ED7677DC45406F1C591A12D056C05331CAAADFE445402735A646AFD256C04A8140BF70EC4540A4DE1816E5D756C074A5EB8E3DF94540D5D598F941DB56C04A88ADCA28FE4540CE22DAA2D1E156C03034722A610446406A3DCD266DE456C03990306A790446400C4176AA83E656C04568D7A93905464065D2F431BEE956C0172A230A900846406C3CEDBE34F056C0991A64AD90114640774D0AD251F656C0135AEFD27818464039CF235EE0F856C03AB56798F5204640EDAEB5C507FB56C0EF23C25BE82446403E4655670EFB56C005E5FA7DA4284640B049416B16FC56C06DD8AF00682B4640594160923BFE56C069204784A72E4640A29CF967D80557C0425B100C3235464092B9265B310D57C0FD64F34E1D384640A79AA042F10F57C0E686AA4F653A4640CFD68DEDFC1257C0B0B2DFD0FF3E4640E6D116B6821457C0175CADCF2E454640DF5DEDDAD01557C07417724FC34646405367F0F9962057C02027B6D09E494640947F966CF92657C0E02ED30E1E4E4640A8693AF1572857C06B7C2C6F42524640F77323652D2F57C0BBFA4810575B4640AC5A11B38E3357C0F3A17530825F464032B321AFB43057C08D9B5070ED6A4640B13941B1E93057C01B20CCAF5D6E4640F30DE254663157C0C96E01AF22734640CC770052403057C094D196CF1E75464092354E32FC2F57C061D3908FC3774640EE428E99183157C00C1F9BED208046407CC18CDAD43057C01BBA8BCDD482464004C55A25FE3257C0462FE0EA65884640FD9A65FFB42F57C046A680EA768E464009793503AD2F57C08C31BFA805944640A8991029CE3057C0EB1201E8E2974640451C3DCA583057C0630F42272F9B46409E137D2FC82F57C01AE6DADB17A64640379A20C9452D57C01AE8D7D4BAA84640FA2607E8D42B57C0CFB03D4A79AE4640EB4BF722852957C0038C8DA09EB246403B9F8145472957C0168571F73FB84640A37EA188E82957C083EB00B544BA46402CE11FF0DD2B57C0275B0CB52ABC46406DD520169A2E57C0342D56090CC6464023705179C73057C0B1AC16C939C846404411FE3E713557C0F0FA07901DC84640C2CF96001E3857C05634185117CA4640D9A9AB59AA3857C0EBE8B5E58DD246405E2D45900A3757C0C42193B6F3DA46408D4DE84B5A3557C01BE2A9CF8DDD4640CFBFAFE3DC3157C01207B823B5E146406D3220B7EB2F57C01A0AAFB62CEB464049E7B474FB2E57C04E65E65328EC46401990690C332D57C09E958DEA0AF246404C636626A32A57C0FBFA75C235F54640AE0DB8FA5E2357C0C0483930C3F94640597E5ED6882157C0AF1B6D49C5FD464084B3C112971D57C084D7B6E197FD4640232A1D30331B57C0F378F2B743034740E561DF8C5B1757C01144C870140247406358468C281657C00FDA246EE4024740FF0692ACF31457C09D1BCFC8470747404D335B0B851257C0B16D1FA35F09474037B5E80E7E1257C045387A7D0B1447406CA2CDD1791257C0E42B1AF73E3547403F342EA8621257C0FA6D8D1953544740B1A720C8620D57C0068EB4B3CC524740A045B45E240657C0317CC86A0E5F4740AE697D1C440057C09860A0C5865747400C465337F9FA56C0F73B8CA30E574740BADD1FC891E356C06282F7C9E06047400E4B599726B756C01E3B60D9EA7947401691922E91B156C0F631F942CA754740C12B3CABC1B156C092100C290A714740254F179447BB56C0300381C2F14A4740AEC04804C4AE56C07F43692CA6524740068C52BB9DA256C0852D2C13344B4740E25033F21F9A56C06D5AF23BC84847404FF34371AC9856C0D9CD4A81134547401D7378CB139456C000F4DE9F9946474066967F6A5A9356C07E8D0081AB4547401A2D9B2A369356C064D708E4344347405E723D28449156C0591833A4E042474032915EA7899056C03C541E0620414740EC7981A3898D56C08E5E6546CE404740DCBC4E3B548A56C01D04FEE89F3847404FC3A535138956C0C3E4E94A6B3247401B36DF0F5F8756C00DD6546CBD2E4740925E586D258756C0F0D9632D932B4740FF4DF36D357B56C0C2133550EA264740CC904A39634656C035BA5F6CA41247405D20442C0F3F56C0D91AD49ED90C4740FF15F466363B56C079F840C66B094740E49A4E3E7B3356C08BBCAB556E034740F12901DFCD3256C0D93F9173A7044740C1151D3EC23156C0AB2D21B52C0447402882E31C793156C057DC2CF8B4024740C335C37E7D2E56C0EB14C455C9034740888EB5DF072D56C09C690C176C02474014F2EA415A2B56C0A3025F159402474080678FE1312956C04548005927FF46403AF2F663642756C00A2520573FFF46402AD4C7073E2656C040E8C971FC0147406AD30EA9D22456C06B5A4592250147400EE6E84B182356C07381E46D78024740C6D46ACEFF2056C068CD49CC61024740857C690F9F1F56C0DBF010ACA80147405100C1CEF61E56C0333EE02DE4FF464000FAC98F131D56C0AEC908EA18004740EFCC824ED31956C0D04651C6E0FD46405BE74411AD1756C0C1D43DA14EFF4640FAC2998E901456C0EFB5A33EBDFB4640D363BB4E251356C0E8A82CFC20FB4640BCB50371751056C0E8271B77C8FB464018C2F66CC20D56C0D4BF67D754F94640C9D4274C880B56C066BA56D50CFA46400EE37AC8A00956C031003977D8F746409EB03605210756C03E06199890F646404012BDA3010656C0A7251AB9D6F54640D2ACDEFF200656C0D10A339E26F246401577C8DB2F0456C0119B4381D3EF464038E15759CB0756C0D78C4547DDEA46401A1DC117510856C0D22AB029E2E84640DF26D9D1AD0556C0C163EFEF50E54640F10C320F4E0356C0B260A8529FE44640F9C3B64D5DFF55C08633F613C4E546403038EC0907FE55C0992FADFC1AE246404A53DD88E9F755C004E0C4EA16E046409E637745E9F555C0AAA1463578DC4640AF6171A44CF355C091A28DDC0EDB46404ACA312346F355C0321F40FFC4D94640888F3621C2F155C05120EAA590D746400908F8FFFAF155C01A27B66784D646409289EB9D4AF455C01DEF41862BD54640D65D7BDC79F455C06CDFE708C5D346406EA0B5B7AAF155C00554C3577DCE4640DDE525D69AF155C0B1FBC17AD9CC464046C3A1F152F255C002C4B741C5C84640FD22A9D007F555C057B1539DC7C84640CF36D26D87F355C0E25FAE05B3C546404DAB2F4885F255C06D2CA972E1BF4640E58E454312F455C0B598E0F9B4BB464067C0159F0EF755C0FE7CDAFBF8B8464078EB3CBA5EF655C0DA2CF3A8FBB346409EB39B138DF855C0EC41B951D4AE46402D3E7033EFF755C08BACA4D358AE46403AAB0E1596F755C0CC451C11A0AF4640FB1BEB942CF755C0BE17A59261AF46406153B492D7F555C0B2EBBE9B4EAC46402A9AA714FEF455C018743279DDAD4640C8C0A576A4F055C000CC8AC02BAD46400A47C55F22EC55C0AD06691D15B24640AC489D1E32E955C0A0980C4B51AE4640C292979C4DE955C03033DDCE90AC4640E7515B0F16ED55C0E694B49ED7A24640C91E120C21ED55C0DBC11D86A09F46402785900A0FEE55C06A401F884E9E46403BA113282FEE55C0778EC110189B4640922A6EE61DEF55C08850E4337B9946402057D5E4B2EE55C0E824B6FC9A964640DBB20B630FEB55C03AA9738F0192464046AAF67F8DEA55C0F12AE27BF58D46400B09C69F33E555C0C7811E291D8C4640CB13EFDA95E755C05B63D87245874640850BB693B3E755C0FFA66FC8F97E464099DCA352E8EF55C0E5742942167B4640010300000001000000170000002DEED1A535C255C07981BC032CA54640AD3AA4C71EBF55C008E09E643AA64640FC4469FFEEBD55C0C411A969C19E46401AD22E1CBABF55C0D9785FEAF49B4640D524D91FE3C255C06C9C41DBDF9F46402B50F2F0A0C155C09E20D0593293464059814BAF1CC555C0D83ABBF4DA924640466F40A8DFC255C0D70F6EC7398C4640D14DBA869CC555C0CAF5DC83CC8B46407749CBA05EC555C012525F0FD28646408319F72134C755C0C1C752294A884640624DC2B36FCB55C06A21F599CC7D4640F96EE56BCDCA55C0D3DCCE247777464018A8E86029CD55C09755654FC66F464043C30D73E9D355C0CAD8B0373E664640DD1DBA393DD855C0FE4A14273B6B4640B008C365F2D955C0C956B232A274464079C4B7F6E5D555C054EFAC7FF281464085A7A59C24D255C0E3D3E13ABC86464022F8C34FC7CE55C0BE67B37A68964640B2E219EE62CB55C06D7F0B27D693464018D2FC653AC455C0B076CD7DF2A546402DEED1A535C255C07981BC032CA54640');
+INSERT INTO "{{ params.usa_geom_table_name }}" ("fid","program","state_code","state_name","flowing_st","fid_1",geom) VALUES ('51',NULL,'WY','WYOMING','N','969','0106000020E6100000010000000103000000010000003000000081D35B6E6E035AC06D9039375FD94440A0A41D528D035AC0AAAA767038C84440244A42F074035AC0E437B6CBACB14440A446B2244F035AC038CE873A698044403D6D6FBBCE3B5AC016980BDE447F44404600E3D1D7515AC01E57795E887F4440D28733AD058D5AC0FE7B0AC902804440E340336510955AC095DDBC3C2A804440FA99495963B75AC0A7477B73CD7F44402E63779275D35AC08B2C7D5E0480444064D8F182CBFA5AC081049F986E804440F62F859617435BC0DC4D47AACC7F44406F60B07A23805BC0A4F91A57B17F444076071D3C0B845BC0CCC837ECBA7F44403140D9F343C35BC06E454F0D907F4440517A90404EC35BC047DB971514A14440B2A0E1B544C35BC09AC0FA500FCA4440BC87CDDB1DC35BC0BD512E9783FF4440281ADA72FEC25BC015C7CC8E6A40454053AA7D5926C35BC0EA9F97878B8245402FC3F1350AC35BC0D28B292F72A445408B3F9C4CFEC25BC098B96CD4FCC14540BDB6B7D639C35BC07B071C4FC4FD45404410F9C44CC35BC0460525DB953C464048CC60AC4DC35BC0553AF8050E55464029C9F05F6BC35BC0EF062AF3727F4640AE0AAD607F9B5BC01720F632037F4640CDA075FA22995BC0A331EBF3D27F46403A1F3AC0B67F5BC0E02593845B8046408BF9312129735BC01778BC5CF07F46405536B53204285BC067C31A22B17F4640E3DF285D97105BC05018F9C503804640846A0B6E3DF95AC02D5EC395F87F46409116B14097905AC045B3C140827F464066815D885A815AC07EC3ECB2A47F46403D4ECEB070455AC0D2377E01FA7F46405B1E10C9AC425AC08A54F54023804640D4AE2975D4035AC0844E1AB7A87F4640B985EA46CE035AC0D6F0FC6284494640E5E93404E8035AC0C8D6000D46174640B81987A3D2035AC0CE49A368AA124640E62AAB82CE035AC0BCBAD80A2CED4540C28FA0DCB4035AC0A8AFC5A479C04540229D7A3CC9035AC0F028DB4254BD4540D15E13C398035AC05EA8BB5864804540278A1E1999035AC0D692057FAD4E45400FF89DC36C035AC0D5F523F3F9FF444081D35B6E6E035AC06D9039375FD94440');
 
-CREATE TABLE "usa_geom_new"
+CREATE TABLE "{{ params.usa_geom_table_name }}_new"
     (state_code VARCHAR(2) PRIMARY KEY,
      state_name VARCHAR(25),
      geom GEOMETRY);
 
-INSERT INTO "usa_geom_new"
+INSERT INTO "{{ params.usa_geom_table_name }}_new"
 SELECT state_code, state_name, geom
-FROM "usa_geom";
+FROM "{{ params.usa_geom_table_name }}";
 
-DROP TABLE "usa_geom";
-ALTER TABLE "usa_geom_new" RENAME TO "usa_geom";
\ No newline at end of file
+DROP TABLE "{{ params.usa_geom_table_name }}";
+ALTER TABLE "{{ params.usa_geom_table_name }}_new" RENAME TO "{{ params.usa_geom_table_name }}";
\ No newline at end of file
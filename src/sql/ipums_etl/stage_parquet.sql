@@ -0,0 +1,36 @@
+-- Convert the raw demographic CSV to a projected, deduplicated Parquet file.
+-- Every row of a duplicated histid is dropped, rows without histid are kept.
+COPY (
+    WITH dem AS (
+        SELECT histid, NULLIF(hik, '                     ') AS hik, ind1950, occ1950
+        FROM read_csv('{{ params.dem_file_name }}',
+                      columns={'year': 'INTEGER', 'occ1950': 'INTEGER', 'ind1950': 'INTEGER', 'histid': 'VARCHAR', 'hik': 'VARCHAR'})
+        ),
+    duplicates AS (
+        SELECT histid
+        FROM dem
+        GROUP BY histid
+        HAVING COUNT(*) > 1
+        )
+    SELECT dem.*
+    FROM dem ANTI JOIN duplicates ON dem.histid = duplicates.histid
+) TO '{{ params.dem_parquet_file_name }}' (FORMAT parquet, COMPRESSION zstd);
+
+-- Convert the raw geographic CSV, with histid uppercased before deduplication
+COPY (
+    WITH geo AS (
+        SELECT cpp_placeid AS census_place_id, UPPER(histid) AS histid
+        FROM read_csv('{{ params.geo_file_name }}',
+                      columns={'potential_match': 'VARCHAR', 'match_type': 'VARCHAR', 'lat': 'FLOAT', 'lon': 'FLOAT',
+                               'state_fips_geomatch': 'VARCHAR', 'county_fips_geomatch': 'VARCHAR', 'cluster_k5': 'INTEGER',
+                               'cpp_placeid': 'INTEGER', 'histid': 'VARCHAR'})
+        ),
+    duplicates AS (
+        SELECT histid
+        FROM geo
+        GROUP BY histid
+        HAVING COUNT(*) > 1
+        )
+    SELECT geo.*
+    FROM geo ANTI JOIN duplicates ON geo.histid = duplicates.histid
+) TO '{{ params.geo_parquet_file_name }}' (FORMAT parquet, COMPRESSION zstd);
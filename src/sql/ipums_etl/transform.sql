@@ -1,3 +1,10 @@
+{% if params.dem_parquet_file_name %}
+{% set dem_source = "read_parquet('" ~ params.dem_parquet_file_name ~ "')" %}
+{% set geo_source = "read_parquet('" ~ params.geo_parquet_file_name ~ "')" %}
+{% else %}
+{% set dem_source = '"' ~ params.dem_table_name ~ '"' %}
+{% set geo_source = '"' ~ params.geo_table_name ~ '"' %}
+{% endif %}
 -- Drop tables if they exist for idempotency
 DROP TABLE IF EXISTS "{{ params.census_table_name }}";
 DROP TABLE IF EXISTS "{{ params.census_place_industry_count_table_name }}";
@@ -12,9 +19,9 @@ CREATE TABLE "{{ params.census_table_name }}"
 
 -- Merge the data from the demographic and geographic tables
 INSERT INTO "{{ params.census_table_name }}"
-SELECT "{{ params.dem_table_name }}".histid, NULLIF(hik, '                     '), ind1950, occ1950, CASE WHEN census_place_id > 69491 THEN NULL ELSE census_place_id END AS census_place_id
-FROM "{{ params.dem_table_name }}" LEFT JOIN "{{ params.geo_table_name }}"
-ON "{{ params.dem_table_name }}".histid = "{{ params.geo_table_name }}".histid;
+SELECT dem.histid, NULLIF(hik, '                     '), ind1950, occ1950, CASE WHEN census_place_id > 69491 THEN NULL ELSE census_place_id END AS census_place_id
+FROM {{ dem_source }} AS dem LEFT JOIN {{ geo_source }} AS geo
+ON dem.histid = geo.histid;
 
 -- Create census place industry count table
 CREATE TABLE "{{ params.census_place_industry_count_table_name }}" AS
@@ -0,0 +1,54 @@
+-- Count workers per census place and industry in a single pass over the demographic and geographic data of the given years,
+-- without materializing the dem, geo and census tables.
+-- Deduplication matches extract.sql: every row of a duplicated histid is dropped (histid is uppercased first in geo).
+-- Rows without histid are kept there, but they never join, so they do not contribute to the counts.
+DROP TABLE IF EXISTS census_place_industry_count_fused;
+
+CREATE TEMP TABLE census_place_industry_count_fused AS
+WITH dem AS (
+    {% for y in params.years %}
+    {% if params.dem_parquet_file_names %}
+    SELECT {{ y }} AS year, histid, ind1950
+    FROM read_parquet('{{ params.dem_parquet_file_names[loop.index0] }}')
+    {% else %}
+    SELECT {{ y }} AS year, histid, ANY_VALUE(ind1950) AS ind1950
+    FROM read_csv('{{ params.dem_file_names[loop.index0] }}',
+                  columns={'year': 'INTEGER', 'occ1950': 'INTEGER', 'ind1950': 'INTEGER', 'histid': 'VARCHAR', 'hik': 'VARCHAR'})
+    GROUP BY histid
+    HAVING COUNT(*) = 1
+    {% endif %}
+    {% if not loop.last %}UNION ALL{% endif %}
+    {% endfor %}
+    ),
+geo AS (
+    {% for y in params.years %}
+    {% if params.geo_parquet_file_names %}
+    SELECT {{ y }} AS year, histid, census_place_id
+    FROM read_parquet('{{ params.geo_parquet_file_names[loop.index0] }}')
+    {% else %}
+    SELECT {{ y }} AS year, UPPER(histid) AS histid, ANY_VALUE(cpp_placeid) AS census_place_id
+    FROM read_csv('{{ params.geo_file_names[loop.index0] }}',
+                  columns={'potential_match': 'VARCHAR', 'match_type': 'VARCHAR', 'lat': 'FLOAT', 'lon': 'FLOAT',
+                           'state_fips_geomatch': 'VARCHAR', 'county_fips_geomatch': 'VARCHAR', 'cluster_k5': 'INTEGER',
+                           'cpp_placeid': 'INTEGER', 'histid': 'VARCHAR'})
+    GROUP BY UPPER(histid)
+    HAVING COUNT(*) = 1
+    {% endif %}
+    {% if not loop.last %}UNION ALL{% endif %}
+    {% endfor %}
+    )
+SELECT dem.year, geo.census_place_id, dem.ind1950, COUNT(*) AS worker_count
+FROM dem JOIN geo ON dem.year = geo.year AND dem.histid = geo.histid
+-- Census place ids above 69491 are not valid places and are set to NULL by transform.sql
+WHERE geo.census_place_id <= 69491
+GROUP BY dem.year, geo.census_place_id, dem.ind1950;
+
+{% for y in params.years %}
+DROP TABLE IF EXISTS "{{ params.census_place_industry_count_table_names[loop.index0] }}";
+CREATE TABLE "{{ params.census_place_industry_count_table_names[loop.index0] }}" AS
+SELECT census_place_id, ind1950, worker_count
+FROM census_place_industry_count_fused
+WHERE year = {{ y }};
+{% endfor %}
+
+DROP TABLE census_place_industry_count_fused;
@@ -0,0 +1,28 @@
+-- Compute the revealed comparative advantage (RCA) of every nonzero (cluster, industry, year) cell for all years at once
+-- RCA = (worker share of the industry in the cluster) / (worker share of the industry in the country)
+-- Workers with industry code 0 (no industry) are excluded from all shares
+CREATE TEMPORARY TABLE rca_staging ON COMMIT DROP AS
+WITH worker_count AS (
+    SELECT cluster_uid, year, ind1950, worker_count::FLOAT AS worker_count
+    FROM "{{ params.time_consistent_cluster_industry_table }}"
+    WHERE ind1950 != 0 AND worker_count > 0
+),
+worker_count_totals AS (
+    SELECT cluster_uid, year, ind1950, worker_count,
+           SUM(worker_count) OVER (PARTITION BY year, cluster_uid) AS cluster_worker_count,
+           SUM(worker_count) OVER (PARTITION BY year, ind1950) AS industry_worker_count,
+           SUM(worker_count) OVER (PARTITION BY year) AS total_worker_count
+    FROM worker_count
+)
+SELECT cluster_uid, year, ind1950, (worker_count / cluster_worker_count) / (industry_worker_count / total_worker_count) AS rca
+FROM worker_count_totals;
+
+-- Drop and add the column for idempotency
+ALTER TABLE "{{ params.time_consistent_cluster_industry_table }}" DROP COLUMN IF EXISTS rca;
+ALTER TABLE "{{ params.time_consistent_cluster_industry_table }}" ADD COLUMN rca FLOAT;
+
+-- Apply the staging table with a single join update
+UPDATE "{{ params.time_consistent_cluster_industry_table }}" tcci
+SET rca = rca_staging.rca
+FROM rca_staging
+WHERE tcci.cluster_uid = rca_staging.cluster_uid AND tcci.year = rca_staging.year AND tcci.ind1950 = rca_staging.ind1950;
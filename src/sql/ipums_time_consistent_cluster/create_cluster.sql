@@ -2,6 +2,12 @@ DROP TABLE IF EXISTS "{{ params.cluster_industry_table }}";
 DROP TABLE IF EXISTS "{{ params.cluster_table }}";
 
 -- Create a temporary table to store the cluster geometries
+{% if params.cluster_geometry_table %}
+-- The cluster geometries were computed by labeling the thresholded raster in Python
+CREATE TEMPORARY TABLE cluster_geom_tmp ON COMMIT DROP AS
+SELECT cluster_id, geom
+FROM "{{ params.cluster_geometry_table }}";
+{% else %}
 CREATE TEMPORARY TABLE cluster_geom_tmp ON COMMIT DROP AS
 WITH pixels AS (
         SELECT (ST_PixelAsPolygons(rast, 1, TRUE)).*
@@ -19,14 +25,22 @@ WITH pixels AS (
 SELECT cid AS cluster_id, ST_Union(geom) AS geom
 FROM dbscan
 GROUP BY cid;
+{% endif %}
 
 CREATE INDEX ON cluster_geom_tmp USING GIST (geom);
 
 -- Create a temporary table to store the cluster to census place crosswalk
+{% if params.census_place_cluster_table %}
+-- The cluster of each census place was looked up on the label raster from its precomputed pixel
+CREATE TEMPORARY TABLE cluster_census_place_crosswalk ON COMMIT DROP AS
+SELECT census_place_id, cluster_id
+FROM "{{ params.census_place_cluster_table }}";
+{% else %}
 CREATE TEMPORARY TABLE cluster_census_place_crosswalk ON COMMIT DROP AS
 SELECT id AS census_place_id, cluster_id
 FROM cluster_geom_tmp JOIN "{{ params.census_place_table }}"
 ON ST_Within(ST_Transform("{{ params.census_place_table }}".geom::geometry, 5070), cluster_geom_tmp.geom);
+{% endif %}
 
 -- Create a temporary table to store the cluster population
 CREATE TEMPORARY TABLE cluster_pop_tmp ON COMMIT DROP AS
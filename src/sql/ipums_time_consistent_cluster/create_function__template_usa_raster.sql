@@ -1,5 +1,5 @@
-DROP FUNCTION IF EXISTS get_template_usa_raster();
-CREATE OR REPLACE FUNCTION get_template_usa_raster()
+DROP FUNCTION IF EXISTS {{ params.template_usa_raster_function }}();
+CREATE OR REPLACE FUNCTION {{ params.template_usa_raster_function }}()
 RETURNS raster AS
 $$
 DECLARE
@@ -7,7 +7,7 @@ DECLARE
 BEGIN
     WITH albers_bbox AS (
         SELECT ST_Envelope(ST_Transform(ST_Union(geom), 5070)) AS bbox
-        FROM usa_geom
+        FROM "{{ params.usa_geom_table }}"
         WHERE state_code != 'AK' and state_code != 'HI'
     ),
     bbox_params AS (
@@ -4,7 +4,7 @@ DROP TABLE IF EXISTS "{{ params.rasterized_census_places_table }}";
 
 CREATE TABLE "{{ params.rasterized_census_places_table }}" AS
 WITH usa_raster AS (
-        SELECT get_template_usa_raster() AS rast
+        SELECT {{ params.template_usa_raster_function }}() AS rast
     ),
     census_place_pop AS (
         WITH census_place_pop_count AS (
@@ -16,7 +16,7 @@ WITH usa_raster AS (
             cp_pop_count.pop_count AS pop_count,
             cp.geom AS geom
         FROM census_place_pop_count AS cp_pop_count
-        JOIN census_place AS cp
+        JOIN "{{ params.census_place_table }}" AS cp
         ON cp_pop_count.census_place_id = cp.id),
    census_places_geomval AS (
        SELECT ARRAY_AGG((ST_Transform(geom::geometry, 5070), pop_count::float)::geomval) AS geomvalset
@@ -19,9 +19,16 @@ CREATE INDEX ON "{{ params.time_consistent_cluster_geometry_table }}" USING GIST
 -- Create the time consistent cluster and time consistent cluster industry tables
 CREATE TEMPORARY TABLE cluster_uid_and_census_place_industry_count ON COMMIT DROP AS
 WITH cluster_uid_census_place_crosswalk AS (
+{% if params.multiyear_census_place_cluster_table %}
+    -- Time consistent clusters are disjoint, so a census place is inside the one containing any of the clusters it falls in
+    SELECT DISTINCT cw.cluster_uid, mcc.census_place_id
+    FROM "{{ params.multiyear_census_place_cluster_table }}" mcc JOIN "{{ params.crosswalk_cluster_uid_to_cluster_id_table }}" cw
+    ON mcc.year = cw.year AND mcc.cluster_id = cw.cluster_id
+{% else %}
     SELECT cluster_uid, id AS census_place_id
     FROM "{{ params.time_consistent_cluster_geometry_table }}" tcc_geom JOIN "{{ params.census_place_table }}" cp
     ON ST_Within(ST_Transform(cp.geom::geometry, 5070), tcc_geom.geom)
+{% endif %}
 )
 SELECT cluster_uid, mcp.census_place_id, year, ind1950, worker_count
 FROM cluster_uid_census_place_crosswalk cw